@@ -13,6 +13,10 @@ from Autodesk.Revit.Exceptions import OperationCanceledException
 
 from pyrevit import revit, forms
 
+# ⏱️ Opt-in Revit API call profiler (Shift+Click About to toggle)
+import apiprofiler
+apiprofiler.start(globals())
+
 # Variables
 uidoc = revit.uidoc
 doc = revit.doc
@@ -233,3 +237,5 @@ def main():
 # Run the main selection function
 main()
 
+# ⏱️ Report the API calls of this run when profiling is on
+apiprofiler.finish()
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+__title__ = "Add Couplings Settings"
+
+from pyrevit import forms, script
+
+# Set the distance between couplings for Add Couplings (Shift+Click)
+config = script.get_config()
+spacing = config.get_option('spacing', 3.0)
+
+value = forms.ask_for_string(
+    default=str(spacing),
+    prompt='Distance between couplings (m):',
+    title='Coupling Spacing'
+)
+
+if value:
+    try:
+        spacing = float(value)
+    except ValueError:
+        spacing = 0.0
+    if spacing > 0:
+        config.spacing = spacing
+        script.save_config()
+        forms.alert('Add Couplings places a coupling every {} m, on pipes longer than that.'.format(spacing),
+                    title='Coupling Spacing')
+    else:
+        forms.alert('Please enter a distance in metres greater than 0', title='Coupling Spacing')
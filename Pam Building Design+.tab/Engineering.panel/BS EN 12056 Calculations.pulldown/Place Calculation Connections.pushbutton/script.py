@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 __title__ = "Place Calculation Connections"
+# Keep the engine alive so the DocumentChanged handler that drops the
+# cached family scans survives between runs
+__persistentengine__ = True
 
 # Add imports
 import os
 import clr
-import webbrowser
 
 # Add references to the necessary assemblies
 clr.AddReference('PresentationFramework')
@@ -13,20 +15,13 @@ clr.AddReference('WindowsBase')
 
 import System
 from System import Convert
-from System.IO import MemoryStream
-from System.Windows import WindowState
-from System.Windows.Controls import Button, Image, ListBox
-from System.Windows.Input import MouseButtonState
-from System.Windows.Interop import WindowInteropHelper
-from System.Windows.Media.Imaging import BitmapImage, BitmapCacheOption
-from System.Windows.Threading import Dispatcher, DispatcherFrame
+from System.Windows.Controls import Button, ListBox
 
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI.Selection import *
 from Autodesk.Revit.Exceptions import OperationCanceledException
 
 from pyrevit import revit, forms, script, DB
-from pyrevit.forms import WPFWindow
 
 clr.AddReference("RevitAPI")
 clr.AddReference("RevitServices")
@@ -35,34 +30,18 @@ clr.AddReference("RevitNodes")
 import Revit
 clr.ImportExtensions(Revit.Elements)
 
-# ---------------------------------------------------------------------------
-# Embedded UI images
-# ---------------------------------------------------------------------------
-IMAGES_BASE64 = {
-    # Company logo shown at the top of the window
-    "logo": "iVBORw0KGgoAAAANSUhEUgAAAfQAAAEoCAYAAACuKgPeAAAAtGVYSWZJSSoACAAAAAYAEgEDAAEAAAABAAAAGgEFAAEAAABWAAAAGwEFAAEAAABeAAAAKAEDAAEAAAACAAAAEwIDAAEAAAABAAAAaYcEAAEAAABmAAAAAAAAAN+TBADoAwAA35MEAOgDAAAGAACQBwAEAAAAMDIxMAGRBwAEAAAAAQIDAACgBwAEAAAAMDEwMAGgAwABAAAA//8AAAKgBAABAAAA9AEAAAOgBAABAAAAKAEAAAAAAACKOJ9NAAAACXBIWXMAAC4jAAAuIwF4pT92AAAEFXpUWHRYTUw6Y29tLmFkb2JlLnhtcAAASIm9Vttu2zYYfhVCvdnQ0SQl6oh6RWP3EGDugsRD091RJGUTkURNUmwnr7aLPdJeYaQsy04Rx9myTYANif/3H/j9B/LN203F+I1sQSoXqhw7f/7+hwOUGDtf/BmeVRO5VJ/ua3l1/3nO7294LJy3P4I3m2RTVIVsGdgUedkkm7HDhE5lYt7tMnJAB2lvxs47KwDXswsw0bUE/iiAnFAXhPGIBDh26Q/AxSREOETEg5gkOEi8GPSPY7zVIksupx96X+Zr7CzbtkoQWq/Xo7U30vUCkTiOEXaR60KDgM1d2bINLJtXOwtT2fBaVa3SJbDfLNW37dhxdlsoqsFs2Yy67Yy4LtCGVYiMMNoBBR9w1W2dd84FRzKXhSzbxmDJgK2WutXNUh8xPYgfODCRzGZPx1IUA7pp36/ap9HN/K6S6FI2+rbm8v3KhPlqr34ps7+jbuCDcquyI7pW8mBTcqOOQK1kgFbJpJas1fVc63xXOxc7msBkYmslAt99UaXQ6+b7Ax05Nb+x42KXQkIg8ebES3z66xYy00Jldw8hrjsnOHFxQr0dytSuYC17Cid4kum6YIZ0VbCFRFW5cMCQymSic10bd8aAd7h+Pplc1DpTuRE0lx/PwPn7SUDiIIDuiHTuZ7PkvGxaVnJ5Ph07ZmWklEgojgOeBTGMiEtgxKl9801YPk692GUUU7bTn2p+a8vQ6m87UmhubOzD8BkLqGc6hGAsocepgCwVFGa+73mBsRmGg7Wfa2WGAssPrdqohLEoQo5pHGcwwFTCMKMejEVqeKcZJSKN01hyB9g6sGaMMrOdN3ZIv3htCyq/3S56uHsQsf894OspwF7+S6lMNlwH2FraJuDKjDXZeevWLtRG5tdTZXbRdAaDKAwPZV8PZBSHkZ0ae9LmctP+xO5k3fTD5Iwt+rdcHeS4w3xmhfF8dj5zvpVYM1sJOqH9+oju604T7UNAR4LcJvCTakwv3fXOruRve7fd3EgY3/LLuw4STr+sHinD5yV8q79eyvLRVtyKG521a1bLdwtTF8/pcnQ0bl2uZH0QecVqQ2BrSBg7Wa0LMPQoaDVgVZUr3lUiWpWin0IDhcf9NGz1NDsppqaXaAZD109hxMxbxFzbpIa3kGGPiexxdlwyJ0FC4sSL/jlBvR5fsnIhzemNXrAVV4o4oDyFOOUCUmomRCQYgSnLUi7DLKYRObKVB4Pyv9/K6eyfSLitif0QP+pHyFqtHvcyhAD+RX8nU/S8I+F/ThHazxj07fjpT6ctjx8sU93F40X1Z/XF6fOOE+JjQaAMWQZjRk13eiKCPguDMOIpxTLdWdMvPe8GGg4um7slc4PtmNldnc3HcPmWpWGxNlfrvwBY9cIajLeI6gAAIABJREFUeJzsfQmcI0X1f2Z3ZlERFUVExQsRFeUcmJ1ck52ku5M9WM5M+sjsLqDrhT9vf56/QfHi560g4n0g/uVQQLz1h6ggyimCwN67wHJfy7W7M5P836uju5J0kk53J5NM6vv51M5splNd9er41qt69V4kIiEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISHRnRiokyQkJCQkJCS6F1ML8vn8wlQqNYgpUp+8B/gz+HyD5yQkJCQkJCQ6g6kFSMzlctmVlIeH1w6lUvlnj+Ss5xyqFvdMpaYGXXOZovlEJLlLSEhISEh0DkyzXiB+ltQKL4sq+vKYYvxPXDXOj6n6n2OqcRP83AhpK3y2Hv5/A/z+R0g/hN8/EFUKmaha3Lc676mqvCUkJCQkJCRCBGrSmPj/R7X8gVHF+FBc0a8Ewn5sLDdZHlu6qpRaurqMvyezxXIia9kJ/4+fk78vXVVOwu8x1Xwgpui/hvTmxcfoL2JZD5BFg/AuCQkJCQkJieAYYFo5QTxTWAIkfgmQ+FOpZZS8E5pZBu18hiTVmKa/67NxlSb8nabKv+P3xnK4CFgF39cfhjy/tTitH+r2XgkJCQkJCQnfIFoy0ZSBfIdjGf23qG2jhg3kW+LkjL9DKreeHJKH/EtjsECAn7tjqv696Lj5ClIEaTwnISEhISHhH1w7VtXinnFl4n8TmrUbtOky17T9k3gjctdn4ooxi9vy8Nkj8PtpEWp0J7V1CQkJCQmJVsGsziPxrP6GuKLfiFvrcdWcaQ+R1ySi+cc1cxbfCyR/WVQ9nhjPSVKXkJCQkJDwCE7maLWe0MxH8IwcSHW6A0RenWaR2PF8PaGa6+PjE4dhuSSpS0hISEhINAMjy1i6sCaZtXYnNKtMtsE7S+QVKabq00lieGc9EFcmRmkxJalLSEhISEi4gpNkLFMoJLPF2QRufRNL9bkjc5vUFWOGXIMDUk+mjRGxvBISEhISEj2PciQycEE+srDsNdWxFufkOKrkU4ms9XRcNcvdQuYVpJ4rlpNZc+tRmRMOIAWXd9UlJCQkJHoV6EntilRksB45NwN+D8kdFwLsI5LPSOr4/UED3oyacLeRubj9jlfmEpr5l1wut4dYfgkJCQkJiZ4AknC1W9RbtMjz12cGo+vSQ8UNmcGPr1eGzt6gDJ4Hn/0U0vnw/2+uVxZ+cmNm6JT1mT2W3KZEXlKRJ5DhFdyiXTUvGlu6mpDmXBN3Y1I3ppnV/aew3HLrXUJCQkKiJ1C9VX6Hsuj1QN4fALL+w7rM4H2b1aHZ+3ND5fsaJPz7VnWoDM8/skEZunqdMnTGOmVwdCp/8CLMM5GzitSa3QjbAK4kpDDzxPP0XbGMEcXyT8mtdwkJCQmJbkV5KrIAE/5eykX22KQuyq/PDP1xozK0Cwn6nuxQCUkaiL0EJD2NCf4+45bY32a3wPN3Z4fKDywdKm9S4XuZhddfozzvtGi2+J9k1ipTV63ByJa7gI2zbXt070r+hg5pHM9ywbR0yAOd3MSz5m+YuOS2u4SEhIRE94Gfb+PPO5QhAzTrW+5hJA7kXFrPyBt+n2WEXm6W2HOzG5Dk4fug6Zce1SLlby87onyktrqUVPVAWjRz4TrLgrSQYCzw+VOQHoK/7USDNvr5JD+jD0bskAe1fC/mUFZy612iDgZ6JPUieqH+vVDGboDsz2GDG6zh7xvTQ4cCaf8ZifwuDUica9weCbwJuZc3KYPlW5RnzSxXj58ZUc1SIqBWToO0WLMYfQ3yem8sa0STavFVIylr/9FU/sB41loCz34cPc+RZ7PFUhBt3dbSVeuXTHyyE0n0LHBBik6d8Gdexi/oVszXNpEkHDbKZSBztsV+R2bwv7aoQ08hmRNNnGrjgUhcTOuUReXtSqT8Y+015WEVtGZVD7b9jcFaFPOqpDox1qyeOFlF08Zx8N07xkiUNd+kTs/SVXPnqGIeQjJv41k6ntPzydYttf8KXXlAnPBdyzAnaCIXTxPF1IJ6dcPPg9hIDA+veFYqlX92tyWMkTCazz+Te2Z0lQrrc116PXMA6xCWLFggqFAxPLx2KBZbuVd47Va/rXocA6Oj+WeGJavhFSueNdcVmlNMMSLflo88c11m8Ed4Rr5Fsc+/QyNyR0NfVN6mLCifpo2Xj1QngxA62WKPK8aZwqSzwJ6EyWf0J/6fDQjyXCx2yl7wvf8XhNS5xXtCs/4H82zDgBtoUVtq9fmmYPl5nuw6pd057dsc9crEiNpb3Ti5eQO9ipmznhPN6H+H/nVXTNE3wc/N3ZOgPLCohZ83QboypuoXx5XCl+D3N48oE6OJhLl3tay6Q3OnbY7REKOKcQvUZRskv7K1vxfXqGvnMAxcHSdZ+ntAxg9COTcEaSv6ff3BmFL4iJh/74PKGndQoZ63RFVja4C25O2JY+2fqdTqZ7CX9Jfmz8n85kRk743K0J8eXEpIdzqMrfV62+2blYXlG9TnlDXtpPKoapb9bLfbmnnGOB3L34qWKBI75PUjv6TOt/rjmvE3IftQOtAUX4yw8o6mJ44EOb0dBvVZZPLNFC7Fn1CGs6IZcy2ZkJzJKITocHQRxP83ouZfFdcKJkxSn4f3XoDvjyv6L2DwfCeumO+PqhNjwt18+F77Jh1WrgG7XKq+Gsr0FS4XKNdFMJF+IZYxThzV8s9nX1pQqYU5ecTGC6+OqeYa+M6Xbdkqxs9hgvka/HzTYsV4Df+WR1Ijf08sN/dOZq27x5ZOokOiWTT87K5UJAn7MMYswMUp/o5/g3bdDn38cpDtO0bU4qvEus0pobA+OQZtkshaj48RZ09WyacM7O/hER3mG0bdeB5jOeuM8eVrcME/E7CtSlhPyOdJWCAewQTRjbsmrYG1ZUK1frIkFDmZJTbW7htesZZr6f1D6Pw62o2pyPM2q0N/Rc0cSHd3O4hc3G6/S4mUL9ZeUYaJAsi8de2ckzl0gAuw/H40B05W2PAJzfxnMmcby7W07Y5W9EC0O6LLWPz0+gONlA9XjvCeP8B374bJcgPV3PRNQEL4+3YglN9yYiRbdoRo9Osx2hxOuDjxjlUlDPcKZcA47v+EAX8KX536n5wcsktk9FxMLVwOZXuSvqvO+2HSgefWASl+ADVT/v2oon8Rvns/pPW8rlDOjfBzM/4Ewj0Qnzs4nydXGOHzT8Lnj0BaZz/Pv6PqsILXj6LlKhwEMjsPy8XKVKosE/0/LIDuRc0Gt5d53WwNSjUPh/JdBG1RL48yDaWrP40yiCvWqNB3GvU3m9Dhu3cmsiYs+tC/AvavLkokFDENR0xugPBbIPAZxlEYy60qoQxgwfoEPPdLDJjEd6Fa2SEJF/SduMiCOjyW0Mg4nPEnA/t7pTDjNNj9C/pyCggG8t8dQnvtpsqD+Tv2mp4mKi6jZKZwLHUmRhQqn+3otCcZa6p+jzPee1tOnsHIfAC9vm1Shn75AD0vbyuZY7oDCP0eIPQvaoeXD1dX+9luL7GraI8lMpMHkcr4nFh4p4LJVk2Qa3Mt31cvYUeimo61XMzTBaRjkQVEtngbEkVSs2a5loQGfUjYSa14Kz6LWlFcMf6CEyosNshdej7h1iQM9wp/T2YnyQQMn/0roRipJuVpKJMkar6gqZLbATCxw0RSsid+1/ejHKwSCTkL5BtVChmSj1Y8f8nyk/E2wAyvK6QSk9nsmDL5evbeRez5s9MrTsUFwrTwPPkOvaVgHYl5J1RzB4tb714u9n+U65Jla1AmV8EEazs2imX0d6IvARZNryQSmpts2QISCfCTrC0bkbpA6MbdiXCuZHY4MaInE61JZU8XvddFNeM4Vv+OHbE4cDR0aJvH2Vzg94aM8702EDosNs4IaKfjsiOICyzrlLDKOkegc+Fw/rnQfv/GOSYk76AlMtYU/T7hHL0/CJ1fTQMy/yJus69vs2Yuauh3KgvK79eS5SN8GMQJ2vl3sPwhdGrS4KCFXOnHuQ16tiOe4zTzfZhPg3N0RugrngWT5X+AzLHjTZP78lRTmh5DYleNaxNafjiuWtsYOfK7880mLXYHX58h0eGALGNp/YP4Ts/ngnyBky4shUn8frY4mGHe+7y9n0SnK5L3R9OFPNT12ymchBTQUlhd41QLxMXQ9JhSqCB0PFIgRK3ou5znSSoRTRkIFcj9YbKq91Iu+t3dzLvfP8iuh2J8NAUkj7se3uumz0AbT+PWYEzTvyO2ab227m1Cr0jMh4OONislOk4Kv4+qE29kbdeSnUUw9C+h06uyFvrWuHM0nX8pe13PEZatSKnmp3GshyaffiV0TuYb1UUnoaOXDSFdR/Oa8MraKVq2fJRa9EHoZFIpR5WmGrEnOFq6+T4/nYvGTCdk8bUm5XEIXdFvI/fkK1elJRYudjv83EK0IW9k4yIjolWRLXp4xxfxvc1InZc7qhbyJHQtDIyo4s8NL9GMceLJWY+gsYrLpFviE1QtoetnI9m6uQCO0a3gXVC32VZX9DEWMQ++ezWUbQf9vFWSpVufdDGgf6xBe883QrfbjWvteFaJZ7pxpfD+iH3tqBNb8H1M6Cqdb8bIfGN9K6zydhRsHlqsmcOk/1S3Q8D+2XeEzs/Nb1Ij+27VBjdt08hW+2ynyJwaxi0q57UV5aNbP0Mn2+04kJO2oU6wScQ+79LMcTrht04UxDhPM39KSlOfOJsROklkgiLb2zWOdkrV28FNBkLJXmwoxofEulaDlzmWNsdhkO0kMm48CXkpC/6fnMXWnUhbJHSWZp13Od7/BC+A9WVCnQGVaB4V8q3ccmfb7O756Nz179Oj2YkjmQCr23y+EnpFvwdSIYtGaLNfYF0b9bHw0N+EzsqMi38gL1MJq8wdBB0bmvXbdsim7wida+dblKEvkXNz6rY1IEFT96/Mg9ys7RWOfcZ+J89uBO18nbJH+Tjt+PKIarVI6HTLCY2jUqljn8eqFKzB2GQcH9ffABPTzniLE4RN6KpxiZifCzwROnl3lebunJEXHWM04kjHJt46ZKFzUp2NKhNZfL/L4GfGevn9nGh3dQfZrFtZcIudyIL+raLsdWQZhNCpPQHbBcAFCzfMY+3QTHuvIH2+CKgx8mM2A65tzqLu8UVcPxI67w+QdpNFo2bcvFg54TV1+liI6HtCJztVSTr+r8P72+y1XU9cwlb7qe2QS7zfCL3Mzrk2pxa9bqs6tGOjQ8a+iRzvqm9WnSAsd4LGvxUSav73CoFZmJe5WYfQj/NF6AlypcbYJtyTnW+EXjFwcXuZHgWYqAnfEtOMX8fpdaKr4fs7iD0BWpjXIx/HRe3NhxIHGlUy4/XPWt9KNYh2R8qi0bLEqUX9zfBOKIv+K7Suh7I80awsNROpP0InREImBLy3quo/IpbxGQOv0/0Bt+RZCN6mbciPb9DADn6/DNJnoxn9U/Dzp5D3/WP1bz5A3ni7wXyszk5RvxA6kQVd4ExibINto0r+ENaebSJ1Sei07xozxKBTMz4aVrnbDDIm8OwfbQDozl0wd99u7dlXhM61863K0FeRaNcFcByDmjiPtAZE/cj6zOCF6zKD71mfWXjs7crCzEZl4fJ1yuDb1iuD34W/33VvlhA9dSGrLCpP+NxyT2pGOanoT46PF15NKhXw6ox9dqxYGS8k6zawGKGfT4sTDqHbRJw1n4grha/Gs/ob0KDLyQ4d5YBWnTHeDsSysdHEgQZdxMBNNd8j1nnKvgdaXAyDbHfNJFdRFkJ8j8WUwmdSmvG6yrLkFya1wsugnO+CBcdWD5NYIA2d3ZP+rFq5QKHX5MYLMZgsNjBSbyhfRua/R4v+6nxSK4x9Eqrxs3rXGZ2jFmpxXGUM2U+ETuVBjCGJMea22Hj+tU3GQgBIQudlJ1dmNfOxaIoaJ3apRz8C5/aM9a2xcA3hKmXSL4Qunp1vVoa2b1H9a+dIyndTgn70jszQ6ZtTkf3Ed1S/87ZYZK8N6cG3bFKGtt2TRccyg9OnaFr5KI9e4pD06XN6+SilODOcO7V8mHry8Zh3WEZxMCF9MIhRHJDlV5qUxzOhc7IBjfjWmJo/XPx+pPL+L98ufza8/4f1Jw+6OID8/iN2dD7hAkF+j2m8LoZoBrOaN6+LjVuvrShLuTxQXZajM8e9AB274PWaBrL0aRTHF080Fn2Eef8TE6mPZowAUT+FWrTbZM+3LEEe1xyqqnvydqvO5+CD84tgwvxr0uX2g+Ml0PymS7v3HaFzmTBHSzcfnsi/sKKvhAZJ6DXjQTMvpW8udyV5VVwP1qyww1lXtGf/EDq/pqYOrUZS9evWFb9HSXnouttTi15H8sagLpHIgnIqMojvwZ0AEkcd/49hWJlQb09F9lmXGfr5o7kF5feriZlG19bw8zFIMGiJJn84PDuqWuUT1WNmvrxspHzJ0gO/j3nyXYcAIFoZTP5XNdhibTiJMWvyd2Nmnq6tNSB0Z4vcvGUkdfz+Tp41zkxIudn7mKGJ/s16EwhdJDj35Xk5F6f1F8G77mPGa6Xa75Czun9ym4V6ZRFc67JrgFYjD3ytEzqTC/y+PrZy5V70tbUaCd85SNRf4OD1txKzeF8qfsctn7hinuCmpXMvgSCbP4ntK/7eb4TO+sw0vVZq/txFLiFAEnr1uCDzlmZYYZU/ZNgOtWCOudanAy/P7dk/hM5cvG5WB392X84foQtk/hf0Lof5oWOaas285t0siht/7nEl8t3vLDu8fIiyZmZMIPQk08SRxI8iJE7ud5dNbXn5TG24/DvtxeXb1WeUHlIi5X9oz39SXV4kW01+t/Y4qcUUayWzcPfjWIYaiCnGMswroIZO36+ZT+M2OC3jlAf/8JRg0cMcTHBX1yMg5vXrHPwG90aXUK2T6hEfs7h/FO0LRHk1gr3jsfKUvYBUb2pYzxYI3dFG9P9tJGd7MlX1onu9qGEl/L7e1aagqr2OXrZ6P+iPj9QQB1tgoF1Dve/2I6GTtiJn6rjItd7dqK38QRJ6dX8mV0Sz5qaoevy+rAhdQ2KOLIr/HfKdc9f27AtC50T6QCyy1yZlcBsaqYmW5x4N4GbR2G2rOrhlXSpCNMdyi9oxNcorD5QPjiw6P3vQn8eX4mRfmHVIfJJo4nhOPqktLX9RO6L8J/VF5Q0qjc62TRkgVvK4sNiYe3Z5TW7p5SRfulhpidTt8+OEuTeQ2i3NzlzrdiA6oTyayln7s6wbOhtpROiOoYt1Fj7bSrAXYeDkKGHppeq8mUZ5XUTwxw2a9JfcBholUPhcsz7Taln4s2Sx4L4i90/ooDGL9a0nh7hiJNyuIdJ7vGSSpRpkE5sHzA/yWl/bXvzGhbHVZUHZ14RO+h6e72ath9BFLxVJWOe7ktCrE3FuRQxSza+HVYdQwMZFNGW8DtqpdlEcfuoTQmfa+UZtcGQjI/JWz8/RCA7PzbcpQybJEzRzP2W5gHW285e+8ShFm9iJ2+6QSilNJ85mvq4dUr5SfWF5E7zzHkLiC8j70WUsepnD4C748+5MZObDy8bLr1NP/TzN2XM0qAGbnOB53BoMGpwFOtH/eah6U8cy+JN0+kqf4V7B3CmuHYJ8bnBxp8gXH/enQOvkX4JJ8fcuHvL4oNuNxnhcvq2WBc/2YWJfV6+uLZ6hk8EKWn+cPd+Q0KOZiaOFCcS5psY9+6nGt2gZ6+6A8H40AGW6tXbBxwhdMbZJQncjGWpbAm3wA9J7QjPYkoRepx6wiLJmRn26fG4LnBs0F3VKDn1B6Fcw8t2iDhX9bLcjmd8FZL5JHbz+uuEIP2/0LSje2Zbn8he8fdnS8rnq62euUl9Q3gLaN9fE11eRuFge/PxeeO6r6iEzRy59UzmlTJzr3Md0YlvbBmRCLHFuOJJI5F+I164ChU/l29iq+WHMs4kW25jQhTNiJEI/MhbueX4jVVsvvp1f5v7Tsbygfdb4Uo4528k3CefLvsoCk+75LjJuldC5M40yWrGL+dd7b2NCR9/u+rlUBh4IXe0OQrcDqYSY4t7cCvsmS1iA7RpNW8QBTzikLgm9Xt+gd9Otq9GYkxVlzsjM8Txp6GO51h12+W3PviL0TZnBjzG/7S05k8EFAInElh4kcb9b3WqvBjdku2bpC47DBcb2TGR2K2jiXPvGa22NykM0dCD0n6ivxm36GRrRyPxXUtGXNxuQQGLPiCoTJ8Pz2wIONjYZmE8vZqTU5NpIQ0LnW8pAHn+lj7dusepcwdPfV+9cnGzHs8kLo6JhIJV6ZYHfL/dQr4ZlgbzOoLcAjGqCbl1DD5fQiXW6Nw3dcDmS6Tyhk0A5LtHufCcWKjXOnRd5uLvfGsngghe1dOucRm3WGiShN5I3PZbS3xdWXXyC3jnX8s+HBd16n8eZktDrgRMokOFZ99EQqa0RugIaujZU3pheqIr5+YXj4CbySsh7B56RA0l7PgKgAV4Gypep+6PlOwmcQSJ4EU2z8C8kEQz1iMEjEksnD8JY4TChHh/XjC9hmFJ6lmzNBhloQpCYi2mtmpKeJ0KHcv6ZZheARDP6O+sYhFHrbsVI4HN1CZ2dM8Pvl9Ki+C9LPFM4PQRCtzX0WKZx3Op5Sugl5hXwKij/T6CPX4gx6YMk6AMXQr5/xLC26INgbFlj73j+y411N7fjbYoqufqEJPRm/QRtFzC8rCivTsKuf9b6At0p1DtX/34i9PWZwe+3uuWOZ+14nr0hM7TrNmWIeIHiZ/J+Id5PX68MbmzVnzxq8Lgt/3t1P7z/zQYk2UKcRVJPMe0DPZshkeDdR/w/CVlKJ+EG7lK9dx7MK6rqaayLh4mgCaHrpOxQ3lu4BXrE5zZ3QjU+77LlThKZANm5eC73zj3gs/9UkxW/ew4/rxEmBJ/b//q3w9xy70tCt49j9FB8L4jAHSuMCw+LwM+BNvWQn4iDjZJgZ2KEU3ZJ6M3kTQ1rzZ+x4nSU0O24EDBOaSClKjm3N/UHoXMCBvL8gS9Cp05onl6XXnSwmJ/v8jAhXzccedYGZfCOO30S+h+1/cpxTugCMdYG6tCFmNlhnGVy7bylu7aejOKgPrv4GbcPLb1RKFjbIh+9uvEvwGT+1wbPPiY862dgLID63OByjU4SekuJ2TRoxomY79q1a4fwnUFTtVOguJJ/ObRXqEEzqHEciTn/w0bt5h2S0JvPT7Znx3xYdWq1/knNvCLsxaGX9uwLQrfDpSpD57a65c6t4ZHUN2cGo2J+fsEJfWM68iLI/95WvdbxLfdfqy8BDdls2MDVE3oYnQZ/oktW1GxIhbwRr8dra+QK2Ufw2Vauigle346MO9vbQhASugMQ18x/H0zJk07ixBVj7aQjeGV7R6tlsbf+s1ZSWHAFCZ/a34TeRg09wpwC2XnCYp14HWzs6a9FciE7T7eic5Eq2fqAJHQvMk8Qz5DWHaOj+eezYrWd2IQro6fNRb3j/ULoZecM/TMPLPVxhs6M4oB4TxXz810epuFvUgcX+3FBi4R+lxIpX6C+sjzSuj/4YIPFcfn531iHFiYAD45ldEJakPfdI+xeu8f87at4uNXWiKChw/+E5UsIFH2Ruw4+7rFONTekUsY+5C1eFy6Otf2v6hCDJPRWUnsJ3QbPF/sSyPoPGHAlhEnZ3nkCeRxA3xTkXFcSuud5Cg0SVesLYdWrCUifX5wtvBKUnfvaFHylaXv2BaFzK/fNyuBbH/Bp5Y6R07Yog2SLOeiWOy/PVnXh6X6u0eG1Nbyjfq52cPkIdbUnf/ChDBKFesCCzvrrCD2baqWzeHT9yjVj65KIMMHWy5T7IMffycoYbQdcyMMhdHOSlINdR8OJEbT2x92izNnfUQ2yCEDf7aJ710ZlwQVPcmmjaGWGJHSvqUOELuaN3gGxX4TkDITYmyQVo14I3xYgCb2VuoF8dvG6tTd4C3PUlTV/WM9+pxN17gtC5xr1Vm2hit7emEbsWSvG5zfSbfen71CHyDazX1Ln2+23aJHnb1YHN7RqEMc1dLyv/gltpHwYEPpYBwidWNJTT2u3w+T0Ylab0AmdvosTqXmBeCed36XnqVwu29HB4krhNCjbbNz9iIFHZrrbsTZ2/LGDll5Pk7b9uYOG9T1ny7RcUxaR1DDQDbsONetSFmcilYTuLXWQ0BH2AtHdn4GPscOuZGrmm8X8/UESektyp3PWFVCcti8C8WZRcm6dKPUJobNK3ZF+5ks3qkOPbPaxze34cR+8jOQpBF1pqSz2bsHQmb59yiukHMSznNeIbcEGBg0NCVrztpF0nhgG+hj4LYZPpYMRtO7b0bjFcZwjYmpBMjtxJJTvF5R03QnUPibIVm6/8Z/JrHksGtHUMxh0HOgYNycyhRWCFb5TEiA1jHIGefwaFwdABo0clkhCbyV1mNBtS+WslUxka4P2tDx+WP9zbEO8xCeoWzpJ6C3NXXQxBWPztLDqVwXS1w8GxSOpWf/q4J1z1/bsC0IXAUR65fYsuYbmKzgLxjXfpFAHM1ewaGpe3lsuRwa4lzkg5Ikt6lDJT/hWtHDfrCwsX6c+t6xo+fKoauKWcNs6CEyiu/EsESaOrTxIic9B0RKh88EIpFFi/tA3QlnOg8/+Bz3TxVTz6/FM4Vq8GiKcdbpMbPosu5t637CSfzlrjQGxTAh45neNrFJpWfCuPynLHTGl8AMsC07ScU0/Gz67Pp61phuXpWoilYTuLXWY0O3yJ8y9sX5By2/LXNU/i/lKQu9k0vnu3H0jav5VogzDgHM91Ti9A8FXmrZn3xC66C3ufh/OZYQ0e7eG296DUzxvoq1jNLWpinPlATvKGqQpdh9ynTJkblOHnt5Ets5bJ3S+3X6edmB5uEH41aCJX38jmoVq3DSayh+I5Q8w4L0SevWW+Qy1FLaIdy8cNJi4py98ttEgok5iyEB7m2v5GRmNgqYPg+EJapXubszC3YWS6HKkLLw8dlncnPXILfceJXREXDGuCnq7fc33AAAgAElEQVT9iI6jNViPL2Kecsu9s0mwyzmPSDBkv/oxNX94XLMeZzdaOm0IV9GefUPoXJPepgwdAlr6LkaQPjRkcp5OjOTWK4OXb8pGXkvyryO4qitq37hTGyrB+2f9kDkndLyy9i5tSfnIthA6Erk+ndSsEvNy9BP0qIZ1CDjYPRE6m6Bqts5tP954l57ds2+qCSv6bhqr3fwxaYuy+5m/46ZVfyups4bX3upbqHouC3zG6uM+kUpC95Y6T+iiL/7fBCUlW+YZnQRSkoTe+QR9t5SgsSKOCaueEd7PNStQTIwQU/8QOoKT6xZl6Nd4Hu7n/JqTOmr4mMcWdejJ9ZnB89dnFh57u7rHqzanIsRwCrfX70hHXrpBWZhZlxn6OmjkD+DOwEZ4p18yx+32rZkFs9eoe08vUQuoQYfWESiRG9MJ1ZxlrkrviaX1IhEcd8QRDE0dy9BIa/oO6JSPU1effkkAv4dkvoZY5Avn7w06Nwt1qOqforsS5nTc9wAl5ca7sLugPo/VnUgloXtLc0Do9jm6qgd2NMNlHlWN0zFPIeCPn5JJQvfTBvwaqmbdMjKSew4rauAAW6BQrQ7LZ0EIqb8InTuE2aQsXHmXD+tytzN10NZLJMAKPZffAeS+CdJtGzKD6+HvD6EXOHaHvcQWEL7IHBOJsqYOzH5uebx8hAZkpehMM/Q1WZbiQvQq6AglJHL4fEdcKXwpqhb3RVmxjhtGp2jq+pVtW18bVQqTQBa7E5REpluoH/Frj2EUKSnrFwwPe+/YfBKPZvSPYfmoQ5AW30+c2pgzqeU4geufAtn+gAadIc5uOLnS/HArsIbQjbPI9iwsSITnyXd8Evps3NnxKPGFjj9Ct3chMM10LB76nG656/8IvOXOjCpjmv5OzFNq6HOThGA5ZwSsK+kfR6fy+0FeW8id87kzhKtoz74idBGblaE/BdHSRW0d88CE3uSQwDHUKv4kTmNg0cD+7pvIN7DzdrziBmnTUuWEb44q5sMpGjWKam6K6N6Vh4dEwuapeotYJ40PeZSoNbl+FxDMmegYgYloIGyPXPiPB1/ut+Jz0UxhBRDj/WMkdrc5W1k3ooGTJH6OwTXIFrtmPIFXx5jxm321zUsZbULMWsuhXFuoEx0SAEdwqSu+v8LV7ixzibs7ntFJSFn4/Ceh+nLPSg29U4SOi1qo3/3USUiQs1FefiuE8ktCD0J4+DOhWk8mtPwwkWaQwEuaefYc3jmXhI7gZ+kb04PJrSoQreLP2rzONvwsI/BZpv3PhpE3y38adwI2qXu8Bcu/Uln5EtAkT4lnjEthot0uGo3ZoSGBIHnC/4t/xzvb8L3NMCn8JKpaJw0r+ecyETFSaz18aRN4InSMT55aTe97p3LW/lHV+FZCNXawshMrc+KkgydarxKLjvYoDK7v8khLfncX7AkpQQjp40haLLhNCa3YK99ftN+Psa/h+UuhXY7gecH/f8QWTLtJfUnCONx4Rq9P1xJ64SyyU6LouyqfhwULmXithhNvBaGT51nMbyevXSkaYvIbRMYeCB2e/XeSLhqn7XyonQXmv9nFYUdPE7pDSOYK2ieDRYrjP2GB8EbygkDHV5LQgyR6HZaM1d+z4rY0P9hHMZo5Dgu9ZrdZ/LWFJPTWwB3NgEb95QdyrXuO63Raxz3VqUO/ibhozizubhw9pUFj4hWqyyD9FdJNNBVuAI3xzwnF+DloaF8BjfdUmAiGXxtbuZeYD8u3Xd6UPBM6O2Mc4JMXDZphvAXS+fDcPzDkJaQtUcXYEMsY10A+58XVwqnw2Uuq6uK7M7OBS8sMi51YxjwW3n8OlO9KkOEd+H5ImyBdB/+/OKYWPpBgd/SF90dG0/mXji01D0nkrIMxylt1qo4sh057Ejn90HrPu9/HrwU+h+Fzq7+P+WL+jnOg5jKC/nUgklF1Xpi/E6ayAvOC0EEDuzA4IaFfcaLhb+HGpZFAk2zfErpzVBUWqSvU0U+r7qsPPji/KK5Z17gEXZrruvUpobNK3qRG9tyqDF2DW+/rAm69tyuhpr9VHSpvU4fuuSW1x4Gs/IRsqj2UVQO1L0z5/AV1Oyz3dBZpf8O3SugRnLxq6ze1YMWKtc+KwWIEf1b/ndYltHumbscOA+gxDt+vqsU9q/8+FY4BYa+jZwmd71jAAk0Tbij41p6qIxMG7xt9S+iz1BNkGP7R9VkaM8K6GxfcrNhN5z9hoff+kHceSrBACCMSZn8SOoJvvd+SXnTwVm3oPuaCtatIfR2NxT57pzo0sy69iFy3qBPpzXZFSgxu6k0a7O/CQqCTje2D0J1tX2HhUQPHh3rbiHRA8NNeK7OG7y8PNAzhWf10uenznu0BGuVT7wqfG5qGIXV5N/7Ta4TOjdVwpwcm2HVheP1yCL2OH4SW0WeEzm1rFOMa6EfX0d/DCwEN5PxtItWmCy3696MzhYMSqvVQSD7+SSJb94rxfajXE0Hbs28JHcG33m8fX5gGDfhJZsTWFaSOmjned0fr+XXK4NvE8nrEgEuaSwQh9Op85rJec/3+XkB7CF0pnID5Cgur4Akmcr7IxbxRY4NJ/p8hxbKmVzE185FkaF7K+ovQHacwhUtjqqWxhV0o581xZmia0PRcs7pzwgd5XxCWdm67pc1av4R+NxIPviPU34SO4CR56/jCZaCpP3GnNvdn6rioQOczSOa3ZQb/C8vHPd31MMIidInuR69p6KS8MMEuS6jGlpDIXAwyFKKHsj4kdGwPVccAK2iM9oPwCNW+m35Do+ut9p1zzTgxRF/tVPZZcxptUTCFcMQjCR1hkzq1fN9+r2MoF+ieui8yh/fiHflt6tDOOzJDq8Xy9TgkofcPul9DB3JVVXXP6DLzFQlFN6KK/juMG4ApxAkbNfRZNFjFcktC90/o0Af+D/OMjp/wCqjzPWHFGyfXOOkNmY/XqT/py4ckzL0TqnVbWISO/jLIbRbN+BKRlaovlhp6iOCkeUdmjwOAWK9C63fQkmfQWC6sq2fNtHL4OXM/uZo2uPF2ZTCB5ZkHmjmHJPT+QbiEThKZ7NbjWSr8vDZoorcTjDtgQn8aryKOsdj1YUXKIv7byYRt/ZSKJFz/4f1H6MafeP4xzXhbiN7ZSti3QI47UEumInbayjGEs84MK/iKszNg3j6cMvbB/KMZ62hJ6CGDG5yty0X2WJceOmOLMrQTtXUWmW06bGIn+TGnNHdnh8qomd+eHvzh7akIaeR5oplzSELvH7SB0I0yeg4kfgjCSlgu4mKYOicKMJFWJdAcSYSv4sNR7YTXEYmEHBCkXwmd7XIsAA39T2GRun2NTTMvY1UYEN4VSaaNkYRq7gxItk5ic11U1U/iMoP57yhJ6G0ARkWztfXxocPuyAz+GgOqILFvpE5opv2EXq02eNvAtvS3Z4dK9Nrc4PXr1IUavhevpXkNy9pDkITeP2gLoVNviKL3w2CJ9b/Qo2NR7Ry3cfV3oBzCPfPvb0J3jBeNkXjWejoskiVRFPE9mrEK8xePdUDGfwrbriKmmT+j75niNyskobcLeE9dvB62QV2YXp8eunwzaOy4JY7hUzdw7ZoS8zT7vVSTuOtX/hx8xv27b9XI3/4OqcBjpZNwq+V52QguhO74BqcDShL6PEFbCL03Eovwp1k/Qhm0cj3QG/qb0COCbwjQmj/HAklN+83fqT91AASa/+Z0Wn8Rr0tctd4S5vY+ic2uWg9xh0yS0DsI1JKnBM9p68eH3gDk+wnUpkFb341W6A8sHSrfK/hu3yykLcy3O3kOCBy1/E2E6AdvB2L/2vrxwRhfOFQvIuYhGKGvfRZMelJDn9/oT0LHcL3k3Nz886FqcU9RFuFBEjpLkcNSxz4vqZm30pgC4dxNT1GfAedg/hjXAtpye2gGeM7d9/dxOdmuZCWhdw5ItOIWeDkVGbxtfNFr0Qp9XXroq0Dyv16fGfw3/LwXNPXHQBt/HNIO+P8DSN7w848b0kPnwkLg7bdmho7gIVZJXiDweWT41giOhq7p/2ahUnfSqGL6bujQOxNZ8tmNw2slofc4+o7QY1A/EkhIM6/hhk7hnZuLkIRe9Y7jwr5KRqOnWaMwH32dRG0MaaudbOlnravE+Y3XQxL6HABJnWyJuwgJSfnuFZFn3ZCLvPA2JfKSDWpk31tSkWdftzbiGvu4XLVI6CMMjGrFAxenVx2K/sHFhJ+xrSjZCXsb/UboLOKh+YcUI/P2uf+VhG5LgskYiPD88KKe6XRbXDPvhHwfZ7crAvcPRrbTo4qREssuNfQuASd3JHI3gq/CgP0sfk8KWWJ+o48InZ69YkS+6Lj5Cqw3Oxdt0xiXhF4ti9h44dWwoHqAyiIcL3IYijmAXGvqkKJhoL9WLWNJ6F0KJOl6aa7L1nXATtwoSfQ6+ojQ+QRs4rb7RpiYV2Ld6UQtt9zbS+jCPXHFeFe4AVNCugHBjO3iWXNTVD1+3+o6SEKX6BYMNCFl2ZH6F/1G6Fi/UjJbLOE5aVQxvoYR+VAG4W+9S0J3e+fw8PAQ9LMrw7peFlYSXNcW3eQrCV2iXSAGGmhh3qFwql2FKRakA+svw58GRh8SukG0sZhqTqeWrcGJ/G88NKe8h95eQrdJMWNEQR67A5JiaMn25Z+1LhPL6Vp2SeitA4XHw3C6pbku31yhfgjM+jLBDjOq5A/hgQV4imf1N8S1icNSy/L7Ofl0BAON2rYBSQ/U2eZv05ZpX6A/CZ1Pxoq+m8VAX5fIFA5CWYQ3v0hCb/ROIMUvUgM5fa61dO5S9jE0+KVNJwldos3gHSqVs/aPq4VTYeL9cEwzTsQ7nuyBik7IBw6Q9xj1uGXshLRLSE+hi86oYpwpPt+9oI4/RrMTR8Y1/d1xrfD+JNSNx8aOyAHhB/1M6IyI9GniXlazNsbGj3s1ykMGZ/EjR2+Ezj8f1fLPT5BY9uHcTQ9SbvRJAGX5aCO5SkL3BzrBqPpiSCcls+axeH+RJwzLiMYs6PREfH7+g5IZGpRAJ3gCPSItWbZmNknOofQ7ExkaJ1jUVO2VcKawJKFhSEuzRK920BRTzBnqvcn6gvh8G0HqkDp29fPENuWJtLVq5mOqebj4PP+JDkCg7t/HsmO5IZFBAZPlFXFl8uVV35Hwhr4ndDKpq/o0khGQ7vVINKJs/EMSerP3xjJmgc1hc9Ln8L1jORJ85fpGYVlJa0pC9wHuZD87+YslK04pJ7KTM0KQhhI95yjuTKrFV7EvzPutVsc6tHAanvlhmEfqQhGdvBgzNBpQcediIG58jne8SkLHidrg1qDUhSvzYw0/O0LovFyJ5auHsS15m/L2TeQmp8ePORV+L35LKI/dyaHM/2/J8pOxHjM4AfP6E5mo5k0pvlMxLwdG29AmQscrSZhPO5IR2jWlisS8xyU1k0ZdC+wKVhK6F/nA2L0oXKv3lmTKlAJLayZTSeh+YBtN6BezldtuJ0gDibSEDf9UHxE6nXBz+RcmmGvD2o7PzgGz1pXiF10IvaLzcfeJHSd0zRwmbcnb1GnfXXRg6+fy8jjemYxl1AK1JtIW+pbfRUg9a3ykE/WYZ2gPoaPDD/S33Y7EiBH7QtgkYAfkUIw3oVyC9SVJ6F7kExvPvzahWg8HlI+v8pL5TzO+w4TRUJ6S0P3AEdovXDpYiYZQ1PtGQ3cGnLmiwTUPupWumU8klk4Sw54IMyrEX7uR0AWnEnaZyI4Bcepg2Bo6Px+Hup3NyloT3IH6lsfoS9bf2ln+eYo2RVszHoG0HdI9oSbVuDemFB5DZyLYV/h2bWhbtopOPMlB/ndBni8RZdQ6JKF7fT+M7/eHFcPcW3LaeSRn7e+lvJLQ/UASegU4oSWXThbIFRuy1ew+2HHCSGatI/H5qXlG6EniMrJetCYgdHLsYN0sGDPNw8HRFoRM6LQt2F3eBXgePazknxtWSiTMvdHL26g6EYfJ8H0wF/wjmSuSe+VhkQHvh9BP/xdl439cSEL3UATyzMEH5xeBfP4+1qHzdHsnJut9J0YSuh9IQq+APeByk6lE/cAGxKdxUrPud7SK8sB8IvS4Vvw0JfTaBQ2dSFbhYuaXvO7trMc8Q7iErlBCR+NVzLftxx9TkQXRTGEFvPuOEB2VkPEEc839Sa3wMvoiP31KEnorZWDz1ExNfdtB5tQA8ncRISJcM0hC9wNJ6NWgluFAbAmt+E8mk12MEInhEV5HW0LOkC1yFtTAKK7nCJ1/Z2R84jCow07mtpOfo3OtjIfCNDtRj3mG9hC6UjgB82ULsoFwE12skrxZ/0DtHd5/SVjGVVSDwz5VfD/m769PSUJvuRwYNa29W+88SttTo+mJI2kzeeMQSeh+IAm9FoJ3JdDCH6Z3Jk3eMWeXLF8DE49x4+K0/iL2jYqwhb1M6OL3oP7vxT4Bk0aJR1YC8iD1hz7xHbHuEp7R2xq68A4keOgXbvOGD3Kidhm4DVwtK++QhN5CUciz6EM9nrU2MbILfeud3oohcc4/3aoMJaH7gST0eqDhB7P6G0AmP4dB8xC18tW3QzrbLZjAfCF0sf6j1A/BP6H+TxJHOarxn6hq/lcjT3kSDdHzhE7A+hZ1VmL+J4S427RfasY0jjnxHS0UShK6j7LENMNqx1l6TLFtbW4ZyVnPabWMktD9IBRCp0FHSAchnWTeBCCx65FInPxCDEWIW43kLy5BVjpI6ANc3iSPOtGrAhJ6hOeJmthRycLL0DjqFSywRhsWdgOYZ2WdOucaV5RnmMm9nvOA0COOAWlctY5P5orEYj0YAVDDKfj9LWL+3iEJveUC2XOEFdrxiZOYwWbGPNaP/CSh+4FPQncmrPrGK8Kk1rLgfPoeb1BNX77qBw7O5xdhtCLxszz5bO1Qdb3aTOgDHupe8UxQQsf/53K5PcTPMU/8rMFk29BvvKvMGtWpXB6g7wp3AcEDzsyBQd+8IfSI05YLEqrx96BGcoK1+7f91UUSessFYmMPd0XQt3pYd9PtxZlm/lh8T2tFk4TeOlokdJwEK0llasFw1noxBiMZTedH0PDhqIx5QMrW5Cj8EnsvoU2EPlD93Oho/pkJkPFiLT+MMsfAL4vTp76oivQW8IWIfw29fajuD1gn7DeLx2mdjh7X3zCqnfp8l++E+l7ybnjPSNo6OJqZODqsNJo2RuLjE4e5FGE+EbqjpWvWh0IjKNX4S7W8vEESeqAyKcZHUqFo6bp9a2FEzfs+qpWE7gc+NXQ0GItl9K/D326C9CB6T2MDaBaEtgM62Xr4/KfoOzi28pS96KvId5s2LCEszTgO3nFiXDFPsJNqHU/ygwZmj3ptkIGEYmXQbznmIeaXUK2T0C975WClWlssa702oegG8WlfVQ6o40S1I4ywCX3KiZ8OE+fq58Uzxir47sUxVd9IZMyv+6gk8Mv9IPPrY5nCF7h8nMmjZUKnfuwz1hKsZ4XMIMUyxROTirUc77KKMsZ/sJ9gG1V/h8sMt+35F1KrVz8jmtZPgs8vSlTVCfsc/P8eKPefoZ+9hxsgBlgYLhAWogtiWei/qv45SH+nTlT0nfjecJIxS4nJ3OayozKvCN0+h81aSVaOQHfqqTyMLaP5/DNFeXmDJHSfxaLBW8i8a12HxydBztMdj3D6O4PITRK6H3gk9FGteCA+N6IVD4NnfoP+zYkfZupov8ysoEt8QsbBDY1aYnluQ0OqA3Pv3IO+st5qjUX3Wr7qpWO54m6864wW1thpMSWzkzPpFafgO3+Ez3noKDbRJnOTN6F1Nlpp8/zG0GJ72RrMb7OwozDAttMjY9lVH8msfFOZloV9h5VjfPnJUL/icWI5wiR0/jccZEA6H4Q2uIfIA2RKJz1H3pUyJ1uWs1G1cCkuSEgeGmiLrRC649//7+Mob6ivUP8Saffs5ANiUA3+Xfj8rena79gyA1mfSmSk6SoMrn9j/0jlVpUIGWhinSg58vfBZw9GFeNdgn1Gq8Y11KpX0ZeDLK+C9iH5kvuxLvIMmGaSNIjN1vlO6LZ/8Ix5AMj1iaAkShZzSMa5/AtFebVSFknoAcqVNRWcP4S+3HKZ6G0F68qg8pKE7gdNCJ0MChL6U39JLDNxIvz/6RQ1XJkRfDvXTmq233BjBgRJ3EaitfSYUng9vs+9sZlmjO9S9afhu7b/aJZ2UdeTxg/q51EBm9DhO9dTv+w0wAgtN+4qkM82uhE6hktlzlWeFspAy4FhUEFzF8sRGqHzfLSJw0CON5JzRZAh860/XRUwwwn+wv+uGLP4noRq7IindXVUMQ9xm6iaETrkdxW1XiY7ADPO+8mke68boUNeb2FttKtGZvB5VDX0UaVgYr7sOVZmtzoJfUizZonnPqVwYSsD0r5ihSFwFf2SJFuUoIyc/usuzwCpjwid+W1Ylt8PJ0u3ft8SidL5ZmcsV3g1zb6VrVpJ6OGUzTx3rI7bZy8ygz6wK6GaccwrSFhcSeh+0JTQcWLSH46rhY+DQJ5mK+hWG3pWCJf4YDydV/GdtQOEaejp/EuRbAWtyenApKPpLWvoeDRQe7WGO+UwXDV0eN9HUIOnZakdSIk2ELq9hZkpHItGKsx3Nsq7lUmfLISQVJKatSOmTHzWTXtqSuiq7mboVGKLIFcNHT5/a5OJ6lKQ+WN0W72FyQzbDRZj5A68alwcEW4g1IO9y6HkU/C+u/n5oLAI9TWRNk/Yr0hQn3m/5W4fweEiHPpEYEJn/dLf1TVJ6AGLR4/Nsse/OKFa20hbtrD1HuNxzrPhhIeWhO4HjQmdNRSZoJBgAwVlwIHKIjg9EUtPjON73c6u+5XQHS134phEtjiN28I+Fk8V7YZtltCKM27tNheETuVizriQmMctPn03LbP5sUZ9gH+OW+zQd59ibnx9y7K11EeEzvtK1notlGdX0EmX90tJ6F7Gd+iELhrInYxHfF7LJ9w5X3d05rgXhFEeSeh+4IHQWZqtEqa9xUvJwg63Ot1oVQfPku1IaPi7Y+PHVW2r9TOhM0cdSv4Q6HgPuYdtrcxL3DImEbDw/7ULgFK8jnY/Rxq604/sLXx6Zk6TzmPP1xu4dFsvaz0aG6c2AjXbsvy6nqovJldxCLnqdcqjlyq33oV+7H1XpOSEpNXJbhQz7Nsy3wndWYSaS3kkNt914f1AMWybHUnojUg0fEIX84G2+I3XMnJPf7FMoSDWMwgkofuBd0KvIFac7HAFRw3jJsv8TJQaTCFxFupq82T7Hc94NetXVYWhpNZ/hC76j/9Lo5Uxj2luy7pC9mhESOwbZj0NwrkhdEaAeM5cLLO7qqWoYjwOnz3JjCmJq936/QfKTYz/im7RubjFLvNgVj8ELjubr5Sj0I9ZPb1sz5PJzElFct6fyBXnvYZuX1tTrDNDuPLEbzg8Ue1W2RskoQctHwW7m64VDwMZPhFvIkc+L0OdLibfDnBuXlEKSeg+4J3Q7cZjsbDxLPJPsbT+QYwdPqoYqahayEM+n4XPb0FiQUOmupMyJ0XVwrCPrKP3J6Hb38ua7xirG7LUPvooEeMyRb8R/v/JqKqfhFeG4PeVUI8PQYe9EuWerCVid2KcE0I3SbQ2KO8N+DxM3odilK24kn85XoeMZvRPoa1FXXeifHtPNW+vHpyCM52vEENM1/C3qP2b3CsZXlk7N6EUJkdzRiqmmePxjL4ayv8dKN99JGAIHhG4eEGztRLVuAKt9sey5gnYJ5JZ81j8PakY2UjtpDGfCJ3U5VC1uGdcM26nYymUa2t3Da9Y62PSlYQetHy15TSnmgRvYZEniw9HNeN15MuS0OcQLRA6JVRyv/bqxUv0xSyHGqGkUlODUZggoaHvoXca653Lk6tK13MHKLwB+4zQqWV/bOVeUN/1yTqGKPZ1ENXcjPfzIw3qHh03xyCvG7CtGrbnHG2503oYn49U7VCIv48ki6+C/vPvOndiS7wcYznraLvv8EhxGkaKM59ymwBihJjNEsh5dzRjnCnWoboMR2cmXwCy/jxMBNNxEpynhtS5H4BHkUToV5tOZvOG0B3Xr7gQDR5Klfdx6Jc+A7RIQg9aPgH2Yg3G2Y31Fte2dq6aHxTrFwYkofuBR0K3yVQzfoCEzb5M3GdiI/IkuulEL0HQGW6od7ZGNRxC+MvweZ5vPxG6/R3FNOtttWOZ2Q2B67gzG+66tFr29qJoNP/MeJPwlp0mdN5+cdX6kVgHm4yZe16+wMMtPxjIrhMzzwu04TXVsoTnv5ly3+kg16Kg/E/G05QARf/xohxJXnbUuUIBr+LEXQz3SJsSd6XWWawci8S86vXJXid0TuZoxwDj9H7aRgF9ufP+qBlex3cVJKEHLZ9bWdE+wq2f8h0qGIPXHJjL7RF2GSSh+4EnK3c+EZuXR/h1ocade4CTMzqcgMnuLtYhKidD+yyUxhXvR0K3fSmr5kWu8qfb7LgCXo9yoXKyY167gk+2WKeYZl5Rd0HVWUKnBk+a8URiaeGgCH1h3fbjdYB6f9vtTiyXJU6M+Bxvs1TK2Ad3htwnc72EskSPe8J3Gg3qBbZPAs06pY6WQuQB79uaSJh7i/2uDnqd0Ad420TV4r64wxaCMVzV+Dbfg/nL4CxzS+gU/Dzd+n5VedkumTmLx1TkyZC22u03S0L3geaETrYVYWJ9mFueeu3YfDJMZM1J2vGqBj0jK2isdaLv934hdJt4j139PKjrXfQ7FTJCBz0laqxFIxY5uyONYZcFt59V3H520XI7SOjOotC4nH6l8eC3r52lJ3S3oB98MQjyORufyzENIaEVj0u69DX7/Zp5vij7VmQJ4+AC97qxqFJsp6lJvwyX0HlEK804EfNdu3btEE6EYaaqHQfSbuhrH49EggZkqU70PNYYod1Qhk+de0Jnd9O1wstAntvZvDZDxx8ZT2eL9QoTktD9oAmhOxOn8VV8zk/DYcQyaJB/uWg4rHHMXSluUBHpH0JHueBPcr3KZSKxB6xm/F2P3Q8AACAASURBVE2sj1fYk4dq/rBu23aK0Fk/iinmJ/G5ZoTK88PJnYXmnHXLr5rQgdg+Q43hKjR63s/geWuUVtE7WdjtmjMSCZeJxdlp8lS3XtXQ6e0BaPNYuvAR6FOPsUVMOGTu2NT8B4+LxHd6hyT0oOVrVGYYu29l8+80vXNubj06ld+vXe+WhO4HzXy5swkcrXjxuVY7taMpmp92n2jpNijXbhD9Ruhoqe5mScpXwTFmcNLqFqQ9eaSN48ZctkU7rqHTMrzZS9sJ+R3lZj1dTeg8UEyc2A1UllnQoG8SZNjyYMbvwntvrS4PloVtFV9Axdc4xC1pk1A1dAtvPbzvqPH8a2mkt4kjw0pkMoX+HFcLp+K4g3fey64VBnIy5UpO2J6a+UUv/cMdktCDlq8BSPyEmFL4fTJnsfgH+mqxTmFDErofePDljvdCYdJ4MfuGLy0xruQnXLdO7a1Qeq6J6DdCh/ef5n6Hl535+lxM8bZdrBReD/k9NZeuX22ZKcbJXuoibHMPeyF0x/+++Y/qM11hl+nHvuRYIRPjZ9X1sydWVf+zh5xCJnSnr3DHOOEmo8R9AzDfEbzuoZG53Sc1cxoXJFTcfs5jJaEHLV8D0H6bMPdGr4Cx8cKr+ZhrFySh+0FDQqf3QuGzbalU/tnsG74IHTVwdse0wlJYMIRZw7/Tb4SORkAp92AIZEEVzVh+Jznmm9l6MdThQXZGPy8J3blCBRp0zRY9uotdg3YgX8Fn/ExEQj/+arUFvX0FUzVuEGwD6o2TNhF6O5PohTD8stpXnzTzsiayawJJ6EHL1wTVUQ7b+j5J6H7gTUN/uM593aawJ8KMeazrxMyvH7VA6FHvmlZPEDpo4O+u42WLdMKoao55rG8VmIaeLbwS8nq0GzR0vnALn9CnmMcy40ZXDR2PezTzXPpsq9bT4uRi/MBNQyeGeKpxlfCVThN6swhwQVLICwSXyRbHC4wbL32jQStJQm8/BvgV03a/SBK6HzQ/Qyc/Uaj08dYa0r6vmgEt1O0Mnd1Fj+es4/l3mhN6oSVCxzJAfjd3K6HHVKvoIhvhPaanc+dqOOWxxPLMS0K3b1Soxu+ryxzSxMf9W1/tmj+14L/UQ/49qKG3L6GBFQ31a51HxROEKCShBy1fN0ESuh80s3JXWEg8rfjf+Jzfu6HQ6X7nRg78J/f4xcrykjiJ3ORO6NAoF+FzXgkdvbBBnvdUbzl3C6EncpMp4Z5+BeEyL0xejK1qIDiG+FRdo7t5Quh5e7fDPNvFqQz36LYjqeZfRd9QbtkD2WIgCpBlDVEIDlHITZCOWrn3clLokR70p3uSSd4uktC9JknoktBr0eweunM+eKuqFvdk3/IkCGe73YiiwYtLg5QY8d2Dd7H59xoSOiWFv7LCNx78NjGZh8crHSKw988tofP3kDueqvmwywREnLHgPfJRxTyECdXrpELvC2eOewHksTnp5ulpHhF6LvdOfg/9ZLfjC/ucVjGnqOyHPZ+j206SNPOT7nnrJFAR+lvwUDdJ6Lxv231CL3qQmwdIQg9avm6CJHQ/aMlTnHE6PuvBwxZvDHgmvxAG1hWu16YcYxiyVck7ezqtvyjuOiB1doXOuI+7QG1UDj5pJ1XrA3WsyOfeUxyf4DXzL/VvAUzaMopMRbycX9nevJKa9aW67TqPCJ3vduBkjt7oXCJEUS1dMx8dY4sjL0567D6UnjgSvr/DxUFPKUFDvz7uaP+dvLbWq4nFtWfX1HCeaNYWzSEJPWj5ugmS0P2ghfCpiWyxFFWoFiJ6kIo41o8DwmcEMNl914Nv77fgs3yCRYv6hKpvTGZrA5U42+7Gu/BZutVaG6KS5zVMXYG65tUNhG47UCGLDvdIa451v/FlXkbnu2Vb9twXunDMcRpzOjLn8dDbbxTnuMOFwX95XY9uOXSIYf17JGXtX9kGfAGKqaJv45XLlyc181Y316+0XqQP/4INqM4GZ+nFpFAyZ0dJgtyDQhJ60PJ1EySh+0FL8dDNEguJ+kmRAKtypNGyUsfvD9+5lJGvazxqSnrmdif2sT2pYrAStzN39j0SYONh3MoX6jBAv+/kgQEDoCNcSOvlNmnOPaHzSQi1OyjrI/ViDzuEaJwfVY/ft5HsMfRkLKN/nh2VzNYbBPON0J3vUPevdaNDEe975jpo90QdOdqfEacqmrmpcYAhsoOywku9Iv1N6CVbM1eNXzaYQ3xCEnrQ8nUTJKH7QWvx0Et2HGlFvw215ERaPzS1wtgntnLlXqll+f1wkoyphS9AAzxYL3oYnZB1OiGrxU/h+3lHF+4Tn163PIpeYsY0QOr6e5wFATeCOwVDkS6FZ//JHH7UmTC7gdAryKtBDO8Kf+T3wu+fQTemWPdUPv9sbINoRj8ioRT+G76/kQXTmWk0AOYboYvfh+/9oZ6fcXLNjPjHt3bD7xdGFX05auHocpREqcO47Iq1EvrWxYlscTpRx8WpbbSoWb8S+18T9CWh48LHvj6oGj+D9uLjLcTrT5LQg5avmyAJ3Q9aI3QiGD4hpqirxt1oQQ6fb8FJHia30hgJJ2mW6pI5M7SDZzcMp1bsw0oyQIvjNGJCNetrlxjXWjNn6eLCfAga6p/xjP5H+Pxv8PudkH9prE4sdid1B6FH7F0Na3/odHczwnTfJoc8UMY0ZCfIBzoolh+e346Gh0T2WdubV8POPz8Jne14ZK0jSZhU1s51CIb0H7roMx7FY56EamzA31HrZnYjdVyckv5XjmetxzEAjii3Jug3Qi/hAhV39pgB3OciwhGdB3m1AEnoQcvXTZCE7gee46HXxsLlpEHCR2aZf1/hc3fBkqtZ3HL+GFqE2jNw/Afy/XUjLR81dUpwJpmUeeKEJpS5joOMriF08UaAJZBo3cUMrZ8xWyF7Mnka07W2Au5uOucnoTvfjarG2x0PfK6xukt2P8EoX0RrJwFCWP+pf/xk2zUoxpu81Kemb/cBoRMZsl2MuGY8OKrkJwRZtS3UpyT0+QFJ6H7gkdBR4613Fl7l+7mRUPHvzLrV+BC+122Q8IYcVSfi0AjT8eYeqzjB0UmYTv4l2unxd3NWiJIlpO4hdFZz7o3sM4xodzerd7XfbTe5sMVT7YQwTwldlCXI5dP0aMd1oVPRF8jf6TONdoYw/jOLHKd/UuyvHjHvCZ0tkmaSOdwlmyxHM4VL0Vuh0K5tmkgloQctXzdBErofeHH9qhqPQvrNGNd2Wo+yVKLnwuYsvT5W+Ax7ed2JkDdmPGN+jJIqkltr78WyMq3rbtySriXZbiN0oRPDM5SIzEaaYoPBTokJF2IJVf8DBtiZ365fa525OJq6/gl69c8qsVsEPiYF3KInW8eMpPSPsbe0OsnPT0JnZ+TsOK3E7Gz+HWVjJMKusLYoqxYhCT1o+boJktD9gAsto19MLXmNXba2y65QIRnA5H0gENU5S5avYaET7S3tRgKe5XkxY66nR5X8W/F9XgbHVEQgN3pnlUyqTRYUJXo+qk9T6+PiY7HxggZl+Bu7drTb2U7VdzNy2uhG6PD3D9OrZPrT4g4AygjzitYh9FHFSOF9ZTrBVX0PZZzRP99ABjY5jmby74Hy7aLHDuwoo8liir8LzyxxMYKLJzSW45NtVZl2shsA51aUx/FbfhULO1rVJ0jd7nUjdCjDW2r6kSCzmFpY46X9RUIniyOh3eyy0+OYs/C5et7ZnDbRJ6Dc9zNtfdbpA40nAeFoaZb0QcW4L64UTvBShzqYD4Ruy4XNAyQqIPQl7pP9WnQWw8cUnZjb7/tbEvr8IihJ6D7AhZbMrfrF+DGnluEnIV+WiIFbcunkzliu8Gp8DibGd8NAeRQnN7INL253s4hMjCzJ4CaBV7IW+mz/3eKcfijm0crAEBr1reS9S1fT/FS98r3OBF3CrT46ceu38khlQDI3L1lxMtRvctauH/y+ZPnJWD9XDR2e+Ujm2DfDs5O7BZkQGY2vOAWNAl0JPZW1lmB0LyK/qu+lj3kT/qyrofMyCBrvUVFF/ysa+NEJ07TtFMS682MGbBOqdZsP8NjjSW3ViFAWu0zJpaum0ytJeVw1dJDL3936BNYN5Aga+qk1hA7feWu69ju2zJLZ1Wu89AF74lu+ehjbbUxsN6HsqaWrKjR0/B7+zhM6hsnlcnvQZ6z9oU98Gz3vpUi/pP3XlqfQf/lE6/Ql80mQ5zdH06teinlhnpi3+C6P/domdHjHNuqopmax0pVJPMrCxZndFlnc+dC3xhTzXFzMOnLgfhE6BcdFL+4qEtKrXVR7S/b38BgmfELH45o6C99W0i6mpPyBZT+vCKqC0DnPBGhPahujbx/N55/JXjGv5MXB7n3r70YtPZ7RfwS/n0eT8WMQwE/g9+8Ld5+Jow147lMxvLqmWmSViAMbJz5M+P8kMUzTt8cyxvmxtDnuvK71QeEQZeGVkN8XoIE2kcWC8F7HWtncBQR4HUyS7+AhX3HiRU0VJp0LQLv6cUX9MsbPIH1ZDKnpGKgVjo1njEuhHj90vgNJJTK6qDZgDdcQCq+Hv/8U8xe/B/L9EZTj51AGkz7eWGuxFwrobS+j57D88M77yWRaWfdSkt6tRi38ZkhTyezxPH59JJExD3DK4pSJ1esXcbVwalV5+B3s07GerL7nCd//KXznnIqQuuy7CaWQgXJW9SNHZlF1YsxL3cX7+bTd3GRp/Jxr/B7PsQdo+8CErxhnQD+5EfsLN6a0++/SyRINwWrsxGdw8sX4z2IeAWATOrTZ3anluPCrXKx0ZSJjusi1nCfw2ir05csTivFRjAYo9AVSx/aeldcB6wNjy9e8BhZ8j+PCtnpR3UKyvxfLUn8XYRI6tPkZbHE/47dN+CIZ2mZea+gY52PMaUuf7TlZwrEG/eI+9NPBXjGv5OUPQqfGO7swQb8xljELeB8cJu1PwET5EUhvwvvoiYS5t/DNBT7ieYuwJwjmSW5xVDFOhknlI+S9GfM9sUzxxESmcJCw/ToQ8J1zD5S3UIdUasU+sXQhiTKG9FFYuZ6OuyZR1TopPq6/gbtAjQhacz8hqho6LJhOw61/3NWhOzuFtVGl8C5cbNCnaGAWXMQRbY7eOX8n9iOSFOO0eNo4Bv8m+Hwn34E+l41m9P8S88ff8Z1AbPmIx0kCPRxCX12LfgOAHN8H339/N6YoKZtxWlSZgLGmryTaEruz71KnhXPc52i7KvnnYnvG0voHg8tWf1+1n4tgoH0PnWJB2380oRbeG6RsOP9BXieGV76uAh1zanHfMNqR+OiA8doX86LoytUtVT3ueSst5EHu9b01GkKL9avIp8F36sa89vm9usDvedVC6Tsqook1LE+9fDsss4b18VB2uthbuvqmzDG4Fb+a2BBgSi1dM6OsfDN+dgl5xtke9+QIRqxvaumq32ZIXmtmxPzxnfD71eL3Wqxnz4H3Dydug4SERC/D9ntdfZboQiqhvpdPJrVnmPN+crEJprruPb8bEQj8mppxOTnuUfWn6e0ESIq+kwZmMW7mUdkigiOjevKs9O/OXAmr+m3MjmEnzx/fhVv0MdW4WCxLM1S/s5tT5QKq68fYQJh1j7SnrgvCbJs2lK+bEHZ7SkhIdDMcK3vza27x0KstlltZ/NgGeqoZT7hY2wrx0L+Ez8lJQ0JCQkJCwic4ica14iq360D4f7Rsx+h/4vOt5W3+uH48dGKUSIwd+0BjkpCQkJCQaBeYlX3GPABIe4fLHWTyOzqGiTOXw+LNhjoQfRIc7+YsKO7EWX8kqa15mVgWCQkJCQkJCV+gNhvxrFnHjbHO4g6Y90UzE8Q/AW69owbunA1PLeCf8SuWxCJZMx9kDm5qvP8xp0kXRmiGkswlJCQkJCSCwD7rzug55nDDNcoaIXXNfAyvjU010KaR1KMZ4+2JrPV4/Qh41EtaXNNVsQwSEhISEhISwcAi9ZmXjfHYA66kbs4yP/U3gAb+ATSWi46br4grky9PaoVYTNU/iE560L0sOk+KKbXR2px46Ny6vastvyUkJCQkJHoJVONGh0fox5+7ynXRrGdZRDDiHY5q4MZOTI7L4mJZcHla+X26KMCwtQ9FUye8jr5abrdLSEhISEiEBtt1r1pYQ7Vw01XD5mfgPF66cyVNJ9EB6wfOwMWASaPHaYYlvlNCQkJCQkIiRDj30jFi3irm5755dLVm0ZzoObo5w7bz3yu+S0JCQkJCQqINEDT192JgERYVDM/U/YQrpSF5s0UMyTuD/tzFd/QwbE94EhISEhISXQtHUy8sjSv6nejRLaGZ4pZ6A43cCdGL36FhaY3NPW7RPsBdzla6ZqZX9eYkSpqEhISEhIQX2IFVUsY+UcU4E8j8ETSES+Ym+bn5rB0L3Y6JTo3exuAZRuSPwGefHdXyzxfz7CW4l7nspqHPTfhTCQkJiSYggVzCSHNdEQn/EAlqNL3qpXHFxJCKV0N6DLfRUyS2vJOIhbtqPAok/jdYALwHfr6E5gT9oNf6Qrlsx6uPrTxlL6j7CVDvs+OK8btYRv87kYNq/grq++WYMrFseMUKEi9aRlGTkJCQkOhW1ITfPSpZeFlU1dNA2kUgtncDyb0rltaLI2lzfCRl7S8+2+YIgm0CJXJ0YYsx26GeW9E6P7VsdYlfzcOEv+Nn+DvIYUNCMU4Woqr11gJGQkJi3oFMvEeAZhXVCrFRzRhZrOqL/Sb8vhB6U6KnwV27eouH3sYQmm0F31UaTedfCiT9f8R+IFss4XECtyGoSOQzfRYNCKkVv/7L4ZSxD8tMkrqEhMTcQLi29KmU4zGs5CPN8vvKcW3iMJK5nNzmEZx46NUp0oMk7sAJVhNXzTvoGKCE3cyinxI+CwmrGtcPJ49/sZinhISEREdhX1lSjM+4hbxsIZVsZyKqeTjmKc/TJboc1P1twtw7rlk30EA1+u6W+z18B40HYUFw1aGquqeYt4SEhETH4Gjo5qfD0NAhzUhCl+gN0P4Jff97RMtuncxFbX13atkaJPWvkZxl35eQkOg0pIYu0Y9wIs6ZSiJbL0Jcy/2/BHlNJzVjBPOW/V9CQqKjkIQu0ZdgfTOpmRe6x4T3o6XTmO/JrPU9+grZ/yUkJDoISegSfQhyvg3E++KEZj3MnOY09E3vLWHgGhJD/q4Ut3qXZ+kSEhKdgiR0iX6D3edzxjJyn1zVmwabaYXUyZ111RwT3yUhISHRdkhCl+g3sPvyoKGbb0VDNhaIJgQyd7bdE1lzEt8hCV1CQqJjkIQu0W/ghJ5QjI+idTu72REuoWvG2/AdktAlJCQ6BknoEv0GTujowrZdGnoya70J3yEJXUJComOQhC7Rb7A1dLWoj+XCsXCvIPTcZDmp6MvxHZLQJSQkOgZJ6BJ9B9Yvo2rxjXHV3FXZfwMlyMNEK/cdiUzhIPFdEhISEm2HJHSJPgS/SrYAyPfaZK4YhmMZWzuPa+afq94jISEh0X5IQpfoR9guj7PWW9APexiGcbZBnGoVxXdISEhIdASS0CX6FER7TqVWPwO09OuToFkHOUtHwzrMI6FZV8KoWii+Q0JCQqIjkIQu0bdg/TOWMaKJbPHxuGb66v/4HeohznpkcfrEQ8W8JSQkJDoGSegS/Qze/6PpQh4IGYm5FFX06bg3I7kS0cyzRSTzJxMZPSfmKSEhIdFRSEKX6HfYpK7oy+Oq9QA5U1cwDLAxTccDMZhj7mGhf7O/xVVzBh3TJDTz7sWZwhIxLwkJCYmOQxK6hERFONUDYAz8HLV1JPYxei6OpE1T1sLPSvg3+P/umKL/ZCRn7S/mISEhITEnkIQuIWEDxwIxZItmrKNjqv4V6M//hH59b1zRn4CfO4DAt4Mmf3U8Uzgzrk0cxr43IM/MJSQk5hyS0CUkREwtEPstjo9MZvIFyspTXkLCrSbMvcW/4+/lcllas0tISMw9JKFLSLgA+i5zEetG1gP4N9m/JSQkugqS0CUkGmKAJuzLpD9LbVxCQqI7IQldQkJCQkKiLZhagCQrJmJwgwnP6tjvSJb877j9x4i5Ze1BErqNAVGWNbJvk/x7FmxLmtd9isnEm5zkmbOERF1MVXLAVJM5SI6r7sKAQAhh59e0gfuY0G0Cj4RLxC3Jv4cQ9rkx5DfVTefQAyElid5Hp/tCmGNrgM5p8nioo7A1wApMLRhNFQ9EBxexjP6emKp/Pa4ZF8YV/cqYUrgmrhauxZ/w+d+BOH8L6Tz4/bPRTGFtPFNYsjh96ouqXsMat/7Krc8IfcBd7pEIWi/HlYnRqGroIPMPRdXCOXGtALI3/kRkzuUPsof0V6jnJdBO34lp+hT8vxgdL8aOzky+oDrfeu/rFVANIVLRjgfn84uOHtffENWM46DuH4yq+jdiqnExyOTPtG8a1+J1L/w9oep/gJ8/ATmeCX3rTYsz1pJotLhv1WvESUii8xgQdwb5zgtNUz2dIl1NalTm4icHH5xftDitHzqq5CdgvHwkBnMMjKdL4eff6NhiHAD/h88vwbEXVwrvJ06RlMmXV71goJfnnp6AvYXCMJKznhNNG8dB45wDDXgLTHxPYZAHdFyBBIvRm9C5RU1if8NnqLcqqwSN/AjkAQ2tfwIm0sVM+0QM1NMY+4TQa+ofi63cK6ZaWkwxPwsy/wvI7gH0/EVl2kT2FfJfzeRvzsLC60EgtitAhmdEVXMMA3/w9/HtsTmpvQ+wstrtN5rOv3RUNU+F+p0P9dsMdd01tnSS1N2W1VIP/TTL+qlq/hUmo0+Mpo0RoZ/WvLczwOOD1c8II0W6mkAcVGznSlQgl8vtEbQfjI7mn8kWFC4oV8xHqdSxz4PxBARu/hDGxiaYQ3fzuWWsCQfwcYX/ByUQfSVci/PPaHriyIgzjnpq7ukJ2GeMDOiUAojkq9CAdzECL2FcZhogAknRmOauJxsm+zm9hB6txkheq4BYzRJ0kuvhHacllpt74zvxvmx1w85zQq8YOMPDa4eARNJQx+/GM4W70esXDIYS8QYGv2P5K2XqUfY09KYgf7LAwgG2DlbVn0ukrYN5gar7QffBtuaOINHG1IJGd4mMHWM5MoGUqKxMX7KicjJtOWE/hb57E2oZeM+bFaLuAjRM2N7hNFhQK8Y2uqDWb/OVVOM/8HNTTDPHxby7CfV2i5CAkmr+VaPqRDyuFUyyO6gY/4M7hNA234S6fauXEvSvc6H830koxlkZZ9esWV8if0cFC/rCVZDWszZtuS+wfnQn9OkvkZzF8U5/J/9PZE44AMbEF0DG97B5u5RsdR5y5v9ZHFdJZ1zNEC0eFgqo9dvv7uq5p1cgTE4Y2QkE/Ut0G2lP/ArxFb2b/SzFvQWGcCFUveT4mTagc0yWxghJ69vjGf3DsZWn7EWL45Rn3hI6N2jDukG9QQZvReLAAYP1RLmzMu9m/rr9yr1G/pgnDKQSBu0gbayau2CSvCwJWrtTvK47YxcXewNxxTwBFj3XYh2wD/FIZLRv2f3Ubz8R+imRU4n6T9cfRu9sSa3wMlKKNk9AvL6wkD51yfKToU8UZ7C+vpJmzVJXsdbxYt5dgJrFEWqPZB5S9Q8CcV1CFyT6U6StqzS/Hk2lJcvXYB2e1I5dQ/tS8+McIh88NoMF64O4eIW5ouSnL2A/Iv0pa11E3sz6sL2ABAUrquj/C+PgcTI/ZK3QxhbNhwYX4po85HsDbsnb9ZSk7hOCRrw4W3gl+n1GH9FkglQNooXHKYn7JZGGia/icJsTOzquOnnD0nI528DziNBtmcPPRUjkUO/NWDeYuEt896Odcrflwd+FgwvfD5M+vP+yqFp8I5dPl2jrtsyi6sQbYfHxR5wIUF5iHdolJ7ufaibtp5rxSDSjfwyJB8vULnLk+cY1/RSsL9R1N+kXfhJGXSM+343j2lnmFlC1rZsaRDsbKOs3oA9upL7q6XYukhDuuNiBZ1x2oHopkQU1GX/GYynmZ9+DBTj5+6h26vNBRvcnUB44F/rrD7vJrp+qX4B5Csa3kahiZKFsW1g/52OrHXORPa74Qg3a/acw9+zLy9SebjdvgRM17UQxpfA20HAeZVvhM4w02zVB1hI7WzygJoRbMjCwzxkeXvEsLNvw2rVDtIy9T+giQeIZNgzIG8bICrhod+5OybymDcj79VnaB6yd8PtneRvM8eDi/XQgOl54P0z0T42xfjAH8ioxYp9lEc9ugTLFBBmFuqNhE7pqnjoWrO+Tfk+JUZ9zDV20Q0BtMJ7W32HvThE7BiwnnRN4v+zkfNSJfoTbzzD+n0hqXEP3RuiooUMbPijs4Pka60RpU4wLMU+bzGGRinMR9hOuRXdCHnxxRrfijTtlZMAW4Wg7xX2h4X7BIjPNdrIR6yTasMtIw141Yq9eyaKjpwmdy3x4xYpn4dkV7kokyarUnrDmepKhg0sIuwn/vyGm5g8Xy99Z0Pah54b6RbRM1pwufJw+BBpvjmxl745lCh9gBQ71Ks58I3RxQYuGVlGl8N/Q9+9MUS0cx+csP2+Nzy8Cr07dQeiqfhFrmAXw2VmEUDVzeq7mIzKm8EggW9wVUwtrsGiS1JuAr8ZG0/kRaLxNRNPozBav585OtoToOfK6aGqCbP9GFePMgJPanBG6vYBKGa+LKeZ1SEzwswuIqb6scHCN5XBwmU+MZiZWCfXo0Lk6bZtk9vgXA6H9gy0wcKuyW/op64t08QOT4A8PzOX2QPmEFQxlPhG6aP8wmjFW0WMmfqvA6Piu4FyPr24gdLzKiXmi8fOSZWv4+JrTNqCLCWuGWsUX3ovlE2+ZSAiwz6MzhWOhQzwubK3MdQevbVhCKBjruXgn7iREM4XT6cTZW4Ruk3mmsAImr4fYWdFc74R4Hviw6JtlZHKGILN2kzrJP5HIvxD66Q10Z6Y7+ylrx91swXE5P1cPwyvWPCF02/4hkSkcROwfcLHOiJwZWc11G3a8z8w1oTMjT7yG9lYyr9Kz8rmWs8t/DQAAIABJREFUCysfGgCbM9RuxDgN6y019SrYmjloWzCYpum98K7VEGnDQiejFszW39CBASNDvxNAxwmdyzyWLqxBy1J2F7+rZV6b6A0Hsh2n6N+gNWsrqdtX+GDS+x177+65l0NTOVEZqdYvhfv9gWTU64QubrHHlIk3JVTzMcf+oS+JnKc5JfQ4u8KKd8qTmvUw3hAJkFfbZARpNolzJiigWHdJ6gz2xJDRVyeyRRhI5myvDCh6f9Eq4dWqEDpIuVOEzskcyOjd9P6+0TMyryM7roWeQ2vYHlK3tTnV/Bx9Xy+QOU9A6svWlJOa+WNWnUD9q5cJneevqsU9o4r+fXTqQ+x0ulyJ6NR4mmNCJ4nl0bX2Cmzux+t598XG86+lYuiKWzdzB3vLNz1xHGrmca13yFxs2BA6XccI3SYlxXwz2TZSe5rMRfntXkK3574s1jM0cG0uayXj2Ff9+zyYu76q6sxa1/xYUBn1KqHzvI9KFl6WUI2/O1u6PT8GQhtL3UDo8R4YX+ToldhTmb+LdJdfjM7DOTM3oknN2iE4iZnzhvLZ+UL4fnsJXZD5ibCAQlnPMqcwcy2/kAYYXi8hBjUfEOsbAvhgHQC5/d8YuwEw1/X12c9Qs5iNa7oaREa9SOiiASiU+w5mTd1Duyyd6SNdQug9kbgRX0Iz3tbOvtvl4GdX+ksSqrmeGMD15gQZ2iCiP9tH6I4B3MTRQEqPJpib3C6oe9hynE1Sn+crxXqHITvI+xg8ouhluWHZsQ4w6f4Hg+qwKvoOHdwzhG73f/0I6Pt3k2uZXWp0O8dJEnqLfRe91UGdt0TV4/cV5dFPIM440EiHXlHo+4HVbkKnxlypFfvAYP1PBxdQJbqVKab2DnRytoU+nTVz+1EZ8wBa/aCypBMakNcv8Ly1PbLTydEHT/F23ndWjF3Uy5lFDQl99LWeInRWv6MyJxyQyJqbJJk3TJLQW0zcMh/q/dG29N9uhu0DWjU+MLY00FUv3x22Ks15h4i3m9BZXgnVPI/e7W/XZKZXe9Aixi2ViQXQqfS/HPoAY74Cfh0JHGubyQ4WB7BIeDxkq9tSZXCIopOIX2sn2FA8hDvuXO7U//uqclTVfyVGFWxFKj1E6PSaYY5cM7y5h49LOpV6kdDt+Aauqe1+BLD/kvltw7CSf64ok3kOOjlitDS8a972KwmKYUdei9sEY1Yk9lyp6rlOE33bCN3ealcKk22azEpcbiRimhCykJxPYlhURb+fpsIDsYy+E53C8OcYac3EQy4XN1gBwnmHKIdWYd8ICIW4hPKhvEB21E8+8YX+GKTbQQ7/hr/fDOVfh585EejMUgC/8GTCw2s2zMbg1kRaPynIzkWPELrji10zL0/J3UBPfaVHCF0MplXmgZBo+GYnOf72qY1NuxZztkMczbBC7sNdDbpazlq/auNKWQhYYdmNnMxR7RAmSYx7+wikR8kkikZCWeG5rCVqRZ0i9nYROpH34rT+IpDFVhq6MzyNmMm5RKIr0Xv4WyH/84C03xlLm+OLlcLrMRb40an8fpiGk8e/+OhM4aAk8RWvvxsI/ufw/fvpoJss2dvNoZRPL9FFm3VvdPyEVzB5+N5aBvL9ru25MLDckMAm0TXrUyivZFZfDiv7lx944Dv3YG02gE5g8DMMSAHPnw3fu58SEgnt6LVfskWAOcuu9d0F73uH42DGvxbRC4RuG4FqLNZC58i8ehewW3YCPZW92wmd9bVZGt2OOHjZRcKuqvqvoL9/F/rkN+Dv52AYWPjsl9DuN8P/d3JFg84x4e4MCsZxlxCJdEfgqPZBuMObD+iEpYFQiR9r2tA54sHrfiCXi2MZ4wPxdGEpEsxw1noxEhxPo1r+QBbn+22QfgBEs8UOe8kWB50YRPRnuIQuyPzLzPtSWHUhcqHe8ixY9RYui6uFpYeqxT1bLePRmeNegBG7QO43sm3y0GROnf8QhyrfCCrTmGZeR20PgvVb/D7ZvdCMG6H/HcqybzRhkr+hwU0U/ewTJ0AkDnqjCbNkT3r0mtqj0Lc+cchyagSHcghKmt1O6M7OlL6cxclu586brUSI27v2DmDV3ztpVNkwHnidGOHkuz6irXWA0Et8/CRo9MUrIL05Nl54NXNt7Ap0BIXP0OiR+tUkGmKWRo8Ms2xEgVDNh1uQW8+CVOwVqdQzoCFuDGNirGloHpAiS8JWXplQdCOVWv088f1egNpLEsP0KfpFUNadwk5COwdh+ITOz81z+qFxzXyChngMPshou5nM37L+52Q6PyLKGCdSngQHL0KiZEL+Lkzc+H/0FAh538V8OYexQ8K+b+5E62YfciV1IgFYVOOeoDscVDMnFuY3c4tY3A6msnIb/IKs7JshxjIoxyP1rnkyudEAF1nzaVhsfdOZYGwin++uX20jUOj7d7RhvqFzDiNAnMh5LHR2jMSOoYwnUHuMsxDAPCUrYni3V3sX3+sxkTC8oBA9Ob7sFLaz5T0eersIvWLeUfS/glwTNaWAsY3jSUyR2r40gN7dYuzaYphuZe3FhmroIfXj7oQz+K3VYZ5DksQamm2H/gsnvIqXs0Z2JkWcOMVEJznS+M5kT48Gxs1h0O7/yM5iZ9oYJCZ0Qp+yDeGK3w3L+JAZb2EIw91xpfChMieGqUBEQf1p26Fbi/viYiqsfkItUFfhyvm7LcuVPTumGK/ByTkR1OZD4cRlEeJCzcG7mKYWDA8Pk+ej4/k02qBUlIfHb8YJJVtE7eUX4g5A2MFrupnQhbJ9rR1GoFzLRgWChvQ10P7h/+A9n02ohXxcmRjFhXRi6eRB0J/fCM8ehTsF8Yz+YWwX+H07XwDg0VA77FoYqd6N1zeT5NhmYhnuonlJ+GxSmciqzo7b3GrodDdqlvjOyOgfm+ILDHveaeoZcmCK8QBfnChK/rkYojVUuxgWjRPmmq+L/XC+YgAmoKuTIW63k3w0c5YFcvmc4KeaNV5wgomQ63X6OzDWdYKtrEMefELnD4vQGZnDhAIy35HQxHcEkjUGrng8njaOwfwd7TEUDIhtFlX1T7MVdFB5l+J0K+yxxcqa14jyaSpFvsgA7V5YyfuUo16i/UffjhbXvM6tCokvApBI+fUrbrnOAkb8Jc5iNiPE+N5homsJnbUZRmyEMbsrWJvV9iW6aCqS8MIg52txG5eFUvbclmgJHcuYx8J3L4PxuduWX4gKA98Nwi3pwDJtjjYSOiFzHDvTsbRexPc4Cpo/iPMMnrOHpzzgIo9437wqFKl2I5xrasU03bIMp6G5L13I84lRJT/B3xVmxxXPGqPjhRi86+52bd/xiS0MQrfPzjXrjJCiFZXIln3WfHo0o+cwb64thg0M7ymQxafDGGxOjGXjdFE+XuWY1Iox8TzUVzm4dq4YG4IGSHHa1/j5kuUnc0OfW6Np/aQpRt74TDvjAXQtods+A6xLQt0NFHYC0d4DNd98pKKc9vGILXsWAIbPI1VtQss5PnEYau3sKCY8bV3hDk+K29EwFd/FidBrinjvn+0jdL4wYTHI2YI2hJ2mqQXlMlXeYLH/+5CMtNnOiPlAYrl/p01dDXvgZ83vhTbAFG7BXHwsOq6nMX9GMO0Q3gAnL9zChPfeyS3hQ+mwFSQRCqETGaiquie6t6QkErSs9GwoptHVfio11e4YwAO8/lCH4Nvv/OxaNW+BSc0zmYruiWvbys9gN3Fx9cjibOGV5AU+25jLZlQzRkBD34hhHA/MvZMZBQU3ePOCbiR0e0dF1dNhkgq/MYM2NaCVf/zgfH4Re6Hfo6bqXcBIXCmcgB7siDFvSOe6jsMTcyqIXL3UB/8Jm9AFy/GzMP+wY49zeYwq5iHoYyLwkRr7Lt1671wY7E7CbmiYTO8K02k/bsGMqhNk67cDBGN3psXj5jDU4xHa+KH5QQ+N0G2tUjGyJJJaYKtsNqhU64di/u0H3zpd9VIYbHcyg7QA8qZb3kmVLgC91MO2Q4CFHOQRePvW2SkwP4X5koViwK3DVCr/bPbfgc61TXcSuu3ngnj0C88Gg9glaOZdsfSJSfKWEG4JCLDzQlfY8L7fh3U9krglpc6ctuJtEva+tig9+E+4hE7LDr9vEY6o2nZ05NwECthn7KMOass1r87RbXLJmseGdXZuT4qK+T7MO+xVWyPwd0VVQ2cTUNcSOl7VCqGDCne5Ta8Wr6FBcOryjqATNA3cggYr1ufFvBuD1hXv40Iej4a1gsdQnWiXwV4yEOCoaOD/t/clYJIVVbpZUAU9OszgMi6ooKNPfS2i2HZ35c3MSirvktVNs1uVd6nqQsRWZ/Q5IDg6PqmHooMO6ucowyCMo+JzYdQRt2EUceExOu4jI9p0Awo0TTeLIHTTW2W+c2K5NzK7lsyMuJm3qs//fdFVXVUZN+JE3PjjnDhxTq7HRC6RNUJX/R2gzn2qvHXWGk7m0c+L9pksjLCGb86CkPNx5crxI+DZnzLtFArrweuw/pTminFCl9aFkjd5gSof45CWQG/iZYUkDXb3m3bMaIiOcU7w6lTb3Q/EL70XXm5i18nvPrNrIV/BevthzpADBG240uAZnSlCZy8WXr1D87KuuV2+VIVqeLHa9x5CRPoa/2Mg4l/r9CdJShL+RNmUtOW9u2rTpiGYw3ew+8z6m1KeQAY3uLZ/7Vpn6n8297U8uBTMdFkj9ETTii4zs9bIK4bhb9QzaJMybIU8b8fvYR34vInYEUncg+j/pdh004TOg9t4wQMFZ/xY/ohU73TLXA03656lS093mfFxORF6EnbRDX9mwJmMazduuLsoruP0aeHjd5PL0bNhkd+ubwpO+qZN6E27zfjevNaZL4zdgyWv1m7EKONQiOPtZT3i4I59XvD4Wif4H6q8FgG/wugF3zAY3bCuxJvfnXf8L1huzYvPZpW+m75uZgoZI3Qmn5Vs4xdu1d94+dy5yYvuR6e1LtvULdicPOEE94klL/qugTknrUL1ghMNY90prJtGCT22wnrhv6TU3iYoZvdLdZ2IpSUQ5HCJWvcyQJLUAklYN257rC2Cto/19lNQSUjJ6CIj5y6GCF2xHrxWNyuYfKlKXngN1olaak547va4iGOOieORjHUC5MTaSjWaUOXVnkyjd5g72+RjLqOKlUW8acv1b7Wc8F2Y4vbgtqnxFPpP8FkidKUt6xS/ER1/C379yKmFWG+vtazYd8OuvRDWu52cILtXGmLnuGp0qSovgzBO6Hzz7r8+pfY2IX7HMRiZoaM9+HpZL9reMyQvmX+GYirtWlvkX8O9qH2yB/TXLMlNNM7UsbBZedDU2aouoScyD67Q3mkK8jOZV1wDQt7B93Q0FmkOw+twWF87C7Uch5GxaHVB3+ox59jHgUqqkzIRy6xlA7m7/keKXnA6OkvlWkg8CZTRH3LPIqHD+H6ovF5zQY6dQMNPd9MWU2janOuagcVxE3z/026z6y0Ck4Qu13po99Qrsd5eaegYfU73eiondOb4+g9q3UsesUOTF7ytvP5srWhNSdzw8Nui+r5rKPG1Ki/8rO6urmDuDJ2h6Abf0VwE5BWrR9fatZPQyoJx8PNe8OJ+lELVfwmeY0K7PqZDHnyxZlng/lWMYtsmd/wKGs7NmCkupVjcIpQoe0/qaDYeWT9dF86kj0Cbv1uw/fdg0Bjr1FOPap2Lvdbcs0ToAochYZX0xkc4gYYPoXbMau2/4nAYbC6+r5n/QpLT/mIlWplCvwwSeuzdfh/m2lDrTw3xbZbxlTCP9+hYk2NCd/zlRejKC39VWTNmrjQZAdmdp9bdTyRm9yAydc6lSejCZ2F6BbTlrpKBzGqiT7uBZB7vd2HtcPw9Ov0pSE3FCW7pZqxLbni28dDF88wHSe4yVzpPo7pRJpW4C/pwDfRnYtgbf7I6/q33m9NCZghdOpFVx1+Ec0TvSCY+1vtAx+1IAUkAoXCD7q2aRClKxfvaGKFLawLM/V8ZbN8ikHEdJl8A79UuHYvrsiX0XOw5GNygqy2yryx8p78W68yEF7Aa59vFs92g60lQMELo3GENHdiMxB2PS5ixotMXHj0L5uK9HUZy4t7uqzYNcS09tdS/884PmcyDm+ajOOc8/P9+KJ+17OAsyzon1tz5/Fn+keISc2l4pv46w+bY7pH1NXHzIAPrTE46Fgc/0rn6Gx83peODZJDQ+cYDvv8+r7oXY0CE3jZwp6VnBhOLsNvxIpw24gxy0LZfaXrxaxN67EjjhasUzdzEWe9cuZ37WbT6Io8SRjrzdE80wUqtBGO911B7uio8TXCwX0YwgwWkLsjsroIXfDD2M8nFC4rx9yUrhJ6cNQfv1jn6Us7Ov85rzgaZJx7Ywfk6ls6YKJ3geyk00yyh8zDN17Gae6K8EaEvhtj8CwK6W8f8K4M7wCL2E7XuLCC5Mxp8U3NR0yb0+MWvho7yQvWFcDJcRGYyZsZe1amcFW3wLYrHez9lzMY4JvcqI3c8A94HGvsXV4/6L4nbbXhhzAqhK46gn9MmPN6PN3TahlQhw/xieFKtwCc8UiJ8fw/GqRC1m1pLzRO643+Bd58IPQtgA2zjADvBDnHtomtCFzu2L/Oqs7FzRijekf+cGUL3gtNNZrRbhoUtbEUnKKtyaxdK4I+PcI/5OCpZvwsLWCMIbVYQ++N5t/Z/4jStBhfHjBB6TEigWd+kYXKPncYK3uTL1HHOAHgfQSYFL7hFwxLIrVOO/1hZ5hIwt5YSocv2L09C5+e5lZM3Psty/d/rCkgQ+qewzgy9aOp1mcv0g57wha1bQo9Nj27g98hxa4kWTh75DmK6zwFO6o5/5UniemDGNlB1TuzhAbbpcILvy+BAphaYLBE65u2GerZ0HUkwTt6DmfCS2Pgm5GQCiiXw/450b4WI19+RapDH+gySDRG6bP9yJvThk8cFoWsMsIy84wR/j3VmSUBJUoXgvVkh9DwR+iLFCKGz60Rs7G3/UhGOeFZeOet/H9V55e/jEenCOwqqCV4TWSL0cnn6aKhnW7HLoz3lfFmER82O0oBIAp9EF+ldAZbhbHkKZCJ0CSL0RcAJvTwWPduEhi5iGl+JdWZJQEToS7EYIXREnBQl79SmCl74sJS7jADX/77Kd8jfL+I43JMvTxzfzfxqRTYIfUZaSo6BenZ3u87E5+egAZuQjWkoSYq0ZM2vhGEOgfA0rI8IXYIIfTGwAebpAP2HDHk9fgbrzNLLlhB67aP9PkOXL71l12ospzIR+jyFX/syQOiImNStsdrzYa5/BRdMHnbXj8+z+9/npsxhWzEPAW9+9+9SlggdjxOUI4+uCR2+/1hnz+8Nko2jH2hdXZOe/FAP1mfwLjoRumz/cib0NWPRn8Dku7dbU1g8wNzZJTNR4iSUoP7X9pvQFWvBeiUIRWa0xIwUKY96fixa3Y2cF5C9iLtQW2e5tZtgUZvlYVyjhrxDXujzzQOW2pEnvbhBNwTociT0YgatgIh4ndEldGHtzDvhFNZHhC5BhN4WcDBAQHdopfF05MsebO5zGMa5wC0RbvADI8FzTBB6pVbSjUe8jAvPIOcEj1nV6EU5LmhDcyoJ5IJjYdlBHp73MVh8d44wrX1jnb/w/n4+T3QTiHRXZICRohP8jTpvOkWWCL2MmQ9dv+sc6MmVNf+TOjJJC7HJ3Q42auUyiIO2aIXYnQtE6Or7tUwJnWssXvjDkoG44iDoRzCmOK86E8QuHHKCp0Ib79GxQhQMELokJhb7HOMRa4TAXL6FBymC77fj4qOOoymIFzgeOwzNWgSNCM3xLKANRngDchdXiGZlYpYejpWMV/7IiNN9RLRsEDofO5Qx1HNft0SiRCe7gYsjE+tLjJjQHcyLoZF0SShHaMXD+ojQJYjQ24CIXOYGX9R94ZPMX1EWMn8xyIlW8iYtHjin79nW+AbjtOmjYVI+qJvCUH3B2LWsZVBALnuFXH5peDocBCWXeTw2a8pnPBvkeS6M85eh3F+S8dl5Jqw4QEza2jtfNNlxQNcm5iwRunXqOUdBPXd2G8BKyUZ2a0rZyLSQmNzDKzVT+LI875YXjqr1GgARumz/ciV0JWTh3+mn8uT5cYte8FG17n4iCeQSXWTAq9wYoWO7kLC0jjmUwpOCTC+LMjI2faByyrnwdSMPUtQbTWyAkUTLs/Lu5NPyXnA6yPgKyw5ugbm9T2jvGH40bW95bvXywgfk/XR5M6VdZInQ2dFeHOu8u8AyYhHvPCRwD4FHewb6uDuFPhKhy/YvV0JPrloEr+PXzjRe+PgcPdyKjnbiEf3cQSfk6eklTZAvm1zYtNKnygAUTvAlE5sMEUP/M3k7/N95278E6nv3Ui4F278YyPPvoD8bhMB6vWjPSe4rV44fgWktYTF5I7TzqyDzh/GmAr/fLoPEmA1cEzuCeeEmbEO3Ocj7Hfo1TmPsBteZSK0L2mutG3mkB3GUNhoeB+18RINsmHaOkTtTWEOJ0Jc7oZtMGs8HWpjdvSBS6+9r3zzfNWBuVz6vR+hJAApMVKFvFRGOQu9S+0wwhoEWs3wM1N5hLkzDGHwD3p3d3Fs+rJu8BhcTuht8EZ/ZrRNmvwk9nvNVjNbYveKQyCPMlGOckqNhSv8O+iSsn3FODJMgQl/uhJ4Tg4wZ0gpeuF0nnnsyIfEe7eQP+n3OFWsF1eCr/M6x9p1vI4SeXF2LTtU2uctwmF50m9jRH7Zq1aohlP1SLznFaS0VwNh1mOVsABcV3rZ43Pn5cDV6Ecz9v4U5dq+4Kz1rJsxs7CD42/L4X3Qc7jQrhJ6EX9bOVc802KIX7IBN+jM7lUeKkBaIr2oRugzQlc6GhQj9ECB0BCd1L/y6iehlTEtXzIQG71G2DSW70ykG73ubMbmLiYkx9KE+rQh9sbxxE+VEgdp3wrwYaJFRt4QwIOb2QE7dGNu1d8KYPsasQvqkLuZFeGDEmeLe7t1knsuIyT0/5p+ozPWuyYQvxsGbO21HKoj7NrEaxl0j05rs2zRaZM7HOg2vnUTosv3LmdCTXMXhX4/onqPzF19cuYnuWyscO3ocOU5M3NOfUnSjX2vmQJ9jcdUl9KSNRTf8lubdeG4VYUkrwh/BxDxCrb8fmEk036xhQE1RurZaey7I7uq1Ff8E/mudOSr7HIc5fSW8Aywlsf7c8+s4viNuuA7r7i5taX8JPSfm4wmu+0Roy2b9mBcROgtuLpdPO1qtvy+QlkAv+qyJwFVs7XT9tbxqo+smEfqhQOixadqbfFkhOfvT0mblndGiF3xPyevbE29l+YLBLvdzhuOlGyN0JXrdeWasIvJsMUpjZ98BVHlkh9hVssUkIUCyMyD7B+1Tzm1YXvRe/nMjMhuQaVBLbuQdPHe6f5cst3Z2p+3MEKErPi3BNfpXZGUYWP/iTmViEqqfjvYV1MSpeAtmphOPMLlRIUKX7V/OhJ5T8xV7oW40NUVoPk+p6oTX8NobAyl7LA8oZ3WXaqQwnK+Y09DF5zBoCDpU6S76BSUQiWxbrydpcmOi9hpMhCJ/3uE5tVGo1gJsX8H2pzEqIs+RHh7AwD4gs22ry9PPEB8x0s7ET8LXyf+tLD7T6Cj1JtmPTtuRJUJHh1lTV0iBlHYPV4I13bTHAETQqvE/hjn0U11LYHyU4IVXpdQfIvSmd2r5ErripRmcb1KrjeNSu8Gn8NqP+izT7U/yEft/q5lVbcFFxJDJHZH4LhjYRMWmdy+8ZXV5/BlSLtrCbaMfUisdrkycUhqb3MfTXPr/LuWUSzZbvSL2puflR/1Kwan9kAWIqUZ1IetZxYv8Mvy7cnnGiKaXJOoIrtGdi0pq4jfyNi5NQs9JQlk//Qxoz06+IOs54HIrYPSzl8Wm954d7cXKA/TjH7Wv/LqJhzvUx65rEqG3ggi9A/CAFQVn6lgQ1AO6jlqtwhOevzcOV8afhc+Z7ypQp8CJJBc4NFMBmX8qBc1cFqOEHi+21WhiRP+OfPKijTFZ/3RV6QzmBaw4bqWARP7WaLC+WI0eY+FS41Sg0V7o1+VlscHogRleLLR8Pq+pRCuhLV9kZ9By09QsZ3luOVuo1NgZNd4S0G1EQqS+tqPpctHQETPxcVj4ybKB91S5p/8VoTCkbQVEDMRz3gneYcaiGZvbN1vWqUfJ55huN/5DhH5IELoaVW3SyI6zVYB4dQxzPQ87/oTyWDWIR+wtvACUq0ON+O/zoxMjBS/4ZUqaedPib1pDL5enV8DLdYupqHGSTOH7LWuFc02r05YBNF35ylf8v0TyZvewRR+kFjzCtcsdlu2/6QVjbzqSfVpxTjMFNT47uyPu1D5Y8MLdnMjCA/POC8dnwXmg3IfObPh5zWtznLTGXv1nsEBvE1dB9c7QWZax4NVK2zqRSWYIXbFcVJXbJ9rzXXi9fy5NKyBHsiG13Nr5PBStfghg6d1eqIaXpNh+IvR4zixM6I1ybrCtMtMTv7AuEZusw5fDQvh4M4npF5wEmK5SRGz7llWZGJ1jIgzMdy95rkkDC/fxsHBfU6xO7hcJDdLML26a0JNzxWr4eqNHHZhXG83v1ejxgu2/Z6w56hSTcYcEPyDvbc8km69cuVp7Lr7UuFkrzH33mpm3oR2zon+/KHr+WEv/tWWYnJNPrwBN+81AYPexjYQwqy82j+VxRcGLduadiarss1J3G9oS32gmt0aCd5sZU+Hl7kx1nKwja4SeyLExUHSjm41ZpmIrYHg9JmLCJ7TEC9BF01VHeKcu4Y6K6IehvSmpgzKCys6j5rMLNvcB/yFCP0Q0dERsEvOiK0c0o5jNtyhIr108y4T//8iygwvRw37Vhk1PWKx9uAPHGMd5O9wE9Xyz6Ib7hFZuKJDHIi+e7IMhQs/JTFTDw39kwrGm+aVj9cwKH4a7oLxzjTv5vPnGXZJXa8nNQWZ4HTHv+B+ANj+cEMUCC5vIWAb9Y+RUsGvXYRhV8XQjZngkGujzr3g+gWh20TbNIS/4HGquXunmAAAa5ElEQVTrmFntcss55xh1jHIKwatlrjkAz327Ep3QQEKgoD7ihC8Vg7Xk7qHP1SbMbmfKAbfgJqReRMuUXTtJHbPuib3ZspUfPfM4y/WvV471jCRWEtHv/ok9MT1yJEJX5koroTeEfLa7uSduqQy+cevo4IVb7MHz4fu3tJbb7cHz4OvfbKkMvQI/0+jNDa5uILT00drzYcCNnqW3TogCmmNFJqsC0+T8O+Dn/1bg+anfBV/fCf+/CK8YwdePwv+vgwG4BXMqywQZBVfG0O5JWss0CF1ZdKMzDMSbP6jNKB8gqXqZa6y7oP3XF5zaBaXRmgXPOqYNE+5AsRg+acT2T4TPvRHqwzF6PA512sGCbIlkJvzcM9oNm4L3xylSZ5Jc5Z1gZGxiteXUvsk3iZOiPd3JkMs+PMA3ieFDUM9VUN/6MvOCn79teO6OaYPxahnM0f/kRx6hCaLikdHcYJvjbPpTOR7tyiaLhC7bfxxaU4xvYmPL1H7YNF4hfXZyB1mm4uO9g0rsl6NYolDZsGz/PNCkH0AfFYNrTp3dtHDDXUUZD4EIfR6kS+gzgpS3OSuO3VEd+sOD64YaO8aG6jvHhhqtBX6+f+8pQ43t1cEL8TNofk+//11Cufr1Vt1Y4+1MDDwDw4FBjQZNtyzjliBsWeTPhNbTSFJY9jSXeCqEziHTvIafTUPmzIKBxO6Bpje2MZGl7T8ILwdukr5bdP1rLS+4Gv7un3jxPw4L7Vfh8z+Cv7m74EXsJRZOdzobqdjLnF8fC+6G57y2w7vEbHEqlc54JizgO8vrN4o5YSaAED8eCusjMm2q4z8IP/spz5cOckH5MFn5n0RLEZdhsKvM5BMTlDHtDRb9f+PdXpLZ1uZtFxDZeGnMHKFzmXHLlJAbzu8Px9aN9sEtZ5WNz4KxPh/G+TZu+QlnTVkUWFvx/B/egZIb/r2uTNvtExH6woS+xVvxnK3O0ENQ6lD2Qdk/R3l8e3Wogdo6fibThJ6Tu1LUOrxI+x5tu4uoNMdLsm4qMld2yjmoF28jX9jMEzqXeaEwfizIfFvRSISxufuQ5B1HE3PYQKtA6wZKLSw2vzAfJ+NgZAxmcUFDM7ewtvy4EJtKF5ercjx0taI1mZdVG3IqcSdENZ2qkTbEzlJe9Dbsa6cBVLJK6AJ8U+ZGWvHPFxo73JTxUKrh3rzj/0eRW/vWY5RAjFqXi83pqJVPr1i9fvwZVrVWyju1N1tu7WvwjjzCrEl41dFg0h0hTxGXPtrWYklIC0Tosv0LEPrtoKEDYf/hThcIm5N6Y46yHzX1zfYS0NAZZHxi2z8RBv7RAr8z2i8izUpJk9ATD2DXfxXX8npigWC+BwdtoFpKqhsp9nx/z+iG1wBxTb1FlcUik5QTul17Ibzcvy966hiZLovJKBX5yDjue8ru5PHqe9npnMokocs1xp04HgMioek5hTWGEztaAPF4D7Rhnm7YR6ffe2Du/Ry+/hjG7yeWF9wBf/soEoW0CPIrmMYsP03FEqlg5e2FHjhmEaHL9h9yhJ5Tr7GFm0w6gSzhkiqhN8ncDS/l5mh/Xwb6nWrhEQWZFvWF7udodNHI+nSPh3ouF+lrUI2+wXvbmbldlU8mCT3XdLx3HnfC9dMav7o83rOcONcEO06JC7vlEMZzUh4LFdLwIRJRNKENXxSi6EXAJSL0WP6HIKEjlBfuI+K8c9kTzEKLAv+aHqHnFOccmLDXltenusj1vWDfeLrd8Na8e8bTuAg6Ii6e9OME94nMwao3x0O9KXHkP37NT+fed1YJXR1DGL/ruOKQ+nwXNw/8epMVimnhRrIyLjznRXIZ2Kjd9Uqv9hwugp5EuCNCl+0/VAk9p3iHYjSmcrq76FRfYgNms14QupQ5jxHtRjei5pJ3lqTMF1kUeK7vkhftLIxOvKxrecrkQk40DIvU40Be9aV+PKTcBPiyOic6xVIidMvyjyl40W09iCfRx8I3DDDv91luzTMsx7bkTIR+aBN6Lg6jOTb2J7Aw3CwEsdQ09VkxgXVKrwg9rvflxfE/g4n7Y361b8nJfMEFgZk9q5OPYpx17KsJr2mMd770j4e4Ex4s+g+vqYyvFBNCK6tfxgk9sQSWz3ol9hvf1R7Eleh1qcu78nnX/0vTMmwDROiy/Yc2oTcTDCwO/5nyeZfRlwi/lrzJXTCImzXv1feM0NW6MfJV0Q2+o5ypL1GiSl4mbnIMH7NGuZaSM3ke6wQfPmnpHg/V48XS9s9R+6Ujk6wTulpf3gtOL3nhPjWM8DIojMzZO+wE70tDfm2ACF22/1AndIQctGFv/MlAMDeWEyekrBIMe4lOOvlsbOeFGKSGtbn7Ra2nhK7Wv2HDpifgPXHhx5CK121vxkMmbQl3WJVaCftmMJf1QK4hkgy5/lVLYH42F8evx5nVXN9ITO+lROgIORfW2rUaCw7jLgtSj8kcA2Rh/9TwyT0EEbpsPxE6R0zqw+N/BIL5DJ+kCyS+6F+ZVXbELGiDgbSqPSd0IfX45S/YExfz8KmYAtRfOmTFZMbHo+gFP5cxq1NKESlIPbiCk3qIcsra/GxeYJhjVniAzVfbf48p2Sw1QlfrteyJs4B09vCYDNkev/nHFTYjXijS39Y+iP3qE5nnckToSfuJ0JtwmCho3rwIyIW96FnRhvjLH4pkILV3y0bDy7VECZ0hTg5hjU6sL7rB77iDYiY3U00yk6FnWYQ5p3bNGpEoJkWT44AcFz4/J9XAIH2fn3PJh3uzR7OY10CRjfaivxQJHZGkJ4W57kUP8EQoS2kDGyejqo9Uoe2V2juwP30k81yOCD1pPxH6QYgJpmhPODDAd3BTYR8JxuFaIL8GFe2Cl+hsbN/KcZ5SEdr13iVM6EzmcqHDc3XYoFxdAhIQoVil3LOy4MWRtUQM+e1Fxw9EP+INYZqyismsMnEKvPzbeErgMCtyElH3wgNCPncWKr6L7U3D2WypETpCznUMPANa7i0yJPISMMEnR0vV6GHLrtUUefWLzHM5IvSk/UTocyJeNMvl6aNBOJcDwewTd0lne6gRiRCi4azI4/5DeQ1KTWe5DAidQc3wBRO7aNn+d0vVqQZPYSrknk7kssXl4yTjjmNRwgQstv+RtRX/6bLtud4tavEGqALPzzvBJ0osjetUr+dny1zlIYxF0BhswxXFk8MnpSGfpUzo6jPQqgNE/sk4k142rS3CSsk3aRj7vyhuKRj0E9EBEboyTkTo8wAHUw5o3o5WY7IKPOdNsqH5aSRSqcuY72jWYmePXrAj7/hvecHY2JHYFrkYKCFVLxGBR/bImOSdFHjmPtGPvZLQU8yMtBjU/MwDGJ8aib3oTR7gWdCihoyBnzK510X9+2TADBE7exeMxaeH46QYKKf+5BzmcuLOcvnRcATaeyPmZ+dXAUVoz4Qg0pCT0Mb9/QUWW5yREloKvoF355l0ZsykkJ277+g57p+jM/eFfPbivEIvdLXutKGOX8Ge2AhjtpMTpt9WrvtelDiLILcO7oU59v4NGzY8oZdyagM84Yz3midDm+/joXbhve1mPsA8YvPJDT7Pau4hoVtjtecDoT8ixr279rvB4+J9YE6KROgHo5lgvHAUXrh/BcHvYZra2GSd74x8OSEOKESz0AvJg4Q4zYlbcHcGG4Y61zr8ewu2f8nq9ZjiMscnlzLBZLtGxqbfa5/y2gZ8ZaTXRWFa58jYRswS1jcNXUWLRjew1vXXgjz+EWS0XaSm5fnHW2RvJbnC2yUxEVlLGQcRZhXrR9lwPwr/dlgo3oM561va2O98wSphDgw7QRnaei3Mq8d4gpWpOtdYuObePEfbih52UPQxuclR5yr87A9Q92fyXs2SDUvTaiH7XBqbfk3llHN15n6jDPN+9ORzcP73TENXkPiQOP4xeNyEmyJx3NQvjT0ea67AsNTHNw1XgjXYTlXRyQhiDX1k3fQDJ61/NVsfupkLOI/4fJrqnYY+k2joMO67Tlp/drwmd9z+ddP7GResmyYNfSG0TuK1sLDn3RrmNf8ZkPteLlCekpJnGgobCyUHKbB80CFL9ckJarrBs7/5mMzh68N2sLFcPu1o8biBeRZHkQoxWGO5tQstb+JNoK3/r66KU3sz5gTHq3tq3f2GaoZHrHLG/xRNowWb5ZbfjNoVT0O7kcmvRf71+eSvJB7hsa+BtNV0tlgv/P7XuNMdtv0xvP0wX5uygNb5WR6Lng19eB1qy9CPh3BhRmvPiJRTlctIXbznk5EaH1zKSOS3fxjm/r/n7eAvlKxavVrweRS20ehFsIm4wPL8ruc+fhY2QeflR8Pj1Lp7CdWprIibV7t2fZEdo2zEOOz1FBPlqEVaBmZhjtRFIKP/xrNyOZ4ZOC+fFytXjh9hORPnFjz/r7qdD+xzOJ9EtLtcD2PRYwRNGOPX41rc7VwueLU3Mi4QV2exbiL0BTDHYj6A50nwIpwL5Wogmh/DC3EPZtmSJHFQ4feVGXmj0x2U7xSc8AOWHZy1ujz+jNbn5TL6AvUSKIdWzQnP7wqj/ktgMZ4E2V1m2eH1sADdCnLdiaYzJKGRhVKDihsM8Pn7MTgPjNsN8PVD+dHaFNY73mJKH49TUmYXTE65XIucgqfiAgXk+zauvQc/s/gc3bWgjNg8ZeFK0dS6A+Rza94NrsNUnUW7tkH6D6jPNhFI59BF8/FE0Q0LllP7F9jg72a5xavMGhgfyWlmCqxLAk9S6YpjJZYb3b857/iBPObLoFZOaBNE6O1ggbPB1atPf8qaSrQSSCZftMMNQNZn4suRr0Svwu/Rez5vT6yG3/25604+sfXzjUZDOj21S+SHSSc53dLBM/sFJpv5ZI+/K1XPeOaasWglajogYwc3SgU3OsPygijvhuPs/5XaupJXs4bXhS9F7XJc3BhoxVwbiaWBBefQAAuitK72wpIXrMH5iPMSZQTawRQQyTj/f20dbG6sQtV/CW4053GAEs/pPGOaIQxkY+5j/00USZ65JmsgXlMEkv2ldEwT8fDjc26MtKgeO81Zmv0GuIVQpF4tsTvx/l0w5lfge6GQ90Dz/DfTx7Rgai70a/Min79p1aqhN4294Mhuy6ZVuaFrx3OHY/mOIOVfV498bruEvrUy+Fb8zG1juSNlPbqlMdP348n2gIOvkEwXE5ZvDlQnGUJbGEDZxbLXvQsrNml8ce/rvVrTGIj7xWTU9RwbkDKiuZo+WjeTeE3Vcsdfbrn+W/FYjvnYoHkcj0GAlNmRClpb5ill+XdcC0cCfwjquglDtuZdv2JZ5xylPD6+SUFY2miIdWyLt+I57RL6FmfwAvbZQ0ZDXxhNC99cZSZZWGlRNAuuBSwifxoHHk52pg05HcIyagszsPnD4we0YnRbVpXOeOZq+/SnzFl/Yg1skr916qlHlSoTryg4tbBgB+8seP7lQPBfA23820U3+L4soJF/BzT46wuO/88YkAqPB/OjEyOrNgRPbX3WQv4heMZ7ouUf020fUUbo+HeC6x5klSRwSPL93cm5J212B0e2eIPWVnewoFNudwaLt3uDazY7h5+5xR7adccChA6/P7C9yr7/6O3O0EvvgDboPh/7gH25vTJ0Qr/lSyAQCPNAeCdXxp8FRLUDyoPcH8N/oJOSR58P13887wTfVOudA7FFyqAvx8Bi1kWpqcOm4O0izsF9nfaRFS6jPcUeXw9cSpDm8d96R5z18Pqhxu+8of1QGibKb705NfI5C2rxxp7rDs3uXId1Dv5Xv+VLIBAI80AS+sZnFd1wr7hdUee3Atov0mxe8MJOF7z4KCUh5diS0lIaA9Li0kLgi1pd4iuCbvgPmBAKY7h32kdWWD/ZDYuT1XoJCSSh324fcRaSIJDrPtSmTZV2Cd3kM1Hrv7uK2v/gL/otXwKBQJgP/LrRadNHAylvE05qMiBMJ+UAc0pzg9/JyHq5TB1viOiNbvgFcZVtfxd9FP1ktybWY31E6AdDJfT7OaHvb5eEs1qA0Ge3cUInDZ1AIGQWyf1h178dSVlcJevmChkLkITx3VnN2bkiFm8sQMP+BSfk7vvInPGqEbsjTYR+MIjQCQQCoT+IyQ601//ggaG6iykfh1d1/VdhfdkhO5lbYerYguM/ohFnnB1FYATDkjv5PLVuQgIidAKBQOgTlCQxXygn5uiuCL3Mz9EvV+vtN+L+VafOFJEsu80IVy8yC0ZwL1o0RPUZOlbIBojQCQQCoU+IPcC96H1aGQ8dmfEt+M2qDZueIKrvO+EpG5aP6/SPJThiFojgB/3uU5ZBhE4gEAh9Qkx4Ti00kMaVJQLKkBc421BAe54JhL5dJvnpitAxrSfLHBlehXVmoG+ZBHm5EwgEQp8gg7CMrAtfWnBjMtfKxV30wutE7VnIeAiblfACLetDU98m34B1UhS6uaES+g4M8GIP7UUN11TpiNDNPXf/XXgH3h78eb/lSyAQCAuBabGYxKTohv+t4QUuNwIs3S2GYsV6+6jJsn6tKgdPhQ3GncKDXycRDJrb61DPK7BeSvQyNySh3+0dcdaj64ca93hD+6E0TJS72wwsA2SOwWCMPJM91x2afXDdUOMuCixDIBCyjuSc2b9KX5MVZ81edNPKlStlwqCen6VLDbrohO/XPUqwpH+AF95aLk+v6FeflgJk6Netbu5pt9mHb9jiHF7dYh8+plO2Vg5ft9k+3NniHDYFZL17odCvW+2hA/dy8/jVW0/CsLGHn6z7fOwDr2cw32/5EggEwoKQhF50o1cpV9e6zlsem6ed4B1Yb6/N07Gjn107CbTzfTrHCLI/mBAmax78hwooOQuBQCC0D7ZgrranngIEuE3HeazZ9B7uyzs+c5Arl2d6s7AKsl1TPuPZ0I+tmkcIonBnv4I36fJHEKEvBiThBqYcNVEEKd/ZRfrU+ljuSGPtWCrpUwkEwqGNWEv3witHQBvt9j56XIBEeWz46P687Z+Idaetqcs+WNapRxXc8GaMu67ntR/E1/GgH78kc3t/MJPjRHq7s+LYdgl9sz14IX6GNHQCgXDIISZ0JyiLACoyfnnXZIiacZGRYXjPcGV8DdYvSN20phPnPh/2xp9sudG3+Lm5r0fmirkdCP0dqpwIvQMROoFAIHQJIOBv64SBPZjUWRa3P+QrPCxsbp786N1AZmDD79dUxleCZv5fpshcHBs0im740Npq7bn8ieTd3msQoRMIBEKHUJ3jSmMmzp4VUvdCvPJVt1z/I+Xy9NH8iTwlaheJXAZaNP2BYcd/PWwcHhZn5ibInB07jHDt/KOqfAi9BRE6gUAgdA6mMSNx4Rl0yZCWzotft5zwgLgWdwf8f3psbOxI9eFNuc6R5EVR86DnWrT6YScoQ13fHRljAW1mTW1CUDsv8Dzoj1jV6EX8aaSd9wNE6AQCgdAFpBaar/onM89ucwTJSBI3CCUvqqPDWt7xf5N3wr+2RseRMNsxv7O/WXuK/3TcEMDnbwStf9bEVbuDtXN/P7+qFr1PlQuh9yBCJxAIhC4ho6AB8X5WP7773CZ4RuywYWAZ2txgDxD0jyyn9uGC558Dxc27k8cX7akX5r3pF+fdcARjzcPfXAJ/8034/O+xXYzI3WDWdPsUz/atGGlOiIU82/sEInQCgUDoGpzQrdHa80FD3clziHcdNnVB4uTX4/B8faqByU+QqEtek5c9c0xD8ma/h69oCkcSF1frjLeLbTZYZrVwHOVA2nl/QYROIBAIGojvdDvBuWlo6XOZ4pGg+XMOMvO3/N48icdkLkztlhd+AvtPMdv7DyJ0AoFA0IQkM9CgP81IDsguRVJvIvB5SqrPlccAxWr0azK1ZwdE6AQCgaAPRmYYrKXoRT83dTc9i8Vy8EghRHP/7vxozcJ+k6k9GyBCJxAIBBMQWnqxMr4SNNcdGM51GZJ63XLDA3j3Pu/Upli/icwzAyJ0AoFAMASpqeKd76I3+ciyInWmmWMAmY14pPBWtb+EbIAInUAgEAxCxkpfW6mtK1Wj3UXhad53QtYqft3ywv0iVOwM9o/IPHsgQicQCATDkKSeH/UroKX/noVZ7Z2jnNHCNyPhAYwwB8T+duyXqfjyBLMgQicQCIQUkJD6WRZmUROEuK/QAy90Y2TuBvuL1ahe9CYPWM7467E/RObZBRE6gUAgpIQ4u5k7/jzQdH+IAV/YPXGzYWLTMbGL83LQzu/NOxNVtT+EbKIhNlpbvBXPASL/PRI3fN2/xR460Fq22kN7tlfh95XBt7DPEqETCATCwpB31Mvl6RWWHXyoVJ2sYxEm+Kxp67xdXjgr7tPfkB8Nj+PtL9OCn3FIDX0baOj3VYf+8MC6ocZ9Y0P1HaCJtxb4+f49pww1tldJQycQCIT2keQ1z+Xt2gYgzjt5bPbwQFaInZ2VQ2FauRc+atm1C2ONnDTzJQGpof/u5NyTtrqDH9viDn5mizN4DZRPt5bb7MFPwdcvbbEPH8PPXDueozEmEAiENjEgCbJ82mlHF23/0qIX7uZm7WA2rXjri2rk4ggAY7KLHOlfyXvBi7GdrL2NBp2XEwgEAoFwEGT+cgASZ8GpXQOa+h40cQPB11uSqaRB8E3PYEleqixQzE2YvU20coDOy5c2GqBxt1Ua5OBIIBAIOmgizLw7cTxoxlcCwT7A051urBeVTGnCia5bcq9jEhdWDyfxBk/HijnMwz3w/69Zbs2TZnU886dEKwQCgUAgdIBW8lxb8Z9uObU3AAHfCES7e2TdFCPeUjVq8NSsQV0SMzeVz1Piv/Fn8XNF+DxuFMqxed//Zd71L15TiVYqrTmMtHICgUAgEDQwM3MQmQ6U3MnnFTz/HMsLPgHk/KuC4+9CYsarb6ygJs+0+amkiJ/h7/BvMOY6v/vu/7ZgB9eBRn5B3vZPXDk+fsQCzyYQCAQCgaCHxgBeD2u0OKIh4Rbt8M+L9oQDGvbrCrZ/Sd4OPlZ0w88XvOAGUb4N5P8ly/Y/XnSDy2AD8FegoZ+K5vzjytMrWh40wK+hkWmdQCAQCISUMXMYkq5B7ZnVJxzyyBGKQCAQCIS+QJjGJclj4efvSZHmc/XviMAJBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUDoFP8fG2heOpsr28UAAAC0ZVhJZklJKgAIAAAABgASAQMAAQAAAAEAAAAaAQUAAQAAAFYAAAAbAQUAAQAAAF4AAAAoAQMAAQAAAAIAAAATAgMAAQAAAAEAAABphwQAAQAAAGYAAAAAAAAA35MEAOgDAADfkwQA6AMAAAYAAJAHAAQAAAAwMjEwAZEHAAQAAAABAgMAAKAHAAQAAAAwMTAwAaADAAEAAAD//wAAAqAEAAEAAAD0AQAAA6AEAAEAAAAoAQAAAAAAAIo4n00AAAAASUVORK5CYII=",
-}
+from en12056.connections import element_lines, plan_splits, set_levels, split_and_join
 
-def bitmap_from_base64(base64_string):
-    """Decode a Base64-encoded image (e.g. PNG) into a WPF BitmapImage.
+from pamui.windows import PamWindow
 
-    Returns None if base64_string is empty, so the UI still loads (with a
-    blank image slot) even if a placeholder hasn't been filled in yet.
-    """
-    if not base64_string:
-        return None
-
-    image_bytes = Convert.FromBase64String(base64_string)
-    stream = MemoryStream(image_bytes)
-
-    bitmap = BitmapImage()
-    bitmap.BeginInit()
-    bitmap.CacheOption = BitmapCacheOption.OnLoad
-    bitmap.StreamSource = stream
-    bitmap.EndInit()
-    bitmap.Freeze()  # makes the bitmap immutable/thread-safe
-    return bitmap
+# 🧩 The Pam family catalogue and routing preference rules, kept loaded between runs
+import pamtools
+catalogue = pamtools.require('catalogue', 1)
+routing = pamtools.require('routing', 2)
 
+# ⏱️ Opt-in Revit API call profiler (Shift+Click About to toggle)
+import apiprofiler
+apiprofiler.start(globals())
 
 # >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> VARIABLES
 uidoc = revit.uidoc
@@ -87,136 +66,12 @@ class SelectionFilter(ISelectionFilter):
     def AllowReference(self, reference, position):
         return False
 
-def GetBoundingBox(element):
-    if not isinstance(element, FamilyInstance):
-        return None
-
-    bbox = element.get_BoundingBox(doc.ActiveView)
-    if bbox:
-        return bbox
-    return None
-
-def BoundingBoxIntersects(bbox1, bbox2):
-    if not bbox1 or not bbox2:
-        return False
-
-    return (bbox1.Max.X >= bbox2.Min.X and
-            bbox1.Min.X <= bbox2.Max.X and
-            bbox1.Max.Y >= bbox2.Min.Y and
-            bbox1.Min.Y <= bbox2.Max.Y and
-            bbox1.Max.Z >= bbox2.Min.Z and
-            bbox1.Min.Z <= bbox2.Max.Z)
-
-def IntersectionPlaneAndLine(plane, line):
-    planePoint = plane.Origin
-    planeNormal = plane.Normal
-    lineStart = line.GetEndPoint(0)
-    lineEnd = line.GetEndPoint(1)
-    lineDirection = (lineEnd - lineStart).Normalize()
-
-    if planeNormal.DotProduct(lineDirection) == 0:
-        return None
-
-    lineParameter = (planeNormal.DotProduct(planePoint) - planeNormal.DotProduct(lineStart)) / planeNormal.DotProduct(
-        lineDirection)
-    return lineStart + lineParameter * lineDirection
-
-def GetZCoordinate(point):
-    return point.Z
-
-def SortPointByElevation(points):
-    return sorted(points, key=GetZCoordinate)
-
-def SortPointByLineDirection(line, lstPoint):
-    direction = line.Direction
-    vectorZ = direction.Z
-    sortedPoints = SortPointByElevation(lstPoint)
-    if vectorZ > 0:
-        return sortedPoints
-    else:
-        return list(reversed(sortedPoints))
-
-def SplitPipeByPoint(pipe, pts):
-    ele = []
-    with Transaction(doc, 'Break Curve') as t:
-        t.Start()
-        result = []
-        for pt in pts:
-            try:
-                ele.append(DB.Plumbing.PlumbingUtils.BreakCurve(doc, pipe.Id, pt))
-            except Exception as er:
-                result.append(er)
-        ele.append(pipe.Id)
-        result = [doc.GetElement(Id) for Id in ele]
-        t.Commit()
-    return result
-
-def SplitDuctByPoint(duct, pts):
-    ele = []
-    with Transaction(doc, 'Break Curve') as t:
-        t.Start()
-        result = []
-        for pt in pts:
-            try:
-                ele.append(DB.Mechanical.MechanicalUtils.BreakCurve(doc, duct.Id, pt))
-            except Exception as er:
-                result.append(er)
-        ele.append(duct.Id)
-        result = [doc.GetElement(Id) for Id in ele]
-        t.Commit()
-    return result
-
-def ClosestConnectors(ele1, ele2):
-    conn1 = ele1.ConnectorManager.Connectors
-    conn2 = ele2.ConnectorManager.Connectors
-
-    dist = 100000000
-    connset = None
-    for c in conn1:
-        for d in conn2:
-            conndist = c.Origin.DistanceTo(d.Origin)
-            if conndist < dist:
-                dist = conndist
-                connset = [c, d]
-    return connset
-
-def CreateUnionFitting(ele1, ele2):
-    connectors = ClosestConnectors(ele1, ele2)
-    result = []
-    with Transaction(doc, 'Create Union Fitting') as t:
-        t.Start()
-        try:
-            result.append(doc.Create.NewUnionFitting(connectors[0], connectors[1]))
-        except Exception as er:
-            result.append(er)
-        t.Commit()
-    return result
-
 def get_sorted_levels(doc):
     levels = FilteredElementCollector(doc).OfClass(Level).ToElements()
     return sorted(levels, key=lambda lvl: lvl.ProjectElevation)
 
-# Define keywords based on family description parameter
-keywords = ['EN 12056 Calculation Connector']
-
-# Collect matching families and filter out DN sizes with invalid formats
-matching_families = []
-collector = FilteredElementCollector(doc).OfClass(FamilySymbol).OfCategory(BuiltInCategory.OST_PipeFitting)
-
-for family_symbol in collector:
-    # Retrieve the description parameter
-    description_param = family_symbol.get_Parameter(BuiltInParameter.ALL_MODEL_DESCRIPTION)
-    
-    if description_param:
-        description_value = description_param.AsString()
-        
-        # Check if the description contains any of the keywords
-        if description_value and any(keyword in description_value for keyword in keywords):
-            family_name = family_symbol.FamilyName
-            family_type_name = family_symbol.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString()
-            
-            # Append the family_symbol to the list (or append just the family_name and family_type_name)
-            matching_families.append(family_symbol)
+# Calculation connector families of the project, from the catalogue kept between runs
+matching_families = catalogue.catalogue(doc).symbol_ids(catalogue.CONNECTOR)
 
 # Check if there is a suitable family loaded in the Revit project
 if not len(matching_families) > 0:
@@ -233,30 +88,12 @@ def show_window(selected_elements):
     script_dir = os.path.dirname(__file__)
     xaml_file_path = os.path.join(script_dir, 'UI.xaml')
 
-    # Load the WPF window from the XAML file
-    window = WPFWindow(xaml_file_path)
-
-    # Set the logo from the embedded Base64 image data
-    logo_bitmap = bitmap_from_base64(IMAGES_BASE64["logo"])
-    if logo_bitmap is not None:
-        logo_image = window.FindName('logo')
-        if logo_image:
-            logo_image.Source = logo_bitmap
-
-    interop_helper = WindowInteropHelper(window)
-    interop_helper.Owner = revit.HOST_APP.uiapp.MainWindowHandle
+    # Load the window from the cached XAML template
+    window = PamWindow(xaml_file_path)
 
     run_button_clicked = [False]  # Use a list to hold the flag so it can be modified in the nested functions
     dialog_result = [False]
 
-    def close_button_click(sender, args):
-        """Handle the close button click event."""
-        window.Close()
-
-    def minimize_button_click(sender, args):
-        """Handle the minimize button click event."""
-        window.WindowState = WindowState.Minimized
-
     def run_button_click(sender, args):
         """Handle the run button click event."""
         run_button_clicked[0] = True  # Set the flag to indicate the run button was clicked
@@ -280,16 +117,6 @@ def show_window(selected_elements):
         window.Tag = (selected_levels, elevation)
         window.Close()
 
-    def on_image_click(sender, event_args):
-        """Handle the image click event to open a URL."""
-        url = "https://www.pambuilding.co.uk"
-        webbrowser.open(url)
-
-    def header_drag(sender, event_args):
-        """Allow dragging the window by the header."""
-        if event_args.LeftButton == MouseButtonState.Pressed:
-            window.DragMove()
-
     def check_all_click(sender, args):
         """Handle the check all button click event."""
         list_box = window.FindName('list_levels')
@@ -309,14 +136,6 @@ def show_window(selected_elements):
             list_box.Items.Refresh()  # Refresh the ListBox to reflect changes
 
     # Attach event handlers
-    close_button = window.FindName('button_close')
-    if close_button and isinstance(close_button, Button):
-        close_button.Click += close_button_click
-
-    minimize_button = window.FindName('button_minimize')
-    if minimize_button and isinstance(minimize_button, Button):
-        minimize_button.Click += minimize_button_click
-
     run_button = window.FindName('button_run')
     if run_button and isinstance(run_button, Button):
         run_button.Click += run_button_click
@@ -329,16 +148,6 @@ def show_window(selected_elements):
     if uncheck_all_button and isinstance(uncheck_all_button, Button):
         uncheck_all_button.Click += uncheck_all_click
 
-    # Attach the image click event handler
-    image = window.FindName('logo')
-    if image and isinstance(image, Image):
-        image.MouseLeftButtonDown += on_image_click
-
-    # Find the TitleBar and attach the drag event handler
-    title_bar = window.FindName('TitleBar')
-    if title_bar:
-        title_bar.MouseLeftButtonDown += header_drag
-
     # Populate ListBox with levels
     list_box = window.FindName('list_levels')
     if list_box and isinstance(list_box, ListBox):
@@ -346,14 +155,7 @@ def show_window(selected_elements):
         for level in levels:
             list_box.Items.Add(LevelItem(level))
 
-    dispatcher_frame = DispatcherFrame()
-
-    def on_window_closed(sender, args):
-        dispatcher_frame.Continue = False
-
-    window.Closed += on_window_closed
-    window.Show()
-    Dispatcher.PushFrame(dispatcher_frame)  # blocks here until the window closes
+    window.show_modal()
 
     # Retrieve and return selected levels and elevation
     if dialog_result[0]:
@@ -386,129 +188,55 @@ def select_elements():
                             forms.alert('No levels have been selected', title='Select Levels')
                             continue
                         
-                        # Retrieve element lines
-                        eleLine = [ele.Location.Curve for ele in selected_elements]
-                        
-                        # Create planes for each selected level 
-                        planeLst = []
-                        z_axis = XYZ(0, 0, 1)
-                        for level in selected_levels:
-                            plane = Plane.CreateByNormalAndOrigin(z_axis, XYZ(0, 0, level.Elevation + elevation))
-                            planeLst.append(plane)
-                        
-                        # Find intersections between lines and planes
-                        intersectionPoints = []
-                        for line in eleLine:
-                            sublst = []
-                            for plane in planeLst:
-                                point = IntersectionPlaneAndLine(plane, line)
-                                if point:
-                                    sublst.append(point)
-                            sorted_points = SortPointByLineDirection(line, sublst)
-                            intersectionPoints.append(sorted_points)
+                        # Find where each pipe crosses the connection elevation above every selected level,
+                        # ordered along the pipe
+                        elevations = [level.Elevation + elevation for level in selected_levels]
+                        intersectionPoints = plan_splits(element_lines(selected_elements), elevations)
 
                         # Place Sizing Connections
                         with TransactionGroup(doc, __title__) as tg:
                             tg.Start()
 
-                            # Track added rules
-                            added_rules = []
-
-                            # Transaction to add rules to routing preferences
-                            with Transaction(doc, "Add PAMBUILDINGUK_ES_EN 12056 Calculation Connector to Routing Preferences") as t1:
-                                t1.Start()
-                                try:
-                                    unique_pipe_types = {}
-                                    for pipe in selected_elements:
-                                        type_name = pipe.get_Parameter(BuiltInParameter.ELEM_TYPE_PARAM).AsValueString()
-                                        if type_name not in unique_pipe_types:
-                                            unique_pipe_types[type_name] = pipe
-
-                                    for element in unique_pipe_types.values():
-                                        elemType = doc.GetElement(element.GetTypeId())
-                                        routManager = elemType.RoutingPreferenceManager
-
-                                        for fam in matching_families:
-                                            newRule = RoutingPreferenceRule(fam.Id, "Sizing Connection Rule")
-                                            min_size = System.Double(50 / 304.8)
-                                            max_size = System.Double(600 / 304.8)
-                                            newRule.AddCriterion(PrimarySizeCriterion(min_size, max_size))
-                                            routManager.AddRule(RoutingPreferenceRuleGroupType.Unions, newRule, 0)
-
-                                            added_rules.append((routManager, RoutingPreferenceRuleGroupType.Unions, 0))  # Track rule
-
-                                    t1.Commit()
-                                except Exception as e:
-                                    t1.RollBack()
-                                    output.print_md("Error while adding rules: {}".format(e))
-                                    tg.RollBack()
-                                    raise
-
-                                newEles = []
-                                newEles2 = []
-                                fittings_added = 0
-                                fitting_data = []
-                                for ele, sub_lst in zip(selected_elements, intersectionPoints):
-                                    if isinstance(ele, DB.Plumbing.Pipe):
-                                        newEles = SplitPipeByPoint(ele, sub_lst)
-                                        newEles2 = newEles[1:]
-                                    else:
-                                        newEles = SplitDuctByPoint(ele, sub_lst)
-                                        newEles2 = newEles[1:]
-                                    for ele1, ele2 in zip(newEles, newEles2):
-                                        fittings = CreateUnionFitting(ele1, ele2)
-                                        if fittings:
-                                            fitting_data.extend(fittings)
-                                        fittings_added += 1
-                                
-                                # Set 'Level' and 'Elevation from Level' parameters
-                                with Transaction(doc, 'Set Level and Elevation') as t2:
-                                    t2.Start()
-                                    
-                                    try:
-                                        for fitting in fitting_data:
-                                            if isinstance(fitting, FamilyInstance):
-                                                fitting_bbox = GetBoundingBox(fitting)
-                                                if fitting_bbox:
-                                                    fitting_level = None
-                                                    fitting_elevation = None
-                                                    for level in selected_levels:
-                                                        level_bbox = BoundingBoxXYZ()
-                                                        level_bbox.Min = XYZ(-10000, -10000, level.Elevation)
-                                                        level_bbox.Max = XYZ(10000, 10000, level.Elevation + elevation)
-                                                        if BoundingBoxIntersects(fitting_bbox, level_bbox):
-                                                            fitting_level = level
-                                                            fitting_elevation = elevation
-                                                            break
-                                                    if fitting_level:
-                                                        fitting.get_Parameter(DB.BuiltInParameter.FAMILY_LEVEL_PARAM).Set(fitting_level.Id)
-                                                        fitting.LookupParameter('Elevation from Level').Set(fitting_elevation)
-                                        t2.Commit()
-                                
-                                    except Exception as ex:
+                            # Calculation connector rules on every size, first in the routing preferences of the pipe types
+                            # while the pipes are split, with the rules the types had before put back afterwards
+                            connector_rules = [routing.RuleSpec(symbol_id, "Sizing Connection Rule", 50 / 304.8, 600 / 304.8)
+                                               for symbol_id in matching_families]
+                            rule_session = routing.RuleSession(
+                                doc, routing.element_types(doc, selected_elements), connector_rules,
+                                name="PAMBUILDINGUK_ES_EN 12056 Calculation Connector in Routing Preferences")
+
+                            try:
+                                with rule_session:
+                                    # Break every pipe and join the parts in one transaction
+                                    with Transaction(doc, 'Break Curves and Create Union Fittings') as t1:
+                                        t1.Start()
+                                        fitting_data, failures = split_and_join(doc, selected_elements, intersectionPoints)
+                                        t1.Commit()
+
+                                    # Set 'Level' and 'Elevation from Level' parameters
+                                    with Transaction(doc, 'Set Level and Elevation') as t2:
+                                        t2.Start()
+                                        try:
+                                            set_levels(fitting_data, selected_levels, elevation, doc.ActiveView)
+                                            t2.Commit()
+                                        except Exception as ex:
                                             t2.RollBack()
                                             output.print_md("Error while setting 'Level' and 'Elevation from Level' parameters: {}".format(ex))
-                                            tg.RollBack()
                                             raise
 
-                                # Transaction to remove the rules added in t1
-                                with Transaction(doc, "Remove PAMBUILDINGUK_ES_EN 12056 Calculation Connector from Routing Preferences") as t3:
-                                    t3.Start()
-                                    try:
-                                        for routManager, group_type, index in added_rules:
-                                            routManager.RemoveRule(group_type, index)  # Remove the specific rule added
-
-                                        t3.Commit()
-                                        
-                                    except Exception as ex:
-                                        t3.RollBack()
-                                        output.print_md("Error while removing rules: {}".format(ex))
-                                        tg.RollBack()
-                                        raise
+                            except Exception as ex:
+                                output.print_md("Error while placing calculation connections: {}".format(ex))
+                                tg.RollBack()
+                                raise
 
                             tg.Assimilate()
 
+                            # Report the connections that could not be placed
+                            for element, error in failures:
+                                output.print_md("- {}: {}".format(output.linkify(element.Id), error))
+
                             # Determine the message based on the number of fittings placed
+                            fittings_added = len(fitting_data)
                             if fittings_added > 0:
                                 if fittings_added == 1:
                                     message = "You placed 1 calculation connection!"
@@ -536,4 +264,7 @@ def select_elements():
 
 
 # Run the select_elements function
-select_elements()
\ No newline at end of file
+select_elements()
+
+# ⏱️ Report the API calls of this run when profiling is on
+apiprofiler.finish()
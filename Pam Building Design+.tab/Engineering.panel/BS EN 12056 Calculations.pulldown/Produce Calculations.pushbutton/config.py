@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+__title__ = "BS EN 12056-2 Calculations Settings"
+
+from pyrevit import forms, script
+
+# Toggle incremental recalculation for Produce Calculations (Shift+Click)
+config = script.get_config()
+incremental_mode = not config.get_option('incremental', False)
+config.incremental = incremental_mode
+script.save_config()
+
+if incremental_mode:
+    forms.alert(
+        'Incremental mode is on.\n\n'
+        'Re-running Produce Calculations on a system with the same options '
+        'reuses its discharges and only recalculates the pipes downstream '
+        'of elements changed since the last run.',
+        title='Incremental Calculations')
+else:
+    forms.alert('Incremental mode is off. Every run recalculates the whole system.',
+                title='Incremental Calculations')
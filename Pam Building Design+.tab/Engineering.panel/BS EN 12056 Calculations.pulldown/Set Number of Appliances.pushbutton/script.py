@@ -4,7 +4,6 @@ __title__ = "Set Number of Appliances"
 # Add imports
 import os
 import clr
-import webbrowser
 
 # If failed, add references to the necessary assemblies and try again
 clr.AddReference('PresentationFramework')
@@ -13,76 +12,19 @@ clr.AddReference('WindowsBase')
 
 import System
 from System import Convert
-from System.IO import MemoryStream
-from System.Windows import WindowState
-from System.Windows.Controls import Button, TextBox, Image
-from System.Windows.Input import MouseButtonState
-from System.Windows.Interop import WindowInteropHelper
-from System.Windows.Media.Imaging import BitmapImage, BitmapCacheOption
-from System.Windows.Threading import Dispatcher, DispatcherFrame
+from System.Windows.Controls import Button, TextBox
 
 from Autodesk.Revit.UI.Selection import ISelectionFilter, ObjectType
 from Autodesk.Revit.Exceptions import OperationCanceledException
 
 from pyrevit import revit, forms, DB
-from pyrevit.forms import WPFWindow
-
-# ---------------------------------------------------------------------------
-# Embedded UI images
-# ---------------------------------------------------------------------------
-IMAGES_BASE64 = {
-    # Company logo shown at the top of the window
-    "logo": "iVBORw0KGgoAAAANSUhEUgAAAfQAAAEoCAYAAACuKgPeAAAAtGVYSWZJSSoACAAAAAYAEgEDAAEAAAABAAAAGgEFAAEAAABWAAAAGwEFAAEAAABeAAAAKAEDAAEAAAACAAAAEwIDAAEAAAABAAAAaYcEAAEAAABmAAAAAAAAAN+TBADoAwAA35MEAOgDAAAGAACQBwAEAAAAMDIxMAGRBwAEAAAAAQIDAACgBwAEAAAAMDEwMAGgAwABAAAA//8AAAKgBAABAAAA9AEAAAOgBAABAAAAKAEAAAAAAACKOJ9NAAAACXBIWXMAAC4jAAAuIwF4pT92AAAEFXpUWHRYTUw6Y29tLmFkb2JlLnhtcAAASIm9Vttu2zYYfhVCvdnQ0SQl6oh6RWP3EGDugsRD091RJGUTkURNUmwnr7aLPdJeYaQsy04Rx9myTYANif/3H/j9B/LN203F+I1sQSoXqhw7f/7+hwOUGDtf/BmeVRO5VJ/ua3l1/3nO7294LJy3P4I3m2RTVIVsGdgUedkkm7HDhE5lYt7tMnJAB2lvxs47KwDXswsw0bUE/iiAnFAXhPGIBDh26Q/AxSREOETEg5gkOEi8GPSPY7zVIksupx96X+Zr7CzbtkoQWq/Xo7U30vUCkTiOEXaR60KDgM1d2bINLJtXOwtT2fBaVa3SJbDfLNW37dhxdlsoqsFs2Yy67Yy4LtCGVYiMMNoBBR9w1W2dd84FRzKXhSzbxmDJgK2WutXNUh8xPYgfODCRzGZPx1IUA7pp36/ap9HN/K6S6FI2+rbm8v3KhPlqr34ps7+jbuCDcquyI7pW8mBTcqOOQK1kgFbJpJas1fVc63xXOxc7msBkYmslAt99UaXQ6+b7Ax05Nb+x42KXQkIg8ebES3z66xYy00Jldw8hrjsnOHFxQr0dytSuYC17Cid4kum6YIZ0VbCFRFW5cMCQymSic10bd8aAd7h+Pplc1DpTuRE0lx/PwPn7SUDiIIDuiHTuZ7PkvGxaVnJ5Ph07ZmWklEgojgOeBTGMiEtgxKl9801YPk692GUUU7bTn2p+a8vQ6m87UmhubOzD8BkLqGc6hGAsocepgCwVFGa+73mBsRmGg7Wfa2WGAssPrdqohLEoQo5pHGcwwFTCMKMejEVqeKcZJSKN01hyB9g6sGaMMrOdN3ZIv3htCyq/3S56uHsQsf894OspwF7+S6lMNlwH2FraJuDKjDXZeevWLtRG5tdTZXbRdAaDKAwPZV8PZBSHkZ0ae9LmctP+xO5k3fTD5Iwt+rdcHeS4w3xmhfF8dj5zvpVYM1sJOqH9+oju604T7UNAR4LcJvCTakwv3fXOruRve7fd3EgY3/LLuw4STr+sHinD5yV8q79eyvLRVtyKG521a1bLdwtTF8/pcnQ0bl2uZH0QecVqQ2BrSBg7Wa0LMPQoaDVgVZUr3lUiWpWin0IDhcf9NGz1NDsppqaXaAZD109hxMxbxFzbpIa3kGGPiexxdlwyJ0FC4sSL/jlBvR5fsnIhzemNXrAVV4o4oDyFOOUCUmomRCQYgSnLUi7DLKYRObKVB4Pyv9/K6eyfSLitif0QP+pHyFqtHvcyhAD+RX8nU/S8I+F/ThHazxj07fjpT6ctjx8sU93F40X1Z/XF6fOOE+JjQaAMWQZjRk13eiKCPguDMOIpxTLdWdMvPe8GGg4um7slc4PtmNldnc3HcPmWpWGxNlfrvwBY9cIajLeI6gAAIABJREFUeJzsfQmcI0X1f2Z3ZlERFUVExQsRFeUcmJ1ck52ku5M9WM5M+sjsLqDrhT9vf56/QfHi560g4n0g/uVQQLz1h6ggyimCwN67wHJfy7W7M5P836uju5J0kk53J5NM6vv51M5splNd9er41qt69V4kIiEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISHRnRiokyQkJCQkJCS6F1ML8vn8wlQqNYgpUp+8B/gz+HyD5yQkJCQkJCQ6g6kFSMzlctmVlIeH1w6lUvlnj+Ss5xyqFvdMpaYGXXOZovlEJLlLSEhISEh0DkyzXiB+ltQKL4sq+vKYYvxPXDXOj6n6n2OqcRP83AhpK3y2Hv5/A/z+R0g/hN8/EFUKmaha3Lc676mqvCUkJCQkJCRCBGrSmPj/R7X8gVHF+FBc0a8Ewn5sLDdZHlu6qpRaurqMvyezxXIia9kJ/4+fk78vXVVOwu8x1Xwgpui/hvTmxcfoL2JZD5BFg/AuCQkJCQkJieAYYFo5QTxTWAIkfgmQ+FOpZZS8E5pZBu18hiTVmKa/67NxlSb8nabKv+P3xnK4CFgF39cfhjy/tTitH+r2XgkJCQkJCQnfIFoy0ZSBfIdjGf23qG2jhg3kW+LkjL9DKreeHJKH/EtjsECAn7tjqv696Lj5ClIEaTwnISEhISHhH1w7VtXinnFl4n8TmrUbtOky17T9k3gjctdn4ooxi9vy8Nkj8PtpEWp0J7V1CQkJCQmJVsGsziPxrP6GuKLfiFvrcdWcaQ+R1ySi+cc1cxbfCyR/WVQ9nhjPSVKXkJCQkJDwCE7maLWe0MxH8IwcSHW6A0RenWaR2PF8PaGa6+PjE4dhuSSpS0hISEhINAMjy1i6sCaZtXYnNKtMtsE7S+QVKabq00lieGc9EFcmRmkxJalLSEhISEi4gpNkLFMoJLPF2QRufRNL9bkjc5vUFWOGXIMDUk+mjRGxvBISEhISEj2PciQycEE+srDsNdWxFufkOKrkU4ms9XRcNcvdQuYVpJ4rlpNZc+tRmRMOIAWXd9UlJCQkJHoV6EntilRksB45NwN+D8kdFwLsI5LPSOr4/UED3oyacLeRubj9jlfmEpr5l1wut4dYfgkJCQkJiZ4AknC1W9RbtMjz12cGo+vSQ8UNmcGPr1eGzt6gDJ4Hn/0U0vnw/2+uVxZ+cmNm6JT1mT2W3KZEXlKRJ5DhFdyiXTUvGlu6mpDmXBN3Y1I3ppnV/aew3HLrXUJCQkKiJ1C9VX6Hsuj1QN4fALL+w7rM4H2b1aHZ+3ND5fsaJPz7VnWoDM8/skEZunqdMnTGOmVwdCp/8CLMM5GzitSa3QjbAK4kpDDzxPP0XbGMEcXyT8mtdwkJCQmJbkV5KrIAE/5eykX22KQuyq/PDP1xozK0Cwn6nuxQCUkaiL0EJD2NCf4+45bY32a3wPN3Z4fKDywdKm9S4XuZhddfozzvtGi2+J9k1ipTV63ByJa7gI2zbXt070r+hg5pHM9ywbR0yAOd3MSz5m+YuOS2u4SEhIRE94Gfb+PPO5QhAzTrW+5hJA7kXFrPyBt+n2WEXm6W2HOzG5Dk4fug6Zce1SLlby87onyktrqUVPVAWjRz4TrLgrSQYCzw+VOQHoK/7USDNvr5JD+jD0bskAe1fC/mUFZy612iDgZ6JPUieqH+vVDGboDsz2GDG6zh7xvTQ4cCaf8ZifwuDUica9weCbwJuZc3KYPlW5RnzSxXj58ZUc1SIqBWToO0WLMYfQ3yem8sa0STavFVIylr/9FU/sB41loCz34cPc+RZ7PFUhBt3dbSVeuXTHyyE0n0LHBBik6d8Gdexi/oVszXNpEkHDbKZSBztsV+R2bwv7aoQ08hmRNNnGrjgUhcTOuUReXtSqT8Y+015WEVtGZVD7b9jcFaFPOqpDox1qyeOFlF08Zx8N07xkiUNd+kTs/SVXPnqGIeQjJv41k6ntPzydYttf8KXXlAnPBdyzAnaCIXTxPF1IJ6dcPPg9hIDA+veFYqlX92tyWMkTCazz+Te2Z0lQrrc116PXMA6xCWLFggqFAxPLx2KBZbuVd47Va/rXocA6Oj+WeGJavhFSueNdcVmlNMMSLflo88c11m8Ed4Rr5Fsc+/QyNyR0NfVN6mLCifpo2Xj1QngxA62WKPK8aZwqSzwJ6EyWf0J/6fDQjyXCx2yl7wvf8XhNS5xXtCs/4H82zDgBtoUVtq9fmmYPl5nuw6pd057dsc9crEiNpb3Ti5eQO9ipmznhPN6H+H/nVXTNE3wc/N3ZOgPLCohZ83QboypuoXx5XCl+D3N48oE6OJhLl3tay6Q3OnbY7REKOKcQvUZRskv7K1vxfXqGvnMAxcHSdZ+ntAxg9COTcEaSv6ff3BmFL4iJh/74PKGndQoZ63RFVja4C25O2JY+2fqdTqZ7CX9Jfmz8n85kRk743K0J8eXEpIdzqMrfV62+2blYXlG9TnlDXtpPKoapb9bLfbmnnGOB3L34qWKBI75PUjv6TOt/rjmvE3IftQOtAUX4yw8o6mJ44EOb0dBvVZZPLNFC7Fn1CGs6IZcy2ZkJzJKITocHQRxP83ouZfFdcKJkxSn4f3XoDvjyv6L2DwfCeumO+PqhNjwt18+F77Jh1WrgG7XKq+Gsr0FS4XKNdFMJF+IZYxThzV8s9nX1pQqYU5ecTGC6+OqeYa+M6Xbdkqxs9hgvka/HzTYsV4Df+WR1Ijf08sN/dOZq27x5ZOokOiWTT87K5UJAn7MMYswMUp/o5/g3bdDn38cpDtO0bU4qvEus0pobA+OQZtkshaj48RZ09WyacM7O/hER3mG0bdeB5jOeuM8eVrcME/E7CtSlhPyOdJWCAewQTRjbsmrYG1ZUK1frIkFDmZJTbW7htesZZr6f1D6Pw62o2pyPM2q0N/Rc0cSHd3O4hc3G6/S4mUL9ZeUYaJAsi8de2ckzl0gAuw/H40B05W2PAJzfxnMmcby7W07Y5W9EC0O6LLWPz0+gONlA9XjvCeP8B374bJcgPV3PRNQEL4+3YglN9yYiRbdoRo9Osx2hxOuDjxjlUlDPcKZcA47v+EAX8KX536n5wcsktk9FxMLVwOZXuSvqvO+2HSgefWASl+ADVT/v2oon8Rvns/pPW8rlDOjfBzM/4Ewj0Qnzs4nydXGOHzT8Lnj0BaZz/Pv6PqsILXj6LlKhwEMjsPy8XKVKosE/0/LIDuRc0Gt5d53WwNSjUPh/JdBG1RL48yDaWrP40yiCvWqNB3GvU3m9Dhu3cmsiYs+tC/AvavLkokFDENR0xugPBbIPAZxlEYy60qoQxgwfoEPPdLDJjEd6Fa2SEJF/SduMiCOjyW0Mg4nPEnA/t7pTDjNNj9C/pyCggG8t8dQnvtpsqD+Tv2mp4mKi6jZKZwLHUmRhQqn+3otCcZa6p+jzPee1tOnsHIfAC9vm1Shn75AD0vbyuZY7oDCP0eIPQvaoeXD1dX+9luL7GraI8lMpMHkcr4nFh4p4LJVk2Qa3Mt31cvYUeimo61XMzTBaRjkQVEtngbEkVSs2a5loQGfUjYSa14Kz6LWlFcMf6CEyosNshdej7h1iQM9wp/T2YnyQQMn/0roRipJuVpKJMkar6gqZLbATCxw0RSsid+1/ejHKwSCTkL5BtVChmSj1Y8f8nyk/E2wAyvK6QSk9nsmDL5evbeRez5s9MrTsUFwrTwPPkOvaVgHYl5J1RzB4tb714u9n+U65Jla1AmV8EEazs2imX0d6IvARZNryQSmpts2QISCfCTrC0bkbpA6MbdiXCuZHY4MaInE61JZU8XvddFNeM4Vv+OHbE4cDR0aJvH2Vzg94aM8702EDosNs4IaKfjsiOICyzrlLDKOkegc+Fw/rnQfv/GOSYk76AlMtYU/T7hHL0/CJ1fTQMy/yJus69vs2Yuauh3KgvK79eS5SN8GMQJ2vl3sPwhdGrS4KCFXOnHuQ16tiOe4zTzfZhPg3N0RugrngWT5X+AzLHjTZP78lRTmh5DYleNaxNafjiuWtsYOfK7880mLXYHX58h0eGALGNp/YP4Ts/ngnyBky4shUn8frY4mGHe+7y9n0SnK5L3R9OFPNT12ymchBTQUlhd41QLxMXQ9JhSqCB0PFIgRK3ou5znSSoRTRkIFcj9YbKq91Iu+t3dzLvfP8iuh2J8NAUkj7se3uumz0AbT+PWYEzTvyO2ab227m1Cr0jMh4OONislOk4Kv4+qE29kbdeSnUUw9C+h06uyFvrWuHM0nX8pe13PEZatSKnmp3GshyaffiV0TuYb1UUnoaOXDSFdR/Oa8MraKVq2fJRa9EHoZFIpR5WmGrEnOFq6+T4/nYvGTCdk8bUm5XEIXdFvI/fkK1elJRYudjv83EK0IW9k4yIjolWRLXp4xxfxvc1InZc7qhbyJHQtDIyo4s8NL9GMceLJWY+gsYrLpFviE1QtoetnI9m6uQCO0a3gXVC32VZX9DEWMQ++ezWUbQf9vFWSpVufdDGgf6xBe883QrfbjWvteFaJZ7pxpfD+iH3tqBNb8H1M6Cqdb8bIfGN9K6zydhRsHlqsmcOk/1S3Q8D+2XeEzs/Nb1Ij+27VBjdt08hW+2ynyJwaxi0q57UV5aNbP0Mn2+04kJO2oU6wScQ+79LMcTrht04UxDhPM39KSlOfOJsROklkgiLb2zWOdkrV28FNBkLJXmwoxofEulaDlzmWNsdhkO0kMm48CXkpC/6fnMXWnUhbJHSWZp13Od7/BC+A9WVCnQGVaB4V8q3ccmfb7O756Nz179Oj2YkjmQCr23y+EnpFvwdSIYtGaLNfYF0b9bHw0N+EzsqMi38gL1MJq8wdBB0bmvXbdsim7wida+dblKEvkXNz6rY1IEFT96/Mg9ys7RWOfcZ+J89uBO18nbJH+Tjt+PKIarVI6HTLCY2jUqljn8eqFKzB2GQcH9ffABPTzniLE4RN6KpxiZifCzwROnl3lebunJEXHWM04kjHJt46ZKFzUp2NKhNZfL/L4GfGevn9nGh3dQfZrFtZcIudyIL+raLsdWQZhNCpPQHbBcAFCzfMY+3QTHuvIH2+CKgx8mM2A65tzqLu8UVcPxI67w+QdpNFo2bcvFg54TV1+liI6HtCJztVSTr+r8P72+y1XU9cwlb7qe2QS7zfCL3Mzrk2pxa9bqs6tGOjQ8a+iRzvqm9WnSAsd4LGvxUSav73CoFZmJe5WYfQj/NF6AlypcbYJtyTnW+EXjFwcXuZHgWYqAnfEtOMX8fpdaKr4fs7iD0BWpjXIx/HRe3NhxIHGlUy4/XPWt9KNYh2R8qi0bLEqUX9zfBOKIv+K7Suh7I80awsNROpP0InREImBLy3quo/IpbxGQOv0/0Bt+RZCN6mbciPb9DADn6/DNJnoxn9U/Dzp5D3/WP1bz5A3ni7wXyszk5RvxA6kQVd4ExibINto0r+ENaebSJ1Sei07xozxKBTMz4aVrnbDDIm8OwfbQDozl0wd99u7dlXhM61863K0FeRaNcFcByDmjiPtAZE/cj6zOCF6zKD71mfWXjs7crCzEZl4fJ1yuDb1iuD34W/33VvlhA9dSGrLCpP+NxyT2pGOanoT46PF15NKhXw6ox9dqxYGS8k6zawGKGfT4sTDqHbRJw1n4grha/Gs/ob0KDLyQ4d5YBWnTHeDsSysdHEgQZdxMBNNd8j1nnKvgdaXAyDbHfNJFdRFkJ8j8WUwmdSmvG6yrLkFya1wsugnO+CBcdWD5NYIA2d3ZP+rFq5QKHX5MYLMZgsNjBSbyhfRua/R4v+6nxSK4x9Eqrxs3rXGZ2jFmpxXGUM2U+ETuVBjCGJMea22Hj+tU3GQgBIQudlJ1dmNfOxaIoaJ3apRz8C5/aM9a2xcA3hKmXSL4Qunp1vVoa2b1H9a+dIyndTgn70jszQ6ZtTkf3Ed1S/87ZYZK8N6cG3bFKGtt2TRccyg9OnaFr5KI9e4pD06XN6+SilODOcO7V8mHry8Zh3WEZxMCF9MIhRHJDlV5qUxzOhc7IBjfjWmJo/XPx+pPL+L98ufza8/4f1Jw+6OID8/iN2dD7hAkF+j2m8LoZoBrOaN6+LjVuvrShLuTxQXZajM8e9AB274PWaBrL0aRTHF080Fn2Eef8TE6mPZowAUT+FWrTbZM+3LEEe1xyqqnvydqvO5+CD84tgwvxr0uX2g+Ml0PymS7v3HaFzmTBHSzcfnsi/sKKvhAZJ6DXjQTMvpW8udyV5VVwP1qyww1lXtGf/EDq/pqYOrUZS9evWFb9HSXnouttTi15H8sagLpHIgnIqMojvwZ0AEkcd/49hWJlQb09F9lmXGfr5o7kF5feriZlG19bw8zFIMGiJJn84PDuqWuUT1WNmvrxspHzJ0gO/j3nyXYcAIFoZTP5XNdhibTiJMWvyd2Nmnq6tNSB0Z4vcvGUkdfz+Tp41zkxIudn7mKGJ/s16EwhdJDj35Xk5F6f1F8G77mPGa6Xa75Czun9ym4V6ZRFc67JrgFYjD3ytEzqTC/y+PrZy5V70tbUaCd85SNRf4OD1txKzeF8qfsctn7hinuCmpXMvgSCbP4ntK/7eb4TO+sw0vVZq/txFLiFAEnr1uCDzlmZYYZU/ZNgOtWCOudanAy/P7dk/hM5cvG5WB392X84foQtk/hf0Lof5oWOaas285t0siht/7nEl8t3vLDu8fIiyZmZMIPQk08SRxI8iJE7ud5dNbXn5TG24/DvtxeXb1WeUHlIi5X9oz39SXV4kW01+t/Y4qcUUayWzcPfjWIYaiCnGMswroIZO36+ZT+M2OC3jlAf/8JRg0cMcTHBX1yMg5vXrHPwG90aXUK2T6hEfs7h/FO0LRHk1gr3jsfKUvYBUb2pYzxYI3dFG9P9tJGd7MlX1onu9qGEl/L7e1aagqr2OXrZ6P+iPj9QQB1tgoF1Dve/2I6GTtiJn6rjItd7dqK38QRJ6dX8mV0Sz5qaoevy+rAhdQ2KOLIr/HfKdc9f27AtC50T6QCyy1yZlcBsaqYmW5x4N4GbR2G2rOrhlXSpCNMdyi9oxNcorD5QPjiw6P3vQn8eX4mRfmHVIfJJo4nhOPqktLX9RO6L8J/VF5Q0qjc62TRkgVvK4sNiYe3Z5TW7p5SRfulhpidTt8+OEuTeQ2i3NzlzrdiA6oTyayln7s6wbOhtpROiOoYt1Fj7bSrAXYeDkKGHppeq8mUZ5XUTwxw2a9JfcBholUPhcsz7Taln4s2Sx4L4i90/ooDGL9a0nh7hiJNyuIdJ7vGSSpRpkE5sHzA/yWl/bXvzGhbHVZUHZ14RO+h6e72ath9BFLxVJWOe7ktCrE3FuRQxSza+HVYdQwMZFNGW8DtqpdlEcfuoTQmfa+UZtcGQjI/JWz8/RCA7PzbcpQybJEzRzP2W5gHW285e+8ShFm9iJ2+6QSilNJ85mvq4dUr5SfWF5E7zzHkLiC8j70WUsepnD4C748+5MZObDy8bLr1NP/TzN2XM0qAGbnOB53BoMGpwFOtH/eah6U8cy+JN0+kqf4V7B3CmuHYJ8bnBxp8gXH/enQOvkX4JJ8fcuHvL4oNuNxnhcvq2WBc/2YWJfV6+uLZ6hk8EKWn+cPd+Q0KOZiaOFCcS5psY9+6nGt2gZ6+6A8H40AGW6tXbBxwhdMbZJQncjGWpbAm3wA9J7QjPYkoRepx6wiLJmRn26fG4LnBs0F3VKDn1B6Fcw8t2iDhX9bLcjmd8FZL5JHbz+uuEIP2/0LSje2Zbn8he8fdnS8rnq62euUl9Q3gLaN9fE11eRuFge/PxeeO6r6iEzRy59UzmlTJzr3Md0YlvbBmRCLHFuOJJI5F+I164ChU/l29iq+WHMs4kW25jQhTNiJEI/MhbueX4jVVsvvp1f5v7Tsbygfdb4Uo4528k3CefLvsoCk+75LjJuldC5M40yWrGL+dd7b2NCR9/u+rlUBh4IXe0OQrcDqYSY4t7cCvsmS1iA7RpNW8QBTzikLgm9Xt+gd9Otq9GYkxVlzsjM8Txp6GO51h12+W3PviL0TZnBjzG/7S05k8EFAInElh4kcb9b3WqvBjdku2bpC47DBcb2TGR2K2jiXPvGa22NykM0dCD0n6ivxm36GRrRyPxXUtGXNxuQQGLPiCoTJ8Pz2wIONjYZmE8vZqTU5NpIQ0LnW8pAHn+lj7dusepcwdPfV+9cnGzHs8kLo6JhIJV6ZYHfL/dQr4ZlgbzOoLcAjGqCbl1DD5fQiXW6Nw3dcDmS6Tyhk0A5LtHufCcWKjXOnRd5uLvfGsngghe1dOucRm3WGiShN5I3PZbS3xdWXXyC3jnX8s+HBd16n8eZktDrgRMokOFZ99EQqa0RugIaujZU3pheqIr5+YXj4CbySsh7B56RA0l7PgKgAV4Gypep+6PlOwmcQSJ4EU2z8C8kEQz1iMEjEksnD8JY4TChHh/XjC9hmFJ6lmzNBhloQpCYi2mtmpKeJ0KHcv6ZZheARDP6O+sYhFHrbsVI4HN1CZ2dM8Pvl9Ki+C9LPFM4PQRCtzX0WKZx3Op5Sugl5hXwKij/T6CPX4gx6YMk6AMXQr5/xLC26INgbFlj73j+y411N7fjbYoqufqEJPRm/QRtFzC8rCivTsKuf9b6At0p1DtX/34i9PWZwe+3uuWOZ+14nr0hM7TrNmWIeIHiZ/J+Id5PX68MbmzVnzxq8Lgt/3t1P7z/zQYk2UKcRVJPMe0DPZshkeDdR/w/CVlKJ+EG7lK9dx7MK6rqaayLh4mgCaHrpOxQ3lu4BXrE5zZ3QjU+77LlThKZANm5eC73zj3gs/9UkxW/ew4/rxEmBJ/b//q3w9xy70tCt49j9FB8L4jAHSuMCw+LwM+BNvWQn4iDjZJgZ2KEU3ZJ6M3kTQ1rzZ+x4nSU0O24EDBOaSClKjm3N/UHoXMCBvL8gS9Cp05onl6XXnSwmJ/v8jAhXzccedYGZfCOO30S+h+1/cpxTugCMdYG6tCFmNlhnGVy7bylu7aejOKgPrv4GbcPLb1RKFjbIh+9uvEvwGT+1wbPPiY862dgLID63OByjU4SekuJ2TRoxomY79q1a4fwnUFTtVOguJJ/ObRXqEEzqHEciTn/w0bt5h2S0JvPT7Znx3xYdWq1/knNvCLsxaGX9uwLQrfDpSpD57a65c6t4ZHUN2cGo2J+fsEJfWM68iLI/95WvdbxLfdfqy8BDdls2MDVE3oYnQZ/oktW1GxIhbwRr8dra+QK2Ufw2Vauigle346MO9vbQhASugMQ18x/H0zJk07ixBVj7aQjeGV7R6tlsbf+s1ZSWHAFCZ/a34TeRg09wpwC2XnCYp14HWzs6a9FciE7T7eic5Eq2fqAJHQvMk8Qz5DWHaOj+eezYrWd2IQro6fNRb3j/ULoZecM/TMPLPVxhs6M4oB4TxXz810epuFvUgcX+3FBi4R+lxIpX6C+sjzSuj/4YIPFcfn531iHFiYAD45ldEJakPfdI+xeu8f87at4uNXWiKChw/+E5UsIFH2Ruw4+7rFONTekUsY+5C1eFy6Otf2v6hCDJPRWUnsJ3QbPF/sSyPoPGHAlhEnZ3nkCeRxA3xTkXFcSuud5Cg0SVesLYdWrCUifX5wtvBKUnfvaFHylaXv2BaFzK/fNyuBbH/Bp5Y6R07Yog2SLOeiWOy/PVnXh6X6u0eG1Nbyjfq52cPkIdbUnf/ChDBKFesCCzvrrCD2baqWzeHT9yjVj65KIMMHWy5T7IMffycoYbQdcyMMhdHOSlINdR8OJEbT2x92izNnfUQ2yCEDf7aJ710ZlwQVPcmmjaGWGJHSvqUOELuaN3gGxX4TkDITYmyQVo14I3xYgCb2VuoF8dvG6tTd4C3PUlTV/WM9+pxN17gtC5xr1Vm2hit7emEbsWSvG5zfSbfen71CHyDazX1Ln2+23aJHnb1YHN7RqEMc1dLyv/gltpHwYEPpYBwidWNJTT2u3w+T0Ylab0AmdvosTqXmBeCed36XnqVwu29HB4krhNCjbbNz9iIFHZrrbsTZ2/LGDll5Pk7b9uYOG9T1ny7RcUxaR1DDQDbsONetSFmcilYTuLXWQ0BH2AtHdn4GPscOuZGrmm8X8/UESektyp3PWFVCcti8C8WZRcm6dKPUJobNK3ZF+5ks3qkOPbPaxze34cR+8jOQpBF1pqSz2bsHQmb59yiukHMSznNeIbcEGBg0NCVrztpF0nhgG+hj4LYZPpYMRtO7b0bjFcZwjYmpBMjtxJJTvF5R03QnUPibIVm6/8Z/JrHksGtHUMxh0HOgYNycyhRWCFb5TEiA1jHIGefwaFwdABo0clkhCbyV1mNBtS+WslUxka4P2tDx+WP9zbEO8xCeoWzpJ6C3NXXQxBWPztLDqVwXS1w8GxSOpWf/q4J1z1/bsC0IXAUR65fYsuYbmKzgLxjXfpFAHM1ewaGpe3lsuRwa4lzkg5Ikt6lDJT/hWtHDfrCwsX6c+t6xo+fKoauKWcNs6CEyiu/EsESaOrTxIic9B0RKh88EIpFFi/tA3QlnOg8/+Bz3TxVTz6/FM4Vq8GiKcdbpMbPosu5t637CSfzlrjQGxTAh45neNrFJpWfCuPynLHTGl8AMsC07ScU0/Gz67Pp61phuXpWoilYTuLXWY0O3yJ8y9sX5By2/LXNU/i/lKQu9k0vnu3H0jav5VogzDgHM91Ti9A8FXmrZn3xC66C3ufh/OZYQ0e7eG296DUzxvoq1jNLWpinPlATvKGqQpdh9ynTJkblOHnt5Ets5bJ3S+3X6edmB5uEH41aCJX38jmoVq3DSayh+I5Q8w4L0SevWW+Qy1FLaIdy8cNJi4py98ttEgok5iyEB7m2v5GRmNgqYPg+EJapXubszC3YWS6HKkLLw8dlncnPXILfceJXREXDGuCnq7fc33AAAgAElEQVT9iI6jNViPL2Kecsu9s0mwyzmPSDBkv/oxNX94XLMeZzdaOm0IV9GefUPoXJPepgwdAlr6LkaQPjRkcp5OjOTWK4OXb8pGXkvyryO4qitq37hTGyrB+2f9kDkndLyy9i5tSfnIthA6Erk+ndSsEvNy9BP0qIZ1CDjYPRE6m6Bqts5tP954l57ds2+qCSv6bhqr3fwxaYuy+5m/46ZVfyups4bX3upbqHouC3zG6uM+kUpC95Y6T+iiL/7fBCUlW+YZnQRSkoTe+QR9t5SgsSKOCaueEd7PNStQTIwQU/8QOoKT6xZl6Nd4Hu7n/JqTOmr4mMcWdejJ9ZnB89dnFh57u7rHqzanIsRwCrfX70hHXrpBWZhZlxn6OmjkD+DOwEZ4p18yx+32rZkFs9eoe08vUQuoQYfWESiRG9MJ1ZxlrkrviaX1IhEcd8QRDE0dy9BIa/oO6JSPU1effkkAv4dkvoZY5Avn7w06Nwt1qOqforsS5nTc9wAl5ca7sLugPo/VnUgloXtLc0Do9jm6qgd2NMNlHlWN0zFPIeCPn5JJQvfTBvwaqmbdMjKSew4rauAAW6BQrQ7LZ0EIqb8InTuE2aQsXHmXD+tytzN10NZLJMAKPZffAeS+CdJtGzKD6+HvD6EXOHaHvcQWEL7IHBOJsqYOzH5uebx8hAZkpehMM/Q1WZbiQvQq6AglJHL4fEdcKXwpqhb3RVmxjhtGp2jq+pVtW18bVQqTQBa7E5REpluoH/Frj2EUKSnrFwwPe+/YfBKPZvSPYfmoQ5AW30+c2pgzqeU4geufAtn+gAadIc5uOLnS/HArsIbQjbPI9iwsSITnyXd8Evps3NnxKPGFjj9Ct3chMM10LB76nG656/8IvOXOjCpjmv5OzFNq6HOThGA5ZwSsK+kfR6fy+0FeW8id87kzhKtoz74idBGblaE/BdHSRW0d88CE3uSQwDHUKv4kTmNg0cD+7pvIN7DzdrziBmnTUuWEb44q5sMpGjWKam6K6N6Vh4dEwuapeotYJ40PeZSoNbl+FxDMmegYgYloIGyPXPiPB1/ut+Jz0UxhBRDj/WMkdrc5W1k3ooGTJH6OwTXIFrtmPIFXx5jxm321zUsZbULMWsuhXFuoEx0SAEdwqSu+v8LV7ixzibs7ntFJSFn4/Ceh+nLPSg29U4SOi1qo3/3USUiQs1FefiuE8ktCD0J4+DOhWk8mtPwwkWaQwEuaefYc3jmXhI7gZ+kb04PJrSoQreLP2rzONvwsI/BZpv3PhpE3y38adwI2qXu8Bcu/Uln5EtAkT4lnjEthot0uGo3ZoSGBIHnC/4t/xzvb8L3NMCn8JKpaJw0r+ecyETFSaz18aRN4InSMT55aTe97p3LW/lHV+FZCNXawshMrc+KkgydarxKLjvYoDK7v8khLfncX7AkpQQjp40haLLhNCa3YK99ftN+Psa/h+UuhXY7gecH/f8QWTLtJfUnCONx4Rq9P1xJ64SyyU6LouyqfhwULmXithhNvBaGT51nMbyevXSkaYvIbRMYeCB2e/XeSLhqn7XyonQXmv9nFYUdPE7pDSOYK2ieDRYrjP2GB8EbygkDHV5LQgyR6HZaM1d+z4rY0P9hHMZo5Dgu9ZrdZ/LWFJPTWwB3NgEb95QdyrXuO63Raxz3VqUO/ibhozizubhw9pUFj4hWqyyD9FdJNNBVuAI3xzwnF+DloaF8BjfdUmAiGXxtbuZeYD8u3Xd6UPBM6O2Mc4JMXDZphvAXS+fDcPzDkJaQtUcXYEMsY10A+58XVwqnw2Uuq6uK7M7OBS8sMi51YxjwW3n8OlO9KkOEd+H5ImyBdB/+/OKYWPpBgd/SF90dG0/mXji01D0nkrIMxylt1qo4sh057Ejn90HrPu9/HrwU+h+Fzq7+P+WL+jnOg5jKC/nUgklF1Xpi/E6ayAvOC0EEDuzA4IaFfcaLhb+HGpZFAk2zfErpzVBUWqSvU0U+r7qsPPji/KK5Z17gEXZrruvUpobNK3qRG9tyqDF2DW+/rAm69tyuhpr9VHSpvU4fuuSW1x4Gs/IRsqj2UVQO1L0z5/AV1Oyz3dBZpf8O3SugRnLxq6ze1YMWKtc+KwWIEf1b/ndYltHumbscOA+gxDt+vqsU9q/8+FY4BYa+jZwmd71jAAk0Tbij41p6qIxMG7xt9S+iz1BNkGP7R9VkaM8K6GxfcrNhN5z9hoff+kHceSrBACCMSZn8SOoJvvd+SXnTwVm3oPuaCtatIfR2NxT57pzo0sy69iFy3qBPpzXZFSgxu6k0a7O/CQqCTje2D0J1tX2HhUQPHh3rbiHRA8NNeK7OG7y8PNAzhWf10uenznu0BGuVT7wqfG5qGIXV5N/7Ta4TOjdVwpwcm2HVheP1yCL2OH4SW0WeEzm1rFOMa6EfX0d/DCwEN5PxtItWmCy3696MzhYMSqvVQSD7+SSJb94rxfajXE0Hbs28JHcG33m8fX5gGDfhJZsTWFaSOmjned0fr+XXK4NvE8nrEgEuaSwQh9Op85rJec/3+XkB7CF0pnID5Cgur4Akmcr7IxbxRY4NJ/p8hxbKmVzE185FkaF7K+ovQHacwhUtjqqWxhV0o581xZmia0PRcs7pzwgd5XxCWdm67pc1av4R+NxIPviPU34SO4CR56/jCZaCpP3GnNvdn6rioQOczSOa3ZQb/C8vHPd31MMIidInuR69p6KS8MMEuS6jGlpDIXAwyFKKHsj4kdGwPVccAK2iM9oPwCNW+m35Do+ut9p1zzTgxRF/tVPZZcxptUTCFcMQjCR1hkzq1fN9+r2MoF+ieui8yh/fiHflt6tDOOzJDq8Xy9TgkofcPul9DB3JVVXXP6DLzFQlFN6KK/juMG4ApxAkbNfRZNFjFcktC90/o0Af+D/OMjp/wCqjzPWHFGyfXOOkNmY/XqT/py4ckzL0TqnVbWISO/jLIbRbN+BKRlaovlhp6iOCkeUdmjwOAWK9C63fQkmfQWC6sq2fNtHL4OXM/uZo2uPF2ZTCB5ZkHmjmHJPT+QbiEThKZ7NbjWSr8vDZoorcTjDtgQn8aryKOsdj1YUXKIv7byYRt/ZSKJFz/4f1H6MafeP4xzXhbiN7ZSti3QI47UEumInbayjGEs84MK/iKszNg3j6cMvbB/KMZ62hJ6CGDG5yty0X2WJceOmOLMrQTtXUWmW06bGIn+TGnNHdnh8qomd+eHvzh7akIaeR5oplzSELvH7SB0I0yeg4kfgjCSlgu4mKYOicKMJFWJdAcSYSv4sNR7YTXEYmEHBCkXwmd7XIsAA39T2GRun2NTTMvY1UYEN4VSaaNkYRq7gxItk5ic11U1U/iMoP57yhJ6G0ARkWztfXxocPuyAz+GgOqILFvpE5opv2EXq02eNvAtvS3Z4dK9Nrc4PXr1IUavhevpXkNy9pDkITeP2gLoVNviKL3w2CJ9b/Qo2NR7Ry3cfV3oBzCPfPvb0J3jBeNkXjWejoskiVRFPE9mrEK8xePdUDGfwrbriKmmT+j75niNyskobcLeE9dvB62QV2YXp8eunwzaOy4JY7hUzdw7ZoS8zT7vVSTuOtX/hx8xv27b9XI3/4OqcBjpZNwq+V52QguhO74BqcDShL6PEFbCL03Eovwp1k/Qhm0cj3QG/qb0COCbwjQmj/HAklN+83fqT91AASa/+Z0Wn8Rr0tctd4S5vY+ic2uWg9xh0yS0DsI1JKnBM9p68eH3gDk+wnUpkFb341W6A8sHSrfK/hu3yykLcy3O3kOCBy1/E2E6AdvB2L/2vrxwRhfOFQvIuYhGKGvfRZMelJDn9/oT0LHcL3k3Nz886FqcU9RFuFBEjpLkcNSxz4vqZm30pgC4dxNT1GfAedg/hjXAtpye2gGeM7d9/dxOdmuZCWhdw5ItOIWeDkVGbxtfNFr0Qp9XXroq0Dyv16fGfw3/LwXNPXHQBt/HNIO+P8DSN7w848b0kPnwkLg7bdmho7gIVZJXiDweWT41giOhq7p/2ahUnfSqGL6bujQOxNZ8tmNw2slofc4+o7QY1A/EkhIM6/hhk7hnZuLkIRe9Y7jwr5KRqOnWaMwH32dRG0MaaudbOlnravE+Y3XQxL6HABJnWyJuwgJSfnuFZFn3ZCLvPA2JfKSDWpk31tSkWdftzbiGvu4XLVI6CMMjGrFAxenVx2K/sHFhJ+xrSjZCXsb/UboLOKh+YcUI/P2uf+VhG5LgskYiPD88KKe6XRbXDPvhHwfZ7crAvcPRrbTo4qREssuNfQuASd3JHI3gq/CgP0sfk8KWWJ+o48InZ69YkS+6Lj5Cqw3Oxdt0xiXhF4ti9h44dWwoHqAyiIcL3IYijmAXGvqkKJhoL9WLWNJ6F0KJOl6aa7L1nXATtwoSfQ6+ojQ+QRs4rb7RpiYV2Ld6UQtt9zbS+jCPXHFeFe4AVNCugHBjO3iWXNTVD1+3+o6SEKX6BYMNCFl2ZH6F/1G6Fi/UjJbLOE5aVQxvoYR+VAG4W+9S0J3e+fw8PAQ9LMrw7peFlYSXNcW3eQrCV2iXSAGGmhh3qFwql2FKRakA+svw58GRh8SukG0sZhqTqeWrcGJ/G88NKe8h95eQrdJMWNEQR67A5JiaMn25Z+1LhPL6Vp2SeitA4XHw3C6pbku31yhfgjM+jLBDjOq5A/hgQV4imf1N8S1icNSy/L7Ofl0BAON2rYBSQ/U2eZv05ZpX6A/CZ1Pxoq+m8VAX5fIFA5CWYQ3v0hCb/ROIMUvUgM5fa61dO5S9jE0+KVNJwldos3gHSqVs/aPq4VTYeL9cEwzTsQ7nuyBik7IBw6Q9xj1uGXshLRLSE+hi86oYpwpPt+9oI4/RrMTR8Y1/d1xrfD+JNSNx8aOyAHhB/1M6IyI9GniXlazNsbGj3s1ykMGZ/EjR2+Ezj8f1fLPT5BY9uHcTQ9SbvRJAGX5aCO5SkL3BzrBqPpiSCcls+axeH+RJwzLiMYs6PREfH7+g5IZGpRAJ3gCPSItWbZmNknOofQ7ExkaJ1jUVO2VcKawJKFhSEuzRK920BRTzBnqvcn6gvh8G0HqkDp29fPENuWJtLVq5mOqebj4PP+JDkCg7t/HsmO5IZFBAZPlFXFl8uVV35Hwhr4ndDKpq/o0khGQ7vVINKJs/EMSerP3xjJmgc1hc9Ln8L1jORJ85fpGYVlJa0pC9wHuZD87+YslK04pJ7KTM0KQhhI95yjuTKrFV7EvzPutVsc6tHAanvlhmEfqQhGdvBgzNBpQcediIG58jne8SkLHidrg1qDUhSvzYw0/O0LovFyJ5auHsS15m/L2TeQmp8ePORV+L35LKI/dyaHM/2/J8pOxHjM4AfP6E5mo5k0pvlMxLwdG29AmQscrSZhPO5IR2jWlisS8xyU1k0ZdC+wKVhK6F/nA2L0oXKv3lmTKlAJLayZTSeh+YBtN6BezldtuJ0gDibSEDf9UHxE6nXBz+RcmmGvD2o7PzgGz1pXiF10IvaLzcfeJHSd0zRwmbcnb1GnfXXRg6+fy8jjemYxl1AK1JtIW+pbfRUg9a3ykE/WYZ2gPoaPDD/S33Y7EiBH7QtgkYAfkUIw3oVyC9SVJ6F7kExvPvzahWg8HlI+v8pL5TzO+w4TRUJ6S0P3AEdovXDpYiYZQ1PtGQ3cGnLmiwTUPupWumU8klk4Sw54IMyrEX7uR0AWnEnaZyI4Bcepg2Bo6Px+Hup3NyloT3IH6lsfoS9bf2ln+eYo2RVszHoG0HdI9oSbVuDemFB5DZyLYV/h2bWhbtopOPMlB/ndBni8RZdQ6JKF7fT+M7/eHFcPcW3LaeSRn7e+lvJLQ/UASegU4oSWXThbIFRuy1ew+2HHCSGatI/H5qXlG6EniMrJetCYgdHLsYN0sGDPNw8HRFoRM6LQt2F3eBXgePazknxtWSiTMvdHL26g6EYfJ8H0wF/wjmSuSe+VhkQHvh9BP/xdl439cSEL3UATyzMEH5xeBfP4+1qHzdHsnJut9J0YSuh9IQq+APeByk6lE/cAGxKdxUrPud7SK8sB8IvS4Vvw0JfTaBQ2dSFbhYuaXvO7trMc8Q7iErlBCR+NVzLftxx9TkQXRTGEFvPuOEB2VkPEEc839Sa3wMvoiP31KEnorZWDz1ExNfdtB5tQA8ncRISJcM0hC9wNJ6NWgluFAbAmt+E8mk12MEInhEV5HW0LOkC1yFtTAKK7nCJ1/Z2R84jCow07mtpOfo3OtjIfCNDtRj3mG9hC6UjgB82ULsoFwE12skrxZ/0DtHd5/SVjGVVSDwz5VfD/m769PSUJvuRwYNa29W+88SttTo+mJI2kzeeMQSeh+IAm9FoJ3JdDCH6Z3Jk3eMWeXLF8DE49x4+K0/iL2jYqwhb1M6OL3oP7vxT4Bk0aJR1YC8iD1hz7xHbHuEp7R2xq68A4keOgXbvOGD3Kidhm4DVwtK++QhN5CUciz6EM9nrU2MbILfeud3oohcc4/3aoMJaH7gST0eqDhB7P6G0AmP4dB8xC18tW3QzrbLZjAfCF0sf6j1A/BP6H+TxJHOarxn6hq/lcjT3kSDdHzhE7A+hZ1VmL+J4S427RfasY0jjnxHS0UShK6j7LENMNqx1l6TLFtbW4ZyVnPabWMktD9IBRCp0FHSAchnWTeBCCx65FInPxCDEWIW43kLy5BVjpI6ANc3iSPOtGrAhJ6hOeJmthRycLL0DjqFSywRhsWdgOYZ2WdOucaV5RnmMm9nvOA0COOAWlctY5P5orEYj0YAVDDKfj9LWL+3iEJveUC2XOEFdrxiZOYwWbGPNaP/CSh+4FPQncmrPrGK8Kk1rLgfPoeb1BNX77qBw7O5xdhtCLxszz5bO1Qdb3aTOgDHupe8UxQQsf/53K5PcTPMU/8rMFk29BvvKvMGtWpXB6g7wp3AcEDzsyBQd+8IfSI05YLEqrx96BGcoK1+7f91UUSessFYmMPd0XQt3pYd9PtxZlm/lh8T2tFk4TeOlokdJwEK0llasFw1noxBiMZTedH0PDhqIx5QMrW5Cj8EnsvoU2EPlD93Oho/pkJkPFiLT+MMsfAL4vTp76oivQW8IWIfw29fajuD1gn7DeLx2mdjh7X3zCqnfp8l++E+l7ybnjPSNo6OJqZODqsNJo2RuLjE4e5FGE+EbqjpWvWh0IjKNX4S7W8vEESeqAyKcZHUqFo6bp9a2FEzfs+qpWE7gc+NXQ0GItl9K/D326C9CB6T2MDaBaEtgM62Xr4/KfoOzi28pS96KvId5s2LCEszTgO3nFiXDFPsJNqHU/ygwZmj3ptkIGEYmXQbznmIeaXUK2T0C975WClWlssa702oegG8WlfVQ6o40S1I4ywCX3KiZ8OE+fq58Uzxir47sUxVd9IZMyv+6gk8Mv9IPPrY5nCF7h8nMmjZUKnfuwz1hKsZ4XMIMUyxROTirUc77KKMsZ/sJ9gG1V/h8sMt+35F1KrVz8jmtZPgs8vSlTVCfsc/P8eKPefoZ+9hxsgBlgYLhAWogtiWei/qv45SH+nTlT0nfjecJIxS4nJ3OayozKvCN0+h81aSVaOQHfqqTyMLaP5/DNFeXmDJHSfxaLBW8i8a12HxydBztMdj3D6O4PITRK6H3gk9FGteCA+N6IVD4NnfoP+zYkfZupov8ysoEt8QsbBDY1aYnluQ0OqA3Pv3IO+st5qjUX3Wr7qpWO54m6864wW1thpMSWzkzPpFafgO3+Ez3noKDbRJnOTN6F1Nlpp8/zG0GJ72RrMb7OwozDAttMjY9lVH8msfFOZloV9h5VjfPnJUL/icWI5wiR0/jccZEA6H4Q2uIfIA2RKJz1H3pUyJ1uWs1G1cCkuSEgeGmiLrRC649//7+Mob6ivUP8Saffs5ANiUA3+Xfj8rena79gyA1mfSmSk6SoMrn9j/0jlVpUIGWhinSg58vfBZw9GFeNdgn1Gq8Y11KpX0ZeDLK+C9iH5kvuxLvIMmGaSNIjN1vlO6LZ/8Ix5AMj1iaAkShZzSMa5/AtFebVSFknoAcqVNRWcP4S+3HKZ6G0F68qg8pKE7gdNCJ0MChL6U39JLDNxIvz/6RQ1XJkRfDvXTmq233BjBgRJ3EaitfSYUng9vs+9sZlmjO9S9afhu7b/aJZ2UdeTxg/q51EBm9DhO9dTv+w0wAgtN+4qkM82uhE6hktlzlWeFspAy4FhUEFzF8sRGqHzfLSJw0CON5JzRZAh860/XRUwwwn+wv+uGLP4noRq7IindXVUMQ9xm6iaETrkdxW1XiY7ADPO+8mke68boUNeb2FttKtGZvB5VDX0UaVgYr7sOVZmtzoJfUizZonnPqVwYSsD0r5ihSFwFf2SJFuUoIyc/usuzwCpjwid+W1Ylt8PJ0u3ft8SidL5ZmcsV3g1zb6VrVpJ6OGUzTx3rI7bZy8ygz6wK6GaccwrSFhcSeh+0JTQcWLSH46rhY+DQJ5mK+hWG3pWCJf4YDydV/GdtQOEaejp/EuRbAWtyenApKPpLWvoeDRQe7WGO+UwXDV0eN9HUIOnZakdSIk2ELq9hZkpHItGKsx3Nsq7lUmfLISQVJKatSOmTHzWTXtqSuiq7mboVGKLIFcNHT5/a5OJ6lKQ+WN0W72FyQzbDRZj5A68alwcEW4g1IO9y6HkU/C+u/n5oLAI9TWRNk/Yr0hQn3m/5W4fweEiHPpEYEJn/dLf1TVJ6AGLR4/Nsse/OKFa20hbtrD1HuNxzrPhhIeWhO4HjQmdNRSZoJBgAwVlwIHKIjg9EUtPjON73c6u+5XQHS134phEtjiN28I+Fk8V7YZtltCKM27tNheETuVizriQmMctPn03LbP5sUZ9gH+OW+zQd59ibnx9y7K11EeEzvtK1notlGdX0EmX90tJ6F7Gd+iELhrInYxHfF7LJ9w5X3d05rgXhFEeSeh+4IHQWZqtEqa9xUvJwg63Ot1oVQfPku1IaPi7Y+PHVW2r9TOhM0cdSv4Q6HgPuYdtrcxL3DImEbDw/7ULgFK8jnY/Rxq604/sLXx6Zk6TzmPP1xu4dFsvaz0aG6c2AjXbsvy6nqovJldxCLnqdcqjlyq33oV+7H1XpOSEpNXJbhQz7Nsy3wndWYSaS3kkNt914f1AMWybHUnojUg0fEIX84G2+I3XMnJPf7FMoSDWMwgkofuBd0KvIFac7HAFRw3jJsv8TJQaTCFxFupq82T7Hc94NetXVYWhpNZ/hC76j/9Lo5Uxj2luy7pC9mhESOwbZj0NwrkhdEaAeM5cLLO7qqWoYjwOnz3JjCmJq936/QfKTYz/im7RubjFLvNgVj8ELjubr5Sj0I9ZPb1sz5PJzElFct6fyBXnvYZuX1tTrDNDuPLEbzg8Ue1W2RskoQctHwW7m64VDwMZPhFvIkc+L0OdLibfDnBuXlEKSeg+4J3Q7cZjsbDxLPJPsbT+QYwdPqoYqahayEM+n4XPb0FiQUOmupMyJ0XVwrCPrKP3J6Hb38ua7xirG7LUPvooEeMyRb8R/v/JqKqfhFeG4PeVUI8PQYe9EuWerCVid2KcE0I3SbQ2KO8N+DxM3odilK24kn85XoeMZvRPoa1FXXeifHtPNW+vHpyCM52vEENM1/C3qP2b3CsZXlk7N6EUJkdzRiqmmePxjL4ayv8dKN99JGAIHhG4eEGztRLVuAKt9sey5gnYJ5JZ81j8PakY2UjtpDGfCJ3U5VC1uGdcM26nYymUa2t3Da9Y62PSlYQetHy15TSnmgRvYZEniw9HNeN15MuS0OcQLRA6JVRyv/bqxUv0xSyHGqGkUlODUZggoaHvoXca653Lk6tK13MHKLwB+4zQqWV/bOVeUN/1yTqGKPZ1ENXcjPfzIw3qHh03xyCvG7CtGrbnHG2503oYn49U7VCIv48ki6+C/vPvOndiS7wcYznraLvv8EhxGkaKM59ymwBihJjNEsh5dzRjnCnWoboMR2cmXwCy/jxMBNNxEpynhtS5H4BHkUToV5tOZvOG0B3Xr7gQDR5Klfdx6Jc+A7RIQg9aPgH2Yg3G2Y31Fte2dq6aHxTrFwYkofuBR0K3yVQzfoCEzb5M3GdiI/IkuulEL0HQGW6od7ZGNRxC+MvweZ5vPxG6/R3FNOtttWOZ2Q2B67gzG+66tFr29qJoNP/MeJPwlp0mdN5+cdX6kVgHm4yZe16+wMMtPxjIrhMzzwu04TXVsoTnv5ly3+kg16Kg/E/G05QARf/xohxJXnbUuUIBr+LEXQz3SJsSd6XWWawci8S86vXJXid0TuZoxwDj9H7aRgF9ufP+qBlex3cVJKEHLZ9bWdE+wq2f8h0qGIPXHJjL7RF2GSSh+4EnK3c+EZuXR/h1ocade4CTMzqcgMnuLtYhKidD+yyUxhXvR0K3fSmr5kWu8qfb7LgCXo9yoXKyY167gk+2WKeYZl5Rd0HVWUKnBk+a8URiaeGgCH1h3fbjdYB6f9vtTiyXJU6M+Bxvs1TK2Ad3htwnc72EskSPe8J3Gg3qBbZPAs06pY6WQuQB79uaSJh7i/2uDnqd0Ad420TV4r64wxaCMVzV+Dbfg/nL4CxzS+gU/Dzd+n5VedkumTmLx1TkyZC22u03S0L3geaETrYVYWJ9mFueeu3YfDJMZM1J2vGqBj0jK2isdaLv934hdJt4j139PKjrXfQ7FTJCBz0laqxFIxY5uyONYZcFt59V3H520XI7SOjOotC4nH6l8eC3r52lJ3S3oB98MQjyORufyzENIaEVj0u69DX7/Zp5vij7VmQJ4+AC97qxqFJsp6lJvwyX0HlEK804EfNdu3btEE6EYaaqHQfSbuhrH49EggZkqU70PNYYod1Qhk+de0Jnd9O1wstAntvZvDZDxx8ZT2eL9QoTktD9oAmhOxOn8VV8zk/DYcQyaJB/uWg4rHHMXSluUBHpH0JHueBPcr3KZSKxB6xm/F2P3Q8AACAASURBVE2sj1fYk4dq/rBu23aK0Fk/iinmJ/G5ZoTK88PJnYXmnHXLr5rQgdg+Q43hKjR63s/geWuUVtE7WdjtmjMSCZeJxdlp8lS3XtXQ6e0BaPNYuvAR6FOPsUVMOGTu2NT8B4+LxHd6hyT0oOVrVGYYu29l8+80vXNubj06ld+vXe+WhO4HzXy5swkcrXjxuVY7taMpmp92n2jpNijXbhD9Ruhoqe5mScpXwTFmcNLqFqQ9eaSN48ZctkU7rqHTMrzZS9sJ+R3lZj1dTeg8UEyc2A1UllnQoG8SZNjyYMbvwntvrS4PloVtFV9Axdc4xC1pk1A1dAtvPbzvqPH8a2mkt4kjw0pkMoX+HFcLp+K4g3fey64VBnIy5UpO2J6a+UUv/cMdktCDlq8BSPyEmFL4fTJnsfgH+mqxTmFDErofePDljvdCYdJ4MfuGLy0xruQnXLdO7a1Qeq6J6DdCh/ef5n6Hl535+lxM8bZdrBReD/k9NZeuX22ZKcbJXuoibHMPeyF0x/+++Y/qM11hl+nHvuRYIRPjZ9X1sydWVf+zh5xCJnSnr3DHOOEmo8R9AzDfEbzuoZG53Sc1cxoXJFTcfs5jJaEHLV8D0H6bMPdGr4Cx8cKr+ZhrFySh+0FDQqf3QuGzbalU/tnsG74IHTVwdse0wlJYMIRZw7/Tb4SORkAp92AIZEEVzVh+Jznmm9l6MdThQXZGPy8J3blCBRp0zRY9uotdg3YgX8Fn/ExEQj/+arUFvX0FUzVuEGwD6o2TNhF6O5PohTD8stpXnzTzsiayawJJ6EHL1wTVUQ7b+j5J6H7gTUN/uM593aawJ8KMeazrxMyvH7VA6FHvmlZPEDpo4O+u42WLdMKoao55rG8VmIaeLbwS8nq0GzR0vnALn9CnmMcy40ZXDR2PezTzXPpsq9bT4uRi/MBNQyeGeKpxlfCVThN6swhwQVLICwSXyRbHC4wbL32jQStJQm8/BvgV03a/SBK6HzQ/Qyc/Uaj08dYa0r6vmgEt1O0Mnd1Fj+es4/l3mhN6oSVCxzJAfjd3K6HHVKvoIhvhPaanc+dqOOWxxPLMS0K3b1Soxu+ryxzSxMf9W1/tmj+14L/UQ/49qKG3L6GBFQ31a51HxROEKCShBy1fN0ESuh80s3JXWEg8rfjf+Jzfu6HQ6X7nRg78J/f4xcrykjiJ3ORO6NAoF+FzXgkdvbBBnvdUbzl3C6EncpMp4Z5+BeEyL0xejK1qIDiG+FRdo7t5Quh5e7fDPNvFqQz36LYjqeZfRd9QbtkD2WIgCpBlDVEIDlHITZCOWrn3clLokR70p3uSSd4uktC9JknoktBr0eweunM+eKuqFvdk3/IkCGe73YiiwYtLg5QY8d2Dd7H59xoSOiWFv7LCNx78NjGZh8crHSKw988tofP3kDueqvmwywREnLHgPfJRxTyECdXrpELvC2eOewHksTnp5ulpHhF6LvdOfg/9ZLfjC/ucVjGnqOyHPZ+j206SNPOT7nnrJFAR+lvwUDdJ6Lxv231CL3qQmwdIQg9avm6CJHQ/aMlTnHE6PuvBwxZvDHgmvxAG1hWu16YcYxiyVck7ezqtvyjuOiB1doXOuI+7QG1UDj5pJ1XrA3WsyOfeUxyf4DXzL/VvAUzaMopMRbycX9nevJKa9aW67TqPCJ3vduBkjt7oXCJEUS1dMx8dY4sjL0567D6UnjgSvr/DxUFPKUFDvz7uaP+dvLbWq4nFtWfX1HCeaNYWzSEJPWj5ugmS0P2ghfCpiWyxFFWoFiJ6kIo41o8DwmcEMNl914Nv77fgs3yCRYv6hKpvTGZrA5U42+7Gu/BZutVaG6KS5zVMXYG65tUNhG47UCGLDvdIa451v/FlXkbnu2Vb9twXunDMcRpzOjLn8dDbbxTnuMOFwX95XY9uOXSIYf17JGXtX9kGfAGKqaJv45XLlyc181Y316+0XqQP/4INqM4GZ+nFpFAyZ0dJgtyDQhJ60PJ1EySh+0FL8dDNEguJ+kmRAKtypNGyUsfvD9+5lJGvazxqSnrmdif2sT2pYrAStzN39j0SYONh3MoX6jBAv+/kgQEDoCNcSOvlNmnOPaHzSQi1OyjrI/ViDzuEaJwfVY/ft5HsMfRkLKN/nh2VzNYbBPON0J3vUPevdaNDEe975jpo90QdOdqfEacqmrmpcYAhsoOywku9Iv1N6CVbM1eNXzaYQ3xCEnrQ8nUTJKH7QWvx0Et2HGlFvw215ERaPzS1wtgntnLlXqll+f1wkoyphS9AAzxYL3oYnZB1OiGrxU/h+3lHF+4Tn163PIpeYsY0QOr6e5wFATeCOwVDkS6FZ//JHH7UmTC7gdAryKtBDO8Kf+T3wu+fQTemWPdUPv9sbINoRj8ioRT+G76/kQXTmWk0AOYboYvfh+/9oZ6fcXLNjPjHt3bD7xdGFX05auHocpREqcO47Iq1EvrWxYlscTpRx8WpbbSoWb8S+18T9CWh48LHvj6oGj+D9uLjLcTrT5LQg5avmyAJ3Q9aI3QiGD4hpqirxt1oQQ6fb8FJHia30hgJJ2mW6pI5M7SDZzcMp1bsw0oyQIvjNGJCNetrlxjXWjNn6eLCfAga6p/xjP5H+Pxv8PudkH9prE4sdid1B6FH7F0Na3/odHczwnTfJoc8UMY0ZCfIBzoolh+e346Gh0T2WdubV8POPz8Jne14ZK0jSZhU1s51CIb0H7roMx7FY56EamzA31HrZnYjdVyckv5XjmetxzEAjii3Jug3Qi/hAhV39pgB3OciwhGdB3m1AEnoQcvXTZCE7gee46HXxsLlpEHCR2aZf1/hc3fBkqtZ3HL+GFqE2jNw/Afy/XUjLR81dUpwJpmUeeKEJpS5joOMriF08UaAJZBo3cUMrZ8xWyF7Mnka07W2Au5uOucnoTvfjarG2x0PfK6xukt2P8EoX0RrJwFCWP+pf/xk2zUoxpu81Kemb/cBoRMZsl2MuGY8OKrkJwRZtS3UpyT0+QFJ6H7gkdBR4613Fl7l+7mRUPHvzLrV+BC+122Q8IYcVSfi0AjT8eYeqzjB0UmYTv4l2unxd3NWiJIlpO4hdFZz7o3sM4xodzerd7XfbTe5sMVT7YQwTwldlCXI5dP0aMd1oVPRF8jf6TONdoYw/jOLHKd/UuyvHjHvCZ0tkmaSOdwlmyxHM4VL0Vuh0K5tmkgloQctXzdBErofeHH9qhqPQvrNGNd2Wo+yVKLnwuYsvT5W+Ax7ed2JkDdmPGN+jJIqkltr78WyMq3rbtySriXZbiN0oRPDM5SIzEaaYoPBTokJF2IJVf8DBtiZ365fa525OJq6/gl69c8qsVsEPiYF3KInW8eMpPSPsbe0OsnPT0JnZ+TsOK3E7Gz+HWVjJMKusLYoqxYhCT1o+boJktD9gAsto19MLXmNXba2y65QIRnA5H0gENU5S5avYaET7S3tRgKe5XkxY66nR5X8W/F9XgbHVEQgN3pnlUyqTRYUJXo+qk9T6+PiY7HxggZl+Bu7drTb2U7VdzNy2uhG6PD3D9OrZPrT4g4AygjzitYh9FHFSOF9ZTrBVX0PZZzRP99ABjY5jmby74Hy7aLHDuwoo8liir8LzyxxMYKLJzSW45NtVZl2shsA51aUx/FbfhULO1rVJ0jd7nUjdCjDW2r6kSCzmFpY46X9RUIniyOh3eyy0+OYs/C5et7ZnDbRJ6Dc9zNtfdbpA40nAeFoaZb0QcW4L64UTvBShzqYD4Ruy4XNAyQqIPQl7pP9WnQWw8cUnZjb7/tbEvr8IihJ6D7AhZbMrfrF+DGnluEnIV+WiIFbcunkzliu8Gp8DibGd8NAeRQnN7INL253s4hMjCzJ4CaBV7IW+mz/3eKcfijm0crAEBr1reS9S1fT/FS98r3OBF3CrT46ceu38khlQDI3L1lxMtRvctauH/y+ZPnJWD9XDR2e+Ujm2DfDs5O7BZkQGY2vOAWNAl0JPZW1lmB0LyK/qu+lj3kT/qyrofMyCBrvUVFF/ysa+NEJ07TtFMS682MGbBOqdZsP8NjjSW3ViFAWu0zJpaum0ytJeVw1dJDL3936BNYN5Aga+qk1hA7feWu69ju2zJLZ1Wu89AF74lu+ehjbbUxsN6HsqaWrKjR0/B7+zhM6hsnlcnvQZ6z9oU98Gz3vpUi/pP3XlqfQf/lE6/Ql80mQ5zdH06teinlhnpi3+C6P/domdHjHNuqopmax0pVJPMrCxZndFlnc+dC3xhTzXFzMOnLgfhE6BcdFL+4qEtKrXVR7S/b38BgmfELH45o6C99W0i6mpPyBZT+vCKqC0DnPBGhPahujbx/N55/JXjGv5MXB7n3r70YtPZ7RfwS/n0eT8WMQwE/g9+8Ld5+Jow147lMxvLqmWmSViAMbJz5M+P8kMUzTt8cyxvmxtDnuvK71QeEQZeGVkN8XoIE2kcWC8F7HWtncBQR4HUyS7+AhX3HiRU0VJp0LQLv6cUX9MsbPIH1ZDKnpGKgVjo1njEuhHj90vgNJJTK6qDZgDdcQCq+Hv/8U8xe/B/L9EZTj51AGkz7eWGuxFwrobS+j57D88M77yWRaWfdSkt6tRi38ZkhTyezxPH59JJExD3DK4pSJ1esXcbVwalV5+B3s07GerL7nCd//KXznnIqQuuy7CaWQgXJW9SNHZlF1YsxL3cX7+bTd3GRp/Jxr/B7PsQdo+8CErxhnQD+5EfsLN6a0++/SyRINwWrsxGdw8sX4z2IeAWATOrTZ3anluPCrXKx0ZSJjusi1nCfw2ir05csTivFRjAYo9AVSx/aeldcB6wNjy9e8BhZ8j+PCtnpR3UKyvxfLUn8XYRI6tPkZbHE/47dN+CIZ2mZea+gY52PMaUuf7TlZwrEG/eI+9NPBXjGv5OUPQqfGO7swQb8xljELeB8cJu1PwET5EUhvwvvoiYS5t/DNBT7ieYuwJwjmSW5xVDFOhknlI+S9GfM9sUzxxESmcJCw/ToQ8J1zD5S3UIdUasU+sXQhiTKG9FFYuZ6OuyZR1TopPq6/gbtAjQhacz8hqho6LJhOw61/3NWhOzuFtVGl8C5cbNCnaGAWXMQRbY7eOX8n9iOSFOO0eNo4Bv8m+Hwn34E+l41m9P8S88ff8Z1AbPmIx0kCPRxCX12LfgOAHN8H339/N6YoKZtxWlSZgLGmryTaEruz71KnhXPc52i7KvnnYnvG0voHg8tWf1+1n4tgoH0PnWJB2380oRbeG6RsOP9BXieGV76uAh1zanHfMNqR+OiA8doX86LoytUtVT3ueSst5EHu9b01GkKL9avIp8F36sa89vm9usDvedVC6Tsqook1LE+9fDsss4b18VB2uthbuvqmzDG4Fb+a2BBgSi1dM6OsfDN+dgl5xtke9+QIRqxvaumq32ZIXmtmxPzxnfD71eL3Wqxnz4H3Dydug4SERC/D9ntdfZboQiqhvpdPJrVnmPN+crEJprruPb8bEQj8mppxOTnuUfWn6e0ESIq+kwZmMW7mUdkigiOjevKs9O/OXAmr+m3MjmEnzx/fhVv0MdW4WCxLM1S/s5tT5QKq68fYQJh1j7SnrgvCbJs2lK+bEHZ7SkhIdDMcK3vza27x0KstlltZ/NgGeqoZT7hY2wrx0L+Ez8lJQ0JCQkJCwic4ica14iq360D4f7Rsx+h/4vOt5W3+uH48dGKUSIwd+0BjkpCQkJCQaBeYlX3GPABIe4fLHWTyOzqGiTOXw+LNhjoQfRIc7+YsKO7EWX8kqa15mVgWCQkJCQkJCV+gNhvxrFnHjbHO4g6Y90UzE8Q/AW69owbunA1PLeCf8SuWxCJZMx9kDm5qvP8xp0kXRmiGkswlJCQkJCSCwD7rzug55nDDNcoaIXXNfAyvjU010KaR1KMZ4+2JrPV4/Qh41EtaXNNVsQwSEhISEhISwcAi9ZmXjfHYA66kbs4yP/U3gAb+ATSWi46br4grky9PaoVYTNU/iE560L0sOk+KKbXR2px46Ny6vastvyUkJCQkJHoJVONGh0fox5+7ynXRrGdZRDDiHY5q4MZOTI7L4mJZcHla+X26KMCwtQ9FUye8jr5abrdLSEhISEiEBtt1r1pYQ7Vw01XD5mfgPF66cyVNJ9EB6wfOwMWASaPHaYYlvlNCQkJCQkIiRDj30jFi3irm5755dLVm0ZzoObo5w7bz3yu+S0JCQkJCQqINEDT192JgERYVDM/U/YQrpSF5s0UMyTuD/tzFd/QwbE94EhISEhISXQtHUy8sjSv6nejRLaGZ4pZ6A43cCdGL36FhaY3NPW7RPsBdzla6ZqZX9eYkSpqEhISEhIQX2IFVUsY+UcU4E8j8ETSES+Ym+bn5rB0L3Y6JTo3exuAZRuSPwGefHdXyzxfz7CW4l7nspqHPTfhTCQkJiSYggVzCSHNdEQn/EAlqNL3qpXHFxJCKV0N6DLfRUyS2vJOIhbtqPAok/jdYALwHfr6E5gT9oNf6Qrlsx6uPrTxlL6j7CVDvs+OK8btYRv87kYNq/grq++WYMrFseMUKEi9aRlGTkJCQkOhW1ITfPSpZeFlU1dNA2kUgtncDyb0rltaLI2lzfCRl7S8+2+YIgm0CJXJ0YYsx26GeW9E6P7VsdYlfzcOEv+Nn+DvIYUNCMU4Woqr11gJGQkJi3oFMvEeAZhXVCrFRzRhZrOqL/Sb8vhB6U6KnwV27eouH3sYQmm0F31UaTedfCiT9f8R+IFss4XECtyGoSOQzfRYNCKkVv/7L4ZSxD8tMkrqEhMTcQLi29KmU4zGs5CPN8vvKcW3iMJK5nNzmEZx46NUp0oMk7sAJVhNXzTvoGKCE3cyinxI+CwmrGtcPJ49/sZinhISEREdhX1lSjM+4hbxsIZVsZyKqeTjmKc/TJboc1P1twtw7rlk30EA1+u6W+z18B40HYUFw1aGquqeYt4SEhETH4Gjo5qfD0NAhzUhCl+gN0P4Jff97RMtuncxFbX13atkaJPWvkZxl35eQkOg0pIYu0Y9wIs6ZSiJbL0Jcy/2/BHlNJzVjBPOW/V9CQqKjkIQu0ZdgfTOpmRe6x4T3o6XTmO/JrPU9+grZ/yUkJDoISegSfQhyvg3E++KEZj3MnOY09E3vLWHgGhJD/q4Ut3qXZ+kSEhKdgiR0iX6D3edzxjJyn1zVmwabaYXUyZ111RwT3yUhISHRdkhCl+g3sPvyoKGbb0VDNhaIJgQyd7bdE1lzEt8hCV1CQqJjkIQu0W/ghJ5QjI+idTu72REuoWvG2/AdktAlJCQ6BknoEv0GTujowrZdGnoya70J3yEJXUJComOQhC7Rb7A1dLWoj+XCsXCvIPTcZDmp6MvxHZLQJSQkOgZJ6BJ9B9Yvo2rxjXHV3FXZfwMlyMNEK/cdiUzhIPFdEhISEm2HJHSJPgS/SrYAyPfaZK4YhmMZWzuPa+afq94jISEh0X5IQpfoR9guj7PWW9APexiGcbZBnGoVxXdISEhIdASS0CX6FER7TqVWPwO09OuToFkHOUtHwzrMI6FZV8KoWii+Q0JCQqIjkIQu0bdg/TOWMaKJbPHxuGb66v/4HeohznpkcfrEQ8W8JSQkJDoGSegS/Qze/6PpQh4IGYm5FFX06bg3I7kS0cyzRSTzJxMZPSfmKSEhIdFRSEKX6HfYpK7oy+Oq9QA5U1cwDLAxTccDMZhj7mGhf7O/xVVzBh3TJDTz7sWZwhIxLwkJCYmOQxK6hERFONUDYAz8HLV1JPYxei6OpE1T1sLPSvg3+P/umKL/ZCRn7S/mISEhITEnkIQuIWEDxwIxZItmrKNjqv4V6M//hH59b1zRn4CfO4DAt4Mmf3U8Uzgzrk0cxr43IM/MJSQk5hyS0CUkREwtEPstjo9MZvIFyspTXkLCrSbMvcW/4+/lcllas0tISMw9JKFLSLgA+i5zEetG1gP4N9m/JSQkugqS0CUkGmKAJuzLpD9LbVxCQqI7IQldQkJCQkKiLZhagCQrJmJwgwnP6tjvSJb877j9x4i5Ze1BErqNAVGWNbJvk/x7FmxLmtd9isnEm5zkmbOERF1MVXLAVJM5SI6r7sKAQAhh59e0gfuY0G0Cj4RLxC3Jv4cQ9rkx5DfVTefQAyElid5Hp/tCmGNrgM5p8nioo7A1wApMLRhNFQ9EBxexjP6emKp/Pa4ZF8YV/cqYUrgmrhauxZ/w+d+BOH8L6Tz4/bPRTGFtPFNYsjh96ouqXsMat/7Krc8IfcBd7pEIWi/HlYnRqGroIPMPRdXCOXGtALI3/kRkzuUPsof0V6jnJdBO34lp+hT8vxgdL8aOzky+oDrfeu/rFVANIVLRjgfn84uOHtffENWM46DuH4yq+jdiqnExyOTPtG8a1+J1L/w9oep/gJ8/ATmeCX3rTYsz1pJotLhv1WvESUii8xgQdwb5zgtNUz2dIl1NalTm4icHH5xftDitHzqq5CdgvHwkBnMMjKdL4eff6NhiHAD/h88vwbEXVwrvJ06RlMmXV71goJfnnp6AvYXCMJKznhNNG8dB45wDDXgLTHxPYZAHdFyBBIvRm9C5RU1if8NnqLcqqwSN/AjkAQ2tfwIm0sVM+0QM1NMY+4TQa+ofi63cK6ZaWkwxPwsy/wvI7gH0/EVl2kT2FfJfzeRvzsLC60EgtitAhmdEVXMMA3/w9/HtsTmpvQ+wstrtN5rOv3RUNU+F+p0P9dsMdd01tnSS1N2W1VIP/TTL+qlq/hUmo0+Mpo0RoZ/WvLczwOOD1c8II0W6mkAcVGznSlQgl8vtEbQfjI7mn8kWFC4oV8xHqdSxz4PxBARu/hDGxiaYQ3fzuWWsCQfwcYX/ByUQfSVci/PPaHriyIgzjnpq7ukJ2GeMDOiUAojkq9CAdzECL2FcZhogAknRmOauJxsm+zm9hB6txkheq4BYzRJ0kuvhHacllpt74zvxvmx1w85zQq8YOMPDa4eARNJQx+/GM4W70esXDIYS8QYGv2P5K2XqUfY09KYgf7LAwgG2DlbVn0ukrYN5gar7QffBtuaOINHG1IJGd4mMHWM5MoGUqKxMX7KicjJtOWE/hb57E2oZeM+bFaLuAjRM2N7hNFhQK8Y2uqDWb/OVVOM/8HNTTDPHxby7CfV2i5CAkmr+VaPqRDyuFUyyO6gY/4M7hNA234S6fauXEvSvc6H830koxlkZZ9esWV8if0cFC/rCVZDWszZtuS+wfnQn9OkvkZzF8U5/J/9PZE44AMbEF0DG97B5u5RsdR5y5v9ZHFdJZ1zNEC0eFgqo9dvv7uq5p1cgTE4Y2QkE/Ut0G2lP/ArxFb2b/SzFvQWGcCFUveT4mTagc0yWxghJ69vjGf3DsZWn7EWL45Rn3hI6N2jDukG9QQZvReLAAYP1RLmzMu9m/rr9yr1G/pgnDKQSBu0gbayau2CSvCwJWrtTvK47YxcXewNxxTwBFj3XYh2wD/FIZLRv2f3Ubz8R+imRU4n6T9cfRu9sSa3wMlKKNk9AvL6wkD51yfKToU8UZ7C+vpJmzVJXsdbxYt5dgJrFEWqPZB5S9Q8CcV1CFyT6U6StqzS/Hk2lJcvXYB2e1I5dQ/tS8+McIh88NoMF64O4eIW5ouSnL2A/Iv0pa11E3sz6sL2ABAUrquj/C+PgcTI/ZK3QxhbNhwYX4po85HsDbsnb9ZSk7hOCRrw4W3gl+n1GH9FkglQNooXHKYn7JZGGia/icJsTOzquOnnD0nI528DziNBtmcPPRUjkUO/NWDeYuEt896Odcrflwd+FgwvfD5M+vP+yqFp8I5dPl2jrtsyi6sQbYfHxR5wIUF5iHdolJ7ufaibtp5rxSDSjfwyJB8vULnLk+cY1/RSsL9R1N+kXfhJGXSM+343j2lnmFlC1rZsaRDsbKOs3oA9upL7q6XYukhDuuNiBZ1x2oHopkQU1GX/GYynmZ9+DBTj5+6h26vNBRvcnUB44F/rrD7vJrp+qX4B5Csa3kahiZKFsW1g/52OrHXORPa74Qg3a/acw9+zLy9SebjdvgRM17UQxpfA20HAeZVvhM4w02zVB1hI7WzygJoRbMjCwzxkeXvEsLNvw2rVDtIy9T+giQeIZNgzIG8bICrhod+5OybymDcj79VnaB6yd8PtneRvM8eDi/XQgOl54P0z0T42xfjAH8ioxYp9lEc9ugTLFBBmFuqNhE7pqnjoWrO+Tfk+JUZ9zDV20Q0BtMJ7W32HvThE7BiwnnRN4v+zkfNSJfoTbzzD+n0hqXEP3RuiooUMbPijs4Pka60RpU4wLMU+bzGGRinMR9hOuRXdCHnxxRrfijTtlZMAW4Wg7xX2h4X7BIjPNdrIR6yTasMtIw141Yq9eyaKjpwmdy3x4xYpn4dkV7kokyarUnrDmepKhg0sIuwn/vyGm5g8Xy99Z0Pah54b6RbRM1pwufJw+BBpvjmxl745lCh9gBQ71Ks58I3RxQYuGVlGl8N/Q9+9MUS0cx+csP2+Nzy8Cr07dQeiqfhFrmAXw2VmEUDVzeq7mIzKm8EggW9wVUwtrsGiS1JuAr8ZG0/kRaLxNRNPozBav585OtoToOfK6aGqCbP9GFePMgJPanBG6vYBKGa+LKeZ1SEzwswuIqb6scHCN5XBwmU+MZiZWCfXo0Lk6bZtk9vgXA6H9gy0wcKuyW/op64t08QOT4A8PzOX2QPmEFQxlPhG6aP8wmjFW0WMmfqvA6Piu4FyPr24gdLzKiXmi8fOSZWv4+JrTNqCLCWuGWsUX3ovlE2+ZSAiwz6MzhWOhQzwubK3MdQevbVhCKBjruXgn7iREM4XT6cTZW4Ruk3mmsAImr4fYWdFc74R4Hviw6JtlZHKGILN2kzrJP5HIvxD66Q10Z6Y7+ylrx91swXE5P1cPwyvWPCF02/4hkSkcROwfcLHOiJwZWc11G3a8z8w1oTMjT7yG9lYyr9Kz8rmWs8t/DQAAIABJREFUCysfGgCbM9RuxDgN6y019SrYmjloWzCYpum98K7VEGnDQiejFszW39CBASNDvxNAxwmdyzyWLqxBy1J2F7+rZV6b6A0Hsh2n6N+gNWsrqdtX+GDS+x177+65l0NTOVEZqdYvhfv9gWTU64QubrHHlIk3JVTzMcf+oS+JnKc5JfQ4u8KKd8qTmvUw3hAJkFfbZARpNolzJiigWHdJ6gz2xJDRVyeyRRhI5myvDCh6f9Eq4dWqEDpIuVOEzskcyOjd9P6+0TMyryM7roWeQ2vYHlK3tTnV/Bx9Xy+QOU9A6svWlJOa+WNWnUD9q5cJneevqsU9o4r+fXTqQ+x0ulyJ6NR4mmNCJ4nl0bX2Cmzux+t598XG86+lYuiKWzdzB3vLNz1xHGrmca13yFxs2BA6XccI3SYlxXwz2TZSe5rMRfntXkK3574s1jM0cG0uayXj2Ff9+zyYu76q6sxa1/xYUBn1KqHzvI9KFl6WUI2/O1u6PT8GQhtL3UDo8R4YX+ToldhTmb+LdJdfjM7DOTM3oknN2iE4iZnzhvLZ+UL4fnsJXZD5ibCAQlnPMqcwcy2/kAYYXi8hBjUfEOsbAvhgHQC5/d8YuwEw1/X12c9Qs5iNa7oaREa9SOiiASiU+w5mTd1Duyyd6SNdQug9kbgRX0Iz3tbOvtvl4GdX+ksSqrmeGMD15gQZ2iCiP9tH6I4B3MTRQEqPJpib3C6oe9hynE1Sn+crxXqHITvI+xg8ouhluWHZsQ4w6f4Hg+qwKvoOHdwzhG73f/0I6Pt3k2uZXWp0O8dJEnqLfRe91UGdt0TV4/cV5dFPIM440EiHXlHo+4HVbkKnxlypFfvAYP1PBxdQJbqVKab2DnRytoU+nTVz+1EZ8wBa/aCypBMakNcv8Ly1PbLTydEHT/F23ndWjF3Uy5lFDQl99LWeInRWv6MyJxyQyJqbJJk3TJLQW0zcMh/q/dG29N9uhu0DWjU+MLY00FUv3x22Ks15h4i3m9BZXgnVPI/e7W/XZKZXe9Aixi2ViQXQqfS/HPoAY74Cfh0JHGubyQ4WB7BIeDxkq9tSZXCIopOIX2sn2FA8hDvuXO7U//uqclTVfyVGFWxFKj1E6PSaYY5cM7y5h49LOpV6kdDt+Aauqe1+BLD/kvltw7CSf64ok3kOOjlitDS8a972KwmKYUdei9sEY1Yk9lyp6rlOE33bCN3ealcKk22azEpcbiRimhCykJxPYlhURb+fpsIDsYy+E53C8OcYac3EQy4XN1gBwnmHKIdWYd8ICIW4hPKhvEB21E8+8YX+GKTbQQ7/hr/fDOVfh585EejMUgC/8GTCw2s2zMbg1kRaPynIzkWPELrji10zL0/J3UBPfaVHCF0MplXmgZBo+GYnOf72qY1NuxZztkMczbBC7sNdDbpazlq/auNKWQhYYdmNnMxR7RAmSYx7+wikR8kkikZCWeG5rCVqRZ0i9nYROpH34rT+IpDFVhq6MzyNmMm5RKIr0Xv4WyH/84C03xlLm+OLlcLrMRb40an8fpiGk8e/+OhM4aAk8RWvvxsI/ufw/fvpoJss2dvNoZRPL9FFm3VvdPyEVzB5+N5aBvL9ru25MLDckMAm0TXrUyivZFZfDiv7lx944Dv3YG02gE5g8DMMSAHPnw3fu58SEgnt6LVfskWAOcuu9d0F73uH42DGvxbRC4RuG4FqLNZC58i8ehewW3YCPZW92wmd9bVZGt2OOHjZRcKuqvqvoL9/F/rkN+Dv52AYWPjsl9DuN8P/d3JFg84x4e4MCsZxlxCJdEfgqPZBuMObD+iEpYFQiR9r2tA54sHrfiCXi2MZ4wPxdGEpEsxw1noxEhxPo1r+QBbn+22QfgBEs8UOe8kWB50YRPRnuIQuyPzLzPtSWHUhcqHe8ixY9RYui6uFpYeqxT1bLePRmeNegBG7QO43sm3y0GROnf8QhyrfCCrTmGZeR20PgvVb/D7ZvdCMG6H/HcqybzRhkr+hwU0U/ewTJ0AkDnqjCbNkT3r0mtqj0Lc+cchyagSHcghKmt1O6M7OlL6cxclu586brUSI27v2DmDV3ztpVNkwHnidGOHkuz6irXWA0Et8/CRo9MUrIL05Nl54NXNt7Ap0BIXP0OiR+tUkGmKWRo8Ms2xEgVDNh1uQW8+CVOwVqdQzoCFuDGNirGloHpAiS8JWXplQdCOVWv088f1egNpLEsP0KfpFUNadwk5COwdh+ITOz81z+qFxzXyChngMPshou5nM37L+52Q6PyLKGCdSngQHL0KiZEL+Lkzc+H/0FAh538V8OYexQ8K+b+5E62YfciV1IgFYVOOeoDscVDMnFuY3c4tY3A6msnIb/IKs7JshxjIoxyP1rnkyudEAF1nzaVhsfdOZYGwin++uX20jUOj7d7RhvqFzDiNAnMh5LHR2jMSOoYwnUHuMsxDAPCUrYni3V3sX3+sxkTC8oBA9Ob7sFLaz5T0eersIvWLeUfS/glwTNaWAsY3jSUyR2r40gN7dYuzaYphuZe3FhmroIfXj7oQz+K3VYZ5DksQamm2H/gsnvIqXs0Z2JkWcOMVEJznS+M5kT48Gxs1h0O7/yM5iZ9oYJCZ0Qp+yDeGK3w3L+JAZb2EIw91xpfChMieGqUBEQf1p26Fbi/viYiqsfkItUFfhyvm7LcuVPTumGK/ByTkR1OZD4cRlEeJCzcG7mKYWDA8Pk+ej4/k02qBUlIfHb8YJJVtE7eUX4g5A2MFrupnQhbJ9rR1GoFzLRgWChvQ10P7h/+A9n02ohXxcmRjFhXRi6eRB0J/fCM8ehTsF8Yz+YWwX+H07XwDg0VA77FoYqd6N1zeT5NhmYhnuonlJ+GxSmciqzo7b3GrodDdqlvjOyOgfm+ILDHveaeoZcmCK8QBfnChK/rkYojVUuxgWjRPmmq+L/XC+YgAmoKuTIW63k3w0c5YFcvmc4KeaNV5wgomQ63X6OzDWdYKtrEMefELnD4vQGZnDhAIy35HQxHcEkjUGrng8njaOwfwd7TEUDIhtFlX1T7MVdFB5l+J0K+yxxcqa14jyaSpFvsgA7V5YyfuUo16i/UffjhbXvM6tCokvApBI+fUrbrnOAkb8Jc5iNiPE+N5homsJnbUZRmyEMbsrWJvV9iW6aCqS8MIg52txG5eFUvbclmgJHcuYx8J3L4PxuduWX4gKA98Nwi3pwDJtjjYSOiFzHDvTsbRexPc4Cpo/iPMMnrOHpzzgIo9437wqFKl2I5xrasU03bIMp6G5L13I84lRJT/B3xVmxxXPGqPjhRi86+52bd/xiS0MQrfPzjXrjJCiFZXIln3WfHo0o+cwb64thg0M7ymQxafDGGxOjGXjdFE+XuWY1Iox8TzUVzm4dq4YG4IGSHHa1/j5kuUnc0OfW6Np/aQpRt74TDvjAXQtods+A6xLQt0NFHYC0d4DNd98pKKc9vGILXsWAIbPI1VtQss5PnEYau3sKCY8bV3hDk+K29EwFd/FidBrinjvn+0jdL4wYTHI2YI2hJ2mqQXlMlXeYLH/+5CMtNnOiPlAYrl/p01dDXvgZ83vhTbAFG7BXHwsOq6nMX9GMO0Q3gAnL9zChPfeyS3hQ+mwFSQRCqETGaiquie6t6QkErSs9GwoptHVfio11e4YwAO8/lCH4Nvv/OxaNW+BSc0zmYruiWvbys9gN3Fx9cjibOGV5AU+25jLZlQzRkBD34hhHA/MvZMZBQU3ePOCbiR0e0dF1dNhkgq/MYM2NaCVf/zgfH4Re6Hfo6bqXcBIXCmcgB7siDFvSOe6jsMTcyqIXL3UB/8Jm9AFy/GzMP+wY49zeYwq5iHoYyLwkRr7Lt1671wY7E7CbmiYTO8K02k/bsGMqhNk67cDBGN3psXj5jDU4xHa+KH5QQ+N0G2tUjGyJJJaYKtsNqhU64di/u0H3zpd9VIYbHcyg7QA8qZb3kmVLgC91MO2Q4CFHOQRePvW2SkwP4X5koViwK3DVCr/bPbfgc61TXcSuu3ngnj0C88Gg9glaOZdsfSJSfKWEG4JCLDzQlfY8L7fh3U9krglpc6ctuJtEva+tig9+E+4hE7LDr9vEY6o2nZ05NwECthn7KMOass1r87RbXLJmseGdXZuT4qK+T7MO+xVWyPwd0VVQ2cTUNcSOl7VCqGDCne5Ta8Wr6FBcOryjqATNA3cggYr1ufFvBuD1hXv40Iej4a1gsdQnWiXwV4yEOCoaOD/t/clYJIVVbpZUAU9OszgMi6ooKNPfS2i2HZ35c3MSirvktVNs1uVd6nqQsRWZ/Q5IDg6PqmHooMO6ucowyCMo+JzYdQRt2EUceExOu4jI9p0Awo0TTeLIHTTW2W+c2K5NzK7lsyMuJm3qs//fdFVXVUZN+JE3PjjnDhxTq7HRC6RNUJX/R2gzn2qvHXWGk7m0c+L9pksjLCGb86CkPNx5crxI+DZnzLtFArrweuw/pTminFCl9aFkjd5gSof45CWQG/iZYUkDXb3m3bMaIiOcU7w6lTb3Q/EL70XXm5i18nvPrNrIV/BevthzpADBG240uAZnSlCZy8WXr1D87KuuV2+VIVqeLHa9x5CRPoa/2Mg4l/r9CdJShL+RNmUtOW9u2rTpiGYw3ew+8z6m1KeQAY3uLZ/7Vpn6n8297U8uBTMdFkj9ETTii4zs9bIK4bhb9QzaJMybIU8b8fvYR34vInYEUncg+j/pdh004TOg9t4wQMFZ/xY/ohU73TLXA03656lS093mfFxORF6EnbRDX9mwJmMazduuLsoruP0aeHjd5PL0bNhkd+ubwpO+qZN6E27zfjevNaZL4zdgyWv1m7EKONQiOPtZT3i4I59XvD4Wif4H6q8FgG/wugF3zAY3bCuxJvfnXf8L1huzYvPZpW+m75uZgoZI3Qmn5Vs4xdu1d94+dy5yYvuR6e1LtvULdicPOEE94klL/qugTknrUL1ghMNY90prJtGCT22wnrhv6TU3iYoZvdLdZ2IpSUQ5HCJWvcyQJLUAklYN257rC2Cto/19lNQSUjJ6CIj5y6GCF2xHrxWNyuYfKlKXngN1olaak547va4iGOOieORjHUC5MTaSjWaUOXVnkyjd5g72+RjLqOKlUW8acv1b7Wc8F2Y4vbgtqnxFPpP8FkidKUt6xS/ER1/C379yKmFWG+vtazYd8OuvRDWu52cILtXGmLnuGp0qSovgzBO6Hzz7r8+pfY2IX7HMRiZoaM9+HpZL9reMyQvmX+GYirtWlvkX8O9qH2yB/TXLMlNNM7UsbBZedDU2aouoScyD67Q3mkK8jOZV1wDQt7B93Q0FmkOw+twWF87C7Uch5GxaHVB3+ox59jHgUqqkzIRy6xlA7m7/keKXnA6OkvlWkg8CZTRH3LPIqHD+H6ovF5zQY6dQMNPd9MWU2janOuagcVxE3z/026z6y0Ck4Qu13po99Qrsd5eaegYfU73eiondOb4+g9q3UsesUOTF7ytvP5srWhNSdzw8Nui+r5rKPG1Ki/8rO6urmDuDJ2h6Abf0VwE5BWrR9fatZPQyoJx8PNe8OJ+lELVfwmeY0K7PqZDHnyxZlng/lWMYtsmd/wKGs7NmCkupVjcIpQoe0/qaDYeWT9dF86kj0Cbv1uw/fdg0Bjr1FOPap2Lvdbcs0ToAochYZX0xkc4gYYPoXbMau2/4nAYbC6+r5n/QpLT/mIlWplCvwwSeuzdfh/m2lDrTw3xbZbxlTCP9+hYk2NCd/zlRejKC39VWTNmrjQZAdmdp9bdTyRm9yAydc6lSejCZ2F6BbTlrpKBzGqiT7uBZB7vd2HtcPw9Ov0pSE3FCW7pZqxLbni28dDF88wHSe4yVzpPo7pRJpW4C/pwDfRnYtgbf7I6/q33m9NCZghdOpFVx1+Ec0TvSCY+1vtAx+1IAUkAoXCD7q2aRClKxfvaGKFLawLM/V8ZbN8ikHEdJl8A79UuHYvrsiX0XOw5GNygqy2yryx8p78W68yEF7Aa59vFs92g60lQMELo3GENHdiMxB2PS5ixotMXHj0L5uK9HUZy4t7uqzYNcS09tdS/884PmcyDm+ajOOc8/P9+KJ+17OAsyzon1tz5/Fn+keISc2l4pv46w+bY7pH1NXHzIAPrTE46Fgc/0rn6Gx83peODZJDQ+cYDvv8+r7oXY0CE3jZwp6VnBhOLsNvxIpw24gxy0LZfaXrxaxN67EjjhasUzdzEWe9cuZ37WbT6Io8SRjrzdE80wUqtBGO911B7uio8TXCwX0YwgwWkLsjsroIXfDD2M8nFC4rx9yUrhJ6cNQfv1jn6Us7Ov85rzgaZJx7Ywfk6ls6YKJ3geyk00yyh8zDN17Gae6K8EaEvhtj8CwK6W8f8K4M7wCL2E7XuLCC5Mxp8U3NR0yb0+MWvho7yQvWFcDJcRGYyZsZe1amcFW3wLYrHez9lzMY4JvcqI3c8A94HGvsXV4/6L4nbbXhhzAqhK46gn9MmPN6PN3TahlQhw/xieFKtwCc8UiJ8fw/GqRC1m1pLzRO643+Bd58IPQtgA2zjADvBDnHtomtCFzu2L/Oqs7FzRijekf+cGUL3gtNNZrRbhoUtbEUnKKtyaxdK4I+PcI/5OCpZvwsLWCMIbVYQ++N5t/Z/4jStBhfHjBB6TEigWd+kYXKPncYK3uTL1HHOAHgfQSYFL7hFwxLIrVOO/1hZ5hIwt5YSocv2L09C5+e5lZM3Psty/d/rCkgQ+qewzgy9aOp1mcv0g57wha1bQo9Nj27g98hxa4kWTh75DmK6zwFO6o5/5UniemDGNlB1TuzhAbbpcILvy+BAphaYLBE65u2GerZ0HUkwTt6DmfCS2Pgm5GQCiiXw/450b4WI19+RapDH+gySDRG6bP9yJvThk8cFoWsMsIy84wR/j3VmSUBJUoXgvVkh9DwR+iLFCKGz60Rs7G3/UhGOeFZeOet/H9V55e/jEenCOwqqCV4TWSL0cnn6aKhnW7HLoz3lfFmER82O0oBIAp9EF+ldAZbhbHkKZCJ0CSL0RcAJvTwWPduEhi5iGl+JdWZJQEToS7EYIXREnBQl79SmCl74sJS7jADX/77Kd8jfL+I43JMvTxzfzfxqRTYIfUZaSo6BenZ3u87E5+egAZuQjWkoSYq0ZM2vhGEOgfA0rI8IXYIIfTGwAebpAP2HDHk9fgbrzNLLlhB67aP9PkOXL71l12ospzIR+jyFX/syQOiImNStsdrzYa5/BRdMHnbXj8+z+9/npsxhWzEPAW9+9+9SlggdjxOUI4+uCR2+/1hnz+8Nko2jH2hdXZOe/FAP1mfwLjoRumz/cib0NWPRn8Dku7dbU1g8wNzZJTNR4iSUoP7X9pvQFWvBeiUIRWa0xIwUKY96fixa3Y2cF5C9iLtQW2e5tZtgUZvlYVyjhrxDXujzzQOW2pEnvbhBNwTociT0YgatgIh4ndEldGHtzDvhFNZHhC5BhN4WcDBAQHdopfF05MsebO5zGMa5wC0RbvADI8FzTBB6pVbSjUe8jAvPIOcEj1nV6EU5LmhDcyoJ5IJjYdlBHp73MVh8d44wrX1jnb/w/n4+T3QTiHRXZICRohP8jTpvOkWWCL2MmQ9dv+sc6MmVNf+TOjJJC7HJ3Q42auUyiIO2aIXYnQtE6Or7tUwJnWssXvjDkoG44iDoRzCmOK86E8QuHHKCp0Ib79GxQhQMELokJhb7HOMRa4TAXL6FBymC77fj4qOOoymIFzgeOwzNWgSNCM3xLKANRngDchdXiGZlYpYejpWMV/7IiNN9RLRsEDofO5Qx1HNft0SiRCe7gYsjE+tLjJjQHcyLoZF0SShHaMXD+ojQJYjQ24CIXOYGX9R94ZPMX1EWMn8xyIlW8iYtHjin79nW+AbjtOmjYVI+qJvCUH3B2LWsZVBALnuFXH5peDocBCWXeTw2a8pnPBvkeS6M85eh3F+S8dl5Jqw4QEza2jtfNNlxQNcm5iwRunXqOUdBPXd2G8BKyUZ2a0rZyLSQmNzDKzVT+LI875YXjqr1GgARumz/ciV0JWTh3+mn8uT5cYte8FG17n4iCeQSXWTAq9wYoWO7kLC0jjmUwpOCTC+LMjI2faByyrnwdSMPUtQbTWyAkUTLs/Lu5NPyXnA6yPgKyw5ugbm9T2jvGH40bW95bvXywgfk/XR5M6VdZInQ2dFeHOu8u8AyYhHvPCRwD4FHewb6uDuFPhKhy/YvV0JPrloEr+PXzjRe+PgcPdyKjnbiEf3cQSfk6eklTZAvm1zYtNKnygAUTvAlE5sMEUP/M3k7/N95278E6nv3Ui4F278YyPPvoD8bhMB6vWjPSe4rV44fgWktYTF5I7TzqyDzh/GmAr/fLoPEmA1cEzuCeeEmbEO3Ocj7Hfo1TmPsBteZSK0L2mutG3mkB3GUNhoeB+18RINsmHaOkTtTWEOJ0Jc7oZtMGs8HWpjdvSBS6+9r3zzfNWBuVz6vR+hJAApMVKFvFRGOQu9S+0wwhoEWs3wM1N5hLkzDGHwD3p3d3Fs+rJu8BhcTuht8EZ/ZrRNmvwk9nvNVjNbYveKQyCPMlGOckqNhSv8O+iSsn3FODJMgQl/uhJ4Tg4wZ0gpeuF0nnnsyIfEe7eQP+n3OFWsF1eCr/M6x9p1vI4SeXF2LTtU2uctwmF50m9jRH7Zq1aohlP1SLznFaS0VwNh1mOVsABcV3rZ43Pn5cDV6Ecz9v4U5dq+4Kz1rJsxs7CD42/L4X3Qc7jQrhJ6EX9bOVc802KIX7IBN+jM7lUeKkBaIr2oRugzQlc6GhQj9ECB0BCd1L/y6iehlTEtXzIQG71G2DSW70ykG73ubMbmLiYkx9KE+rQh9sbxxE+VEgdp3wrwYaJFRt4QwIOb2QE7dGNu1d8KYPsasQvqkLuZFeGDEmeLe7t1knsuIyT0/5p+ozPWuyYQvxsGbO21HKoj7NrEaxl0j05rs2zRaZM7HOg2vnUTosv3LmdCTXMXhX4/onqPzF19cuYnuWyscO3ocOU5M3NOfUnSjX2vmQJ9jcdUl9KSNRTf8lubdeG4VYUkrwh/BxDxCrb8fmEk036xhQE1RurZaey7I7uq1Ff8E/mudOSr7HIc5fSW8Aywlsf7c8+s4viNuuA7r7i5taX8JPSfm4wmu+0Roy2b9mBcROgtuLpdPO1qtvy+QlkAv+qyJwFVs7XT9tbxqo+smEfqhQOixadqbfFkhOfvT0mblndGiF3xPyevbE29l+YLBLvdzhuOlGyN0JXrdeWasIvJsMUpjZ98BVHlkh9hVssUkIUCyMyD7B+1Tzm1YXvRe/nMjMhuQaVBLbuQdPHe6f5cst3Z2p+3MEKErPi3BNfpXZGUYWP/iTmViEqqfjvYV1MSpeAtmphOPMLlRIUKX7V/OhJ5T8xV7oW40NUVoPk+p6oTX8NobAyl7LA8oZ3WXaqQwnK+Y09DF5zBoCDpU6S76BSUQiWxbrydpcmOi9hpMhCJ/3uE5tVGo1gJsX8H2pzEqIs+RHh7AwD4gs22ry9PPEB8x0s7ET8LXyf+tLD7T6Cj1JtmPTtuRJUJHh1lTV0iBlHYPV4I13bTHAETQqvE/hjn0U11LYHyU4IVXpdQfIvSmd2r5ErripRmcb1KrjeNSu8Gn8NqP+izT7U/yEft/q5lVbcFFxJDJHZH4LhjYRMWmdy+8ZXV5/BlSLtrCbaMfUisdrkycUhqb3MfTXPr/LuWUSzZbvSL2puflR/1Kwan9kAWIqUZ1IetZxYv8Mvy7cnnGiKaXJOoIrtGdi0pq4jfyNi5NQs9JQlk//Qxoz06+IOs54HIrYPSzl8Wm954d7cXKA/TjH7Wv/LqJhzvUx65rEqG3ggi9A/CAFQVn6lgQ1AO6jlqtwhOevzcOV8afhc+Z7ypQp8CJJBc4NFMBmX8qBc1cFqOEHi+21WhiRP+OfPKijTFZ/3RV6QzmBaw4bqWARP7WaLC+WI0eY+FS41Sg0V7o1+VlscHogRleLLR8Pq+pRCuhLV9kZ9By09QsZ3luOVuo1NgZNd4S0G1EQqS+tqPpctHQETPxcVj4ybKB91S5p/8VoTCkbQVEDMRz3gneYcaiGZvbN1vWqUfJ55huN/5DhH5IELoaVW3SyI6zVYB4dQxzPQ87/oTyWDWIR+wtvACUq0ON+O/zoxMjBS/4ZUqaedPib1pDL5enV8DLdYupqHGSTOH7LWuFc02r05YBNF35ylf8v0TyZvewRR+kFjzCtcsdlu2/6QVjbzqSfVpxTjMFNT47uyPu1D5Y8MLdnMjCA/POC8dnwXmg3IfObPh5zWtznLTGXv1nsEBvE1dB9c7QWZax4NVK2zqRSWYIXbFcVJXbJ9rzXXi9fy5NKyBHsiG13Nr5PBStfghg6d1eqIaXpNh+IvR4zixM6I1ybrCtMtMTv7AuEZusw5fDQvh4M4npF5wEmK5SRGz7llWZGJ1jIgzMdy95rkkDC/fxsHBfU6xO7hcJDdLML26a0JNzxWr4eqNHHZhXG83v1ejxgu2/Z6w56hSTcYcEPyDvbc8km69cuVp7Lr7UuFkrzH33mpm3oR2zon+/KHr+WEv/tWWYnJNPrwBN+81AYPexjYQwqy82j+VxRcGLduadiarss1J3G9oS32gmt0aCd5sZU+Hl7kx1nKwja4SeyLExUHSjm41ZpmIrYHg9JmLCJ7TEC9BF01VHeKcu4Y6K6IehvSmpgzKCys6j5rMLNvcB/yFCP0Q0dERsEvOiK0c0o5jNtyhIr108y4T//8iygwvRw37Vhk1PWKx9uAPHGMd5O9wE9Xyz6Ib7hFZuKJDHIi+e7IMhQs/JTFTDw39kwrGm+aVj9cwKH4a7oLxzjTv5vPnGXZJXa8nNQWZ4HTHv+B+ANj+cEMUCC5vIWAb9Y+RUsGvXYRhV8XQjZngkGujzr3g+gWh20TbNIS/4HGquXunmAAAa5ElEQVTrmFntcss55xh1jHIKwatlrjkAz327Ep3QQEKgoD7ihC8Vg7Xk7qHP1SbMbmfKAbfgJqReRMuUXTtJHbPuib3ZspUfPfM4y/WvV471jCRWEtHv/ok9MT1yJEJX5koroTeEfLa7uSduqQy+cevo4IVb7MHz4fu3tJbb7cHz4OvfbKkMvQI/0+jNDa5uILT00drzYcCNnqW3TogCmmNFJqsC0+T8O+Dn/1bg+anfBV/fCf+/CK8YwdePwv+vgwG4BXMqywQZBVfG0O5JWss0CF1ZdKMzDMSbP6jNKB8gqXqZa6y7oP3XF5zaBaXRmgXPOqYNE+5AsRg+acT2T4TPvRHqwzF6PA512sGCbIlkJvzcM9oNm4L3xylSZ5Jc5Z1gZGxiteXUvsk3iZOiPd3JkMs+PMA3ieFDUM9VUN/6MvOCn79teO6OaYPxahnM0f/kRx6hCaLikdHcYJvjbPpTOR7tyiaLhC7bfxxaU4xvYmPL1H7YNF4hfXZyB1mm4uO9g0rsl6NYolDZsGz/PNCkH0AfFYNrTp3dtHDDXUUZD4EIfR6kS+gzgpS3OSuO3VEd+sOD64YaO8aG6jvHhhqtBX6+f+8pQ43t1cEL8TNofk+//11Cufr1Vt1Y4+1MDDwDw4FBjQZNtyzjliBsWeTPhNbTSFJY9jSXeCqEziHTvIafTUPmzIKBxO6Bpje2MZGl7T8ILwdukr5bdP1rLS+4Gv7un3jxPw4L7Vfh8z+Cv7m74EXsJRZOdzobqdjLnF8fC+6G57y2w7vEbHEqlc54JizgO8vrN4o5YSaAED8eCusjMm2q4z8IP/spz5cOckH5MFn5n0RLEZdhsKvM5BMTlDHtDRb9f+PdXpLZ1uZtFxDZeGnMHKFzmXHLlJAbzu8Px9aN9sEtZ5WNz4KxPh/G+TZu+QlnTVkUWFvx/B/egZIb/r2uTNvtExH6woS+xVvxnK3O0ENQ6lD2Qdk/R3l8e3Wogdo6fibThJ6Tu1LUOrxI+x5tu4uoNMdLsm4qMld2yjmoF28jX9jMEzqXeaEwfizIfFvRSISxufuQ5B1HE3PYQKtA6wZKLSw2vzAfJ+NgZAxmcUFDM7ewtvy4EJtKF5ercjx0taI1mZdVG3IqcSdENZ2qkTbEzlJe9Dbsa6cBVLJK6AJ8U+ZGWvHPFxo73JTxUKrh3rzj/0eRW/vWY5RAjFqXi83pqJVPr1i9fvwZVrVWyju1N1tu7WvwjjzCrEl41dFg0h0hTxGXPtrWYklIC0Tosv0LEPrtoKEDYf/hThcIm5N6Y46yHzX1zfYS0NAZZHxi2z8RBv7RAr8z2i8izUpJk9ATD2DXfxXX8npigWC+BwdtoFpKqhsp9nx/z+iG1wBxTb1FlcUik5QTul17Ibzcvy966hiZLovJKBX5yDjue8ru5PHqe9npnMokocs1xp04HgMioek5hTWGEztaAPF4D7Rhnm7YR6ffe2Du/Ry+/hjG7yeWF9wBf/soEoW0CPIrmMYsP03FEqlg5e2FHjhmEaHL9h9yhJ5Tr7GFm0w6gSzhkiqhN8ncDS/l5mh/Xwb6nWrhEQWZFvWF7udodNHI+nSPh3ouF+lrUI2+wXvbmbldlU8mCT3XdLx3HnfC9dMav7o83rOcONcEO06JC7vlEMZzUh4LFdLwIRJRNKENXxSi6EXAJSL0WP6HIKEjlBfuI+K8c9kTzEKLAv+aHqHnFOccmLDXltenusj1vWDfeLrd8Na8e8bTuAg6Ii6e9OME94nMwao3x0O9KXHkP37NT+fed1YJXR1DGL/ruOKQ+nwXNw/8epMVimnhRrIyLjznRXIZ2Kjd9Uqv9hwugp5EuCNCl+0/VAk9p3iHYjSmcrq76FRfYgNms14QupQ5jxHtRjei5pJ3lqTMF1kUeK7vkhftLIxOvKxrecrkQk40DIvU40Be9aV+PKTcBPiyOic6xVIidMvyjyl40W09iCfRx8I3DDDv91luzTMsx7bkTIR+aBN6Lg6jOTb2J7Aw3CwEsdQ09VkxgXVKrwg9rvflxfE/g4n7Y361b8nJfMEFgZk9q5OPYpx17KsJr2mMd770j4e4Ex4s+g+vqYyvFBNCK6tfxgk9sQSWz3ol9hvf1R7Eleh1qcu78nnX/0vTMmwDROiy/Yc2oTcTDCwO/5nyeZfRlwi/lrzJXTCImzXv1feM0NW6MfJV0Q2+o5ypL1GiSl4mbnIMH7NGuZaSM3ke6wQfPmnpHg/V48XS9s9R+6Ujk6wTulpf3gtOL3nhPjWM8DIojMzZO+wE70tDfm2ACF22/1AndIQctGFv/MlAMDeWEyekrBIMe4lOOvlsbOeFGKSGtbn7Ra2nhK7Wv2HDpifgPXHhx5CK121vxkMmbQl3WJVaCftmMJf1QK4hkgy5/lVLYH42F8evx5nVXN9ITO+lROgIORfW2rUaCw7jLgtSj8kcA2Rh/9TwyT0EEbpsPxE6R0zqw+N/BIL5DJ+kCyS+6F+ZVXbELGiDgbSqPSd0IfX45S/YExfz8KmYAtRfOmTFZMbHo+gFP5cxq1NKESlIPbiCk3qIcsra/GxeYJhjVniAzVfbf48p2Sw1QlfrteyJs4B09vCYDNkev/nHFTYjXijS39Y+iP3qE5nnckToSfuJ0JtwmCho3rwIyIW96FnRhvjLH4pkILV3y0bDy7VECZ0hTg5hjU6sL7rB77iDYiY3U00yk6FnWYQ5p3bNGpEoJkWT44AcFz4/J9XAIH2fn3PJh3uzR7OY10CRjfaivxQJHZGkJ4W57kUP8EQoS2kDGyejqo9Uoe2V2juwP30k81yOCD1pPxH6QYgJpmhPODDAd3BTYR8JxuFaIL8GFe2Cl+hsbN/KcZ5SEdr13iVM6EzmcqHDc3XYoFxdAhIQoVil3LOy4MWRtUQM+e1Fxw9EP+INYZqyismsMnEKvPzbeErgMCtyElH3wgNCPncWKr6L7U3D2WypETpCznUMPANa7i0yJPISMMEnR0vV6GHLrtUUefWLzHM5IvSk/UTocyJeNMvl6aNBOJcDwewTd0lne6gRiRCi4azI4/5DeQ1KTWe5DAidQc3wBRO7aNn+d0vVqQZPYSrknk7kssXl4yTjjmNRwgQstv+RtRX/6bLtud4tavEGqALPzzvBJ0osjetUr+dny1zlIYxF0BhswxXFk8MnpSGfpUzo6jPQqgNE/sk4k142rS3CSsk3aRj7vyhuKRj0E9EBEboyTkTo8wAHUw5o3o5WY7IKPOdNsqH5aSRSqcuY72jWYmePXrAj7/hvecHY2JHYFrkYKCFVLxGBR/bImOSdFHjmPtGPvZLQU8yMtBjU/MwDGJ8aib3oTR7gWdCihoyBnzK510X9+2TADBE7exeMxaeH46QYKKf+5BzmcuLOcvnRcATaeyPmZ+dXAUVoz4Qg0pCT0Mb9/QUWW5yREloKvoF355l0ZsykkJ277+g57p+jM/eFfPbivEIvdLXutKGOX8Ge2AhjtpMTpt9WrvtelDiLILcO7oU59v4NGzY8oZdyagM84Yz3midDm+/joXbhve1mPsA8YvPJDT7Pau4hoVtjtecDoT8ixr279rvB4+J9YE6KROgHo5lgvHAUXrh/BcHvYZra2GSd74x8OSEOKESz0AvJg4Q4zYlbcHcGG4Y61zr8ewu2f8nq9ZjiMscnlzLBZLtGxqbfa5/y2gZ8ZaTXRWFa58jYRswS1jcNXUWLRjew1vXXgjz+EWS0XaSm5fnHW2RvJbnC2yUxEVlLGQcRZhXrR9lwPwr/dlgo3oM561va2O98wSphDgw7QRnaei3Mq8d4gpWpOtdYuObePEfbih52UPQxuclR5yr87A9Q92fyXs2SDUvTaiH7XBqbfk3llHN15n6jDPN+9ORzcP73TENXkPiQOP4xeNyEmyJx3NQvjT0ea67AsNTHNw1XgjXYTlXRyQhiDX1k3fQDJ61/NVsfupkLOI/4fJrqnYY+k2joMO67Tlp/drwmd9z+ddP7GResmyYNfSG0TuK1sLDn3RrmNf8ZkPteLlCekpJnGgobCyUHKbB80CFL9ckJarrBs7/5mMzh68N2sLFcPu1o8biBeRZHkQoxWGO5tQstb+JNoK3/r66KU3sz5gTHq3tq3f2GaoZHrHLG/xRNowWb5ZbfjNoVT0O7kcmvRf71+eSvJB7hsa+BtNV0tlgv/P7XuNMdtv0xvP0wX5uygNb5WR6Lng19eB1qy9CPh3BhRmvPiJRTlctIXbznk5EaH1zKSOS3fxjm/r/n7eAvlKxavVrweRS20ehFsIm4wPL8ruc+fhY2QeflR8Pj1Lp7CdWprIibV7t2fZEdo2zEOOz1FBPlqEVaBmZhjtRFIKP/xrNyOZ4ZOC+fFytXjh9hORPnFjz/r7qdD+xzOJ9EtLtcD2PRYwRNGOPX41rc7VwueLU3Mi4QV2exbiL0BTDHYj6A50nwIpwL5Wogmh/DC3EPZtmSJHFQ4feVGXmj0x2U7xSc8AOWHZy1ujz+jNbn5TL6AvUSKIdWzQnP7wqj/ktgMZ4E2V1m2eH1sADdCnLdiaYzJKGRhVKDihsM8Pn7MTgPjNsN8PVD+dHaFNY73mJKH49TUmYXTE65XIucgqfiAgXk+zauvQc/s/gc3bWgjNg8ZeFK0dS6A+Rza94NrsNUnUW7tkH6D6jPNhFI59BF8/FE0Q0LllP7F9jg72a5xavMGhgfyWlmCqxLAk9S6YpjJZYb3b857/iBPObLoFZOaBNE6O1ggbPB1atPf8qaSrQSSCZftMMNQNZn4suRr0Svwu/Rez5vT6yG3/25604+sfXzjUZDOj21S+SHSSc53dLBM/sFJpv5ZI+/K1XPeOaasWglajogYwc3SgU3OsPygijvhuPs/5XaupJXs4bXhS9F7XJc3BhoxVwbiaWBBefQAAuitK72wpIXrMH5iPMSZQTawRQQyTj/f20dbG6sQtV/CW4053GAEs/pPGOaIQxkY+5j/00USZ65JmsgXlMEkv2ldEwT8fDjc26MtKgeO81Zmv0GuIVQpF4tsTvx/l0w5lfge6GQ90Dz/DfTx7Rgai70a/Min79p1aqhN4294Mhuy6ZVuaFrx3OHY/mOIOVfV498bruEvrUy+Fb8zG1juSNlPbqlMdP348n2gIOvkEwXE5ZvDlQnGUJbGEDZxbLXvQsrNml8ce/rvVrTGIj7xWTU9RwbkDKiuZo+WjeTeE3Vcsdfbrn+W/FYjvnYoHkcj0GAlNmRClpb5ill+XdcC0cCfwjquglDtuZdv2JZ5xylPD6+SUFY2miIdWyLt+I57RL6FmfwAvbZQ0ZDXxhNC99cZSZZWGlRNAuuBSwifxoHHk52pg05HcIyagszsPnD4we0YnRbVpXOeOZq+/SnzFl/Yg1skr916qlHlSoTryg4tbBgB+8seP7lQPBfA23820U3+L4soJF/BzT46wuO/88YkAqPB/OjEyOrNgRPbX3WQv4heMZ7ouUf020fUUbo+HeC6x5klSRwSPL93cm5J212B0e2eIPWVnewoFNudwaLt3uDazY7h5+5xR7adccChA6/P7C9yr7/6O3O0EvvgDboPh/7gH25vTJ0Qr/lSyAQCPNAeCdXxp8FRLUDyoPcH8N/oJOSR58P13887wTfVOudA7FFyqAvx8Bi1kWpqcOm4O0izsF9nfaRFS6jPcUeXw9cSpDm8d96R5z18Pqhxu+8of1QGibKb705NfI5C2rxxp7rDs3uXId1Dv5Xv+VLIBAI80AS+sZnFd1wr7hdUee3Atov0mxe8MJOF7z4KCUh5diS0lIaA9Li0kLgi1pd4iuCbvgPmBAKY7h32kdWWD/ZDYuT1XoJCSSh324fcRaSIJDrPtSmTZV2Cd3kM1Hrv7uK2v/gL/otXwKBQJgP/LrRadNHAylvE05qMiBMJ+UAc0pzg9/JyHq5TB1viOiNbvgFcZVtfxd9FP1ktybWY31E6AdDJfT7OaHvb5eEs1qA0Ge3cUInDZ1AIGQWyf1h178dSVlcJevmChkLkITx3VnN2bkiFm8sQMP+BSfk7vvInPGqEbsjTYR+MIjQCQQCoT+IyQ601//ggaG6iykfh1d1/VdhfdkhO5lbYerYguM/ohFnnB1FYATDkjv5PLVuQgIidAKBQOgTlCQxXygn5uiuCL3Mz9EvV+vtN+L+VafOFJEsu80IVy8yC0ZwL1o0RPUZOlbIBojQCQQCoU+IPcC96H1aGQ8dmfEt+M2qDZueIKrvO+EpG5aP6/SPJThiFojgB/3uU5ZBhE4gEAh9Qkx4Ti00kMaVJQLKkBc421BAe54JhL5dJvnpitAxrSfLHBlehXVmoG+ZBHm5EwgEQp8gg7CMrAtfWnBjMtfKxV30wutE7VnIeAiblfACLetDU98m34B1UhS6uaES+g4M8GIP7UUN11TpiNDNPXf/XXgH3h78eb/lSyAQCAuBabGYxKTohv+t4QUuNwIs3S2GYsV6+6jJsn6tKgdPhQ3GncKDXycRDJrb61DPK7BeSvQyNySh3+0dcdaj64ca93hD+6E0TJS72wwsA2SOwWCMPJM91x2afXDdUOMuCixDIBCyjuSc2b9KX5MVZ81edNPKlStlwqCen6VLDbrohO/XPUqwpH+AF95aLk+v6FeflgJk6Netbu5pt9mHb9jiHF7dYh8+plO2Vg5ft9k+3NniHDYFZL17odCvW+2hA/dy8/jVW0/CsLGHn6z7fOwDr2cw32/5EggEwoKQhF50o1cpV9e6zlsem6ed4B1Yb6/N07Gjn107CbTzfTrHCLI/mBAmax78hwooOQuBQCC0D7ZgrranngIEuE3HeazZ9B7uyzs+c5Arl2d6s7AKsl1TPuPZ0I+tmkcIonBnv4I36fJHEKEvBiThBqYcNVEEKd/ZRfrU+ljuSGPtWCrpUwkEwqGNWEv3witHQBvt9j56XIBEeWz46P687Z+Idaetqcs+WNapRxXc8GaMu67ntR/E1/GgH78kc3t/MJPjRHq7s+LYdgl9sz14IX6GNHQCgXDIISZ0JyiLACoyfnnXZIiacZGRYXjPcGV8DdYvSN20phPnPh/2xp9sudG3+Lm5r0fmirkdCP0dqpwIvQMROoFAIHQJIOBv64SBPZjUWRa3P+QrPCxsbp786N1AZmDD79dUxleCZv5fpshcHBs0im740Npq7bn8ieTd3msQoRMIBEKHUJ3jSmMmzp4VUvdCvPJVt1z/I+Xy9NH8iTwlaheJXAZaNP2BYcd/PWwcHhZn5ibInB07jHDt/KOqfAi9BRE6gUAgdA6mMSNx4Rl0yZCWzotft5zwgLgWdwf8f3psbOxI9eFNuc6R5EVR86DnWrT6YScoQ13fHRljAW1mTW1CUDsv8Dzoj1jV6EX8aaSd9wNE6AQCgdAFpBaar/onM89ucwTJSBI3CCUvqqPDWt7xf5N3wr+2RseRMNsxv7O/WXuK/3TcEMDnbwStf9bEVbuDtXN/P7+qFr1PlQuh9yBCJxAIhC4ho6AB8X5WP7773CZ4RuywYWAZ2txgDxD0jyyn9uGC558Dxc27k8cX7akX5r3pF+fdcARjzcPfXAJ/8034/O+xXYzI3WDWdPsUz/atGGlOiIU82/sEInQCgUDoGpzQrdHa80FD3clziHcdNnVB4uTX4/B8faqByU+QqEtek5c9c0xD8ma/h69oCkcSF1frjLeLbTZYZrVwHOVA2nl/QYROIBAIGojvdDvBuWlo6XOZ4pGg+XMOMvO3/N48icdkLkztlhd+AvtPMdv7DyJ0AoFA0IQkM9CgP81IDsguRVJvIvB5SqrPlccAxWr0azK1ZwdE6AQCgaAPRmYYrKXoRT83dTc9i8Vy8EghRHP/7vxozcJ+k6k9GyBCJxAIBBMQWnqxMr4SNNcdGM51GZJ63XLDA3j3Pu/Upli/icwzAyJ0AoFAMASpqeKd76I3+ciyInWmmWMAmY14pPBWtb+EbIAInUAgEAxCxkpfW6mtK1Wj3UXhad53QtYqft3ywv0iVOwM9o/IPHsgQicQCATDkKSeH/UroKX/noVZ7Z2jnNHCNyPhAYwwB8T+duyXqfjyBLMgQicQCIQUkJD6WRZmUROEuK/QAy90Y2TuBvuL1ahe9CYPWM7467E/RObZBRE6gUAgpIQ4u5k7/jzQdH+IAV/YPXGzYWLTMbGL83LQzu/NOxNVtT+EbKIhNlpbvBXPASL/PRI3fN2/xR460Fq22kN7tlfh95XBt7DPEqETCATCwpB31Mvl6RWWHXyoVJ2sYxEm+Kxp67xdXjgr7tPfkB8Nj+PtL9OCn3FIDX0baOj3VYf+8MC6ocZ9Y0P1HaCJtxb4+f49pww1tldJQycQCIT2keQ1z+Xt2gYgzjt5bPbwQFaInZ2VQ2FauRc+atm1C2ONnDTzJQGpof/u5NyTtrqDH9viDn5mizN4DZRPt5bb7MFPwdcvbbEPH8PPXDueozEmEAiENjEgCbJ82mlHF23/0qIX7uZm7WA2rXjri2rk4ggAY7KLHOlfyXvBi7GdrL2NBp2XEwgEAoFwEGT+cgASZ8GpXQOa+h40cQPB11uSqaRB8E3PYEleqixQzE2YvU20coDOy5c2GqBxt1Ua5OBIIBAIOmgizLw7cTxoxlcCwT7A051urBeVTGnCia5bcq9jEhdWDyfxBk/HijnMwz3w/69Zbs2TZnU886dEKwQCgUAgdIBW8lxb8Z9uObU3AAHfCES7e2TdFCPeUjVq8NSsQV0SMzeVz1Piv/Fn8XNF+DxuFMqxed//Zd71L15TiVYqrTmMtHICgUAgEDQwM3MQmQ6U3MnnFTz/HMsLPgHk/KuC4+9CYsarb6ygJs+0+amkiJ/h7/BvMOY6v/vu/7ZgB9eBRn5B3vZPXDk+fsQCzyYQCAQCgaCHxgBeD2u0OKIh4Rbt8M+L9oQDGvbrCrZ/Sd4OPlZ0w88XvOAGUb4N5P8ly/Y/XnSDy2AD8FegoZ+K5vzjytMrWh40wK+hkWmdQCAQCISUMXMYkq5B7ZnVJxzyyBGKQCAQCIS+QJjGJclj4efvSZHmc/XviMAJBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUDoFP8fG2heOpsr28UAAAC0ZVhJZklJKgAIAAAABgASAQMAAQAAAAEAAAAaAQUAAQAAAFYAAAAbAQUAAQAAAF4AAAAoAQMAAQAAAAIAAAATAgMAAQAAAAEAAABphwQAAQAAAGYAAAAAAAAA35MEAOgDAADfkwQA6AMAAAYAAJAHAAQAAAAwMjEwAZEHAAQAAAABAgMAAKAHAAQAAAAwMTAwAaADAAEAAAD//wAAAqAEAAEAAAD0AQAAA6AEAAEAAAAoAQAAAAAAAIo4n00AAAAASUVORK5CYII=",
-    # Washbasin
-    "washbasin": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAF8CAYAAAC5cAPdAAAC8XpUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHja7ZdtjtwgDIb/c4oeIbYxNschfEi9QY/fF5JMZ2Znpa26fyoNKJhxwBg/hmhC//VzhB8oZOQhqnnKKW0oMcfMBR3fjlJWS1tc7VX41D7og9Wzy5ACKccLT4ekS38ZOiUV9PTOkNfzxf74IsdzeX8ydC4k06PpWzsN5dOQ8PGCTgPl2NaWstv9FvZ+yHZt1I8nzKb2Y990rvb8Oxqi1xRKYe4CNVoWPhyQ+cQgBR1Hy+IYSJCzP9so+fQEAXkVp+3Oq/CCCr2icm3pGYqkY0SA4jGY6SZf6klfBz+sEN+tLH/S4UFvspg+bOd6xmgexujH7kpMCGk6N3VtcfUwcEfIZU1LqIZH0bdVM6oHZG8F8rbVbUetlImBZVCkRoUG9SUrVbgYubNBMleWpXMxzlxlC+AUZ6XBJlkaCLJU4BVo+eYLrXXzWq6SY+FGGMkEY5M0h4X6G+qnhsaYKU80gwn0tPgQzySEG5PcbDEKQGhceaQrwFd9LpOrgKCuMDs2WLb9MLErnbk180gW6IlXIY+zRtZOAwgR1lY4QwICWyJRSrQZsxEhjg4+BYYcB4V3ICBVbvCSo0gCHJwYrI05uLbmWFY+1LizAEIliQFNlgJWERcb8seiI4eKikZVTWrqmrUkSTFpSsnSvPyKiUVTS2bmlq24eHT15OYePHvJnAWXo+aULXvOuRQsWmC5YHbBgFJ23mWPu+5pt933vJeK9Kmxak3Vqoeaa2ncpOGeaKlZ85Zb6dSRSj127alb9557GUi1ISMOHWnY8JFHuVGjcGD9UL9OjS5qvEjNgXajhqlmlwma14lOZiDGkUDcJgEkNE9mm1OMHCa6yWzLjFOhDC91wmk0iYFg7MQ66MbuD7kHbiHGf+LGF7kw0X0HuTDRfULuI7cX1Nr82tRNwiI0j+EM6iY4fhjQvbCX+VH7sgx/O+Ft6G3obeht6G3oPzE08NXAv4HwGxQtJsJZ1ZrAAAABhWlDQ1BJQ0MgcHJvZmlsZQAAeJx9kT1Iw0AcxV9bpVUqInYQ6ZChCoIFURFHqWIRLJS2QqsOJpd+QZOGJMXFUXAtOPixWHVwcdbVwVUQBD9AnB2cFF2kxP8lhRYxHhz34929x907wNuoMMXomgAU1dRT8ZiQza0K/lcEEEYPBjAmMkNLpBczcB1f9/Dw9S7Ks9zP/Tn65LzBAI9APMc03STeIJ7ZNDXO+8QhVhJl4nPicZ0uSPzIdcnhN85Fm708M6RnUvPEIWKh2MFSB7OSrhBPE0dkRaV8b9ZhmfMWZ6VSY6178hcG8+pKmus0w4hjCQkkIUBCDWVUYCJKq0qKgRTtx1z8w7Y/SS6JXGUwciygCgWi7Qf/g9/dGoWpSScpGAO6XyzrYwTw7wLNumV9H1tW8wTwPQNXattfbQCzn6TX21rkCOjfBi6u25q0B1zuAENPmqiLtuSj6S0UgPcz+qYcMHgL9K45vbX2cfoAZKir5Rvg4BAYLVL2usu7A529/Xum1d8PlcVytYPk98oAAA+caVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8P3hwYWNrZXQgYmVnaW49Iu+7vyIgaWQ9Ilc1TTBNcENlaGlIenJlU3pOVGN6a2M5ZCI/Pgo8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA0LjQuMC1FeGl2MiI+CiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiCiAgICB4bWxuczppcHRjRXh0PSJodHRwOi8vaXB0Yy5vcmcvc3RkL0lwdGM0eG1wRXh0LzIwMDgtMDItMjkvIgogICAgeG1sbnM6eG1wTU09Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9tbS8iCiAgICB4bWxuczpzdEV2dD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlRXZlbnQjIgogICAgeG1sbnM6cGx1cz0iaHR0cDovL25zLnVzZXBsdXMub3JnL2xkZi94bXAvMS4wLyIKICAgIHhtbG5zOkdJTVA9Imh0dHA6Ly93d3cuZ2ltcC5vcmcveG1wLyIKICAgIHhtbG5zOmRjPSJodHRwOi8vcHVybC5vcmcvZGMvZWxlbWVudHMvMS4xLyIKICAgIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vdGlmZi8xLjAvIgogICAgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIgogICB4bXBNTTpEb2N1bWVudElEPSJnaW1wOmRvY2lkOmdpbXA6OGNjNjNlOTQtNjMyNC00Njk5LThiYTUtZDYyZGQ4MjkyMDljIgogICB4bXBNTTpJbnN0YW5jZUlEPSJ4bXAuaWlkOmVkOTUyOTA4LTY1YTktNGVkYy1hZWExLWRjMjE2MTg1MjBjMCIKICAgeG1wTU06T3JpZ2luYWxEb2N1bWVudElEPSJ4bXAuZGlkOjBmNDVmOGI2LWQ5YTUtNGU0YS1iODRlLTI0NGE5YTc2ZmE3ZiIKICAgR0lNUDpBUEk9IjIuMCIKICAgR0lNUDpQbGF0Zm9ybT0iV2luZG93cyIKICAgR0lNUDpUaW1lU3RhbXA9IjE3MjQ4MzY5NjkyNzI2MjgiCiAgIEdJTVA6VmVyc2lvbj0iMi4xMC4yMiIKICAgZGM6Rm9ybWF0PSJpbWFnZS9wbmciCiAgIHRpZmY6T3JpZW50YXRpb249IjEiCiAgIHhtcDpDcmVhdG9yVG9vbD0iR0lNUCAyLjEwIj4KICAgPGlwdGNFeHQ6TG9jYXRpb25DcmVhdGVkPgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6TG9jYXRpb25DcmVhdGVkPgogICA8aXB0Y0V4dDpMb2NhdGlvblNob3duPgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6TG9jYXRpb25TaG93bj4KICAgPGlwdGNFeHQ6QXJ0d29ya09yT2JqZWN0PgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6QXJ0d29ya09yT2JqZWN0PgogICA8aXB0Y0V4dDpSZWdpc3RyeUlkPgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6UmVnaXN0cnlJZD4KICAgPHhtcE1NOkhpc3Rvcnk+CiAgICA8cmRmOlNlcT4KICAgICA8cmRmOmxpCiAgICAgIHN0RXZ0OmFjdGlvbj0ic2F2ZWQiCiAgICAgIHN0RXZ0OmNoYW5nZWQ9Ii8iCiAgICAgIHN0RXZ0Omluc3RhbmNlSUQ9InhtcC5paWQ6ZDk0MWFiNDUtZDVkYS00ZWNiLTgxNzgtNzk0NjBjZDNlN2I2IgogICAgICBzdEV2dDpzb2Z0d2FyZUFnZW50PSJHaW1wIDIuMTAgKFdpbmRvd3MpIgogICAgICBzdEV2dDp3aGVuPSIyMDI0LTA4LTI4VDEyOjIyOjQ5Ii8+CiAgICA8L3JkZjpTZXE+CiAgIDwveG1wTU06SGlzdG9yeT4KICAgPHBsdXM6SW1hZ2VTdXBwbGllcj4KICAgIDxyZGY6U2VxLz4KICAgPC9wbHVzOkltYWdlU3VwcGxpZXI+CiAgIDxwbHVzOkltYWdlQ3JlYXRvcj4KICAgIDxyZGY6U2VxLz4KICAgPC9wbHVzOkltYWdlQ3JlYXRvcj4KICAgPHBsdXM6Q29weXJpZ2h0T3duZXI+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpDb3B5cmlnaHRPd25lcj4KICAgPHBsdXM6TGljZW5zb3I+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpMaWNlbnNvcj4KICA8L3JkZjpEZXNjcmlwdGlvbj4KIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAKPD94cGFja2V0IGVuZD0idyI/PnQEWXYAAAAGYktHRABcAFcAb7Be3UkAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAAHdElNRQfoCBwJFjFe6x7LAAAgAElEQVR42u3dd5xdZ3ng8d9U9S5ZxZYl2TKuuNKMCwaDTYtTCB0SAqGaXQJsyG7ahu3ZbEiWOMBuwoYEQgstptqAbVzA3bjgXiRLliXZVq9T94/nuWgQLtK859y5d+b3/XzOZ6SR5s6559x7n+dtz9vB6HUA3UAvMAs4FngBcAJwBLAkvz8l/58kSTowA8BuYCuwDngQuB24Frg7v9+X/294tEF8tIF/JnAq8GrgLOAwoCcTgm6gC+gc5e+QJGmiGwaGgMEM9H1AP7AWuBL4FnALsG00icDBBucuYB5wLvAm4JQRrfwu75UkSbUbHNE7cDPweeAyYFMmApUmAB3Zsj8DeDdwZiYCk7wPkiSNmT0Z+K8HPg38ANh7IL0BB9Jq7wAWAx8EPkyM88/FcX1JksZaNzADWA48F5gD3APsLE0AOohx/j8B3gAcnj0BkiSptRKBecRE/BXAamDD0/UEPF0C0AmcDvwR8EpgNk7okySpVXUA04CV2SPwCLDmqZKArqcJ/mdm8H8JMNXrKklSW+gleuyXZQLw8JMlAV1PEfxPGRH8p3gtJUlqK93E8vxFwJ3EcMDTJgAdwEJizP+VtvwlSWrrJOBQYmLgtcCOp0sAJgO/B7yRGPOXJEntq5dYyTcE/ISoIfBLCUAX0eX/IWLswAl/kiS1vynAIUQJ4dXkfIBGAtBBLB/4U+B5uNRPkqTxooOoFTCDqBi4G2LCH8Q4wUuJZX9O+pMkafz1AryQ6OnvbiQAHcTGPm/KXgBJkjT+zAPenDG/ozMzgVOJpX/W9pckaXyaDJwGnAx0dxPj/a8mdvWrwiBRdOAOYsvC7RzE7kSSJOnnNf4PI8r7Hk41u+7OBF4FXNudgf8sqhn7X0/sRHQZcBOwitinWJIkHXywXp6t9nOJuXoLCx9zKvCifGxewr4NA0qOh4A/A470nkmSVKmVwEcz1pbG6w3AOV1E0Z+zibGBkpb/3wMXEZsPSJKk6mwCbs9YfQwwveCx+oHVncCzKVv3Pwh8H/gs8IT3SJKkWjyRsfYHjKjoNwo9wLM7gSPINYGj9DAx5v+g90aSpFrdnzF3TcFjdANHdBIbBZTMLLwduNl7IklSU9yUsbckATi0k1hmUFL3fy0x21+SJNVvVcbe0eoAZnYSSwJKEoDtuNRPkqRm2ZaxtyQBmNpN2fg/WORHkqRmGiZm8pckAD2dFZ2IJElqbhJQpNNrKEnSxGMCIEmSCYAkSTIBkCRJJgCSJMkEQJIkmQBIkiQTAEmSZAIgSZJMACRJkgmAJEkyAZAkSSYAkiTJBECSJJkASJIkEwBJkmQCIEmSTAAkSZIJgCRJJgCSJMkEQJIkmQBIkqRxo9tLII1704HDgEXAHGAmMAXoyX/vB3YD24DNwHpgLbDDSyeZAEhqL7OAo4BnASvz63JgITAPmAb05v/tA3YCT2TwXw3cC9yfX+/N5ECSCYCkFtQBLABOAp4LnAk8J7/3dHrzmJPJwpn5/Y3ATcDVwPXAbfk9SSYAklrEDOBk4HzgVZkEdBQ+5iHAK/IxbwO+BVwG3AJs8ZJLJgCSxk4X0bV/HvAm4IVUP7m3M5OLk4CXA5/LZGAVMOgtkEwAJDXXlAzK7wB+E5hd8+/rIIYUjgSOBz6dPQO7vRWSCYCk5pgKnAP8HvCS7AloljnA24FlwMeBK4hJhJJMACTVaBrR5f8h9k3Ya7auPIeZmYx8xyRAai8WApLay+QMvH8whsF/pBcAHyEmC07y9kgmAJLqeb+eAXwAeH4LnddzgAvz3Lq8TZIJgKRqHQm8OwNtqzkLeB9RR0CSCYCkikwH3gW8jNacu9MFnEusSJjm7ZJMACSV6yDG2M+j/qV+JWbnOb6c8iJEkkwApAlvIfBaYu19qzseeB1RRVCSCYCkgtb/q4BTaI8Jdt15rq+0F0AyAZA0erOILvUVbXTOK4ghi1nePskEQNLonAEcXWHrfxDYQxTt2Z7HzvxeVXX9u/OcT/f2Sa3LSoBS6+ogyv0ureCxhoEdwB1E1b4bgUfz+4uA04ihhhOJFQel3fdLgRcD38vfIckEQNIBmpMBuXTm/xCwGrgI+CbweLb6+/Pf7wZuAL4C/ApR1Gc5ZT2EjXOfhVsHSyYAkg6q9X8s5bPph4F7gP8I/BDY9CT/py+PzcBngDXAn+XvL+kJWAgcB/zEXgCp9TgHQGpdx1XQ+l8LfAL47lME//1tyv/7yfzZErPzOUgyAZB0ED0Ay4nx+NHaS3Ttf4kY/z9QO4Av58/uLfj904ktg10OKJkASDoIh1JWVnc9cCkx5n+wHgMuyccYran5HCSZAEg6CLOA3oKffwy4tuDnrwU2Fvx8L61dulgyAZDUkqZStv5/B/Awo5uAN5w/u7Pg93fnc5BkAiDpAHUUtv4hCvvsLvj5KooD9eIcAMkEQNJBJwEleoAZBT8/Mx/DzxjJBEBSG5kJPGuUiUQHUc7Xev6SCYCkNrOYKCU8WucQZYIlmQBIaiPzgZcyumI8xwHn5mNIMgGQ1Ea6gJOAd2VvwIFaDLybqOXf5WWUxif3ApDGtznA64BtwD8TG/88nWOAt+TPzPHySSYAktrXImKHv6XEVsB3EHX+txPr/WcChwEnEFsCX4AFfCQTAEnjpifgrcCLiN357iF2/xsC5hEz/l+YSYJDg5IJgKRxpJPYYGi5l0KSmb4kSSYAkiTJBECSJJkASJIkEwBJkmQCIEmSTAAkSZIJgCRJMgGQJEkmAJIkyQRAkiSZAEiSJBMASQdmGBgo+PmBfAxJJgCS2shjwDXEtr97gD5gkNgCeHi/RGEo/60v/+/m/NnHvIzS+OR2wNL4dRfwNuBQ4BTgBODI/PtcYEr+v93AJuAR4AHgduAWYB3wGeAQL6VkAiCpfewFVgFrM6hPBSYBvfneb/QADhHd/X35M7vyGMi/SzIBkNRmOjKQb8vjYH9W0jjlHABJkkwAJEmSCYAkSTIBkCRJJgCSJMkEQJIkmQBIkiQTAEmSZAIgSZJMACRJkgmAJEkyAZAkSSYAkiTJBEAalwaB4XHwPIbzuUhqMW4HvO86zAZmArOAGcTe6T0jji5ie9RhL5ealJwvHAfPYyHwFmDIW6om6BiRdPaPOHYB24GtxLbYW4htsk0AJuiH6wLgkDyWAsuAQ4EleczJJGAqMCUTAEkH51jgs14GNdkgsDsD/y5gM7Auj0eAVcBaYGMej03EJHWiJQBzgMOAlcBpwInACcDhBnhJGje6gOl5ACwHTtkvQVgN3AHcBtwyIil4jAnS0zsREoDebNEfAZwKvAR4IdHd3+H7RJImZIJwRB4XADuAm4HLgWuA+7KnoN8EoD1NzsB/AvCrwCuI8UgnPkqSRpoOnA2cCWwAvg1cDPwsE4G9JgDtk9kdAjwPeD1wHtH1b+CXJD2dTmAx8Hbg14FLgC8BNxJzBcbVxMHxlAB0ELP3jwNeC7zRFr8kaZSJwDzgDcC5mQR8MXsEtjNO5giMlwSgm5jBfwHwDqLbvxPH+CVJZYnAIcCFxBDBp4FvEqsJ2n5+wHhIACYDzwbenS3/6bb6JUkV6SCGlk8E/jvwHOBTwE+BPSYAY3dTphFj/P8WOAMLG0mS6usNmA68mVhK/nHgu8SQgAlAk4P/HOBtwPuINZ6u45ckNSNuvoCYY7YE+EeisuBwOz6Rdgz+84H3AO8ixv4d65ckNUujjsDvE2XkP0msEmirJKDdEoAOYonG7wG/TZTzNfhLkpqtsWTwvUTJ+L8C1rdTEtBuk+XmEuP9bzP4S5JaoFG6APgd4ENE73RbZTDtYjox3v8Wg78kqYWSgPnE5MALiXo0JgAV6iGW+f0OMelCkqRWsgj4LeB3M2a1vHaYA9BB1PJ/MzHbv86W//CTHDBBdoZSSya+7d7TNcw431BFLR07Gl/3P+r6fcsyVq0CvtHqsaO7DW7giURd5hNqvHFDeWwGbifKPT5EVHvaROwn3WcioCbqJGYWn9rmz+MWYpLUkLdUTYwbvcTEvLlEr/EK4HiiaFxjb5jOmt63J2YvwP0ZT0wARmkOMe5/JvV0qQxlgL8S+AGxL/QTRGGHXcDubL0M+p7SGNg+Tp7D9d5KjYGujBtTMhmYQdT3P4mo7392JghVJwI9GbPeB/xhNixNAEaRxb0WeBnVT6oYzNb9vwLfAR4glm9s8z2jFvrwGk/PxSRazTaYx579gvDtwA+BI4FXEkPMiyt+z80kqtTeDPw9Ldp73KoJQAdwDPA6YGkNLZLvAJ8F7gDW+uEkSRPGtjzuJ4Z7vw38JvAbRFGfqhxO7CZ4DXBXKyYBrZoA9BIz/k+p8BwHgLuJcdUrgHsM/JI0oXsIVgNrMhm4kei2P7ai3oBu4GSiaN2fEPPITACeQSdRZ/n8CrOxXRn0LwKuZnyMrUqSyg0B9wEbMiF4P3AOMXeg1BxiKOCbwI9pscmwrZgAdAOvp7olfzuIHZv+ErgBZyNLkn7ZNuASYiL4FuDVlM8/6yD2DHhjxp+9rdbabrXzOYXY2reKiX/biYl+/wO4zuAvSXoagxkr/hz4OtVMDJ8BnEWsPmipmNtqCUCj9b+sgtb/TuDSbPnf7OtaknSAbgU+RiwP31VBL8BSYlJ7S/W6d7bYuSwFXlRB638wg/7HiUIkkiQdbBLwv4nJgQOFjzWTmFfQUtvXt1IC0EUUZlhSwXndD/wdMeFPkqTRuDpjyQMVxNolxFBAy/QCtFIC0Au8HJhV+DibiRmX/4pj/pKk0RsCLiZqBWwpfKxZROGhXhOAXz6P5cSayZKlF8NEd80XsKqfJKnctowpNxU+ztSMcYe3SuxtlQSgG3g+5ev+1wPfx3F/SVJ1bsrYsr7wcWYDz6VFhgFaKQF4DuWFF24hyvy6a58kqSrDxDBAaeNyqgnAL5tCeff/ZmLXsZ/5WpUkVexnRI2Akt39phC1biabAIQuYmnE0sKs6B5i0wVJkuroBfhxxprR6ibmAFS9+2BbJwBHUT4z8h4c+5ck1ecW4N7Cx+jNmGcCkBdhGdBT8BjbiM0cnvD1KUmqyeMZa0o2lOvJmGcCUFEC0NjOUZKkOt2fMccEoKJzKB3/X09s4yhJUp0epmw5YE/GvDGPv62SAMwtzIY2ARt9XUqSarYhY05pzDMBIDZGmErZBglbcfxfklS/JzLmlMTdabTApkCtkgBMKzyXvZRv2SiNR8Nj9LPSeLUL2DMeEoBWqEbUQRRHKEkA+oB+X5fSL5hMrDkeLnhvlhYsMYnQeFMab6ro9R43CQCUrQAAd/3T+Gy5lya1p1NeG2NG4c/3mwRoHBosTABaYkfA7nFyM/yA0Xi0Mz9oRjtBtoeYbDRWBoAd3kaN0wS97XV6H6WWtR7Y3cbnv5vy3dMkmQBIE86DlFUcG2vb8zlIMgGQdICGgVspW2881jblc3CITjIBkHQQCcCNRMnR4TY9/7XATSYAkgmApIOzmdjiekMbnvsG4Gpgi7dRMgGQdHCGgG8Qu4+1m3uAr+MSXckEQNKoA+nFRHd6u1iT53yft08yAZA0Ov3AF4FLaY819TvyXL+I1TklEwBJRdYCFwFXEMV1WtUAcCXwCWCdt00yAZBU7lbgr1s4CRjIc/tYnqukFtftJZDawhAxq/6jwGPAqymv01+VHcB3iF6K6ymrky7JBEDSfvYSywK3Ag8BrwNWjvE5PQR8GfgCcDvO+pdMACTVYjgD7RPETn/nAy8DljX5PFYTXf6XEOP+j3hrJBMASfVbB3wVuBn4IXAycDywHFgEzKJ8m+2GfqLXYX22+O8kxvlvJGr92+UvmQBIanJvwIN5fA84ElgKzAdmEnuOl070HQL6gG3E3IO1wANY4U8yAZDUErYQdfdv8lJIOhAuA5QkyQRAkiSZAEiSJBMASZJkAiBJkkwAJElSu3AZoDS+TQZmE/sGTMu/TwK68v0/TBTy6c9jN1HbfwdR/GePl1AyAZDU+roy4M8HDiEqAx4DrAAOz+/Py0RgClHoZw+wE9hOVBhcQ5T6vQtYBTyex2as9S+ZAEhqKdMy4K8Ang+cBZxElAUG6Njv68iEoSd7CBaxb3Oh4TzWE2V/rwSuy8RgYyYMkkwAJI2R6cBhwHOAXwfOBuZkoO94koD/TPZPFJYAi4lNhx4jdiP8BrHt7zpiqECSCYCkJpmSwfkc4C3Z6p80yqD/TAlB4/EWZpLxcuBa4PPEjoDrcK6AZAIgqVadxBj/2cA78+tUmrOip5EMTANeDDwPuAz4e+DHxH4EzhGQTAAkVWwSManvd4E3EF3zXWOYiMwAXg2cCnwB+DQxabDPWyWZAEiqxhTgRcAHstU/hWq7+keri5iDcCFwHPDX2Ruw21smmQBIKjM9W/zvB45vwfdtY1jg5ZkMXAR8EVcKSCYAkkYdWGdk6/odxBK/Vq7e2Q2cCHwEmAX8HVFbQFILshSw1Not/w8C72mD4D/yM2Ul8G+I4Ypp3kbJBEDSgZsMvA94G7C0zd6rncAy4HcyeZns7ZRMACQ9sx7grRlAD6c1JvsdrA5ixcI7gDflc5JkAiDpKXQRZXzfSXSlt/N7tBN4FvBu4EzGbsmiJBMAqeVbzcuADxGT6cZDwOzK5/J7wKG0Z2+GZAIgqVaTsrV8ev55vJgMvBB4L9DrbZZMACTt0w28BLiAKPVbp+GnOOo0N5/bWbj8WGqZDx1JY6sDmEmU+F1eQ2I+DGwmtvW9lSjXuxHYmq3zXqKs8OHEFsKn1JCEdBJLGd8N3AJsakLSIckEQGppPcAriM11qlwy1w/cB3wbuApYS2zpu40o1dufgbmTWK8/E5ificAZ2WJfSXVzEaYALwBeBnwN9wyQTACkCd76n0Fs6Tu/wsddB3wFuBi4G3jkKf7fUB5b81iTLfQbgO8DrwJeS2w9XIUFwJvzse0FkEwApAnd+j+DmClfxcS/QeBG4FPA5cDqggRiHXAPcBuxLPE0ytfzTyKGGM4AvmcvgDR2nAQoja1e4DVUM+a+F7gM+CixGc/qCh7z4XysjwI/qihgzwF+A1cESPYASBNUF7Hu/3TKx/4HgWuAPweuyL9XZRfRZd9HDFmcQ9m8gMnEXIDDgHuJIQhJJgDShGr9n0mMi5f2xt0MfLyG4D8ywbiCmCg4mxgOGK1OYGE+99XEhERJTeYQgDR2JmVrurT1/wjwJeCSmoJ/wxBwKfAFYkVB6XN/MeOr4JFkAiDpGXUAs4gJcSVj4QPEuP/XgT1NOO9dxBK+0p6GXqLmwHQsDyyZAEgTSDdwJOXd/w9lq/zBJp57Fb+zC1iU18ChSMkEQJoweoHjKwh+1wJXj8H5XwVcV/gYPcAJuBpAMgGQJpAe4KjCBGALUbRn1Ric/yrgp0TxoNHqJsoD2wMgmQBIE0Y3sJSy5XT3E8voxsrdeQ6j1VgGaQIgmQBIE0YXsQFPSQKwihiPHysPU1ZsqIsoMWwCIJkASBPqvTen8D24kdjcZ6w8Cqwv+PnGLoh+DkkmANKEeu+VLoHbSswDGCs7gO2F12AaLgOUTACkCaanMPj1EVv6jpU9lNcemGwCIJkASBNNadW+rhZ4Dxu8JRMASQdhOFvww4Wt58lj+BymAlMKr8HuwmsgyQRAaitDxPh9yU548/MYK3OBeYUJwA7cDVAyAZAmWALwRGHwW5zHWFmSR8k12Ei9GxhJMgGQWsoAsYtfSfBbSVQTHCtH5jFag8RSQhMAyQRAmlAJwIP5dbRWELX0x2IeQG/+7iMKr8EDjO1KBskEQFJT9RNlfAcK37+nAiePwfmfDJxGWSXDAeAeEwDJBECaSPqA24G9hY/zPOClNLecbjdwbv7uEnuAn5kASCYA0kQySJTRXVXYCzArE4CzmnjuZwHnEaWMR6uf2EhoPc4BkEwApAlmN3AN5dX0XgC8GTisCee8Avgt4PTCx9kLXFfBc5dkAiC1nb3A5ZkIlJgEvBp4JzC7xvOdA7wbuCB/Z4ldwA8oHwKRZAIgtZ1+4GbKVwMAHAK8DbiQ2GGvyhK9HUTRnwuBN+WfSzRm//8Ux/8lEwBpAhomqgF+F9hZQZA+DHgP8EfA0oqSgA5gOfAnwHuBQyt4zB3At4ndDC0DLJkASBPSXuAbwIYKgmFnBui3A/8LeBmxXn80iUAHsVvhy4C/IMb9l1TwmTFMVP/7BrESQtIY6fYSSGNqkOgO/y6wiOi+L22xzyfmBDwLuAr4KnA9Me5+ICYTS/x+A3gRcDRlm/6MtB34JrAaZ/9LJgDSBLcb+Fy2to+hmp65KcBJRPf9mUTRoRuAO4nld08QXfGDwDRiDkGjsuBzM3k4klhmWJUhYE0+193edskEQLIXIALzV4D3Uz7JbqRZRNW+E4AzMvBvyQDc2I64h9jad1b2HizM71VtC/AlovqfrX/JBEASsR7+cxmkzyLG7qt+rx9KNZP4RqOPWPHwz7j2X2oJTgKUWsMQsRzwE0Q3+XizFvgUUfnQmf+SCYCkEQaBS7Mn4PFx9LweB/4J+H4mOpJMACTtZwfwGWKd/I5x8Hy2Axfnc9rm7ZVMACQ9tVXARVRTJngs7QYuy+ey2tsqmQBIemY3An8FXE171svfA1wJ/DVwi7dTaj2uApBa1+XEaoBBoiDPlDY5793AFZnAXOFtlEwAJB28S4gNc3YC5wEzWvx8t+c5fyITGEkmAJJG6bIMrI8Bv0aUDG5FjxI1/v8fMYQhyQRAUqEbMgF4GHg9cCzVFwsarT6ikuGXgM/nOUoyAZBUkVXEpLq7gTcSNf4Xj/E5rSMmKn6eWOe/y9skmQBIqt5u4OvAbcBrgFcCxxM1/JvpMeAOYhfDrxE7GkoyAZBUsweAvyQqBza27T2S2NWvp6bfOQBsIHYTvJLYZvh2rO4nmQBIaqpB4KcZhI8CXgGcDawEFgBzKJ8n0Adszhb/Axn4vwPchzv6SSYAksY8Ebg7j38gtv89AzgNWEYsHZxK1BGYlElBF/sKgQ3lY/QTBXz2EGWIdxDzDm4mxvl/Cmz1cksmAJJazxbgR9lS7yEmCR5HDA8cTgwRzBuREHQSE/d2Zkv/UWLnvvuAu4D12QswjLv4SSYAklpaI1jvJWrwPwx0jDgY8XXkz4z82WGDvmQCIKn9kwFJ+gVuBiRJkgmAJEkyAZAkSSYAkiTJBECSJJkASJIkEwBJkmQCIEmSTAAkSZIJgCRJMgGQJEkmAJIkyQRAkiSZAEiSpHZNAEq3K+3wVkqS2iR2DpkA7DNQmAR0+XqUJLVB7BwG+k0AqrsYnSYBkqQm6M6jNOYNj/UTaZUegNKL0Q30+LqUJNWspzABAOizB2BfNrSnMAGYBEz2dSlJqtmUjDmjNQTstQdgXwKwnbJJEVOA6b4uJUk1m54xpyQB2G4CsC8B2AoMFiYA03xdSpJqNq2CBGALLbASoBUSgCouxnRglq9LSVLNZhU2OAcz5rVED8BYr8EfBjYX9gDMBOb6upQk1WxuYYNzCNhUQQ9AceztpHwNfhUFETYWJgCzgHm+LiVJNZtXmAAMAI9VkACULH0fBvo7KV+D31WYiQwC6/KijNYcYIGvS0lSzRZkzClJANYVJgBV1L7p6yTWI5ZW4StZEzlUQQIwF1jk61KSVLPFFSQAj1DW611FMaK9VSQA3YWZyGBejJKeiB5gITDD16YkqSYzgUMKg29/xrySHoDSuDvc6AHYW3hBeoDewh6AjcC2wkRkAbDU16ckqSZLgfmF8W4r8HhhAtBLWfXbn/cA7KS8CM/Uwou6F1hFWXnEhcAKX5+SpJocSdlwcx/wIOWlgKdSVotgGNjZSSzBGyo8kdIiPIPAfZT1RizOmyNJUl0JwOLCBOB+ylcATC+Mu0PA5ioSgCqq8A3mRSlJABbmzenwNSpJqlgncAQxB2C09masGyw8lyqqEW7qpLwgQVU9AHcSmwKNVjewDOcBSJKqtyyPksl3e4C7KkoASobef94DUJoAzKC8DO9gXpTSiYBLgWf7OpUkVezEwgZmY9+buytIAGZSturt5z0ATxQmALMpL8Pb2BGwdBjgsLxJkiRV6dkZY0pa//dQzU6AczP2FicA6wqzkdmUFUVoGABuA3YVPMYheZNm+lqVJFVkFnA8ZUsAdwG3VtD6ryIBGADWdgJrKKvCN5tq6vAPAjcSyxJLHAGc6utVklSR0zK2lNgJ3FRRAjCvMAEYBNZ0AmsLE4BJmY2U1iVuJACbCx9nGfACX6+SpIqcDiwvfIxNwC0VJAA9RK97SSGgn/cAPEZ0TZSMScynvBZ/Y1vgn1E2DLAIeC5lXTWSJDVa26dStvxvJzHEvZny8f/FlG1+NwzsIOcA9AHrC3sBFgBLKrjQA8BPiNUAJY4CzvB1K0kqdBbwrMLH2AZcRzXd/0sKG7gDwKPkdsCDwEOUbcazADi0gic2CFxF+TDACuCllA9LSJImrq6MJcsLH2czcGWFCUBJb0Q/UY54sJEA3F+YABxSUQIwRJQEvpuy5YDTgVNwSaAkafROAk7OmDJae4hCdw9RXgKYjLUlQwB9wAP7JwClG/Esq+iC78legE2Fj3MUcAGWBpYkHbwO4FcylpTYBPyIskq3Ix1eQQJwHzDQSYwH3FeYAHRnVnJIBU9uCLiM2C6xxALgbNwhUJJ08I7MGLKg8HEeBy6vqPW/mChG1F1BAjDYmSf1MOXViRZTvk6SPIf7iIIJJasBOoCjgV+1F0CSdJDx49eBYwvjx05i6d+DlM/+J2NsyW6Ejaq7jwBDnfmNXcT4REkvwGJgZUUXfw9wKbCh8HEWAa/Ki2YSIEk6kOC/Ang55b3aG4BLKJvTNtJKylbcNbYj3gUMd+Y3G2V4S8YoDqV8qcTILOUyYHVh1tRFlG98jQmAJOkAE4DXZuwoWUk2DKwCrqio9Q8xH6GkB2B3xvpBiP2Nyb/cmv84WjOIMZO5FTzJYWKd4lVUMxfgAmJFgEmAJJVqi/0AABYXSURBVOnpgv/JxNBxaTG5xzKGbagoAViQMbZkRcLujPUDIxOAgQoSAIjZicdV2AvwDWJookQXcALwdsr2T5YkjW9TgLdlHCutI7Ma+NcKW//HU77a7kl7AIaISQHrKKsIeDixbrKqBOAOonrS1sLHmgWcD5yLxYEkSU/eWHxZxorSHWW3ElVt76wwATgJWFrw8wPE3j+PZsz/eQIAMUnh9sJegEXZ2u6p6An3Ad/MTKrU4dkLsAiHAiRJ+3QQY+vvyFhRGiMeytZ/VZP/JmUPQMmeO43tiH8+2X9kAjAIXEtsEjBavcQkhaMqvDHXAtdTvk3wZOCFxOSObl/vkqTUDbyO2El2cuFj7ciYdX2F53c0sQKgu/C8fmE/gv0TgOuBLYUnujwDbVW2A18jli6UmgO8ldgt0KEASVIXsd3vW6hmEvv9wNcLG9P7eyHl+xFsBW54qgRgiOhqf5CyegCHZoCdVOGTvwr4cQW9AN3AMcCFxFpKhwIkaeLqJLr835+xobRhuCNj1dUVnuNk4DmUrf/fS9T/X8uIioSd+/2n/swQthWe7LFUOwywgxhPuauCx5oKvAJ4EzDN178kTUgdxGS/twHnESsASt1ZQ+v/GGIIoKRRvY0YTu/fP/thv16Aqymfdb8MeHHFN+sqop7ylgoeaxbwzrzpvb4PJGnC6QVeSUwOn1nB420mCthdU/F5nkN59/+27JkYeqaMaB5RuWiAWL4wmqMf+HIG2io9H/hBwXmNPPryRj0f5wNI0kTSTYyrX5fxqoqYcinRVV+l2RlLS85xIBOTeew37L1/D8Bwtv6vLewF6M4ui+dVfDFuAL5HrGMs1QOcBnwgz9UkQJLGv678zP8Asba+ilVh64DvAjdVfK6nE0MAJee4JVv/WzmAmgSdRNf4vYXZ0CbgL6iuJkDDUcA/Zwu+iqxtN3ARscSi0/eGJI1bnUQ53b/Nz/6qepM/m49bpR7gY8TQQsn53Q285GDi2zzgh5QNAwwT8wmOruEm/jqxxeJwRcdO4M+J2aAmAZI0/nQAhwH/NT/zq4oft2RMqtqxxDB1ybkNEEMTs58qG3qqLoOfZOZRYgWxqULV3euXEqsCtlT0eFOB9wBvJrZ/dHmgJI2v4L+QWP11IdXM+G/EyouB71d8vl0ZO1cUPs4movt/+8FerLOJTQNKso9BYtJeHWvuTwL+pYJeisYxROzedCGx65JJgCSNj+B/CLHW//H8rK8iZvQDXyJ2mq36fA/N2DlYeI4/JSY7HnQ8m5JPbk/hCawi6ivXMcnuNfkEq+rKGSImc1xI1Fx2OECS2jv4L8rP9HUVBv9G1/9v1HDOXUSP9OrC89sDfIFRljbuJNbKP1R4EnuBbxF7K1fdqp4K/LtsuVeZBDwO/HucEyBJ7aqT2D3v9zNGVBn8Hwc+QvXF5Bq9Fd+lfKL7g0SNg1HH3RVETYDSi7WKqLZUxyY8RwL/JxONKpOArcRkkZW4RFCS2klXxob/lp/lVQb/PcAngCNqOO/ubHg/XMF5Xk4U5SvKoP4H8EQFvQDfo76x9bPy8QepNgnYlTf6BNxBUJLaQTdwHPC/qXa2f2NW/bepdsO7ka3/hcSEwtLW/+OZ/BT3YJ9J7BJYeuHWAL9LPaV3u4j5ALdXnOk16gR8kSjIMBknB0pSK+pg37bvX6K6df4jG4W3EUv+6hga7gXeTWzYU3qu12bMquSkPklsblA6Y/Kq7JKoI4hOB94HrK/4pje6fG4glpDMwXkBktRKOvOz+c35WV06ef3JjkeB91LPJnIdxJyzH1Femng7UejoGYvwHcjY9mBe3JOJ2ZQlN2hKdsncmF0pVeojxk2GiHrMVW5H3E1MzDgjn8NqDrCsoiSpVl3ZsHwXMTFvJdX3NO8A/oaoQruphucwJRuwr87GbIk7gU8B91R1cjOAf6J8XGIQuJVYw1/HxLoOYuLiX9aUAQ5ldvU14EX5InNIQJKaryM/g88kuvyrnuw3sgf4r4lJhXV83ncBpxDDC6Xz2PqAz1SQRPySN2VmUXoxt2X3xIwau4KenQlLfw0vhsa8gJuJwhLWC5Ck5rf6lwIfJNbj76rps74f+IeMKXV9zs8kVrJtq+B87wBeX8dJzsnMorQXYIioLfBr1DMhsPHieC7wFaqrFPhkL4wNxATBlxCTT0wEJKk+ndm6/VXgm8Rs97oaegNEtdnnUN9S8EnAbxLDyqW9F/0Zo+fUdfFfT8y0r2L3pMuB5TUGzR5iFuTFNSYBjY2E7gT+KrtxunBYQJKq1MG+rvK/Ae6j+ln++wf/7xDzvupaAt6ZMfByqtnd9tZMJmozF/j7ik52M/Bn1DcU0EgCzgIuqTkJGGLfnssfIQpEdJoISFJx4O8kJvb9e2KTurrG+kcG/+8R++H01vjcZgD/hfLtfhuN6v/LU+z6V6Wq6u8PZhZ3Xs0XuTdv5DdrTgIaL5z1xFbKH6a+SSOSNBGC/0qilO/lxJBrMz7DLyYmFtYZlyYBLwceoJoCdrcQw+q1m03MiKxi0kUfsbXvSuodP+8likN8hfrGi/Z/Ea0DLgP+NLutnB8gSc+sCziV6CG+PD9L6w78jTH0LxNDxz01Pr/ObBxeQjW96TuBjwGzmnWDzgGurOiibyeW7c2t+Zx7iImB/0S1+wY8Uy/HBuAa4KLM0Ob5/pakXzKfqLL3t8Rw6kaqLe/+TOXq/4GY8NdT8/OcA/wvqpn1P0wUDzq7mTdqCvBHxAzMKsbP1xAVnKbWfN7dxHKOv8rEY7iJx3ZiicY38tq9mFj+IUkT1SxiFdUf52fjHWPw2bwtG6EnUP/Gb9OAt2bMq2Iew0ZibsTkZt+4Z+cNq6qlfB0x47Lu7KuTmKT3p9k6H2ryi22ImCdwPVG84k+AC4gCRg4TSBrPOvOz7lfzM/jL+VlYRwn3A/0s/uMmff72EpPSb6iwZ+OrxMZHTddN7DV8P9WNv3wNOLoJN6KDKODz3sw4B8fgxTcyg7sF+Bax8+CHgV8BjreHQFKbm5kt6wvys+0T+Vn3U+CxMfzcHSQq772H2IGv7snaHcCzMsZVNQ/tXuC3SnotStY3NpZKnETsYFRae78bOB9YBfzPzMzqMpyP/9nsBXhXdkP1jMEbZEEeJ+eLciOx6cRGYohlQ57rY/n3TcQymO3E5I/deS/6/ayR1CQ9+Zk9hSjMM53ozp9LjOUvABYTe6jMzyC7KP/eNcbn3gf8APi7/LqjCb9zYTY4z6OaugJ7MpG6NONG0xMAiNmZXyWGA15cwZOaSpQcXktMyNhc803ZAfxrBttVRBGFsZyk15VvmsUjvtdP1BjYMiLw78jAvztfzIOZBAzgskNJ9TaeuvPoIrq1p+Rn9zRibfssYrXYHOorojNajxPDDv9MDDsPNuF3zgbekLGtqp0Er8nehPVjfUEbuxg9UmH3zL3ERInpTXweRwIfAm6iOUsFPTw8PDyacwwQww4fJuaANcsM4LeBuyt8LmuIoYviiX9VdMUMAE9kl09Vu/zNIzZ6WE1s8TvQhBu1OV8gazNrPYwxmFkpSarUFvbNsfoS0ePbrMbxucAfEL3kVegHvkAsZ3+8FRKARvDcThT0WV7RYy7JpOIhYqihGV01A8Qeyvfli2Z2JiNdvockqa30ExP9/pEok3sFzZsr1Uusavt9oghdVa4kasrcVsWDVRnYGkUbTqa6esRHEONIq4ixjqEm3bwNxFDAWqLLZQH17lkgSarOOqL8+6eAz+VnebM0is59mJjYXtW8rIeIKrzfp6Je8SoTgIFMAqYSpW+rqKPcWDoxO5/8hiYmAX3EuM3txBBHR/YGOCwgSa1pK3D1iFb/T2juCqnGjoUfImodVLWkfQexEd8Xid7pyk62StuJcYllGbiryHw6iNoA07MnYGMTkwCIZXfXAncR+x9MyoSk1/eaJLWEncQcrq8AnyRmyG9q8jl0Z/D/APBaqlsBMURsTfy3xOZBlWYrVXsiL/xxxDh+FTqBY4iiEmvZN9zQTOsym7yfWIPZTQwLmAhI0tjYBfyM6O7/JFHbZRUxdNtMPcBpwAeB11FtTZmbgT8nKiZW2vitIwFolFfckRdkVoXnejzRDb82f0ezk4D+zMCuJJYq9mUiMJXyQkiSpAOzleiV/V62jP8fMWQ7MAbnMnLM/zeptvbBw8BfEAV/9lR94nXNbu8jxuu7iUmBVY2bN4YD5meLfP0Y3fC+EYnAnURBno7sDZiKxXgkqWrDxBDzz4hlfRdl4L8zP5PHwhRi++APEjsZVhlTt7Bv6WItwxl1Lm/bQRQHWkzMB6gqK2pMDDwsXwzrxvDm9wEPEntW30DMgWhU5Ou1V0CSiu0iit/cQlSe/RhRye/+MfzshxgCPpdY6vcKqt3DZjfw9ezdeLiuJ1D3+vYtRDGfo4DDK/x9HcQSwaOIrRzXUEP3yEEYJOr3/wj4LtEVtTef7xD76mZLkp7ZHmKu1wPE+v1PE9u4f5vm1YV5OnOAXwM+Qqz3r7LXtz+f83/L3o3a1J0ANLpsVgEnEptBVJklLSHmBQwSywR3tki2ei+xycSP8sW6N/9tIJ+/Ewcl6RftzHjxMPBj4PPZ2v+nbP1vo/mT+56s8bmQ2IXvQ8ROh1U3Jm8mtom/ue5Ep1lj1VOAlxKTGZ5Vw+/dmC+WTxFd8q2yM15HBvzJxF4DZwPPzxfNHGJp4zSsLSBpYhnOVv4uYrh4E1Fz5TpibtWD2XAaaoGg39BLVLp9J/BmfnHTtioMZePx3wGXEcMAtQeoZplJTJL4z8T4fdW/eydwCdFNdEuL9AaM1JlHdwb/0/I4MZOimZkITBpxOJlQ0ngI9ntHHHuIWfz3EiVtb8pjC9FLOkRza70ciGnAqcRkv/OJyd5VX6M1wB8D3yDmkzWlhdpMc4gtEf8ws6eqf/9ABv+PE4UTtrTgC6lx3btGJAQziDoHxxLzGlYCKzIpaMwf6Mmf6Rrxs42j8ZgmDJKaEdCHR7RaG8fgiKM/P4/7ia77B4nx/PuI5Xt3Zct/YMTPDrfgc+0kCr+9Cvi3xKq27hqu56PAfyEq/W1uZiBqduCbC7yNmDyxoIZzGMqL+S/EEoqH2TcG36pGJgSNAN+b12cJcGh+PSSTqMZ+2zOy16AbVx1Iao69xOz7gWzNb8/G1tYMXhuJuU+P5NeNmQg0koNWDvgjTSJ6q98DvD4/hzsr/h3DxJL5/0nMddjUzOsyFi3GDmId/7uIkonzaziPYWII4MfEJJIf59+H2uyN1jkiKWj8udHS79yv1W/rX1IzewFG9gYM7ffnoRHBvh0/d6cTu/h9iFjnP62mOPU4MWz9d0QV3eGJ8OLpyNbsR9lX23+4hqOPWCv6n4jJG062kyQ9lV5i+PU/s6/OQB2xaShj33/MWDjhGnCNJOCP2LfVbx0XepDonroKeCMxrt7l61ySlLoyNlxAzMDfwr5hijqC/3rgP0zU4D8yCVhA1FBeV2MS0OgNWE3MCziZWJpot7kkTVwdGQtOAf4PUbOmrlZ/I/g/QqwmqGP4uy1vwDzg/cSEvcGaL/42YunJHxLVCXu9CZI04eJOb8aAPyZqEGyvuRE6mI3Q92bMM+6MuBlzgN9m345OwzXfiI1Epb53ZjdMjzdEksZ9rOkmqvm9iyg69FjNDc/hjGl3AW/NWGeseRIzgVcS1aD6ar4hjWGBtcAPgQuJUsVd3hxJGneBv4vodv9tYnvdtcTyxGbEmRuAX8kYp6cxhSiZ+32iFOJwE47+fDF8J3sElpgISNK4CfxLssX/Heof5x957CIq1J6VsU0HoIcok/tZYjbmcJOOvcQYzQ+JQkVH57lIktovjhwD/AExs391EwP/MFEU6R+JCYYtGUdauYXbSWz5+1bg7URFpmYZIqozPQRcS3QXXUtUupIkta7ZwAuA84jN11YQY/6dTTyHh4ktjD9PlEBuyQI/7dDFvRh4BbFK4KQm30Qyi1sL3ANcnZnkvbR+eWFJmigmET22LwHOJDZYW5rJQDMNEfvR/A3R9b++lS9au4xxzwDOIGoyv5Qoy9hsA8QeA6uJlQo3ECWG7yW6lSRJzQ36zyJK9j6X6O5fRkzm7h6D89lBzF37VMaGHa1+Adtpkls3cALwGqKi35FjeC57iWIOq4lhgp8Bt+bX9b4vJakWc7KlfxJR0O1oosz7EsZ2M7RVwBeI3fzuzAZjy2vHWe6LiLGdt2fmN9aTKwaJ+QJriHGf+4jhgvuJsZ8NvmclaVQWZmPvqGztryB25VvaAkEfYgXZNcBnsvW/rp0ubrsuc5sCPA94A1G7eUkLnduOfBE8ml/XZmLQ2B7zkewlGPC9LUmQDblF7Nv+/FCiSt9hxDywxfm9aS10zo8AF2er/wZi2Xpbafd17iuAlwOvzd6ASS14jv1EpanG8Xgem4jtHzflsZXYsrhx7CKGGgbYt7WmJLWDrjy6iZK7U4ktdqdmEJ9FlMOdO+KYT+wN0/h6CGMzlv9M9hBj/P9CTPR7qF1v0ngodDMFeA4xN+DVjO3cgIPRl0F/Sx7bM+jvzq978v80EoB+2m9fbUkTT2e26DtHJACTM/hPya8ziBn6jaNd6q3cD3wT+BpwUzu2+sdbAtCwBDgfeBWxDGSh70NJUgU2E1vKfz1b/Y+OhyfVNY5u0HZiR6fbiS72HqIbqdfXriRpFHYTReA+R2wX/ENiR9lxoWuc3axhYpz9ZmJ9/i6iu2k+zS8gJElqT/3ZmPwqsa7/X4gJ3eNqGHa8b3Yzm6gMdT5RKOJ4ewQkSU9hgFjG/RNi46DLGMcl4CfKbnczgXOAXyNqQx+Fm/xIkva1+O8DbgS+S4zzbx7vT3qibXc7N3sDzieqCh5NLE2RJE08u4iCbbdMpMA/UROAhmnE3gIXEEMDKzM5kCSNf0+MCPzfI7r6t020i9AxwV8EvURFwVcRQwPLiOWEk31/SNK40kdUYX2IGOP/FlHBb8Ju5tbhawKIFQKHAS8mhgeOI8pOzsXVA5LUrgaJSquPEivDLie6+VdhdVUTgCe5HpOJyoIvA07PxGAesQtVt5dIklo+6G8j6sE8TGzW831igl8fVlQ1ATiA69JJTBA8CXgRcDax98AsYlWBywklqTXsJYrBbSU26bmeGNe/nii1PkTUiZEJwEHpzGMWsf/0C4n5AkcQdQamEcWG7B2QpOYYIGbw78ig/0AG+2uAW/N7Q7b2TQCq7hVobHRxODGB8PnAicTkwcZmF5Ozh8DrK0llhomu+93EJmm7spV/G3AdMZHvYfZtmGZr3wSgKT0DjS0vJ2UCcFIeJxLDBY2hgp4RX7u97pL0pIF+IAN5Xx79xHj+gxnwb82vj+S/D+ZhS98EYMwTgu4RScFUYClRdfAootbAcmARMbdg5P/tGtG70Dg6Rhzs92dJauVAPrzfn4dHtM4bx+CIY4Dozl9PzNC/L4/7gTXZ6h/5fw34JgAtf207nyTQ9xCbEy0lVhgsyb/PzWNOHpOJ4YRJIxIK5xlIanUDIwL2XvZ13W8mluRtJgrxPAGsywC/Jv/e/ySJgV36Nfn/T+wjG2ZsDgUAAAAASUVORK5CYII=",
-    # Bidet
-    "bidet": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAMAAADDpiTIAAAAA3NCSVQICAjb4U/gAAAACXBIWXMAAA3eAAAN3gG05XH5AAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAAwBQTFRF////AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACyO34QAAAP90Uk5TAAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxwdHh8gISIjJCUmJygpKissLS4vMDEyMzQ1Njc4OTo7PD0+P0BBQkNERUZHSElKS0xNTk9QUVJTVFVWV1hZWltcXV5fYGFiY2RlZmdoaWprbG1ub3BxcnN0dXZ3eHl6e3x9fn+AgYKDhIWGh4iJiouMjY6PkJGSk5SVlpeYmZqbnJ2en6ChoqOkpaanqKmqq6ytrq+wsbKztLW2t7i5uru8vb6/wMHCw8TFxsfIycrLzM3Oz9DR0tPU1dbX2Nna29zd3t/g4eLj5OXm5+jp6uvs7e7v8PHy8/T19vf4+fr7/P3+6wjZNQAAJDZJREFUeNrtXQdgFcXW3ptKEgghkIQQSAgtQYoQSuglCCIdRSkKgghiAcHyKIqUHwRpCsJDFFHkgbygEkBFBAIoPYUuCYQECKSSBFJIvXf/8ERlZ2d3Z29u2Z05n4LO3rN7Z8757pkzZ8oaOGvBb3CYfyWcOUBVUJ6Rlp4evyfTWs83WOexwSOGdXIA61kMppNR36XohwB+8192AqNZGBUb51vDDTha/pEec7Z3gV+/xeHQfopLbLkOPEDLXY3AWlZC8tCLFueVpR845DjY32podHyI1ruAOZ+7gp2sB9dR5b9rmgDvLjWAlawJQ5/7xzUcAwzaBdGf1UeEQ3/ULAFanKgBBrI6Cjpf0igBXC81BvPYANdalGpzFPAG2N8maPyGNj1AzWRvMI5NkNvonhZHAfP7gmlsAzfuoAY9QM10NzCNjVDsbzEXYLlJmwFi++85Gn+mCMxVJXi0Des2WOQCBnyrvZpu5xHc6g/mswz630J1u117lXS5h9RxnxdYzlLw2oco956L5urYD6lilg/YzXLwyULU209zeYAWSPm1bDCb5ZD9moK67U8Af2Ex9juwmiXxXaysujVAgHrC4kmwmWVxUlbd2vMAMWAyyyJG6x7AT1g8ByazLM7Jqtt8OFnpQaUa12dIE/+6dSv/9cjMSM/ISE+P03rCqtQ2dmMCLj0GD/p74aJf6z/1G/3jjzfBz1QBCcJxaqhmR9Tjv8vn8Ti3KFy7C9pChXVNAAKYN1ZZX8bL4cIwIADFBKi9/D6vhNP9gACUEqDGvHs8CY50AwLQSIDX7/Ck+DkYCEAbAdy28ipwpzczBGBkHX/938eoChZ+fY2V0RsbBOga205lemTdBmcgADV4OVp95nTyQR8gACX45Atz1s90jwkFAlCBmW+ad1/QHi8gAAUY+KG5dzb5BAigfzTfZn4TX3yCfgLQPhtYa7enxCeXDqXeunXLwcfHJ6BnV4lTLTa0LOYAZNBmIshxPzbRU7Z/miDZ5/7Ux5lYwY80o1/IBJqFlTirmrZiUr3ub2VgRMvbAAH0TIDmFRij7g/DC7tNzxYLxzoCAXRMgJ1iixaMkBYPOCqWfwsIoF8ChIvtmdRSNiReIbqhsCEQQLcEOCQy569KZ1gMK0Zv+QUIoFcCPCmy/w7lHn2W6KbngQD6JIAhHjVlvDtBYuQseldWbZoJQHEmcEhb5ELWsPvKd1VMMiFXfFbRnL+hmABouF/2NNHC/5g16JVxDGSEKewCHHMQV76C8EaP62gncE0Dpx9BF6AW3ZCAP28x4Y1Fr6JXGi2ALkCHIQBSXpxHeude0QlMM9qCi9ddF5AkrFCKimPsfXO0lxGGLkAlHkPOrd2gYr9y1tvolXbToQvQGQYg5V1qbv5adBLnwoaU6onaBSFNhcUrlzEyg7uG+Z6N/y5N/MkrF5DA3/0zOPVQXzHAT8L6LBNLBD48fO/uRMztM0UZ4RfojAGoJcA5YX0iRALt/tkquhXjGUUZ4ezaQAA9ESBXWJ8g9HOXC498itk31l60luQbIICOCOAurE6FKNZZ8OjHOXXET1gl6gT60kgAWkcB9YXFtApU4LlHC96Y3cBzb6BXPnOnUFGMEEA0DeQZIihilgkWTUGvNJoPBNANkN0AZejnLYTHQeGO3v1lG3rlrbZAAL2gVDYrwHHXFTzEA0zPQS44bnQEAugEyFnlAR7I5+m3BcV47DNEGeGw6UAAfRLAIHIBgmRvBf6FvJsPoFcWBgMB9IEspByCCszMfaSw7Cr+KVPQrYHunwEB9IFi5OzfZqhAxtR//v+i1IKPa6K4v98LHAALrWUCE4X1+Y9YYlj6w8+2SG8WcDojygjXsU97IBOoEsixcLj3F3ivPHmfv/7DQLnHtNNKRhgIoBLThPW5Xwsr5ah4Cox4f3E/qghA7YKQU8Ki2ytYKeNdpefMvY5eoSsjTC0BziLJv6lmvmnvvigjHLwACKADlJ4XluuNNvNB+0SrBWaEAQF0AHQN2NvmPkicEf7CEQigfVxByq0mm/mgO6IzIsJmwLBf86MA7jk0ei9ube6jfkUfVWT7jDCMAtQiEb1QLbK6mY+agu4qdt8AXYDmcZVHr4SYm8hPno9e6TsWfL7WuwAuVXxC0AIzt0E4xts9IwxdQJWjwEp8ENPerEcZXzYiV+p8DF2A7oKASrQ5ucrDnGfFi86NfqEfB9B2FzAd/z6gFLP2eLkno89Jtm1GGLoAS3QBD9Bw71Yz3gWCyQgvhF+9tj1AY+mXgr1oxuO2oE+paEuDB6CYAI6l0u+FO9BY9ePqiE4S3g9dgKZhTJb+rM+FmWpHhOKM8BM9wfFr2QNwUbIvhzyjekS4D33EUfAAeowCzR4RijLCXZ+CPIB+CcA5zrikzoApH6BXYFZQ011AD+WXBG/zVRVWxqGvnvGELkDDSFQWGX15vJqwEs0IO+v/4CCaCZCZryzj/ZWaEeEZdAZgCLh+DXcBXAzRu+LvqxgR+pQI78212Q8IugDr9AGVcFsa24H0idmRwnKtBtAF6HcY8DceP/kx6YhwLVJuCATQDwGyJV//4zCddER4Oh4IoNsuwGvw89lSokE/E44IE4AA+gGy6985eFvzzTIjwgkkzywQFgOAABpGIXIKcDMuZ/wT1yRHhJsONlF+JjK0LAMC6KgPeHBKxMFWH1VIiUdcmOWk0gMUAgF0FAX+75yY4lntY6Tkqy2JUxoRhgIB9EuAh+fEnOs0o0jqjtYnP5HdPuLQjzICGCz1oAThMUzNyVNVTcMDAurXq2aN1tUKFBRv/31+aOD6AZI33Xz1Z+kndkTOHbieaWbVSjLS0tNOXyWWDxVudk0M1RqTzEsFG8KX/MHbDo/8uEdlSot9Kz0inG/ZCv2xJJzwJ0jlmkDDyCTepnh0Gaf3l9JyOVIjwqC7Fq9T0kgDqwToHcPbGKOE339FWjIaOyJ0/N0atYrpbUcC2C8I9Nge3d7W3yk8LfBQ6yXlkuS8MBszIpzTzRq1ah+93YPTPdR6gKCzvO0hOi2w1Ulp4XMdUelx5daq2Nkg1rqAbll2sD/mtECHaQWS0kbhiNDrWyvWLKsbWwToWmoP+/P3MFVpsEfGLIv/nu839L1h1aqVdmWJAIGZvH3gh6vNcxnSN1T8MKJH66CAMVus7rEyA9khgPsZO9mf74HPF31h4u2PM+7MjAI2trEXTZthr+ZN6n3F/j+hNhtZmQvoOZrTFgE47kjrxeV2Z8DonmwQwLDMfjoOkfqg9P2wk3ZnwDIDEwR4tiOnOQ9QiYtdpxbYmQAdn2WBAIYP7ajixjKHvJrWPrbbzgz40PYuwPavjw8X78TJOhETe8863+Z6WFB0Dk6SEb41dMQaf7LnJk+o4mKwmu07dBZNOjYOt38/ZPVh4FJRwm2lmxXrlSb8sgEK4l4biEaEJ/0tUDW3lUb0uUsZyAMggvyNLlat12Hhtylv6O6eomz/La6WqVwXNLuYQH8eIBQJxE1jjlv1+64QR4EP8bvihjLTzLGllqnc8TEmZJRi84U+NicAOgW88hinLQJwSlmqa4MsN449tlJBPfQRAOk8M+da+fsSCRMBf8PPT/bj9Nea77Vg9eZmyqqHQgLUExZPl3I29QABHlVyAHdnN1lv0ZRh6WlZ9dDvAeKs/X3JyDaQpko3PC49oPh8cL2l9y1cvzg7ewCb5wHqCotnrP195deFq/tCzqrzAHeKvGtwuWlpadf2xvNWqN8ZWfVQSABk/X++1b8wsYm6KBDxAItWc06OVuyn8mXVQ2EXYHOoHAa4IWFipcOoKKVYPcwRQGkY0BKZLThPuXroJ0CiOg+A9AA384AAdHmAmn6qYsCzHBBA57hdpMoFIB7gHBBA97iqhgCG1uABKA8C5KPAYE/wAEyPA5EQoCAZCMAWAZAQ4DwPBKCNAI0dVXgA6nsABmMAl4YqPMBZIID+cS+LvA+oFQQegPo+IITcAZguAAHo6wOakRPgSjEQgK1hAHMxIHQBjMeALBIgQHofvnML8AAUIkn4ri+DdB8Q6gIegEKU3SANApAQIDsdCMBWFMheCMAGAYjnA9kbBIAHkPMAQADGCBBQB7oAFgjg5UvmAEoTgAB0ILWYzAUgIcClCiAAHeCvmkUAFkIANghAmgxmcBTIJgEkPIBHE/AATCcCWjkAAdjwAI1dSUKAG3eBAJQSwOVJrFR/Bh0AIwTIvSMsj8QJ+Q5gMAZkhAAc8rrHIbhzGF5wBgJQi8PCYvUXxCKOLwnLpt+AAPTgCFJe004kshJZDRSXAwSgB/HIUTxuu9DjuKa8iVzYxwEB6IHxIHIhYHcDQXnopxwQgGasRS+0T5j9zwLAxjuj0OPSbp0EAtCEaNGo3v3DCxNaPTC7V4/lfwwT3bC8gg3FODFCAG7VZtGlZpu40ksZLbBvbc36ggMPQBW238ZddQ0bgH9r76piIABdKHtVjfTtf3NAAMqw5ytyWdPYAiAAdZh+g1h02SEOCEAd8l8kPek/5gMOCEAhjowkG9pdHV4OBKASO8cYCaSu9LrNAQHoxI6xygxI7JXGAQFoxbe9bipI/NoznQMC0Iujbb6X+7h4av9MDghAM/JGTMqW/PBU27U8BwSgHBuD38nAfvD7gE6JzGmDQQJwRSuDp4neAFa8q1uPvQwqw4ljESWffurT98ne9R4eG1x2/sD+Y6VMaoJRAlQie9s2zqFOXb/q2VlZdzl24cRw2zlTVhbHOhw4ABAAAAQAAAEAQAAAEAAABABAHoAJ7j8W4F/Pn0tPS7/9hwkIwBiqPTFs8D/nRWbtiTpQAl0AO/Bbf2fPxEfOC/WduOfOej8gACPwmJc0xUN0cUrSPA8gAAsYljS/Ou569flJw4AA9GPuD3WlPqr7w1wgAOVwj1xokP7UsDDSHUYBNMMtOlxe4NnA3sXgAejFpnAlifBN0AXQizmjlGVGzQEC0IrBi0ikFg0GAtCJav82kIgZ/l0NCEAl3qxPJlf/TSAAjfCeRSo5yxsIQCFme5FKes2GPACFVB8nvpYeH8e1C/MXXR830wQEoA2dRG8LvDz+9P/+2/Hr5sgnvp2OQxdAG9CJHn5F2J/2506HreAVhIEA+sdQpLz23b+XgJS8u1ZBGAige/gh74q7Jgj0Zl8TftrMFwhAGeoh5VeLHi0VoeeIBgABKAMS6t+PFpaj78uKAwFo8wDxyHFhxnh5hwEEoMwDxKCfx4AHoBvIIaFu6OfIhXIgAGVATn/sgH6OXEgHAlAGxKKtkdcHu7YGAjBFAOdnhOVnnIEAdOMWUl4tSPX4rlYQBwLoHXnIOK/O+kdL6+sgo8Q8IABtiELKT+/5e4NI3T1PKwgDAfSPXeiFQZfG1Xzw35rjLg1SFKYW7KwHOJ8SjFzx3swnx3HtGomXiqacBwLQhw1LRZcMjRvjRdnRCkNrAlcTR/a3VgMBKEQJ8bvAPigBAtCIzRfJ5C5u5oAANMI0geiXXTLBBASgE7ETSaQmxnJAAEqxbamyzNJtHBCAWrwXqSQR+R4HBKA4DBilsEN80SgTEIBm8HNH3pf+9P7IufDaONoR2S1G6qOYbpHMqYPBcwLPhI9Kxl1PHhV+hgMCsNAN/Lf59EvoxUvTm/+XZ1AZbB4WXbZ6dZNhwzr/xX7TiaioJI5NMHtcfNKKFa51Hx4Xn1HKMQuW3xtYeuMGxzzgjSFAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEABgPwKYhEUDmIAxAhQJix5gAsYIUCAseoIJ2CZADTABJQQoFxadgABkcJJVo3o5uxGA1LDQBcgqqpBQrkBzBCg0jwDMe4DqhIYlJYrePEAN8ACUeAAggEUIUMAaAZiPAaqDBwAPQIUHgCDQpjEABIGMjwIgBoBRAB0EqF0dCMCWB7iHJDFDoAugwwOQBoHGa0AAmT6Q/kwglwgEeFT/AazFAFwCEOARBLoKyzn0EwA8wKNoKixm5TPnAZqxvSqwmbB4hdMtAcrKBEVHT0IP4F4fPAABATwd5bStBQKg4UszKbncbOgDJNV0lVDOYoMACxIgldSuSB8QCh6AwAOEyCpbEwQgDu4gCvwHzg0JPUCIrA71RQAYB/6DYOFaTz6JBQKAB5Ds2m8V00MA6eEd4gEC/SEEUAwBDM20TwCk8m6BUoIpyBAmAjyAIgEC3UjzBfYjQH46oWs3JgEB/kJr82LA9HwNEoC8bz8BBHgI9w7mjQIt1wPYhQCHhMWGjZglQGdne48C7UKAaA5cwJ/oKSwWXGODAOkJQAAsAY4aaSJAfQ/SPqA3q/avFi4sH5ES9KivBwJcL5Mdukr3AXUfY5QA4chqkMOSo0VhUqXsuiYJgA7vpPuAw7yw3Ad6gAcojCPsAZKMmiQAeRBw5wIEARgCHKuwfQhgTQKEcaR9QE82D6tz6UzYA6Cq1AkBejqSEqBWGJME6OBGGAM69tQlAWpKm/U3pBMbCT0AxxXFSjqAmvogwMUK0q79Xryw/LwjiwToLywelzz4CVFkxUWNEqAglji4R/oAfxbHAYHdSEMARDuxBRolAGrWri6kktxYBgkw2kAYArh0lVeedtCHF6KHpGS1e0LJQgY3CZ8XqqDIWUqwB6JWi7pLi3qA46WkfUDJDmHZ42nm7N+qlbB8tJywByg9rlkCFJPP9H/DfB/wPFKO5AhjwBPF2m3UXKGvKpOeDzKkCEWNAYzZ33BTqICSmlKSHmVCybmcZj0AGp44d5eU5Lcg9RjDGAG6NxCWf7onKemslxiw0uKFQrIukxZtikQ2FxgjwAak/c9ISi5D4mVnLTdrr7CycXIRI6KBNkzZ3yVX2Pq7rpKicULJvZatiIWnYZClHm1qSYtuYToMfArRzPelUpK12siqWGNoj/ysh0uLepcKRbPdWSLADuKx/XBEsr2m2+WQJ6ztWhnZ75GWzWDI/vWRyP62tCdeK5TM0/jUeZSwukkyokMRAtx2ZYcAq5C2r5QWTRJKRmm8ZdOQlnWRGTLcQWSnMGN/7wKk6e0kRbsgktM03rSWSH0/k5H9FJFNcWKFAEjCjE+QFv0MEW2p9bZlCuubK+PXOyBt48cxYn+3LJ40ueeKDBczNd+4b5G2jZCRPYHIXmZkbeAbSLtNjSVFRyCi32q+ceioZbeM7CDUBTzLhP2dkHkQ/gdp2d3k42qNwAUJ7cp8ZITPIc07wwQBnkd5Hy4p6oMMF++4aL95a1WErSNRVQxigQAo7aPJB1VrddC8jkidY+XyRlcQ4RMM2H8Ayvp+0rKxiGhHPTTwMlJpuZ1/L6HKYGCT0BGkyfHSoo+hUbIuGjgbqfUSGVlnZFkEf4r6gcATKOefk5ZdgojO1kULGxiFtU6Vs+lUVB2vUG5/Z9RBXpXeE+GQiiybaqCPNh5QsYrVDUkc8Tl16CbAuyjjJ0vLoqusD+ikjeOQem+WE56JKuRLqu0fgM4CpMukSjfrNFPqgSwMK/SQEfbMQ9NinWkmAJoo5f9lIT1qCqqYuxBVyVmKNwr2Qht719NCnlRT6KMmwVe7kNfZjKf5cLqItvVDGekz1twRZFU4oIO7gXLS/4cq5V5dWgkwA21qrkzIOxCRvamjEfKHSN2PyQm7oXMj/FZK7V/3HtrS12Wkj6lwFlpDKNrQXnLSg3lV4vrFN2rCHVG4oKtXq5xGKr9fVhqd8+QvOdNo/24ioneTkd6PyJ7WVVtf5dXMYjS8j4q/T6H9PZPQVm6RkUbn1PhXddVYd3TR0y5Z8ffR1lZ0p48A29BG5ssFu7sQ4SydbZuYhaZ3WslJuySiyrlFXUZ4gqgDeEtGupUJEZ6lN3+Xp2oxW1+RdvZS9kbREFG645LcImg0Y5jnqbcGowm+iqay4pEiBsyiyv6uZ3k1Sx+aViDCC3XX4trorMdGWXHRJAlf3o0mAnwqsn+knPhGRLigtv6avBxpQ5n8ZPbbIg2l1qbH/kNFrSuSU0cDZC0ov1yPaa9ipBFrZMWdLoh09BM1YUD9HFHj5sjJr0GEi3WZHF+HtOK+r6x4DxOvYqpUV3A8ImpanNz6bl80L7JOl80OUunHPhJpqbwrHQSYL2pZQVNVvWeQPtu9CWlHqXw22+moSE83qQgDnjGKGiZ7HEoocnQGv0mnDW+GNvygQk95R6Sow9X0b/8eJaJmyS/tOIhIG5vptenb0YaPlpd/ShwGROl+eVCLPFGjEmUPxh2Nim/XbdtF+cx0hXzWEpGu+K90PhSonypqUmlbuRs801Vl0bUNdEaDXy0v7/S7mAErdW1/r4viFr0pe8dqXtU8mrYhmtOsaCt/Q0A2r27ErHG4igeA/B7ZO9pWqJpJ1zr2oa05oeDRnxSHATreLOTwnbg1t2RHNgb00Ax+n74jIDQXwE9SuGOxWGVG3Z4b8SmmMb1k75iEype10HcMtIxXufULkzXjS/vqs/GzxE3hF8jeUUeUM16m80GQR6rarV/1ssRaKwzXY9snY+y/X35Y+6VoRsxD5wTgnkGbZOqicEffCrHeclrQ8fs/Kz8O7iKKgJ7RfyJsL9qmc0q5nQkYzWV10Fu7l2Nacd1fvvs7J1oXpX/7c43RaWF+utIt72J0V/iUrlrtuAnThhyFpf3T0RuKG1NAAPFcWL7i5NZHGO2Vj9fT+H8npgXFCpObQfnoHfNpsD9XTbQe/qTivo8vMfrTUUaoxiFM9Y0KZ/w5n0TvSKpGBQG4/iJdrFL0oD/gGLBWJ9sjfWJxtX9N4a5Vojv6c5RAnA8bouhDo3E6/F4XP4nARFzdlfZ2DhHd8R0t9ucaiNbE5yqGATXicFr8zUv7rW2eiqu50ukOQbmisLcBNQTAhPXKYYAP9nd0sb7W2zr8Lq7e+5zVBgD8u/TYn3O+qD4M4IJu4TSZ2lbbLV2FqzQfp/RuZPFtF6naId2DVx8GcI/l4HRZMlXL3f8JrP1PKq1tFAcAMm/e1iVEZyMQhAFcp3tYdUZ5a7WVA7GU5fcpJfTFAQD/DV3257xSzAgDuDZpWIXe1OauMaelJmx1tyud8Y4JAFK8KCMA17HMjDCAa5iAVWnF+xrMCNT7DVtXfp1iXcUBQFlHjjrMMCcM4GrjO1U+2l9r7eubha/pAsU7MQEAle9QjDInDODc9+D1mqWtySHXxUZsNU1vKI92xAFAFI3252pdFzX0lJvybY4b8QwwrdDQOCkiEV/JstGKt7qdEs8a16KSAFy4OAzYQ/KqwIV45fLntDJS8t0iUcMi5Wy+k9jDlYVzlOItzL4PkvumVEgoeGs9DbTK8EquRPVyCc69/opXdXaQzrFb3NqPSO4bViyh4oJ/2b0faC0RpvJ8MsE6NszKh9302p/zvmFmwNtV6kfGJzxp1xZ5rCiXqlkUwVAeMzS64U0xAbjOYnWZXiC5sUmclJ75nQ3t156hN6VqVf42we0viDNH5VS/LoHj3sFEykTrHlxWSzKgeJ6dlgn0PChZp9QuBPf3F0fF/Dt0258z7DF71f/QHEl1pzxvhxeP9/1Nsj78LyTnXIYXYjYOGignAOeNcZp3yA7CbnBUWuMpU218lOrAk9KVMc4lyVSH3sHMcnhz1KMLJmq6EUB0q+Mio7TWs+fZ7jwZw3DpkITnM4jefhmACYjLu3AMYCJuoQ9h7qtPuozii9bY5jAlh+fOy9SCP0w0TVELc3AAP5FjAnMwTT/qRnav7z453Zf/p7XVa+/58mW5Kpg+JDrUxu2orte9VxG4gP4nwkjeMLNcTv/8z32sGUY59Nt6X/brL5AtVaj2E+be1azYnzNswzT/SE3Cu8PPyZqAT11urWWDzZfekv/qIsLEZE3MHnh+m4EZAnDOv+Lmdkin+B2n3ZW3A395ruU31Xm/flrhW/ndhDGIP47CvzpzDKE6TpnJTUhv9/tGyRb8qTcteb5utSHflyp9481hhA9rkoy5+3R1jilgV/1nhhHf3+2cIgUqfh1vkXl1h7CZ+4sVv618OelRDmGZmNsTfTjG0PA2Rg35EcT3O755T9EovPHsp89WzRE0mhx5hyfAMeLD/CLyMbffbsgxh1Z5GEWUqjgPqu43PBGubBwXbFYNaz+7IZnsK3ImEQdwz+K6krxWHIPojvOrRjVvR+t+nidE6tYpbVW8dad6hxc/2nPNRPjwolXk/vtVXC6zuDvHJIZiF/rMV/EEp9dTeXJkn/p20Uu9Gsjm6T07vbTi5+smFU/NX6Ki+56PDVaG2nNIbk8GTMS+R2j9GyYVA8qxM9WepV2Wknw9v/gvlBTzXrX++Uft2+rurvkkjzycXIv1by9/ybGKOdjf1A4XNc9wGBHH2wvZc9S8zc1lB6/vg0+sgLlYlRzyU/eUJw/bxfwZ76g6xM/vEPYpczmmMRk7wZveW+VjOu822dr8t6a5qapib+xEpnEyxzieLsHqZZ7azX+ttlbY0vy/T1DVT3EO87BML3maYx498Yn9g6oTOMGLUmxk/ZQFaqca6uJXD97tCfbnuMfxizwy+qgf0nTfkGd16xd81Uv10KlPBvZR6Y+D9f+Xbr2Kz+MuNON9Qa5P7yy1ovVNB8aqP73ZcSF+JdvVRmD7P+ErMZA7ZNYecO9XjlrJ/FfeCzSjPv746J+P8wXL/4UaB/A6yuxn3vOC5162tPGLD8xqZ1Zd+mXiH3igBtj9kRxJpITLXWTua+MCx22yWExojF36hJl7TxwXSYxPI13A6sIsqYTyj1RhA3DQi19fr7L1r20YYf5683pHJJ6ql1Nv7Z4U5Pmcl6s0X9Fw/OYb5tq+PGH7pOAqfLfhZanNTHPB3qRJwUqcaFPFJwcPn7npaLYa05de+O+851pW0Uu3kdo4Duk/PCKkdn1UrKlpgcfX6jRu8Y7zSou7CuP/M2dYiAVeWFtzjVRqMj1CQ0rX1FJkv61SyZ+Mt7dZqsGBwZ7VK1Hj4R9Xg/Fu3iMottD3jFkplco8+Hwm/NilQsEPJDf/RTfXU0OaR0uOKD6A8E8OvdOkNFe2VDdvUPNYWibVirTeYGOFrOB+ye75xnB9NGG49LBjP2T/lLuB96XndX/SQfa80U/SOxXeB/dPgp5p0gnZBTW1XfeaC6SHGWkw+UvaDcjsAb+7qI52K15nkcyuxX3g/snHau/JLO8pXOGvzVr7ryiU2aj2ngHsqgI9bsvNzK0L0l6Ng9bJ5Zhu9wCbqoNPlFy+rmxTU21Vt+mmMrn6RvmARVVjsOx0rnFbS+1UteU2o+wawsFgTXPgtlh2dZdpZ3tt1LP9Ttk16aWL3cCWZiLkgPzMzS997B5ZGfr8Il/HAyFgxypgVJq8em8stqt+QxYrLDZIGwU2rBpqfKy04ePU67XtU7Xar59SOqTkY1j4V3U8fkxp+UbZzuE2X2HnMnxnmeKxIbDu3zLd7EvKq3ly1nWyZZU6rctR3jr8EqR+LAXvzwn2fia+b6P0UND7iQRbSD73BrtZEOExJPt2Dr/TzsrzbQ7t3jlMshE5JhxsZmEMPE60nDN351SrZYhaTt2ZS1SJ4wPBXlZAxEHCNb2Z21+xeKa46SvbMwm//mAE2MpK6Pwj8cLu1M3jAy31tYHjN5MfRvVjZ7CTFdF2h5F8dX/S55N6+FXt+/x6TPo8ScUmsh1tdaZQ/Y1Ums8eo2rV/t3ExMSExKRSlV/j2iQkNCQkRNVb3I3bllzmgABWR6OZ41XnfUzXEyqJkJhOIOpfafeQ0IaqhxNlX3+UrMMkiy47gvrvTDZvhq3gTgECrgaCOuZlb4s/X3ELemjbwXeRmjNCrY7URbDgz9Zw6LO5QBvWL9jcB5Z72wUeY/cb7W194/6xHmAJ+yHgXxftaf6L/woAG9gbYZ9k2sf6mZ+EgfY1AadBkcW2tn5x5CAn0Lx24DUpusR21i+JnuRFieIoWrPg1iUior31f5UVsdHRx4up0Rpli1Zq9Ogd8bj1xmSmc9GHfiugSmMUrlry7hURYY3jRC5HRx/OpU5blC5bq9s7IsKSZwkkR0cfyqBSUxSvWwxqHxoSGuJZxafkJyYkJsTeoFZL1C9c9Q95QIMg9XGB6cYD0xPNHwIBNI9qTUMredCMbKKv4Eql5ROuljChGbaWrnt71qj+YMq3+sM/lX9xBYUPZoULH/6p/Cs/lyWV/D/dKhlrZ/WY1QAAAABJRU5ErkJggg==",
-    # Shower without plug
-    "shower_1": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAAOxAAADsQBlSsOGwAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAACAASURBVHic7d13vC1Vff//1y30piBFEA+iYi9YfooFFI29RMWu2I29G0w0scT+VWOiiQ2NYuy9xAKxocbYSyII0gREEJQm7cK95/fHuiee2evsc/dea82aPbNfz8fj8yABZ/ZnzS7zPlPWrKGsdcCBwMHAjYEDgH2BXYCdgPWFX0+SpCG5CrgYuBA4AzgBOA44FvgpsKnUC60psI51wN2Aw4H7AFcvsE5JktR0PvAfwAeBrwEbc1aWEwC2B54CvJDwV74kSarjDOBNwJHApSkrSAkAa4EnA68Gdk95UUmSVMTvgZcC72PK0wPTBoCbAO8FbjflcpIkqT3/DTyJcL3ARNZNsfLDgc8C15myKUmS1K5rAU8EzgV+PMkCkwSAtcDbgNcCWye3JkmS2rQVcH9gN+CrwOJq/+MtBYCtgQ8BTyjSmiRJatvtgBsCn2eVOwVWCwBrCTv/h5XtS5IkteymhLl4Ps2YIwGrBYC34V/+kiT11U0Jc/N8ZaX/OC4APJFwm58kSeqv2wGnAj8f/Q8r3QZ4E+AHhIl+JElSv10C3BY4fvm/XDvyP1oLvAd3/pIkDcUOhH1744/+0QDwFOCgWh1JkqQq7gg8fvm/WJ4GtgdOw+l9JUkaorOB/YHLRv/Dcwm3CpSqE4E3AHcB9gO2bWtEkiQNxLaEfeZdgTcCv6bsvvlZoy+4Dji90MpPAh5OmUcNS5I0z9YAjwBOpsw++jRGTv/fs9CKPwJsV3jwkiTNu22AD1BmX3235Sv+9wIrfGUbI5YkSUA4GvAP5O+vP7C0wnXAHzNXdlRrw5UkSUvWkP9H+3lsPg1wm8wVnYQX+EmSVMt2wCnk7bsPXAscnNnIS4HLM9chSZImcxlh35vjEIAjSU8QJ+LV/pIk1baGcAQ+df/97rXADTIaGPuYQUmS1JpF4DMZyx+wFtg3YwVfzVhWkiSl+3LGstdeC+ycsYJTMpaVJEnpTstYduc1wAZgq8QVbIcXAEqS1IVtWWFe/wltWEP6OfyNwPrEZSVJUr6rCPP5TG30ccCSJGkOGAAkSZpDBgBJkuaQAUCSpDlkAJAkaQ4ZACRJmkMGAEmS5pABQJKkOWQAkCRpDhkAJEmaQwYASZLmkAFAkqQ5ZACQJGkOGQAkSZpDBgBJkuaQAUCSpDlkAJAkaQ4ZACRJmkMGAEmS5pABQJKkOWQAkCRpDhkAJEmaQwYASZLmkAFAkqQ5ZACQJGkOGQAkSZpDBgBJkuaQAUCSpDm0vusGZtAOwAHAbsDOwLpu25EkJbhkc50KnAEsdtvO7DEAwBrgTsDDgUOBG3XbjiSpsIuBY4EvAx8Dzuu2ndmwhvRUtJF+B4j1wOHAEYS/+CVJw7cB+BDwOuDXHfdSwlUkHqme1wBwEPAu4GZdNyJJ6sQG4C3AK4HLO+4lhwFgQmuAlwCvon+9S5LK+xnwUOCkrhtJZACYwDrg3cATu25EkjRTzgXuC/yw60YSJAeAebkNcA3hkL87f0nSqN2B/wRu2XUjNc1LAHgZ8KSum5AkzaydgS8Ce3TdSC3zcArgYODreD+/JGnLvgLcu+smpuApgDG2Bt6JO39J0mTuBTyq6yZqGHoAeApO7CNJms7rCX9ADtqQA8A64MVdNyFJ6p19gcd23UTbhhwA7gEsdN2EJKmXBn/h+JADwMO7bkCS1FsHMfA/IoccAO7adQOSpF67W9cNtKkPt/Gl2Au4duY6zgJ+AlyW344kqbJrA7cmbz93W+B9ZdqZTYuJdVUXzU7oENLHtQi8gzm4AlSSBu42wO9J3xd8vX7LU7uK9PENMgAcRvq4Tga2qt+yJKkFTyJ9f/C/HfQ7reQAMNRrAHbMWPZ7wJWlGpEkdepbGcvm7Etm3lADQM7Mf5cU60KS1LWc3/RBzyI71AAgSZJWYQCQJGkOGQAkSZpDBgBJkuaQAUCSpDlkAJAkaQ4ZACRJmkMGAEmS5pABQJKkOWQAkCRpDhkAJEmaQwYASZLmkAFAkqQ5ZACQJGkOre+6AUlSlh2BewAHArsB5wLfB74OXN5hX5pxBgBJ6qe1wAuAvwWuvsJ//x3wd8B7azal/vAUgCT1z1bAp4D/x8o7f4BrAkdurnWV+lKPGAAkqX/+GfjLCf+3TwI+iCFAIwwAktQvtwH+asplHgl8BE/7ahkDgKQ+Wwc8CvgscAZwAXAqYWd33w77atOzgDUJyz0UOAqPBGgz06D6YB1w+821O+FH/ifAt4ArOuyrK2uAQ4F7Adfb/P+fBhwNfBXY2FlndV0f+CRw85F/vwuwH/AI4Jub/3lOzcZadveMZR+5+Z+PZX4+J1rFYmJd1UWzE3oS6eN6Vwf9jrMdcCPgVsA+HffSlYcAv2bl9+ps4Bmk/TXUV7cCfsz4z+9xwMGddVfPDYDzmOw7fRqwfyddlreesONO/X1bqg8zP0cCrkn6djqjg36ndRXp4zMAjNQsBIBbA58GLqXZ26+BI4Dtu2utqtcz2Xv2cWCbjnqs6V7AJWx5e2wAHt9Ni1VsRQg603yvT2cYIWAN4f3NDQBL35t5OApsADAA9CIArCHc07ulhP8rwl9AQ/YcpnvfvsSwQ8D1gQuZfHtsBJ7YSafteypp3+2hhIBfUSYALDIfRwIMAAaAXgSAl67S12j9kXCkYIj2Av7E9O/dV4BtO+i3hk8y/fYYagj4Junf79OB61bvuKw3Uy4AzEMIMAAYAGY+ANya6c/tnUt8AdQQvIz092+IRwJ2J/287ybg6fVbbtUkp0G2FAL6fCRgH+LTg7k15NMBBgADwMwHgE9P0ePyGmIIOJa8H7OhhYAHk7c9hnQkYFvK7PD6HgKeQZntsLyGGgIMAOMreUEDQDnbkZfohxYCTiP/x2xIIeCZ5G+PIYWA3CMAS9X3EPAGymyH5TXE0wEGgDHlRECz4TqEEJDqGoTzokO5JqDE/cn3Bj7HMK4JuLTAOtYS5oQfwumAHxVaz76E701frwk4AnhN4XU6Y+CcSU1GHgEo5zYZ/S6voRwJOIZyf9EM4UjA7Sm3PYZwJODplP2rt+9HAl5N2e2xyLBOB3gEYHwlL2gAKGefjH5Hawgh4PmU/THrewhYB/yWctuj7yFga+BEyn5GDAFxDSUEGADGV/KCBoCySv6g9f0WwV2YfJa3SavvtwiWuA5gefU9BNyU6eZFmKQMAXENIQQYAMZX8oIGgLKOmKLHSarvRwIOI9zCVnKb9PlIwFrg85TdHn2/RfAOtBMC+npNABgCVmIAGF/JCxoAytqesjN8LdL/EPAiyv+Y9TkE7AR8h7Lbo+9HAgwBMUNAkwFgfCUvaAAo7waEnXbJL27fQ8ALKP9j1ufTATsA36Ds9vBIQFyGgLj6GgIMAOMreUEDQDtuBPyOsl/cvl8TYAhoMgTEDAExQ0BgABhfyQsaANpjCIgZApoMATFDQMwQYABYrZIXNAC0yxAQMwQ0GQJihoDYvIcAA8D4Sl7QANA+Q0DMENBkCIgZAmJthICP0Y8QYAAYX8kLGgDqMATEDAFNhoCYISA2ryHAADC+khc0ANRjCIgZApoMATFDQGweQ4ABYHwlL2gAqMsQEDMENBkCYoaA2LyFAAPA+Epe0ABQnyEgZghoMgTEDAGxeQoBBoDxlbygAaAbhoCYIaDJEBAzBMTmJQQYAMZX8oIGgO4YAmKGgCZDQMwQEJuHEGAAGF/JCxoAumUIiBkCmgwBMUNAbOghwAAwvpIXNAB0zxAQMwQ0GQJihoDYkEOAAWB8JS9oAJgNhoCYIaDJEBAzBMSGGgIMAOMreUEDwOwwBMQMAU2GgJghIDbEEGAAGF/JCxoAZoshIGYIaDIExAwBsaGFAAPA+Epe0AAwewwBMUNAkyEgZgiIDSkEGADGV/KCBoDZZAiIGQKaDAExQ0BsKCHAADC+khc0AMwuQ0DMENBkCIgZAmJDCAEGgPGVvKABYLYZAmKGgCZDQMwQEOt7CDAAjK/kBQ0As88QEDMENBkCYoaAWJ9DgAFgfCUvaADoB0NAzBDQZAiIGQJifQ0BBoDxlbygAaA/DAExQ0CTISBmCIj1MQQMPQCcT9rYLiBxwUUMAH1jCIgZApoMATFDQKxvIWDoAeAnpI3tpyQuuIgBoI8MATFDQJMhIGYIiL2B8t+bDwFrW+h16AEgNZC9hsQFFzEA9JUhIGYIaDIExAwBsTZCwOta6HPoAWBv4E9MN65LgX2ZcqHlZQDoL0NAzBDQZAiIGQJipU8HbAIOLNzj0AMAwDOZblzPXFowdcMYAPrNEBAzBDQZAmKGgFjpIwEfKtzfPAQAgL8nfL+29P17+fKFUjeMAaD/DAExQ0CTISBmCIiVDAHnA2sK9jYvAQDgbsAPWXksPwLuPrpA6oYxAAyDISBmCGgyBMQMAbGSpwOuUbCveQoAS64PPBp4zuZ/HjDuf5i6YQwAw2EIiBkCmgwBMUNArNSRgL0K9jSPAWBiqRvGADAshoCYIaDJEBAzBMRyQ8ClwLqC/RgAVpG6YQwAw2MIiBkCmgwBMUNALCcEfKFwLwaAVaRuGAPAMBkCYoaAJkNAzBAQS70m4C8K92EAWEXqhjEADJchIGYIaDIExNoKAderOYjCpj0S8JEWejAArCJ1wxgAhs0QEDMENBkCYm2EgDPodwh4OVu+P30ROBrYvoXXNwCsInXDGACGzxAQMwQ0GQJihoDYfYFfsvLY/gD8NWUv/FvOALAKA4ABYDWGgJghoMkQEDMExNYCtwWeC7yWsNO/N7Bdy69rAFiFAcAAsCWGgJghoMkQEDMEzAYDwCoMAAaASRgCYoaAJkNAzBDQPQPAKgwABoBJGQJihoAmQ0DMENAtA8AqDAAGgGkYAmKGgCZDQMwQ0B0DwCoMAAaAaRkCYoaAJkNAzBDQDQPAKgwABoAUhoCYIaDJEBAzBNRnAFiFAcAAkMoQEDMENBkCYoaAugwAqzAAGAByGAJihoAmQ0DMEFCPAWAVBgADQC5DQMwQ0GQIiBkC6jAArMIAYAAowRAQMwQ0GQJihoD2GQBWYQAwAJRiCIgZApoMATFDQLvmMQBcC3gAYV/4gM3//4oMAAaAkgwBMUNAkyEgZghozzwFgDsA3yR++uIm4Fub/3uDAcAAUJohIGYIaDIExAwB7ZiXAPBCYCOrj2cj8KLlCxkADABtMATEDAFNhoCYIaC8eQgA0+7znrS0YOqGMQBoSwwBMUNAkyEgZggoa+gBYA/gIqYb18XAXky50PIyAGgShoCYIaDJEBAzBJQz9ADwCtLG9koSF1zEAKDJGQJihoAmQ0DMEFDG0APAD0kb249IXHARA0Bb9gJeRrhi8zfAycDRwPOAnTvsK5chIGYIaDIExAwB+YYeAM4nbWwXkLjgIgaANjwHuGRMX4vAucBhnXWXzxAQMwQ0GQJihoA8Qw8AV5E+vuQFDQBlvX7C/jYxchtHzxgCYoaAJkNAzBCQzgAwvpIXNACUc1hCn3/dQZ+lGAJihoAmQ0DMEJDGADC+khc0AJSxDjgpsVdDQLMMAXEZApplCIhr6CHAADC+khc0AJRxcEavi8BLK/dbkiEgZghoMgTEDAHTMQCMr+QFDQBlvDij16XySECzDAFxGQKaZQiIa6ghwAAwvpIXNACUMenFf1sqQ0CzDAFxGQKaZQiIa4ghwAAwvpIXNACU8TcZvY6WpwOaZQiIyxDQLENAXEMLAQaA8ZW8oAGgjHtm9LpSGQKaZQiIyxDQLENAXEMKAQaA8ZW8oAGgjG2AczL6Xak8HdAsQ0BchoBmGQLiGkoIMACMr+QFDQDlPDOj33FlCGiWISAuQ0CzDAFxDSEEGADGV/KCBoBy1gAfT+x3tTIENMsQEJchoFmGgLj6HgIMAOMreUEDQFlbA5+fsMdpymsCmmUIiMsQ0CxDQFx9DgEGgPGVvKABoDxDQMwQEDMENBkCYoaAPzMAjK/kBQ0A7TAExAwBMUNAkyEgZggIDADjK3lBA0B7DAExQ0DMENBkCIgZAgwAq1XyggaAdhkCYoaAmCGgyRAQm/cQYAAYX8kLGgDaZwiIGQJihoAmQ0BsnkOAAWB8JS9oAKjDEBAzBMQMAU2GgNi8hgADwPhKXtAAUI8hIGYIiBkCmgwBsXkMAQaA8ZW8oAGgLkNAzBAQMwQ0GQJi8xYCDADjK3lBA0B9hoCYISBmCGgyBMTmKQQYAMZX8oIGgG4YAmKGgJghoMkQEJuXEGAAGF/JCxoAumMIiBkCYoaAJkNAbB5CgAFgfCUvaADoliEgZgiIGQKaDAGxoYcAA8D4Sl7QANA9Q0DMEBAzBDQZAmJ3BC6i7DY5Gdit5iDGMACMr+QFDQCzwRAQMwTEDAFNhoBYGyHgU1VHsDIDwPhKXtAAMDsMATFDQMwQ0GQIiJUOAZuAW1YdQcwAML6SFzQAzBZDQMwQEDMENBkCYqVDwD/UbT9iABhfyQsaAGaPISBmCIgZApoMAbGSFwZ+oXLvowwA4yt5QQPAbDIExAwBMUNAkyEgVupIwLG1Gx9hABhfyQsaAGaXISBmCIgZApoMAbESIeAT1btuMgCMr+QFDQCzzRAQMwTEDAFNhoBY7umA59ZvucEAML6SFzQAzD5DQMwQEDMENBkCYqlHAi4F9u6g3+UMAOMreUEDQD8YAmKGgJghoMkQEEsJAa/spNOmoQeAjaR/HpM3jAGgPwwBMUNAzBDQZAiI3RE4n8nG+nlgXTdtNgw5AKwlfWwbyFjYANAvhoCYISBmCGgyBMQOAL7P+PFdDrwWWN9VgyP2Jv29mvUAsBXpY7uMjIUNAP1jCIgZAmKGgCZDQGwNcE/gHYTb/H4EfBF4CXDtDvtayX6kv0+n1m93KtuSPraLyVjYANBPhoCYISBmCGgyBPTXAaS/Ryd10O80diB9bBeQsbABoL8MATFDQMwQ0GQI6Kebkf7+nNBBv9PYhfSx/YGMhQ0A/WYIiBkCYoaAJkNA/9ya9PfmuA76ncaupI/tHDIWNgD0nyEgZgiIGQKaDAH9chDp78svOuh3GnuQPrazyFjYADAMhoCYISBmCGgyBPTHIaS/Jz/toN9pLJA+tlPJWNgAMByGgJghIGYIaDIE9MM9SH8//ruDfqdxQ9LHdhwZCxsAhsUQEDMExAwBTYaA2Xc/0t+Lb3TQ7zQOJH1sPyZjYQPA8BgCYoaAmCGgyRAw2x5M+vvwHx30O407kj62b5OxsAFgmAwBMUNAzBDQZAiYXY8k/T34ZAf9TuPupI/taDIWNgAMlyEgZgiIGQKaDAGz6XGkb/+jOuh3GvcnfWyfI2NhA8CwGQJihoCYIaDJEDB7nkr6tn93B/1O42Gkj+2jaztoWP2wATgM+ELh9b6a/oaA44FDgbMLrvPqwDH0NwS8BXhh4XXeE/gs/QwBlxAuOvtmwXWuAf4FQ0Cqq2cse0mxLtqxU8aylxoAtBpDQMwQEDMENBkCZstuGcteUKyLduSEmwsNANoSQ0DMEBAzBDQZAmbHkAPALhnLXgjp5w+8BmC+eE1AzGsCYl4T0OQ1Ad37LOnb+nEd9DuNt5E+tueRsbABYP4YAmKGgJghoMkQ0K1vk76d/7KDfqfxQdLH9ngyFjYAzCdDQMwQEDMENBkCuvNL0rfxXeq3O5UvkD62B5GxsAFgfhkCYoaAmCGgyRDQjZzv5YEd9DuNY0kf213JWNgAMN8MATFDQMwQ0GQIqO8K0rftPh30O43/IX1styJjYQOADAExQ0DMENBkCKhnZ/K26zb1W57K2aSPbX8yFjYACAwBKzEExAwBTYaAOq5D+vY8v4N+p7GOsB9OHd8OZCxsANASQ0DMEBAzBDQZAtp3a9K35Qkd9DuNPUgf2//NcJi6AgOAljMExAwBMUNAkyGgXfckfTt+p4N+p3FT0sd26tJKUldgANAoQ0DMEBAzBDQZAtrzFNK34ac66Hcah5I+tu8vrSR1BQYArcQQEDMExAwBTYaAdrya9O339g76ncbDSR/b/03tnroCA4DGMQTEDAExQ0CTIaC8fyd92/1NB/1O49mkj+19SytJXYEBQKsxBMQMATFDQJMhoKycaYAf00G/03gD6WN73dJKUldgANCWGAJihoCYIaDJEFDOGaRvs7vUb3cqOUc3nre0ktQVGAA0CUNAzBAQMwQ0GQLybUXeffLXrd/yVL5F+tgesrSS1BUYANqzO/Bg4FmEJzYdRJj0oa8MATFDQMwQ0GQIyLM/edtp1j83p5A+vtstrSR1BQaA8q4PfBLYuEJfvwWeCaztrLs8hoCYISBmCGgyBKS7K+nb6JwO+p3GGuBy0se399KKUldgACjrnsCFE/T3RWDHjnrMZQiIGQJihoAmQ0CaJ5C+fb7XQb/T2JP0sV3JsiPKqSsxAJRzK8LUjJP2+B1gpw76LMEQEDMExAwBTYaA6b2C9G3zofrtTiVniuPTl68odSUGgDLWAD9O6PO7GAJGyxDQLENAXIaAZg05BLyf9O3yqvrtTuUhpI+tMcVx6koMAGXcPaNXjwTEZQholiEgLkNAs4YaAnKukn98/Xan8mLSx/ax5StKXYkBoIw3Z/S6iCFgpTIENMsQEJchoFlDDAHnkb497txBv9N4J+lje93yFaWuxABQxqczel0qTwfEZQholiEgLkNAs4YUAq5J3rbYp37LUzmG9LE9ZfmKUldiACjjMxm9Li+PBMRlCGiWISAuQ0CzhhIC7kH6NriQcG3WLDuZ9PEdunxFqSsxAJTx1oxeR8sQEJchoFmGgLgMAc0aQgjI+Zx8f4X1zZL1wAbSx7ff8pWlrsQAUMZ9MnpdqQwBcf1tzUEUZgiIGQKaDAGx95I+9vfXb3cq1yV9bBsYmVU2dUUGgDLWAb/M6Hel8pqAuAwBzTIExGUIaFafQ8APSB/3ER30O417kj62E0dXlroiA0A5B5N3SGel8khAXIaAZhkC4jIENKuPIWAt8CfSx/yA+i1P5fmkj+3LoytLXZEBoKzHs/IzAHLKEBCXIaBZhoC4DAHN6lsIyHkI0CLhmSyz7F2kj+3toytLXZEBoLwnUD4EeDogLkNAswwBcRkCmtWnEPBA0sf5J2b/gWvfJn18zxxdWeqKDADtMAQ0GQJihoCYIaBpJ8IRwJLbYyPLniM/w15K+hhn/SFAAOeSPr67jq4sdUUGgPYYApoMATFDQMwQ0NRGCLgYWKg5iAQfJn187+yg32nsTt77t9foClNXZABolyGgyRAQMwTEcuZIH1cfZ/YnhhmnjRDwnqojmN7xpI/tGR30O42DSR/b+SutMHVlBoD2GQKaDAExQ0CsjRDwtKojKKv0NQEXAFtVHcHkdiNcr5A6toPqtzyVp5E+tv9aaYWpKzMA1GEIaDIExAwBsdIh4Cxmd6c3idJHAm5Yt/2J3Y/0MW0Edqzf8lRyHgL03pVWmLoyA0A9hoAmQ0DMEBArHQIOpd9KhoA7VO59Uq8mfUy/6qDfaf0X6eN70UorTF2ZAaAuQ0CTISDWRgj4PXDzmoMorOSFgS+o3HsbSoWAA2o3PqGvkz6mD3TQ7zTWEi7CTB3fPVZaaerKDAD1GQKaDAExQ0Cs1JGAV9VuvCW51wScy8h88jNiHXk7yOge+RlzAHmf3z1XWmnqygwA3TAENBkCYoaAWIkQ8KzqXbcn50hANJvcjLgVee/vbeu3PJWHkT62c8atNHWFBoDuGAKaDAExQ0As93TAgfVbblVKCLgA2LuLZifwTNLf28uBbeq3PJXXkD6+r4xbaeoKDQDdMgQ0GQJihoBY6pGA/6G/cwGsZifgWCbbBhsIjy+fVf9O+ue6DzMAfpH08b1x3EpTV2gA6J4hoMkQEDMExKYNAZuAe3XSaR3bEH73VvstOQM4pKsGJ3Qy6Z/pt3bQ77TOIX18jxq30tQVGgBmgyGgyRAQMwTEXsjkE8a8rKMea7s5YUf4U+Bs4BTCX51PZfanQ96TvM/zYfVbnkruEw5vPG7FBoB+BwAwBIwyBMQMAbEHEXZ048b3B8JjujX7HkTeZzmaI3/GPJz0sV0KrB+3YgNA/wMAGAJGGQJihoDYDsBTgE8CPwN+AXyWcEHZLh32pen8C+mf4RM76HdabyF9fN9ZbcUGgGEEADAEjDIExAwBGqJfk/75XXGK3BmTM3nTm1dbsQFgOAEADAGjDAExQ4CG5DrkfXafUL/lqawHLiF9fI9YbeUGgGEFADAEjDIExAwBGoqcJ+QtAter3/JUDiRvfPuvtnIDwPACABgCRhkCYoYADcFnSP+8nla/3ak9m7zv46oMAMMMAGAIGGUIiBkC1GfrCbMTpn5Wj6zf8tQ+Rvr4vrillRsAhhsAwBAwyhAQMwSor+5M3uf0kfVbntpvSR/fy7e0cgPAsAMAGAJGGQJihgD10atJ/3xuYvbv/8+dAOgvtvQCBoDhBwAwBIwyBMRuRthplw4BN6k5CM2VH5D+2fx5B/1O63Gkj+9KJvh9NgDMRwAAQ8AoQ0CsjRBwCrBbzUFoLuxG3u/ZqvfHz4j3kD6+H07yAgaA+QkAYAgYZQiItXE6YFafIa/+egR5n8m71295aseTPr5/nOQFDADzFQDAEDDKEBArfSTgcmDnqiPQ0OU8/vdiwlMQZ9ne5H3nHjzJixgA5i8AgCFglCEgVjoEPLBu+xqwbYALSf8sfrZ+y1M7nLzv20QXOBoA5jMAgCFglCEgVvJ0wHMr967hegB5n8W/qt/y1D5A+vhOmPRFDADzGwDAEDDKEBArFQKeU7txDdZR5H0WF+q3PLUzSR/feyZ9EQPAfAcAMASMMgTESpwOuH/1rjVEWwPnk/45/EX9lqd2I/K+a6s+AGg5A4ABAAwBowwBsZwQcBn9/SxottyPvO/gK6p3PL1nkT6+TcCek76QAcAAsMQQ0GQIiKWeDvinLprVIL2fvO/fLap3PL2cBxxNNcGRAcAAsJwhoMkQEJv2GZMadQAAIABJREFUSMBJwK6ddKqh2Qr4A+nfu1Prtzy1rYGLSB/jVBMcGQAMAKMMAU2GgNhNCDP8TbLzv2FHPWp47k3ed+5N9Vue2t3IG+N9pnkxA4ABYCWGgCZDQGw3wqH9y4jHdQlhJrKrd9adhui95H3f7li/5am9ifTxXcmUE24ZAAwA4xgCmgwBK9seuBfwdOBpwD02/zuppPXAeaR/z34HrK3e9fSOI32M3572xQwABoDVGAKaDAFSN3IP//9z/Zandh3yxvjSaV/QAGAA2BJDQJMhQKrvE+R9v+5Qv+WpPZO8MR44zYutL9W1Bu3fNv/zSModQrsD8BXCoeOLC62zlg3AYcAnKTu5zWs2//O1BdepyewC7AdcA9hhc+1EeK8vIUw88yfgLOAMwo+t6tmNvO/aGcD3CvXSpntnLHsW8LNpF/IIgEcAJuWRgCaPBPTT3sBjgHcA32D6eQ3+BPwE+CjwIuBW9OPccp89n7zv1Bvrtzy1HVn5gtpJ68iUFzUAGACmYQhoMgTMvjXAnYC3k/d89dXqj4TJWx5H+CFXWT8j7/25df2Wp/Zw8sb4kJQXNQAYAKZlCGgyBMym/YCXE+YiaGOnP67+RHhYzd0J4UN5bkve+zHxk/E69lHSx7iBcBpragYAA0AKQ0CTIWB23ISwA76Sujv+lep/CM9193qrdO8k7z2Y+sr4DmwDXEj6GL+R+sKpL2gAkCGgyRDQrRsDn6b8Z7JEnUC47sAjAtPZjrwn/20i3Fo36+5D3ufreakvnPqCBgCBIWCUIaC+7QlPeLuc7nf0W6pvE56loMkcTt72/lr9lpO8h7xxJoec1Bc0AGiJIaDJEFDP/YDf0O1OfdraQJjudbsWtsfQfJO8bX149Y6ntw44h/Qx/jTnxVNf1ACg5QwBTYaAdq0HXk84xNv1Dj21fkm4XkEruw557++f6McdGX9B3ufo73JePPVFDQAaZQhoMgS049qESV263oGXqIuBR5fdPIPxevK27fvqt5zkSPLGedOcF099UQOAVmIIaDIElHUH8p4HP6v1BrxAcLntyXvwzyJw++pdT28r8j7Pv85tIPWFDQAaxxDQZAgo4+6Ev5i73lm3VUcRdgiCZ5G3LX9Rv+Uk9yNvnNkzHKa+sAFAqzEENBkC8jyW2bivv+36ArBtoW3WV2uBX5G3HZ9Vves0R5E3zuyjHKkvbADQlhgCmgwBaR7AfOz8l+pzzPfEQQ8kb/tdCly9etfT25a8yX9OocBpo9QXNwC0ayh/BRgCmgwB07kLeQ9I6WvNyu9QF75J3rb7t+odpzmMvHG+rkQTqS9uAChrK+CphCkdL9ncy6XAt4CnEXYcfWUIaDIETObmwAXU2+n+gXB3wSeA9xN+C94FfBz4KuEvrpqzDL4idwP20K3I3263q951mi+QN85blGgi9cUNAOXcgC0/pexEMm/36JghoMkQsLqdCZ/5NnewpwL/QniK2p4T9rUtcEfgZYS/VNsMBJuA+07Y11D8O3nb7Hv1W06yB2FCqNRxHl+qkdQGDABlXJ/JbwO5kPDj01eGgCZDwHg5T0ZbrS4nHCI+mDK33e0L/A1wWkv9nrf5NebB3sAV5G2vR1XvOs0LyBvny0s1ktqAASDfOsLtKtP0dxGGgNEyBMTV5xDwV5TfHpcD/wjs01LPWxE+2208evg7zMdFga8jbzudRX9Olf6MvLHeqFQjqQ0YAPI9OrFHQ0BchoC4+hgCrkX5e/2/TsEfzC3YCjiC8hcuvqBS/10pMfFP1pS4FR1I3jh/UrKZ1CYMAPlyfvT/RLhCuq8MAU2GgOCTlBv7pcCT67b/f24I/HyCHieti2jv6MUseB552+dyJr+Oo2tvJW+szy3ZTGoTBoB8Z2b0uYghYKUyBMTVlxBwb8qN+dd0/9jd7Qjz0Zca08fqtl/NtsBvyds2R1bvOs02wLmkj3MD4QLCYlIbMQDkK3Go09MBcRkC4pr1ELAOOIEyY/0xs/XX4Kso9z7euXLvNeReELcJuHH1rtM8kryxfrZ0Q6mNGADynZrR5/IyBMRlCIhrlkNA7g/jUv034RbCWfNCyozvq7Ubb9n2wNnkbZPPVe863dfJG+uDSjeU2ogBIN9HMvocLU8HxGUIiGsWQ8Aapr8bZqU6kcKHRwvLfbztUt22duMtehH52+NO1btOc13C0YrUcf6BcAqhqNRmDAD5cp8ENVoeCYjLEBDXrIWAB5A/pj8AC7Ubn9IawiyDuWPt01+8q9kBOIe8bfGD6l2neyN5Y31bG02lNmMAKOMbGb2uVIaAuAwBcc1SCPgqeWPZBPxl9a7T7ET+k+42MozJgf6a/M/xg6t3nWZr8sPOrdtoLLUZA0AZewG/yeh3pTIExGUIiGsWQsDehN+SnHG8o3rXeW5P/uf7b6p3XVaJv/5/SXh0cB88jLyxFr33f7nUhgwA5SxQ7oLApfKagLgMAXF1HQJy/wo8m348+nXUu8gb93H1Wy7qJeR/dh9Rvet0x5I31qe11VhqQwaAshYwBIwyBDQNMQTkXvz3pPotF7Er+U86bOWQcAU7Ar8nb+wnEm4d7YNbkv873tqdLalNGQDKW8AQMMoQ0DSkELBvRr+LwOn0Z+73lbyavPG/rH7LRbyU/M/rY6t3nS53Mqj3tNlcalMGgHYsYAgYZQhoGkoIODyz32dV7re0awCXkD7+r9dvOdsehKea5rzvJ9GfhyNdg/znQrR622dqUwaA9ixgCBhlCGjaBvgSZbfHImHCmlren9HnZcDVKvbalqNI3waXE6Yb7pN3k/8ZfXztpjPkHu34edsNpjZmAGjXAoaAUYaApjZCwCbq3Vp1WkafH67UY9v+grz369D6LSe7Bfl3fJxAf/76Xw+cQd54W7v4b0lqYwaA9i1gCBhlCGhq43TAubS/PXbO7LEv939vyTrCJEap2+F59VtOdjT5n82HVe863cPJG+v5hAsmW5XanAGgjgUMAaMMAU1tHAl4Zss93zajt42Ec6tD8SnSt8W/dtBvigeS/5n8Bf257x/g++SN9001mkxtzgBQzwKGgFGGgKbSIeCLLff7mIzeftpyb7U9i/Rt0YcLAbemzJMe71+78QyHkjfWjcD+NRpNbdAAUNcChoBRhoCmkqcDjm+513/I6O0DLfdW28Gkb4szO+h3Ws8n//P4vepd5/kyeeP9TK1GUxs0ANS3gCFglCGgqdSRgBNa7jNnJry+T4M7ak/St8WGDvqdxq7kXeOwVHeu3XiGm5H31L9FKl7cmdqgAaAbCxgCRhkCmkqEgK+03OOHMnrr0xSwk/oT6dtj2w76ndTbyf8uVvtruJCcWzsXgf8lPDmyitQmDQDdWcAQMMoQ0JQbAl7Qcn85pyru03JvXfgd6dtj9w76ncSNgCvJ+w5eCdygduMZrkU4KpMz5qfUbDi1SQNAtxYwBIwyBDSlXhNwPuHQbZu+kdDXUvXpcPCkci6Sq3Kx2JTWAP9J/vfv7bUbz/RW8sZ7DpUnd0pt1ADQvQUMAaMMAU0pRwIeX6Gvb07Z0/K6U4X+ajue9O1xvQ763ZKc3+CluohwfURf7Ene1M6LhJkDq0pt1AAwGxYwBIwyBDRtA3yMLY9xE/UeMPOFCfoZV/eq1GNNvyV9e+zRQb+r2ZMyF/69pHbjmf4f+b+7u9VuOrVZA8DsWMAQMMoQ0LQGeCrhtrGVxvZT4B4V+/nwmD4mqT7NBjepi0jfHrP2PICc93apTiIE177Yjbz3cJFw+qC61GYNALNlAUPAKENAbB3hEPqzCH9hPQW4aQd95DwU5sUd9NumXUnfFld20O9q7kWZ71mfJv0BeA15472Kjq7lMAAMIwCAIWAlhoDZ9FrSt/97O+i3TXcgfVv8roN+x9keOJn879cxtRvPtAvhwtmcMXf2cCsDwHACABgCVmIImD2PJ33bf79+u636K9K3xbEd9DvOm8n/Xl0J3KR245leQd6YNwEH1m56iQFgWAEADAErMQTMloPI20nsXL/l1nyE9G3x7g76XcmtyL/nf5EQIvpkN+BC8sb8hepdL2MAGF4AAEPASgwBsyPnvPcicL/6LbdiDXA26dvhRfVbjqwDfkT+d+kswuH0PnkD+eO+Q/Wul0lt2gAw+xYwBIwyBMyOnFvf3tdBv224E3mfvVm4JfKFlPkePaR245n2Iv++/69W73pEauMGgH5YwBAwyhAwG3JuF7uQcNFZ3+U8FOlKuv/M3Yj8neAi4el5ffM28sfd+ayWBoBhBwAwBKzEENC9J5O3vR9fveOydibv6vHv1m+5YSvgB+R/by5lNqczXs21gcvJG/c3qne9gtTmDQD9soAhYJQhoFvXJW9bHw+srd51OX9D3vhfVb/lhhLnvxfp34x/AEeSP+5qj/xdTWrzBoD+WcAQMMoQ0K0TydvWfZ0VcEfCg19yxn7H6l3/2Z0J+4Dc78rPCUcS+uTG5N/xMDO3b6YOwADQTwsYAkYZArrzCvK282+AHWo3XUDuvPGnUfGZ8SN22fz6ud+RK4Hb1G29iC+SP/a71G56nNQBGAD6awFDwChDQDf2J0yEkrOdX1e96zw3If+Z8V0e/i8x1/8i8PrajRdwCPnj7vzK/+VSB2EA6LcFDAGjDAHdOJa8bXwVM3I+dQLbAj8h/3N1g9qNb/aYKXpcrU5g9h5itCVrgB+SP/bb1W58NTlfulllAJjMAoaAUYaA+h5N/jY+E9i9duMJcm77W6qvVe86uBbwxwl7XK02AgdX7r2EEuHnM9W73oLUgRgAhmEBQ8AoQ0Bd68i/GHCRcEvajpV7n8YzKfNZ6uJoxzryj9Qs1dsq917CtuRf97ARuEXlvrcodTAGgOFYwBAwyhBQ11Mos42/BGxdufdJPIb8ax2WPkNd+NspelytfkU/J3B6Cflj/0j1rieQOhgDwLAsYAgYZQioZ2vgdMps42OYrW38dMrcMrcI3Lty7wB3pcyDfq5kxs5/T2gv8h/4cwVw/dqNTyJ1QAaA4VnAEDDKEFDPIyi3jX9EmK2tS+uA11JuTF+p2z4A+wK/T+x3tF5ZufdSPkj+2P+xetcTSh2QAWCYFjAEjDIE1PNlym3jC4DD6rb/f/YAjp6gx0nrcupf+b8V8J0CvS8S7nyYxVMzW3IQ+aduzic8NngmpQ7KADBcC7QTAg6pOYjCDAF1XJ/8OdZH6+PAnpX6XwMcTrm/mpeqi7+e/zWj3+V1KWH2vL5ZC3yf/PG/uHbj00gdlAFg2BYwBIwyBNRR6oKz5XU+4UKunVvs+z6UuU98tH5B/XvmS9yauVRPq9x7KU8kf+ynEu4gmFmpAzMADN8ChoBRhoD2rSXMllZ6R7pIuI/9tcABhXrdifBUwh+11O/FwA0L9Tqpm1PmEb+LwKcr917KLsDZ5I//0bUbn1bqwAwA82EBQ8AoQ0D79gB+Szs71aX6HvB3hIfqTPNAmv0JjzL+KOV2lOPqMVP0VcLVgZMK9X4mM3zuewv+hfzx/5AePK0ydXAGgPmxgCFglCGgfXcGLqPdHexSXQH8L/Ap4O2EeeqPIMy5/xbg/cB/AX+o1M8iYSdU0xrCTHUlet9If6ZnHnUb8m/b3ET4/M681AEaAObLAoaAUYaA9j2AMveg960+B6wvsP2m8XeFel8E/qFy76WsA35M/vg/WLvxVKkDNADMnwUMAaMMAe17KvV3wF3WN6l/4diDKPc5/jphR9pHzyN//BcD+9RuPFXqIA0A82kBQ8AoQ0D7XkyZqXRnvb4HXK3QNpvUrQnfwRL9nw1cs277xVyTMHdE7jZ4Se3Gc6QO0gAwvxYwBIwyBLTvcGAD3eyYa1QXUxjvR5mr3Zf2CXer2n1ZnyB/G5wEbFO78Rw5b/asMgC0bwFDwChDQPvuR/tX3ndRRzHdnQgl7EyYY6DUGI6o235R96PMNnhA7cZzpQ7UAKAFDAGjDAHtuxXwa+ruoNuqDcALCVfg17Q18LXM3pfX56k/hlKuRplbTr9Uu/ESUgdrABAYAlZiCGjfToTHq9bYSbdVpxPmIKhtDeG2xlLjOIH61y2U9F7yt8GlwHVrN15C6oANAFqygCFglCGgjqcSpvmtscMuWR8Cdm1he0zi7yfscZK6GLhJ3faLOpQyF5f+be3GS0kdsAFAyy1gCBhlCKhjV8L3tg93CZwI3LOdzTCRh1NuO20CHlq3/aK2p8yshyfQswv/lksdtAGgnNoTfrRlAUPAKENAPQcTZuurtTOfpn5PuJWxy0fi3pmyT1p8Vd32i3sr+dtgE/3+fUoeuAEgz20J5+HOJHyINgC/At4E7FuphzYsYAgYZQio607AF6i/k1+pzgFeQbtPIZzEzSg7jfEX6ME896u4E2W+k/9Wu/HSUgduAEizFfAOVj8Mdxnw9Jb7aNMChoBRhoD6bkf4Pte+RmAj4Qr7xzEbh4b3B86i3Ph+SXhaXl/tTJnfp/OA3Sv3Xlzq4A0A01vLdA/beH2LvbRtAUPAKENAN7YFDgM+SXsP87mScPrhCOBadYY1kT0I56hLjfNcQqDos3+jzLao/aTGVqQO3gAwvRcl9GMIaJYhIC5DwOTWEqa+fTHwWcJFeSkPGzqHMGf/WwiTyMzi9t8F+CnlPmeXAQdVHUF5D6DMtujlPf8rMQDUCQA7An9M7MkQYAjYUhkC0m0F3JCwc3g08FeEv+RfTbi969mE9+wwwmmFPtzzviPhuQKlPl+bgEdUHUF516DMtMcXAteu3HtrDAB1AsBDMnpaJFwc2FeGgJghQG3ZnnB0ouRn6+9rDqAln6bMtnhG7cbbZACoEwBek9GTIcAQYAjQJLYmHJ4u+Zk6suoI2lHqkdLfpd93P0QMAHUCwNszelpeng4wBBgCtJKtKX/745fo/zwlN6LMA6Qu37yuQTEA1AkAr8zoyRBgCDAEaDVbAZ+j7Gfoh4RrCfpsW+BnlNkeL6jcexUGgDoB4D4ZPa1Ung4wBBgCBGGugWluL56kTgH2qjmIlvwzZbbHtxnYof8lBoA6AWBbyk7GsYhHAgwBhoB5twPwn5T9zJwDHFBzEC25N2Wee3Ah4fdqkAwAdQJAbl+GAEOAIUDL7UJ4b0t+Vi4EblVzEC3Zm/D8hRLb5AmVe6/KAFAvAEC4otYQ8GeGgJghQFuyK/B9yn5GLiU8UKnv1gPfosw2+Vzl3qszANQNAOuAD2b0N668JsAQYAiYD3sBv6DsZ2MDcN+ag2jRGymzTc4F9qzce3UGgLoBAAwBKzEExAwBGrUfZZ5hv7w2Ao+qOIY2PYAy5/0XgQdW7r0TBoD6AQAMASsxBMQMAVpyA+B0yn4WNgFPqzmIFi0QntBXYrv8S+XeO2MA6CYAgCFgJYaAmCFANwZ+S/md/zNrDqJF2wA/osx2+SWwXd32u2MA6C4AgCFgJYaAmCFgft2Zdh5j/Pyag2jZOyizTS4Dblq5904ZALoNAGAIWIkhIGYImD8PJeyUSv82/G3NQbTscMptl0E96GcSBoDuAwAYAlZiCIgZAubHyyh3Qdvy+ruag2jZ7Qlz9JfYLv8BrKnbfvcMALMRAMAQsBJDQOyJlA8BxxLOo6p764F3Uv53YGg7/72AMymzXc4ArlG3/dlgAJidAACGgJUYAmJthID3VB2BVrIT5R/nu0g4kjCkc/5bUW6ynyuBO9Vtf3YYAGYrAIAhYCWGgFjpELCJYUwD21f7UO7JdaPv63MqjqOGUhf9LTLQp/xNygAwewEADAErMQTESl8TMDf3P8+Y2wK/o52d/1Bu9VvyVMptn88wh+f9lzMAzGYAAEPASgwBsZJHAn5ZuXfBXwKXUP57fhXDe5DNwcAVlNk+pxGeqTDXDACzGwDAELASQ0CsVAg4v3bjc2wN8FLKX8uxSHiwz/3qDaWKGwB/pMz2uQy4dd32Z5MBYLYDABgCVmIIiJU4HXBm9a7n087AJyn/nV4ELgbuXm8oVewG/Jpy2+ipddufXQaA2Q8AYAhYiSEglnsk4Oj6Lc+dGwLH0c7O/w/A7eoNpYqtgK9Rbhu9v2r3M84A0I8AAIaAlRgCYjkhYGgXjM2aR9PO+f5FwvfgBvWGUs37KLeNvofzXTQYAPoTAMAQsBJDQCwlBJzJHD0EpbL1wOtpZ8e/CPyccBvh0LycctvodwxzG2UxAPQrAIAhYCWGgNg01wRsAO7SSZfDtw9huuW2dv7HEK4pGJpHU24q5A2EhypphAGgfwEADAErMQTEHky4KGy1MZ4P3KerBgfuYNq5v3+p3k84Rz40h1Ludr9FvOhvLANAPwMAGAJW0kYIuJDwPPa+2hf4V+D3NMf1O+CtwDW7a22w1gJHEKaZbWPHvwl4BcOcxOZA4CLKbas+/aZXZwDo94dlHXAUhoDlrgucTtnt8QP6/2O7FtiPcP/zten/eGbVXsCXaWfHv0h4+t3h1UZT17UID+Ypta2OBbauOoKeMQD0OwCAIWAlbYSA+1YdgfroMMKteG3t/M8jnFYYomsAx1NuW52IM/1tkQGg/wEADAErKR0CjqzbvnpkZ8JvR1s7/kXgf4Dr1BpQZTsBP6TctvojcEDVEfSUAWAYAQAMAStZoNw1Af9duXf1w50of93JaH2JYV7pD+EQ/Vcpt602AHerOoIeMwAMJwCAIWAlpY4E/G/txjXT1hMuxLuK9nb8mwjzB6yrM6Tq1lF+SuSnVR1BzxkAhhUAwBCwkhIh4JjqXWtWXYd27+1fJNy++dBaA+rAGuAD+BvVKQPA8AIAGAJWskDeodqX1W9ZM2Yt8GzC/BBt7vx/Ddy00pi68k+U3WYfI7w/moIBYJgBAAwBK0k9EnAF4RY6za+bE64DaXPHv0g433/1SmPqymsou82+BWxbdQQDYQAYbgAAQ8BKUkLA6zrpVLNgO8K5/pIz061US+f7h/5X7Cspu91+yfADU2sMAMMOAGAIWMl1gZOZbJyfY7gXYWl1B1P23vRx9XvgHpXG1KUXUna7nUU4tadEBoDhBwAwBKxkN+ATjH/gyCWEp5G5858/Vyf8FpR6GM1qdSywd51hdep5lN1uFxGmDVYGA8B8BAAIO7IPUf4H7OU1B9GCmwJ/T7gd6WjC8xWeDuzZZVPqzGOJn5vQRm0knFpaX2dYnXoOZbfd5cDdq45goAwA8xMAoJ0QsAmnyVX/XY8QANve8S8SDl3Pyw7sOZQ9knIV8JCqIxgwA8B8BQBoJwQcx/AvXtIwXY1w8d3l1Nn5f5XwwKB5UPqc/ybgKVVHMHAGgPkLANDONQEHVR2BlGct4al651Bnx38Z8Fzm5ymMR1B+G7646gjmgAFgPgMAlD8S4JdTfXEvwu1jNXb8i8DPgZtVGdlsaGPn/5qqI5gTBoD5DQBQNgT0+Y4AzYcbAB+n3o5/I2HGu21qDG5GvIry2/EdVUcwRwwA8x0AoNzpAKfK1azalXCev+3JfJbXqYR5BObFGspP77tIuCvH64taYgAwAECZIwEPqN61tLrtgRcRng9fa8e/CXgnsGOF8c2KdcB7Kb8tP8l83CbZGQOAAWBJTgg4H9ihfsvSirYGngr8lno7/kXgFOAvKoxvlmxD+Uf6LgKfAbaqOI65ZAAwACyXGgJe0kWz0oilHf+Z1N3xbyT8dszTX/0QxtvG3AlfYb6um+iMAcAAMGraEHA0TperbnW1418ETgQOaX+IM2dX4HuU355H45P9qjEAGABWshZ4LeEvm9W214cJ51mlLmwDPAM4g/o7/ssI02DP41+q+9HOQ5L+k/D0RVViADAArObmwAeAc/nzNroI+DRwaId9ab5tAzyN6R/rXKqOBq7f+ihn081oJ3B9BXf+1RkADACT2hGfu61u7U6YZKaLQ/2LwO8IswfOy2x+o+4OXEj57folPOzfCQOAAUCadTcG3g1cSjc7/quAtxOeGzCvHgdsoPy2/QLzeRplJhgADADSrLoTYQdR8mly09Y3CafC5tkRtPMefAxv9euUAcAAIM2SrQmH2X9Bdzv9RcJ57nk+3A/hvXgf7WzfD+LdQ50zABgApFmwD+Gq+rPpdsd/yeY+5v2CtN0IRz/a2MbvxOl9Z4IBwAAgdWUd4cKyjwNX0u2Of+PmPhZaHXE/XA/4Fe1s59cz30dVZooBwAAg1XZDwo7gHLrd6S/VMcAtWx1xf9yZ5m2/pWoT8NcVx6EJGAAMAFINOxNm6/tvut/hL9VPmb+5+1fzVNq50v8qwu+yZowBwAAgtWUt4ZG4HyCcW+96h79UxwMPw0PRS9YTjsi0sa2vAB5abyiahgHAACCVtJZw+94/0d2EPePqN4S/cn3E7J/tBXybdrb3hYRrPDSjDAAGACnXOsIDcd4GnEX3O/rROp0wdbD3nDfdihCK2tjmZ21ev2aYAcAAIKVY/pf+LO70F4HTgOfiNLMreSztzaz4S7ybohcMAAYAaVI7APcl3Mf9e7rfwY+rE4En4F/8K9kGeAftbftv4TNDesMAYACQxlkDHEiYCvZrwOV0v3NfrX4GPBpnmBvn2sD3aG/7fwonUOoVA4ABQFpud8JV2+9i9i7iG1ffAe6PV/Wv5v7AH2nvPXgTzu7XOwYAA4Dm206EK7VfD/yEbh+8M01dCXyYcIRC460HXkGY6bCt9+GZtQajcrwVRpo/ewN3JFzAd2vgtoSHvvTFhYR5Bd5CuIJd4+0NfIQwF0MbzgcOA77e0vrVIgOANGxbER5leyfCTv8QYI9OO0p3AuHitfcQrl7X6u5BCEp7tbT+k4H7EZ4ZoB4yAEjDsRthZ38T4KaEe7BvSb+vhN8AfA74V8KT6bRl2wCvBF5Me+fkvws8iPDMAPWUAUDqn62B6xMO39+YsMO/MbB/l00VdhJwJPB+wgODNJkbEQ7536LF13gP4Zz/lS2+hioYagC4ImPZfYp1IaXbjTCRyn7L/nldwo5+P4Z5tfsVwGcJO5ivEy4w0+QOJxzBl/RNAAAJjklEQVQp2aGl9V8FvAx4Q0vrV2VDDQAXZyx7COEH9rQinUixqwHXINxuty9hB79U19n8zx07666+7wNHAR8l3Kam6exOuHvpQS2+xu8It4Z+t8XXUGVDDQCnZyy7I3A08HzCAzIuKtKR+mg7/jyF7M6EyWXWArts/nfbANtv/r93JJxr3w3YdQv/dJKaML/ABwk7fi8iS3dvwqmSvVt8jR8DDybvd1UzaojzAOxA6K/r+5Qty/pz/Z5wiPoQnDAm186Ev/rbfs+Owpn9Bi31gzHLAQDgB3T/g2dZ817nE3Yi96ffdyPMkrsAp9Lu+3YZ4bHJGrChngIA+AphghNJdZ1DuHXvM4SL+TZ0285g7AC8Bng27R5BORl4GGFWSA1cakKc9SMAB9CfKU0tq+91CvBmwoRDHt4v72DCREhtv4+fxyf5zZXUD8qsBwAIRwG6/mG0rCHWVYQH8BxBmI9giLclzoJdCOf62/5j5krC8wIMb3Mm5wdg1t0BjwJYVqk6BXg34XaznVDb/hI4i/bf1zMI00RrDqV+aPoQACDcatT1D6dl9bHOBT4OPJfwV77q2Af4BHXe488R5qTQnEr94PQlAOxGuH+16x9Ty5r1+h1hx/NcwjMEPBxc11rClfcX0v57fRnhffbUzZxL/QD1JQAA3J7w9LCuf2Ata1ZqI3Ac8D7g8YRnC6g7BxJmRKzx3h9Hu88KUI+kfoj6FAAgPLbyCrr/4bWsLuoswjz7fwvcjTCRjLq3C/BP1Ju47Cj+PHul5twawocixUb6N4/A3YFP4wVMGq6NwInAz4Gfbf7nzwmH9zU71gKPA14H7Fnh9X5POL3wuQqvpZ6YtwAAYX6AjxHOcUp9dRVhwpbjCHPpHwccv/mfl3XYl7bsNsA/AwdVer0vA08mHAWS/s88BgAIU5I+j/BoSw+FalZdTpjy9RTCzv6UzXXS5v/fGfb65ZqEe+2fTJ0LLC8CXky4dVOKzGsAWHJ14BnAE4H9O+5F82MTcB7hNrtzCU/G++3mOn3zP88Ezu6qQRW1LeGK+5dR7zHP3yRc3PmbSq+nHpr3ALBkDeE+57tt/ucNCPfG+hQsLbeRPz8eehG4gHAo/mLCBaaXApds/vcXjvzzfJo7/U01G1cn1gCPIszfv1DpNS8jBI234mdME0i9mrRvdwFIUi0HAd+l7p0e3wFuWGNwGg4DgCSVcQPC7Ik1d/yXEJ7J4MRNmpoBQJLyXBs4kvBQnZo7/y9tfm0piQFAktLsRbil73Lq7vjPAx5bYXwaOAOAJE1nV8ItfRdRd8e/SDjFsEfrI9RcMABI0mSuTtjx13hgz2gdBxzS+gg1VwwAkrS63Qg7/vOpv+O/dPNrb9PyGDWHDACStLI9gTcS5nqoveNfJFzk5yRlao0BQJKarkWYTOcSutnxnwQ8sPVRau4ZACQpuBnwLsKMel3s+C8hHO7ftuVxSoABQJLuBHyBMH1uFzv+TYSr+72nX1UZACTNo/XAw4Ef0c1Of6l+CNyh5bFKKzIASJonVyM8ne83dLvjPwN4Kk7hqw4ZACTNg1sSzu93dWHfUl2M5/k1IwwAkoZqa+BhwLfodqe/SHhk9FsJcwpIM8EAIGlork+4f/8cut/xbwQ+Alyv1RFLCQwAkoZga+ChwDF0dzX/aB0D3KrNQUs5DACS+uyWhEPr59L9Dn+pvgr8f20OWirBACCpb/YEng/8nO539svrWODgFsctFWUAkNQH2wGHESbsuZLud/bL6xvAoe0NXWqHAUDSrFpHmKXvXXTzCN4t1XeAu7U2eqllBgBJs2QtYaf/T8zGVfwr1THA7dvaAFItBgBJXdsGuDfwbmZ3p38l4Xa+A1vaBlJ1BgBJXdgeuD9wFHAB3e/gx9WfCKcgDmhnM0jdMQBIqmU/4BnAf9DdI3cnrbOBlwG7trEhpFmwgfQviHNZS1rN1oSL5N4EHEf3O/VJ6n+Ap+Dvm+bAH0j/olyng34lzbYbAs8CPgNcRPc79ElqI/BZQlhZU36TSLPpNNK/NHet366kGbM38FjgA8CZdL8zn6bOB94M7F98q0g9cCzpX543dtCvpG7tDxwOvAc4nu534in1U+BpwI6Ft43UK0eS/iU6EQ+XSUO2nnDb27OBjwK/pfudd2pdTAgtztEvbfZ88r5Uj6jfsqSW7Ac8nHBY/NvAJXS/486tnxD+2t+53GaShuHW5H25TibM0S2pP9YC1yc8PvfVwBeZ3Ql4Uuo84G2E3zdJY6wD/kjel+1DeCpAmlXXIDyh7mnAO4HvEQ6Hd72TLl0bgM8BDybcfihpAh8k/8v3DxgCpK6sJ1ycd0/Cab13ES7wPZfud8xt10+A5wJ7ZG9FaY4s7bDvAXy1wPo+DDwJuLzAuiQ17Qlci3Cefn/gupv/uT+wQAgB8+JXwMcIFyb+quNepF5aCgDrgFOBfQus81TgpYQv5mKB9UlDtgbYfXNdA9iL8JfsPptrYdn/vU1HPc6K0wi/Kx8DftZtK1L/LT9k/xzC4zdLOZkwE9iXCV/cs/DIgPpta2CHkX93dUKA3nnZf9+OMI3sLpvrasv+ufR/78qfd/xrK/TeVycDn95c38c/KqRilgeA7Ql/vXseTVKXfkqYlvczhHn5JbVg9KK9JxMmypCkWq4Evgt8nrDjP7XbdqT5MBoA1gLfAQ7qoBdJ8+Nc4JuE+Qc+D1zQaTfSHFrptr0bAz8gPtcpSamuJJzD//Lm+hmez5c6Ne6+/UcSbumTpFSnAP+5uY7Bv/KlmbLaxD3/THgAiCRN4kTC5ENfA74O/L7bdiStZrUAsAZ4P+Gxn5K03EbgBMI1Q98lnM8/vcuGJE1nS1P3bg0cRXg6mKT5dR7h2qAfAP9FeJ7AnzrtSFKWSebuXwv8I2GiIEnDdxnhXvwfLKuTO+1IUnHTPLznscC/Aju21Iuk+s4HjgN+vLl+CfwvcEWXTUlq37RP77sRYaKgO7bQi6T2XEB4aM4vCefufwH8HDi7y6YkdSfl8b1rgMcDryU8uETSbLiS8NyNU4CTCH/Z/wo4Hvhdd21JmkUpAWDJdoRH/76I8MQySe26ivAX++nAmYQpc08m7PBPBs4gXJ0vSVuUEwCWrAUOJVwjcF9gtwLrlObJZYSpcc/e/M9zCffQnwX8lrCzP2Pzf3cHL6mIEgFgubXALYBDCFMKHwDsS3hk6o7AVoVfT6plA3DJyL+7Crh42X+7nLAzv2Tzv7uIcKvcBcCFy/659H//gbCzH12vJLXu/wccWcOes7wfDQAAAABJRU5ErkJggg==",
-    # Shower with plug
-    "shower_2": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAC8npUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHja7ZdtjhshDIb/c4oeYWxjbI7D8CH1Bj1+X5iPbnaz0lbdP5UyaIAYsI0fQ5LQf/0c4QceyhZDVPOUU9rwxBwzF3R8O56yatriqq+HT+mDPNwDDJGglWPA09HSJb8UnS0V9PSNIq/nwP44kONp3t8pOg3J9Gi60E5F+VQkfAzQqaAc29pSdnu7hb0fbbs26scbZlX7sT06rb3/HA3RawqhMHeBGDULHw7IfGOQgo6jZnFMJLRlDRYRyacnCMizOG1vvApPqNAzKnfvHRRJhzxA8BjMdLdP5aTPgx9WiN9YlnpbfpCb3CYegjzfMZqHMfqxuxITQprOTV1bWT1M3BFyWcsSiuFV9G2VjOIB2VuBvG1121EqZWJgGRSpUaFBfbWVKlyM3NnQMleWJXMxzlxlC+AUZ6HBJlkaCLJU4BVI+faFlt28zFVyGG6EmUxQNklzmNV3lE8VjTFTnmjzO1bwi2cSwo1JbtaYBSA0rjzSFeCrvH8mVwFBXWF2bLBs+6FiVzpza+aRLNCCiYr2OGtk7VSAEMG2whkSENgSiVKizZiNCHF08ClQ5DgovAMBqXKDlxxFEuDgxMA21hituax8iHFnAYRKEgOaLAWs5sWG/LHoyKGiolFVk5q6Zi1JUkyaUrI0L79iYtHUkpm5ZSsuHl09ubkHz14yZ8HlqDlly55zLgVGCzQXrC6YUMrOu+xx1z3ttvue91KRPjVWrala9VBzLY2bNNwTLTVr3nIrnTpSqceuPXXr3nMvA6k2ZMShIw0bPvIoNzUKB9YP5evU6KLGi9ScaDc1LDW7VNC8TnQyAzGOBOI2CSCheTLbnGLkMNFNZltmnApleKkTTqNJDARjJ9ZBN7s/5B64hRj/iRtf5MJE9x3kwkT3CbmP3J5Qa/Pbpm4SFqF5DGdQN8Hxw4Tuhb3ML7Uvt+FvF7wUvRS9FL0UvRS9FL0U/T+KBn484E9h+A1YJKOFer5guwAAAYVpQ0NQSUNDIHByb2ZpbGUAAHicfZE9SMNAHMVfW6VVKiJ2EOmQoQqCBVERR6liESyUtkKrDiaXfkGThiTFxVFwLTj4sVh1cHHW1cFVEAQ/QJwdnBRdpMT/JYUWMR4c9+PdvcfdO8DbqDDF6JoAFNXUU/GYkM2tCv5XBBBGDwYwJjJDS6QXM3AdX/fw8PUuyrPcz/05+uS8wQCPQDzHNN0k3iCe2TQ1zvvEIVYSZeJz4nGdLkj8yHXJ4TfORZu9PDOkZ1LzxCFiodjBUgezkq4QTxNHZEWlfG/WYZnzFmelUmOte/IXBvPqSprrNMOIYwkJJCFAQg1lVGAiSqtKioEU7cdc/MO2P0kuiVxlMHIsoAoFou0H/4Pf3RqFqUknKRgDul8s62ME8O8CzbplfR9bVvME8D0DV2rbX20As5+k19ta5Ajo3wYurtuatAdc7gBDT5qoi7bko+ktFID3M/qmHDB4C/SuOb219nH6AGSoq+Ub4OAQGC1S9rrLuwOdvf17ptXfD5XFcrWD5PfKAAAPnGlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4KPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNC40LjAtRXhpdjIiPgogPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgeG1sbnM6aXB0Y0V4dD0iaHR0cDovL2lwdGMub3JnL3N0ZC9JcHRjNHhtcEV4dC8yMDA4LTAyLTI5LyIKICAgIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIgogICAgeG1sbnM6c3RFdnQ9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZUV2ZW50IyIKICAgIHhtbG5zOnBsdXM9Imh0dHA6Ly9ucy51c2VwbHVzLm9yZy9sZGYveG1wLzEuMC8iCiAgICB4bWxuczpHSU1QPSJodHRwOi8vd3d3LmdpbXAub3JnL3htcC8iCiAgICB4bWxuczpkYz0iaHR0cDovL3B1cmwub3JnL2RjL2VsZW1lbnRzLzEuMS8iCiAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyIKICAgIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIKICAgeG1wTU06RG9jdW1lbnRJRD0iZ2ltcDpkb2NpZDpnaW1wOmUwZDgzNTI2LTdhMTEtNGQ5MS1iYmU4LTU0NmVjM2U2MDQxMiIKICAgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDo2ODkwODQyNi0xMDBlLTQ0NGUtYWY3OS1iNDcyYjA3NGM3OWIiCiAgIHhtcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD0ieG1wLmRpZDo3MzhmNmVhNC1lMzgwLTQ5YTUtODk1Mi00NmI3Y2NiNjIzYWEiCiAgIEdJTVA6QVBJPSIyLjAiCiAgIEdJTVA6UGxhdGZvcm09IldpbmRvd3MiCiAgIEdJTVA6VGltZVN0YW1wPSIxNzI0ODM2ODQwMDYwODQ2IgogICBHSU1QOlZlcnNpb249IjIuMTAuMjIiCiAgIGRjOkZvcm1hdD0iaW1hZ2UvcG5nIgogICB0aWZmOk9yaWVudGF0aW9uPSIxIgogICB4bXA6Q3JlYXRvclRvb2w9IkdJTVAgMi4xMCI+CiAgIDxpcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgPGlwdGNFeHQ6TG9jYXRpb25TaG93bj4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uU2hvd24+CiAgIDxpcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgPGlwdGNFeHQ6UmVnaXN0cnlJZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OlJlZ2lzdHJ5SWQ+CiAgIDx4bXBNTTpIaXN0b3J5PgogICAgPHJkZjpTZXE+CiAgICAgPHJkZjpsaQogICAgICBzdEV2dDphY3Rpb249InNhdmVkIgogICAgICBzdEV2dDpjaGFuZ2VkPSIvIgogICAgICBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOmY2ZmM1Y2E3LWQzMTMtNGY1NC05YTdkLTVmYjVmNTliMTMxNSIKICAgICAgc3RFdnQ6c29mdHdhcmVBZ2VudD0iR2ltcCAyLjEwIChXaW5kb3dzKSIKICAgICAgc3RFdnQ6d2hlbj0iMjAyNC0wOC0yOFQxMjoyMDo0MCIvPgogICAgPC9yZGY6U2VxPgogICA8L3htcE1NOkhpc3Rvcnk+CiAgIDxwbHVzOkltYWdlU3VwcGxpZXI+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZVN1cHBsaWVyPgogICA8cGx1czpJbWFnZUNyZWF0b3I+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZUNyZWF0b3I+CiAgIDxwbHVzOkNvcHlyaWdodE93bmVyPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6Q29weXJpZ2h0T3duZXI+CiAgIDxwbHVzOkxpY2Vuc29yPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6TGljZW5zb3I+CiAgPC9yZGY6RGVzY3JpcHRpb24+CiA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgCjw/eHBhY2tldCBlbmQ9InciPz4OEEXyAAAABmJLR0QAXABXAG+wXt1JAAAACXBIWXMAAA7DAAAOwwHHb6hkAAAAB3RJTUUH6AgcCRQnmAnJGAAAIABJREFUeNrsnXeYZVWZ7n+nqqu6OkPnDDSZJgcVlSCIIoM5IzoYxjFMcMYwTnD0jle9M3fujGkGdABBUdFRDAMiQRAFDCQlQ+ec6FSdKp5z//i+7Tk0daqr+6y1z977vL/nOU8VTfepOmuv8K5vfd+7SjROCRjlr4nAkcDpwELgMGAuMBkYD4wG2hBCCCHE3pSBXmAnsBlYAywFHgMeABYB3cCAvyqNLt6N/Ns24CDgDOBc4FRgDjAOGOMLfqeLg3Yt/kIIIcQ+RcCgL/B9Lgh2A7tcEDwA3AXcB2z3v39AQuBABUC7L/QvBc4DjgLmAVN9sRdCCCFEWPqBZ4DVwFPAHcDtLgzKaQiAGb7bfxkW6j/Gd/lCCCGESIde4EngQRcBPwfW7u9OfqR0AqcBlwDvAF4BzNrP9xBCCCFE44wCZgInAQuwHLxdHiEYDCkAJgNnA+8D3gYcjs7zhRBCiGZT8s34icB0LElwM9DTqABow871LwI+CpwPjFV7CyGEEJliDHA0Vom3HVgP7GGYBMH2ESz+r/XF/wSU4CeEEEJklXZgNlaGvxNYPpwIGE4ATAVeD3wEC/lr8RdCCCGyTRtwMHAssAVYgZURjlgATAb+SIu/EEIIkUsRkBjzrQNWMUROwFACoAM4yxf/E1CWvxBCCJFHETAZ8+xZAqxkr+qAoRb304D3Ywl/2vkLIYQQ+RUBM7Ay/mXs5ROwtwCYidX5X4rZ+QohhBAivyTOvZsx46BdQwmAduzc/x3Yub8QQggh8s8YrIR/rYuAShIeADMSmIPZ+56qthJCCCEKxWm+xs/2Nf8PAqANuMD/gpL+hBBCiGIxCru/5/xk7W9zJXAQ8BLsYh8hhBBCFI9jXQBMBEptrgrOwK701a1+QgghRDEZjdkFnw6MSgTAucA8tY0QQghRaOb6mj8qcQs6FbP+FUIIIURxmYbl+01ow0L/c5DpjxBCCFF0OjwKcEQbdhYg0x8hhBCiNRgHnNYGHIeZBAghhBCi+IwBFrYBC7DMQCGEEEIUny7gsDYs+18CQAghhGgNOoH5bZgJkNz/hBBCiNZgFHBQCdjtEYA2tYkQQghReMrAnhIwqMVfCCGEaBkqQLnk3wghhBCihdDOXwghhJAAEEIIIYQEgBBCCCEkAIQQQgghASCEEEIICQAhhBBCSAAIIYQQQgJACCGEEBIAQgghhJAAEEIIIYQEgBBCCCEkAIQQQgghASCEEEIICQAhhBBCSAAIIYQQQgJACCGEEM9lVIE+Sx+wAVgHbAN6gEE9YiGEEA3QDnQBBwGzgBlApwRANij7wv8YcBdwL7AI2AL0AhWgpD4shBBiP0jWjtHAZOBI4EXA2cDxwHRyHkUv+YfMKwPAGuBq4LvAcv+zsn+uivqwEEKIBtfJki/2o4DDgDcDlwFzPUKQa5WTx9egL/jvBmbn/SEIIYTIBe3AHOA9wIq9Npy5euU5fLHBd/43Y+f+Ou8XQggRm0Fgra891/halEvyKgD6sDP/73rjK9QvhBAiLSrAeuB6X4v6JADS3f3fhR0BaOcvhBCiGZGAZcAv8hoFyKsAWAvcgyX8CSGEEM1gwNeidRIA6bEdK/Urq/8JIYRoEmVfi7ZJAKRHD7AVnf0LIYRoHhWqnjMSACkxSNXkRwghhGiWAOghp8fRbTlveCGEEEJrUYsJANn7CiGE0FrUggJACCGEEBIAQgghhJAAEEIIIYQEgBBCCCEkAIQQQoiWZpQ+PzPQVcJCCNFqDGIe/i1rKd/qAmAG8N/AXOQrIIQQrUIJWA28EVgjAdCatPviP0/jQQghWnINaFmUA6CdvxBCaO6XABBCCCGEBIAQQgghJACEEEIIIQEghBBCCAkAIYQQQkgACCGEEEICQAghhBASAEIIIYSQABBCCCGEBIAQQgghJACEEEIIIQEghBBCCAkAIYQQQkgACCGEEEICQAghhBASAEIIIYSQABBCCCEkAIQQQgghASCEEEIICQAhhBBCSAAIIYQQQgJACCGEEBIAQgghhJAAEEIIIUSmGKUmaDrrgd8BTwEbgV6gA5gKHAmcAsyRWEuNPmCZP5OlwDagDIzz53A8cBwwSU2VGtuAR4DHgHXAbqAdOBg4HDgZOMTHjYhPP7C8ZoxsBQaBscBsYKGPk4PUVBIAYmh2APcAvwB+UyMA+v25TAWOAM4AzgZe7H8m4rEc+KU/k4dcCCQCYGyNADgTOAc4VWMouhi7H7gL+BXwOLAW2OOCeDKwwJ/DWT5O5qrZorLan8cvgQdrBEAyRma5AEjGyGlAp5otu1Ry+Loh0MQ7H1jRhN9/E3AdcO4IBkcb8DzgP4CVOX1eeXg9AXwSOHoE/WYy8FbgNmCX2i7KayfwU+CNI4y2LAQ+Azzti5HaMPxrkbfxcSN4HpP82d3sm50sfp4VvgaE2EjfkNNnKgGQ8u/e7Yv/sfvxGdr8d/0MsEoTXNDXoO9qPgTM3I++M9Z3nLdkeILL66sHuNPbt2s/nslM4K99oRpUOwZ9rQX+znf4I6ULeBHwY5/3JAAy9tK5cvrcA1zpk9TACP9N2Repr/i/3eB/JhpnD/Bt4EYsH2Ok7AbuA/4JuNcjASIMT3o/v8/FwEjZAHwT+LxHywbVlEHoAa4Hvo/lYOzPv7sf+D/AHRoj2UMCIF3WY+fL9+7H4r+3CLgG+BLwjERAwwz4LuCH2Hn/gUyMDwKfxs5Fe9SkDbPLF42fHEB7VrA8mhuAfwbWSAQ0zCDwqD+Ppw/g3/cCDwD/AtzkgltIALQkvwd+iyU3HQhl7Ajg277LkQhofPd/ZwO7xYq/RzLB3dLAsxXGEixKtt3b90CeyQYs7Pw5qkdm4sDow87xnzrA55GIgAeBfwe+g0XPhARAy/Gkvxqh7AvW9cAXfcdTUdMeED1YBUZ3ACHxG38e/4NVcogDY4UL5UqDY2Q98CPg/2GZ6hojB0a/9+0NAcbag8B/Al9HxwGZQCVM6bLRX40y6BPlN7Ha53ej8qcDndxWECZ034Md7SSi+pWo/OlA2IolnDVKIgL+28fIe4Fj1Lz7RcV36xsIE9nqw8prrwRKwCXABDWzBECr0Btwd5hEAq7253gpZoYi9n+CC3VO3APc7c9mFPBy9i+LXdgisSfQjj3JCfgmZhz0TkZWwiae3YYhj1AGgIeBK1yYvQ4ZBkkAtAgd3uYDgd4vyQn4iu88L5EI2C9KvkCHPApLIgGD/rzPwVwExcjHyOjAC9hGLOwMFi072p+92Pf4GIPV9LcFFAL9mKvjF4DxwCsUCWgOygFIl6mEd/OrYNUBl2P+AqvReef+COC5gRecRAT8FktCuwcztREjYxJWzx96gU5EwFexREMlBo5ckB0VYZfejyUWfh7LMVAFjQRA4TkK8/cPTSICvgpchXwCRkoXcDowMcJ7J9UB8gnYP+ZhdssxduibgG/5zlM+ASMXAGdhNtih6cXuE7gcS/zUnCUBUGhO8QUnRrsnIuAa4MuoRHAkjAHOwy4wibHgyCdg/zkCeCHmtFiKMEY2YoY28gkYuQA4H7Na7ow0Rm7FvDiWq7nTpR34VA5/7yex7N5GF7hJwLtI72a38d7hl2KOWqFD9YnV8Cos7HyiL3I676wvgMe5WFpC4+WAQzHgO8/lwDTs8pp2NX1dury/rvZxEmOB3u2L/ybgBCwCpDEyNEmeDN6H10T4GX1Y5cfh/jzSehbbga/510bnkTdi9u4SABIAww6mqa6qH6HqIR9aBOxwEbDblfs4TXB1n0cHlgewzie4GLv0AexYZq33tSMlAoblIH89QZxIVgU7klntk/9R2NXCGiP1F7hZPq8sCbBg1luMJ/uzmCYBIAFQRAEAFtqc6QvPoogioJvqOecRxDnnLooImAJM94lgZUQRsA4LQU/wZyIRMDSdwAzvs8uAzRFFQOIDcSi6bns4xvgz2Ykl7/VEeB6VmiiABIAEQCEFQPJzD/MOvyyyCFiCZbsfgupth2Oei4DkCCWWCFiLGdRM8UVHpbhD04Udl3T584ghAnARkBw1zEtx95lHpvhrq88roR0vd2NmTedIAEgAFFkA4LvAY7Fs8VWRRcAin0jnSwQMy3zf5WzFwsMxIwGrsOTD2cgxcDgRcKxPsGuJl9i6C1js42W+L3I6DhiaGVgEc4OPkZB3X/RieUsvS6n9JQAkAJomAErYccCJWFhtFdU7s0Ozw0VAp0ceJmiCq8tcXwQ2YglPvZFEwEbfRR3mk6pEwNB0UC0LXBM5EpDsao9woawxMvRiNxML1a8knE1wwhkuANI4HpMAkABomgBIRMAYFwG7fUDFEgHdNbucY4hTZlUESr4gH+kLztqIImATdsXqAp9UJQKGfh6jqJahrYgoAnZTPZJb6EJZpdJDrxtTfcFb7GI2hAjoBF4CXJDS55AAkABoqgCoFQELsXPIJcQ5DkgiAcuw0PYJqERwuAE9BfONX+UiIMZxwKCLgEXY+fM8lBNQb4x0uiibiJ3Zx4wErPT3Pwkr3ZUIeC6jfIwc7+21LoBQPgq7ROsUCQAJgFYRAMkENw4LPSbVATFq0pMSwZXe6U9SJGDYsTEZ841f79GAWDkBm1yYTfVogETA0HRhyaxTfOcZMxKwGgtvJz4BEgH1RcAx3odXNSgCLvaFdLoEgARAKwmARARMxM6fu7BSmx2RREC3L2h7kE/AvsbHNOycfjNxEwM3+C5KPgHDM8YjJTFFQFIiuMbHyjHIJ2A4ETDdhVk35qVxICJgIfDHmO1wWn1fAkACIDMCIOEgn+A6fYKLaRa0wttQPgHDD+5Z/tpO3BJB+QSMjLFUK1qWAVuIdxwgn4CRj5E5vqlYvp9jZBbwJ8CrXWilhQSABEDmBEAiAhb498uIkxiYRAKWUvUJmIQYipIvOPIJyFYkYIF/TcMnoIxViMgnoP4iOMdfg1hEa/sIxtVR2DXmb/P+niYSABIAmRQA+C7wGF9o0vQJkAioj3wCskWaPgFLkE/ASITyHF/UO/xZVLAKgYGavzcOi3KeAbzZ5+BDmvD7SgBIAGRWACQ+AScQ3yegGytHk0/AvpFPQLaQT0D2mILdenoilkg73ttrOha1OQN4LfBe4CLSDftLAAyxC8zb6wbChEbnY2d8Wf6sSTjt77EQWaxs5JKr8E/5DnQwp30jjVc/8ADw+sgLwRjgRcAtLgLV9kO/yt4+VwAnuyiINUZmAn+OHc31q+2HfSb9WE7ADhdmG7F8jZ3+5wNN/h1X+BrQKKN8Tcrdc1IEILsRgNpJJ/EJKGPnkTF9Apb6budEVCI4nOJPfAJWE98n4CmPPMyLuLjlmVqfgAnE9wlYgR03yCdg+GfS5otjp89hY/1rp/95s9tNRwASAJkXAMlgqvUJeJq4PgHJcYN8AoYfO5OxPI11xPcJWI58AvZF4hMwmfg+AWt8R3si8gnYn3ksS0gASADkQgAkg2eiT3BdLgJiJgauxkJ1C32XIxEw9PhJfAK2ELc6YKNHGiYin4DhqPUJWEKcEsEKVbOgrZhZ1GSNkdwhASABkBsBUPs7zwdGY9n7MUXASqpJT6oOqD/4Z2HZ+kmbpeUToEjA0CQ+AZOws/qYZkErsfPsQ1GJoASABIAEQEoi4DD/fjlxzYKWej85BF0lXI+S7zqnU7VajpUTkPgEHOyLjnIC6kcCFmDRstUuAgYj/JzdHmkYxPI0pqvpJQAkACQAYrO3T0Ass6Ad2HHDaKrua2Jo5mNZ4tuIdxww6AIg8QmYg0oE61HrE7AmsghY7PPRfCxXQ8cBEgASABIAUXedY7EkpJ2+y4nlE7ATy0Tv8MjDRE1wdZlDuj4Bh2I+AaPV9EOS+AQkIiCWWVAiAvqo+gQoMVACQAJAAiCqCBiDZevvxkLPMUVAsss5Bl0gNNwzmYG5oa3BQvaxREBSIrgAy0NQJGDo5zEKS2btoHrVbwwRsIeqdfdCLEonESABIAEgARBdBCzEwpsxfQJ2YjkHu110jJEIqDshpOUT8AyWDCqfgOHHSFo+Abux45lNmCmRfAIkACQAJACiT3Bp+wTskAjY59iST0C2kE+AkACQACicAEhEQJo+AWuQT8BIxpd8ArKFfAKEBIAEQOEEQO1nStMnYAD5BOxrcpBPQLaQT4CQAJAAKKQASD5XWj4BS3yhUYlgfeQTkM1IQJo+ARXvAxIBEgASABIA0ZngHbKXdHwCunyCkwioj3wCskWaPgFLa/rAFDW9BIAEgARA7F3nWOAELBQZ0ydgB1aO1ol8AvaFfAKyRVo+ATv9edQemWmMSABIAEgARBUBY7BM5D3YNaYxRcAif2/5BAz/TOQTkK3nkZZPwC4s56A2eVbVARIAEgASANFFwEJvr6XENQta5mLjRFQiONyEIZ+AbI2RtHwCksTALVgZrUSABIAEgARA9Aku8QkY5QtCTJ+A5LhBPgHDjz35BGSLtHwCdlHNOTjRRYfGiASABIAEQFQRUOsTELtEUD4BIxt/8gnIFmn5BNTm5RyNVW0ICQAJAAmAqCQ+AZ2+y4lVHSCfgJFPHvIJyBZp+QTsxPJyerFkTVUHSABIAEgApCICFvj3y5BPQLORT0A2IwFp+ATswnIOKliexlQ1vQSABIAEQGwmYOfP8gnIDvIJyBZp+QQkJYJJH1AkQAJAAkACIPqucyyWhLQT+QRkBfkEZAv5BEgASABIABRWBHRh2fq7kU9AVp6JfAKy9TzkEyABIAEgAVBoESCfgOwgn4DsjRH5BEgASABIABR2gkt8AjqQT0BWxqZ8ArKFfAIkACQAJAAKKwImYufP8gnIzviUT0C2SNsnYAfmE3CQxogEgASABEBsEp+A0cgnIAvIJyB7pOUTsAuLzMgnQAJAAkACIFURcJh/n4ZPQCcWWtVzGBr5BGQzEhDbJyARAct8rpNPgASABIAEQCqk5ROw0yMNY2p2VWJo5BOQLZrlEzAZHQdIAEgASABE3nWm4ROQHAc8jR07HIaSnoZDPgHZIk2fgKVAP/IJkACQAJAASEkEpOkTsNh/5jEuPjTBDf1M5BOQreeRtk/ALhcdKhGUAJAAkABIRQTE9glIIgHLfUE70X+uRMDQE458ArI1RtLyCdjNs30CxkkESABIAEgAxJ7g0vIJ6MbOn3f5BCcRUH/syicgW6ThE1BbIiifAAkACQAJgNREwESf4Mb5BLc9YiRgNeYYuBDZBg83fuUTkC3S9gnoxnwCDlbTSwBIAEgAxGaSi4Aun+Bi+wSUPfIwUU1fd/KRT0C2SNsnoA/5BEgASABIAKTERN91tvsEFysSsB07T+1APgHDIZ+AbEYC0vIJWOrfz0M+ARIAEgASACkwAQs99mOh55jHAYuQT8BISNsnYBbyCRiONH0CFvv3hygSIAEgASABkAZjgROws/rVkUWAfAJGRjN8AmYin4B6pOkTsMSfzeHIJ0ACQAJAAiAyJZ/4T/KFZmUkEQDyCdifZ5K2T8BhyCdguOeRpk/AUuQTIAEgASABkOIE14XVpOMTUMxIwHLkEzCSCakZPgHzUU5AvTEinwAJAAkACYDCTnDjsNBjcovgtgg/Rz4B+ze25ROQLeQTIAEgASABUFgm+AQ31neF8glo/vhO2ydgAvIJGA75BEgASABIABSWiVgoWD4B2aAZPgHjkU/AcKTpE7AC+QRIAEgASACkLAIW+MBYjnwCmo18ArIZCUjDJyC5RVA+ARIAEgASAKkxnqpPwGosJyC2T8A8PcthkU9AtkjTJ2CJfy+fAAkACQAJgFSo9QlYE1kEyCdgZMgnIFs0wyfgCOQTIAEgASABEJm9fQJiOQaChbaXIJ+AkTwT+QRk63mk6ROwzL8uRD4BEgASABIAKUxw8gnIFvIJyN4YScsnYJeLjK3IJ0ACQAJAAiClCW4cFnrs9J16TJ+A1cgnYCRjXz4B2SJNn4A1WAliK/sESABIAEgApMh4qj4Bi4lbHbAG+QSMZPzLJyBbpOUTsNOF8g5a1ydAAkACQAIgZdLyCdiOfAJGOnnJJyBbpO0T0Etr+gRIAEgASAA0SQSk5ROwDDt2kE9AfeQTkM1IgHwCJAAkACQACknaPgFdNbsqMTTyCcgW8gmQAJAAkAAoLGn5BGx3ETDad1XjUU5APeQTkC3kEyABIAEgAVBI0vQJ6MYSDxOfgDESAXWfiXwCsvU85BMgASABIAFQ2AkuTZ+AZdjlKPIJGH5Ck09AtsaIfAIkACQAJAAKO8Gl6ROwCvkEjGRukE9AtpBPgASABIAEQGFJ0ydgNVWfANkG158f5BOQLeQTIAEgASABUFgSn4AxPsHFFAEr/PsjfOERQ09u8gnIFmn7BPRRTJ8ACQAJAAmAjIqABd4/l0cWAUuxc2f5BNRHPgHZjASk6RMAlqdRJJ8ACQAJAAmAjDIeO3/up1odEGOXk/gEjEE+AftCPgHZIm2fgJL3gaJEAiQAJAAkADK+yznBF5qYZkHyCRg58gnIFmn7BAxSHJ8ACQAJAAmADJP4BJyInUOuRD4BWXgm8gnI1vOQT4AEgASABEBhJ7gun3DwCSimbbB8AkY24cknIFtjJG2fgG3k3ydAAkACQAIgJxPcWCz0ONp36vIJaP7cIZ+AbJGmT8BqrATxBPLrEyABIAEgAZAjEp+AccgnICvzh3wCskWaPgGr/GtefQIkACQAJAByhnwCsoV8ArJHmj4By8mvT4AEgASABEBORYB8ArKDfAKyGQlI2ydgXs5EgASABIAEQE6RT0D2kE9AtkjbJyDpA3kRARIAEgASADnf5aTpE9CFnXfLJ6A+8gnIFvIJkACQAMiwABjAztK6vSN2+2Da44OpzV9acJ7LUD4BMUQAPNcnQImB9Z9J2j4BC1wEKBIw9PPY2ycglghIfAJ2u+jIeomgBIAEQNMEQNkHylLgR94RrwK+DvwQ+JVPnuN9IHVowak7wSWhzrJPQLFyArqxnIN+jzyoRLD+hJj4BKwirk/AZhdm8zzyoMTAocdIp4uytHwCuoGTXShnVQRIAEgANE0ArPXO96/ATcDDWNb5Ov9/S4GHgLtcsc+leLdxhZzgEp+ATqolgqGp9QnY45EHOQbWn1smYyVi64nvE7CCqk+ASgSHZjSWzDqFuD4ByVXC23yMZNUnQAJAAqApAuBJ4EvAt4FHfKD0+o6m7F/7sIzqddjZ2nosy3qu5rG6ImCC7wLHYmf23cT1CejFQqvj1Px155fEJ2Czt1ksEbDBx8ok5BMwHLU+AWmIgF0uAg+SAJAAkACwEPJ1wLVYqGwkC1QSet7mImC+5rFhn+k8LDwf2ycgeX7yCRh+cpzlr+3ENQtKfAIm+DORCBiaxCfgIOzILKZZ0Ap/NodiESEJAAmAlhUA/cBPgMt9YOwPPVQvw5nhkQCFnus/18O8f68gHZ8AlQjWJ7lGdjrVI5RYIkA+ASOPBCzwrzF9Ana4yKiQPZ8ACQAJgFQFwFLgeuDWA/z3Pb6gbfHBNFO7nLpM8AEZ2ycgKRGUT8C+ScMnIIkErEQ+AfsiLZ+Abqo+AYdkKBIgASABkKoAuB34nk9QB0qvT57rsazeqRIBw+5ymuEToOOA+qTtE3AYFjGTT8DQpOUTsIPs+QRIAEgApCoA/gc7AtjT4Pv0Ur2B7VhX1BIBz6XWJ2BPTSQglk/AEn8Ox6DqgOGeyQwsUS+2T8AzwNNYqHuWIgF1n8fePgGxSgR3YrlMPVSTZ5tZIigBIAGQqgC4Cbgj0ALU65PncizLdppEQN0JrssnHLDzyFiRgG5//14XHfIJqD9hJj4Bq4nrE5CIgCTyoJyAocdIp4uy2D4BSWLgVprvEyABIAGQqgC4Bbgn4PslkYD1NbscLThDT3DjgMN9AVhEXJ+A5Cph+QQMP/dM9mhJEs2K6ROw0kWyfALq00X1jD52ieAaH4Mn0DyfgK3ANS0sAMoSAOkKgHuB+7DEtJAiYK0P1lmoRHA4JvgEJ5+A7IgA+QRki2b4BBxFc3wCNmHl2N0tKAAqEgDpC4BFmPHPlsDvmyS5bUc+AftiordPl09wMUWAfAJGNnnKJyBbpOUTsAM7DqhgkZk0RUDFReF1LSwA+iUA0hUAfS4Cnozw3j0+eXYjn4CRiIAFPnCXE9cnYBl2vnqI/1zxXJrhEzAZ8wnQ3QH1IwGJT8CqiJGARARMwSJBaUXLyi4AvtnCAqBPAiBdATDRO92DNF4JMJwI2OoT6gyyfRtXM5mAnT/3Ea86IBEBi2t2VRIB9Un67FbiHges8/eXT8Dw1PoErCVeieB2f+aHYccBaWxcyv6Zvu0ipNUEQFkCIH0B0IUloT2DZdr2R/gZyXHARuyscwoKddZjLJaEtIfqEUoMEbDNRcAY5BOwL+aSnk/AUo8C6Crh+iQ+ASWqZkExRMA6LEp2UkpRgEEf898JIABKwJtyKAB6JADSvwtgBmZTutgnoRjOWz0+WNdgpVbyCag/cLuwbP1eqlbLMXwCtlP1CTjaxYeOaIZ+Jmn5BGzCjuQOQz4Bwz2PxCegEwvXxzoOmOQRgENTEgArMWO2RgVAe04jABIATRAAbb7jOBSrT97kk1FokuqAVVR9AnQcMPQEN8YnuIrvCmNFAhKfgH6PPIyWCKg7RhKfgFXE9QnY5GI8iTwoJ2DoMZL4BEwknk9Ap4/Dk1P4TAMuZr6PVSQ0wigXAMfk6JkOArskAJpzHXCH73IW+A4ktghYX7PL0YIz9AQ3DssM7/QFYVuEn5PkBKzCjh1OQmZBw+2qJrt4XU98n4AVmK22fALqk/gExCoR7AROA16QwmfpdzH+gwACYLQLgKNzJgB2SAA0RwAknX0mVnO7AksOjCECkuOATf7z5mvBqcsEj8yMw8L1Me8OSMyCjkPHAcOJgMQnYAtxqwM2uFiegHwChqPWJ2AJYUsEJwEvTFEALAF+3KAAKPn4fT12fJEX+oEtEgDNEwCJCJhoC/M6AAAgAElEQVTnk9w6f8USAUmJ4HRX8WJoEp+A0aTjEwDyCRiOxCdgNun5BExEPgHDkVS0TPJddKhIwBzgPOCUFD5DUpJ9I2ZG1IgAGAe8zoVjXugDNum8q/l0Aa/wCagE3B1pguvGLiIq+aR6JsoJGG4iepur5Kt9kgudrDmIeRBchR0JvdV/rhhaBLywZpG5iThHNL2YWyfYue6FPj7Fc5nsu95+4CvAozRe1TTPX2lQ8d83hLjvyOFcWgZ6JACyQSfwqpoHc28kEbDNJ8+yd9pTUdJTPWYB7/FJ4jos8SmGCFgGXOETyJslAoblxS5gy8DNkURAj4+/QR8j5yIr53pMAi71zcvVmMvpgYqADiwxNq1EurLvghsVAKWcCoAKqgJo+hFALe1Y2HEKFubcSLzjAPkEjIy0fQK6sCS08Wr6usgnIFuE8Ako+XtcCjw/pd97N/AwcLt/34gAmOIbuAU5em49wEoJgOwIgEQEHIqddy7BEvfkE9A8muET0IZ8Avb1TOQTkK3nUesTsHI/RUAbVn3xPuDiFMXvLuA3wC9ozJU1Ket+Jen4F4RiD7BUAiBbAgAfTLN90pFPQDYmuFqfgGXE9QlYjnwCRjLppukTsAg7m5ZPQP0xkvgEHMTI7w4Y5c/xT4G3eBun1d+7saOeXzfYd9q8X1xEvi5h2w08LQGQPQGADyb5BGRrgkvTJyApEZRPQH3S9glY7iJZPgH16fJd8BHY+fpqqjkBpb1eY7HI2ocwG91DUm7XbcCd2L0svQ32w8OAl2PHU3lhF/C4BEA2BUAiAhKfgOXE9wnY7AJAVwnXZ4JPVGNdBMTMCUjOt49DSWjDTb6JT8Bm4l4gtAErE5yIfAL2JQLmYLa4p/j3k3zsTHdx8GLf8V8GvMTnnbTbcytwK1a90NdgHzwSuACL3OaFHcBDCmdlm3FYXWw/8EXiVgfcjIWzKj5AxdDMxbL1K1j2/nLiVAcsAb6BJVld5mJQPJdRwOnAB73/xioRTKoDkh3sq9FxQD3GYna+x2CmPuuwkHsZO06bRtX/pFkM1PxOIT5v3vrCINCtDpwPRZ34BLQRzycgKRHEf84LUE7AcCLgbf5MriKeT8BS4EoXAW9BJYL1aANeRDUaE1ME3OPP42DgHEUC9jl3HU02LXIHAwmAJEcob/1gENghAZAPan0CKr4T2RPh5yQiYNAn1dN8shPPZRbwbp7tEzAQYZAuAy6neuXoXDV9XdL0CbgaC2fPlVDOJaEiAEk+Q97mSUUAckaHi4AOf3i/iSgCbsbOxf4Oy0ZX+dPQTAX+zL+/Dgvbh44ElF1cfNnf+1IXH2JozqwZI7cSJ08jySC/E3gDytHIqwDYHkgATMzhHDkIdCsJMLtJgEPRjiWhxfYJ6MXO7eQTsO/BP5p0fAK6XQi0Y2erY1B1QL1nkpZPwADwUmTclEfWANdgyXCNjNcOLE/rDBcCeWETcKNCV/mjCzt7/ARm5RvLq3w78DPg01im7ICafkjasPPg92FHAocSJyRcxo4DrsKSD7cS/j72ojAKc5b7BHB+JIG/y8dFjBsjRXz6/BmGiABMIJ9HADslAPLJOOxylE9iGdBjIvyMSo0I+CxwnxacYSeBaVi2/gewWvFSpEG7FPg68AUXAVp8hqYTK0X7O+BlmEFN6PGxE7MM7lNz52/xI0z0tOQCc3TO2mAA2CIBkF/GY5nPHweeFykSkNSk34aVIf5KzT4sM7ESwUQExBhfiQj4NpYcuFnNPqwIOBH4MFZJE1oElDFHNQnj/O3+Q0Vu8poDMABsURJgvhlLOj4B3cBPsfNn+QQMzxwsW3+QuD4BSSSgA/hj5BNQj5g+AUkJmDZS+WIPB3ZpUT3yKAB6gJ0SAPknbZ+ARDWfiRIDhxMBl/pCfTXxSgQTn4A24K2oRLAeMXwCkp3fdFQqm0cBsCFQBKDT+0Ge1tIBLPlxQAKgGHRizmQl79T3RBQBN3oH6sB8AtSHhmYmlhQ44Dv1GCWCiQi43Bc5mQUNz4upul3+pEERMA67IGqKIgC5Y7cLgEYjAG2++I/N2efv9b5f0eRdHEZh12m2+6LzW+L4BHRj9dUAf4NlW8snYGimAO/35/Et4vkELHcRAOZQqOOA+rzAx8oAjfkETMcib2PVpLmMAGwMEAFox7xA8hYB6kv6vZRr8SIBLwc+5rvzWLXi23zy/CzwBMqCrkcJSzz7c+xIINZNcsk1xVcA1wLPoOqA4XZtp7p4TUoE93eMjPf3uEgCILcRgE0BIgB5FQBJBKAsAVA85BOQvQUn8Ql4F+n5BKg+vT61PgEv9eczEhFQ8sn+TOAvsdJPzaH5jACEyAHIfQRAToD5cgLcn0jADN9xLnK1G2OB7sWc1tZjV7LOQu509RaOcZh3fCd2FBDDpz7xbkiuxT3RBaCeydCT92QXAr3eZjuGaavkGV4M/BVWejtazZhLHsesuxs9Ih2D5ZWcRb5cADcAdwC/kwAopgBIRMBM7NrN5f7QY4iAHsxWc7MLgPmaX+oyHrNyHgssJo5tcK0I6MOsnBWmri8CprkwO9zFUjdmElP7XKZhVQTvxEouTyGO+ZaITwV4APgujefjjAUuwMpM83QfxGrgFuApJQEWm3Gk4xOQXCCUZFjLJ6A+czCzoAoWqo9xlfCAC4zEJ+AdKDGwHm3YdbWzgJN8c7HORdSgi7ZZWDRtIc29w140zi5gS6Ax1+7jKo8eAJuAsgRA8ZFPQDZFwNv8mVxNvBLBJcB/US0RlE9AfSb6Tu50qlaxAy4AFOovDt2++IVglIvDvPWPPXiisARAayCfgOyRpk/Af7oIeDPyCRjpzm6SmqGQ7MCOK0McvY3Ccq3yFgFIBIAiAC1E4hPQ5gvDb4jrE1Ch6hOgHdTQJD4Bg5hPwGLi+gRUkE+AUAQgRAQgSQrN41Xpu3yzJh+AFowEXIj5BCS3CMb0Cfg08Bhx7mMvArU+AW/HEtFi+QQkkYCv+QSoEkHRimzDKpca7f9JpVXeSgB7vA0GQDWsrUitT8BpxPMJ6AZ+DvwT8AiWiCieS5uLgD/FjgRi3SJYBlZgOQeXY4lQusVOtBpbsKqlEJupWeTviDNJgkQCoHUZC7wQ+MeaSECMXWciAj4H3K8FZ9hIwFQsW/99LgJiRGYGsaqD64AvAVsVCRAtKADWBej3o7Gk2rwJgOQIpCIB0NqMw2qb/xbzR48lArYDtwOfx5IPteDUZyaWrf9B7DggxvhMEgO/BfwHlgwkRCuwE7sDIETuUxfmsZJXAQAoQ1uRAHgJFp7/EvFKBLuBn/qCVgbORu509ZgNvMnb6QpfrGNVB3wDO8O8DAtnClFkNmKupSHowky98pYDsN3bQQJA/KEjJz4BJeCXEUXAT/z7NuwIQj4B9UXAJf5MriJeieAy4EqfB96KfAJEsdngrxCMxlxPc30EIAEgcBX7Kv++TDyfgEQElLEkGvkE1GcmZlPd7zv1JYS3ch6kWiLYjh0/zFbTCwmAfTKOfCYBdisCIIai1idgAPgtcX0CoOoT0KnmH5IpwAdcMH2TuD4BV/iu5hLsdjwhJACGphOzhB5P/o4yt1NzXbiSAMXeHftC4KO+O4/tE/BZ7GauPjX9kCQ+AX9GfJ+AJZgj4U8jiAwhsiIANgZ4n/FYAmDejjD7fe7dnfyBBIDYmy7gXKxEMKZPwHbgZ9htlA8jn4B9iYA/Bd5DXJ+AB7BLnZaiag1RLJILcHYEeK+JwKE5XD+3YDbISACI4RiHXebziZpIQIxd53bMJ+BfgIeQT8BwIiAtn4DfYYmgEgCiKFSw7P/Ngd5vYkQhHpNN7GWDLAEg6jEe8wn4OPC8SJGARATchvkE/ErNPiwzsES9DxDPJ2AZ8KAEgCgYqwMLgMPI3xHARvY6AlESoNhXJOB8LCnwS8S9RfBm39UOAmchn4B6zMZu9asQxydgJ+aVvsefv56DKEIEYBlhzv/Bboqcn8MNtASA2G+6gIt8kSkRzywouUq44sr6TBShGk4EvM2fyZWE9wnoqREAQhSBxYSrAJiOVcrkTRxvZK8jAAkAMRI6gFf64lwG7iWeT8DNNT/zVPXRuswA3olVUIT2CWhDJk2iOPRipa4hbK+nYBUAedycbNq7DTS5iv0VAe0uAn5DHJ+A5DhggKpPwGg1f93JqNYnIIQIaMeqDvJY4yzE3pSxBMB1hKk0moZVAORtbOzGciD27K30hRgpiU/Ax6jeIhjTJ+DTyCdgOGp9At6BZSY3unOfDRyrCIAoCIPAk9RcgdsgM4EjciYAKi6AntMGEgBif+nCLvP5ByxEH8snoBu4C/gM8CjhbXCLJgLeC7ybxsuTjsJuh9TcIIokALYGer8ZWAVO3lgjASBCMQ67zCcNn4CfAf+MlabJJ6C+CAjhEzAVK/18Hgr/CwmAvenEImQzchgBWMUQZZASAOJAGQ+8mPg+AclxgHwC9s1MzCfgg1iYcn/G92jg1cAbgAlqSlEAKliy8mIsotgos8inBTDASoZIglQSoGg0EnA+llzzJeJVBySJgW0+qF+spq/LbOBNPravwZz99lUiONkX/3dj5/9CFIEBX/g2EaZMdr6/8iiEhowASACIRqn1CWgjrk/ATf59CfkE7EsEXILlBtyMHZ8sH+K5zACOdkH1JmCh5gRRIPqwJOKdgd7vkBwKgIp//vXALgkAEYNO4FX+fUyfgEQElJFPwL6YjB0HnA7ciV30sx6riU4SB4/CcjlehLmbFW3y7/V+mHy/dw5JyfvuaBeyY7xfiWIJgF2B3m+ev/JEGbNBHjIHQpOnCEWtT8Ag8Fvi+gQMUvUJ6FTzU298H+0LfT92E9oOf0aTqZZx5jmS0o/VONe+dmAZz1v9tQ1LKN27DrwN83U/GPNUmErVA2HsXi/1sfzRCzwWSACMBeb4uMmbAFhKnRwICQAROhJwoYuB/+O7zh7CXyyTJAYOYuWIx2mCrkvJX6O9jSbv9ed5o+w7ux4stLkKWAQ85V+fxkqekh1/Za/XUG1T2qudprlwqn3NxpIju/zvKFKQbZIE4iddFDY6hg7FkgDzxiB2D4IEgEiFLuBcX2z+yUVAjEhAUiI44CLgJE3KIxYDeZzM+/1Zb/Vd3S+xKNNTPsH3+d9J/t6Bis6d3rdWYFdVd3hfngOcjHkknI6VWnb4S7ko2WMX5h+yLcAGpIRV1czMqWBe5O0gASBSYRyWpPcJzM0vhghIfAJ+7hP0h4EzNBkXbhdXxsqX7gbuAB7BLnXZ7ruaGOJywF+1770JKye71SMEx7rQPc+jAx3IOyFLdAP3Ey4X6QgsaTZvDHi/lQAQqTIeSy77W+D/EufugEQE3OYL/wexjHZNxPmnH7vb4OeYI+QTVJOZyk36fZKcghUeebgf+B6WjHouZop1sB5dJtgRUAC05TQCMIhZAG+gjpOqBICIHQk4zyfPLxLfJyAx6DhLTZ9bdgG/94X/d1i4fzHZuw9ih4uSJ4CHgHuwo4FzsGOCqXqUTaPsi96TNH4BUBt29n8I+bseuw/LialbBikBIGLTBbzCFWhMn4Bu4Cf+feIToAtt8kOvT1a/xMLs97LX3eUZZr2/7sciXedh0a9TJASawnaq9r+NRovasUqjPIb/+1yg7pIAEM2kE3OaK2Fh+3siRgJudLHRgYVk1cezzQBmUvQQFsW5HcvszyM7XcA85BGMV2HRqONyuHvMM5sw86sQ7n/t2BHPtBy2Qz/7qILQ5CjSYhRwsUcBBomTE5BEAm51oZH4BIxW82eOsu/UHsPO0X+E2bZWCvDZdgK/8EXoPODt2H0ZM1C5aloCYCQW2CNhNFZhlMdITg/VKhkJAJGJSMCFPqg+RzVJJ5ZPQB/wScziVhNvtnYm67Ayzi/7JLWHYt32mFiwJlbMb6Zqt5wYMIk47b7Wd76NCoB2LPHvcMwIKE8MYtUzaxgmf0YlUyJtuoCzsdr9U4lzi2ASCbgL+AxWDzygps/E5Nzru7PPeR94BDujLBf08/b5JPxV4GPAdz3yoaut47ARyyXZFWBjMRrL4zgoh+2wC4uuDRtlVQRANINxmAf9JzGfgPuJVyL4M//vDwPPl+htKluxRM1rXARsbpHPXXZB+mssO30R8B7sYhklqoZllQv+EAKrC/MWmZjDdtjp7dA73F/SZCiaReIT8HHsfDRGJCCxA70NK0P8lZq9aSzCroz+Z6wSZHMLtkFyJnst5pJ5L9krb8w7K4GHCXOsOAZLJJ6Q0wjAw/sSAIoAiGYyFkuS6vPFIZZPQDfwU99tVTCzIJEOFewM/BvAD3yCbmXK2JHADdiFRe8AXpbTRSZr7ME8I5YFEAAd2M1/h5DPJOKkFLJfAkBkmS7gIixpJaZPQHKVcDIxyCcgPv1Y2Psa4MdYUpKoitKbfaLe7WNgipqlIZZi1/+GOE4cj2X/51GY7cGOQjaxj0RICQCRBeQTUDx2YBGdr2JHMDvUJEMKpF9i57W9mG/AdDXLAfOIv0IwETuazOPuf6sLoX0mPmvyE1mh1idgALvpLaZPAFR9AlQiGH7x/zl2B8R9kcRcUShjxkFfcBHwRomAAxZTj2O5JiE4GKsAyKMA2IJVAOyzDFJJgCJrkYALgY/67jxWvXTiE/BZnzSUiBWOPt/5/18XcVlY/Es+142ier1vp/93Fo6Byt4Pvwx8GzsWECOngrlJPkWYSFMXcChwGPm8YvwZrAJgnwJAEQCRNbqwm9U6sUzpGFcJQ7VEcACrRz8pp4M9axPxb7Cw/33sIwM54kLfvtfXLizhdLx/7fDn3uMLxjbfQZb9NeivNGv1k3vbv+a/32XIMGh/+t0D2O2RIZiJ5Qh15bAtBjEjpCUSACKvJD4B/0h8n4Cf+0LxEeQT0CgPYgl/t6W48y/VLJKTgAXAMb6DS16TfFFNREGSa5Is9ruxhKlVWCLZ01SvHx7wv5uGRfGgRwKu8cX/rTldhJolAJYFer9ZWIlyHtfH9Vj2/4jEtwSAyLIISHwC/sV3lqEXlVqzoE7gz/xniv1nEVbq92PSS/hrA+YAJ2LntQuBuZhz20R/TWBkYf5e/727PSKwCViBXU18ny/Mu1L4TP1Y/fbVWFXABS4GRP3IyWpf9LYEeL9RLhoXks8qodXeVysj/bBCZJW0fAK2I5+ARkTUZuBbWJ3/Myn1i4VYlOgUzKv9UCx0e6Bz2mh/1V76shuzrV7iEYEHXIgujxwR6PVoyldd4JyAElXrMYBFCEPdIDkHOw6cSD6PX9ZIAIgiIZ+AbNOH2ft+j/gmPwdjVRun+/N5PmanG1NoHOOv81wE3Is5St6Pmc7EyhPYjd0oeC3wl9jRhvIBnssgVja8LtD7HeH9Ko9tPeBjcIUEgCgS8gnIJv1Y3fW1hCu/qicCD/fd+MW+80/7gpYx2OVVJwEvd9FzK3anwfpIQmAncD2WjX4Jdp2wqFLGIk6h7pVocwFwfE4FwHosD2L3SP+BJjeRF2p9AgaxUGxMn4AKVZ+A0Wr+ISffdcBV2Dl5jIz/dl/0TvIF8AKsRr6Zk3M7cCTwPszC91rgFhdAoXMEKti59n9huQ0Xo3yAWnqphv8HA7zfLCzaMzWn7bFof4W4BIDIWyTgQl+QP+eDv4fw57GJT0AfdmPhQnQGO1Qb3YYl/W2O9KwPAS7FsuEPwaIyWdmZjQaOAv4eOAv4CnY81R1oMUoY9En9u9j59AvV9Z4VIflpwP53PJZvkVeewipY9ivkIUSe6MJCwf+AhWRjlUl1A3cBn8FMNQbU9H9gAHMa+w8sWz4kJarh9s/4TnuBC4KshWXbsSqD87BbDv/Ed+rtEdr7Fhdcm9T9/iCM1mPHgaGMk44HjstxNGQRdv4vASAKTeIT8EksISxGWLS2RPCzWClYWU0P2Dnj93y30R/4vScCf4RFeF4GTCP7yZhjPBrwF8DHsLLE0HPrDqzK4mZ1P/CxeTewIdC4nIGF/2fmsC0qvvgv39+NigSAyCvjqfoEPC9SJKBCNdT9RSz7u9Xpxbzrf0T4HIzJmBf+32BZ/pPITzJWOxaifxPwISyTPLRweRwLeYe67z7PbPG2CJF3UXLRdgT5TP6rYFHK/a7CUQ6AyDOJT0A/5hMQqzqg2yebJAHxLFq3JOsJrFJiFWEjIgcDrwf+FKu+yCtTgVf63PofWOQoVJSk33e9/+O71VbNS+nDvBkeJEzyaQl4AZbcmVcelgDIJ7u8M690VduHJTsdhJ0nHuE7ITE0tT4BJeL6BNzoarvdd6itFkHbiV1fe3vAxb/k/fu1wHtzvvjXipmLvU/2+O4s1IVTqzD76ot819qKXhUbMT+GZwL0wzYs+/9k8hv+34Idx+23CZcEQPPoxbI27/NF6xHMxWkPlmE8E8s+fxEW4j4OO/sWz6XDd12Jv3ssx8BuqmewHViiWiuNod9jORHrAr5nF1ZX//6CLP4JE4HXYGfVl/tYD1Ud8CTwQ9+xjm/B8b4CuIMwibmJmD8ip2JqEEvIXX0gYkgCoHm7/vuwGuqf+O6yUqPowLJ9H8XCfecD78ZCzwep+YYVAe0+KH5LHJ+AbS4CBqn6BLRCKLbPd573BnzPTqzG/4O+my3ascp44B2+M7uG/czQHoa1WFXA63xj0Eq3WO7x3e7vAgmqMT6/zs1pewwAv8aSIQ8o/CHSn0jvxjLYvw9sdeW2941jyW52ly84n3LVr7vCh19QLgQ+6rvJWNepJj4Bn8XOxPsK3q4V38E+SLgytDZgHmZze2JBRVTJRcB7sYqGUEd5ZRcTP8COZVqJJS5C99B4IuQoX/hPxxJQ80iPbyY3SgDkg/uBK2t2qPvqxBVfYB4BvoBZg+5CWcD16ALOJb5PQFIi+GmK7xMwCNzpnzMUM4C3AS/BwuVFpc0/6zsx/4pQbMYSU7e02FzwpAuAEDkoY4GXkl+L5X7s+urF7If9rwRA89iGmcscyH3p/dhZz1ewcOIeJALqkVwl/ImaSECMXXEiAv7Zd8dF9AlIbvu7h3D3rXdht/hdimXNF72iot3F6MVYXk+oyX+FL4bdLTKuN2Gh/0WB5r5xWGRmSo53/7+mgWuQJQDS5RGslnx7A4P+Ueyu8K8dqOprEcZj1/qm4RNwK/B5iukTkJSePUW4crbDqdr7tkoW+2jgFf4K1Re7sRyizS3Shg/6GAvRD7tcjB1Hfu9X6PGxue1A30BJgOnyGGbm0eiE/AiWQDjKJ9KJatq6Cv98qj4BsaoDksTANhcFLy5QGw54lCPUfesHeftcQGslr4HlPJyPXWR1d4BdbI8viMv8vYvcnnv8sz4U6P0O9mcxhXxGoAaxxL+HacAMSQIgXdZhGbwhdmWPYuVF7VgN9RQ1b12ln/gEtBHXJ+Cmmkn9zALsbstYctEjjewy9uJE7GrnVr3aNjkK+B2WwFcJ8Hwe8N3szIK2WeJ0dz+WNB2CmS4A8rr734WV5W6kgaNHCYB02U240rQkJ+DzvtC8kvxeYxmbTl90Sj6ZxHIMTMyCBnw3dlrOx1ivTzKh7rsfhzmundXCfXE6lp9yApYI3GjyaFIG9rICC4ABzHwqVBLqRKx892jyGzXZhpXlNrSeKAcgXdoDt/kAdjb7ed99blETDyt2Lwb+DPNpj6X8u7GcgH/DwnN5LhHsIfxta8+jNc1ralnggj1ELsAgFhZfV9C2KmMmN/dyAFa3dZiLZf935bhdNmJHIg1tZCQA0uVgwtebDmB5Bf+GfAJGEgmQT8DI2em71BBZ5m2++J+ubshM4BzMgrbRY6Iy5iC6mGJWA/T5WAqV+V/CklDPJr/Rue1Y9HclDUaQJADS5XBX/6FJRMAXkU/AvpBPwMgn3lVYglmjF66UfLE7BZivLviH9jibMJGoQeyoZmXB2qniIvSnAT/bfOwq8dk5Xv/WYblMDW8sJADS5WSfBGOQiAD5BOwb+QTsmz2+6wqRs1ICzsBusCup+wEWCTwfM6MJ0deeJkyCcZZIjqCeJFzu1Ane7nmumFiLHYk0vKmQAEiXQ1z1L4z0/vIJGDnyCRie3S4AQh1fnAwcqm73rP53MlYNEaJaZCkHaAebYXZix5qh8humYEdQx+dYiG7HjhWXE+AuBFUBpEuHC4DlWF36hgi79L19At6CrhMeLhIgn4D6AuBpGjddKQETsIzr6epyz9p8TfXFaDmwo0GhudHnk0GKYa7U6zv/XzXYNrWcgpXnjslxuyzHyiGDREQkANJnLvBGzL3rmz5wY4iAxCegA7uWdLKafkjS9glIFsUzyXYELpQAaMOuWp1La95dPxyjsSOoXwRY5Pqx0PAmilEOuAW7CXUdYY7OunzMnZrzdlmEGUkFQQKgORyB3X/eC9zgyj30+XDiE/AFn3gvRmZB9egEXuXflyNHAm7yn9Hhk1FWx+AOLLu80XPGUdi5q/re0P3uBCwSFYK1/sq7ABhw8XkTYY4xS5jl7xnk2yslyf5fHGrTKAHQHEpYNcBHfOf5Y8KZrew9kJISwQpWe6yJeGg6vH3a/Tn8hnCJR3uLgJv92fwNFgIenbG26PMdWG+AiaYNOAzZVdfrc4cTzhdhM/BMAdplLZY3s4ww1TMdmPX0CTlvl0cxz4dQd3IoCbCJJPeh/x0Wop9JnMSURAT8K/B9X4BUHVB/R3Yh8DEsWSi2T8CnXdH3ZqwdelwAlAP187kBd7lFoh2Y5rvSEJux7eTfC6Di89WPCJOA2oaVXL4QS8LOc7s8hJV7Bl2ERHMngNm+4LwBywiOJQKeAr6M5R006kFeZLowk5akRDCWT0A3ZuX5T1jSZn+G2qAX81yvBOrjc5D733DtM5Mw5YDbyb8R2ArsyvTFBMhyrxH1R5PvEtRnfJ5YIQFQvAlgHvAXwCXEy5QewLJq/4tqiaBEwNCM9R3DP9ZEAmIo+kQEfA7L7M2KT0AvYSJFbb7wT0bHjcO1USgB0F0AAfAQduFkovEAACAASURBVMVxiN1/CTt6egX5NqAq+/zwROg5WwIgO5PAAuBPgLdHFAH9WHjtGn/JJ6A+iVlQbJ+AxCzoi2THJ6DPf69GJ5uSC4BOdadh2+ggwuSB7CBcyVyzdv93Y9HKEAtdlwv5Y8h36V9ygdnTod9YqjxbE8ExwLv8+68Tr0TwMcwnoORRh4PU/HUjAedR9QmIdYvgdszutA0Le55Fc8OVgy4CQkQAxqDyv32N+wmEcabrJd+XT90L3Em4nJhJwOuwHIA87/5XUL36VwKg4BwLvNsn4W8RxyyoDztPusL7wOtRdcBwu4han4BfEvcq4bIvCi9s4sJZCihARiP735H0sRBzcYV82U3XshbzQ3g8oHg/FYviTchx3xjwOWdJhHVAAiCjHAV8wHee3yOOT8AAdqb0RaolcFPV9EPSwbN9AmJFArqx888yFjY/rUljtORipxTgfTrRUeO+CNHWiQDIY15PGbgDK70NtfufgRmuxUqsToMKdrHbHZgnR3AkALJJCaud/msXATF9Ap7CfOpLyCdgX2PlYqph+lg+Ad1YiWCF5voEaNFOdwEMsXDnUQAkNsa3YEnKIejycXMB+T77H8CqIX5HpPJODfJs7woSn4BXE7dEMPEJuIH8ZxHHpBk+AY+T/rluKdDcUMaS0gbUdYaljzAlb3mkB4t6PRhQUC8AXuubmTyvcbsw07BolzxJAGSbtH0C/gP4tnc8lQjW312cDfwDdsYY0yfgLuAzvjNK82y3A6uCaLSvlV1QSgAMvwPeQRgfiA7yVXExiEU2/xs74w7Vd493oZ736pNtwG2YKZcEQAuLgPmYT8BbiesT8DjwVaxEcI9EQF3GYUl6iVlQLJ+A7dj531exS0DSYjRWux9CAHST78z0NATAdsKcfY8jX46LO7Ecp0cJd/Z/nC/+03K+vu0A7sOueY42fiQA8kEb5hn+p8A7PBIQg+QWwauAK5Fj4HCMx671/Vvg+RFFwDbgB1iGdFrHM11Y+LQUqE9107oh7pGIpE2ESSqdSH4y3gd8cfs+4ULc7djR3AXkP79tM1YVFHXMSwDkhxJmZ/nOGhEQ4zggEQFXY7bB3Wr6YXdc5wEf8ohALLOgtcDtRDACqcOYgAKgDKx2MSmGfr7rsGO3EP0xL5bLz/ji/2TAHe7xmI33nJz3iX7sSCTW1eR/QFUA+SMNn4DEMfAK7BztNVhIWAy9W34F1XPuGCWCJeDXLgDOSOEzdVB1p2s0H2QQy2TehhmziGeLo+0eAQixCE7IiQDoxYxtbggkfJK17Byab6IVgg1YxG8tkSNnEgD5JA2fgMQx8AtYpOhi5BNQj06qPgFgjmYhSwQrvote60IjjXE7Hss3aTSJr4zlL6i6pP5OL5R97+ScCPUV2G1/SwmXIHo0diR3aAH6xRLMGTR68qwEQD5JfAI+7Arxh8TzCUhKBCu+yMknoP6u+VX+NYZPQLJb3JXSTnqsC83lDU5Egy4AtqqLPIc+7Lgt1PHILKxqKMv0YBfb/JhwN2COwTxMTi9An9jm0ZGH0xAAygHIL8k96x/HQvQziVsi+HlX7drJDS8CXgZ8hGp1QMhnMkh6yXRjfVfVaClVGVjmAlWJgM+m1yf6UAJgts8DWeZhwhqbtXs/Pd83RXnncew+hFQqZyQA8k2aPgGPY7bB1yOfgOHoAs4ljk/AeNIr80oEQKOX1CR2pr/HjjFElZ3AA4Q5Ahjri/+kjH/eX2AmV4MB++nbgRMK0B8GXSDdTUq+HxIAxRAB8zCfgEuI7xPwFeQTsC+Sq4Q/EVAETMNCvGnZAoeKACQT2/3Yma8wdmM5NutoPNRb8jlgesY/812Y61+o46Au4EysEmdaQXb/v8ZKAFNBAqAYtGH2l+8lHZ+Aq4Gv+SQm6u/WE5+A5zUoAkrAKZgXRFp0YuVU8wNFAR7CqgGEsRUL9YbY/ZeAI8hu+L+C5ZLcBPw24Pse7Lv/BQVZy36FJRCntrGSACgOafoEPIKZBV2HcgL2FQk4H/grDtwnoOTvcwHmcpYmE7BchhDmMs9g4c3l6haAmd/cSbhE0RNcrGWR5EKznxGu7G8C1bK/CTnvCxWsMuI3WL5MqjtHUSwSn4C3Ed8s6HLMzGOLmr0uXcBFwPuxY4H9FQGjgJfTnDBnlwuXUOfK9/ouR7t/OxJZROOZ8CVfAI/PaARgEMtz+DHh/P4BDok8x6XNL7ALkVK9N0NlgMUk8QkYwHwCYpQI1voEtGM+ASoRHJpO7EbHEhZOv5eROSyOx844P+DCLm1GewRgaqCdyaOYUdL5ZP+8OibLMJvXEIZRbcCRviBm7fKbMhb5+SYW/QmV+DcFu5DrLJpzVXbo3f8WLBq0KO0frghAMUl8Av6aaolgjGedJAb+m09oigTUp8NFwEexmuXDfIEvDfHsxmHnmhdiiYRn0px7zUdheQDHECbM2uc731+Q7u2GWWI3dr/73YF2e6OwuyhmZPCz7sES/27F3A5DrVknYhejhbixstkM+Ibg94Q7HlEEQDzLJwDMLGgd4RNMakXAIPB6ZPk63Hg7x3dsdwL/Q7UOvOyT2URgIWYvfBEW9m/mOO3AyhrvB54I8H6PYXecn0u4+wbyxO+oXvISYiyOwZJMsyYABoGVWNVQyPLP2d53zijA+pWUyN5Ik3JjJACKTa1PwCjs3u31EUXAF32Xd2lB1HmsZzLHhdLLMOevTS4CxmKh8cnefmNpfpSuA8s/uCGQANiJlTr9wPvJmBZ69ts9+nEHYcLhndhx34kuHLPERuA7LnBDOmKeCbyO7B13HAh9WEL1b2hS9FQCoDUWnMQnoAM7j1sf4eckIuAK79jv9gVMIuC5tFG9u30GFu4f8GfVQbaO5tpcRJ7hu9c1Ad5zMfBtf8+FNF5mmBfuJOwVr2OxKNGsjH3OHiykfT1hLaAXYtUwRxdkXtnpm7JVzRzcojUWnMOBPyG+T8DjmFHQNcgnYCSUfDczFktoyuKY7MCOLo4JuPN5GPOSaIUy0oqPix9hfgihxvR0rELk4Ix93kXAtVhYO1TiX3Lr5ssLIhj7MIv1O5o5BiQAWoujgcuAPybe3QFJiaB8AoolUk7BXA1DXTe7zXfDP/Dvi7z4bwO+i9XBhxLFE7Bw+AKyFQ5fh7n93U5YP/tzXADML0i/2IyVRq6iiXdkSAC0HscC78JqaGOLAPkEFIdJWOnVKYHeb9Anvyuxc/GdBW23Ht/530DYUO8MrMJnQsY+610udp4hTK5RiWrOzGkF6RMDWJTkJpocJZUAaN1IwAeAN/ngitEPan0CfuwTgsg3L8Bq+McH7CMPYdGi+0npBrQmLIhfAZ4M+L6JQ+OZhL1sqlF+54L/wYDv2QX8kYvPolQXbcBC/4tJ2fhHAkAkHIpdW/t6LMkrpk/Av2Ilb4oE5JupmJvh6YSLHPVjZYHX+QJSFBGQ3Hv/r1i+Q3/A9z4aeCN29p+VZLh1vvO/LeB7dmB5J5eS7j0YMUnyQX4cuE9IAIj9fvazXAS82r+PJQKeAj6PnfeGqn8WzeEU4FUMbWLUiAj4NnZk9CDQm/M22uOL/z9jJV4hw7wHYZGYl5KdZLg9vvjfTLicn5ILzndjx5ZFqVhbA/wSi44ONvuXkQBobdp94f848Bb/PsaOYgCrIf+C7/R2SgTklinYLYfnBV6AdmMlUf+C2QXnMRJQ8c/xc+CT/jW0u9vp2Nl/Vnw2+qj6Ojwd8H3HY/dQ/BHFshi/Hzv778/CLyMfAJEY03zQJ5TriOMT0O8i4Er/73diJjDyCcgfx2HlpA/5jibUTmYXZhu7G7sm9+VYaWQe+kgFu9/hRx7JeJjwCV4zsGz4F2Rk8zaIhf6/gkVuQtk7J1bm74u4KWkGK7CE18eysgFqBz6Vw4Z80ncLjXa4SVhGfKtb15aw0OJh/v0SwtxTvjdlLA9gtX+/ECthkgjIF52Y81xi+BIyZN/vi8oSzESm3p0JWWMxVvt+VYQ2Scboq7Ey3qyUwnX74v9Dwib5zsOqlF5HsRxFb8KM2NZk5RdSBEDUTjBHYh4BZczIZ0MEpdqHlQhe7QvJWyXAcsl04A3Y9b6/JszNdgm7sbPz9T5ZvgXLeu/KYDvsxur7k/vul0fa3T3fF8TjMvK5d2FHHN/zeSIUXdjdBm9ykVmExb+ClYDeRdhqEEUAFAEIzhTfYQxg15bGuKEqiQSs8EF+CK3lCV8E2n3cdGBZzVsCL3wVjwA8jvnK78LcEif5z242vS5kf+hi9hb/PWMI81lYOPxisuH5P+Cf/QvAfYTN1zgZS/w7l+LkqFWw8sjvYdEtCQAJgEwzGTjCJ93VxEnaK2NuWEv95831CV7kh1FYiH6LP8fuCD+jD8sdeRQLM5exvIBxTRICu7Fw/51Y5cLXXKTESloc65GWt7tQzgJLga9jl/2EvOhnNhb6v6RAG4IydiviFVi0bDBrv2Alh68bCHN8Md93oRW9nvNKnNr+0hfnWGp8FJYLcDVV9zC98tVPlmJJnTF3pyXvg0cCH8JKzp5yETkQ+TP2YTc2PuU7uct8Vx5bgHRimfD3YLkRWXjeG4F/x46AQobnu7C7Sh4u2PjYhd2SekSWwxMSAHoN9RpwEfBB4pkFJSLgRCyBapvaPZf95BeYP0Ds2vQ2jwDMwpLi/tMXjQ1YDXqPi5JGRc0e74vrsHyE/wdciNlnd6YQnm7HDH++k6Exscd3/scH/vztWGnpjb5jLtK4eBp4CRm9wEhJgGJfA3MW8DHvwN/1CTH0cUDiGPhF321dSrGyf1uhnzwfKw3cDtwdMdRZxs7fN2Alg/dg5XEnYImCpwJHYVUtbTWvUp3+VKlZdMreF7dgx4wPA7/1r5s9/N9HuHK3fW1OPoD5LWTh3L+MJf19y9smVBu0+fO7DDirYGO+2+fMp8hI3b8EgDiQyX0u8BcepvsGccpYEhFwhU+y75IIyBWdwMt8B5444cVcKMv+c/b4gr3SoxATqCayzvbFZab/2cSanVjFJ+Wt2NHTMy4qVvh7dWO5L91YGDfNuu25WOXDG7D8mGaPgQqWh/Edb+OQ/vVjfKyfnxGhE4p+7GjsBuIkh0oAiNRow5K93uOC4JpIIqDfRcDV/t/vJB814MKYgF3Z2odZPz+a0m65jPlW1HpX/N4F5Fh/dfHc0H0STdjjwiUxINrTxDacjB01vJNsmOBUsPyHa4GfEtbcaIwv/K9x0VMknsES1ZfQ5At/JABEKA7HwryJT8D6CDujWhEgn4D8MRkrV+sBvoSdgTYj83kXcUpYYzLeF//3YMmOWWAXFvb/IWEdQkcBC7CSv2MKthb1Ao9g3hCZ7oMSAGJ/OQo7rxvEXK3WRdjlJSLgCu+jr6VYfuBFZxp2y2S/7xwfpXhX/YZmKmZ9/CdYPkUW6AFux479lgZ+7+nYMcfZWKSmSKzE7kbI9O5fAkA0IgLe7yLg+ogi4DEslNwOvNInSZEPplO97+Eq7KrfXjXLkMzFLr15N3bZTxbow45RrsCS/kJGcSZimfGXYsdGRWIXcC92/flA1n9ZCQBxoMzHPAJ6Xe3GEAG1Vwm3uQiYrKbPDRMwY5dOFwEPEP6CnDzT7uPoLS6WshL2H8SObq70xSzkMxvlIued2CVk7QV7pr/HQv8x5kMJAJEZ2rAs67/BEpVuiCgCHgf+zSem16OcgDwxBngzcDDwVSyLXNdBmyg6DCv1ewOW8JcFKpgF+LexJLadAd+7hJ33vx4r+eso2DPdhpVK3paHxV8CQITYwcwCPup96TvIJ0A8d9LvAi7wHd+12LHRFjJoi5pSe4zBPO//Eqvzn5yhvrwOi+hdiZVAhhzL07CM/ze7ACoaP8cqJXbk6ZeWE6Cc3ELYwS4DPu6TfCw6gJOwS0h2UizXsFZ49WI++v8GHNuiG5CZWN373b5jzFIf3g5cjh1FhBYko7G8oScK2K/L2J0p7yebN1YqAiCi0gYciiUxlbASwRi3XiXVAdd49OEyipdBXGQ6sdKvS7DEt+9it+jtaJEx8nzf/b4M84bPUgi8xzdWV2LZ6yF3/iUsyfEtZCfPIfQm+kbsut+ePP3iEgAiJEcAf+wD4lri+QQ8iiWVjfJJRTkB+aGEufNd7NGi47Ea85g36jWbGb7ovxbzvJ+Wsd9vEPiJC+vfE/b8uh14Hnab4WkUL+lv0NvsRiy6lSskAERojsZCnLU+AbFEwOW+i3oNqg7IG2Owm+6OxAymfoL5+q+iOAmCB2EZ7+dgFSzHkb3Et0Hgly6of0vY0rWkyuEyLOmvaNG6Cha9+g5mfZ07ASsBIGJwJHYeNoBlEq8lnk/AF7Dw6sXIJyCPTMOSOk8EbsISqZ7ArKbLOf1M4zGvjDN91/+CjC5+Az6GLnfxFdICueSi/A1Y+L+IRl59wK+xq6nX5/EDSACIWBwC/LWr5O9FEgFJdcC/+s95tSIBueUELDHwIuxI4KfAcuwWvv4c/P5tmO/BDCzD/w2Ys9944l8dfKA7/6WY0c/PsATAkEzwyMd7scTHolF2kXqV99NcIgEgYk6Is4CP+GTzg4giIDELKvvEOxGVCOaNEhYePx47Enit95mbqd7O10P2Sgc7scuGpmFHGq/xnf/B/nmy2A/LWPXT14Hvu8gK3SanAB8G5lG8c3+wCo7bsWqO3CaxSgCImLS7+v8YVgZ0vavmGD4BT2DHAT3YhUW6RTC/fWY8dl4+D0se+y1wK3ZWvdpFwCDNOSIoubgdheUxHOk7/QuxJNiJWClYlvveKh+LV0ZY/MGiOR/EjnWKWO8/6JuOr0ZqPwkAUagJfQ7meNaGXSwSq0TwCZ/UoOpDLxGQ37npYCyRbprvqpdgdsK/Ah5yMTlYIyhjJQ+WavrRBF/0n49lt5/oIndyTha7lZjL3xXYPfWh2+wYzP75ggKPv6Xehk+RA79/CQDRbEqY7el7XBBcE0kEJElNV/t/X4Z8AorQdyb4a7ZHBi7w/rMYK8F62ifljYTPFxiHeRYc6TvbhVh+ywx/TcxRW66p2fmvivD+84A3Am9y4VZEtmN21j/ALv7JdcWKBIBIkyMxnwBcBMTyCXiEqk/AW3M2SYv6dPhueyaWaNeNnWWv88V/A5ZnshZ4xv9/N3Zeu8P7RmWIOXAsduwwwb8e7GJjNpbHMs1/5nz/7zx62G/AytWu8UhKaKZgHv+XENcNtNk84O24uggfRgJApM3RWHi+jPkExCoRTHwC2rGEsilq+sIx0XflJ/h/DwCbXBBs8kV/u792YGVblb2iC+0uACbUiICDfaGfXRDxuBlL9rsGOyYLzTjM5+Dt2BFAUVmGGf7cU5QPJAEgmhUJeD92fvsd4tR8Jz4BtVcJT1PTF5pRvnDPUlOAi51t2N30X8UiY6HpAl6CHe+dVOC23INVpNxMga60btMYEU1iPvAhLGw4J1JfHACexC6fuRG7gU6IVlr8bwP+HYuIhWY0Zu/7VxTT5jehDDyIGVU9WaQPJgEgmkUJO1f9CBainx2pPyYlO5/HEne2o7voRWss/ncC/xsL+4f2T+jAjvP+BjiDnN2Ct59tuQnzTLinaB9OAkA0k8Qn4KNYst5s4pQN1foEXIddJSwRIIrKVsw34VMufkNXRpSwWx3/GrvcaHyB23I3VvL3c8K7JTYd5QCILIiAOZhxSIcr7RgZtv1Y+O6/fDf0Lix5ST4Bokg8A/zIxe6TxLFRXoBd/X0RVu5X1DHUi/lN/DdWZlo4JABEFihhtdXvwqJSX8MSA2OIgMf9/cGqEeQYKIrCJuzejSuwBNgYTolzsVr/t2CXbxV17FSwMuWvYPkTA0X8kBIAIksczrN9AmLYBifVAVd79OFtFNe0RLQO64Dvurh9ONLPmIkl7b4DM/0pMluAG7CLknYU9UNKAIiscQTm4FfGjgNi+QQ87uq+wyc1+QSIvLKKqsnPY5F+xjTgdT42jy14e+7B7p/4BnakUth8IQkAkdVIwHt9oU4uEIohAp4AvujjQD4BIm+UMW//6zHny8WRfs7BwKuwc/+TC96mFZ8Xvuliqr/IH1YCQGSV+cBfYmdv34skAmp9AkrAq7FLXYTIOoOYDfI3MZOfGImzJcwJ8eXA+7ArfovOWuAnwI+LvvhLAIgsk/gEfNgX/u8T5zig1iegDLzBJz0lBoosL/7LsJD/ldg9CDHG3wTgHMyr46QWGBM9WPnkN2iRUmEJAJFlan0COrF63BiJgbU+AT1YkpOqA0QWKWNRq6swT4vNkRaq8cBZwD8Cx7fAWlEB7sCOU5bQIj4hEgAiDyJgNvIJEKKMudFdAdxOvAS1scCLgL/Drj8e3QKL/9NYlPFuwrsmSgAI0QDyCRCtTh92Ec1VwC8xq98YdAFnY1G301pk8e/GciluoUAX/UgAiKIhnwDRinRj7n7XAL+OuEh1Ymf+f4ZZ/Ha2QNv2Y/X+P4y0qZAAECIg8gkQrUIF2OCL01XA74mXmd7li//7gAtaZPHvA37l88jTrdjBJABEXiMB8gkQRSYp8/shdua/hDjWvmBn/i/2nX+rLP5JJcWVmN9/rwSAEPlBPgGiyDvTRZi171ewMr8YyX4lLNH1TKzU72yKf+afsB5L+ruZAt7yJwEgik7iE/ARX/hviCQC5BMg0qQHC/Vfid1C1x1x8Z+AZfv/PXB6Cy3+27Hrfa8gXjKlBIAY8QIz4K+yD/YSlu3ejp1Bt2nBGZJ2YAaWsTwa8wlYjXwCRP6oYMl9t/vCdA9xzWgmAecC/0BrlPrVjuVfY0d762mhkj8JgOzRi90zfSdwH3apxx4fjLOBU4HzgKOwczoxtAiYDXzAhdI3iFci+ITvzMBKBMdIBIhAi/8GF7DXYcdOMcvRJgMXYtGz41po8Qd4AKumeJgWsPqVAMgu67EbvG7BLvHYiF07WfZFZTyWoXoT8FLgTVjym3guiU/Au10QXBNJBAxQLREEq0YYp+YXDVDG7pu/FvOfXxZ5VzoFuBj4c+CEFlsDnnSRdSsWyWt5JACaw2LMbOYG7Hy5MsSOYIe/lvprLVYDf5p2nXU5gmf7BKwljk/AI1hZ1ijgLVg4VYj9pQeL/l3vG4ENkX/eDOA1wHuw6GIrzSMbsaS/HwBb1PWMduBTOVVy/03jCV+TMHe5NCfw1cC3sBu8lo/w32zDsoJ3+iCehYW7xdA7nPm+i1pOnHPUMubBvgJLCDwEOw4QYqRs8h3/lVgmeuxktDlYAut7WnATsdsX/6/RovX+w1HJ4euGQNGL+T6Jp/V792FnfMcd4O87EXg7djTQl9Nnl9ZrGXbGOS+iWBoFnOjRhmfU5nqN4NXvYv7fSeeSnRKwAPgYdnzVau3d6wLrRdo0DT2BifRYjvl4P36A/74bMwbpwTLfT6S1Enj2h0Oo+gR8n3g+AY9jPgFgZkHyCRD12IUlkn4XO/N/hnjmPsn8fhiWsPo23/C0EomPx5cxs5+yuqAEQDP5HfBgg++xAzsv7AU+4buILjXtkDufWS6USEkEDGK2wcoJELUM+rj9ORaGvh2r9ol55exoLCfmQy5Mp7dYm5eBlcCXiHt/ggSAGDFJQl+jJJNJH/C/PBIgEfBcEp+AD3tfT2yDY/gEPI7VFvcDl2Jlm0rWbG2SkP867Jjoe1gCcOwM9C7gFCzsfzZ2mVWr9cU1WKLujSjpb5+dVDkA6bw+RrhzqMTJ6yLgXo8I6Ix16FcZywn4WywZKhYdPvF+GQv3ltX2Lf36/+2deZCU9ZnHP3MxAwKKCgiooBGUeAfxiEbdaDSy2UOja2rX7H3VZqtStZva/Wf/ytbuVrK1W6Y2l2B0TUyiq2IM4gWaeKPgLQJyiYDDMVwzA3N37x/f591uZhlmhunu6X77+6n61ds0COOv336f4/c83+dgRPu3x31XioDrOOA3gWVI8a4a78EdEfmfjs/9nQEos7RUoVLQWVTh/gLw7YhyL/dnOqCzNAvpBNRSPJ2AHtTTbZ0A04zO+hej8+e2Evybk1C6/y9QpX81dqa0htO1EHVc+dzfDkDZMC5Woc6jEidgGRIOagTme5sH5FNYJ8AUl05U6/Mg8BRqOyuFEZqB6k++Glmouirc+250NLooHPGsb0c7AOXEdFSYtrHAf+9BpBh4chibOd7qAZmNqqIzSDb4E4ozSvh9pOnehKYInuCtr4qo/3lUcJqk4Et1T9+Gak/mVuneZ9D8hHvjauNvB6DsODfWxiL83fuQytUU4K9wO9pgmYC/DEP9IMXpDuhBfdffjc/kGjzPIc1R/3rgCZT2f7NE/25DPE++Avw+0ryoRrIo6/IjJPPb61tyaFgJsLRKgBOR3OcqVLRXaA6gI4FTgHNwAcxgn/25sWfbKK5iYHdEZqd421NFHyo4WxGO3v1Fcu77k8wKmYc0/b9SxfdWBnVW3QksQTUAZojYQJSWEyISvIHite29FZmAFpwGG+whegrSCbgVnaEW4/vQjc6C30a93yYdRucgOt9fiHrtF4ezV4pn9oloQNi/Abeg4r9q/Rx2hPO1FLf72QGoAOZF1mEexVHx60ap5+fwuMvBqEPp+b+PKGo6he+XTgY7vYGESUzlR/27w+D8LfC9iPq7S+Bw14ajekcY//lUr95ENoKcRUgddYdvTTsAlcAY4CrgH9FErmI4AduBl/BZ2FCdgOnA14A/pDg6ARl0bPWJt7uiDU4P8Drwz8A/oZkcLRR3fG9CTTwv/iEc1tkoi1itYlMtSNjrfnSE52znMeAiwNFhPHBtPDj+HRUNFVIdbF8YHGcAhv5wnYkyM7WokrjQOgG78flkJbMFTe9bArwTn2cpg4YFSM//GmBylX8We+KzWIgEvvp8e9oBqDQmAF+IKP07qDCwUE5ABhW3JeqAlqQdGv11AgopG5xxlFKRtKPWvqXAsyjdXyqDU4PGW38ZHVHNx8JSB1Cl/0Ikv+3vlB2AiuU44EsRqf8QpRcL5QTUmcoLVgAAEYdJREFU2fAfE2chBb8M8GMKpxMwkepUZqtUOpCg0wuove91VPhXKuriXrwZifvM8fOa9nDC7o7Pw9gBqHiawsNPjEwhnIBGJDhUzWeEI80EJDoByQChkToBM5FQkylvulC6fyVK9z+DjtRKyTjgQnLKfpP9PaYjnLG7gV/5NrUDkCbGICWvWpTSWjlCJ2AqcBkSCjHHxunA11G692FGpiveBFxE9c1jryR60dnyO6iq/DGk2VHK8+W6cBIvD8O/wE48xLNwBfCDcMic9rcDkEon4OYw2ndy7GJBNUgE6It2AEZEohPwjXj90DE6AfXAp9H57WRva9nRh1LLm5F+xmKk6tdDaQfJNKIs0e+hbpSZ8UyodrqQhsZ/oPS/C/7sAKSWJuCmMNzfQt0Bw3UCzkHjQOdSnQNBCh2RTQH+Ll7/nOG1HCWiLX8KnOftLCuy8d1qRhmeR1DnzEFK2z5bE9/7y4E/B25EgmH+7urzWQ38K0r/d3pL7ACkneOAz4fx+BYSkBnKjZ9ErLdEFNHkrSyYEzAN+JuI0n6CzoizQ/g8TkK1BDfh2QzlRIacmM9DaHDTTkrfNpuk/L8a39vzUHeQyQmafTOMf5u3xA5AtTAB+A2UArwXeBrYP8h/cz4aCHIr1pwvRpQ2E/izyAj8DBVrDpSObEBp/z9AxzqnYdGtcuETVET2FMqwbaQ4czkGoxHVhfwJcF3cXz6yEz3Au8C347OyfoYdgKpjfGQCjkcKYK+FR9yM0pT1EVWeieZ/XwV8DqnameIwE7gdmAW8Eg+pj8iNfZ0Qxv584LOxpuIirnJgCxoT+2J8l9YyerMZTkYaILcjYR+Pis7Rhwox/wt4EtVnGDsAVUkDOhs8N4z7BxHBHELpw8QBuCgMj88Ni89kVGNxWXweH5HLzkyMz+Ec4FRvVVmwNSL9F9B8jDWjFPGDMnpzUXX/76DCUGeGcvTGZ7UQFWTa+NsBMBFZXhHLjD414QhcE8uUXxTZHA7aS8Dj8bprFH+mqcAl6IjuS1gT4kjG/y3gLuB/bPztABhjzHDoQiNhN0S0/zBq6SvFpL6BGIf0HxagGp2LcKauP91IdfF7qA3Txt8OgDHGDEoWdcm0o3P9Jai6f3MYltHqG68HJqH6nb8GrkRHdjb+/99pW406np7C1f52AIwxZhAyqFq8DY3lfRQVZjajGpnRGoVdg876zwTuQCn/07Ci35HoREcz30TV/jb+dgCMMeaoEX8vsAMpwy1BhX2fhAHJjPLPNxWJ+dyB+vqn4EK/gYz/W8C/oM4Mt/rZATDGmAHpCGP/HGrp+xB1YRwqg5+tAXWG3AZcjyb5Wcp34M/xNeA/0ahln/nbATDGmCOyJ6LFl5Ey5uow/Jky+flmR9R/E3AprvA/Gm1h9O9CGZwOb4kdAGOMyacbifesCaO/Iq57yuhnTCb33Yiq/M/A5/xHoxVYjvr8l+PBPnYAjDEm6EGa/B8jid5VqI9/NaPbw9+f45Ggz1XAl1Frn2dvHJ09wDJgESr480hfOwDGmCong6SU94bRfzWiw7dRejhTRsbiOGAGEuRKZHzHOuo/KlmgBfglSvuv9JbYATDGVLfR70LFX7tQ+96TEfHvRlX+fWVk+MdE1H8FEvO5Ln5db+M/6OfcgsZoL0LHOcYOgDGmCo1BXxj3PREJPo1S/LvCGeiifAr7QO17Y4EL0cje6yID4Kh/aJ93Mzrv/ynlVbRp7AAYY4pMNm/tQmn9F8L4bwlH4ECZGoYxaPrjbcBvAWdH1O+e/qEZ/41oot9jwHZc8GcHwBhTNfSRm8T3OpLp3YYEe5I0fzlSi1T8FgA3IDGfU7GE73A+97eB7wNPoKJOF/zZATDGpJxOlOp9D1Xurwc2oeE8LWX+s9dElH91rEuAOTjVPxy6kVbD3aimY5+3xA6AMSadZCPC20audW8N8D6wjsqQd62LiH8+ufHONvzDpxUJ/NwDPEN5qDMaOwDGmAIa/DaUwt+J0vlrI9p/F03gqxRltwY0pOd84Fqk4ncWTvUfC7tR6+YipOvf6y2xA2CMqXyD3xHRXWL4N6Bz/VVoklsygCcp9it3GoHJEeUvAG5Blf0NjvqHTSacwKXAD9DRjyv97QAYYyrQ2Peic9xu1JLXFhH+SnIa/C3k2vnKqVf/aNSE4Z+AFPx+F1X2z4j3Xdk/fHpRked9wH/Haxt/OwDGmAqJ3pLe/L6I9LdGVL861jpgPyru6wzHoJIe8jUR2Y9DZ/y3ojP+aUjVz+n+Y6Mn7pM7gadQi6eNvx0AY0yZRvf51y5y6fy1qHBvHbADCfIcjHWIymzhqgnjfiI63/9tJOYzA/fyj5QOJN703bjuw21+dgCMMWVJZxj2bahIbwNq1dsR0f2+WPtJR/FWPTAL+Hysc1CV/wTfCiOmBXgcuBfVgbR7S+wAGGPKIzLbE4a9mVylfnM8uPfEezvi1z0p+/+fAJyL9PovRdX9c9ARgBk5G4FHgAdQx4eV/ewAGGNKRBal5Vsj8mqNyH1vGPc9Ydh3xNoVBn9PyvdlGlLr+0wY/vmovc8Uhl5UBLo41iZviR0AY0zhSKbjdcQ6dIRraxj7lli7I7rfjlqxOqpov8YB01Fq/1LgC8DFOM1faIezFVgB/AhYho6JjB2AVOHeXzMcQ51c819n+72fjWtv3urrd01WT0T0+8Ow74zoPbkmq51c2jU7wDXNJCN5pyDJ3uSM/8z4PX+PC0cfyiI9D3wHpfw7vS12ANJ4o2+rooeoOXa6yLXB9cQDMRvv98T7nfG6Ny9qPxArEdNp7bcSw57t5zwc6Vpt1AFNqGXvTNTC90XggnivHrfyFZoeVCy6GPghyi71eFvsAKSRnWjcpx8iZjCy/SLuwV5nhrFMjpp4LiWKfZ9Din0Xx6/HOeIv2v3dgxQe70FjfPfhYj87ACmmF52hGmNG3/ADnAzMA64HLkdn/SdHxO/+/eIZ/9aI+n+Cxvl6kp8dAGOMKToTybXwJWN4T0Xn/Y70i0sG+BD4GfCLeN3lbbEDYIwxxeJ4VMx3QazZeYZ/jLenJHQhNb8HgCdxNtQOgDHGFIkpwBlo7O4cNJjnAuBTfhaVlCyq8n8apf1/hVX97AAYY0wBaQijPy0i+08jwZ6LwxFwer/0dKD5D08AP0YKfy70swNgjDEjog4V600ATgijfynw2TD8J4XRr7HxH5Wofy/wGjrvfwwpS7r92Q5Axd7QxpjRoxad1zeifv1TUDHffFTJP5dcv369jf6o0YVS/o+gKv/VqAPKz1A7ABWLHybGlP47VxvPjQZUyDc3ovwr0Ln+pHAIGnG/fjkESR1oct9dwLOkcxCUqTIHoD4iDqewjCm+k52k7Ceigr3PoHa988LgHx9rrA1+2ZBBg6AWAz8F3kFKlH5emop3ABrjwXPIN7QxRaEOmIra82YD5wCz4r3JqLhvkrepLOkA3gDuB14E1jvqN2lyAE6Ih1IzllI1plDfqRlolO4s4PT49bRYM2zwK4LNwFPAEuAVNIfCmFQ5ANOAK+MG7/XHaMyQqQlDnkTxUyKqn46q9k8DZobBb/J2VQytSMf/cSTqs9ZbYtLqAEwFrgYeRtKV7mM15nBqgfHo3H5CXCeiVrwZEeWfifrxT0fV+qby6AM2oVT/A8DL6GjUmCFFA5V6hr4DVbYuQiMrXQtgqtGBb8xbTbHGopR+ks6fFYZ+VkT8+dX57smvTDJoYM+HwM+BR8mNNjcm1RkA4kH2x3HTPxkOgTMBJi2Oed0Aqz6ujWhKXqKyd1pE8snZ/YnxZ2tj1eW9NpVLFuiO594y4G5gHeqIMqZqMgCQG+d7H0p/bY73Mhw+m92YUnyXBnpdc5TX/Vcdmnl/Uhj4k+P1FCS0c0oY/ckR6df3Ww15ht+kiz501r8CuAel/fdiUR9TpQ4AYex3IXWrF9AZ2Pr4YnTG/59TnKaYJBF5EqWPCUPcGEa6CZ2xj401jsPP5fPP6U+I1w391pi81RjvmeqJ+jOol/9BpOO/BfX1G1PVDkBCN7ATtQbuR/KX7hAwpSBJsedH8bUcnrZPIvO6AYx6/rLDavKN/3bU1rcU9ffv8LYYOwDGGJNeWlGa/wngOTS5z4I+pmB4GqAxxpQXHehI8zngaXTm79Y+YwfAGGNSShfwMfB6RP1LsZKfsQNgjDGppRcN7nkXDe9ZgmXOjR0AY4xJLX2okv8j4Bdh/NeRa2U2xg6AMcakiAxK928DHom1MZwBdy4ZOwDGGJMyEnGyRL30oYj4d+LqfmMHwBhjUsvHwHLgGSTqsxnplxhjB8AYY1LINqRS+mvgVaRU2uVtMXYAjDEmfWTRlNJVSJ58OfCBDb+xA2CMMemkF0n1rgnDvwSJ+tjwGzsAxhiTQrrRALL1wLPAL8Pw92C5dWMHwBhjUkU2DH87quZfGmtdGP4+b5GxA2CMMeky/L3AQeA94FF0xr8F6fi7pc/YATDGmJQZflCq/1V0vv8aGte7zxG/sQNgjDHppBm18y0H3kISvnu9LcYOgDHGpI8+VNH/CmrpexOd8bd7a0waHIAMUOutMMaY/6M1DP1bKN3/MlLus1a/SZUD0AU02gkwxlQ5PcAuYBMazfsi8Hy85+l8JpUOQHtc7QAYY6qRNmAPmsj3MtLqfzOCo2SAjzGpdAD2AROABm+HMaYKSNr4DsXzbyXq338Ryff24lS/qRIHYCswFWjydhhjUkwmz/BvApahsbwbgP1AJ27lM1XmAGwGzvdWGGNSbPizSKjnReA54G2gBaX+rdNvqtYBeB+43lthjEkZ2TDyyUS+d9A5/3ZU5W9M1TsAq5CkpTHGpIE2NHr3HVTMtwa19O3CBX3GHOYArA+PeA4uBDTGVCatSJnvwzD478bagFv4jBnQAWgD3kB1ANO8JcaYCor0dwDbIuJfhbT51+MqfmOG5AD0IrGL6+0AGGPKmD50XLkfpfPXIZW+51FVf0f8Oaf5jRmGA7AyvkwXIFVAY4wpB3pRlX4HsBNV7/86DP/HQHf8mYwNvzHDdwCywAHUGnM+cKG3xRgzSmQj0k8M/3Z0RPkS8DpK93fGcprfmBE6AIT3vBy4EjgPqPPWGGNKaPST6H0vsBpYgTKTm5Ba3wF05m+jb0yBHYBseNrPRBbgUm+NMaYE9KDq/ffR5L01SJ10JzrnP+QtMqa4DkCSBXgemAvMBiZ5e4wxBaYXVe6vRy1768Pgb0WqpJ68Z8woOACE170UaQLcCozxFhljRkCixvcJKtrbjNT4EgdgC07rG1MWDgBIPes+YBZwGa4HMMYMnQ50Zr83DP/OMPprgffC8Ld5m4wpTwegBxXffB8dA8we4M8ZY6qbpC+/Pa4HUCr/A1TI935E+13kCv3cqmdMGTsAhAf/DDAe+EZkA+wEGFO9ZFDPfXcECR0R4X8Qkf17qIBvN0rp9+UtY0wZUnOU36sFTgJuBr4OnI2PA4xJO9kw9pkw3sm1Benqr431AUrtd0SEnzgHNvjGpMAByHcCbgS+BszDA4OMSZOx739tR2I7m2JtiLUbnd0finUwDL8xJqUOQMIkVBD4R+EMuEXQmMrmENCM9D+2ogr9rahFbx+arncgb/V4y4ypTgcA1BJ4AbAg1jxcF2BMOdODqvF3o/76XXmv98Tv7Y3XLXE96G0zxg7AQEwFrgZuAC5BwkEeIGRM6elCKfvWvHUg77o/jPrufsa/hdzkPGOMHYBhUQtMB66LdTZwKjAZ1wgYMxKSIThJUV0nuWl4nXnXgxzeb7+rX6TfgmV0jTFFcACS/7YWmBiZgGvRscAM1D44FmhCRwf1qIOgZoT/pjGjSVIh37+XPZP3fh+HV9In7x1t9eYZ/taI3JOz932xWmLtjut+cgp62X4/I7jf3hhTRAcg/++ojzUeOCscgnOBM4DTUCfBeHRU4FZCU6kkEXm+Vn1fRNrd/SL0rrz3D4ZhbyM31S4/bZ+k6tvDqOeL5mSO8DpjA2+MGSn/C1RQ/eKjM6FqAAAAAElFTkSuQmCC",
-    # Single urinal with cistern
-    "urinal_1": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAAOxAAADsQBlSsOGwAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAACAASURBVHic7d15uF9Fnefx901uCEtCggQSICiLQmQRgaEBA9IgIiqg0uLS+vD0YoO22qjTiNPjKPZMu8wztsuMPjbDdLfOjCi4jdIioiKbNsq+gywKgbAGQlYCyZ0/6l4S01nurXN+VXVOvV/PU08UOPd+fyenqj6/s9QBSV2yDfDvgV8Ai4CRzG0RcBXwodHaJElSyw4DHiT/pL+x9gBw6MA+vSRJFToYWEb+SX5zbRlw0ID2gSRJVZkC3En+yX287XZgeCB7QpKkiryd/JP6RNtbB7InJLVmUu4CJG3WCbkLiNDFmqWqGACk8r04dwERulizVBUDgFS+Lj5eNz13AZI2zQAgSVKFDACSJFXIACBJUoUMAJIkVcgAIElShQwAkiRVyAAg9dd+wFDDtl/yqiUlYQCQJKlCBgBJkipkAJAkqUIGAEmSKmQAkCSpQgYASZIqZACQJKlCBgBJkipkAJAkqUIGAEmSKmQAkCSpQgYASZIqZACQJKlCw7kLkLRJU4DJkdvOBVY0/P1zI7ebDGwBrGr4+yUNyFDuAiQ9byvgCOAoYD6wJ7Az8QEgtxHgYeBO4GrgMuBnwDM5i5IkqRSHAecATxEmzT63xcBXgT9oZc9JktRBhwI/Jv+knKtdBhzeeC9KktQRM4F/Iv8EXEr738ALGu1RSZIKdzSwgPyTbmntIeCVDfarJEnF+lPCXfG5J9tS2yrg9Oi9K0lSgT5M/gm2K+3MyH0sSVJRTgPWkH9i7VJ7b9SeliSpEMcBz5F/Qu1aew44PmJ/S5KU3Q6Em9tyT6ZdbY8BO014r0saF1cCVBftArwO2B3YPnMtm3LwaFO8fwFOyF2EJCmvmcD/wlPqtTUDgDQAngFQV8wBLgXm5S5Eyd0O7Ee4kVJSSwwA6oJJwOWEF+TUaBnwSO4iJmg2sE2LP++NwP9r8edJkjrgreQ/DZ263Qd8ANit+e7LZnfgg8Bvab4/fpK2dElSCX5A/gk5VVsNnA1MbWPHFWIq8AmarYWwmvBqZElSRR4m/8Scoj0HnNLSPivRWwgTeez++cv0JUuScmoyaXSp1bAE7lnE75/zM9QrScoo98Scot1AuNmx7yYDNxG3jx7MUK8kKaPck3OK1udT/+t7G/H7adsM9UqSMsk9OQ+6LafdR+ZKNx1YSdy+OjBDvVIv1XDKUSrdrYRn/WuxhLC4T4zt2ixEqpkBQMrv4dwFZBB7Pd9LAFJLDABSfityF5DB8sjtprRahVSx4dwFSAN0euLfdzBwWuLfKUlRDADqs3MS/75TMABI6ggvAUiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFXIhIPXZPyT+fXsk/n2SFM0AoD5zVT5J2ggvAUj5Tc9dQAYzIrd7ptUqpIoZAKT8ds5dQAa7RG63pNUqpIoZAKT89gG2z11EQjsA8yK3fazNQqSaGQCk/IaBN+cuIqE3A5MjtlsD3NNyLZKkgo1U0O4HtmxrhxVsK+AB4vbR3RnqlXrLMwDqgudyF5DArsDncheRwOeBuZHbXtFmIZKk8sV+Y+xi+xgw1M5uK8oQ8HGa7ZtTk1ctScrq6+SfmFO2C4j/llyiucC3aLZPVgIzUxcuScrraPJPyqnbcuBc4ETC5YEpjfdiOlOAFxJqP5fwWZruj28l/QSSpGKcR/5J2ZavzUeSVKWtgYvJPxHZ0rfLkNS6mGdxpRyeBb4BLAYOArbJW44SWQOcAjyUuxCpb/p4t7H6bzJwGLAnZT87/xrg5NxFdNxXgPfkLkKSpInYGriN/KfQu9rups4XJUmSeuBlhBfY5J5Mu9aeHt13kiR11qsJz7HnnlS70lYBr4va05IkFeZkDAHjaSuBN0TuY0mSinQk8Dj5J9lS2+PAMdF7V5Kkgu0J/IL8k21p7Wpg9wb7VZKk4k0GzgSWkn/izd2WAh/GNUkkSRWZTXgF8AryT8Sp2wrgy8CcxntRkqSOmgX8FXAt+SfmQbdrCGc/tm9lz0mK5kqAUll2Av4QeAXwYmA34CV07xT5auAe4H7gduBXwOWj/1+SJI3DLcR92963hd+9b+TvvqWF3y1pgCblLkCSJKVnAJAkqUIGAEmSKmQAkCSpQgYASZIqZACQJKlCBgBJkipkAJAkqUIGAEmSKmQAkCSpQgYASZIqZACQJKlCBgBJkio0nLsASQMzF1jRws+Q1EMGAKm/fpS7AEnlGspdgKq2DXAwsPdomwfMAWaO/rtpo03qqqWjbRnwFLAQuAO4a/TP60b/nZScAUApTQKOAF4FHAMcCkzJWpGU1yrgV8BPR9tVwJqsFakaBgClsDfwduBUYPfMtUglexD4NvCPwI2Za5GkaK8GLgVGbDbbhNvPgGORpA45Abia/AOozdaH9q/A65Gkgu0BXEj+AdNm62P7CeFymtSKybkLUC8MAx8FzgP2yVyL1Fd7AH9OuHfrF3izoBryJkA1tSth4p+fuxCpIr8C3gbcl7sQdZdLAauJE4HrcfKXUvsDQgjw3gBF8xKAYr0P+CphwR5J6W1NeLx2KfDLzLWogwwAinEW8Pd4CUnKbQg4DtiKsJCQNG4GAE3EEPBl4D/kLkTS7zkC2AH4Ye5C1B0GAE3EJ4EP5i5C0gYdQngi59LchagbDAAar/cCn8pdhKRNeiWwmLB4kLRJXsPVeJwEfJfBPTWykPCt5VrgduBewpvTlhFucJK6ahrhRtmZwJ6EN14eTHgZ1pwB/c41hCd0vBwgqZEXAk/Q/qpmC4DPAC9L91GkohwA/FdCX2i7fz0GzE33UST1zTBwJe0OTHcDp43+bEnhzNopwK2029d+ia/blhTp47Q3GD0O/AUuPiVtzCTgdNo94/bRpJ9AUi+8GFhBO4PQd4BZacuXOmsH4Hu00/eWE94hIEnjdhHNB59ngb/Cm02liRoiPHL7LM374YWJa5fUYSfRfNBZhuuUS02dSPgW37Q/2hcljcuvaT75H5m8aqmfXknoU0365NXJq5bUOcfTbKBZhd82pLa9nuaXA16dvGpJnXI5zQaZ96cvWarCB2jWN3+evGJJnbEPzQaY7+MNf9KgDBGeqGnSR/dNXrWkTvgM8QPLY8AL0pcsVWUWYU2N2H76yfQlSyrdJOAB4geWP01fslSl04jvpwtwMS5J6zma+EHlJjz1L6UyCbiF+P7qEzoCTIJaq8kdwp8kDCySBm8N8OkG27+qrUIk9cMvifs28TtgcoZ6pZoNE3/J7ooM9Uoq1HTC8/sxg8l/yVCvpHAWIKbPrgKmZahXUoGOIf564j4Z6pUE+xPfb4/KUK8K4z0AApgXud0DwG1tFiJp3G4GHozcdu82C1E3GQAEsFfkdpe2WoWkiYrtgwYAGQAExJ8BuKbVKiRN1LWR2xkAZAAQALtEbndHq1VImqjYPrhzq1WokwwAgvg7gu9ttQpJE3VP5HYzWq1CnWQAEITHAGM82WoVkibqqcjtYvu8esQAIIgfDJa2WoWkiXo6crttW61CneT67YL4ZXw9fqT87L+KMpy7AGmCZgHvBU4A9sBXECuvRYR7YX4AfAl4Im85kjQxsauJpfYmwjXP2HpttkG2J4E3kl5svaqcp4AE8YNByuPnZOACvG9FZVsD/BHwvYS/swv9VwXyABCUP4DsANyNNy6pGxYDLwYeT/T7Su+/KpTfptQF78fJX90xA3hf7iKkzTEAqAtOzF2ANEEesyqep4AE5Z9CXILvL1e3PE261fZK778qlAeAoPwBxDuW1UWl9w/H/8p5CUCSpAoZACRJqpABQJKkChkAJEmqkAFAkqQKGQAkSaqQbwNUn/mYk9rgY6jqJc8ASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVKHh3AVIasV2wDRg+jptXTMYf+BfAyxe7589DSwFloz++WR0pZKKYACQyjMM7AjsDOy0zp9jbTYwk7UT/bQ8ZT4fBpYATwGPAAtH20Pr/e9HgefylClpQ4ZyF6AijERul+r4Kb2+GNsAL1mv7Q3sTpj8+3Z5bg0hINwH3AX8Zp12F7A8X2mbVfrxV3p9KpQHgKD8AaT0+jZlGvBy4EBgP9ZO9nNzFlWgBawNBLcA1wE3Es4w5Fb68Vd6fSqUB4Cg/AGk9PrGzAD2Bw5ep82jf9/mU1oIXLtOu5pwOSGl0o+/0utToTwABOUPICXWNwnYFzgKOBI4FHjRAH+f1vod8K/AFcBlwK3EHyPjUeLxt67S61OhPAAE5Q8gJdQ3mfBtfj5wLHA0MKvFn694SwhnBn4CXAX8CljV4s8v4fjblNLrU6E8AATlDyC56psHvB54FXAE//bROpXpaUIQ+ClwIXBnw59n/1AveQAIyh9AUtW3JWGiPxY4CXhp5O9VWe4DLiGEgUuAlRPc3v6hXvIAEJQ/gKwCpkRstzWwYjP/zWzgNcAJo39uG/F71B0rCGcHLgS+C9y/mf9+a2BZxO95hhAoUyi9/0oq2EhkS2VRZH07b+Tn7QKcAVxJeD499vPbut9uBc4G9mDDdon8uY9v5OcNQuxnl6TiB5AHIuvbb52f8QLgVOAHhBXpck88trLaakIgPAOYw1r7R/6835JO7GdW5VwKWF0QuxjM7sBBwCmE0/sxlxFUh0mEJzzmA58lPGZ4AWGBohhLWqpLGhivAQnivw2kOn4uJzxrL3XFzwmPiqZQev9VoTwDoC64BwPA5jxJOFMy1hYTvoU2fQHPMOHxx5mEZY23Gf1zu4Y/t+/uzV2AtDkGAHVBjYPpYsJb9B4GHiS8SOdBwjK4C0b//1OsnfBzmDbaZhKepphLeJHR2J+7EK6n70xYJrkm9+QuQNocA4C6oK+D6UpCuLl19M+xdjNhgi/dWPh4GLhjM//tTGBPwt3267b9CeGhb/p6zKpHvAYkKP8a4suB6xP9rkF4ljDJX8/at9zdSfqX2pRqB8KrkA8g3LQ59ubELt+0eQBwU6LfVXr/VaE8AATlDyCTCde4u7AU70rCBH8dayf8m2l3bfoabEE4O3Aga0PBy0m3uE4TTxMeO12d6PeV3n8lFawLzxFf0qDOQbZlhOfHP01YQrgLE1RXDRNesXwWYT2HJ8n/97+h9qNB7YCN6EL/lVSoLgwgn2hQZ5ttMWEZ2Q8Dh+F9NDkNE17D/NfA9yknEHx8kB96A7rQfyUVqgsDyB82qLNpuxX4DHAUTvglm0x4mdOnCNffcx0vrxz0B11PF/qvpEJ1YQCZTLgzPsUAvoJwyeEswiuB1U2zCcs/n0+4Lp/i2HmEcKym1IX+K6lQXRlAzmlQ6+baYuBrhNcAb53qAymZrYDXA/9EWD9hUMfROak+0Dq60n8lFagrA8jxDWrdUFtJuJnsVMIKd6rDVOBEQuBbQrvH1GsSfo4xXem/kgrUlQFkCrCwQb0jhGfyLyJM+tumLV8Fmga8g3Bj5zM0O7YeJjy+mFpX+q+kAnVpAPnbCda4bltDeNubtCHzCcdI7PH1n9OXDBOsMXf/lVSYLg0gOxMW1Ymt+VryfEtT2aYSFm1qcmZpbvKqgy71X0mF6doAcsFm6tpc+0z6klW4z9LsmPpm+pKf17X+K6kgXRtA9icssxpb92rg1cmrVqleS7NT/6sJ7y7IpWv9V1JBujiAfJP4ukcIj/0dnLxqleYQmq8R8PXkVf++LvZfSYXo4gAyj3DdtcnA/QiwV+rCVYyXAo/R7Bh6lvAmw5y62H8lFaKrA8jnaDZ4jwC/BV6YuG7ltxvwAM2Pn79PXPeGdLX/SipAVweQ6cACmg/iDxFOBasOh9F8PYmx42ZG4to3pKv9V1IBujyAvIXmA/kIsBw4JXHtSu/thHc9tHHMvDlx7RvT5f4rKbOuDyDn0c6Avgb4O1wnoI+mEh7/bHK3/7ot941/6+p6/5WUUdcHkBnAvbQzsI8AtxBOE6sfDie80rmt4+N+YLukn2DTut5/JWXUhwHkFTRbIXD9thr4PDAz5YdQq14AfJFma0as31YRjrWS9KH/SsqkLwPIn9HeQD/WlgBfAHZK+DnUzA7A2cCTtH88vCfdxxi3vvRfSRn0aQBp49HADbVlhG+TLh5UrkOA/0G4oXMQx8Bn032UCelT/5WUWJ8GkMnAdxnMBDDW7gY+CRw0+vuUxzDw7wg397V5D8iG2rcp9++6T/1XCQ3lLkBFeI64wW2YcH21NFsQQsDrEvyuZcANwDXA9YQbxBYBT4y2FQlq6LOtgO3XaS8CDiSciXk5sHWCGi4E/ohw/b80w4TVCCdq9ei2kioXe8p0qxzFjtMWhIF7kN8Kbf1vPwa2pFzbEPe5luUoVmWZlLsAFSH2m03Jz8uvInxrOy93Ieqs7wBvAFbmLmQTpkZu90yrVaiTDACC+AGu5G9GEAa5dwCfyF2IOueLhJUhS7+EYwBQNAOAID4AdOEZ+RHCI2HvxkFPm/cM4Vg5g7BqYOli+2DpwUYJGAAE4aa1GNu3WsVg/QNhRbi7cxeiYt0PHEU4Vrpih8jtnmi1CnWSAUAQPxjMarWKwbue8Kz4/81diIpzHnAAcHXuQiYotg8+3moV6iQDgCB+MNix1SrSeAp4J+ERwfsz16L8FgInA39MODa6JjYAxJ71U48YAATxAeBFrVaR1kXAfsB/o+y7vDUYKwl/93sT1ozoqt0it/MMgAwAAuChyO12a7OIDJYAZwIvAc6hzEWN1K4R4AJgX8Lf/ZK85TS2e+R2C1qtQp1kABDAfZHb7dZmERktAE4nnBH4n3hGoI9WAucSJv63EJYO7oM9IreL7fOSeuZQ4lYTezRHsQnsCHwMuIf8K9HZmrV7gY8Ds+mnRcTtF19qJQkIg2PsADsnQ72pDAFHAF8h3CyWezKzja8tJFzSOZJ+v+9kV+L30XYZ6pVUoCFgMXEDyXEZ6s1hiPDymY8AFxMencw90dlCe2L07+Qjo39HfZ701/U64veX5NugBIRB4WZgfsS2BxBemNJ3I4S3/t0AfHr0n+1BOJX6EsITES8C5hLeUDcTmAZMSV5pvzwLLCUE1OXAA8DvRttvgGvpz/X8iXpZ5HY3tVqFOssAoDE3EhcADmu7kA65l3onH+V3eOR2BgABPgWgtW6O3C4mNEhqZoj4ABDb1yX11GHEX4N9cYZ6pZrNI76/HpKhXhXIMwAacz3xz78f1WYhkjYrts8tJ9zHIhkA9LxngGsitz2+zUIkbdZrI7e7mnBjpWQA0O+5KnK74/BudymVLYBjIreN7ePqIQOA1nVl5HbbEn9DkqSJOQKYHrmtAUDSBk0nXAqIubHoCxnqlWr0ZeL66ErC2hSStEGXEje4LAQmZ6hXqslk4GHi+ujFGepVwbwEoPVdFLndHMKpSUmDczTxLzb6UZuFSOqf/Yh/vvjcDPVKNfln4vvnvPTlSuqau4gbYJYQbgiU1L4ZwDLi+ubtGepV4bwEoA05P3K7acDb2ixE0vP+mPCiqRjntVmIpP7an/jTjNdmqFeqwfXE98uXZqhXUkfdSvxgc3SGeqU+O5b4/nhjhnolddhZxA84F2aoV+qzi4nvjx/KUK+kDpsNrCJuwFkD7JO+ZKmXDiD0qZi+uBKYlb5kSV33LeK/dXwjQ71SH30H+6GkxF5D/MCzGnhZ+pKlXjmI+G//I4R7ByRpwoaA24gffL6XvmSpVy4kvv/dQujDkhTlXcQPQH4DkeIdQ7O+9yfJK5bUK1MJL/qJHYRuwJcESRM1GbiJ+H73ILBF8qol9c5HafZN5LT0JUud9pc063MfSV+ypD6aATxB/GD0BPFvMJNqMwdYRHx/ewyYnrxqSb31NzT7RuLjSNL4fJtmfe2v05csqc+mAY/SbGA6KXnVUre8iWZ9bCHxLwySpI36IM0Gp4eBHZNXLXXDHOARmvWx9yWvWlIVpgB30GyAugifTZbWN0SzZ/5HCGt2TElduKR6nECzQWoEeG/yqqWyfYDm/eo1yauWVJ2LaDZQrQLmJ69aKtPhwDM061PfT161pCrtBayg2YD1AN4PIM0hLNrTpC8tA/ZMXbikejV9LHAEuAxXK1O9pgJX0Lwf+difpKSGgetoPnidhzcFqj5DwNdo3n9uwBv/JGVwCPAszQexT6QuXMrs72jeb1YBB6YuXJLGfIzmA9ka4D2pC5cyeT/N+8wIrvcvKbNJwM9pJwS8K23pUnKnAqtp3l8ux7dsSirA7sBTNB/UngPekrh2KZW3EY7xpv1kEbBr4tolaaPeQPgW30YI+LPEtUuD9k7auV9mDeF9AZJUlE/TzrXNNcAZiWuXBuU9tHPafwRvmJVUqEnAj2hnoBsBvoCPCKq7hoCzaa8//Biv+0sq2Czgbtob9L6GiwWpe6YCX6e9fnAn8IKkn0CSIuwNPEF7g99lwOykn0CKtxNwJe0d/4/iUr+SOuRIYCXtDYILCC9NkUo2H3iI9o77FcArkn4CSWrBW2nv5qcRwhvT3o/3Bag8Q8AHCavztXW8PwecnPJDSFKb/oR2Hg9ct/2YcJpVKsGOwIW0e4y7MJakXjiDdgfHEeBh4KSUH0LagJMJ1+jbPr7fm/JDSNIgfYT2B8kR4Hy8QVDp7Qx8m8Ec02cm/BySlMQZtH85YISwNOrp+Iy0Bm+Y8O38Sdo/jtfgN39JPdbWkqgbarcBx6f7KKrMMcCNDObYdQlsSVV4K+0+Irh++z7w8mSfRn13MPAvDO54XY53+0uqyJHA4wxuUF0DXADsl+oDqXcOAL7DYC5bjbVHcX0LSRXaE7iDwQ2uY+1K4ERcP0DjcwTwAwY78Y8QlszeK9FnkqTizAIuYfAhYAS4Dng3sG2ST6YumUF4a98NpDkWL8K1/SWJycCnGPw3rrG2FPhH4Gh8cqBmk4FXAf8MLCPNsbcG+FvCmzMlSaPeBDxFmoF4rC0E/jshDEwZ/EdUZlsQ7ub/EvAIaY+1RYRLUZKkDXgRcDlpB+axtphw09dphDcaqh/mEdaJ+C7wNHmOrUuBXQf9QSWp6yYD/5F2X6wS0x4hTBofJqwvsMsgP7RaMRd4LXAW8D0Gs0zvRNoqwiqYnvJXcbwrWiU7GDiXsp7pXwTcBdw32u4nBIUnRtsiwlsLVxO+baq5bQmhcEtgO2D70TabcMZod2A3wh31Jd1Ydx3hhT7X5y5EkrpomLCE8FLyfpOz2cbblgNn4z0lktSKlwA/JP/gbrNtqv2AsL6FJKllxwI3k3+gt9nWbXcAr0eSNFBTCJcFUj/GZbOt3xYC7yNcqpIkJbINIQg8TP6JwFZXe5xwnX86kqRstgX+hvBtLPfEYOt3e4jwWJ8TvyQVZAvgVOAW8k8Utn61uwhnm7ZEklSsIeA44HzCM/m5Jw9bN9tK4JuEG09dM0WSOmZH4Ew8K2Abf7sR+BDhTZVSb5lqVZN9gVOAtxLWh5fG3Ec4Y/RV4PbMtUhJGABUq30Ia8YfDxwJTM1bjhJ7hvDSqYtG2x15y5HSMwBI4XHCo4D5wBHAIcBWWStS25YDvwauBK4iTP7LslYkZWYAkP6tKcCBwAHAy4D9R//cLmdRGrdFwE2EFSNvBm4Ybc/mLEoqjQFAGr/tCW+eG2u7jP6zWaNtO2AaIUAM47PibVkCPEeYwJcCTwKPsfYNjAtY+3bG+wgBQJKkYp1P3F3qp+QodjNOIe6znJ+jWEkwKXcBkiQpPQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIAy4ZI0QAAA0ZJREFUSJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASJJUIQOAJEkVMgBIklQhA4AkSRUyAEiSVCEDgCRJFTIASPmsjtyuxH47OXK72H0gqaESBxKpFssit5vWahXtmB653ZJWq5A0bgYAKZ/YyW9Wq1W0I7ampa1WIWncDABSPk9HbrdXq1W0I7amxa1WIWncDABSPvdFbndgq1W0I7am2H0gSVJnHQ6MRLTVwPYZ6t2YHYA1xH2WQzPUKwnPAEg53Rm53STgjW0W0tAbgaHIbWP3gSRJnXYXcd+cr8hR7EZcSdxnuCNHsZIkleArxE2eI8D8DPWuL/YyxgjwpQz1SpJUhLcQP4H+NEO96xoCLiW+/jenL1mSpDLMBFYQP4m+PX3Jz3vnJuraXFsOzEhfsiRJ5fgm8RPpk8Du6UvmhcATEfWOtfPSlyxJUllOIH4iHQGuIX4p3hjTgesa1vy6hPVKklSkYeBumk2olwBbJ6h1a+AnDWv9DfEvD5IkqVf+gmaT6gjwCwb7noAdgV+2UOefD7BGSZI6ZQvgAZpPrg8ARw6gvqOABS3U97vRzypJkka9g+YT7AhhqeBzCN/Ym5oNnEv8Ur/rt7e1UJMkSb0yBPyMdibaEWAZ8AVgv4ha9ge+SHhcr616fhJRh6QBiV2/W9JgvJRwh/2WLf/cmwkT8C8I6+8vAJ4a/XczgV0Jr/SdDxxLXGjYlBWENwa69r8kSRvxbtr71l1Ke1ere0iSpJ76P+SftNtq32h530iS1FvTgF+Tf/Ju2q4Gtml530iS1GuzgNvJP4nHtt/QzpMIkiRVZzfgHvJP5hNt94zWLkmSIs2h+dr7KdvNwC4D2ROSJFVmBnAx+Sf3zbUfAtsOaB9IklSlIeAMYBX5J/r127PA2cCkQX14SZJqdyRwB/kn/bF2G2EBIUmSNGBTCGcDlpBv4l9G+NY/dbAfVZIkrW8X4HOEyTjVxL8U+CywU4LPJ0mSNmEH4GPA3Qxu4v8N8J8I6xNIkqSCDBGux38BuIVmr/FdQ3ik7/PAK1J+CEmD59sApX6bDRxBeMvgPGBPwup800YbhFP6S4FHCAv43EFYgfBK4NHE9UpK5P8DtTF1pP7GKpYAAAAASUVORK5CYII=",
-    # Slab urinal
-    "urinal_2": "iVBORw0KGgoAAAANSUhEUgAAAYAAAAGACAYAAACkx7W/AAAc03pUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHja7ZxZdhw3l4TfsYpeAuZhORjP6R308vsLZJEWJVI25b/fWrRYFKsSCdwhIi7ywmb/z38f81/8qcVZE1OpueVs+RNbbL7zQ7XPn36/Oxvv9/unvv3kPv7evL/heQ28htcF+Xl1b79/XfD26jo/pR8Hmq83xsc3Wnxeff1pIP+8BM1IP6/XQO01UPDPG+41QH+WZXOr5ccljP28vq5/zMBfo2+xfpz2L/8uWG8l7hO838EFy3cf/DOBoL/RhM4Pje8u8I4+xM+Jt/rro+4xyGd2sj/MyvzsFfuFV+wXTgn5+b3hFx+Nmd9fP/29Sz/9/jWguSb+4c5hvt/5w+9n8L8s5+3vOauac/azuh4zJs2vRb0t5f7EBwcmD/eyzFfhb+Lncr8aX9UQvROXLzvt4Gu65jwWPy665bo7bt/X6SZTjH77wqv304f7uxqKb34Ga/BT1Jc7vuC9FSremrg38Fv/Phd379vu7aar3Hg5Pukdgzn51+jbf+Lry4HOUcg7Z+u7rZiXl8WZhjyn73wKh7jzFkfpGvjt6+c/8mvAg+maubLAbsczxEjuFVuKo3AdHfhg4vXJNVfWawBMxL0Tk3EBD9jsQnLZ2eJ9cQ47VvzTGaiSKH7gApeSX8zSxxAyzqle9+aa4u5nffLPr8EsHJFCDgXXkF74KgJsxE+JlRjqKaSYUsqppJpa6jnkmFPOuWSBXy+hxJJKLqXU0kqvocaaaq6lVlNb7c23ADimlltptbXWOzftjNy5uvOB3ocfYcSRRh5l1NFGn4TPjDPNPMusZrbZl19hgRMrr7LqaqtvtwmlHXfaeZddd9v9EGonnHjSyaecetrp715z5nHrL1//3GvuzWv+ekofLO9e49JS3oZwgpMkn+ExHx0eL/IAAe3lM1tdjN7IdfKZbZ6sSJ5ZJjlnOXkMD8btfDru3Xd/ee6D30yM/8pv/s1zRq77T3jOyHVfeO5Xv33itSW2mTaY6yGloYxqA+lXxzx1uHYwAghbwqgl9swle42zy5jpHG7GuGNlJtR8XdH0UvdyGqk73lwVf2WgpnR4hyHcXokLsTg/hJWBy3E8tBlWxYexuVJw3jD2pBRaZ22FMSMrWG7P2nH/asevijUn0RDqyTOVluPZPiwc0Jj/wnSg/MzL1LGTO8TYKL7USWa3bnPt/LeA1omRVvenMSB53WxZoNUR0Z1Yjj1rTuXsMHlt8DqunXCclgZvdj601yohYSqXdhiZacxxRqpYpXY/gH44dcRZ2jw9F2/KKPn0lMpoRB2eLi4MrsmNCPXcbuNDhncnaq72ZOJiMIszuBHW67amWY5ZJ+d69porlbOrJ4Llk+ea8/EaCaZ71ScXGb39dt3ym8URcvzKtenCUgymFexauy7Sy8flxmXp4EmZ0CQmFnfrZkNhNndyrTFcOryXKkbHB55Ax+MsPcxEwhyXc7c4UjlMqFQbc5kDesvBIbRqIEpXVmTAaGHAcXbXkhXtADX5XauP1jUmMqrbba48a0l+JggPHyzAYxmmVUSoWbMiTEn9kcBwn6ethFTES26Ptmc4vvPJNVzZw0/yP62Iq2Ora0/TN/HjVhhIMDKx7ZYUOfjILf7shlAFhJwiIZEC0Q5EXl49siKoRutRvJuTd+5DJg946+WxwgiEuusdxwysl0GqekBnmcWDJJtkKzux4j42fz0Ieb1se5r8c2YE2w4l25YJ5H3w2sLhEcReo6/EmxEbDSCrKtfBPaTAyMUgAWesDFDxjP85oP4KjdMxkvNrRkAwCsCihG/CeZ71IWsY5TAimUAantpOAvOmLxM8ygDraiXnMM5qWBw0Bfc204z+9JXzyE2hEJPxvQLswEoG/90OjRxQQq7Famtj6pWgAw4m/7IDRbQZyQIVAezkfa7mC6bNCNia8lwFaD91jhRjbY68Wys1IJ+APnOBFYVr67HpJGw16/EJCASSpkxgSkWO5RuOpAE2tZ/b6eckvenGReN1kfkkXb9IUl0FNg5bJtokprCrK9GH5uG5ZIh04HrWbQWqG95Z2/sFemz0ftngGHSTKt73YcCNu0N/YYHrvZ++NxTnG7JmxFwxgMUyCao4MWxyh4wK253RBWmTHKgWaCdgfSRL5LjWZsmkwUgAH/QC1B7Q1a8xK0kBaB1BuRODMofYnvTiBeaxqNpwiNKgW60TJ6QZ0hlzdxN2Lwe0pP5rskrem8JIP8k2L/uMVPAN1D3j6RBkX6sR2CGO5vcGHdI0ZyOJ+9nXmqLXEc+Edord3fXN1Mk33+ACQmtwNYGdPAANnC2UxbREfq/HNBKID2zYrmAgCPDOOyEo5xwwUJ1lhC2qGxDBgE/CBvthr0nYEbo+QUwAm0clTNIdzAQN3EnkZMnDAZ3Ll3gGt9zeDXRD3tGjHRK/agiYPVbdosoJVpg9E6tm9liVyqUmqZcBwx2kQ2eYvg9ZeixMBx3iJwCce4FPHTEFA4MrwRYTWJVCBC6CR1HpCb3EBCsUdXqseIL/tiw4dzkiLxxxYP37Wi0evikCohTAbd1fl/68WiQWfO/zWA6zoS4WHx8jvDHRgQDI17P3XE8SmYs2oATMenFyn/S8AutJQnEpjsa969rPK9Mm/IAcEDm+BjU/jqo0+/X2MiY4nzIRR6FE1d0olxGWmbBZkPMg0IXZhVjeiSjX8geZhEVxLkMmYhPsCcuSdNCBLLngFWClrhRXhNNK96uvXkxbONLvFAJ6gJgpqucy9whtJqZJniW8SPxskQ8qbJCXMBeuRBSQwwopuw2c5CjjDl6FhUdV2a7iEMAS3xLh+LJMBFdLZeFVWJACE7ZEYnUqm8g6UDkIrVBfln7s/LKyldZB7w7YqKvabUifGqQQewUAYGlsv8J1DHY1j2FVc2JYtA7jUGYON7JvKTAP7wif8OTNBBuKK8QJfgtR5Don+DY8Adk2aYu4Hl/Oq/R7X6pjllVwbFX9y2QIu8m/0yGrjbCDGpy4ABrGO9hkxEtvBTwtkxoa2k+SXBQAVdGf8HyqUZFb82BESog0kASg9YV5ZJ3A49Q0YgQooMIOtjJ1pL5yBeEYpK9RLjdpRIuUJO4YdCBFODSOsqoHnSHW/zKR3XzP5KNdnQOGo8BWdsaBesAOBN7C4Ie6QMCACCIAMQNql9C8MdkKNX9EOK8Yycn9jl1FSWS+yqLwJDq/u4muiuBJdGrjXX+1rFHy4w/qp5tvWWlC8imm14Ph6w5zgeGohsv3k0DDh/gzPznafzrsdcSnzm04NxXy02TJ06FtEhLa++Mo3wcRB9WS85Rp8F9glR0OKTAvJumbCilI5BUk1Qu3DbxP1sDDEBv0Ca6nKxUowkdOwAfFWHRABHqlTzRYrFubQ9KLF2KgiOHqMsluhR4sYwGALYgDczUYUh0hB2kgazdEHvAltPsG4/3ebBWw3Uek3+oid0pEhPRAKytWsAs5M/MTuKVDZJR86E8VfOUVuAJWxEFSWqOfDYyFfnATrZMlH0liiHtETDD3JO/hawUkVIYBMQi5gSC7qZ0icDDJlN4akf2iiYHUYj3oJV5Tg4gxNXaJGTXaKNoqdrzC3pNCBA2mquN6F1g5hoiojI3kSBstSoCjELPICY4OE+02mfyB4gvxwO0TrkLgcxnqFJUJ9j2KDZGCgMb+EYAGyTPShCJrSaA4Kr7kVUI2Il0FbS87JDTGRGkp2JZNeUmhGJTbDUeq9xLzo9I6RShAByPcUrFR37EGOQz/LWT/asAzDlXJHfZps3WDKZuIrDFXkiCiEy6MYTpm8CRQDF3cxM2nEoJ3mUtd2hFO7rkczH6NoI2rO8aXI4g8z2PcD2M8A5jvz0GERnwit8A7NHGmjgWPqk0URgAU4ijZ3w1Spt7B0NQP66q7x4zP5jKYTciFkEOueAtoxnqJ3Cjn7sRi4ONga5K9VLmDyYfP1mD+xpCVeaRf5/Grp81Prl4eFcnICChHHSwhfyPuFW5NKgMZ7srzTtM7EWrPcD/QgmpfD5xDoashLu9uFWUyarY3MDk/Spc5jJjeoq1LrywX5TvzVfxYB2pwPWoldw8dIUOkK8fdl2bpqJl/6f63EPwYgebPQ/DjFCTYQZXrmgvxL+dc12D70HtQIu/RqQMBN2QThcVEXmwhJvr4UQbmy2SNXxsX4AxEXyxDdYJH9AQUm52L2n2jfaFtIAs0hPpJgDm/Hqq844ie2QhJWBoRcQMIWl7kDgHMuIjOp3q07vmwAG3enaGKrLuJQU0TZWFt6VQDS6K+2qD03dSyFCaWojL4pj0Tr1tgPHjAD+aG/MQ4pM6Gmhbx2dAPEHkbARZBSWtfKu+cPMondn8fHQHTMNfQ7pH24Z7FlafwssinZx1UwNRS1LIgpDuvEni6/n7V7655u+TDBeb39/nntzGf3qfeLRCknPiWag4x1hG/AVKf1ESwhBI1UVmgqamQcZ8J2vbzUIf4unjIG0z6bHDqLoxHncOwd2iqaXQHvArBRW/04IVr4XAoV/s/kcSsN/C3pQS88acCuZanQA77Fsg1QKJUAEXKycVkngeWKIgOib6PRiI+4306mqz4Pl58LjLfmUP8zY3Ml3dK6VpvQ9ZJKC3VT2g1pC76BezLHxxsfjLo3VSiWq83LPn2vBZqokmZ1kmCRKxXCrAyUrihjz6jpkUcB21zIGoK+ruVMB11YaY2a9ILrCbHRxOtfie7XT8QDrCssu2IV27Sar1pcI3wU5tjE+Gu/e9nm2Zey9yxfhhpjBtIP3zafO/jX3/afO/jX3/a/Pu5PJ82X3wcoEPW54B0Jham9fcRQfUzIsF3z33fcItxI9nnHtU0lDLlDIqXfy8+I6C8EPqJt36aKAD3fm/z11z/6SWfX2G+f8nnV5jvX/L5FeZPl/LzFebDJWlrDw+tnVHS/CiegFxzDly9/SpDe0O2VD37gVYHlP6ms7uXmLc3dRBor+TBZ9obeMude7Evz8VOF1/JpW0Rai3xUzf+pzz/09d/PBAAcxxYoDmXp0i9lM6s9djpmPXFmr+7ZPPVmv/PlvZ3SzZfrfm7SzbfdfP/2dK+HOjv3Lz+P7L/45F9JS5CwGp3O1EmUaBrk6Skoh0M52eekfIoAEPbJegoZa9Haq4MuyCMtPdeFbGWQ28pjDZ8sHGX01VLrYQSUs/Ur6/mqze++/o20G8spcWiyMPM2NgHLA2cqppZDvVsX1Yyn0fGvdCF58KL4Usqn0tX2uN8Mifz7xf1dwN9c7Hm19V+tVhKqoU37+MYP0aKVCRhHoR3c22aqud0egp4no3dG3DzaD9Vev9o3/8+EktdPQftKb1Ubx1qJUmPs7VzaV5bg23cCD5hq5CkJitP+X5SVhXVVcCHZ467zHwL2CtfXyVsNs/W9msKdwL86+MUXhPgbncKqnT3eCpdzeLOQUz7TEI7DKu87XT8MpHXNFQIM5G3afxgBvMdO/zODOY7dvidGcx37PA7M5jv2OF3ZjDfscPvzGC+Y4ffmcF8xw6/M4P5jh1+Zwbzb9LiRzOYn+3wJRam/JuBU6WoaemErF0jv9bwNgafw042tpkx0IpHz1I89y3gSIWHVsmL+q4U7bantVqOMwO1LrZnf63vfffXB7RC0XJKac+TQH+eTZU02wfIwtSa4IUsc2ksPFtcNalfRw921toSzHG8nkIe2/lXl7HHmE8h3a5raut7AnOmBEakFt1LD5sj5BdqX1tP89wlQnWg6BHcUDPL+HJIc8cMf61I/SN3TeWpkfRkZjXBuDZ/8NV9ik0c7X1UAzxbm9ubXH+3qJKTCoXinn2+12QU03c6z2TuTMxvjfvDVITnn0zmPvk5zMP8OpHn4c+PU/mNod+NYv7cKh+NYv7cKh+NYv7cKh+NYv7cKh+NYv7cKh+NYv7cKh+NYv7cKh+NYv7cKj8YJZdtSNURS0eRah811dVjVMd2RZndZ5rhb26DjtVzDpNn6nqGXgJSN/C5grybAfj1Rd2DrAc9rsa6e8OV2/Qn+6rHR0MN7aNTkO9oxu3tYYZ6JqpuzhBzTBoDcyVXEzxxIXL/XoaJRdScdpDitV0wj+/afugkREn3OSG1AqsgNNDke8URuT4XdPiogFjUs2xf1f+3Y7NaIcsCp8suscfKT/upSFqgZDil6o2M6NOv3W24mcyYO6gngrHPmOEEbpzerpGivFdBMvvYM/fblfu5Uhe2vy40SfWPbZaKQc0ULrm5oC3r82lu5L7V0JgCtlN3gV3ZJ+d2U2vS8cNG9RKu2bdZs8zVDn46t+PG7xgYKPQMk47in4HUuTu6D831FH3zsQP5VW2udlrkLGWWO3s3l3q4k3oWV9XRVktQ5iC7fVZ/qjo19dDkh2UTT3r3Lt7c1f+1bms97NH+Mlso/s3Ir+vwWn8f8/0dkwhhKDZgDELJtr3yUmNkJ5o8yah2sr7W2xzbqFnCXLYPTMKXXtIkzs192rGW18mcMNy0oW3bCMyqZ1w7U8bFXkYeNUHofeRY5y69znqWRauUoICR8lf7rj1fFqNkSiRwQ3blOGaWqBRb264VTK+zLUcPhGMzYXK7igAgmYCHIZvX1lzMiBHtI4+Q05GIcGoAGG7sOmfdPbXgiA+kiHo2hrnr7TWUmvT0fbI6llQwUhUE1NGmgv62wLnXo+yEjXu3o7Vmmet9yGx8cZidiNjIEav5Tj1ET3cHNFg1rdUye8sr77YCbxM8d486qQEbFZWX5S2zb0dYixhSz/UJAaK2uEfT1hhZV9Dj76zubyJYjWOsrRPB1aknRKBlAwS5/HToRkwBUFwjl1HABha7vGv+PsgMvo2SfXczoElWDwADSMikT2rIN1+Mt7mqI4iafk2CqOrJ+u6FdRw9sfdqWyB7mEyn6lPbuFtqoVwsoei0y6r3qeikxvdpWAINWQpcBUVdtD55fAwp2EnkYlxiInOToqcWa7SnXWUSUdseBLY5CLI1hprPO0kedLjl1TUyFmmfJ0FEgFXfala/QA7IMK5kgF0ofckXsZAJ7zfSs457q3sjtcQMMU63YPjTkJbVd69mGKJ563SVfYR9zb0bNepG7WmkFtNZau7XYaxWVejfp4A614ZKXg/fLiuvXCpVv5Tud+Jx3gC3DmZa+BmXOG4j/9uS91C3GKyW4Jk0EZM95a1ufj1+8bMTziGBiXoKTBxlte+CRiTuHN4VOA0fkYbuQDLyhxbrb0PiwjPex1LmdpPgCpPYVHcGizA7jEbcqsMsaGOnuGobCSJqwbDNB0J4MsNZvZobSWB3Ogu3tTK1HPng9AJ/p/MN7VC/7ECJtCFd8auQUb0omRwg2hHJoYW97iMePj7TyZ1c1pEB9c8X06r6oPfi7qiFOhX2UNg8bSRooEfZyROQW8/1SPiGMgcusnpnmE8g/9SjbVKmglGf1ejF2+Yh3hmhx9yVm3Zt1r7VoMw0Y78t5XZC101PunJuzkEGrUwDFKZqcRV1BEKiEAcZRyuova4b2KvtrOMqkUiCXbNspo6RuYoXbfSc6zBMvN9usHu+kEwvalp/SsDeq2BOHTCTQEJgeAt/kpZb58a4c2B+UhqzGU/uzYa//V5FCAICrsQth5DUKQ72aLfNE8uRJVR2vQf0iBpCfZvtnrUZponIddTEk3ub4msJCgZoOnY8oEneR7mbIcpHllDu1UrYtzQAVB2r8eC0oUTSYQ2wnIJOD/jLW5LpUfBNs5tklE3bqoma6KY2VLj35hEaPt0ANrOowzsR68eu27jvBtMF7PzoBHpOGfMQxyCUHvSPz5PZmS/TEZeh2bYeop+9ZD0IyjMVbI/YQTsQvlGnTAgSjJ3lFNRWy04HP9R4pWL+i+HhI+jNA6I2jgFKd5y3ya5gXIvIFLVy76vXVoqzkU9om+ACnhnqIMnwUXGOrEGsSCl11ljDVp9KVuoUo9N+SJcRN1x2dNKl6XTB6ve5NdiAnKzlhI2AxD4teoueARtCln9qcck+e/5nN1X0hAJJdKpDpSgoSSc1AKu1HhWP4K06uQBVFDV5FJAQp9x+MK/9DcQourpXaQ3SB5CbRNeVN+loPvAvNb4agFIe1PkN4gVtXBA/W8V8iuhpbNSANExYqw6RgO+xzFqlTXUEBcOKc6DzkshZCLq7jNERSTAR0DXbhOBgzW28OledH0ud3twpYhT1tVoF9pUj5W5l1CGZNuHRATwwsdNIffGeAtF7Qx7B6mep5T6TiUfYMTLKo2zynGBBEUQbdRIITQSsQ/bqSoP+4DE8XAA3Cj8wa1RX1cuJpAQLCCeiGdVKeYQUV5h4nRvZACFiUeFNrqpjUKdMA6Im+pKzAUj5TJ1A/dFdNrI7baoA9Vg6PjrUd9q0JaNsrF15gbjYaoODBdRedxaYfdwto4i9qOpHTZV3nyq++u2oWnB/R572snQ+gAjpSLdBNSJ3LLSf+vBIEUqeiAkJzHY7d4HzkWyMNehEQQSUdVI6ypK3NGQh7dlCK1l9Ars+3T4riD02CJNhfiJQPaJTxzIJHQoauCdgRthj6njHyjoAUWLiOvKqIwM6IbBRtWh9bWaFhswNu4E4o5I8ouCNuED0TbUUQOxT0bh1Sqof5gz6bx1yKxRg1YAqDDQBGdiP4IMREb1BB6i6rXokgqboS+eMqAmRBK1uFRGS4OTQVOdwRsZSZattl0mSskO9SSgKikvEXVYjlfSRbuAjKDS16XSfmmehPhmoLSXS7fhJKcpnnTKP6wpRV9Eki++djJMwcj2qJEVwq6cUxQ6y6DwPWVPuQStKIHLZkIGUflCojl9BdvWiwDxMEHGHSgeh4GJgOoYSJ9gdQaExiQOJcStNx2S7WYi+FdUZn1rFfjV5KJbCazsLIzpAS8ynVmaSU136VGwtUXUmQkWH5V6FH9UpOpkIzc6p5VxEz2o34xLMIaotaHER0NHUmZuTDzqoqaMCt9BBucL6yeTVkNJ+AJBQpER7UrOJxLVOMErPUwrn0tsa2rDEHDqkdDu8KfnU3Uoplyw2imdra8+DgzcSEhWCRVMjtKkZ7okxZEmWOIcHQo7AMLzP1TisVqhKNbiZavOZt1Oihq79T5upJAsLxnrgDWUOaEE51xz8IJBe98wbCDa1PeHUKQZl48+qxgqiW+38INcQsu/ycIDquwDslQIp2kbh0xawPePckJLNMQDcqm0NbleMcB8k4FHNQTglRAjQRikFDiIbSB0KCsLuNJ3wlgwBjEpIW9sikk5gdh4CUta3Xc7UQiyBIDu3ktVRABVEOkIm6o4uFXJiUiw7nQElFUm5i1nGFiEkBd1VsG6qOKzcJlJYQaBpRImYSiXWfCoLta/zMMJBz8xZDZUoU+/GkrwDmZc0Mp6klto6xgP33JGpewlkZfqiSM5YMMPuOTMdn3RC+aihom1DCVzBa+rMpqO6C7lepK7AurKx1YEEBol3h0VYU0yrnQn1iCANZZF9APNqpIhOZFXksU5QIsrjoPq2QCtIUBK4atWuEQ7s23SSpwnkB2scDRi8p+o0X8SotisAoTp1Qpmy1x2SjAhlVXVfEYCoPPa47DqCHnU6TlB7FYVkk1jR/1xAuzXciopAXW4UJBbrrictO3Nn1Tp01hLvkICgPVQRmTwAAyvmpUOHyIaEGI06josaplCjoiaSevY6UBLv0TWsDpE2IBwBIR1BSR/O2o9QtNrggQ1QHWapddHBEJR8kHusY3SdLis6HVPIAFVoNRYUEj6tKBcKV3JnJp3+HoyjTspOQFKZ9CXwsOJqnRX2I3pv4TImXxt2bognwier6oWLr1JdkeplVfJMG39LFaROr+dO1koBKIKGzohDDTDU0nEjHQdaHhBSS/XQ/+hA/2+Rojw/Z0HC5n8Brs3XBCCkTf8AAAGFaUNDUElDQyBwcm9maWxlAAB4nH2RPUjDQBzFX1OlKi0OdhB1yFCdLIiKiJNUsQgWSluhVQeTSz+EJg1Jiouj4Fpw8GOx6uDirKuDqyAIfoA4OzgpukiJ/0sKLWI8OO7Hu3uPu3eAUC8z1ewYA1TNMlLxmJjNrYiBV3QjhAAGMSMxU0+kFzLwHF/38PH1LsqzvM/9OUJK3mSATySeZbphEa8TT21aOud94jArSQrxOfGoQRckfuS67PIb56LDAs8MG5nUHHGYWCy2sdzGrGSoxJPEEUXVKF/Iuqxw3uKslquseU/+wmBeW05zneYQ4lhEAkmIkFHFBsqwEKVVI8VEivZjHv4Bx58kl0yuDTByzKMCFZLjB/+D392ahYlxNykYAzpfbPtjGAjsAo2abX8f23bjBPA/A1day1+pA9OfpNdaWuQI6N0GLq5bmrwHXO4A/U+6ZEiO5KcpFArA+xl9Uw7ouwV6Vt3emvs4fQAy1NXSDXBwCIwUKXvN491d7b39e6bZ3w+w3nLAg/Uv9AAAD5xpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+Cjx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDQuNC4wLUV4aXYyIj4KIDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+CiAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgIHhtbG5zOmlwdGNFeHQ9Imh0dHA6Ly9pcHRjLm9yZy9zdGQvSXB0YzR4bXBFeHQvMjAwOC0wMi0yOS8iCiAgICB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIKICAgIHhtbG5zOnN0RXZ0PSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVzb3VyY2VFdmVudCMiCiAgICB4bWxuczpwbHVzPSJodHRwOi8vbnMudXNlcGx1cy5vcmcvbGRmL3htcC8xLjAvIgogICAgeG1sbnM6R0lNUD0iaHR0cDovL3d3dy5naW1wLm9yZy94bXAvIgogICAgeG1sbnM6ZGM9Imh0dHA6Ly9wdXJsLm9yZy9kYy9lbGVtZW50cy8xLjEvIgogICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iCiAgICB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iCiAgIHhtcE1NOkRvY3VtZW50SUQ9ImdpbXA6ZG9jaWQ6Z2ltcDo5MGJhY2Y0Mi05MTc4LTRiMDgtYmYwOC01NjhjNzY2ZDRjYTQiCiAgIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6OTZiNjJjMTctZDgxZS00NWQ3LWEwNjQtYTU2YTQxMTVlNjgxIgogICB4bXBNTTpPcmlnaW5hbERvY3VtZW50SUQ9InhtcC5kaWQ6OTJkMWNmNjEtMzdmMS00NjE2LWE5NTAtNWU3YzE4OTA2YWExIgogICBHSU1QOkFQST0iMi4wIgogICBHSU1QOlBsYXRmb3JtPSJXaW5kb3dzIgogICBHSU1QOlRpbWVTdGFtcD0iMTcyNjIxMzk0MjQ4OTk3MiIKICAgR0lNUDpWZXJzaW9uPSIyLjEwLjIyIgogICBkYzpGb3JtYXQ9ImltYWdlL3BuZyIKICAgdGlmZjpPcmllbnRhdGlvbj0iMSIKICAgeG1wOkNyZWF0b3JUb29sPSJHSU1QIDIuMTAiPgogICA8aXB0Y0V4dDpMb2NhdGlvbkNyZWF0ZWQ+CiAgICA8cmRmOkJhZy8+CiAgIDwvaXB0Y0V4dDpMb2NhdGlvbkNyZWF0ZWQ+CiAgIDxpcHRjRXh0OkxvY2F0aW9uU2hvd24+CiAgICA8cmRmOkJhZy8+CiAgIDwvaXB0Y0V4dDpMb2NhdGlvblNob3duPgogICA8aXB0Y0V4dDpBcnR3b3JrT3JPYmplY3Q+CiAgICA8cmRmOkJhZy8+CiAgIDwvaXB0Y0V4dDpBcnR3b3JrT3JPYmplY3Q+CiAgIDxpcHRjRXh0OlJlZ2lzdHJ5SWQ+CiAgICA8cmRmOkJhZy8+CiAgIDwvaXB0Y0V4dDpSZWdpc3RyeUlkPgogICA8eG1wTU06SGlzdG9yeT4KICAgIDxyZGY6U2VxPgogICAgIDxyZGY6bGkKICAgICAgc3RFdnQ6YWN0aW9uPSJzYXZlZCIKICAgICAgc3RFdnQ6Y2hhbmdlZD0iLyIKICAgICAgc3RFdnQ6aW5zdGFuY2VJRD0ieG1wLmlpZDo2NmQ2ZjY5NC04NmU3LTQwZTgtYmI0NC1iYjczNzRjMmY3NDYiCiAgICAgIHN0RXZ0OnNvZnR3YXJlQWdlbnQ9IkdpbXAgMi4xMCAoV2luZG93cykiCiAgICAgIHN0RXZ0OndoZW49IjIwMjQtMDktMTNUMTA6NTI6MjIiLz4KICAgIDwvcmRmOlNlcT4KICAgPC94bXBNTTpIaXN0b3J5PgogICA8cGx1czpJbWFnZVN1cHBsaWVyPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6SW1hZ2VTdXBwbGllcj4KICAgPHBsdXM6SW1hZ2VDcmVhdG9yPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6SW1hZ2VDcmVhdG9yPgogICA8cGx1czpDb3B5cmlnaHRPd25lcj4KICAgIDxyZGY6U2VxLz4KICAgPC9wbHVzOkNvcHlyaWdodE93bmVyPgogICA8cGx1czpMaWNlbnNvcj4KICAgIDxyZGY6U2VxLz4KICAgPC9wbHVzOkxpY2Vuc29yPgogIDwvcmRmOkRlc2NyaXB0aW9uPgogPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgIAo8P3hwYWNrZXQgZW5kPSJ3Ij8+VEp25gAAAAZiS0dEAFwAVwBvsF7dSQAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+gJDQc0FoMI2cAAAArISURBVHja7d3NjxtnAcfx39jOe9Im3QSChAockaASRUIIIbghceSEBEeuVAIJxI1/ASTugHgRR/4AKnHhAkhBKj3ALZza0oZAS953PRzmGXZqvPYsiXdn7M9HWjm7ftnNs4/n68cz9iawG24kqXt+fCHJzJCx7SaGAP7HeyUEIACwY95OMjcMCABsh+M8on9kBYAAACAAAGwXRzqwq6qFzz3lgxUAAAIAgAAAIAAACAAAAgCAAAAgAAAIAADDUq04zysj2aW5b76zc9v7ZSuAWZKfGCuArVIneXlVEb6e5BfGCSsA2MJJX1XTuq7nR90J9pNMDRMCANs/9ydr7hQAbJfJsg3+vPN5LQZYAcB2z//ZkjvEPMn9JK8k+dfAK3a1/IxX0jx9dc8d+cTGfi/JnTKHziX590DHvp0n8yQ/7nmd7yf520D/T1WSC+Xf0/LxIM2fseRknElytoz7lSTvDny7850kn1v42jtJrldLHv0/SfJqmh3C/xz4RuiF8jM+VwLwngCc2NjfKJNomuT8gMe+nSfTJG/0XAF8NslfBvp/qpJcLKeTEuD78XeMT3L8lwVgPuCf+WqS22U72fXTpDksqC4f+0nuJvlyxrEzeNY59aK2k38U1N3IDn2e7HXm+bINZfe8Fwf+f2o3/pP4q36n+cAiI9lOTss2/e7CPK/Tedqk/fh7ubPANrl+jADcMFxsmb2ybT/ozvVJWU4ue4Qx5iUamBec9hyqhv6zd5e5DzuPhA6OsQQ6jeXMcc/32gb2N3TZIc19NuvyMS9/bkA/e/vIf9JZAc9naXZeTNLs1Gg37NfWRKAqg7GpoySq8vM8Xrj9SZodGct2urTPh15Os2N43rmtK+W27CjbnEmW7wiryh1hXn4Hp+XawufPrbnswQn/fO04tXN0uvAzrJr77fXrI75+ptw3Hpj/vcd/0SzJR9IcHbbfGe+jxn2a5INJ3jqFuXTUnJ4srgZmnR+uPfNCkm+k2TewarDOl1XDpgIwKwNdL3z9YpqjHuol12mPSOkeDtoeNref5ggnd4CTD8Css7I8rfG/tPD5N1dcdt38zwnM+cXxXDX31wVgWm7P/D/+Nqc7v28keTuHR02uCsAkyfNpDlMfwhFCl3J4+PB/V7rVmglxZ82A1Rv+hdTH2NC016mOWB3UJv/G70D1ivNyyuPf3iFzxJ1y3fknPYbLxnPyf/5cQxj/bZjD7fjXPW/rOJffhL2n+Q8DsOXLdgAEAAABAEAAABAAAAQAAAEAYHT6vpWsN9ICGJe1r/GyAgDYUQIAIAAACAAAAgCAAAAgAAAIAAACAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAAACAIAAACAAAAgAAAIAIAAACAAAAgCAAAAgAABshSpJbRgArAAAEAAABAAAAQBAAAAQAAAEAIBRmPW83JuGCmBUbq67QN8Xgn3bWAKMyg+eVQAuGUuAUbn3rAJQGUuAUVm7bbcTGGBHCQCAAACwS/oeBjqrqip1Xaeq7A5guOq6edqzna+tdt52v7bM4vUWrw9Dn/9HzeGnCcBX2xvse8MwhBAc9Xnf6x33+jC0ub/yAU/8QRiAnWQfAIAAACAAAAgAAAIAgAAAIAAACAAA49H3lcBeBw8wLt4OGgABAEAAABAAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAEwBAACAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAAACAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAACAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAAACAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAACAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAAACAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAAACAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAAACAIAAACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAAACACAAAAgAAAIAgAAAIAAACAAAAgCAAAAgAAAIAAACAIAAACAAAAgAAAIAgAAA8MxUSWrDAGAFAIAAACAAAAgAAAIAgAAAIAAAjMKs5+V+bagARuUr6y7Q94VgLxlLgFF57VkFoDKWAKOydttuHwDAjhIAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAQAAAEAQAAAEAAABAAAAQBAAAAQAAAEAAABAEAAABAAAAEwBAACAIAAAGyVKsmFckpnUGrDAGAFAIAAACAAAAgAAAIAgAAAIAAACAAAg3V/tuYCPzRGDNC3jvj6gyQ/T3K/x21UOXwhZN3z8peTfC3NK0rrJPMk03L+QZIf+dUwJlWSm4aBEXqj8++6zOU7Sb5YTvuugOfHvK/8JsleuV67gv5rkleS/NmvBWDz6s7H/XL6ZpKrG/ye15O8tfC9b/tVMFb2ATDmufug8+i8dWaD33O65Gsf86tAAODkVwCfT/IwyawTgv0Nfs/Fp4vuxJspMmIzQ8CI3UryTpIPd+bzJ5PcPcYj+jr99wN8oLPCeJLk434FCACcnl8l+W7596Uk30vyqOd1q85qoo8LSS4uXBeAU3I1798pO9/wR/s9fpvkecMPcHrOlhXA/kIINvnxJMmXstkdzrBxdgIzdk+SvH4K3/dW+d4wWvYBMHbtI/Jlh2jOc/iK32XX66tauN5Dw44AwDD8Ps2Lwc6WjfW0bPwfl1Xu44XLX0zz1g0pp+c757Ub92ln4z/rBOVBkl+m/45mGCxHMrANpkk+VE5vdzbWn07yjxVz/2yJw6rVwF6SV5O8kOTdNIeZztO8FcWBoQcYju7O2ovP4PYupXldQW2Dz7bxFBDbap7koytWAO3KYd0LwfbKSiHp/4IxGAVPAbGNK4D2dD+H+wKWaZ/7P8jhIZ3LNvLteftx6CdWADBYT8pGuiqn84WNdtXZ0LeBuLCwKjgqKH8yvADDdT7J73K4c7ddCbQfD9I8p383zZE8y17o9WjJeXfy/qOFYPQ8BcQ2upnktfLI/2qSz/S4TvfR/afK6R/SHF56L8lLaf7eAGwNTwGxjdpX6F4qpwdpXrnb1x87/27f/8erftk63goC83q1aVkpu6/gjgIjXAnceorb6PtH40EAYMs49h8BgB1lPxkCACOd3/tJXn6K23CkHAIAO6oSASxvYXy8bQMIADuqTnMY580kLy45/xPl9PU1KwAQABiZ9n19fpb3v9/PmfJxv3x+Mc3RPu0fgzlr6BAAGLeqrAKudb42z+HO4XPla+37/J/rXCZpXkfgPoIAwIgj0H0aZ7JwumrlAFvNUUAAO+o/C1XsWdfPLuIAAAAASUVORK5CYII=",
-    # Bath
-    "bath": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAMAAADDpiTIAAAAA3NCSVQICAjb4U/gAAAACXBIWXMAAA3XAAAN1wFCKJt4AAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAAv1QTFRF////AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMtkj8AAAAP50Uk5TAAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxwdHh8gISIjJCUmJygpKissLS4vMDEyMzQ1Njc4OTo7PD0+P0BBQkNERUZHSElKS0xNTk9QUVJTVFVWV1hZW1xdXl9gYWJjZGVmZ2hpamtsbW5vcHFyc3R1dnd4eXp7fH1+f4CBgoOEhYaHiImKi4yNjo+QkZKTlJWWl5iZmpucnZ6foKGio6SlpqeoqaqrrK2ur7CxsrO0tba3uLm6u7y9vr/AwcLDxMXGx8jJysvMzc7P0NHS09TV1tfY2drb3N3e3+Dh4uPk5ebn6Onq6+zt7u/w8fLz9PX29/j5+vv8/f6IHHhzAAAWKElEQVQYGe3BCZxU9Zku4Ld6oZtNYGykYiC0WwQ1GiWRctgczUWjVyGgEc1cB1FyddREjFLquI1mVJZJR0SbqGyOJuAyRxBDgiGtYQ0YEe8VETdUQJaGRpGlt/c3ZhIz3/9UdddCN3VO9fs8EBEREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREZHW1f6UUbf825QZT7/wzMyH7rvtsn4dIW1Fu4G3L3ivga7GjQvvPrMUku+OvWXR52zKvt/ffgIkf3W5aglTWXVdGSQvHT17H9NR++xJkLzT/cFapqthRk9IXunwL7uZiX0PdIXkjcKxm5mp6htLIPlh+Dpm44N/LICEXyeP2aoqg4TdUW8we++dBAm3Idt5MD69ABJmY2t5cBrGQ0KraApTaWAqs0sg4fR3L7FJ73sP3zb6nG8cHul24v/6p1sfem4Dm7Q8Cgmj6AY2YfXtp8Cvb3xZA5P7qBwSPiXLmUztb67pieR6XDlvH5NZ2wkSOrOYRONTR6E5X/lFPZN4vgASMj9hEr/rh1T6zmMS90HC5bwGJnj9XKRj8Eom+gEkTPrupt/eMQVI06W76bevPyQ8um2g30f9kL6+G+i3pSckLIoW0W9FFJnotoh+r3aAhMQN9HuiFJkpepB+D0DCocsOuhrGI3NX1dK1ryckFO6jz7XIxsWNdM2AhMFX99I1Ddm5m66GkyAh8DhdLxcjO5Fn6VoACb4T6+l4vwzZ6riGrjMhgTePjs9ORtMi3fv2KEDTem+jYyUk6AbTNQLJFQ7595Uf1pKs27Rq6tBiJDeogY6LIQG3nI4XkVT/WdW0an45BElNp2NDESTQ+tHRcDKSOHYuEy04CUn03EfH+ZBAe5COmUhUWlHLZBqmH4ZE99MxFxJkxdtp7euFBNEVbMqbxyBB12pa+7tCAuxCOiYgwWkfsWnV/4AE4+gYCwmwObR2doXfwM/ZnLph8Ct5n9bLkOAq2ElrAvx6b2PzPjsZfuNo1XWGBNZpdJwBn06vM5UPusPnaDrOgwTWTbS2ROAzh6lVReDzOq3JkMD6Na1p8BnMdHwfPnfTeg0SVAV7aH0XPiuYjg3FcJ1Kq7ELJKDKaX1aAtdIpuef4bORVgwSUOfQmgOf1+i3dcHkeZvotykC189pXQ4JqB/Rugauo+gz/1j8Wc8n6BODawSt+yAB9TCtYXD9mI6ay/GlYZ/QcT9c/Wk9Bwmo39I6Ha7f03Eu/ke/Olrr4PoarbWQgFpFqxcc7etpPQrrHjp6wdGukcZHkIBaR6OxGI5jaG0/DFa7DbQGwLWDxi5IQH1EYztcA2k9D9c0WhfB9QaNOkhA7aLxOlzfp3U7XFfRuh6u39AqgQRTHY2FcP2I1nlwnUbrPrhm0jocEky0PLjitGJwldOqgKuSVhQSTLQ8uOK0YnCV06qAq5JWFBJMtDy44rRicJXTqoCrklYUEky0PLjitGJwldOqgKuSVhQSTLQ8uOK0YnCV06qAq5JWFBJMtDy44rRicJXTqoCrklYUEky0PLjitGJwldOqgKuSVhQSTLQ8uOK0YnCV06qAq5JWFBJMtDy44rRicJXTqoCrklYUEky0PLjitGJwldOqgKuSVhQSTLQ8uOK0YnCV06qAq5JWFBJMtDy44rRicJXTqoCrklYUEky0PLjitGJwldOqgKuSVhQSTLQ8uOK0YnCV06qAq5JWFBJMtDy44rRicJXTqoCrklYUEky0PLjitGJwldOqgKuSVhQSTLQ8uOK0YnCV06qAq5JWFBJMtDy44rRicJXT2r7GtYNWFBJMtDy44rRicJUzfVFIMNHy4IrTisFVzvRFIcFEy4MrTisGVznTF4UEEy0PrjitGFzlTF8UEky0PLjitGJwlTN9UUgw0fLgitOKwVXO9EUhwUTLgytOKwZXx3qm60A7SGB0G3rLI5VfovV+pWsFrf7w+X9M12pIUESu/5zZicHnUaZrCiQgin7LbMXg07OG6dnRAxIQtzJrMfhdzvRcAgmI8gPMWgwJzt/E1D4cCgmKK5i9GBJ1u37W2g+a8/rMa7tAAuMRZi8GCb3FzF4MEnpVzF4MEnpVzF4MEnpVzF4MEnpVzF4MEnpVzF4MEnpVzF4MEnpVNHZHU7iXVgwSelU0apBCnFYMEnpVNGqQQpxWDBJ6VTRqkEKcVgwSelU0apBCnFYMEnpVNGqQQpxWDBJ6VTRqkEKcVgwSelU0apBCnFYMEnpVNGqQQpxWDBJ6VTRqkEKcVgwSelU0apBCnFYMEnpVNGqQQpxWDBJ6VTRqkEKcVgwSelU0apBCnFYMEnpVNHZ3TeEuWt/pKkF3GFKoouS1Ax8sf27SPxShKVWUNqB69ohiJFVFaRve/UEBkqiitBVr/zcSVVHajl+1h18VpQ1Z3RM+v6e0JVticJzyGaVN2Xc6jB4bKW3MpiPxNyXLKW3OH0vxpZmUNug/8FcDKG3SUPzFMkqb9KcI/mwkE9W++sRMySNPrD7ARJfiC4Ub6PPxtd8ugeSZdv2u/YQ+7xYDOIs+s7tC8tLhT9HnQgBT6Ng5HJK3Ruyk41Eg8hEdF0Hy2MV0bIngdDrmQPLaXDpOx+20tpZB8lr3bbTuwGO0boHkufG0ZuBFWmdD8tyZtBZiDa2ukDzXpZHG69hGYwMk771NYxsO0FgMyXuLaezHhzS2QfLedhobsZJWL0ieK6e1HB6t4ZA8dxGtZ/AIrYchee5hWg/iGloNMUheO72e1lh8jY51pZA8VvomHV8F1tAxEZLHJtLxKoB76JrVFZKnus2m6y4A/ejz8TmQvHT+Jvqcii8spN9v7x15dASSRyLHXTp5Cf1+jT/7ZiOTqN0veaSWSTScgv/2JKVNmo2/OOoApQ3a1xt/dSWlDfo/+JufU9qcyfgfhb+ltDELC2F0W0tpU1Z1haPzPEobMrc9fArup7QZ90SQ6LIdlDbho4uQVJd/20vJe5/9S3s05auP7qXktZqHe6A5HYbP3EHJUzseP68dUio8bcSPJs2htXWhhM5WWnMmXjfs1CKkj5YHCR2PFjJFy4OEjkcLmaLlQULHo4VM0fIgoePRQqZoeZDQ8WghU7Q8SOh4tJApWh4kdDxayBQtDxI6Hi1kipYHCR2PFjJFy4OEjkcLmaLlQULHo4VM0fIgoePRQqZoeZDQ8WghU7Q8SOh4tJApWh4kdDxayBQtDxI6Hi1kipYHCR2PFjJFy4OEjkcLmaLlQULHo4VM0fIgoePRQqZoeZDQ8WghU7Q8SOh4tJApWh4kdDxayBQtDxI6Hi1kipYHCR2PFjJFy4OEjkcLmaLlQULHo4VM0fIgoePRQqYO0HgREjov0jiATG2jsQwSOstobEOmNtB4ExI6b9LYgEytprEZEjqbaaxGpl6isRcSOntp/A6ZepZWO0jIlNB6DpmaTusISMj0oDUdmfoZra9DQuZ4Wj9Dpu6idTokZPrTuguZ+jGtoZCQOYfWDcjUaFrfh4TMJbSuQKZG0BoLCZkf0hqJTJ1N62ZIyIyndTYy1Y/WzyEhM4nWt5CpnrRehoTMQlq9kbFdNHZBQmYrjU8jyNgrtHpDQuUrtJYicw/RuhASKufRegSZG0vrDkio3EbrGmTuDFrPQkLlaVoDkblOjTTegYTKO7S6IAvv0mjsDAmRwxppbEQ2/pPWAEiIDKI1H9n4V1rXQELkelo/RTYuojUNEiLTaY1CNr5OayUkRF6jdQKyUbCXRv3hkNDocIDG/iJkZRWt0ZDQGEnrNWSngtY8SGg8ResRZOcsWvs6QkKi5FNa30V2inbRuggSEhfQ2lOCLD1F60lISMyi9SyyNYpWTTtIKBTvonU5stWllta5kFA4h1ZDGbL2Eq1pkFB4lNYSZO96Wp8UQEKgcDutm5G9o+gYAAmBs+jog4OwltYkSAhMpfU2Dsa9tLaUQAKvYDOtSTgY/ekYAwm8YXQMxsGIbKG1LgIJuuW0dhTioEyl4wJIwA2mYzoOzgl0vAIJuBfp6IeD9Bs6+kMC7WQ6/oCD9V06noEE2pN0jMTBiqyj1XAsJMDK62l9UIiDdjUdD0MC7CE6bsTB67CT1t7ukMDqvpfWZ13QAh6g4y5IYN1DxxS0hF51tLZ3ggRUp520Go9Di5hDx0RIQN1Ix3y0jDPoqDsJEkg9dtFxNlrISjr+EIEE0a/oeAMt5VK6/gkSQOfRNQYtpWgdHdu6QQKn4wd0bCxFizmHrmmQwPl3ui5CC5pHR2N/SMD0q6djMVrSMfvp+FMhJFAKX6Wj/htoUffRdR0kUG6kawpaVqdNdOyOQgKkfA8dO7qhhf2ArrmQAHmRrv+LlhZZRtf1kMC4lK7XCtDivtVAR91gSED03U3XILSCx+ja2hMSCN020PVLtIYjauhaWQIJgKKX6NrTE61iHH0egwTAFPrchtZRtJw+P4Tk3Fj6rClBK/laNV0HzoDk2OBauj49Dq3m/Ea6NkUhOVW+nT6XoBU9QJ8lxZAc6rSWPlPRmor+QJ9pkNyJePR5tQSt6qvb6DMFkjM/pU/N0WhlQxvo80gEkhvj6TcCre4e+v0iAsmFn9KvAq2vcDH9phdADrnIg/Rb2Q6HQPQT+s0uhBxihdPpt7M3DomzGuj3VCHkkCqeywQX4hD5MRPMKYIcQqUvMMGdOGTuYIJniyGHTKfFTDAJh9AEJni+A+QQ6baCCabikJrKBGuPgxwSR6xhghkRHFKRmUyw+3uQQ6D/e0zwqwIcYoVzmWhCIaSVRcbXMYFXhEOu+AUmquoBaVU9fsNEC9shB0p/x0SbB0Ja0dBPmKiqPXKi41ImqhsHaS3FDzQy0fJOyJEurzKJpztDWsVRK5nEn7oiZ8pWMom3ToW0gkt2M4mVZcih0ieYRMMjh0NaWIdHmcx/lCK3bm5gEtXXFEJa0sXvMYmGOHLu/N1MZs1gSIv59h+YzKcXIABOeIdJ/bInpEX0nN3IZN47CYHwdy8xqT23lkAOWse7P2dSVWUIiKIpTO6dCyAHJ3L5JiY3rRjBMbaWyS27uBCSvcGvMrm6axEog7ezCRt/0hWSleJLlrAJO7+DgPkmm/TZlGMhGYveuZlN6oegGcBmNMw7C5KRv3+qls04A0FzBZv3+ugSSJpKR7/K5o1G0DzAVLY9emEHSEqRU+/fwVTuR9A8zzTsnX/VVyDN6Dzisc1Mg4egeYvpaVx1+zchSfUZ97tapmcdAqa4jun7cOq53SCO0u9OeZfpqy1CsBzPDG1aOOnyfu0hKD7x+3c/s66Omfk6guVCWqu2MC0Nbz/3rxf3LUYb1a7vRXfO/f+1TMuWVbQuQLDcTOuH7cdtZfo+3/LWykXPPP6zu24YMyrvjbnhrp89/syilW9t2cv0bbux/Q9p3YRgeZzWEKDDTdspLWTH+I7AEFqPIViW0oriC53iOygtYOdtnfGFKK0lCJYdNGrwF51v+ZhykDbd3gV/UUNjOwKljNZKfKloxEuU7DW+NLIIX1pJ63AEyQBas2H0+XkNJSvVk78OYzatv0eQXEHrVjg6XvUaJWMrLi+F41ZaoxEkE2iNhN+Jd66lZGB1/Fj4jaT1AILkeVonIonj4qsoaVnxk6OQxIm0PATJehr1JUiu97hXDlCadeDlG76G5ErqabyFACmuo/EOmtb+rLtf3k9Jav/Ld5/VHk17h0ZtEYLjeFoL0LzSIXcurqc46hffOaQUzVtA63gExzBak5HSmY0UR+OZSGkyrQsRHDfTGotUOr9P8Xm/M1IZS+smBMd0WoORyi/o+rBbx+69+/YbNHT4JaPy3CXDhw7q17d3947dPqTrF0hlMK3HERxLafVACufS1fgdtEHfaaTrXKTQg9YSBMcOGruQQteP6ZqKNmkqXR93RQq7aOxAYJTRWoEUZtP1Tke0SR3foWs2UlhB63AExQBas9C84XQ1DEIbNaiBruFo3ixaAxAUY2jdgmaVbaVrMtqsyXRtLUOzbqF1BYJiAq0RaNbTdK0rRZtVuo6up9GsEbQeQFDMo3UCmjOKrvpvow37dj1do9CcE2g9j6BYT6O+HZoRrabrXrRp99JVHUUz2tXTeAsBUVxHYwOaM5+uNcVo04rX0DUfzdlAo64YwdCH1gtoxmi6ak9BG3dKLV2j0YwXaB2PYBhGaxKa1ms3XbehzbuNrt290LRJtIYhGMbTugpNiiyi64+FaPMK/0jXogiadBWtmxEM02kNQpOupmtfHwj67KPrajRpEK3HEQxLaR2Bphy9h65xkC+Mo2vP0WjKEbSWIhiqaexEUwpeoeuVAsgXCl6h65UCNGUnjR0IhDJay9GUcXTtOQby347ZQ9c4NGU5rTIEwUBaM9GEPvvouhryV1fTta8PmjCT1gAEwRhacSRXuJKuRRHIX0UW0bWyEMnFaY1BEEyg9T0kdytdu3tB/qbXbrpuRXLfozUBQTCPVl8kdfIBukZDjNF0HTgZSfWl9TyCYD2N+nZIpvg1uuZDHPPpeq0YybSrp7EeAVBcR+NtJHUPXdVRiCNaTdc9SOptGnXFyL0+tOYjmW/V0TUK4jOKrrpvIZn5tPog94bTmogkSt+kay4kwVy63ixFEhNpDUPujad1JZKYSNcnZZAEZZ/QNRFJXElrPHJvOq2BSDSgga5hkCSG0dUwAIkG0pqO3FtGqzsSdNhA1yxIUrPo2tABCbrTWorcq6ZRjUQP0fVxV0hSXT+m6yEkqqZRjZzrTmsZEpzdSNc5kCacQ1fj2UiwjFYZcm0grRnwO2wjXdMgTZpG18bD4DeD1kDk2hha4+H3GF3vdYI0qdN7dD0Gv/G0xiDXJtIaDp/z6GocAmnGkEa6zoPPcFoTkWvzaPWBq9tmuiogzaqga3M3uPrQmodce5tGXTFcT9K1vj2kWe3X0/UkXMV1NNYjx4rraKyHawRd9TFICrF6ukbAtZ5GXTFyqw+teXB030bXfZCU7qNrW3c45tHqg9waTmsCHM/S9UY7SErt3qDrWTgm0BqO3BpPawysy+iqPRWShlNr6boM1hha45FbM2gNgHHkTrrugKTlDrp2HgljAK0ZyK1ltMpgLKBrdREkLUWr6VoAo4zWMuRWNY0dMMbQtf9ESJpO3E/XGBg7aFQjp7rTatxvNNB1EyRtN9HVsN9opNUduTSQ6VpaAElbwVKmayBy6Uqm6fPjIBk47nOm6Urk0kSm6TpIRq5jmiYil+YzPYsjkIxEFjM985FL65mWT3tDMtT7U6ZlPXLpXablSkjGrmRa3kUurWY6XoRk4UWmYzVyaSHTsPNISBaO3Mk0LEQuDWMaLoNk5TKmYRhyaglTmgPJ0hymtAS59Y0PmcITxZAsFT/BFDZ+Azl2+AI2p3FiBJK1yMRGNuf5bsi5SL9/nr0wuV9XjCiDHJSyERW/Xpjc7GtOg4iIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIi0pv8Cvphc0aU3mGkAAAAASUVORK5CYII=",
-    # Kitchen sink
-    "kitchen_sink": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAALEwAACxMBAJqcGAAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAACAASURBVHic7d15mGVVdffx72q6AQGZRKQbEIwoiojK5ISi4ohKE42KMXGIQ+TVmGjigIkx+jqbwcSocUSNiSIEcB7CoAkhCKICviKKCmI3MojKaDOt949zaBvooaruPnefc8/38zz1NEL12qvKurV/95x99o7MRJIkjcui2g1IkqTpMwBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggZACRJGiEDgCRJI2QAkCRphAwAkiSNkAFAkqQRMgBIkjRCBgBJkkbIACBJ0ggtrt0AQERsBOwOLGs/dlzjn2/5WAosqdWjJElzcANwMbDyNh8r1vjn8zLzpmodtiIz6wwcsQXwOGA58ERg2yqNSJI0XVcAXwA+A3wlM6+u0cRUA0BELAOeTDPpPwrYZGqDS5LUP6uAk2jCwOcyc+W0Bu48AEREAM8AXgHsC0SnA0qSNEwJfBP4e+Co7HiC7jQARMSBwDuB/TobRJKk2XMG8MrM/HpXA3QSACLi3sDbaS73S5Kkhfkc8OrMPLd04aKPAUbEDhHxfuAcnPwlSZrUk4FzIuL9EbFDycLFrgBExB8DfwdsXqSgJEla0zXAn2fm+0sUmzgARMQS4B+Bw0s0JEmS1ut9wJ9m5g2TFJkoAETEdsAxwIGTNCFJkubl68DvZeblCy2w4AAQEXvRPLe460IHlyRJC3YBsDwzz17IX17QIsCIeApwKk7+kiTVsitwajsnz9u8A0BE/AXNZX8X+0mSVNfmwDHt3Dwv87oF0KaMY3A3P0mS+iRp1gQcO9e/MOcA0N7zPxXf+UuS1EfXAA+Z65qAOQWAdrX/GXjPX5KkPrsA2G8uTwdscA1A+5z/MTj5S5LUd7vSrAlYsqFP3OAVgIh4L9Pd5Odi4MvAT4CVwIr2z4uBiTY9kCSpY0uApcAyYMf2z7sBj2///bS8LzP/z/o+Yb0BoN3e919Kd7UWPwCOA44HvtH1EYiSJE1TRATwQOBQ4HeBe05h2Bevb9vgdQaA9tCB8+l20d/Xgddk5mkdjiFJUq9ExIOAt9HtTrrXALtl5s/X9h/XtwbgDXQ3+Z8DPDEzH+HkL0kam8w8LTMfATyRZk7swuY0c/larfUKQETcu21oo8LNXAu8DDgyM28uXFuSpMGJiEXA84B/AjYrXP4m4L6Zee5t/8O6rgC8nfKT/0XAAZn5YSd/SZIamXlzZn4YOIBmrixpI5o5/XZudwUgIg4Evla4gf8BnpqZlxSuK0nSzIiIuwD/ATy0cOlHZObX1/wXt7oC0K5SfGfhQT8JPMrJX5Kk9WvnykfRzJ0lvbOd41e77S2AZwD7FRzwf4DnZub1BWtKkjSz2jnzuTRzaCn70czxq93qFkBEnE65AHARzXaEvvOXJGme2tsBZwA7Fyp5Rmbuv7r+LQEgIpYBP6PMSX/X0iz4+3aBWpIkjVJEPAA4hTJPBySwU2auhFvfAngy5Y75fZmTvyRJk2nn0pcVKhc0cz1w6wCwvNAA5wBHFqolSdLYHUm5zYJWz/WRmUTEFsDlwCYFij8xM79YoI4kSQIi4mDgCwVKrQK2y8yrb7kC8DjKTP5fd/KXJKmsdm79+gY/ccM2oZnzV98CKHX5/zWF6kiSpFsrNccuh2ZBwEbApcC2Exb8QWbuPmlXkiRp7SLiPCY/SvgKYPvFwO5MPvkDHFegxq20jz8cQLM3wd7AFqXHWICkOSb5jPbjhMy8qm5L6xYRGwOPBPYEdgR2av/cgbLnPdxEEyRXrPFxLs3357qC4xQVEXcAHg3sT/Nzdk/Wf0rmtFwLfJvmZ+zUzDy9cj+S+uE44NUT1tgW2D1ofvn958QtwYNLHe0bEVsD7wKeU6Jex34KvDAzv1q7kVtExGY093ieCjwJ2KpiO9cAXwKOBb6QmVdW7OVWIuIAmtW1u9XuZQ6OBl6SmZfVbkRSPRHxIOB/C5R6TADPBj42YaGLgR1zbWcLz1P7S/koYNmktabs/cDhJb4HCxURmwKvoLlPdMdafazHb2iC3VtqXzWJiHcAf04/3u3P1WXAH/QpbEqarnY//xXA0glLPWcRzeXgSX250OS/NcOc/AH+GHhprcEj4pnAecCb6efkD7ApTTj5YUQ8vz0De+oi4g+BVzKsyR/gzsAnI2KH2o1IqqOda79coNSOiygz2f6kQA2Af2CYk/8t3hoRd5/mgBGxLCL+B/h34K7THHsCdwE+BHwzIn5nmgNHxFLgH6c5ZmHbAu+r3YSkqkrMuctKBYCVkxZoF/w9d/JWqtoceMu0BouI+wCnAQ+Z1piFPQD434jYf4OfWc7rgW2mOF4XDo2IR9ZuQlI1E8+5FAwAKwrUOKBAjT6YytcREQfSHBBR6pSoWrYHTo6IQ6Y03lDD0m3NyutF0vyVmHP7cwWAcscQ17asPVmxM+2WkF8Btu5ynCnaDDg2Ip7d5SDtI397dDnGFM3K60XS/BW7AjDpSkJongKY1N4FavRFZ19LROwC/Btltm7uk42A90fEfTscY0/K7n1Q0yy9XiTNT4k5d+kiYEmBQjcUqNGHTX5K6eRriYglNE9JzMo7/9vaFDiq3cegC5t3VLeGWXq9SJqfEnPukqE9BjV2bwUeWLuJjt0b+OfaTUjSrDMADEREPJRmk58xeF67zkGS1BEDwHAcQXN401i8tnYDkjTLDAADEBF7AmN7R/zQ9qqHJKkDBoBheBXjevd/i0lPvJIkrYMBoOfafd8Pq91HJU+KiCGc1CdJg2MA6L8DKfOo5hAFcFDtJiRpFi2u3UBhh9GciDeJDwH7FOillJJbvl4NnACcDHwDWFWw9hKa3ekeCTwG2KpQ3QNojlruix8Az5iwxjLgCwV6kaQFm7UAcF5mfmeSAhFxdalmCikVAL4DPDUzf1yo3tqcAbw3InYEjgYeXKBm3/a8v67Az9ivSjUjSQvlLYAei4g7AiW2xv0p8PCOJ//VMnMFzZWA7xcot2vXZytI0hgZAPptN8rsXf/SzLyqQJ05y8xVwIsKldu9UB1JUssA0G8lFv/dTHPfv4ZTgGsL1BnrIkhJ6owBoN9KTHwXZuZ1BerMW2Ymky/KBNi4QA1J0hoMAP1WYuK7sECN2uN7BUCSCjMA9FuJpzRKPY5Xc/xZe1pFkqozAPTbNQVqbF+gRu3xS3wfJElrMAD022UFaty5QI3a419aoIYkaQ0GgH4rEQA2jogtC9SZt4hYBNypQKkS3wdJ0hoMAD2Wmb8CbihQqtZtgG0ps4+BAUCSCjMA9N+QbwOUGPeazCyxl4AkaQ0GgP4rEQBqXQEoMa7v/iWpAwaA/iuxAG7IVwAMAJLUAQNA/439FoABQJI6YADov7HfAvARQEnqwKztsPahiLh6whr3L9JJOV4B6JfdIuJrE9bYtEQjkjSJWQsA+9RuoAMl3gEP+QpA3wLA5sCBtZuQpEl5C6D/xn4FwFsAktQBA0D/jT0A9O0KgCTNBANA/w35McBZvAUgSTPBANB/pc4DmOqxwJ4DIEn9ZgDouQGfB3Anyvx8uQZAkjpgABiGywvUmPZtgBLjXes5AJLUjT4FgKzdQEGlv5YhrgPo4wJAf8YkqdWnAHB+7QYKKv21DHE3wD7uAvjjwvVqmqXXi6QK+hQAzqjdQCGrgLML1xzio4C9uwKQmReVrlnRrLxeJFViACjvrMwssWhvTUPcDbCvjwCe2UHNGmbl9SKpkj4FgBOAn9ZuooCPdFDTKwDlfLSDmtN2GfC52k1IGrbeBIDMvAp4Ye0+JnQi8IEO6o41ABR/BDAzjwKOLV13yl6SmSWeDJE0Yr0JAACZ+VXg/bX7WKBfA8/PzC5WZ491EWBX9+sPZ7j7CxyVmUfXbkLS8PUqALQOB14GXFO7kXk4EbhfZl7YUX0fAywoMy+lOfZ5SJfRVwGvAZ5VuxFJs6F3ASAb7wbuB3waWFm5pXVZBZwOvBh4TIeTPwzzFkAfHwNcLTMvzsxDgGcDpwLXdTXWhC4BjgP2zsy3Z+ZNtRuSNBuCMhuKbNNuWduJiFgG7A1s0dUY85A0z2Cf3cFq/7WKiG2AKwqU6vT/p1u05wDcwOQB826ZecHkHW1YRCwG9gTuST+C8bXAt9tHFyVptYjYGvjlxHUYQAAYu4gImisOSyYsdc/M/GGBltYrIu5MmXfvW2TmkG4FSVLnSgWAPrzT0Qa0CwtLrPqe1kLAEuNc5+QvSd0xAAzHkNYB9PIRQEnSbxkAhmNIjwL2+RFASRIGgCEZ0qOAvX0EUJLUMAAMh7cAJEnFGACGw1sAkqRiDADD4S0ASVIxBoDh8AqAJKkYA8BwuAZAklSMAWA4SgSA7dpdBbvmLQBJ6jkDwHCUeEe8BNi6QJ11ioiNgG0LlDIASFKHDADD8SvgxgJ1ur4NcCfK/Fx5C0CSOmQAGIgBnQfgOQCSNAAGgGEZwqOA3v+XpAEwAAzLEJ4EMABI0gAsrt1AVyJiK2AXYGn7sUP75yY1+5rQLgVqDOEWwPYR8S8F6tRyPXAJcPEaHz/NzCuqdiVJa5ipABARdwOWA4cCBwAb1e2ol4ZwBWBn4I8L1OmTjIhvAMcDx2fmebUbkjRugw8AEbExcDjwR8BeldsZgiFcAZhFATyo/XhbRJwLfAz4p8y8rmpnkkZpsGsAonEY8H3gXTj5z9UQrgCMwb2BtwE/iIjnRcRgX4uShmmQv3Qi4mHA6cAngbtVbmdoun6HbgCYn52AjwDfiYjH1G5G0ngMLgBExMuBk4F9a/cyUHftuP7vdFx/Vt0X+EpE/M2UtmuWNHKDCQARsXFEfBj4e1zcN4ktO55gtuuw9qwL4PXAMRGxee1mJM22QQSAiLgzcBLNQj9NJmi26y1fuDkHYNMuao/MU4BTI6LEY5+StFa9DwARsRnwJeChtXuZIQ/oqO49O6o7RnsBJ0REiYOVJOl2eh0A2kvVHwP2qd3LjNmto7q7d1R3rHYDPh0Rg39cV1L/9DoAAG8Afq92EzNo147qugCwvINoHnOVpKJ6GwAi4mnA62r3MaN27Khu108YjNVLIuIFtZuQNFt6GQDa+/6+6+nODh3V7SpYCN4REdvUbkLS7OhlAAD+DFhWu4kZ1tWjem4D3J1tgCNqNyFpdvQuAETEnYBX1e5jxm3dUd1OHi/Uan8SETvXbkLSbOhdAAD+EtiqdhMzbsuO6nYVLNTYlGZhrCRNLIAsUGebzPzVxM1EbApcDrgLWrd+k5l3KF00In6F4a1rNwLbZ+YvazciqY6I2BqY+HdA354vfgzdTP6XAmcC3wGu7KD+NO0LPHXCGhuXaGQtSoSKr9Kc9TBkmwH3p9m/ovRalsXAk4B/LVx3XiLiDsD9aL7GnWjeTEizLoEf08wn383M6yv3M5G+BYDlheudCByemT8sXLea9sS4SQPAoohYlJk3l+hpDUsK1PhEZlad3Epqt/N9N/DkgmWXUykARMRS4H00IcQzOTRm10fEJ4CXZ+Yg31j2Zg1Aex76IYXKXQO8BHjMLE3+rR8UqlP0GOX29k2Jd4E/KlCjNzLzwsw8BHge8OtCZR/ffr+nKiKeCXyXJoA4+WvsNqY5n+a7EfHo2s0sRG8CAPBgyp0l/7zMfG9mlljf0Dc/LVSn9L799yhUp1TA6ZXM/Cjw9ELlNqfZIXBqIuIpwL8Dnk0g3drOwJcjYv/ajcxXnwLAXoXqHJ2ZRxeq1TttqClx6b70tr1FAkBmXl6iTh9l5leBDxYqV+r1skERsR3NZX9Ja7cRcGREbFK7kfnoUwAosVjq1zSX/mddiYUnpY+aLREobixQo+/+Avh5gTrT3Cjr73GTJ2lD9qB5jH0w+hQASmwje0pmXlagTt9dW6DGTgVqrKnEOQCrCtTotXax0IkFSk1l2+X2RM7Si3OlWfW7tRuYjz4FgBLvaM4oUGMIri5Q4y4FaqxpaYEa1xSoMQQlfk6ndQVgd7rbOEqaNfeOiMHsY2MAGKaJN12i/BWAEk8VDPJRmgUYUgDYb0rjSLNgI2Dv2k3MVZ8CQIl3GSsL1BiCEgvlSi8CvE+BGr8oUGMISvyc+q5c0kT6FAA0d2cVqLE4Ig4uUIeIuD/NPvWT+l6BGiprLFfVpBJuAr5Vu4m5MgAM05cL1Xl+oTqHF6pzUqE6Kuc8xnNrRprUuZk5mLVMBoBhKjVRLo+IiTYEareGfW6Zdvh8oToqpN134jO1+5AG4rjaDcyHAWCAMvNGyjwJsBFwakRMcibE6ZQ5XGhViRMl1YlX0ByoJWndvge8uXYT82EAGK5SWwLfCThhIX8xIo6j3NMEJTbHUQfa3RlL3eaRZtFNNFvQD2ovEwPAcP1bwVoHRsRF7WK+DYqIe0bE+cChBXs4tmAtFZaZxwK/D1xRuxepZy4CHp+Zp9duZL4MAMP1DspunbsT8K2I+GR7hO3tRMTSiPgQcC5w94JjJ/D6gvXUgcz8JLAnzZqAmyq3I9V2PfARYM/MXNBV1NomuferijLzxog4FXh4wbIBHAYcFhE3AJcAF9KcdrUUWFJwrDWdlZlXdVRbBWXmxcChEXEH4H7APjThscRR0FLfJfBj4Ezgu5lZ4lyWagwAw3YE8D8d1V5C84u99I6Ba/OmKYyhgjLzOuC09kPSAHkLYMAy81SGvzr7ysz8j9pNSNLYGACG7w9qNzChF9duQJLGyAAwcJn5n8DJtftYoG+1C8skSVNmAJgNh9CsSB2Sm4AiZxFIkubPADADMvNq4NW1+5int2XmJbWbkKSxMgDMiMx8F3BU7T7m6D8z869qNyFJY2YAmCGZeRjw37X72ICzMvOxtZuQpLEzAMyYzHw4zU59ffRTYO/aTUiSDACz6v7AD2o3cRsXAffJzJtrNyJJMgDMpMy8PjN3p9mnug+Ozcy7tosVJUk9YACYYZn5fOBpwA2VWrgReH5mPrXS+JKkdTAAzLjMPAbYBThnykP/ALhXZvblKoQkaQ0GgBHIzIszcy/goXS/NuBC4HGZuXtm/qjjsSRJC2QAGJHMPLVdG/Bo4Ic0R1sWKU2zwv+pmblrZn61UF1JUkcMACOUmSdm5j2BzYCXAd8AVs2zzPXAt2h2INwyM3fJzGPLdipJ6sri2g2onsz8DfDu9oOI2IPmOf17AHcDdgK2BX4J/Ay4gOYWwjmZ+Z0KLUuSCjEAaLXM/B7wvdp9SJK65y0ASZJGyAAgSdIIGQAkSRohA4AkSSNkAJAkaYQMAJIkjZABQJKkETIASJI0QgYASZJGyAAgSdIIGQAkSRohA4AkSSNkAJAkaYQMAJIkjZABQJKkEVpcuwH1T0RsAiwDdgTuDPwCWAGsyMzf1OxN/RERdwAeAOwMROV2pGlI4Hzg7My8oXYzkzIAjFhELAEeATwRuCfNhL8jcKf1/J0rgJU0geB84AvASZm5qut+VV9ELAZeCTwd2BN/h2icVkXEWcBHgA9kZtZuaCGCJtFMapvM/NVEjURcAOwyYR8PyMzvTFhjpkXEVsDBwCHAE4CtCpS9GvgK8BngC5l5RYGaMysidgV+MmGZX2fm1pN3M3cRsRdwJLD3NMeVeu5E4PmZeeG0BoyIrYFfTlrHNQAjEREHRsRXgMuAfwcOo8zkD7AF8FTg48ClEXFyRDyuUG31QETsD5yBk790WwcBZ0XEpG9gp84AMOMiYo+I+BzwNeCxwJKOh9yI5rbClyPihIhwwhi4dk3IkcDGtXuRemor4MMRMai1MAaAGRURyyLig8DZwJMqtXEQ8M2I+ER72VvD9DfAHrWbkHruIOBFtZuYDwPAjInGXwE/BF5A8468akvAs4DvR8Rb20VkGpY/qt2ANBCDeq0YAGZIRGwBHAf8X2Czyu3c1ibAa4AvRcQ2tZvR3ETEXYHta/chDcT92qerBsEAMCPaS+ynAsvrdrJBjwa+ERH3qt2I5mS/2g1IA7IJsFftJubKADADIuJhwOnAfWv3Mkf3AE6LiMfXbkQbtG3tBqSBGcxrxgAwcBHxHJrnUO9cu5d52gr4fES8tHYjWq8zazcgDcy3ajcwVwaAAWuftf8w3T/a15WNgH+KiKfXbkTrdA7gLo/S3PwkM39Ru4m5MgAMVETsDnyK+qv8JxXARyNin9qN6Pba/c5Pqd2HNBAn1W5gPgwAA9RuA/lZYKpbwXboDsBnImJZ7Ua0Vi/DqwDShlwOvLZ2E/NhABiYiNgI+DTN4T2zZEeaEHCH2o3o1jLzezSbAUlat5dm5qW1m5gPA8DwvBN4TO0mOrIvzZoG9c87gXcBN9duROqZ64EjMvOo2o3MlwFgQNrT2P60dh8de2ZEHFS7Cd1aZt6UmS8HDqQ5BloSfBPYJzPfVruRhXBb1mF5O9MLbVcDF9Pc19oWWAbccUpjvy0i9h/qGduzLDNPiYj7AA+g2SRof2BnmsWc0qxLmgB8RvtxdmbeVLelhTMADEREPArocuOcn9IsLPwc8L+ZedVaetiC5pf+IcCTgbt31Mu+wNNo1jqoZzLzeuAb7YekgfIWwAC0R0y+o6Py5wAHZ+YumfknmfnVtU3+AJl5dWaenJkvz8zdgEfRXALrwpuHtKe2JA2NAWAYngGUfk7+CpqTq+6fmV9aSIHMPJnmEvDvAz8v2BvAbsALC9eUJLUMAD3Xvvt/U+Gy5wIPzMwjM3OiVd3Z+CTNrYFvF+nut17nVQBJ6oYBoP/2pey99q8CD8rMoiu5M/NnwAHAsQXL7gA8omA9SVLLANB/hxasdSbwu5l5ZcGaq2XmtcBhwH8VLFvy65cktQwA/VdqAlwJLG8n6c60e8c/BfhxoZLL29sgkqSCDAA9FhH3APYoVO5ZmbmiUK31ak/D+j2aZ2YntSPNbRBJUkEGgH4r9e7/85n5tUK15iQzvw38W6Fy3gaQpMIMAP22vECNm4EjCtRZiNfR7JM9qRLfB0nSGgwA/bZ3gRpfzszvFqgzb5l5AXBMgVL3iYhNCtSRJLUMAD0VEVsDJY7GPb5AjT6Mv0OhOpIkDAB9trRAjZtp9vev6UvAqgJ1lhWoIUlqGQD6q8SEd05mXlKgzoJl5tXAaQVKGQAkqSADQH+VuAJwUYEaJZToo8T3Q5LUMgD0V4l3vCsL1CihRB9eAZCkggwA/VXiHe/FBWqUUKIPrwBIUkEGgP66rkCNEk8RlFCijxLfD0lSywDQX7N02XyWbmdI0kwwAPTXLF02n6XbGZI0EwwA/VXiHe+9CtQo4d4FangFQJIKMgD0V4l3vDtGRNWT9CJiN8qcaGgAkKSCDAD9VeqSd+2T9EqN7y0ASSrIANBTmbkKuKxAqadHxEYF6izUMwvUKPW9kCS1DAD9dkKBGvcAnlOgzrxFxFMoc6LhSZmZBepIkloGgH4rdZLeGyJi00K15qS96vDmQuVqn2goSTPHANBvpU7S2wl4XYE68/EKyjyF0IcTDSVp5hgAeiwzrwJOLFTuiIh4WqFa6xURjwfeWqjcaZn580K1JEktA0D/lbr8HcBHI2KfQvXWPkjEvYBPAaUWHnr5X5I6YADov8/SXAYvYTPgpIh4YqF6txIRjwD+G9iqYFkDgCR1wADQc5l5CXBswZJbAp+NiNcUrElEvAT4T2C7gmVPyMwfFqwnSWoZAIbhtcANBestAt4aEadFxMMmKRQR+0XE14B/BhaXaK6VQNGQIkn6LQPAALTvgj/YQekHAv8VEZ+JiMdHxMZz+UsRsTgiDoqITwHfAA7soLdPZ+aZHdSVJNEsDCuxwco2mfmriRqJuADYZcI+HpCZ35mwRi9FxPbAj4AtOhzmSuCLwKk0W++uBC4HtqU50ncZsD/wJGCbDvu4AdgjM8/vcIxqImJX4CcTlvl1Zm49eTeTafeXuAvN7xJp1iWwIjNvrNlERGwN/HLSOiUv2apDmXlpRPwt8DcdDrMlcFj7UdMHZ3XynwUR8QTgaTS7PN4Hf49oXFZFxNnAmcDHMvO02g0tlFcABiQiNgfOB3ao3UuHrgZ2axc/zqShXgGIiK2AfwCeN81xpR67Gfhb4K/b81umotQVANcADEhmXgP8PlD18lOHEnjeLE/+QxUROwHn4OQvrWkR8Crg9Ii4Y+1m5ssAMDCZeTLwp7X76MgbMvOY2k1orT4M7Fy7Camn9gL+rnYT82UAGKDMfC/w/tp9FHYM8MbaTej2IuJFwGNr9yH13Asj4nG1m5gPA8Bw/Qnw9dpNFPJt4Dke+dtb7scgzc2razcwHwaAgcrMG4DfAy6o3Mqkfg4ckpnX1m5EtxcR2wF3q92HNBD7RMRgHok1AAxYZl4OPIzmcZQh+h5wQGb+rHYjWqd9azcgDciWwO61m5grA8DAtZPnw2hO4BuSzwMPyswf1W5E6/U7tRuQBmYwrxkDwAzIzOsy85nAX1JmX4euvQ1YnplX1W5EG3RO7QakgRnMa8YAMEMy8y3AoUBfJ9bfAM/KzCMy+Hp6NwAADP9JREFUs9QRx+rWtyh3HLU06y7JzItqNzFXBoAZk5mfBe4HHEW/rgZ8hmanxn+v3Yjmrt186qzafUgDcWrtBubDADCDMvMnmXkYzWl/X6vczmnAwzLz0Mz8fuVetDCvpF9hUuqjVcBf1W5iPgwAMywzz8jMR9Kc3vf/pjz8D4GnZeaDM/OUKY+tgjLzROADtfuQeu71mfm92k3MhwFgBDLzCzS3BZ4KfIICh0isw1U0tx4OA+7jtr4z5ZXAybWbkHrqKJpDgQbFYzxHIjNvAo4Fjo2IxcCBNAsGlzPZHu8XA58FjgdOyszrJ+1V/ZOZV0XEQcDhwDuAzSu3JPXBZcBLMvPo2o0shMcBi4i4P3APYBmw9DZ/bgdcAaykmexXrvHPPwLOdAvf+RnqccC3iIidgYOB/YD9aQLkYHY/kyaQNEeyn9F+fK7dkG2qSh0H7BUA0YYmg5PmpH3M6f3M3oFU0qi4BkCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBFaXLsBScMSETsDBwP7AfsDOwNRtSlpOhI4Hzij/fhcZl5et6WFMwBImpOICOBw4B3A5pXbkWrZt/04HLgsIl6SmUdX7mlBvAUgaYMi4o7AicB7cPKXbnFn4NMR8amI2Kh2M/NlAJA0F+8EHlm7CamnngH8Re0m5ssAIGm9IuIg4EW1+5B67g0RsUftJubDACBpQ96Ji/ykDdkEeFPtJubDACBpnSJic+B+tfuQBuIhtRuYDwOApPXZG39PSHN1l/Yx2UHo0wv7pgI1fKxRQ1Di57TE62Uu7julcaRZMZjXTJ8CwGUFauxZoIbUtRI/pyVeL3Px4ymNI82Kwbxm+hQAVhSosV+BGlLXSvyclni9zMU3pzSONAuuBM6r3cRc9SkArCxQwwCgISjxc1ri9bJB7TanP5nGWNIMODMzs3YTc9WnAFDkCkBEPLZAHakTEfEg4KACpaZ1BQDgbVMcSxqyt9duYD76FAB+VqjOByNiy0K1pGIiYlPgSMq87kq9XjYoMz8AfHVa40kD9cHM/ErtJuajTwHg64Xq3BV4b0QsKVRPmlhELAL+HrhXoZJfK1Rnrp4PXDTlMaWhOBv489pNzFdvAkBmXgScWajcs4DTIsKnAlRdROwG/DfN6WEl/Cgzv1uo1pxk5s9oHm86cprjSj13M83pmPtn5lW1m5mvvj03fzywT6FaewPfjIj3AKfQLM74aaHa0npFxDKan+WHAC8DNitY/viCteYsM38N/FFEHA08jeY1dh/693tE6tIqmnf8ZwIfy8zTKvezYAGUWLG4TWb+auJmmnfs5xToZ12uAAaX0jQ4m9EcE9qVh2XmKR3Wn7N2XcNd8KwAjUMCKzLzxppNRMTWwC8nrkOPAgBARJxLufuk0qxZAdw1M2+u3YikOkoFgN6sAVjD62s3IPXYG538JZXQxysAAZwO7FuinjRDzgP2rH35UVJdM3sFoN1F6dW1+5B66LVO/pJK6V0AAMjMk4Av1+5D6pHTMvPY2k1Imh29DACtFzCl/c6lnrsC+MPaTUiaLb0NAJm5AlgOXFe7F6miG4GnZ+b5tRuRNFsWUWYRYCfPAGfmN4HnUqZHaYj+LDNPrN2EpF4pMefmIuDyAoU62/QkMz8NvK6r+lKPvTsz31O7CUm9U2LOvXwRZY4VXVagxjpl5ptpDiO5vstxpJ64GXhlZr6sdiOSeqnEnLtiEWUW2u1YoMZ6ZeZHaM5Rv6zrsaSKfg08KTP/tnYjknqrxJy7slQA6PQKwC3a/c/3A749jfGkKfs+8MDM/FLtRiT1Wok5t1gA6PwKwC0y80KaEPBC4OJpjSt16HKaEwP3yszzajcjqfd6dQXg4QVqzFlm3pSZHwJ2o1kg6Al/GqLrgLcAd8/Md2fmDbUbkjQIJebclQE8GfhsgWK7tu/Opy4itqM5n/xQ4BHAxjX6kObgJuC/geOAT2fmzyv3I2lAImIX4IICpQ5ZTLnd9pYD/1So1rxk5uXA+4D3RcSWwMHAE4G7A0uBHYBNa/SmUbse+DnNraoLgS8Cn8/MX1TtStKQLS9UZ2UAW9Hcg1w8YbGTM/NRk/fUjfb0pKXAJrV70cy7HrjEiV5SaRFxEvDICcvcCGwXmUlEnAhMOnnfCOyYmZdOWEeSJN1GRGxPs3fPpG/YT8rMg245C+AzExaDpqHXFqgjSZJu77VMPvlDO+ffcgWg1KKC64F7ZeZPCtSSJElARNyNZq+QEovcd83MCxfB6mfrzypQdGPgTQXqSJKk33oTZSb/s255Ym/N44BL3AYAeGZEPKBQLUmSRq2dU59ZqNzqub6LABDAxyPijoXqSZI0Su1c+nHKHAEMawsAmfkt4KJCA+wJfCIiFm3wMyVJ0u20c+gnaObUEi5q53rg1lcAAD5WaBCAQ4A3F6wnSdKYvJlmLi3lVnN8ZOZv/0ezi975wJ0LDviczPx4wXqSJM20iHg2Zd+UXwbslplX3vIvbnUFoP0Pbyw4IMBHI+IvC9eUJGkmtXPmRwuXfeOakz/c5gpAO/AS4Hs0J+2VdBTwvMy8rnBdSZIGLyLuABwJPKNw6fOBPW574ujtFum1n3BE4cGh+YJOiYi7dlBbkqTBaufGUyg/+QMcsbbjxm93BWCNZv4XeFAHjVwL/B3wzsy8qoP6kiQNQvuY3yuBPwc262CI0zLzwWsdez0B4ACac8u7cinwBuADmXljh+NIktQrEbEYeBHwemD7Dod6WGaestYe1hUAACLik8BhXXXV+hHwb8BxmfmdjseSJKmaiLg/8LvAs4C7dzzcpzJznTsIbigAbA6cCuzVQWNrcyFwPPDF9p8vvu2qRUmShqB9tH4psAtwMHBo+8/TcDbwkMy8Zl2fsN4AABARuwJnANuV7GwergUuBi4BbreIQZKkHlkC3IVm4u/inv5cXA7sl5kXrO+TNhgAACLi4cAJNF+YJEnqpxuAR2fmf23oE+e0V39b6KWTdiVJkjr10rlM/jDHAACQmR8A3rPgliRJUpfe087VczKnWwCrP7l5bOFLwKMX0JgkSerGCcAT5vNY/byO620LPwn413k2JkmSuvGvwJPmu6fOvAIAQGauysxnA68Cbp7v35ckSUXcDLwqM5+dmavm+5fndQvgdn854mDgk8CWCy4iSZLm60rgmZn5xYUWmCgAAETEvYHPUv70QEmSdHvnA4dk5rmTFJn3LYDbahvYn2YBgiRJ6s4JwP6TTv5QIAAAZOYvgccDLwBWlqgpSZJWW0kzxz6+nXMnNvEtgNsVjNgM+DPg1bg2QJKkSVwJvB14V2ZeW7Jw8QCwunDEdsBfAy/GLYQlSZqPG4B/Ad6YmZd3MUBnAWD1ABF3B94CPA2ITgeTJGnYEjgaeG1m/qjLgToPAKsHitgRWE5zHOIj8KqAJEnQvNv/GnA88JnMXDGNQacWAG41aMRW/PZs5CcAd5x6E5Ik1XMVzdb6xwNfzMxfT7uBKgHgVg1EbAw8CngIsKz92LH9805420CSNEwJ/IJmBf+K9s+VwKnASZl5fcXe6geA9WnDwVKaMLAU2LhuR5Ikrdf1wMU0E/3FtSf59el1AJAkSd0oshGQJEkaFgOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI2QAUCSpBEyAEiSNEIGAEmSRsgAIEnSCBkAJEkaIQOAJEkjZACQJGmEDACSJI3Q/wcm2bWW0O3Y/QAAAABJRU5ErkJggg==",
-    # Dishwasher
-    "dishwasher": "iVBORw0KGgoAAAANSUhEUgAAAbQAAAIACAYAAADqh5m4AAAC9HpUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHja7ZZtjtwgDIb/c4oeIbYxNsfhU+oNevy+kGS6M91Krdo/lSYomHXANn4Ms2F8+zrDFzzkMYWo5imndOCJOWYuGPhxPmX3dMTd76fGa0TP+oCX94ihEkg5P3g6Jd36a8EtqWCkHwx5uz7U5w85npL9xdDlSFZEK4R+GcqXIeHzA10GyrmtI2W3p62NU17rzzT42hq6emv1mvzydzRkryv8CPMQkgM9C58ByHpjkIKBo2dxTCSJGAvk1l+RICGf5en4EFV4pdLLY/KT/jF6gSLp1AconpOZHvJTPennyQ87xR88S3t4ftJPuTP2nOT1ztk9zDnO3ZWYkNJ0bereyh5hYkXKZS9LaIZXMbbdMpoHVG8D8n60o6I1ysTAMilSp0KTxpaNGkKMPNggmRvL1rkYZ25yhM0JjSabZOkgyNKAV6DlRyy0/ebtrpHDcSfMZIIxWqUQVvcv2i8NzblKnujwM08oC8TFqwgRxiK3eswCEJp3HelO8N1en8VVQFB3mh0bLEc9TVSlq7ZWHckGvfAq5HnWyPplACmCb0UwJCBwJBKlRIcxGxHy6OBTYMhxULgCAalyR5QcRRLg4MTAN9YY7bmsfKpxZwGEShIDmiwFrCIuNtSPRUcNFRWNqprU1DVrSZJi0pSSpXX5FROLppbMzC1bcfHo6snNPXj2kjkLLkfNKVv2nHMpcFpguWB1wYRSKlepsWpN1arXXEtD+bTYtKVmzUPLrXTu0nFP9NSte8+9DBoopRGHjjRs+MijTJTalBmnzjRt+syzPKhR2MeOfmq/T41uarxJrYn2oIalZrcJWteJLmYgxpFA3BYBFDQvZodTjBwWusXsyIxToYwodcHptIiBYBzEOunB7ge5J24hxr/ixje5sND9C3JhofsFuZ+5fUJtX83tkLAJrWO4knoIjh8mDC/sZf2o/bYMf7rgbeht6G3obeht6G3ovzE08cuZ8R/qd8wWZcpz49YrAAABhWlDQ1BJQ0MgcHJvZmlsZQAAeJx9kT1Iw0AcxV9bpUUrgnYQKZKhOlkQFXGUKhbBQmkrtOpgcukXNGlIUlwcBdeCgx+LVQcXZ10dXAVB8APE2cFJ0UVK/F9SaBHjwXE/3t173L0DvI0KU4yuCUBRTT0VjwnZ3Krgf0UAYfRiBAMiM7REejED1/F1Dw9f76I8y/3cn6NPzhsM8AjEc0zTTeIN4plNU+O8TxxiJVEmPice1+mCxI9clxx+41y02cszQ3omNU8cIhaKHSx1MCvpCvE0cURWVMr3Zh2WOW9xVio11ronf2Ewr66kuU4zjDiWkEASAiTUUEYFJqK0qqQYSNF+zMU/bPuT5JLIVQYjxwKqUCDafvA/+N2tUZiadJKCMaD7xbI+RgH/LtCsW9b3sWU1TwDfM3Cltv3VBjD7SXq9rUWOgP5t4OK6rUl7wOUOMPSkibpoSz6a3kIBeD+jb8oBg7dAz5rTW2sfpw9AhrpavgEODoGxImWvu7w70Nnbv2da/f0Agf9yrfl3xqUAAA+caVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8P3hwYWNrZXQgYmVnaW49Iu+7vyIgaWQ9Ilc1TTBNcENlaGlIenJlU3pOVGN6a2M5ZCI/Pgo8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA0LjQuMC1FeGl2MiI+CiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiCiAgICB4bWxuczppcHRjRXh0PSJodHRwOi8vaXB0Yy5vcmcvc3RkL0lwdGM0eG1wRXh0LzIwMDgtMDItMjkvIgogICAgeG1sbnM6eG1wTU09Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9tbS8iCiAgICB4bWxuczpzdEV2dD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlRXZlbnQjIgogICAgeG1sbnM6cGx1cz0iaHR0cDovL25zLnVzZXBsdXMub3JnL2xkZi94bXAvMS4wLyIKICAgIHhtbG5zOkdJTVA9Imh0dHA6Ly93d3cuZ2ltcC5vcmcveG1wLyIKICAgIHhtbG5zOmRjPSJodHRwOi8vcHVybC5vcmcvZGMvZWxlbWVudHMvMS4xLyIKICAgIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vdGlmZi8xLjAvIgogICAgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIgogICB4bXBNTTpEb2N1bWVudElEPSJnaW1wOmRvY2lkOmdpbXA6M2VmNDRjZjgtNDVlMy00OGRkLWJkMzMtMThkMmFiZDkwYzYwIgogICB4bXBNTTpJbnN0YW5jZUlEPSJ4bXAuaWlkOmE1NzE1MTdkLTVmY2UtNDI3ZC1iNDg5LTEzMmUxOTQ4MWIwOSIKICAgeG1wTU06T3JpZ2luYWxEb2N1bWVudElEPSJ4bXAuZGlkOjRmYThkN2MwLTMyMGEtNDE1Ny1hMTE1LTMwOTBhMWEyODQyNiIKICAgR0lNUDpBUEk9IjIuMCIKICAgR0lNUDpQbGF0Zm9ybT0iV2luZG93cyIKICAgR0lNUDpUaW1lU3RhbXA9IjE3MjQ4NDQ2NjkwMjUxMDEiCiAgIEdJTVA6VmVyc2lvbj0iMi4xMC4yMiIKICAgZGM6Rm9ybWF0PSJpbWFnZS9wbmciCiAgIHRpZmY6T3JpZW50YXRpb249IjEiCiAgIHhtcDpDcmVhdG9yVG9vbD0iR0lNUCAyLjEwIj4KICAgPGlwdGNFeHQ6TG9jYXRpb25DcmVhdGVkPgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6TG9jYXRpb25DcmVhdGVkPgogICA8aXB0Y0V4dDpMb2NhdGlvblNob3duPgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6TG9jYXRpb25TaG93bj4KICAgPGlwdGNFeHQ6QXJ0d29ya09yT2JqZWN0PgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6QXJ0d29ya09yT2JqZWN0PgogICA8aXB0Y0V4dDpSZWdpc3RyeUlkPgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6UmVnaXN0cnlJZD4KICAgPHhtcE1NOkhpc3Rvcnk+CiAgICA8cmRmOlNlcT4KICAgICA8cmRmOmxpCiAgICAgIHN0RXZ0OmFjdGlvbj0ic2F2ZWQiCiAgICAgIHN0RXZ0OmNoYW5nZWQ9Ii8iCiAgICAgIHN0RXZ0Omluc3RhbmNlSUQ9InhtcC5paWQ6NzZjM2Y2ZTEtYmY3NS00OWQ1LWE3NjUtYzBiZjIyNTI3MTM5IgogICAgICBzdEV2dDpzb2Z0d2FyZUFnZW50PSJHaW1wIDIuMTAgKFdpbmRvd3MpIgogICAgICBzdEV2dDp3aGVuPSIyMDI0LTA4LTI4VDE0OjMxOjA5Ii8+CiAgICA8L3JkZjpTZXE+CiAgIDwveG1wTU06SGlzdG9yeT4KICAgPHBsdXM6SW1hZ2VTdXBwbGllcj4KICAgIDxyZGY6U2VxLz4KICAgPC9wbHVzOkltYWdlU3VwcGxpZXI+CiAgIDxwbHVzOkltYWdlQ3JlYXRvcj4KICAgIDxyZGY6U2VxLz4KICAgPC9wbHVzOkltYWdlQ3JlYXRvcj4KICAgPHBsdXM6Q29weXJpZ2h0T3duZXI+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpDb3B5cmlnaHRPd25lcj4KICAgPHBsdXM6TGljZW5zb3I+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpMaWNlbnNvcj4KICA8L3JkZjpEZXNjcmlwdGlvbj4KIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAKPD94cGFja2V0IGVuZD0idyI/Pg/HrtIAAAAGYktHRABcAFcAb7Be3UkAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAHdElNRQfoCBwLHwjTqPnkAAAgAElEQVR42u29d7TlWVXv+zmx6lSOXaFz7oZumoYmNTRRgUYMqChgABTUd72g1/cc7/qePh3XNJ5eveoVM4oEQSUjSclNhu4Gmo50DlXVsXKdOvn9Mee+dajXoWr9dlh7n89njD2qOpx9fmv91prfNeeaa64hjjAMTADPAl4GXAacCqxERESk9xwC7gCuAN4LfB6YBOYBhhaJ2RbgDcAPACemuI3lfxMREek188BMitgO4IPAnwM7gfmRFLWNwG8ArwROTzEbXSR4IiIivWYotWl56tZZwAnAV4DJkfwPr87PyYqYiIj0ibitJqKLh4Crh4FtwI8BJ9k/IiLSZ2wHXg6cPAw8FTgj3TgREZF+YhQ4DXj6MHARsMw+ERGRPmUZcNEwsBkYsT9ERKRPGQE2DxOp+SaCiIhIvzIEjHvGTEREBgIFTUREFDQREREFTUREREETERH5bpoepp7Oz4JdKSIiDRgCxvPTdUGbAv4OeDfwIKb+i4hIGQtEseEfBV5HYbGP0YYPsAv4NvCA70NERBqwibiPszji13QPbQj34UREpDnDNIz0KUYiIjIwiigiIqKgiYiIKGgiIiIKmoiIiIImIiIKmoiIiIImIiKioImIiChoIiKioImIiChoIiIiCpqIiIiCJiIiCpqIiIiCJiIioqCJiIgoaCIioqCJiIj0M6NLvP1DwHJgGTCWnxbz+ZkBDudnwSEjckwL5da8GgdGjppXczmvJoEpu+u4+nPsKLttfy5hQRsDVuZnBbAOOBHYCmwEVi+afFMpYruBHfnZDRwCDuafTkaREK1VOa8mgE3A9pxXG/LfD+eCcCoN74PAPcBOYN+iOXUwjfNSZtlRdmpj2qkt2Z+rcjG+sGix3erPHdmfi+3UkunPpSBoIzkoVgJnAE8GngI8ATgpVz5DOeGGFv3cwqI/W57aTuBbwJX5uRE4kANnVrsmS2wxvDIXgWfnnLoEuCCFbFnOp6FHmFfziwTuDuCbwFXA14Hbc15NLqF5NZpCtQo4N/vyKcDjsz/HFtmoR+vPw4v688rs09sWiducgta/bVuRovVC4PIcHGsWue0jRw2Ox2I1cDrwkhwg3wE+BnwcuDUn4SyGJmUwGVpkeE8HXgp8D3BOzrXxRfPqWFmZc/I84IeB/blo/AjwmRS3wwMqbIv788zsz+/Nv688yk4dKyuAtcD5wI8Ce4Brsj8/Bdw9yAuFQRS04Xyp5wKvBF4EbMtBM36cAvZw3t5IenWr0v2/AHg18EngXbky2p8rJpFBmlergYuBVwHPI0JhK3NeNbVDo0S4cnV+79OAu3LB+G7guhS2+QHqzzXZnz8JPGdRf442sFNDi/qTtFObgacCrwc+DPxrLsYnB81ODZqgjQGnpcB8f3pn6+hMNudQTuTx/B1bgOent/YW4FpgWjsoA+JFXAz8VHoQ21J4hjr0+5bnZy1wckZYPpzz6k76f09oOXAh8FrgBURIsRv9uT5t4kuA9wFvz/4cGG9tkARtA/DiHCQXAid0aIA80qBZm59NxD7dO3PQ7NAmSh+zlQhd/TjwuDSK3WIk5/U6IsnkacBbgQ8Be/u0P08iQquvJKJI3e7PjdmnW4BnAH8P/AcRmlTQKuHc9Mp+iNig7mW7NuZA2U7sC7yF2JwV6TeeDvw0sf98Mse3l9NOhtMAPy+9w/OBNxPJDv2yXz2U/fma9DhP7eKC++GeZVsuvk/KhcrbgVsUtN4ykoPk9emdbankuYaJTfNXEem2byZCkWZCSr/YhZdktOO56SHV8lwXcCSN/U3A1X0wr5alffpZ4NlEJKcGxrI/1+eC5W+Br9LHSW39LGhjuWL7RWLvalWFz7ghDcMGIkb+QSJ1VqRm4/ujwM8RiQTLK3zGbcDLc86/Cfgi9Z4JnQBeBvwCETIdr/AZTwR+LBcufwl8jj7dp+xXQRslNlN/KcVsvHID8awc2MPAe/BAttTJcuBHgF8GLuK7K+fUxgrgB3J+DQNXUF8S1gpiv+wNxL76SMX9uZo4NrA8+/OT9GEGZD8K2lAKxBtT1Mb64JlHckC/kTi/9lHMgJT6Fl4vBv5Lilk/2IYxIgIyl/Ppi9RzcHgZ8H25OLiY/qibu4w4VzhHpPR/gT4LP/ajoD2BCDM+t0/EbLGoXQz8CpFR9HkG/NS+9A3jRHjxV4gM4X6yC8NE0sohorDB1ZXM9WcSEaQn0F9F4FuiNklkkl5Dnw2GfvLMtgP/W3pmE31qOJ6cq7Yz8LYDqcP4nkmExS6h7vD9o82rlxJJLCdW0J9np6d7cZ8tulusSFF7Pd09/rSkBG0FkTV4Od09u9FuVgKX5eTb0E+DRQaSzcAriNDdRB+3o7UH9Iq0Fb1adG8kEmqe2cPnaAcbsz9f3k/jYrSPnvNJwE8Q6aXtZo5I1JjlSBhwKFdXrfp07RSeDUS5m68RpX0mtavSAyaIzLuf7ZDRmiH2tmY5kmAwfNS8aienE0kt1wCfoPtJDRNECatWxmA3+3MZ7U86OS0X3lelrar+2FE/CNpQDo5fBM5qo7C07g86BNxL1DbbRcSNF4hsnxOJcMz2XAEup3k9yFabTgD+E1GI9VYsaCzd52yOhJXaFa1pXbt0kCiEewtwH1HfdCi9llNTfLblP0+0cdF4US4WrwQe6uK8GiYOKb8hvd52tGUhBexw9t8O4ObszwP5O1bmIv9MoqrLyrRT7Qh1DuUY+Tngpi7358AK2nLiZP0zaM9Zs9kUsWuJ+nCfS0GZSu9sftHLHMmBcUr+/suJKx1Wt2HAtPbTfpCoJvKQ9lW6yHoi9P3cNhm/mTSyXyWyeL9I3M/VmlcLi+bVaHoUZxIZyy8lqn+saoNNWkEUW/jhnFfdOk+1LufyhbRnH3KGuNfs62mnvpQLhJlH6M9x4taDyzhys8iKNvTnmhwjLyDO0R6ufWC/hci6WzjOzyTwG7m666R3th34d47cGF36mc/VzueBn8+Xv/4YB98ocbr/DKKmXeuA9HzDZ5rJleQF2lfpMs8gzm7Nt2FeHUoRe3nOkbXHaEjHifB7ywv4PEcqwDd5pmniupStdGePeig9w29y5Pqopv35wezP0wr68zziIHfrbF7T/pwk6md2uhLTCakpkwXPuBd4Z+0e2kSu4C7MFV0T1/0h4G3EFS83cHzFTWfz/99LhCevB76S4ZqTG4RrRnMyPz/DCXpp0g3WZKThyQ0N/jwRpn8T8G8ZDjueSjjTOeYfyjDaN4hw4ctTjEoZS6N+OfAOOn/mc0N6MGfSbB9rPr2wv0yv7JbC/txNXEb8TSJJ5lVEkkfpu15G5DBcSuV7/qN9MPF+hGYbrAvEvUp/QdwDdAfNzn8dBL6dE/Ae4FeJ4silA3lFtvFTCpp0iXNofvRllth3/qP0znbSbH9lb0Yr7s3vel16e6VsI0pOvT8jIZ3c+9mev6tJmbC5XCj/cfbnvQ2eueWxfC2/Zwfwn4mcgBJRG8po1o8Soc9qBa3mtP1RYuP4GZTHpBfyhf4pce3ErbTnMHNrZfo+4PeAGynPABrOcMV5Db1QkWM1To/L1XaT8X8r8PvAe9NgtkMw5nLB+Q+5AL21wXctJ/blOn1QfCL7s8kB6rn0blv9uatN/TmbffhW4E8avqdlxFGEU2p2hGoWtDVEuHFj4XMuEJlBf0OEGXd24Bn3ErHlP0+PbaHQwKzKwbIVkc6yPRdQmxp8x90pOB8gwlvtZhdxn+BbaXZP1wbiQtJOLhS3pp1aWej9zKdt+lMibNuJe952Zn/+PZG4U2KnhnPMXEokxSlox8k6mmVgzRBXtvxTh8Ssxf5cVb0n/166an5mhklEOsnZwBMb/PweIiT2rgbj/VjYAfxLimbpebJVxHUtnTzgvDWN/HAD+/Ee4N0d7s9daQs/Rnnm5xh1XSfUN4I2RJzleAJle1NzxNXif58hjE7GzxeABzJMcj1locdhYh9uO1YOkc5yOhGKKx3r16TndB+dP5N0c3oWNxeK2ni29yQ6EyYbIZLCzimctzPE8aF/TE+3k/05D9xO3M14d2F/juZiaIOCdnysIDaENxU+4yRRKeBrdOfcxBxwXYYMHiz8jjXEwfF+LusldbOMONRcGgm4H/gs3bsEcoYoPPBeyveoV6QR7sS9bq0jB6XnYx9Mm3Ed3anCcZhIvPkEZfcyDhOp9adTaTmsWgVtTa4iS/fOHkw3/kAXn3mWyKi6s8Hq95z0TEU6wbb0Vkq5gQg3drME0n35O+9v4KU1PfbzSGzKRehC4Xy/MwWtm/25n8j2Ls2oHiGSYNYoaMfOKuJMR8nzTRPpxFfT3Ys05/L3fpuyWPhQGptq49MyEIJW6p3NpqBd2eVnbm0ffKXQ8I8R0Z5OVL3fkB5vSbhxf3qfN9Hda6SmiPNpNxfax6Fs80oF7diZoHw/6UAO/l7cCj2Xv/v+BgZnDSKdYSPl+x87iD3iXsyrvUQVkZID0qPEPlcnBG015ZnJDxBlrXpxJ+IkcZ6sJILVqllZ5U0CtQraMqLMSomgHcoVyEwPnns+J31p6u0JtKdepcjDsa5BBGBHRiB6Qav2aomHNpKi04l73lZSfvxhNxHNme9Bf87m7y45ID2UC+/lNQ7wWgVtjKhfViJoUxmi6MXKZ4HIJNrfYIJ4uFo6xUrKQ0W7iSIFvWCKyFYuDZGNp0fR7gzi5ZSfyTpEZBv2onp968D14cL+bEdx9iUlaKMNJt5MTrxerHwWcuKX1o6boD9vuJX+YHmDlfV+yjN42yVq+wvndevamnbfFzbeoD8nia2JXgjaPJEU0iRzdKTGAV6roA1Tfj9Sq9p2r+7tmaQ83DmqoEkHGaFZeaaZHj77PLHnUypoEx2wd00LEU/3qC8XGvblcgXt+Du81MNq3WM21IdGgx55lrI0mG+w0BvqsREbotkloHMdWOQ2mavDPezPVl82sc1VXvRZq6DNceT+sxJBWdcjQRsi9v5KN6Bn6INrzqVvmWngFaygtzX8WncSlp5NnerAYrF12WYJTfIE2mGn1jcQtcP0JkehbwWtdVtriaCNE2m6Iz0aKNspT2ndT2/SomVpcJCyChHkInFLj557lCg4UJrYMZv2pN1GuLWvV8JKyq9zacoIkXpfsvBeyL6cqXGA1ypo08Q5jRJBmyCuYhntUX9eQHn5qocaGByRx2JffkrYQhyo7QUribquJQZ4njhG04k7vA5RftvAGqJsVi8EbYwoB1aSeNeqXTtd4wCvVdAOEZdnlgjaauDpdObcybF4aE+jvHzVvXS24rYsbVq3Q5dwIlHyqBcLxdXEbRQlCVOzaUs64VHsJ6rYl7CJuDW8FzZ4nLhnsuTM6wJxJrHKSz5rFbSDxHmukpj3RK4+un0R3RBxMPoJRGy8ZKDcRWfulxJpLZjuK/zZVSlop/dgkbgFeGqhoM0QZ646IWh7KD9Lth54ci5+u+mljaan/TjKjhy0qvYfVNCOb+VzA+UXZm4CXkJ3y7OMEZcJnlrYr0M58R5EpDPsSG+llLNzjHfTbqxL7+xUyvbFp4nqPZ0IkT0A3FIoSCO5OHh+lxfeK4GXEmXQSo9F3USlkaSaBe3GXAWUhh1fDpxGd5JDholyMK+gfOO8VVT5Ae2udIi9RMWNUmN0OvBiIumqG17FEHFP4Kso30JoFePtxDVSD+acLRXLLcCP5Z/dsMWjRNH3l1MebjygoJW5tfdSXol6lLiK5eVEGLDTrAZ+iPJ7l1rhxjuodLNVBoY7cl6VMAJcBPw43am2vg14EfCkwoXpPFGN44YOzavDRPhtB+UJbE8Bvr9L/bkl392ZhV7hXDoau6j0vOxwxROvVWG7NPa9AvgZ4DI6e36mNSh/jvJCpfNElf6d2lvpMDcT15aUckp6TJfS2QK1q4AXAj9LeUjuYM6r0iNAx8Iu4MsNDPxm4BeBizvcn2uJ8OZPUX4550za5D21Du6aBW0PcTvuoQZtOwH4r8Cz6MwNq+PA44HfzFXPSIOBcoWCJl3gNuAbNDvveF7Oq05dnLmM2Kt7A83Oau0BPklnz3buBL5AeUGEkbQdv04kanQiO3tFLux/LW1iqd0/BHyG8ttElrSgHSaujPh2g3DBaArO/wO8IN36dsT+W7Xhngr8NpGtVDqx54lkkG/UPFBkYJjKeXV1Q8F5KvC7RFbvRBvn1QoiBPe/53c3qT15F+X3qB0ru4lLT29v4KUtS4/3vxEh3WVt7M81wOVpA89qsOieTs/+ejqzHznwggZxZuYDNEsRHSdi8L8H/GS6+MMNB8laIlPoj4FnNwwVzAAfyckn0g2uT8+lyT7ICiL78M+IjOK1DefVMHH56Osy4vEUmmX/PQD8O5G40en9nruAj1K+PdIS8uemTbk8hWioYX9uBV6dC4+LaFb4/CDwfsrPMXaNt6RrvnCcn0ngN+hs0sVIhje+noNlocFnltgQ/0ciNn+8ZXSGcuX0ZOAPic3R6YbP1Lpe/nlYZV+6x1AazRs5Umi29DOd3/NX6bUtP455NZSGdyIjKG/OOTrb8JkWgK+mEe9GlvNYzuHWPYxNnnuKSGL5E+CS/O7j6c/WfWUvBt6aYtv0mWbSBp/X4f48ITVlsuAZ9wLvHK184s0RBxffQ5xD2dTgu0aIDe2XEbH/rwCfJq4if7TDkUNE3bOL0xt7BnEeZ3Mb2jeVHuiNVFobTQaSBeAa4H3A/9HQSI0RGcWbU0C+AHwqDeB9jzEfz8gF4vPyz7MoK0pwNPemd/YdulNEdybn8IeA19Jsv36cOKqwKQXti9mfVxIZm4/EaPbnJenpPTX/uR0JcXuAf007OVfzwB7tg8k3Cbw3vapLab5pujrF6cwMmdyRL+qOdKdb9wQtJw4fnkKcvzkp/76xjWJ9K/CuxxioIp1gJ/CxnFcX0Xz7YT1Rcu7sNKh3pcdyV86r1qp7RYrfqYvm1am0LxN5PsX6XXS3PNMDwDuJTMKz2+DJbEz7dG4K/l2L+nQPkaCxQOQFbMq+PG2RnWpXf04Re2fvo9JyV/0maHNEZtZb8oWd1qbvXZOe2oUcKYZ8gCPXTIwTqcMb6UzFkf3A24mkF70z6cW8+hYRlvotmu/ZLDbEG9PjmiT2sA5wJDFjPH/XRjqTIXlbRnRKKw2VMp1C+vb0ete16Xs3LfLWJtNOHeTIdsfyFK9NdCZDciexTXNb7d5Zvwhay6X/SLrRr6S8mv2jufnbu+x1fhp4d052kV6wG/gwUVD7R2j/Pu5EegzdYm96nR+iN/cKHgD+hUhoeSHtPyo0QVRp6eb4+Dci4aUv7mkc7pOJ17qy4B+ImPLhPjYis+mV/RUR5pxDpHfz6k7gb4ljI/18uWzrLOc/0axeZVOv9w7gr4Hr+rw/DxP7of9A+VVeCtpjTL4rs4O/2adC0Dpz9hbi0LihRuk1U0RG4F8RYaX5PmzDAnGu7h+JJK9eMk0kcbyFOJu20If9OZf9+Q/5Z9+0YbQPB+6HiHjxSuJkfT95mXcTG8dvw5qNUg8HiH2nE4lSUyf32WL3hvQyP1yJ8Z3OOb4ZeA3dK+bcrkX3dSnIH+o3QR7uw8nXGix/Q3nx4l6I2T1E5tVfpAHpx5WbDC77gD/PBdfdfeKpzRO1Kf+CyISerGi+7yMOnb+T8suKe+GZ3QT8HRG67bsI0ghRJf48jr/axSwRs76S7l/2NpOrsinirMU6unOAsnSQ3J0i/CdEir5iJjUyReylrUqvYk3Fi95ZInz/x8A/U2cFi8PEfvlyIjt7dcWe2kyK2Z8TodteJKutJLI5L+P4o4dTwHf6VdBaDbieSAs+jSibM1rhILklvck35bMqZlIzkzmnITIUa1wsThIHmX+HOB9V8y3vBzmy539qLhJq68/DxJGD/05EkXqVeb2kBQ2OXIp5E7GvdlJ2RK9XQa0SNl/JQfJPdPYKC5FOeGo7iTvJtqQR7vW8mifOb36OKLb7Kfrj2MtkilqrP0+oqD8PAh8nat1+nN6GbRsL2ugATL7JHOA7iNtffzYHzFiPBsxsrhj/NV33a+iDE/YiRy3IDhBJAbcQ9wr+cC4aR3r0PLNESau3AO8gwo3TfdSf+9ObvIVIFHk5UeZrtEfPM0Pc5fbmtFW3MACJaqMDMgFbBVL/Evga8NNEcc5VdG8PYD6f44oUstb9ZqbmS79yKD2L3yPOJP0UUc90WRfnVavw7CdTzK5MYevH4wWTwFUcuUPt1cRdjeNd7M+5XKx8LO3UlcRWyECchx0doMk3lwP9k7l6+wgRTn1uroSGOjjhDhO31r43B+p3sAKIDAYzRFLTB4l71J5JFPhu3VjdySjIbuI+s/cR58tup7+LKrT6807iKpZrU9BeRtTB7GR/thYGn0079dUB6c+BFbQWh4lkkbuIfYALclX5HCIjsl3lfeaIdNwv5CD5BrGXtxuRwWN/jvHbMwpyUc6pZ9Hec2uzRPjrivx8Mxeo+wesPw8Qh5Zv58hVN88h9o9ObGN/zizqz88RWyA307u8BwWtwYD5Zorb14hrWs5NgTuXqLa/5ThXRA8R1RRuIA4fXp+D49ZBHSAiR7EnDfC302s6e9G8Oifn1Ybj9BzuzTl0Q3otN2aU485B8yAewQv9SgrNl4j6ructslOnH2d/zhPX9txyVH/enOI50AUdRpfABJxOz+km4DO5mjyFKEa8lTjNv4E4I7KCI5ves0TmzIEcdPfnxNuZE+3OdOFFliKHUtS+nXPntJxb23OhuIkoIr6aCKWNcORS28NE1u/uNL73Ekldd2Rk5dAS7c9r8rOGSPE/5WH6c9VR/dmyU3sX2aldi/rz7qXUn6NLcNDcmB/SO1u3SNAmFgna3FGCtpv+LjYq0in2LzLG5Bxaf4yCthuPsxzNvqP6c3RRfz6SoNmfS1DQHi7c0RoEItIe5ogK7Q/YFW1hNj0vLwJ+DIbtAhERUdBEREQUNBEREQVNREREQRMREQVNREREQRMREVHQREREFDQREVHQREREFDQREREFTUREREETEREFTUREREETERFR0ERERBQ0ERFR0ERERBQ0ERERBU1ERKQtjDb8+ZH8jlFgyO4UEZECFlJHRnolaOPATwPfA0wraCIi0kDQxoHt+WfXBW0YOD0/IiIiPcU9NBERUdBEREQUNBEREQVNREREQRMREQVNREREQRMREVHQREREFDQREVHQREREFDQREREFTUREREETEZElRpNq+zPAB4BPAXvx+hgRESljAVgLPB/4QWCs24I2B3wDeBew2/chIiINWA9sAF5aKmhNQ47Dpb9YRERkEWNNNck9NBERGQgUNBERUdBEREQUNBEREQVNREREQRMREQVNREREQRMREVHQREREFDQREVHQREREFDQREREFTUREREETEREFTUREREETERFR0ERERBQ0ERFR0ERERBQ0ERERBU1ERERBExERUdBERERBExERUdBEREQUNBEREQVNREQUNBEREQVNREREQRMREVHQREREQRMREVHQREREFDQREREFTUREFDQREREFTUREREETERFR0ERERABG7QJGgVOB84CtwDJgyG4RkcpZAKaAXcD1wJ3ArIK2dNkOfC9wGfB4YFsKmohIPzAF7ASuBT4HfALYoaAtPc4EfhL4qfy7iEg/cirwdOC5wGnA24FbFbSlwxbgVcAbgI3OBxEZkEX6G4E54G+B+5ZaByzFpJAh4PnAKxQzERkwNgKvTBu35HIBlqKgbQYuBR7n2BeRAeTxaeM2K2iDz7nAOY55ERlgzlmKdm4pCtoJwCbHu4gMMJvS1iloA85EfkREBpUV+VHQBpwhPDgtIto5BU1ERERBExERUdBEREQUNBERUdBERETqx+tjjo9WVes9doWIdJh1HLkFRBS0tnMd8D+Ab2Pqv4h0jgXgAuBXFDQFrVNMppd2p10hIh1mY9ocOUbcQxMREQVNREREQRMREVHQREREFDQREVHQREREFDQREREFTURE5NHwYLX0AycCFwGnA6tciHWNeWA/cBvwTWCHXSIKmkgZa4HnAy8CnkCUAFqhoHVV0A6lkH0L+DjwaWCvXSMKmsixsx74ceB1wBOBEbukZ5wGPBW4BNgC/Auw224RBU3ksRkDfgD4JeA8u6MaW3EJsDK9tncBM3aL1IShG6lxTJ4J/Axwjt1RHefkuzld+yEKmshje2eXp6g5PutjBDgLeEm+KxEFTeRRDObTiMsNpU7W5ztyX1MUNJHHGJMnARN2RbVM5DvSfoiCJvIYjOKN4DUzhAlloqCJPCYLwP3AtF1RLVPAffmuRBQ0kUdgDrgaD+/WzF7gG/muRBQ0kUdgBvg34G67olp2AB/Gc2iioIk8pod2LfBe4B67ozruAd6T70gPTRQ0kcfgEPAO4G1YELc2z+ytwNvzHYlUhZlKUiMLwO3A36VH8BKi7NJmu6Yn3Ad8HfgI8DHgDrtEFDSR4+MW4C3AVcCTiLNPq4Hldk1XOAzsI/YzrwKuAQ7YLaKgiZRxAPhifkZT0Dx03R0mifvQZu0KUdBE2ssscW2JV5eIyP8Pk0JERERBExERUdBEREQUNBEREQVNREQUNBEREQVNREREQRMREVHQREREQRMREVHQREREFDQREREFTUREFDQREREFTUREREETERFR0EREREETERFR0ERERBQ0ERERBU1ERERBExERBU1ERERBExERUdBEREQUNBERUdBEREQUNBEREQVNREREQRMREQVNREREQRMREVHQREREFDQREVHQREREFDQREREFTUREREETERFR0EREREETERFR0ERERBQ0ERERBU1ERBQ0ERERBU1ERERBExERUdBERERBExERUdBEREQUNBEREQVNREQUNBEREQVNREREQRMREVHQREREQbMLREREQRMREVHQREREFDQREREFTUREFDQREREFTUREREETERFR0EREREETERFR0ERERBQ0EbWlCQgAACAASURBVBERBU1ERBQ0ERERBU1ERERBExERUdBERERBExERUdBEREQUNBEREQVNREREQRMREQVNREREQRMREVHQREREFDQREVHQREREFDQREREFTUREREETEREFTUREREETERFR0ERERBQ0ERFR0ERERPqXUbtAHmaRsxU4EdgMbARWA+PACHAYOADsBx4EdgI78t/V3KYTgJPyz9XAGmAlMJfPfgDYA+wC7gZ2V9yedcC2/GwCVgDLgWXZ1ql8T4eyHbvyHT0IzFfaplXA9mxTa8ytynbNAdPAPuAh4P58R/dW3B5R0KRHbALOyc/pKWZbgA1pPFcCYyloU8DB/OxN49IymHcCNwK3pOD1UsBOzPacmUK2Ldu0MduzCphIY3koP/uzPfemUN8F3ATcnP++V6wHzgDOzj+352Jjc/63iVxwjGfbpxeJ2l7ggXz+ncDtwHeyTff2sE2rgbPyHZ2a72drtmltvqOVKdJzwEwuOvamqLXG3K3ZnpuynaKgyRJkIg3kBcATgAuBxwEnp3AdL4eA24Dr8nMjcG0amsNdatO2bMP5wHnA44Fz01AOHed3zaSgXZ/tuSH/fm16Cp1mPI39hfmOzst2nZFGvoS5RW1qteua/Hs3FiDLs02t9/L4fF+npZdZ0p478/mvAb6Vf36ni2NOFDTpISvTOF4CPAd4ZorYUMPvXZEG6vH5z3cAXwCuSENzPZ0J442kkT8PeHq26YnZziaM5feeAXwfEa77CvAZ4OoUtk6EvFalkb8IuCzb04730+qr0/JzeXo0XwA+B1yVYvBghzzM83Ph9Owcc6e0qT2n5+fyFOvPA58Fvp6LqoNOeQVNBo9xIvz2dOCH0rCs6+DvOzU/Pwh8Ffhgitt32uThjBCht4tScF6URnKkQ+3ZCLwEeGEK9IeBT6UIPAQstMFjPh24FPjhfD8rOzwmNuX7uTxF+t0pbu3y2NakR/Ys4AeApxV6YsfCUL7/V+V7+izwfuDLRAh8RhOgoEn/M5yG60nAT+ZkX9emFf+xeoTPTSG9AnhXGpu7ib2eEsO1lgjDfT/w48R+2WgX58zFKaSXZ3s+QexJHSx8P5uBZwCvAF6cQjDUxTEyDjw1PdsrgHeksN1VKATL8p08N9v0LCLc2K02rUsBvSwXHu9IwX4Ak0gUNOlrr+yMXIX/PJEcMdaD5xhKD+R7iFDnh4E3A98gNvmPlbE0lC8GfoEIY4112fi32jOSi4QLgO8F/g74NBFWPVajuSy9slcCr873M9KjsTKUz/O8fEfvBN6a3uih4/ietSn4r0vBX0dvjgcNEaHOHydCnH8NfIDY553WNCho0j8MEaGdJwNvJMJxK+j9ucPhNDKvIPba/hZ4L7FvM/cYP7s8vaKfAV6eXsxIBe1ZDryASLB5e4rAncfg2axIr/U/VfR+yD5dC/xsvqO/AD6eC4+Fx/i5jcCPAK9PoR/twWLj6HkwTuwZ/jrwFODPgCuBSZqHiUVBky6tTC8HfoVIMFhe2fONpTj9OpEo8IdEeGv2UYz/9wH/OY1SN8NXxzqPTgN+mUhO+ZM0mo/kCUwAP5pidnEa3drG0DgRBj2J2Jt6CxGyW3iE9p8M/CoR6ttawWLj6IXH6hxDpwN/DHwsvWlFTUGTisVsCxHCegO9CzEeqyewnQgJbQZ+m0iNnz6qPauAnyBCjI+ruD3D6TV+P3F+70+A/3iY9kwQ4cWfTw+o5jk4lkL9xhSEvyTOfy0c9f+cA/wGEVLeUNli4+iFxBOA382x946HaY8oaFIJpxKhotcSZ7JqL23W8iZflML1W8TmfUsE1qaQvZbYC+yH8TpBJCOszOd/96L2TAC/mO05u0/a0zqk/vr0lP8HcaB5Ib24JwG/SWRnrq5YzBYL8KnAf8nnfTMRIpYBwFqOgyVmv0Bsxp/YR+92KA3Ls1PQLkyjsyKN6M8QFSX6afG1jEiseCMRghsnwqSvSu/snD5rzxARRnwlEfZdl+/o/PTMnk33MzObtmd7zpXX5d9FD00q4TRiP+Yn0/D0IyvSMP4a8P8SmWmvIc7O9ePCa4zYH3sjsTc4RoQZz6Gu/aXjYTvwY0TNy08Te2bPoXNny7rRntfk+/lrelsKTBQ0SQF7HbHPtK3P27KCI+ewzkivs5+jCK3zXb+Wc+0C6t0DPFZOSWF+QS46VvR5e05OUZsB/obOVEoRBU2OgbVECOsnGJywyUriXNegsCxFbZBsRqvc1KBwOhHaniLOE+5DFDTpKmNECavXECHHTrCHqGb+EFEK6VCOmRVE9ZGTiazKfvE69hIJAPfm36fy2SdycbCdyAxd1iftOUgcd9iZ72gq//0EsS+5LT2q1X3Snvl8N3elp3SQCAe22rMxxWdNB373WURC1X3AP2OpLAVNusYIkVX2c8QeUzs5RBR1bX2+nUZmD3F9x2gal+35u88l0ulbVe1r43CK8rVEjcIbFxnMw0RYcOUiY3kucZasdfNAbSHPOaLw87cXtef2NMStih6riMSNU7M9rcr2Z1DXmcQW9xFHNlpj7uYU6f0pLCuJbNit+V7O48h1RxNtfI6ziXDqHcAXeezD/qKgSRvE7Ewi2+yiNnpHk0QR168AHwW+RKRnPxJXLTKeTyT2VJ6XhnNTBf00k4bpy8C/E/Uj7zzGOXEeUYT4udm2kytozwJR//IbxPm2f0/D/2hG94r885RsywuIAsGnU8dh7oeI4s5XZJuu4tguij05F3QvJsK5p7dJ2Mbyff8icT7tFqz9qKBJxxgiDiG/Jo1TO6qxL+QK+fMZavkEx3fNy4H82a8BHyL2816cIZxeGc0HiEod7yHqRu44jp+dTe/nWqL238uJ6vfnp3j3ggP5TO/PNt16nIb2TqIk10eJ4tSvIMqibe5Re6ZTjD9BVCC5luOrr3jXorH6onxHlxK3kTdlFbGHexPwppwbHrxW0KQDrEzP4TW05+qX6fRi3gn8I1G4tXTyThGHom8mrov5hTSaq+je+aS5FK/3EJv71zUU+luAP00P4peIFPXNXWxPa7HxWeJA8zdodnHl/cDbcvHxGo7cVDDSxfYcyMXGm9LL3N9gzD2YY7fVnlek99Y0arGe2E+7MRc1BzQ9Cpq0lxFiz+CNREivqVE9nAL0JuDfiMyupivRhfye96eY/N/pSW6g83tRM8Rda3+Wv79dK+tJImx5T4p0K6O00+2Zy9/5NqKI8920Z09nnth7++/ZX79M7B11OrFnnggxfhL4fWLPbKpNInkzUQ/0RiJceBHNEntakZA3pvd4De6n9QVWCukfthEHp89rg/GZIm4q/k3gX9skZkd///XA/0mEhjodtplOw/NruWJv9++bI8J2f5yfO+ns3kor8eMP0kO8q80GdSG9tX/OPvs2nb1SZYFILPon4jD2tW0Ss8Xfvzfb81u5AGn6/WPEfvBP0L/FChQ0qZIVxOb3K2h+kHWKuGn5t4lQ1nSHxGY2vYrfIy7B7FQVhmnizq7/mu3a36H2zKcIvDU9jNs6+HtuJQrovpPOXUq5kH31yVx4fKuDonZvjoHfT69ztkPtaY3t/0aEiafaMO9eRdzwMKEZUtCkPZxNpOg33b+ZTgP2u0QWY6cvOpwj0q//KA3a/R0QzRuA/4tITDnQYU9wgQibvTs9p9s78DtuJcKB76Pz15ssEGe9vkjUZLyhA2JzX3pmf5TC1umswVb04XdS1JqM8SEi0eTncg6KgiYN2Urc43QpzfY8Z3IV/kfA1+nerb0LuSr/c9q7wd7yZH4nxflgF9vzUAr0PxDhwHZxB1H9/T10966ug7kg+O30PNslOgeI/cw35RjoVnumiOMnf0js5TYR6VHgWUR26BbNkYImzbgwwx5Nqj209oD+ICf6VJfbsJDi85fAR9rkBdyTXtJ/dFHMFnN/CtoHaU/9v/tSyN5Kb+oJHiTS4P9n9m07vPOPEEV/b+tBew6n5/kHROi7iUivzjl4oeZIQZNyTiHOxJzb8Hse6LHxb4naNURYa64N7Xk38F4iGaBX54TuJhIc9rTB+H6KOGqwo4fvZ196anvb8H2fSW/zWz18PweAj6dIN10knEdcYHqSZklBkzKeBLyUZqHGVhr9e9pkqJoK9Kk0O3A9SeyNvJnYk+nlodeJXGxsbPg9X872XN/j9zNKVMpoWvvxFiLj8PN0JgHkeNgD/Atx6H9/g+8Zy7n4JM2SgibHz6lEKakm3tk08M1KjD/EweRn0Cyx5TqOVJfoZXuGiPvOnkazQ+43p8G9osfvpnV7+A/TrOLGwVw8fYwjtSV7yTxRxupv01tsUnT4/JyTJyMKmhwXlxJVQZq8o7uIPZmr6f3B0G3E5nqTYso7iMSST1TwfsaJ2w6atOcQUZrrw3R/X/Ph2nNpemhNUtQ/m4J2V0VzaZaoTvI2IkzcxF6+MPtJFDQ5Du/suUTcvpTdRGmh91BHlYPnAZdQXmZpjkjHfncFK/9hIo37MprVQ2zVv7yzgvezjiiFtb7w5xdywfEOYq+0NmZz7HyCZqH38zPSoJemoMkxcll6M6W0EjDeRm+TJlqsJ0pgNTnLczNRXPf6Ct7POPAymt1Dtzu9za9W0J5lRAbfsygveD1LZHx+mdjnrI2F7PO30SxRZSjn52WaKQVNHpu1xL5Mk72ze4kD1F+j99dfDKWhvJjyu7imiQzNj1cyZ7YRNwqUemcL+X4+Q7NEhXZ6Zz9G+V7gPHHI/N2VeJuP9pxfyr5vUrnmfODpOVdFQZNH4Rlp/EcaTNovEzUaZytozzLgcprtNV2VYrajkva8KL2z0ne0izhycG0F7RkhQtwvpHzv7BBRDeTaSsbcY3mS70nPeL5Bnz0xF56ioMkjMJqhjMc3+I5biAyzGyoZX2fn5F/TwFh+GPhcJe9oJVE1onSvaYYoa/U1ulet5dFohYM3FdqDVvmx99G5ep3t5lpif/n2Bt9xIbGX5o0lCpo8Ao8j7hBrkgb+JaJCQw2XEo7kyr/JYdQriMy5fRW0Zzzf0RMKvZlW4sQHiMopNbApPejS61YOEHfp3UH/XIS5kIukLzb4jnVEJOU8REGTh30X39NwgtycAnB3Be0ZIi73fD7l129ME1lp36jMOytdcMymIb2J3u9tQuxpnpcCPVLYntuI/c19fTbf7iAOfjcpy3Vejm/tqIImRxn/jcAzaZYO/MX0ZmpYKY8SG+dnUnZ/2wJxduhK6kicGCIuKn0RZZmAC0TVin+jjr1AcqHxQuKalJLD7q3iw92oot8JL+2zDb20U4gtgnV07xZzUdD6QtCeksa/9J3cTZzTqiWUNU7cElBaoXyBSNO/tpL2rCQSdk6hbN9khqjXeCN17J1BhIK/t9A7m+dI+PRAn8677+Sc2Vn48yM5Zy9R0BQ0+e73cBmwvcF3fJ7IbqzhEPUIcCJRUaEkGWQhDf+XaP8daqWsTYEuvWD1EJFdV0vixIZcRJ1caAf2EeHg26k/s/GRmMs584UG37EdeLa2VEGTI97ZRqLo6YbC7ziQk/LGiryzZ+ZkLxlj80Riy43Uk9xyUgp0SWHlaeIOuqvo3W0HD+edPYeycDDEdTc1VG1pyvW5GCxtxyYikWu9XpqCJmEsn0ycBSo91/QNojLIVCVtWk6kgq8q9M4eJMJzuyppz+p8R5sL58wkUeLq/orG3SnpoZUY4YOLxtxsn8+/w9mOaxrM31NpdnZUFLSBErTn50qvhNbm9k0Vjakt6XGWpLbPEYkgt9CsMno72UjU1izZO5tPIftcRd7MeuL4wbZCQXuACDceon9S9R+NG4FPN/j5TTmHFTQFbUnTypy7hLIyOgvEhvaVFXkzE+nNbKH8oO7HK/NmtqQ3U2KwDuf7ubMib+Y04KmUh8h2pEDPDsg83EEcdC+dQ+uJqiGGHRW0Jc0YcQaoNHNugYj/f6eilfJKorJ+Sd3GeWJv5ss0vwW6XawhKreU7gfuJ7I1D1c07k6n/KLKfUR47jb6L1X/0ebRzUQKf8k8Gs05/HisHKKgLXFBu5TyG4Jnc6Vcy91TrQSXp1NWeWKGyGzcUZGx3EIkuJSmtu8iEnZqEbRVwDmU3xSwgwjPzQ3YXLyTCN2XhrlXU540JAraQLCMCM+VJk/sytXy3kraM5Gr1JMLBWCSqLG3p6J3tD0FutQ7+3K+p1oE+iyitmZpaOyO9GTmB2wu7iFud7+v0EtblXNZQVPQlmzfbyKuiSkJz80BX6GugrBrifN0JangreSJL1HPQd0J4uDsGYUC8BBxVcl0Re/oLCLMTWF7vgXcw2AkgxzNfcRe2lzhWDmf2BPXripoS9I7u5hm4cbPU1fyxBoiwaVE0FrJEw9VZCy3pPEv3Rd5kLimpKbkidMov8rn7nxH8wM6J+8nwsNzDcb/Eykv9CwKWt+ynMicK63avg+4mnrCc0PpcZ5HeTbgl6nroO4W4ILCnz1IpIPfX5EAbCcSQkrDYjuI82cLAzonHyIOwO8vbONEzunliIK2xGgy+Gc5kqpfi7FsZQOWFro9RIRQa8oG3Eqc1yoNN15JPWfpIEKnZzSICNxBPbVCO8E8cQzm6kKveoI4DqGgKWhLipE0lqWV6GeIUNbeitq0jgi3jBS25y7qqgs4QYTnTij8+QdztV9TeK6JoO0gykTNDPjc3Evso5WMwzEig3QrHrJW0JaYd3Y+cWarZPU/R9QF3F9Rm9YTe4IlY+pgejMHqSectZ1I2CkxTAtEss61FQraKYU/ewf13HzQSfbn3CoRtKGc06WJXqKg9SXLiVBWk1JKt1BXeO6EnMglY+oAsX9W0+r/JMovW90NXJer/VoEehtRc7DU0C4VQZskysg9WLgYGc25PYEoaEvIQzuP8nDjdUQySC3Gci1wNrGPVuJx7qe+/aYTU6BLuI8401RT8sQ5DbyzSSIcfO8SmJsLxP5naXh1NOe2HpqCtqQE7dxCD20qjf9kRe3ZmJO4RMxmiI34HdRTfWKUCDluLfz5B9Mg1iRoZ1B+396OFLT5JTI/DxNhx5Lzg2M5F/TQFLQlwQiR3r6d8gSKqyoTtHXEgd0SWuntNXlnm9JDK50fDxLZgDUJ2imU3x5+D/WUV+sGkw0EbTjHzkbtq4K2FFiRxr/08OWBFICpitq0lvJqGgeAGypb/W8j9tBKmEqP88GK2jOWC6h1DQTtziU0Rw+nh12SpDREhBvPpPx2c1HQ+oZVGZIo6fsZIvyzuzIB2JgCULp/dh11FbvdlqvsEloJOwuVtecEyus33pOfpcJ8LkjuoSzbcZjYUlipuVPQBp2VxAZ9SbhxKr2ZmsJzq1PMSlej+4jrb2oS6K0NPLT7qe/w8Wm56CjhUC6i9i+xeTpLZDuWREJGco4raArawDNBpE+X9P1UTrKaagNupPwqklkic66miictj6Y0IeS+CgXt9AaCdmcK2lJjpoGgDeecMOSooC0JQStNOGgJWk0eWhNB20tcrFiTmK1LMRsr/Pn7iYzAmji1gaDdRewJKmjHZ1dPxExHBW0J9Pdayq9qP1yhoG0g7j8rYT9xYLem/abtlJe7au297K6oPUNEhuP6wp/fSV03OnSLWSIUfriwzzdSfi5TFLS+8c62Ffb7fBrKndSVQLGG8vDcQeq7W2tTA+O/p0LjvzzbVFph/37ioPFSFLR7KK/20qrXqpemoA0sK9IDKFm1TRN7GbUVh12TBnNQBG1jA0F7iNhDq8k7O4GyG9Fb3FeZx9lNWnNuqrDvt+M+moI2wKxsIGhTafxr2m8aJ0KOpav/g2kwahO00vNauyv00LY2MKqTKdLTS3S+zrdB0Mx0VND00B5F0GoKN66lPNkAImX/Pj20jnpoWxsY1fup5wLZXgnaPXpoCpo8sqBtayBoO6gvI7A03Hg4DeZUZe9oYwr1IHhoQ0S5q1Kjei913bnXbeYw5KigySOyHNg8QIK2toGg7aO+dPDlKdKjhT+/uzIPjYYe2q4lLmgtD60k5DqUc92kEAVtYFlG+f5MrYJWGnI8QH37Ta1U61L2VCYATT20B3LhsZQFrdRDgwhdjyMK2gAL2mrKsxxrq6ixqoFAT1Jf9tz6Bt7MVIp0bWxs4CXsJkpfLWVB20V5yHE15UXIRUGrvq9XNVixHUqDWVMCxYoGAnCY+sJZqyi/mPFAhYI2lB5nadWTfdR1TVG3WSAO/5feDL8s54eHqxW0gWM55ckGM2lc5itsk4J2RNAOVtaesVx0lBrUpS5oLS9tH+X1U9fopSlog8gyyvdnZqhzc74dglaTx7lygDy0VshrrMF3KGgxPvdRXtBgbYMxJQpa9R5ayWp5hkg4WKisTROUJxwcpr6Eg5U0u3i1Jg+tJWilGZtz2Z65JT5vF3LuzRS+AwVNQRtYQSv10KbT+C9U2KaRwp815Nh5muyf7dc7+1+CtpfyailrFDQFbRAZp7ym3kyF3swymp2xOUx9l0auaOChHRwgD61lxKectpB9URpybJIIJgpatYw0GNitPbSaPLTlbRC02gotr2zwjiYpz4brlKCtojzkeJClW8PxaHHf32CsLqM8iiEKWtWCVhr+mavMWJKGsnSizlcoZk3bNFNhm8YazPFp3D9bvPia68GYEgWt6r4uFbSWACxU1p7S8TNHeRp0zW2qTQBGKE/Zn6G+YyK98tCmG/RFk0WFKGgD6aEtVLj6H2pgLOcq9dCGG7RptkKRbjK/Z/TQvqsvSheTY3poCtqg9nXpfkaNIbpB9NCaiHStgqaH1h5B00NT0KRNHtp8hcayqYdWa8ixiaDNVfh+mgiaHlp7BE0PTUEbyL5uGnKsaQ/NkGP9HloTQ6qH9t1zr7QvRrWzCtqg9rUhx7o9tKYiPVfhO2oi0AqaHpqCJo9oLEv7e2HAjMv8ABrLQWvTHPVVpunHvmiSaSoKWtU0MRBOCunmeJP2eLp6uQrawBqX0sHdJBRWo0dSY3tabVpoMJeGbI+CNuCeu4Im/0vQSo3LUIXvatDaM6jvSNvQnCZhw3n0lBU0PbTq31VTD63GsdfE+NTmdS7QbO9HD609Y9W9SAVtIGmSqdhK+a/JwDTJ6huhPOOzkzQ5S1Zjzb6m6eZm5x3piyYZvYYcFbSBY5by6zhGaFbZvhNMNxDoMeq8UmOqQZvGK2zTVANj2uSuu0FjBc3u/Zu1CxW0QRS00or5o5TfDN1JQSu9XmSMOi89bCJoyyi/S60TLACHGnicE5QXAhgkhrIvSiMKNV6TpKBJY2YaCFrLQ6sp5DjdwOMcr1TQmqyma/TQJhsI2nLqDAvroYmCVomHVnqlfY0e2jzNLoBcRn1JB1MN2rS8Qg+tiaCt0EP7Lm+1VNAmFTQFbRCZJm4BLhW01RUKQJPV5zLq2xc81EDQJipsz4HC9zNE3N6toEVfrG7QF978raANJFPEVe4ljAPrKhS0yTSapYK2trL27G/gRa9KEajJQ9tL+f7NWuoMC/dC0NZRHk7eR3loXhS0qgVtH2VnUsaB9QMmaBOVClrpPueq/NQkaAcbtGeiMoHupaBtKBS0hZzzh+1GBW3QOJyDu9RDW19hmw41ELTlufLVQ+scc/l+SvfR1uilQc49PTQFTR7GQythLI1/bVlnTT202sKoTTy01fmpiVbYsdSgrqW+ZKRuM5b9MFrY/wqagjaQzKXBLN0gXkF9iSEHG4j0igq9zr3pdZZ6M2sqHHe7GxjUdSztsONw9kFpss9ULvisFKKgDSSHgIco30fbVtk7258Gs4RVwAkVGv/SxJ2Wx1nT+1kA7qc8jLq5Qq+z2/ZxG+X7Zw826HtR0KpnErivUNCWASdW9s72pUCXCtqWyt7PTLapdM9pHZFAUBMPNPA6T6jU6+ymfdxO2fnChZzrCpqCNvCCVsKynFw11ddrh6DVlrm5m/Iw6jpgY2UeWhOjullBY1sDQbsfMxwVND20RxW0QfHQlgObqO/w7kPAngaCtqmy9tyvh9bYQxtv0Pd6aAraQAvazkJBWw6cUtk7m0wBKK0WsrpCL+3BBoK2gbrCqAs53koFbQt1Hhfppn08hbKjC037XhS06jkI3NNA0E6nvis99uRKtFTQTq1M0O5v4HVuJkJUNQnaLsoTXZZlm5Zq6v5IzrmJwr6/m/Jyd6Kg9YWg3VUoaGO5Yl5b2Xvbm0azVNBOq0zQ7ksvrVTQtlc25g4RiSGlx0W2UV8YtVu2cQMRdi09g6agKWgDzRRH9jRKRG0FEQKpyUvbS4RWFLR4PydQV3WNVuirNNFlewr1UmM0owcrCvv8YM51CxMraAPN/vRoSs+inUldiRR7gR2FP7umQkHbnR5NKRuBrZWNuR35nko9tBOW4DwdzblWegZtJ+WhXlHQ+oZDwK2UnXVaBpxLXSWwHiLCqCWsTI9zRUWiNp8r69ID4xtzZV8Tdzdoz8nUd16wG4wB51CWsj8H3IYZjgraEhG0mykrh7MceHxlHtqeFLQSgR4i9mdOrsxL20Uk75RwQq7sa+J2yhNdthIH+oeW2Dwdy7lWEj6eB76D+2cK2hLgYANBW5arxlUVGZgZ4F6aHbA+n7r2BXdRHkY9ATirsjF3F+X7gqMpaEsp7DiU4/IsykKOCpqCtuQ8tNnC97WBCNPVto92O2X7gqsrFbRSD20DsS+4rKL27M5FR2mCwok55paSd3YacQavxEbOArfgGTQFbQkwRexp7Kc8fb80FNIp9uQELmnPKuBx1LUveG8DQWt5aadQV5juLsrPC568xAStFdpvcqnnPZjhqKAtEQ4ANxV6aePAEysTtIeIEEuJoK0kwqhrKhKAfbnoKF1hb0qRrknQ7qD8vODJxAHjpcJEzrESQZsBbqT8nkBR0PqOQ8C3c/AfL8uAJ1HXPVW7cxKX3vu0jvqSXXYRYdQSNgNPqEzQbqV8X3ATcAZL5260lcDFhYI2C1yDGY4K2hJisoGgtcrxbKeeMN1hIqT1QAMvwWRWzQAABTtJREFU7UkVCtqtDQTtAuraF2wiaC0v7awlMDdbSTCnFc6vmZzbCpqCtqQE7ZpCQRsiQiJPIPafamEPEUYt8dJWAU+uUNBuKfzZMeAk4jxaLXNsL7GvUxpGPQk4bwnMzdXARZSH9KdT0EwIUdCWDDO5Wt5F2fmtUeAS6rpNeG9O5Cbn62q68XkXkY26UPjzG9Mw1jTH7iD2Bks4hchGXQqC9uRC72yOqBCyk/IbKERB60sOAN8ish5LBO1pKQA1eWjfLBS04RSAJ1JPuvsUEUYtzXbcmO+opjl2K1HBooQNRPLOxgGfl+uApxYK2uGcA54/U9CWHFPA1yiLtY/kivks6sl23A9cn55aiVczATyLsqs6OsVO4LrC9qwjEgtWU09yyM35KeVUYm9wUKuGTABnU14A/DDw9cJFqihoXWeB8hDU0UwCX6V883g58JRcOdfAPBGmu5GyMOoE8EzqyqTbmV50CaPEvtP51BVGvbXBmDuJCMctDOj8Xp9zalmDOf012pcQsjDAfd0RRu2C42I8B/2GNqxSh4gw3UNERfPjXREOA5cCH80J1GujuZCG4MY0Csc7tsbS47yQ2GOcqaA9rTut5grnyjrg+USY73AF43c2x9wOyupNbsl3u30AvZD57JNnFM6luZzL+/K9L7Rh/K2n7OiAgibHxBnAK4Hn0p6wy3Ki0nzJ4B8mMh1fC9xZiaCtINKdS9PVVwOvS1GcpvehrQVi36iUtcD3p/c5U8H4bRnt0mzSZcT+0i9XItDt7ptTckE13GD8v7pNfbOQC90zNLsKWqc4Oz81MJQruNcOUP8uA142QO1ZTmSjXjJgi7pf1RQ8rC09y77pLe6hiYiIgiYiIqKgiYiIKGgiIiIKmoiIKGgiIiIKWi1MYWkaERlsDjN4ZwUVtIfhQeJEv4jIoLI7bZ2CNuDcTHnFcRGRfuAWmhWiVtD6hLuBrxBXg4iIDBp3EoXP71lqDV+KgjYHfAp4P95bJCKDxQHgfWnj5pZa45dqLcebgbcCq4CXEFXERUT6mXuBjwBvI0KOS46lXJz468AfECHIZxN3Pa0lKpEPOTdEpHIWiFsc9qQd+xzwTuCGpdohS73a/g3A7wMfIK7FOI24AkJBE5F+ELRDwO1EXsD1tO9yUQWtT5kErgKuXvTvFDQR6QdBW/z3JX+7tYLmYBARGQgsfSUiIgqaiIiIgiYiIqKgiYiIKGgiIqKgiYiIKGgiIiIKmoiIiIImIiIKmoiIiIImIiKioImIiChoIiKioImIiChoIiIiCpqIiIiCJiIiCpqIiIiCJiIioqCJiIgoaCIiIgqaiIgoaCIiIgqaiIiIgiYiIqKgiYiIgiYiIqKgiYiIKGgiIiIKmoiIKGgiIiIKmoiIiIImIiKioImIiIImIiKioImIiChoIiIiCpqIiEg7BG0BmLcbRUSkIfOpKcWMNvjZIWArcAHwYP6ziIhIiXO0MTWlWEuaCNoy4PXAq5uqqoiILHmGgPH8dF3QaPrLRURE2oVJISIioqCJiIgoaCIiIgqaiIiIgiYiIgMqaNOYdi8iIv3LAjA9DNwPzNkfIiLSp8wB9w8D3wKm7A8REelTpoBvDgNfBW4FZu0TERHpM2aB24AvjQCHgeXA44F19o2IiPQRdwF/D3xqhIg93gJsB04CVmKhYRERqZt5YBfwQeB/AvtH8j8cBq4m6jJuzD+HiCxIxU1ERGoRsWngABFm/Bfgj4D7gIWWoC0Ah4AvA9cRMcmVwCosPiwiInVwMIXso8CfAm8HdqfQ8f8BqQfrDro2qXMAAAAASUVORK5CYII=",
-    # Washing machine up to 6 kg
-    "washing_machine_1": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAALEwAACxMBAJqcGAAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAACAASURBVHic7N153KZj+cfxz3fGMnYSioqSpVKkLKGypD1ESVkrFRVKfqW06ZeloqifiBZRsiVLixQpS4hIZMu+ZinZlzHH74/zGjOYee7ree7jurfr+3697tcMcz3Hec4zz31fx3Uux6mIwOqTNAewArDkGK/nAnP2q49mZiPofuC2MV43RsTN/eve8JETgM4kzQe8CdgEeDuwSH97ZGZms3AlcGL1uiB8gxuTE4DZkLQYsBHlpv8GYEp/e2RmZuNwG3AyJRn4Q0Q81uf+DBwnAE8j6Z3AJ4G1gUl97o6ZmXXvPuAk4KsRcXW/OzMonABUJK0DfB14Tb/7YmZmjZgKHAbsGRH/6ndn+q31CYCklwD7ABv3uy9mZtYTDwL7AftFxAP97ky/tDYBkLQk8GXgA8Dk/vbGzMz64E5gT+CwiHi8353ptVYmAJJ2AvYF5u13X8zMrO+uBt4TEZf0uyO91KoEQNJcwEHA9v3ui5mZDZSHgG0j4vh+d6RXWrPKXdLiwOn45m9mZs80L3CspD0lqd+d6YVWjABIWpmyH/QF/e6LmZkNvBOAbSLiwX53pEkjPwIgaTPgHHzzNzOzejYFzpG0dL870qSRTgAk7QYcB8zX776YmdlQWRn4i6RX9rsjTRnZKYDqyf84oBVzOWZm1ohbgNUi4o5+dyTbSCYA1Zz/OfjJ38zMuncesG5EPNrvjmQauSmAarX/yfjmb2ZmOdaklBAeKSOVAFT7/H+OF/yZmVmurSV9ut+dyDRSUwCSDqO3+/xvA34LXF/9/tbq19uB1pWVNDNr0ALAktVrqerXlwMbAPP0qA/TgI0j4pc9aq9RI5MAVOV9v92Dpv5GmWI4GbgoRuUbaGY2hCTNC2wIbAS8HVi84SbvB9aMiH803E7jRiIBqA72uYZma/v/BvhMRPy9wTbMzGyCJE0CtgD2ApZpsKkzI2K9BuP3xKisAfgyzd38LwI2iIi3+uZvZja4ImJaRBwFrAh8Cvh3Q02tK+mtDcXumaEfAZD0EuDv5B/p+wDwMeBID/ObmQ0fSQsD36CZtWGXAStHxLQGYvfEKIwA7EP+zf9GYO2IOMI3fzOz4RQR90bEh4CPA1OTw68EbJMcs6eGegRA0jrAWclhzwY2jYi7kuOamVmfSNoAOBZ4VmLYW4DlIuKRxJg9M+wjAF9Pjvczyny/b/5mZiMkIk4H1qCM8GZ5HrBzYryeGtoRAEnvpBzZmOVsys3/scSYZmY2QCS9HDgXmD8p5L3AshHR1ILDxgzzCMAnE2PdSBn2983fzGyEVbu5tgKynn4XBrZLitVTQ5kASFoMWDsp3APARh72NzNrh4g4Cfh8YsiNE2P1zFAmAJSKT1l9/1hEXJoUy8zMhkBE7A38Oinc2pIWTYrVM8OaAGySFOdi4MikWGZmNlx2A55IiDOZUoZ4qAxdAiBpPuANSeF29z5/M7N2iogrgB8mhRu6aYCh2wUgaTPg+IRQp0dEViJhZmZDSNJzKWfJzNdlqAeBZw9TTYChGwEgb/h/96Q4ZmY2pCLiduDAhFCZo9M9MVQJgKQ5gLclhLoyIi5MiGNmZsPviKQ4QzUNMEe/OzBOKwCLJMQ5MSHGU0h6JbAOsBqwKnlFJizXHcBfqtcZEXFLn/vTkaQVgbWAJYGlql+XBBYAbgduq163AtdS/l4P9qe3zau2Aa8PvICnfj8WA+5hxvfiNuBmyvfjjv701oZBRFwl6UrKKYLdWDOjP70ybAnAkklx0hKA6rSpA4Bts2Jao5amlAMFeEjS54DvDNKJXpIErE6Z7tqEsT+UVpjF/3tE0u8oP+cnR8Td+b3sLUkvYsb3Y23GN3oZks6nfD9OjIirGuiiDb8T6X5qOOse1RNDtQhQ0rbA4V2GuR1YKmP1f3UY0TEM2T+6PcNAHABVTXF9ENgDeH5S2CeAXwJ7RMTlSTF7RtKGwFcpCVGWvwFfiIhTEmPakJO0BnBeQqh5hmUh4FCtASDnRntq0s1/YeBofPMfBesAh/azA9XulsuBQ8i7+UPZn7wxcKmkH0nKjN0YSatWoxinkXvzB1gZOFnSWZLWSo5tw+sCIKOe/3MTYvREGxOA6xNiQBn2XyoplvXfJpK27nWjkl4m6TzK1tblG2xqEqVe+TWS9q5GGwaOpIUk/RS4kOZXVK8DnCPphGpdgbVY9WB4U0KooXkobGMCcFu3AaoFf57zHz0HSOrZe0LSO4A/M2NNQi/MDXwWOFVSxoLaNJKWA84H3geoh02/E7igOiXO2u32hBhOABqS8Y29NSHGOgkxbPA8i+5XAdci6bOURUcL9KK9WdiActPryd+3E0lvoNz8Z7WosReWAc6VNFTbuCydE4ABNhAjAJStfjaaXtVkcEmTJR0F7E3/338vBs6TtF4/OyHpw8Cp5Gzx7cb8wC8k7dbnflj/OAEYYBmLKzL+gVdNiGGDaZWG438TeG/DbYzHQpSbXl9GAiS9DTiYslhxEAj4hqRB+jey3vlXQgwvAmzInAkxHk+I4SI/o6vbeuCzJWl7YOem4ndhIeCUXq8JkPRS4CgG83Poh5I80tc+GfeHuRJi9MQgvvHMRo6k1wHf7Xc/xvBi4Lhe7Q6ozk4/BViwF+1NwBTgRElDM5xrNl5OAMwaVt3sfk7OCFaTNgC+0qO2fgK8qEdtTdSSlKSolzsSzHrGCYBZ8z4HPLvfnahp16aLBUl6E/DmJttItBbwnn53wqwJTgDMGiTpBcDH+t2PcZibBkcBqjoLX2sqfkP2kjToozdm4+YEwKxZX6HcVIfJNpJe1lDsLSmleIfJi4Ad+t0Js2xOAMwaUq1y73l54QSTgL2yg0qai3KwzzD6giTv/rGR4gTArDnbMrzvsbdLyl63sD7wguSYvbIY8I5+d8Is00AeCNISWwA+lzzX+xmsffbvTI73OOW40r9QDsu5DXglpTLl2sDSiW1NBjYCfpgYs4kyu5cx43tyBeVApdUo5ytkF3V6J/Cz5JhPkrQ05d9xNUpFym63SAbwT8r35i/AuRHxaJcxa5H0LErJ9NWq13MSwt7KjL/L2RHx34SY7RYRQ/Oi/EB3+1o4oR83JPRjlX5/P0ftBeye8O9ySFJfXpr08zr9dclYPzOUZP5zwKOJbZ6c+G8j4JbEvt0DvK9Dm5tQKn9mtXkfMHcDP7dzUaZcHk/+mXn66wpgzR68D7cD/tPw3+VO4N0N9H2HhL4d3fT3OOs1rMOTZoNuk8RYewOrRcQls7sgIqZGxN6UJ8crktrdUFJWZcRXkXd89u+Al0XEUWNdFBEnAi+jHLqUYQFKrYQ0kl4CXERJ3poekV2Rcvzxvk0El7SwpF8BPwIWbqKNmSwGHCvp2MSf0dZxAmDWjLclxTkhIvaIiFolSiPiMmBz4LGEtqdQ5u0zvDUpzi2UJ7876lwcEf+mHC98dVL7Wf+u0xdFHguslBWzhknAZyR9oIHYB5H371zXu4Gv97jNkeEEwKwZyybEuBvYcbxfVCUBeya0Dzl/D8ir+vfBGOfcb0Q8TFmQ+URC+5nVC79Eb2/+M/umpOdlBZO0KSXR6ocdJaWOzLSFEwCzZFXRmMUTQn0lIu6c4Nd+HbgxoQ9Zw/YZcU6IiNMm8oURcR7w44Q+pJz0Vi34+3RGrAlaCNgnI1BVKrmf51yIcqKkjZMTALN8z6F8KHXrrIl+YURMBc5J6EPWYTgZcSb8/Uj6eshZzQ5ltX+/d2G9PinO8sASSbEmajlJ/e7D0HECYJYv42b3KHB5lzH+ktCPQUoALurz1wMslnRi4iAcNfz8pJvmqxJiZBiUfgwNJwBm+TKGia+ou/BvDBcn9KPrv4ukKeSsCr+0y6+/gu7Pe59EzsFOr0yIkSGjH69IiJFhUPoxNJwAmOW7PyFGxlBzxlN3xt/lUbq/8UL335NFyTmS+YGEGLclxMiQ0Y9aOzJ6YFD6MTScAJjly/hQfY6kbp++X53Qj67/LlEqrNye0JdV+/z1AA9GREYCcGFCjG49DPwjIc5fE2JkGJR+DA0nAGb5sp7uur1hZcwzZ/1dMuIMQgKQkchAzvqMbl1cLRbtOg6lAl4/PUJOMtMqTgDMklX71B9MCPWRiX6hpFWANRP6cGtCjKw475U0obUEkuah1ALoVlYCcB7wt6RYE3VIRpCIuB/4aUasLnw/KZlpFScAZs3IeOJ9h6RxHydc1SE4nJz57kEaAVgKOHCCX7svsFxCH1ISgGqB53bkrI2YiFMi4sjEeDvTv3UN/wQ+06e2h5oTALNmnJsU50BJ4z1C98vAykntZ/09/pwUZxtJ7xrPF0jaENgpqf2svwfV2Q5fzoo3DnfSxejSrETEf4APAr1+Cn8U2C4iHupxuyPBCYBZM36RFGcR4JI6IwGSFpf0c8rBMhmuiogrk2L9mryn3WMk7V8N68+WpLkkfaVqO6MwE+QdLARAdYDTZpSbci+cALw8IrKmMp4UEadSjmHudrtmXRcAq0ZERsGrVnICYNaM04Csp5JFgCMknSzpbTPvDpA0p6RVJO1EKRy0aVKbkJfETF8X8aekcJOAXSmJ0VaSVqjK0aJiWUlbUBbafYG8inuXRMQNSbGeFBEnUE4t/A7l2OfsaYG7gFOBLSJisy7KS3cUEX+lLD7dg1KJMmMtzMzup/wcfQpYKyK88K8L/S5F2Wbfl5SxnchmGO9QeWMi4mFJp5F7LPA7qheS7qDse34JMHdiGzNLfdoFTiL3ON3lgenz2PdLuhp4MaXOfROyvx9Pioi7KfPoSJqbkhAs2G1Y4LqIuLnLOONrNOIxyhHWe0uaBKxATqng24Brqm2llsAJQP+4bOXo+zm5CcDMnkNeXfpZuZkyxJrpJOAAmhl5XIDm31M/bzg+ABHxKCOypz0iplEqMF7R777YM3kKwKw5RwPX9LsTE7RX9pNWRNxEzol8/fCL6phls5HhBMCsIdW+5D363Y8JuBr4QUOxv0CpQDdMpgK797sTZtmcAJg1KCKOYzCqvo3H55oqqhIRt1KmAYbJYRFxdb87YZbNCYBZ84apSMn5EdH0XPe+wN0Nt5HlAWDPfnfCrAlOAMwaFhF/AL7b737UcD+lmEujIuI+YHv6Xz++jo9GxL/63QmzJjgBMOuNXYAz+92JMUwDtoyIy3vRWEScRFkPMMj2Sy6XazZQnABMzDA8udjENPJvW82pvwu4von4CT4fEaf0ssGI2As4tpdtjsOpDNfUjdm4OQGYmH/2uwPWmOuaChwR9wAbUYbaB8nPImKfPrX9fuCiPrU9O1dSquZN63dHzJrkBGBihm1Vt9XX6M2o2ku+FoMzEvBtYNwnDmapDnFZn1KvfxD8EXhtVbrYbKQ5AZgYJwCjq/EKbFUSsBr9XRPwOPChiNglIp7oYz+mLwp8B7B/P/sBHApsWJXlNRt5TgAm5vfATf3uhKU7ISLu7UVD1XTAhvRnd8DdwBsi4vt9aHuWImJaROxGmRJ4tMfNTwV2joiPRET2QTxmA8sJwARExP3Ah/rdD0t1F7BjLxuMiKkR8THKEHgvRpUeBb4JrBgRWSfzpYqIw4GVgGPozWLbk4GVI+I7PWjLbKA4AZigiDgN+F6/+2EpAtihyWNSx2w84g8RsTqwOc2cHTCNUoN/+Yj4VDX6MLAi4p8RsQWwOnBGQ82cS5nr39hHylpbOQHozo6UIzyzz7y23rkWWK86k72vqrLBL6UsyjsReKjLkNcAXwdeHhHbVYfxDI2IuDAiNqCMkBwGdFuQ5x7gcOAtEbF2RJzdZTyzoaZhOlpZUkZnF8me55W0LOX863WAJTNjWyOmAVcBvwT2jIiBTOAkzQO8iXKk8FqUn635ZnN5AHdSEppfASeO2pNtdbb8mpTvx4bAC4BnjfEl91KONT6dklCd3e8FjzbYJO0AHNxlmGOqEayBN0e/OzAKIuJa4D0AkpYEVgXm72unbHbuAC6q1nEMtIh4mHLjOnH6/5O0ECURWBJYALgduA24Y9QXsFX78s+tXgBImsKM78dilKf824Bbq++fmc2GE4BkEXEb5QPILF21P/2/wBX97ssgiIhHKMWbGivgZDaqvAbAzMyshZwAmJmZtZATADMzsxZyAmBmZtZCTgDMzMxayAmAmZlZCzkBMDMzayEnAGZmZi3kBMDMzKyFnACYmZm1kBMAMzOzFnICYGZm1kJOAMzMzFrICYCZmVkLOQEwMzNroTn63YE++Kakx/rdCTMzGzgv7XcHeqmNCcD7+90BMzOzfvMUgJmZWQs5ATAzM2shJwBmZmYt5ATAzMyshZwAmJmZtZATADMzsxZyAmBmZtZCTgDMzMxayAmAmZlZCzkBMDMzayEnAGZmZi3kBMDMzKyFnACYmZm1kBMAMzOzFnICYGZm1kJz9LsDfbAn8Ei/O2FmZgNnDWCTfneiV9qYABwQEff2uxNmZjZYJO1AixIATwGYmZm1kBMAMzOzFnICYGZm1kJOAMzMzFrICYCZmVkLOQEwMzNrIScAZmZmLeQEwMzMrIWcAJiZmbWQEwAzM7MWcgJgZmbWQk4AzMzMWsgJgJmZWQs5ATAzM2shJwBmZmYt5ATAzMyshZwAmJmZtZATADMzsxZyAmBmZtZCTgDMzMxayAmAmZlZCzkBMDMzayEnAGZmZi3kBMDMzKyFnACYmZm1kBMAMzOzFnICYGZm1kJOAMzMzFrICYCZmVkLOQEwMzNrIScAZmZmLeQEwMzMrIXm6HcHzKw5kiYB8wELAgvM4jUFeAC4f6bXfdN/HxEP96HbZtYDTgDMhpCk5wIrVK/lgRcBC1Fu6jPf7OcD1EU7UykJwpNJQfW6G7iqel0JXB0RD020HTPrPScAZgNK0rzAcsy40c98w1+wR92YA1i4eo0lJN3MjITgyV8j4pZmu2hmE+EEwGwASJofeC2wHrAK5Ub/fLp4eu8xAS+oXhs+5Q+kB4CrKQnBn4EzIuIfPe+hmT2FEwCzPpA0N7AWsH71Wp3RfT/OD6xavd4HIOkO4A/AGcDpEXF9/7pn1k6j+oFjNlAkzQGsxowb/lqUBXht9RzgvdULSTdQkoEzKCMEt/eva2bt4ATArCGSXgq8hXLDfy1lUZ7N2jLAB6oXkq6kGh0AfhsRD/ava2ajyQmAWSJJi1OearehDHnbxKxYvT4KPCjpBOAIyujAtL72zGxEOAEw65KkKcBGlJv+m/D7Ktt8wNbV61ZJPwGOjIjL+9sts+HmSoBmE6BiHUmHAncAxwBvwzf/pi0FfAa4TNJFknapRl3MbJz8YWU2DpKWpTzpb0UpvmP9M31nwX6STqVMEZwSEY/0t1tmw8EJgFkHkgRsCnwSWLvP3bFnmgN4e/W6V9JRwH7eWmg2Nk8BmM2GpMmStgIuB47HN/9hsDBl4eDVkn4sacV+d8hsUDkBMHsaSXNJ+hClet2RwEv63CUbvzkoUzWXSzpO0ir97pDZoHECYFaRNK+kXYDrgEPxHP8omAS8C7hY0i8lvabfHTIbFE4ArPUkLShpd+AG4ADKSnMbPW8DzpV0uqT1+90Zs35zAmCtJWlRSV8BbgT2ARbrc5esN9YHTpf0Z0lv63dnzPrFuwCsdaq6/LsAX6I95XkfBO6fxesRymE9C8ziNXdfeto7awK/lHQB8NGIuKjfHTLrJScA1iqSXgccBKzU774keAz4J3DVTK+bgft46k3+gYmUz5U0J09NCBYEFgKWpRxXvGL16/MYnmOLZ2V14AJJhwB7RMS9/e6QWS84AbBWkLQE8A1KOdlhcwczbvBXzvT7GyLiiaYajYjHgX9Xr9mSNC+wPCUZmDkxWJ4yujAMJlG2D75L0m4RcWS/O2TWNCcANtIkTQZ2BL5KeXoddNOAi4E/UE7DOzci/tvfLo0tIh4CLqleTyFpGeD1zDgG+Xm97NsELA4cIWl7yrSAzxuwkeUEwEaWpDWB7wKv7HdfOriMGTf8P0bEf/rcnzQRcQNld8WPASQtB6xHSQbWo9xwB9HrKFsHDwD29HHENoqcANjIkbQosC/wQQZzbvoaZtzw/xARd/a5Pz0TEddQ/v6HAkhaiRkJweuBRfrXu2eYE/gfYAtJn4iIE/rdIbNMTgBsZFQ1+7enbOlbtM/debobKVUFj4yIq/vdmUEREZdRRkC+I2kSsAGlgt87KccAD4LnAz+vDhz6eERc2+8OmWVwHQAbCZKeDfyK8mQ5KDf/+4EfAusCL4yIL/jmP3sRMS0ifhcRWwPPAbYDTqesixgEbwYulbRdvztilsEJgA09SetQFs69pd99AZ4Afgu8D1giIj4YEX+MiOhzv4ZKRDwQET+OiDcASwOfBa7oc7cA5gV+VB00NCgjFGYT4ikAG1rVkP9ngP+l/z/Lf6ecR//TiLi9Hx2QNDewHLAkZd/+zAV+Zvf7uSh1A/4D3Fu9xvx9RDzcs78UEBG3UNZ07Cvp1ZStnO+lv5UbtwFWk7R5NY1hNnT6/aFpNiHVkP8R9P+p/9fAXhFxbq8alPRcnrnnfgVgGXowqifpUUpCcANwIXBR9fpHRExtsu2IuBC4UNJuwJaUkYHlm2xzDC+hFBDaKSJ+0Kc+mE2YEwAbOtWQ/8/o357yacAJwN4RcXFTjVQjHCtRVsi/mhk3+gWbarOmuYElqtcaM/3/RyT9jRkJwUXA5U0kBVWRosMlHQG8G9gDeHl2OzXMA3xf0nrADhHxQB/6YDYhTgBsaAzAkP9U4Chgn4i4sokGJK3AjD3y6zJcBxRNoSQET08KLqUkA9NHC9KSgqrE8TGSjgXeQUkEVs+IPU5bAq+upgQu7UP7ZuPmBMCGQp+H/B8FfgR8rSpsk0bSC5lxw1+PMn8/SqZQbsgz35Tvl/RryijKrzOemqtFlicDJ0vakJIIvL7buOO0AnC+pF0i4tAet202bk4AbOBJWgs4ht4P+T8IfA/YPyJuywoqaUXKIrItgBdmxR0iCwDvqV6PSDqNkgycnFEFMSJ+B/yumirag7J9r1emAN+rpgQ+5CkBG2TeBmgDTdKmlIp5vbz5B3A48KKI+FTGzV/SYpJ2kvQXyna2z9LOm//TTQE2ony/75R0mqSPVIc3dSUizo6ItwDrAL0elt8COFPSME3hWMs4AbCBJWkH4Dh6ey7934HXRcT7uy3RK2mKpHdLOhm4Dfg2ZTGfzdocwIbAIcBtks6qkoF5uwkaEecAqwKfpGx57JVXAedU0zxmA8cJgA0kSV8CDqZ3P6P3A7sCq0bE2d0EkrSOpEMpx/hOX5zm6bbxmUR5cj8EuFnSPpKWmmiwiHgiIg6gbJv8WVIf61gOOFfSyj1s06wWJwA2UCRNknQw8OUeNns0sGJEfGuiq9NVbFIN8Z8FfIjhOH54GDwL2B24XtJPJa020UARcXtEvI9y5kAjOzlm4TnAHyWt26P2zGpxAmADo6pkdyywQ4+avAp4Q0S8d6Lz/JImS3ofZY75F3iIv0lzUkosXyDpbEmbSZo8kUARcQbwCspajIcS+zg7CwGnStqsB22Z1eIEwAaCpAWBU4FefEA+BHwOeEVEnD6RAJLmkrQ95Snyp5SCPdY7awPHA/+UtGv18zMuEfF4ROxLqej3i+wOzsLcwLHV2hazvnMCYH0n6TnAnyiFb5p2MbByROwTEY+N94slzSNpZ+Ba4DDgxdkdtHFZBtgfuK7aZTHutRYRcVNEbEo5X+D+5P493STgYElfbrgds46cAFhfSXoxcC7Qi0VS3wVeExH/HO8XSpqzqj9/A3Ag/StDbLO2KGWXxWWS3j6RABFxNGXl/iWZHZuNL0k6WJI/g61v/MNnfVOtjD6H5vfD3wdsHhEfi4hHx/vFkjagzPF/A1g8u3OWagXgFEm/l/SK8X5xRFwDrEnZgdK0HShTAt4hYn3hBMD6QtKLgN/S/A31IsrWvuPG+4WSlpR0NPB7yvYxGx4bABdLOqyaYqotIh6NiI9SKhU2XTdgM+AH1TkXZj3lBMB6rqrydhrlNLkm/R+wVkRcO54vkjSHpF0pC/ze00jPrBcmAdsD10jaQ9KU8XxxRBxLKSD01yY6N5NtgH0bbsPsGTz0ZD1Vrdb+DbBsg838F/hgRPx8vF8o6XXAQQz3qv6HgZuBG4GbgHso5xo8VP364Ez//RgwH6U+//yz+XUBYClg+eraYTM/8FXgw5I+FBGn1f3CiLi2Ootif+BjTXUQ+LSkOyLiWw22YfYUTgCsZ6p9/icCr2ywmQuB90TEdeP5ompU4hvA1o30Kt80Sh2Dv1J2NlxPudnfGBF3NdFgNUw9PRFYoXpN//0yDP6I4gsoe/G/A3wmIh6p80XVupGPSzoT+AEw7i2HNe1fJQG9rFRoLeYEwHqiWu38E8qRt005Cdii7gf7dJI2phz3u0gjvepeAP+gJDd/paxruCQiHuxpJ8qRu7dUrzNm/rMquXsZM441fi3N3Si7IWBnYANJW0bE3+p+YUQcL+lKSr2KCZcl7tC3H0u6uzrR0KxRKu/p4SApo7OLRMS9CXFsHKryvk0WQPkB8JGIeKLuF0iaE/g68InGejVx/6askzgVODUi/tXn/oxLVaHvVZRkYH1K4Z5Bmz54DPg85bjnaXW/SNLSlAWsKzTUrweAdSPioobi22xURZq63QFyTERskdGfpjkBsMZVRU++1GATe0fEHuP5AknLUMoOT7iufLKgPOH/hnLTP388N6VBVyVbqwNvBbYElu5vj57iTGCbiLi57hdIejbwK8rfqQl3AmtPpGaFTVzbEoBBn7OzISdpR5q7+Qew8wRu/u+kzJsPws3/FmAvYLmIWD0ivhQRfx6lmz88WXb3nOrf6oXA64HvUxZs9tu6wKWS3lv3CyLibsrIxm8b6tPiwG+rtSlmjXACYI2R9C7KVrwmPAa8NyK+M47+zCXp28AJwMIN9auOx4DjgLcAS0fE58e7VXGYRfGniPgQZSvou4GTFMWkpAAAIABJREFUgcf72K2FgaMkHSlpnjpfUK3BeAflLIgmvAj4zUTOOTCrwwmANULSGpRFf038jD0AvC0ijhlHf15EKTm8UwP9qetSYBdgyYjYPCJOHbUn/fGqiu4cHxEbA88FPg5c3ccubQX8QVKtAlUR8Thl50hT2/deCRznksHWBP9QWTpJiwDHUE4/y3YXZYHU78fRn7dSVs+/qoH+dBKU78WrI2LliPh2RNzTh34MvIi4JyIOopzOtwUlYeqHNYDzJNWq/liNaOwKfKah/ryRsljRLJUTAGvCD2lmkddNlIVRtVdHS9qWsj1woQb6M5agHFf7iojYwiu664uIadXozirARsD5fejGC4FzJa1b9wsi4uvAByg1GrJ9UVKTW2ithZwAWCpJuwCbNBD6HuBN1WEtdfvyacr+/l7WuwjK2fKrRMS7I+KyHrY9Uqon61MiYk1gQ8pq/V5ahLIQr3ZxqIj4EWWaJ9tk4KdeFGiZnABYGkmrUfbVZ3uIMud/Zc1+SNL+wNcoxVV65WTgVRGxaUT0a/h6JEXE7yNiPUo9gXN62PRcwBGSvlj3CyLi/yilh7M9F/iJ1wNYFv8gWQpJC1HmuudKDj0VeHdE1BoGrvabHwHsmtyPsZxOmePfOCIu7mG7rRMR51KqDG5H2SvfK3tKOrz6+eooIr4AHNZAP96A1wNYEicAluUHlHnTTAFsHxG/rnOxpPkoT+FbJfdjdu4Bto2IN3iOv3eqqYEfUyrxHUQzc+6zsi3lLIG6FQ13pJx9kc3rASyFEwDrmqSPU841z7Z79UFfpw+LUp7E39xAP2blp8CKEXFEj9qzp4mIeyPi48CrgfN61Oz6wEl1jhauylK/F/hTch+8HsBSOAGwrkhaFdivgdDfqlZV1+nDksDZlO1bTbseeHNEbFVVg7M+q6Zd1gK2B3rxb7IBcHyd6YDqYKqNyN/S6PUA1jX/8NiEVRXKjiV/v/9RwKdq9mFhSu38Wnu2u/AE5Uz4lSKiqfKvNkHVtMAPKD8Hv+xBk2+jPIVP7nRhRPyXMjJ1Q3IfvB7AuuIEwLpxGLBscszfAdtFjVOqqpKtpwAvT+7D0/0DWD0idouIhxpuy7pQFVnaCNiN5ksLvxv4oaSOO00i4nZKQZ+7kvvwxfHUKjCbmRMAmxBJGwObJ4e9GtisKq/aqf05KLsO1knuw9MdB6wREX9tuB1LUo0G7E/ZLXBDw81tQ1mI2FFVw+KdlJ0tWSYDP6izJsHs6ZwA2LhJmhc4MDnsI8DmEXF/zesPoxzE0pQngE9XNfsfaLAda0i1dfSVlMJMTdpR0jfqXBgR5wDjOr2yhhcBn02OaS3gBMAm4vPkl/r9RET8rc6Fkr5G2QfelLuAN0ZErQ91G1zVToFNgZ0ppzA2ZTdJX6557TeAWltbx+EzkpZLjmkjzgmAjYukFai5QG8cjo6I79Vs/1PAp5Pbn9lfKNX8zmiwDeux6tjotYBbG2zmS5J2rNGXoEwd3JLY9tw0d/S2jSgnADZeB5Fb7e8a4MN1LpS0DeXpqSk/AF4bETc32Ib1SVWs6TXAFQ02c6Ck19Toyz2UGgGZ6wHeKOndifFsxDkBsNokbUHZA52l9ry/pDdQbtBN1PYP4JMRsX1EPNpAfBsQVXK3DnBuQ03MSakR0LFIT0ScDXwhuf1vSZo/OaaNKCcAVoukBSj74DN9MiIuqdH2kpTaAE2c6jcN+HBEHNBAbBtAEfFvyh76UxpqYkng2GqnSidfo9SxyLIU8OXEeDbCnABYXXtSPtiyHBMRh3S6qCq0chSwWGLb000Fto6I7zcQ2wZYRDxM2ZL3g4aaeB01pquq9QBbk7s2YRdJKyXGsxHlBMA6kvQKYKfEkP+k5rw/JfF4fWLb0z1GmX44qoHYNgQi4omI2B7Yq6EmPiHpvTX6cTdlPcATSe3OARxcp0CRtZsTABtT9SHyXfKG36cB742I+2q0/Ubgc0ntzuxhYOOIaHp/uA2BiPg8sEtD4b8vqWOlyog4i9xEZB3KTgOz2XICYJ1sC6ydGO+7EXFhp4uqef+fkL/o7wHgrRGROe9qQy4ivg18qYHQ8wInVGdWdLIPcG1i29+QtEhiPBsxTgBstiTNDeydGPJf1Di8pJr3/xn58/4PUgr8nJkc10ZARHyFmmV9x+nFQMdjrauTAzOn2hYDdk+MZyPGCYCN5QOUY0ezfKo6Ga2Tr1AWUWWaBrwvIv6cHNdGy86UEy6zbSRpq04XRcRvyC1d/FFJz0qMZyPECYDNUrWFKbPi3h8i4qc12n0TzdQ13y0iTm4gro2QiJhGWZV/egPhvyXp2TWu24UyWpVhfkpSY/YMTgBsdrYElkmK9TjwsU4XVbUGfkj+vP/BEfGt5Jg2oiLiMcoWwYuSQz8b6FhvoipW9L+J7e5cvbfMnsIJgD2DpEnkPoXvHxF1yq9m1xqAUmQlc17VWqCqTvkWSqnqTFtKenON675JXsniRYCPJsWyEeIEwGblXcAKSbFupMbTTFVrIHuo8u/AeyIia3+1tUhE3EVJAuqsWxmPQyTN16HtWqNm47CrpHkS49kIcAJgs5K5936XiHhorAuqWgMHA5MT270DeHudegNmsxMR1wIfTA67NPDVGm3/gVIFM8PiwPZJsWxEOAGwp5D0DmDlpHC/jIiTalz3AcpRrVkeBzaJiJsSY1pLRcTPge8kh91Z0uo1rtsNyEpiPy0p8yRPG3JOAOzp9kiK8wSwa6eLJC1KORAl054RcX5yTGu33YCOBazGYRJwmKQ5x7ooIm4H9k1q83m4OqDNxAmAPUnSBsAaSeGOjYg6C6j2BRZNahPgbPI+MM2AJ3cGbA7cmxj2FdRIkinFibLa3b0qtGXmBMCeomOVvpqCGhUEJa1J7vzqfZTT/bzoz9JFxPWU6apMu3cqE1ytY8maglgW2CIplg05JwAGgKS1gHWTwp0UEZd1aG8yZeFf5p7/nSLihsR4Zk9RHSB1YGLIhak3CnAg5RyLDJ/1SYEGTgBsho8nxqpzqtk2wCqJbR4XEUckxjObnU8DlybG+0S1Fma2IuIe4JCk9l4GrJ8Uy4aYEwBD0oLAJknhftvptL8GCg3dCuyQGM9stqr1ADtSproyLEC9stv7A48ktenFgOYEwIBS+CerSEidp//NgeWS2gPYLiL+nRjPbEwRcS7wo8SQH5e0RIc276CUys6wWadiRDb6nAAY5D0N/CkizhrrgmruMfPp/+iI+H1iPLO6PgNkJZ7zUu998TVKnYtuzQdsmhDHhpgTgJaTtDR5R+/Wefp/B2X7U4ZHKB/CZj0XEXeTm8x+RNJSHdq8CfhJUnueBmg5JwC2NTkr8f8SEafVuC6r0BCUQ4Zc7c/66fvABUmxplBvK+4+wLSE9tbvlHDYaHMCYFsnxdmn0wWS3gDUKX9aR2aFNLMJiYhplAWBGTdkgA9KWqZDm9cAxye0NQnYKiGODSknAC0maQ1g+YRQdwKn1Lgu8+l/j4jI2hdtNmER8VdKTYsMc1LvVMzvJ7WX9QBgQ8gJQLtlzQH+LCKmjnVBcqGhi4EfJ8Uyy/BF8gr1bCNp7g7XnE7Z/tqtl0laNSGODSEnAC1VnQqWVRL0yBrXZB4x/Mlq6NVsIFTbUA9KCrcosFmH9qYBP01qz4sBW8oJQHu9DXhWQpwrIuKisS6Q9HzgrQltQSkz/MekWGaZvgk8lBTrwzWuyap8+V5JcyTFsiHiBKC9srL+Oh9CW5FX87/jYkOzfoiIO4FDk8K9XtIKHdq7HPhrQluLA29OiGNDxglAC1Wnj2U8kQf1hiGzko1zI+L8pFhmTfgG8GhSrA/VuCZrFGDLpDg2RJwAtNPrgbkS4pwZETePdYGk1YEVE9qCUgvdbGBFxG3klevdtlqrM5ajgDEX4Na0oU8IbB8nAO2UdRJYnaePrKf/a4ETk2KZNSmrXO+z6VCuNyLuAk5NaGtRYOWEODZEnAC0U0YC8BDw87EuSN5pcIBX/tswiIgbqbczpo46iwGztsT6iOCWcQLQMpIWB1ZKCHVSRNzf4Zq3UZ4suvUfck9eM2vafklx1pPU6eTMU4B7E9pyAtAyTgDaZ72kOHUOJMka/j8kIh5MimXWuIi4grwzAt7Voa1HySkN/DpvB2wXJwDtk5HlPwacOdYFkhaljAB063Hg/xLimPVa1tB8nffRbxPaWQB4dUIcGxJOANonIwE4LyI6FTzZglLXvFunVSurzYbN0ZRkuVtrSupUtOtMyrbcbnkaoEWcALRIVZHvxQmhzqhxzcYJ7UD5EDUbOlV54DqHZHUymQ6FeiLibuDvCW1tkBDDhoQTgHbJyu7HTACq1f9rJ7TzCHBSQhyzfunlNECdxLyTtWocRGQjwglAu2QkAA8C53W4Zg1g3oS2flNjp4HZIPsN5bjsbr1Z0uQO1/whoZ0pwFoJcWwIOAFol4wE4OyI6FTkJGuk4ZikOGZ9UR2TfVRCqGcBr+lwzR+BJxLa8jqAlnAC0BLVXuLnJYSqM8yYsdXwIXLmT836rSfTABHxX+DihHacALSEE4D2WDcpTqf5/3mANRPaOaXGTgOzgRcRlwC3JoTq1TqA1SVlTOHZgHMC0B4vT4hxL52PH10LyFhE5OF/GyUZN+aXS3pBh2sy1gHMQd4BXjbAnAC0x/IJMc6sUY8/Y/jwEcriKbNRkZEAALyuw5+fRc5BRE4AWsAJQHuskBCjV/P/f4mIRxLimA2KrARglbH+sCqZnVGCOOPzwgacE4AWkDQF6DR0WMf5HdqZH1gtoZ2zE2KYDYyIuIlypHW3xkwAKhkJgEcAWsAJQDssR86/9VUd/nxtyvxht5wA2CjKGAWokwB0ep/W4RGAFnAC0A4Zb+Z/VduMxpKx0DCAcxPimA2ajARgUUmdtvNmJADLS1JCHBtgTgDaISMBqPOhkjFseHlEZJxtbjZoMlboQ+dRgIwEYB5ypg1tgDkBaIdhSgA8/G8jKSL+BfwjIVSnhYC3A/cltON1ACPOCUA7ZCQAV9a4xgmA2dgyKvWtXOMarwOwjpwAtEPjIwCSng0smtCOEwAbZRk35l4tBPQIwIhzAjDiJC0BLJQQqtMHSsaHxT0RcWNCHLNBVWckrZNlJS3Q4RqPAFhHTgBGX8ab+DHg+g7XZCQA1yXEMBtkGTdmASv1oB2PAIw4JwCjLyMBuDYiOh0z6gTArLOrgU7ltOtYqsOfZyQAS9YYabAh5gRg9GVs5enVDoBOowxmQ60qcX1TQqglOvz5NZSaGt3yVsAR5gRg9GVk8L1KADwCYG2QsQ5gzAQgIh4mJ9FYMCGGDSgnAKMvIwG4Y6w/lDQnsExCO04ArA0yhuc7jQBAh/dtTZ4CGGFOAEbf/AkxHujw5wsCkxPacQJgbdD4CEDl/oR2nACMMCcAoy/jDdzpgySjjanAzQlxzAZdxs+5EwDrmhOA0ZfxBu40ApAxynBzRExNiGM26DLK9NZJADLa8RqAEeYEYPRl3Jx7MQJwe0IMs2GQ8WTuEQDrmhOA0deLEYCMNh5OiGE2DDKezOeV1Cm5dwJgY3ICMPqGZQTACYC1RcaNGTqPAjgBsDE5ARh9w7IGwAmAtUVWAvCsHrTjBGCEOQEYYZImAfMmhOrFFMAjCTHMBl5VDfDxjFAd/jwjAfAiwBHmBGC0ZTyZB14DYJYt4+bc6XwOjwDYmJwAjLaMN+9DEdHpScMJgNn4ZCwEdAJgXXECMNp6UQQIckYaPAVgbdJpVK0OJwDWFScAoy2jPG+nDxnIOd7UIwDWJlMSYnR639V573aS8RliA8oJwGjr1RPAgwntZHxYmQ2LjMV1nd4zvRoBtCHlBGC0ZQwzztejdhZKiGE2LDJuzk4ArCtOAEZbxpt3sqR5OlyTkQAsnBDDbOBJmgPo9J6qwwmAdcUJwAiLiMeBRxNCdfogcQJgVl/W3nonANYVJwCjL+Pm3GmVf0YbiyTEMBsGTgBsIDgBGH29WAiYsQjQIwDWFllb6zrtnHECYGNyAjD6PAJgNlgyRgAejoj/dLgmIwHIKFhkA8oJwOjrxQiA1wCY1ZeRANxS4xqPANiYnACMvow3cC9GABaSpIQ4ZoMuIwG4ucY1TgBsTE4ARl/GzbkXIwCTcS0Aa4fnJsTwCIB1zQnA6OvFCMAd5Gw3XD4hhtmge2lCDCcA1jUnAKMv4+n8WWP9YURMA65NaCfjg9Fs0L0sIUadBGDRhHa8CHCEOQEYfRkZfJ0n86sT2nECYG2Q8XM+5hqAqtrgsgnteARghDkBGH3/SoixQo1rnACYdSBpSXJ2vHQaAXghMGdCOxmfHzagnACMvqsSYvRqBCBjaNRskGX9jHdKAFZMaOO/EXFHQhwbUE4ARl9GArBA9eQylowEYGlJdU4fNBtWGQnAIxFxd4drMhKAjPe0DbA5+t0Ba9wNlBX6c3cZZwXgtjH+POPDQpQProsSYg0kSXNRFmc9e6Zfnz2L/16UUuv9QcpCzgdn8/v7KEneZRGRUZLZmpUxzXVdjWsyEoCMhwcbYE4ARlxETJP0T7p/8lgB+MMY7fxL0n/pfi//SxnSBKAaJVme8r1aDliCZ97ks+rAP11Iuha49Gmv6yIiGmrTxi9jBOCCGtc4AbCOnAC0w1XkJACdXA2s1mU7A70OQNK8zLjJz/xanuZu7rW6Bry4em060/9/QNLfgb8AJwF/ioipfeifFRkjAOfVuMYJgHXkBKAdMt7IvUoA1u7y61NIej7wEp55o38e5WY7LOYHXlO9dgb+LekU4BfAaRHR6UQ5SyBpAWA7cnYAnN+hrcXoULujJicAI84JQDv0KgG4IqGdNSUtGBE9K0AiaW5gVWAtyo1yLXLKtQ6iZwHbVq8HJZ1KSQZ+FRH39rVnI0jSa4APAZsDGQtcHwT+3uGaOu/VTgK4JiGODTAnAO2QkQAsI2nuiBir5O9ZCe3MAaxHGa5uRDVXP/1G/xrKzb/bRZLDaD5gs+r1uKQzgAMj4jf97dZwk7QosDXlxp9d2+LCiHiiwzUZw/83eXRo9DkBaIeMBGASZX758jGuOR94BJjSZVtvJCkBqCqircxTn+6Xzog9YuYE3gS8SdIlwD7A8VWZZ+ugOslyfcpNfxOaSyjHHP6veP7fanEC0AIR8R9JdwGLdRlqFcZIACLiUUnnA6/vsp0NJ/qF1QfxasDbgddVv5+3y/60zSrAMcA1kr4GHBkRj/W5TwOpGk3aDvgg8KIeNFlnAeAqCe04AWgBFwJqj4w39Po1rvljQjvLSVqm7sWS5pH0dkmHArdSnpK+QElEfPOfuOWA7wPXSfqkizQVKt4s6STgJmAvenPzhw4JQLWeZa2EdpwAtIATgPbIKNRTJwE4M6EdKNMAsyVpCUkfrD6E7wZOoQy/jurivX5aCvgmcKOkL0rKWMk+dKpE88OUUbDfABsBk3vYhZsj4vYO16wJzJPQlqsAtoATgPbIWKG/jKROTzrnARnDxc9IACStJOlzkv4M3E55Ot0IP+X3yqLAnpREYG9Jz+53h3pB0nMk/S/laf97lO2h/VBn+L9Okl5HxueFDTgnAO1xdlKcMT9gqpXDdSqVdWxH0hRJ60s6QNJ1lO1Pe1GecoZpL/6oWRD4LHCDpP0kPaffHWqCpJUlHQ7cCHyeUsmxn/5c45r1Etq5MSI6HTZkI8AJQHtcSM7Z3r1aB7AIZWj/dGAXyvGmNljmAz4FXC/pO1XxpKEm6bmSPlJtibyEUi9hrj53a7pfjfWHVZXKNRLaOSMhhg0BJwAtUZV/zbgx93IdgBedDYcpwMeBayX9WtL7JWVUousJSS+V9FlJ51EWkR5CzpN0pksjotO8/NrkJCunJ8SwIeBtgO1yBmV7XDeWkPSyiBirHsC5wOOUveXWHnMCb6leU6un6OOBX9Q4vrZnJE2irJTfuHot198e1XJ8jWuy5v9ne+iXjRYnAO2SNbS3AWPXA3hI0unAm5Pas+EzB2Uh5xuBgyWdSRnCvpjyNPvvXnRC0jyUA6ZeAby8+nUVcmrl99JxNa7JSACujIixjv22EeIEoF0upcyrd7uYaX3g2x2u+QlOAKyYTEkaN5j+PyTdwowji/9W/Xoj8HDd6oPVk/yC1Wuh6rU4sBIzbvYvZvinOi+PiCvHukDSgsCrEtry/H+LOAFokYiI6knsXV2GWlfS5A41yU+kHFziefxnmgrcA9xFScjunun303+9h3Ljmm8Wr/kpRw+vQLnJDdvTLJRTFZ8HvPXpfyDpEeChWbym3/Cn3+znox27Qeo8/b+OnJoETgBaxAlA+5xB9wnAQsCrGaMueUQ8KOlEYMsu2xo2D1NOUbuaUk3tep55c783IiKrQUlLURKBlatfX0FJDob1/T2leg1jYtOEOvP/G3S+pKMgbwGvDYFh/YCwicvK8N9D54NJfsJoJgDTKEVhrmLGjX76rzdn3tzriIhbKavXnzzFrzp//u2UZO8t5FSHs967osOC2+lTIe9OaOtvEXFPQhwbEk4AWiYirpJ0K6W8azfeJ+l/OkwD/B64kzIvO6xuouxquJQZN/p/RsQjfe1VBxFxP/Az4GdVDf+3UZKBt+JpmWFS9+m/2/czePtf6zgBaKczKOeVd2MJygrv2Z4dHxFTJR0N7NxlW73yGGWV+rnV68/V0/VQi4gHgWOBY6tV8W8FPsbg7XW3Z6oz/79NUlue/2+ZYV8daxOT9Uavk0T8NKmtJvyLsljx08A6wEIRsWZE7BoRx4/Czf/pIuLhiPh5RKxPKRxzar/7ZLN1dUT8fawLJM0PbJrQ1lTgrIQ4NkQ8AtBOWUN9m0haoBpunqWIuEDSNQxGsZUrKIuczgXOjYjr+tud/oqIc4G3SHo1pdb9RrRjVf2wqPP0vxk5h2FdMNb72EaTRwBaKCJupt7BIp3MQ70dBT9JaGsiHqckO58Alo2Il0bERyPiJ22/+c8sIi6MiE0oBXKOpSxytPGbBmStDXkC+EGN67KG/49JimNDxAlAex2ZFKfONMAvk9qq49+UaYctgMUi4g0RcaBv+J1FxKUR8R7gpcCPKAmUdXYv8E1K4ausEZRjI+L6sS6oDl/KWMcxlbJg1FrGCUB7HUNZ9NatdSW9YKwLIuKvwJ8S2pqdq4D9gNcDi0fEVhFxTET8t8E2R1ZEXBURH6BU0fsOpbaBPdNlwA7AUhHxKcqBSHMnxf56jWu2IifhODUi7kqIY0PGCUBLVbXYxzxetCZRb6//VxPamm4aZS7/U8DyEbFiRPxPRPypw7ZEG4eIuCkidgaWBvYGnFCVofkTgPUi4uUR8b3q7Is3U9ZQZDgtIi6pcV3W8H/WaKANGScA7XZEUpyO0wAR8TvggqT2BHwhIr4ZEdckxbTZiIi7ImIPSiLwOUpth7a5G9gXeFFEbBYRZ07/A0lzAgcktvW1ThdIWh1YMaGt/wInJ8SxIeQEoN1+Tak5362XVB9InWSNAgg4TFLG2edWU0T8NyL2AZYB3ktZMDjKK8evoEwtrQc8NyI+GxE3zeK6XSillzNcFBF1tulul9TesYNe1Mqa4wSgxSLiMfJW//5PjWt+Samol2FFytOo9VhVS+DoasHgYpQqg99n+EcGHqHURdiJ8qT/0mpq6cyImDqrL5D0HOCLiX2o8/S/GLBtUnse/m8xJwCWNQ2wqaQxhySrGvl7JbUH8FlJL0mMZ+MUEY9GxK8j4kPAcymn0n2TcgjSMLgZ+B5l/n7RiHhLRPxfpxX4M9mXcjJjhmuBn9e4bldy9v5fD5ydEMeGlAsBtVxEnC/pamD5LkNNAj5L5yeT4ymr9jOGTOcCDpX0ul4fwGPPFBHTKNXkzgI+VSVnr+SpJxUu2afu3Q9cTlm5/+QrIv410YCS1iBvIR7AftX3cKw2FwY+mtTekX7ftJsTAIMyDPi/CXHeJ+nLYz09RcQ0SfsAhye0B6WE74cpT3E2QCLiCso8+lHT/5+kRXnm0cXLUA4omjLRpoAHKDf5+ykL267hqTf7G5OPYBZli2TWvv87qfee2BlYMKlND/+3nIYpAZSU0dlFIuLehDgjQ9IywHXkfJgdEhE7dmhvDsoH9DIJ7UH5wH9JRNyeFM/6QNJkSiIwHzD/LH4fwH2Um/zMvz7Q6ydZSR+gXqW+uj4fEWNOj1V1/28EnpXQ3p8jYq2EOCNF0g7AwV2GOSYitsjoT9M8AmBExA2SzqLM33br/ZL+NyJuG6O9qZL2BQ5JaA9gIcrTWJ2yxDagqhoO91WvgSVpIWCfxJD/Br5b47odyLn5g5/+DS8CtBkOTYozN6VATyeHU55msmwmaePEeGazcyCweGK83SPiP2NdIGkK9d5XddyPS/8aTgBshqMp0wAZPiLp2WNdEBGPUuYzMx0kKWtFttkzSPooeVvwAM6jbKHs5IPAc5LaPNjToAZOAKxSDb923INc03yU4iid2jyZ3CpkS5H3dzB7CklrkVvx7wlgx07rF6pKg59OavNhyjZNMycA9hSHA7cmxdpJUp3VyjsDDyW1CbCjpPcnxjND0nMpW1jnTAx7UM2a/1sDYx64NQ4/6Gbro40WJwD2pKoy4DeSwi1EqQvQqc0bydmCOLNDJGUsaDSb/gR+HKXQUZbbgS/UaHte4EtJbT5OvVMGrSWcANjTHQZkHQ06vRhMJ/tT9otnmQs4QdKLE2Naex0ArJ0c81MRUWe3wxfJe/o/IiJuToplI8AJgD1FRDwEfCsp3JzAQTXafJy86mbTLQr8sqqcZjYhkrYj/2fzjIjouAq/Sp53TWrzCUrZYrMnOQGwWTkIyFolvJ6kLTtdVB2vmr03eQXg+KrwkNm4SHoV3ReFebrHqJ9QfJe8NQfHRMQ/k2LZiHACYM9QDU1+JzHk/lXxlE52Iy/xmG4DaoxCmM2s2sZ6AhMvTzw7+0XEVTXa3wpYN6nNILdwkY0IJwA2OwdS6qtnWAJfaPVVAAAYRUlEQVT4aqeLIuJOmjni98OSPtlAXBtBVUnio8mbe5/uBmq8D6pkeb/Edk+KiMsS49mIcAJgsxQR95BXqhfgo5JWrXHdIcBvEtudbj9Jb28gro2eb1NGjjI9Abw/Ih6uce1elKQ5S+YR3DZCnADYWPYHHkmKNQk4WNKYP3NVUZStKee0Z5oE/EzSK5Lj2oiQNEnSoeQv+gPYo1rn0qkPrwLGPExrnH4bERcmxrMR4gTAZisi7gD+LzHk6sCHarR7D7A5Zd9ypvkpOwOWS45rQ64a9j+CGj+fE3ASNfbfV8nxweR9Lk+jRq0Bay8nANbJnsAtifH2kbRYp4si4jzgM4ntTvd84BxJqzUQ24aQpLmAY4GOu1Um4Fpg25rHFX8YyPy5/H5E/CUxno0YJwA2poh4AMhcQLcINc9Rj4hvUVZiZ1sM+IOkNzUQ24aIpHmAE4FNGwj/MLBZRPy3Rj+WJ68KJ8Dd1KjEae3mBMA6iojjgd8mhnyHpLpHm36A8hSVbT7glGq7lbWQpPmBXwFvaaiJj0bE32r0YwplBGL+xLZ3j4h/J8azEeQEwOr6OPBoYrx9JK3Z6aLq6endyW1PNydwhKTdGohtA6yqEHkasF5DTRwWEYfXvPYAYOXEtv8M/DAxno0oJwBWS1VFLPOo3TmBoyUtUqPtiymnBjZBwDck7S9JDbVhA6Qq8nMG8JqGmrgI2KlmX7YAPpLY9hOUkYc6aw6s5ZwA2HjsA1yXGG9pyhHEHUXEoeSXCp7ZrsCR1clvNqKqY33/CLyyoSb+A7wrIjqOWFW7UQ5Nbv+7NY8YNnMCYPVFxCPUfLIZh43GUaXvg8Cpye3PbEvKNsHMuVgbEJJWAc4CXtpQEwFsFRE31OjL3JR5/wUS278Db/uzcXACYOMSEb8GfpEc9muSVq/R9uPAZsA5ye3P7I2UHQKZZ79bH6n4JHA+sGyDTe1UvT/qOABYJbn9/6mz48BsOicANhG7AA8mxpsTOKbO0b3VccVvBzquru7Cq4G/S3p3g21YD0haglJa+pvAXA029cmIqHXolKTNgR2S2/9jRPwkOaaNOCcANm4RcTPwleSwywA/qtn+vZQn9WuS+zCzRYFjJf20TmJig0fSW4FLgabrPXw6Ig6oc6GkFwOHJbc/FfhYckxrAScANlHfIv8pfBNJX6pzYXVy4IbkVimclfdRRgM2bLgdSyJpbkkHUvb4L95wc3tERK0CPtWOlxOBBZP78PWIuDw5prWAEwCbkGo+/j3kHRk83ZclfbhmH26kJAF3J/fh6Z4H/FbSdyTN23Bb1gVJLwMuoLltozPbMyL2rnNhVXHwl8DLkvtwLlAraTZ7OicANmERcRX5c5kA35W0Sc0+XAm8GbivgX7MTJRiSBdLWqPhtmwCJO0I/AXoxYmPe0fEl+tcKGkOyor/tZL7cA+wRURMTY5rLeEEwLoSET+lZm3/cZhMObr3tTX7cBHwDvJHI2ZlecphQl9xzYDBIGkxSScB3wXm6UGT34iIPcZx/aGUhauZgnLIUPax2dYiTgAsw07AZckxpwAnS3p5nYsj4k/A6yl7oZs2mbLf+ry6/bN8kuaX9AXgn8BGPWr2gIj4dN2LJe0DvL+BfuwXEb9qIK61iBMA61pEPAxsTu7WQICFgVMlLV2zH3+llHe9Krkfs7MqcEm1U2D5HrXZepLmkrQT5ZCor5C/qG52DoqI2idjSvoEsHsD/TgX+FwDca1lnABYioi4AvhoA6GXpCzAW7RmP26gzLU2WSxoZpMoOwX+IelwSS/qUbutI2mSpK0pCd63aX6F/3RBWe3/8bpfIOl9lNoD2Tzvb2mcAFiaiDiCmrX9x2kF4Fd1V+BXx6C+Afh5A32ZncnAtsBVkg6T9IIetj3yJL0DuAQ4glIzolfuBzauu9ofQNIbKe+D7MOlPO9vqZwAWLaPAf9oIO4awPFVDfWOqnMLNqc8KfbSHMD2wDWSvitpqR63P1IkvVbS2cDJQK/XW1wLrBkRp9T9AklrURLPJhaIet7fUjkBsFRVqd7NgYcaCP8W/r+9e4+6a77zOP7+NqjW/dIJZpbLxG0UNe7LPcyiRrPQ1oxbTV2rpqpTl6lRpaXSjstQDLOYamkFY01LUq0JEUnQiuuwVCLBKJK6a4QEyWf++O1HkidPknOes/f5nXP257XWXs/jsc5vf7PCsz9779/v+0uvA1ZrsJb5kk4BTiPdPbXTCsBXgWkRcWlErNPm83e1iNgmIsYAE4BdM5RwF7CDpIbDbNF5cCxQxWZSfu9vpXMAsNIVXckafl/apD2BCc1s1iPpYuAw4L2KalqaFUl7JzwbEZdFxHYZaugKEbF2RJwcEZOBR4EDMpVyGfBZSW82+oGIOAq4DaiiUZTf+1slHACsEpKuAy6uaPitgfubmXkv6WZgB+CJimpalk+QutM9FBFTIuJcrxz4qG3vFyPiduBl0iub7TOVMxc4RtI3JM1r9EMRcTrpnf9yFdQ0BzjY7/2tCg4AVqXTgap2KNuQ1JBnh0Y/UDyZ2BG4oqKaGrUpqX3rlIh4OCJOrdtcgYjYNSKuJvVt+C9SI6ecjZVmAsOL4NqQYpvhi4B/pfwJfwDzSHf+EysY28wBwKojScAxwG8qOsXawD0R0fBub5LmSDqZ1Dim6j0EGrEtcBHwQkSMj4gTImLN3EVVISKGRcQ5ETENmAR8hdTrIbeHgO0lPdDoB4r2vj8FTq2sKjhR0m0Vjm815wBglSo2DfoiaYOWKqwEjI6II5v5UDGze2vg7kqqat7HSPMb/gOYGRGjI+LYiNgqIoZkrm1QIuLPImJERJwfEfeTOvadCwzLW9lH5pI6Ou4i6aVGPxQRK5FWJXypqsKAsyVdW+H4ZpW8szJbhKTZxQzp+0hr+su2PHB9RAwtJvw1WteMYpvfM4DzyPsIemHLk3rH9/WPfzciHiFtdPMgMFnS9FzFDSQiVgT+mrRccydgZ9q7Xr9Z9wHHFZtJNaxoSPUr0p+xKldKOr/C8c0ABwBrE0mvF4/q7wOqeN8dwEURsRHwTUnvN1iXgB9GxDjgRmDjCmpr1SeB3YoDgIh4g/ToenLfIenldhUUEZuw6MX+M3ROgFqaWaT2vFcVf/cNi4gtSWv8q5y8eQvt2crYjGjy/4GsIqKMYteQ9FYJ49ggFL9EJ1Ltu9+HgL+X9GwzHyo6DZ5JmrzYUMOhDjMT+CPwRnG8uYSvC3//LrAGsGa/Y62l/OxTwCpt+jOVaTRwkqQXm/1gRBxDmjxa5W6D44D9Gw2vVr6IOBG4qsVhbpZ0aBn1VM1PAKytJD1ZtHUdS1ojX4XtgUci4lhJDbcDLpoYnR0R1wH/Rvt2mCvLOsVhi3oF+HqxFLQpxfv+q4Gm5pgMwqPAQb74Wzt5EqC1naRJwKGkZU5VWY3UOvjyRtsH95H0rKQDgc/Svp0FrRo/Bf5qkBf/rUhPk6q++E8n3fnPqvg8ZotwALAsiuVNJ1B9i96vkZoGNT3zXNKdpP7zZ5DeHVv3eAbYV9KXi82hmhIRxwG/AzYvvbJFzQD2k/THis9jthgHAMtG0o9JW+lW/dhzW9IrgUOa/aCkDyRdSFq9cAPt31PAmjMFOIp01z+22Q9HxMoR8TPgGqp93w8ppOzSaSs6rD4cACwrSTeRlru9U/GpVgVuiYgrm30lAGnJoKSjSBvT/E/p1VmrniKFyS0k3dBMK98+EbE16ZH/EWUXN4CHgV0lPd+Gc5kNyAHAsivu1PYCXm3D6U4CJhfbtjZN0gOS9iOteR9FtfMYbNn+FzgE2FLSKEnzmx0gIlaIiLNIj/yr6FPR313AXpLa8d+72RI5AFhHkPQw6e76uTacbitgUkRcWzR2aZqkxyQdTuobcAXVbH9sS/YIcDCwjaRbm13T3yci9iGFiPOpblXKwm4GDpBU9RMvs2VyALCOIekZYBfg8TacLoBjSRvyHBcRg9rMRdLzxd4CGwDfJW3datWZDIyQtJ2kX7Zw4V83IkaR7sbbcdcPKSge7qV+1ikcAKyjSJpJ6ok/vk2nXIs04ev+iNhmsINIek3SucD6pE5u7XiSURdzgVtJs+V3lDRmsANFxJCIOAV4mrQUtV3OlnTyYF5RmFXFAcA6jqS3SWvwG27iU4KdgYci4tKIWHWwg0h6V9LlpA1vdic1kfFTgeaJ1DHyBGAdSYdIamnyZUTsTJrkdylpUmg7zANOcG9/60QOANaRJM0F/o50AW2XIcApwNMR0dLdoZJJkr4KrEta6XAjMLv1MnvaVOA7wDBJe0i6ptXW3RGxVkRcA9wPDPopzyDMAQ6RdE0bz2nWMAcA61iS5hcX0LOAdj46XRcYFRETit0CW1L0EviVpCOAoaTlamOAD1odu0e8BlwJ7CxpM0nnSWr5FUpErFbM7p8KHEea99Eur5BeWfyijec0a4o3A7KuEBHDSXfQOXrdTwa+D9w+2ElnAylWIBwM7EOa97BuWWN3uHmkWfzjSRvg3C2ptDAUEWsD3yB1gVytrHGbcA9whKQZGc5tLajbZkAOANY1ImIo8DPgbzKV8CRwAXDLYBrNLEtEbEoKAnsVX6vYNjmH+aTNbu4hXfQnSvpT2SeJiPWAU4GvACuVPX4D5gPnAd/zZL/u5ADQwRwALCI+BvwLcC7pnX0O04AfANeXeefaX7F/wV6kMLAnaYVBN5gPPEa62I8HJhQTOysRERsC/wwcTb5tnGeSlvjdk+n8VgIHgA7mAGB9ImJP0iuB9TKW8QfgQuBaSe9VfbKIWAPYlLRufbOFvt+E9jSx6W8GqZ/91OLo+356MYmzUhGxGXAmqXVvzq3NxwJHSnolYw1WAgeADuYAYAuLiE+RNujZL3Mpr5C2nb1B0hPtPnnRxGh9FoSCYaRlbqsUx8oDfN9/o5sPSPsxzCqOdwb4OoOFLvY5utlFxIrACNKGP39L3onM84BzgJF+5N8bHAA6mAOA9Vdc/L5Fevea65XAwh4HrgduLJoadaSIGEIKA8sB77Tjjn2wir/j3YAvkZaG5pjY199LwGGSJuYuxMpTtwDgZYDW1Yr19iOB4aRfyrl9BrgYeDEifh0Rh0fEJ3MX1Z+keZLelvR6p178I2KTiPgeMB2YABxPZ1z87yDtQeCLv3U1BwDrCcUv421I8wI6wRBSN8OfAzMj4rqI2LuYxGhLUDTtOSkiHiC9ajgb2ChzWX1mkRpFfU7Sa7mLMWtVzokzZqUqfikfERH/SWoss3nmkvqsAny5OF6MiF8DdwP31H3iWBGItgX2JvVDGA4sn7Wogd0EfNNr+62XOABYz5E0LiK2Bk4Dvg100iP4vyA9yj4eUEQ8SWqGMw64t8rlcp0iIrZgwQV/L2D1rAUt3RTgHyXdnbsQs7I5AFhPKtbnj4yIG4HLgAMzlzSQALYqjlOAeRHxMOnpwDjgvnYsL6xasU5/H9JFf2/ydHNs1nvA+cBF3r7XepUDgPU0Sf8HHBQRnwN+ROe8Tx7IEGDH4jgTmBsRj5K2rp1SHE+T1tl33EUpItZhQY+CvmNLYIOcdQ3CaODrkp7PXYhZlRwArBYkjYmIu0ldBM8AVshcUiM+TtqmeOd+P58XEc+xIBR8dFS99LBY0TCMdHHfnEWbEnXCDP1WPA+cIun23IWYtYMDgNVG8Tj97Ii4AbgCaHmnv0yGABsXxwEL/4uI+JAFjXsGaubT/+tcFm0U1P9Ytd8/d+IEvVa9D1wEnN8Lr1zMGuUAYLUjaSqwb0SMIE0S3DFzSWVaDlijOGzpPiRtLnWBpGdyF2PWbl6TbLUlabSknYB9gXtz12NtM5fU7W1jSUf74m915QBgtSdprKS9gN2B32Qux6ozm9SlcSNJJxUTRM1qywHArCBpkqT9ge2B/wa6Z6MMW5q3SUv6NpB0mpv5mCUOAGb9SHpY0hdIS9h+Ttr1zbrPq8BZwPqSzpb0eu6CzDqJA4DZEkh6StKRpGVu15Jmi1vnewn4J2BDSRdI+lPugsw6kQOA2TJImi7peGA94GvAg5lLssXNAW4mLYvcUNKlkt7NXJNZR3MAMGtQsXXulcXKgc2B7wOeSJaPgImkfRXWkXSopDskfZi5LrOu4ABgNgiSpkj6Nqm18HDgOlJzHaveNOA7wDBJe0i6tg6bKJmVzQHArAVKxks6BhgKHE5aSuiJg+V6E7ga2EXSJpLOk/Rc7qLMupk7AZqVpGgjOwoYFRHrAocB+wO7Ap/IWVuXmkHaFfEXwBhJczPXY9ZTHADMKlCsNb8EuCQi+jb16dsOdyd6s6d+q14HxpMu+uMkPZ23HLPe5gBgVrHizvXe4jgnIlYCdmNBINiWer6OmwVMoLjgA49LcvMlszZxADBrM0mzgTuLg4hYHdiTFAaGA1uQdvzrNbOB37Lggv+QZ+yb5eMAYJaZpLeA24qDiFgBGEZqQNT/WCtTmY2aT1oaORWY0u94yXf4Zp3DAcCsw0h6H/h9cSwiItZi8VCwKfCXwIptLPNNBr7IT5M0p411mNkgOQCYdZGin/39xbGI4snBysAqC31dZRk/+zjp0fws4J3i68LfD/gzSfOr+jOaWXs4AJj1iOLJwRvFYWa2VHWceWxmZlZ7DgBmZmY15ABgZmZWQw4AZmZmNeQAYGZmVkMOAGZmZjXkAGBmZlZDDgBmZmY15ABgZmZWQw4AZmZmNeQAYGZmVkMOAGZmZjXkAGBmZlZDDgBmZmY15ABgZmZWQw4AZmZmNeQAYGZmVkMOAGZmZjXkAGBmZlZDDgBmZmY15ABgZmZWQw4AZmZmNeQAYGZmVkMOAGZmZjXUbQFgbgljrFrCGGZm1nvKuD6UcZ1qi24LADNKGGO7EsYwM7Pes00JY8wsYYy26LYA8HIJY+xQwhhmZtZ7yrhBLONGtS26LQC8VMIYe5QwhpmZ9ZCIGApsUsJQDgAVKeMJwK4RcXgJ45iZWe/4dyBKGMevACrybEnjXB4R65Q0lpmZdbHipvDzJQ1X1nWqct0WAO4oaZw1gVsjYv2SxjMzsy4UEQcAV5Y03BOS/lDSWJXrqgAgaRrwVEnD7Qo8ERHHlzSemZl1iYhYPSJ+AowBVi9p2F+WNE5bhKTcNTQlIkYC3yp52CnAA8Bk4FHgvZLHNzOz/IaSVoLtAOxGehpcpu0kPVLymJXpxgCwM+libWZm1ilekLRB7iKa0VWvAAq/o7zXAGZmZmX4ce4CmtV1TwAAImIEcHvuOszMzIBXgGGS3sldSDO68QkAkkYDE3PXYWZmBny32y7+0KVPAMBzAczMrCM8A3xa0ge5C2lWVz4BAJD0W+Cm3HWYmVmtnd6NF3/o4gBQOB54MncRZmZWSz+UdFvuIgara18B9ImIjYAHgbVz12JmZrUxGjhI0vzchQxW1wcAgIjYA7gLWD53LWZm1vOeBHaRNCt3Ia3o9lcAAEiaAPwD8H7uWszMrKdNBUZ0+8UfeiQAAEgaBQwnrcc0MzMr21hgJ0nP5y6kDD0TAAAk3U/q8fxY7lrMzKyn/AjYX9JbuQspS08FAABJL5A2ebgW6NrJGWZm1hFeBY6WdIqkebmLKVNPTAJckoj4NDASGJG7FjMz6yqzgUuAC3vhff9AejoA9ImI3YALgN1z12JmZh1tDvATUnvfmZlrqVQtAkCfiFgfOBA4CNgDWC5vRWZm1gHeAMYAtwF3SpqduZ62qFUAWFhErAHsA2wIrFccfw5sAgxtcfjZwGstjmFmZgtsUMIYvwdeBF4CXi6+PgVMkvRhCeN3ldoGgCWJiBOBq1oc5mZJh5ZRj5mZQUSUcbFao5dm8beq51YBmJmZ2bI5AJiZmdWQA4CZmVkNOQCYmZnVkAOAmZlZDTkAmJmZ1ZADgJmZWQ05AJiZmdWQA4CZmVkNOQCYmZnVkAOAmZlZDTkAmJmZ1ZADgJmZWQ05AJiZmdWQA4CZmVkNLZe7gB61fESsnrsIMzOzJXEAqMbni8PMzKwj+RWAmZlZDTkAmJmZ1ZADgJmZWQ05AJiZmdWQA4CZmVkNOQCYmZnVkAOAmZlZDTkALG5O7gLMzKx0At7PXUQncQBY3OO5CzAzs9JNl/Ru7iI6iQPA4p7ATwHMzHrNw7kL6DQOAP1I+hD/h2Jm1msm5y6g04Sk3DV0nIjYE7gHiNy1mJlZy54Dtpb0Tu5COomfAAxA0r3AFbnrMDOzlgk42hf/xTkALNmZwKTcRZiZ2aDNB84qbuqsHweAJZA0G9gTOB1PCjQz6zbTgD0kjcxdSKfyHIAGRMRmwBeA7Ypjg7wVmZlZPx8ATwKPkCb83eBlf0v3/4iW1DEW58ixAAAAAElFTkSuQmCC",
-    # Washing machine up to 12 kg
-    "washing_machine_2": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAoE3pUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHja7ZxZch05sGT/sYq3BMzDcjCavR308vs4khQlipREqcz6p8Uqkbq8N4FERHi4BwJp9v/532P+53/+x3lro4mp1NxytvyJLTbf+aHa50+/fzsb79+vf/zLqz+8br79wvNS4Ht4flHz8929vv56oZfvrvNT+u5Cdb78Yvz4ixZfhq/vLvQyUNCMNIX1cqH2cqHgn1+4lwv057ZsbrV8fwtjP9/X643W53+jv87rmpTn2/t/x8LqrcQ4wfsdXLD87YN/JhD0fzSh80Plbx8qb3Qh3Z89f8dQX2bCgny0Tva7WZkPrOI+ssq3n94ZJeTndcMLPy5m/vb9w9dd+njxzV3i70YO89vIP7zevV/vb+f1/3NWNefs5+56zCxpfrmp11u5P/HGwZKH+7HMV+H/xM/lfjW+qsF7JyZfdtrB13TNecxyXHTLdXfcvt+nm0wx+u0L372fPtzXaii++RmswU5RX+74ElpYWNCHiXkDr/pvc3F33HaHm64y8HK80zsu5mRlc039H3x9eqFz5PLO2fptrZiXlxMyDVlOf/MuDOLOqx+lu8CvX+//yK4BC6a7zJUb7HY8lxjJvfiW/ChcQwfemPj+xJor6+UCLBFjJybjAhawGed32dnifXGOdazYp3OhSqD4gQlcSn4xSx9DyBiHiGFsPlPcfa9P/nkZzMIQKeRQME0LHVsJ2PCfEis+1FNIMaWUU0k1tdRzyDGnnHPJAr9eQokllVxKqaWVXkONNdVcS62mttqbbwFwTC230mprrXcG7Vy58+nOG3offoQRRxp5lFFHG33iPjPONPMss5rZZl9+hQVOrLzKqqutvt3GlXbcaedddt1t94OrnXDiSSefcuppp3+zmjOPWX/6+nOruVer+WspvbF8sxofLeX1Ek5wkmQzLOajw+JFFsChvWxmq4vRG5lONrPNExXJM8sk4ywni2HBuJ1Px32z3ZvlfrCbifGf7OZfLWdkuv/Cckam+8RyP9vtA6stZZtpg7kWUhhqUW0g/HhT95X/gMUTxqltHNaNEVnk7hmJ5Rxz5Z7TnCXvNHbCIbnhBkjtcFbbtp3kVh4DZHN7tLy268fudPYIhaVsIQNLIOKsbtTDgrq2d2xEfxmtn1oPgRbzGTOGvtZMZ60Q+L7XnjOt4Vr2kwlUPspSFLykdAGuzXy8FdZobZ+Py3P4ttJIedRGuIazWS+it8knN2CMfQLjYe1pZwtpLlYzsBgspc1mY5+c23K5h+3HSHGsxRKnNf3CjTDoAhkO/sGKr3l85KpAcs9coK5zlBJ8MTXox11TXFY/HZv0Az8B5kSRoEhm0ivgP8t439VdAkqIE1fivYKZEQx6ueq/XNR8f9V/uaj5bKpfvaj5k/v/k4uary7qZxc1/2Kp7y/6/83//8j8JSZY1XGrAAvTD88FegQYC0k/3UvNMUJoBZieOwLYpYKhpbl5jC/AEe89m6xzbNHblwWh7we3HfoBoBlMhVEgWkwgcT0+FmYY1ueL76bv5D3XX9XnMEltpfsSt+3bljCrZqtBmGI6g4kPqLvfZ4c0wiqAdD5+kuTMmpnJBgdcBjAsx952cU283k0wcBVoJZmlgORg1nJrrjHmICOdXPxOcYc8yCKbXEPqPHCxAzEsq0NzN4jNgvlxLOljAG0g6wH0vJ21B1JZs448M+ZBOHBHZJFyE0aXDHq+n0Cq2T3WU5PrTDKe4Keuc7h+HrvoN6QMuw73i9nODMWaMZoM2LgdEg7jpVVOkrNhepKNlrx5LlmvGci42D9mzy1ft3nMs6PpY1fskla7XhGBf35JotzBrgQucz2b93BdOXedEVPHKeDWiZWJEJTOHNwyR8no5ERGcigoMkFp6czE2y0ZH1+CQsTKTTdGEVcJq9qZysrtOE+yiTedXRjZUxzqbDxg7EBCJBFz3+SptDzJfKeA7cLaEc+EF3jo/kCDiXygzq6LGJbQkZddLddofeM1dua7Nts/K1PjPjOzAFBQ0u85lamP+5uON99VMttFnC1M/aO7cn/tSegsad03LnocMEGNM24Wa2EUMfUiq+9sn6HML8YKn06WqY7drtVqYg3xGcPKpM312xr3NjYsqZwJJTtQKb0SvSIxkmW5Bzflaq3+NIj5fhSu9G05pImeSTLqM83XBXlbjWct7kpcq7EYZa4ga8YyCH5YgAU+eoIZWFAC9kcM9ZncPjnDrbqHd03CEzYBPcPzzOJGIFQzJubm8f4yehHZE7EDeRYO0TxwBF8YrvaaPR9lmcM+XH6WtkOFTsHYtBYjhTHQIBE8gc5AE30j6nuc+cbOZTbt7MwlnpWrDrv6iCphhfteAv9dJ2TJd9ww5LMvXZr4bfagILQzD1CqAj5MgvEypLJBel58TDUJ5CjARgiz/Lx9ENA+sMCFRQGE1hyiV62C4YwFAQ8DatchWeFUBQF3MwcwWbwzkEZswFsIaJYkJIDRbxCtcDMbTmth6qHyiuv4I6JMXkMkY8jdB0C9PbeSDUETdCOZgYLPcdjsU2P+0gO6xjxzbfg3WaFD+lrnNn2ZkVkj9yGZot67msQSzsnQZ0J3ha8uTDASgg/n1HW6YMVDb0Fs/AF80aSi6wzfwTBuLPmIXhubAAFDWZcBgiPcC+oT48oHdk+8PeBPJXQ8YKLOmUGuqyMSIvoFAIabbuixj2cwg6Xct+dyLFhhXO/xBx/Q+H46JBS5EXAN1Udgh7yWi+y4/MB6i3Tk8fCR8SWElrOjwWr7YqTa85UEjZ+xD36Zk4wl/GxZ1sJRRbCJo0kWNMshF4FAGLOfACqp2zYYdLdkr0mA9HbwhzqPfGCRdDvLiRfyuRYKdgP/awsGh5mVuCVxsfz4EwmH+Xd8cUO4gZtxo4irBtCV0D5uY0VEyRkDHF/4ERFpVD9B0zgceXOPF9KQH0mzxzodEkC4T5I5CXFtpAtxi/Qfs7M4rjQovJ/bGcQJgmnVZjE4a3F8IGGS/pgCN0c65OMsESuZRtc0+T5KRKpE3xpKCffF3AblQmYDSRbJIEYSAsoAarIjGfmI4PgMzPe1M6LOBbwHxO+IPLsxOKKXJIGKM6z9zS1K1eStDjBmomahR73zQ3o04nJwgYKzdkgDhmcJHKmD0AfIWFyw0LC+iEIACiyC2DTAE0nsY8FDHSNUXJechA4qMBD4ENwjeTChjUoa7SwYfuqPyURgri7DGfZV9IS3gGEVcqpk9FGVEW4BxwLOBjqYt2TBmvgM6AIIlDoljiewMBgS8ZiRT9wmIYvtva3LoRPJ9MHH4cV8Ls3oPVctpi2Cd9VlLJnWYVuIEHh8IX81gKZnfrkHUhirEcUEHEo0WVczkjk7yEYb8AlYSkv8VU4xrEpzBI9cn0AmweyV3eASg+TNy4A+9wZN7PHJiDBMt1hQ0H9GUbcNfxkmSDAuUqddMB/AZk1CqRNLLqpgmFfyzSnaQOySBStLKzNhJqf5Ad1SRW88JIK0ouDTz5ADpcswVxQYwG3JLiSPXkVDPmZlXNIb8oAyPHnA6hMz9dMePnv50mzM0XJJeKzSxCBNdG4Q6xy5jOKQ30V3Z9TDpXTK/Def+wQluhfq++FlhKimtLsi/RrFsx6TqxzCupVL2CMhSPQlSF9EoBdRwTXCnqongMz4GxNcGaGuiiroi+0H6Iyj2LEHRAsKRfTrBzIfKYBFrbOPjnvjGScSOy0nVnlCrO1QVYWs4eXSewHMrtYsP/N1TFOEDVOx3sS8hOyimAT49tzDsoAJ1kkviiXvJy2SjYkorZoYB6tlxsNKw6vVjp2qLDwrY/HOu/Qi/8/7kkgPTPuuJ2QxiTatu0b1XorpCo2tuBH2rM+reNIR3UzPIG5c9gVpno9u6u55H+moXzp3qmD6MfjrcBJT3wbU+xlL0/p4xuZtyixQ1D9el0cqaYYXwp6fQSDcDJlDquOI2GctPDHfjpmA+6ie3NBCBvO39kaWdkfgvwFKdXq88oic6u48ooP2c4d38R9hSL4n+gvWxWV2xQdKIfRyV73Owo0APNANUJWQUtmH6NbWxoLff8aPdg4nV6RfSvyrZPm6bwNDb3KztBh+2lWurzX4xCImQpDkTbolQUTDmqRNhMXMrZFA9G1d8pgFAwT8bAMh1bhNt2BtID5UUOxRf6Nfq1J0NJCGvSRq7RB/BN+wY2VxgV6yCtk7Ijsbsoh0DrIFrIbOTFUiz7lkgTxupxtZaF1NhN8jbgbpE3IWGdBtCKNqaapgIdEkmZCHlYyJDUhZk68FUzlwNEOkolWAH8hRI1Vu4NmLlvsiDCY4Y4MmrFRJ26Rdj+gqNUMkHWMies5eCnRTHajuYZ+zT8d88WVIh695Mh3vonNrKIdVhALjwfLR9ED6AiphT0pi6eQ+DAQP87KQwLzgo4QF2t/K30FsawcpiwLVxgW4ArwANcbygU8zD0hTn1xoGSi+hQQvvrxlcmRRZf3RNRpQZntV6XM5FSqPxIOSHSkL5oF0J/mhDeHsBhrlkg/NJQSPl7AnSwQUpIvCTQjQPIUE7Qt2z6y5KpJk7cyMbJsqq8JHyjL4HXHnkIgkT7nA2DHBwyp5OjQyJSRLFsjgY3XLApnwIKxImIQez7QsGJYzYhbNc2f4gidMHDl4tQCrJXn1rqJ7GfgM6Yi8z83OqW3IIy6GzzAFaAef5NYyoAodVb1GRY0GCbTAKSxbRsN9keBj3RJKro8bXy9OTgs7iYW8XDLQJsE1VDR2Jw4K94eL9Wf/cUpU+x5vCiMNMhG0gDyoN69AhwUHKG6qpsdQnPeKRjJt0kYokm2qYgGX8UX1jQrzyYuBCJg14FmnaPuwVK4TBkkFTU4WUY0IUd8BCTx1XSxKBXRROKRwKyUBI+GAuYtPIALjOalpb4i1UIFEZBQ9dsjkiKN4PQdiyYcBHNTQDG75LKTgkigxDEbG6GPZvvgiv8OX7o/OYCfwMZIKFfg1JQjI3egUbGhXSsjg7U+k4T1nMJ+SBu6dFH+xGgIAdeH1tR6wbapXJC4IACvJCEbAYdC0XeyNTEc5YKqkJsb0+h2t+pvKDUGLMMMHQQoAAeUDve8T46PcULrZTxEuaAe5zavkVfHMJVLnHz6jnCZC87CR7zkNd+nIGls1ANR3Kr3A9wnwMyQV1+Q9COjNfVXFMTEIVw9mZTEopwTa8Ylb3rDrqTECA3GpCpJVWsh1v1Qewkt9cihGz8GB1nkKCBlZqZm1xxpedYc1no/rV88v/FM10S+0c/nj0ObrY388tPn62B8Pbb4+9sdDm6+P/fHQ5utjfzy0+Vtzvx/a/K253w9t/tbc74c2f2vu90ObvzX3+6HNv0XY29Dm3yLsbWjzbxH2NrT5twh7G9r8W4S9DW3+LcLehjb/BahpaPNfgJqGNr8eG6I+ydpQ5IlEINnDmdMcKh7wI8SG/B2rizUaN5LIsoW/oPLd2kM547vMd+XNS+pT4hMbUeK0U4qMD/gDM7QmQKtOnso1aFzNaEz0CMIs8c/RVBPdSsyi4VJINzUr+/6YnM3vJf1rCvwpA6p16byk9GLeRL2E3qeynhV81fTKtndur6r+anqj4suLqJ/1W8PAT98HdwzfQ+176P/qOezu+kQPoa4trNrkvcMRe7OX8u4+1ywRNg/Jrdd+iC/0GToRrhhm4F0hTswFiYKYIoQqjJE1Clt7ehCo9FKzYRUQshWKKqWQGk6xckHml+GrerJyUvsCggI2xcClIn6cCWlnfRBuH+Bcw6bM9D1UAZmrhj8UVT2QTPHyAO1P4rsB7rBU+20NicCXNyzVZTAD+aEqk3oFVH8ofs+pGtBGs93SwmQlNR7sJzU47MmWBeMuGalCazb0eHYMWUKDs6hqnnJQaaLgzWg0VBe8qalphI+2E9AsSQqkBL1lVESsnUY16hzu4vSCdnj5eJ/qWxrqOZmqvcvxc++uouxRdbD8WZDeOw8+fKN/9UDQ3got3gdTbggRp5LAgnTXxr2xJKNxVzDJ8AwJu+7uZVnRQjBYRA3rivrSjoEaPllSbnieyKtOovRAQBO3ucIt9MeM7EZk2zkQIF3NMYjNTqb1M8H6MeCJi7AuDaIXkazw6p5Vnh11sELEOhKNS6irps6duFhjRb12PRBpURssBUGBA/qC7L0OiPcgFGDgRLJDjyxtG3o5OHcxXLFdZW6c86jEgeREtpsTtW0lbOuqOhaksvTiJnCYB2ooNTxJRenmmuqjK6Glbjkifx9J5ruQQqSpbCMoSQVZcs4oz5Y0k92Q6DtfbdI1bVwLtvCUa7PlDLCmqtFVCKLjj0YQQnLBN43wCQq9gZD5NxR6AyHzbyj0BkLmIxTaFrEWC46xEM0WsdbU6pn2bYo6XWN4dQKdU3b0wadYTLe7FxaV+MZo0ttZu/qlJ+2ISaWShtbCXzwxp7elTWQEVRdPdGvePciJyi6HL7wP9z1l8eW8aid3Jyu2DBjkrLK/dhIqMFmQqIiwpFBKK/ut/aydDQCBMq9JqcgxxdvpVIa2FnGzptcFSu433zNS9Lpj0DgAaqkjCdiY/iIqgsr3ZaeSJvo68Vbn27Qbb0yPuMTdpqS/Ie4wF+gUiD/f3GqqC1y0044+IR3G0JYljrjVD6UtrpF2bSrfJNaPhahrGu1GZEJfxYgZ821ujTu5pkBwqu/2BVjc/SIV4BdrgvArADjTIm1aUMm7aWyTtCOqEG9k1aotr6P7dvjXe0U6663CkMz7yQ+FyE/+7doXeamJbvWyXY8G9y9HGrZPPLl7vo7/dRyaXwWi6IXqEu9s5PaVyY7LbnUZAxsnAbVqLSYPgUg3gm50cVlFDZctuej3eSkwypXar0L7RWajzkF1U56IUY8Ed/40SDD2ejbhX1sk2jcBnwS1W81/jehdx+41M/hkKnrdh9Oyr9OB0qkJpuWe89hbDlL6WIu4T+pzKBUXUk28qs4DyeLeALxoBtkUsAg7zwkdJGWMMnvx3Fcm0WurVQUENRJyuX27AidJHOd1DSTiDyyheNMD79O+5bktvqpcKtF/s/quO2AFxt4BN2u4VkrqOcTdzo2npf7zYfolcU852WmjZ1bSRSA/QRxJ2S7Jy0n9lUyuwmIbHeCqCccAxshX9dqQLLJ9TS4AV66SKYmJksdkMWwOBE53KqoRxhmf3qNxq0Ux48j+ECQVsbrahYzvvc7nlphnxZ8bAA1wQGhU4SyrNvWFx5B12IAVrgcuOrVHrZ7EciLkVvVsSCqfZzyV4Ju2EPPWPTRwiGzqnsoMkRFv0r79LKx+Vdhbf6xfMwGZpjhcZa/OmgTnsVOECBAAWAI/ILep8/NwTeKwiIQlYNCT+JXsyJqFC53UIFpOZUpWlYR5BnG0H5whS4GD+zZsnelmagdADEQPvA2K3VUmwzJYoCSkBFArKg3zATETCeOoRzW2DnHZwGOJ2VW4ntM+7gBUrPZMuFu3l0rRXL4cS4Y2ABkfCGG2jpjgBrELIJ5hd96RGv3BlWyGoXrmGTqBDDzYOMRMuTrZApERoyHn4Gsxvezh2gpceNWteg9KnKx9JQHBxmqADvfcR8f1s1dZvGk/dlhfeiWvlRXdnXmxUR01D5Ua69bjS6pHG4UhsbSD4E0p51tLd9DAYNUh42eN2wiMmvpzuZTrW80X2nf3ADnIhdNXZMnSbvuGqcAJCZakiibZEuTmLkRgbkFz1Q3mlQs437DrW+nxT4mF+aT4+EPpURH9WnrUTu5HEsyc3xcfP0TE94BofkZEHRU4PwCyft/tg+MvmPyyIfWGyCY/uYBg08rk+LpIE8dTS7NyDh7I6pOBc0qlxGWJroykyRE7VdI9idOo+at6Vlz7FABYI0c0df4p58aCWmhQ2jjcJQPkWOWADTvp+ILLfMT2WJsqEWXMxmpVpMBGbqmJhIiCdXLnZX3H5jypAV1MWNhJ7M0L3AclglMUwzUAsamaOreAilJrFIELK2ZsbLPVmSiPGtPLdrD2yWRhNep/IGc4UG/AISGSkCenbEkqwQGIMoQx7+2q/UN1UFrPuR7YHNZUjftnbmO+T6DaihlAB5PNYCDgG0UwWdoUkAMkATgbN40q1I6thae8bEy7bbY64EMEUjG3WgnUUilYrxthpoYb1S8uRMJW4IXOxSXZz/Kh8q1kpC9ibFubYWno1M6ZPZVw68k1vnXWq7+IhajPrjsECDTKJJOGGW0TtQmzGkjyzAUs545IeN1J/+J3SR1XSS0UpAKAFh171JHIgovB4bnkLaIuem11hmaQNKQ10isUSveLKvorQWF+IjJ/KSjMn3Uq/F5QmB8Vxd8LCvOjongTFCwR4XBcB5SftkbyDZie19COzFByG0FNThPiANSqYUt7XIRqWuKu6pmCAvKDmmtnDla7tgRmYbqSzO0e0riHB3ZIeMyFMPNgGCmVFWwoX5DkWFiDWp0qop15jerAbtIdtILcyErpKIollNZyAhvARW3VxB6TGwGvA82dJRrVUAe1087dgREMFozMuKp2OUf6HhC+fTfvXhBok8mEkuLIgsw8gAVk/Aqey+9MBuGeYRHkYLXPqRN5D7Or+tH4H+4joeXwMXjCDO7ck1czg5ppELA4B67InbfFpdTq7ZAhTV6Cpb9JUbVdk2cxZhPZ5DsZjDwJKe1z2SiKuJlRUJXhpattoupQKUksyfDx1LyTFruR2RH8ZDpo2yZwhw7/DRKw+pv4Wa0DimlM9i6Snpr/SzAhGhROb8F0Q0mh8oMo+DGSXuLIfLR79zcdP6pn+/+i48c8QfSVjp/vosgr+cgX7DEzYiPfSVxDB9HUFlrU/CDl2cnNaki/LTuZcMBAXd0j99AP3kOCYpjdo09mEo65wr63TxDnquVg4rfP7wjX39YC8b4dWhYIHdo/h3Z68hhMFCQ32cPYbtM5K1W2ikbq+1cF6VEDHucc5Hd4JuJ0a/N5ojJIwUnNYw6gLng3WsRZbdXKbd1oOs8bBiANH29qtL0lTLKEBx16UdfCPZybh9qKKylAO/4tO3Pvym1YGZla5sUM2tI8SVuXMdziXnvmtiRSFv45MgGAipqnQbJR8j0YBAjJLiz1TpIoxPhAhg3Vba4xq9toCk8FbVJHiHF5NcGt10a+pr7B/BR97SC4y3r6jZzasHlbfcrykA7yoSoDePuJavIrqI2OFUZV+l5L9TMVEBBVqi/cCNK+uNj8VB9nRKOUojYtFm2hIndSiUJQFuC6rZGM1BGEtzSYf9Ip5gZdP+rvRY2VoXK/iny5iKaWBp+HKE1SKGiM2mORwQkcAkR9xY5mGr4p0ZAkDtQvi3ppC6aTuAd7j0kIf7bgDJcozDZBL1WO6E35DkUCRgQzcN/dlrMZ8tNvuya0csambqvLpPDNggiQ+SOiIbU1G4i31FfDXYJhYLOV8FP5BfxuGhROyJpqn6F8E+hLglBHDKDDEPqLB3wjyyW1aBHrOJDBqB6uoL5R6z200C1yBFa1BadlBTNAjI0IHoSYvaHiv0VNs689AeZPmgLe9wQkdYW9K7aY12rLnxZbeG9+v7kAAh7zUYr/U3QaqhW/kAzztbLlC8l4t1DcXDYNUFn+HntEUHW/IyI9QW6BJFXR91J5W/11BQNJwjnBzG2iC3rqwXUVC4kgkWsjiTS6p0oxOC5oQzZCCOILiFGXuX852KzvWTGi8dxOqajmChiGep7dbiAPX0gORCeChvQVdBQ7ZT2XwBVVIdTdWhNEYAJyU9KTe9t9Gu5BBaEVc05qdUZ0dvIivMPqOCgaUfcwhxh70YmorP4MJXRLzlXTc0HdoNcG/m/vPQcl/exeZD/rLfyG0FjBuFN39/Wj014aCAuhioZAcWkXwLBOvl0dGsfdK1EPYEJZo/gD6Ku+G8g3cY3eKU7y6B5Q8GoJTRkIIdBfOuvuFG7pXQLLI8vwGTl/c9LpC3a3nbrTgj7unHRct9qkeOT9PTJqmM/BrSBZq2inEWEPOOECatbcZGjUOQvGOrkmkRATuZ5lLmA1kovoTleDm67DvDP0jghCDKpck2AsWvcmWLfaWKwSTzr2xbV0koEEMrnNqUPNAXiEg5o+tSsZPFA1IQ0Y5h7pSJE/ZDjnASl0LowVxYYwDCqqrFZVWyOIUGFdFY5j6vDInaOOcwwPUIIxev7F0+qZm5r7ko7TFBtnAm1RYCguFI3e9oS3Q2capVwftRGW9f2W4xqkNYdbjlNFRafY1O5WtitLZTOcCe8BkLdUlU5axwr4Jw/6J6KhEwdAkU57h3G0xfgjT4XVQr3CcgNLsvpDpBv9xr3bYeJincH727uF4gYXy+xDp3ygUDr/q7NGasre6l8saMqkXKqyeYoeVdWb9vlMFjGspGafg3rpdATjWH/3+J5C/Yf1Z+GhoOcVD7e5cPgKhi9QKNj6vvL8JyzT/EwzP608/7LMYT6qc7yVOd5qz787oPf0sMdPDuh9qz7bHwU4mh5XgXSn62QYoxhcBTdIw8K7/GpYMtSsnVmlkTZh5psVwXRNQhmKA9UnC8ogylzodm5w2Gl0zAb0gF12CErUs1nuxiiZfwpqGwZr3j6mw4oBZ1lbZwMIMn4TIaKwwIr50Ygq18FpbkUFlR9ZhaGHD8wNMqrOl9IM0Jxkua6esoIsIdLvtiF5WVhonCrJRL+2DXU26fhlp871EJvlWdoM4QnKBUdn2whp6OzoVf+w3Cfry3KYnnTkvXkFDM6RUDSMKIoKlN1SoNN2FeylateZOeSieFXq0WG/3tOALsGz+Xhs8s4EuuWtYzNrXn6o3d0iksHQ2t8hVh1qRrwS1GmlONHWqENevcBGJhm7Qc3QyPBYWFNV1SegFcUorLoyvSzrVHSvRJhKt0TibfjH1aGjKTajTbIAP3S4OKQHA27xgCGFObvjPU8f9bFPSbps9Xi6EZOeuCBurIZNC88mF2Yf5tZ2ebap7KQNDKiZaMZoOt60Vd2MG/yYLI6OyYF3OFjfKqXYoa19E/Aqbo/MQL7feFvcJCiB+/U6O6KH0AI1F9wcIhvGNmo8ZAA9C6FILGAPU/R8AcKVhBGsHoZEnCTtmTHr2UooRVtmM8FTi9d22xZin6GWca3QuMm1VqNjdg6GrUbVho/PAbYGnU4sHbxGA7vVuGkYW/sREBZkhFv2qhjOYsjbOXQhGCHGrxqiGC1GbnKKBUSCnqFAwo6AI/eVX7cydKSxVz1Bw/YO+N+TiZVF0XmCpSbYm8zRIQCoVNlSbs6LRU4OvUSOddpA5MpZ1iRJ6AQgut+XJf3w887419S3+Ux+f1V9m18duPmK+jbnlyWsP1ff5oPeHCADorF1hqBGtI0ESWSU7J3OP+lEmwP+biv+1HEbvPCYrmapoAOYMKijDlyvR3eEWzuuQinVfiT/tPWz8YkK8OHDbcRZl3rSgakQDUFKdlm4lLYi7lO13Bb8/1C2/+33ZDYGsaqhJgIiFfQZtBUr5VslFirpYKwOkAaRO2TPLYiBefIEnKopRhoSwuoY4whgyNCZZNWAyI9BchLu6yLU+B52ES8CWcHPUbQ7VsbWdku6nm296VVlarjrfRhYfu8Krzrqt9sb5pMWs/g70vCeM5jvSMNnCuqPaqTmw66LN/30x95t3opLP2inn+MGlll1Qh/pTv4mkfcKUKnxa6n5yrQNgcWgE5aq3vFV5FgsBMZS6w4JsZfpWBdIA7MhsZMvCXyflGW1Ywtz92SRvm1XCDS1gQUS8qgqRNoUQ0k6niAC6tWzMHWukJyBdNAhvqQUaq9+IN+bKx+CHlVwj7PqUQvzSE50MvXRvuOoANbWTmRyyL+hSgbmRTEA+7BmhRspW+ciVY+927VLh0lRVzo9kjvcXoloNd7NHZG2PUxBmxW3HAqVR//DgnWytRpirzpegA1bHVza2hHSGVZsV8mupbe1tIO/b5pyr66xdJR3epSCZ/rMiOxCjvcrAgOEBKqiZadztUC9ZJCew6bD0OR0dS9NcsvQJwbwTg4DFuJA7SKOMzP3dWbHlUgVetDO0NJUnSu3KnURnSnMoFL10uHk2LEsqgiCr21aGEg73pBjfQdB1HUXycUnqo9PZ+S1j7/Ls8WrU9pHtzxfTleDQGesoyY2Vam7B0YisXRZ+RbR9/GeNJNmxn3i0jPV4tLMem96RtDttRvWz9FqVgFlZ1J0MZ5pZERh0NMj8H8uG3R6QziETyV+xmkWoIS/6kEgsAudNr5HrTqw8hKW5uc2yr/LbObzwvLXMpv5uLB8swjRsKDKwEcqOgTLYohpZj2VBLLk/Y7nHi9qxKRxL4fs+a6CIswWhRemLgZp9Kh9CXU9PSNWr3Mz+z7SZOscurtdBahfaAKEHe5CMLGsrTb18jVUemg58CGYp9eZdrdxckK/Hm4SEljSUPOdjpmpBGsJDJPEj1HcoPycKjw4HcE6qmBGhyDEJe6+sr/YPXEG656HXlTt8JzsnwdVoPv92+lPbujt9OfrkyyKNtMBh6ptoVYYti2VcU9W5+TWqS58x3ALMEgb0ZVH6gcUZHGnGtgIApAfnrygVmqmAojwH8gfTGtos1q1zqyHFPhuQKZt9Vyr8vRukWGew6J6HMQ9KnofEZHmBfrvDos+j8DQ0U9w/fURGATqvI1H2ouZur0UdfpSkg4fV3d2uI/qsOLA5z60h+C7D+1Zz0N7zCMWni13nRJ9nizy7YzofbLIPUT7bhFVfbvLeBcxwCF/Oc53Dwf6YaLPNF+fCxSfhwS9Lcl352fvs0V+XJDvT8/2+4SUbyvCUOYXY303WV3kma66uO6EZ3xdlXu02PywLC+L8u5s8WfeFex3Q5mPx/qdBZ+FUcp+XRfzoa+gJNW2qvxWvHpx1REjKTlWjfvuFts99rNNTBiGlzM1vt+jw9XvlyfEtLvKapy5Hf+IlPuEmNHvs1vu9kAjcwIE8v9qW3AmD9WtVSgiDamyd2cXevvEgz9zYPNVD/7Mgc1XPfizYcxXPfgzBzZf9eDPhjJf9eDPHNh81YM/c2DzVQ/+DOzMV3zlV65ivuIr71wliNPzSxW5HzyKemzJGe5BIeikf569pJQZ9WwEVZPFR+B0TWfHe7RZncJ6ctnSNiVS1E8WAtrJ70mHcGfiM6vguvR0wzmrnker2n4pahs4SMr7jIPFukVt2CeVng5+NLrO/Gb1EBJ3ku5ez9CKvXtUherRbRHSk9xMUl6XYrU+IVCtNT2ZaJCqD5m2MUMWgZAe6vg8Q48cWn7MPlg28rOejdQRafCtTjh7HKarMjdnTjo1q52/lkyKu8MNYK6wYewrwu1WS2o1bdBme5+BEoddKNB7MiSQyiXR8n12NFTrUhjzs+p42+r6eKfrElptPCBzdKTEr8OgputxE8jFEKAUxYc+tYEZmwuyXvdSkaiZqmqfugZU8YEodq9nDWm75z5OMlfjxp4JroQi1UMF9FCk4SqgGUUahwda4bdVJHmO28bzch5Kj7d6uoL1eKtqbmngJdrfHsL1+uw61OLLs+vuOaz7IC5vH6b54wXN6xX/9YLm/RT/9oLms3v+6gXNZ/f81Qua3y3in17Q/KlVfndB81Uzf3ZB87d+8/6C5l8d8T/wbD16Zuqlo3q7UXPj1tMnoh7RE9WVhDrN6GWr3lo9bw+FphqWnmOQxyTSf3WCRc/f0vktW7XRMHoDrdcK6Nylp9f0pYb2idwJqmfODOLqOQt6eIC6u/sxaMv7mPXDtd4jk7bYzf8FHxP2Lle57KUAAAGEaUNDUElDQyBwcm9maWxlAAB4nH2RPUjDQBzFX1OlRSsO7SDSIUN1siAq4ihVLIKF0lZo1cHk0i9oYkhSXBwF14KDH4tVBxdnXR1cBUHwA8TZwUnRRUr8X1JoEePBcT/e3XvcvQOEZo2pZs84oGqWkUkmxHxhRQy8IogoQuhHWGKmnsou5OA5vu7h4+tdnGd5n/tzDChFkwE+kXiW6YZFvE48vWnpnPeJI6wiKcTnxGMGXZD4keuyy2+cyw4LPDNi5DJzxBFisdzFcheziqESTxHHFFWjfCHvssJ5i7Naq7P2PfkLQ0VtOct1mlEksYgU0hAho44qarAQp1UjxUSG9hMe/mHHnyaXTK4qGDnmsQEVkuMH/4Pf3ZqlyQk3KZQAel9s+2MECOwCrYZtfx/bdusE8D8DV1rHv9EEZj5Jb3S02BEwuA1cXHc0eQ+43AGGnnTJkBzJT1MolYD3M/qmAhC+BfpW3d7a+zh9AHLU1dINcHAIjJYpe83j3cHu3v490+7vB1eQcpzleGeSAAAPnGlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4KPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNC40LjAtRXhpdjIiPgogPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgeG1sbnM6aXB0Y0V4dD0iaHR0cDovL2lwdGMub3JnL3N0ZC9JcHRjNHhtcEV4dC8yMDA4LTAyLTI5LyIKICAgIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIgogICAgeG1sbnM6c3RFdnQ9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZUV2ZW50IyIKICAgIHhtbG5zOnBsdXM9Imh0dHA6Ly9ucy51c2VwbHVzLm9yZy9sZGYveG1wLzEuMC8iCiAgICB4bWxuczpHSU1QPSJodHRwOi8vd3d3LmdpbXAub3JnL3htcC8iCiAgICB4bWxuczpkYz0iaHR0cDovL3B1cmwub3JnL2RjL2VsZW1lbnRzLzEuMS8iCiAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyIKICAgIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIKICAgeG1wTU06RG9jdW1lbnRJRD0iZ2ltcDpkb2NpZDpnaW1wOmIyYTMzZjJkLWU5MWUtNGM0YS1iOTkwLTYwNjdhNjc0NWJiMSIKICAgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDpmOTgzOGE3My00NWRiLTRlN2MtODQ5Ny0zN2E3ZDRhM2MxZTgiCiAgIHhtcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD0ieG1wLmRpZDphMWM3MWQ1MS1lYmM3LTQyNzEtYjVhYy02OGQwMzc3ZjFiMGEiCiAgIEdJTVA6QVBJPSIyLjAiCiAgIEdJTVA6UGxhdGZvcm09IldpbmRvd3MiCiAgIEdJTVA6VGltZVN0YW1wPSIxNzI0ODQ3NzY5Mjk1Mzc0IgogICBHSU1QOlZlcnNpb249IjIuMTAuMjIiCiAgIGRjOkZvcm1hdD0iaW1hZ2UvcG5nIgogICB0aWZmOk9yaWVudGF0aW9uPSIxIgogICB4bXA6Q3JlYXRvclRvb2w9IkdJTVAgMi4xMCI+CiAgIDxpcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgPGlwdGNFeHQ6TG9jYXRpb25TaG93bj4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uU2hvd24+CiAgIDxpcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgPGlwdGNFeHQ6UmVnaXN0cnlJZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OlJlZ2lzdHJ5SWQ+CiAgIDx4bXBNTTpIaXN0b3J5PgogICAgPHJkZjpTZXE+CiAgICAgPHJkZjpsaQogICAgICBzdEV2dDphY3Rpb249InNhdmVkIgogICAgICBzdEV2dDpjaGFuZ2VkPSIvIgogICAgICBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOjM0YjNmMTRmLWNiMmEtNDdiNC1hYTUzLWU4OThhM2VjMjA1NiIKICAgICAgc3RFdnQ6c29mdHdhcmVBZ2VudD0iR2ltcCAyLjEwIChXaW5kb3dzKSIKICAgICAgc3RFdnQ6d2hlbj0iMjAyNC0wOC0yOFQxNToyMjo0OSIvPgogICAgPC9yZGY6U2VxPgogICA8L3htcE1NOkhpc3Rvcnk+CiAgIDxwbHVzOkltYWdlU3VwcGxpZXI+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZVN1cHBsaWVyPgogICA8cGx1czpJbWFnZUNyZWF0b3I+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZUNyZWF0b3I+CiAgIDxwbHVzOkNvcHlyaWdodE93bmVyPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6Q29weXJpZ2h0T3duZXI+CiAgIDxwbHVzOkxpY2Vuc29yPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6TGljZW5zb3I+CiAgPC9yZGY6RGVzY3JpcHRpb24+CiA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgCjw/eHBhY2tldCBlbmQ9InciPz7AQrWzAAAABmJLR0QAXABXAG+wXt1JAAAACXBIWXMAAA3XAAAN1wFCKJt4AAAAB3RJTUUH6AgcDBYxWCDcIAAAIABJREFUeNrsvXeQZNeVn/ndl6ZMew80vAdhCE+CJEiAIEBvh+RwZHZGblfSKkaKnVDIzK52ZyY0GiOzK21Iq9DIjMw4cuhJ0IEAQRAgHAEQ3nu0t9XlMvO9d/ePcx6q0OiqrOq+WZVV9fsiXmQ20J358r137/ndc48JiPlSBy4Ats9ynAw0dKmEECIZR4AdsxwvA6/qMs2doEswJ1YBHwI+DXwc2KBLIoQQfcdTwNf8uA+IuiQSAMfDFuCTbvRvAgZ1SYQQYsmwA/iGi4HbgbYuiQRANz4D/G/Ae4BMl0MIIZY8I8DXgX8KPKPLIQFwNNcBvw+8S5dCCCGWJTnwB8BvArslAMTbgN8BPqVLIYQQK4Ix4F/4MSoBsPLYDvwG8NeAmsaDEEKsOPa4N+APgI4EwMrgV4HfBYb1/AshxIrnGeALwMMSAMuXJvBvgb+h510IIcQ0xoFfAf58pfzgleT63gp8G0vrE0IIIabTAD6PZX/dIQ/A8uEyLB/0dD3jQgghuvAV4JexYMFly0rIc/8scJeMvxBCiDnyC243zpAAWLr8feBLWClfIYQQYq5cBtwPXLFcf+By3gL4rBt/1ToQQghxvLwGXAPskgBYOsrtLq38hRBCJOAe4AagtZx+1HLMAtiKNX7YomdWCCFEAk7F4gG+KgHQvzSxVL9L9bwKIYRIyGXABOZdXhYsty2AP2Bhi/zsAL4HvOjvX/fXnazAspJCCNFD1mAl3LcDp/jrpcAHgKEFOocS6xvzLd2O/uJXgbgAx8PAbwFXowBDIYRYbIbdKP8nrMNfr23ACHCRLnv/sB0r2NDLm34L2loQQoh+JgP+IuaV7aU9uF2Xun/4Dz280Q8AN+oSCyHEkmEA+DVgfw9tw0d1mReftwF5D27uEawUpNz8QgixNFmPxYb1QgA8ysqoptvXfK0HN/Yl4O26tEIIsSz4O1hgdmpb8Vd0aReP63pwQ+9ENQSEEGK58QHSbwm8Cgzq0i4Odye+mX+M1RIQQgix/DgX8/CmtBv/QJd14flMD1b+Mv5CCLG8uRSL8UplOw4CG3VZF5Yfk3bPX25/IYRYGXwKK+qTyob8mi7pwrEFKEgX7a+APyGEWFn8ekIBcIcu58Lx1xPeuF/W5RRCiBXJtxPZkRzYpMu5MHwz0U17EOX5CyHESiVlHZlf0eXsPauwjkwpbtgHdTmFEGJFk6qS7Fd0KXvPZxPdrFt1KYUQYsVzMjCawKaMopoAPee/JxIAV+tSCiGEAH47kV35uC5l76gDBxLcpCd1KYUQQjgXJBIAf7DUDOpSu0kbEnzO13pwbldgpYmvAa4EVmtM9SW7gPv9uA14bQmc84XAu7G216f463ZgDbAT2OHH68Dz/rvGlvE93IJ16Dz9qOuxBSv1Wl2LHVip1tv8vgsxE08DT/lYOxGu1aXsHTcnUmnvTHhO64E/pLe9p3X05hgD/h7919Er+DP6O5i3ar6/awL4BvDXgM3LZOyfjRVb+THzrwFSAj8F/qEvIoQ4Fr+TYE7Zr8vYO34lwQ3aQbrUv+t8pSFjurSPfmkAVQf+JvBKwt+Wu8fr4iUs+u9NfL8fBj6h6VQcxTsTPV8KBOwR/zjBzfnPCVf+r8l4Lpvjq4v8bH/W3ZC9+n0F8F+A05bIWL8S+MECCL93a1oV0zxvKboFnqVL2Rv+3wQ3558kOpc/lNFcdsf/tAjP9MXAPQv4GyeBf0b/xv+sA/6ItHXa55K/rV4gAuChBM/Te3QZe8OXE9ycv57gPK6QsVyWx34WNh7gE8DIIv3WW0kTUJuS87BArMW4Hi9iXeLEyuaWBM/S55fKj82W2M3ZnuAzXk/wGddpnCxLNnLiUcBz5R9je/NrFum3fgC4bwF/bzduwvb6FytI70zgbqxLnFi57OwTOyUB0KMLuyPBZ1yjcbJsuarHn18D/hhzwy/2+DsX2354/yKfx/8CfLcPPBKrsViQv69hIAEgAdB/nNwnN/hKjZNly+U9/vx/BfyFPvq969zoLZYn4GPA/+fCqB8IwD/vs3skFo7dfWKnJACOQSPBZ3QSrRTE8mRVDz/7bwB/tw9/8zqsw+ZCr8Avwrwh/TgP/Wfk6VuJpLAPTQkAIcR03gf8uz4+v3OBL7Fw2QGbXHSs7dPrMYjFaGzXoyuWKxIAQiyMsfsyaTxYveQDwG8t0Hf9D6y6Xz+z3UVR0CMsJACEEMfDr7N0SvL+Gr0vFvQh4MNL5Hq8G/iCHmEhASCEmC+nA39nCZ3vQI+9ABnwe0vsHv42/e+9EUICQIg+47fcqC4lfpne9Q74S8BlS+x6nA38LT3KQgJACDFXLmJxygunmBd+uwef2wT+6RK9l/8EZf8ICQAhxBz5lSU8xj5O+riFG7EtkaXIFtRBUCwz6roEi8YvYd3fRDr+Kv2VZ/+ZxJ/XwSr33Q88gFW1vALLV38PcEbC76oBnyRd90zoTZndx6ZdkyeB8/16vJP0RZ0+A/xJD5+XM/w+XoNVpDzRFMkIPOfX5n6s1HFrgZ79jVjJ9Gv8OCnBZ74+7bf8BDisKW9lkaLpx/oE5/FSgvO4XLczOf8owX3594nO5SLS97C/vIuY/3Wf4FN95zcS3ptA2vbZ+4G/2OU7P41V/kz1nSP0Jp6jiW25dOhtw6MngWsXYBz+FeBgj3/LHnrTdOdvJTi3P9VULAEgAbCyBcCvJ5zs5hOFfgnwRKLvnSBdZcSrE16P789jRbkRK3Wc6rs/mviZfRvwKAvX9bAAfrdH42898G0WtovjF0lbvVMCQAJAAkAC4IS5K9Hz+uXj+O5LEnoCUu17/5+JzudVrHTxfBjCtttSfP+/TbzyX0jjP/34az0Yf3+0SL8l5T1ZUQJAQYBC9IZzEnzGPuBvH8e/ewz4zT76HZCu6t9fZ/57vxNYQGbRR78D4P9ysbYY/Cvg1ISf9wt035LpFX8bq2IpJACEWHQawNYEn/Nb2F7n8fD7wMsJzuGURNckxed8BXP/Hw/3AP81wTmk6vR2BvAPFvEZXQf8TqLPCixun4uAdZQUEgBCLDonkaZ+/J0n8G9zbBviREnVDGf7Il+PFP++urcpeA+Ln4V1faLPOR/Ytsi/5bw+OAcJACFEEmPXAh4/wc+4f5kJgJ8t8r8HqweQwnD3Q6vh0xIZzav6ZNxdhZAAEGKRSeEmfpIT703+UJ/8lkHSBN8+0gfXNCNNgaQr+uRZTXEeb++T3/J2hASAEIvMkQSfkcLVvL1PfksrgeFNcU02kaapz2iCz9jRJ89qivPY1Se/ZRdCAkCIZTCpnpRg9X11n/yWiBXkOVGuXOR/DzCWSAA80AfP6QRWM+JEebBPxt2DCAkAIZaBAEhhsK7po9+yow+uRwoBsDPR9bi/D57Th7Bg0RSfExf5t0wmEjMSAEKIE+KwrxRPlL95Av/2ctKUfX090TVJ8Tl/geOPJRjCagH0iwC4B/j5Ij+nqYpeHcGKAC0m/zGRmJEAEEL0xYr3ExxfO+EG8Iek2e/uJw/AKcC/Ps5/+7tYqli/CIAOVjO/s0jP5zeB/57w8/4uixfX8BzwDzXlSAAI0S/cnehz/jXzb6H7G8BlffY7fproc34Z+Nw8/83NwK/22e8Aa/D0G4vwbO7hxLxLx+IgVqVxoVfhLRdS45pylj/qBSBmo596AXyKdLXOD8zRE7AV6x2Q6nufSnhv1gFt0jW0+ZeYW382mlg1xZRd9s7swXP7C8BuFqZu/pdJU6VyJq7EtjYW4rfci3XdTImaAUkASABIAJwwQ1gcQMoJ7xvAx3hzdkDDn6VfBfYm/r7fSXx/bk18fk8Dfxm4gKnKiwHrX/BLPTBED/Xw2d0M/Bv/jjbpW+d+B/jCAo3DJtYN8ydYxkTK3zIC3AH8GlDrwbmvKAFQRywW/5E06URiitP76FwmsLr1n074mZ9gqjvfLj/eRm961AN8LfHnfZ20TVvOZ2of+wjwDHAu8+8WuFjXYzr7sH10/H5eDKxNsGB6AeuguJC0gX/mR+YCLUXFwR3Asyx+xoGQB2BR2l7q6P3x7xM+r395CV+HV0jTz+BogVYs4WtyiabgZY/aAQshkvCnvmJZivx2D1Zar5CmI99i8FWszbIQywYJACF6Rw7870vwvJ8B/lOPPvufYNsjS+0+/iM9zkICQAgxH75Ef1R9mw+/Tu/SuV4H/p8ldj3+wEWREBIAQoh5sZSKlNyLpYr1kt/Fgt6WAqPAb+oRFhIAQojj4Xbg3y2B8zyCFXPpNSPA32BpRHP/r1iOvhASAEKI4+LvAT/q4/Mrgb8EPL5A3/d1LB6gn/kXpC2XK4QEwDJAeai6t/Mlx0rYvtinv/v/wOrDLyS/DXyxT6/Hd1F9eSEBII7Bc7oEy5YXevjZ+4FPYq72fuJPSF/1b678VeBnfXY9nsIqCZYaDkICQBzN/boEy5ZeG6PHgHf3kSfg33B8HQdTMQ7cCNzSJ9fjDuC9WEtnISQAhATACuLBBfiOx4BrWNyYgA7wP2OxCcUiX/MRrMTxv1zk8/gPWOfAfRoGQvQf/VIKeA3wMiqbu9yOLy/w81wH/u0i/M69wPv6dIz/FWByga9Hh3TtgsXSRt0AJQDmxAdlMJfVsYfetkmdjfcD9y3Ab5z0VfamPh/n5/okWi7ANfk66VvKCgkAscwFAFjjGBnPpX+UWE/2xebzWMW51L+vAP6Q/uqWOBeuBn7Yo3t+F3CdplQhASABcLwEdx2OIiO6VI/ngOv76BmvY10EvwqMneBvewb4vWWwwn0/tj+/6wSvxz7gvwAf1lQqJAAkAFJxDvBnWJ1zGdX+PwrgCeD3gVV9/LwPAZ/21fszXYRm6QbyLqyW/3J0a2dYBsXvAw9haZWz3eeDwCPA/+0ir6YpVEgAvHm1IU6c54Ev+PvtwJXAal2WvmQXlup3ZAmc6wTwNT8q1vkzth0LRt0J7PDf1Vnm964E7vajYnDa9djiomCHi/EJPe5CSAAsJDv8EKIXHPbjSV0KwAIbX6C3BZyEWJaoDoAQQgghASCEEEIICQAhhBBCSAAIIYQQQgJACCGEEBIAQgghhJAAEEIIIYQEgBBCCCEkAIQQQgghASCEEEIICQAhhBBCSAAIIYQQQgJACCGEEBIAQgghhJAAEEIIIURX6ivwN/8roK1bL4QQ4igukgBY3vxVPeNCCCFWOtoCEEIIISQAhBBCCCEBIIQQQggJACGEEEJIAAghhBBCAkAIIYQQEgBCCCGEkAAQQgghhASAEEIIISQAhBBCCCEBIIQQQggJACGEEEJIAAghhBBCAkAIIYQQEgBCCCGE6Ep9Bf7m3wQmdeuFEEIcxTuBT+sy9CcxwbFel1EIIcQx+FsJbMyfLpUfqy0AIYQQYgUiASCEEEJIAAghhBBCAkAIIYQQEgBCCCGEkAAQQgghhASAEEIIISQAhBBCCCEBIIQQQggJACGEEEJIAAghhBBiIanrEgixAgZ6vR5ijMQYAarXMO2vxBDsjyEEiqKIumpCSAAIIfrIkJdlSYxxuvEOR/+9ysCHEDKgked5E2j4Mf19AHKgE2PsAG2gE0Jo+3/L/YNmEgTVF0UJByEkAIQQJ0Cj0QhFUVSG/A3jHkKoF0UxHGNcA6z2Y8gNet2PxvT3McYGMOBH8xjvM6Ay/K3qiDG2pv23Sgjk/nenv28BozHGUeBICGE0xtiuBEP1mmUZeZ5LHAghASCEAKjVatNd8wFo5nk+GGMcduNeHcMxxnXAZmCrH5uBjf7/B/0YmHZUK/zqyI76czhqJV/y1tampR+VGJj0o3p/BNgL7AH2xBj3AAddEEzEGCf8dTyEMOHCoswyCz+SMBBCAkCIlTHg6vVQFAUhhEaMcbgoisp4N4FVwAZgG3CSH9v82Aqsc8N+9Eo/O8rAZ6QP8J0uEKa/FtO8AdUxBuwDdvmxO8ZYvd8HHCnLsvI0TIYQxoFWrVaLEgNCSAAIsWwYGBjI2u12A2gWRdGMMQ7HGLcB5wHnA6e7sd+MufUr93zzqPc1jrHfv0AE//65UABnT/MaTH8dBw4Au4HXY4zPA88ArxRFccRjD1pZlnVqtVrZbrclCISQABBiadBsNrM8z2sxxhpQb7Vaq93IX+DHucCpvqJfC1Tu/oFpq/ijje9SoubHALDmGF6EDrZ9MA6MAoew7YMXgaeBJ4uieLEoigMhhE4IoQgh5EVRlHq6hJAAEKKfDH6IMWZlWYayLBvtdnsDcKYb+nP9/UnAJj82uMGfvie/FA39XLwGR/8583ln0AVQFWvQBg67d2AfFlPwaozx+Rjjs8DzIYS9IYTJLMvKgYGBODY2JkEghASAEAs8cHwvP8bYaLfbW9zInw2c4av7k5nay9+IufCzaUdY4Zfw6CDEShRswbZGcmAE2yrYBeyKMb4eY3ylLMsX8zx/IYSwI4QwCcSyLLVVIIQEgBC9odFohDzPiTHW8zzfzNQe/vkuAE4DtgPrmQrQq9zhojvTgxebLgg2+fUtsO2C3cBrwEvuHXgGiyF4zb0DqkUghASAEImsUpaFsizrnU5noxv5s9wovR242Ff5VdpdA5XYTi0IGv7nVS4IzsPiCA668X8EeDzG+EJRFK+EEHaHECZVmEgICQAhjosQQj3GuK4sy62YW/9C4CrgUv/zsK9SNY4W6JZME1lgAYbb/J7sB54CfhZjfDTG+DKwK4RwIMuyloSAEBIAQszI4OBg6HQ6taIoVgHrPVXvYuAa4HI3+lXUfkNXrC88BFWhpA3AKcA7sQDCJ4D7Y4wPF0XxCnAwhHAkhNBWvIAQEgBCAFCr1bKyLJutVmv1NKN/LXAZ5vLf4Ia/qavV12JglR+bsWDMd2EBhE8A98UYH4wxvgqMZFk2WZZlrssmJACEWIE0m82s0+nUi6LYAFwCXIe5k8/AotE3MBW9L5aQpnPBtgbLxjjHBd1OFwN3lmX5QAhhV5Zlk81ms5yYmJBXQEgACLHcWb16dRgfH6+32+3NwNXAe4Er3FBsxfb1laq39KliBjZimRlnARcB7wAeizH+pCiKn05OTr7cbDYn2+226goICQAhlq1FCKExOjp6ihv+a7G9/Quw6PKmDP+yFQJVOuYWFwRnY8Gc18UY72+32/eEEJ7NsmxMAYNCAkCI5cUgcEaM8Qo3/le54Zebf2VRpRZuxLYIzgWuBN4RY3ygKIqfAU9nWXa4LEt5BIQEgBBL8uGu10Oe56sw128VzX+tT/prsdx9rfZXrlegarZUPSPXAA8C95Zl+TDwXAhhf4xRwYJCAkCIJTGzh5DFGNfmeX4atud7nRv+M33VN6CrJKZR1Ra4AMv6eAfwMPCTGONDwIshhH0xxrYulZAAEKIPybIsK8tydYzxVCyF7/2+qqs6763k3P0C68RXHQVT3fkybH88m/a+atyz0ubDtVhL5u3YNtHjwB0xxp8Cz9dqtUNFUXQ02oQEgBD98BBbY55mWZZbsP39j2IFYU5xw7/cnvMSa5Yz/agMfDzqdXr73Za/Vkfb/10T84oM+mvVmrjp1256A6Ppr/Wjjko4LHktiXmKVmFlni9xMfm9oijuCCG8HEIYU4yAkAAQYpFYvXp1mJiYyPI8X4vt8X/IJ+rzsSCvpdqE52gjXhxlzEexane7/XUPVhd/bJqRb00z8tNFwtFHZCpC/uijMuyVOJh+rMEi6rdi5Xi3+jUfOoYnocbSzK7I3Bsw7L/xXODqGOO3Y4z3ZFm2p16vd9rttrIGhASAEAtFo9EIY2NjAzHGs4EbgZuwlL5tLL3gvqMNfgs4BOx141697vPjkIuAUTf6o8AE0AkhvMkzEGMsQgiEEOZlpGKMIcYIEEIIb6zyY4zTRUFVeW+1H2tcBGyZdmz1183+dxtMtQIOS+Q+VULgfP8d5wJXlWX5vXa7/fDq1asPj46OSgQICQAhek0IIet0OtuBdwMfwNz9Z/kkvdT2rVtu3F8BXgJe9T8fAkb8ODzt/aiv6iMQQwjltPeEEGIIgTzP4zRjjhvz41MnMXaazWYoiqL6rMpoZ/4+TFvpDzNVhW+dv1/r7zdie+tn+rHd/99SuWc1rF7ENViw4AXA7aOjoz8KITwbY5zU6BQSAEL0aNXf6XTWxxjfjrn634ftz673Z7nfV5PRV+q7gdenHa9NO3a6wc95c8BeGUIoY4zlUcb5mO9Tc5Sbu3r/lj3wLMsmYowHY4zHCiwc8hX0qdOOU4461tPfWzeZez9OxWpInA1cFGO8HbinVqu9XhRFodEqJACESMdwp9M5F0vn+4Cvwk7C9qP71fCXvmKvXPi73cBXq/2XgB2YG78NtEMInaON/EIY+GQ/2DrtVfEFnaME3Ein09kPvAA0QwgDMcbNvpquvAKnMhVTsM29Bv2YvVH1G7jIPRkXAOcXRfFj4PFarXZAFQWFBIAQJ0YTa+hymRv+9/mqq1/d/QXmvt81zdi/ADwPvOhC4OhgvSVl5I+XTqcTXRR0gHH/rftcCN3vYm69C4Kzsd4MZ7ln4CQslqDfBF/DvRpVnYlLge8XRXEv8OLg4OD45OSkhICQABBizg+mVfFb4yurm4CbsUj/jX343BbAETf8O4EngQeAx/zPo8A4Hqinu/uWazfmB7VabWdRFC+6IFiFxQ6ch5XrvdyN7Cb/7/0iBgK2vVGd2/kuBL43OTn5cJZle9V6WEgACDEHsiyr53m+Eevn/hks2O80n/D7yXBNuOHa68b+AeARX/Xv93ryMvjzuahFUbpYGgf2Y1kIL8YYH8C2BS7ACvRc4d6BdW58m30gBgK2LXAJ5rW6EPhGWZa3Zln2clmWLd1hIQEgxEwzaAgDZVmeBnzQjf/lvurvB3d/lYffOsroPwa8DOwKIRyIMbYAFqpOzNq1a8PY2FjwwLsqfS+bZpRCl/eRtwb2Va/RUwijZxjEWq0WW63WQrm1Y4xxFBit1+uvFUXxXIzxPmzf/Xz3DFzpq+/VLgQWuyBRHYtfeK+LljPKsvxaCOGRRqMxobbDQgJAiLeyyiP8P4UV9TkPSytb7JVdZfj3YO79h9zovwi8FkLYE0Jo1Wq16Pvcydm4cWMYGxsjz/MwPfUuxpiNjIw0sb3zdX69qsp+1dGc5X3AAhAn3aMxcfT7GOPE9D/neT4BTHrNAaaLgyzL4vDwcDx8+HDy65DnedlsNg/neX44xvhSjPEx4KfAGS4G3u6egTOx7YPFFgLD2LbVeuDUGONX2u32nfV6fX+e58oUEBIAQmRZFryM73uBT/rrqfRHat8E8Cy2J/1z4BksqG8XMJllWVGWZRlj7NmKv9FoZAcOHBjG0s42HXVs9GOtG70Bpprb1Lu8r65vFZjXnna0jvrzWw73dEwAh2OMu4GdRVHsOnz48O4sy46UZZncyE1LR+xkWXYgxngoxvise2J+ggUOXow19Hk7Fji4mGmFTeB0vz/bgFPzPP9elmXPa3tISACIlU6jLMuzsSC/j2Pu3H4o4zsCPO2r/fv99WVgLMuyThXU1QOjP4y5jU/Goss3dDqddW78q2O9X6P1fqxmqmb/bO7+mf4c53Ac/feqGgWTWABkleq4B9hblmVVwXCf/7d93lo3WUe96SmHWZbtKcvyoHto7gXuwfpCXIVlkGxfxPmu5vfrXS7atpdleQvWeviIpgAhASBWImt9cv4I5vK/gMV1+ZfAAV/xP+KG5EGsOl9VgS+l0Q+8tab+yb5iPA1LfdvkRn+QqYY79aPeL6aXJPq5n+FehJw39yuo0iF3xRh3YYF9B7DeBdUxyjGKCh2HGKhqKUzEGPf4PfwplqJ3FZazfyqLE0wa/Nm+yEXbduAbwF1Zlu1SYyEhASBWBN62dysW3f8JLLf/VMxduhjkvlJ9AXPz34X1g9/pK7QkrtoQQj3GWNXLr9z5p2LR7Gf76zYsqn3Qr0ezz8dpmCZIphvWLf7bWkxtJ7Tc+O9kqgriDv/zHmBvCGFfCGHcDfrxKZIYC2CsVquNF0WxH2vpe6c/b9dg0fmnYFsmCy2emi7uPuIC7+SyLH/oz96EZgchASCWLSGEwbIsT8dy+z+FBW1tYnGi/Nu+In0Zc/PfCTzqq9aRE12VZlkWYoyDMcb1wIYY41YsQO1cP87w31411RmmP6veHa8wqATMmmn//XQ3wNMDDQ9hhZIeizE+FmN8BdgfQjicZdno8ZbW9Up801MKnwbucI/Ae4C3ucdloYtKVT0F3u1C6RTg28DP6/X6yPQ+DkJIAIglT6PRCHmer4oxvg34NPBRN4KrF8nwV0bnJ77ifyqEsGNgYGD0RCq3udFvxhhXlWW53lf1VzBVxKYK2FvD0mxelML4VYLnjUU7tv3zrmmC7IkY4yNFUTztnoGxEMJECKFznCV2J4EdWZbtK8vyeb/nV2MBp1e4EBha4PvxpiwB4Ct5nv/YU0mVJSAkAMTSZ2BgILRarTU+0f4S8GFf9Sz0arfECvc8D9wG3A48HUJ4PcY4HmNkcnL+Dd2GhoZCq9WqxxibZVmuwdz5V2LxDedj+71bV6jBn6u3oOoaeIZ7CK7GtgV2AM+4Z+BRLO1yNITQDiHk8xUDZVm2gZ1ene959/xcjdWduAoLvKxaFi/UHHwaFgOzGVgfY7ylVqvtLYpC1QOFBIBY2rRarfW+uvsCFu2/bREMYduNyV3A94H7QwgvZVk2eTwryjVr1oTx8fFQlmVtYmJiDZZ+9nasBOz5mKt7ervboCdhXivjIV8VX+IGuoobeDHG+ESM8SHg2RDCkUajURzVrXAuQiAH9mRZdqAsyxexOIEbmCo5vZBiLWMqS2AYGCqK4pveWVAiQEgAiCXLZp9YfxG4HtvzXEhjGLHAswd81X8n8FSWZSNlWR7X9vLQ0FAYHR1dHWM8G4vqvtiN/jm+mlvHVCtcGf7j9wqA1TXY5s/NJVhsxutYPYZHY4w/a7fbPw8h7IkxzjtYsyzLvFaFU1VxAAAgAElEQVSr7SnL8lCM8VUsjfD92NbAOSxcYGpw0XGl/+bhoii+FkJ4IcYoESAkAMSS42RfUX2OqRzohTSIYz6h3wn8CMvl3+15/Mezj5wBmyYmJt7mE/WlmLv6LF/pVxH7MvrpV8jVarxqBHQuFtH/buDhGOPPgUdCCC/FGMfn8+HuAWphlR33YmmgT7gQqNpOL4Q3oEoVvNSfpaEY41eBp/AUVCEkAER/P1TWya9Kdfoctre6fgENYxvL3b/PV/13A69kWTZeGsczTra5sb8ceCe2v78VS30bkNFfUM9AVdFwyD0Dl2NxHQ/61sATwAteeGg+N7sADmOZIDumeQOuc+/D+gX6jYNYhkL1G7/i56Q0QSEBIPp4qZZltTzPz8Dy+z+H7YuvWSADWWD5/I9h6V63Yalfh4B8voY/hNCMMZ7sq82rfLV5sRv+qta8WFzPQJVRsB7bhnkfVgDoPg8afAlL65xPJ752rVbbVRTFiHsFHsfSVt+BBSkOL8Bva2K9MH7BRcCfYx6sUd12IQEg+pFmWZZnYWl+n8X2x1ct0HeP+WT9E+B7WAW/3fOc+Ku+BEPA1hjjOdjWxbvduGxjcYrHiLmtmgexYLrT3Vg/g1VzvBd4JoSwu+rU2FVJ2rbAmNfsr2oIPIplC1yGxbb0WgA2sIyST7oIGMC8WiO63UICQPTbBHyeG/5f8PcLUXK18BX+w8A3sdS+F5lnjXU3/MNlWW7CXP3vxVz952J7wEO6xUuCGlM9E07DXPfXA3fGGG/DMgcOzbUnge8XHQghjMQYd7io+Dhwo3/+wAL8ntOBj7nnYRC4q16vH1LBICEBIBadEMJQjPEiLNL/U1hQ3EJET+dYetiPgK8Dd9dqtd1FUczZ11+r1UJZlo2yLDdidQqux9LOznPD39QdXrIM+7O4HYvovxK4PcZ4ZwjhhflUGfRI/NdDCIddCLzmQuBtWPR+L71CGVMBtUPAYJ7nP6rVavuPsyiSEBIAIpnxrwr8fNxXRb1+rqqo7WeAbwHfwfZ9R+aT1ler1bKiKNb4JH4jtn98CbbH39DdXTYMMNVn4Tzgqhjjj4qiuDuE8Eqj0Wi12+05icYY42gI4ZEY4wEXAZ/Etog209tMgYAFPN7gXoChoii+hxVLEkICQCy48W/GGC8D/pIb/1Po/b5oxFz+9/uq//YQwosxxjmX8Fu/fn04fPhwsyiKM3zFX6V7nYoi+pft44rFb7zNn9OLXAjc0W63782ybEfV4nkOIqATQng5xvhNLMDwNayS31k9nlMDtrXxHv+eEot32afbKyQAxIKRZVmtLMtLsOp+H1kg419g6X0/wlqp3gPsnU+hlBBCdujQoZMwN/8N2F7/eZgbV1H9K+DRxeoIXIbtrV8MXFaW5V3AQ76F1NWtHmMssyzbH2P8ibce3uEi+O30tr9FVTb5HUx1Wvwh1lZZCAkA0eOHpl7P8jy/EEvz+yjm9u+18ZzA8ru/D9wCPJJl2ehck/qbzWZot9vrvBnRezGX/2W+ohpYRrenw1QHvAmsJkLu4ik/6n3hHpV6l6PBVLvfVSz9uIiqlsAWpgI9LwPuKIriJ8CTAwMDI61Wa1Yh4MWkjoQQHvMtgR1YDMy19LbcdXAR8y6/x5PAj1F2gJAAED1e+Wd5np+DRft/Eutw18vnqMRK+f4Mi/K/DYvyn5xHXv9wu90+E3Pzf8An/aof/FKjwFIeR/y1MgBVe90jWDGbQ/53KhHQdnEw/X3u17fBVOvegaNeq/eDvrLd4MZnegvjYX8/xMLkyKc0pEP+LFR1BC4BvtNqte7FSg53LS8cY2xlWfZKWZbfxlJPd2LbSmf3UFwGLOXxvdOegbtd+AkhASDSG/+yLE/zVc6n6H2t9NxXVXcAX8Nc/nv8v8+Fmq/y3o5FUFfu/vUsja58k9NW8+Nu8A+5gdmB7T8f8P9WGfzpBn66kZ/pgKlSu9VRO+q1el93gzbsQmALFvw2/XUTVvhplQuG1f6+n693VYf/PP8dZ/jxQ+AZ9zR18wZURajuxMoJV1sCl/ZQaGbuabjRRcA4Vv9iUrOVkAAQqY3/yZjL/7NYrnwv8/w7WF/47wBfxqqgzdnFGUIYjDGe7iuxj2Mpfv0c3V9lNlQT+WE39K/5SvR1Nyr7p63+x4DJEEIrhNByI7QwFjOEqlZ9teofnOYN2Oir6rNdJJ7hgqH6e0N9OvdUq+rKhX8W8K2yLB90oz4X4TmWZdkjZVke8nv1eSzepFfVMDMszfFD/uxMhBCemGvBIyEBIMSsNBqN0Ol0tvgq+gu+qumlq7eN1Xb/JlYC9dG5rmoajUbW6XSGY4wXY+WIP4xFfvebazq6Qanc8iPAK1hq4zNYCds901b2h0IIR45VwCbGSIwLmw7u59F2ofIWcRBjXOvegE3uGTjVDeo5TKXkDTG1zdBPAZiDwAV+7mdgMSe3hhBeqtVqrW4FeMqy7NTr9RfyPP+Gi7QWtl+/rkcioCoW9HFgIsb4P2q12vNFUaiBkJAAECe4FO90NmER87+EFVPp5d55C+t+9lXgqyGEp+ZatS3Lspqf67uwcsTv84mxX57ziLndc2yv/lUXOs9hcQ3VKn9nCOHA0b97oY38CYqDfX5Qq9VqRVGsdSGwzY/tWPzIeS7QtmHbC9W2w2KTucfoeqwIz1kxxm/lef5wrVYb6VZAKM/zODAwsLPdbn8vxjjhq/Pr3RPSi99X8+v5aWC8KIo/rdVqLxdFoVbCQgJAHDfrsW5ofwELnlvTw++axAr6/DnwzRDC83Pt8R5CqPoQfAALTrzaz70fVpbRj1FsW+MxFznP+6r/tRDCnhBCCyhrtVrsdDrLpsJbURTF4ODgoXa7fRh4vizLzFf/23yFfS62pfQ2f93mXoF+qMcwjAUGbvFz/XZRFHeEEF7t9my2Wq3YbDb3ttvt21wATPjzubVHIqDhHpbPuQj4cpZlrx1P+0shASBWOCGE1THGd2Fu//fQ23aoY8ADwJeA74QQXplHfv9qr0b4EWwvtIpP6IeVZMtX+s+60X/CBcBLwEgIIQ8hFGVZFtUKfznO15OTk5UIAstk6GRZNlaW5StYs56T3BtwEeZ+Pw+LITiJxY/bqLsX4INYbMOZMcbvekXAsdn+YbvdjlmWHSzL8idMxXh8yD0gvRCnA379fhGYKMvyG+5VEkICQMyZwRjjVT6R3IDth/aKEeCnwBexvdYdczH+3sBnm4uTT2BR/qey+HnqHSxo7CXMvf848HMXAQeAiXq93s7zPC7G/n2/4EGLBdAKIYx7jf373ANwoa+8L3QhcJY/g4sl6jLM+3WFewNOiTF+xZ/bg11+Z8yybKQsy3umiYCP0LsU2iEsTucL/l23+PMohASAmB0PpLsQ6+p3I+ay7JU79gCWOvVFrMLf7hhj12j2EMJAWZZnYoGJn/CJeSOL5/KPLmReY6qH/EO+4t8HjNRqtfGqylyea2v2TRfP7vkYMBZCOBhjfNU9A1vdK/AOLJ3zXBY3m2PADfdHMY/YGuCOLMv2zOZq9zTCUczL1XbD/DH3dPRCsK7yMTGKBZL+0N8LIQEgZlj2Dw5mk5OT232CuxlzVfZi1RV9VfIj4E+xFqf78jzv6v8OIQx7Rb9PYpHPF7B4RX1KN/yvY/ELP/XV/mvAfl/5RYD5NCqSGGAEGMmybGdZli+6Z+Ai9/Zc4x6BLSxOm+YatjXxfrzWQVmWt/oz0E3ZTWCtqysR8Cl6l1K71q/VbmBvCOH+ucbUCAkAsfJW/mFycnKtr/p76aKsjP/3gT8B7hkYGDjYrfRqo9EIeZ6vijFeigU6fYLeN2CZicJXVDt9Qr8TK8LyIpb/nfvKTw/Wiagr2yY46McO96z8GMvVv9ZX0JtcCCxk0GBVM+A9Lj7XYK72l9y4z0bLf0cbC3z9HOayb/bgHDdj2Qc7Y4x7QggvxBj1UAoJAPFm8jwfxtL8Pontv/ZiVRJ9Mr8d+CNfMR9utWavW1Kr1UKn01nr5/d5pnoQLPSecIEV6tmFlSf+iRv+Z7MsO6CI654yCjzrEfhPYKVvr8ba8V7kQmBggZ+J1X4OlQj4RgjhGU/9m4028LQ/T1Vvgot6MCdXNQI+DOyIMX6xXq8f6FbLQEgAiBVElmUNT6P7tK+s1vZoRXXEV8t/DNzjOdXdrW5RrPfz+gJwE7Y1sZArvtJXa6+74b8b+FkI4elms3mw1WrJ9i8Q3vr5eRcCj2KxAldh6apv91VvYwGfj0EXzMPAuhjjl+eSIQDknur6Df+MASyNL/W83MS2GT4J7CiK4geoZ4Bg6bU//Y0En/F7qFb2m2g0GqEoipOBz2DuyDN69GyM+Yr/v4UQ7qjX64fn0nrVJ/QbgL+MxSWctMDGv4Xl698BfAXrS3BblmXPDw0NjXuKm1h4imazOQK8HGN8BquxcMgN3loWtpZADSvyc6p7Akax4M9uJXnLEMIItm3U9H+/tgdejDpWibAOvJxl2b65BNuuQK7G4opOhMexWibyAIj+p9PpbMCq5lXd/Xph/MexCOg/CSH8uF6vH+x0OnNZMm9zo/+LmKt34wJO6tEn5gexLYs7gaezLDscQsiLoojj41pILSbtdjsCnVqttqsoiv1YquXjWIDetb6iXqh2zzVsW+oTbmxXu2jc38Wj0QohPBlj/LJ7ET5F+uDbzMfOdcDrZVnuDyG8JBGwspEAENW+/6fp3b7/JBYZ/0Xgh1mW7elm/JvNZtZut7djwYi/6Mq8V7XUZxIsz2F7/N/H3P57m81m242O6CdXQFGUWD2BF2OMe4EnpwmByzGv0ULMd1WHvpt8bDWAW+cgAiaxnhdfxAIaP0r6ioF1FygfBl6JMX4V6zchJADESiPLslpZludj+cjXuoFNTRXx/BXge9geZNntvNrtdtXc5PPAZfSum9rR5FiA34PAD3wF93K9Xj+S53lst9VfpZ/xFe1hN6Y7/fUmX/leiLnpe/0cVavt9zDV/+FWuhQMYqqdb9Ux8SZs+yvl+TaB87Htvh1YGu4RPTkSAGKFUZblKZh7/Was1GnqiTHHXLLfwFKkXsainmckhFAry/IM90j8onslFiLHv3TD8Zwb/R8Aj2RZtrcsy0KFe5YcbTdwh/y5ewQrwXstts/e6/oBwcXGu5nq+ng7x+ieeBSjwD0uAgax2JcNic9tFVNev71YwSq1D5YAECuIddi+/8ewUqupn4UCy4n/lguA5+heJKUWY6yKEH0Bi+geXIBr0XJjcb97Ke52ozGhyP4lzzjWXnmvP4PPuBC42MdAL1MGA5aa+F4fDzlWw2Cky78bwbaeKhFwHWmbcFU1DG7AClYdyrLsGaWxSACIFUCtVmsURXEVFqx0WQ9WQyWWLvcdzPX/JN2Lo1TtVz/oxv/SBTD+Vfnep7B9/h9iLuMDekqWHQdd4O3GmjN9AmsbvbXH82AlAq6f5gm4u9lsjnaJJTmAuecrEXBt4nFac0/IR4EdZVkeQPEAEgBi2Rv/WlEUVSBQle+f2vgfBG7DOvs9ytzci5uxVqm/hNUw77WLtsACs+4Fvg7cPs8OhGLpUeJdGLH4gB3YPvtZWKZAr2IDMn++b3QBkHc6nXvpUpu/VqvtLYrih5jLfhVW6yBlhk4Ta8H8UczjdSvdvXRCAkAsVYqiGPLVyPuwaOXULtBJbA/zy1iJ3LnUXNjo5/RLWNOXXu/555jr84dYTv9PG43GgU6no+j+lcGBEMKdMcZd/hx8DPOE9ar4VSUCtmDxNp0YY+G1+cdmGasRC0j9gf/bTS5WUo7ZYRcWNwLPNxqN5zQOJADEMiTLsqZH/d+ERQKnrj3extz9XwPuq9fr43MInluL7XF+AXPJru3xZZjE9oFvwcq2Plqr1cY06a0sYowTIYQnYowHsO2qT/hzeDK9iwuoUgQ/BOSesfAzZq/KV2BbFt/1c/ucC4FUQqXqF/A+4Ok8z3cODQ2NTUxMaDxIAIjlQq1WC0VRbPTJ56oerHaqieqbWHvUA906+4UQVscYr8Wi/a8jfbTzm+Z8LAL7Yczl/13gpRjjpCL8V6wIyLMs21GW5S3YdsAOHx+9LB6UYUV+PoxvB2BR+LN5ylourL8FnOKr9ZResgGso+aNMcZHW63Wz+iSrSMkAMQSoiiKYczNeSPWHCR1tb99WNDSd0MIL5dlmXcx/sMxxqvc+N+AuTh75X4tMFfqT9078aMQwm7t9wuPfD+ItRveiwXCfQbLEujVVlSGBeB9GCuPPYbVypjR6GZZNlqW5X1YQaOTsQyZlB68qqnRzWVZvlSr1fZ1q9chJADEEiCEUIsxVhPOxaSPrh/FXJlfDyE8HmNsdzmfwWktfW/ySa1XbtcOlo54m6/876vVagfn2INArBzGsGyQcX+eP49VEOxVAaoa1nPjIy6eD2H9JmYSKjGEcCDGeId7ATaStmdH3UXJDcDDZVnejhoGLXsyXYLlT4yx6qT3PtJXFusAT2C5/vfFGEe7GP96jPEcrAjJR3zS6VVTqg7WcvXPgf+K5VYfkPEXM5BnWfYi5iX6b5jH6CC2fdQLGsB5WA+O97tRn20cFyGEV7Dtq9vcY5Hy3Kquhh+JMW4PIdT0SMgDIJb+PT7fV//n+KSTiiqt6rvA7V41b2a1mWVZWZZVENQn6F3XQZjqt/5l4Kv+XtXOxOwPdFlGLDPgW8AEtjf/bizwrhcLpiHMnf9pYG8I4UcxxvFZREDbBffXsViC95KuSFDmv/PdwAMxxoN06WEgJABEf3OyTxLvIH2E/X6sbO53gJe7VRIry3Kdn8sngXN7+PxVQVNf8tXcc3QvRCTEdHa7sJ3w4wbSN+epWINlwOyNMe4LIfw8xjibWB3F6ldsx2JnLk8o7OtYZdCPAU+GEI5029ITEgCiDwkhDMUYr8Sq66Wu9T+BBU59Ewtg6ra6roIQP+WvzR797ElfIf0Z8LUsy14sy7Kjp0EcBwewWhHjftzsRje112p6oaA9McZD3tVwxuc2y7J9ZVn+0M9nI+bdSzJtuCC5GssK2MkssQlCAkD0Kb7XfiNWVjdlZb2SqX3/e+neTazuK/5PYh3SelVwZQJr+vJF4Ou1Wu2Voihk/MWJMBJC+EmMsfIEfJTeZNHU/HM/CuyKMX4ly7JdM3nVPCjw1RjjLVhQ4DoXEakEyTZs2/BxzNM3pkdh+aEgwOXLeiy3/r2kza8vseCjH2Bpf3PZI9yORfvf7JNVL567CSyf+o+Ar2ZZ9rKMv0gkpMdCCA8A/x3zeL1Kb/LkG1jL4s8A1/mW2WznVcW5fAdrI5wyrXXIz+Vm4Nwsy4KeBAkAsQSo1+sZFlh0A7aflzLwr+Wr/ttDCK/NYdLZ4EKk2vfvxTM3jjV6+R/AN0MIr3arQyDEPEXAeAih8i59Dysa1Is8+SGsVe9n/XV41gk8y0aAB7BYnFcTn0tVovsdZVmu11OwDG2FLsGyM/4hz/N1mKv9aqzARyqqan+3Aj8PIUzGOGsW0iBWdfBT9K6176Sv/P8Y+E6WZa+XZakqZqIXIqDyMg26ob6Z3vTTqMbvLqxGwGMzeRw8a2EP1mb4IixQcZg0W2x1bFvieuDxer3+0zzPlUIrD4DoV8qyrGG5vNdgBXZS7lUe9onmbmD/bFH/nkN8ARZNfC22JZGaqgbBnwPfy7LsNRl/0WPGseDXLwF3YltgqY1i8LF7A1NNu2akVqu1sCJGt2F9LlKOgapC4FV5nq/R7ZcAEH1Ko9EIZVmuxlzuF5O2nnkL22/8AfDs0NBQMdt5xBhPxrIPbiJ9BgLY1sPzWCDid934q3SpWAiOYEWlvogVCzrcg++oYZH9HwIuCyHMOJa9sNUhrAvn7X4+MeF5nOwi4IJmsymbIQEg+pE8zxvYPvvVWOBdyi2e3VhK1AMDAwNHZusWluf5kK/6P0L64kP4Cud1LE/7G8CL2vMXC8whLAj2i+4RONIDT8Aq4ArgphjjOatWrZpNROchhJfcCzDXNtxzpYpLuLbT6QwNDw8rIFACQPQhqzCX4dtIu99+xCeVH4YQXm+1WjNOdF7q9zxf/b+dtOmHYIFX+3yi+zJW8EcV/sRisB+Lh/kzLDZgogffsRnfChgfH9+wevXqMMvYmwR+7sJ4J+mCFBtYLMDVMcazW62WSgRLAIi+upFZ1ogxno4FD6Wsr18CL2CRz0/OVqEsy7LgfQfej5UTXZf4Z1auzruAL4UQurVRFaLX426PG9w/w+JRUlfNa2JevZtijJePjY3N6NUry7IMIezCYhPuBUYSewEuxdITB3TnJQBEH1GW5Vo3uheSLgq4WuX81CeVvV3OYcBX/Tdi6Yeps0xGsZSnPwPuzrJM3crEYo+7mGXZbiwX/+vAy6SvEbAaK+V9c4zxFE/zPfZSvdEoQgjP+vk8jwXKpqAOnAlcG2M8JcsyZZBJAIh+IIRQxwrsXE/aQjsdrLLeD3xiK2dZCdWwuIMPYvuWqVcJk8CjWPT1j+r1+oi6+ok+EQFVTMotPlb2krZGQIal910P3JDn+Zp6vX5Mgd9ut2O9Xj+ExSXcgcXuJJlmXIhcDLy7LMsh3XkJANEHxBjXYfn2l/ggTbX6fxVL+3uwXq8fmYMH4l1Y5cHUudGFr2a+Dvwgy7K9ykcWfUY7hPA01kXwHrqXx54vTSy252bgwqIoZgys7XQ6pbcN/gFz69MxXy/A9cBWtQuWABCLv/rPgNOwQKGUjUo6WGDTHcCuLga3jkX73+yTVOqo/11YetOtnu4n4y/6UYiPMdUg6wnSxqcErIfGO4EPxhi3ZVmWzXIuE1gBoR+TrplPdQ6XAlfFGFfprksAiMWddKoBeQXp2v1WPdHvxQqLdJvITsKyD95B2r4D+ErqZ9ie5tMq9CP6nP0uVm8BXiJtPECGBfjeCFzlNT9mYy9Wr+AJ0sYCnObnsHU2ESIkAEQPaTQaAXPJvQfb+0+1+s+x5iIPYFH3szGEBf7dBJyR+CfmWPGhW1wEqCOZ6P9JNcte8Wf2NtLtwVcMYCV/bwK2d2nS0wKe83H8WkIvwAas1sjFZVnKCyABIBaDPM+HsX3/dyZc/ZdYbfH7gKezLOu2+j8TS/u7jC6NS47DC/E6to95e5Zle3XHxVKgLMvC4wG+Sfp0PLDaAO8ALvPYm9moKgQ+ktAbUXkB3g+cXKvVVBhIAkAsNDHGM1yJn0a6lLuOr/4fBA522W9fg/UcuB6LUk5p/A9j+f7fAV5VmV+xxMbmGOa1+ga2F5+yNXXmwvsGunvdxrFiWT9zb0SK+JmA9fa4FjinKIqm7rgEgFhAPPjvQqxEZyo3XAQOYs1+nsqyrFv08HlY1P9ZpM35b2Mpf7f45DmhOy6WGvV6fR8WhHcr5s1KySYX35fS3ft3CGuX/VBCL0DTFx6XA9vkBZAAEAu7wliLdds7m3Rlf6tc+wdDCPu6rLqHfPBfTdpOf1XL4e8CP86y7LDutliKeObMDqyHxn2+Gk85d5+OBd+eO+tfzLIJLBDwPhf4qbxpa338nyYHnQSAWCAGBwczH/Rvw9zwqVb/h7CKf0+HEGYsaerBh+f6CuTUhKv/yvX/Y+D7wG65/sUSZxJzwd+GBbSmzArYiMcCzDYP+Bjah20D/BwLrk3BEBaQeFaMcVC3WgJALACdTqeGBf9dmHD138JS/u4PIcxqePM8H8C2Hq4mXfBhdQ5PArd6EFVbd1ssdUIIB7F0vJ/4Cjxlq97TsBLg53fxArTcC3AX6ToX1oAtWHXA7doGkAAQPWZoaCgry3KdK+/TSVd0Z79PDs/Mtvdfq9Vq3nToGiwQKVUAUPRzuBO4r16vj+pui+VAjDHHagLc7ivwlN0r1/lYvBqrAjqTF6AIIex2L8BTCcV1lQZ8XoxRAkACQPSSVquVxRjPxwLw1pCm7G8beBG4O4Swc7Ya+97w52r3AKxJ+NPGsYC/O0MIr3Q6HVX7E8vJCzCB5ePfhrXqTZmSdzqWCnxBo9HIZjmHlhv/H5OuVPEgFot0XlmW2gaQABA9Xk003Piek3D1vw8LEHrKS4jOtvrfhqX/nJt49b+jWiHFGDu602KZjdvSDf+Pfayl9HCtdlH+rjzPV61ZsybM4gV4HasL8FIiL0CG1SW4EDjN44OEBIBITbPZzLAqXJdidf9TBN9FLOr+LncRMsvqfwgrOXw5FvmfarCPAA/7OezUnRbLkVqtVmDNeX6AedxSCd0GVg/gmhjjWWNjY7UuXoDnXISkKlBUVSe8JMaoBkESAKIXdDqdZozxQl/9p+r6N4p12nsmxjjjqiTLshBj3Axch20/pBroEXgBy5V+2ldKQiw7iqKItVrtMFYd8MdYzEsqBrHA4GtijM1ZxnEZQtiF1QXYT5pgwKbPSRcXRTE8MDAgL4AEgOgBg1jAT8rKfzt89b2vy+p/FRbtewVWhCTVs7Mf2xu9r9ls7tMtFstcBJQhhOexLpsv9MALcEWMcYN7C99CnucxhHAYiwV4mTQBiZVn8vwY4xl5nssLIAEgUhJCyGKMGzD3+0mJ7l3EWoU+guXfz8YmX/2fm1B8lD4R/RB4qd1uK/BPLHs8zuYJbC8+VY+LgHkFLwAu7nQ6A7OI+QJrsf1QN+E/Ty/AucDlZVlKAEgAiMSTxjBW+OdsrOlOCjfbEWw/8AVmKbcbQmhgBX+uwGr+p3Lx7cbcoQ+7a1SIlcKrWNrti6SrzFfHynJfE2Nc1WVBcQBLCdxFmm2AKhvh8hjjqi5dCoUEgJgna7CqX9sS3rdXsKCkg13Ex3psf/F00kX+l1jhobuBWVMPhViGjDHVpCeVF6CGeQcvA07OsmxGT12j0Rj18fcSaXptZFhg8PkuQhq6xRIAIgHe+GcTU/vvKdR1BJ7Fav93S0k6CbiKtB3/DmNFUR6r1Woq+iNWIjvcC/As6aoDDmEBeZfGGGcsDNRut6u234+4FyCVB+I04C9RJOIAACAASURBVMoY44BurwSASGGprc72aVjlvVTu/5FpK4DJWcRHw7/7bVjVsRQU2NbDg8CeoigU+S9WIofdAP8cOJBqvQCcAlwbY9w4h+9/CPMEpioNfBIWpzSo0sASAOJEJXW9HtzwXoDV3U+1+n8ec0GOdBEfW7Ac31NIF/w3gWUePBRCGNNdFiuY3dg22NOJjHDAvISX0mXLrtFoTPgi4HnSdCrMfK46K8a4vixL2RcJAHEieE+eSgCkKr2bY3v/T9F9/+90bOthQ8Lvfs0FwMuq+idW9ARs7a4f8vGQqklPHQvavRJr1nNMvNz2QawE9yup1ixYZcCzSNeoTEgArEy8wUYVXJPC/R991f8kXfKA3f1/Jub+T9X1r+UT3kOkCT4SYikL/BLbg7/XBXmqWICtWNDwyV0i8kexOKDnEnog1mOlgYfcgykkAMRx0sQi/7djJTdPlAJz+z1Dl+C/GON2zP2/NdGzUmKFf34GPFOr1bT6F5qEs2zUBfEjpOvSt8aN8DllWQ7P8t2TeCVQ0vQnqLYBLowxDs/SVVxIAIjZqNfrwYv/nO0r8BT3K3fF/zzdq4Cdg+0lplr9T/h3/xwYUeqfEFCWZQd4HduW20WaToEBc8Vf5AuImb47YsGAT2MewZjge9dg5cLXqkWwBIA4/okBH8TnYek9J0rEIv6fAXZkWZbPOIpDGMS2HS4AViX6SYfxroP1er3QHRbiDcaxLYCnXKSnYK0LgJO7/L1JrBjYc6QpSlR5LU9BcQASAOI4rbWp5y0uAFIMpALL/X0NGHX1/xaGh4dDjPEUN/6bEz0nbf/ex0IIe/I8l29QiGoizrKOC/NHmSUtd54MY97Dk7uM4TZWmfDlRAIgc/FxfoxxraoCSgCI4xMANVfSp5Fm/7+Duf53z7bKaLfbYdrqfzjRzzmCuThfijG2dXeFmKIsy8LbcT9Jum2Amgv4M5g9i6fAYnNeJV0mwiosBmFdjNrpkwAQ88KjZ9e78V+fcBX+HLA3hDCj0i+Kooal8ZyZSHiAuf8fdS+AEOIoQggtH5+Pky5DZhXmQTyty99rYZUJX0sgPoIvHM7HAgLlAZAAEPNcEYBF/p+V0AhPYmVH94YQjjnIBwcHgzcSOQ3bfkhR/Kdwr8MztVptv+6uEMce9lhzoKomQAqG5ygAcmAn5iFMsQ1QVS/divoCSACI+eH7/6dge3gpBEAJHAJeDiEcnmn/v91uZ1gRkVRph2DFRp4EXi+KQsF/Qhxb9JchhD1Yq+BdpAkGHMS2ALo18sr9O18gzfZDhmUDnB1j3KA4AAkAMT9qboTPJE0HvglfXewNIeSzCI/K/b+ddKV/92Pu/126rULMMiFbMOBLPl5GEnxkwALyzgJOWrt2bZhFAOzxOWKCNHEAQ9g2wGalA0oAiPl5ANa4B2Cji4ETZRxz/x/oMrjr0wRACtddxNz/T7oQEELMgNfGeBUrDHQo0ccO+pg+a3JyMnRZJOzAtgKKRN97HhaIKCQAxFzwAMDtmCu+mehjx7E0o4NZlsVZhEflMtyaSHgccuHxGpaFIISY3QtwwMfMPtLsxw9gnsRziqKYbc4vgL1YHECKTJ2mf+8W9ywKCQDRjRBC5gLgJNK44atqXy+EEEbyPI8zTDx1N/ynYNHDKdx2OzF35gHdWSG6U5ZljnnNXgFSdMts+nxyVlmWq4aGhsIM807pouPZRAKghmUwbSVNITMhAbD88bzZzaRz/09ipUZ31Wq11izf28SCDrcl+t5KADyBBQIKIebGQV+Jp9oGGAZOjTGe5IG+xxIAxTQBkKoYUbWoWK9AQAkAMTcBENz4b0hkiA/7oJ5x9T9NAJxLuuY/LRceryWcUIRYSQLgcGJDfPpM7viyLGOWZUfc83CQNHEAVXvg9QoElAAQc6Asy8wFwPqEAuA5ukcVD2INgLYk+t59pHNjCrGSGMEi8lNtndWATcDJMcZslkVA4d/5UiLRXlUjVEEgCQDRjYGBgeCBeBswt12KQTMKvBJCmNEQ12q1qo3n6QkH614XAOO6s0LMiyotb0ei8VOvBMBs834IIbr4eCWRAKj7gmK9bqkEgJj76n9dwvszDuzx3t8zfe+gG/9NpNv/3yMBIMRxcwQrzJMifTbzRUW3wOLo43UX6QIBN7sAkAdAAkDMRlEUVQfAdYkMcY5tARyZrQqfex1OwYqGpBio0QXA67MJDyHEjIxgcQB7E3xWwCLxN8cY17nHb6ZxO4FlIaQSAJsSL2iEBMCyvidb3RCnuD/jvoLoZoSrHt6rEhn/Ecx9eaj0xgZCiHl7AF7EYmlSzS3rgW1lWR7TC1Cv1wkhjLsAaCUSHoNYEOCgbqkEgJjNclqAzpaEAmDUVxDd1PyAC4DViTwAe7AMAK3+hTg+2m6IU7njKwFwKjNsA7Tb7RhCmHTRkaokcA3PaqrVatoGkAAQXRRztQWQ4v4cAfZ4q9FuAmAraQoAlUyl/7V0S4U4bsYwT1qKOhpVoO8pzF7mu/CFw0HSVO+sYfEHm8qylACQABBdBktKD8ARYG+MsZshHsKCdVJU7IpYAaDXEq1chFiptDBvWioBsB7YHmOcMRAwhADmudvtXoBUHoBNKBBQAkDMcDOsUlbDB8pq0m0B7JnNEIcQ6r4yWEua0sMF5rbcVavVJACEODEBsI80BYGqzoCztvrOsqwSAHsSCYBMAkACQHQbnSFkMcZ1boxTteI94hPIjIY4xjiEuf+HE63+x7C4gyPe3UwIcXy0EwuAYczDuKZer882/0+6iE/pAdioaoASAGIGyrKsuSFOFYgXXQAcxNIBZ2KYdA07Sqx++WHSlBIVQgIgXUngDFgDbC2K4phxAJ1OJ3rMUCoPwBsxAPIASACImakzFYmf4t6MufGfy/7/NixdJ5UAGCFNK1MhVjIdH8OHSRORj4/zDcweCDh9C+BEvzdgwcUbEs0xQgJgWVIVzUhVAvgwVgOgWyRvSg9AlAdAiKRMuAhIUVEzYDU/1sYYZxQA0zwAqap4Zr6wWdNsNmV3JADELEq5kUgAHJqjABgi/RaAPABCpPUCHErkBRjAggFnrDRaluUbFUQTjeOqINBqxQFIAIjZB0kj0eeN+qSRz8EDsCW1AAghSAAIceLkLuQPJhIATSwOoFugcdvHcoo4gCrDaUC1ACQAxOwCoJbIAzCJufC6ueIHfUJI0XvgjS0ACQAhkgmAA6SpBYAb4rmM9wKLI2on/N4B3U4JADGzABggXQpgBwsAnHHV4DUABhN+Z+EC4EiWZRIAQqQRAIcSeQCqOWYuHoDS5488wW8I0wSAPAASAOJN0rjRCNM8APVEg6Tj6n02Q1z3QZnqWehge4djeZ6rBoAQaUT1EV+Np2CuWwAl5kVMUQ74DQEQo6YFCQAx0/0YII0rfk4CIMZY8wkhxbNQ+kR1BGUACJEE30prka47X5MuQYA98ADgAmBQHgAJADHz4OyFByB28QAMJhId1UplPIQgmS9EGqKP425jOakHwIXHJNoCkAAQPR7h5hZLHQOQM7ctgFQegOgrho43FBFC9JcHoBrzQ3QJyIsxFvQmBkBIAIhZPACptgDadAkCJG0MQHSvg9z/QqSy1vV65QHoJPrIaqExnGVZfQ6CPk/keajLAyABILoPzKRbAF2i8Rs9EgDaAhAihYpvt1NvAVTGeHWXtsDaAlju4lKXoD/I83y6AEjlAciBdlmWswmAKggwVQ2AnHRBQ0IIo0goAKIL/m7jvidpgMoCkAdAvFVtV4KsQdqUvG5uw9RbADkqASxEakofy/kCf2c74Xc2URaABIA4xjK8VkudAjjX/fgqC0AxAEL0Lym3AYJ/Rtnls1LXAVAMgASAOOZIK8uMtAGAuQ/cbpNFlQWQ8nu1BSBEegFQpfWm/MxuAkBZABIAYgFInQEwlyqA0wVAClWuIEAhei8AUsUBzDo3TEs/TOXRUxCgBICYRQCkagIUfdCW8/juVN+boy0AIXo1X6ecs7ttATDPeaTbHJP6/IUEwDKR9xYaOxeX/XzExFwERUm6wL2YcMIQQrx5TFdBwqnEerctgOo7s4RzgxYHEgDiLSMtvbutydxc+1V6USqVX9NzJURPBECTtHvos3oAYoy9qEzarTCZkACQAEhAjbkVFJpLueD5TFKDPlEJIdIKgAZp43W6GeIsoQCoshhaupUSAOJoKV6WqctuVhNGt6DCSpWXiZ6noYSTlBBiamylzNbp6gHogQCQB0ACQBzzRmRZZYw7CQdIA2jWarWwQB6ATB4AIXpCM/G4mksdgGo8p9oC6GB1BSQAJADEm5brIeAtdFOn3TSLougmAOQBEKJ/FweBucf0zNX4R6CcrW13jDG1B6ADtNUpVAJAzDxIquYbKVRytWc4231OHQQoD4AQ6efp1B6AEmvbPZctgEZCASAPgASAmGWQpKq8NV0ALOQWwBDQ9AhiIcSJTgo2llIKgKrE72RRFOUcBEDK7qSKAZAAEG9ZOptbrFeVt7IFEgBveADU8UuIZAKgMsSptgA6wBG6ROSHEHqxBaAsAAkAMcsgWYwtgJQxAIMoBkCIpOuDhB6Aao45RJcmPy48UgUBagtAAkDMQwCk8gDMaoxDCCk9AHP1Oggh5jdPD7kxTkELODiHeSalB6DyPKTqZSAkAJYPnU6nisyttgAWygPQASYSio4asAoYajab8gIIceLUgTV+nOiYmu4BWEgB8IYHQFkAEgBi4TwAs67GY4wFMAaMJxIdGbARWJ/nuZ4vIdIIgE0+rlJ5ALpuATC1pZcqC0CFgCQARJdBkrIa4CAwPIf7PA7sJ02ATgA2AxtijDXdUiGSCPlNfqT0AHQTAJU3L1X2QQdoyQMgASAWxgOwBtgwBwU/Aez17z5Rai4ANnoQkRDixAXAZvcApLCeLeCgx/90W0BswOIPUsxtbWwLQB4ACQBxDEpglHSBMut91dBtD68SABOJnqlqspIHQIgTZ8gN8XCiz5vEggBn9ACEEBo+f6SIO5i+uBnLskwCQAJAHIMCc8Wn2o9f58a4mwsvtQDYIgEgRLLV/yYXACnm62qb8VAXD8AAsDXR6r+a246EEI60Wq1St7U/qOsS9J0A2O1egBSDZMhVfLf0oQlgD2m2ADKfrDbq+ZqiVquFqjiSv05fVYUZJuqZVmfRP7PKHhHLlwEX1OsTfV708T5SluUxBcDAwEBot9uDwDb3OqSIOxgDDsYYVQhIAkAc03JmWVEUxR4XAKlaAldxAHVmiC0IIUzEGPcl8gAEnzQ2AqsajcbB5Wik6vV6KMuyMuhvmSDdyGchhDowUBRFVcilqug2/f30euul36fiqNc33scYc2Ayxngky7KxsizLac2kJAwkAGajjVUBnFHsxxiJMQ4CJyXyABTYlsMBlAEgASBmpARGgMPY/lyKwbfGJ5CBmQRArVabzPN8H1NbDyeq+N/wAuR5vovu0cZ9a+R9MnzjAGohhIGiKIZijFVxlqaPpYYf9cqwxxiHgdVYNPX04+j/Vq20qlSplk/W7WO8nwSOxBh3xxh3AyMxxtEY4zgwFmMcc1GXZ1kWQwgURaGJd2nSTCgAqhijPcwSaOzPeeUBSCoAQghRZcIlAMSxRklRxBBC7qvxUTcSJ7rvt9onkCbmhnsLeZ6XviqohMeJpv0E9wBsjjE2loIAaDQaoSxLfFVfx9ooN2OMR6/U18QYN/vkuM2v7Vq/ztOPYf/7Nb+H2RzeT5+oq17tb7RuPeq1YKqI0//f3pvFyHVe+37/9e1dVT2STbbYnESJg0RqoGTJsmRJtmQNniXZlu1j31wEAYKLC1wgQPKaIE/JQ4IgQB7ykKcguEGAc3x8jo9lyZI1UPM8UBIpkuI8k02y2eyxuoa997fysNZWFdvd1U32ru6u7vUDNqq62axh729/a17rEoDzAM4COMvM5/TnK977MoASERWJqMjMie3ALecB6MtQARgCcJqIoumWgd4DWSoAXq3/QfMAmAJgzKwtD6gnoC8rBYCICjPs+xUAqRcgN0cvAEESl25YbGtsxYoVVKlUKIqigJlD/XxBHMchgFBdnz0Q9+fkI92I23G16/6b15l0zEeSLQO4qc4zkD5O6GZ/DsBxZv6Kmb8GMEBEJSKq5HK5yBKyFiddXV00Pj7Oev+uVSUzK0F8qpFSriGtdmSXBGghAFMAjGvY0AfUGs9ic+4G0KeWbCOqakkWIdUDc/UArAOwUYXkQlv2jpkDZg7GxsZCZk69Iut0c11XZ9HfoOesHbX+6211z1PliKb53vMN1XkouuvWUNp5bUK9O8OQBNNDzLyHmfdWKpUT6hmInXOxeoKMhdyQJbckLBaLBV2LDwC4Bdk040kVgIYeAFWMV+qRRSVPknoAnHOcJIldaFMAjCl3cyLPzKkCkMWdUh8CmMkDcBHThAmuUwG4CdmVEc1a4ANw3nvy3rsoiroAbACwGcDN+rgBkqOQuuvrY/H108/qBT1hcU84nKqqINDrvlK/83YAdwF4FEA/gNPMfICZ93nvDxLRoHOuSkQ+jmOz1OaJVatWUalUomq1GsRx3APgdgD3A7gHwG0AtmX0VrEaF+eCIIjSJNbJCkiSJO26Z7RltOZTD8CQ5aKYAmDMrKWnIYAsLLJOtSRmUwp4WhWPLBIBOwDcqILngnoYMiUtrVOXpWPmjiiK+gBs0vfeqO/fp+dgjT6u0LXv6gS7awEhf72KQfr9wrpzsV29Aw8DOKPKwNEkSfYA+ArAQBAEiW3YTVX2iYhoeHi4k5m3qMC/q07ob9D7KMhoXxkF0E9EY9NViXjvoYmra5GN9y4tOxwmorKln5gCYDTAOee995eQXQjAqZXb45wLp6v91azxExBXncfc49ekG9gWAAezUACCICDvfVpP35YkyQ2oxedTV/76SY89ELf9fMfmF+0Sq1MGCqoMbdXrMwDgawBfAPg8SZKvAJxxzsXee9u5MyCXy1Ecx2DmNmZez8w71OK/U4/Nek3SNZuVQppAcnzOonGr8bSMdx2yCTuk1v8wshs5bpgCsDTROOwQsgsBpF6AtZrgNj6lms4cQXIA+lVj78pg89mglkyXbgDXtji1DM97HzDziiRJ+tSC7VWBv1Gt/U36fBVq40vTsjzrdtl4s0/PVbtep/UA7lNF4EMAu733X6t3qAxL4rpuax9AGEXRahXy29TavwfADl3T9TkmmW8ten+faSSI1ZvWqesgKwXgMmqeRcMUAGOGzaLMzEMQF+3KDDaELgA3MXPndAqAMgHgJKRcpzOD912jHoCua/CAkNatt8VxvEo3xj59ndsA3AqJ5acbZtpUJ7WYjDk4WVDrSbAKwE4ATwJ4D8AHAA4T0TlIDwKz5ma3ngPvfRczr4XkxNwJSey7S63sLswwsjtDD8AAgDOaZ9RIAejWe6wtg/eN6xQAwxQAYxabBidJckWt5r4MrlMPJJN4BSTRbzrFo8rMx3Sj2JjBptShr7MOwDFMU3rU3d1NExMTYZIkHd77blV6NgG4A8DdaiGt042prc7KN5rnGUirIHrUWn0SwIfM/BaAfUR00Tk3mlhK93T3Up6Zu73363QdPwRJ7LtZ13fHPK/h1MN3PgxDX61Wp/vcOWZeo/dfFjkAqQdg2DwApgAYs9s8GBKLv6I30Fyv0wq1nHuCIKAGiV1VAMd1o8jKwuuDxJi/Us9CquS4tMnO2NhYh/7dDgDfUsvzZhU+K9QqbZZr1GhM2ohmlVqwjwD4gplfT5LkEyK6SETjRLTsEwaDIHDe+zwzdzHzJgAP6vnaCQlZrcTClMUypBT0AhGNVKtVP43h4bz3PRBvW3dGXolvQgDWBdAUAGN2HgDoTTMIcaHNddMoQGJ66733bZim538QBFEcx6dRaxWaxWa1RpWPlWEYXtGe+DndaLbp5rhTn69TQZM223F1FqmxsKRT6XrUq3MvgP3M/BYzv0tE55xzE8tREQjD0CVJkk+SZCUkoe9RiJs/XdPdWNjw1Df5PUEQJHE8dQ6g9z4d5X1rhopKBPEoDjvnMFXpoWEKgHH1jeghrVwvoHHG7qydCmpJb2Xmlc658lRZ3XEceyIaZeazEJddewZWQC8k/LBRu+3thLhEb4WU6tW3061vsmNCf/GRJg2uxtVhmieY+X1mfoeIjgdBUEySZEnv9O3t7RTHMSVJko/jOE2cfBgS29+q67oNtfLShaSq+8k551wj5SyoU9izSgAcgfYXsd4SpgAYs0BvlPOQNq5Z1c93QGq/V6k1wA009pOqfKzJYCNoA/BtAP+NvvZNKvjTJL76nvhGaykCPZAkti1q+T7EzJ8mSfIBgIPOubEwDLlarS6Zjd85R8wclkql1FK+E5Kncqda/L24usfEYqACqeI4pddjJgVgK2rTKeeqeJzS/cZyRUwBMK6BcVUABtTimqsLsVMVgNUzbEyJKgD9uqlnMRhoEySOnK45y9hfOopAOgHxdlUEvgXgOwD2eO8PVqvVY5DWs8VWrBzI5XJERKhWq50ANnrvt0DK+LaowL8FEhLpxuIsO2VIA6DjRHR+YmKCp1NsvPcr9F7tzej+LAM4DOAyEcHi/6YAGLPdWaVU55wK481qwc+FglrfazX5rjTNRpAkSZIqAHFGXyeXkUVhLGJZqcd2iIfnYQBHIU2gDjLzSei0Qkh4KVnk91+emVdFUbReBfzNavFvVws57a6ZVqQs1pBVWa3w40Q00WACYNolcguycf/XKwADlgBoCoBxbRsQM/N5ACd0M52rAuAgcdubNQ+g4qfIyNGyrouQhiHjatlYPN64lj0lHY+8FhL+GVMhtB9SDXIMEmK6QkRjRDQBYEG6DWrmexvEQ5bOhejSkc/bIK7921SpWQHJiymgdTxYRUhTpxMznN8Qkii8LSO5kLYePkFEw9ZJ0hQA41ruHrlh+lUBKGf0sgW1YtYw82VMU+qnSYLHIXHDXizwRD+jJXGo9RJYDcmG3wng55D8loOQyYSnmbkf0v1yAhKvLhFRBUCZiKLrFR5BEDhmdsyc5pmEaempWu9t2neiD9K1cmPd43r93F2qfLfqPTCmCsDpWXhwNqh3I4swRkW9PRe1v4jdEaYAGNfIiFriaUOgud6YqQLQx8yHMY2LPwgC9t4fBHBIrR9TAOZuDXmI29s3ONIhTPWDieoPp5Zn1n3i54OCHqtV0OyAeJgm9LiiXoFzAM5q+KtfO2JW9NzxNAcmnTcHIJckSSroU0WkC+K6rxf2a/T37ZP+dj668zWbqp7PE8650RlK8Nr1fKzP4Huzeh4OAxg2378pAMZ1QEQxM1+C5AHcjLmP1s1BXHxr0cCFuWLFCh4cHDymlsMTkGxv4+83uVQo1QtwP0k4RSrgxhscRf0br9cobW9cmPTYDqniWKeCqx1XDziqPxYzOVUEVtedy/Q8FfUYr/MIJKqsVvXvqnVHXKdgtNUJ8lydohTWKU5tatGn459byZ1/Pdb/AQBnfWPpn9M9YROyGwFcVC/PiCUAmgJgXJ8CAHXVH4E0FpmrAhDoprsJQNoP4O82hsHBQc7lcqNRFB1R5SOdDb4chXy9lZk+j1VAXdZjQC3YsToBVqyzbiuThFb9UakTZIzapL766YWTBVi3KmV9qE0+TK23PrVowzpreNEvddTmOayc4pzXK1yTD1+3tnOoDTeargyP6h6Xem7LCCTn4twMf5fXPWFzRuuF9f44RESjFv83BcC4DrRz1oAqAKWMXrYATWry3g9imj4DURR5SBb3PkiJ13JSAFgF87AK9kE9rtQ9DkOSnNJjHJKrkR6TBftkJSJt+TxZ0GGSYPpGYKkVlQquUAV9j3oF0qMXUu2xQ4+b9Jq3grCjKb7/ZEt18rniWf7f5UYMySE64pwbmsH934ZaSWMW568CCeecR3b5S4YpAMvsDo5jJqIhZj6hAieL+FwIqdXeBnHxN2o0lGZu/wgSO11qJCq8B1AbWDL5GJricUw3ufrYPgPwqVDXgU4NLZ85ukUrzrkJZh6sS3JLreBeSDnXLXps1et9M5ZGVQdN89yoMQqJwfd77xuV86btf7erF2mu5zOdO3AUNgLYFABjjjsdUaR5AGd1U59rOWCgr7MdQI9zrjidiy4IgtEkSY6pIpDVdLCFwkPc8qk1n7rv+9VSuVj3b0Nq0aex528enXNxo3hqKtTnY0ieXrcYk5I5tZ3zeQC7VeBvU6/PDr32m9UzsMIE6JLlCoC9qtw2Iu0Quh3ZePm8Cv6viWgiCAJMN3vAMAXAmB1Dqs1/G5IHMJdNmyCu4zsAbPbeX8Y0bjq1YE9D4ojpRLNWEfZl3YjSYwjiljyl3+mUCv8R1OLxEYDYOTdt6VkrDDNh5gSaf6Du30sA9uh13wQZ5HO/XtObIKEDa8W8dEh7eexXD2Kjv+2EtDLOyv3Pek8dBFCy/v+mABhzMdeDAN77Ub2hxpGNKz5QBeB2iIu/UZzuvFoSP1qkCgCr8E6T7oq6AfVDEhhPQnopnFMloFR3VDCFi3IpTSxTRSb9voN6Xg4BeEcVgcf0cQMkn8D2hNYmTcA7DuAMMze6tx0kafQOSFlkFsQQz9oJ51x5PjxhhikAS5YoilhduodVgN2EuZctEcQVfBuAniAIhqeLVzvnRrz3R9Vq3obFkQwYo5ZsN6rC/ZhueqmwH9SNsEhE40EQlOI4tlmkoiwNENEVFRC71QJ8DMB3VRB0Ibt2sMbMApsyfr1LqrQPzfC3najNcMjieqfu/+NENByGoTcFwBQAY+6kXbWOQ1x1WSRydUHiftuSJLmo1vN0FmS/bih3Z2gpXOvGkkBc9GWIe/MgpELhkJ6bQUjN8SgRFesTn5jZ4pCTpYSECa4454aZ+Qwz71VL8PsAvgdJHOzA4u5z36okqoh51IZjuQxf+xSAz1Q5bsQqSFhxU4bvfQHAlwBKlUrF3P+mABgZbNZetfndesN2FRd+hAAAIABJREFUZbQp3wKZX753OgVAGVRhe3meFID6+vtYv/sxFfoH1crvB3CBiC5rL3kPgMMwxFIaP9t0zcp7n8vlRpIkGWPmU8y8HxIeeEAVgTvUUmy1zoOL0dL3KvjP6j2XQHIxtmSoKF9SAXyUiMrTxf+dc6H3fp3e/30ZKgBnAewmooo1/zEFwMgIIhpj5k8A/EI19iwshk2QYSe9hUJhYDqNXduIHlIhfCvmXokw00ZZ1I3kCKScKJ1LcBaSkzACSdbzQRD4KIq++dwNZp0b06DnLwnDcCxJkoMATjHzVwA+AnCfKgP3wJIF5yKYhyHeqt0qoIuqYGXZhTDWe/RdTf7jBkbFClXuNiE79/+QfsdTRBTZZTcFwMhOASgz8zEVirdBErbmapF1QhuAVCqV07opTWUlppr9h2oxZJUx/I3chpQrncHViXsnIO7MAUgYJK4vw/PeL6mEvYVGM7ZjAGNEdJSZzwL4AsAnqgjcBwkDrcPSbZ+LjNf1WUg73r167Id41B5WAbwmQ8V5RN9jz0wJeMy8Wr0PWVn/sSrpe4ioOFMPDMMUAONa1GuRdMO6IX8HkgeQxfW7Sa273dMpAKqAXGHmDwA8AhmN2p7h17sM4HUAb0KaE52HJPBVUOsFn54HWwzzADPHAMaJqMTMAwA+VwXwu5Aw1O0ZWo9L6tTpfXpCreE9es8eBjCoivwtkFyL2zK8j6pq/X9MRANJA+lPRHlmvlGV+VUZv/8XzrnYkv9MATCa4wX4DMBPIUlaWVy/NA64tq2t7UK5XPbTCISK3uCfQMIGW5CdOzhS6/9jiMvf3IeLRxFIAIwFQTCeJMkVSE+I7QAeUkV0M6Q8dPUyVgbSttGXIQmqRwF8CnH1nwUw6pwree+ZmVeqEvVohtY/VHnfC+Az51xlOgEcBAElSdKj9/CNaIL7PwzDxBQAUwCM7BWAiJnTuPi3kU2P93ZVJm6vVCrHIW7E6d5/hJnfB/AgpG48K+ulF1KL/j4RnWBmUwAWGerSTacXXoYkY74OaSZ0l3oE1kNCUysheSJLNV8gHQY1poK/Xy38A5hUlaJ/m3quQj1PT6gCnctQgT4NSb471Uj6JkniIIm830V2Uz5T639/GIYTlv1vCoDRBLz3XnsC7IXEEFdmoMGTWgIPM/PnnZ2do8VikRtYOvsh4YK79P9lEQvugswn+DEzn83n8/ur1ar5+hcvJUivhYsq+N6CNKjaWqcQbIW4lztRG8/bsreerv0SpFrmIiQXJxX4p1UpGlEl+e8yUZ1zznvfC0n8exjShjkrxtXbsDuXy5WnS4QNw5DiOO6EtIS+DxJGzMoD8jWAA0Rkpr8pAEaTvQBfqsa9Hdm48HohCUG3T0xMnNUN5e9gZtYN7kP9+zXIriKgD8DjAA5GUXSuUCgMmSXREpbwICS2fRTAfl0bfaoc7lCF4A71DrTh6jHHi6m0MC07nTxqOFIr/7gKua8hSaoXAVwmoiv5fL6YrtXpEu+99wWIl+txiPcsqyTKtPb+MwCHG5XAxnEcQHJ+vqefIYv93+saOAjgVH1FjmEKgJG9ApAQ0RHtDPiwCmDKYB3cBOB7zLzfOXd0uoE3QRDEcRzvUS/A3Zj7bIKUnFqNP2HmI1EUvQvLBWgZtORsNJ/PjyVJctJ7v5eZP1ZBswEyiXCjKgLr9OhT70/abKj+QBOUg8mjlz2urs8fgtTRX5x0pL+7AOAiEY0GQRA751CtVrlSqTR8U+dc4L1fD4n734dsh2qNQRIN9+rzRrSpMvaIemaysv4PATjcqO+AYQqAkYW6nyQcBMFYkiQHICVyvRltKKshmcnvaPnXxDRWhCeiy8z8KSSOuDpDL0AnJLHsSe/9qSAITlo2UWuhFihDBhGVmblfPVbdulZWQ0ID6fNeVQTW6GOf/j5tR5x6Ca63Za5XT0UFtaFP45BpeekY6PRxaIpjBECJiGIi8kTkkyTha+ks6b3vRC3x7wZkmxtxGZI8+/Us9vpNkJ4OWzLc+ydUATmiI7DtJjAFwGgm+Xzel0qlfXrT35GRApBXC/wB9QKc1Pr/qd4/qVQqX6JWEZCVApAOJ3kCwKEkSQYwcztTY5GiXiQPIA7DsJokyRAzn1Sh7nT/6VCFYI0KxxtQyx3I6RE2eJ7uYVHdUa17nPy8qkJrCLXxz1d0nVWhrn+NZfswDH0URczMuE7rNvVsPab3apb9E8ahPQacc4MzlMi2QXIzvo9svIbQc3UJEvs/b7X/pgAY80CpVPJEdJKZD0Lik1nNdV8BcQ9+pPPkS1P9UaVSYSLq10Ey31OLLauKgDwkU/qHENfiF7oxGy2MNhlKY+s16ZjLjcZxPMDMJ+oEeqgKAuljoII0Xyf865+nCkBq5ddb+zFqbn6uex4DiNWyjyeHvFJhH0VzjkKt1nvqIWTTvKueSwA+AHBkuvHVSgAJvdwH6T2QlRJSgrbmNve/KQDG/DKmAvKYWs1ZCOBU+N7HzF85585O5wXQRjFfQZrD3ApJ+soCgriLH9LNpV8/h1UFLEE0aSzWo7F7yDnHzMTM9cpBKlBZLXdPRD4MQ57NTIg5WPazoR2SBPkEpONmlsK/CJnP8TEkN6ERHZB8ne8iuzki6R60G9LDw2hBrK93i6IDgtLe4mMZvSxBSgsfAnCnZi5P/8dEZyD94g9BpvRluS5v0o3zO977brvihpdOOulUyKquuZIeZQBVZo69936hB0I550JIy+yfQHp2ZDk/w0M6Db6m9140w720BlK1szND67+qgv8LABdn8EAYpgAYTeC0KgCnkV3GfAhpDfxtAKudc9RACalCso/f0M0gy00gD+kN8BNkm7RkGM0W/uS93wjgR3psyFL3h+QsfATgXUgCYyM6IbH/b0PCEVl9hiGI9+9YEAQVu+qmABjzTwmSBPQRGnTwu4418U1fAO/9TKGF85DxsbuRfcJeL6TU8XFIDNMwFjX5fJ6896shGf+/hMTcs1ReI0jy78vqBYhncQ89pNZ/Vq7/GNLt8E0AlvxnCoCxgJxUS+DsLDaD2RJAmpY8gJmHhdRvSEch7smsIEjs9ClI9vJqu9zGYiaKona9b34D8WC1ZfjyXhXutyE9/8dn+PsOSE7Pvchu6l867Gg3gAPOuaJddVMAjAUiCIK0FOjTDL0ApBb3A5DSpYbxS+fcECQZ6R1IQlKWFkE7xH35awDfJaJOu+rGotxMnQuZ+S4V/g8i23a/gJQvfg7gVSK6OIvE2LUAfqBKQJadB88A2AWJ/VtyrikAxkKh7rdzEHfcOUwqs5oDIepalzbKBdBN4AyAVyBNQbKOCfaoB+C3zHwvEdkIWmOxKeKB9/4WiNv/cYjrPcus/whS8fM6gP0zxd2JaAWkqdb3IF0Xs7L+RyB5P18QkVn/pgAYCw0Rjarg3QOJw2dlgW+A1DDf771f2egPC4XCBGoJgaeQfSigD8CTAH7DzLc75wK78sYisfxdkiTrIQmrP4OUxGYZ90+T7t4H8LZzblT7KjTyRGyDjA3fgewGMcV6b78F4KJWZBimABgLid6I/eoFOJOh8A0g7sMfAdimpU1Tos2BBnVz+DhjRSRdqxt0U/uV935LGIa2fo0Fx3u/ShXlX6jAzdpDVYbU/L9BRMe89/EMnyedOvgQss38H9fP8ZFzrmRX3hQAY/F4AcZU8B7QGzUr4bsKkgvwqPe+YSJRLpeLIGNSd+nnyLqDXw5SEvgMgJ/HcbzeOWdr2FhIOiE5Ks9CXO7tGb9+mvj3FoCPmbk8wz7QBsn4/ymk939WnrIYknD8IRGdLRQKZv2bAmAsIi9ArBvFe5C+AEmGa2QLgB8D2KkbzJRUq1UOgmBMP8M7kBrlrJOECuqVeBYyNKg3l8uRrQBjAcjXrcVHkH3SHyAx908AvB0EQf8Mwj9g5k2QHIR7kW3zoQlI588PnHPlUqlkpX+mABiL6mJKSc67kLK8iQxfugPSTORJZr45l8tNu26SJPFElCYl7lZvRNZ0qNX1GwAPRVG00q6+MZ8QUaoYPwOZW9HXhLeJARyHJP7tbTQZ0zlHzNwF6ff/Y2Q7dTCChBY/I6JjuVzOMv9NATAWG93d3TERnYSEAs4iu+6AgLQTfRLA/XEcr2hkdXd0dESQcqVXICGBZgzzWQGJc/4DgHusPNCYL8IwJGa+EeJmfwrAzU3aS/tV+H8Aqb2fFu99HpJ/8ENkn4dQgrT8/Sifz5fK5bJZ/6YAGIuNkZERds5NQFzw+5BtOV4e2tucmXdEUTRtbLFYLHJHR8cgpCLgFUh5YjM2jV7IvIDfMvMdzjkrDzSaSqFQoDiOb4KU+/0W0umvGetuENLw529EdKLhJi4lur2QUtkfQPISsiJNMP4MwKH29nYT/qYAGIv2gjqXQAaEfIJsuwMCMknsYUi8c22jBLyJiQl2zh0H8FdVBC436SuvU0vsWe/9jiAIbGaA0RTy+TxVKpUtkNDTv4PMzGiG52kCEj57DsCemRL/vPcd+lmehAzRyrJEtqjC/zPn3Njw8LApAKYAGIuVKIo4DMM0Ee8TZDcpELqxbICUBX6bmdtn2Jgi9UQ8DwlLjDdpDacW2e+TJNnpnCvYSjAyJqhWq7eo1f97SJvfrmbcwpAx2M8D+DAIguFZ3JNp4t99yK7mH6hl/r8N4KBN/DMFwGgB4jj2APZDEvEOI9sYfAGSgPckM89mSt8YpE3xC/qZoiZ85RwkPPEbAP+l9/4eIuqwlWBkuL5uVeH/O0iZXTMs/7Sj5kuQUb8XZzFoJ3X9PwLJ08myImZIhf8nzrlhWwZLD3OXLl3GIeM6b4d0JtuQ0eZAkOYij0MylIedc+cb9QR3zl3y3r+ln2E1ZMBP1spnmqPwLIA2Zv4jEX1ZKBTGLGnJmOO6ulXX1W8gMf+2JrwPQ8JkbwJ4gYhOzaLTXur6/xmAOzO+p8qQXh67ABy1nv+mABitR9q2cyekn35WVosDsB2SAd3vvX8dMqN8arPG+4SITjLzi5AhQyubYK2k63kzJBzQzsxt5XL50zAMhxu1TjWMBsJ/hwr+Z/V5s8JLaSOv5wAcYObKLNb6dkgZ4oPINhyRNh96DdJe3Hr+mwJgtCBlAF8CeFWt41sytBLaANwP4CKAi0T0KTNP2x6UmatE9DUzP6dKwONoTgzVAdioykk7gPY4jt93zg1aDNO4RuF/B8Tt/6x6AXJNeq8SJDz2PIAPnXPFRgZ3LpdzURSlZYhPILthP6knYgxS9rcLMt3TMAXAaEWI6BIzvw9xFfbqkRWrIGVH/cw8QESHmNk3+CxFZv4UEgpYA+lW1gyLiiCjUH+sSkCH9/5N59xFUwKMWdwzeR3r+zuIN2lrE4V/OmDnRQC7CoXClUqlMu0azefzFEXRKkjc/2n9bFm6/hNI4t9LkB4eFVsRpgAYLYrGEY/qDX0bgG5kW7e8ETIF7Twzj0Bch1PivWfn3JD3/g31AqyC5AM0ax32AnisTgl4paen55yVMhlTUSgUqFqt5pn5W5Ayv2cgIaVm7pMXIa72F51zpxsJfwCIoqidme9Rr8ROZJuP4CF5CB8AeJeIRpjtVlnKWBXAMiAIghFILe+buuFkeVcHEPfoM5DOfA3b8mo+wBm1eF6CZD03c7BID2Qq2n8F4NfDw8Nb2tvbbd0bf0e1Wu1k5gd0rfxyHoT/MKRc9y9EdHAWiXYhM98K4FeQfhxZzx6oQEIRL6pCbwN/zANgtDpaSnQB0pXvLrW8O5FdEl4HpC76lwAuaD5AuYFXIiaiA8z8r2qdP6WehGYJ5m5I6WIbgI5SqfRcEARHkySJbXUYuu7WM/ODuoZ/AAlTNXN/LAL4CMC/AfhipmY/zjnnvU+9bWmv/yyTaGNI47C3AXzqnCtZ4r8pAMZSudBhWI7jeD/E3bgZEg7I8vqvhtQin2Xmy0R0uJEFoVnOX0DCEXlIQtN6ZF8ZAH3NLlV+CgC6kyR5QZMSR2x1LGvaIcmxT0Bi6veoghw08T2LkIz/fwHwXhAEQw3m/MA5R9771QAehXjabsr43k0T/z4D8Jpz7oqV/ZkCYCwh4jhm59ywxt/vhmQO92YocJ0K8J8BOMfMw865CzMk3ZUgTYJyqgT8CDJVrVnjfdshfRG6AWzQssRPIL3OI1sly8jkF4t6td4LT6sCcCuyHaE7FRO65v8AYJdzbsZmP3Wtfp+GeNqyTpyNIHlCbwDYVygUklKpZIvEFABjKdHV1ZWMjY0dZ+bX1Op5QIViVqQd036BWn+AoVlaQ6kS8KR6E5qlBOQhY1xXQFqoboE2O3HOjVuVwLKg4L2/EZKz8jSkjn79POyHRciUzD8AeMU5d857n8zynnpaPQDdGX+mtAHRe5BR4uMm/E0BMJYgo6Oj7Jwra1lg2iFwM7J1d7ZBepI/q8J/NvMIRiGZx6kS8BgkmbBZSgBBYqjf141/K4CXvPe7iWiAmc0bsHSt/g5d+z+BhJ3uQvbJdNMJ/y9V+P9tlsI/UAX1Kf28a5vwucYhobg3ieiEZf2bAmAsYbz3PgiC80mSvKLCf6UKwyyFaw+k0c8ogDIRfcHMEzP8vzQjOg9xcX4fErenJp6OggqDPshM95eZ+Q0AR4MgqMyiD7vROsI/9N73qrX/FCTRbwuaV99fzwSAvQD+GcCLYRie1Xkd00v+IHBJkmzSz/ospFw263uhCqn1fwnAJ8xctZViCoCxxEmSxBPRXmZ+Xq2KR5DtcBNCLR+gxMwVIvpqpvammnz0lm7KOWTf4rSRN+AxSCXCVgAvJ0nymSVDLQ2IqOC934Zaot99kDDTfJSDluqE/wv5fP5MtVptuKa6urpofHw8vX/+AdLnP2tFxUNyX14G8DqkPNgwBcBYDjBzEeJ2X6cW8E5k2yAIkGzlp+uUgION3Oveew6CYDBJkjf0s4SQdsOd83BK2iGtX/vU2vqr9/4dIjpmllFL08PM96ow/Qkk96UdzfUspZQhvfT/GcDzYRienkn4A8D4+PgaSKnf7yEhimYMHxqCDh4CcMKWiSkAxnK7+GF4KY7jNyE1z6sgbvAsrSKCuFl/CaDMzH90zh1tFPtMksSHYTgQx/Fr+lkSVQJWzNP90KfegBsBbGXmVwDsCcPwig0Uaim6de3dr4L/QVV2c/P0/qnw/yOAF5xzp2dy+yu96qn4PSTzvxkesCKA3ZAeBAeQ7bhwwxQAoxXQDekYJAa4EVJj3NuENZaOUy157/8UBMGpJEl8g8+VBEFwIUmSlyHdySYgnc+aWR2Q4nTTvUPf7xYAL8dx/BmAk7lcbjiKIlMEFi9dkOqOb0Gy5h9SRaAb89f5tAJx+/8LgL86507NlPCXy+UoiqKVkNyX3zdR6a0COASZOvhZLpcbiyLLeTUFwFiuVAHs0w1hg25AWddC5yHJdr8FMJEkyfPOufON4utJkiTOuX7v/auQOOoEJHGrb5428rwKkpWQvIDPALwbRdGXAM5qTwXLD1hcgn8tpK7/BwC+q4K/d573uQkAXwH4V6h73XvfsONkEAQURVG3fubf6T24qgnKbgLgHGQ66GtENGDKrCkAxjKnUCiMVSqVT9QLsAaSdJR1PkAbJJ75e/UEvOScu9So7l7/bQDSoGQC4rr8IZrfpjWFVAG4GxISuBtSyvWe9343gH7n3OgsyrmMZmho+TxVq9V2SBLnThX8DwDYoet4Pvc3hlS9fA5xrb8MmfI3Y7vpJEk6IZMxfwvpg5Flg676zzcEqbR5johOM7O1wjYFwFjuVCoV1vr3XZDEvR59zLodagekJ38ZwIT3fpdm2s9khQxDmpSkSsDPIPkK8xXPdSpkeiEhgbshtdPve+8/A3BBZ7jbhjoPqLu8UK1WV6uy+j1IjH8nJM4fzPNHSgAMQpJq/wTgbfVwzagYElEHM98J4De6rtc26TOmTYieI6J9nZ2d0fj4uC0mUwAMQwb0aKzyefUEdDfJEumEuDpLAMre+3d1RPBMSkAR0lSopM+fUWFcmMfTRJC8gAchsxTugYQGPvTef05E54ioZB6B5hAEATFzGEXRKkhI6SE97sH8eYUmE0FGYL8Jcft/FATBldn0kCCidma+XYX/03rfNUXHh8T9/wqZPTAxPj5urn/DFACjhve+QkR7mPk5taQeQvYleARJbvq+Wk6h9/6dXC53eRbxyDIRfcnMJUgHs1+pBdi+AKerRxWZOwB8B8BHzPwxM39JRKeJqBKGIVerVdto5y74HTO7JElWQtz7D+j6+bYKzfwCfbQyJIn2ZQD/RkR7crncxGyuuVr+d6nw/xXEo9Us70Qa938ll8tZ3N8wBcCYmlwuV6pWq+/qxtqL5uQDpJb042rBt0dR9HqhULhYqVT8DJ6KSPsJlCEthn8LiZ92LcDpcqrM3K8egQcBfKCKwNfVavVsEASjjSoejAabUxhSkiSdSZJshCT07dBz/B1dnwXMX2b/ZMYhyX7PA3iBiI4wc7Vanbmijoi6mPnbkCY/TyH78tt6hiDhsxcBHDPhb5gCYExLtVr1uVxuMIqiVyEZ912QLPis46ppy+BH1ILvqFQqLwdBcC5pNBsV34QrTnjvnwMwAuDXao2vWQCBQHof9UA6zN0KKT/7FMDeJEmOQeas96syYBvw7KzjdXEc36hr7y6Im/9WVRzbMP9x/nquAPgIwJ8B7CKis9eQULeSmb8LSYb9MSR00aw1Ow4ZtPVnSE8CC00ZpgAYjYmiKHHOHffevwDJgn8GUhKX9UZFkFyDB1JPQJIkLzrnTs6UUOe9T4joHDO/BOASxM35mFqKbQtw2kg9JTeoV2ArpAHNKbUU96gycJ6ILhcKhZFyuWzKQE3otzNzL4C1zLwVkmh5DyTPo1cV0TbMTwe/aZcdpH3um5BM/w+DIBiYSWEFvklcXI1anf9jkIS/Zgn/dOzwPwP4UJUBwzAFwJjFTud9FdLM5E+Q7P2fQvICmqEEdEHiuQUA7d7757UFb2UGT0DinLvsvX8X0sv8FCST+lto7jTBmcir0OqFuKrvgJQvngGwn5n3lMvlw6q4DGkp4XIMExTUc7Kambeo0L8X0oq5D1IL37nAQj+lquvrb6lF7ZwbnmWyn4uiqA9Spvh7VQJuaOL3KqM2efDNIAguz0JHMUwBMIyrKEFahhYgbvofNnHjalcBUADQxszPEdHhmaYIavVAGo8dgrjbn4aUhq3FwiWIpbSp4rROrdm71Po7A+BrAF957w9C+h2MAyg556qzqIpoRfJ1a6kbUmq6UxW2WyDu8HVo/hTIa7X6xwAchsTRX9AclIlZ6mwBM2+AtPf9HSSxdlUTP28F0t73XyDNfvotB8UwBcC4XsYg8c50434UzelSlgqI2wH8OwDtzPxnItqXy+WKs8isjvL5/MlqtToMKcs6C+BHak0uFiuyoB6Bjars3K+KwAkVMIcBnPLeX9TzXoWUmUXOubhVygudc+S9Tyc6pkenWvUbIOGkbSr0N0OaLK1chF+lAvEsfQrgFQBvEdGJ2cb7iShk5k2QUNA/6PXubrKX4oh6KF50zp2xklTDFABjroxAMonbVAl4SDcyatKavFU3zHZm/lMURV+qm7yhEqBKwhARvc/MF1S4/hwSXliNhU0cm0yuThm4H8AFAKdVeRlQwZMeF7z3F4loSMMinogSIkqCIPALmdkdhqFLksQxc6DnN/Ted6uwXwcZC516QPogiZrr9VjIME0jElXADkHi/W9AmugMMs/uVBNRTsMaT0EqVe5B9i22r1KAAZyE1Pr/mYhOWGMqwxQAIxtpJUNw3lAFoA1SitWsMb1OLcNfA+hk5k5m/piIrvAsdmBmrnZ2dh4sFouDqgQ8rZ6LTeplWGxCJ6hTBlgF0Hgq/CGJZxdUqRkAcJmZLzHzZe/9IIAJ51zq5q0/P1z/SEQgInbOYbJHpVAoUJIkYGaqO8X154km/46ZwziOV6pQX6MCvg8SekmFfOrWX1W339AiXeasgvSser1eA/Cuc+60935WE3Py+TxFUdTGzNshybPPQkppm9mwKtbP/DKAf3HOHTLhb5gCYGRnXkQRqwB+WZWAAiR226wmPKTC42kVHjcw8zua+T/jZlwsFrmjo2OgVCq9ysypm/1J3Yx7sXD147P53qFaxysgrvJUKSgDuAypeEiPfgCXvfdFiAu4okKsiloIof53FQAREVUhoQXvvQ8rlUoetRh9foYj/ZtOFfY3qvKySa9Zt34Hp9/HLWKhn+IhOSQH1OJ/FcA+nZY3K7O/vb2dyuXyKma+R4X/zyBVKfkmf+4Lqqz8gYi+MuFvmAJgZG8eMXvNKH5RBX8eksTVrA2O1LJ8Uq3IG5n5ZSI6xMzFmf7zxMQE53K5iTiO96r1fABSe/2gbswrFvHppjrhCUjIoKDCdZMqBLEK9jE9JvQo1T2WpvjdhHZTLGsJW5rf0aFH+rxz0s/T/VuoXoxQD2qxpV2GZPh/ABmN/TERXQrDsDpb4e+cC0ql0kZIhv+zkCTUZg8kqh+W9QcAn89GOTYMUwCM6yJJkiQIgv4kSZ6HhAJykC54zRrMk/YKuFct9xuZ+S8AdodhOBjHMc/kuQBQJaLzAHYx8yFI//4fo9ZKtq1FTj+poJ2cy7BaFYJELcKpjmSKn1kPN8UR1D1S3c9u0vOWXs7qUflKLf7XiegoEY17730UzU6WElGH9/4WSKnsM6oUr5iH83MFwNsq/D9R745hmAJgNFUJiInoFDM/rxbgbyGJe81aT6RCepsqA+sBPB/H8VsQN/iM/VeZ2QMYdc4d9N5fgpTgParehdvVWsu16CWhOuvbmB3jkLDQu5DY+RdEdImZq7NN9FMBv5qZvwXgF5Ay2S2Yn9kUIwDeB/BPkEY/RbukhikAxrygpVBHAPwF4kL+pQroZq6pQIX/46iVlP0NwGEdxzvjzq1lUQNENKy5Afv09R6pUzDsvliaeEgY5DKkNe4uFaLENylWAAAXtElEQVRHAIxfg+CHKos3Qlz9vwDwMOZnFDEDGIWEK/4JwHuQcdmGYQqAMa9UIXH1f4W4U3+pnoBmW9IrIVUIN6hC8Ffv/eeQmeyzqnvWWOlpSDe+E6oIPAYpybtRrbjALvGSIIHkPlzW6/whpEf+/tm28v3G5JceB+0AtkPCSD+DhKfmo49Bmqj4IYB/BPBGPp8fnM0AIsMwBcBoBiVIy+A0w/zXujk2O66e1/fpSZUAAO8AOOOci66hk15ZhcJpSFhgn1pzd0Ey3At2n7S04C+rkvcVJE7+mT6/CElpuab90nvfA6npfxq1RlOFefoul9Xi/0cAb+Xz+SEbN22YAmAsNBUiOqAjekuQJj53qBXd7IzwPkintfWQhL5d3vtD2jjoWnb3Uefcx8x8jJk/gzQ7ule/xyb9Lq1QzmaIpVyGNFXaB2ln/RGAPUEQDF5ra9wgCMh7X2Dmm3VdPAXJ9u/D/CRCxpBSv7dV+L9bKBTGK5WKCX/DFABj4WHmyDl3zHv/z6oE/B7S7nY++rp3QkbxrlOvwKve+0+J6HQQBOWZKgW+kRre+7a2toEoit7x3n+pzVwehoQFbofMbZ+P7G7jOpchJMZ/DuLN+UQt5n1ENFIoFPy1TmAkolySJDdAMvsfV6v/dkgJ5Hwog2mTn10A/omIPgrDsGTC3zAFwFhcZpf3sXPunPf+T7oR/xeQWP2Kedgs85DhMr+CNPvZxcy74jje75y7NNvmKCog4ra2tqFqtbqbmQ8y8y4A34UkfO3U91lsrYWXO+N1gv8DFfyHiWjMORclScLlcnnWL9bV1UXFYnEFM9+i1/2nqLWUnq9qkbS9798gY30/Z+bybMsTDcMUAGPelQAiusjML6DWiOYh3TibrQQEkCz+nZCQwD0A/ua9f1fru0dnmxugikAEYNg5V2TmM8z8LqT74aMqDG6CJCLm7covCDEkI/4igIOQHJAPAJwkopEgCKpxHPO1jsIlorbx8fGNqrz+BOIFSsNA8xUCiiDDoZ6HjOTeB6vzN0wBMBY7zJyEYTgQx/ErkFhsCVJmN18x0zwkHLBChfS9zPwKM3+iVmLpGpWaCDJkaATSk/9LADvUMrxf36NH3y9nK6CppHMSRiAx/gMQV/+XAE5pu+oqMyOOr7kjbghgFTPvhLj6H4NUtazC/Hp70pG+/6YKwCET/oYpAEbrmGYSdx+EtCmtQEICT0Bq9+djMyVIbsB2VTxugWT274JkgQ9jFg2EJik2Xv/fMCQu+7W+3g5IvsOdkBLCbn1v8wxkJ/QnVPBfUGt/jwrJ05B5CFcAxNdYy5/i9JptVkX1SYj3aMMCXMMJSFXNvwJ4iYiOMbPV+RmmABgtyTCk21pZjx9D3KnztfYcJPzwgArnHQDe0s90XDfc6wmqFiENZI4D+ALSUGazKhp3QBLFblJFoM2UgesS+qniOKBW8D4V/sdV8F+EhAGub2HIJKR2SBfI76jgfxhS2tc5z9+XVcH5HMAfAbyi3TZtsI9hCoDR0oxCmpeUVXD+DMBWzO9o3lAFch/ErXu7Cu0v1JqfCMMwnm3FwCRBdRnAZSLaw8yrIe1gb1Xvw3Z9nioDOUzdz3+5k84nSAccDQA4qgL/oCpbhzW/ZE4WsXMu8N4XvPc3QLw2D0LK+u5RZXEhlJ1hSI+CPwJ4lYj6mTmxZWGYAmAsBSZ0gytC3LVP6ebbhfktq2vT970Jksj3EYBPAXwVx/EpAOPOueQaGgnVTDgJEVwGcDkIgs+TJFmpwj/1CGxVL8Q6SFy5gKsH8CynHgOTBxONQBr2XFDr/oha/F/rCOiqnuPrerMgCIiZHTPnvffr9Jrcq8L/26oYLoRSVoGEMD4A8GcAb19PrwLDMAXAWOxUgiDYlyTJICQZ71mI67VvntdiOmHwPhUEP1APxYcA9nnvTxHRcBiGfrbjYP/OpEuSpLu7e6hUKn3mvf/Ce79CPQO3qSJwkyoCvZBKgtXqIagfp7tUFAKue2QVekOpsqSC/yykJfMxAEeJ6IJzrhIEAVer1TkJw9TVz8wbICGg+yCx/rtQK+dciHNdhGT67wLwPBF9EQTBxHV4oQzDFABj8ZMkSRyG4fk4jp9TJeDXkGzrLZiflqr1SkCgQvdOFco/UG/A28y8J4qi0865K9fYUfAbxsbGWK3bJJ/PD8ZxPMLM+wCEzNwJ6Vy4Tb0EW/XnXkhFwUpIVUGh1S+5en9GVOgPq5V/AuLiPwIp20uTMhPnXJwIuNYSvnoKhYKrVqsd3vuNkFDMQ3qNt+u5DbEwTZ3SZNLPIVn+LxPRyXw+H1uDH8MUAGNJE8dx0tnZOVIsFt9T6+8UZI76XWqZzyfpKN1uFcQbIG7hPQDe8N7vBnBay8uuuwOL9myP9IBzbhzAFWY+zMxvQEITvaglEt6iz3sh9edtehTqHhdLYmGasFeue0yfpw16jqmwPwpxeY8TURlAxTlXrXd5z0Xo1wn+7kqlsl49PI9ASjY3q+Cfz9yTyUSQ8sW3IWV+HxPRZWaOKxWr9DNMATCWAcVikQGUiOhrZh6BuICfVSttzQKtzVAt727IIKC7IKV+7zDzx6qojBLRhMb7r98ElByDqh5jABAEQb/3/ri+V5d6J3r0fKyBhErSYw0kj6BDBVoetQRDN8PRCMbV8fnJR6JCLP3sFbXuB1WZuwRJ4EuPK/r9iir0iwCqLGQi8OtlP4DuSqWSXrtHISGmm/RcLbTCNK5K0EuQ4VVfB0EwmiSJWf2GKQDG8oOZq0R0mplfhriGzwH4oVpr7Qv0sRxqLvgbIQl8j0OazXzOzIchseuic67svc8kYUtH042lCoF6CgJmbteQQYeekw49ulSwrUEtj6BLBWGhzksw+eccakmHVCfc4zqhnh6Tf57A1fH7KyrYJiYdJSKaSIV93fXO+loV9Fys0DVzNySp7w79efUi2OcSPWefQVz+b0Ba/FYyVH4MwxQAoyWVgDR7/n21JM9BqgTuVmt8oYbvkArU2yA5CnerVXlcPQNfee+P6OZeIqLqXD0DU3gK0s5343/34YgIQDszd+l56oKEB0IV8uGkIzfFz6QWfYxaCV6j56kSMAZgPAiC4nQZ600Q9impUtOt1v2detyqQn/TAq+beiq6nt8G8AKAj5xzF66nysQwTAEwljIl59xe7/0V9QY8A4nHp1UCC5kVX1DhshkyGOgcpDnNNwczH1dloEpEcdbKwBQCluss7kvX7OZwLgRAuVzuupPP5sOCDcOQ4jhOFZZO9cpsV8Vshz7fql6bxTKp0avSdgjAawD+SkR7mbmYkcPIMEwBMJYW3vskl8udjqLoL5BkqX5IEtdW3fwXwwbfDknS2wYJDZwEsB9St34YwHFmPqPKQEJEfi4lhU081zEALMbkM+ec07r9II7jdkhyZtpg6Xb1xtyC+e/TP6Nepp6SAUiW/98AvOqcO3G91SSGYQqAsWxQQTlMRG8z8zlI4tQPIZP41mJhs7jrIUj8+Ta1Qn+iysCXkCqCIwAuMvNAHMdXgiCYSLu7OefY6r2vEvgEgLz3RERt3vseSAVEH8TNvxMS29+BWlyfsLh6JXhIQuQxSGOflyGDigbN6jdMATCMazGlmKtBEBxKkuSCCtSfQuq4F2JCW0P5hdpAmTv08/0cEiY4CAkPHEmS5BwkaW6YmUeIaNw5lyznLPB8Pu+iKGr33q+EVDz0MPN6tfZT9/42/bc0h8EttqUKKXs8D0n0ewnAu0TUHwRB5TqmEhqGKQCGkSRJEobhUJIkHzPzCQC7IQmCD0Ea53QuIisw7SkQQpLxVqrw+iFqcfqjqhAcBnAySZIrAMaIaIyIJnT08NLdcMIwSJKkjZm7AXRVq9WVkJj+rSrwd0Dc/d24unLBLdKvFEMSWA9AYv2vATgWBMFYkiSJCX/DFADDmMsOK67ysnPurPd+BOJa3w0ZKvQtSBncYpu2R2qx5iDZ+ashrX9vgeQ0jKs34CSAw9oQ6DiAASIqAYi0/30VdQ2EWogAtZLDPBHlmTkfx3EPxKW/vc66X4vaCOUuLJ4QTyPSJL8TkAz/lwHscc5d9t5XrbzPMAXAMLLccSWQOkJE+5n5IiTD+gk9blUhsljXdKoQrNQDkPrw29WbMaQKwQVmPo+rm+lc0n8rYYoSPedcNN9lZc458t4HuLq0MH1eQK2BUR+ANcy8RgX9OkjPglV6rECtHLEVSGcZ9EPi+68C+FgVOcvwN0wBMIym7sAyI/0CpJ/6KUgG/hOQWe6bIO531wJfJahTCG5Wq7Ks32tsimMY0idhEOJ2HoQkmF2BdNrzqA3cme2RKifXcjjvfZsK8PphRjegNstghSpk3ZOed6F1RyFHeg2+gjTzeRfA/iAIhmx6n2EKgGHML2VI2V0/NLYOSRK8W4VRrkUUgW8Ma9S6/KFOQKfPy5As82E90uE6IxB3dAW1Nr1TPU5+HqnSkIYq8nWP+Sl+rv+7dlVcelQR6Kk7Oiad91afahhDcjiOQ7L73wTwCRH1M3Nk7n7DFADDWDjGiOhTjaHvA/AkgPtRqxNvNUVgKsFJdcrBuin+dnIr3wi1Vr7THakCEKLWXa/+cbrfTeeypyW0ptJJjiVINcdetfjfguSgVJrY6dAwTAEwjFnv1lJff8k595r3fj+kW98jkCTBLRDX9GLOJr9exSAl0KMAcbNPFmaNfm6kdCxVAd9I8KcJfucgLZ8/hiT6HXLOjXkL9BumABjG4sN7Xw3D8HSSJBeY+X1I85jHAdxXpwi0LXFhthwFd1aCfxRSz38AwDsA3gNwwjlXdM4l1rzJMAXAMBYxcRx7SNngeWa+wsyfQxr0/AAyF34bJGmtw86WAQmdjEJySb4E8DqATwGcc86Nh2EYV6tVNsPfMAXAMFrHG+ABTDjnysw8xMwHdXN/SJWB21URaDcreVkS1Vn8n+ra2AOgn4hGmTn23qNardqZMkwBMIwWVgSKYRhOJElyiZmPQrK5vwMZ73sXpGqgDa1bombMngokxn8SwEcQN/8BAGdU8CeW4GeYAmAYS4i0oyCA0xB372HIxLZ71CvwLUjjmgJat3LAmObyq+AvQkpGP4Y08tkP4GQQBONJkrAJfsMUAMNY+kRBEJz33l9k5n2Q1sLfAnAnJDSwBbUBNK3Uqc4Q0jK+GFLKdx7SJ+JrSCOfvQBOOufK3nu2Wn7DFADDWEboFL44l8tdSpJkgJk/Y+abISGBOyG96rdCetev0PslMGVgUQt9r4K/DOAipFf/sTrBfxDAYBAEcZIklthnmAJgGMvaFRBFDIB7enqKlUrl60qlcoiZX2bmzZAywnsgswY2QZrwrEBtBLApAwuP16MCaZF8XgX/PkiIZz8RXQ7DMHLO+UqlYha/YZgCYBg1hoeH0/74Pp/Pj8RxvI+ZDzHzC+oJ+I4e2yGDbXpxdW97Uwbm19pPB/MMQ4YmnYZk8X+sQn+AiCpBEMRRFPkoiuysGYYpAIbRmGq1ytBpe4VCoVytVke1jPB5SH7A/QAegMyvv0EVgQ69p0wRaB4Jasl8wwDOQmr3PwKwj4guQUo/K7lczpfLZXPzG4YpAIZxfVQqldTSrBDRGMTNfJCZXwKwGcC9kLyBWyAjcDsgJYVp/3xj7gK/AknmGwVwBlK29yUki/8igJEwDIuFQiEpFoucJAnMzW8YpgAYRmYwswdQCoKg7L2/DOC0VhGshoQENkI6DW7Xx42qENRP0zMPQWOBnw4rqkAmHp6ElGwe0eeXAFwBcCVt2AOA4zhGHMd2Bg3DFADDaKKUkgoCBlB0zk0w8zlmTsf59kL6CfRBkgY3Q8IGW1QhSCsKcvq4XPsNpKV6EWp1+pdUyJ/Q46z+bkCPIQAxEXEQBLDe/IZhCoBhLBje+2+SBwGMOufGmPkUMxMkDNAHYIMK/40AboRUFGzS369CrapgqqPVhbyf5khL9c6ooD8DmcCXHhcAjBJRDABExHquwcxm7RuGKQCGsWgVAkAS0k4x82kV5iEz3wDpLbBZH/sgTYdW6LGy7nkXal0JSY/654shnJAKeZ703AOYgMTt648Rfbyigv6UWv3niGgi/f/OOa7vzmdd+gzDFADDaGUPQeycOweg3zn3aZIkjpnz6gVYo0df3eMNqhx0AejUI32eJhvWewlmMwqYZhDms/05rZSYgGTlFyE99tPnqZAfgLjx6135g0Q07pyLmdmz4OuFvCXxGYYpAIaxFBWCxHufSrhKLpcreu/PM3MAgDSfwDFzTgV+H6T3wDp9XKu/Ww0JMwSTDjfpcbp/I9S656WPjZ7X/xypwB+AuPIvQtz2F1TYXyGiSvr3ROQBeOecLxQKXCwWvQl5wzAFwDCWNVEUpXHxqwLbQRAQgBFmvsjMB/SeTVsShwACVRIKerTrY9ukI/1d/b8XVAmIIPH4MmrldpUpflee9PuqxudTxSBOD+dcwsxJGrMHai58773F7w3DFADDMBpRV23wzVD6MAypXpgSEZxzjpld6jmY4qD6n+v+Dvr6PrXQ644pE/iIyAdB4PWzgYhAJFGFNCvfLHvDMAXAMIyMmar0LRGJe5XUDcOQ6i3vepj5qt/XC/H63031fswM665nGKYAGIbRQorCdFiGvWEsP5ydAsMwDMMwBcAwDMMwDFMAFh2VDF5jhV12wzAMo0nyodIqX7bVFID+DF7jPlvjhmEYxhTck8FrXDAFoDmcz+A17rc1bhiGYTTJQOxvlS/bagrAuQxe41Fb44ZhGMYk1gK41RSApe0B+B6Af29r3TAMw6jj/0I2w7Uu2KlsDv8tahPH5nIMQnqqG4ZhGMa/z0i2MGTMt9EEbsnwIr0HGcVqGIZhLF+eAjCUkVzZa6ezuezPUAkYAfAf7ZQahmEsO3oA/OcM5QkD+J9b6QRQC160/xXAf5/xax4C8CGATwF8AZl8ZhiGYSwt1kIqwe4H8H3IOO0suQ/A56YANI8HVVgbhmEYxmLhNICbW+kDt2Ir4I8BHLC1ZhiGYSwi/p9W+8DUoif6GQDP23ozDMMwFgGXAGwDMG4egObzAoB3bc0ZhmEYi4D/qdWEfyt7AADLBTAMwzAWniMA7gQQtdoHD1r4pJ8FcBuAnbb+DMMwjAXiP6BF89Jci5/4/whgn60/wzAMYwH43wD8pVU/PC2BC7AFwCcAbrC1aBiGYcwTLwD4FQBvCsDC8iiAXQBytiYNwzCMJrMPwMMAxlr5SwRL5GKcAnAUUh4Y2No0DMMwmsRhAD+HlP61NLTELszDAP4MoM/WqGEYhpExrwH4HYDhpfBl3BK7OB9Aejx/aevUMAzDyJD/E8DPlorwX4oKACD9mL8P4P9GCydnGIZhGIuCAQD/NYD/DkCylL4YLfELdydkeuAztoYNwzCMa6AI4P8A8L+jxZP9lqsCkPJ9AP8LgEdsTRuGYRgNKAP4z5D2vheW8helZXZhbwLwS0jt5qMAQlvrhmEYy54rAP4Kaerzilr/Sx5axhd8FYAnAWwGsEGPjQBuBbB2jq9dBHDZ7inDMIzMuDmD1/ga0kb+HIDz+ngAwHsAYjvFxn8CwHM8/mCn0TAMI1M4g6PHTmMNZ6fAMAzDMEwBMAzDMAzDFADDMAzDMEwBMAzDMAzDFADDMAzDMEwBMAzDMAzDFADDMAzDMEwBMAzDMAzDFADDMAzDMEwBMAzDMAzDFADDMAzDMEwBMAzDMAzDFADDMAzDMEwBMAzDMAzDFADDMAzDMGYitFPQFHKwudOGYRiGKQDLjl/rYRiGYRiLEgsBGIZhGIYpAIZhGIZhmAJgGIZhGIYpAIZhGIZhmAJgGIZhGIYpAIZhGIZhmAJgGIZhGIYpAC1E2U6BYRjGkoMBVO00mALQiD12CgzDMJYcxwBM2GkwBaARX5kXwDAMY8mx206BKQAzEdtCMQzDWHJ8aqfgashOwZT8AMCbdn4MwzCWBCcA3A1g3E5FjcBOwZScAtAL4Lt2KgzDMFoaBvAsgCN2Kq7GQgDT8z8AeM9Og2EYRsviAfyPAN62U2EegGshAvD/QlxGj8JGJxuGYbQSRwH8EsA/2qmYGotxz44dAH4D4D49brZTYhiGseiMtn0APock/P1/sLK/hvz/anbny4GUAiUAAAAASUVORK5CYII=",
-    # WC with 6 l cistern
-    "wc_1": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAAN1wAADdcBQiibeAAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAACAASURBVHic7N133F1Vlf/xzyIJoXcIvYQuRaoKUgIKaCiJioqI4m8AdSxjY1DEMlgY9ec46g8dGLFLR6oiNkAgUhUQhNB7JwgJJSFl/f7YOwghIcld+z77nHO/79freeG8hrPOeh7u3nvdffbZ29wdkaYws1WBTYCN889KwFLA0i/6efH/PbxOpiIAzACmAE/nf77452ngceCW/DPR3R+ulKfIy5gKAKnBzJYGdga2Jg30swf9ZWrmJdJnk8nFQP7ntcCl7j6lalYykFQAyJAws8WAHYE3ALsD26Fv7yKQZhGuAS4E/gj82d2n1k1JBoEKAOkbM9sYeDtpwN8RGFk3I5FWmAb8mVQQnO7ut1TORzpKBYAUZWYrAgcA7wVeUzkdkS64CvgZcIq7T6qdjHSHCgAJM7NFgbGkQX9vYNG6GYl00vPAr0nFwPnu/nzlfKTlVABIz8xsFPBJ4BBgxcrpiAySScAPgW+5+yO1k5F2UgEgC83M1gaOIA38i1VOR2SQTSUVAt9w93trJyPtogJAFpiZbQR8BjgIGFE5HRH5p+nAL4CvufuttZORdlABIPOVV/MfTVrRv0jldERk3mYBpwNf1NsDMj8qAGSezGxx4Cjg39HCPpE2eR74v8BX3f252slIM6kAkLkys32A7wLr1c5FRHp2F/Bv7v6r2olI86gAkJcws3WA7wDjauciIsWcA3zM3e+pnYg0h57nCgBmtoiZHQHchAZ/ka4ZB9xkZkeYmfp9ATQDILzwPv8vgDfWzkVE+u4PwEHaP0BUAAw4M9sNOBFYrXYuL/II6aS0W/M/7yGdojaZfx61OhmY4u4zaiUpYmbDScdSL8M/j6heJv+sQzrhcqP8z1GV0pybh4B3u/tFtRORelQADKg8Dfg54AvAsIqpPAxclH+uA25196cq5iPSF2a2LKkY2ArYLf+sWjGlmaTXe7/q7rMq5iGVqAAYQJWn/J8kDfYXAhe6+00VchBpBDN7Fem0zN1JBcFyFdLQI4EBpQJgwJjZVsD5DO2U//R8z58Bv9IhJiIvlw/V2od0qNZYhna3zYeAse5+3RDeUypTATBAzGwM6XWgZYbolteQBv2T3f3xIbqnSOuZ2UrAu0jFwHZDdNvJwDh3v3iI7ieVqQAYEGb2NtJiv5F9vtUs4JfAMfo2IRKXZ+0+C7yN/r+6PY20OPCXfb6PNIAKgAFgZv8KHEt/O48ZwMmkgX9iH+8jMpDMbBNSIfAuYHgfbzUL+Ii7/08f7yENoAKg48zsaNJK/36ZAfwI+Lq739nH+4gIYGajgU8D/0J/C4EvufsX+xhfKlMB0GFm9h3g3/p4i0uBD7n7jX28h4jMhZltDnwf2LmPt/muu3+sj/GlIm0J2VFm9nn6N/g/Chzs7rto8Bepw91vdPddgINJbbIf/i33JdJBmgHoIDP7AHBcH0LPAo4HPuvuT/Yhvoj0wMyWA44BPkB/vth90N2P70NcqUgFQMfk1f6nUb4TeAB4l7tfWjiuiBRiZjuTFuOuUTj0LOAdejugW1QAdEje1/83lH/V7wLgPXqXX6T58h4CPwfeVDj0NODNOj+gO7QGoCPMbGvgbMoO/jOAI0k7hGnwF2mB3FbHktpuycOyRgJn575GOkAzAB1gZiuSDtJZs2DYB4F3uvtlBWOKyBAys52AU4HVC4a9H9jK3ScVjCkVaAag5czMSNvtlhz8JwI7aPAXabfchncgtelS1gR+lvseaTEVAO13OGm6r5SrgJ3c/d6CMUWkktyWdyK17VLGkvoeaTE9AmgxM9sBuIRyu4H9Fnibuz9TKJ6INISZLUk6p2OvQiFnALu4++WF4skQ0wxAS5nZCsAplBv8Twb21eAv0k25be9LauslDAdOyX2RtJAKgPb6MbB2oVinAQe5+/RC8USkgXIbP4jU5ktYm9QXSQupAGghMzsM2K9QuD+S3vGfVSieiDRYbuvvIbX9EvbLfZK0jNYAtEze5OMWoMS021+A3dx9SoFYItIiZrY0cBGwbYFwTwAba7+QdtEMQPt8nTKD/22kXb00+IsMoNz230zqC6JWIPVN0iKaAWgRM3s96Qje6Pu3jwGvcfe7w0mJSKuZ2bqkVwRXDoZyYGd3nxDNSYaGZgBawsyGk87+jg7+Tlrwd3c4KRFpvdwXHETqGyIM+H7uq6QFVAC0x0eBLQvEOcbdf1cgjoh0RO4TjikQaktSXyUtoEcALWBmq5EW/i0dDHUJsLu7z4xnJSJdYmbDgAuBXYKhppAWBD4Uz0r6STMA7XAE8cH/MeBdGvxFZG5y3/AuUl8RsTSpz5KG0wxAw5nZysDdwBLBUHu7+/nxjESky8xsLPDrYJhngXXdPVpMSB9pBqD5Pk588D9Vg7+ILIjcV5waDLMEqe+SBtMMQIOZ2bLAPcCygTCTgU30PE5EFlRedzQRWCYQ5ilgHXd/qkxWUppmAJrtI8QGf4AvaPAXkYWR+4wvBMMsS+rDpKE0A9BQZrYE6dv/SoEw1wHbaeGfiCys/FbANcBWgTCPk2YBni2TlZSkDRua6zBig78DH9TgL2a2FbARsDqwxhz/BHgQeGCOf97q7tcNfbbSFO4+08w+CFxO7xuQrUTqy75TLDEpRjMADWVmNwKbBUKc7e5vKZWPtIeZjQDGAOPyz5o9hrofOCf/XKzjogeTmZ0FjA+E+Lu7b14qHylHBUADmdk2pJP6IrZ392tK5CPtYGZ7AQcDY4mvHZnTU8D5wE/d/beFY0uDmdl2wNXBMNu6+19L5CPlaBFgM703eP3vNPgPDjPbzswuBC4gbeRSevAnx3wXcIGZXZgHBRkAuS+Jbh8e7dOkDzQD0DD5II0HgFUCYXZ190sKpSQNZWajga8C7yR+SNTCctK74ke5+51DfG8ZYma2C/CnQIhHgTXcfUahlKQAzQA0z5uIDf6XafDvNjMbYWbfBG4GDmDoB3/yPQ8Abjazb+Z1B9JRuU+5LBBiFVLfJg2iAqB5olNlXyuShTRS3hr6j8CngEUrpwMph08Bf8y5SXdF+xY9BmgYPQJoEDNbDngYGNljiIeAtfTqXzeZ2atJK/LXqZ3LPNwDjHP362snIuXlfQHuA1brMcQ0YFV3f7JcVhKhGYBmeTO9D/4AJ2rw7yYzexswgeYO/pBym5BzlY7JfcuJgRAjSX2cNIQKgGbZPXj9z4pkIY1iZh8GTgeWrJ3LAlgSOD3nLN0T7WOifZwUpEcADWJmdwCje7z8WnffpmQ+Up+Z7Ul6/35Y7VwW0kxgrLtHXx+ThjGzvwJb93j5ne6+fsl8pHeaAWgIM1uH3gd/0Lf/zjGzDUmv2rVt8IeU86n5d5BuifQ1o3NfJw2gAqA5IlNjDpxcKhGpLx8FfS6wXO1cApYDzs2/i3THyaQ+p1d6DNAQKgCaI9IobnD3R4plIlWZ2SLAScAmtXMpYBPgpPw7SQfkvuaGQAgVAA2hRtkckUZxUbEspAk+QNrPvyvGkn4n6Y4LA9eqAGgILQJsgPyc9NZAiHHufm6pfKQeM1sKuB0Y1YfwfwHOI33WHsw/kI4FXp10ZPC+wLZ9uPcjwAbu/nQfYssQM7P9SHtS9Gojd7+tVD7Sm+G1ExAAtghcO5PYHt3SLJ+i7OA/CfgGcLK73zePf+fFHfHRZrYW6eCfI4AVC+UxivS7HV0ontT1J1Lf0+sC1S146edOKtAjgGaIPOv9q7s/VSwTqcbMRgGHFwo3lbR16/ru/o1XGPxfxt3vc/dvAOvnGFML5XR4/h2l5XKfEznetwvrW1pPBUAzbBy49uJSSUh1XwSWKhDnHuB17n5kpDh096fc/UjgdTlm1FKk31G64eLAtZE+TwpRAdAMkWr4xmJZSDVmtjpwWIFQlwLbl9yPP8faPseOOiz/rtJ+kb5HMwANoAKgGSLV8C3FspCaxhFfk3Mt8CZ3f6xAPi+RY74p3yNiOOl3lfaL9D2aAWgAFQCVmdmqQGSjFBUA3TA+eP2jpLdBni2RzNzk2OPyvSKiv6s0Q6TvWTb3fVKRCoD6IlNhj+pozfbLO+XtFgxzwMIs9OtVvscBwTC7aXfA9st9T6QY1GOAylQA1LdB4NrI3gHSHGOBEYHrz3b3IdsMKt/r7ECIEXRro6NBFumDIn2fFKACoL7IXu+a/u+GyJT4DODIUokshCPzvXulxwDdEOmD2nzORSeoAKhv6cC1DxTLQmqKbI16lrtPLJbJAsr3PCsQQtvBdkOkD4r0fVKACoD6Io1gSrEspAozWwxYKRAiMghHRe69Uv7dpd0ifZAKgMpUANSnAmCwRd6Jnw6cXyqRHpyfc+iV9gNoPxUALaYCoL7Izm+Ti2UhtUQGwatrbgOd7311IIQKgPaL9EEldr2UABUA9WkGYLCtEbi276/9LYBIDpHfXZpBMwAtpgKgPhUAgy3yLfjB+f8rfRfJQTMA7acCoMVUANS3ZOBana3efpHT8R4plkXvIjnoZMD2i/RBkb5PClABUF+kAS1aLAupJfIMvwm76UVy0DHW7Rd5k0NfYCpTAVDfE4FrtYim/do+hd72RxgSE5nGj/R9UoAKgPr+EbhWBUD7RTZSacIiukgO2siq/SIFQKTvkwJUANSnGYDBFvkWvI2ZRY8Q7lm+9zaBEJoBaL9lAtdqBqAyFQD1RRqBFtG0X+Rb8ArAzqUS6cHOOYdeaQag/fQIoMVUANQXaQR6jabl8mY6zwZCjCuVyxDf+9mamxhJMSoAWkwFQH2RRrBWsSykpshuegea2ZAXgvmeBwZCRH5naY6VA9eqAKhMBUB9kUag87S74ezAtSsDny6VyEI4gljnH/mdpTk2ClyrAqAyFQD1qQCQ6GD4CTMbslcC870+GQyjAqAbNg5cqwKgMhUA9UUawXo1V4FLGe5+N3B9IMQSwElmNqJMRvOW73FSvmevrs+/s7RYPs557UAIFQCVqQCoL9IIhgPrlEpEqop+I94V+H6JRObj+/leEfr23w0bEBtDVABUpgKgMnefQuxEtQ1L5SJVlRgUDzWzr5iZFYj1EpZ8BTi0QDgVAN0Qmf6/L/d9UpEKgGaIrIh+bbEspBp3vw64sECoo4BTzGzxArEAyLFOybGjLsy/q7TfJoFrryqWhfRMBUAzRBrDTsWykNo+DXiBOO8AJpjZjtFAZvY6YEKOGeXUeWNB+iPS91xZLAvpmQqAZogUADtoIWA3uPs1wGmFwm1NKgLOMbMtFvZiM9vYzM4ALs+xSjgt/47ScnkxaGQXSs0ANIC5l/jCIRF5U5Un6b0g214dazeY2frAzUDpFf1/Jz17Pw+41d1fchCLmS1Peqd7LLAfsFXh+08HNnX3OwrHlQrM7PXAZT1ePhNY1t2fKZiS9EDfHBvA3aeY2UTgVT2G2BlQAdAB7n6Hmf0v8OHCoTfLP0cBmNlU/nkYz+rEznVfEP+rwb9Tdg9ce5MG/2bQI4DmiEyJRV/Lkmb5D2JvhiyIxYDR+affg/99pN9JuiNSAOj5f0OoAGiOSAGwp5npaOCOcPfHSQftRA4JaopngXH5d5IOyG+F7BAIoef/DaECoDkijWJxYN9SiUh97n4tcDBl3gqoxYGD8+8i3bEPMDJwvWYAGkIFQHP8DZgWuP6dpRKRZnD3M4Cja+cRcHT+HaRbDg5c+wxpQao0gN4CaBAzu5Te362dBqzi7pMLpiSV5V39TgP2r53LQjoDeIerg+kUM1sFeIDeF5Bf6O5vKJiSBGgGoFlODVw7kvT6lnRIHkAPBE6onctCOAE4UIN/Jx1I7O2xSB8nhWkGoEHMbGXSq1mqruVlzOxjwH8Bw2rnMg8zgU+5+3dqJyL9YWbX0vseEdOA1ebcg0Lq0QxAg7j7Y8DvAiF2N7MtS+UjzZIH1rGkTaOa5klgrAb/7sp9S2SDqF9r8G8WFQDN84vg9R8vkoU0krv/DngdabfAprgZeF3OTbrrk8Hro32bFKZHAA1jZksAjwC9vtc/DVjb3R8tl5U0Td6L/QPAF4CVK6XxGPAl4Hh3n14pBxkCZrYucBu9P578B7Cquz9fKieJ0wxAw7j7s8BZgRAjgQ8WSkcayt2nu/uxwPrAVxjaTYOezfdc392P1eA/EI4gtvjvNA3+zaMZgAYysz2B3wZCPELqnLXf9oAws9VIswHvApbt022eAk4GvuTuD/XpHtIw+bN1F7HNf3Zy9wmFUpJCVAA0kJkNA+4HVg2E+Q93b/MmMtKD/GhgDDCe9FromsGQ9wPnkk4SvFjf9gePmX0T+FQgxF3uPrpUPlKOCoCGMrP/Jrag7xlgI3d/cL7/pnSWmW1H2rp1Q2C1F/3MOUvwFPDQi35uA36lY6YHm5mtCtwOLBkI82V3/0KhlKQgFQANZWZbAdE91H/k7oeUyEe6JS82XS3/nw/ltSciL2FmJ5EeK/XKgY3d/bZCKUlBKgAazMzOJXbIzyxgG3e/vlBKIjIgzOwNwB+CYU529wNL5CPlqQBosLzxxnWABcJod0ARWShmtijpgLKNA2FmAJu6++1lspLS9Bpgg7n734BTgmF2N7P3l8hHRAbGEcQGf4AfavBvNs0ANJyZbQjcROwd3KeBLdz97iJJiUhnmdn6wA3A4oEwzwEbuvsDZbKSftAMQMPlxTM/CYZZCvhRPlpWRGSu8mukJxEb/AG+p8G/+TQD0AJmtibpVZzIRhwAH3H37xVISUQ6yMz+i/ie/5OB0e4+qUBK0keaAWgBd78f+J8Cob5uZpsXiCMiHWNm+wCfKBDqmxr820EzAC1hZisDd9L7IUGz3Qm8Rg1URGYzs7VI+46sGAz1GOnb/9PxrKTfNAPQEu7+GPDtAqFGA6eZWWRRoYh0RH7ufzLxwR/gGA3+7aEZgBYxs6VI+wKsXyDcse7+0QJxRKSl8sLgXwAlNuu5njS7qFP/WkIzAC2SK+v3ADMLhPuI9gcQGXj/TZnBfyrwbg3+7aICoGXc/XLgmELhvm9mBxSKJSItYmZHAh8rFO7T7v73QrFkiOgRQAvl5/d/BrYvEG4m8C53P71ALBFpATM7BDihULjfAW9yDSatowKgpcxsI9Kq3SUKhJsBvNPdzywQS0QazMwOBH4GDCsQbhJpl9GHCsSSIaZHAC3l7rcS37BjtuHAKWY2rlA8EWkgM/s4adFficEf4DAN/u2lAqDF3P144FeFwo0AzjCzQwvFE5EGMbOvkxb9ldoS/EfuflahWFKBHgG0nJmtQjq4Y5WCYf8TOErP9ETaL68ZOgE4uGDYO4Ct9M5/u2kGoOXc/VHgEKDkYH0kcLKZRc8eEJGKzGw54FzKDv7TgYM0+LefCoAOcPdfAR8vHPadwB/NbFThuCIyBMxsO+CvwJsLhp0FvNfdrygYUypRAdAR7v5d4MuFw74euMHM9i0cV0T6yMw+AkwA1isc+sPufkrhmFKJ1gB0jJl9D/hQH0IfD3zS3Z/tQ2wRKcDMlgF+COzfh/Cfc/ev9iGuVKICoGPMbBHgRKAfO/zdSnr2d3UfYotIgJntBXyfdOBXad9y90/1Ia5UpEcAHePus4D3Ahf0IfxGwJ/N7Dt5cZGIVGZma5vZL0ltvh+D/0+Aw/sQVyrTDEBHmdkSwO+BHft0i8eBo4ATctEhIkPIzBYlbQb2ecrsCDo3ZwP7u3uJA8ikYVQAdJiZLQ/8Cdiij7e5Fvg3d7+sj/cQkSwf4TuetF/Hxn281YXAWHef1sd7SEV6BNBh7v4PYC/gpj7eZmvgUjP7nZm9sY/3ERloZjYs7+N/A3Am/R38LwHGa/DvNs0ADIC8MvhkYOwQ3O6vwDeAMzRtKBJnZiOA95A26NpgCG75Q+BD7v78ENxLKlIBMCDy2wHfAIZqJe+dpBXJJ7v7g0N0T5HOMLMNSQt63wesOQS3nAkc7u7fHoJ7SQOoABgwZvY+0jv9iw7RLWcBF5FOIDvT3ScP0X1FWiev23knaeDfYQhv/RTpSPDfDuE9pTIVAAPIzHYEzqLsAUILYipwHnA+cKG73zvE9xdpHDPbANidtF5nb2Coz+C4DdjP3ScO8X2lMhUAA8rM1iYdEvLqimncQVppfCFwsbs/XDEXkSFhZmsBu5EG/d2BtSqm8wfgHXnBsAwYFQADzMyWBH4OvKV2LtljwETg5hf9/N3d76+alchCygv31gU2edHPxvmfK9bL7CWOBT7h7jNqJyJ1qAAYcPmd4k8CX6J/m4lE3QD8EjjR3W/v543MbBjwOmB7YFtg5X7eT1pvOLDUXH6afJT2Y6SB/8TaiUhdKgAEADNbB/ge6RlkUz0HHOzup/cjuJltDPwMeE0/4otU5qRtff/d3SdVzkUaQBsBCQDufo+77wO8HWjqa3uLA6ea2RGlA5vZAaRdDTX4SxdNBHZz93/R4C+zaQZAXiZvHPRV0rHCTSwSZwCbuPsdJYKZ2frA9cCSJeKJNMg04Bjga9rYR+bUxM5dKnP3ye7+UdJ7yNfVzmcuhgNfKBEor4H4CRr8pXsuBLZw9y9p8Je50QyAvKK8KO7jNG+R4Exgyehe5Wa2CeltA5GueJJ0QNfPaycizaYZAHlFeT//00g7+jXJMGDVAnG2KxBDpElGkE4BFXlFKgBkQfw/0qtNTVOiANimQAyRJlmS9I6/yCtSASCvyMzGAeNq5zEPzxSI8XiBGCJNs6+ZNWWDL2koFQAyT2a2FOnbfxPd7u43FojzlwIxRJrou7kNi8yVCgB5JUdTd5/yV3JmoTjXkF4rFOmaNYEv105CmksFgMyVmW0FfKxAqEmkHchKuhP4vyUC5U1RvlIilkhB04GHCsT5qJltXSCOdJBeA5SXMbNFgD8Drw2GehzYFDBgDOkEtN1IB6L06h/AjiWPLjWz4cDl6I0AqWcSqc3N/rmatPD2ZuKHB10NvM7dm/Ymj1SmAkBexsw+RDoXIOqguR04YmarkgqBXYAtSUXC8gsQ7wLSPuYlnv3PLacfAPuUji0yBycN7C8M+O5+y9z+RTN7D+l8iqiPurveDJCXUAEgL5EHwonAssFQF7j7mxfivqNIhcCLfxYDHs4/Z7h7399tNrODgY+QCpNF+30/6ZynSd/mJ5FmwF78z0nAHcAV7v6PBQ1oZr8F9gzmNZm0fXaJxwrSESoA5CXM7BTgncEwzwCbufs9BVKqwswWBbZAxwHLK5vGiwb46M6Uc2Nm6wI3Et+u+nR3f0c4IekMFQDyAjPbizTNHvVxd/9OgTgiApjZJ4BvFQg11t1/UyCOdIAKAAHAzBYnfcsYHQx1JWmRnhYciRSSF+ZeAWwfDHUXaXbuuXhW0nZ6DVBm+xzxwX86cJgGf5Gycps6lNTGItYDPh/PSLpABYBgZpsC/14g1Nfd/YYCcURkDu7+N8rsf3G4mW1WII60nB4BDDgzM+Bi0it5EbcAr+7HIigRScxsJHA9sHEw1GXALq4BYKBpBkAOIj74O2nqX4O/SB/lNvZ+4rtr7gS8J56RtJlmAAaYmY0gfXNfLxjqOHf/1wIpicgCMLPjgA8Ew9wFbOzu0XUF0lKaARhs/4f44P8A8OkCuYjIgvs08GAwxnqkPkAGlGYABlR+lngb8dP+xrv7OQVSEpGFYGbjgbOCYe4DNnD35wukJC2jGYDBdRjxwf8MDf4idbj72cAvg2HWIq0pkAGkGYABlDf9uQNYLRBmCrCRuz9cJisRWVj57I5bgaUDYR4E1nf3qWWykrbQDMBg+hCxwR/gvzX4i9SV2+B/B8OsDmgR7wDSDMCAMbMlSat/I4fcTAJGu/vkMlmJSK/MbBngTmDFQJhHSW36mTJZSRtoBmDw/BvxE+7+U4O/SDPktvi1YJhVSMdgywDRDMAAyd8U7gJWCIS5H9hQzwtFmsPMFgNuB9YIhJkErOfuU8pkJU2nGYDB8gligz/AlzT4izRLbpNfCoZZEfh4gXSkJTQDMCDMbHngbmCZQJjbgFe5+4wiSfWJma1GmtJcEVgp/8z+3ysAI+plJw02HXgCeJz0bfjxF/3vR939oYq5zZeZDQduBjYIhHmSNAvwZJmspMmG105Ahsy/Exv8AT7ftMHfzIYBrybtbT77J/qGg8jLmNlDpEN0Zv9c7+4z62b1T+4+w8y+AJwUCLMc8Cl0ZPBA0AzAADCzlUmrhJcKhLkO2KYJp4eZ2XrAgaRDjHYg9g60SK+mAJcDlwAnuftdlfOZfbrndcCWgTBTSLMAk8pkJU2lAmAAmNk3SVV9xN7ufn6JfHqRpzf3Ix2AsgdgtXIRmQsHfg8cD5xbc6bMzPYBzguG+Ya764yPjlMB0HH5efgdwOKBMJe5+86FUlooZrYuadvifwFWrZGDyEJ6GPgR8AN3v7tGAmY2AdgxEOJZ0izAo4VSkgbSWwDddySxwX92jCFlZqPN7Jek4uWzaPCX9liV9Jm9w8x+aWajK+Tw2eD1SwCfKZGINJdmADosr/x/gFgBcL67710opfkysyVIndfhwMihuq9IH00Dvgkc4+7PDtVNzewCYK9AiKeBNbTpV3dpBqDb3kds8HfgqDKpzJ+ZvRO4Jd9Tg790xUjSZ/qW/BkfKp8lteFeLQW8t1Au0kAqADoqrwaOHvBxqrtfVyKfV2Jmm5vZxcApwJr9vp9IJWsCp5jZxWa2eb9v5u5/JX5c8IdK5CLNpEcAHWVmewK/DYSYQdr057ZCKc2VmR1AWjAVXacg0ibPAf/i7qf08yZmtglwIzAsEGZ3d7+oUErSIJoB6K5o5X5yPwd/M1vEzI4BTkaDvwyexYGTzewYM+tbP+zuE4HTgmE0C9BRmgHoIDNbm7TxT6Tq397drymU0kuY2dLAicC+/Ygv0jLnAe/u1yE8ZvY60oZFvZoBrOPuDxZKSRpCMwDd9AFig/8VfRz8NwCuQIO/yGz7AlfktlGcu18BRNrzcOD9hdKRBlEB0DFmtihwaDDMsSVymZOZbQNcBbyqH/FFWuxVJZ3+xAAAIABJREFUwFW5jfTD/wte//68G6d0iAqA7tmfdBJerx4BTi+UywvMbEPgN8DypWOLdMTywG9yWyntVCCyq99qwFsK5SINoYque6ILdo539+eLZJKZ2erA74gVJgvreeB64D7Ska6P5Z9JpGeaInMaTjo2euX8sxKwFum0yUWHKIdVgN+Z2etLPnN392lm9r/A5wJhPkQfvhxIPVoE2CFmtiVp0OvVdGDdkh1P3o3wEqDf7z1PAS4lHdM6AbjK3af2+Z4yAMxsMeA1wOtJx03vTP9PoLwR2MXd/1EqoJmtAdxN7IvfZu5+U5mMpDYVAB1iZscTW6xzqrsfUDCfJUgnpEUOJZmfq4D/BU5x92f6eB8RAMxsSeAAUlt7TR9v9Wdgj5LbB5vZqcA7AiG+5+4fKZWP1KUCoCPMbFnSvv9LBsLs5O4TCuVjwLnAPiXizWE68EPS44q+71QoMi9mthXprZtDgBF9uMWvgP28UEdtZjuRZsp6NQVY3d2fLpGP1KVFgN3xXmKD/7WlBv/sg/Rn8P8DsKW7/6sGf6nN3a9z938FtiR9Nkvbh/iW3i9w98uAawMhlgbeUygdqUwFQHdEF/9FXxN6gZmtA3yjVLzsPuDt7r5H3t1MpDHcfaK77wG8nfRZLenrZrZuwXjRtq6dATtCjwA6wMx2B/4YCDEJWLPUojkz+z3wxhKxspOAw4byKFWRXuW1Lz8ADiwY9kLgjSUeBeRFjfeR3nLo1S7uHnmUIA2gGYBuiFbkJxQc/A+j3OA/C/iMu79bg7+0hbs/6+7vBj5D+gyXsDtprUFYbusnBMN8uEQuUpdmAFrOzFYGHqT3V3tmAqPd/d4CuaxFen1pmWgsYDJwoLv/ukAskSrMbG/SDFaJNvE0sLm73xMNlNvqXfS+Zfh0YFV3fyKai9SjGYD2ewux93rPLTH4Z8dRpqObBOyowV/aLn+GdyR9pqOWIj1aCHP3+4CzAyFGAONK5CL1qABov/2D1xfZ99/MdgDGFgj1LLCPu/+9QCyR6vJneR/SZztqj/wqXwnRxYDRvkcq0yOAFjOzFUh79/c6A3CTu29WKJeziX8jmAGMc/fzC6Qk0ihmNhY4h/gW7L9y9yKnaZrZ34Aterz8eWAVd3+qRC4y9DQD0G7jiXUmPyuRhJm9CtivQKhDNPhLV+XP9iEFQu1tZqW21v554NpFKdPupRIVAO0WnYIrdbDHEYAFYxzv7kUKEpGmyp/x44NhDPj3AulAvA/QY4AW0yOAljKz5UjHe/a6/ehf3H27AnmsBdwRyAPgHmALd58SzUek6cxsaeAGYJ1AmBnA+oXe3rmS3s80mEp6DKC220KaAWiv/YgNuqcVyuOTwTwgbfKjDkQGQv6sHxYMM5zU9kqI9AWL0Z8tv2UIqABor+rT/2a2DPGO7Afu/vtoLiJtkj/z0Vf6Ds1tMEqPAQaUCoAWyo1+z0CIq939rgKpvJXYAURTSOsHRAbREaQ20KsliR3tC0B+jHBlIMSb8xHJ0jIqANppH2Bk4PpS0//vDl5/nLs/WSQTkZbJn/3jgmEOLpELsT5hccrsASJDTIsAW8jMziTtANirdaPbiZrZasD99F5ETgPWc/eHInmItFluR3cRK+jXd/c7g3msRVqM2+vbPKe5+zsjOcjQ0wxAy+SptjcFQlxVYi9x4ABin5+fafCXQZfbQPT11/cWyOM+4IpAiL3NbPFoHjK0VAC0z96kKbdeNWH6fxbwjUJ5iLTdN4idGvheM4vuwwGxviH6xUQqUAHQPpEVt06Z1f+bANsGQvzJ3W+P5iHSBbktXBwIsR6x9jjbGaQ+old6G6BlVAC0SJ5iiyy2ubLQyX8HBq8/qUAOIl0S2ZIXYNNoAu5+P3B5IMQ+ZhZZyyBDTAVAu7yZ2Gt3pbb+jUz/P0/6piEi//RLYqcFblAoj8hjgOjryTLEVAC0SxOm/3cARgdCnK9X/0ReKu8OeE4gxLKFUtFjgAGiAqAlzGwEsS03r8grfaOi0/8nFshBpIsijwEuKZGAuz8ATAiE2NfMhpXIRfpPBUB7bAcsHbi+1Or/8YFrJwO/KpSHSNf8jnSw1sKaCVxYMI/ITOHywNalEpH+UgHQHmMC1zoFnrub2VbAmoEQZ7r71GgeIl3k7jOBj/Vw6U8LP1Y7g9hriWMK5SF9pgKgPcYErr0mr/CNip76pel/kVfg7r8GzluIS24CPlo4hweBqwMhxhRKRfpMBUALmNlwYMdAiFLTg/sGrn0YuKhQHiJd9i4WbD3ATcD+7h55e2BeIn3GzloH0A4qANphO2CpwPXhgdfMRgHbB0Kclqc4ReQVuPsz7v5e4H3A33j5qvwngU8Ar3b3m/uURqTPWAatA2iF4bUTkAUyJnDtdOCyAjnsTe8HhcDCTWuKDDx3/ynwUzNbCXg96ejg24H73T3yjH5BTCDt2bFoj9ePAa4plo30hQqAdtg1cO1V7v5MgRwiz/8nA38qkIP0KE/JjgJWn+MH4ME5fh7RbE1zuPvjxPYI6OWez5rZlcDOPYYYA3yzXEbSDyoAGi4//98pEKLE9P9IYI9AiN+5+/RoHrJg8p4RY0ivbL6WNNCvAizoc9mZZvYoqRi4EjgbuFj/DQfORfReAOxsZsNUSDabCoDm25bY8/8SCwDHBHPQ9H+fmdnSpNPYxpMe10R2hhsGrJZ/tgU+BDxlZr8mFQMX5J3rpNsuAr7Q47Wz1wHoMUCDqQBovsj0/zRih3vMFln9Pwv4TYEcZA5mtghwAOlshjcA/TyIZVnSLpAHAtPM7I+k1zpPGYLn0VLH5cBUYLEer98NFQCNprcAmm9M4NrLC2288+bAtVe4+2MFcpAXMbO9gGtJg/BY+jv4z2lkvueJwLU5F+kYd49+gRhTKBXpExUADZYXbkWe/4en/81sLWKH/2jr34LMbBsz+wNwAbBl7XxIOVxgZn8ws21qJyPFRfqQnbQfQLOpAGi2bYjt/19i453IIwhQAVCEma1nZieRplTfUDufuXgDcI2ZnWRm69VORoqJ7gegorDBVAA025jAtc+SVnBHRQqAe9z9hgI5DDQz+wQwkbRDXGQvhn4zUo4Tc87SflcBkdeIxxTKQ/pABUCzjQlce1mh17YiBcAFBe4/sMxsUTP7MfAtet+QpYZFgW+Z2Y/NrE15yxxyHxI5HnhMoVSkD1QANFSB5/8l3v9fHdgwECLScQy0vPXyRaTtYNvqfcBF+XeR9tK5AB2lAqC5tiY9Q+tVE57/l3gFceDkY5evJnYAVFPsCFydfydpp0hfsjRaB9BYKgCaa0zg2smUef82UgA85u63F8hhoJjZ/qSZk7Vq51LQWsCE/LtJ+/yF1Kf0akyhPKQwFQDN9frAtZcW2oIzUgDo2/9CMrO3A6cBS9TOpQ+WAE7Lv6O0SO5LLg2EiDzKlD5SAdBckXe8Sx3/u0kgxJ+jOQwSM9sW+CnNXuUfZaTT7batnYgstEifskWxLKQoFQANZGZLApF3qS8pkIae/w8RM1uNdNrb4rVzGQKLA+fk31naI9KnrGtmkbNEpE90FkAzbUbv3wRnATcWyCHyCGI6aRGbzIeZLUY6YGeNIbjdA7z86F94+RHB/c5lDeBsM9u10FbV0n83kvqWXr40GrA5cEXRjCRMBUAzRabMbnf35wrksF3g2usL5TAIfgi8pk+xpwN/Is0unOPu9y3IRXn753H5Z1dgRB9yew3pd393H2IPFDNbGdiTNNDOIm3AVfQVXHd/zsxuBzbqMYQKgAZSAdBMkQIgvPNefm9360AIPf9fAGZ2JOl0vdLuBL4MnO3uTy7sxblQOBY41syWIx0x/HliZ0LMzYFmdqO7/2fhuAPBzLYGDgf2Z46Noszsb8B3gR8XPK3xBnovALQOoIG0BqCZIo3lbwXuvxmx59F6/j8fZrYR8KXCYScBnwA2dfef9DL4z8ndn3T3nwCb5tiTojHn8KX8t5CFYGa7A5eRCsi57ba4JXACcEI+NrqESN+iAqCBVAA00+aBa0vsvR+Z/gfNACyIYyg3A+fAfwHru/u33f35QnH/eQP3593928D6+V5eKPRw0t9CFpCZ7QKcx4K9Lvp/gB8UunWkb1EB0EAqABrGzFYBVgmEqF0APOju9xbIobPM7LXA2wqFmwKMd/fD3f2pQjHnyd2fcvfDSY8FphQK+7b8N5EF898s3F4R/2JmOxS4b6RvWcnMVi2QgxSkAqB5IpXys6Tnv1GRAkDf/ufv64Xi3Ans4O7nFoq3wPI9d6DM5w3K/U06zcx2pLetdT9S4PZ3kvqYXkVmNqUPVAA0T6QAuDG64MfMRhDbhEjP/1+BmY0lvscCpOe/27v73wvE6km+9/Y5l6hd899GXtlBPV63v5ktH7lx7lsirxjrMUDDqABonqpvAOT7jwxcrxmAeciLsb5WINTtwH7u/kSBWCE5h/1IOUV9reCCta7qdUOdRYFXF7i/1gF0iBpb87R5AeA04K8FcuiqA4h3gk8B+7r7PwrkU0TOZV9SbhFbkP5GMm+Ro3VfVeD+KgA6RAVAg5iZkV7B61XtAuAv/ViB3iHRTW9mAge4+8QSyZSUczqAlGOENgZ6ZdMD10b6ltkifcyrNMPTLPqP0SyjgSUD15coACLntuv5/zzkvdDfEAzzNXe/oEQ+/ZBziz7ieIP2jX9FkeKvdgGwBOU3k5IAFQDNEpkie9jdHyuQw8aBa/X8f97eRGxtxWO0Y6X810m59mok6W8lcxdZ9BkuAHIf83AghB4DNIgKgGapvQXwqsAygRCaAZi38cHrv+Lupd6775uc41eCYaJ/qy6LrMJfKZ8bEKV1AB2hAqBZai8AjHz7f8LdHyqQQ+eY2XBg70CIu4DjCqUzFI4j5dyrvfPfTF7ubuCZwPW1HwOoAGgQFQDNUvsVwEgBUGpDmC7aFVgucP1X27S4Muf61UCI5SizV0LnuLsDNwdCqACQF6gAaAgzWxTYMBCixCFAkQIg8o2v6yJT2jOAM0slMoTOJOXeKz0GmLfIY4ASBUCkr9nAzCJrYaQgFQDNsRa9Hw4zE7ipQA4qAPrjdYFrL2nSO/8LKud8SSBE5G/WdVUXApL6ml5f9xwGrFkgBylABUBzrB649l53n1ogBz0C6I/If9uzi2Ux9CK5R/5mXRcpAMKbAeW+JnLg1xrRHKQMFQDNEWkUD0Rvnh9BrBcIoRmAuTCzYcCoQIhBLQBG5b+dvFz0TYDIaaOzRfocFXcNoQKgOSKNIlwAkM55j3S4KgDmbhV6/7s+4O73lUxmKOXce/1sDiN2LHZn5b/r5ECISKE/W6TP0QxAQ6gAaI7aBUBk+n8WcE+BHLoo8t/1wWJZ1BP5HfRNcd4ia37WLnB/zQB0gAqA5qj6CADYKHL/Nr2mNsQinV0X9lWI/A4aKObtjsC1tQsAzQA0hAqA5qg9A7BW4FpN/89bpLMb9BkADRTzFlmEV7sAUGHXECoAmqP2DEDk1Ry9ATBvegTQOw0U8xZZGxIp9mdTAdABKgCao/YMQKQA0AzAvFngWi+WRT2R3yHyt+s6zQBImAqABjCz5YHFAyFKfFPUDEB/DPo34EGfAemXyAxAiQIg8t9m8dznSWUqAJoh0kk+7u7TIjc3sxHE3lXXDMC8DXoBsFrgWhUA8xaZAVjZzCJfOMh9zuOBEFrf0QAqAJqh9vP/1YlNt6oAmLfIIBYZPJtCMwB94O5PApHjobUOQFQANESbn/9PpRuvq/XLoHeStT/bXVb7MYBeBWw5FQDNUHsGIFIA3J2PKJW5e4S0UVIv1jCz1naUOfde859F+tvJvGkhoISoAGiG2t+S9AZAn7j7THofyAwYVzCdoTaO3h8tPZL/djJvmgGQEBUAzdDmGQC9ATB/kWfZ44tlMfQiuev5//xFZgBWLXB/zQC0nAqAZtAMQLddGbh2jJktVyyTIZJzHhMIEfmbDYr7A9euUOD+KgBaTgVAM9SeAYicuqYCYP7OCVw7gnbOAown5d6ryN9sUEwKXFu7ANAjgAZQAVBZgfPiSxQAkc4g8i1kUFwEPBW4/qi8V0Mr5FyPCoR4ivQ3k1fW5gJgVO77pCIVAPVFzouf6u6RTmC2yK5cTxe4f6e5+3Tg/ECIDYDDCqUzFA4j5dyr8/PfTF7ZE4FrwwVA7num9nj5MGIzj1KACoD6lg5cW+o1KRUA/Red0v6CmS1ZJJM+yjl+IRhG0/8LpvYMAMT6oEjfJwWoAKgvsiXns9Gbm9lIYIlAiGeiOQyI3wDPB64fBRxeKJd+OpzYI63nSX8rmb9/BK5d2syGF8gh0geFtiOWOBUA9UUawXMF7h89lEMFwAJw98nEn2t/zszeUCKffsi5fS4Y5qL8t5L5cPcZQORvVWIWINIHqQCoTAVAfYsFrq1dAMx0916fAQ6ik4LXDwdON7PI8/W+yDmdTsoxIvo3GjS1HwNE+qBI3ycFqACor/YMQKQT0Lf/hXMicFMwxvLAeWa2bIF8isi5nEd8Nukm0t9IFlzVhYBoBqDVVADU1+YZAC0AXAh5a9sjC4TaBDirCUVAzuEsUk5RR2r734WmGQDpmQqA+mrPAEQKAM0ALCR3PxeYUCDUbsCVZrZRgVg9yfe+MucSNSH/bWThaAZAeqYCoL7aBYAeAQy9IwrF2ZhUBOxVKN4Cy/e8MudQQqm/yaCJFAAltphWAdBiKgDqq/0IIDKNrEcAPXD3P1PuXfflgF+b2VfMbKlCMefJzJYys68Av6bMAAJwTv6byMKL7DBZYgpejwBaTAVAfbVnAEYGrtUMQO+OBEo97x5G2nr3djP7YKH3u1/CzIab2QeB2/O9Sm3jWmpdxKCK7C2xaIH7awagxVQA1Fe7AIh0AioAeuTuNwNfLhx2FPA/wA1mdkCJnQPNbEkzOwC4IceObPIzN1/OfwvpTaQAiBT/s6kAaLHi3xRkodV+BBA5ZEaPAGK+BGwO7F847ibAycBUM/sD6XHDee6+QNu2mtkoYF9gHPBG+jdVewbpbyC9a/MMgB4BVKYCoD7NAAwod3czOxgYDWzTh1ssBuyTf2aZ2V3Ag3P8QDqb/cU/69H/2cG/Age7u/f5Pl3X5gJAMwCVqQCor3YBoBmAitz9WTMbB1wNrNrHWy0CrJ9/ansYGOfu4bMshGmBa/UIYMBpDUB9kWmwEtvwagagMne/HxhPmf+eTTcVGJ9/Z4mrPQMQ+czqEUBlKgDqa/MMgAqAQtz9SuDQ2nkMgUPz7ypl1C4ANAPQYioA6qu9CDDSCegRQEHufiJwEN2cCZgKHJR/RymnzW8BaAagMhUA9WkGQF6QB8hdgYdq51LQQ8CuGvz7QjMA0jMVAPXVLgC0BqBh3P0qYDvgmtq5FHANsF3+naQ8FQDSMxUA9dV+BKC3ABrI3R8EdiG9z99WJwO75N9F+kOPAKRnKgDqi/w3mFUsi97o6NY+cvfn3P1A4LPAjNr5LIQZwGfd/UB3L1GkSnNF+iCNP5XpP0B9kXehlyhwf03hNZy7/ydpx8CzaueyAM4CNs85S//VfoQY6YO0D0RlKgDqqz0A176/LAB3v8Xd3wrsCEyonc9cTAB2dPe3uvsttZMZILULgNr3lwAVAPVFqmAVAAPG3S93951IGwdNrJ0PKYfx7r6Tu19eO5kBVHsAjtxfMwCVqQCoL9IIaz8C0CKeStz9HNJjgUOACxnaNQIz8j0PIU33nzOE95aXqr2IONIHaQagMp0FUF/tb+CRTWc0A1CRu88EfgT8yMxWAPYmzQzsBYSPAp7DM8BvgbOBX7v7E4XjS28ibbDEhlO1ZyAkQAVAfXoEIGF5QP458HMzWwzYg1QMvJZ0wt/yCxnyH6TTAq8kDfq/d/cu7lDYdrUHYD0CaDEVAPW1+RGACoAGygP1efkHgFwUzHns7+r5/z3nEcEParBvjdoFgB4BtJgKgPo0AyB9lwf0O/OPdEftAkAzAC2mRYD1aQZARHpVuwDQDECLqQCor/YArLcARNqr9lsAtQsQCVABUJ8eAYhIr2oPwHoE0GIqAOqr/QhArwGKtFft1wD1CKDFVADUV/sbeO37i0jv2jwDoAKgMhUA9ekRgIj0qvYArEcALaYCoL7ajwC0CFCkvWoXAHoE0GIqAOrTDICI9KrNbwFoBqAyFQD1tXkGYOkC9xeR3kXaoGYABpwKgPpqfwN/KnDtagXuLyK9i7TBSNufrfYjCAlQAVBf7UcAj9P7UbKLm9nCHjIjIgXkttdrHzCD1Paj9AigxVQA1BepgsNHvrr7LODhQIjV5/+viEgfRNrew7ntR0X6IM0AVKYCoL6nAe/x2mXNrMQswIOBa9cocH8RWXiRAiDS5gHIfc+yPV7upL5PKlIBUJm7zwAeDYRYs0AaDwWu1QyASB2R4jvS5meL9D2P5r5PKlIB0AwPBK4tUQBEvg2oABCpo+oMALG+J9LnSSEqAJrh/sC1KgBEBlObC4BInyeFqABohtozAJHpQK0BEKmjzY8ANAPQACoAmkEzACKysDQDICEqAJpBBYCILCwVABKiAqAZItNhaxW4f6QzWNXM9DkSGUK5za0aCFGiAIj0PXoE0ADquJuh9gzA48D0Hq8dDqxSIAcRWXCrkNpeL6ZTZhdAzQC0nAqAZohUwyuZ2cjIzd3d0W6AIm0S3QWw183HAMh9zkqBEJoBaAAVAA3g7k/T+8EcRpmV+FoHINIetZ//r0Hqe3rxVO7zpDIVAM1R+1VAFQAi7VG7ANArgB2gAqA5aq8D0F4AIu3R5j0A9Py/IVQANEftAiDyrWB0gfuLyIKLtLnaMwAqABpCBUBztPkRwOYF7i8iCy7S5moXAHoE0BAqAJqj9gzAbYFrNzGzYQVyEJH5yG1tk0CISFufTTMAHaACoDlqzwD8PXDtYsAGBXIQkfnbgNTmehVp67NpBqADVAA0R9UZAHf/B3oMINIGoen/3NajNAPQASoAmiPSKEaZ2YgCOdwYuFYFgMjQiLS1SBsHIPc1owIhVAA0hAqAhnD3ScDUHi9fhPqPAVQAiAyNSFsrNf3f69gxNfd10gAqAJol8mxsiwL31wyASPNVnQEg1tfo+X+DqABolrsC125V4P6RbwcbRM8kEJFXlttYZMFtiRmASF8T6eOkMBUAzfK3wLWlCoBeDwkZTuzVJBGZv03o/RRAp34BEOnjpDAVAM1yfeDaV0dvng/ouCcQQo8BRPor0sbuLXQIT6SvifRxUpgKgGaJNI71zGyZAjloIaBIc9V+A2AZYL1ACBUADaICoFluBqb3eK1RYBYALQQUabLaCwBfTe/HAE8n9XHSECoAGsTdnyfWQGovBFQBINJftV8BjPQxN+c+ThpCBUDz1F4IGPmWsI6ZLVUgBxGZQ25b6wRClJgB0ALADlEB0DyRZ2QlCoCbgVk9XmvAZgVyEJGX24zep99nUWb6PdLH6Pl/w6gAaJ5II9nMzHp9RQgAd58K3BEIsXXk/iIyT5G2dUdu2z3LfUukwFcB0DAqAJon0khGApsWyCEyVbhLgfuLyMtF2laJ6f9NSX1Mr1QANIwKgIZx90eBhwMhSrwJEFkspAJApD8ibavEAsBI3/Jw7tukQVQANFPtdQB/CVy7hpmNLpCDiGS5Ta0RCBFp07Pp+X/HqABoptoFwKX0viUwwK4FchCRf4q0KSe16SgVAB2jAqCZqr4KmI/r1DoAkeYIPf8vdASvXgHsGBUAzRSpllc0szUL5HBJ4FrNAIiUFWlTkbYMQO5TVgyE0AxAA6kAaKaJwLTA9SUeA/wpcO16hYoQkYGX21Jk//1IW54t0qdMI/Vp0jAqABrI3WcANwVClCgAot8aNAsgUka0LYVnAIj1KTflPk0aRgVAc1VdCOjujxCr2rUOQKSMSFuamNtylBYAdpAKgOaKNJqdzazXLUNfLDJ1qBkAkTIibSk8/Z/7kp0DIVQANJQKgOaKNJpVgC0K5BCZOtzYzEYVyEFkYOU2tHEgRInp/y1IfUqvVAA0lAqA5rqe2Lv4byiQQ/Tbgx4DiMRE21CJBYCRvsRRAdBYKgAayt2fAG4IhHhjgRweIHYwkAoAkZhIG7ojt+GoSF9yQ+7LpIFUADTbHwLX7mJmIwrkEPkGoQJAJCbShko8/x8RzCHSh0mfqQBotj8Grl0KeG2BHCKdyBZmtkKBHEQGTm47kbU8Jab/X0vqS3oV6cOkz1QANNslwPTA9eHHAMQWERmwd4EcRAbR3qQ21KsSCwAjfcj0QjlIn6gAaDB3fxq4KhAivBDQ3e8G7g2EeFs0B5EBFWk79+a2GxXpQ67KfZg0lAqA5otMob3WzCLTd7NFphL3MrMlC+QgMjBym9krEKLE8//oY0RN/zecCoDmizSi6AKe2SKdyWLA2AI5iAySsaS206sSz/93IfUhvVIB0HAqAJrvCuCZwPUl1gGcD8wKXP/WAjmIDJJIm5lFarNRkb7jGVLfJQ2mAqDh3P154NJAiBLrAB4CLg+E2NvMRkbzEBkEua1EFs9enttsVKTvuDT3XdJgKgDaITKVtoWZRbbxnO2XgWuXBvYokIPIINiD1GZ6FWmrAOQ+I/IKoqb/W0AFQDtEGpNRZlvgM4PX6zGAyIKJtpVoW4XUZ0ReQVQB0AIqANrhOmBS4PoSjwHuAa4JhBhnZsOjeYh0WW4j4wIhrsltNSrSZ0wi9VnScCoAWsDdHbgoEKLEQkCITS2ugI4IFpmfXUltpVfh6f8s0mdclPssaTgVAO0RmVJbx8zWL5BDdGpRmwKJvLJoGwlP/+e+Yp1ACE3/t4QKgPaIHqpR4nTAW4EbAyHGm1nkuaJIZ+W2MT4Q4sbcRqOifYUOAGoJFQAt4e63E9uSt9RmPJEpxtWAHQvlIdI1O5LaSK9KTf9H+op7c18lLaACoF0iU2tvMrPlCuQQ7WT0NoDI3EXbRonX/5YD3hQIoen/FlER4sDHAAAdgklEQVQB0C6RxrUoBQZfd78BuC0Q4m16DCDyUrlNRJ7/35bbZtRbSX1Fr1QAtIgKgHaJNq53Fcki9k1jHWDPQnmIdMWexBbelZr+j/YRKgBaRAVAi7j7w8C1gRC7mdmoAqlEO5sPFshBpEuibaLE9P8oYLdAiGtzHyUtoQKgfU4JXDsMeEc0AXe/htiCxH3NbI1oHiJdkNvCvoEQ9+Y2GfUOUh/Rq0jfJBWoAGifU4HIJhsHFMoj8r7xMODQQnmItN2hxAbeElv/QqxvcFLfJC2iAqBl8jafkZP5djCzyLPG2aJTjoeaWaTTE2m93AaixXCJ6f91gB0CIS4vtAWxDCEVAO10cuBao8wswARibwOsCexTIA+RNtuH1BZ6dRupLUYdQOzwn0ifJJWoAGin04GZgevDbwPkvb6PC4bRYkAZdNE2cFyhffcjfcJMUp8kLWM6s6GdzOz3xLbsfJW73xzMYQXgAWCxHkPMAjZw97sieYi0kZmtB9xO71/EpgJruPsTwTw2BW4KhPiDu+8RyUHq0AxAe0VX3JaYBXgCOC0QYhHg/dE8RFrq/cT64NOig38W7Qu0+r+lNAPQUnnLzkfofdeu29x9owJ5vI7YosRHgTXdfXo0F5G2MLMRwP3AKoEwO7j7FQVyuRXYsMfLnwdGufuT0Txk6GkGoKVyg7sgEGJDM9u2QB5XANcFQqwCvCWah0jLvIXY4H9docF/W3of/AEu0ODfXioA2q36Y4BMiwFFFk548V+RLDT9P9D0CKDFzGxJ0hT6Ej2GuB9YO7qK2MyWAh4Elg6E2cTdb4nkIdIGZrYxMDEQYgqwurs/HczDSDt69voa4rPAKu7+TCQPqUczAC2WG955gRBrAjsXyONp4OfBMB+O5iHSEtHP+s+jg3+2M7E9CM7T4N9uKgDaL7oBR1MeAxxmZqsVyUSkofJn/LBgmKZM/2vzn5ZTAdB+FwCRRTjvNrNloknks8gjO5ItBnw6modIw32a3vfNAJiQ21pIbvPvDoR4EvhNNA+pSwVAy7n7NOCsQIilgUMKpfM/wes/oFkA6ar82f5AMEy0jc12CLE1O2e5+/OFcpFKVAB0Q3Qq7qOFDuY5A3g8cL1mAaTLot/+Hye1sZDc1j8aDKPp/w5QAdANF5LeBujVesC4aBJ5NuLHwTCaBZDOKfTt/8e5jUWNI7X5Xj1K6nOk5VQAdIC7lziM4xMlcgGOJ50N3ivNAkgXRb/9O6ltlRBt66fnPkdaTvsAdISZbQP8JRhmO3ePxsDMzgLGB0JMBUa7+0PRXERqy9/+7yRWAJzt7uEdM/POf9cEw2zr7n+N5iL1aQagI3KDvCQYptQswBfRLIDIbCW+/X+xUC7RNn6JBv/u0AxAh5jZeGJvBEwH1nX3BwvkcjqwfyCEZgGk9Qp9+z/D3d9eIJfVgbuBEYEwb3H3s6O5SDNoBqBbziV1Nr0aQbkd+f4DmBW4XrMA0gXRb/+zSG2phA8TG/zvJPUx0hEqADrE3WcB3w2G+YCZLV4gl78DpxXIRW8ESCsVWvl/Wm5L0VwWL5DLd3MfIx2hAqB7fgRMDly/IvCeQrkcjWYBZHCV+PZ/dKFc3kNq272aTOpbpENUAHSMu08BfhgM87F8Ulg0l4nAScEwHzCztaK5iAyl/JmNfuM+KbehaC4GfCwY5oe5b5EO0SLADjKzdYHbgcjufm9y998WyGVD4OZgLme6+9uiuYgMFTP7JfDWQIiZwKbufluBXPYinRkSyWUDd787mos0i2YAOig31HOCYT5eIBVyBxY9KvitZvbmEvmI9Fv+rEYGf0hH/oYH/yzals/R4N9NmgHoKDPbCbg0EMKBzdz95gK5jAZuAYYHwtwBbO7uU6P5iPSLmS0G3AisHwgzA9jY3SNv9MzOZ1Pg70Dkkd7O7n5ZNBdpHs0AdFRusJEdv4xyswB3Aj8Jhlkf+Ew8G5G++gyxwR/gJyUG/+zjxAb/azT4d5dmADrMzN4N/CIQ4jnSZjwPF8hlHeA2Yu8hTyPNAtwezUekNDPbgPTtf2QgzHRgQ3e/p0A+q5Le3Y+81nuQu58YzUWaSTMA3XYaENnVb3EKbUGaO7To2wkjgWMLpCPSD8cSG/whrbYPD/7ZF4kN/g8S38tDGkwFQIe5+3TiA+ahZrZRiXyAY0jf4iP2MjO9ESCNkj+TewXDTCO1kbDcZg8Nhjk29yHSUSoAuu9/SVP5vRoOfLVEIu5+H3BcgVDfNrOlCsQRCcufxW8XCHVcbiMlfJXYotvnSH2HdJgKgI5z90nAz4Jh9jez15TIhzQtGV1TsCblTkcTifoi6TMZ8TCFPtO5rUYO4gL4We47pMO0CHAAFHoV6GJ3361QPu8ETgmGmQFsVWKfdJFemdlmwHXEvm0DHODupxZICTO7CBgTCFHsFWBpNs0ADIDckKO7+o0xs7GF8jm1QD7Dge8XSEck4vvEB//fFhz8xxIb/CHlo8F/AGgGYECY2euB6Pu8fwO2LnEimJmtT3plKnJYCsBh7n5CNB+RhWVmhwI/CIaZSnq19Y4C+SwCXAtsGQy1k7tPiOYjzacZgAGRG3R0e+AtgYMKpEPu8EosLvy2mW1SII7IAsufuRIL/75aYvDPDiI++J+jwX9waAZggORO60ZiB/PcQ9qmNPo6H2a2KHA9EB3A/wa8VtsEy1DI2/1eSXywnQi82t2fL5DTSNJ22+sEwswkzUaETyCUdtAMwADJDTu6Gc86wIcLpEPu+D5YINSWwDcLxBFZEN8kPvgDfLDE4J99mNjgD2kTIg3+A0QzAAPGzFYjHRW8RCDMJGB9d3+qUE4/AQ4uEOqt7n5WgTgic2VmbwHOLBDqp+7+vgJxMLNlSYdlrRgI8yzpyN+HSuQk7aAZgAGTG/i3gmFWBD5dIJ3ZDicVFVE/NLO1C8QReZn82YrOoEH6rB9eIM5snyY2+AN8S4P/4NEMwAAys6VJ3xhWDoR5jvSNIXLWwItzOgQosZp/ArCru88sEEsEADMbBvwJeH2BcIe6e4lCAjNbnTSjF9nz/zHSjN6UEjlJe2gGYADlhv7lYJjFgf+IZ/OCHxF/TRFSB310gTgiL3Y0ZQb/y0if9VL+g9jgD/BlDf6DSTMAA8rMRgA3Ezu7fCawRalNQ/KuatcSOzIYYBawh7tfGM9KBp2Z7Q78nvgXpumkfTSK7F6Zd/i8gdhbPXcAm+rQn8GkGYABlRv8UcEww4DjzCyyxfALcsf4XwVCLQL8wswijzhEyJ+hX1Cmr/yvgoO/kQ7Wigz+AEdp8B9cmgEYYLkTuQrYLhjqw+5eZFve/I715cBWBcL9Btjb9SGXHuT28WvgzQXCXQfsUGqvCjP7EPC9YJhrgNeofQwuFQADzsx2A6JT5U+TDg+5t0BKmNkGwF+AZQqE+7y7f6VAHBkwZvY54mtlACYD27r77QVizX4b4e9A9Ejs3d39ogIpSUvpEcCAyx3Ab4JhliK+J/oLckd5WKFwXzazEnsMyADJn5kSgz+k8yqKDP7ZD4gP/r/R4C8qAATSe8TRA372NLP/UyIZAHc/jXKn/Z1gZnsViiUdlz8rpQ6Y+n7+LBeR29iewTCzKLuPh7SUHgEIUGw3vieBV5XaUCTvb/5nYJsC4Z4Gxrj7XwrEko4ys22Bi4l/wwb4K7BjiXMz4IVdPG8ClguGKrYLobSbCgABwMzWAm4lfjzvOe4+vkBKAJjZaFJHumyBcI+QOuQ7C8SSjsmftT8DowqEewrYpuRnzczOBsYFw0wFNnL3+wqkJC2nRwAC/P/27jxaz6q64/j3JwEBKYqCTEGgCg4s1DJFERRFiWIMoCwigyzEiCBatM4WBecBLTigVmikTBFqAZUhYGVUFAhUoWESC0gAIQzGIgRNsvvHPvfm5iaX3GGf53mH/VnrXZe/9jnkHc5+nnOevaH8IHwzINRekmYExAGg/IC+KyjchsAcSesHxUs9onwm5hCz+AO8K3jxn8HEF3+Ab+binwbkHYA0SNK6eLvgzSYYagG+FfDQxGflJH0TeH9QuGvwE9CPB8VLXUzS2viTMFOCQn7LzP4xKNZAcnIzEyvdDXAP3u73zxOfVeoFeQcgDSo/DBGn7zcg5m7CUB8GrguKNQU4q9R3T32sfAbOIm7xv47YRj/g36WIolbvzsU/DZUJQFqOmV1MTK3y/SVND4gDQOmbPgM/aBhhGl5JLfW37+GfhQh/AmaUz2qI8h3aPyDUrPLdTmlQbgGkFZT+4vOATScY6j68QFDUoo2kvYFzo+IBx5pZNg/qQ5KOIbah1T5mdl5UMEnPwr+Hm0ww1L3493DhxGeVekneAUgrKD8UhwWE2oSY2v6Dyg/s8YEhj5U00Z4IqcuU9/zYwJDHRy7+xdeZ+OIPcFgu/mll8g5AGlFQbQCAPczsZwFxgMFOhpcCu0TFBL4FHJV10Xtbqe//DeIOlIK3+H1dZFMdSW8ALgkIlc/8pxFlApBGFHgLcj5eC/3Bic/KSVoPuALYNiomfhjs4Mg93NQ5JK0BnIqfJYlyE/AaM3s0KqCk5+K9MCZPMFT4FlzqLbkFkEZUfjgODwg1GThb0qSAWACUH9ypwJ1RMfGF4QJJEVXgUgcp7+kFxC7+dwJTgxf/ScDZTHzxBzg8F//0VDIBSE/JzH6K90OfqNcAXwuIM6iUHN4Dr/AX5fXAZaUPfOoB5b28DH9vozyAb22FlL0e4mv4d2WiTi/f3ZRGlFsAaZUkPRvfCtgoINxBZnZGQJxBkl6O12+PKBc84Hf4D/xdgTFTwyRtge+lbxUYdiHeV+I3gTGRdCAxyfYf8Vv/jwTESj0s7wCkVSo/JBFbAQAnlQU7TPkhno7XOY+yFXC1pJcGxkwNKu/d1cQu/ouA6RUW/5cT11L78Fz802hkApBGxcx+DMwOCLUWcE65qxDGzK4E9gMWB4bdGLhC0q6BMVMDynt2Bf4eRlkM7Fc+a2HKd+Ec/LsxUbPLdzWlVcoEII3F+4GIk/xbArMlhX7+yp7nTCByX+tZwCWRDY5SXeW9uoSJt80dyoCZ0fvq5TswG/9OTNSDxD7emHpcJgBp1MzsYeCIoHB7AF8IijXIzP6d+FrsawI/lHRSaRyTOpCktSWdBPyQibe1Hu7D5bMV7Qv4dyHCEeU7mtKo5CHANGaSzsJvt0d4m5mdExRrkKQvAp+IjgvcCuwfvQecJqbsoc8GXlQh/JfM7JPRQSW9FfjPoHBnm1nepUpjkglAGrPyWNU8YjqUPQbsZGa3BMRajqTvE9PdcLgngY8D38jKge0qlf2OAr4MPL3CECeZWURZ7OVIejFwLRBRc2IBfup/QUCs1EcyAUjjIul1+D5rREvd24Edo1uVlv3V04npprYyFwKH5A9vO0oiegqwZ6UhZuOPrS6NDCppXbxt8NYB4Zbgj6teGhAr9Zk8A5DGpfzgRO21bw2cVq7mwpQf7gOB4yLjDrEncGOp254aVP7Nb6Te4n8ccGCFxV/AacQs/uBnE3LxT+OSCUAaNzM7Af8xizAdODoo1iBzHwXei18tRdsIuFjSV0uTolSRpNUlfRW4mJjCVMMtAd5rZh+ttL1zNP5Zj3Ba+Q6mNC65BZAmRNKawFXADgHhDL+lfmpArBVImoafEH9GjfjAXHz+8yrF72uStsFv+Ud81lbmL8Dbzez8GsElHYzPP+JO11xgVzOLLH6V+kwmAGnCJE3Gu5c9NyDcEuAAMzs7INYKJG0PnE+dq0fw+c8CjqlQJ74vSdoY+AxwKDFnTlbmj8A0M7u+RnBJ+wFnEjP/B/HumvMDYqU+lglAClEqr/0ciLgNvhjYt1ZFM0mbAxcBL64Rv/gL8HXgODN7rOI4Pat08PsI8CHq3bUBuAV4k5ndXSO4pL2AHwER3TD/BuxuZlcFxEp9Ls8ApBDlB+mooHCT8PbBU4PiLaf80O+MNxCq5RnAp4E7JL1HUq0r154jaTVJ7wHuwP8Nay7+lwM7V1z8p+LtfaNaYR+Vi3+KkncAUqhSiW1mULgngDeb2WVB8ZYjaQ38dv2BNeIPcyvwMTP7SQNjdS1J04GvUKegz3BnAIea2V9rBJf0WuACYmr8A5xsZjXqWqQ+lQlAClUW1cuBVwaF/Av+nPPVQfGWUx7L+jwQXultBFfij25d19B4XUHSjsDXgFc3NOQXgaNrFXKStDNeJyPq7sWv8BbEVZKV1J8yAUjhyqGtucAmQSH/jO97zg2KtwJJM4HvEner9qkYcC7wPeDn0c+ad4tSqGl3vNX0PsScjl+VxXjN/JNrDSBpB/w8zLpBIe8DdshDpSlaJgCpCkmvwO8ERJVnfQR4nZn9NijeCiTtRGyRltH4A/AD4BQzu6vBcVsjaQvgEOCdwPMaHPp24B1mdm2tASS9DLgUiGp3/SR+5f/roHgpDcoEIFUj6VDg3wJDLgBeU6NvwIDS7e8rwJE0c0U6wPCrxlnAub32fHepF7EP/ijf7jT/b3sifgbj8VqDlPr+VxDTI2PAu8xsVmC8lAZlApCqkvRtfDGNcj/wajO7IzDmCkqp2R8Am9YcZwSP4s+MzzKzG1oYP4yk7fBF/wBgvRamcC/wTjP7Wc1BJL0AP9+xcWDYE83sfYHxUlpOJgCpKkmT8CvbyMNd9+BV0Ko8ujVA0nr4lWOtZkKj8Ru8Kc0vgOvN7MkW57JKkp4ObA/sgv+7vbzF6cwGjjSzR2sOUupKXAVsFhj2Svzcy+LAmCktJxOAVF3p2vYr4PmBYf8XPxNQNQkAkDQD+A5x+7rj9SRecfGX5XV1250Iy3u7M/Cq8tqeOm15x+IRvJ7/WbUHKov/pcDfB4b9PfDKtt/b1PsyAUiNkLQZvj+6ZWDYB4C9mzggJWkT/DzDG2uPNUa/oyQD5e8tFR9tE1498VUsW/S3qjHWBMzB983vqz1QOeh6HrBhYNg78XMu9wTGTGmlMgFIjSlXS1cAmweGXYTv8f4wMOaIJB2BP6++dhPjjcNjeGL0MPDQKP4CrA88ZxR/NwTWaej/Y6wex+srfLeJwSS9HT8jsmZg2Lvxxb/6Xa2UIBOA1DBJW+JJQOR+qQHHmtlnA2OOSNJW+Gn9XZoYL63SL/CKfr9rYjBJnwaOJfZJhnvwxf/OwJgpPaVMAFLjJD0frxEwOTj0mfhC0MhBOUlvAT4HvKyJ8dIKfgt8ysx+2sRg5YDjLPyJhkjz8Wf9fx8cN6WnlAlAakW5ir6cuGqBA67GzwU0coCq7Ivvh7erfWETYyZuA44Bzq513mG4ctjxPPzsQ6T78MW/kbsXKQ2VCUBqjaQX4knARsGh78J7u88Ljjui0u3vYHxhijzjkJa5G0+0TjWzJU0NKmkb4Hxgi+DQf8QX/9uC46Y0KpkApFaV6mmXEXuSGrx/wAwzmxMc9ymVZkjvBv6Z2KIw/ex+4AvASU03w5H0RuAs4ur6D3gAeG3NqpYprUomAKl15QrrMmJLqAIswfunnxgcd5UkrQW8D/gYfoI+jd3DeFnmb5vZE00PLulI4BvAasGhF+CLf2N3qFJamUwAUkeQtC1eUGX9CuG/DXygydvGAyStC/wT8AHgmU2P36UWAicA/2Jmf2568LKdcwKewEV7CC9gdVOF2CmNSSYAqWNU6KQ21BzggNplYUdS7gjsDbwD2IP4q8putxi4BDgdOK+NK34YLP98JnUKPlXvaJnSWGQCkDpKaR7zX9RpHHM/cJiZnV8h9qhJ2hCvk/8OYLs259IB5uKL/mwze7DNiUiaBnyfOmc3HgVe3+3NnVJvyQQgdRxJO+BJQK1b5qfiZwP+VCn+qEl6CZ4IHEhscaROdjdwBnCamd3a9mQkPQvf6z+40hAL8cV/bqX4KY1LJgCpI5Uk4CfUO0l/H/BuM7uwUvwxKfUEdsOTgbcRf+q8bQuB/wBOA65q6vn9VZG0J3AS8fUoBtwPTM/FP3WiTABSx5K0KXAusGPFYU7BDwgurDjGmJTzAnvizXZ2wrcJ1mp1UmP3OHADcA1eqneOmS1qd0rLSHomftDvkIrDXAfsY2b3VhwjpXHLBCB1NElr4ldoB1Uc5l78bsBFFccYN0mTgG2BKXhCMAV4EfC0Nuc1xFLgFuBafMG/BvifTu1lL+lN+Gdq04rDnI5/pjom6UlpuEwAUleQ9BHgy9Rd9GYBH2zj0bOxKo8X7sCyhGAn6t3GHu4+ll/s55rZ/zU09riVf7PjgUMrDrMU+LiZHVdxjJRCZAKQuka5cptN3efp5wMzzeziimNUURa4Z4/xBf542qhf3ZAgDSdpKnAy8Q2ohloI7N+pd5JSGi4TgNRVSv+AH1O/8c7JwIe6cbFLy5Sk6OvAzMpD3QbslXX9UzfplD3ElEal/MBOAWpfZc0E5kk6TNLqlcdKwSStLukwYB71F/+LgCm5+KdukwlA6jrlxP40oPY+62TgX4HbJR1aDuOlDiZpkqRDgdvx967mLX/wz+C0TnqKJKXRyi2A1NUkHYjfrl+zgeF+D3wOOL2NvgJpZKV+/0HAp4DnNzDkIvysyBkNjJVSFZkApK4naUe8XkDNx7qGuh34LF6+dmlDY6aVkPQ0vKzyp4GtGxr2Xvz5/usaGi+lKjIBSD1B0sbAOcArGhz2VuAzwNmZCDSrLPz7AcfgNRGa8mvgrWZ2f4NjplRFngFIPaH8IO+G13RvajF+Ef5Y4o2S9i3lfFNFcvsCN+L/9k0t/kvxz9ZuufinXpF3AFLPkfQK/FzANg0PfSN+RfrjTql13ytKcrUXfsflpQ0PPw/f7/91w+OmVFUmAKknSVoD+ATwSWCNhoe/G+8pf7qZ3dzw2D2ldEs8CDgA2Lzh4f8KfBH4kpn9teGxU6ouE4DU08oCcjLwypam8N8s63eft45HoZzn2B9f+P+hpWn8Cr/qzwQu9axMAFLPKwfGjsSv5tZpaRpLgZ/jycC53VA7v0mS/g7YB1/0d6e980mP4XeNTsyDnanXZQKQ+oak5wHfA97U8lQeB36CJwMXd2rXvNpKYaWp+KI/HVi73RlxEXC4mf2h5Xmk1IhMAFLfKcWDTgDWb3suwALgLDwZuLbXDw+Ww3w74Yv+DGCDdmcEwEPAB7KoT+o3mQCkviRpAzwJOKDtuQzxMHAlcHl53dTtCUFZ8LfFH9HcDXg18JwWpzTcmfjiv6DtiaTUtEwAUl+TtCe+LbBZ23NZiaEJwTXAPDN7rNUZrYKkdfDHL6fQmQv+gHvw2/0Xtj2RlNqSCUDqe+UA2jH4QcEmegqMlwF3AjeV143l7x1NnyMo+/cvwK/uX1r+bgtsCXRyQaRFwInAZ/IgZup3mQCkVEiajCcC7wRWa3k6Y7EEeACYj9epH3jNB+7HT7YvAp4Y8nfgv8GTnrXKa80hf9cBNsY76m065DUZ2JDu+zf6Ab7wz297Mil1gkwAUhpG0tbA54F96eyr2bRqBvwIONrMbm97Mil1kkwAUhqBpO3w2gFT255LGpeLgU+a2Q1tTySlTpQJQEqrIGlX4KPAm8k7Ap3OgAuAr5rZVW1PJqVOlglASqMk6YXAB4GD8X3y1DmeAE4Fjjez29qeTErdIBOAlMZI0vrAEfhTAxu2PJ1+9wB+qv+7ZvZQ25NJqZtkApDSOEl6Ol7R7r3Adi1Pp9/cAHwH77j4ZNuTSakbZQKQUgBJ2wKH4AnBc9udTc96EC+ZfIqZ3dT2ZFLqdpkApBSoFMjZE08GpgGrtzqh7vc34HzgFODCfm2clFINmQCkVEk5K7A/sDdeEndSuzPqGovxEsjnAbNzbz+lOjIBSKkBkp4JvBF4C96O+NntzqjjPIK34/0pMMfMFrY8n5R6XiYAKTVM0mrAq1iWDLyE/qsvYMDNLFv0f2lmS9qdUkr9JROAlFom6Tl4QrArsAuwPb13duBvwPXAL4Cr8AX/4XanlFJ/ywQgpQ4jaW28ne4uwI54e90tgKe1OK2xWArcBcwDrsMX/WvM7PE2J5VSWl4mACl1AUlrAS/Gtwu2GfJ3c9o7XLgYuBtf6G8e8vcWM3uipTmllEYpE4CUupgkARvgbXtX9lqP5dv9Dn/BsvbAw1+LgEfxlsIrey2w/AFJqWv9P2vv8MvsnyoIAAAAAElFTkSuQmCC",
-    # WC with 7.5 l cistern
-    "wc_2": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAvpXpUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHjarZxrlly3jqz/cxRnCHw/hgO+1roz6OH3F8wqtSTb99h92rJUpVLmTm4CCEQA4Hbnv/7fdf/6179CSKO7XFqvo1bPf3nkEY1vuv/8Z+/P4PP78/u/+PXTX37ufvxD5EeJr+nzD71+vobvn39f6OtrML4rP12or69/mL/+w8hfH99/u9DXByWtSEvYXxcaXxdK8fMP4esC9rktX0dvP9/CPJ+v+/tG++e30x/3e0/a58vvf8+N3duFz0kxnhSS58+Y4mcBSb+zS8Y3nT9j6rwwpML3IVX+LGl8rYQN+bN98j+tyv2JVcKfWeXHd78ZJdXPzx0/+HUz64+vf/rzUP58893b4p8+Oa0fn/zLz3OO8/fb+f597+7u3vO5O8uVLa1fN/V9K+87XshFcnpvq/xq/C58396vwa/u8N6FybdffvJrhREiZrkhhx0s3HDe1xUWS8zxxMbXGFdM72c9tTjiSt5hoaxf4caWRtpYMKaFeRM/jT/WEt7njvdxK3Q+eAdeGQMXC3IFpz/+L3795YXulcuH4PuPvWJdUU7IMmQ5/cmrMEi4335U3gZ///r9P9k1YcHytrlzg+bn5xKzhC/fkh+lZ+jECwtfP7EW2v66AFvEZxcWExIW8BXnDzX4FmMLgX3s2Me4UCdQ4sQEoZS4WWXMKVWMQ8Tw2bynhffaWOLnx2AWhiiEUcM0Ixm2ygAb/tNyx4espJJLKbW00ssoVlPNtdRaWxX4WUstt9Jqa6230aynnnvptbfeXR/dRhwJcCyjjjb6GMOMDzWubLzbeIHZjDPNPMuss80+x7SF+6y8yqqrre7WWLbjThuc2HW33ffYdsLBlU4+5dTTTj/j2MXVbrr5lltvu/2Oaz+sFtzHrH/49fetFr6tFp+l9ML2w2q8tbXvSwTBSZHNsFjMAYs3WQCHjrKZ74GIdjKdbOZHJCpKZJVFxtlBFsOC+YRYbvhhu/+x3C92czn/R3aL35ZzMt3/heWcTPcXlvuj3f7EalvZZvnknoUUhtpUnwg/XmSx8z856aev3Q6//AwzDzvnWM297qMgIT8n8lo0hQt/u6yRyOpr8a4yei/F61WJS5U2Quv7nrRrHxYsbbu95dxs7qvoB8WWX7lM7hHcbP7Ou07q5SS7a8W51jyxt1U97wh1r7WtnD5TZqsM28/QsYmbe7d025hT7+3l5jN3IwfY6T7NsRvXubfvWe7FPdjEcNjQk1c7J66BD8k13OkrsZl77351lTh7tYMt/Lj+pDJB7U1e3d1sAQWBDxvn1oJXxpYXH30uyc0dPOTWNcJYmCs0ouzib4cbEauJFRTH/g2721y38e1pwPuKbe+wk4Hu5278yGPjbHEerQk7Hn/6JlHcXlou0TfevGKs6Y5R1k7zHmLm8vMrKoF/hbfZfLS+O7HqktG/S179U88hrfeim6MBOuxUPP1dAMOlXy/ovq/4n17Q/b7E/+0F3e9L/N9e0P3VPf/TC7p/t4l/ecFjaaUtoFo4VnBt89JaZ2pk9Xhe3GQcPcTV8PXu4xQYLdyy303MbZwshm9faxVPwZ26q2PI2aLlC7zVmjzOZjhb2u3L2bgZoijsu1LfFV+Dmttsy2baPdspCkPHneqjGvz4TtvgwOYy12cukn04Ew99NwnI7nNqKQQdsWtxAyTQpFMMkI6utnHnGuI4k3Wsy6d4UGxPa2xDLTZLX63x17JXaK3OyL3mDYVtpcKRwgFLglsdXIl1TmKC/WXvSiFtVxOCsagZzygxg0DnrBlTXT2FDqr2BOZag3BxD6QjsAYrgDFxxrZSORGyNTGEeWFzssKbtkKXsAcuWlZyK6UT/B4Ds8roeyrONomshFzC/+9rA+vAE6Aphglg1etB8aLktkcGH6a7ymdTNvCgABuWyyI9hktqCIuVlANcxXNxrnICVyCrJFtKXamyUzARO827IKhb5Jbb6vLCYeC65klGOnUYl45lhD71H761VhO8K+FIPkx7btzCcexEvwKzsRP+fK7fHaQ+2DpjNZCUu1IU7LW3r20vAMvvBlvKLG/1HXInoTluOtoyCG7JnXSDEY298BM9uNl9faIHmyPpN9/JxXPCNzDNIHcH3U1iP7Lbk8WkCxSGPSvJPYs5YawyD+m2lhlxwYFbESMHJrC51NDvtLgU93mUVs2R+qTu7PevN+7bJ4Qd4gHFIJpLHZnPPLPBQVqs4HDFibktPHq7Y0pnpFgM2cMl+svi+zMJzYyr1V0TqwP4a9xz4o+62RjHqukU8XyTCCkQLQUoEnkRPLH1cbmQZ0tnIr2YlV3G9HVz33AYkiHC7ybCfyhT+coGwAOA2s/a6+FNpZr1wb81UAjdQjqMaWKSwNoTkqGK/xz9DA52rMhbi9QrX52+KVAVcCYqQnYEPPLa7OqIp65zQlPam3CLTFBA6nA9JAi0OvJarA+HDM1BBRtBuoExPxdvBxn2qTOAU2vPNDYbi/3I/eOMCbnC5FA8PMgOBP2QNftOxwXBi8dh+uS2S8FJEoh+2da8FtSEFdzEzuySSLIkzJ3bWgVPw5k8PyXAUcCOjclsJGEIvdLWpFgI6Qpg+DZruPwPgoXjwQOScIIRcRdRt3E7ny5CwcYQa0QFaBtsrJ4TYTVyvMAMLtjJ78bi7yOVfuHUEZLAGtkh7sr3yc1P7syuEzWp/JECiX1CAUNmf5AhvBUBn7q2GHqRcR+4FHoF0glXQY5cdqzAkTaRUtwEPWpmi+7GTGkiaitMCL1qR5ln5/pHt//lK1sMk3QQ4gC+9gaw7pT8HvBVkVb8WxfHtZ9SwCangZ9bCEEsgw5xoCrqUKnhVHdApwSawpxsw32jcgIbgRttAGbVuTNvw30vmpYPbPfoU+4iTcG4Nk6BXbsb9eQOA52ekIT3kk+4IcjjZecyKeqyQgge7jpaiNCtIymRpQrG8nC7YXfuiPBD7hnrZGMRC+QyTCptIqssLpNGw01zxcuBNXJl4WLXwwBY+ITje/BxDxfKJTWPvYlbAh0qPnwi1lPirjAomCddjkhHUXYsvlRxGef3nXdIGsNj9AYCY84xWLTes8Eu0BSSbWaPbpM5PTwGSQCX2NU8ngpoCAQytAZejFvhGwF0Jzkc3Ai+CH4a+N7YGW5bGH0DroyFuEYtcWWI8Eq5ayVm1TXtSdcGk2i2J181bTbAnBpJpOxwFq/HRVYGG5NS7YA346wNq6kgli+GRtQAiYv9aWRqcBg6HtYudwXIBFQFZVVsD/DFnhgHHbwggmxBroZrDb7nIm5IAE3uRD5KcltK/eNDnuA9q9yNTWARgZSQDhmvYj5W2NgTUimRDWaeKxJxYPxoFRMOEjkFMoZDLyMuAWk4DnID8biTSgnkeryOtEPawhliAgrKjs0t9gooi4QL3lQ3fIcki2uxM75WeBuyNlk/HbbTEgCnIiAGPp+bkPcHrOhgGYsUFsRBSLpC/JkR0AusGaBn9DCONg75Eko4xQEvWwEN2DhrrTaAAUiYmySsCcSFAvn7QAgxE44KV1lJc3RkI/YHdr5wvvzP1yxRAprV6yL8RkWpGEjlFvBiNrsijQk0zAZnA4xIRzexcSWPAWsl4QNy7BtqqGtr440kSIzKL0Xm3sh7Yg49nVHW6PUiBY6DX1X9yH1C3koygNhIwXGjECKS6SiOlZBBPMkPSauofER6k/1g4NuLonCVwA/YDvgGTmyijmzE6FCiAZMymCsIiRGxPx5w4XiK9qrQCog+8oXWEqSLoVC4I/wDP4CG9RoGKIEHYG4+ejlkGQRo3JtBCMQg8g/3wzaRrFO0wZ3vsNSTDWhfBSCE+rddD+63H7QlKENuI8pPvUqOcHxcV3G9QBjAnLyYyC/EAbve2HJSbRFjU1A3oHaqwnijEtjmSoG8sDd0naWiCOQ/sF/YXcseX8AlcY6yitkAuF0mkIpyGHSzK3/xMalyi+SghZOlg1ogT5PEa4Oc9AndHlAvXtvXB6bT9nBI+DPf9POVShHhSbfThOhj2ugl9F6VVGEswAPGyueQNWFwT0ERGW0ux75CJtiUJ3lAW2CL3ZeEwMFZM4IBIsHO8COk+PEqbeFeRibBGyErnVCLsBHYWRBlQtjDGIn33g7y6VjI3DzsqfhiENsGefFGFOKR0OZGBsh8NNELoqBpxdLYtgxtAJgBUT77wCAHoUfs30f1gofwss/QmyDRdPFK0arcgYtHq1y0fQuhH0/55lUtq1jZxKna41Xso3iVB/d/DtxCbKe2Q4FXFXQ/lmzZsvRDJTuUJU2QXvElNejLgTIUWM+jZtInwkFBKFB/MWqAIx+0CHwH5nCRjeLSBtR23Gg1klSF+145hpLegus8rs9mL8M5f6X6Dq4PbBKvfGLh3Ww+Dpqadax/AF2YC8kIz9w4YvTZAMzHL3tTzvOEXz6+ugKrg2MudG70YjFkapETyBn8mVRIZha/WBUeNGDK5KddA7wsGg4IsIwBP88OTwYqJ1QXD0JFw9FXqnDBEPkRuQ7LgXk9eSM1qyWQtOGkyV/x0n2osWyIShY1xoR4rpjFItQwIfQLloL8awgiNLoPEiFqKhETgLCIUp9ORQCSOJbHXuAaW8J+cd/I5Mn+bQgUhAnD4e7kc1Af22FnqIY8DO67MS7CD/7gh4QAxLHfCDKQYS6yPV8iHHJDDoRREMZixw3amIYyT2WL1oSaqVRKiCDFSURkWoAZb0cvy03IVXCBxJ3AHCCe2EyJUPfNzqO2CYPBvkspk7hwWtdxQ6JE+LlNt43rGTpWEfQRfWUgQlJcbOxF7wGys8P62DRQt3OdjfVUP4ILPkIS4OVcC1UcIc5IM4QAKiTmqRwEBgB96B3eFE800QM0bAU2ktowjhQE0UAT4dmDMC8zIeeRzorgY2zjTCnAbeSuBDSYDl0lz6MVCvl3dVIWb3Ise6sIkM9tQfU/NA60d6sKeXr+s2LrT19jmAsIwG/dsoYKGH2xAC4VJgrTUlPxmVwJFc/BpHrhzwfVbiosgVyXV0wlOPTG20O3I2obPQnTxTs6HBrQ7Qeq1UDtR5iUTHAeOEAmZ4NUmEcuLLZYW73Eur/E2p7IZ5z/VljPK/WQ6b2oSsqNHz/b9aFaFSqc7QBvxyLbiKWKBNW+JsJvZgR3BTFBTx8H+aarZIR4gKwhB4dKL1XUacp+5CsomNIvkL7gVnwg6mc5ch66ScKGOOY9+BRCv8II+wPhOFTmxwlwX1LQq9VklKLEFhugdKKkT+431fbBMYCcDR1jg6kIZrBMfuOLV73eC5F6JWKh28grcTXcxEsDspVgqINGV2RN1B5N9VybeEsHImM/aHe0KTIUOyDdoI0gsPxv3RUJ2tyEhhuzGLn/IA/Y1sZeNxILdB0iTZbtt1U4MTK+weBXk4hmK+F7UQWoTtYgAhOJpsJU3EAzLq94WL7mWMhbAc6JCpTiDOKfJBMfDADOj8hDdqMqExtcxLGweQTBXCy1l6TCF0nUq8DBh1WR+f3YCSSSnI/sqRaI+w07aB6Kn5cFUVJJIG7AXNDuYw6AJ4EcXWXsJTcjFjceByrFBozGuXDV0siPuJT6opnXp9BU/YpYLYpIvVoFOXimTxzBWFCirKaqnIaomedTnR25oC1KwF1ENNEQ+DtY5rnQYVfsc1UkQegHbfYiVm/lXsgrwDHONKMKKCouqOKZyHp1FrhlzJiD6Id6ADIw+3RjkA4pL6XCncd9+LgPlASGw02Cmajk0VUnLZ1MwxvYmCkOuUH9tvyH931KvuXXvxfEyS1hAnfC7EpKiUAvwr9s4Cllsx6Ka5uABmpZS951bDJ6a2XBTrhLbmeHyUVGt5x6Jnx2AQr7aeqkJSkLOTlQ5FZRYVjdCfN4cy4GA28wPOIIB6owM1NBkt2Fg9aTCGcuJUfsUke+Iv8SDnlDUtvMkydB8TGBOZge8dCbMrA2C8ANRHopQUVowBPKqpyAON+QNGTmQmVnGBkfOk4pfOyTmAmeik+T/xuI0nGBoJEK2CWUFC7iF9v0ispBthyksUnQYkVJFOKUUCejRXZ2EeevLA4gKDXXpqK2SmRdhWhBEHQOgAIqF3w6LmE2pAzqu1it8qPablBPwSDrwy8hzKD2Ud3GQ2xh2eJ3BSZA4uuoXf6HL7vaVY1jBSfrbQuBgXz2+ASMmHRCkoDvWcSPAGASXoE/QrYmiMz2Y1tCiWTt2lSx92gNZAqIEpTg8gtCj9S+gA05OELwH0c5BFpG9lRpqDcgQvJTzvCuRzlZHUXaBTObQLJ/5lteMRVTQ9m6xhIIveNZF68hWurByKR/2Fbu5tAYdQkv8Z47vHiQFxZXyAvgE9oC3EhoqrnvWIF7khGxjxoXMnoEBjhWkVmPYEs74MlAIZT3hL9TdP98ZRmPh6OyIU4V4EZeW905rhUBsblVVp1qbgyV/6ScyDIVeIFz2utuAusnQg55NR7m/M5e7wTaVHrifXifWqYwJbJKkVuSlNV2UIUoFpU5SYZFkgemaxdSQn5xAcKjWi5AHlQ8jLyQTY9DnB1dlsjboPx6da5s8vKFc/IGHAzU4oNRPnU7SBUBFqoQXe2bgfCvw08ot3Bc8jrba9U2fGYCElxWdPo88vnCi2j14JGHMnehlKqQSNnqk2oIAOYpougX4BCqw8DUCjKQXS3xCka8cmtp5IXqVGtG2YlrASZD/ZdAzuRbsq8Krvl1xzw0ZkjsTtUnSI/I0UbSLOQylrfMfbpnVVSlExxQA1+hZ2pAiAxA/w4AK7icj1OSS+c+n94bIfpp2ZGc3U/tObaL4DgdVGsaZJlJ8wp49ZfHvLezR/GKp+IpZX5aeAglyKhXE+9dDnf6NLg1evBpD/q43teQRNR/LOx7WV+L0lSXY1XQ8z9bktr4M33Y/S/L0gd8LYtU8VmYOjXj01nkcl9L+lqQbkMLUln31wX92U65z1b9g50aqBOwagdpy7JjzMRy2xD2vDoJFXaEresdZD6Sb9Yg1IwmUUdwqcCOPD5q/xOITSUjfAqyuSpEhdzj1OY5qhhACS8kAdabIj9Ba3d9NHcBjKM2XjtuDFWv8WyW3f3MSUm74V/boaNhMUNtSHkZbIv0DGGRahNB8lkNiIegj+/trfkK2BGufoLGulhKVD3byCKTrBUUaF09fwJhqaCfNZsiRiK4KGUgM2EK0PXF9SW6m9BecwPApROSscqqYvcm5IvX4Ad42JI1yZRCxB/RszE1CBPVv85kDwTnMXgZWMr6h1Nt+9GUiyb5Y1nv330lvxJz/gwH32/6S4TCqDs3QHZEK9KTFA29+HAddPsgtZDrIWDkZOBAJB+uYWq6ZkgENyiihxhTX4xMxf2quj644UOCBoKVzyp0oQ8y3SyI9qoBLgAYFaaajYaynBw1ktARLQGfJpk38YoFGfBWxYmS+F9RSyGS2Um6WZtx/eMzXVkKHpPcp2OKv0KcNLyBwvYSyWpU+XNJOjPsCfUc6kgcSFAnycLLb4BKQVQH7BaF7LBFe2SGbI7aR6TEqwoc0HbaRt0rQ2YJ1CZfVJxFFU+xL9QkA7Nw5Ruu29wwzKIuvkRV1XDFFm3CC0gIh8wCTsdPoLL2o3HCT00JTptwhIWrkR8cyLtQVxNlpGLnUH3F67ILCsQmKOIRjCuqdw6BU4sfdtL61JhNZz3i3dbcxOq8SH54yQf47NziFyo+6OVJXXa2fG80G9mhEhJdo0ZEQ0K06YOU5h3K+2tWNWgo52+laU0LkC6UPA5ssBFF3rFV3HivUNi+PrJCmjgUcbRQoGqq3yDg0iFUQpwthcFCNfbz+r7EJZw+uwJEQGbRXgippZEIEmDXqKoK1iDiq7s2NTvgT4QoDDLYxqmhCUhgvovQ7usCDjJQvcAHPLcpAGV31IAKvVLYNqE15EHoxqsnw6WGR1AujSQi67cqmeS1ROo/2p+niz7FwtRWPLoRBIKK7Oxszyqrrg1deiPKFxY33qzv0FTAcK+7dwB9DR9dD90jLoBUCMKCSO184YqGhBlBrwf4EhkdsUnKfh1x/1h1dCgNSSE+C14M7CMBMKT0le+LTAtpIpYbupRXLwIYII5Js3jcq5LCXioVNwdRDK8bNus6YPwkwivGRTZ0lTXY76uYIC9ohajsnEWNmph7gaRZYO8Pe9SDADMW0lxqpX5aFw2BZDCjqbJlnVUsREUwg2+ihbOqBUXNbfIV+q588tojG1b232ONP9xSUH0If+B2THNkna2Z6qQ9hgixWxgwkhikEDLuqf7HIgscNu5WNo/kBnFDaLx4UXEfk7LZKvaxoXP2gfNe9an31vvggEdNHY0xKvqLev/ca0N94YXgcleJzTRGoN7RYXPYb6JdPRlcoN78XBIHrBpLVGxV9Y00+4hvtqqWMIEASrVX3mnjOogj2NDzhquDezjGxGmNu1GjRE3hNOT2KJCqwpjm/MJQ866dDFZjdLQR1G+r70XS2mC98Pao6XEgsAowZOoRV1Ggh6BOjFoNKmBXscsjCg7eoFiWOxpZmqp4HtHdCxifhc0JbqREaKNBcZC9hBTKi9tCd5ZM7kd5Gxh5x6flDdH6qeM6SS5HJaT5KD3BE6G5KmVxw/OokKPJA81LELOjvlIS/9trZ4AjuhCfdJ77IkUR4uvNbBSQGpFoagVge5yAKABFcdwAxVK9gF1F8i6n2UI/TfMsUunAOO5cdzFVjFVjreQ4q4g8BBRpt0EWICoJJpzYcoAPYoeOdmpAhVrUPQkZed1fT/XolEVI6s32x7jZpIIHqAtUXiGzTiSuQUiIHVhkdX0SP2iJoZbL7BvgG1j2pnHYUgJcTe03NZXID1hzaqAgqnGaVcifNQdCLjlSUwJhhOPk5Pl0OtkZs3aSDjkI55O24i8q3w+gKuHkTXWpTi5F88E6pibGAU4SCmS/DdUJ+OQ0r6kc2r5WD8IsEa6ixatlkDFlVyInAI5qoLm5HM5CVqnxiiujJ3oSQ0hyAaX48UrQaeasiS8SGlyHvCyKujH8m53LuL1Tz7ZqTOhRc/KsBkqlYDEHqRjU3hoRXSpbgKLsPxGDCxZBtvqcJmHWzGkoR1zhR0FYQaLaOEpIHNpDFjJpAcyOb2aiw7+goRo/wpgBthBUcXUkYWg6zm9EXS1H+5dyl3y/YGFB20JyNth79cmka/JeqU03AAcoUTEKQ3BKE+SHmy0mTYhNGA3UqevEAh5bd8cMCZWGOmNrwzDhTEdwqtWFf2Z4P/vv8lryagi7/y4eD4lf8g8opIJaONMHyFUuqrXJBOwZsnKJtu9TJoGMqNlojtfd5qVQp2nrQKYXiIkWyeoRAPDm1YoWk7asHr1XgeSKvS1NFhwrgL/hHtCl7tXeAbDFaFWIJeavyjf8gU3HTU+OALtK34gZMBpjcsNsRxvZCXU1cvMqZrzck/vbo1eazPn7pNt9urxchEgn9bGvKlnpGAt5Is1B8PLBy8RE2U1vRbdD6pWPavwF4K0QH1VGy3PPuGYwlWwIQ9hEgkJPblU9pKxoHSTspUmVTSqukuFqSQH457JxxaHg3gkLU+PTfyoOqsYFiHGC93TJvkdyImFFjDaNeBLfgW0XvV/vWNSGQ7JnoXXix7JGKr1mJIgGeBl4AWShMDNCPmpzATfoiEqgGWKv5uPr/KMbHdrrq/V/9GHpdf6hK0md/ykJFZXYJgxC4pAtNS95EQTP48dozXQLVlSHJiquxqoTBEJd/whTbiqjpTQVyFxXI0lLoC6hu8UoNbA9j3qWaJEixsl6J2FVCn65Jtl2St2A9HmbJrxAAkU6mPjqZf6jJdF34AR5esKTHIDMXxGR9arwGMluVpS6+QQ8F/xlUdyJkIWXLFwGdRTYcVVwQSQ8WEe5HDxE45RQKjRZUj+yDTT7JV6JCJAjEZjGphaV4VgZqQIOMfEylG0HVUn2EDgHj2WhpC5FAbs1SPMIV780MVNZ6VBBti9105SP16cs+j4G1p2wDUhkxfmtPBChmo0YjZgbDNFJpqyy5n1x5rXDXHiIfYCgmj8g5ri4sjpXAMMdDpSAeSJ7gFKk5wBhTa+LuJVca/s2KJp+fhsU4k5y+xgULYwWY7NFC7GopvG+Leo32Zo78KaRtdmKWmlFFnoGhdxuZX8oliE/XvZ3XgOBsEs0RPhpeAuHCRCcpAK1CrcRAPcaLNCcGsCCVy+NYChSH9A4IBcGC4ZdAPsz/Ao7JEhFgSGuSQwBKCqqerI8TR+BQjpdMEWVZ1LfMS+nDIECbUg0n9VmUQtrrq/htW1kyO/hNc1HnPCG13p8LfZHbqtmI46De4H/mshiz4ADr5EuRBUwUJCiHdje0KT2CT0NAxc16jRA3hsyXIfRIFzTCRohRqUkdR2ngTrg7tERndfMbKofxFVImxX5QKJD+JDNSPc6iVMjeqqrl60Sf3gzUjf+m3nFP8wvalIejmmSRa5042YGYTGMhC+NiUIzaUmNKWjGLm1NVqLZj5pP04LmvOsb/Ho4zV9vc1d9mq3R9MQ14EQV+jmmWpEaqVRRgQgcWVN+3PHViOfVP5RhIIIagprwC078TrWJXzvCaX0xSlX5RbyxBajjsyZCp7yaLUJsqSROhrKU3Naxzn4+NSs+834xStjQ2h5ereEKLllXjyqYnAtlryVDUa8S8JvQST67I7O08jUVIqEIiCD7+VClwUaEIUy8iiBNkrWMoYYnymyREgEn4Kjjnm5qmhuwDIa2QNg0zSYX5ErB7xZuW701pBRswoumaIJIhxO8Su1CibkXWwb1+4Nx1d4xeQPcEF/idpqghcz4zkKsoKkyTAOFgIcO2DOePxwko1vCNng+CUjIyXZ9zmCwHV++glmxaRh7ac5S0zxHg+6e90raxQoe8aH79U24h97lVQlsfMdyH8tBFf8dTel+EZfo9r6Vx/BMJdhPKns9mhx0OAT9aoI2zeVhSxF/MDICczq+qB4SX5AoUocp5aphKDUkENfYAuBGwKh5MatBSKMGbPFxODefk2QUsVpgyprohqbshRoCyGMqArUVDWpwslSBqninvfOX/SxcDSTr4fansljRFF3AeUf70IV6joj0/tCFmIGAginy05TcMzeYxBbg43xWVvPVC7McLA9fA+s26yKU5sEvTtNB2bBUOIbvvq6MWuqZfEDQ2zCurKJjI69lna3ozut82ka8Hn0YYk2gq2Q7WQI7mZVFVKipvBsqIFwSX54TMj+BRrApslxYLUxXjcIngXao/xCUBOMI4uygcSplFtjFa6p/ONHYR+j6zmiyLM2DIgsbcrBDjzzWU71VueKSqrAdcn2+VAHaSCmocsd2vKqQBAgUXSqL4EQdYKdSTNPkcEDUMryiksmSzsUNh9pd9kqPtqUqxOyXpoZghxs7FpX8igYx5yR9kdiG1/lM8mrU6ZpzderOWNHdjzZq3q1ImH8Ya5lgUo8fxiqzerWMRVhneIJKhLWOVyZ6XNhdnazK40OGEdOqeyxTy19zYzDhPqUpHq9vGu0llRALr+GmeV6bj9dn903sVScsnTxARGmqknSWVcwNEW09PBqbq6f6qJoGOwo798alca0fZyH+JsF/R300udnvR7akinyzj2xx8HPSW/voFnJSerqlfXQLGXuz+6QbQpnP5o84VaOGY51RZsIJmmG1ZK5pDKCJr1SD1BwdhMjtUxFrkurEO5CI9xZIU4ke4K+6MtAGJEN1kd9oYKd5Sim1nXeAjdUtmVogAYRThdYu6T7/QPyuvUtuR3C3NX0Shw5vpcyuBacTkpGsGF9zKQSNVQUdrIRZ3I1ffcScWcBsmFhZEsUwiV5TA/wRoTzU8NW3A5LEHsgX1qvFa34rQoureBz3pcbJRMIf2E87h73xGvGUV8IYiWCnv3KXbB1aramKDiZcNTa+quhZFWKTuAPaNc114dDqHgz1u0zzvQdPcLjdxx1s/MPeSuPWnzdw32Ui/HTjFV/3G+tJLhzN9WRex11rbp7IveqmafJMHEzVoaD2cBwk5vSZKZVnN20u6n9NNoRFa6NhW62DmQiKqUHT1VHUEyaPXeH7W0wicodPbug0tIPmKoXq/NDV+aG3zaCqtjkjIKJOgc3+tjm9tgSaAretK+nIDyjUhn7s6kGRg87tuQVRx/IPGT6J9xKCkL+8Nk4wZ3h1CETvgGfDvlFP8b6KYrrDTYMpJVtwmU+RFZDyI3wVWUWtVGTtX0XWwU3DViRlX2cI08f4OkNOh3hjefXEqHTd1BpaKvHf+ukKwz/UjxTbQUxoHmrJxKaTc6Hr6B//Z+gxxKsUT7jt85Qu6af8w0KyL8expchbVcJV0lf9CnIRH3uM6XHf6vub6NZZlbG7lLdOLSHjqmRM2IeYbk5H1ZdVf05Wl22RksSygwYzgMmj/f8MhnG3fWbSsk6Za+JVx700Z08kQkZFPDcMTmMnJxu0GxZJUM7O3Zo+vJyvZobUPDDQo+ZioE1J47Gvl0E+do8Yqk2nXoaIy/25kwFOY5SNsyjhFrKcagZxfDoZ4qHQuaNvXCHHqqK1H+rUA7iTNVrT1GSJOpIDvqm1pkOZACjMIECj0XzDzgSc8F3VxB0f7oPOdizdCSR2aZr0EMgBHnlHhcPq+/KUr4bioElP4/NJ0ESgAaW7u9MGkuLQp6MD5aheIq0QSzqViHMTTA2ICeqYZJIuMiNOVhUCDNinPKfGzDC/V+0E8Uew6SSqYKGB+PDxKgaO7eMTmygJzZH+1fCodz9+cDQieQn53R5h1TngrjNzKnKw4VG1UdiNiktIH52TIV2oO9ACOl57FF/BYmH0M1WJ69rDXjW/1FcsInH+jIZChxdqKp73iIxp1KlBsnCzGV0gDz8aqJ4WSfmRDK6nOSRQCi1eAVE5pC2pIGBIshZJaGPFr4EHFJ+7cDvoCyI7/XLINSAo4LZjBK8xTTh7IChex1aIir/C5febKuC77B23B/sBMchZM5BDm5nO1J+mthf0JCadL9PhnfgeOwDSKn2inSOyS0+HWPuc7TQCFmG8muqZHtqiGmh+hc1UTH0tdfjhSUFnEgxGUeTxOGfh1ipcXqSUvNbfHOV7qovOa8J0IrekEgnkiu9rRkdrkn9qAJ3ggpFpSvGSo0gN6VYdTrEO9VOj4M1hJE8KUHGkahxJk3Fr1wDJxw45imodtTqnhhT+AErub6CX5rc1tv8m4TTrdUzPQ1kBbzw16nAS6QgGq0NKsMR+9Rwd7g1FB67vL1GpmhoAsgLSQ4UlPRCjKAWSxyzoWIDptINr8sJlOtjVB+zsTT3DfMgQ4h58sMaGVZrQiFZi9xI3+fpaQ82YoYMtkF4XLv5Drp/i9xgZeC1BByaDjj9AsmtGqkc1R5ogDsjTWcbzOaUGSI7r45nViZrh/lD+Wzoc1et8FT54cF+bX7M/Gi9tOplgOjutwQjs91gdgVqAmt5I2RGDLbkXKo28CK+JNZEkS9aTPOD7GsciTamHCweD5ahDx8uhYIRlQk0U5TWdB0Q5+TddUF41vqjBcdU/m6p6T53B9Ou8abfrUVbsNtiM4x/8KqN18nJBc2tJ02KEoc6FqYCcpR3VWWnvk1tn17KmFKTSElooxf2eXaDHpGQ92ShrboQ8nT8Fm6YGSXifhuYxHRJIIb4xHqhEVxaoZUWC3HNhdeo1K3AJ46GOn1cHjAwd/0JNzXd4QVMayvi8LyMdm57dEdH4OiVNGncbwQxsabaGmNgoWhAxs6onUdJ9ild7TAiOpDtN65B3E3cIFY654ABcwgFanx2ui0SkSTQV60+VmyBXVafVzE4IKst92FkEcmHiUcmZbHDwTaQoxAQqeYkafE0PPtGU8FBz41X/+5NDj28uHaVSxY7gK6q5qBSpIqWKb/PNsb2j8y3PdyKpWtzxLAlAPVdAZTW8ygc4E1GQu9D+q0BvctB31jBmh55QC6dUfAmKVwoMc2OliJDgDpPOVerhXBoPwJulvJv4cf0Q/JTfaMxMbpIDh4aCNHW11azVQ63uVheDnDwFHAAFO2Fbczd6vAUqVnOTAREEl38tieAI4jd8lp8v6xTGCHoIjMbXXjTnicepxwUoIHLOO+EXtkAwH/VNl8YauksvnPfXQyqCZvn07IA8NQ7UTtdR4qTpFTJD7hAn4ECP9SGvQYcH/GElDfI4nOafsLw/fN0tIzdTdV09cj1FopTxqotvlIWcnbWHOPIer1eydNIf/sDahoYOYEIZIKyqtWUkt9vv4S9X7bWd+3OJbhoVOyqMETh6rAQbajqcD22Eq3GxDCeb18LXAA08w+ms/qcKnHRqUQ8+0MOtrs4qqPejgfXkhx60AKeQot56+IJwBnsQKVv4o8rokPya4yUKOHXSo4A0Ka7jBD5XTXQdDJONIFvdC6ht64gwErCL+UBh8A+nM5YADIgjtw8BvJjgLhCPsMxReTTpwNniihva2XRo3+/7aSkTWZpxYhcIWsPGIn1qCOtMBomIGLeTxBVh8eXoNG5X0ngNvBjeHGODQ6pBBfVho5Zq/sSyDhlcMug73nHDK2AMHQ0/RZDQ2EZEGmRD4aTqlG4ENPJYMknWVxc1z6oRbzARhqOjo6zCa7KqQvy8BoXfoI8o0oE5w0Bu1ZrPJ1Oa2KEFt4MSFqJ7SwfpUWxTj61IbxoKwFcz8B0JhY7j/7snPYxGJ+pwZbVl9CwRKJt7NZ80ocbz1bR0Iri9RydFJUTSMgwKBr6Eu5tdnnBT03EesPAOHZ/dftytxzoCG/CipZorbyaFFuBTpxy4hvSWKpHIfrZNz7y5rWiaeZWc8XJ2UNWJdiBaYF6GCCr4NV44NT4wJfNZHfitZyoUnR1NmgiDDSASIQ3t48VtqsuJa+hCBFFQKJNLW0imw0+f+gJ35tGfOjhPxBBApar5oGPmS+2uqIaDupCgpzORYKS/6QlcV2WYraPpQ0dNNeqikzpqfoF0h9xeCCCyJibWote4ogCXxKjaiLrFOlZ0I6slf6s+vUJ8D+fxasi8J01MzaCpboeESghwAkJP5NIDp/TkMqcT8DAbuOkHg/vVMSlccuqELXgyPtUE9VQbl2E5UApToQXKIf3MXfuqsSGtMOjgJIpe99xEoXQ6fXfB5J0aGVM95z25A6WDXiLL4PwEBR4ZoMurucSCjo5HgU77DXgaokiTNDvo082Pcc57ix7QM3NeKo+g0jW1atppnQ2ocMgqOwqjNTOmAfQQ+GdCbQyvW4PXSUDUIriWJ46qUSdARkrQNNTeV3E3aEpY2oocuWDH5D3E3kTJfE9ktjVUM4rc/6mNFSjkNMh51mf4mZRsToCic3I6ChT8sHdkD8dVKQblUbaevtn1mJFdDopPUyqSg/U9o+Qbzc51Ov8ZCGaEeNBZTnZJ53KbnmQWBSELOIs6BKxxSmUDKCjxolN8ZTR1dYr6Mw6+ClU1/wrpa0Nuuk7AYyJNV6tn9p4SUvk5QQG5WHoETFcf82mJz4BmKU5DAXqSBjGfDXWQdEZJj0wg1JpmYVcF+fd7LtDnyTlXKnEYBvw5y7n/KD2+oU9lGEuuNgiBpj/eExzg63pCbIRi6vkZn6efAG8YEGojhaXpKHUMdHD/RvQtmW6yu27oeDrBAnPTAx9wxKunKGUNKLJtn9GLoHmtDt/Xg5gsX52laFeD1xp522oEfh08QWF1yBbZFzO95xtNwbe0rFKjtlH8zyAwBcrn59XTqKCiGKnZROcDtWQGbCMKCdLaK3FIZ786mxwH7keuXCj1d+B+rk6Mj6FzSUfCS20Ocr+IddZTrx7Ss3XzeWcw3gJmSeIbybvpWVyQQejZ1EPAlmqyWVF2VUoEakXw2Tu5DCs/rPk98E/P3ALnNFin9CguUPUcEUFIk1y2/OvDbNyPp9lEGeMEHZGFhsFl1GhXFym/iGuqV2iYMO819PCXpEedDfu0eMdwOkCHjtUTc/VECEkC49bVAXkzBgCpHmUE0bm4PSRAJMPrQFLNpsNb75FX9biDs2g0KmtMTEdk3yDkW1epb13ps678WReiTkPfeb+ex8E0b2YQlY1V78w6m9qERSdIB7DpTZRl6ukjGkfQMyhYO44boUQKaz1tTFOf+T1EMDgQVfCiu5Juhx+XJyInpBWyqlGRCtOGpwl/CYulJoCag/fLzhpSi8dB4GTooXIZTFgnl0Ebxct4aUCN3v15KOR8j0aRiIX748QlqVIRAeGTvNvvROnFU9CgYA8wDROb/R3pIBt4PRn3lTGyzsayEwYZP5A3KOyEekOu8tE5yKFxmK8gSzq+UzSFXPVrGyJolfc9elBqFgKj87CxvKfZvHP1SQUC7/72OC5Uxv03EKMfLM0fEVMAAAGEaUNDUElDQyBwcm9maWxlAAB4nH2RPUjDQBzFX1OlRSsO7SDSIUN1siAq4ihVLIKF0lZo1cHk0i9oYkhSXBwF14KDH4tVBxdnXR1cBUHwA8TZwUnRRUr8X1JoEePBcT/e3XvcvQOEZo2pZs84oGqWkUkmxHxhRQy8IogoQuhHWGKmnsou5OA5vu7h4+tdnGd5n/tzDChFkwE+kXiW6YZFvE48vWnpnPeJI6wiKcTnxGMGXZD4keuyy2+cyw4LPDNi5DJzxBFisdzFcheziqESTxHHFFWjfCHvssJ5i7Naq7P2PfkLQ0VtOct1mlEksYgU0hAho44qarAQp1UjxUSG9hMe/mHHnyaXTK4qGDnmsQEVkuMH/4Pf3ZqlyQk3KZQAel9s+2MECOwCrYZtfx/bdusE8D8DV1rHv9EEZj5Jb3S02BEwuA1cXHc0eQ+43AGGnnTJkBzJT1MolYD3M/qmAhC+BfpW3d7a+zh9AHLU1dINcHAIjJYpe83j3cHu3v490+7vB1eQcpzleGeSAAAPnGlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4KPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNC40LjAtRXhpdjIiPgogPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgeG1sbnM6aXB0Y0V4dD0iaHR0cDovL2lwdGMub3JnL3N0ZC9JcHRjNHhtcEV4dC8yMDA4LTAyLTI5LyIKICAgIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIgogICAgeG1sbnM6c3RFdnQ9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZUV2ZW50IyIKICAgIHhtbG5zOnBsdXM9Imh0dHA6Ly9ucy51c2VwbHVzLm9yZy9sZGYveG1wLzEuMC8iCiAgICB4bWxuczpHSU1QPSJodHRwOi8vd3d3LmdpbXAub3JnL3htcC8iCiAgICB4bWxuczpkYz0iaHR0cDovL3B1cmwub3JnL2RjL2VsZW1lbnRzLzEuMS8iCiAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyIKICAgIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIKICAgeG1wTU06RG9jdW1lbnRJRD0iZ2ltcDpkb2NpZDpnaW1wOjg5YTZkOTFlLWExZjMtNDZhNS04MzEyLTE4NjI4YTNhZWE2NiIKICAgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDo3MGU4ZTg3ZS1kYWI4LTQ3ZGQtOTIzNS0xYThiMDk4M2RkYzUiCiAgIHhtcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD0ieG1wLmRpZDpmYTA2ZDIxYy0yNWQzLTRlZDEtYTgzMC00OTViOGZhYjQ4YWYiCiAgIEdJTVA6QVBJPSIyLjAiCiAgIEdJTVA6UGxhdGZvcm09IldpbmRvd3MiCiAgIEdJTVA6VGltZVN0YW1wPSIxNzI0ODQ3NDIwOTg2NjMyIgogICBHSU1QOlZlcnNpb249IjIuMTAuMjIiCiAgIGRjOkZvcm1hdD0iaW1hZ2UvcG5nIgogICB0aWZmOk9yaWVudGF0aW9uPSIxIgogICB4bXA6Q3JlYXRvclRvb2w9IkdJTVAgMi4xMCI+CiAgIDxpcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgPGlwdGNFeHQ6TG9jYXRpb25TaG93bj4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uU2hvd24+CiAgIDxpcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgPGlwdGNFeHQ6UmVnaXN0cnlJZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OlJlZ2lzdHJ5SWQ+CiAgIDx4bXBNTTpIaXN0b3J5PgogICAgPHJkZjpTZXE+CiAgICAgPHJkZjpsaQogICAgICBzdEV2dDphY3Rpb249InNhdmVkIgogICAgICBzdEV2dDpjaGFuZ2VkPSIvIgogICAgICBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOmRkMzk0MDU3LWY3NWUtNGJmMC05M2IwLWI2YTRlYTdhMTA1MSIKICAgICAgc3RFdnQ6c29mdHdhcmVBZ2VudD0iR2ltcCAyLjEwIChXaW5kb3dzKSIKICAgICAgc3RFdnQ6d2hlbj0iMjAyNC0wOC0yOFQxNToxNzowMCIvPgogICAgPC9yZGY6U2VxPgogICA8L3htcE1NOkhpc3Rvcnk+CiAgIDxwbHVzOkltYWdlU3VwcGxpZXI+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZVN1cHBsaWVyPgogICA8cGx1czpJbWFnZUNyZWF0b3I+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZUNyZWF0b3I+CiAgIDxwbHVzOkNvcHlyaWdodE93bmVyPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6Q29weXJpZ2h0T3duZXI+CiAgIDxwbHVzOkxpY2Vuc29yPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6TGljZW5zb3I+CiAgPC9yZGY6RGVzY3JpcHRpb24+CiA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgCjw/eHBhY2tldCBlbmQ9InciPz5GX8FWAAAABmJLR0QAXABXAG+wXt1JAAAACXBIWXMAAA3XAAAN1wFCKJt4AAAAB3RJTUUH6AgcDBEARr9K3QAAIABJREFUeNrsnXmYXEd5r9863T09o9lHu2TZli3LO3jDdvCKFxwwiyFmMfseSCA3CwmXhJubm4089waSe7Owb0kAYwy2MYaADRjjFRvjfZctyZZsyRoto1l7OXX/qJpYlrXMdFX36e75vc9znlFMTp86VaeqfvXVV99nECKArq4uUyqVctbaBEj8X2Ot7QKWACuBg4CDgYVADzDPX93+6trl30UgUc2KNscCZWAMmPB/x4Dx3f5uA54E1gJPABuMMTuAFLDGmNQYk+ZyuWqpVEpVrWI2GFWBmC19fX2mWq0yMTGRS9N0CFjtJ/pl/loOLPCTfae/ikAByPkr2cdfIeaKCKj6yXxvf8vAlL8mvTDYBmzc5VoPPGKM2VAsFsv5fN52dnayZcsWqyoWEgAiCkmS5NI0XQ4c5if9VX51vxAYAHr9pN/rJ30hRHwqwE5g1P/dAQwDG4A1wKNeEDxhrZ1QdQkJADFrcrlcvlqtLvUT/oH+WrHL3+VAn2pKiKZgCngat2Uwfa331+PGmLXW2nFVk5AAEHub9HN+0j/Qr/CPBo7dZbXfoVoSoiWwXhCsAR4A7gUeAdYZY56UdUBIAAiSJCmkaTqAM+WvAF4CnAEcByzyA4m+FSFamzHgQeAm4GbgMWCzMWarLAMSAGIOUSwWk1Kp1GWt7fOr/d8AXuYn/0Egj3PK0zciRPtYBFKcD8EkcB9wg78eNMbsSJJktFqtVlRVEgCiDeno6EjK5XKHtXbIr/Jf6yf9IdxxPB3DE2JuiIEy7gjiCG5r4AfANcaYDblcbqK/vz8dHh7WSQIJANHqLFiwwGzdurWQpuky4DeBVwBH4Uz8vfoWhJjTTALPAuuAnwJXG2Me6Ovrm9ixY4dEgASAaNlGNqZorV0NnOdX/UfiHPq6VDtCiF1IcccJHwV+CVxnjLndWjuiqpEAEK018c+z1h4DnA6cAhwPHIpM/EKI/bMJuMcLgVuAW3HxBoQEgGhW/FG+1TjHvpd7AbBcNSOEqIGdwB3Aj4EbjDH3WGtHVS1tMFeoCtqHfD6fS9N0sbX2JcA7gN8GTkPBeoQQtVPE5fI4BViMC1M8boyZwJ0oEBIAIrPeWSwmaZrOS9P0MOB1wMeAc4H5yMojhAjH4IKAHQa8FHdUeMQYszOXy5WstXIUlAAQjSZJkkKlUlmI8+r/KPAm4ACv2jX5CyFiioAcLt/HMcBJQI+1dqMxZqK7u7taLpdVSxIAot4MDQ2ZycnJgrX2DOD3gHf7TtmPAvgIIepvDViACxV+PGDL5fL6wcHBqcnJSdWQBICoF93d3WZkZGQIeDvwfpy5fzku3a4QQjRq/ujFhQ9fBSyenJzcmM/nt6Vpqi2BFlFyooXwcfuPAN4AXAQcTnMn6BkHtuKOD23F5TIf47kc5yV/Tf+7jItSJkS7j70533eL/u/0v4u4dNoDuAid8/3V1+Rj9gbcSYFLjTG3WGt3qpklAESsxjKm31p7CvB6fy1oojYs4yKJPQNsAbbjQoxu9f99i/+7FXesaGrXyxgzlSTJZLVa1eQv5lKf7rDWdu4y8U9f83COdgtwSboWeBEwgNvmG8J55C8GupvolSaBnwHfwkUUfFKtLAEgAujo6EhKpdIS4Bzgbf5v1ub+cT/Jb/er+qeBh3HZxtYATxljtlhrtSEoRAS89a8fWIY7lnckcAQumde0OBjAmeWzDvZ1H/BN4MokSR5L07SkFpQAELPv9B1pmh4EXAK8BbfXloXvhvWT/qhfxT+GixJ2D3CfMWa9MaZkjEmTJLH5fD6dmJjQal6IiPT29pqpqSlTrVYTa20CJGmaLvJC4MXAi3gux0eftyTkMxovNgPXAv9qjLmvu7t7dHR0VGOCEPtj4cKFJkmSInAc8FXfmSq+YzXqquJM9DuBp4CrgN8HTgQWGmP6jDFduVwurxYTIhsKhUIuSZKiMabXWwJWAW8Fvgg8AOzAZf3LYvwYAW4ELjTGDPT392vRKQuA2G/DGNNprT0Bd7b/bJxpr1HtNZ03fBi4C7geFwv8KWPMNmPMSJqmOvArRHMKgqRSqfRYawdwPgLH+THkFNx2QY7GbhFMeCHyaeBHKJ+ABIDY5+Tfba09HfgILntfI0P5Wtw+/k+Am3Gm/o1JkmxO01RhP4VoIbq7u834+PigtXYpzm/geFx+kBNx2wONogLcC3wBuBLnMyQyRnEAmm/yH7DWXgD8Ds7Zr1EevlPA3cC3gUuBq5IkucVa+ySw01qbqnWEaC18ZL4J4Nnu7u7HyuXyo17UP4E7uTPQICGQAEtxMQPwAmC7WkgCQDzHIuBCngvu0whP/x1+4v8BcBnwrUKhcHOaplustVU1iRBtJQZGec6Bdx3uaO4kLu5AIyyNi3luG2IT7niwkACY8yzGBfb5AC59b723Z8b9QPBj4GvA17q7u28rl8s7FMVLiLZnElhjjLkNeMiPBwWcxbGzzuPPAuAQ/7wNihwo5iyDg4PGGDMIfBjncJdSX8/cEs789gNcKOHF+Xw+19fXJ38QIeYgxWIxMcb0AWcCXwEe8YKg3mPR08D/A1bl83ktRsXcoq+vz/ijO+8F7sAdm6n3kZx7gD8BDk+SpLNYLCZqCSHmNr29vSZJkg5jzGJczJEf4czz5TqOSakXAX8DrOzp6dEiRMwdjDE9uJj+t/qVeT0n//XAP+O2FxZKcQshdmdoaMh4a8BRwB/7hUm5jtaAKi7GyMdwvgFCzInJvxt4BfBznJduvSb/SeA64F3A6iRJlDFQCLFP/Gp8CfBK3NG9rXUUASnwKC6t+RLVfuPQKjCbyb/LJ/X5b7hz/p11etQzwHeBLxhjrgM26jifEGJ/lEolgNEkSdZZa5/AnRZajEtCFHvb0PjfXYaLOvqEXxQJCYD2IkmSDmvtScAHcUf+6jH5p7i9/m8BXy0UCrdUq1Ul5RFCzAp/FHgTLtHXTj9eLcJlLIzNEtwJgRFjzBO42CRCtAeDg4MGF5bzc9TP7D+CC937AWROE0LEWqYbU8RtCXwD2Eh9tgRS3Lboa/zzhGgblgGfxEXASuvQcbbgTP5neQdDIYSIhk/8dQTwv4HHqc8pgUngh8Bx8lkS7UIXLpPeQ9THk3YT7gzvUcaYTm9tEEKIqPgTREuBP8LFDKjHCaZncc6HB3R2dmosE61LkiQdwGtwpvnYKTlTnDnu08jLXwjRAHz8kEXA+3BJfmKLgBRYi3OUXqgaFy2JN5kdBVyOi8Mdu5M8DvwFcFihUFBQHyFEI1kAvAW4DWe6jx219C7gQn9sWojWwZvhFwN/jzPRxzb7P4ALoLFStS2EyIh+4I24FOJjdRABVwCnqJrrsEBVFdSPqampAZ5L8LOMeAk2KrjAGV/CeeSuV20LIbIa6owxj+Ocm5f4K9ZWZAIcgDs1tRYXkEhIADQ3SZIUrbUvwYXTPDxih6ji0nh+zV9Pq7aFEBlTMcY8htsGWO5FQD7C7xqgwy+gho0xD6H4ABIAzY61djXwHuA3iRfsJwU24PwJ/qWvr2/z1JT6ghCiKUiNMY/gTPcrcE6CMeYYAwz6RdTGQqGwRumDRdPiHVbejQvFGyvD33TmrH8GliuZjxCiSekBfhu4n7innsaAzwCLu7u7dTRQFoCm5TS/+n9RxDrejnOG+XQul3uqWq1WVc1CiCakhNumHAeOAXqJkz+ggAtBvLNard7rwxQL0VQsBv7ST9ixlO8E8GXgeK38hRAtwnLgD4lrCZ0CrgGO9keshSwATcVrgLcDh0T8zf8EvpDL5W7Tyl8I0Qr09PSMlkqlZ3FRUI8mTgKhHG6LoWytvQM5BIpmoKurywCrgX8jXqKfKi6r31uMMb2qZSFEK+GjoJ7oV+2xAqGVgV8D5xhjulTLsgBkyvz5883OnTvn+ZX/RTjv11BSYDMuHvbVuEQ/QgjRMlhrq8aY7TgHvsP92BjqD5AA8/zfu4BtqmmRnYrK5Qq4NL/XEy/L33ZvTThMNSyEaHG6gU8Aa4ibA+ViZT6VBSBr+oB3AefiwmKGMuWV7V8mSfKwvF2FEK1MsVisVqvVx3COgYcRHhvF4E4FWNxxw82qZZHF6j8HHAncSrzc2A8Cl2jfXwjRLvgTTC8Fvks8H6lngDcZYzpUw7IAZMEQ8HrgQm8JCOVZnMPMVzs7O7dXKhVFvBJCtDxpmlpjzLO47YDVuEyCoVaATpwPwBpZAUQWHAP8nHie/9cBpxcKBYkzIUQ7ciguQ+oUcXwBHgPeruiAoqEYYwaB9wLDkSb/x4E/1tEWIUS7UiwWDfBy4CbihAqu4kKkH6LanR1aZYZxFC7m9VER6nIK+B7O83+jqlYI0Y74WGajOBP+S3CBgkJW79MZAzf29/ffowRpEgCNWP3PA14GvB+3pxVqfrrXT/4/U+2KmOTz+Zy1tts7lfbjMqstwJ3JXuqvxTh/lgFc7PZ5xphOY0w+SRKrkygiMmNeBBwOHER4uvT5wPDU1NStvb29E6VSSTU8k7FBVVAb1trDgXNwjn+hk/8ELtHPDapZEcq8efPM5ORkh7W2EyhWKpWlwEo/0c/315AXAfO9gC0BW3HbWcPAsLV2GNhsrV0PrDXGTACTuVxuqlKpSBCI0EXUOmvtl3BJ0w4KHEcL/nfOnJiYuBK3LSAkAOrGkbisf6FWlApwJ3ALLt2vELOmq6vLlEqlfJqm+fHx8R5c7PWTgd/wq6wB399ze7gSnttL3dM1Bqy31v4SuLVSqfzaGLPZGFPJ5XKVcrmcqgVEDYuoUT/23YizSoXGUDkMODNN02skACQA6sl83L7/gRFW/2Xg+8ADqlZRKxMTE0v8hH+aXwkt9YPqIDPfotqXGXa5F72vAZ611j5srb01TdOb8/n8I7IIiBqtAFuttd/x326oAJgPHJ2m6YH5fH6NvklRL84AriLce7WEi/h3ptL8ihpZCPwW8DngNpwVKYZn9f6ubcB9wOXAh4FV+obFbOno6EiAZcBlwM4I3+VDwDt1kmpmqMPWxkX+Ggj8nTHgG8CP0jTdoWoVs2AIOBt4M3AJcB5un7+H8GQrM6ET50S4Gmd6XZGmaR+wM5/Pj6RpqgBWYr9Uq1WbJMmUtbYLZ1UNTaSWx52o+gkwqRoW0ejv7zc4M9PnI6yyKrgY1mckSVJU7YqZ4D35TwP+yA9yMVZNMVNX/x/gVX5VJ8RMrQAHA5firKKhgYF+DRyby+W0xS3i4aPznY87qhc6YA4DnzPGLFLNiv3R29trcOb+i3HpoXcSL/NkrCvF+bT8CvgocKgGYTELEfAR4OEI3+EG4APGmAHVrIiGX6n/ObAuwkd6P/AK7VWJ/eEn0WXA7+HiRUw14eS/uzXgKeAzwNHGmK6BgQGFaRV7ZXBw0ADH4rZEQ7+/EW9NOFg1K6LQ2dmZ+BXYVX6AC/lAp3AJfxbNmzdPA6PYl+gs4PbZ/48XnrEyTjZCBGzBRbc8wxjT4wd5IfaIMaYA/JmfwEO/vSeAU/P5fKKa3cfiQlUwM9I0LVhrX4LzuF4e+HNPAd8zxlxfLpfLql2xl8m/I03Tk3H7/a/DHe1rlT5rcCFel+FiEuyYmpraiAt6JcQeh1mcj9UqYEXgt2eAe9M0fULfnARAFCMAzrnpLNzZ6hDuA76Sy+XWWWsVREXsaTU0z1r7MpzZ/+W4qH2ttoI2QNGLgEO89WIjzn9BiD1RwcVXOSWCmNiEO2a9VdW6Z+SgM3OmQ02GTv5TuPSV93V2dlbHxsZUs2L3lX8xTdPjgA/hjvd1tUHfOckvOCaMMVdYa3XsVezp21+fpuk9ftIeDBC9BZxPwaBqdR/1rSrYP729vcZa24vbi+0N/Ln1wF3d3d3bxsbGdFZaPI+Ojo4kTdPVwDvaZPLfleOBt1lrzzLGdKi1xQuW7WlaAh7FObuGWEdzuPgUOmUlARDG6OhoB86jdBHh2yYPAb/M5bT7Il5IqVQ6EOdn8mbctlO7cRbwTmvt8Tl1ArFn1gK/wG0HhMxtg37c1nFACYAg5gEv9n9DsMAjwH0jIyNa/YvdGQReC7wHZ2lqR6/5PHAu8KFqtXqQwgeLF0xKSbIRuAMXyS9knDTAETjnWSEBUOOsbW13JAHwDO4ol5ygxPNHKmPyfvJ/J85prp37Zj9ue+N3KpXKQF9fn44Hiv8iTdMyLqfF2ghWgCMlACQAYlkAQvdjH8f5AAjxX3R0dCTW2pNxmfaOob6nc6Yj9k1fu6f+nf7v9bZQLQVeAbx8586dPfoKxG5sx/kBlCJYABSWei/oFMD+FFKS5NM0XQocAIQ6Lj3mLQBCALBw4UKzZcuWTuDVwG+w75S8oVT8quoB3HG8bX6gnfDP7cftly4EDsc5UfXWq2vh9mffYq29HVnFxPPZgcstcSEunXWtAmARcIAxpstaq3gAEgCzXC458/+BxNn/f0wWALErw8PDeWvtScDpwJI6rfjX4OLzP+T/vRaXi2IUGDPGTFlr836g7fYi4ADc2f3VOOvXi3Fn+mPShTseeIYxZthau01fhAAwxoxYa+8JtABMz3FLrbWLtPiSAKhFAPR4ARCyXWL9SmsdCkohPAsWLDBbtmzpw3n9r67DxL8WlxntBuAXxpiHrbVje/jGp/+5fZf//Etv/ZoOynKOn6yPIN7pBINzfHyDtfZenOOXEPjV+lrgWVwQrJBtsUU4q5YEgATArJmHC/0b8gGmfuX1jKpT7LL6L+KClZxL3PPKY7j90+8DVyZJ8nCappVdJvqZfbRpWgEeLxQKa8vl8k+BV+JCEp/iB9QYznsduPTGp+B8ZCSQxTQ7gQeBgwjbilrgL7EbcgJsnAB42KtZIaZXOQuAS4jnpJT6CfQXwCeMMf/U2dn5oJ/Ia6ZcLqfd3d2bkyT5BvAx4DJcPotKhDIb3LbDa3HbDEK4D8OYKVzW1NBwqRIAEgA10x1JADyJc2wRYjrL3yG4OP/9kX52Ovvex4wxN/f19e2cnJyMkmtibGzMpmk6lcvlHgX+DvgXnFUrxu/ncD4QJxhjuvV1CE8Jtw0wKQEgAZC1BSDUB+Bp5OksphVhmg7h9tQHI/XD7bgU03+XJMmD1tqJHTt2RD/KV61WK52dnRuBrwKf9cI2hgjoAo6x1h6qr0N4yjhL05QEgARAw/G5pAf9Ci1UAGw0xkgAiF0HpVMJP1o6PVBeB3y+o6PjUR9IpW5MTk5aXKa1K4Cv4CxbMcTG0bjjh0KQJEksAdAJDBpjulSrEgAzplKp9OKcs0KcJS1uD2vYWjulWhWeRcAJkQTAjcB/JEnyq1Kp1LD00l1dXeuB7/hrMsJPHgYcnsvlNC4JqtVqFefTMhLh5wastQt7enoUdVICYMb0485mh3w0VZzzn/L+CgCMMX3AKsJ9SyywGbjKGHN9vVf+uzMxMWGTJHkU+Doug1vo8weAQ6vV6rKBgQEN1AJjzKQfP0OD+PQDS8rlsr4rCYAZ0wMMhQpZYEOED1i0CdbaA3CpcXMRvq2fAzdbazNxME3TdMoYcz/O/2B7hJ88GHjRxMSEBmoxLXI3RlhA9QBDaZqqRiUAZkwB55wUMhhV/Ac8qeoUnhgCIMWF8r3KGPNAxqu07cC3gScIdwg8GHhRtVqVABDT3/nTEQRAR4SxXAJgjgqA0A94mPCQlqJ9WIxzdgsZjErAbcD9e4ru12ArQNkY8zjOFyE01sUy4DBrrQZqsavQDV1AFYDO2QbDkgCQAChG+IDHceZaIcBFNesPFABTwC04b/zM8Xu1t0UoTwcwWK1WO/SZCGOM9eNnaNCpAvFCWEsAzCEBEPrRWNz+vwSAwBgzzwuA0L43CdxujGmK0Lm5XK6Ci+UfQ5B0Af3FYlHjk8CPnxIAEgCZCYCQlZoEgHjuY3DJpfoCf6aMC8CzrlmOlpbL5aox5mlc5LbQLYkiMCQ/ALHL+BlFAGhrSQIgCwvAuDFGAkDgV/+hAmAKl9lsvJleLJfLlXEnXkLT+haBQWutxicRUwAUVZ0SAI0WAKksACKyACjj4v432zdl/eQfagHoBIa0WhPGGNAWgARAhgIgVDVqC0DEFgAVYKsxptKE77eDcMtEERd/Q+OTsDh/l1gCQKJSAmDG5HBeyaE+AFPESZgiWp8uXIKpEKq48KhN9U15j+1RwmO3dwC9sgAI/01NRVhA5bwIEBIAs1pplQhLdGL8x6fBTOC/p1KEftuMqxnjV+/5wN+p+lWfDm3P9eW/E4H5CHNVjLFcAmAODtah+5nTg6LqWuC/p9CskHmck1yumV7MB1npJ9zCMQVs96s/ITojiMoSTeY0KwHQ/ExF+GgMzuybU3UKP/mHZjfLA/MjDIr1sAAMRBAAk7gscNo2kwVgevwM/danUEI2CYAaLQChWwCdEgAiogDoAFYQJ5VwNNI0NbgwxwMRBuutsgCIXRZQMQTAuL4pCYBGq0aDC0ChuhaxBEAROBBYlMvlmkJYdnZ2JmmaDgIH4bYBgi0ASZLIAiCQBUACoOUFgCwAAiCXy416ERBqVeoHXpym6UAzvFepVMoDx+KS+YQ6J04C27q6urRaE7G2UKeAMR9XQEgAzEoAhA7W3RIAAqBaraZeAExEsAKcaq1d0AzvZa3tAE7GbQGEkAI7kySZGBkZkQAQ0wIg9AhfjLFcAkAWgNkv+nAOW8puJqYZxoXyDTFxF4EzgAPz+Xym/bhYLCbW2gHgzAgCYAuwXuZ/4YWlwQXOCh0/ZQGQAMhENeaApSgMpXiODcDdgQIgBywHLqhUKodm+TKlUqkX+E3g8Ajf+TrgviRJtFIT03PUYuIcLR1LEk15EgCNtQDkJQDEbqwHfkW4ObIIvAo4IStnwK6uLmOtXQa8CVgS4SfXAr/u6OiQABDTc9Qy3DZqDAGg70oCYGYYY2JtASzF7WMJQT6f3wI8hNsKSAP772HAq6rV6nFZvMvExMQS4CLgxAjf+CSwxhizdnR0VAO1wFo7vYCKIgCa5NCMBMAcsgAkuHPRffPmzdMGlKBSqaS4bYAHcJn9Qr+vlwNvBg5usEAeAM4H3oFLchTKOuBRa+2EvhJRKBQS3GmXgQhz1RQw1tEhVywJgJmrzxIuuUnoIJ0DFk5MTHSrVoVnGLiV8LwAAIv8KvxtwKLu7u66C01jzDxr7bnA+4BVxIlKeD/wsD4NAVCtVgs4838xws+NG2PGh4eHZVmSAJgV24HNhGWjMsAya22vqlP4CXQY+CXxgpMcClwCvHVsbGxxvXwCenp6DNBtrT0feC9waqTJv+IFwKP6OoRfgOWBAwj3nxoBtvgFnZAAmPXHsyZQACTAIbgc50JgrR3zE96dxElSYoDVwO8Cf1StVg9MkiQ/f/78aNaAfD6fGx0d7fWWho8BZxMnxWqK84m4y4ttIfDf1ooIFoAN/hISADUJgEf9CqVWcn5wXqjqFLtYATYB3wSejTVH4/wA3gz8rzRNz9m6dWsUq1OSJB2VSuVIP/H/LnAC8RxbK8D3vBgSYlokF4EjCD8C+JQEwN4HDFF/AZBIAIg9rKjHyuXyDcDtOOtQjMk6hzObvho42Fp7I3CdMeZ2a+2s0xDncrl8tVpdlabpBcBZuGh/S4gX2bLsLSE/y+VyT1WrVX0YYpp5uPDSob5TG7wIEBIAs16ljVhrHyHcB2AhsMwY02mtnVTNinK5nCZJsilN0+/4lc4xEX9+ABcp8AjgOGvt7cAjwOPAOmPMsLV2ag8r/Vyapv24IEMrq9XqocCLgNNwzn6xHQwngCuAB6rVakVfhfDfYSFN02X+Owx13ZcFQAKgNvyRpA3ADtyRlCSgrg+y1i4FnlDNCoBCoVCempr6KXABznzfE/kRC4FXAOfijtndDdxvrd3ov+lxnHUrAbrSNO3x96z2q6/DCU/vu6/V/yPAD3O53Gat/sUu424vcDTh20zjwNPANtWqBECtjOAilC0hzCP1EJxTiwSAAGBqairN5/PDlUrlB37SfWmdHtXhV/CHAq/z/62CS0w0jnO46vf/f2a3q15sBr5rjFmr1b/YTQD04yxPIat/61f/cizdC3ICnBmTuPPJoab7Q3F53IX4L/r7+1PgWn89U8dHGd/nc/4q4hJVHcBz8dbz/n9L6jz5jwJ3AJcnSaLVmXhBt4ggAFLcltezqk4JgNpHTWMmcabKUAGwCjjMGKNwVOK/GB4etl1dXTuAbwDfIs6xwNmKgkaOBVVcDIRPG2PWV2X7Fy9kAW77KdQC8IQEgARAKBORLACdwGHW2tWDg4MKCyye+8AmJmwul3scuBT4DmGnTpqd24EvGGN+NTg4qOAsYncW4fxPegmzQkkASACEk8vlpnDBgGKszFYDx01NTalixfOXxdVqxRhzN/B14HrCQ1A3Iw8AlxpjrrXWjm3dulWhWcXuHIg7dRLqo1YC1iVJslVVKgFQM5VKpYqL3f404bHbDwWOm5iYKKhmxQuWLNZOGGNuBb7kJ8t2sgQ8DVwOXGWtHVZri32MkS8hLNZEFedPszlNU20xSQCE4VMD30X4cZIB4HBr7fKOjg7Vv9iTCNgB/Bj4KnAPcRIGZfpKwJPAZV4ArFUri72wGDgK55gaMj6W/XgtobkPlBx5pkopSYy1toCLhLY48OfGgXXW2oettVKnYk9MAA/6gWy+v1rRebSC88S+DPi8fych9sbJwMW4rdIQxoB/w2XcHFO1iiD8an0ZcA3ueIkNuLYAnzHG9Ktmxd7o7e01xph5uLC+38ed2Q/99hp5TXoLxoeBpV1dXXJ8FXulr6/PAB/BBV4L+e6qOOe/l9YrK6aYm1aAIvA3wMYIg+PtwIlJkuhIoNgnXgScCnwOtwVVbfKJP/UWjOuB1xlj5mu7S8yA5cBnI3x/O3EWp5Wq0n0jdTSbysrlSNN0Hi5E5YrQcR3YjtunUm4AsS/KSZI8a619FBeV8lBcyOBmnVR3AFcDnzLG3Gyt3V6tVuXtL/ZKZ2dnUqknx8IfAAAgAElEQVRUXoGLUnlA4M8NA/9mjLlDY6uIRk9Pj8FtA3yNOObRXwCrZRoVMyGfz+eAg4C3A/8BbGqylf8YcB3wUeB4Y0xRrSZmOK4OAv/qBW7od3gP8OIkSXTSShaAeJRKJQqFwliapofjMreFJG7J40Kx3l+tVtcBCgwg9kmaphbYYYx5BOdJ/6T/bgaIn0RoNkzgIvt9G/gm8AOc458cXMV+qVareWvtmcCbcdatEEaAm4BLrbVy/pMAqMsg3IsL63tI4M9Nx1u/HR1XETOnAmwwxtyJy/A3gtt378TlTm+URWkEF6vgP3HBi74B3EtjQxmLFmZwcNBMTEz0AR8EzsTlowhhPfAN3zfKqmEJgHow6ZXqyYGDbQ4YAn5ljFmnD1bMdvG0YMGCJycmJm4DHvXf5RTPpfjN47L8xaKMc0LcgMuNcaOf+L9QKBR+naapVlxiVpRKpQ5r7bFeABwa4SfvBT6fy+U2WWtT1fC+UTrg2njKr3y24HKn1yoCEtz57oustY8Dv1bVitmwZcsWOzQ0NL5jx44b0zS9zVo7iMuidipwih9UB3AxBKYz/U1fe3IiTP1V3eUq4fb3NwC/Am7xovUpY0y5s7OzPD4+Lic/MWvSNO3HOf4ti/BzI8AjxpjHlF5aAqDePOoHwwsCrQAdwG8CNxpjHtG+lZgtPp5+Bah0dHRMlcvlrcCt1tpOXFz143E+K4txFqfpq9dbCAzPHd8b86v8rf56FpcH41d+cB0FJpMkmapWqxVrLePjsviLGlY/SVJI03Ql8Apc9r9QngBuTZKkogSTEgD15hFclKnzCTuOZfxg/Apr7YPADapaUSulUinFbQVM+kF22Fr7mLX2h15sFna5OoE+3L5rGXd8b9z/e/oqARPGmBFr7YS1bqGvAVZEWP0vA97iRWqM7eg1wC2FQiHV9ynqq5zckaxXAvf51Vfo0ZVh4H8YYwZUu6KBq7C8MabLGKOAVKJhGGN6cCF/10QaP58E/ruOns4OOQHWrl6tXx314TJXhTpbdfm/T+K2F4SoO95RqoKO7InGcizw2zhflRiW6B/hHFLXq2pnsQBQFQStnjbijkA9Tpy0rcfj4r6vmDdvnoIDCSHakQXA2cC5ERahFpdm+ufGmHtUtbIANHr1VMLt4R+zyyq+VqbPcY9UKpUHhoaGyhMTE6poIURbUCgUkjRNzwXeDRxOeMyKKi7s9OU466kQDbUCdODiAdxFnCQtFVyI4FOUKEgI0S4MDAwYXIKef/ULp9Cxsgo8A7zVGNOlGpYFIAsrQNUYMwEswZ257g3VFLiwrr3W2ttwma2EEKJlGRoaMtu2bZsHvB8X8ncows9OAt8DrsDFqBAiEytAATgJF4M6RlKV6XzW7zPGDKmGhRAtPkZ2AJfggkjFsJSmftK/yKfLFiIbBgcHjT/W8je4KIExRMCUFxRnJ0mioy1CiFZeIJ2I26sfizQ+jgD/Rng+FiHC6ejoSHBHWn5IvPSqE/4jP0E1LIRoNTo7Ow2wAvhnXOj0WGPjo8CrjDHdquXakQ9AJKrVqjXGbMFFtTqCcF+A6fY52FsD1uJCswohREtQqVTmA78FvA8XijrG8eYdwE+ArwDbVcsSAE3zvftrmRcBoXEWDFD0CnoMF35YuQKEEE2P3xY9B/gDnPd/jPnG4qKvfsYY8yBx4q8IEe2jLwDv8ZN1SjyT153AB2TyEkK0wDhYxCX5+QnOghlrHNwI/G+gr6+vT8HSRFOyAvifuCN8sURABbgeeK0xpmv+/Pn6+IUQTYfPk3IecCXOjynW5F8CvgkcWSgUFMVWNCfFYjHB5WK/DHdWNVYHGAeuBV6uwBdCiGajs7MzAU4HvuEXQDbidT3wen+qQIjmxZ9NfTVwPy6taqxOMIo7aXCezr8KIZoFfxLqBJxz3taIY16KS/Lzh8CgajoecgKsH2VgG84R8DhcjP8o/QxYDiwENhpjnvHPEkKITMjn87lyuXw08EHgNbiEP7GYwpn+v4GLsyJEa3QKYBVwKe7oSkxz2BTwbVkChBBZ4qP8nQT8E7Ap8jhXBq4Dzta+v2jFztEJvBy4kbhbAdOd41vABcaYXtW2EKKReF+k04Av4M7kxxzfKsAa4G3GmAHVdny0BVBnrLUVY8xGYAAXtnJ+TH0BrMZtB2wzxjztLQNCCFH3yd9a+xvAh3HBfmIvQob9AudbwGbVuGhJurq6DC440GdxMaxt5KuES7LxPmDAO+MIIUR0ent7jV/5vwb4T1xwspgxT6z/zR8DR+VyubxqXbQ03h/gLNzZ2NidZdon4B7gz4BFEgFCiNj4Y369wLuBG4iX3Gf369e4mCfyb6oj2gJoEGmaTucKGMfFxD64Dm05HzgImF+tVp/I5/Pb0zS1qn0hRCiFQiFXKpUOxnn6vxN4MVCPeCT3A583xlzT2dm5s1JRtF8JgPagbIzZ5FXzcmApcZJjTJPgzsmuBJakaTppjHkW+QUIIUIGliTprFarpwEfAN6A8z2qR0Ceh4CvAZctWLDg2ZGRES1gJADaignvrDfhJ+r5hCcN2hWDM9EdCSzxnXQ7LiaBEELMlkXW2lfgzP6vAxZFXrhM8wTwH7jz/k+Oj4+r5iUA2pJx4EmcL8ChQH9kEQCQx8UgOBxnphsxxozgHAaFEGLfKwnn6HcYcBHwO8CZQGcdHmWBp4GvewGwRrUvAdDujAGPAfNw+/b9dVLVQ7i9ukO8JWA0SZJJa221Ae+Y+M4thGiVSSGXy1trF+DymbwPeK9fqNRjvkh57rjfl4GH1QJiTuAjWy3GpbdcR31OB0zH0p70guPTwInGmH5/MqGeHOwHDWUuFKLJ6ejoSHxAsaOBvwbuxW1VVus4Lg0DXwKOyufzOrkk5qQIOAj4B5wZzNbxqgDPArcDHweOSJIk193dXY8JOsH5IQghmpj+/n7jz9ovAz4E/BwXeCd25NLdr624GP/HKsOfmLPMmzfP+Mnyn7wittRfCKwFrgLeDxzQBNVgdrmEEI1jEc6z/z9wXvhTDRiDdgDfAU7W5J8d8gFoAsrlMj09PcOlUukZnJPNKurjbLPr6nwAZ6Jfjdvfmw+MFwqFbYodIMScYCVwIfB24GKck9/SBswLo7gEP/+SJMmtaZrqoL8EwNymVCqRz+c3p2m6wbfLEqCvzivivFf/R+O8fQ9M03QhgDFmJ0ozLERbkSRJ3lp7OHC+n/Tf5P99MC7VeL3ZBPwA+HKSJNdr8pcAEJ40TW1PT88zpVLpYb9Kn48L7FPvdsrjnBGPB070q4Bu/9/TXC43aa1N1UJCtB75fD6Xpul84DBr7QW4s/zv8RP/AdQnoM/uWNy24xW4zIG/0JgiASD2YAkYGhraPjExcTfuzP4S3FG+RiTEMN7qcAzOHHgk0GOtzQF5Y0ySJElFHVeI5p/0rbX9wOI0TY8EzsMd5/sALn3vggaO/yXgceCrwBdxoX5FEyCHqyalq6vLTE5O9lprz8UF4XgpLqBPo9rM4rYASrgogncC1wM3AuuNMePGmLIxplqtVmXGEyJDisViUi6X89baAtBprV3ox4xzgJNxHv4dDVrt7zqGTOLO9n8a+HGxWHx2ampKCwgJADGjBjKmx1p7nFfur8WF+W10u03HERjFee8+BNyNiyswAjxtjHkgl8uN5fN5Ozk5qQ4uRH1IgHTevHmmVColaZomQJKmaT/OefjFuG28E3H+Pb24YGNZWHtHcWnKP2WMub2jo2O7Jn8JADF7EdBprT0CuAR4G/GTCM2WEu6oUM5bJSaAzwE/AR40xmyw1ioBkRD14VBcMrE8bpvuKJxH/yLc6Z5Bf2U5RjyLc/b7gjHmLmvtmJpNAkDUSKFQSMrl8qHA63HHdo6geXw4ysB64Bmcl+9mYIsfBDbveuVyua3aMhBiP8v8JMmlaToILPTXIty+/fT/fY5fCJRwfjuN3B7cH2twZ/y/lcvl7q5Wq1W1qASAiMMS3FbAxcCpQE+TlnPEi4DpaxiX/2AMF1p0zAuEJ7x4WI8zGTaCBX5AXeQHTwUiEVmMvYn/9vZ0dfrV/Pw9XI04GVQLUzhfoSuAK4FH1cwSACI+84CXAb+Fc/Q5GCi2wXvtGilsb0z7I+z0q5/Ef8cpbitieo8x768cz+Uj6NjlOdP3Tp+umMRlaVS2RNGosTfn++301en/drTYu1Rw2U1vB75jjPmptXaLmlgCQNSJfD6fq1Qqi3BbAq8DXoQ7LqijnfHEiBAaj/ctxkdwXv7fA76ZJMlTaZoqgJg+OFFv/NGfjjRNjwLe6MXAMm8hUNsKIerFFC552XXAV40x9+Tz+bFyuSwv/xZCq8UWplqtWmttJUmSLdbau4F7cGbE5TgzotJrCiGiDju4rbbrgX8EvpokyRpr7bhyiEgAiAzwkfnGjDEbcFG2HsZ5Cs9HDm5CiDiUgQeAzwBfNsbcCmyx1srLXwJANEkH3YzzrH8Y2ICL6b9AbS2EqJEUZ+6/HPgS8P1isfhopVKZVNVIAIjmYwIXe/sx3PngZbiIYHlVjRBilhhgHfD3SZJca63dXq1WZe6XABDNTJIko9baUdwxnS5cxj+JACHETNmOO89/J/D9JEm2KRlY+6DJoI1J0zQF7uK5YDynqFaEEPthJy5w14gfP37iRcAIOh4rASBaiiouSMdKtbcQYgY8CXwKl/DrKVwCsAqQVqtVrf7bCJ0VnxssxPkE9KgqhBD7YQw4BudEXOW56JqizdA58bnBxzT5CyFmSDfwIdypIk3+sgCIFmYpLjtXV8BvWH0rQswpxnHbhptVFe2LTgG0P38LnBb4G/8G/Ay3HzjixUCXvh8hmo5R3JG9p3CZQ2ulgPMZ+pGqVBYA0ZoM4vbxQlb/txpjzrHWFoBDgMP8dQguvsACXMTBflysgQ5VuxANYQzYusv1LLARFwjsCdzWX4j4H8WFFR9RVbcn8gpvb95FuOn/d6y1E8DE0NDQ3aVS6e40TZmYmOiy1i4HjgYOBw7yg8V83B5ip7/m+TLk/e8l/r8LIZ5PinO6q+zyd9erituXn8R55q/HHc97xF9PFIvFrUmS2Hw+z86dOzfiUvTWutDrAd4B/LOaRhYA0Xpt+7BfrdfKpcAle/ofFi5caLZv326q1WoOyFlrEyCx1vYBB3gLwUr/9yAvCqbPFy8CXuqFgb5BIRxTvo9s9xP89t2uHX6V/zjwoDFmO1AxxlSTJKl2dHSk4+Pju5/T/zZwcUCZHgSOUtMI0Vq83K+4a73KgeJhf5wN/AVwm1/dWF265tA1Dry5AePAERH618s0nLYnOgbYvvxO4P3fxJkX68UNOH+Bk5EzoZh7dPk+9rd1HocfAi7LeCwRQjSQAyOo/pPqWL5e4HtaBerShfV9obeO/e3UCNbAZRpWhWgN/iaww99Sx7KtAu7XoK9L1/Ou+33fqBe3B5bvLzSsCtH8dACbAjv7W+tUthNwx5U04OvS9cJrq+8j9eAdgWXbiE6NCdH0vCWwoz9Dfc7yHxZBmOjS1e7XJurjfFuM0P/eoOG1vZCiaz9CHXY+B5Qil2kZ8GPc8b9GUcJlM3sSlwr5WX8N4/wjhNjTeDgflzxrIS7I1QrgxTQuwNUi31dO86vuWEwBnwc+ETi2fFufiRDNyYsCFX6J+M4+g8C9DVg5jQDXAB8HzkTBhkQ8Ov039XH/jY004Hu+1/edmCzHOfSFlEsxAYRoUj4X2LkvjVyeecBNdR4obwPeiws0JEQj6Pbf3G11/rZv8n0oJt8KLJOiAgrRhPTjYneHdO7TIpbHAFfXaWAsAZ8BjlOzi4w5zn+LpTp961cTN1rm6YRb2pRaXIgm4yOBHfvOyOX5UJ0GxGtx0c2EaCaO8N9mPb752IF47gwsz4fU3EI0Fw8Gdup3RyzLQbiY5jEHwfWExTQXohFc7L/VmN/+TuDgiGV8N+H+CUKIJuGcwA69hbhOc7FXQl8n/l6oEPVinv9mY/aBnxBvK6ATdyImpDxnqJmFaA4uD+zMfxexLO+POOhVcTnNhWhFPua/4Vj94YMRy/ZJmsthWAhRAwsJO9pTweUOiMEKXMrSGIPdDuBCNa9ocS6M2Cd24rbXYvXVkHwhJWBIzStEtnwgcFD5bsSyXBNpoNsCHK2mFW3C0f6bjtE3fhyxXKGWw3eraYXIlh8HduJzIpXjNyINcGO47GVCtBOn+m87Rh85PVKZzgosxzVqViGyY4gw8//9EctyZYSBrQy8Us0q2pRXEh6Jbzo2QCzuCSjHFC7+iBAiA94TOJDEcrA7CkgjDGzvUJOKNucdEfpJChwTqTx/HFiWt6tJhciGHwR23kMileOrEQa1z6o5xRzhsxH6y9cileXgwHJcpeYUovEMEBZ+9I5I5VhBeBjUtUCvmlTMEXr9Nx+6XRbr9E5IToMJ9d3WJVEVtCyvAQoB918WqRx/GFgOcLEDdqpJxRxhp//mQ8j7vheDkLGgE3iVmlSIxvK9wBXEyghl6CM8AdHn1ZRijvL5wL4z6vtgKAcGluM7akohGkcfMBnQYX8ZqRzvIjyz2ICaU8xRBnwfCOlD74tUllsDyjCO0nG3JNoCaE1eBRQD7o9l/n9r4P2fBbarOcUcZTvhzq/vjFSWkDGhCx3fFaJhfDdw1RAjnOhSwuKcT/rfEGIus5Qwa16s0zwrCDvK+y01pRD1pxtncqu1o94WqRx/gPb+hYhBqC/AX0Qqx82E+SN0qSmFqC9vDBws/ihSOe4gLMvfKjWlEOD7Qog1bRNxUgX/fuDY8jo1pRD15TLCIojFODt8ROBA8VM1oxDP4yeBfepPgZ7AMhxA2DbA19WMQtSPLsKO3d0SqRx/SXN4LgvRLrwrsE9N4LLzhYqAmwhL4V1UUwpRH14fOEjEChyyhrAEIjr6J8Tz6SU8W+AaXF6OEP5bYBleraYUoj58gzDz/4oIZQhN+3uFmlGI6P17+npLYBmWE7YN8DU1oxDxKRAWNOTmSOX4p8AB6mI1pRB75BURBMAPI5TjFwHP3wrk1JRCxCV05f37kcrxJGF7hJ1qSiH2SA5YF9jPx3DOfCH8XmAZTlJTtgaKBNg6nB1wrwUuj1CG4wIHl+/igp4IIV5IlfBjuvNwDoUhq/DLcdsAWYxVQog98COyj/3/icCVwXlqRiH2y+OB/ewxYFlgGUJyA3xfTShEPPK4FKK1dsi/i1SOkLzhT6O9QSFmwnmEOeKlhKcb/lvCtvrU14WIxKmBK4ILIpRhceCg9H/VjELMiB7C02w/QlhMgPORH0DbIx+A1uDsgHvLwI0RynAhYeFGr1YzCjEjRoG1gb9xILAo4P6bgFJGY5ZoEHlVQUtwVsC9v8R5BofyqoB7R4CfqxkzJYez4izb7QLYuNu1CeeQJrLjp8DRAfcXcVk/H6/x/nHclt8ZAQLg79WMQoSLtJD9/7+KUIZiYBm+rWZsKAWcCfdfcEmbNgKVWbRXxd9zh/+N8/1visZxNmFbbtP5AUL4X8gPQIhMOSVwEHhZhDJcEFiGd6gZ604v8AZcQpbthAeU2f3a7n/7Df5Zov6EhgZ+IHASPhv5AQiRKX8S0AEniRN4558JS/27UM1YFxJc6NdrfFvbBl2T/plvQX5E9eT2CO0UchywiEsyVOvz/1hNKEQYPwjogD+LVIaQ5D83qQnrwgXA3Q2c9Pd23U2cUybihXw6QvuEht7+acCzr1ETNv8KQjQvOeD0wM4bygrgkID7FRQkLicA1wH/CbyoCcrzIl+W63zZRDzuifAbp0YQALVyOvIDEKJmXhKo/k+PUIa3BZbhWDVjFFbissWFOobV80p9GVequaLwYmbnvLmn69rAMpwW+PyXqBmFqI0/JiwpSAzP7S8ElGGtmjAKfwBMNfHEv/s15csswlhE2B68xZ3eCQkIVCAsKJH8AISokWsCOt6PIpXhkYAyfFZNGEQH8JUWmvh3v77i30HUzr0RrDKvCixDSB4S+QE0MfIBaF5C9/9jOAAuAw4LuF8OgLWz2Lfhu1r4Hd7l32GxmrNmfhF4v8GZ8UMI8QM4A/kBCDFrTgpU/qdEKMMlgWVYpWasieOA9S288t/9Wu/fSdQ2gYbWf6gQPxn5AQjRUD5K9lG4PhtQhs1qwpq4mPAAMM14jRF+JG0usgIXSyOk7p8lzA8g58cU+QEI0SCuIPt83A8GlOEqNeGseQPN7eUf45TAG9TMs558NwXWezVCvX9fY0H7IR+A5iXkjHeM/f/FwBEB99+sJpwVJwJfIyzjYrNj/DueqOaeMVXCj/IlwAcCrQAhY4qOAgsxC7oDV4Ix9tzeGLjqOFPNOGOWAk+18cp/9+sp/85iZlxEnFwOIQG9QmKSpIHiQ9QJpQNuTo4OWAmmwH0RyhDiOVzGxTEX+6cTuBJY3oBnbeCFqX/hhSmC612W5f6dz8LFqxf75mbfr0Mstr2EpQe+L6AMBjgGuFVNKcT+eW+A2n44UhluCiiDJv+Z8/U6rrRLOPPxh3HOZDNlhb/nWv8b9Srf19X8M2YH4f4Xbw8sw8MBz3+fmlCImfGPAR3t8gjPzwHjAWX4v2rCGfHxOk2sa3Bn8AcilHHA/9aaOpX14/oMZsSNEer6jwLLcLnGBCHqz08COtqfR3j+iwIHmjerCffLatxWSczJdAvw+9Qn+l6H/+0tkctc9nUh9s1fRKjrTwSW4c8Dnv1TNaEQMyPk2M/rIjz/PYEDzYFqwrqupvZk3v17oL8B5e73z4p5XPFyfQ4zEuWhdR4qAF5HWCwCIcR+WET20ff+NeD5G9SE++WUiJPnCPCaDN7hNf7Zsd7jFH0W+yQHbA2s4z8NLMOqwOcvUTMKsW/OJSzaWozYDr8MKMO31YT75Xri7fUfneF7HE0834Dr9Vnsl8vI1gcgISxK5XlqwuZCgYCaj5CgGdNHdUIoEBaE6BY14T55Je74Wyg34s5m35/hu9zvy3BjhN86y9eN2DvT20a10hX4/NAjxgoIJMR++FKAwv5ihOefELjKOFVNuE/BfU+E1fKjwGATvdegL1Poe92jRck+6QF2BtTvlRHK8MWA539ZTSgLgNg3xwTce2+E558UcO8UcKeacK+8OcIqaAfwamBbE73XNl+mHYG/cyw6QbIvRoG1AffHiL54b2D7CgkAsRcMYXu6WQuAX+ECx4g989bA+6t+gnyoCd/tIV+2asZ11O48EHDv/IwFwFGac4TYO4cSZkJdGKEMIQ6Af68m3Cs9uLC3Ie371y3wnn8d+I6TKG78vvjvAXW7PsLzF5L9KSUh2pKQpB9PRypDSMjR16sJ98rFgQPnZlw892an15c15F0v1ueyV14dUK87I5XhabKNUyIiIXNMcxGyRxbD/L8E6Au4XycA9i3uQlfWO1vgPXdGsFRcpM9lr4R44fcQx0ooPwAh6sC3ApT1pyI8/6yA5w+r+fZKHucoV2vdPk59wvvWiw5f5lrfdxvKVLo3DM4ZsNa6PTtCGT6F4oTIAiDazgJweMC9j6v59imsQhLz/A2t5VxZ8mWulQHixEpoRyzwYMD9MQJHyQIgASDqsGo6LOD+ezIWAE+oCfdKiEm7Any3Bd/5u77sWdRZuxOyDRBDAISMNauAoppQAkA8nxXUbvasEnY8SAKgvoQER7qB5jrzP1O2+bJnUWftTkj0xxgC4AFqP+6ZAw5QE0oAiOezLODe9bjjU1kKAG0B1Kdtr2zh974yozqTANg7R0V4/iRhRwqXqwklAES8ThEjA18HsFIWgOjkgMUSALNmsa878UJCtgAW4DKOhhIy5kjcSQCIiJ0ihgA4NHDAlQDYM4sC6nUD8GQLv/uTAd9mLtJE1Y48iUvFXCsrI5QhZMyRBUACQDSZAAgx/6fAOjVh9Hbd2AbvvzGjumt3Qnx+DpQFQEgANBdZbwGsDny+cgDEH+yeboP3fzqjumt31rSwAJAFQAJANJkFYEXAvTL/12ewm+sWAE0UeyfECU8WACEBIAvA8wg5mqMTAPUZ7LQFIPZGiG/IigjPlwCQABBtZAEIEQCyAOwdE3CvbYP3txnVnSwAsgAICYCWYBDoynilKAuAVsDNJmw36vOpiwXgwIy/6y4/5gkJABE4SG4BpgKfXyDsrLosABIAe2OpBEDTWQAWBi448GPOloD75d8hASAidIYY5v9lhJlbJQDqM4ktbYP3lwWgPmwnLD20/ACEBEAbDJJZ7/9P0h7H1erFXB8ks/6225mstwF0FFACQLSBBSBEAKylPZzV6sUmXKCkWr+L5S3+Xdda/tTXndg7cgQUEgBaJWUqAGT+3zfVgInMAK9t4Xd/LbVvLW2i9oxzsgDIAiAkAGQBaIAA0AmA/ROyl31RC7/3RRnVmSwA+2eJLABCAkAWAFkA6s9tAfeeDQy04DsP+LJnUWdzhacC7h2SABASALIAQFjWNQmA/XNVwL2FFrUCXOTLnkWdzRWGW1gAaAtACFza0wrOka6Wa36EMtwb8PyT1YQzmsS3B9Txo4GTaRbv+2jA+25vsffNipcG1PGdEZ4/P+D5FcLSjwtZANqCkHzxk4GrgGlConKNqgn3Sxn4QcD9q4D3t9D7vt+XuVZ+4OtM7JutGVsAhv0YVOvCZ5GaUMx1Vgeo6LWRyjAWUIYD1YQz4k0BdWyBZ4DuFnjPbl/WkHd9kz6XGbEwoI5HIpVhbUAZVqsJZQGY64SE5ByP8PwiMC9QPIj980OgFHD/YuCjLfCeHyUsrHTJ15XYP9sC7u0F8hHKEDIGdakJJQAkAGpnIsLzQ5NySADMjBHgZ4G/8Qng3CZ+x3N9GUP4WcTVabtTCayrGNsAIWOQBIAEwJyns4UFQJXa9wDnIt8IvD8PfJuw/fV6scqXLZ9xHc01sj4JEDIGdar5JABkAchWAIQMAlr9z46vAw9EEGxXA/1N9F79vkyh1qQHfB2JmZO1I6AsABIAYo5aAHQCYHZUgfrRcaoAAB+SSURBVI9H+J0jgCuaRAT0+7IcEeG3Po7C/8oCICQAZAFoCQEgC8Ds+R5wU4TfeRkuWl6WntSrfRleFuG3bvJ1I2QBEBIAEgANEgDaAmg8fxLpdw73E/AFGbzDBf7ZhzdZnUgAzJwYIaYlACQARABZbwGEmJG1BVAbNxMv1O0AcA3w10BPA8re4591DfFyFFzl60TMnh0ZjT0xxiBtAUgAyAKQsQAoygKQCTH3u3PAnwGPAR8kzvnu3cn7337MPytWGNdYfhFzlZDYEh2yAEgAiLktAEIGAQmA2nkQ+KvIv7kY+Awut8ObiRM5sNv/1r3+txdHLvNf+boQjRcAxQjPlwBoYfKqgszJegsgJOmKtgDC+EvgGODiyL97BPBNXIyG63Am9quBTbMQEq8GXgucR/1MtZf7OhBz0wKgLQAJAFkAZAGYs1jgncAhwAl1Epev8leKS928cbcLXG72Xa+V1N86eKd/d6vPYM4KAFkAJAAkAGQBmNOM+5X27cCSOj4nAQ71V9Y84995XM0fzFTAvdoCmOPIByB7QsxgMcLwygKQPU8BFzE3wipP+nd9Ss3eFhaAkG9WWwASALIAtLAFQAIgHrcB75sD7/k+/66iPQSALAASACIjFZy1D4C2AOLydeBtbWoJmPTvplj/zSMAst4CkAVAAkAWAFkAxG4i4Czg6TZ6p6f9O2nylwVAFgAJANFEAkA+AM3HL4GTgDva4F3u8O/ySzWrBIAEgASAeD6KAyD2xEbgTNx5/lblm/4dNqo5m1IAaAtAAkC0cBukGZddqVvrywTwFuBPgUoLlbviy/yWSCJVNC8hY5DmHwmAOU/IWeh5GSt4mfAawydxEQOvaIGyXuHL+kk1W0PIegsxZAxSHAgJAK3yMp6AJQBag4eB1wMvBW5qwvLd5Mv2el9WMTcEQNbPFxIAc9YCIAEw97gFOB0XTOehJijPQ74sp/uyCQkAWQAkAEQDOmHWWwBy4smOq3Cm9vcCP6WxPgIV/8z3+jJcpebIjKydiOdl/HwRgHIBtLYAiLECn8z4+aJ2qsCX/TUEXOhX4xcQJxXwrowBPwKuBK4Btqr6W94CMJnx8yUAJADmPNoCEDHYCvy7vzqB870YOAWX4W9wlr+3DXd87zY/6V/L3MhVMJcEgLYAJABEC1sAdApA7G1ld7W/punkhWl/l/n/beMeLk32EgD1HoNkAZAAkAVAFgDRIFHwuL+EBIAsAEJOgLIASAAIIQEgC4AEgGg1AZC1BUCnAITIlqxPAcgJUAJABKAtACFEq07A2gKQABAZdcIYWwA6BijE3BQAMRw9tQUgASBaeAUuC4AQsgC06vOFBEBLoy0AIcRcFADaApAAkAUg4F6FAhZCAiBLAaAtAAkAIQuAECIDWvkUgCwAEgCyALSwBaBXzSdEpvRm1PdlAZAAEG2wAt8RcO9SNZ8QmbI0o74fYwySAJAAmPNkvQWwhdpTyXYx+yQzQog4DAaMARXf97MUANoCkACQBSDg3hgpX1PgmYD7l6kJhciEkL73jO/7oYSMQbIASADMeUYBW+O9/ZGsABsD7l2uJhSi5QTAxgjP7/JjUC1YP/YJCYA5TQXYHHD/ARHK8LQsAEK0HMsz6vMxxp7N1L71KCQA2ooNGQuAkNWABIAQc9MCEDL2bFDzSQAIx1MSAEKIOSQAnlLzSQCI5rAAhJgD5QMgRDa08haALAASAEIWACGELABCAkACQAJACCEBICQA5hAh5rAVGQuAJfqOhMhk7F6SsQAIGXu0BSABIJrEArAFKNd4bx5YpCYUoqEs8n2vFsrEiQIoC4AEgMjYArAAKAY+36JogEK0EqFRAG3g84t+7JEFQAJABDJK7Yk5DHE88eUHIMTcEAAxzP/L/dhTCztQFEAJABFNEcsRUAgJgEYKAB0BlAAQEcnaD0CxAIRoHVo5BoD2/yUARJMJgJBVwSFqPiEayiEZ9XUJAAkAUQdaeQvgGDWfEA3lmIz6eowxR1sAEgCiySwAjwbcewSQUxMK0RByvs9l0ddlAZAAEG1oAbg/4N5OYJWaUIiGsMr3uSz6uiwAEgCiDS0A29A2gBCtQKj5f5ssAEICoH0EwGKgEKEM90kACNHWAuC+CM8v+DFHAkACQERiGJgMaMestwEkAIRofgEQy/xf69wx6cc6IQEgdiNkb+xYWQCEkABogAUgZKzR/r8EgNgLTwTce1zGFoBVhOckEELsmyJhDrcxLAAhY80TakIJALFn7mkCAVBrkpA8YUeThBD75whqzwJom0AA3KMmlAAQe+bugHtfHOH5o8C6gPu1DSBEfQnpY+uJk4QnZKy5W00oASDid46VQF8kK4AEgBDtJwBi7P/3+bFGAkACQETmQaBc470mkhVAjoBCSADsa/Vfaxrgsh/jhASA2AOlwA6StSOgBIAQzSsAst7/f9CPcUICQOyFrB0BQ1YJBwE9akIh6kKP72NZWgDkACgBIOrI3Rl1zl1VelrjvQY4Wk0oRF04mtrN7ylxzO8hY4z2/yUARB07ydHUfkRomklgTcD9x6sJhagLIX1rDbVHGp0mHyjwJQAkAEQdO0kRODJCGUJMhWeqCYWoC2dm1KenOZKwYF8SABIAYj9sBp4JuD/GSYAQZyEJACGaTwDEcAAMGVue8WObkAAQdVTKMfwAfhVw73LgEDWhEFE5xPetLPp0jLFFq38JANEiAuAX1B4SGOAsNaEQUQnpU9b3aQkAIQHQAmR9FHAY+QEI0UyE7v/HSMGrI4ASAKLJLQDzcfm6Q7lBFgAh2sICcEOE5x/gxxZZACQARJ15CJjK2Arw84B7V0YSIUII15dWZtSXY4wpU35MExIAYgZUgAcyFgChqwZZAYTIfvUfywIQMqY84Mc0IQEgZkjWjoCbAlW7/ACEiENIX3rI9+UsBYDM/xIAooGd5gxqDxm6KyGmQ1kAhMjeAhDD/G/8mCIBIAEgWkAALAKOjVCGENPh4cBiNaMQQSz2fSmLPjzNsX5MkQCQABANFAAhZ/HPzdgCANoGEIKM+1AMC0DIWGIlACQAxOzZCtwbcP95EcqwgbDEQBIAQmQnANb4PhxKyFhyrx/LhASAmCXXBQ4chYytABIAQmQnAGKs/guBZbhOTSgBIGrjJwH39gCnZCwAjgWG1IxC1MQQYb48MQTAKX4syWIMExIAc5obgHLA/edFKkOtGOBCNaMQNXEhYad5YjgAhowh5UhlEGLOciPOkaaW6xeRyrAuoAxXqgmFqIkrA/rdukhl+EVAGW5UE8oCIMIIMaGFmu+mCTElXgB0qxmFmBXdvu9k0WenCd1GlPlfAkBkKABCHXhiDCadwCvVjELMilf6vpOlAAh1JJYAECKQDmCU2s1wn45QhqVANaAM31QzCjErvhnQ36q+z4by6YAyjPqxSwgRyA8DOmKsIBwhvggjQFHNKMSMKPo+k/Xe+90BZfihmrH50RZAaxBiSgsN4znNdwLu7QXOVzMKMSPO930mi746TWg4cZn/hYjE8QFK3AKXRCjDQYFl+LKaUYgZ8eXAvnZQhDJcEliG49WMQsTBAFsCOuMXI5Xj9oAyDAN5NaUQ+yTv+0qt/ez2SOX4YkAZthAnG6moM9oCaA0s8LOA+8+LVI4Q0+IQShEsxP44i7Domd+JVI6QMeNnhCUyExIAYjdC9tQOAg6NUIbvBt7/W2pGIeraR74boQyHEraNoP1/ISKzirA9ud+OVI57A8qwEZkGhdgbxveRWvvXvZHK8duBY80qNaUsACIujwHrA+6PFYwnxMS4FHipmlKIPfJSws7vxzL/h4wV6/1YJYSITIh38BQwEKEMxwauDj6lZhRij3wqsG8dG6EMA36s0GkfIZqMtwYOEO+JVI5HAsqwFm0DCLE7xveNWvvVI5HK8Z7AMeatakoh6sOSwM55baRyfDKwHBeoKYV4HhcE9qlPRirHtYHlWKKmFKJ+3BnQOSvA4ghlOClwkLhCzSjE87gisE+dFKEMi/0YUWsZ7lQzClFf/iRwoPhIpHKsCxQiy9WUQoDvCyET77pI5fhI4NjyJ2pKIerLQUAa0ElvilSOfwgcLP6nmlII8H0hpC/9Q6Ry3BRQhpQ4IYiFEC3QUU8PHLSeBHJqSjHHyfm+ENKXTm+jhYUQYj98OHDA+FiEMhjCTgNY4LVqSjHHeW1gH3qEOKdqPhZYjg+rKYVoDKHOOndFKscfBg4ayhku5jo/DOxDfxipHHeRvXOxEGKGhB7XOTJCGYaAiYAyVIGVakoxR1np+0Ct/WeCsMRB0xxJcxwvFg1GoYBbl0sD778kQhm2ApcFfn8fUFOKOcoHAsfgy3wfJOOx4FI1pRCNJTRkZ6zIYacGrh42AQU1p5hjFPy3H9J3To1UlhBfnlghxoUQs+SqwAHkxEjl+HVgOd6ophRzjDcG9plfRyrHiYHluEpN2bpoC6C1aYZtAIDPBt7/QTWlmGN8MOM+F2sMkPlfiIzoBsYIO4sf4whRDzASuJI4XM0p5giHB/aVEd/nQjGExSAY82OQkAVAZMAYcHXA/QcAZ0Qoxyjw74G/8btqTjFHCP3W/933uVDO8GNArVztxyAhREaEBhL5TKRyHBtYjglgqZpTtDlLCTs6a31fi8FnUCAvIVqaIrCNMHNiX6Sy3Bg4oPyjmlO0Of8Y2EdujFSOPsK27bYBHWpOIbLny4GDyh9EKsdbZQUQoq6r/7dGKssfBJbjy2pOIZqD8wM78/9v7+5jrarOPI5/773AvZcgL8rVQkGw4sv1BuqAWlOlBhNCYQSpTMSJCUaldqyxGjI201SrTQuktENMofGFOjAFoR3j2MYIWjOxBLUzEmvrqKhBRN5fVQYEhCtn/tjPSU/xtl5Yz9pn7XN+n2Tl+pc8ez/PWvvlrL3WBnw25mkGdustgEiUp//d1sdCNVmfD4llvNIpkoYmwhcVucYplnl6CyAS5el/nlMs1xC+eJd28hRJyMLATr3GKY6zCdtWVG8BRE//XW/jfbZTLGsCY1modIqkZXRgp/ZcGfAJvQUQcX36f8IpljEO48RopVQkPasDO/YypzhG6S2AiOvT/yinWJYFxrJa6RRJ09TAzn0EGOwUy2N6CyDi8vT/mFMsg62Ph8QyVSkVSVMj8E5gB5/tFEsHYXud6y2A6Ok/60MdTrHMDozlHbR6rEjS7gjs5HuAVqdYVugtgOjpP6gPrHCKpdX6dkgsdyilImk7BdgX2NFvcYrlfL0FED39Bz39n+8Uyy2BseyzsUVEEjc/sLO/js8ugZBtXBL6FmCoUioFM9Th6X+pUywN1qdDYpmvlIoUw3CgM7DDT3CK5RyHWB5XSqVgHg+s+U7rOx4mOMQyXCkVqZ8BaJVjLIsJ//Z4olIqBTHRod4XO8azSjfgIvXlcsK/PW53iuULwNHAeNYDLUqrJK7FajWk1o9an/HQTviaHJcrrSLFszaw4z/kGMsih6ei+5RSSdx9DnW+yDGehwJjWauUihRT6Pa8B4HPOcUyjPBFSA4DI5RWSdQIq9HQxbiGOcXzOevDKWw/LCI56wlsDRwAHnCM5wGHp6OnlVZJ1NMO9Z1Sf9tqY4iIFNR3CP898lynWIY6PCGVgGlKqyRmmkNdH8bvk9dzCZ938x2lVaTYTiP8NeBjjvGELo5SAjYDfZRaSUQfq8nQuvZc9Cp0L46DNnaISME96DA4XeIUSz9gu0M8P1ZaJRE/dqjn7dY3PFziEM+DSqtIbfD4FOg5x3imOwxQR/HbJEXkZHUQ/qq9ZH3Cy3Ok8wmwiCQgdDGQEjDJMR6PCVPam1yqbTVpTWyd5BDPKqVVpLZc5jAw/Am/7UDPJnyt9BIwU6mVKpnpUL+HrC94aLQ+GhrTZUqtSO35tcPgMMMxnrsd4jmA345pIt11vtVeaP3e7RjTDId4fq3UitTuoBW6Mc9GoNkpnl7AOqc3E1omWPLS4vSkvc76gIdm65uhm/7oZlqkhoUuDVoCZjnGc4VDPCVgoVIrOVnoVLNXOMY0yyGeh5Rakdo2CPgocKDYg98nSwBLnAbUrym9EtnXnGp1iWNM/axPhsTzkY0NIlLjfuAwgM1xjGegwwBWAt4HzlR6JZIzrcZC63SP1byXOQ4x/UDpFakPpwC7CF8pbLBjTDc7PVk9DzQpxeKsyWrLo0ZvdoxrMOErfe6yMUFE6sTtDgPZw47xNABrnAbYHyq94uyHTrW5xmrdy8MOMd2u9IrUl57AesJnDXuuGNZB+JbBJeAT4EqlWJxcaTUVWpdH8F29sp3wr3rWox3/ROqSx5K8q52faOY6PWltA9qUYgnUZrXkUZNzHeNqwGcVwulKsUh9agDWOgwi33SMqQV4xWnAXel8cyL11z9WOtXiK/iuVfFNh5jWqn+I1LdxDgPJfnxn348A9jkNvHcrxXKS7naqwX1W017OtD4XGtc4pVhEPJ5ynnGO6VqnwbcE3KAUywm6wbH+rnWO7Rl83o6JiDASn0lONzrH9TOnAfgoMEFplm6agM8WvyWrYU834jNJdqTSLCJlSxwGlg/wXU2sGXjZaSDeD4xRmuUzjMHn9XrJarfZMbZB1sdSWoVQRGrAUHy25/XeTewLwIdOA/IO+/+J/LVa2+FUax9GqDWP3TwPWV8XEfkLP3Ia/Lw/LZqG3++xb+O7DKvUhoFWG151Ns05vulOcf1IqRaRrvQFNjkMMrsiXGR/6jg4/zfQW+kW09tqwqu+fhrh5mSXQ1ybrI+LiHRpgtMguNw5rl7AS46D9JNozwDJauBJx7p6yWrV03Kn2DQRVkQ+0yNOA84U57jOwmcSVLktUqrr3iLHevrAatTTFKfYHlGqRaQ7+gFbHAadrUB/59imOg7YJeBepbtu3etcS1Od4+tvfSg0ri3Wp0VEumVSwk8e850H7u8q3XXnu841ND9CjF5v4iYp3SJyopY4DUDjnePqid/WwZUTt7Queu1rwHdCaXmLX+8d9cY7xbZEKReRk+H1CnIzcLpzbAOAV50H8l/iP4FL0tHLcuxZM69aLXo63fpMij/BiUgdmew0UP4O6OEc2yBgg/OA/izQR2mvOX0st561sgHflS+xPvI7p/gmK+0iEmqp04B0f4TYRuC3elvlNqltSnvNaMNn2+vjV5UcESHW+53iW6q0i4iHU4HtTgPT9RHiuxC/5YIrVwwcrtQX3nB8V/grL/N7YYRYr3eKb7v1WRERF1c7DU4HIw2eX8FnL4PKtg0YpdQX1ijLoWdNHLJai3ETe9ApxquVehHx5rUi2YZITyiT8dvGtXJxl7FKfeGMxXfRqPK20jF+Vz8Vv7ksy5V6EYnhNGCn00D1DNAYIcYbgGMRnvqmK/2FMT3C26BjVlveGq0veMS40/qoiEgU1zgOqnMjxTjLefCvXDpYmwilqze+S/tWtlmRYp7rGOM1KgERie1XBRi05kS6EKwjzhwGCXOh5SZGzucU4Gb6VyoBEclDGz7bk5aA/UB7pDgfjnRBOAzciVYOTEGD5eJwpFw/HCnudqt9jxh3oc9WRSRHVwKdTgPYW8TZp7wRv4mLXbWnNPBW/Ub0qYj5XU6ceSp9reY9Yuy0vigikqs7HQfb30R6om4A5kW8SGzHf68D+Wzj8Vuboqs2L2I9/sYxzjtVCiJSLb9wHMzuiRjnrY5vLLqaIT4P/w1h5NN62rk+FimXnVYrsdzjGOsvVA4iUk0t+C2zegyYETHWq4ADEZ8a1wIdKoloOvBf0reyHbAaiWWG443LWut7IiJVNQS/9QE6gWsjxjqGuK+OO8kmjg1SWbgZZOe0k7g/5YyJeAzXOsa/0/qciEgSxgJH8FtxLeZypsOANyJeTMpPk99HOwuG6GPn8EDkXL1hNRHL1fitUHkErUwpIgm61XFQ/hiYEDHW/sBzkS8s5V3jvgE0qTy6rcnO2Y4c8vOc1UIsE6yWveK9VeUhIqnyXIntIDAuYqy9gGU5XGTKCwhNUXl8pinEW9Dn+LbMaiCWcfht8FNeiVJEJFm9gBfxfZX+5YjxNgCzc7rglIDVwMUqk0+52M5NXnmYTdyFnL6M708XL0a+WRERcTEI2Oo4+O0DLooc80z8dxL8W187PE72LXtjHddJo52Dx4n3WV9X80tmRj6ui6xmvWLeiiaVikiBXIrv8qx7gS9GjvkS/FZo6257D7gPGF5HtTHcjvm9nM/1W5bjmL5oteq57PSlGk5EpGhuch7AdxFv34Cy3sCCHJ9IK98KPAv8I7X5fXeLHduzVTq3C4i/k2M7fntklNtNGkZEpKgWOg+I24AROcQ9HtiS84Wq3N638za6BvI/2o7l/Sqdyy3ks1TzCKtNz9gXavgQkSLrgf/krk3E/W67bABxNxPqTnsF+DbZpLLmAuS72WL9tsVezXO33HIY2zCrSe/Joj00fIhI0bUB650HyHdyugkAmI7v77ohvwe/QLYW/tWksRNhm8Uyz2I7nMB52ms5y8Mwq0XP+NejXSZFpIYMBTbgv8hOXhOkBgOrEri4Hd/eBhYDXwcuIO6nbQ32b3zd/s23EzwfqyxXebgU/8WKNlhfEYmuQadAcjSM7NWm55P7YeBG4Jc5HcOtwE+IP6HsZB0gWyt+L7CnG38BBgKndePvGaS7tPFB4J+BB3L6966zmyDPCZvvAVfYXxGRmnMW/r+XHgO+l+MxnAOsSfDpt17bGstJXr6H/5cMm6xviIjUtLOBzREuBI+S70S5ycAfdQGuWvuj5SAvzVZj3sex2fqEiEhdOAff1QLL7QXynUDVQDbh7E1dkHNrb9o5z/MnzDarLe9j2Zrz2wsRkSScR7YPu/eg+i7QkfOxNJHNRdioC3S0ttHOcd47K3ZYTXkfz3brAyIidamdONu+7gO+WoXj6QXchv+iMPXcttk5rcZmOF/Fd13/yi9Y2tX9RaTedeC/hGoJ6LQLRzW0AneRzbTXRfzk2h47h61VyuFtVkPex7WrCm+oRESSNRLYHelCsoD8XxuX9SXb+OZDXdC73T60c9a3SjlrspqJcWy7rdZFRKSC905qxy8QM6CKx9ZKthnOykhPlUVvR4Gn7By1VjFPA4i34FMeO1qKiBTWaOJtHLMNuCqBYzwDuBN4WRd+1gJ3AKcnkJeriDd3431qY3MnEZGoLiLuK/N/B/oncqwXAHPxXxwp9dn8s4HzE8lBf6uJmD9pXKRuLSLS/ZuAmDPptwKTEjreBmAc8G/EmXWewu/6i4CvkNYS5JOIsx5F5VsnXfxFRE7Q54GXIl+YFgP9EjvuVmAaMB94nmyd+6Jd8D8iW6L3J8BUfNfM99DPch/zHLxkNSwiIiehBVgaeaDeAkxM+Bz0AP4O+Cd7Q/A68ElCF/tPgNcstm8AF5L2XvYTLecxz8nSBG96REQK6a4cLnqPUL1Pz05UX+BK4F+AJ4j7Grurn0+esH97HHBKgc7ZIzncDN2l7ipFoO2ApUgmAiuI+8p+CzATeKaA56cvcOoJNshmqJ9I+78CnpsJwM+BIRH/jX1knzGuUlcVEfF3HvlsvLOoQG8D5G/fFC3KoV7eROv6i4hE149sQZ3Yg/pm4Bagp0554fS03G3OoU5Wkt5EUhGRmtUIzCOf37zfBW4i7YltkulhuXo3p9qYZ7UoIiI5ux44lNNgvx64gertKyB/XZPlZn1OtXDIak9ERKroYuJ/1lXZ3rLBX09+1ddouXgrx/xvsZoTEZEEDAJ+T77fv68DrtONQNUu/NdZDvLM+e+t1kREJCHNwP3kv0jOa8A/oM9q89Bg5/o18l/s6H6rMRERSdSlVbhAlIA/kS17qxuBOBf+qXaO887ra1ZTIiJSAL2Ae4GPqc5ud3PIdvqTMBfYudxYhTx+bDXUS2kQESnmBeRFqrdO/h+AWeh34xMxyM7ZH6qYtxd1AyciUnyNwO3Afqq7Yc5vgRkUZ+38PJ1i5+a3VHejo/1WK5rYKSJSQ84knxUEu7NV7grg76nvxYV62DlYYeek2nlZaTUiIiI16npgN2lspbsLWAB8ifqYPNhgx7rAjj2FHOxGi/qIiNSNNuDRRC5A5bYH+E/gW8CoGrkhaLBj+ZYd257EzvmjVgsiIlJnJgGbErsodXVD8CWgTwHOZx+LNdULfrltstyL1C19ryySTUC7F7gNaEk4zvLGRP9r7VX7ux7ozDmWHsAIYKQ94Y+0dlbi48ph4GfA98km/InoBkBEGGI3AjdSrA1/PgF2kq1Rv7WibQG2Awfswneo4m/5v7GbnlZrLRV/+5B9kjcE+HxFGwKcUcBztNgu/FtU6iIi0pVzgf8AjpHm62u17rdjlstzVdYiItJdo4GndREtbHvacigiInJSxgJP6o1AYZ74n7SciYiIuDgPeBA4qAttcu2g5eY8lamIiMQyELgH2KELb9XbDsvFQJWliIjkpRm4GXhZF+Lc28t27ptVhiIiUk0jgX8l+xxPF+g4baed45EqNxERSU0PYArZKnhHdNEObkfsXE6hvjdOEhGRAhlItrXsfwFHdTHvdjtq5+x29Nu+iIgUXD9gOrAM2KuL/KfaXjs30+1ciUhkWgpYJH9NwGXAZGAicEEd9sUS8Aawiuy7/RfIlusVEd0AiNSN0+yGYCxwOTAG6Fljx3iUbOb+88Aau+DvVepFdAMgIn/Wm2xL3cuBi4EOYDjQWJD4jwEbgdeBtXbR/x+yxXpERDcAInICWoF2sp8LOir+DqN6s+M7gffsQv9Gxd91ZLsNiohuAEQkYh9uI9u2t6s2gL/c7vf4Bn/eHvj4dhj4gGxL4a7abrLf8kWkgP4fwCyo4dzAKKAAAAAASUVORK5CYII=",
-    # WC with 9 l cistern
-    "wc_3": "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAy53pUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHjarZxrlly3jqz/cxRnCHw/hsPnWj2DO/z7BbJKLcvyabtPW5aylMrcm5sEAhEASHf/3389969//SvEGLrLpfU6avX8l0cecfJD95//pv0ZfLY/v/+LX+/+4X334x8ibyVe0+cfev28hu/3vy/09RomP5WfLtT31z+sP/7DyF+3779c6OtGSSPSEM7XhcbXhVL8/EP4usD8PJavo7efH2Hdz+v5ftD++e30x/uek/Z5+fXvuTF7p3CfFONNIXn+jCl+BpD0O7s0+aHzZ0ydD4ZU+DnYOymNr5EwIb+bJ//TqNxvViX8blV+/PTLoqT6ed/xxh8ns/54/e37ofx+8p1N8U93TvvHnf/wfmvx/vo437/fO929dz9PN3NlSuvXQ30/iv3EBxdTnuxrlV+N34Wfm/0a/OoO690s+fHbL37tMEJkWV7I4YQZXrj2usNmiDne2HiNccdk7/XU4og7eccKZf0KL7Y00mG9Ytosb+Ld+GMswe477HY7dG58Ap+MgYsFmYLTH/8Xv/7yQu/J5EPw/cdcMa4oI2QYWjn9yadYkPC+7ajYBH//+vU/rWtiBYtNc+cBp1+fS6wSvmxLdpRsoRMfLLx+fC2083UBpoh7F4FOYgV8xfhDDb7F2EJgHjvrM7lQx1HiYglCKfEwyphTqiwOHsO9+U4L9tlY4udtMIuFKKmmxtKMNFmrDLBhPy13bGiWVHIppZZWehll1lRzLbXWVgV+s6WWW2m1tdbbaLOnnnvptbfeXR99jjgS4FhGHW30Mcac3HRy5cm3Jx+Yc8WVVl5l1dVWX2PNjfnsvMuuu+3u9tjzxJMOOHHqaaefceYNF1O6+ZZbb7v9jjsfpvbSy6+8+trrb7z5Y9WC+yzrn379/VUL36sWbaX0wfZj1fhqa9+XCIKTojVjxWIOrHjTCmDQUWvme8g5Oi2d1syPiFeUyCiLFucErRgrmG+I5YUfa/ffK/eHdXM5/0frFr9Xzmnp/i9Wzmnp/mLl/rxuv1m1o2izfXK2QnJDTapPuB8fmrHzPzHp+7XXe188jODEstbaq/d57rmxnBMzQ3W9lBzuzON6pub12TZxhB+4dxqr1FNme/GG/AZrzcSM8hYocG9+d+yRuNGYz430dlsvsGKY3Dl3vHTOPIknf4yPmQe8ep6eb7G8nnGMcHK/aSmahrsGoe65M0PLj/fSGa+Xe/TJE9PdgaWJzGnbvCrS73N2e56ZiWm+fu7SANqu6cbgWJ/7UjlrcY+Yb8RaeZQKfow7et71bu40Vmx8E/P5zN1aHpxoO/VT9UgNErFqnMuXnjG92tYZPZw+ToqhvbUPBndmOivm2hIjHv7dfR6TViAgzCILXW529+4RM1NAWKqJCbvdp1sTN2W6NEu9NryysdIeG9rvLb3r7d/CnIlrjt3cDnrj5RBP4z18MfG7Truc//uXc5/r/eeXcz8P7z+5nPvz0/7vLuf+avL+6eXcv1+Lv3G5g2/U5t3zY/TTc5mzrjzl1GXMArLw2ZvwioFJrJ0XBv78TWUJ+26c58W5H6C5RunRPcW6ml7Zvr57F6yl1fEYS+obxgmodZwpyxmgpbCQPE6Lb2KlYGEcPm4wKzqfLyyk71v8K7Hhjw1frkDueBfGsWspqz3GAGiFMnA+RunbBeNDPycMEZ0WXR4e3GU2eLLt4wBd6vO7P1wexCNQ8wATAlRw+On7KyDZA5JyxcvyeYSEsUJ1gtNzERI8UOx8ZTApx/e0OwgAxS4Fd++tgWk3ebloWHO0s1oua1egvU982sHOGN+GOQKn67B4IG7N1/PPzOfmIdI9kaleEGlGEiuTfEEJXw5PmvDYUM0gzxj51Xpx6ib6Q5TIBd+WCvjlFb4CvB4tOg4u4NoAx1nwFfAo5hH29XESt6IiBssLpkMAa4m71rNgd7WfVdMIod76ygqvLWYA5E/jcfn+HN85t00WGjhuOzfh7cac+HmetjfXxcyIFAW7EBI1YPkRxO5QQMJqQc+RXA9ln0oY41nvKnPYwGcrKw/C4WheUN9Z2wjO8p2TRxIr5E/ihiYyXSKP22l2LcQNjJip7iG9hcEND/zfNpLfFeuCwoLGAQZT0tld6ot1Nbz268R3XRgNAQNve4mJM0/LF8spfgHbJ5SZc7oPkyWYEEV6IQIQLInbg4fZgm3Q+xBpbTrkG+Fc+EQvbTO/42TIwhib9z+z4fdbA5IeJvMc+rKg3G6s3PdGVwkdgcWP+wY5BDfGsD1rx/f2w4gIiNnz9Bj8kWmCC5tQwajHq9yvY5y1OJY438zw5Cq3D/lVbIRen1YlvuWOofiW52oHMUDMyXCItBoRLGwutDT7Jzt8Dkt6GNMeEw8q0qIl/PpaLksRFAp3fB2ukDCOiG5pB8vC4THIkEfHXhPjgCaWCnXq4YEdmwdC0Bx+BmUYaL4n1QXs4RyE6Xp4ptzSYnkSBkk4BswALVvTe4eAj08FmM+bt8FEGk6V2ymReSViVrwkrAcfAkneIGTu6bhfT0wn70dID1LripXhpphb5p9WL3kRMQuMETID+K6dAKoqnnf1HhZzpyt/ckwgnOtAxXBQ/JwJPjzTiLfue0OrAM2CQ+UIEiIvbhZbkTriw0f85BHr5WtYF8blgel7EIrnMi1jyLhgAR1FasY1ZFwNRdjEdSDsEz7Fd2/nzbfLIbQczIRAMRcgzqogZSKoUMIkjMQC5dygI9S6B0gLfpzGJYpMxH0+DZPHKD4mBzRickzg/JhcyjK5WCHLFeL9cHgmZYgdsTgzQTFfd2lN3KMXRQn5ewodN9wtQWLkr61D7grD5PM8GDwL5uKvEAePwk3QrWmu7cCPi1fjeIwgw3GSb3sBmrLwxB9Qvpd5cgk0PrW4csMAPc7e49HCJEIWls2YcVfPjA2u3sGIQ7S4TBy4TdABcR4G7VtnJSFn7YY5Uj6rM0MLVBiDGWsuMLiB9K7tsJQ9Q0wJyBVrwoGIi2vJpPyShQFWPDZe15IgJfVbCk877soeywb2e1FMliexavcQ4tJkWaGSrWC5wN7L9SaMEMv3L9wHyHC3yg0LHBYrdsnXg4lXsLtrrsF6fwqBtMBiMeqBxw2esYVRGZ4YOX7A8475M6OPzn4IWByGvVBSc/pKSJfIEvgQStCAQTG79bXAWVxVeo3ZAcsxA12v8GiYH1fCTUGx3t+E5iOeMLKDdWTcQ9MDf7jEIkgCEfnxgwc+4f7VoFzBpjgj7wNUhLewDEwVoNhxrNbxNmmlrggd21yoCsYEk7o48csbJkIcA5AeoOIE90ztHYwk4yuIIWCFJ8Q6F58DcYCqh+LjIWAk2JsCOvFGVrHNSSEISIibF5+YaEFZ73lcFN03cA74+NkbIO0Pl5/AB5ZV0EiIoo7IwGCz7+tJyEa3rt/EszQazs4aV1nUugqQxNgFJrL6Q+QnSM0UYmwZ50BfMEB0G/EPB0nJ7boI8NAZZXEWeBBZaw9+TYkRrekUdH69TnAMdMOUzyzEKBY7BiAcTQvqxwxDKEJ5qQm+zcoPiEzV/KFlHyqa74G5+EgmuCBeDnw1YTS9IeIiF3aSKgfQA+28borBA0tlXq5IdEFyw092hhu2Szz0YGd9BqQKhBmn0beAWpCoZoWbgXdguQFMSXhDn3VIvYeIix9lwkA2KCqakmnMeEJkpmCNV4idBk5rfICpAsogqywi7s3TXInojZYKCGsmmKkgVmkcQ3YeQX5QHZ8N4uTLtZ7ThirIObFqaA8MpKSI0RV40dU3WmHhB9ITAPXANTPRRWARr/HDTbcSCIexYtEJdTfvXJNgEeHurPm5WLdCRas4BNHi8MQLuZ5AJVj8jYMPinW3rawfqjIy7HwIFDd3jwzsUgiJj3RgCb7CMzeuji/9bAxfrzxELw6vOhcJYA+RYz8ErCRgw07B7i87JSZM/22nI0FlgtkpBp4+dsocwQ8w1KqMCbKeYDBz8go4hOSNM8nJPgamlAPYgotBgvgSNgQzYb7qGw7VE2eOSAM07WUuxKdqFjk9V9MxpSSKyBPxEqfDyppYVC4H3l0WAQ/uNByqgefBowgiOBQChCV8+PrCpJnrCR+asK64jsIIDhpzQnXtFxFqeNcNB8YY3MF0lVN/isJlVZQQzzDQUbCSCj4r1GPfxEawjDkZivcMFbRA9BWUBgBxg4PdvtJFxvuFI3BJ/kkjVuKd0JoDX4RbFzBKIMZrYA0TcRYrrctj1cSA7HDgKehksgeypdYE0SEaPi006ueXxE1Ca95k7swCoMmglOd8VHaeSnUM4fbJsLM2+Vxd4DasFTzCBMZYl8AZJx7bMObE3EHZkHbMNMZJYHGEby2Q3cNDta6y4zjwK9B/FDTiDocWhwSxMVOuBcSGBQMjjk2etQFoZTsms/rMaMBFMJ5IPd/3/BMH4DuxZVFKQkAvoWst+7owPp5y4IwID56uO+6KqGhLihqulTfrxfcYo3xQWm1NUKfKnBtEC/0mBjlwY6U4S4ZJccOKZYcJfnGfwmrUHRn6hI5VAKFjiZmIBKmH1GRJOUgMoowA1s1aMU8WJ6xznFQM7BWMS8RbpcvQ8a21AY7DYKoSXjwMTAbfzYITw43CIiKuGQ8ynd/DlWoDYHqGyFUDJbEMIAFSwmoSC94X44ThtvpzvH8IPIIWX0daOZjPIYQoBoCB6cB8Z8yQ9xIkBIk2MKar5JlRB/Dok52osGswaqXDMKAxLkLBEraxJPtYmYAxz4myZ2Ka+DssD+dPp3QPGQCgfZkV7MQDK3y1TSaPm7t9mEEkDOaWKvEpKWWP82xWiSvz5B6n4tOgIaCQ9bWsvGUnNsUuGl0JKoO4hv4hzCmkMBfESGlg4ZbC3VHaLIZRBvGe4SohwMhfhl3x+IkpOo1l382JSy8E0r4CEMxCKZOBbFyEfqYp8pAQPOwGd2TZFT6xARTv11DLGTzJgR7bWGtI5oajexWRsASf8a6usAmzHBe3gVZCZveSiq1HSm6sIwZ0d1lu5tU8zGuw7vCV/RgwyJNlWEpGIAfwEIBEdBr3VK6zv6S5NtiEgRH6WLViBSkQqcNsif7SbeNt6aFTXimw2sZHeSHs4rkRrXYk+hivkpNPXBiF6bzinsqhIPlj7UDdG8UeCb57Q4Xagn1ZtgSsYzhKEbUzwZUpkzSbahs82vug/HEr5akPmhXikUH3rJwO951bN9wBIQa1Fu2BjQnW+x8S1e7jM9Be+QxyobCayPqGy+D/DX2B90NWoIEs15T+5QmueJxoH2YO/oMaDtgAy4ENPK3OD2wsD+76abCRpXQ/sBEFGwr4nidISekNgBDVBOHyPFoC2IivRFWC/CBcKNmMlmONVgFE0VLbUgVJWeetvMqW5SqhXkTcgrI4EC3mD6aFDTWQ5cirWXPg4hlSSQUVxizDJULx1L1USE4gXuP5xJqbpUpdVoYwbX8Jtcc491FWEtwSfF+JqgcL5pG0PpNrrennxRRwBuh95jEZFxfib2hwaNk7w+pj7WElEXNSyMlKXEvvTgkzyDpc2UJRQjLDsHAWRYw+0SJLOc43lxKcRB/QCc7Gqt8iPgLvg4AxFnAZ8oY2qCgxPi5rYiqUJEWFI47/QHUI9IHxGfq+JhMezNj86LAyY0F/V5ymMOxUDg6NIiPExqhEFBZB+EKfgaZYZgM8RMqeFRI8zg1kLUwdpGU6BVLY/sb1swdkWmRQE2BrcIakYDzBRBZFMw7+e0ZVVCJ8/E2oU+C1AGtBji8lbSAW0JHmjZWkBtSaljMlB0Dg8cU4QIYSAHAwBOzsAiWwTFDvilS0nHCnTFDnNrxzk/ka/gwVmZqyoxUhFq0K7wXEWwW2JwQrbOW9VGSqBJIknUJYF+AoVwJzfW51OPnrFUEFF0WeARTo1JxVCSSGDAXsnSdSVLldgE28B3Z6guVSmLoi63Ud+8XsuJhgAEKOCBKrsmQZIQklHUAWTO8o4wjiiisxxx2XSJg/TJInl6aF7UPuO/AZMPp7Nw/1mqJRUP4CeYUjA9E8DiK8P5jLDQ2zC8ofiDIz6+qJAGoUZ2C/42A2zO28F64YsDk0PKNDMMIxCZ+QdMSiV3GvYUwqDLYxcdbQHESEiDeUTxVwoO8Q6IFwqGrVHjzJNNG0GnGs+BUV1cqYm7v5pdqgVhMJwQwS1JRWQjBjZ8ratKscIva8WcddZWEVC8cth1RqOFwliinWjOiBkkKr3UX74lVGOrtWRHSlVsttFdTNgQAC/icSuzOe3SVeWFuWAd4D+KgFAa3vIAhNClV+HqHqpykdXkIzm/KQcGQ6cpF7EDkGYBuQ8oSrCjMGlGwYLXSiSNilCtAwRNBQKwKAX49uQ/nCUjSd6+EgT5UxYj04sDELPIaLqraG1XaXv9x/CQ0hHkERAriAkGBWY0l0+XOI4lZaG4XIy2ISVy6ofWdVGhdXdRCXaGhu4YcQhW8EpVbBLXydUF0Lioswd9tcS1ikfP49RVkJS56Ce+1JQhBFCWRLHBsRgavwcfw94HNcD3HkCzHX5FFR4aXMpoU9CsHYcMIWYP7VsgZxeJb8qv7YUFxDdQzPHF1Llg4FrqdSpFIBSfIEc0jjVPQisxGE2YCmjBAJT7zGg0VEuS/wkMSozRFxmY2YUBiKyj+g81GiUQwimiPudtwGiOBceCLet2y+O4Y6CLIsx9xV2R7MqhAM8VxFYoKssiRyZK+UJk/ypgOQM/zXh0D8mrp1kTqAHSbEKPEEG+amhaC71DFFQCiEsPow4qv8Oa8pKMe2rM7GRc9WIaYZPIHT8G5EHXSSscGqo7QYS9qCNVXBgJjJ24CIrpp5/o4ikF5xZuaGO4BvNcjg8CvgTv0Gg+culqneOElMS3V3ZheCq7JETe4oPECJVH1ReIZ/PJ4jK1ENH3obqfHazA3iOP1jCIhN2ErH0sH/deZB+/bhVH3eLAXMjbcxuZHaUmENYBTv/HSHwXkUXOBwTZnNlL3VHwEn7ApY6Nsh9YeSVIQlQBxnFlMj6AXiPsp+LBW0hPXglzkA98U0Eyz0weQ2YW/EUq+bPGL/ysOhvFQaWehwnqWpnPPHZOPX61YCCAINJYBALihT1oU8Dskql8STDVW69K/AE/efRa5i+TjmQdn8w3PzM35yLlFzIQcI56y/O+hkrqQCVRE/IPY09ffgHdAkfyxZbL4BjSZozaxZwCylqIPyIDwSytbhEEnoU72lehd3wym8qgmED3B0y2L5ZglowVNx+wZccEP0LXJn4vlVnSxBmRriLAF37ifJX0TMV6qzQv8vMgOmBqWLau4BrRsOqTonaFJMVgMKAIfrKHvxM+CosWpgD8BbUmqhhgirUuuX6kvttaGXvVWjlBFMjAEr1qIzea4o3w4pWAt/Y95yGdbToEvgUww34N1IAkyJ3yoJQJsvYQRfU2ZciTM8ygGQSS0s1jLDwA/YQCwAsWPhS+oM4b5VjsYagldMfvBKI9UKAYlerRY4uGPa1Nnm41Y331PZ4ANnEWs/inJQYdwLuSs9kkqEVHtzbqAYXwH4sf/uJP9ujyBsRRiBUws07cqlZAgugPqUxMY+wUWVhvAgOKvSuTzuVuUGMdAqtAbXxTIg/QgWqB72DY7AOpakocwootILEXF2GCqkHo4Gwz/clvBQEDsX7rgdvIO4Aj18D5VNyAzKK6gatlTCgvgdEJxYy7QooTBVusUnEauo/aIYnWJQjxZ/AJ0vffK8HTJdx5B5QkyVyyCKVfHVp66a/GkvIIhbu0wE46+9uRzksn8FJ0vRVyV+KmYdVD1nAAcOscLq8BAAwapGI+BuxHc+V0VaGdF1RJ2lLpmBhfj4YTBi8v/kbxFy595FoN6hGigAgvcrp3uwRjWHYSAH08Z6COg9w/WUL3lZxIixEimT4sxBSCCOL9a/gXor9h9AazxCLDNM2BeFvaY+VBgucS9jT53wQvjxaNbRE3Q1BVdYftgJlBd2chKMWQ2zkCmAICEdG+GaKNMn6gAMYpozlEmZ2Ct8uurfUvLEKaOnlIwUB5xd5Hkw55cf0VSQyypBD9j4faCCFYOqWdVKWHlR5yRERelEp/xVGNiMURJAjMVAy+6ErEL/7Cxmca6yeRiaOgsOTi2/JECDeI+AgZYBIYUpKSgDGYhJTx1QkKUm2o+M7SrtJJX6hqgZJgetbgQZYahyn08pfRiVq3BbrPygKY7qobCwAMQ/sBuZi38lAm0u1tqVpbJFbca4AXvlRdm9IvR2qFtLUbDaB65J/JmQdzAOuNtMxzXtEAnOBPUTlNSF0Mx5pfwv5tchh9ALgI2YzFwyVQNhpM6wR0TVMqoKaDr3YPIZQyJIdGUVC3eeqmpBDaGrUJ0DiWB2BKNgDeGHaAykjK9C+jkgWVJZfakhQDVfdbQ9lS2iv3xBN+Rx8TLnQ1QWqKqFEOeEz4uGQM8LXm/rDpsLNXWraCkFo5E+JSQSSHPKVxXEwTK4HjbNFeB4gDCIzFTWfZTCrMpM7bszeH1102Xwia5Vtm2sqCY0RBpsJCnJPYh+V1VmVdFOLUNNzkNVGFwHQLGcSEl/1Q3Aq9MPFa0Mqt4TVcad4kdP9fitjpudUS88E5GKYK6CwRUsSu4kNYp8Qnp0U72fyrxNZbqVfJCLZjBZGT619IGDYBsmjwArSMFEgIC9WvNjv2crg9W2m0hiUey75pOaJtwjHiEWLPZioglZ6nRsfkpnva42XsFkVIcLA1C5h7gRXBT9ZL6VP2L1CHe5xwwvQWQX1nZDCRi8Mq2oKbWfsKDqn1Ft4iHZ0bQH5uFUAsTK4DiYONAF6vsbgTh8iynYKHyEJoPM5mxqmQHIrNKIFWBrVhR9xzFAaHVPIpLpMd35DHVVw8lbG0dZkXoRRlyG0AopggavJpIO1CilNUtQ76dVRTdIdo0VAktF2QeoYdOL8jXHkrye9ej2zu1g2+fT0PivhrXkLKfjP1f9Ty7qfr7qf3JR91dD/acXdX/n+f/ORd0/ndS/uqj7T1bqx0WBRrezAUrr6goEAWH0BLqoCgxGV5X+9Kr6QAatlBPAuCI1JeBXLyo6mMiMZTfrXygxFiVIU85DzCoNeMzZibCV1RasWprVy9JQ/71oZimfbkapPF3IVOMmdEV1DxFUImEQ/XqXSi7x8B8/eSA3KE+vRD6RNUFrL9w2EdmgTSCkXBd+L88VI5t4rsdzFxJozY4jDw/ZqCC0ng2PqcrZm4eB7VtFNwuvrlddKcOAlYfaICrxhQmQEEdZIwm9kSrto1DOW5FUxKKglZYaNRgOZCA5ZauhHwEaeuIWoa4WHYSwKoyMqUzdH9XR717dT8U8YuGDvz6FrcYEs0Bgf91KKjDxS5WswswvJGt/xUPQ0RxNlYR2VWCBio6GriNsEluJBMjEUYHOrgbKgB5OTAhMSBfke2rhRB2eHMUe+1zqSVduhMVCVAKXXs0m2WcVwsNRegnTsrS8OpOPWismgSjCsvhI9HCD/mw7TEzO3wsK2nSq66MbSSO8w23hRgxtEpSq+jMG1H+gybqah4jw8D7VqgjqAORwy3bCqE7EeJX/Z8RlIBWXWn3SU1pdIbuJZCIKO7h82xzJElUbz8nqAsNF1krMNT7C+mUiC8RBcuQBzdAksS4mmidrHy6pfly/mEzJMwTsuqruLeQ6AfmahlCmrOKBMNeX1FLbIK4/BVOmS2OoKjSqG0od+AXFXevlsR0EzRoGRyB8buRhiMqgqNocsrajHEK3QN6aqZ5ScvAnyTRoxJT8IfjumdEidydlZXB7uERNMyh3QxjFoawHB3QpypjIPJiyJIW81ITaoTAb4Q8D2tsRXgjjMDIRHdXctirTH7IhHt/UJ8hModoGcwvzSqnwRSDFuI6SQEp3EbIxhRpUDFrb5HlS+6MfSFI5EnEO7bmiNaeGBalL8xHzwKgrvamuIEVeB4qh6sSLmV8kIwIZafDqBuAGMXF3uErJ6raLRZs6IHzqPWqhKPXp91Jn0oFnX22+ItBWxX5iKqy0PCHlQqtqLx7f6qCJJIFyRsxge8gBpZls8MgoKKxDTC2NnknyIqhhyfsZNKDIfDMCNUPhkbur5igkb1mt/FwA1ddV8OIbzVVlRqZ6IaDlxH2EoPaTIE+epUpMyG31zKiUhqcxSQ0Oz2rATAtcUa3DfbmBEIKGJhW9VThaw/p/hnQGiBKZ/ul/anOUqzwgtA6k95i+SufOexygr0xY8cqzbBXm9PWkiv1RX/HcDZfcDyS+iCxNXx3BcPMej4LEMAoExQ3bSnHgug+9di3QlDuLXDUjmYZyPTgUyh9OvGqKWwmXDtqoXXtpGRoS2ElkzIqRAThEJbh4fxdm3tUwDLMd6u1JPgsepyAGGWAQE0Ej4miGBPsPZq/eVqmSfVfitodr+dqqpgnsVNnAqizcJmC0AotFwPMu+pvn736AhVA6RE1TOUrtzle9XTxWU5UHNXPUilSwjhEg/zeomiyPCCph1E+nhlVNVOAAapUQNvz1hr+qrbOePDIz8hB4wC+BGwNpPJZKaOogkMa2qv13Mcz9sSvsL14/TX8j9mENkVhZ12YrK57KvTFtV1QHGyjnvPRA+G3DRqERKlMcFFUOiHNZZxnKVmZ1x0nsQ1GRvEvqr2KJro2o/quVFHmIkFutyOpK5vov977UnBetTUyJHSuTK8DfNIXE5xkB6t2pW0eFiIPqxmLxqKgcp4dB2G7YmlaN625kEA6ELasu0LKXQ6QUgAxQy0eADd2dVZkOmMFV7OPBrIH206g0tJ+jvqE+JSyHe1XrU8rYofqUpMW9tp2pLdWyzb5PQJoo45WeRnF/436T4ECIY4aKSL3quutVVE68YC2SBluAsRFyQObUValCtCgmo0vFLLYSW1PpNusUb7iWSrFtVMgfU14CYA+pyQCJ29pFHa03VBulrM+yqR1Rrfnq0BgqzVovKQwPBKqqB6tHiECuDjSVc4FbV5v1Niz4X4FpJZySuEpgSYpJSPVoHXlqliXIJLXlVWu1Vbc0Xkt8L2ojdLdllWOZVcZWFOIO9nKXOh21B0v5KTBSDHap6qrewYROesrkAbwKSMzNcsrJES9gRoRmDFc9o3afKIV6kV92GwWDooTTxQqVGCpeqhvrtMQ3vqYeoU8oFm3C8Qq4DRFcqnspwKsdMatnA1an6JdUjq0MWvUnWedUjN3u0ydj6woYt+91hTmrWl1Vbx7YvC3rGB82+ZRD+VpY5aO0sI5RsbL1rgYhXVopu/RWozAwi5uhiLfS5FEtnIprQ+2L6b/1elAi1r3l2ylpB1intp6FzOVCJdK1cB/gs3hC3PaDOqhPZRSH4FtbECDjuY2QlPNPWHxi/kOcVVcHJeAf/T41wLYoKMC2Qb6uaDHR/GmqO1WFLauYRG0L6e6o5SaI3BBMSsR7drK6opfxaKuIT5/SNNoFrU80sIa5hcdPOOutG+VTvFvvHA+Ka7OzdQuql12F06xi91Kr+c7aYV2sfVVyI2vTlDr1s/VGKPU8t0sqAaDPL0rld4X1/afCulX47q8JEvfbjMlPKyJ+96mQqstvr4AR4XroJgKd/r5C0f5Rpy4lHQUQVCpjeuHIVsdt8Ohpnb9pfWCbv5ppTPWBXKVQuQrU51NTcTBBpZdZFQJSXZHlC9appu5ibUkAhbPOWBA/KX4nsW4G+svOh+b6F8kME6Yokqmy3/S9KkOGtTymqVU1CSllwkrCG9CRyu6LRofzPhzTeZx1qJU8XivDqBoLc9nAespxT4SkmiZqsiqhmmq1Mnd9ZFAgdAtQ5nUVl1JYvCqHaZryU5tsAt2jTLVHrEftUWlE7BYPVShi4pVzRvAAbpjwCg4SiPV1jHfDtAE3bZ/vandjPF69CUOJpti0F/f8dn3RkaGIZ+el3SF411TTiSIlKKp8t9qw1cq/WDt+ZMyoHVgHAZylSdo4oc4ydeZ85WpfKl/2wroSElNaw0KiQqU2Inm+jOZDr0K21Zsw1HUbSgiyK9Bpax+k/xCfC9OKf0N0/qw5QQNm1dqGgjbVVAtsOORhmSzXWKqSFmBViY+1RAoILbWJhI+C0foGCkaysdZ+8nBeO1y1pUFbbZdyEB3mWk+BGJQIumLlaWd1w2tRCCbJ9tfKHz67pILav4/LKpxz44Jm21L26n86CCQiM9JI+4gEIYSDF0x7scoiEOo5/SYQ9ZyjpkEEnhGI3IGCyXp8BKd0wroMdqPMqspGc6ixAPQ6DBdgryrlQBVZpeX60RbIavUf9IjaTEZX4v9qO2R4CMHih9puIsyCSb5Ru4iVbfEqrHCvmwFfxyf4bmMI6m76NOQ3CWm+Dz8QQolIM0FFjcOqu5ei/jrxV6Fe+UhN9+/h6E/wJEGSwJqkbFFSycvaVMp2RpTS2uBsU20kBvFcqA5MHzhXiRT5g6RqX2GjZTXaQQAUNbTljZgQMwjZdZhGYE6O+nW0mUZbLJANpoRYnqhCDMpC2aoJwPemLjjVxUZuxLDCX9Jx4vxB3ZYMtn0SCRN+t6f6yZvSq0tdP8SjZH2WNWHCDRVZtMfdCqzWIerseY3LLmtA+eayKkO1Ly6rgu4Xlz2E0hb8hyarVD0+NLk6lHYXTy6C1qKqTVI/TGof0v9Ch+wA4ss6MJjsVgqkH+v+Cr7yUdSS89q8w9DUvBN0XAABr7AMCP8AqctVhFxbBzdP+7UJdqq/9xdm7/4Hyg93hYQmZaylabSJFjX50TQ87c3+o2mOI0A30zTvo2lY8iXBhnMgWCd6Cw9QTFF3GQNvakQsqrdi7XJ13uBrx4FaSHuP0STL0sMY5Pn1JET6gklNyAy+yJWb2g4WDBqvUNaFAKzci7Lx0RKaK+pABtRC8f3Ad+EdhIsVtNlmLGUYtjWvQRNmIcBucBADijE27a+Nym9Gl/QpfAdi9iBuEE3Tea3kVFX8fSIJ0hF4MIRrj2dZTW3vTtotO2XuUDkXwNsEgdfmPu1GQ/ZnlDVaHCOY6ks5zIoHerRVK2i3aRMQHR6POUO/EZ3E2FSj40vvqmtKTdqSe/jeWNBYleWRWI+ZqWoZGwf8LCV8bYUu8R8LPx7arIAnhuRq8y04BkFcU41hqj67p24Qe2R1myRlM65OmQHWmNaoeA6yRuCI0KauzmidtJpVTGzAkBtj3tmNBxSoT8lADdTP2oeIzm5Qe1YUAxObmDomwvRHteMVpqLosTZS9ZY9GBsTnbRvETENt0PRNR0Boolumuhd44uNia5MdJAOSXr72OYgKLcsopQHPUY9gphNDJgoBQ0c6KHXoDLKTyAYH5F16fiMuQuPDF1qnxRsbaiE8knBTgcqhZg+OVjRHsvBhk8OlkBGDEqIHnUcqqFq6lCRXcCrCnGdYhmSaCb8xhnqOCvGgaO25kyV620PihoMraZVoHo9BStq+Tm6uNdUFxEmbNL3ObjuPwv4USuRtRXh0wUgkfE8CpIACVHsuRoH1s6KEWyboJLz3E+Zh6k9sKAfxHurJN7nVPYxaPcl1tp9W050GwT2AsjD9GNJUFA9a6gD6IeCKeUV8KGmjUKnIS+VApwzRRC57aGtUswRbq0TYaBY3Bzx5+3MkUgAgP7q/KB4dRSJuju0x4EFJh6LG372lmi3pVpVnDqrlCrbJ6vigQlWlSfwA6BMXlogjzqCRlx0mkTkR65AhDzjaN/B8mcXNK3tQinSzdqdJZnCUvvk0WRQpa4HIcYwZ3YgCLarpDl395BZVaMbSzqStlOjD/FmjFD3U2sMjpC0kRQ5rE5T6JJJf2+8GYBgApbNYUtWxQ8VdZS8erdg6qqW3KWuV1iHdlU+bThIvT4lI3ZEe3lYk/Z+FB5neyVUgtq1bHeDUwbYNlXGwmOIjG9tWSLg4rtY928OMPjTvmm11jvogTZjGXUNxC9tvLfshzYaLqIPWgzBjQ6SmUAntkoINyEYmKesPIbafZZjZOr81jz6c6HJoWfV8rG2eFHt2mr/2XzXVfPeSsirU+rVDOIOO9yCp01SR6IZOgtG24+BKwKHYrfMsgzpIcBI7SgZh069WCJGfdWYE2xA+wV1hARES3miPnJU2yWkJLIqfkI5ZoxXsaBrS/xpdlzSUio3a9MEqg6pTIxra64as+O6pXTt6n77aWsN+ptIgbEqq6+2iKoNtc8jpTPyi/+0TeSo+xZmgO1fdQIOV7U31MRcAmPyNkdVVmHqKB+CLlIFq59qcUgdCXHUR6wz36w3OTa13B+1erZaeCTlv6BW/Lw7vEq7r2vsRw4BJbPmgSgOs7VvccilG7j9KZgRHmpwxAJlTDaPrN48ZhxacXF1zEBUa6s5CFtP899Dlfv9P8BN1etW1Q1d1qfVTRlW4mfZu6hFjYWEeuegSjvUDRhR7US/5/nWl8q1ASMdVV6GWv3zg5hMJd20976rp+YCtOrSGNYcFqLT/mw0sJgPUULcI+OI/MvW3hoVH4CBhiq14ldSpSYdpOAkjl21BTFZoviuQIlzJJT2kKMZT9gbXiNPZzkFdGKpQ9qXZ1T7Bc7tddoEzIyHQ31xYe8CltZU463aBh8khhCztl8IXiey71UwEKCJ02m370L++k+FeajfHwqOXgvERlA9a8+y1wa0q5IhDqPanva9j6yeZtXwMjA2jk4cAYDXbHYqg3Zf40/TKU8fdYjS0Aq0epsa/JAtYZwIXTjahd+Y62dIs7e0Jg6pTfncbmvfOQ7XnDh6x7LXtaLL577W59LzUfdHxRVVaF5K3kIv1GC54VIwCQk9S97UW1woliVaLIIOyUEORssuiKF7RYK9ekGlBS6c19zXmgzDU/EYqYkYvbv8VdoHbcQEYzDbdhlcta4xSkAtI/anToapOogCJRWVxsQhJqumPp6uPX1FGGX93JphuWBU9Z4HQhOo+STyKJmoJ84RNMM2wercG9epktCUTcZIUuu6VLAgHZWkE0ODisTLRBOfgcmmZtQkUgqbfDjMW9Zq76JMXFUPKwoESaFgnHPobBdl73A8ZV6UCB3qX1YyXBpQJ/fc0bTHAydyZZbT1QnAOuusgVmJAtpAqYb6AM6/T8oeXNSOSmGyWratrjPteAx4zizRnckKqXmfp1PrdNRRZmoJ0la2/tW4+tmDNbSlLgD146m7N+oEn2BFXKDcKTMTpEoU+JZt8NbObew+6EQOnQQUa8R5pU1UpOifAw3VcCEjVuPpiOg1URhMSm5cR1Wzjrrjo20Vy/NodyZeXMdWMXVA3I5v5sW2c4l5iEEdSM19dnGx5Ec7kuGu9eiougEL4GGVHL8MHjYc4Q69qXxa779vHPifXrElHgLvCyqe37696vx2tAAMVmex7qE5VI9UUvGkYI06xazxlah2hKM9aQUeoVxthyAjnFUlJohNO2ME6y7uf3dwSvokg5u21oFRSFQHNdbWH5WDEqOvwc69UeJax6zpLBxtCrp4iLbHBcuNxqf+3GjxAUKNuFrXqelEm3M8nAZFguPg0LjX8J/TO5CCSvxZ49ZVs4tpFhhB0QksVTYfI1Dh2owbLqymxkIMvYwgf7an6EAPncIQPk25qjXncpSzijpHspyQRPqIkPhFcV6bk5daf5OOVVxbQ9hKcXzqetc2Pjyv4+h0gAy05ynybiLx1R6cS/CEQDmG+0leaE0Q99qFpqNfh7jGxqOUn+ISkKpUA6tZVTgHmHpQnw1CKFkNyOHR8MEG60JS6fjFdQk92jUe1LoD/xhXcaJ8ouTSHs2icw6IVZP7TskgZINrqrfrbJ0p2mxnpyAhJOLCZHp8VWgWGqkPKMqRj7HtZjkf9Uuq1A3UcqGpyGUTmhUQlWggxiy17foymesaxDi7drYiPYYdlpNUEmWsSuiPkZRAuJMQOifAx7pwDRU2lZNkTpi6rG0/2o0xCAHqelebn7ITyPcH7HUdGwkIuKdNgOotqBL7qBJpRZ56eTusBseaLDhAOHV2g2ViVf/sSmXDxxFp8ujt3byxFdvoAGbyXF7R/GRErUojUztJtw6w7KqBFVUfxDklbsSAX9EmxF2wIxTNsh3e+6EHdlTRCt4oGRE2NrDwI4wwXRuyWhJxlEc4iRHePAlLCweEaHnbfAjTVVuwdkEQPxU9WX1tlmGVl+qDWUwOlDrKxVt31lYPIvEf++HfA3OkikzkUbTvXBsmbH8JFJDnJXKJ5KLVqk6C0iFsemZoiDT94AHVjgVzLHDIJ/oUUIZLG4baQ+LpbJao7q8XEpNcnzbFwEKx1IUlwm4xIC4CB2V4B6c6OroASaSmHu2tyGr+TmfrK7OihKpO0/PaeZCVSS5GKLp2r1477mZ8DgdpMznbatMIFQeX06PB6dS/ArfbarBhxFu9UAANYUNJy6XzwW5UC7QJK+YXYuy0wxmBeM5R+kTH+qntGafkD0RB0nFPANFTpVOHLX1hycSW1MigMteAp2c3ylAiRid/TcMSaBKQfZrGAj485Ru4p04gE5gFpSOY5qmOD21DaDpzbmBH9RqYYfgBWM9qZdAmLIsGOtsSk0LArIi9N3nTjNBUbqYi2Rxj4JMBeHE6oEjHrKl0FrM64g//gDNALPpBPQRVM01FKLjqPGw1rCClPtu4sdyqPQ9u/9jHrS+m1dRuPb/OMdM+7vHr0Qe/f3X/ICWylyJMJk4Vftqq718kVC1xSK9BLiFntmdJpNnOldo6xEhnlh7VC3JnOgsGte9Tj1zCXvZtwWoQOrYOK7zuJutNf6i6T2Gvol60N0ON1joyD74cdU6jjjUdqmhmFkSHe2XtntRZfVhn6E5n0L3PkRw6EyMoPDKX2g7EiPgTygdhOaWq6MpK6RQcQLFsdZ8YgRQLg7Dnj8a2PFsTnFZINHRG+9ISCpBrQg4gAbBzyU+4Tde5MBfMjdGAvjB7TpvGjk9ogsY8qsxZOqaDWatPSFu2eDq4AEakgxTCVTLRmsPtbC+deJKPtTFqg0zed6tdXD13yQ4WYm1Sq1Ks+UosZ7WB3mlb39XjZIkK26uq9UDSIyFExZK2cTFnS20R72LgPgzVURZPlVR22tqH+dnNiaTXxg3ob/kcmSQ1gFw/Vv+wngNAFGWsPRFvBTReF88IOuxwj1ztgDo0mdIUl6kZKmbpvE/ctDqmeWtU82hUikUa1dColg992KhEBfbLVs0S/k07smJVbfiAdhJIqksIJdWyocE6RalY7oogM3QUIKRoaNutDsxCoaChCMnaVadgLjeSYj9bKVMXtXem6nhOtY6IZ8PThL06F1vJ/6RtVV+LvFUBgHTbGovuToiwjil72bHI1xY5WKkXCkHcZTnVONfUGy/FVlk87e1UqkcHnkSdnVarMutD25Ahu9K0dq4NoSB8UnGWwtCpPjodLCcGM9R7AB+aLRCS5GZRDTIfJ7vaX9MlRZEr/DrayZF00IB4W7K9uSWrnTXnqWM/mp2j1f5RJiI9ZcahKv8fVCjwOEqNYa8AAAGEaUNDUElDQyBwcm9maWxlAAB4nH2RPUjDQBzFX1OlRSsO7SDSIUN1siAq4ihVLIKF0lZo1cHk0i9oYkhSXBwF14KDH4tVBxdnXR1cBUHwA8TZwUnRRUr8X1JoEePBcT/e3XvcvQOEZo2pZs84oGqWkUkmxHxhRQy8IogoQuhHWGKmnsou5OA5vu7h4+tdnGd5n/tzDChFkwE+kXiW6YZFvE48vWnpnPeJI6wiKcTnxGMGXZD4keuyy2+cyw4LPDNi5DJzxBFisdzFcheziqESTxHHFFWjfCHvssJ5i7Naq7P2PfkLQ0VtOct1mlEksYgU0hAho44qarAQp1UjxUSG9hMe/mHHnyaXTK4qGDnmsQEVkuMH/4Pf3ZqlyQk3KZQAel9s+2MECOwCrYZtfx/bdusE8D8DV1rHv9EEZj5Jb3S02BEwuA1cXHc0eQ+43AGGnnTJkBzJT1MolYD3M/qmAhC+BfpW3d7a+zh9AHLU1dINcHAIjJYpe83j3cHu3v490+7vB1eQcpzleGeSAAAPnGlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4KPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNC40LjAtRXhpdjIiPgogPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgeG1sbnM6aXB0Y0V4dD0iaHR0cDovL2lwdGMub3JnL3N0ZC9JcHRjNHhtcEV4dC8yMDA4LTAyLTI5LyIKICAgIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIgogICAgeG1sbnM6c3RFdnQ9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZUV2ZW50IyIKICAgIHhtbG5zOnBsdXM9Imh0dHA6Ly9ucy51c2VwbHVzLm9yZy9sZGYveG1wLzEuMC8iCiAgICB4bWxuczpHSU1QPSJodHRwOi8vd3d3LmdpbXAub3JnL3htcC8iCiAgICB4bWxuczpkYz0iaHR0cDovL3B1cmwub3JnL2RjL2VsZW1lbnRzLzEuMS8iCiAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyIKICAgIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIKICAgeG1wTU06RG9jdW1lbnRJRD0iZ2ltcDpkb2NpZDpnaW1wOmU4ZDY1MjczLTc1MDktNGUwMi05Y2E1LTc3MmM3Zjc5N2EwNiIKICAgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDpkMmJjNGMwMS04Y2JjLTQwMzUtOTQ3ZS01MzMwMmU2ZWZhMWYiCiAgIHhtcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD0ieG1wLmRpZDoxNzc4OWQxMy1kMGMyLTQyYTYtYjg1OC1iNTg0ZWVmOGJkNGEiCiAgIEdJTVA6QVBJPSIyLjAiCiAgIEdJTVA6UGxhdGZvcm09IldpbmRvd3MiCiAgIEdJTVA6VGltZVN0YW1wPSIxNzI0ODQ3NTIwNTM3NjU2IgogICBHSU1QOlZlcnNpb249IjIuMTAuMjIiCiAgIGRjOkZvcm1hdD0iaW1hZ2UvcG5nIgogICB0aWZmOk9yaWVudGF0aW9uPSIxIgogICB4bXA6Q3JlYXRvclRvb2w9IkdJTVAgMi4xMCI+CiAgIDxpcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgPGlwdGNFeHQ6TG9jYXRpb25TaG93bj4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uU2hvd24+CiAgIDxpcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgPGlwdGNFeHQ6UmVnaXN0cnlJZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OlJlZ2lzdHJ5SWQ+CiAgIDx4bXBNTTpIaXN0b3J5PgogICAgPHJkZjpTZXE+CiAgICAgPHJkZjpsaQogICAgICBzdEV2dDphY3Rpb249InNhdmVkIgogICAgICBzdEV2dDpjaGFuZ2VkPSIvIgogICAgICBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOjk1OTQ1ZjIwLWZmMmQtNDU2Ni05ZjY0LTBhNTRlMTBmODRhYiIKICAgICAgc3RFdnQ6c29mdHdhcmVBZ2VudD0iR2ltcCAyLjEwIChXaW5kb3dzKSIKICAgICAgc3RFdnQ6d2hlbj0iMjAyNC0wOC0yOFQxNToxODo0MCIvPgogICAgPC9yZGY6U2VxPgogICA8L3htcE1NOkhpc3Rvcnk+CiAgIDxwbHVzOkltYWdlU3VwcGxpZXI+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZVN1cHBsaWVyPgogICA8cGx1czpJbWFnZUNyZWF0b3I+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZUNyZWF0b3I+CiAgIDxwbHVzOkNvcHlyaWdodE93bmVyPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6Q29weXJpZ2h0T3duZXI+CiAgIDxwbHVzOkxpY2Vuc29yPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6TGljZW5zb3I+CiAgPC9yZGY6RGVzY3JpcHRpb24+CiA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgCjw/eHBhY2tldCBlbmQ9InciPz61VuTxAAAABmJLR0QAXABXAG+wXt1JAAAACXBIWXMAAA3XAAAN1wFCKJt4AAAAB3RJTUUH6AgcDBIoWCex5AAAIABJREFUeNrsvWewJFeanveczLq+vUV3o+HtAOMwfgYzwBgMxuySy41dklpRIiUuFfqhkEjRhJZiMCiSEvVjqRBDjiFRZDAUuyuSG2u0nB2HwVhgZjAAxgAD1zCNRnt3u/v2tVWZRz++L6cKF92N7punbrn3ici49zZQVVmZJ895P3sCYmTJsiwAeYyxAYwB40ADaMQYx4ApYCtwHbAX2APsArYA08CkH1N+THT8PenvmetKC1GbCLSAFWDJj8VL/L4IzANngePAMeAocBK4ACyHEFr+Xk0/VoBWlmWxKIqoSz06BF2C0SHP8xBjzHzRz4CxGOMMsAPY7T+3dhybgQ3ARmDGj2lf6KvFvdFx5Kt+zzXGhEhGCRR+VIt45++dC/sSsABcdEEw58c5YNaPs8Ap4AQwG0JYCiEU1dFqtUpdcgkAMaA0Go1QlmWIMVYL/wSwza346tjtP6vFf1PHMd2x0OdA1nGEjvETVh2s+l0Ikc4TEDsEQee/df63wv972SESVlwQXPDjfIcIOOlC4KQfp4ALIYRmCCGGEGKWZbHZbMpDIAEg+pksy0KMMXfrfluHRb8dc+PvA67333e4lT/ecYx1WPFXGicaP0L0n0C4knCoPASVIKhCChdcABwFDvvPEy4QKo/BuRDCUpZlpUIFEgCij8jzPBRF0cDc9Jt84d8H3Azc6L/vwtz6m2i79SdXLfRBY0OIkfEidAqDKmQw54JgFssjeAM46McJLIxwIYSwFGMsdDklAEQvbl4IwRP4JrDEu23ATcBtwC2+8F9H270/45b9ale+EEKUq44VFwNnsJDAEeB14GXgFf/7vHsQmnmeF/IMSACILlLF9cuybGAx+h3AfuAGX/xvcat/nwuCyqVfxfCFEOJqqfIHmliFwUngEPCaHwf972PuMVjK87wsikIJhBIAIiVZloWyLCdpx/L3+2J/u1v913dY+p2ufSGESMGKC4GLwGkXAAfcK3AQyx84EUI4H2Ns6nJJAIi6NymELMY47Yv79cCdwLuAO9zS347F9me06Ash1lEMzLnlfwoLDzwPPOOC4EQI4fzMzMzKxYsXFRqQABDXuPA3YoxTWOOdG4F7/bjT/97li/7qsjwhhFgPIpYv0HQxcAR4FXjBhcDzwLEQwhywHGNUaEACQFxh0a8S+yax+P7NwF3AO/y42S3+SSyhT/dQCNEPVEJgHqsWeBF4zo+XsFyBC+45UPWABIBYtfDnWGLfLiyh707gncA9WJJf1YK3oSsmhOhjr0DlETiNVQw8AzyLhQYOYWGDZdrNjIQEwMgu/lmMsbL4b8Li+/e5ALjeLf4plMUvhBgsWm71n8RyBJ4FnsJCA1UZYZPLNzASXUQJYz0ky7IMGI8xbsZc+x8BPgt8Cng/cCvtUj6JNSHEwE1zWLhyG+1NxfZi3sxAuythkWVZjFE6QAJgyGk0Gp2tevcC7/FF/7PAx7Hs/i1Y/b4WfiHEIBNcCIz7vFbtLFp5NiPtHQlLqQAJgGG2+kNZlhMxxh1Yct/9wOeBz2BJfttl8QshhlgIjNEuad7noqABtGKMKyGEVp7n0gESAEM2+q2sbzMW5/+QL/wPY/H+PViCn+6JEGLYhUBV6bTdhcBebH8SsLBAM8/zQipAAmDgmZ6eDkVRjMcYdwHv9UX/8y4CbqHt7leSnxBiVKi8ARuAnS4CrnNDaDnGuJBlWUu9A7qrxEQ3FVaeZ2VZTsUYbwA+iLn873MvwEYGp5a/avjR+XP1rmKX+imE6M68famflZu98+cgzC8lVhZ4BusZ8APge8AzIYRTIYSVsiw1pyRG9eTdekJDCEBeFMUWrFf/R4BPYHX9u+nPsr54maPAdvyax7YMXcD6gS9jGbzVUaz6WUoICJHUYs583m5gHty84+8xzK0+5Vb0jP8cXyUGOsVBP323KfcAzGChgV3A9hjjU8DhEMKCth+WABgUhT7hLv97scz+j2HZ/Vvpn+z+1XuCr/giXy30S34sYPW6s9he4Oew2t55FwErWNxupeNoSgAIkXyRzH3+mPCf4x3HBOZO3+LHVv+50RfXST9m/Jjy97iUN6GXa9IW/y4bsd4oO2KMP8CaCJ3Psqwlb4AEQL9a/nmMcTrGuB94H/AA5vq/kf7YrKd6cFodi/eyL/JnsW09j2KtPM/6wj/XYflX1v+iv7bT+i9WWf9CiPTGRdbhAWis8gJMdHgApjs8ARt9Yd1Bux5/N7aJ2FSHgBjvA+9A8HPa74JmK5Yj8F3g2RjjqRDCihIEJQD6bfGvsvw7Xf7vwTL8e13aV3Ys1ktuxZ/0hX71cQpr4Xke2/ZzmTeHBMpV3gNCCNVPpM6F6PpcEwBijGHVwnmpo8q43+iL6Q5f/Hf5z85jB7DJ56sG7bBDL0TAmJ/Pe12o7MBCAk+GEI7keb5YFIVCAjUvskjzQI57bf+9wINYst9dtDP8e2Xtl26Vz/uiftwt/MMdxxFf+C8AyyGEAmj5z1ILuhCDzfj4eFYURVaWZeUtGPP241vdQLnej/1Ybf4eFwjbXDz0MqEwutFyHPgp8E3gsRDCK1mWzUkESAD0jKmpqbC8vDxeluUurH3vw8BH6a3LP7qlP++L+hlf5F/CenAf8AX/IubKXwohLOd5XrRaLS32QowAmfXeHcPylaYwt/tmFwJ3Andj7civc0Nm0yoxsN5zWhPLQ3oReAR4NITwQgjhXFmWEgESAOv+AIUY40SMcQ9W0/8F4MOuoKsHZT2pSmnmfdF/3R+WF4CDrqBPhRDOxRgXQwhl5bqXlS/ESM9jwcMJORZ33+YegH0uAu7GQptVH/9qV9L1XkMKN2oOAN8Avg78HMtXauluXhtqBFTvoZnyZL+PA190y78Xi3+BJeSd8wfj+/5wfAt4DHjarf/jIYQLIYRlb64RY4wol0aI0cWf/1+U/IYQln2RPYV5Dt9wA+I1LHy4QLsaIWd9QwMZlqy4yUXKBObFnEPbC0sArIvbJIQMmIkx3owl+lWW/3U+INfrYags/tNu6f/QF/1HgcddGR8BZkMIi66QSy34QograQKfW5ohhCUXAycwj+LrWKXQGSyEGF0INNZRCFQJgpuxHIZJnwfnsFwBhQMkALqqQDdg7rAHgc8BH8AyaNcr0790FX7SLfsn3eJ/xEXAS8CJEMJFLG6mB0IIsVYxUGRZthJCmI8xzroAOOjGxTlfdFu0W/uuR45AJQI2doiApouSBc15EgDdWvw3Ytn9n8YS/t6H1ag21ulhrNplvoy5+r/uFv+PfOE/qQdACJF04rFQYZVcvIAl453AwgNvYF7IFdqhgaqEsNsioEE7Z2HGz+88sJhlWSFvpwRAEhqNRijLciNwD/AQ8Fng3T7wun0dq3a8c668f+jW/qPAE77wn3IlrhiYEGI95qNF2s3DjvjPcz4HdTYV6qYQ6BQBWztEwLkY47zvKKg7JgGwdsbGxkJRFDNYacxDbvm/E8uG7fY1rOL8x4AfYzWwX8c2yngxy7LTjUZjuSxLLfxCiHUXAlmWLfvCf9yFwGkXBwFzzXe7u2AlAmZ8Tp7p8FLIGyoBUOMC5XkoimI6xnhbh+V/7zot/k1/mF7yBf9rwLdCCM9mWXYyxrgQY9TaL4TonQowE7vI87zqMHqswxvQ8nmy8gh0Mzcgp93LYALLBzjnYkQiQALg2ugo9bsZ+CSW8PcuzNXUzWsXsVr+Q1hs/6tYkt/TwKE8z+fU+EII0W9CYHp6ulWW5Tzt0MAxX4grb8AE3c2Xyv1zNvvvnSJAlpIEwDUt/pMxxhuwOv8vYH39t3d5AFfdrp7DYvyVu/8lLPlvRTEtIUQ/0mw2iTHGPM9XsPLBk37M+tw27Qt0N3dEzf1zNmGhhzksMVA5UhIAV81kjHEftqnPF7BSv25m+1f9ro8BT2Hu/kewuP8xr+PX4BVCDII3ANpNhWax/IAzWKXAOO0dCLuRG9CZE7DR59YLwHnvayALSgLgCqPHNva5DtvG9wtYh7/ddG9TnwJzVb0G/AD4ChbrPxBCmEUtLoUQA6oFgBXvSXLaj2XarvpJ2t0EU1NVB2zoFAG0dzeVANAleMvi34gx7sQ29vk81ulvX5cW/84NLl7Auvh91UXAobGxscWiKDRQhRCDTulezFksJNCZFzBF9/oGVM2CZtzQmgXOZ1mmUKoEwKqLkeehLMstWKLf57DEvxu7uPivYPX7P8Fc/l/HXP4ngaay+4UQQzbHNrEEwVNujRcuAmZodxFMzbiLgGkszFp99sh7ViUAOlfkGDtr/T+LtfvtRrJKFe8/ijXy+RLwSAjhxRDCBRTrF0IM5xwLUGZZNh9jPIGFBFq+OG+ge3kBY/7+Y1hS4MkQwvyoz7USAG9WiTdi/f0fBt7hg7Ibi/8icBhr5fsnWLz/cKPRWCqKQou/EGLYhUCZZdmy7y1wCvOGVkl7E10QAdXeAdP+3rMuAkY6H0ACAAgh5NhOfh/xxf8+rMVvandUxDpTvQ58B/j3wOMhhBMhhBXF+4UQIyQCYp7nzRjjnHsClnyB3kx7S/WUIqBqSFRtHHQG2ym1OaoiYOQFQJ7nWVmWm7G+/p8HPuZiIHW5X9Xc52Wsvv/LwJMhhFMhhFZZllr8hRAjJwJCCC0sKfCsz5FVI58p0lcIdFYfLGC7pl5gRPMBRloAbNiwIaysrExicf+HsaS/m1wlphx0pQ/wF7COfl/Dkv1OAy1lowohRlkH+AI83yECxl0ETCcWAZ2hgDGsNPCEz88jNxGPtABoNpvj3unvk1jS311YokhK13/n4v+IL/4/84Gu+n4hhDAK2pv4zLshVm3uk1oEVM2I8Ln4jJcpjpQIGFkBkGVZHmPcgTX5+TzwXtJv7VvF/F/qWPyf8QGuXv5CCHFpEVD175/pkgjIXGBM+GeeCiGc8ZwECYBhJoQQYowbsV39HgbuB/aQtuSvWvxfw2L+X/HF/5wWfyGEeFsRcAGrDtiIbcA2nXjNqvIBxjAv7QnavQkkAIZYAIwB1wOfBj4D3Iq5g1Iu/ktYtv+3sIS/n3pbXy3+QghxZUr3AMxhodJNmId2inQh2mrPgAn/+xRwxMsTR8INMHICwK3/bVir34cx1/9m0sb9V4A3gO8Cfwo8FUI4G2PU4i+EENfmCZjz3ze6CJhMOF9n7gEYw/IOjgCzWZaNRHL2SAmAiYmJ0Gq1JrBkv4ewkr+9pG312/RB9BjW4e9HIYTTMUYl/AkhxNpFQInlA2x1EZDKY5t3rAHnff5eYAS6BI6UACjLMsdi/R/Dsv7vxJJLQsLBehL4oVv+PwghHI8xNvUcCyHEmufVedobCG13ETCeaO4OtJsEtbAuradDCCsMeVXAyAiALMtCjHEaeI8v/h8AdiS8BhFL8PsxFvP/XgjhsBZ/IYSouUJbs6AFPyaAnVjotpFIBFShgNy9DYeBuRDCUIdtR8kDMA7sx5L+ql3+UjX8qbr8vYiV+n0rhPBajHFJj64QQiQx4loxxkUszLrFRcAMabq2BhcB4/73EaxR2yJDHAoYCQGQ53leluVW4MNu/b8TyypNkUhSbet7CMv4fwR43ne7Uos/IYRIMdFa2+CmG1sBSwjcTrrKgMzXxHEs3HAU69kytF7coRcAeZ6HsiyngJuBL/DmXv8prP8CKx95Aov7/xiYjTFqVz8hhEhL6QbXgi/Uu0ibD1AJgDHgGHDcBcdQzuej4AFoxBi3u/X/MHAH6bb5LbFmFT/1xf9xrJmEMv6FEKILhBBKFwArPpfvwkICKYy6qjfAJO2KgLO+bbAEwCDhiX+TwC3AF7Ha/x2kiRlFLD50AIv7PxJCOJRl2Yo8/0II0dW5vYgxLrixtcVFwEbShAKqqoDgHoAjtMsQJQAG7Pttw5r9fBG4jXT1oy3MRfQt4MshhJdCCAva1lcIIbpLRz7Aov/TTiy0m2J+rxICJ7CNgl4HzjCEuQBDKwC8498U1ub301gIIJX1X2Ilfz9x6/9HWZbNlmWpTn9CCLE+c3x013zLrf/r3OBLVRXQwFq6n3RPwNB5AYbZA5BjrqH73PpP2e9/GXgVy/j/ttf7r+iRFEKIdaXosMy3YXu8TFM/FBD8GMNyAV7Hkr2HygswlAIghBAwV9BNwAPAg1i5SCPRgKu6/X0N+HkIYV7PoRBC9IQWlhA4hXV63UGaqoAqDLCElQQexSoChibMO6wegCr2fx/W8/9u0mT+Vw1/nvXF/wlXhSr5E31LlmXBRXEV2wyrjrf8WwjhF6/zZFpdSNGvBl90ERCx/i77sJBAnmDOz/19z7sAGCovQGNIx8QYlhV6D7bxTyrXfxOLBf0YeBo4HkIoNDmKvlPA1v8CrAy24T9zn9CyVT+Di9gS83AV3sei5b8XnnBVhhBQoqvoJ7zh2iLwGuaZvQPrDbA9gZEbfC25Fyv3fiXP84WiKIbiGRhGAZC5CrzFLf/rSFf2d9Gt/yeAg8Ciuv2JfrL0gTzGmPvGV5Mxxs1Yz/QNWNvUKcwbVh0T/sy0fBJdxGqs573MqtqJ7TwwF2NshhBafsRhmQjFwFNgidnPA9/H2r5vJE1VwDTWOv5u4NmyLGdpVx9IAPThd9oJvAO4nTRtIiOW+HcUeMpFwCxy/Ys+sPSBUJZlVpblhC/2O91q2e0CeIeL4pmOY7pDEOSYd2sBC3F1Hhd98T+Jlb2ejDGejDGeDiHMu2cgqvOl6DUhhGaM8agbaPdg+QC7EqxzmXsU7gbuiDEelADoX8Z90rsTiwWlyHOIbgU9BzyDhQG0y5/o9YSXF0UxQ3uP9J1u+dyCVb3ciLlBp/1ZzzuO6u8q/h/dimr5z85jxcf/Caz65RXgNZ9sz7oYPh9CWJYQEL3Cx9485p39sRuAlfCt6wXYgLWTvx14MsuyM8NQ9j1sAiB3C2g/cIP/nqIzVMstoB8DLzPEvaHFwIzz6RjjDqzS5S4XvDfS7o2+FXOBTlziGQiX+TuuEr2dvxf+TN3hC/5ZzCP2GvAC8GKM8TBwLoSwIiEgeiSKC+BsjPGnwLv9mZhKYAiOYZ60m4C9ZVkeHhsbm282mwMdAhs2ATDm1v/tmPszVdnfnC/8P3frXzX/olcL/yRW4XKrT3Dv9t/3urU/2WHlZ9do+YQriITcn68Zf7ZaWHjgFLYT5otYY6xnYoxv+DOzwhCVTImB8ALELMsWY4yv+nx9jxuCdavAgr/Hfn/eDhRFsTDo43vYygBnsK1+P+k3PkXpXxNrAvFNLLnkONrsR6wvVT3yDrf2P4Z1t/wU8D7MNVm5+sfWuPhf7SSYubAed8tqCxZr3e8/t/m/R2DFLTIkBMQ6egEqj1XVF+A6zIWfwhtcYm2BX4kxDnwJ+NAIgCzLshjjTqzl7wOY66eR4GbPAT/Ddvt7PoRwUZOZWMfJbMwX1duADwKfwXpbfNAX/q0dVn9Y78fOn7EJLNa6GwsT7PG/x2lv39rUcyPWyQuALQex8GenyoUZSzDecywp9mXgaJ7nzUEuBBsmD8CkT5L3Yw2AttecEKNPXEeA7wHfCiEcjzEq+U90nYmJiVAUxYQvqvdhW1l/zgXube4NmEhk1aTwDFThic1+zvuxsMQ0VkEzH0Jo5nmuylnR/YUtz4kxLrvlv9+9AHUrwioP2DzwBnA4hHBxkPNdhkkAbPWJ8uNYDsB0gvesrP+vA8/K+hfrYlZnWWi1WpNuTd8PfJ52WGuXL7TdcPGnEgJTbnntxioTNriYvgCsjI+Pl0WhfbNE9yjLMuZ5Xnjzq2qPgFTt4FtYEuyhGONJBjgkPBQCYGxsLJRluccny4+55VH3RhfAaeBx4JEQwlFU+ie6vYKGkMUYN7iI/STwBeAjLgZm6I2rv44QqMoTN/ozNRdjXBobGyskAkQ3GR8fpyiKlj83N7sImEwwtjNsf4BXsfywJQmAHjE5ORmazWbl/n/AvQCbqe/+X8JKnL4D/CCEMKfSJtHlxT+PMW7F2o4+5Jb/e92SnhiAhf8tzgwsD2ATFrLYApQxxoWyLBezLGspHiC6RVEUhBBamDf4Bj82Uj8MkGMerYPAK+4ZHsi1YeDLAJvNJm4xXU875lh3oiwxd+WrfsyHEErNVaIrq6RtttOIMW7Hyvo+jXmz7nAxO8jPaUa7fGoCCwdsijF+L8b4ChZmkytAdIUYYwvz5L4MHCZNeXjDxex+4LoY46np6eliYWFh4BaIxhDc4OAWxg2Yq3E8wduWWLOTA8DBEMKKNkARXRzDDW/q834s2e9jmMtyA8MRpgu++O/BXLDVfgSPAi/Iuya6zKwLgNexMtqZBON5Cus0uw84sLy8vCAPQO8ml83uAdiR6DstY53/XgWOZ1nWUrxSdGXwmtt/M5bg9zAW96+6l2XD9FWxMqztWFijgSVPLccYD4QQFhQOEF1iHmtWddDFQIpdAidd0O4BJgd1fRgGD8AY7WYkW0iT/HfO1eIbIYQLRVHIOhHdWPxXJ/x9HGs1mmr76n4kxxID34ltqDIHLMQYX3fhLURqqqz9g1gYYC+WC1CHCawi5zraYeeBE7ADbWHkeZ7FGKcx1/8O0nX+O4m5/49mWaauf6Ir63+Mccqt/fuBBzG3/zAv/p3egC3Ae2h3M9xF/UYtQlzJC3AQ28jqfCLjuWp+tQ0YDyEM3HM70B4A3/N8iyu6LaSJlzaxdr8HgJN5nke5/0UXGPdx+xEs6e9u0uxaNkjGx04s7+GCewKWQwhnvIObEClZwpr3vIJ5ePcmMIAnfQzvwVoDLw/iQzjQTgC3/K93NVb3+0RsT/QTWAfACysrK4pLim4I72rx+7RbwhsZrpj/1T6/e4CPuifg7hjjhizLgoaISEwTCwMcxqoCUmxU1ehYfwby+R1oD0CMsZFYAFSxomPAuSzLWmWp8L9Ih8f9N2JJf590EbB1nZ7F2DHpXWnyCx2eiG4vxhNYOdXH/dmbjTEeGB8fX5L4Fl3wApz2+X0O88LVGd+r1x+FANbNdZFloSzLcbek9pJmt6dlbHvTY8BFlf6JLojWcSzu/yEs9r2H7sa+qzFc+PhedOun5Ufh/0+10UnDz2cCc3GO0922w9U2q7dg4ZDDMcbZZrN5FPUHEGkpsCqAw/5zW833q9oM73UBkDNgbYEHVgDEGDMsZrrTb8JEgrddwRIAD2N7nQuRjMnJyWx5eXlTjPFubDe/GxNYIVda+Asf00tYnP24j+2TWCLURRcEpS/605grcyuW3VyV1m7w52uc7rg5M//cu4EPAAdijGewcJwQ3RIAJfXyxt6yBmVZNlA9YwY5BFCV/1X7oKeYmJax+P8xLGtUiGQsLy9PxhhvxGL+VZe/1AtqtfA3sX3LD2L9LA75xHfMJ7+LvsAudwiAyQ4RUHnWrnehcivt/QjGunDeDawS4F4/joYQ3vBObkLUJoRQxBjPYfldZ/05qet9y/152QFsKMtyngHyXA2yB6ASAFtJ1/1vzq2jM6gmWSRkfHw8X1lZqerf3+MTRuouf9UW1tXC/zzwE/952K3+ZRcHhY/50l9XbXLSGQaYdsvmZj/vd7twud69Ao2E3ovgAuQmLC/iFfcCXNDoEYnWjNKF70ksF2CR+l6tyguw3YXAKQmALjM5ORmWlpYqAbCZNDHUKv5/0q1/xf9FEsbGxkKz2ZxyC/o9wJ0+WaR0/Rdu0b8B/BT4gS/+h4DZLMsWgVZZlrEqV75U570QQvB/DsC5EMKpGOMR4EXgx1jo4sNYS9WdpN2kKPf3fBfwLLYZ1yLahVOko+VC+ARWDlg3d6wSrlsZwDLegRQAKysr1blvdhEwluDCV+V/p2T9i5Q0m83MLf53uyWdohVpp9Xfckv5Zay//vexHvvHY4yLIYSiMy55pY67HaIg+t8FsBJCuBBjPIW5T1/BKhg+7N6AlG2Lq6qA+7BeHGexkIUQtTF9G+exUNgpLNeljgFZ7QuwlTSJ6BIAb4eX5o25AEjlAVj0AXFWFodIzIQvlPdhsfTJhJZCC3P5PwM8AnwXeDnLsvMhhGZRFCla7JcxxpUQwtkY44J/3lm3oD7u3ylVHXRGu1Xwc8BLWZZdKMtSFQEilQBY6Jjr6+aYrBYA8gCsx33sggBY8gFxngEr5RB9Te5j9CbgtsTWf9W34mngT4HvAIeyLLvYjQUzxljmeb5YluWxGOMSFipbAB7CwhqpJsAJLAHxdmBfWZbHUVWOSDSMMQ/vbKK5Xh6AHqi4qp56s1seKb7Hig+IOXkAROJnbKdbybtIV/ZX+nh9Fvga5vo/FEJYLLvYvaooigg0vWXvT/w8Gv69bvfJMIXAn8FCATdjoQDl5Ygka4cLgHNY2KxIMFbHsT4AGwZtTR1IARBjzH2i2Uia+GN0D8A54KKXi+hpESkYxzYMudWthBQWQvQF8QDwTeDbwMEQwtJ6banruQHnXIBMdjyLVW+DFNdtjwuALVgPAz2UIoWArYy9FAKgWker8tmJLMuyckBayA6cAPAs5cr6T6W4Wj6hzgFL2pdcJGQCSzS6wcdsCut/Bcv2fwxz+7+SZdlSDxqQlJgr9Wf+3bb5JLgrgdCpPCc3YmGThn9vIVLO98u0y2DrCtZNwMYYY9VkqO8ZuM0LfG2edKsgRcylignN+aBQ/F+kYsyt/n3uBUix1W/plvfPgceBF7Ism+9h97EihHAay0P4PtZ0aDGBtV51B9zjx4ZGo5FpSIkUy0jHnH+RNHkAlVG6mfT9PSQALnGxU7r/F31SXRgU5SYGgklfvG4gzWZVYKGq14GngOeyLJvttbsxxriClVX9xL0BJ0njWh1z6/9GYEdZlhIAIqUXYM7n/RSepYYbpDMSAN2n4Yt/iiYk1RbA52j3RRciBVO0W+lOJ3i/yvp/DmvKczzLsr4oj/NGQ6+4MHnNhUqK+WkbtlHQLs/9ESIFhVv/50mzNXDugn9ykNbVQRUAuXsBUrQirRIA50jjuhSiUwAvey9kAAAgAElEQVTsxUIAU4nG6VEXAC+HEOZarVZfjFcvOzyNtR1+EesV0ErwnG/BqgF2DPB8JfpTAFR5AE3ShKzG6N7mXhIATvCJYYx0vchXaLcclQdApGLcLdhtpMmMv4jF2A8As56J3z+TSZYtY6GAF7GOgcsJnvVpX/w3ywMgUmpWH59LpCkFrARAiq60EgBXqbZSeQBatPdIF6K+Sg0h80V/mnShqjlsk59DLlj7irGxsYiFKF7DNh9KEQaoSn6ngfE8z4NGl0gkAJo+76cw+n4hAGKMEgBdJmUIANr7phcoBCDSUNUGT5EmKajA4pVvAMdDCH3XrGp5eTm6l+IwFqpIFVJrYMlVUzFGhQFECmIXBMA43dkqWwKg07jqkgBougdAAkDUtf6Db1c9Q5qkoCr+fxrbsGqu39z/HaxgvQGq3dZSeNUqMTWtMIBI6AFoJRYA1Tba8gCsw3lXAiAF1UAoqq1ShVjzam29KlILgGoTnkHYq2LJRUCKEqtK8FfelGx8fFwPqUjlAWiSpmS12p9GAmAdSJkEGGmHAOQBEKkYdwGQqlfFMta6dBAqVZpYKGCOdDXW035katQpEgmA1B6AlInpEgBvIwBSlgG2EipBITo9AFOJxuiyewGWQwj9XqlSulBJ0VkzrBYAzWZTCkDUG1QhdOYApBhPnWWAygHo5r3z885J13Gp7BAAmlxEijE65ot/igmhmqwWGYx++AXpSqwqwT8FTCoJUCT0ABQuUMsEz3uVAzBQ++tkA3zzSLhYx45DiJRCICQco+UAjdGUz1M1wSr2L7oxRmOfvZcEwFVMhCld9lnHIUQqK3iFNF3GcMsiZeJrt+eVlO7QyqOQyl0rBJhnqUEaD11nKHlgxuigLngtnxBSXOzOLk65rAyRSKS2sJj9EmlcjGN4U6EBaDSS0W7ek0KwFFj4YzGEUDYaDT2jggTPVFW2l1qkDkw32UH1ABQ+saayCBoSACIxK1gm/FIikTqJ7YA5OQBjtEra2+DPVSoxpc26RJpFxHJJUgqAqrXwsjwA3afoogdAiHoDynpJNBN7AKaArb6o9vs4HaO9N/p4oud93o+iXzZAEgPvAUgdplqRB2B9aPnEmjK+OgbkqjEWCayL2OEBSGG1Vi71HcB2YKpfe+LneZ4Dm4CdLlhSCICmL/4L8gCIhAKgQboqncooXfYSQwmAbs2vtHMAUjdxUAhApPICdHoAUiSrjmFb4+4DdpRlOdaP37soimlgjx8zpOvTsQAsZlkmASBSegC6EQKQB2CdPAApcwBS7i0gRDUhLLgFm+JZ3QzcBFwfY5zsQ+s/uPV/owuVFOdYeVMWgOWiKCQARKq1L2UIQAJgPQ0N0oUAAu1tW8clAESixRBfuM5jLXFTdMTbCNziImCm38IAZVnmWIjiNuD6BAKg6oB4HpgLIWi7bpFy7RvHtupOtVunkgAH0AMwaBnWYgCYmJjAx+hJ4Lj/XpdpYD9wF7CvKIq+8QJkWZbFGDe7QLkD2EX9CoAS2//gKHAWxf9F2rVvCkuqTeH5LeQBWB86cwBSeQCmMPfqJGoGJBIwPz8fsQTAw8AhzIVdlwaWCHgv8C5gR7/UxHtOwn7gve4B2JBgUi194X8NOBlC0F4dIhW5j9FNpPH8KgQwwB6ASgBMSwCIhCwAR4DXsYqAFK7BGeB24APALa1WazrLsl6LgAxLULwHeB/m/h9L9JyfcQFwSh4AkZAG5vXdQrpSVYUA1skDkDoHQAJAdIMmcNq9AGdIs5HPGLAbeLeLgBvLshzv1RcM1vRgE3A38CHgTn+WUpRWLWIhlCPA+QHYBVEMAD5mx33cbiJNs6pfeAAGqVIlG9AbmLoKYBxzB80kslyEwCeFeeCYi4CLiazYSSzWfr8vunt6MW6zLAsxxhnM5f8J4IPAdaRp/9vC3P9vuIhaKYpCTTpECqrdJTf4z5StgNUHoOsugBgrD8AS9bOrq+tQJQJOhRDkBRCpWAFOAK8Cs4kEa4412Xk38ClfeHeFEMbWMRwQyrKcAm52IfIJLDQxndB7chxz/88i979IwNjYWFX/X1n/KcRqlZe2BKwMkgegMaD3sXK3zGFx1oL6pRzjWDxoY4yxwWDsuy76nybmxn7VLdn9pCk7Gndr+4PVxBNjfCrGeDLLspWyLLtmhYQQKsv/Jl/8P4MlJqZw/VcsYa7/14BzaBdAkWLhKEtijBM+16cSAC3Mu3cRWFlZWRmYsdoY4Hu5grkIZ7GYaN1JdQrY5pbVmASASEGWZUVZlmddABzC3OWpuo9NuKC4n3ZZ0xNlWR7LsmypLMuklkie56Esy9wX/9uBj7sH4r1Y/X+qPQqq3IlXsRDAvASASIG3eh/vEAB1x2yVq3IG61cxUJUqAykAsiyjLMsVnyRO+2JdtyZ6yoXEdh8g83pcRAKLI2JeqteBn/nCuYE0XfKqHhY3uhjY6O/9ZIzxUJZlc0ArkRDIiqKYcJF8O/AA8CDwDv+3lHPJReAl4OdY+ERiXKQSAFXS93Y39uoKgBLzRJ/APFUSAN1mbGyM5eXlZV/8T9EuvagT/5zBXKo7SVMWIkSnF+AE8GMsW34v6XafrETAXuCjbtnsjTH+KMb4MnAqy7J5FwIxhFBtVnTlNzU3f/XrmDf52efnfz8WeriZdG7UTuv/uF+r57BGQEKkFADTPtfvIE0FwEUXAAOXqzKQAmB5ebnqD36qQwDUZRLrXrYjkXUmROUFKEMIczHGl4CfdngBpknTeTK4B2C3Wze7fKH+MfCTsiwPunWyFGNcBlpeUhdXTY7Ve+UxxjF/z6kY43asvO/9WOLhHf5Zk6Tdmrj083zBvSWHsyxbThzJEKNNtVvlHvcCNBKM2Xl5ANaZEMJKjPGMC4ClBB6ABpbEtAPYFEJoxBjVe1yk8gK0iqI45YvynW6xT5G29XTDPQAzPsHdArwTeBnLPziMlSTOxhir5NlOEVBtkDLjz8FerKnPjb7o3+legCm6s3FWC0v8e8pFwFyp1V+kWvnzPBRFUbn/d7oIr5uLU4UATmI5APIArBMtv+Bn3AVTJLiZEz4wdsYYD/qNFaI2RVHELMvmy7I8APzELfRqsU65kGY+jrdjOQG3YsmyR4CDWC7CKR/bi5jLvXTLaMIX9y0uIG704zoXx1MuELpRali4BfWii6SjXs2gwSOS4JtVbXZhm8L6B/NEn/N1aIEBS1YdWAHgccwVLO5yxiezulZJJQCqvcwlAETKCahqbfusi4DdvsB24znMMRd91d9iN7aJ0KI/NyuY52zRBcCYL/AT/vuk/13tkpnTvY2yop/La279vxpCuCjrXyReM6r+Gdf7z1TW/2n/OXDjtTHg97Tl6uukq68Z6sUkx10A7PX3EiIpIYRFT877PnCDT0Rb6E5TrmrBHvNnfabDQind6q7CAJn/P1nH60LH0U2aWAz1KeBHwLEsy5pFob1/RHJRXAmALQnGdbX+nCDdXh8SANcwmRYxxlm/AfNY3LIO424p7Qe2ZFmWyQoRia2QIoRwOsb4Yx9rm4H7SJcQeCUxEFZNhmOrJq1ebCpUulfkR8C3gZdCCPNq+yu6tN5tcwMvhehuYR7oE26ADtxaMegtb4vECqzKEN0H7CnLcmZqairouRGJWcYa3DwGfBOreV/u0bmsl5V/ucX/LBbz/wbwdAjhjJJvRZes/81YeHcnaRJwiw4BMJB9YwZaAHgp07mOG5BCgVXlVDcDO1qtlgSASO0FiCGEeSw7/zt+HGLAthKtexmwuOnPgUeBH4YQjuZ5rqY/ohtMuOV/s3sBUpSvtlYJAIUA1lW9mIf+IpaEccFvyETNtx3D6qhvA3YVRXFIz47ogggoQgjnYozPY+VIm33s7mH4G1FV7VMPYG7/x7EKhcVWqyXXv+gGU1jC7a3+rKUaw1U7+oEU7wMtAHyyqMowTrsKq7u9YwMrEbkZCwNMZFm22M3NVcTIioCWj9ufYpn6W9wy2UX3yu36ZfE/iIVAvutCYP5qOhQKsQaCL/o3+bExwXtWFWinaJehDxyNgb+zIZSeCHjIJ9MtNS2oqlXkHjxL27unKSVZdGP8NmOMx4En3BMAtrnObvcIDJMIqLqmHQS+h8X9n2UAO6iJgbP+9/jin6rVe7Vb5RFgsdFo0GoNXupKPuh3Ns/z4Nv3bvUbfB31wwBgLp1TwKEQwiksvCBEN0RAgWURn3PLYhwr2etWx71eUGBhugNYzsNXgKddtOvZEt1kB9bG+n4sBFC31XvEXP9PYB6sQ1NTUyvNZlMCYL0ZHx+nLMvCJ8ubXQSk6K5WuSqPAAdDCCtoS1LRPVohhItYSdwcFsaawbxRgx4OaGLu0ueAR4CvYo2QtPiLrtJoNLKyLG8EPgF8mDRbx1ctq78D/CCEcGZlZWUgPVgDLwCKoiDLsiLGOI7V799MO5a6ZqPMJ+CI7Uz2cghhDrkpRReZnJwsiqKY4817i0+7EBhn8Kp2oi/+1R4IXwG+DjwbQpjV8yS6TVmWU9iW1Z8E3oXF/0PNMT2H7VXxLeDZRqOxMKjtYvJhuMmePFQl7+2nvStaHaqOaBew/IKT8gKIrroALIZYhhAWXQScxUICk6tEwCB4A0raHrQngC8Dj4YQXs6y7GKMUQ22RHcXtzzPYox73PK/H6sCGE8wrk8CP8CqVw6XZdkc2Gs0ZPd8CmvicxNpSj2CWylnsP7kA9nvWQye4ZJl2XKMsapuqZpc5T6BVSGBfhQCkXb+zEtYpv+Xge+FEN4AFpXtL7rN+Ph4KIpiArgX+AzwHixPrO6a18T2rPgm8FSWZbODLGaHRgB4IlWGNXu4HUv8qOMyrcIAuXsBXgLOhhCaerxE11fRGGOe5ysxxvNucRz3cVj4mGzQ7t3fLwv/instXnOr/2tYzP8nwHHfwluLv1iP5yePMe4APoK5/2+lfve/6GK8al71fJZlS4M8pIfJA1BtaFLV8F9H/WzP4NdomfZe6qk6DgrxtiIASzi64Bb1MRcCVdncmI/PjN6FBkpf+KtQ2ZNYed83MDfpy8C5PM8L9dIQ68gktvvlp4D3uUGYIvmvKtl9DDgSYxzoPJZhCwF01vDvx1w+oeb7BdqJH68BZ7Isa8mQEeu8yC65dX0Ui6tXW5C2/DnOfZxGuhseiH4+LV/457B9DX6CZUU/4j+fA06FEJaAUs+LWLdFLc/zGOMW4OPAp936T7HZ1hLwoo/vn2ZZdm7QPVqNIbv3K24lHcDcpin2Ws9dPd4L3IElfagxkOiJCPBE1LkY4xFfZN8JvBvLe9mB9TnfgiUNXipX4Fomwbjq96LD2p/147g/bz/x8zkaQpgLITTLspTHX6wrWZaFsiwnYoz7gHtIXxb+BubVmg0hDPzgHjYB0HIr6XW3ku7BuqvViZNmrh5vxFxJrwFzIYSLmt3EeuMJRwseezwfY3wDc7vvod3r/FYsGXabj91xf9bzjiNbJQ5ih9AofbGvjiYWBptzz8PrPgm+6hPiCbf2z4cQVrTwi56p5LLMsB1d3wncjXmBU6xz1dpyCDicZdlQbFndGMIxsOxWyWs+Mc0keM8cayH5fswFdNjVoJqYiF5NdGWe5/MxxsUY4wngQIxxm4/T3bTDYNe7Z2AT7cZC01iMtLO3QKeFv4h1JpzHkp7O+7P0ho/9E9WiD5wPIayEEAot/KLHhBDCRIxxrxtrles/BZX1/yow683nBp5hFADVBisv+WR1A/VzHarcgpuxPu0HYoznQwjnNeOJXuEWSAEUjUajVRTFgu8rUO0wuANLht3uf0/5OJ7yY5L2fgMFFuNcXHXMYy7/0y6szwLLIYQW1r2w1MIv+oQ8xrgda/hzL7ap1jhp3P9zvvi/6t7fobhgQycAQgiFbw70sh/3kmb/5xxzJ70bi3ke9slRZYGi96q31apc960sywJWb3/OQwRjtEMAVWlrwyfHCf+3lguAJm3Xf5Xs16IdBmhlWRarjH4t/KJP5v0sxjiDbeP+MdKU/VU0MY/XAfcCLA7LdRs6AeCmyKIv0D/3BXuDWzt1B8NkhxfgxRjjKawkS2WBom/wxbnI87wsy3I5xni5JMCqzDXQjv3HDqunc4KNlZk/qG1PxfASYxzDesDchzX92Zlofas2/nnBj1O+jfdwuEyGeR6kncF/k6vBuk1TAu3d2S5gJVnqaS76dVLsnMQudVTJfq0Oi/9y/68Q/UrV/+V9wOfd6NtEmiZZTSyc/CjW1+LkMM33wyoAYgihmtw2ALdgpVEptlbNMNdpibUIPhlCWJAXQAgh1p2AJbfejtX8P4jlvaSw/qs5/gdYY6sXsixbGKaw19B6ADoEQANzB+33gZLCCzDmR9MFwKmxsbGmOp0JIcQ6mv5Z1vANfz4OPATcSZrYf9Xa+jlf/H+Euf+Hyts7zCGAThEwgSWHbCfN3uoZ7QzqOeBYjPFCo9EoFB8VQoj1meK949+7gYexXf+2ksb1X2Lh3e+5AHgZK40dKoZaAGRZVvVSz7EEkevcC5CiLLDamS3DEgGPlWU5j+KlQgjRVTZs2BCazWbV7/9h4AHMyzuW4O2rRPLnsNbWT2JlsEOX6zXUAiDGWHkBSrfWbyJdbWiVEDiJhQKOA7NZlmnHMyGE6CKtVms8xngjFvP/rAuBFP3+8YV+Fkv8+ybWVG5xGK9jPuwDJc/zqllKiXVF25vICwDthMAxHyAngPPaLOhN10cXQgiRjBBCw7f6/SjwOazsbxtpXP8Rc/W/CHwFeIohrvQaegEQYyTP89KTNzZgPdJ30u6AlsILMO0/z2OJIhdRaSBYb/o5XQYhRBKLIsuyGOMmLO7/OazpT5X1n8r6Pwl8y4/XsQZZw2kgj8KgmZiYiEVRVF6A3Vh74I2Jvn9wL8C0v995rHRkkdEuDcz8wTypaUsIkWDxD2VZTmMJ3Z8FPoWFdVM0eVtt/f8JtsPlUDd6GwkB0Gq1qlyAJtYgYi/WIGgi0cDJ/L02+CA6j3WPWmJ0XeARS5y5FiHVzX3shRCDPKHEOIEl+j2AJf69g/q7vXbSxLaTrzL/D2GlgENLPkrjh7ZbfgsWCqiaA6WyeKvNVqokknNY/3QhhBBrZwzb4fIjWLe/+0izx0tFiXV3/RnwZeBnIYQLDLkXd5QEQOUFWKLdHGiXL9gpFGSVDzCDuaSWsVDAhUaj0VJ/ACGEWNO83cBCtx/0xf8jpOv2VxmHS9huf98CHg0hHM2yrDnsydz5iI2lGEJoYm6dCR9U20kXCqi6BG7w91wEzsYY5ycmJlqWhiCEEOJqF3/P+K/6/H8cq+YaT/gxLayM+zG3/p/PsmxhFDq7jpoAwJJI4zIW79noXoDNpGkgUYmA8Q4RsAScK8tyPoQgBSCEEFe3+Ocxxm1Ymd/nsJr/mzAPayqqcO2Pga8C3w8hzA5by18JgMoFECNep7+MxXe2uicgxT4BnSJgEssxmHQRcD6EsCARIIQQb7v4Z97m911Ywt8ngVtJ0+f/F8sBMI9l/X8N+HYI4YgbhyNBPoqDyzsErmAlH+PuBUhZFRBoJwVu8Z/LEgFCCHFVlv9m4B6s3O/TwB1upKWsEmoCh4HvYC1/n8+ybGmUOrnmIzzOSiwXYBlLBNzt3oBUDSUqETDt7zuJ5QScDyEsZFlWDMA4Uyc/IcR6Lv4Nt/zvxnb3ewhr85uy3A/M9X8G2+Xvy8DTIYTzMcaRytYeZQFAo9Eoy7KsGvZsxioDNia8LpUImKEdDljGyk0WfffAfl5gtfgLIdZr8R/zmP+9HYv/O3xOTrn4R6xD6c8x1/93QwhHRyXuLwFQuQDKMno+wJIPsO1YOCBlnKkSARs6PAFNYC7GWIUDtNAKIUZ98d+Otfj9rB+pG/1Ui/8ScBDb7OfrIYTX8jxfHsVS7XzUB16MMYYQlmiHAnb6Qj2R+KOqnIDtrmhL4GIIYT6E0JIIEEKM8OK/i3ap30PA7aRNzK4osJK/H7j1/9MQwtwolPxJAFzBGeCqsGoVfJ3/zLtwvaewDlbbsHyDi8AF90RIBAghRoLJyclQluV4jLHq8PdF2qV+qRq0rZ7nzwPPYHH/x0IIZ0bR9S8BsNo8b5cGQjsfYAPpe9PntEsEt/nvSzHGWe88JREghBhqGo1GaDabEzHGG4BPAF/Atve9oUuLP1gS9ovA14FvhhAOxRhXRvk+SAA4Hgpo0t76cRPmrp/uggioNg/a5CJgGliJMV4IISzneS4dIIQYzkUnz/OiKDZimf6fwZr8fADbnyVl/tXqxf9V4JvAIyGEF0MI86M+z0oAdBBCKD0foKoM2Eg7ca8bImC8QwRs9H9fBpYUEhBCDOEcO1aW5W7gvVii30NY4t9u0vVhWU2V9Pdt4GshhJ9lWXau1AYtEgBvWZWzrOUCYL7DE7C1S4Mzw1oQb8RCDttdFDQ9HLHCkO9GJYQYjbUfS+rbD3wIS/Z7EKvx3+bzYDcW/xXgdWyL368CT2dZdrosy5ZuiQTAW/BWwU0XABd9UG7B8gLGuzBIOzcQ2uHHRqwqYDGEsJxlWSlvgBBiUK1+nz9vBx7AWvt+FLiZdt+Vbiz+TeAI8Lgv/j8CTsQYm7orEgBXEgHRE/IuuhDIXaVu6pJSDbQrBHZgvQi2YFUCzY7Ni+QNEEIMysJflT5fh7n5P4W5/d8P7KF78f5q8T+Glft9Bfih/72iOyMBcFUiwAfLnIuAcRcBG+ieu6ozOXA3FhaoHpIm0PQWwvIGCCH6c1HJ8wCMxxi3Yj38P+wL/6ew5j7bSbf76uUW/1PAE1i53+PuCVjW3ZEAuCYd4JsGXXARMInlA2zsogjALf8qJLDHH5gJoIwxtoDWgOwlIIQYIbIsa8QYN8UY9wP3YUl+nwU+CNxI+s5+l1r8zwBPAX+Kxf7foF3dJSQA1iQCzmPJgVMuAjaQbuOgy3kDKsFxnQuBasfCwutXWygsIITo/cKfAVPe0e9ebPveh4GPY+V+O7psNOHz4SzwU1/8vx1COJTn+ZKMJQmAuiJg2UXA0ioRkHdxUFe5ATNYSGAflh9Q5SIUtHMDNMKFEOtJNT9NeB//O7COfg9hW/je58bLVJfnSXwuPId1+fsK8GgI4bUsyxaLotDcKAGQVASs+KDe4otzt0VA1TNggwuB/f5zxoVA5g+A9hQQQqzHwl8l+O0CbsMS+z6FNfb5ENbOt1tJ05da/Gex3f2+7scrWZYtjmqPfwmA7lA1CrrgnoAqYW+K7oYDOu9XZ1hgP7AXK7GphEDwByJKDAghkq36IVQWf7Vp2m1YbP8zHQv/HZi7vxvN095ilLnRc8YX/0d88X8py7J5Lf4SAN0SAYuYu2mOdoOL6Y5FuNvquwoL7HQBcL2LgZ3+4FUPByGEmGXZIBYOBA01IXpPlmV5jHHc55zK1f9Rt/g/6Qv/XZhXcmqd1pWqSusE8LQv/N8AXtTiLwHQbYoQwoIrz1ksBj/lD8j4OomAzL0OM5gb7gY/qmTByv1WlTSGEEIYkH0G3uXf4ZSG2tXP07oEIqG1X80vkzHGTW5kvMMt/gexGP9HgTs7DI9ux/l/YYRhJX2HsTr/r2I9/g+EEBZUJi0ra92UcVmWm139Puhq+B7aGa/r6plwRTzvC+ermFvsReCQK+Uz7rlY9n0PYp7nNJvN2Gdjcsy/j9p1vv2zm3Us/vEqrll4m/8WOt5LFSajYgnmeYgxEmPMgEaMcQbre7LTF/9bsWz+OzGv4xbWJ7nvUvPcPNbe9/uY2/9J4Gie58tK+JMAWG8RkMUYN8QYbwY+hsXC3oe5w8Z7cI0jVhkw74v9aawO9iXgBeAVFwNzHspYCiE0tTGGEKO58JdlWWXyT2KhzK2+6N/li/4tmGdxC+ZZrKz99aaFhV1fBr6FufyfDSGczrJsRYu/BECvHqKsLMupGOP12LaWn8HKYa6nu+0u304pV2LgoguBE1hHrNf8OAQcxcIYC74dciuE0CrLstCdFWK4aDQaWVmWeYyxEWNsYInMG7Ew4j6sWc/N/nOv//tWn8eqJONezGdN2pn+38Bq/F8Ezqm3vwRAP3gCQoxxIsZYbXX5KeB+zHXW7e5Xb+cRKGn3DFjEQgRHsd7YJ/w42fH7KazSobPHQPU+MYQQFWcTog8ndHs4Q8dCHToW7qp0bxvmodztC/zujmNPh7U/geUBrLebf/X8teLz04998f9eCOHVEMKcDJWaglCXIJG5XZYxhLAcQjjmm/fM+fEJzJW2pUfXu6oayLHY+pQr/r1YIk1V1njCRcERFwan/d8X/Jj3YzHGuEB7q+JKXPRFCMFLlapJUIhRMNiqfw9u1VcJydOrjhm35qumYvt8sd/m/22i41iPsuarWfwXsGS/H2GJft8PIRwCFhW2lADoK6oNhEIIp2OMP/HBe8GFwD2utid6+GBVFsEElp9QWfEtrIyw2gK5+nkBc7ud9Z8X3YOw5N9tDkssPOz/T6vjwe2JIybGOIXFKKvvmF1hcpFIEIMmACpLfvWR+3w+7cbG1kscW1z8b+g4pjuek/A2QmM9F/7C55fXsEz/bwJPhxCOAsvyQEoA9LMQqHpS/9wXyllfKN/jqrvb+whcy2SCTwBjfl67aLv7Vzos/wUsJFC9roV1RTyOJeUc8/+n5cflmhGFVQ/65c4tXoUVFFd5OSZ9gtvYYdFcKlmp8ly0+sl7IcTbCVyfNxr+vHYe1b9NrvIAzKzyBjR4c1gg0F9CuHQj4yxWwfR94DGsxe8pz0/S4t9ll5JId30nMDfbu7CGGe/nzd2y+rkXw5ti/6sW3NixiK64OGj5z+rv8hIioJp8Jv1YLYRWT0jVe837Yr167MYOATC+akLMLjHGK+ui2XGuaqEsBmEu6bT0x1aJgZxLx/xX/+znuaaFeR1fxzb0+SHwVAjh1Rjj+VXPv5AAGJCLHMJYjHEjlln7Pmx/7Hf731Ub32G5F3HVcTVWTZbg8/E7FKYAACAASURBVLiEkLjac5QHQAzSnN0pkrMhmDsKt/pPYKXKP3LL/3ngdJZly4r3SwAMNN4voHPXrA9inbTegbndp1FnRiHE6FCVKc9isf6ngMfd+j8SQrjo4VTRJbTgrNdIjzGOj48XZVlWLYSrMryLtJN3el1yI4QQ60ELyxl6w639L2P9/J8OIRzNsmw+xiirXwJgeCiKAmwzoRUsge4k7ZK7RdrZ6znD4doTQojVVn9V1/8TrJXv19zyfwU4l+e5Ev0kAIb+ISi8Fe+si4DjtLcZrjLa+6EWVwghkthAPse9iGX2fxVr6ftsCOFklmWLMcZSFX4SAKMkBKoM99NYE55Tfl828+ayHSGEGOS5ruWGziPAl4AngEMhhAsxxqYW/vVHfQD648FYcU/APNb8ouraVzXo2SixJoQY4DluGQt7HgZ+Bvw8hHDUNyLTyi8PgB6SLMuKGOMS7cY7LSwnYJJ2qaC8AUKIfqfEvJtVq/HXsWY+TwFPhhDeyLJM7XwlAMQvFECMhBAKX/yr9ruLvuhXTT/6qWWnEEJ0WvpVWPM8ttvoC1hZ3+PAd4CngYMhhPNASy19e4tCAP0nAqIv+kfdE1Dt3Pc+bG/ufVh+wJR7B8Z01YQQPaZwa/8cls90EGuF/hLm9j+OlT8vYOGApqz/3iMLsr+ptu/cjTUPuhu4xUXAdViL4Zt0mYQQPaIKWZ5zQ+UVX/QPAK/Srm5aRi23JQDEmu5RA9jEm/fvvh74IvBJXSIhRI84CDzpC/+r/vdhrM5/zhf9ytLX4t9nKATQ/3S2y7yIxdWmse09/7wujxCihywAv+eL/wn3BizT3gxMyAMgunDfdrrSXmsOQLUlbqA/twUVQnTXsOjcRGutz/4ycBfm6l+WlS8PgFifh/dz1EsAPIYlG1bJhFVC4eXKDSUOhBisOeJy/95Zorfiz/6WNX7OBPAR9wIICQCxTvxazdf/S7//u/zY7pPABtptiKs9CarfqzLEXk1eV0ICRYyyJX+pLa5X/13Q3oRnFqswOu2W+1+uORdJAAwgmjQHk01Yks3EGl//VAjh4RjjVqySYC+WWLgdyy3YhHUf3AjM+M8ttMsPO3csrDuGOl2R1URVXkYExEsIhMpbkXWcV6YhIkaE0q34Fbfqmx1/r3T83Zmtfxpz2R+nvQ/JvwDeu8ZzWMRCkvO6HfIAiO7zSzUWf4D/d2xsbLbVas3FGI8DzwFjMcYxf9/N7hXYi5Uc7gNuwNoSX+eiYHVTorVOXsUqC2XZJ6uqZKjzM6r/p+hY/HPamydVuymul6dCiH5gAUsQvohl3s+t+n2O9qZjh7BkvYshhGV/3lZijL9bQwBMAV8A/p1uhRDd5w+4vOvvao4bE5zDno7Fey3Hkr+HEKPMHn8W6jzPtyQ4j/28NWxwLce/0a0UovvMuOJf64P6w0Tn8TdqTlr/p26lEODPQp1n6R8kOo/Ha5zDRfcECCG6yJ+vOVn8zUTn8WSNcyiA23QrhQB/Fup4006QJp/rr9ecW/6cbqUQ3eXf1nhASyyWX5e7ak4Uj+o2CvEmvlHzmfq7WAVPHa6nXhjgd3QbhegeU5irba0P6PcTncc/rDlZ/aZupRBv4q/UfKYWgf8kgQh4rMY5nKdecrIQ4gr8as1J4r9OdB6v1DiHZdbedESIYWUjVkZX5/l+BXhHzfP4r2qewy/rVgrRHX6Xeu7//QnO4SM1J4g/1G0UIvnzXR2/UfMc9lEvDPCvdRuFSM8Ytq3mWh/MxxOdx/9Sc4L6Nd1KIS7J5xMIgC8nOI/v1vj8s1hfDiFEQupa3n890Xm8Qb0Y4aRupRCXJAder/mcz2PJfHX4L2uew/t1KwcDdUsbHB6s8doI/H6Cc3hPzcnlD7CmJ0KIt1JQv0x3GksorGOF/z71tvJ9ULdSiLR8tYYifyLROfy9mpbBZ3QbhXhbXq35nL2MtfGuww9qfP6/1y0UIh0NrJ/3Wh/I/zHRefywxjkcQ7FBIa6Gz1AvEa8E/lrNc/gfqBfq07MuRCI+XNMieDjBOeyuOSn9M91GIa6KDdTr9xGBl6jXE+AhlAcw9CgHYDB4sMZrm8D3EpzDF6nXbvRPdBuFuCouAgdrvscN2I6ea+UxbBvhXsxZYp3QdsCDwQM1XvsEafbp/qUar70AfFu3safkmBdn76oD4Oiq4wTtLZdFb3gUuKfG6yewXT9fXePrF7CQ38drCIDf1m0Uor5IqxP//0cJzmGi5jlon/D1ZQxz4f5v2KZNR4HWNdyvlr/mSX+Ph/w9xfrxIPVCbtX+AHX471AegBA95UM1J4FPJjiHh2uew3+s29h1NgK/jm3Ico76DWVWH+f8vX/dP0t0n7qtgZ+ruQg/iPIAhOgpf6fGA7hEmsY7/yv1tv7dqdvYFTKs9euX/F7HdTqW/DN/A+URdZMfJbhPdcoBJ7BNhtb6+X9bt1CIevxpjQfwm4nOoc7mP4/pFnaFh4GfruOif7njp6SpMhFv5X9KcH/qtt5+tMZnf0m3sP8tCNG/5MD9NR/euuwHbqnxejUFSct9wCPAV4B39cH5vMvP5RE/N5GOnyV4jw8nEABr5X6UByDEmvlATfV/f4Jz+Es1z+Gduo1JuBnbLa5uYlg3j9LP8WbdriS8m2tL3rzU8fWa5/Cxmp//Ad1GIdbG36bepiApMrf/rxrncFC3MAl/A1ju44V/9bHs5yzqsYt6MfiIVe/UaQg0Rr2mRMoDEGKNfKnGg/fVROfwUo1z+Oe6hbUYB/7VAC38q49/5d9BrJ1nEnhlfqnmOdTZh0R5AH2McgD6l7rx/xQJgHuB22u8XgmAa2e338O/MsDf4a/4d9it27lmvlvz9QFz49ehTh7Ax1EegBDXzPtrKv8PJTiH/6DmOdym27gm3gMcGmDLf/VxyL+TWNsCWvf61xXiH0R5AEKsK3+L3nfh+uc1zuGkbuGa+DXqN4Dpx2Oe+iVpo8h+rJdGnWt/inp5ALnPKcoDEGKd+EN6vx/38zXO4Y91C6+ZX6e/s/xTVAn8um7zNS++J2pe9yLBdf/3mguGD+UA9C91arxTxP93A3fVeP3juoXXxPuAf029HRf7neDf8X263VdNQf1Svgz4z2p6AerMKSoFFuIamKlpCaaIuf35mlbHJ3Qbr5o9wOEhtvxXH4f9O4ur41dIs5dDnYZedXqSlDXFh+gS2g64P7mnhiVYAs8mOIc6mcNNrI+5eHsmgT8C9q3DZx3hrVv/wlu3CO72uezz7/wA1q9eXJnH/bmu47HdSL3tgZ+tcQ4BuBf4gW6lEG/PX62htl9MdA6P1TgHLf5Xz+900dJewdzH/wWWTHa17PfXfN3fo1vn9zu6/VfNeernX/xHNc/hxRqf/5u6hUJcHf9zjQft9xN8fg4s1DiHf6ZbeFX8VpcW1lewGvwtCc5xi7/XK10619/SMLgqvpfgWv/Nmufw+5oThOg+36jxoP39BJ//rpoTzV/ULXxb7sBCJSkX09PAX6c73ffG/b1PJz7npl8LcWX+QYJr/fdqnsPfr/HZj+oWCnF11Cn7+XMJPv8/rTnR3KBb2FVr6lLu3d8GNq/DeW/2z0pZrvj7Gg5XJcrrXvO6AuDPUa8XgRDibdhF77vv/e81Pv+IbuHb8qGEi+cF4M/04Dv8Gf/sVN/jQxoWVyQHzta8xn+35jncVvPzr9NtFOLKfJp63dZS9HZ4osY5/DvdwrflW6SL9d/Tw+9xD+lyA76lYfG2/Ft6mwOQUa9L5Wd0C/sLNQLqP+o0zahKdeowRr0mRN/XLbwiX8DK3+ryPaw2++c9/C4/93P4XoL3esCvjbg8VdhorUzV/Py6JcZqCCTE2/B/11DY/yLB599X08r4sG7hFQX3zxJYyweArX30vbb6OdX9Xj+TUXJFNgBzNa7vHyU4h39R4/P/pW6hPADiytxb47XPJPj899d47TLwtG7hZfmLCayg88AvA7N99L1m/ZzO13yfd6IKkitxEThY4/Upui8+U/P+CgkAcRkC9WK6vRYAT2GNY8Sl+Q9rvr7wBfKFPvxuL/i5FT2+RsPOczVeu73HAuAdWnOEuDy3Us+FujPBOdRJAPxt3cLLsgFre1vn/v7jAfie/7jmd1xCfeOvxH9T49oeSvD5O+l9lZIQQ0mdTT+OJTqHOi1Hf1W38LL8Ws2J8yTWz73f2ejnWue7/pqGy2X55RrXdS7RORyjt31KRCLkjukv6sTIUrj/rwM21Xi9KgCuLO7qWtZzA/A95xJ4Kn5Fw+Wy1MnC30AaL6HyAIToAv+mhrL+pwk+/4Ean39Gt++yNLBEubVe21fpTnvfbjHu57zW7zuLdiq9HAFLBlzrtX0wwTn8U9QnRB4AMXQegDtrvPZV3b4rCqs6G/P89wxWcuWKn/Na2UKaXgnDSASer/H6FI2j5AGQABBdsJpur/H6n/VYALymW3hZ6ri0W8AfDOB3/gM/915cs2GnThgghQCoM9fcBkzoFkoAiDezn7W7PQvqlQdJAHSXOs2RvkN/1fxfLbN+7r24ZsNOne6PKQTAc6y93DMHrtctlAAQb2ZvjdcewsqneikAFALozr39owH+3n/Uo2smAXB53pHg85eoV1K4T7dQAkCkeyhS7MA3DtwsD0BycmC3BMA1s9uvnXgrdUIAO7AdR+tSZ86RuJMAEAkfihQC4NaaE64EwKXZVeO6HgHeGODv/kaNsZknWqiGkTewrZjXys0JzqHOnCMPgASA6DMBUMf9XwKv6xYmv69Hh+D7H+3RtRt26uT83CAPgJAA6C96HQK4o+bnaw+A9JPdsSH4/sd6dO2GnVcGWADIAyABIPrMA7C/xmvl/u/OZDfqHgAtFJenThKePABCAkAegDdRpzRHFQDdmewUAhCXo05uyP4Eny8BIAEghsgDUEcAyANweUKN18Yh+P6xR9dOHgB5AIQEwECwFZjqsaUoD4As4H4Ttkc1fLriAbihx+N6yuc8IQEgak6Sp4Hlmp8/Rr1adXkAJAAuxx4JgL7zAOysaXDgc87pGq9XfocEgEjwMKRw/++lnrtVAqA7i9ieIfj+8gB0h3PU2x5aeQBCAmAIJslex/+XGI5ytW4x6pNkr8f2MNPrMIBKASUAxBB4AOoIgIMMR7JatziBNUpa67jYN+Djeq3nX/q1E5dHiYBCAkBWUk8FgNz/V6aosZAF4M8O8Hf/s6w9tHSCte84Jw+APABCAkAegHUQAKoAeHvqxLJ/ZYC/96/06JrJA/D2XCcPgJAAkAdAHoDu88Mar30Q2DKA33mLn3svrtmocLjGa7dJAAgJAHkAoN6uaxIAb88f13jt2IB6AX7Fz70X12xUODPAAkAhACGwbU9bWCLdWo7tCc7hmRqf/0HdwqtaxM/VuMYHai6mvfi+B2p833MD9n17xUdrXOOnE3z+9hqf36Le9uNCHoChoM5+8Us1rYCKOl25LuoWvi1N4E9rvP424K8N0Pf9a37Oa+VP/ZqJK3O2xx6AMz4HrdXw2aVbKEadO2qo6IOJzmG+xjncoFt4VfyFGtc4AseBmQH4njN+rnW+61/QcLkqdta4xhcSncPBGudwh26hPACjTp2WnAsJPn8CmK4pHsTb82VgpcbrdwN/awC+59+iXlvpFb9W4u2ZrfHajUAjwTnUmYOmdAslACQA1s5igs+vuymHBMDVcQH4Zs33+HvAp/v4O37az7EO30xonQ47rZrXKkUYoM4cJAEgATDyTA6wAChYewxwFPndmq9vAP+OevH1bnGbn1ujx9do1Oh1JUCdOWhSt08CQB6A3gqAOpOArP9r43eA5xIItj8BNvfR99rs51TXm/ScXyNx9fQ6EVAeAAkAMaIeAFUAXBsF8FsJ3ucu4A/7RARs9nO5K8F7/RZq/ysPgJAAkAdgIASAPADXzv8HPJbgfT6JdcvrZSb1HX4On0zwXo/5tRHyAAgJAAmAdRIACgGsP38n0fvc6Qvwwz34Dg/7Z9/ZZ9dEAuDqSdFiWgJAAkDUoNchgDpuZIUA1sbjpGt1uwX4EvCPgQ3rcO4b/LO+RLo9Cv7Yr4m4ds73aO5JMQcpBCABIA9AjwXAhDwAPSFlvDsH/lvgZeA/J01992oa/t4v+2elauOaKi9iVKnTW2JcHgAJADHaAqDOJCABsHaeB/5R4vfcDfwf2N4Of5E0nQNn/L2e8ffenfic/5FfC7H+AmAiwedLAAwwDV2CntPrEECdTVcUAqjHPwTuBX4t8fveBfwe1qPhEczF/ifAiWsQEr8M/FngM3TPVfv7fg3EaHoAFAKQAJAHQB6AkSUCfxm4BbivS+Lyl/wosa2bj646wPZm7zxupvvewaf9u0cNg5EVAPIASABIAMgDMNIsuKX9I+C6Ln5OBtzqR6857t95Qbe/Nss1XqsQwIijHIDeU8cNlqINrzwAvecw8CuMRlvlJf+uh3Xbh8IDUGfMKgQgASAPwAB7ACQA0vFD4DdH4Hv+pn9XMRwCQB4ACQDRIxXc6xwAhQDS8jvAXxpST8CSfzf1+u8fAdDrEIA8ABIA8gDIAyBWiYAHgGND9J2O+XfS4i8PgDwAEgCijwSAcgD6jyeA9wNPDsF3edK/yxO6rRIAEgASAOLNqA+AuBRHgU9g9fyDyu/5dziq29mXAkAhAAkAMcD3oOzxuWvr1u6yCPwG8HeB1gCdd8vP+TcSiVTRv9SZg7T+SACMPHVqoad7rODlwlsf/gnWMfAPB+Bc/9DP9Z/otq0LvQ4h1pmD1AdCAkBWXo8XYAmAweBF4FeBjwKP9eH5Pebn9qt+rmI0BECvP19IAIysB0ACYPT4PnA/1kznhT44nxf8XO73cxMSAPIASACIdXgIex0CUBJP7/hjzNX+V4FHWd8cgZZ/5l/1c/hj3Y6e0esk4ukef76ogfYCGGwBkMICX+rx54u1UwD/0o9twBfdGn+YNFsBdzIPfBX4I+BLwFld/oH3ACz1+PMlACQARh6FAEQKzgL/jx+TwEMuBj6E7fC39RrfbxYr3/uhL/pfZzT2KhglAaAQgASAGGAPgKoAxOUsuz/xo2KSt277u9f/29FLHFrsJQC6PQfJAyABIA+APABinUTBq34ICQB5AISSAOUBkAAQQgJAHgAJADFoAqDXHgBVAQjRW3pdBaAkQAkAUQOFAIQQg7oAKwQgASB69BCmCAGoDFCI0RQAKRI9FQKQABADbIHLAyCEPACD+vlCAmCgUQhACDGKAkAhAAkAeQBqvFatgIWQAOilAFAIQAJAyAMghOgBg1wFIA+ABIA8AAPsAdio2ydET9nYo2dfHgAJADEEFvj5Gq/do9snRE/Z06NnP8UcJAEgATDy9DoEcJq1byU7xbVvMiOESMPWGnNAy5/9XgoAhQAkAOQBqPHaFFu+lsDxGq/fq1soRE+o8+wd92e/LnXmIHkAJABGnotAXONrNyfyAhyt8dp9uoVCDJwAOJrg86d8DloL0ee+/7+9O4+1q6oXOP69nW6LpYylFAqlUIFSi0BBCDIEnk2lyiC8UAkJBEQQEUXyxGdE0SiQh4pEMCDI8AQBNQiESEE0iAV8j4Z55pWhpWUoLWNpCy2974+zbrzUC9ye9dvDOef7SXbKP4f72/u31tprr732WrID0NFWAYsyfj8uIIYXHQGQWs7mFdX5iLZnEc2/epQdgLaysOIOQM7TgB0AqTNHAHLanoWmzw6AGhbYAZDUQR2ABabPDoDqMQKQMxzoHACpGq38CsARADsAcgRAkiMAsgNgB8AOgCQ7ALID0EFyhsO2qLgDsKnlSKqk7d604g5ATtvjKwA7AKrJCMBiYGWTvx0CbGIKpVJtkupeM1YSswqgIwB2AFTxCMDGQHfm3+/B1QClVpK7CmBP5t/vTm2PIwB2AJRpKc1vzNFFzEx85wFIndEBiBj+3zy1Pc14A1cBtAOgsB6xEwElOwBldgD8BNAOgAJVPQ/AtQCk1tHKawD4/t8OgGrWAch5Ktja9Eml2rqium4HwA6ACtDKrwA+YfqkUn2ioroe0eb4CsAOgGo2AvB/Gb/dHhhsCqVSDE51roq67giAHQC14QjAoxm/HQ5MNIVSKSamOldFXXcEwA6A2nAE4DV8DSC1gtzh/9ccAZAdgPbpAIwBhgbE8IgdAKmtOwCPBPz9oanNsQNgB0BBlgArMvJY9WsAOwBS/TsAUcP/zd47VqS2TnYAtIacd2NTHAGQ7ACUMAKQ09b4/t8OgD7Asxm/3aniEYCJ5O9JIOnDdZM34TZiBCCnrXnWFNoBUP8eqkEHoNlNQoaQ92mSpI+2Pc3vAthTgw7AQ6bQDoD692DGbz8Z8PeXAvMyfu9rAKlYOXVsPjGb8OS0NQ+aQjsAiq8cE4BRQaMAdgCk9usARLz/H5XaGjsAdgAU7HFgZZO/7QoaBXAioGQH4MOe/pvdBnhlauNkB0D9eDezglQ9EdAOgFTfDkDV7/8fT22c7ADoA1Q9ETDnKWE8MNIUSoUYmepYlSMATgC0A6ACPVhR5ezbS1/d5G+7gMmmUCrEZJoffl9NzPB7Thvj+387ACqwkkym+U+Eeq0Ans74/c6mUCpETt16muZXGu01JLODbwfADoAKrCTdwKSAGHKGCvcxhVIh9qmoTveaRN5iX3YA7ADoIywCXsr4fcSXADmThewASPXrAERMAMxpW15KbZvsAKjAnnLEPIB7M367ObC1KZRCbZ3qVhV1OqJt8enfDoBapAMwm+aXBAbY1xRKoXLqVE+q03YAZAegBVT9KeASnAcg1Unu+/+ILXj9BNAOgGo+ArARjf26c/3dEQCpLUYA/h7w98eltsURADsAKtgTwDsVjwLckfHbCUGdEEmNujShoroc0aa8k9o02QHQAKwCHqu4A5D71OAogFT903/UCEBOm/JYatNkB0ADVPVEwJcze+3OA5Bi5NSlJ1JdrrID4PC/HQCVWGn2pvklQ/vKGTp0BECqfgQgYvi/K7UpdgDsAKgFOgCbAFMCYsgZOtwOGGMapSxjUl2qog73mpLaFDsAdgBUYgcg51v8f6t4BAB8DSBRcR2KGAHIaUt67ADYAdDaexV4OOP3nwmIYSF5GwPZAZCq6wA8nepwrpy25OHUlskOgNbSXzIbjqEVjwLYAZCq6wBEPP0PzYzhL6bQDoCa89eM344Edq+4AzAF2NA0Sk3ZkLy5PBEdgN1TW1JFGyY7AB3t78DKjN9/JiiGZnUBnzONUlM+R97XPBETAHPakJVBMUgd604aE2maOWYHxTAvI4YbTKHUlBsy6t28oBhmZ8Rwpyl0BEB5cobQcofveuUMJU4HPmYapbXysVR3qqizvXJfIzr8bwdAFXYAcifwRDQmw4EZplFaKzNS3amyA5A7kdgOgJRpGLCU5ofhzg2IYSzwXkYM15hGaa1ck1Hf3kt1Nte5GTEsTW2XpEyzMipi1CIcOXMR3gS6TaM0IN2pzlT97v3BjBhmmcb68xVAa8gZSstdxrPXdRm/XReYZhqlAZmW6kwVdbVX7nLiDv9LQXbO6In3AEcExDA+M4bLTKM0IJdl1rXxATEckRnDzqZRitEFLM6ojL8OimNORgxLgCGmUvpQQ1JdabaezQmK49cZMSwmZjdSFcxXAK2hB7g94/efCYojZ2hxQ9wiWPoo+5K3euZ1QXHktBm3k7eRmewAaA0579TGA9sExPDHzN8fZhqlQuvIHwNi2Ia81wi+/5eCTSTvndwJQXE8nBHDCzg0KH2QrlRHmq1fDwfFcUJmWzPRVDoCoFhzgfkZv49ajCdniHEssKeplPq1J3nf70cN/+e0FfNTWyUpWM7s4HeA9QNimJL5dPAz0yj162eZdWtKQAzrp7bCr32kmjkys4E4NiiOpzJieA5fA0hr6kp1o9l69VRQHMdmtjFHmkqpGJtmVs7bguI4OzOO6aZSep/pmXXq7KA4bsuMY1NTKRXnvozKuQoYExDDrpmNxPWmUXqf6zPr1K4BMYxJbUSzMdxnGqVinZbZUJwcFMe8zI7I5qZSglQXcm6884LiODmzbTnNVErFGg+szqikdwXF8fPMxuIMUylBqgs5dennQXHclRHDamKWIJbUAhV1r8xG63lgsKlUhxuc6kJOXdqrjR4sJH2Er2U2GN8OiKGLvK8BeoCDTaU63MGZdegpYr6q+XZmHF8zlVI5cifrPBAUx6mZjYZ7hqvTzcqsQ6cGxfEA1U8uljRAuZ/rTAqIYUNgeUYM7wETTKU61IRUB5qtP8vJ2zio1yTq8XmxSuZSwK3r2szfHxEQw6vA7zPL3/GmUh3q+Mw2+PepDlJxW3CtqZTKlbtkZ9TKYXtkPj28DAw1neowQ1PZz6k7ewTFkjOXJ2qJcUlr6cbMBmRqUBz3Z8ZxuKlUhzk8s87cHxTH1Mw4bjSVrctXAK2tDq8BAC7K/P1XTKU6zFcqrnNRbYDD/1JFPga8Td63+BGfEI0E3sx8ktjOdKpDbJdZV95MdS5XF3lrELyd2iA5AqAKvA3clPH7ccDeAXEsBa7M/H+cZDrVIXLL+pWpzuXaO7UBzboptUGSKpK7kMiFQXFMyYxjOTDWdKrNjSXv09meVNciXIgLeUktrRt4jbzhxFFBsdyZ2aCcZzrV5s7LrCN3BsUxirzXdq8Bw0ynVL3LMhuVbwbFcaSjAFKhT/9HBsXyzcw4LjOdUj1My6zMzxCzMU838IqjAFIhT/+vpDqWa3Cq8zmxTDOdUj0MJn9RkUODYjnHUQCpkKf/c4JiOZT8xbvcyVOqkQsyK/XsoDi2IW9bUUcB5NN//9t4bxMUy+zMWC4wnVK97JJZqSNXBrzeUQAp9On/+qBYpga0E7uYUql+7sis2FcFxbGjowBS6NP/jkGxXJUZyx2mU6qnQzIr97vAZkGx/MFRACnk6f8PQbFslup4TiyHmFKpngYBT2dW8DODYplM3l7njgLIp/9GHZocalwaHAAAEJRJREFUFMuZmbE8javHSrX2jcxKvhgYERTLNY4CyKf/rDpwTVAsI1LdzonlG6ZUqrd1gTcyK/rxQbFs7yiAfPrPevrfPiiW4zNjeSO1LZJq7tzMyv4oMbsEQmPjktxRgC1MqVrMFgFP/1cGxdKV6nROLOeaUqk1bAWsyqzw04Ni+XhALNeZUrWY6zLL/KpUdyJMD4hlK1MqdU4DNCswlsvJ//b4AFOqFnFAQHm/PDCeWXbApc6yF/nfHk8KimVrYGVmPHOB4aZVNTc8ldWcsr4y1ZkIk8hfk2Mv0yq1njmZFf9XgbFcEvBU9ANTqpr7QUA5vyQwnl9lxjLHlEqtKXd73mXApkGxjCd/EZIVwETTqpqamMpo7mJc44Pi2TTV4TpsPyypZEOBhZkNwIWB8VwY8HR0i2lVTd0SUL7rVN8WpjZEUov6DvnvI7cNimWLgCekHuAw06qaOSygXK8g7pPXbcmfd/Md0yq1to3IHwb8Q2A8uYuj9ADPAyNNrWpiZCqTueU6ctGr3L04lqW2Q1KLuyigcfpUUCzrAS8GxPMT06qa+ElAeX4x1Y0InwqI5yLTKrWHiE+Bbg+MZ2ZAA7WSuE1SpGZNJn+ovSfViSi3U59PgCXVQO5iID3AjMB4IiZMuTe5qnYH9ZrYOiMgnlmmVWovnw5oGB4kbjvQbchfK70HOM7UqiLHBZTf5akuRBiU6mhuTJ82tVL7uSGgcTgqMJ7TA+JZStyOadJAbZ/KXm75PT0wpqMC4rnB1Ert22jlbszzHNAdFM8w4PGgkQmXCVZZhgc9aT+e6kCE7lQ3czf9sTMttbHcpUF7gFMD49k3IJ4e4AJTq5JcEFRm9w2M6dSAeH5laqX2NhZ4O7OhWEzcJ0sAVwQ1qF8wvSrYF4LK6hWBMa2X6mROPG+ntkFSm/tRQAN2VmA8Gwc0YD3Aq8CWplcF2TKVsdxyujiV+ShnBcT0I9MrdYZ1gUXkrxS2WWBMXwp6sroTGGyKFWxwKlsRZfRLgXFtRv5Kn4tSmyCpQ5wc0JBdHBhPFzA7qIH9selVsB8Hlc3ZqaxHuTggppNNr9RZhgJzyZ81HLli2GTytwzuAd4D9jfFCrJ/KlO55fJdYlevnET+Vz1zccc/qSNFLMl7R/ATzdlBT1ovAKNNsTKNTmUpokyeHRhXFzGrEM40xVJn6gLmBDQiXw2MaThwf1CDe3Nw50SdVz9uDiqL9xO7VsVXA2KaY/2QOtt+AQ3JW8TOvp8IvBHU8J5uitWk04PK4BupTEfZMtW53Lj2M8WSIp5ybg2O6fCgxrcHONoUay0dHVj+Dg+O7VZiRsckiSnETHI6JjiuXwY1wCuB6aZZAzSdmC1+e1IZjnQMMZNkp5hmSb2uCGhYXiN2NbFu4N6ghvgtYKpp1keYSszwek8qu92BsY1NdaxOqxBKagNbELM9b/RuYlsDrwc1yC+l/5/0QWXtpaCy9noBZS1iN8/lqa5L0vv8V1DjF/1p0WHEvY99ithlWNUeNk5lI6qcHRYc38yguP7LVEvqzyhgfkAjs6iAm+wvAhvn/wHWMd1K1kllIqp8/aKAzsmigLjmpzouSf2aHtQIXh0c1zDgnsBG+ibcM0CNMnBTYLm6J5XVSFcHxeZEWEkf6dKgBueg4LgmEDMJqve4xFR3vEsCy9NrqYxGOigotktNtaSBWA9YENDoLATWD47tkMAGuwc4w3R3rDOCy9IhwfGtn+pQblwLUp2WpAGZUeMnj3ODG+7vmu6O893gMnRuATFGjcTNMN2S1tYVQQ3QtOC4hhK3dXDfiVuui97+uoidUNq7xW/0jnrTgmK7wpRLakbUEOTzwCbBsW0APBTckF9L/AQu1cewlOPIMvNQKouRNkl1po6v4CR1kAODGsq/AUOCYxsLPBPcoN8GjDTtbWdkym1kWXmG2JUvSXXkb0HxHWjaJeW6MqhBOq+A2CYSt3pb321SR5v2tjGamG2v11xVcmIBsZ4XFN+Vpl1ShA2BF4MapiMLiG8n4pYL7rti4FamvuVtRewKf73L/O5UQKxHBsX3YqqzkhTi4KDGaVlBjec+xOxl0Pd4AdjR1LesHVMOI8vE8lTWiujELguK8WBTLyla1IpkzxT0hHIgcdu49l3cZW9T33L2JnbRqN5tpYt4r74hcXNZrjb1koqwEfByUEN1KzCogBiPBlYX8NQ30/S3jJkFjAatTmUr2qBUFyJifDnVUUkqxKGBjerZBcV4anDj33fpYDcRqq91iF3at+9xakExnx0Y46EWAUlF+10LNFpnFXQjeJxi5jAoz04pN0Xk/KwW6Ez/ziIgqQyjidmetAd4C5hUUJwXF3RDWAGcgisH1kFXysWKgnJ9cUFxT0plPyLGRfjZqqQS7Q+sCmrAnqSYfcoHETdxsb/jTza8lXdE/1Rgfq+mmHkqo1KZj4hxVaqLklSqUwIb2xsLeqLuAs4p8CbxIvF7HeijTSNubYr+jnMKLI83BsZ5ikVBUlV+E9iYfa/AOE8MHLHob4b4OcRvCKN/NTRd69UF5XJVKitF+V5grL+xOEiq0nDillldDRxVYKyfB5YW+NQ4B5hskSjMZOKX9O17LE1lpChHBXZc5qS6J0mVGkfc+gCrgMMLjHUqxQ4dr6IxcWysxSLM2HRNV1Hsq5ypBZ7D4YHxv5zqnCTVwt7Au8StuFbkcqbjgccKvJn0Pk3+EHcWzDEyXcOlBefqsVQminIwcStUvosrU0qqoRMDG+V3gOkFxro+cHvBN5beXeNOAAZbPAZscLpmL5WQn9tTWSjK9FSWo+I90eIhqa4iV2JbBuxXYKzDgKtKuMn0LiB0kMXjIx1EcQv6rHlclcpAUfYjboOf3pUoJam2hgF3EzuUvmeB8XYBZ5Z0w+kB7gB2s5j8i93StSkrD2dS7EJOexL76uLugjsrkhRiLLAwsPF7A9i14JiPI34nwQ/72uE6Gt+yD+rgcjIoXYPrKO6zvv7mlxxX8HntmspsVMwLcVKppBayB7HLsy4BPllwzJ8iboW2gR7zgB8AW3VQ2dgqnfO8kq/1kynHRfpkKquRy07vYXMiqdUcG9yAL6K4fQN6rQOcX+ITad9RgduAI2jP77uHp3O7raJrez7F7+Q4ibg9MnqPY21GJLWqC4IbxBeAiSXEPQ1YUPKNqvd4NV23Xdog/7ukc3m1omu5gHKWap6YymZk7BfYfEhqZUOIn9w1n2K/2+61AcVuJjSQ437gNBqTyrpbIN/dKdbTUuxVXrurUw6LNj6VyejJokNsPiS1utHA3OAG8umSOgEAM4l9r5vzPvguGmvhH0w9diIcnWI5J8W2ogbXaUnKWRnGp7IYGf9c3GVSUhvZAniG+EV2ypogtRkwqwY3tzWPp4DLgS8DO1Dsp21d6W98Of3Np2p4PWalXJVhD+IXK3om1RWpcF1eApVoPI2hzcgn9xXAMcC1JZ3DicBPKX5CWbOW0lgrfgmweAD/AmwMbDSAf8dQ36WNlwH/AVxY0t/7YuoERU7YnAfsm/6VpLYzgfj3pauB75d4Dh8HZtfw6bdTj9kpJ2X5PvFfMsxPdUOS2to2wPMF3Ah+S7kT5Q4EHvAGXNnxQMpBWbpTGYs+j+dTnZCkjvBxYlcL7D3uotwJVF00Jpw94Q25tOOJdM3LfIU5OpWt6HNZWPLohSTVwnY09mGPblSfBSaXfC6DacxFeM4bdGHHc+kal72z4uRUpqLP58VUBySpI02imG1f3wA+W8H5DANOIn5RmE4+XkjXtIrNcD5L7Lr+fb9gmWT1l9TpJhO/hGoPsCrdOKowAvgWjZn23sSbOxanaziiohyelMpQ9HktqmCESpJqawrwSkE3kvMpf9i41ygaG9+87g19wMfr6ZqNqihng1OZKeLcXkllXZLUR/ROamsuELNBhec2gsZmODcX9FTZ6sdK4E/pGo2oME8bUNyCT2XsaClJLWsXits45gXg8zU4xzHAKcC93viZA3wD2KQGefk8xc3deJX22NxJkgq1K8UOmf83sH5NznUH4GziF0eq+2z+M4Hta5KD9VOZKPKVxq5Wa0kaeCegyJn0C4EZNTrfLmA/4DKKmXVeh/f6lwD7UK8lyGdQzHoUfUedvPlL0lraHLin4BvT5cB6NTvvEcBhwLnAnTTWuW+1G/7bNJbo/SlwCLFr5kdYL+W+yGtwTyrDkqQmDAeuLLihXgAcUONrMATYGfhKGiF4FHivRjf794BHUmwnADtR773sD0g5L/KaXFnDTo8ktaRvlXDTu5TqPj1bW6OA/YH/BK6n2GHs/l6fXJ/+9n7Aui10zS4toTP0LaurWoHbAauVHABcQ7FD9guA44BbW/D6jAI2XMsDGjPU1+Z4swWvzXTg18C4Av/GGzQ+Y5xlVZWkeNtRzsY7l7TQaIA+vFN0SQnl5Qlc11+SCrcejQV1im7UnweOB4Z6yVvO0JS750soJzdTv4mkktS2BgHnUM4772eBY6n3xDY1DEm5eraksnFOKouSpJIdCSwvqbGfCxxNdfsK6IMNTrmZW1JZWJ7KniSpQrtR/GddfY8nU+Pvk1/1BqVcPFli/hekMidJqoGxwD8o9/v3x4Ev2hGo7Mb/xZSDMnP+j1TWJEk10g2cR/mL5DwC/Dt+VluGrnStH6H8xY7OS2VMklRTe1Rwg+gBHqSx7K0dgWJu/Ieka1x2Xh9JZUqS1AKGAWcA71DNbndn0djpT3l2SNfyuQry+E4qQ8NMgyS15g3kbqpbJ/8+4FR8b7w2xqZrdl+FebvbDpwktb5BwMnAW1S7Yc6fgaNonbXzy7RuujZ/ptqNjt5KZcWJnZLURraknBUEB7JV7jXA5+jsxYWGpGtwTbomVefl5lRGJElt6kjgFeqxle4i4Hxgdzpj8mBXOtfz07nXIQev4KI+ktQxRgO/rckNqPdYDPwR+DqwY5t0CLrSuXw9ndviml3z36ayIEnqMDOA+TW7KfXXIdgdGNkC13NkirWuN/zeY37KvdSx/F5ZakxAOwM4CRhe4zh7NyZ6OB0PpX/nAqtKjmUIMBGYkp7wp6RjQs3blRXAL4Ef0pjwJ9kBkMS41BE4htba8Oc94GUaa9Qv7HMsAF4ElqYb3/I+//b+N6nTMyIdw/v8O5LGJ3njgM37HOOAMS14jS5PN/4FFnVJUn+2BX4PrKaew9ceAz9Wp1xua7GWJA3ULsAt3kRb9rgl5VCSpKbsDdzkiEDLPPHflHImSVKI7YCLgGXeaGt3LEu52c5iKkkqysbA94CXvPFWfryUcrGxxVKSVJZu4EvAvd6ISz/uTde+22IoSarSFOBnND7H8wZdzPFyusZTLG6SpLoZAhxEYxW8d71pZx/vpmt5EJ29cZIkqYVsTGNr2b8CK72ZD/hYma7ZyfhuX5LU4tYDZgJXAUu8yf/LsSRdm5npWkkqmEsBS+UbDHwaOBA4ANihA+tiD/AYMIvGd/t30ViuV5IdAKljbJQ6BHsDewFTgaFtdo4raczcvxOYnW74S0y9ZAdA0j+tQ2NL3b2A3YDJwFbAoBaJfzXwHPAoMCfd9P+XxmI9kuwASFoLI4BJNF4XTO7z73iqmx2/CpiXbvSP9fn3cRq7DUqyAyCpwDo8msa2vf0dG/D+7X7XPOCf2wOveawAXqOxpXB/xys03uVLakH/D1T7tZGJbehOAAAAAElFTkSuQmCC",
-}
-
-def bitmap_from_base64(base64_string):
-    """Decode a Base64-encoded image (e.g. PNG) into a WPF BitmapImage.
-
-    Returns None if base64_string is empty, so the UI still loads (with a
-    blank image slot) even if a placeholder hasn't been filled in yet.
-    """
-    if not base64_string:
-        return None
-
-    image_bytes = Convert.FromBase64String(base64_string)
-    stream = MemoryStream(image_bytes)
-
-    bitmap = BitmapImage()
-    bitmap.BeginInit()
-    bitmap.CacheOption = BitmapCacheOption.OnLoad
-    bitmap.StreamSource = stream
-    bitmap.EndInit()
-    bitmap.Freeze()  # makes the bitmap immutable/thread-safe
-    return bitmap
 
+from pamui.images import set_images
+from pamui.windows import PamWindow
+
+# ⏱️ Opt-in Revit API call profiler (Shift+Click About to toggle)
+import apiprofiler
+apiprofiler.start(globals())
 
 # >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> VARIABLES
 uidoc = revit.uidoc
@@ -124,17 +66,10 @@ def show_window(selected_elements):
     script_dir = os.path.dirname(__file__)
     xaml_file_path = os.path.join(script_dir, 'UI.xaml')
 
-    # Load the WPF window from the XAML file
-    window = WPFWindow(xaml_file_path)
-
-    # Set the logo from the embedded Base64 image data
-    logo_bitmap = bitmap_from_base64(IMAGES_BASE64["logo"])
-    if logo_bitmap is not None:
-        logo_image = window.FindName('logo')
-        if logo_image:
-            logo_image.Source = logo_bitmap
+    # Load the window from the cached XAML template
+    window = PamWindow(xaml_file_path)
 
-    # Set the appliance icons from the embedded Base64 image data
+    # Set the appliance icons
     appliance_image_bindings = {
         'WashbasinImage': 'washbasin',
         'BidetImage': 'bidet',
@@ -151,23 +86,7 @@ def show_window(selected_elements):
         'WCWith7_5lCisternImage': 'wc_2',
         'WCWith9lCisternImage': 'wc_3',
     }
-    for control_name, image_key in appliance_image_bindings.items():
-        appliance_bitmap = bitmap_from_base64(IMAGES_BASE64[image_key])
-        if appliance_bitmap is None:
-            continue
-        appliance_image = window.FindName(control_name)
-        if appliance_image:
-            appliance_image.Source = appliance_bitmap
-
-    interop_helper = WindowInteropHelper(window)
-    interop_helper.Owner = revit.HOST_APP.uiapp.MainWindowHandle
-
-    def close_button_click(sender, args):
-        window.Close()
-
-    def minimize_button_click(sender, args):
-        """Handle the minimize button click event."""
-        window.WindowState = WindowState.Minimized
+    set_images(window, appliance_image_bindings)
 
     def run_button_click(sender, args):
         # List of TextBox names and corresponding parameter names
@@ -262,46 +181,12 @@ def show_window(selected_elements):
             # Restart the main function to allow for another selection
             main()
 
-    def on_image_click(sender, event_args):
-        url = "https://www.pambuilding.co.uk"
-        webbrowser.open(url)
-
-    def header_drag(sender, event_args):
-        """Allow dragging the window by the header."""
-        if event_args.LeftButton == MouseButtonState.Pressed:
-            window.DragMove()
-
     # Attach event handlers
-    close_button = window.FindName('button_close')
-    if close_button and isinstance(close_button, Button):
-        close_button.Click += close_button_click
-
-    minimize_button = window.FindName('button_minimize')
-    if minimize_button and isinstance(minimize_button, Button):
-        minimize_button.Click += minimize_button_click
-
     run_button = window.FindName('button_run')
     if run_button and isinstance(run_button, Button):
         run_button.Click += run_button_click
 
-    # Attach the image click event handler
-    image = window.FindName('logo')
-    if image and isinstance(image, Image):
-        image.MouseLeftButtonDown += on_image_click
-
-    # Find the TitleBar and attach the drag event handler
-    title_bar = window.FindName('TitleBar')
-    if title_bar:
-        title_bar.MouseLeftButtonDown += header_drag
-
-    dispatcher_frame = DispatcherFrame()
-
-    def on_window_closed(sender, args):
-        dispatcher_frame.Continue = False
-
-    window.Closed += on_window_closed
-    window.Show()
-    Dispatcher.PushFrame(dispatcher_frame)  # blocks here until the window closes
+    window.show_modal()
 
 def main():
     selected_elements = select_elements()
@@ -309,4 +194,7 @@ def main():
         show_window(selected_elements)
 
 # Return the main function
-main()
\ No newline at end of file
+main()
+
+# ⏱️ Report the API calls of this run when profiling is on
+apiprofiler.finish()
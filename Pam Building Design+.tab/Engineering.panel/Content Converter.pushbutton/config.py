@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+__title__ = "Content Converter Settings"
+
+from pyrevit import forms, script
+
+# Toggle dry runs for Content Converter (Shift+Click)
+config = script.get_config()
+dry_run = not config.get_option('dry_run', False)
+config.dry_run = dry_run
+script.save_config()
+
+if dry_run:
+    forms.alert(
+        'Dry run is on.\n\n'
+        'Content Converter reports what it would convert, the fittings no '
+        'Pam family matches and the Pam families to load, without changing '
+        'the model.',
+        title='Content Converter')
+else:
+    forms.alert('Dry run is off. Content Converter converts the selected elements.',
+                title='Content Converter')
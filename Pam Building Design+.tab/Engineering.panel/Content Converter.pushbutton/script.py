@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 __title__ = "Content Converter"
+# Keep the engine alive so the DocumentChanged handler that drops the
+# cached family scans survives between runs
+__persistentengine__ = True
 
 # Import required classes and add references to required libraries
 import os
 import clr
-import webbrowser
 
 # Add references to the necessary assemblies
 clr.AddReference('PresentationFramework')
@@ -13,19 +15,12 @@ clr.AddReference('WindowsBase')
 
 import System
 from System import Convert
-from System.IO import MemoryStream
-from System.Windows import WindowState
 from System.Windows.Controls import Button, ListBox, TextBox
-from System.Windows.Input import MouseButtonState
-from System.Windows.Interop import WindowInteropHelper
-from System.Windows.Media.Imaging import BitmapImage, BitmapCacheOption
-from System.Windows.Threading import Dispatcher, DispatcherFrame
 
 from Autodesk.Revit.UI.Selection import ISelectionFilter, ObjectType
 from Autodesk.Revit.Exceptions import OperationCanceledException
 
 from pyrevit import revit, forms, script
-from pyrevit.forms import WPFWindow
 
 #import Autodesk
 from Autodesk.Revit.UI.Selection import *
@@ -38,52 +33,23 @@ clr.AddReference("RevitNodes")
 import Revit
 clr.ImportExtensions(Revit.Elements)
 
-# ---------------------------------------------------------------------------
-# Embedded UI images
-# ---------------------------------------------------------------------------
-IMAGES_BASE64 = {
-    # Company logo shown at the top of the window
-    "logo": "iVBORw0KGgoAAAANSUhEUgAAAfQAAAEoCAYAAACuKgPeAAAAtGVYSWZJSSoACAAAAAYAEgEDAAEAAAABAAAAGgEFAAEAAABWAAAAGwEFAAEAAABeAAAAKAEDAAEAAAACAAAAEwIDAAEAAAABAAAAaYcEAAEAAABmAAAAAAAAAN+TBADoAwAA35MEAOgDAAAGAACQBwAEAAAAMDIxMAGRBwAEAAAAAQIDAACgBwAEAAAAMDEwMAGgAwABAAAA//8AAAKgBAABAAAA9AEAAAOgBAABAAAAKAEAAAAAAACKOJ9NAAAACXBIWXMAAC4jAAAuIwF4pT92AAAEFXpUWHRYTUw6Y29tLmFkb2JlLnhtcAAASIm9Vttu2zYYfhVCvdnQ0SQl6oh6RWP3EGDugsRD091RJGUTkURNUmwnr7aLPdJeYaQsy04Rx9myTYANif/3H/j9B/LN203F+I1sQSoXqhw7f/7+hwOUGDtf/BmeVRO5VJ/ua3l1/3nO7294LJy3P4I3m2RTVIVsGdgUedkkm7HDhE5lYt7tMnJAB2lvxs47KwDXswsw0bUE/iiAnFAXhPGIBDh26Q/AxSREOETEg5gkOEi8GPSPY7zVIksupx96X+Zr7CzbtkoQWq/Xo7U30vUCkTiOEXaR60KDgM1d2bINLJtXOwtT2fBaVa3SJbDfLNW37dhxdlsoqsFs2Yy67Yy4LtCGVYiMMNoBBR9w1W2dd84FRzKXhSzbxmDJgK2WutXNUh8xPYgfODCRzGZPx1IUA7pp36/ap9HN/K6S6FI2+rbm8v3KhPlqr34ps7+jbuCDcquyI7pW8mBTcqOOQK1kgFbJpJas1fVc63xXOxc7msBkYmslAt99UaXQ6+b7Ax05Nb+x42KXQkIg8ebES3z66xYy00Jldw8hrjsnOHFxQr0dytSuYC17Cid4kum6YIZ0VbCFRFW5cMCQymSic10bd8aAd7h+Pplc1DpTuRE0lx/PwPn7SUDiIIDuiHTuZ7PkvGxaVnJ5Ph07ZmWklEgojgOeBTGMiEtgxKl9801YPk692GUUU7bTn2p+a8vQ6m87UmhubOzD8BkLqGc6hGAsocepgCwVFGa+73mBsRmGg7Wfa2WGAssPrdqohLEoQo5pHGcwwFTCMKMejEVqeKcZJSKN01hyB9g6sGaMMrOdN3ZIv3htCyq/3S56uHsQsf894OspwF7+S6lMNlwH2FraJuDKjDXZeevWLtRG5tdTZXbRdAaDKAwPZV8PZBSHkZ0ae9LmctP+xO5k3fTD5Iwt+rdcHeS4w3xmhfF8dj5zvpVYM1sJOqH9+oju604T7UNAR4LcJvCTakwv3fXOruRve7fd3EgY3/LLuw4STr+sHinD5yV8q79eyvLRVtyKG521a1bLdwtTF8/pcnQ0bl2uZH0QecVqQ2BrSBg7Wa0LMPQoaDVgVZUr3lUiWpWin0IDhcf9NGz1NDsppqaXaAZD109hxMxbxFzbpIa3kGGPiexxdlwyJ0FC4sSL/jlBvR5fsnIhzemNXrAVV4o4oDyFOOUCUmomRCQYgSnLUi7DLKYRObKVB4Pyv9/K6eyfSLitif0QP+pHyFqtHvcyhAD+RX8nU/S8I+F/ThHazxj07fjpT6ctjx8sU93F40X1Z/XF6fOOE+JjQaAMWQZjRk13eiKCPguDMOIpxTLdWdMvPe8GGg4um7slc4PtmNldnc3HcPmWpWGxNlfrvwBY9cIajLeI6gAAIABJREFUeJzsfQmcI0X1f2Z3ZlERFUVExQsRFeUcmJ1ck52ku5M9WM5M+sjsLqDrhT9vf56/QfHi560g4n0g/uVQQLz1h6ggyimCwN67wHJfy7W7M5P836uju5J0kk53J5NM6vv51M5splNd9er41qt69V4kIiEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISHRnRiokyQkJCQkJCS6F1ML8vn8wlQqNYgpUp+8B/gz+HyD5yQkJCQkJCQ6g6kFSMzlctmVlIeH1w6lUvlnj+Ss5xyqFvdMpaYGXXOZovlEJLlLSEhISEh0DkyzXiB+ltQKL4sq+vKYYvxPXDXOj6n6n2OqcRP83AhpK3y2Hv5/A/z+R0g/hN8/EFUKmaha3Lc676mqvCUkJCQkJCRCBGrSmPj/R7X8gVHF+FBc0a8Ewn5sLDdZHlu6qpRaurqMvyezxXIia9kJ/4+fk78vXVVOwu8x1Xwgpui/hvTmxcfoL2JZD5BFg/AuCQkJCQkJieAYYFo5QTxTWAIkfgmQ+FOpZZS8E5pZBu18hiTVmKa/67NxlSb8nabKv+P3xnK4CFgF39cfhjy/tTitH+r2XgkJCQkJCQnfIFoy0ZSBfIdjGf23qG2jhg3kW+LkjL9DKreeHJKH/EtjsECAn7tjqv696Lj5ClIEaTwnISEhISHhH1w7VtXinnFl4n8TmrUbtOky17T9k3gjctdn4ooxi9vy8Nkj8PtpEWp0J7V1CQkJCQmJVsGsziPxrP6GuKLfiFvrcdWcaQ+R1ySi+cc1cxbfCyR/WVQ9nhjPSVKXkJCQkJDwCE7maLWe0MxH8IwcSHW6A0RenWaR2PF8PaGa6+PjE4dhuSSpS0hISEhINAMjy1i6sCaZtXYnNKtMtsE7S+QVKabq00lieGc9EFcmRmkxJalLSEhISEi4gpNkLFMoJLPF2QRufRNL9bkjc5vUFWOGXIMDUk+mjRGxvBISEhISEj2PciQycEE+srDsNdWxFufkOKrkU4ms9XRcNcvdQuYVpJ4rlpNZc+tRmRMOIAWXd9UlJCQkJHoV6EntilRksB45NwN+D8kdFwLsI5LPSOr4/UED3oyacLeRubj9jlfmEpr5l1wut4dYfgkJCQkJiZ4AknC1W9RbtMjz12cGo+vSQ8UNmcGPr1eGzt6gDJ4Hn/0U0vnw/2+uVxZ+cmNm6JT1mT2W3KZEXlKRJ5DhFdyiXTUvGlu6mpDmXBN3Y1I3ppnV/aew3HLrXUJCQkKiJ1C9VX6Hsuj1QN4fALL+w7rM4H2b1aHZ+3ND5fsaJPz7VnWoDM8/skEZunqdMnTGOmVwdCp/8CLMM5GzitSa3QjbAK4kpDDzxPP0XbGMEcXyT8mtdwkJCQmJbkV5KrIAE/5eykX22KQuyq/PDP1xozK0Cwn6nuxQCUkaiL0EJD2NCf4+45bY32a3wPN3Z4fKDywdKm9S4XuZhddfozzvtGi2+J9k1ipTV63ByJa7gI2zbXt070r+hg5pHM9ywbR0yAOd3MSz5m+YuOS2u4SEhIRE94Gfb+PPO5QhAzTrW+5hJA7kXFrPyBt+n2WEXm6W2HOzG5Dk4fug6Zce1SLlby87onyktrqUVPVAWjRz4TrLgrSQYCzw+VOQHoK/7USDNvr5JD+jD0bskAe1fC/mUFZy612iDgZ6JPUieqH+vVDGboDsz2GDG6zh7xvTQ4cCaf8ZifwuDUica9weCbwJuZc3KYPlW5RnzSxXj58ZUc1SIqBWToO0WLMYfQ3yem8sa0STavFVIylr/9FU/sB41loCz34cPc+RZ7PFUhBt3dbSVeuXTHyyE0n0LHBBik6d8Gdexi/oVszXNpEkHDbKZSBztsV+R2bwv7aoQ08hmRNNnGrjgUhcTOuUReXtSqT8Y+015WEVtGZVD7b9jcFaFPOqpDox1qyeOFlF08Zx8N07xkiUNd+kTs/SVXPnqGIeQjJv41k6ntPzydYttf8KXXlAnPBdyzAnaCIXTxPF1IJ6dcPPg9hIDA+veFYqlX92tyWMkTCazz+Te2Z0lQrrc116PXMA6xCWLFggqFAxPLx2KBZbuVd47Va/rXocA6Oj+WeGJavhFSueNdcVmlNMMSLflo88c11m8Ed4Rr5Fsc+/QyNyR0NfVN6mLCifpo2Xj1QngxA62WKPK8aZwqSzwJ6EyWf0J/6fDQjyXCx2yl7wvf8XhNS5xXtCs/4H82zDgBtoUVtq9fmmYPl5nuw6pd057dsc9crEiNpb3Ti5eQO9ipmznhPN6H+H/nVXTNE3wc/N3ZOgPLCohZ83QboypuoXx5XCl+D3N48oE6OJhLl3tay6Q3OnbY7REKOKcQvUZRskv7K1vxfXqGvnMAxcHSdZ+ntAxg9COTcEaSv6ff3BmFL4iJh/74PKGndQoZ63RFVja4C25O2JY+2fqdTqZ7CX9Jfmz8n85kRk743K0J8eXEpIdzqMrfV62+2blYXlG9TnlDXtpPKoapb9bLfbmnnGOB3L34qWKBI75PUjv6TOt/rjmvE3IftQOtAUX4yw8o6mJ44EOb0dBvVZZPLNFC7Fn1CGs6IZcy2ZkJzJKITocHQRxP83ouZfFdcKJkxSn4f3XoDvjyv6L2DwfCeumO+PqhNjwt18+F77Jh1WrgG7XKq+Gsr0FS4XKNdFMJF+IZYxThzV8s9nX1pQqYU5ecTGC6+OqeYa+M6Xbdkqxs9hgvka/HzTYsV4Df+WR1Ijf08sN/dOZq27x5ZOokOiWTT87K5UJAn7MMYswMUp/o5/g3bdDn38cpDtO0bU4qvEus0pobA+OQZtkshaj48RZ09WyacM7O/hER3mG0bdeB5jOeuM8eVrcME/E7CtSlhPyOdJWCAewQTRjbsmrYG1ZUK1frIkFDmZJTbW7htesZZr6f1D6Pw62o2pyPM2q0N/Rc0cSHd3O4hc3G6/S4mUL9ZeUYaJAsi8de2ckzl0gAuw/H40B05W2PAJzfxnMmcby7W07Y5W9EC0O6LLWPz0+gONlA9XjvCeP8B374bJcgPV3PRNQEL4+3YglN9yYiRbdoRo9Osx2hxOuDjxjlUlDPcKZcA47v+EAX8KX536n5wcsktk9FxMLVwOZXuSvqvO+2HSgefWASl+ADVT/v2oon8Rvns/pPW8rlDOjfBzM/4Ewj0Qnzs4nydXGOHzT8Lnj0BaZz/Pv6PqsILXj6LlKhwEMjsPy8XKVKosE/0/LIDuRc0Gt5d53WwNSjUPh/JdBG1RL48yDaWrP40yiCvWqNB3GvU3m9Dhu3cmsiYs+tC/AvavLkokFDENR0xugPBbIPAZxlEYy60qoQxgwfoEPPdLDJjEd6Fa2SEJF/SduMiCOjyW0Mg4nPEnA/t7pTDjNNj9C/pyCggG8t8dQnvtpsqD+Tv2mp4mKi6jZKZwLHUmRhQqn+3otCcZa6p+jzPee1tOnsHIfAC9vm1Shn75AD0vbyuZY7oDCP0eIPQvaoeXD1dX+9luL7GraI8lMpMHkcr4nFh4p4LJVk2Qa3Mt31cvYUeimo61XMzTBaRjkQVEtngbEkVSs2a5loQGfUjYSa14Kz6LWlFcMf6CEyosNshdej7h1iQM9wp/T2YnyQQMn/0roRipJuVpKJMkar6gqZLbATCxw0RSsid+1/ejHKwSCTkL5BtVChmSj1Y8f8nyk/E2wAyvK6QSk9nsmDL5evbeRez5s9MrTsUFwrTwPPkOvaVgHYl5J1RzB4tb714u9n+U65Jla1AmV8EEazs2imX0d6IvARZNryQSmpts2QISCfCTrC0bkbpA6MbdiXCuZHY4MaInE61JZU8XvddFNeM4Vv+OHbE4cDR0aJvH2Vzg94aM8702EDosNs4IaKfjsiOICyzrlLDKOkegc+Fw/rnQfv/GOSYk76AlMtYU/T7hHL0/CJ1fTQMy/yJus69vs2Yuauh3KgvK79eS5SN8GMQJ2vl3sPwhdGrS4KCFXOnHuQ16tiOe4zTzfZhPg3N0RugrngWT5X+AzLHjTZP78lRTmh5DYleNaxNafjiuWtsYOfK7880mLXYHX58h0eGALGNp/YP4Ts/ngnyBky4shUn8frY4mGHe+7y9n0SnK5L3R9OFPNT12ymchBTQUlhd41QLxMXQ9JhSqCB0PFIgRK3ou5znSSoRTRkIFcj9YbKq91Iu+t3dzLvfP8iuh2J8NAUkj7se3uumz0AbT+PWYEzTvyO2ab227m1Cr0jMh4OONislOk4Kv4+qE29kbdeSnUUw9C+h06uyFvrWuHM0nX8pe13PEZatSKnmp3GshyaffiV0TuYb1UUnoaOXDSFdR/Oa8MraKVq2fJRa9EHoZFIpR5WmGrEnOFq6+T4/nYvGTCdk8bUm5XEIXdFvI/fkK1elJRYudjv83EK0IW9k4yIjolWRLXp4xxfxvc1InZc7qhbyJHQtDIyo4s8NL9GMceLJWY+gsYrLpFviE1QtoetnI9m6uQCO0a3gXVC32VZX9DEWMQ++ezWUbQf9vFWSpVufdDGgf6xBe883QrfbjWvteFaJZ7pxpfD+iH3tqBNb8H1M6Cqdb8bIfGN9K6zydhRsHlqsmcOk/1S3Q8D+2XeEzs/Nb1Ij+27VBjdt08hW+2ynyJwaxi0q57UV5aNbP0Mn2+04kJO2oU6wScQ+79LMcTrht04UxDhPM39KSlOfOJsROklkgiLb2zWOdkrV28FNBkLJXmwoxofEulaDlzmWNsdhkO0kMm48CXkpC/6fnMXWnUhbJHSWZp13Od7/BC+A9WVCnQGVaB4V8q3ccmfb7O756Nz179Oj2YkjmQCr23y+EnpFvwdSIYtGaLNfYF0b9bHw0N+EzsqMi38gL1MJq8wdBB0bmvXbdsim7wida+dblKEvkXNz6rY1IEFT96/Mg9ys7RWOfcZ+J89uBO18nbJH+Tjt+PKIarVI6HTLCY2jUqljn8eqFKzB2GQcH9ffABPTzniLE4RN6KpxiZifCzwROnl3lebunJEXHWM04kjHJt46ZKFzUp2NKhNZfL/L4GfGevn9nGh3dQfZrFtZcIudyIL+raLsdWQZhNCpPQHbBcAFCzfMY+3QTHuvIH2+CKgx8mM2A65tzqLu8UVcPxI67w+QdpNFo2bcvFg54TV1+liI6HtCJztVSTr+r8P72+y1XU9cwlb7qe2QS7zfCL3Mzrk2pxa9bqs6tGOjQ8a+iRzvqm9WnSAsd4LGvxUSav73CoFZmJe5WYfQj/NF6AlypcbYJtyTnW+EXjFwcXuZHgWYqAnfEtOMX8fpdaKr4fs7iD0BWpjXIx/HRe3NhxIHGlUy4/XPWt9KNYh2R8qi0bLEqUX9zfBOKIv+K7Suh7I80awsNROpP0InREImBLy3quo/IpbxGQOv0/0Bt+RZCN6mbciPb9DADn6/DNJnoxn9U/Dzp5D3/WP1bz5A3ni7wXyszk5RvxA6kQVd4ExibINto0r+ENaebSJ1Sei07xozxKBTMz4aVrnbDDIm8OwfbQDozl0wd99u7dlXhM61863K0FeRaNcFcByDmjiPtAZE/cj6zOCF6zKD71mfWXjs7crCzEZl4fJ1yuDb1iuD34W/33VvlhA9dSGrLCpP+NxyT2pGOanoT46PF15NKhXw6ox9dqxYGS8k6zawGKGfT4sTDqHbRJw1n4grha/Gs/ob0KDLyQ4d5YBWnTHeDsSysdHEgQZdxMBNNd8j1nnKvgdaXAyDbHfNJFdRFkJ8j8WUwmdSmvG6yrLkFya1wsugnO+CBcdWD5NYIA2d3ZP+rFq5QKHX5MYLMZgsNjBSbyhfRua/R4v+6nxSK4x9Eqrxs3rXGZ2jFmpxXGUM2U+ETuVBjCGJMea22Hj+tU3GQgBIQudlJ1dmNfOxaIoaJ3apRz8C5/aM9a2xcA3hKmXSL4Qunp1vVoa2b1H9a+dIyndTgn70jszQ6ZtTkf3Ed1S/87ZYZK8N6cG3bFKGtt2TRccyg9OnaFr5KI9e4pD06XN6+SilODOcO7V8mHry8Zh3WEZxMCF9MIhRHJDlV5qUxzOhc7IBjfjWmJo/XPx+pPL+L98ufza8/4f1Jw+6OID8/iN2dD7hAkF+j2m8LoZoBrOaN6+LjVuvrShLuTxQXZajM8e9AB274PWaBrL0aRTHF080Fn2Eef8TE6mPZowAUT+FWrTbZM+3LEEe1xyqqnvydqvO5+CD84tgwvxr0uX2g+Ml0PymS7v3HaFzmTBHSzcfnsi/sKKvhAZJ6DXjQTMvpW8udyV5VVwP1qyww1lXtGf/EDq/pqYOrUZS9evWFb9HSXnouttTi15H8sagLpHIgnIqMojvwZ0AEkcd/49hWJlQb09F9lmXGfr5o7kF5feriZlG19bw8zFIMGiJJn84PDuqWuUT1WNmvrxspHzJ0gO/j3nyXYcAIFoZTP5XNdhibTiJMWvyd2Nmnq6tNSB0Z4vcvGUkdfz+Tp41zkxIudn7mKGJ/s16EwhdJDj35Xk5F6f1F8G77mPGa6Xa75Czun9ym4V6ZRFc67JrgFYjD3ytEzqTC/y+PrZy5V70tbUaCd85SNRf4OD1txKzeF8qfsctn7hinuCmpXMvgSCbP4ntK/7eb4TO+sw0vVZq/txFLiFAEnr1uCDzlmZYYZU/ZNgOtWCOudanAy/P7dk/hM5cvG5WB392X84foQtk/hf0Lof5oWOaas285t0siht/7nEl8t3vLDu8fIiyZmZMIPQk08SRxI8iJE7ud5dNbXn5TG24/DvtxeXb1WeUHlIi5X9oz39SXV4kW01+t/Y4qcUUayWzcPfjWIYaiCnGMswroIZO36+ZT+M2OC3jlAf/8JRg0cMcTHBX1yMg5vXrHPwG90aXUK2T6hEfs7h/FO0LRHk1gr3jsfKUvYBUb2pYzxYI3dFG9P9tJGd7MlX1onu9qGEl/L7e1aagqr2OXrZ6P+iPj9QQB1tgoF1Dve/2I6GTtiJn6rjItd7dqK38QRJ6dX8mV0Sz5qaoevy+rAhdQ2KOLIr/HfKdc9f27AtC50T6QCyy1yZlcBsaqYmW5x4N4GbR2G2rOrhlXSpCNMdyi9oxNcorD5QPjiw6P3vQn8eX4mRfmHVIfJJo4nhOPqktLX9RO6L8J/VF5Q0qjc62TRkgVvK4sNiYe3Z5TW7p5SRfulhpidTt8+OEuTeQ2i3NzlzrdiA6oTyayln7s6wbOhtpROiOoYt1Fj7bSrAXYeDkKGHppeq8mUZ5XUTwxw2a9JfcBholUPhcsz7Taln4s2Sx4L4i90/ooDGL9a0nh7hiJNyuIdJ7vGSSpRpkE5sHzA/yWl/bXvzGhbHVZUHZ14RO+h6e72ath9BFLxVJWOe7ktCrE3FuRQxSza+HVYdQwMZFNGW8DtqpdlEcfuoTQmfa+UZtcGQjI/JWz8/RCA7PzbcpQybJEzRzP2W5gHW285e+8ShFm9iJ2+6QSilNJ85mvq4dUr5SfWF5E7zzHkLiC8j70WUsepnD4C748+5MZObDy8bLr1NP/TzN2XM0qAGbnOB53BoMGpwFOtH/eah6U8cy+JN0+kqf4V7B3CmuHYJ8bnBxp8gXH/enQOvkX4JJ8fcuHvL4oNuNxnhcvq2WBc/2YWJfV6+uLZ6hk8EKWn+cPd+Q0KOZiaOFCcS5psY9+6nGt2gZ6+6A8H40AGW6tXbBxwhdMbZJQncjGWpbAm3wA9J7QjPYkoRepx6wiLJmRn26fG4LnBs0F3VKDn1B6Fcw8t2iDhX9bLcjmd8FZL5JHbz+uuEIP2/0LSje2Zbn8he8fdnS8rnq62euUl9Q3gLaN9fE11eRuFge/PxeeO6r6iEzRy59UzmlTJzr3Md0YlvbBmRCLHFuOJJI5F+I164ChU/l29iq+WHMs4kW25jQhTNiJEI/MhbueX4jVVsvvp1f5v7Tsbygfdb4Uo4528k3CefLvsoCk+75LjJuldC5M40yWrGL+dd7b2NCR9/u+rlUBh4IXe0OQrcDqYSY4t7cCvsmS1iA7RpNW8QBTzikLgm9Xt+gd9Otq9GYkxVlzsjM8Txp6GO51h12+W3PviL0TZnBjzG/7S05k8EFAInElh4kcb9b3WqvBjdku2bpC47DBcb2TGR2K2jiXPvGa22NykM0dCD0n6ivxm36GRrRyPxXUtGXNxuQQGLPiCoTJ8Pz2wIONjYZmE8vZqTU5NpIQ0LnW8pAHn+lj7dusepcwdPfV+9cnGzHs8kLo6JhIJV6ZYHfL/dQr4ZlgbzOoLcAjGqCbl1DD5fQiXW6Nw3dcDmS6Tyhk0A5LtHufCcWKjXOnRd5uLvfGsngghe1dOucRm3WGiShN5I3PZbS3xdWXXyC3jnX8s+HBd16n8eZktDrgRMokOFZ99EQqa0RugIaujZU3pheqIr5+YXj4CbySsh7B56RA0l7PgKgAV4Gypep+6PlOwmcQSJ4EU2z8C8kEQz1iMEjEksnD8JY4TChHh/XjC9hmFJ6lmzNBhloQpCYi2mtmpKeJ0KHcv6ZZheARDP6O+sYhFHrbsVI4HN1CZ2dM8Pvl9Ki+C9LPFM4PQRCtzX0WKZx3Op5Sugl5hXwKij/T6CPX4gx6YMk6AMXQr5/xLC26INgbFlj73j+y411N7fjbYoqufqEJPRm/QRtFzC8rCivTsKuf9b6At0p1DtX/34i9PWZwe+3uuWOZ+14nr0hM7TrNmWIeIHiZ/J+Id5PX68MbmzVnzxq8Lgt/3t1P7z/zQYk2UKcRVJPMe0DPZshkeDdR/w/CVlKJ+EG7lK9dx7MK6rqaayLh4mgCaHrpOxQ3lu4BXrE5zZ3QjU+77LlThKZANm5eC73zj3gs/9UkxW/ew4/rxEmBJ/b//q3w9xy70tCt49j9FB8L4jAHSuMCw+LwM+BNvWQn4iDjZJgZ2KEU3ZJ6M3kTQ1rzZ+x4nSU0O24EDBOaSClKjm3N/UHoXMCBvL8gS9Cp05onl6XXnSwmJ/v8jAhXzccedYGZfCOO30S+h+1/cpxTugCMdYG6tCFmNlhnGVy7bylu7aejOKgPrv4GbcPLb1RKFjbIh+9uvEvwGT+1wbPPiY862dgLID63OByjU4SekuJ2TRoxomY79q1a4fwnUFTtVOguJJ/ObRXqEEzqHEciTn/w0bt5h2S0JvPT7Znx3xYdWq1/knNvCLsxaGX9uwLQrfDpSpD57a65c6t4ZHUN2cGo2J+fsEJfWM68iLI/95WvdbxLfdfqy8BDdls2MDVE3oYnQZ/oktW1GxIhbwRr8dra+QK2Ufw2Vauigle346MO9vbQhASugMQ18x/H0zJk07ixBVj7aQjeGV7R6tlsbf+s1ZSWHAFCZ/a34TeRg09wpwC2XnCYp14HWzs6a9FciE7T7eic5Eq2fqAJHQvMk8Qz5DWHaOj+eezYrWd2IQro6fNRb3j/ULoZecM/TMPLPVxhs6M4oB4TxXz810epuFvUgcX+3FBi4R+lxIpX6C+sjzSuj/4YIPFcfn531iHFiYAD45ldEJakPfdI+xeu8f87at4uNXWiKChw/+E5UsIFH2Ruw4+7rFONTekUsY+5C1eFy6Otf2v6hCDJPRWUnsJ3QbPF/sSyPoPGHAlhEnZ3nkCeRxA3xTkXFcSuud5Cg0SVesLYdWrCUifX5wtvBKUnfvaFHylaXv2BaFzK/fNyuBbH/Bp5Y6R07Yog2SLOeiWOy/PVnXh6X6u0eG1Nbyjfq52cPkIdbUnf/ChDBKFesCCzvrrCD2baqWzeHT9yjVj65KIMMHWy5T7IMffycoYbQdcyMMhdHOSlINdR8OJEbT2x92izNnfUQ2yCEDf7aJ710ZlwQVPcmmjaGWGJHSvqUOELuaN3gGxX4TkDITYmyQVo14I3xYgCb2VuoF8dvG6tTd4C3PUlTV/WM9+pxN17gtC5xr1Vm2hit7emEbsWSvG5zfSbfen71CHyDazX1Ln2+23aJHnb1YHN7RqEMc1dLyv/gltpHwYEPpYBwidWNJTT2u3w+T0Ylab0AmdvosTqXmBeCed36XnqVwu29HB4krhNCjbbNz9iIFHZrrbsTZ2/LGDll5Pk7b9uYOG9T1ny7RcUxaR1DDQDbsONetSFmcilYTuLXWQ0BH2AtHdn4GPscOuZGrmm8X8/UESektyp3PWFVCcti8C8WZRcm6dKPUJobNK3ZF+5ks3qkOPbPaxze34cR+8jOQpBF1pqSz2bsHQmb59yiukHMSznNeIbcEGBg0NCVrztpF0nhgG+hj4LYZPpYMRtO7b0bjFcZwjYmpBMjtxJJTvF5R03QnUPibIVm6/8Z/JrHksGtHUMxh0HOgYNycyhRWCFb5TEiA1jHIGefwaFwdABo0clkhCbyV1mNBtS+WslUxka4P2tDx+WP9zbEO8xCeoWzpJ6C3NXXQxBWPztLDqVwXS1w8GxSOpWf/q4J1z1/bsC0IXAUR65fYsuYbmKzgLxjXfpFAHM1ewaGpe3lsuRwa4lzkg5Ikt6lDJT/hWtHDfrCwsX6c+t6xo+fKoauKWcNs6CEyiu/EsESaOrTxIic9B0RKh88EIpFFi/tA3QlnOg8/+Bz3TxVTz6/FM4Vq8GiKcdbpMbPosu5t637CSfzlrjQGxTAh45neNrFJpWfCuPynLHTGl8AMsC07ScU0/Gz67Pp61phuXpWoilYTuLXWY0O3yJ8y9sX5By2/LXNU/i/lKQu9k0vnu3H0jav5VogzDgHM91Ti9A8FXmrZn3xC66C3ufh/OZYQ0e7eG296DUzxvoq1jNLWpinPlATvKGqQpdh9ynTJkblOHnt5Ets5bJ3S+3X6edmB5uEH41aCJX38jmoVq3DSayh+I5Q8w4L0SevWW+Qy1FLaIdy8cNJi4py98ttEgok5iyEB7m2v5GRmNgqYPg+EJapXubszC3YWS6HKkLLw8dlncnPXILfceJXREXDGuCnq7fc33AAAgAElEQVT9iI6jNViPL2Kecsu9s0mwyzmPSDBkv/oxNX94XLMeZzdaOm0IV9GefUPoXJPepgwdAlr6LkaQPjRkcp5OjOTWK4OXb8pGXkvyryO4qitq37hTGyrB+2f9kDkndLyy9i5tSfnIthA6Erk+ndSsEvNy9BP0qIZ1CDjYPRE6m6Bqts5tP954l57ds2+qCSv6bhqr3fwxaYuy+5m/46ZVfyups4bX3upbqHouC3zG6uM+kUpC95Y6T+iiL/7fBCUlW+YZnQRSkoTe+QR9t5SgsSKOCaueEd7PNStQTIwQU/8QOoKT6xZl6Nd4Hu7n/JqTOmr4mMcWdejJ9ZnB89dnFh57u7rHqzanIsRwCrfX70hHXrpBWZhZlxn6OmjkD+DOwEZ4p18yx+32rZkFs9eoe08vUQuoQYfWESiRG9MJ1ZxlrkrviaX1IhEcd8QRDE0dy9BIa/oO6JSPU1effkkAv4dkvoZY5Avn7w06Nwt1qOqforsS5nTc9wAl5ca7sLugPo/VnUgloXtLc0Do9jm6qgd2NMNlHlWN0zFPIeCPn5JJQvfTBvwaqmbdMjKSew4rauAAW6BQrQ7LZ0EIqb8InTuE2aQsXHmXD+tytzN10NZLJMAKPZffAeS+CdJtGzKD6+HvD6EXOHaHvcQWEL7IHBOJsqYOzH5uebx8hAZkpehMM/Q1WZbiQvQq6AglJHL4fEdcKXwpqhb3RVmxjhtGp2jq+pVtW18bVQqTQBa7E5REpluoH/Frj2EUKSnrFwwPe+/YfBKPZvSPYfmoQ5AW30+c2pgzqeU4geufAtn+gAadIc5uOLnS/HArsIbQjbPI9iwsSITnyXd8Evps3NnxKPGFjj9Ct3chMM10LB76nG656/8IvOXOjCpjmv5OzFNq6HOThGA5ZwSsK+kfR6fy+0FeW8id87kzhKtoz74idBGblaE/BdHSRW0d88CE3uSQwDHUKv4kTmNg0cD+7pvIN7DzdrziBmnTUuWEb44q5sMpGjWKam6K6N6Vh4dEwuapeotYJ40PeZSoNbl+FxDMmegYgYloIGyPXPiPB1/ut+Jz0UxhBRDj/WMkdrc5W1k3ooGTJH6OwTXIFrtmPIFXx5jxm321zUsZbULMWsuhXFuoEx0SAEdwqSu+v8LV7ixzibs7ntFJSFn4/Ceh+nLPSg29U4SOi1qo3/3USUiQs1FefiuE8ktCD0J4+DOhWk8mtPwwkWaQwEuaefYc3jmXhI7gZ+kb04PJrSoQreLP2rzONvwsI/BZpv3PhpE3y38adwI2qXu8Bcu/Uln5EtAkT4lnjEthot0uGo3ZoSGBIHnC/4t/xzvb8L3NMCn8JKpaJw0r+ecyETFSaz18aRN4InSMT55aTe97p3LW/lHV+FZCNXawshMrc+KkgydarxKLjvYoDK7v8khLfncX7AkpQQjp40haLLhNCa3YK99ftN+Psa/h+UuhXY7gecH/f8QWTLtJfUnCONx4Rq9P1xJ64SyyU6LouyqfhwULmXithhNvBaGT51nMbyevXSkaYvIbRMYeCB2e/XeSLhqn7XyonQXmv9nFYUdPE7pDSOYK2ieDRYrjP2GB8EbygkDHV5LQgyR6HZaM1d+z4rY0P9hHMZo5Dgu9ZrdZ/LWFJPTWwB3NgEb95QdyrXuO63Raxz3VqUO/ibhozizubhw9pUFj4hWqyyD9FdJNNBVuAI3xzwnF+DloaF8BjfdUmAiGXxtbuZeYD8u3Xd6UPBM6O2Mc4JMXDZphvAXS+fDcPzDkJaQtUcXYEMsY10A+58XVwqnw2Uuq6uK7M7OBS8sMi51YxjwW3n8OlO9KkOEd+H5ImyBdB/+/OKYWPpBgd/SF90dG0/mXji01D0nkrIMxylt1qo4sh057Ejn90HrPu9/HrwU+h+Fzq7+P+WL+jnOg5jKC/nUgklF1Xpi/E6ayAvOC0EEDuzA4IaFfcaLhb+HGpZFAk2zfErpzVBUWqSvU0U+r7qsPPji/KK5Z17gEXZrruvUpobNK3qRG9tyqDF2DW+/rAm69tyuhpr9VHSpvU4fuuSW1x4Gs/IRsqj2UVQO1L0z5/AV1Oyz3dBZpf8O3SugRnLxq6ze1YMWKtc+KwWIEf1b/ndYltHumbscOA+gxDt+vqsU9q/8+FY4BYa+jZwmd71jAAk0Tbij41p6qIxMG7xt9S+iz1BNkGP7R9VkaM8K6GxfcrNhN5z9hoff+kHceSrBACCMSZn8SOoJvvd+SXnTwVm3oPuaCtatIfR2NxT57pzo0sy69iFy3qBPpzXZFSgxu6k0a7O/CQqCTje2D0J1tX2HhUQPHh3rbiHRA8NNeK7OG7y8PNAzhWf10uenznu0BGuVT7wqfG5qGIXV5N/7Ta4TOjdVwpwcm2HVheP1yCL2OH4SW0WeEzm1rFOMa6EfX0d/DCwEN5PxtItWmCy3696MzhYMSqvVQSD7+SSJb94rxfajXE0Hbs28JHcG33m8fX5gGDfhJZsTWFaSOmjned0fr+XXK4NvE8nrEgEuaSwQh9Op85rJec/3+XkB7CF0pnID5Cgur4Akmcr7IxbxRY4NJ/p8hxbKmVzE185FkaF7K+ovQHacwhUtjqqWxhV0o581xZmia0PRcs7pzwgd5XxCWdm67pc1av4R+NxIPviPU34SO4CR56/jCZaCpP3GnNvdn6rioQOczSOa3ZQb/C8vHPd31MMIidInuR69p6KS8MMEuS6jGlpDIXAwyFKKHsj4kdGwPVccAK2iM9oPwCNW+m35Do+ut9p1zzTgxRF/tVPZZcxptUTCFcMQjCR1hkzq1fN9+r2MoF+ieui8yh/fiHflt6tDOOzJDq8Xy9TgkofcPul9DB3JVVXXP6DLzFQlFN6KK/juMG4ApxAkbNfRZNFjFcktC90/o0Af+D/OMjp/wCqjzPWHFGyfXOOkNmY/XqT/py4ckzL0TqnVbWISO/jLIbRbN+BKRlaovlhp6iOCkeUdmjwOAWK9C63fQkmfQWC6sq2fNtHL4OXM/uZo2uPF2ZTCB5ZkHmjmHJPT+QbiEThKZ7NbjWSr8vDZoorcTjDtgQn8aryKOsdj1YUXKIv7byYRt/ZSKJFz/4f1H6MafeP4xzXhbiN7ZSti3QI47UEumInbayjGEs84MK/iKszNg3j6cMvbB/KMZ62hJ6CGDG5yty0X2WJceOmOLMrQTtXUWmW06bGIn+TGnNHdnh8qomd+eHvzh7akIaeR5oplzSELvH7SB0I0yeg4kfgjCSlgu4mKYOicKMJFWJdAcSYSv4sNR7YTXEYmEHBCkXwmd7XIsAA39T2GRun2NTTMvY1UYEN4VSaaNkYRq7gxItk5ic11U1U/iMoP57yhJ6G0ARkWztfXxocPuyAz+GgOqILFvpE5opv2EXq02eNvAtvS3Z4dK9Nrc4PXr1IUavhevpXkNy9pDkITeP2gLoVNviKL3w2CJ9b/Qo2NR7Ry3cfV3oBzCPfPvb0J3jBeNkXjWejoskiVRFPE9mrEK8xePdUDGfwrbriKmmT+j75niNyskobcLeE9dvB62QV2YXp8eunwzaOy4JY7hUzdw7ZoS8zT7vVSTuOtX/hx8xv27b9XI3/4OqcBjpZNwq+V52QguhO74BqcDShL6PEFbCL03Eovwp1k/Qhm0cj3QG/qb0COCbwjQmj/HAklN+83fqT91AASa/+Z0Wn8Rr0tctd4S5vY+ic2uWg9xh0yS0DsI1JKnBM9p68eH3gDk+wnUpkFb341W6A8sHSrfK/hu3yykLcy3O3kOCBy1/E2E6AdvB2L/2vrxwRhfOFQvIuYhGKGvfRZMelJDn9/oT0LHcL3k3Nz886FqcU9RFuFBEjpLkcNSxz4vqZm30pgC4dxNT1GfAedg/hjXAtpye2gGeM7d9/dxOdmuZCWhdw5ItOIWeDkVGbxtfNFr0Qp9XXroq0Dyv16fGfw3/LwXNPXHQBt/HNIO+P8DSN7w848b0kPnwkLg7bdmho7gIVZJXiDweWT41giOhq7p/2ahUnfSqGL6bujQOxNZ8tmNw2slofc4+o7QY1A/EkhIM6/hhk7hnZuLkIRe9Y7jwr5KRqOnWaMwH32dRG0MaaudbOlnravE+Y3XQxL6HABJnWyJuwgJSfnuFZFn3ZCLvPA2JfKSDWpk31tSkWdftzbiGvu4XLVI6CMMjGrFAxenVx2K/sHFhJ+xrSjZCXsb/UboLOKh+YcUI/P2uf+VhG5LgskYiPD88KKe6XRbXDPvhHwfZ7crAvcPRrbTo4qREssuNfQuASd3JHI3gq/CgP0sfk8KWWJ+o48InZ69YkS+6Lj5Cqw3Oxdt0xiXhF4ti9h44dWwoHqAyiIcL3IYijmAXGvqkKJhoL9WLWNJ6F0KJOl6aa7L1nXATtwoSfQ6+ojQ+QRs4rb7RpiYV2Ld6UQtt9zbS+jCPXHFeFe4AVNCugHBjO3iWXNTVD1+3+o6SEKX6BYMNCFl2ZH6F/1G6Fi/UjJbLOE5aVQxvoYR+VAG4W+9S0J3e+fw8PAQ9LMrw7peFlYSXNcW3eQrCV2iXSAGGmhh3qFwql2FKRakA+svw58GRh8SukG0sZhqTqeWrcGJ/G88NKe8h95eQrdJMWNEQR67A5JiaMn25Z+1LhPL6Vp2SeitA4XHw3C6pbku31yhfgjM+jLBDjOq5A/hgQV4imf1N8S1icNSy/L7Ofl0BAON2rYBSQ/U2eZv05ZpX6A/CZ1Pxoq+m8VAX5fIFA5CWYQ3v0hCb/ROIMUvUgM5fa61dO5S9jE0+KVNJwldos3gHSqVs/aPq4VTYeL9cEwzTsQ7nuyBik7IBw6Q9xj1uGXshLRLSE+hi86oYpwpPt+9oI4/RrMTR8Y1/d1xrfD+JNSNx8aOyAHhB/1M6IyI9GniXlazNsbGj3s1ykMGZ/EjR2+Ezj8f1fLPT5BY9uHcTQ9SbvRJAGX5aCO5SkL3BzrBqPpiSCcls+axeH+RJwzLiMYs6PREfH7+g5IZGpRAJ3gCPSItWbZmNknOofQ7ExkaJ1jUVO2VcKawJKFhSEuzRK920BRTzBnqvcn6gvh8G0HqkDp29fPENuWJtLVq5mOqebj4PP+JDkCg7t/HsmO5IZFBAZPlFXFl8uVV35Hwhr4ndDKpq/o0khGQ7vVINKJs/EMSerP3xjJmgc1hc9Ln8L1jORJ85fpGYVlJa0pC9wHuZD87+YslK04pJ7KTM0KQhhI95yjuTKrFV7EvzPutVsc6tHAanvlhmEfqQhGdvBgzNBpQcediIG58jne8SkLHidrg1qDUhSvzYw0/O0LovFyJ5auHsS15m/L2TeQmp8ePORV+L35LKI/dyaHM/2/J8pOxHjM4AfP6E5mo5k0pvlMxLwdG29AmQscrSZhPO5IR2jWlisS8xyU1k0ZdC+wKVhK6F/nA2L0oXKv3lmTKlAJLayZTSeh+YBtN6BezldtuJ0gDibSEDf9UHxE6nXBz+RcmmGvD2o7PzgGz1pXiF10IvaLzcfeJHSd0zRwmbcnb1GnfXXRg6+fy8jjemYxl1AK1JtIW+pbfRUg9a3ykE/WYZ2gPoaPDD/S33Y7EiBH7QtgkYAfkUIw3oVyC9SVJ6F7kExvPvzahWg8HlI+v8pL5TzO+w4TRUJ6S0P3AEdovXDpYiYZQ1PtGQ3cGnLmiwTUPupWumU8klk4Sw54IMyrEX7uR0AWnEnaZyI4Bcepg2Bo6Px+Hup3NyloT3IH6lsfoS9bf2ln+eYo2RVszHoG0HdI9oSbVuDemFB5DZyLYV/h2bWhbtopOPMlB/ndBni8RZdQ6JKF7fT+M7/eHFcPcW3LaeSRn7e+lvJLQ/UASegU4oSWXThbIFRuy1ew+2HHCSGatI/H5qXlG6EniMrJetCYgdHLsYN0sGDPNw8HRFoRM6LQt2F3eBXgePazknxtWSiTMvdHL26g6EYfJ8H0wF/wjmSuSe+VhkQHvh9BP/xdl439cSEL3UATyzMEH5xeBfP4+1qHzdHsnJut9J0YSuh9IQq+APeByk6lE/cAGxKdxUrPud7SK8sB8IvS4Vvw0JfTaBQ2dSFbhYuaXvO7trMc8Q7iErlBCR+NVzLftxx9TkQXRTGEFvPuOEB2VkPEEc839Sa3wMvoiP31KEnorZWDz1ExNfdtB5tQA8ncRISJcM0hC9wNJ6NWgluFAbAmt+E8mk12MEInhEV5HW0LOkC1yFtTAKK7nCJ1/Z2R84jCow07mtpOfo3OtjIfCNDtRj3mG9hC6UjgB82ULsoFwE12skrxZ/0DtHd5/SVjGVVSDwz5VfD/m769PSUJvuRwYNa29W+88SttTo+mJI2kzeeMQSeh+IAm9FoJ3JdDCH6Z3Jk3eMWeXLF8DE49x4+K0/iL2jYqwhb1M6OL3oP7vxT4Bk0aJR1YC8iD1hz7xHbHuEp7R2xq68A4keOgXbvOGD3Kidhm4DVwtK++QhN5CUciz6EM9nrU2MbILfeud3oohcc4/3aoMJaH7gST0eqDhB7P6G0AmP4dB8xC18tW3QzrbLZjAfCF0sf6j1A/BP6H+TxJHOarxn6hq/lcjT3kSDdHzhE7A+hZ1VmL+J4S427RfasY0jjnxHS0UShK6j7LENMNqx1l6TLFtbW4ZyVnPabWMktD9IBRCp0FHSAchnWTeBCCx65FInPxCDEWIW43kLy5BVjpI6ANc3iSPOtGrAhJ6hOeJmthRycLL0DjqFSywRhsWdgOYZ2WdOucaV5RnmMm9nvOA0COOAWlctY5P5orEYj0YAVDDKfj9LWL+3iEJveUC2XOEFdrxiZOYwWbGPNaP/CSh+4FPQncmrPrGK8Kk1rLgfPoeb1BNX77qBw7O5xdhtCLxszz5bO1Qdb3aTOgDHupe8UxQQsf/53K5PcTPMU/8rMFk29BvvKvMGtWpXB6g7wp3AcEDzsyBQd+8IfSI05YLEqrx96BGcoK1+7f91UUSessFYmMPd0XQt3pYd9PtxZlm/lh8T2tFk4TeOlokdJwEK0llasFw1noxBiMZTedH0PDhqIx5QMrW5Cj8EnsvoU2EPlD93Oho/pkJkPFiLT+MMsfAL4vTp76oivQW8IWIfw29fajuD1gn7DeLx2mdjh7X3zCqnfp8l++E+l7ybnjPSNo6OJqZODqsNJo2RuLjE4e5FGE+EbqjpWvWh0IjKNX4S7W8vEESeqAyKcZHUqFo6bp9a2FEzfs+qpWE7gc+NXQ0GItl9K/D326C9CB6T2MDaBaEtgM62Xr4/KfoOzi28pS96KvId5s2LCEszTgO3nFiXDFPsJNqHU/ygwZmj3ptkIGEYmXQbznmIeaXUK2T0C975WClWlssa702oegG8WlfVQ6o40S1I4ywCX3KiZ8OE+fq58Uzxir47sUxVd9IZMyv+6gk8Mv9IPPrY5nCF7h8nMmjZUKnfuwz1hKsZ4XMIMUyxROTirUc77KKMsZ/sJ9gG1V/h8sMt+35F1KrVz8jmtZPgs8vSlTVCfsc/P8eKPefoZ+9hxsgBlgYLhAWogtiWei/qv45SH+nTlT0nfjecJIxS4nJ3OayozKvCN0+h81aSVaOQHfqqTyMLaP5/DNFeXmDJHSfxaLBW8i8a12HxydBztMdj3D6O4PITRK6H3gk9FGteCA+N6IVD4NnfoP+zYkfZupov8ysoEt8QsbBDY1aYnluQ0OqA3Pv3IO+st5qjUX3Wr7qpWO54m6864wW1thpMSWzkzPpFafgO3+Ez3noKDbRJnOTN6F1Nlpp8/zG0GJ72RrMb7OwozDAttMjY9lVH8msfFOZloV9h5VjfPnJUL/icWI5wiR0/jccZEA6H4Q2uIfIA2RKJz1H3pUyJ1uWs1G1cCkuSEgeGmiLrRC649//7+Mob6ivUP8Saffs5ANiUA3+Xfj8rena79gyA1mfSmSk6SoMrn9j/0jlVpUIGWhinSg58vfBZw9GFeNdgn1Gq8Y11KpX0ZeDLK+C9iH5kvuxLvIMmGaSNIjN1vlO6LZ/8Ix5AMj1iaAkShZzSMa5/AtFebVSFknoAcqVNRWcP4S+3HKZ6G0F68qg8pKE7gdNCJ0MChL6U39JLDNxIvz/6RQ1XJkRfDvXTmq233BjBgRJ3EaitfSYUng9vs+9sZlmjO9S9afhu7b/aJZ2UdeTxg/q51EBm9DhO9dTv+w0wAgtN+4qkM82uhE6hktlzlWeFspAy4FhUEFzF8sRGqHzfLSJw0CON5JzRZAh860/XRUwwwn+wv+uGLP4noRq7IindXVUMQ9xm6iaETrkdxW1XiY7ADPO+8mke68boUNeb2FttKtGZvB5VDX0UaVgYr7sOVZmtzoJfUizZonnPqVwYSsD0r5ihSFwFf2SJFuUoIyc/usuzwCpjwid+W1Ylt8PJ0u3ft8SidL5ZmcsV3g1zb6VrVpJ6OGUzTx3rI7bZy8ygz6wK6GaccwrSFhcSeh+0JTQcWLSH46rhY+DQJ5mK+hWG3pWCJf4YDydV/GdtQOEaejp/EuRbAWtyenApKPpLWvoeDRQe7WGO+UwXDV0eN9HUIOnZakdSIk2ELq9hZkpHItGKsx3Nsq7lUmfLISQVJKatSOmTHzWTXtqSuiq7mboVGKLIFcNHT5/a5OJ6lKQ+WN0W72FyQzbDRZj5A68alwcEW4g1IO9y6HkU/C+u/n5oLAI9TWRNk/Yr0hQn3m/5W4fweEiHPpEYEJn/dLf1TVJ6AGLR4/Nsse/OKFa20hbtrD1HuNxzrPhhIeWhO4HjQmdNRSZoJBgAwVlwIHKIjg9EUtPjON73c6u+5XQHS134phEtjiN28I+Fk8V7YZtltCKM27tNheETuVizriQmMctPn03LbP5sUZ9gH+OW+zQd59ibnx9y7K11EeEzvtK1notlGdX0EmX90tJ6F7Gd+iELhrInYxHfF7LJ9w5X3d05rgXhFEeSeh+4IHQWZqtEqa9xUvJwg63Ot1oVQfPku1IaPi7Y+PHVW2r9TOhM0cdSv4Q6HgPuYdtrcxL3DImEbDw/7ULgFK8jnY/Rxq604/sLXx6Zk6TzmPP1xu4dFsvaz0aG6c2AjXbsvy6nqovJldxCLnqdcqjlyq33oV+7H1XpOSEpNXJbhQz7Nsy3wndWYSaS3kkNt914f1AMWybHUnojUg0fEIX84G2+I3XMnJPf7FMoSDWMwgkofuBd0KvIFac7HAFRw3jJsv8TJQaTCFxFupq82T7Hc94NetXVYWhpNZ/hC76j/9Lo5Uxj2luy7pC9mhESOwbZj0NwrkhdEaAeM5cLLO7qqWoYjwOnz3JjCmJq936/QfKTYz/im7RubjFLvNgVj8ELjubr5Sj0I9ZPb1sz5PJzElFct6fyBXnvYZuX1tTrDNDuPLEbzg8Ue1W2RskoQctHwW7m64VDwMZPhFvIkc+L0OdLibfDnBuXlEKSeg+4J3Q7cZjsbDxLPJPsbT+QYwdPqoYqahayEM+n4XPb0FiQUOmupMyJ0XVwrCPrKP3J6Hb38ua7xirG7LUPvooEeMyRb8R/v/JqKqfhFeG4PeVUI8PQYe9EuWerCVid2KcE0I3SbQ2KO8N+DxM3odilK24kn85XoeMZvRPoa1FXXeifHtPNW+vHpyCM52vEENM1/C3qP2b3CsZXlk7N6EUJkdzRiqmmePxjL4ayv8dKN99JGAIHhG4eEGztRLVuAKt9sey5gnYJ5JZ81j8PakY2UjtpDGfCJ3U5VC1uGdcM26nYymUa2t3Da9Y62PSlYQetHy15TSnmgRvYZEniw9HNeN15MuS0OcQLRA6JVRyv/bqxUv0xSyHGqGkUlODUZggoaHvoXca653Lk6tK13MHKLwB+4zQqWV/bOVeUN/1yTqGKPZ1ENXcjPfzIw3qHh03xyCvG7CtGrbnHG2503oYn49U7VCIv48ki6+C/vPvOndiS7wcYznraLvv8EhxGkaKM59ymwBihJjNEsh5dzRjnCnWoboMR2cmXwCy/jxMBNNxEpynhtS5H4BHkUToV5tOZvOG0B3Xr7gQDR5Klfdx6Jc+A7RIQg9aPgH2Yg3G2Y31Fte2dq6aHxTrFwYkofuBR0K3yVQzfoCEzb5M3GdiI/IkuulEL0HQGW6od7ZGNRxC+MvweZ5vPxG6/R3FNOtttWOZ2Q2B67gzG+66tFr29qJoNP/MeJPwlp0mdN5+cdX6kVgHm4yZe16+wMMtPxjIrhMzzwu04TXVsoTnv5ly3+kg16Kg/E/G05QARf/xohxJXnbUuUIBr+LEXQz3SJsSd6XWWawci8S86vXJXid0TuZoxwDj9H7aRgF9ufP+qBlex3cVJKEHLZ9bWdE+wq2f8h0qGIPXHJjL7RF2GSSh+4EnK3c+EZuXR/h1ocade4CTMzqcgMnuLtYhKidD+yyUxhXvR0K3fSmr5kWu8qfb7LgCXo9yoXKyY167gk+2WKeYZl5Rd0HVWUKnBk+a8URiaeGgCH1h3fbjdYB6f9vtTiyXJU6M+Bxvs1TK2Ad3htwnc72EskSPe8J3Gg3qBbZPAs06pY6WQuQB79uaSJh7i/2uDnqd0Ad420TV4r64wxaCMVzV+Dbfg/nL4CxzS+gU/Dzd+n5VedkumTmLx1TkyZC22u03S0L3geaETrYVYWJ9mFueeu3YfDJMZM1J2vGqBj0jK2isdaLv934hdJt4j139PKjrXfQ7FTJCBz0laqxFIxY5uyONYZcFt59V3H520XI7SOjOotC4nH6l8eC3r52lJ3S3oB98MQjyORufyzENIaEVj0u69DX7/Zp5vij7VmQJ4+AC97qxqFJsp6lJvwyX0HlEK804EfNdu3btEE6EYaaqHQfSbuhrH49EggZkqU70PNYYod1Qhk+de0Jnd9O1wstAntvZvDZDxx8ZT2eL9QoTktD9oAmhOxOn8VV8zk/DYcQyaJB/uWg4rHHMXSluUBHpH0JHueBPcr3KZSKxB6xm/F2P3Q8AACAASURBVE2sj1fYk4dq/rBu23aK0Fk/iinmJ/G5ZoTK88PJnYXmnHXLr5rQgdg+Q43hKjR63s/geWuUVtE7WdjtmjMSCZeJxdlp8lS3XtXQ6e0BaPNYuvAR6FOPsUVMOGTu2NT8B4+LxHd6hyT0oOVrVGYYu29l8+80vXNubj06ld+vXe+WhO4HzXy5swkcrXjxuVY7taMpmp92n2jpNijXbhD9Ruhoqe5mScpXwTFmcNLqFqQ9eaSN48ZctkU7rqHTMrzZS9sJ+R3lZj1dTeg8UEyc2A1UllnQoG8SZNjyYMbvwntvrS4PloVtFV9Axdc4xC1pk1A1dAtvPbzvqPH8a2mkt4kjw0pkMoX+HFcLp+K4g3fey64VBnIy5UpO2J6a+UUv/cMdktCDlq8BSPyEmFL4fTJnsfgH+mqxTmFDErofePDljvdCYdJ4MfuGLy0xruQnXLdO7a1Qeq6J6DdCh/ef5n6Hl535+lxM8bZdrBReD/k9NZeuX22ZKcbJXuoibHMPeyF0x/+++Y/qM11hl+nHvuRYIRPjZ9X1sydWVf+zh5xCJnSnr3DHOOEmo8R9AzDfEbzuoZG53Sc1cxoXJFTcfs5jJaEHLV8D0H6bMPdGr4Cx8cKr+ZhrFySh+0FDQqf3QuGzbalU/tnsG74IHTVwdse0wlJYMIRZw7/Tb4SORkAp92AIZEEVzVh+Jznmm9l6MdThQXZGPy8J3blCBRp0zRY9uotdg3YgX8Fn/ExEQj/+arUFvX0FUzVuEGwD6o2TNhF6O5PohTD8stpXnzTzsiayawJJ6EHL1wTVUQ7b+j5J6H7gTUN/uM593aawJ8KMeazrxMyvH7VA6FHvmlZPEDpo4O+u42WLdMKoao55rG8VmIaeLbwS8nq0GzR0vnALn9CnmMcy40ZXDR2PezTzXPpsq9bT4uRi/MBNQyeGeKpxlfCVThN6swhwQVLICwSXyRbHC4wbL32jQStJQm8/BvgV03a/SBK6HzQ/Qyc/Uaj08dYa0r6vmgEt1O0Mnd1Fj+es4/l3mhN6oSVCxzJAfjd3K6HHVKvoIhvhPaanc+dqOOWxxPLMS0K3b1Soxu+ryxzSxMf9W1/tmj+14L/UQ/49qKG3L6GBFQ31a51HxROEKCShBy1fN0ESuh80s3JXWEg8rfjf+Jzfu6HQ6X7nRg78J/f4xcrykjiJ3ORO6NAoF+FzXgkdvbBBnvdUbzl3C6EncpMp4Z5+BeEyL0xejK1qIDiG+FRdo7t5Quh5e7fDPNvFqQz36LYjqeZfRd9QbtkD2WIgCpBlDVEIDlHITZCOWrn3clLokR70p3uSSd4uktC9JknoktBr0eweunM+eKuqFvdk3/IkCGe73YiiwYtLg5QY8d2Dd7H59xoSOiWFv7LCNx78NjGZh8crHSKw988tofP3kDueqvmwywREnLHgPfJRxTyECdXrpELvC2eOewHksTnp5ulpHhF6LvdOfg/9ZLfjC/ucVjGnqOyHPZ+j206SNPOT7nnrJFAR+lvwUDdJ6Lxv231CL3qQmwdIQg9avm6CJHQ/aMlTnHE6PuvBwxZvDHgmvxAG1hWu16YcYxiyVck7ezqtvyjuOiB1doXOuI+7QG1UDj5pJ1XrA3WsyOfeUxyf4DXzL/VvAUzaMopMRbycX9nevJKa9aW67TqPCJ3vduBkjt7oXCJEUS1dMx8dY4sjL0567D6UnjgSvr/DxUFPKUFDvz7uaP+dvLbWq4nFtWfX1HCeaNYWzSEJPWj5ugmS0P2ghfCpiWyxFFWoFiJ6kIo41o8DwmcEMNl914Nv77fgs3yCRYv6hKpvTGZrA5U42+7Gu/BZutVaG6KS5zVMXYG65tUNhG47UCGLDvdIa451v/FlXkbnu2Vb9twXunDMcRpzOjLn8dDbbxTnuMOFwX95XY9uOXSIYf17JGXtX9kGfAGKqaJv45XLlyc181Y316+0XqQP/4INqM4GZ+nFpFAyZ0dJgtyDQhJ60PJ1EySh+0FL8dDNEguJ+kmRAKtypNGyUsfvD9+5lJGvazxqSnrmdif2sT2pYrAStzN39j0SYONh3MoX6jBAv+/kgQEDoCNcSOvlNmnOPaHzSQi1OyjrI/ViDzuEaJwfVY/ft5HsMfRkLKN/nh2VzNYbBPON0J3vUPevdaNDEe975jpo90QdOdqfEacqmrmpcYAhsoOywku9Iv1N6CVbM1eNXzaYQ3xCEnrQ8nUTJKH7QWvx0Et2HGlFvw215ERaPzS1wtgntnLlXqll+f1wkoyphS9AAzxYL3oYnZB1OiGrxU/h+3lHF+4Tn163PIpeYsY0QOr6e5wFATeCOwVDkS6FZ//JHH7UmTC7gdAryKtBDO8Kf+T3wu+fQTemWPdUPv9sbINoRj8ioRT+G76/kQXTmWk0AOYboYvfh+/9oZ6fcXLNjPjHt3bD7xdGFX05auHocpREqcO47Iq1EvrWxYlscTpRx8WpbbSoWb8S+18T9CWh48LHvj6oGj+D9uLjLcTrT5LQg5avmyAJ3Q9aI3QiGD4hpqirxt1oQQ6fb8FJHia30hgJJ2mW6pI5M7SDZzcMp1bsw0oyQIvjNGJCNetrlxjXWjNn6eLCfAga6p/xjP5H+Pxv8PudkH9prE4sdid1B6FH7F0Na3/odHczwnTfJoc8UMY0ZCfIBzoolh+e346Gh0T2WdubV8POPz8Jne14ZK0jSZhU1s51CIb0H7roMx7FY56EamzA31HrZnYjdVyckv5XjmetxzEAjii3Jug3Qi/hAhV39pgB3OciwhGdB3m1AEnoQcvXTZCE7gee46HXxsLlpEHCR2aZf1/hc3fBkqtZ3HL+GFqE2jNw/Afy/XUjLR81dUpwJpmUeeKEJpS5joOMriF08UaAJZBo3cUMrZ8xWyF7Mnka07W2Au5uOucnoTvfjarG2x0PfK6xukt2P8EoX0RrJwFCWP+pf/xk2zUoxpu81Kemb/cBoRMZsl2MuGY8OKrkJwRZtS3UpyT0+QFJ6H7gkdBR4613Fl7l+7mRUPHvzLrV+BC+122Q8IYcVSfi0AjT8eYeqzjB0UmYTv4l2unxd3NWiJIlpO4hdFZz7o3sM4xodzerd7XfbTe5sMVT7YQwTwldlCXI5dP0aMd1oVPRF8jf6TONdoYw/jOLHKd/UuyvHjHvCZ0tkmaSOdwlmyxHM4VL0Vuh0K5tmkgloQctXzdBErofeHH9qhqPQvrNGNd2Wo+yVKLnwuYsvT5W+Ax7ed2JkDdmPGN+jJIqkltr78WyMq3rbtySriXZbiN0oRPDM5SIzEaaYoPBTokJF2IJVf8DBtiZ365fa525OJq6/gl69c8qsVsEPiYF3KInW8eMpPSPsbe0OsnPT0JnZ+TsOK3E7Gz+HWVjJMKusLYoqxYhCT1o+boJktD9gAsto19MLXmNXba2y65QIRnA5H0gENU5S5avYaET7S3tRgKe5XkxY66nR5X8W/F9XgbHVEQgN3pnlUyqTRYUJXo+qk9T6+PiY7HxggZl+Bu7drTb2U7VdzNy2uhG6PD3D9OrZPrT4g4AygjzitYh9FHFSOF9ZTrBVX0PZZzRP99ABjY5jmby74Hy7aLHDuwoo8liir8LzyxxMYKLJzSW45NtVZl2shsA51aUx/FbfhULO1rVJ0jd7nUjdCjDW2r6kSCzmFpY46X9RUIniyOh3eyy0+OYs/C5et7ZnDbRJ6Dc9zNtfdbpA40nAeFoaZb0QcW4L64UTvBShzqYD4Ruy4XNAyQqIPQl7pP9WnQWw8cUnZjb7/tbEvr8IihJ6D7AhZbMrfrF+DGnluEnIV+WiIFbcunkzliu8Gp8DibGd8NAeRQnN7INL253s4hMjCzJ4CaBV7IW+mz/3eKcfijm0crAEBr1reS9S1fT/FS98r3OBF3CrT46ceu38khlQDI3L1lxMtRvctauH/y+ZPnJWD9XDR2e+Ujm2DfDs5O7BZkQGY2vOAWNAl0JPZW1lmB0LyK/qu+lj3kT/qyrofMyCBrvUVFF/ysa+NEJ07TtFMS682MGbBOqdZsP8NjjSW3ViFAWu0zJpaum0ytJeVw1dJDL3936BNYN5Aga+qk1hA7feWu69ju2zJLZ1Wu89AF74lu+ehjbbUxsN6HsqaWrKjR0/B7+zhM6hsnlcnvQZ6z9oU98Gz3vpUi/pP3XlqfQf/lE6/Ql80mQ5zdH06teinlhnpi3+C6P/domdHjHNuqopmax0pVJPMrCxZndFlnc+dC3xhTzXFzMOnLgfhE6BcdFL+4qEtKrXVR7S/b38BgmfELH45o6C99W0i6mpPyBZT+vCKqC0DnPBGhPahujbx/N55/JXjGv5MXB7n3r70YtPZ7RfwS/n0eT8WMQwE/g9+8Ld5+Jow147lMxvLqmWmSViAMbJz5M+P8kMUzTt8cyxvmxtDnuvK71QeEQZeGVkN8XoIE2kcWC8F7HWtncBQR4HUyS7+AhX3HiRU0VJp0LQLv6cUX9MsbPIH1ZDKnpGKgVjo1njEuhHj90vgNJJTK6qDZgDdcQCq+Hv/8U8xe/B/L9EZTj51AGkz7eWGuxFwrobS+j57D88M77yWRaWfdSkt6tRi38ZkhTyezxPH59JJExD3DK4pSJ1esXcbVwalV5+B3s07GerL7nCd//KXznnIqQuuy7CaWQgXJW9SNHZlF1YsxL3cX7+bTd3GRp/Jxr/B7PsQdo+8CErxhnQD+5EfsLN6a0++/SyRINwWrsxGdw8sX4z2IeAWATOrTZ3anluPCrXKx0ZSJjusi1nCfw2ir05csTivFRjAYo9AVSx/aeldcB6wNjy9e8BhZ8j+PCtnpR3UKyvxfLUn8XYRI6tPkZbHE/47dN+CIZ2mZea+gY52PMaUuf7TlZwrEG/eI+9NPBXjGv5OUPQqfGO7swQb8xljELeB8cJu1PwET5EUhvwvvoiYS5t/DNBT7ieYuwJwjmSW5xVDFOhknlI+S9GfM9sUzxxESmcJCw/ToQ8J1zD5S3UIdUasU+sXQhiTKG9FFYuZ6OuyZR1TopPq6/gbtAjQhacz8hqho6LJhOw61/3NWhOzuFtVGl8C5cbNCnaGAWXMQRbY7eOX8n9iOSFOO0eNo4Bv8m+Hwn34E+l41m9P8S88ff8Z1AbPmIx0kCPRxCX12LfgOAHN8H339/N6YoKZtxWlSZgLGmryTaEruz71KnhXPc52i7KvnnYnvG0voHg8tWf1+1n4tgoH0PnWJB2380oRbeG6RsOP9BXieGV76uAh1zanHfMNqR+OiA8doX86LoytUtVT3ueSst5EHu9b01GkKL9avIp8F36sa89vm9usDvedVC6Tsqook1LE+9fDsss4b18VB2uthbuvqmzDG4Fb+a2BBgSi1dM6OsfDN+dgl5xtke9+QIRqxvaumq32ZIXmtmxPzxnfD71eL3Wqxnz4H3Dydug4SERC/D9ntdfZboQiqhvpdPJrVnmPN+crEJprruPb8bEQj8mppxOTnuUfWn6e0ESIq+kwZmMW7mUdkigiOjevKs9O/OXAmr+m3MjmEnzx/fhVv0MdW4WCxLM1S/s5tT5QKq68fYQJh1j7SnrgvCbJs2lK+bEHZ7SkhIdDMcK3vza27x0KstlltZ/NgGeqoZT7hY2wrx0L+Ez8lJQ0JCQkJCwic4ica14iq360D4f7Rsx+h/4vOt5W3+uH48dGKUSIwd+0BjkpCQkJCQaBeYlX3GPABIe4fLHWTyOzqGiTOXw+LNhjoQfRIc7+YsKO7EWX8kqa15mVgWCQkJCQkJCV+gNhvxrFnHjbHO4g6Y90UzE8Q/AW69owbunA1PLeCf8SuWxCJZMx9kDm5qvP8xp0kXRmiGkswlJCQkJCSCwD7rzug55nDDNcoaIXXNfAyvjU010KaR1KMZ4+2JrPV4/Qh41EtaXNNVsQwSEhISEhISwcAi9ZmXjfHYA66kbs4yP/U3gAb+ATSWi46br4grky9PaoVYTNU/iE560L0sOk+KKbXR2px46Ny6vastvyUkJCQkJHoJVONGh0fox5+7ynXRrGdZRDDiHY5q4MZOTI7L4mJZcHla+X26KMCwtQ9FUye8jr5abrdLSEhISEiEBtt1r1pYQ7Vw01XD5mfgPF66cyVNJ9EB6wfOwMWASaPHaYYlvlNCQkJCQkIiRDj30jFi3irm5755dLVm0ZzoObo5w7bz3yu+S0JCQkJCQqINEDT192JgERYVDM/U/YQrpSF5s0UMyTuD/tzFd/QwbE94EhISEhISXQtHUy8sjSv6nejRLaGZ4pZ6A43cCdGL36FhaY3NPW7RPsBdzla6ZqZX9eYkSpqEhISEhIQX2IFVUsY+UcU4E8j8ETSES+Ym+bn5rB0L3Y6JTo3exuAZRuSPwGefHdXyzxfz7CW4l7nspqHPTfhTCQkJiSYggVzCSHNdEQn/EAlqNL3qpXHFxJCKV0N6DLfRUyS2vJOIhbtqPAok/jdYALwHfr6E5gT9oNf6Qrlsx6uPrTxlL6j7CVDvs+OK8btYRv87kYNq/grq++WYMrFseMUKEi9aRlGTkJCQkOhW1ITfPSpZeFlU1dNA2kUgtncDyb0rltaLI2lzfCRl7S8+2+YIgm0CJXJ0YYsx26GeW9E6P7VsdYlfzcOEv+Nn+DvIYUNCMU4Woqr11gJGQkJi3oFMvEeAZhXVCrFRzRhZrOqL/Sb8vhB6U6KnwV27eouH3sYQmm0F31UaTedfCiT9f8R+IFss4XECtyGoSOQzfRYNCKkVv/7L4ZSxD8tMkrqEhMTcQLi29KmU4zGs5CPN8vvKcW3iMJK5nNzmEZx46NUp0oMk7sAJVhNXzTvoGKCE3cyinxI+CwmrGtcPJ49/sZinhISEREdhX1lSjM+4hbxsIZVsZyKqeTjmKc/TJboc1P1twtw7rlk30EA1+u6W+z18B40HYUFw1aGquqeYt4SEhETH4Gjo5qfD0NAhzUhCl+gN0P4Jff97RMtuncxFbX13atkaJPWvkZxl35eQkOg0pIYu0Y9wIs6ZSiJbL0Jcy/2/BHlNJzVjBPOW/V9CQqKjkIQu0ZdgfTOpmRe6x4T3o6XTmO/JrPU9+grZ/yUkJDoISegSfQhyvg3E++KEZj3MnOY09E3vLWHgGhJD/q4Ut3qXZ+kSEhKdgiR0iX6D3edzxjJyn1zVmwabaYXUyZ111RwT3yUhISHRdkhCl+g3sPvyoKGbb0VDNhaIJgQyd7bdE1lzEt8hCV1CQqJjkIQu0W/ghJ5QjI+idTu72REuoWvG2/AdktAlJCQ6BknoEv0GTujowrZdGnoya70J3yEJXUJComOQhC7Rb7A1dLWoj+XCsXCvIPTcZDmp6MvxHZLQJSQkOgZJ6BJ9B9Yvo2rxjXHV3FXZfwMlyMNEK/cdiUzhIPFdEhISEm2HJHSJPgS/SrYAyPfaZK4YhmMZWzuPa+afq94jISEh0X5IQpfoR9guj7PWW9APexiGcbZBnGoVxXdISEhIdASS0CX6FER7TqVWPwO09OuToFkHOUtHwzrMI6FZV8KoWii+Q0JCQqIjkIQu0bdg/TOWMaKJbPHxuGb66v/4HeohznpkcfrEQ8W8JSQkJDoGSegS/Qze/6PpQh4IGYm5FFX06bg3I7kS0cyzRSTzJxMZPSfmKSEhIdFRSEKX6HfYpK7oy+Oq9QA5U1cwDLAxTccDMZhj7mGhf7O/xVVzBh3TJDTz7sWZwhIxLwkJCYmOQxK6hERFONUDYAz8HLV1JPYxei6OpE1T1sLPSvg3+P/umKL/ZCRn7S/mISEhITEnkIQuIWEDxwIxZItmrKNjqv4V6M//hH59b1zRn4CfO4DAt4Mmf3U8Uzgzrk0cxr43IM/MJSQk5hyS0CUkREwtEPstjo9MZvIFyspTXkLCrSbMvcW/4+/lcllas0tISMw9JKFLSLgA+i5zEetG1gP4N9m/JSQkugqS0CUkGmKAJuzLpD9LbVxCQqI7IQldQkJCQkKiLZhagCQrJmJwgwnP6tjvSJb877j9x4i5Ze1BErqNAVGWNbJvk/x7FmxLmtd9isnEm5zkmbOERF1MVXLAVJM5SI6r7sKAQAhh59e0gfuY0G0Cj4RLxC3Jv4cQ9rkx5DfVTefQAyElid5Hp/tCmGNrgM5p8nioo7A1wApMLRhNFQ9EBxexjP6emKp/Pa4ZF8YV/cqYUrgmrhauxZ/w+d+BOH8L6Tz4/bPRTGFtPFNYsjh96ouqXsMat/7Krc8IfcBd7pEIWi/HlYnRqGroIPMPRdXCOXGtALI3/kRkzuUPsof0V6jnJdBO34lp+hT8vxgdL8aOzky+oDrfeu/rFVANIVLRjgfn84uOHtffENWM46DuH4yq+jdiqnExyOTPtG8a1+J1L/w9oep/gJ8/ATmeCX3rTYsz1pJotLhv1WvESUii8xgQdwb5zgtNUz2dIl1NalTm4icHH5xftDitHzqq5CdgvHwkBnMMjKdL4eff6NhiHAD/h88vwbEXVwrvJ06RlMmXV71goJfnnp6AvYXCMJKznhNNG8dB45wDDXgLTHxPYZAHdFyBBIvRm9C5RU1if8NnqLcqqwSN/AjkAQ2tfwIm0sVM+0QM1NMY+4TQa+ofi63cK6ZaWkwxPwsy/wvI7gH0/EVl2kT2FfJfzeRvzsLC60EgtitAhmdEVXMMA3/w9/HtsTmpvQ+wstrtN5rOv3RUNU+F+p0P9dsMdd01tnSS1N2W1VIP/TTL+qlq/hUmo0+Mpo0RoZ/WvLczwOOD1c8II0W6mkAcVGznSlQgl8vtEbQfjI7mn8kWFC4oV8xHqdSxz4PxBARu/hDGxiaYQ3fzuWWsCQfwcYX/ByUQfSVci/PPaHriyIgzjnpq7ukJ2GeMDOiUAojkq9CAdzECL2FcZhogAknRmOauJxsm+zm9hB6txkheq4BYzRJ0kuvhHacllpt74zvxvmx1w85zQq8YOMPDa4eARNJQx+/GM4W70esXDIYS8QYGv2P5K2XqUfY09KYgf7LAwgG2DlbVn0ukrYN5gar7QffBtuaOINHG1IJGd4mMHWM5MoGUqKxMX7KicjJtOWE/hb57E2oZeM+bFaLuAjRM2N7hNFhQK8Y2uqDWb/OVVOM/8HNTTDPHxby7CfV2i5CAkmr+VaPqRDyuFUyyO6gY/4M7hNA234S6fauXEvSvc6H830koxlkZZ9esWV8if0cFC/rCVZDWszZtuS+wfnQn9OkvkZzF8U5/J/9PZE44AMbEF0DG97B5u5RsdR5y5v9ZHFdJZ1zNEC0eFgqo9dvv7uq5p1cgTE4Y2QkE/Ut0G2lP/ArxFb2b/SzFvQWGcCFUveT4mTagc0yWxghJ69vjGf3DsZWn7EWL45Rn3hI6N2jDukG9QQZvReLAAYP1RLmzMu9m/rr9yr1G/pgnDKQSBu0gbayau2CSvCwJWrtTvK47YxcXewNxxTwBFj3XYh2wD/FIZLRv2f3Ubz8R+imRU4n6T9cfRu9sSa3wMlKKNk9AvL6wkD51yfKToU8UZ7C+vpJmzVJXsdbxYt5dgJrFEWqPZB5S9Q8CcV1CFyT6U6StqzS/Hk2lJcvXYB2e1I5dQ/tS8+McIh88NoMF64O4eIW5ouSnL2A/Iv0pa11E3sz6sL2ABAUrquj/C+PgcTI/ZK3QxhbNhwYX4po85HsDbsnb9ZSk7hOCRrw4W3gl+n1GH9FkglQNooXHKYn7JZGGia/icJsTOzquOnnD0nI528DziNBtmcPPRUjkUO/NWDeYuEt896Odcrflwd+FgwvfD5M+vP+yqFp8I5dPl2jrtsyi6sQbYfHxR5wIUF5iHdolJ7ufaibtp5rxSDSjfwyJB8vULnLk+cY1/RSsL9R1N+kXfhJGXSM+343j2lnmFlC1rZsaRDsbKOs3oA9upL7q6XYukhDuuNiBZ1x2oHopkQU1GX/GYynmZ9+DBTj5+6h26vNBRvcnUB44F/rrD7vJrp+qX4B5Csa3kahiZKFsW1g/52OrHXORPa74Qg3a/acw9+zLy9SebjdvgRM17UQxpfA20HAeZVvhM4w02zVB1hI7WzygJoRbMjCwzxkeXvEsLNvw2rVDtIy9T+giQeIZNgzIG8bICrhod+5OybymDcj79VnaB6yd8PtneRvM8eDi/XQgOl54P0z0T42xfjAH8ioxYp9lEc9ugTLFBBmFuqNhE7pqnjoWrO+Tfk+JUZ9zDV20Q0BtMJ7W32HvThE7BiwnnRN4v+zkfNSJfoTbzzD+n0hqXEP3RuiooUMbPijs4Pka60RpU4wLMU+bzGGRinMR9hOuRXdCHnxxRrfijTtlZMAW4Wg7xX2h4X7BIjPNdrIR6yTasMtIw141Yq9eyaKjpwmdy3x4xYpn4dkV7kokyarUnrDmepKhg0sIuwn/vyGm5g8Xy99Z0Pah54b6RbRM1pwufJw+BBpvjmxl745lCh9gBQ71Ks58I3RxQYuGVlGl8N/Q9+9MUS0cx+csP2+Nzy8Cr07dQeiqfhFrmAXw2VmEUDVzeq7mIzKm8EggW9wVUwtrsGiS1JuAr8ZG0/kRaLxNRNPozBav585OtoToOfK6aGqCbP9GFePMgJPanBG6vYBKGa+LKeZ1SEzwswuIqb6scHCN5XBwmU+MZiZWCfXo0Lk6bZtk9vgXA6H9gy0wcKuyW/op64t08QOT4A8PzOX2QPmEFQxlPhG6aP8wmjFW0WMmfqvA6Piu4FyPr24gdLzKiXmi8fOSZWv4+JrTNqCLCWuGWsUX3ovlE2+ZSAiwz6MzhWOhQzwubK3MdQevbVhCKBjruXgn7iREM4XT6cTZW4Ruk3mmsAImr4fYWdFc74R4Hviw6JtlZHKGILN2kzrJP5HIvxD66Q10Z6Y7+ylrx91swXE5P1cPwyvWPCF02/4hkSkcROwfcLHOiJwZWc11G3a8z8w1oTMjT7yG9lYyr9Kz8rmWs8t/DQAAIABJREFUCysfGgCbM9RuxDgN6y019SrYmjloWzCYpum98K7VEGnDQiejFszW39CBASNDvxNAxwmdyzyWLqxBy1J2F7+rZV6b6A0Hsh2n6N+gNWsrqdtX+GDS+x177+65l0NTOVEZqdYvhfv9gWTU64QubrHHlIk3JVTzMcf+oS+JnKc5JfQ4u8KKd8qTmvUw3hAJkFfbZARpNolzJiigWHdJ6gz2xJDRVyeyRRhI5myvDCh6f9Eq4dWqEDpIuVOEzskcyOjd9P6+0TMyryM7roWeQ2vYHlK3tTnV/Bx9Xy+QOU9A6svWlJOa+WNWnUD9q5cJneevqsU9o4r+fXTqQ+x0ulyJ6NR4mmNCJ4nl0bX2Cmzux+t598XG86+lYuiKWzdzB3vLNz1xHGrmca13yFxs2BA6XccI3SYlxXwz2TZSe5rMRfntXkK3574s1jM0cG0uayXj2Ff9+zyYu76q6sxa1/xYUBn1KqHzvI9KFl6WUI2/O1u6PT8GQhtL3UDo8R4YX+ToldhTmb+LdJdfjM7DOTM3oknN2iE4iZnzhvLZ+UL4fnsJXZD5ibCAQlnPMqcwcy2/kAYYXi8hBjUfEOsbAvhgHQC5/d8YuwEw1/X12c9Qs5iNa7oaREa9SOiiASiU+w5mTd1Duyyd6SNdQug9kbgRX0Iz3tbOvtvl4GdX+ksSqrmeGMD15gQZ2iCiP9tH6I4B3MTRQEqPJpib3C6oe9hynE1Sn+crxXqHITvI+xg8ouhluWHZsQ4w6f4Hg+qwKvoOHdwzhG73f/0I6Pt3k2uZXWp0O8dJEnqLfRe91UGdt0TV4/cV5dFPIM440EiHXlHo+4HVbkKnxlypFfvAYP1PBxdQJbqVKab2DnRytoU+nTVz+1EZ8wBa/aCypBMakNcv8Ly1PbLTydEHT/F23ndWjF3Uy5lFDQl99LWeInRWv6MyJxyQyJqbJJk3TJLQW0zcMh/q/dG29N9uhu0DWjU+MLY00FUv3x22Ks15h4i3m9BZXgnVPI/e7W/XZKZXe9Aixi2ViQXQqfS/HPoAY74Cfh0JHGubyQ4WB7BIeDxkq9tSZXCIopOIX2sn2FA8hDvuXO7U//uqclTVfyVGFWxFKj1E6PSaYY5cM7y5h49LOpV6kdDt+Aauqe1+BLD/kvltw7CSf64ok3kOOjlitDS8a972KwmKYUdei9sEY1Yk9lyp6rlOE33bCN3ealcKk22azEpcbiRimhCykJxPYlhURb+fpsIDsYy+E53C8OcYac3EQy4XN1gBwnmHKIdWYd8ICIW4hPKhvEB21E8+8YX+GKTbQQ7/hr/fDOVfh585EejMUgC/8GTCw2s2zMbg1kRaPynIzkWPELrji10zL0/J3UBPfaVHCF0MplXmgZBo+GYnOf72qY1NuxZztkMczbBC7sNdDbpazlq/auNKWQhYYdmNnMxR7RAmSYx7+wikR8kkikZCWeG5rCVqRZ0i9nYROpH34rT+IpDFVhq6MzyNmMm5RKIr0Xv4WyH/84C03xlLm+OLlcLrMRb40an8fpiGk8e/+OhM4aAk8RWvvxsI/ufw/fvpoJss2dvNoZRPL9FFm3VvdPyEVzB5+N5aBvL9ru25MLDckMAm0TXrUyivZFZfDiv7lx944Dv3YG02gE5g8DMMSAHPnw3fu58SEgnt6LVfskWAOcuu9d0F73uH42DGvxbRC4RuG4FqLNZC58i8ehewW3YCPZW92wmd9bVZGt2OOHjZRcKuqvqvoL9/F/rkN+Dv52AYWPjsl9DuN8P/d3JFg84x4e4MCsZxlxCJdEfgqPZBuMObD+iEpYFQiR9r2tA54sHrfiCXi2MZ4wPxdGEpEsxw1noxEhxPo1r+QBbn+22QfgBEs8UOe8kWB50YRPRnuIQuyPzLzPtSWHUhcqHe8ixY9RYui6uFpYeqxT1bLePRmeNegBG7QO43sm3y0GROnf8QhyrfCCrTmGZeR20PgvVb/D7ZvdCMG6H/HcqybzRhkr+hwU0U/ewTJ0AkDnqjCbNkT3r0mtqj0Lc+cchyagSHcghKmt1O6M7OlL6cxclu586brUSI27v2DmDV3ztpVNkwHnidGOHkuz6irXWA0Et8/CRo9MUrIL05Nl54NXNt7Ap0BIXP0OiR+tUkGmKWRo8Ms2xEgVDNh1uQW8+CVOwVqdQzoCFuDGNirGloHpAiS8JWXplQdCOVWv088f1egNpLEsP0KfpFUNadwk5COwdh+ITOz81z+qFxzXyChngMPshou5nM37L+52Q6PyLKGCdSngQHL0KiZEL+Lkzc+H/0FAh538V8OYexQ8K+b+5E62YfciV1IgFYVOOeoDscVDMnFuY3c4tY3A6msnIb/IKs7JshxjIoxyP1rnkyudEAF1nzaVhsfdOZYGwin++uX20jUOj7d7RhvqFzDiNAnMh5LHR2jMSOoYwnUHuMsxDAPCUrYni3V3sX3+sxkTC8oBA9Ob7sFLaz5T0eersIvWLeUfS/glwTNaWAsY3jSUyR2r40gN7dYuzaYphuZe3FhmroIfXj7oQz+K3VYZ5DksQamm2H/gsnvIqXs0Z2JkWcOMVEJznS+M5kT48Gxs1h0O7/yM5iZ9oYJCZ0Qp+yDeGK3w3L+JAZb2EIw91xpfChMieGqUBEQf1p26Fbi/viYiqsfkItUFfhyvm7LcuVPTumGK/ByTkR1OZD4cRlEeJCzcG7mKYWDA8Pk+ej4/k02qBUlIfHb8YJJVtE7eUX4g5A2MFrupnQhbJ9rR1GoFzLRgWChvQ10P7h/+A9n02ohXxcmRjFhXRi6eRB0J/fCM8ehTsF8Yz+YWwX+H07XwDg0VA77FoYqd6N1zeT5NhmYhnuonlJ+GxSmciqzo7b3GrodDdqlvjOyOgfm+ILDHveaeoZcmCK8QBfnChK/rkYojVUuxgWjRPmmq+L/XC+YgAmoKuTIW63k3w0c5YFcvmc4KeaNV5wgomQ63X6OzDWdYKtrEMefELnD4vQGZnDhAIy35HQxHcEkjUGrng8njaOwfwd7TEUDIhtFlX1T7MVdFB5l+J0K+yxxcqa14jyaSpFvsgA7V5YyfuUo16i/UffjhbXvM6tCokvApBI+fUrbrnOAkb8Jc5iNiPE+N5homsJnbUZRmyEMbsrWJvV9iW6aCqS8MIg52txG5eFUvbclmgJHcuYx8J3L4PxuduWX4gKA98Nwi3pwDJtjjYSOiFzHDvTsbRexPc4Cpo/iPMMnrOHpzzgIo9437wqFKl2I5xrasU03bIMp6G5L13I84lRJT/B3xVmxxXPGqPjhRi86+52bd/xiS0MQrfPzjXrjJCiFZXIln3WfHo0o+cwb64thg0M7ymQxafDGGxOjGXjdFE+XuWY1Iox8TzUVzm4dq4YG4IGSHHa1/j5kuUnc0OfW6Np/aQpRt74TDvjAXQtods+A6xLQt0NFHYC0d4DNd98pKKc9vGILXsWAIbPI1VtQss5PnEYau3sKCY8bV3hDk+K29EwFd/FidBrinjvn+0jdL4wYTHI2YI2hJ2mqQXlMlXeYLH/+5CMtNnOiPlAYrl/p01dDXvgZ83vhTbAFG7BXHwsOq6nMX9GMO0Q3gAnL9zChPfeyS3hQ+mwFSQRCqETGaiquie6t6QkErSs9GwoptHVfio11e4YwAO8/lCH4Nvv/OxaNW+BSc0zmYruiWvbys9gN3Fx9cjibOGV5AU+25jLZlQzRkBD34hhHA/MvZMZBQU3ePOCbiR0e0dF1dNhkgq/MYM2NaCVf/zgfH4Re6Hfo6bqXcBIXCmcgB7siDFvSOe6jsMTcyqIXL3UB/8Jm9AFy/GzMP+wY49zeYwq5iHoYyLwkRr7Lt1671wY7E7CbmiYTO8K02k/bsGMqhNk67cDBGN3psXj5jDU4xHa+KH5QQ+N0G2tUjGyJJJaYKtsNqhU64di/u0H3zpd9VIYbHcyg7QA8qZb3kmVLgC91MO2Q4CFHOQRePvW2SkwP4X5koViwK3DVCr/bPbfgc61TXcSuu3ngnj0C88Gg9glaOZdsfSJSfKWEG4JCLDzQlfY8L7fh3U9krglpc6ctuJtEva+tig9+E+4hE7LDr9vEY6o2nZ05NwECthn7KMOass1r87RbXLJmseGdXZuT4qK+T7MO+xVWyPwd0VVQ2cTUNcSOl7VCqGDCne5Ta8Wr6FBcOryjqATNA3cggYr1ufFvBuD1hXv40Iej4a1gsdQnWiXwV4yEOCoaOD/t/clYJIVVbpZUAU9OszgMi6ooKNPfS2i2HZ35c3MSirvktVNs1uVd6nqQsRWZ/Q5IDg6PqmHooMO6ucowyCMo+JzYdQRt2EUceExOu4jI9p0Awo0TTeLIHTTW2W+c2K5NzK7lsyMuJm3qs//fdFVXVUZN+JE3PjjnDhxTq7HRC6RNUJX/R2gzn2qvHXWGk7m0c+L9pksjLCGb86CkPNx5crxI+DZnzLtFArrweuw/pTminFCl9aFkjd5gSof45CWQG/iZYUkDXb3m3bMaIiOcU7w6lTb3Q/EL70XXm5i18nvPrNrIV/BevthzpADBG240uAZnSlCZy8WXr1D87KuuV2+VIVqeLHa9x5CRPoa/2Mg4l/r9CdJShL+RNmUtOW9u2rTpiGYw3ew+8z6m1KeQAY3uLZ/7Vpn6n8297U8uBTMdFkj9ETTii4zs9bIK4bhb9QzaJMybIU8b8fvYR34vInYEUncg+j/pdh004TOg9t4wQMFZ/xY/ohU73TLXA03656lS093mfFxORF6EnbRDX9mwJmMazduuLsoruP0aeHjd5PL0bNhkd+ubwpO+qZN6E27zfjevNaZL4zdgyWv1m7EKONQiOPtZT3i4I59XvD4Wif4H6q8FgG/wugF3zAY3bCuxJvfnXf8L1huzYvPZpW+m75uZgoZI3Qmn5Vs4xdu1d94+dy5yYvuR6e1LtvULdicPOEE94klL/qugTknrUL1ghMNY90prJtGCT22wnrhv6TU3iYoZvdLdZ2IpSUQ5HCJWvcyQJLUAklYN257rC2Cto/19lNQSUjJ6CIj5y6GCF2xHrxWNyuYfKlKXngN1olaak547va4iGOOieORjHUC5MTaSjWaUOXVnkyjd5g72+RjLqOKlUW8acv1b7Wc8F2Y4vbgtqnxFPpP8FkidKUt6xS/ER1/C379yKmFWG+vtazYd8OuvRDWu52cILtXGmLnuGp0qSovgzBO6Hzz7r8+pfY2IX7HMRiZoaM9+HpZL9reMyQvmX+GYirtWlvkX8O9qH2yB/TXLMlNNM7UsbBZedDU2aouoScyD67Q3mkK8jOZV1wDQt7B93Q0FmkOw+twWF87C7Uch5GxaHVB3+ox59jHgUqqkzIRy6xlA7m7/keKXnA6OkvlWkg8CZTRH3LPIqHD+H6ovF5zQY6dQMNPd9MWU2janOuagcVxE3z/026z6y0Ck4Qu13po99Qrsd5eaegYfU73eiondOb4+g9q3UsesUOTF7ytvP5srWhNSdzw8Nui+r5rKPG1Ki/8rO6urmDuDJ2h6Abf0VwE5BWrR9fatZPQyoJx8PNe8OJ+lELVfwmeY0K7PqZDHnyxZlng/lWMYtsmd/wKGs7NmCkupVjcIpQoe0/qaDYeWT9dF86kj0Cbv1uw/fdg0Bjr1FOPap2Lvdbcs0ToAochYZX0xkc4gYYPoXbMau2/4nAYbC6+r5n/QpLT/mIlWplCvwwSeuzdfh/m2lDrTw3xbZbxlTCP9+hYk2NCd/zlRejKC39VWTNmrjQZAdmdp9bdTyRm9yAydc6lSejCZ2F6BbTlrpKBzGqiT7uBZB7vd2HtcPw9Ov0pSE3FCW7pZqxLbni28dDF88wHSe4yVzpPo7pRJpW4C/pwDfRnYtgbf7I6/q33m9NCZghdOpFVx1+Ec0TvSCY+1vtAx+1IAUkAoXCD7q2aRClKxfvaGKFLawLM/V8ZbN8ikHEdJl8A79UuHYvrsiX0XOw5GNygqy2yryx8p78W68yEF7Aa59vFs92g60lQMELo3GENHdiMxB2PS5ixotMXHj0L5uK9HUZy4t7uqzYNcS09tdS/884PmcyDm+ajOOc8/P9+KJ+17OAsyzon1tz5/Fn+keISc2l4pv46w+bY7pH1NXHzIAPrTE46Fgc/0rn6Gx83peODZJDQ+cYDvv8+r7oXY0CE3jZwp6VnBhOLsNvxIpw24gxy0LZfaXrxaxN67EjjhasUzdzEWe9cuZ37WbT6Io8SRjrzdE80wUqtBGO911B7uio8TXCwX0YwgwWkLsjsroIXfDD2M8nFC4rx9yUrhJ6cNQfv1jn6Us7Ov85rzgaZJx7Ywfk6ls6YKJ3geyk00yyh8zDN17Gae6K8EaEvhtj8CwK6W8f8K4M7wCL2E7XuLCC5Mxp8U3NR0yb0+MWvho7yQvWFcDJcRGYyZsZe1amcFW3wLYrHez9lzMY4JvcqI3c8A94HGvsXV4/6L4nbbXhhzAqhK46gn9MmPN6PN3TahlQhw/xieFKtwCc8UiJ8fw/GqRC1m1pLzRO643+Bd58IPQtgA2zjADvBDnHtomtCFzu2L/Oqs7FzRijekf+cGUL3gtNNZrRbhoUtbEUnKKtyaxdK4I+PcI/5OCpZvwsLWCMIbVYQ++N5t/Z/4jStBhfHjBB6TEigWd+kYXKPncYK3uTL1HHOAHgfQSYFL7hFwxLIrVOO/1hZ5hIwt5YSocv2L09C5+e5lZM3Psty/d/rCkgQ+qewzgy9aOp1mcv0g57wha1bQo9Nj27g98hxa4kWTh75DmK6zwFO6o5/5UniemDGNlB1TuzhAbbpcILvy+BAphaYLBE65u2GerZ0HUkwTt6DmfCS2Pgm5GQCiiXw/450b4WI19+RapDH+gySDRG6bP9yJvThk8cFoWsMsIy84wR/j3VmSUBJUoXgvVkh9DwR+iLFCKGz60Rs7G3/UhGOeFZeOet/H9V55e/jEenCOwqqCV4TWSL0cnn6aKhnW7HLoz3lfFmER82O0oBIAp9EF+ldAZbhbHkKZCJ0CSL0RcAJvTwWPduEhi5iGl+JdWZJQEToS7EYIXREnBQl79SmCl74sJS7jADX/77Kd8jfL+I43JMvTxzfzfxqRTYIfUZaSo6BenZ3u87E5+egAZuQjWkoSYq0ZM2vhGEOgfA0rI8IXYIIfTGwAebpAP2HDHk9fgbrzNLLlhB67aP9PkOXL71l12ospzIR+jyFX/syQOiImNStsdrzYa5/BRdMHnbXj8+z+9/npsxhWzEPAW9+9+9SlggdjxOUI4+uCR2+/1hnz+8Nko2jH2hdXZOe/FAP1mfwLjoRumz/cib0NWPRn8Dku7dbU1g8wNzZJTNR4iSUoP7X9pvQFWvBeiUIRWa0xIwUKY96fixa3Y2cF5C9iLtQW2e5tZtgUZvlYVyjhrxDXujzzQOW2pEnvbhBNwTociT0YgatgIh4ndEldGHtzDvhFNZHhC5BhN4WcDBAQHdopfF05MsebO5zGMa5wC0RbvADI8FzTBB6pVbSjUe8jAvPIOcEj1nV6EU5LmhDcyoJ5IJjYdlBHp73MVh8d44wrX1jnb/w/n4+T3QTiHRXZICRohP8jTpvOkWWCL2MmQ9dv+sc6MmVNf+TOjJJC7HJ3Q42auUyiIO2aIXYnQtE6Or7tUwJnWssXvjDkoG44iDoRzCmOK86E8QuHHKCp0Ib79GxQhQMELokJhb7HOMRa4TAXL6FBymC77fj4qOOoymIFzgeOwzNWgSNCM3xLKANRngDchdXiGZlYpYejpWMV/7IiNN9RLRsEDofO5Qx1HNft0SiRCe7gYsjE+tLjJjQHcyLoZF0SShHaMXD+ojQJYjQ24CIXOYGX9R94ZPMX1EWMn8xyIlW8iYtHjin79nW+AbjtOmjYVI+qJvCUH3B2LWsZVBALnuFXH5peDocBCWXeTw2a8pnPBvkeS6M85eh3F+S8dl5Jqw4QEza2jtfNNlxQNcm5iwRunXqOUdBPXd2G8BKyUZ2a0rZyLSQmNzDKzVT+LI875YXjqr1GgARumz/ciV0JWTh3+mn8uT5cYte8FG17n4iCeQSXWTAq9wYoWO7kLC0jjmUwpOCTC+LMjI2faByyrnwdSMPUtQbTWyAkUTLs/Lu5NPyXnA6yPgKyw5ugbm9T2jvGH40bW95bvXywgfk/XR5M6VdZInQ2dFeHOu8u8AyYhHvPCRwD4FHewb6uDuFPhKhy/YvV0JPrloEr+PXzjRe+PgcPdyKjnbiEf3cQSfk6eklTZAvm1zYtNKnygAUTvAlE5sMEUP/M3k7/N95278E6nv3Ui4F278YyPPvoD8bhMB6vWjPSe4rV44fgWktYTF5I7TzqyDzh/GmAr/fLoPEmA1cEzuCeeEmbEO3Ocj7Hfo1TmPsBteZSK0L2mutG3mkB3GUNhoeB+18RINsmHaOkTtTWEOJ0Jc7oZtMGs8HWpjdvSBS6+9r3zzfNWBuVz6vR+hJAApMVKFvFRGOQu9S+0wwhoEWs3wM1N5hLkzDGHwD3p3d3Fs+rJu8BhcTuht8EZ/ZrRNmvwk9nvNVjNbYveKQyCPMlGOckqNhSv8O+iSsn3FODJMgQl/uhJ4Tg4wZ0gpeuF0nnnsyIfEe7eQP+n3OFWsF1eCr/M6x9p1vI4SeXF2LTtU2uctwmF50m9jRH7Zq1aohlP1SLznFaS0VwNh1mOVsABcV3rZ43Pn5cDV6Ecz9v4U5dq+4Kz1rJsxs7CD42/L4X3Qc7jQrhJ6EX9bOVc802KIX7IBN+jM7lUeKkBaIr2oRugzQlc6GhQj9ECB0BCd1L/y6iehlTEtXzIQG71G2DSW70ykG73ubMbmLiYkx9KE+rQh9sbxxE+VEgdp3wrwYaJFRt4QwIOb2QE7dGNu1d8KYPsasQvqkLuZFeGDEmeLe7t1knsuIyT0/5p+ozPWuyYQvxsGbO21HKoj7NrEaxl0j05rs2zRaZM7HOg2vnUTosv3LmdCTXMXhX4/onqPzF19cuYnuWyscO3ocOU5M3NOfUnSjX2vmQJ9jcdUl9KSNRTf8lubdeG4VYUkrwh/BxDxCrb8fmEk036xhQE1RurZaey7I7uq1Ff8E/mudOSr7HIc5fSW8Aywlsf7c8+s4viNuuA7r7i5taX8JPSfm4wmu+0Roy2b9mBcROgtuLpdPO1qtvy+QlkAv+qyJwFVs7XT9tbxqo+smEfqhQOixadqbfFkhOfvT0mblndGiF3xPyevbE29l+YLBLvdzhuOlGyN0JXrdeWasIvJsMUpjZ98BVHlkh9hVssUkIUCyMyD7B+1Tzm1YXvRe/nMjMhuQaVBLbuQdPHe6f5cst3Z2p+3MEKErPi3BNfpXZGUYWP/iTmViEqqfjvYV1MSpeAtmphOPMLlRIUKX7V/OhJ5T8xV7oW40NUVoPk+p6oTX8NobAyl7LA8oZ3WXaqQwnK+Y09DF5zBoCDpU6S76BSUQiWxbrydpcmOi9hpMhCJ/3uE5tVGo1gJsX8H2pzEqIs+RHh7AwD4gs22ry9PPEB8x0s7ET8LXyf+tLD7T6Cj1JtmPTtuRJUJHh1lTV0iBlHYPV4I13bTHAETQqvE/hjn0U11LYHyU4IVXpdQfIvSmd2r5ErripRmcb1KrjeNSu8Gn8NqP+izT7U/yEft/q5lVbcFFxJDJHZH4LhjYRMWmdy+8ZXV5/BlSLtrCbaMfUisdrkycUhqb3MfTXPr/LuWUSzZbvSL2puflR/1Kwan9kAWIqUZ1IetZxYv8Mvy7cnnGiKaXJOoIrtGdi0pq4jfyNi5NQs9JQlk//Qxoz06+IOs54HIrYPSzl8Wm954d7cXKA/TjH7Wv/LqJhzvUx65rEqG3ggi9A/CAFQVn6lgQ1AO6jlqtwhOevzcOV8afhc+Z7ypQp8CJJBc4NFMBmX8qBc1cFqOEHi+21WhiRP+OfPKijTFZ/3RV6QzmBaw4bqWARP7WaLC+WI0eY+FS41Sg0V7o1+VlscHogRleLLR8Pq+pRCuhLV9kZ9By09QsZ3luOVuo1NgZNd4S0G1EQqS+tqPpctHQETPxcVj4ybKB91S5p/8VoTCkbQVEDMRz3gneYcaiGZvbN1vWqUfJ55huN/5DhH5IELoaVW3SyI6zVYB4dQxzPQ87/oTyWDWIR+wtvACUq0ON+O/zoxMjBS/4ZUqaedPib1pDL5enV8DLdYupqHGSTOH7LWuFc02r05YBNF35ylf8v0TyZvewRR+kFjzCtcsdlu2/6QVjbzqSfVpxTjMFNT47uyPu1D5Y8MLdnMjCA/POC8dnwXmg3IfObPh5zWtznLTGXv1nsEBvE1dB9c7QWZax4NVK2zqRSWYIXbFcVJXbJ9rzXXi9fy5NKyBHsiG13Nr5PBStfghg6d1eqIaXpNh+IvR4zixM6I1ybrCtMtMTv7AuEZusw5fDQvh4M4npF5wEmK5SRGz7llWZGJ1jIgzMdy95rkkDC/fxsHBfU6xO7hcJDdLML26a0JNzxWr4eqNHHZhXG83v1ejxgu2/Z6w56hSTcYcEPyDvbc8km69cuVp7Lr7UuFkrzH33mpm3oR2zon+/KHr+WEv/tWWYnJNPrwBN+81AYPexjYQwqy82j+VxRcGLduadiarss1J3G9oS32gmt0aCd5sZU+Hl7kx1nKwja4SeyLExUHSjm41ZpmIrYHg9JmLCJ7TEC9BF01VHeKcu4Y6K6IehvSmpgzKCys6j5rMLNvcB/yFCP0Q0dERsEvOiK0c0o5jNtyhIr108y4T//8iygwvRw37Vhk1PWKx9uAPHGMd5O9wE9Xyz6Ib7hFZuKJDHIi+e7IMhQs/JTFTDw39kwrGm+aVj9cwKH4a7oLxzjTv5vPnGXZJXa8nNQWZ4HTHv+B+ANj+cEMUCC5vIWAb9Y+RUsGvXYRhV8XQjZngkGujzr3g+gWh20TbNIS/4HGquXunmAAAa5ElEQVTrmFntcss55xh1jHIKwatlrjkAz327Ep3QQEKgoD7ihC8Vg7Xk7qHP1SbMbmfKAbfgJqReRMuUXTtJHbPuib3ZspUfPfM4y/WvV471jCRWEtHv/ok9MT1yJEJX5koroTeEfLa7uSduqQy+cevo4IVb7MHz4fu3tJbb7cHz4OvfbKkMvQI/0+jNDa5uILT00drzYcCNnqW3TogCmmNFJqsC0+T8O+Dn/1bg+anfBV/fCf+/CK8YwdePwv+vgwG4BXMqywQZBVfG0O5JWss0CF1ZdKMzDMSbP6jNKB8gqXqZa6y7oP3XF5zaBaXRmgXPOqYNE+5AsRg+acT2T4TPvRHqwzF6PA512sGCbIlkJvzcM9oNm4L3xylSZ5Jc5Z1gZGxiteXUvsk3iZOiPd3JkMs+PMA3ieFDUM9VUN/6MvOCn79teO6OaYPxahnM0f/kRx6hCaLikdHcYJvjbPpTOR7tyiaLhC7bfxxaU4xvYmPL1H7YNF4hfXZyB1mm4uO9g0rsl6NYolDZsGz/PNCkH0AfFYNrTp3dtHDDXUUZD4EIfR6kS+gzgpS3OSuO3VEd+sOD64YaO8aG6jvHhhqtBX6+f+8pQ43t1cEL8TNofk+//11Cufr1Vt1Y4+1MDDwDw4FBjQZNtyzjliBsWeTPhNbTSFJY9jSXeCqEziHTvIafTUPmzIKBxO6Bpje2MZGl7T8ILwdukr5bdP1rLS+4Gv7un3jxPw4L7Vfh8z+Cv7m74EXsJRZOdzobqdjLnF8fC+6G57y2w7vEbHEqlc54JizgO8vrN4o5YSaAED8eCusjMm2q4z8IP/spz5cOckH5MFn5n0RLEZdhsKvM5BMTlDHtDRb9f+PdXpLZ1uZtFxDZeGnMHKFzmXHLlJAbzu8Px9aN9sEtZ5WNz4KxPh/G+TZu+QlnTVkUWFvx/B/egZIb/r2uTNvtExH6woS+xVvxnK3O0ENQ6lD2Qdk/R3l8e3Wogdo6fibThJ6Tu1LUOrxI+x5tu4uoNMdLsm4qMld2yjmoF28jX9jMEzqXeaEwfizIfFvRSISxufuQ5B1HE3PYQKtA6wZKLSw2vzAfJ+NgZAxmcUFDM7ewtvy4EJtKF5ercjx0taI1mZdVG3IqcSdENZ2qkTbEzlJe9Dbsa6cBVLJK6AJ8U+ZGWvHPFxo73JTxUKrh3rzj/0eRW/vWY5RAjFqXi83pqJVPr1i9fvwZVrVWyju1N1tu7WvwjjzCrEl41dFg0h0hTxGXPtrWYklIC0Tosv0LEPrtoKEDYf/hThcIm5N6Y46yHzX1zfYS0NAZZHxi2z8RBv7RAr8z2i8izUpJk9ATD2DXfxXX8npigWC+BwdtoFpKqhsp9nx/z+iG1wBxTb1FlcUik5QTul17Ibzcvy966hiZLovJKBX5yDjue8ru5PHqe9npnMokocs1xp04HgMioek5hTWGEztaAPF4D7Rhnm7YR6ffe2Du/Ry+/hjG7yeWF9wBf/soEoW0CPIrmMYsP03FEqlg5e2FHjhmEaHL9h9yhJ5Tr7GFm0w6gSzhkiqhN8ncDS/l5mh/Xwb6nWrhEQWZFvWF7udodNHI+nSPh3ouF+lrUI2+wXvbmbldlU8mCT3XdLx3HnfC9dMav7o83rOcONcEO06JC7vlEMZzUh4LFdLwIRJRNKENXxSi6EXAJSL0WP6HIKEjlBfuI+K8c9kTzEKLAv+aHqHnFOccmLDXltenusj1vWDfeLrd8Na8e8bTuAg6Ii6e9OME94nMwao3x0O9KXHkP37NT+fed1YJXR1DGL/ruOKQ+nwXNw/8epMVimnhRrIyLjznRXIZ2Kjd9Uqv9hwugp5EuCNCl+0/VAk9p3iHYjSmcrq76FRfYgNms14QupQ5jxHtRjei5pJ3lqTMF1kUeK7vkhftLIxOvKxrecrkQk40DIvU40Be9aV+PKTcBPiyOic6xVIidMvyjyl40W09iCfRx8I3DDDv91luzTMsx7bkTIR+aBN6Lg6jOTb2J7Aw3CwEsdQ09VkxgXVKrwg9rvflxfE/g4n7Y361b8nJfMEFgZk9q5OPYpx17KsJr2mMd770j4e4Ex4s+g+vqYyvFBNCK6tfxgk9sQSWz3ol9hvf1R7Eleh1qcu78nnX/0vTMmwDROiy/Yc2oTcTDCwO/5nyeZfRlwi/lrzJXTCImzXv1feM0NW6MfJV0Q2+o5ypL1GiSl4mbnIMH7NGuZaSM3ke6wQfPmnpHg/V48XS9s9R+6Ujk6wTulpf3gtOL3nhPjWM8DIojMzZO+wE70tDfm2ACF22/1AndIQctGFv/MlAMDeWEyekrBIMe4lOOvlsbOeFGKSGtbn7Ra2nhK7Wv2HDpifgPXHhx5CK121vxkMmbQl3WJVaCftmMJf1QK4hkgy5/lVLYH42F8evx5nVXN9ITO+lROgIORfW2rUaCw7jLgtSj8kcA2Rh/9TwyT0EEbpsPxE6R0zqw+N/BIL5DJ+kCyS+6F+ZVXbELGiDgbSqPSd0IfX45S/YExfz8KmYAtRfOmTFZMbHo+gFP5cxq1NKESlIPbiCk3qIcsra/GxeYJhjVniAzVfbf48p2Sw1QlfrteyJs4B09vCYDNkev/nHFTYjXijS39Y+iP3qE5nnckToSfuJ0JtwmCho3rwIyIW96FnRhvjLH4pkILV3y0bDy7VECZ0hTg5hjU6sL7rB77iDYiY3U00yk6FnWYQ5p3bNGpEoJkWT44AcFz4/J9XAIH2fn3PJh3uzR7OY10CRjfaivxQJHZGkJ4W57kUP8EQoS2kDGyejqo9Uoe2V2juwP30k81yOCD1pPxH6QYgJpmhPODDAd3BTYR8JxuFaIL8GFe2Cl+hsbN/KcZ5SEdr13iVM6EzmcqHDc3XYoFxdAhIQoVil3LOy4MWRtUQM+e1Fxw9EP+INYZqyismsMnEKvPzbeErgMCtyElH3wgNCPncWKr6L7U3D2WypETpCznUMPANa7i0yJPISMMEnR0vV6GHLrtUUefWLzHM5IvSk/UTocyJeNMvl6aNBOJcDwewTd0lne6gRiRCi4azI4/5DeQ1KTWe5DAidQc3wBRO7aNn+d0vVqQZPYSrknk7kssXl4yTjjmNRwgQstv+RtRX/6bLtud4tavEGqALPzzvBJ0osjetUr+dny1zlIYxF0BhswxXFk8MnpSGfpUzo6jPQqgNE/sk4k142rS3CSsk3aRj7vyhuKRj0E9EBEboyTkTo8wAHUw5o3o5WY7IKPOdNsqH5aSRSqcuY72jWYmePXrAj7/hvecHY2JHYFrkYKCFVLxGBR/bImOSdFHjmPtGPvZLQU8yMtBjU/MwDGJ8aib3oTR7gWdCihoyBnzK510X9+2TADBE7exeMxaeH46QYKKf+5BzmcuLOcvnRcATaeyPmZ+dXAUVoz4Qg0pCT0Mb9/QUWW5yREloKvoF355l0ZsykkJ277+g57p+jM/eFfPbivEIvdLXutKGOX8Ge2AhjtpMTpt9WrvtelDiLILcO7oU59v4NGzY8oZdyagM84Yz3midDm+/joXbhve1mPsA8YvPJDT7Pau4hoVtjtecDoT8ixr279rvB4+J9YE6KROgHo5lgvHAUXrh/BcHvYZra2GSd74x8OSEOKESz0AvJg4Q4zYlbcHcGG4Y61zr8ewu2f8nq9ZjiMscnlzLBZLtGxqbfa5/y2gZ8ZaTXRWFa58jYRswS1jcNXUWLRjew1vXXgjz+EWS0XaSm5fnHW2RvJbnC2yUxEVlLGQcRZhXrR9lwPwr/dlgo3oM561va2O98wSphDgw7QRnaei3Mq8d4gpWpOtdYuObePEfbih52UPQxuclR5yr87A9Q92fyXs2SDUvTaiH7XBqbfk3llHN15n6jDPN+9ORzcP73TENXkPiQOP4xeNyEmyJx3NQvjT0ea67AsNTHNw1XgjXYTlXRyQhiDX1k3fQDJ61/NVsfupkLOI/4fJrqnYY+k2joMO67Tlp/drwmd9z+ddP7GResmyYNfSG0TuK1sLDn3RrmNf8ZkPteLlCekpJnGgobCyUHKbB80CFL9ckJarrBs7/5mMzh68N2sLFcPu1o8biBeRZHkQoxWGO5tQstb+JNoK3/r66KU3sz5gTHq3tq3f2GaoZHrHLG/xRNowWb5ZbfjNoVT0O7kcmvRf71+eSvJB7hsa+BtNV0tlgv/P7XuNMdtv0xvP0wX5uygNb5WR6Lng19eB1qy9CPh3BhRmvPiJRTlctIXbznk5EaH1zKSOS3fxjm/r/n7eAvlKxavVrweRS20ehFsIm4wPL8ruc+fhY2QeflR8Pj1Lp7CdWprIibV7t2fZEdo2zEOOz1FBPlqEVaBmZhjtRFIKP/xrNyOZ4ZOC+fFytXjh9hORPnFjz/r7qdD+xzOJ9EtLtcD2PRYwRNGOPX41rc7VwueLU3Mi4QV2exbiL0BTDHYj6A50nwIpwL5Wogmh/DC3EPZtmSJHFQ4feVGXmj0x2U7xSc8AOWHZy1ujz+jNbn5TL6AvUSKIdWzQnP7wqj/ktgMZ4E2V1m2eH1sADdCnLdiaYzJKGRhVKDihsM8Pn7MTgPjNsN8PVD+dHaFNY73mJKH49TUmYXTE65XIucgqfiAgXk+zauvQc/s/gc3bWgjNg8ZeFK0dS6A+Rza94NrsNUnUW7tkH6D6jPNhFI59BF8/FE0Q0LllP7F9jg72a5xavMGhgfyWlmCqxLAk9S6YpjJZYb3b857/iBPObLoFZOaBNE6O1ggbPB1atPf8qaSrQSSCZftMMNQNZn4suRr0Svwu/Rez5vT6yG3/25604+sfXzjUZDOj21S+SHSSc53dLBM/sFJpv5ZI+/K1XPeOaasWglajogYwc3SgU3OsPygijvhuPs/5XaupJXs4bXhS9F7XJc3BhoxVwbiaWBBefQAAuitK72wpIXrMH5iPMSZQTawRQQyTj/f20dbG6sQtV/CW4053GAEs/pPGOaIQxkY+5j/00USZ65JmsgXlMEkv2ldEwT8fDjc26MtKgeO81Zmv0GuIVQpF4tsTvx/l0w5lfge6GQ90Dz/DfTx7Rgai70a/Min79p1aqhN4294Mhuy6ZVuaFrx3OHY/mOIOVfV498bruEvrUy+Fb8zG1juSNlPbqlMdP348n2gIOvkEwXE5ZvDlQnGUJbGEDZxbLXvQsrNml8ce/rvVrTGIj7xWTU9RwbkDKiuZo+WjeTeE3Vcsdfbrn+W/FYjvnYoHkcj0GAlNmRClpb5ill+XdcC0cCfwjquglDtuZdv2JZ5xylPD6+SUFY2miIdWyLt+I57RL6FmfwAvbZQ0ZDXxhNC99cZSZZWGlRNAuuBSwifxoHHk52pg05HcIyagszsPnD4we0YnRbVpXOeOZq+/SnzFl/Yg1skr916qlHlSoTryg4tbBgB+8seP7lQPBfA23820U3+L4soJF/BzT46wuO/88YkAqPB/OjEyOrNgRPbX3WQv4heMZ7ouUf020fUUbo+HeC6x5klSRwSPL93cm5J212B0e2eIPWVnewoFNudwaLt3uDazY7h5+5xR7adccChA6/P7C9yr7/6O3O0EvvgDboPh/7gH25vTJ0Qr/lSyAQCPNAeCdXxp8FRLUDyoPcH8N/oJOSR58P13887wTfVOudA7FFyqAvx8Bi1kWpqcOm4O0izsF9nfaRFS6jPcUeXw9cSpDm8d96R5z18Pqhxu+8of1QGibKb705NfI5C2rxxp7rDs3uXId1Dv5Xv+VLIBAI80AS+sZnFd1wr7hdUee3Atov0mxe8MJOF7z4KCUh5diS0lIaA9Li0kLgi1pd4iuCbvgPmBAKY7h32kdWWD/ZDYuT1XoJCSSh324fcRaSIJDrPtSmTZV2Cd3kM1Hrv7uK2v/gL/otXwKBQJgP/LrRadNHAylvE05qMiBMJ+UAc0pzg9/JyHq5TB1viOiNbvgFcZVtfxd9FP1ktybWY31E6AdDJfT7OaHvb5eEs1qA0Ge3cUInDZ1AIGQWyf1h178dSVlcJevmChkLkITx3VnN2bkiFm8sQMP+BSfk7vvInPGqEbsjTYR+MIjQCQQCoT+IyQ601//ggaG6iykfh1d1/VdhfdkhO5lbYerYguM/ohFnnB1FYATDkjv5PLVuQgIidAKBQOgTlCQxXygn5uiuCL3Mz9EvV+vtN+L+VafOFJEsu80IVy8yC0ZwL1o0RPUZOlbIBojQCQQCoU+IPcC96H1aGQ8dmfEt+M2qDZueIKrvO+EpG5aP6/SPJThiFojgB/3uU5ZBhE4gEAh9Qkx4Ti00kMaVJQLKkBc421BAe54JhL5dJvnpitAxrSfLHBlehXVmoG+ZBHm5EwgEQp8gg7CMrAtfWnBjMtfKxV30wutE7VnIeAiblfACLetDU98m34B1UhS6uaES+g4M8GIP7UUN11TpiNDNPXf/XXgH3h78eb/lSyAQCAuBabGYxKTohv+t4QUuNwIs3S2GYsV6+6jJsn6tKgdPhQ3GncKDXycRDJrb61DPK7BeSvQyNySh3+0dcdaj64ca93hD+6E0TJS72wwsA2SOwWCMPJM91x2afXDdUOMuCixDIBCyjuSc2b9KX5MVZ81edNPKlStlwqCen6VLDbrohO/XPUqwpH+AF95aLk+v6FeflgJk6Netbu5pt9mHb9jiHF7dYh8+plO2Vg5ft9k+3NniHDYFZL17odCvW+2hA/dy8/jVW0/CsLGHn6z7fOwDr2cw32/5EggEwoKQhF50o1cpV9e6zlsem6ed4B1Yb6/N07Gjn107CbTzfTrHCLI/mBAmax78hwooOQuBQCC0D7ZgrranngIEuE3HeazZ9B7uyzs+c5Arl2d6s7AKsl1TPuPZ0I+tmkcIonBnv4I36fJHEKEvBiThBqYcNVEEKd/ZRfrU+ljuSGPtWCrpUwkEwqGNWEv3witHQBvt9j56XIBEeWz46P687Z+Idaetqcs+WNapRxXc8GaMu67ntR/E1/GgH78kc3t/MJPjRHq7s+LYdgl9sz14IX6GNHQCgXDIISZ0JyiLACoyfnnXZIiacZGRYXjPcGV8DdYvSN20phPnPh/2xp9sudG3+Lm5r0fmirkdCP0dqpwIvQMROoFAIHQJIOBv64SBPZjUWRa3P+QrPCxsbp786N1AZmDD79dUxleCZv5fpshcHBs0im740Npq7bn8ieTd3msQoRMIBEKHUJ3jSmMmzp4VUvdCvPJVt1z/I+Xy9NH8iTwlaheJXAZaNP2BYcd/PWwcHhZn5ibInB07jHDt/KOqfAi9BRE6gUAgdA6mMSNx4Rl0yZCWzotft5zwgLgWdwf8f3psbOxI9eFNuc6R5EVR86DnWrT6YScoQ13fHRljAW1mTW1CUDsv8Dzoj1jV6EX8aaSd9wNE6AQCgdAFpBaar/onM89ucwTJSBI3CCUvqqPDWt7xf5N3wr+2RseRMNsxv7O/WXuK/3TcEMDnbwStf9bEVbuDtXN/P7+qFr1PlQuh9yBCJxAIhC4ho6AB8X5WP7773CZ4RuywYWAZ2txgDxD0jyyn9uGC558Dxc27k8cX7akX5r3pF+fdcARjzcPfXAJ/8034/O+xXYzI3WDWdPsUz/atGGlOiIU82/sEInQCgUDoGpzQrdHa80FD3clziHcdNnVB4uTX4/B8faqByU+QqEtek5c9c0xD8ma/h69oCkcSF1frjLeLbTZYZrVwHOVA2nl/QYROIBAIGojvdDvBuWlo6XOZ4pGg+XMOMvO3/N48icdkLkztlhd+AvtPMdv7DyJ0AoFA0IQkM9CgP81IDsguRVJvIvB5SqrPlccAxWr0azK1ZwdE6AQCgaAPRmYYrKXoRT83dTc9i8Vy8EghRHP/7vxozcJ+k6k9GyBCJxAIBBMQWnqxMr4SNNcdGM51GZJ63XLDA3j3Pu/Upli/icwzAyJ0AoFAMASpqeKd76I3+ciyInWmmWMAmY14pPBWtb+EbIAInUAgEAxCxkpfW6mtK1Wj3UXhad53QtYqft3ywv0iVOwM9o/IPHsgQicQCATDkKSeH/UroKX/noVZ7Z2jnNHCNyPhAYwwB8T+duyXqfjyBLMgQicQCIQUkJD6WRZmUROEuK/QAy90Y2TuBvuL1ahe9CYPWM7467E/RObZBRE6gUAgpIQ4u5k7/jzQdH+IAV/YPXGzYWLTMbGL83LQzu/NOxNVtT+EbKIhNlpbvBXPASL/PRI3fN2/xR460Fq22kN7tlfh95XBt7DPEqETCATCwpB31Mvl6RWWHXyoVJ2sYxEm+Kxp67xdXjgr7tPfkB8Nj+PtL9OCn3FIDX0baOj3VYf+8MC6ocZ9Y0P1HaCJtxb4+f49pww1tldJQycQCIT2keQ1z+Xt2gYgzjt5bPbwQFaInZ2VQ2FauRc+atm1C2ONnDTzJQGpof/u5NyTtrqDH9viDn5mizN4DZRPt5bb7MFPwdcvbbEPH8PPXDueozEmEAiENjEgCbJ82mlHF23/0qIX7uZm7WA2rXjri2rk4ggAY7KLHOlfyXvBi7GdrL2NBp2XEwgEAoFwEGT+cgASZ8GpXQOa+h40cQPB11uSqaRB8E3PYEleqixQzE2YvU20coDOy5c2GqBxt1Ua5OBIIBAIOmgizLw7cTxoxlcCwT7A051urBeVTGnCia5bcq9jEhdWDyfxBk/HijnMwz3w/69Zbs2TZnU886dEKwQCgUAgdIBW8lxb8Z9uObU3AAHfCES7e2TdFCPeUjVq8NSsQV0SMzeVz1Piv/Fn8XNF+DxuFMqxed//Zd71L15TiVYqrTmMtHICgUAgEDQwM3MQmQ6U3MnnFTz/HMsLPgHk/KuC4+9CYsarb6ygJs+0+amkiJ/h7/BvMOY6v/vu/7ZgB9eBRn5B3vZPXDk+fsQCzyYQCAQCgaCHxgBeD2u0OKIh4Rbt8M+L9oQDGvbrCrZ/Sd4OPlZ0w88XvOAGUb4N5P8ly/Y/XnSDy2AD8FegoZ+K5vzjytMrWh40wK+hkWmdQCAQCISUMXMYkq5B7ZnVJxzyyBGKQCAQCIS+QJjGJclj4efvSZHmc/XviMAJBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUDoFP8fG2heOpsr28UAAAC0ZVhJZklJKgAIAAAABgASAQMAAQAAAAEAAAAaAQUAAQAAAFYAAAAbAQUAAQAAAF4AAAAoAQMAAQAAAAIAAAATAgMAAQAAAAEAAABphwQAAQAAAGYAAAAAAAAA35MEAOgDAADfkwQA6AMAAAYAAJAHAAQAAAAwMjEwAZEHAAQAAAABAgMAAKAHAAQAAAAwMTAwAaADAAEAAAD//wAAAqAEAAEAAAD0AQAAA6AEAAEAAAAoAQAAAAAAAIo4n00AAAAASUVORK5CYII=",
-    # Icon next to "EC002 - Ductile Iron Coupling"
-    "coupling_1": "iVBORw0KGgoAAAANSUhEUgAAAGAAAABgCAYAAADimHc4AAABhGlDQ1BJQ0MgcHJvZmlsZQAAKM+VkT1Iw1AUhU9TpSItDnaQ4pChOlkQFXGUVCyChdJWaNXB5KV/0KQhSXFxFFwLDv4sVh1cnHV1cBUEwR8QZwcnRRcp8b6k0CJU8MHlfZz3zuG++wChWWWa1TcJaLptphOSmMuvioFXBBCiiiAqM8tIZhaz6Lm+7uHj+12MZ+F/K6QWLAb4ROJ5Zpg28Qbx7KZtcN4nDrOyrBKfE0+Y1CDxI9cVj984l1wWeGbYzKbjxGFisdTFShezsqkRzxBHVU2nfCHnscp5i7NWrbN2n/yFwYK+kuE61SgSWEISKYhQUEcFVdiI0a6TYiFN51IPf8T1p8ilkKsCRo4F1KBBdv3gf/B7tlZxespLCkpA/4vjfIwBgV2g1XCc72PHaZ0A/mfgSu/4a01g7pP0RkeLHgFD28DFdUdT9oDLHWDkyZBN2ZX8VEKxCLyf0TflgeFbYHDNm1v7HKcPQJZmtXwDHBwC4yXKXu/x7oHuuf15x50fpB9yl3Kn1FGVKwAAAAlwSFlzAAAuIgAALiIBquLdkgAAAAZiS0dEAAAAPQBnBiY5RwAAAAd0SU1FB+gHDQccNLQFiO8AAAAZdEVYdENvbW1lbnQAQ3JlYXRlZCB3aXRoIEdJTVBXgQ4XAAA4UklEQVR4Xu19B5xkVZX3qapXOXfunu6hJ8MM6K5jQAUUvtVvdY2rLiKCoiKSkwl1QUGCCkqYIeqKIIiuILAqSk6DwJAGmMCkntDTsTpVV65XVd//f169npqmJzQMMN/vt2fm9kv33nfv/5x7wn33vXLI/0f0cn9/aPkNNxxojoy8u5jJHJxPpReWs7kZ+UIuZBZMoyLojttlOr2elMfr3erzBZ/xRiIPty/+p2Uf++IXN1er2adon2fAk4lE5MXLL/+w2dv975mx1GElAF7J5iSTz0qhZApBr7jdIl6PuLB1upzichniMlziduLY6ZKio5LzhoIPBRtbrz/54h/fWa16n6B9lgG/u/baOaMvvfTlXCJxdCk1OiuXTEs6k5MsIHcG/eKLhMXj9Yvbj+TxidPjFoMJwDscDjFLZSmVy+JEfrOQl0AgKIFYPVLdA82zZv5s0b+99x8NzoZk9XZvGe1zDPjjNdfMG1jx/Bn5gcQxZnIkPDo6LLmyS8QfAnhhGc9mpQyAg5GIRKIxcUHCnU5KvUMymbTkMTqkXJGAz498IkUwoqGpRVK4Vt/YINH6Oin73eLw+DYFQ9G/x5oa/vC+I454CEyrVJvwptI+w4DHXnwx/vJ1133T7Ok9pTg6EukbGZSMwynOQEg8Lr/E6uNSdJalWDDFR4lHy6luDJdLgfd6veKGCsqAQcmxpARCIXG4PeLxe8QXDMI0uKUCjI2AV7wuj/jBUF80IhWOGp9/eSQWvaV94cLb58+f311t0ptC+wQDfvn9cz+X2bDuotLw0NxEX5+M4pwf4ERjdQLFLvkSVE8mK27DI7F4VEqQaimXZHR0VEyzKD6fVwqFEhhiSFNLs5QxGspmGcwxoKbcOhIcYJSDDMVocaBOXBSn2yUGmBQKRyUAlVYynMP+YPiuSGvrze//wAcefjNGxVvKgLvuv7950+9//9Nyf9+xY719MpxOixuqJRiPiwegauscAArAlSvQ51A9WeQZHR5Sne4PBcGMkuRyeYnF4hbAANVlGOLAEOFxBf9ILgOg4xgcwMbacgQ5aDNwzeU2xAd7Eo3U6chxB/1Pe+PRW2YuWHD7ggULtmklbwC9ZQxYet73P1xZvfHqykDfnM2D/VKEWgg3NaDjQTEqAA7CV0aixFZgTCsA2u/16X5qPC3JZBKAWcbXHwzAEHuUUSQyirDn8gUYYxNAwxMqFiUM5hqsA71mHtaNi+AxmEGmcVSAGayLNsYfw2hzuYZC0didje3tNy1+z3se1RvsRXpLGLD01FPPKWze9ONcb79zayop/khcInV1Kr0C6OjFkOhOFvN5GR0ZFn/AbwELZCORmF7P5nOq+ynRlHTIPJGVNEaJC6BnYQ8KAD4Wi+kIyhcKMMRNVk5gz/s4yAA15BYDxODIwTXcxwlBcIMxvjDUE9rm8LqXeQ33zTMOnHfPoR/6xBZtxOukN5UBz1QqgceOP/5ad0/vMQNbt8owpDrS1CTw0bUlLootEK5Ah7uAED2aXC4neQAdhJSXcW0UBra1rU08kFIWquCcdoJgcg/AjiXHpQwbwTyqblg3gOyFmmuor5comM26qKLgRunIceC4VCxIBUxiKsPOmPCm2J4SqzecMNwYcVB9ptM15g8EHoSqvOWr559/Fxhpsgmvhd40Btx1163N3bfdc1tpsP+DXb1bYfAMiQF8w+dD5wEElQb+UyrLYAylnj59FgxwQ8q98HAo1QTVg6CrTD2ioJP4VwvrHoE1wQAec2SQr/zDEUNGhOkhaUH8KSKYg6oqF4rKNLLTpBFHUpXkxgijeuP9YSeosgwkP+xEhcw1PM8E2xp+eNxZ3/oLa5wuWe1/g+n3S5bM7V/2jzvL27Yu2jDYDVcwLvGGBkGoqsBwqFPfExQ3wCsVS5IYSkCH5+EJxSQPyaRfH4NOLsMGlCCVqotAqkYUaD2q/scRjDfPkypQS5Bz3Aj3cVbEVYQXZcI+FPPixD7rMzESwGHJw3sqwQ4EYAPIaBeknucNeGD0qFwAnkwk+I4y7EsuJTm6xqHoFZ5o6H+aOjo3/t8jj+zSG+8BveEMuOXKK/dPPPb4X4q9PbM3Jgbg8sUk2FAPcFQTawOsRmCfzj0ZgiMaSPr0KejzIFRU0A8VRGNc0+Ltu4DcKmodkSnVLc9pGTDWxR3YhHIRwRpdWVAR9zEB6GguI16AXTYxCpAvFI5g9OXFGw5KfTSOeipSVMAL4kAqc+TArpChvA9d4ZIy0ZdyBUMrQo11t8874ojfHnbYYYN6o53Q9j68AXTLdZfuP3Lf0/cUero7NwD8QF2junmq7HlnlWJ4OvinDcGfqmBrp+gmkjQXwFeqSvXkhmsxuxLrv+4zala+AjwEC+LKQ8IBWgEnASXsjUu8GF1FxBNUQQbaMgLHIBiPwcsKCKyIGDhfzubBHM494R/KVmATyFSDUbpAMMgILY3ueQ0xOHK8ge5wa+tFX/3hD6/R5kxBVjvfAPr99VfOGrxv2f35bVtnb0gMSrC+QaLRqAJLKuutCT6kneeqwE/QJKBrJb+W7PpqyZJ4/Idqc4KjFagbSj50jUp8Howt4Po4DHoUHo4JSWbQFkEskakUtEzA6RYH7ALtA+eUyEXaIIJfhnp7FXJov45gtEfvjzrcyO8LRcRZ33jbp8487aszZszIWJm3kyVie5nuuOOO+p6Hlt1Z6e6bvXGQ4NdJpAo+vRYmRrIT4KP1VBaa1BaQG5R4SFY16dAAUNZ2e5qoj9tqbhzoXwek2pXOQGXk1KspMqr2GDKEGMIJXe8F6OPplHpKWYwOExIeAHp+6PQSouxyJo02wmbA+DqQSjDMWi/PoSlMTiQ2d7scMAePnVKE/5ROjoqjf+Dzf7jsstu7KhUMix2J42ev0tpy2fvcRRf9ydHd897ViV7xI6qNQ4fWEgFzocVkAN0/pomG6z9ud0zWnylIbQnJAp1kEBxKbyEPoS9B1cC4Qs+PFMAM3DfAqQgwhEEcpZsjMwI744Cxd49nxcFpbo9LyvB+yjS2Witgxw73dToDyUU1hEQXlVMddCBUyKr56VyY4FLOzIvPLM/d8MQTzX994on/0ctV2usMmNO95Xp397bPrOvdJu5QWOJQPSRKSaUqJpR6+CjVjk0mmxk7Jv61ul9DBMS6gCxWfU4ATtXhpLEFY7NQC6bHp94LgaXxLJSgjtAG6v5QJCRu1GFkcuJEOQZcZTAGITEknPDg3tDvtEccMeopIT4YhYfWDyehH6OkP5uREbi4mTyYjlZ4Ud6DfGw0RwjvVcIIg9e0+MjPf27FXfc/uIZNJk2NwWukq0867ezyxrWXbtm0SXLodENLk0oE2q+NoHrABqbq9d9WpRH12hJH5rpgaB0ABkGAFHE9z8jWjeAJYEB7I+bCSfjwYykEatiPIKhyQ90gXFZRLEE9QdeoDaChZt2wBLhmSBqucffYmGwdHZaebFrSUFfOMuMFSj8iZjKMETUcjEaMnPl19dIJV1tZiNFWAic8qKccqVv92e9+5x2zZs2CK7YXR8B/nXfeEblVq24a6t7sHEGjG1qaraGKa1Q1BEn7z8xkhKK2i8SS+K/6nUfkXA3xiFd0phN7zjKMJ3S904R3A1WQY9AESXShDei25qcPAzusD3ACuO7KZ6GqELCpjgfUuIe6lcjnBlic6h7Jm/L8YL/cs2alLIdg9SLKHktn1Ys10RmqIvaTgl6mCkIPx7IFWT84IBl4U21wu11+1K/xi4jf6W7s7+pae+cjD7+IInuHAX/+9R9a+h5/6C/pvq2xHgzlhpZWMfh4EDdUoAgSEKcfTqNmoc8ru6Fqec3JItVEnjhQF8Fn1w347i54K7TRWYBRgCQ7GUQBUN6PedEA7FmF3QDDmymorcj73VIGAziCCChaLR7DJwm4nU9Djf4j0Sd9UC3pVAZxCWwIbAmnJhgTcLqE095kANWqgX6VHDjWST1DBoaTkhwZkhaMBi+YzuZTGNJmqe7vzyy/EYe4216g9Q/9+dpSYqBj28ioxONN4kXnOYxrIa41rvbfqYhSuF3aqQasrU081GGNRPCd8HQcnPUEN9KQ2CKk3kDnDehpFxJ1MJ1dKCcwogJjaIqRz0B1wCVF8OR0gFkUX+QKOr1wSd3y8JbNcuPzT8ny3j7Jw191I08UzoTXawVqHrqo0FzAWlMRDDJxPg815YLhdUDUnZxGhwvaNT4uK15aBbuDc1BRedifYj7z3nuv+a95vOvrZsA1p595ggwOfnJbf794Q1HxRwI4yx5ZEkqg3JBASj/3VRlQIl9FvAoZhRgzWb2jzFa3Omq2E5lgwNA6Yfw4lZCDFFKVGNBzKvW4bt+P1x309QESDa0D6sX0eqs+PeqHDvfDVqyFtN626gV5dOMGSeeKqIteTRngYrSAqcEAo3HKPww9zwNMGugSRkOZnhOuFeB5sXvq6dFLgqHfnEjIpq4NuA1GGi4GKhXP1q4Nh6Gi18eAP1599ezcpnU/GevpxdBHIAN/X3vOPwCMEscb6NBXKAjMThLz1yScwvntSQ05iHNGOm8E146SD1GWPCSLaoT6nqqAeVXyUdB0MLotSYBRMBhWAvCmx4s6AS7aFwAznIHglvF43ZV3r3m51DU8LB4/roMpOvWBPEzc9/pg0HEP7nPLh0Ek7hdQP7dFjDATSfsEppd9HsmCEZs3bZFxjAaDj0ZR33gudbCW1RpeI2194rErysPD0T54BbH6RnhoMHxV4k1YuW1kXgX45ETAd0iTzuGfVY+ldjitQKOWA+AVqhx6Izi21AkZxT/U9xUxkJcSKl50Hnl5jZLv9WG0huuWLTrkkMNemj/jMoc34ITyhADQo0KeSQzgTCxHAoEn2PY1m/jQh9EymUEXmP/4nCEH13Ykl5bubVshIJypRaCXz+/PMq+ZAdef/e3/cA4Pfqy/f0i8YagePjBRoFR4lSxwqUKqqCgxB64gk912qyPc8nw1aR6rgxOJHaL7B1eT+Sn5JkClj8576xQTLtDdRRSgNsAHN9MJ1VCBJBY5hYy66ff7cGzWR6//1M2//pePnXLK5ln9ySjcVfhSGDG4Di7oPW0iA0h8AGRLvt0ukj0i7C0Tr7BdEBddTsPnFBwhLFI2i+0vQxW9JgY8+eSTkVTXpkvGB4YkhfA8Eo+geupFSq3VKA206CUAb0Ju8ZpSw47x2GYEt7zGk+yklajzeUazKkGFlanzqXYg+eio6nwaO9RBT4d5S6iOOp8guhhwUYppPA2Aj398jFOhKmlt+fa3bvjVCbMcDvXHId1OAz6l2iqATyaSakEmcQTUUu01MslWT0UEfJys47AsQRA4eqKcTscpPssoV8p1W+65J8qeT5ue//VvzvKODs1KjGYkBBfL4GM8nGdT2B6Cj4GMI8v/VjdwgrY32KLJxxZRBWid+KNMpBHlVDCELwevpGJw1ZtTVRyNLhPB5/yLgUb4aGwZAEGflzj1gPoCyFUK+nLe/fY76swl1/5Mb1SlTDEbxgbyM3V7bEZQxdTS5Pw2A0xOV1dHDVVa2B+QaDDAG7AQ++ZLDQ76p82Au3/zm5nZvp4ze+Afl1BpKOiHy2cBTqkhaBrpQu1w3wLfGs47NtaSdIsBVkOnIq0P9TugSghonhLltoIfNbYoyzurxFLnY+PmMIfaccDYlqGDabTdyF8OhlKRufM+c8YvfnGbVft2Gh/PhieDaZPddibe13aTa/dtIgN4jvfnPmv0QFjCsDchel6cFmeRsrhzicT0VdDmRx77rmt0LDICNy0Sj+FmHPYI9HknJEaGVAa8B/rNvwqMBfT2pJf2gGhU1dspwu0D3EUEWXxUSEWgNgeJABfBcMYefvjiDupf6PgSAyxc98DdNEP+Uf+C+Z848ZJL/mrVvCONpVIt1NsKnnbGAngqmgw6iecmyuIyayADSKwnBDXIOSJlEC5C3XF+2zctBtx0w5K52UT/l/vh1xr+oBoyuoGskDck9ASf+pvnSCo52l6e2J54rppFiflrE1nIYg5Ic7lE0wgfW2cdETzpFasOQIZOIS/66q5AP6m3A1cTkbiJijzofCUQHovNnf/Jky+44CG92RRUzOU66cXUgjsZaBtQks2kycTzbD9ln6MAf3Q6OxqJiBtMKKhqwoiE7ZRM5oPTYkDyyWfO8I6O+YcRmHB+n4XtNnKfPjgPp27ajmR7TDbgk0kn10wMeU4x4B/Bp9HlfJLlomoX0VF0Fsc+Si/cUwZYNLi0dnyaBZ2fjsyZ/ZlvXHjhLtf0pNPp/ckASuvuRgDJZo4t+TtQ9ZhA6xbu+aZUUp5duUpWr14tJVRbKBakt2vj6Tu/wyS6/ebr2/OJxDGJoWFxB4LihXGzcbO5rkDaJ/eApgLeJrqOpWJOtTu8a1hlBEfsLI5pcK2pbWvIeyhl9Hjo47sh/bgEsws1FCiGZnce9Y2LL35AK90J9ff3h7KZzLvtYEr7g/ptBvDYZspkqgXfZobmtf6rkLngBHSNJWVl10bJZbi4mKMJoy6bnbvHDBh8dPlxrlQ6MgSVwMd4teDxJtaTrddGdl3bGQgAivT1Tfj6kGL47wSDfj59e+aj+8rZdzc64qHkY4SUPdUHTshQDnjEs1/r107+yWU7PACZim755W/enktlOmkD6OXY/vxkcEm2GrLBts/X5iVZDNOGant90ZjUdXRAHSEYNEsSRJ+8oVBujxjwzLZtgfTQ8HGJoSEx4FkwJFcdrglqQpHbkVQItBGqJPRcLdUWYT04A7WE5rBTkGYH1AHkWtWJwTU69D+r+ViUwxtOpXhKeRxA9XsDGNq0DnAv0D5Pa+sPzvzFkptYYne0vmv9R7iajkQGEGQywB4BtVRrByYzYUeyOqgQwEC5vYhDmpqlMrNdxgzjRTgFf29sm3HCHjHguSVXfNSVHp+VzGYkEA1qOG0Tbz2l9E/Vpl0RGmrC5SnziVYeLicf5wGAMqd2cVldUeRRw4sdztuH4JpylJhwCIyKB9CXIBxe8YUbfn3m0msutCreNd184U/+T6K7+5TB8dEJqecIYMBVC6ytgmxPiTQV+Dy287I+a886n0Fs0gvpX5fLrjjtyqv+9cvnnnvTHjEgu2XLl3KjI2JCD/sCfpV6iyiFFjCTafr4U69D5qGH6TlwbNJ4MaizieCrZ40OGsgjMNIleBZFGGf4SuIzfHA3I8s+fuMNJ1WL7JLuu+OO+rvvvPOmNa+sjpbAdL5fQAkngJMDLhLPm1DBNuj2CKllgoKOfEwT+VRg0TcIlwmnwp1Pf6jroYd0getuGfDbX/5yv2IyeURiPCXeIDwfBjYKFq8CfPydAv9pk2ofdI4zlnQfCx5Aj4ZzKhs79HaV6PEwSvZC+vP09Y0ACnNZCZjh8/e2L37/F+3phd3Ry8uWvbunb1vbgAnDCDviAQNs/T8VA0hkAK/ZTLJBrt2SidwyERvrXEVX3VUQzTeLu+W+ex74MPPvlgEjK1Z8TLKFAAuHgpYnwkKUejsQIkYWQyzieYuY07pF7fXJI4ZegZN6F6CWUH/R6Ra3w80FB7yK/JQo4kyDBsMLX5+s56oF6lfV/N5AOTqn48tHnXniJq10Dyg52L/IFwlBvXmkCFXGJYcEmOpnKukm6LUGuvYayT6ndoL71Tq4zrRSBAMgxIF8SjyZnGzp3fxZXrNy7IIcA8OfSibHIF0ABYaE4LHzem1SA6ZD9vwQN7qH2IIPYoqQenuep5ZooAu4uYfShZQL8OEh9DUY4IHv721p+dE3Lrn03mr2PaKcWT5QQgEpZjK6rIT9IcBURXbfCDqJx2SOrVqYbEbYZB+zDh0dOKcztNiOm2lxJkfFN5KU4d5t6EepScvwz87oT7/7r45CevTgcaof+P5cR0+tTx/cbsSuaFeX0Q3UY92eU8zonT42NPmAhOCzo5R65kU9XN/jxjknOsfXUh0YJXlkc3OKORh88Iyrl/xYK5sGpYqV/Yf5ymshKz6Pf8LAkgGkyf2rjZQng28TGcQRwOcT2jtO05BxI6MShhEul4vSMWu2dM7b/x5e3iUDEs+uOrRQzIb4pmHAHwA8uCHB4MXqzXfHhJ0Siqn0E2gyAHqIc0poOVkMiadZ1myq90tQRZzn0YfncIXZdB8Nh9s30vn+xcejHa/2dXdBj/3qV7MT6eSiweFRXS1B/c9AjOqnVrfbRGB53bYNdh47kcgUNeLYt6etS4hj8umshDJFgfsic+cvkIZ/Oui2Y877z1/w+i4ZUOgfPjyXSiO6tNblqz7W6gkMDbFljPVFBxD3eYVamXqdk2Qso2etYkpWPkufc+KMz1mhWfUxIKcaCL7WU20dI3r4J5Z0IdjS89h3e90SaW8567MnnbXRyrnn9NCTTx6fGB0MjaTGxWvAtsFwmRAEq5+vJt7bfuJF0lE6iXhObQQYwpUR1qNThIvZlITRw3g0IrMXHpg49sJzTgLT4O7tggG4oZHPZg7OjGfEBdeT4Oh5/ONeLedfK3E+hy9IkFt8KYIrjrVKrRtSpHP/Go7B60GMANtgevi6KbwgjyH5ePjuE69Yoss7pkMv3H5709aBga9t6RsSyZckABvCV5kIrq1+aon9pPTb+wR6sgqy8SATWY8uBXMYYFpO6uFceJB13v4H8KWUh2KO2Ei12M4ZcPfNv+zMZ8fn5bJFXcKH2lWqKZs0L7w1pWK3VNPIWtIaIC0C6afuLxN8nWmjbWAOa6KNI8fyepAdTgBHAx/DZL3e4f3fs/h05pwu3X3//acODI80DI6N64N8F5hZgH9O6a8FtrZ/fN+MwPKcrX5qieV4bcKIs8XogCufkzAazVejmvfbT1zh8B3VIko7ZcDg6rUHlopZbwFS6p+YY9H/mizasRHTI3QOw5O6vQjwuaxPVxtX+0xNyiXkfhMSB72a9xk61cCI2M3pkNaW8z594pl77HLa9Pitt7b19fScvLa/X3JQDZ6gR785Qa+Mz3unIoJqSzbJ3tYygQxgHkJCBqgQwbMLcoQbDpkxcyaHbf+c973vb1YJi3bKgOJo8m1mKo/CAIeTYRXcFLXSCOpMJO+gYPFO1vCrbZAqKhhJaMHqGd7Kup0WLWHIFwE+pF7feEf9Dki2VR+kH6LP57MGvAauv+SEXBl5PDBupYDvybOuWrrTlx52RY/c/+A520YS8YHhYW0v37ov5PLW60hTSDaP+aKgvc88U6sfLkmB+0kjXvUWzWIWAlQRPxyYlrYZfDv/r4cffjjfQ5+gnTIgl0kvyMI/dmJ4Ehcbb2vehyaYG26tfV4n2dtamtwplXJ4NFQxXP6NFrNKlNWacB4eEcHmYltBfOD2YYso1TCl6HFWGmbP+RbqVGdsOnTX5T9929b+nq+v7h2UbCYtAV1oZT1Inyz9VCdsN7dkgO3VTJ4jIhETempkgI/PInC5UClKcTylT/NijfXiC4Wh/1teNTm4UwaY+XxnJge9x+V7BIlkb3j/mmTBRgBxyEbz/CRimwk4C/DlCPRaChzKXOanZXiVko9LqIArHbjgtuTywEBT+isShVFzhSM3f/XCCx/XqqZJy5e/cOmG4UFPAq6nE50g6BkIGXV/LbC1up/G1w6siMMEFlViGZ4rQt1wVtjDkQoJqyDo2g/e1YFz58rCeQvgYHhWfP6bZzxWLTZBUzIADQiYuXxrvpAXg5LBdiHRsGgjt7dvAnTdnzjWwx3ILsJLFfrz6CQ9Hy4T1JfnbMI+PS13hXoZRs0dxCmoKHQu7/Yk29/xjvOqOadFV5192pf6B0c+tLY3Ad2flHAgpDqb7fD5XvXiygSRQWQO8+1MRbHDRQRZXnhpjGO49qcO6veQRQulc8EsiccaxB2J/xp5XzVqp2TAsmX3xcysGeNr/i5IB3hsTZYpfBbINqnWqBJPW8fIWT1vlWH0DFhZB5ezQbXwqRUbz0SVw+Skg4/KaTmMEtw+l09MjnwMZy8Mr6uuYclRZ07f8D5x440ztmzY9LOVvVslMTYqbowofluIng3Bn6xW7HbR72eyr0/FAEo/R0gZ/eL3LVxwKzjvEwUjQl4/bIJLMi5JHPRPB99aLbIDTcmAvpVrIsVCIWiC63x5jUNK1cekRtYSj2t4McEknmOialGuoLGUcHo0fPGBp9X84pIJjWRCFXm5+B42II/RR8bxxQrT5e5f9OF/uRzZp00P3//AVV2J4cY1I4NwTAoSCQYlX8ihzU5VQ7V9oaQzkVKp1IT0T2aSTTw3EUFjBPB5r8D1jDI4RX8CoYh4wuFbDzvyo1O+rjolA/K5ShDqx6NrLlGpBSL/gQg02qEA1+xbTbaA5rEypHreukYJxx5GFRwzfT2UALAByl7k56hwobP6pgtXEjss15QvVHjrGpZ+9Mgjd/nO7VR03SmnnNCV6P/0C729kh9GREqXGp5dNp+XgB8SSjtUJRt4EkG1pZ80mQHMS+nnlvm8Put9BL4M6IXtDMATMjAicoan0DRr1rXVYq+iKRnAWJBPneqamsTNySRKLW5kga5ZLKrdJ1UbyG6oxJOqW85mOtE4TjuYtOI0ajivjMWO5geDPEhkSNHLcQH00cms4e7vPOLQabud/33xD/559dbNl720rVcGhhPqrXjDAUlmctDXPnU9bVBrwee5WunfWXRM5uXBSG7dUGna17wpAeDl9LolHI2LLxC5/aiTT15tlXo1TcmA5NhYRzgWlVg0CnUNNxDA8fMB1N/2GkxlCBtdBZi72gcV++02wCYe82E0M5WheipwPZmVGp87HBzKJEg/r5fIIHCFNshXH7vuE0cfnahWtUf04mOPxV96du0tr/T1BTf19cPXL0ooGoGxhG0BQAEuJqYarJLNCG7pdpowpLbU70z66b5ypPAxKNeo0rF25jIShPSHIhEuhS+1zppzWbXYlPQqBvzqxz/+SP/qVVfzobh6hvSTVW9XI0KoEC5+1X/cVoGubSBJ+VCzrxmBMnU/v7OAUKbKO8v15IhzI+rmPTnnw2Oq0bLDGOv458XXa9Zp0F+vu/7G9YMDB6wA+KPpcYkEfDoCuCyE4Lv00zgWTQgTiKBS+uma8lyt9Nt95NaWfjLCtiMOMhkjoD4UkvbZneIMBf/0H6ef9KwW2gntwICbly59V9/qNX8uDyVaCTZBo+QycOKsZT6bhn3IQefBN4Y020EMn1TZndgh2Uxgw3WlMj8RgFsisStsNK/TN+OegTwV6H5+LIPkhBpyR6K/O/LEE6f1xaorjvv65Zt6+z6xrG+LJIeS6pt7gz4Aa31bTgGz2Y922sT22KsjCCxBZrKBt4nnbOn3045A4vlMWoBPFOU6mpslGG8oNc2afXG1yE5pBwaMbt38KU8+5+R7sHzNU2e28V8zYUSkRkYlPToquWQSzMiq8SnRqHJUgEFsFF98VsZUmaBGmf+g+9Wvh+rhpBvrZNc5rcG8fKcLN0Gky6GMzpcNKboMs+GAWdOS/qtPOunstb1bT1+2rVuG+4cgPEWJRMKSSVNaHQpYreqxiSCzP3RNa6VfJbuaeI5blqeaIiPITJzkCxcSAUPiIb+0zZsj7lD0ts+feupz1ep3ShMtQeVGbmjkY1kYKLrj/N5OgZINMHMFgA23zcSNipBOfl6Mr2IOjY5JJjnOaQspFPMQcjACqVgmYyDXsBl8GM2lJrbvz/eyKE/sDCHnvXjMFQPwNXAM1QBV5AajXN7A418659zncWGP6KqTT/76ho2bL32ye7NsGuyFK2NKJBbTmU7q9CDcT4JmE9tgE/fHxsasibQq+DajtK3VvDzHusisgD+oxxQudzorEdiKGW0zxBerSzUecND5WmA3NNGa2a0N7xldt/F75niKoYROBeTKBclkc1LXNlPmf+CD8s5/+4gccMThMvt9B0vzAfPQGbd0b+jCMB+CBPNhNYYmG6rSbKkv1f+8BkNOBuo6Hyh37DKLjhDGAG5c52NGfshJl5MzRgiF771vxQt/Zvt2R1efevpXNm/ouuHhvq2yYVufVNIZCcXjChylOgS9TMmmBE8mnqPeJ7A28FPl5TEZyOiYAVYoGMBJDxickTjUTzuYvfCgt0uoc+Z3jzv7zD36gNPECBhd3/UZF4YRWowbwcLjUrlYlgVHfEA+dMbJsuhfj5ABMGTlxvXS198v0YZmee/nPisHfPIjMgwjNwBXbxSuXhFeQAWjgK9zWmqJ4NM/4AvUGL70OSlRuCenGMgvF0YZvSsTneIVjhGddXU5racgu6GrTzvt62u71v7qsZ7N0tXdJzkAHgQYhI86nWpnqoCLxHM0pgSVeWzpt/PWlqE3xLzsVyDoVyehAvXrRtlGtyGz9ttPjHjdy4ee96Ol1SK7JWUAP7CRT4x8vJBLq4/uhArIFzMy913vkQ8e+XmoopI8dt8D8txTT8n6da/ICy8+J2vWruYXAWT/dy6WcGuzDGDkJIdhI4aHMGrGobLyahvoQVH6YQFUBVG96IeOyARggF29H3qKaNdyTfWRJNoBBoyzfbuiG844+0urN3Rdt2zLVnmlewB2MAn3OaCjk1LNqQYyoBZIm3iOYFL1MB9tF8G31ZRdhkyxVE1Fv1/Hz1t6XVycDHWUHZNmANFS3yh1Mzsk1N72nQOrjxv3hJQBz/78Z4eU89n5RVREb4Qfq+Na9kWHHgJQMOTGkjICfd9Q1yCtjS3S1NSin4B0UceAOVzLMw4dn1EjlodNyGBYWt5SBcOaMk1bwICuAF3Pd6aIMfoLt9OECgJD+EhSwa8aPDDD6TTGtJU7oaUnnPbtZ19ZeeNjm9bLum5EurBFjF8MqLLxVFJB5ZSzrcsnE4Hlx18p2SRu7X2bbPD5Bihnh/loNgi/XwWmAAMPY9wIVdQ5d74E4vX/ffz3vjflCyA7I23ZwJZtn6sAMBLnXgCHGAjZPbGwfp4rFonK/P0XSEtLqzS1tsgBByyUhfMW6SLdnpfXyGAPv/vpkhQkvkAPiBIPFcQpWn09FI3lq/0lMMP2lmjc6UERfDKIgZdN4ItKl8vnm3KFW3n1YPinxx1347MbVv3k4fUAn/fP8ftyYQiFS5IYjfzI31QeDwFlIpP57VG2xQ60KP21xHwkXud6fgpU0B+SiuGVHHxzN5jc5DCkrb1NfI2NyZnveMd3tMA0yIkGeLPjox81EaCoPmDXIY0F+Mzb1rwiEoQ+9HlkwQH7y6K3v00WHXigtM+cKd54WLb1bJFn7rlPylzRhsbn0GC+TkEJV7B1HQyA5nnsmxgh0EuqlvQ8mMK3GWkL6P1Y3SUDnAjYcOz3DlVPTdCfL75i8Q8uOPWhp9av+dK9a1+R7t6EuMDoSH1Yr1PtUJcHJnk8NhFoMoX5qM9t1WMbXaZaYh1kRJYLk71QPRBMfVqH8nEIUGN9VDo7Z0ugrencTx57bFe12B6T88af/OT9rrFUB6cJGHB5oAI4qcq3xx65405Z+eCj6KCJRlsrBthQSvGWl1fKg7fcKuOjCTEwzB1QWRUEPEU01mIAX7DgigeqtJLkID00zPrdNV7DVkcaTSWk1qRFQ+dphPm5yrzhSsZnznyk2k6lS886/ax7nnjgkWWrXln88NqNMjY4LHxgF4rHwOySGlwCOtndrCUCzHy2cSb4ZBjz14Jvqx4m9XqwDfEJGm0T3PJYKiMt/oDMmTVbpD7++CkXXHRVtei0yHXo7Nnnl4YG38bHgoYPN4A088mOC75+cnxcnnjwYendtEm6N2+WPDg+2NMrLz36qDz3wIMyCs+H311OYfizI2E00AdG0eiyLwy8+OEOTmvz8SZNBtdLMhag1+9GniB0K79aaE1PwD31QD0EAmORmZ1fOPH739cw/vZLLjt4XkvjTS+vXXvC4+vXe9b29EkR7nEwEtBvSOcRZHGEBeGZ2Dp/siSTeI5g8pMBNvgUKlsF1RKPeZ4BF33+CN/xgmHnCj1nakw6HG6Z3T5TGmbPSccXzfvM4vce0lctOi1yffzwwz8jqfG38QcPAvUNENgyboioEQ3wQzJ6Ewl5+rlnZe2KlyUD3VqBi9e7cZ2UYGwp6Wkc84Oo/OZCGJ0KBfxoqPWtZmpffrYmB2lnMMQJCEaj+tVBMIXf7OFHjEpIZRckEVGZ4Y0M1R+46F9Pvuiih5//3Z8692uIXfTEimeWPL3ulTnPIeYYGhlH/Q7V9xyVVCVscygUBLOtbznsCnx6PASf9yfAZADLTCaeN9FulmHd/LEILiBwpcalpViSGY1xmbtwoQRndHz7G/953t3VYtMm19HHHl1ymfL5cRgk6FxxM7gAM8qQaj6oa0AwkwaYA2PD+nXZEBpdAugleEx0JYsmY4cyJNkJhnmgorzoIBqMDhSgY2lVnPTB0Umd1MMoIHM5GiLwJvi9NZ0d5Tk39kOhv5164Tm/dSaS5/7l8XuvW7521WHPvNLl3Ap1w2A5FgyJL+hDdJ6DXs4pUHaQZQNJsG0DSuIxVQ6Nri35BL+2TC3xGsvbKo2jitMnJkZDHJ7WbNyvc+F88ba13nPmz39xWrXYayJoiYrrVxdeeEN+sP+4FKSDzzQ9Jafk4J7lx0eginBjBE/PrlklPWMpmTV7jkTAKJ1mACJmPitlAA3FAjA8YEJAPRAvOsb5EZ33AQP4XU6qDRNeFdW+F51vQ7Bkcu7H5dOPKNEIrSqYwwOm6UgM9cU3DwxKLo2RAzXnC8ArQ730rPhNacJLcJh2pu8JIsEn8ASTQNJ+7Qx8e1SwzWmMdgpNJBpBPkT4aL8fmHR63TJvzhxpmLtgsPOQQxYf9ZWvbK0Wf000MVavv+j8awv9ieNz42knvyTCJ1MZTroNJjS4GkqOyzaMinATAg50hNep42lU+SE8NF/XxLgBFjvnxYjwwLASAH5CAFk1L1URh3UAHWmJ1Wn0y+kHMpAvYdz1Spe81NcL+1DRN1649Bxuvb76n0Nwx1Hkc3sVeP0qVxXEWokn8b6UdPr59HYo+Tb4HDWTmcbyPMdEZtFNjsL9rkBNMlYxIJwdYMzcljbpWHigRObO//TJPzr3df8g0IQIzPvIod9NFwpJv49reAmnUwLhqKQh9eNDGAnQ941c2wJD5KPxAu8MdNIN6fDyu8pQPXwln4CwoybyUP2Q6GrS2+F1AhGgTgUIyKzGl8TnY1mzIuNQaREwmJ+S9AbgcZWLkMa0/oIG84SDYQmF+QM+NctlQATc3jLRBiVgv+wpY7aJwFM4pgKfdZE5nDdi3kAkZH16DHapDKPdijzt8XqZiYDL09D4070BPmmiBy/ceOd7uzduiI5AYqjD6aVwCLKjjGILkF4P1JHfzck0GCNIA58C8fv6fBznhaS40WB+sQrZdBoij47YTKCE82YGdL4HeQkCJ+IY/SqBkcOZomRKMN4om8YoSSMWIYAEJgzQyRSCybI20LVEEAkmJXhwcFCvc6TQmBJ8psllbMm3wSfjeC8uMaEmqKRTMgNasxVeENWvM17/4FmX//z71eKvmyYYkOkb/Jy/UHBs2rBOEtC9frh3ZTYMXk0eRpZfFeSyQHogBJqfACBDOG1MUKl++HlI/XYPrvGDdtT7Oehszq7qihPoeN6QD+f1xsoAAInrnLDYks5IHiMnj1FgoDzBJhh0AblPkFh3LYg2I5jIrOHhYVU7tm2gNHPfBr+2bK3kU00xBe1ZU4pMJiexYlraMGJnds4VV1PTpvZ3Lz4GdVDn7hWaYIARCob55VdYTtm4apX0b+uB4QuIOxKW+jbovRkzJB4IiR+hN/U8P73FCS9u9ROPGA0EHX91OoDJ4NMtGGt+3h04qLhz6pkP3oE3iN4K1A+kfxCRZnd2FKPDJ7FoXH/1gvNNBJ7gESgtUQWQW55jooTTvaTUc5+BGPU/yWbEZMaReJ5152DUc3ClQ+GA+DGaKRIleDxRnJ/pD0lbZ5tEWpszjbPnH/mFr32tp1p8r9CEMjzu+K+VS4XCfyQR5NDd6u3ZBuNnSEt7uxo7DxrvI/BoHNWMnahuaAv0mPv2NZ5DciPRWHOSjcs2XIiK+VENDxhp+mAHMJo4dfh8f58MceratOIPLhm3nhtsl3AbRJsZlHh6OJR47ttgkwnqCFTthF2eRKnnfq3aYVn6+kG+psRXn4pZqYMXNAOeV2dbqzTP7BRvR/Nxp5x/wQ4rm/cGTTDgjr/8ZfXRR3/R76k4D+kH+HQve7A1YJRbOjp0ehk90wfnHuhoLzrCbzRQmj0QZ269OPZConkNlgMJEoh++8EQLzrNF+wMzn5ivwKAKgDf7fLKi4gxViPAMeD1lAGGEyqNdqUWdCZKNXW0HVAxETyCzcTrBLhWXdnlSbxGskeUrfMZR/jhRBSgPjl/VZ9MSXvAK53NzdI2e5YYLc3nnH3p5a9pNfbuaAd34M6///3+o445Ogj9/v7B7m6pFAvS190jLkSYLZ2daGxBHBiW/DYDuqXBFOeP9E1A7qMOTdXzmqrn+MiRN+NiqzIA4HJzFyR0E4B/bnBIJ984EcxVxWNjfOYMtQCmUz3QqHL6gNJu+/QEmxJO4AksjwmsPa/DROBt0Ek8Zn4SmcgyYXh2XB/E+agS1FA0nZRZUIOtrc0yY848cTQ0Xvbtq5acq4XeANrRHwPdde+9933l2GMb3E7nuweUCUXpgz1Ay6Vtv/2kCEOJMJirfaUMKaP3whV0nE6m0Waq4BzfeNF9JKCBfU43QMKg1oqoy0Cne9JZ+cdAr+QBDFUVuQhNJeOIOZgooXaipJIIMkEkwATQ9u0JPLc28LVEJvAayzI/GUgbFQqHxEAgSBCKAL8+lVHw62Y0SieCrWDbjPO+eeWVe83jmYpexQDSH//2t0fXr1r9JZ/LFenrxQgA4LQJ/ARYY32Dfn28DAmGcdBXRvXXTKuJP3YDS6rn6DnpeebTz8GDYbjGBybr4d49muiVHOd/oKIIPDgHYPhiA7+DYj0aJHAE3FYpJIJIsiWeWxv4yeDz2L5OL4eTa6yPsYgX7aCpLuTT0jiek2aonea2BpnVOU9cLc2Xnn3FlT+wannjaMfW1tDNVy39oWNs9LyVT/9DVi1fDsOcFxOS3dG5nwTRaa7x5+DmX0oY97Xv+KOjvlozVRMPYfo0H79kNQxjuxrRNV/KpvdUcXL2VJWalqF6oMohYDagLEsG2FJuA24zpZaYl9eYh/k5UjiKNMCCZ0djrY+mYbcc6ZzEIf0dONfU2igzMMp9dS1XnX3d1a9rjmdPaacMuPfee9s2Ln96jSefC699/gVZ/fRynd/PASx0HcBDncDoFtE5zveXkNghPqywFmoRGGxxBzLEUXJICtfG4Cr5G5s0ei5XTJ1PorfkcnMpN0YIMlPd6CoFHQnQclVDOjnVkgpBFXiCzsT7c+qDv8LEVd4En+d1LRLsmCuVlAa4yW0IPFvaWqSxvUMiTW0XnL70ijdM50+mnTKAdPM11xyVGx651QmdueHFl8CEJ/U3VlxwIRnG8kkXf3+FjFDQkXTZIhPKc0siEzjUmXK4Jb/bSZeVP6jggdtZBGNGwIhciFMQcV0RrbOdtDVq8JEXI4TmvBZ3G3ASt7bEc5/Pa/mCCeeh+CTL54V6pAMA8SkWMuLNjMsMqL9meEANHa1S39gs/qbmc7559dWXaIVvEtV0Z2r67dJrvloYHfmlwFtZ//JLshIjgdMMRIJga8IosCVQVzugnEJv4a/EWMAmAsTnAvpmDPb5sgQN9iZIfQKc8QIUPsyP+kKS5/NlfcBjjS67TqsOy820E+/P0WOiLFtBXe/hs22qOdyqwLduoN5iiHCb4AxE6yPS0dohwUh9yd/eeMq3rly602XkbxTtlgGkG69ZckJpaOTa/HBStq5fK6uf+od2lGBzBFDHWl/EBUjsOraWPq8Chl0Oe8owzLGqME7CcQVxI39kmRNvdB/LLnluoEeeXveKxGDk3zV7voz6PfJiTz+GD2rmVEZNcEbSe+Ia9TsTzxN4dzWQgxuGe/N3JIsSAIObygWJIU5o5gqPGS3iDEdGGmbOPfakn12yRwvA9jbtEQNIt11//andK1deKYgSswND8sqzz4EBBB7YVLc2A8gYB9SRhb5FPK+EDYFpaW7S3/7lL5fqAyCc1wk+eEwvrtsgwyMJedfChZKG5/W3dWuh+hhNW/fSJS68YZXs0UD1w63FHLYFsWPeFIOfCoDANMDrCUeh75sbpb2uUQqh8PMN++9/3InnnrtCK3oLaI8ZQPrFD7/3rZFtve/rbJ+ZHVqz+qjyOFcSA2yAwRHAjnPoExvdr4JEhgiMNEnHBhjAeaYslH0umxG3XkIgBIT5gaaCCV+dS0AiYV2d98imLunGsQdemILLaqmOsGuNNJLeVC/RFtEGVOByhhAp14EV9RhhseYGaYEDEAjGROLhG9994slnfOid79zl2qM3mqbFgFq64tTTf54fGvlnB59WULMAwXKpkgMEygn+AUhOMIaYB4B5EMAQHxdURj5Y33AzvKLFhd7+LwhiAma3SVUHivEzxZwVfQKB4NrxpHgQyCngyAutr42nXVC7g5p1SSSfZ/PRKfajAD4KVVYfr5O6liaph8qrGL5hY0bLOd+58sppv3PwRtBrZsB0CaOBTCIDaApMsIgaQn5+xhkXFLZu/UEBETbthE0VJ4YFXFk+b3i6p1eeQVTOH1aw+FqVdKgjrsCA8tenVh7sB7EfRrfCPkh8LCL1TfUSDUfF4w1IJRi6Z/ZB7zzjqG+euta6y1tPbxoDdkZgjHHx8V/5q2to5EP88cztIwHAMjKGV5RIpWXF+i4ZzWd13ZEDLjA1PB/y6OQgygRRIghm+YNBidTFYNhjEvPB7/d6JOM2uuMtzT8+84ol11l17zv0ljOAxJ8+XHf3//zZMZo8OFVI6/wIpbykqqiki6IqJmIFBE5jiEkK1V8zZeP5Oy38mVk+Sg3weQW2HqdXHB6H5FyOpC8av6HzPYf/7AvHfwGu1L5H+wQDSHfccV/9xr/+8deO4eGPZ8CEInSMC5JOl5WkgTVsAJusiwHgepLUKHMuCf84j+RExJtzOcf80cgtHQcedPnRZ5yxTjPuo7TPMMCmy08785RUYvDbRj7bUYbnw/VHXH1NgDkBok2mG0rQkfgaLZ/M8ZUql8e7wheL3Nb0joW/P/brp3VZNe7btM8xgPTUfffVP3n33cekx8b+vZTJHWSUyjEoJJV8Gl/9VVMG44Z7oOR3rzHCgUfjDS1/+8b55z+FEbHXnte+GbRPMqCWbr/+5va+davm5XOpduidWMkFYS87+tyRSN+8t799w2t5e/5/6X+pSiL/DwfcuNDZbklNAAAAAElFTkSuQmCC",
-    # Icon next to "EC002NG - RAPID S NG Coupling"
-    "coupling_2": "iVBORw0KGgoAAAANSUhEUgAAAZAAAAGQCAYAAACAvzbMAAAq9HpUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHjarZxpkl23kYX/YxW9BMwJLAdjRO+gl9/fwauiREq0FWGbFqv46g33IjPPkEiUO//3v9f9D//rrXqXi7Xaa/X8L/fc4+Cb5j//G+/v4PP7+/2vf38Xfn7c/fhB5Gvia/r8oNXP1/D9+NcLvr+GwXflT2/U1tcP5s8/6PnzNbZf3ih+viRdkb7f31f09UYpfn4Qvt5gfG7L197sz7cwz+fr1+s/y8B/Tn/l9vNl/+XfxurtwuekGE8KyfN3TPFzAUn/ZZcG3zT+Dsl4YkiJ72Oq7/HvW2JB/m6d/J+uyv0aFf+bqPjfBCXVz+OOB35ezPrj698+Hsovj3+9oXtL/KdPTuvHJ//0eI6x/Ho73//du5u793zubuTKktavm/q+lfcdT5y8VXovq/wx/it8b+9P509zZO8i5NsvP/mzQg+RsNyQww4j3HDe1xUWl5jjiYQkxrhieo81QtTjSt4Rp6w/4UZLPW0iGNMivIlH449rCe9z+/u4FRofvAPPjIE3C0oFp7/+G39++0b3KuVD8O3HWnFdUUnIZShy+ptnEZBwv/OovAX+/vPr/xTXRATLW+bGDQ4/P28xS/jKLeVReoFOPLHw9VNrwfbXG7BEfHbhYkIiAr6GVEIN3mK0EFjHRnwGb9QolDgJQSglbq4y5pQqwWlRn81rLLznxhI/D4NZBKJQRkZoehrEKgNs5I/lRg6NkkoupdRipZVeRk0111JrtSrwG5YsW7FqZs26jZZabqXVZq251tvosSfAsfTarbfe+xh86OCdB68ePGGMGWeaeZZZp802+xyL9Fl5lVWXreZWX2PHnTY4seu23Xbf44RDKp18yqnHTjv9jEuq3XTzLbdeu+32O35ELbhPWP/y559HLXxHLb5I6Yn2I2q81Oz7LYLgpChmRCzmQMRNESCho2LmW8g5OoVOMfM9UhUlcpVFwdlBESOC+YRYbvgRuz8i91PcXM7/Udzid+ScQvffiJxT6H4Tub/G7W+itsU2yyf3IqQy1KL6RPnxhNNGbEOk9o+/uh8PjMWFtLLPMGM5JstzY1n53K4KqqM0OHB1LhPyDIW7vWXvaMeHOq7jpuMds47NonbFuJzUJkwWPbfOWsBKe5KOvOq0e329K2xittpsfZ5dRl+NPBq3cwlnVBLq2h5jpL5s9JQLS2nr9gPseK50n9g2QWa9Qm3b+NRTJulJ0W1XemNdio1bW7ozrVAtREI5Fwibaxt78Zifk0hauPsaXNYX7+1nrHPnm4Hj7QTNeiBuVil6okuWCCJXntOiri3y31npQDyHVATYxyop7N2t1Fv8qi1sqv/mur2teE8A1XMZQZd+Q2qHtIksdmh3zglb3XV9miVzW9xOHnfudnnf6Ycr8/SZV+9UBxGaXA45/S582A7zEq+zyNCVYr9oiThJZK6Fu+ANuS9Wc+7qIhE8Y40SGtVwfGMNbIbARxHUAMFtojTs6g7MyriHZB0s4U4n1nL3mpRZdqOT6mF11W2Kc93QyRVvxuJ7SocbjXWHcymFdALZT1nO3A/By5OYwJfk8nSEggBSFTfHtH0fPDXbGiEX/g/2j5e+//ar+xdPUK6ffm2Ovsk+g9K5EjKf4FL65EYh8Il89Ic8MnEh6uocfsadm7IWps6kW7LV456TLD02aj5w11BNLR4gIbjj5k8GhCtrZIjjPnoGzyK1fFMf1EfahL1Tym21W0a5rSIfOy861vpWtOrpZDt8toEKF0G1siaLUQCstliqPP0RlBD9PuIlVpmgjd38RJkcLtIjQ0JchJOLiIkkM2fcczsICzAaJWX91N5Ju5Rtlhs9JWYXQEyROjlptVpyG7mceYBGdKr5fflQhwRqpnpGB13fVmIZbeTTeygz39SQ7vAyn3q4H08uQhmLIGwTLHAfN3eg20ECoPW5691ZTW1v0hg0n/O2TF34kUPdUIASCf0FkuYBlp51Ai9dNaVGEbmJlEMwFNKYt1lcTb38gJvfpPTs5C8MdgxcJTvv6LeFmQnvJQ6lDevjEJvr9uoJWCbrMTfjzBVsnA3QFYIwz7oHuVhvBaygJr+uDX9UTsY/a50sZpsjJOFRXNxOYK0E/WT9tsmKExkWeqS5ZiWZTgEv2hkSNjMILKxxk8HSoA5WcaPMyIsKKAMs1ERVUvl1BApOyXoAw4MEBWrPRHbmxnvO1QZLc6hJrrKREVQ/UL6AuRKbLaCF7Dpjwt7Q7LSmVeJOM9VKPrNEEeA/XDCYxif768lWT+G4uniPuSjcc0gQNAprR2GBJVpVyzxsJRTwCyqzE+cZ0EPmvSm6MjI6AAqdrp7aCojGosDiJa6VYflliB7xd5z92HxIIAv2+6/uNz+wzOpk5eqJ8RLotSjIuonQnsiGzk0g9FuxsO3wqQ6JLpnBOkMKV9+V0zbQnbgHxQYVM2+KedfFkyj1O0l809td48rBAgJxwSNrWWxAmAb3DvJGUnWIgKjq0jEMI54sjoWLpgerwSePhdkirZI26VeXO4CxQc+9Lqrk3AwtRGoHJgEh9r1IG/BD0d9f9Qh2nyDAiCirWeA2dI8j2c7KUcgVM7AOScK18k+XkpoqgAljBRgN9kK46INZGupO1LWmrw2YvK7v2Ba8glwDI1F2JHmSezDZz5vQOx2uSJXqA+gqAgc9PgAfeVUYA53GG3bXYCoflc3NuAKuAmTeyHRYAFCBvxtIFykwIUgmyRKrBVcOy4HFmN1qblQ/GBzJThIN5d/gTLDMS59lApzq89u2+YrIAhwCgCp8XAAz7JUS8pQ6rtstgAVtsHZM1BALRJKUtgf1SQkFAAIkh3TnRQdooTyK9dQLHC1AHrobAx1SHBhiJP6+wUShHbVUA0JJ4Abv8PmqTFCBlSthjLIzcqtUlAphRkXOGC7v5FgOJE4BqikseLybqPvOVSjirQpV1AFNMo232JgoK/Kb2xCqcVd/AeGeHJU8VVlgF+mYEolncl6zdHmosgbRVBJuKKSSlD4ia613hDEJmqPfMXRExAIbUVSIY9h/TuCNG6DIOqp5d4ldsiqTrggEU6Fk1HM0aA0DlwUdvDGV6aiImCVBOm/HZ2wsd5gWSH/W9LAipFg8u5IGCK2hSC1VdIXqLnJiAdPrdNefzvRx7L1y5j4SGbBgcJDsIFHBGwHoov4pUjQ71AF2IkAOhqQgFkE5rtvhgfm0gRYLRXIGUYNfiZAR4UQR8lCUloHmS4a0plJ3z90XC3XgvoXI4F/uaR1430jhk0lIPBQqlmxNgOgtKA2uLwALyMpK1mUyZ/X5pek8TM29VnMguhAFXoTWI/Yn2SulDDdHkiVQu3IVyG8qAPpnSVAIkPgcsBHPhY7DhWkLoqKUnifJDrEOavyJgYaQQXjcV4cIZthJANYoDXw2mfDYpk04Ys513CT7ksQ/3JKkX7mORxOsKaX2bzzIREEetMtKjjgAN0UedhdSGPzJj6gAzRjJ8rJZiYouhJiWmjx8AGhq+jxgjVW8LZ3lijARjB8CoiZegnijlFblbXnPBO+CjLAh0gBmIMnJHVCu+oZFjA2riz116lTdBSzXKr8GNkIPeMrSPJyxV1UayTxWIoc2QOqA03owozKHDAoodb3LY3mIMZm/BiJh8shOA52UOST5gEAuCHapjFolS3XBu55DlI+QCc3CFTiJH/KuILVuDDHY7ZskhjfjrAXxlBAQD4Y6aVwxcBhDtZcoTzjPTkG5j3UdEi2RZUhWo0g6+EFtViFZlXntShMUQUAQlTG5mHtg/Ybj6n1vlg8XcBBgDjUReiLVCgQI8tR0Edi9HQUqZuNWF0tj8TTUAlw/RUI2Nx4Psxwr+uJC7u4gzzC+iGIWCbvDh2LzQVy5GYq1AEyE8koWpMAL8Txbip5KQZXhOisaheoP6BjM/SImzUJdsg8kFqrtoKNYDlCyxSRDdLAmmCPDfKFTA8VC0aKtiUkcjvi214LFh5PIEi/QNMADWQTwBQ5EGO4JnUE2VDsKOLQEfsItGXhXLUMmDsZPW1eaQ6DMKVVuEoQp2CwUGwi/pWRxeCRYgTbB6YMj5JYiOBh580nOXac6xgSwBkpaoAwHQaFQ4+UO+WfxHJoa36XiBTISap8a4vrnmE02dwHLLlyMesa94MYTz+bTpNaXXSJFQHHfCduxABV7fIvWH1wkgQmDUkOR+kEmO0wdgs+20IraMPw2RoCKBV9PiqTOQtZCohdYQeyQDySMyk5X6Ilc6hT8dEjFToahXcIuAcUJVaMFG0u61eGOPtkAjrjGJyAr+i3DfamEiwiF+gPSbASHwtiB9YWnCiWCRFqLbC5qGhYQtyDjrZbRcgX40kT/Iy6B0xYoDOQZRoPrXa4CQnNypyQ7CgHO6hVYB1uwWI/shP5YQ5RPVpbB2WQhbKWGwVKLgizvw6UzPNhCrvD5kNF45h+yWWh8ZDp+9CdIRDCXrd4aDnyrkW15TrAGyiYlFA9gjTVCyijtyKMNRYFxxg1wOdA54Ek1GLiJ5oq1Ycg8YIwZqMmCQ3nCxeQM/L+l00jdBGWrd3NCn1gW3tYoJExUlXgA5wrgghIB4nktQeAWXfQmxB8UjHVeQln2dVBLe7JK8H9U/xH4KlQxyo0l2rAyAMCdsEyHfJNlcRVLg2SC06vCp9ggwciDXWMhAE1ZNMnJCT2OBpwoplR9ygiCsRPqjzeqbqYxgQbAkAsSOJGSuIrLTW5kHu9OboDyC6XGdSOWiW3oOHcWTk0qkGCC8Y68U56hYOBUsJMcQaf2agA0ybSjtJkMKbAekpfTNVkeynBDgQP3f9FqAXMcCO7yzxWhlMjmg3FAblOQsK5noeAcz/Vb50V5z1IENDg7qES0P6n35CIet6P8UfL4KUp0HCQhfgnxi39CHi/sMSmk5iNPBoRBr96fVAb0fFeLfFSHeVkAPzzJk7kfhB/OBoiitDHoZVTkozBoAxeIpUuVk/zGG6HrF9QFdWZ4jctfeCORF1Vf1RSFRChIUcQtBCEhR9XNB5nFjTLahI/cHwnb3UhtCRnnxVvwEVUCvwxK2cCXBieCrGmhSsIGK9RzBHsQqKI8XTD30SMghqs8ZIIDUS84xdXx80sZdzkn8IiE5qZhlVxJHcAGsA2gE5mb0GIIH2QspUSqs7bYdS2i8aGAPpXcSdxGErMOoja4g8TRlZFrWAtuZ2KM4FusGxyDSkoNF49dn5KaDaE+Dlfgi9ixInKAtU2VwjiXRQo1y/WdRTwS0AjMgfOJD+kBi856uCRrJQ2+cAQeOVy1Lgr3VgS1pAFiOyx3Zd2LEUjJw4qfvrFnIuSB/eJKk7j3sJD4AswiDwZFyNuBRi18GB1WQm6RnBvnZH6jGOAcUgkyAnvIUIfUjaK1QVHJVkJVKCzSNQATYH1YenIj4mpeguSkCQtFLkS94PqJ/kdIuyEBHKBD1RpWiXoC8uZ5phdS8SC4GlR6L5yCL5voIPool2gTg0sxGSVDZif4NZG+npDxSYh87bM1lD2c0YY+gbdH33rYkzI+yAVrWPa2QYHG2uKBuhpR0hRehAet4UraFcZix8UR+yKe4eQyAfAEsDdgD4UzO8ZgCuKxMVIPDoP33XhE25wAgUNDS5A9pMt9TwPJgJme1HbXFtXOwNQFDeYdXv0pqj3DtFG6EUiuyBgwQNQNu44ZgBxpwWgsSJORoCaHGm3YnfV6l55Uw/hmLKwbeHjPugRy+MjebsRmRY/MqXqSpIVo1VrHj+EIhld7kHgrSigunBFVlc3NDbkOZCP1iMoYqGhsfCvAPQ4N5MFReCr4PH+jnr84f5FwSsysrM3aNXKSu0hQ7S2UM5G4XktViXaXPA1nqtIklNfSxgCpGuV18YmIeplnjIigFqN3uEXYy9RMRRsYGCOewBg2mVSYF1+EapAOfLY1q6yCSBA7FNQUSM1RfwjgDsKq114GqmZ3+Q3Eu9qXMs9KZVQjq8BqSSGQZiTNJ7uhwLr6cdLi6EqUzQRotvZKZOmKWq5kV/5kBrJ4ZErLqohOm9pAPaKqw0gYS97ToQ5TV1sUZIbH44aLJwneZY2UC+qMJGxLtikon2Qtflj9BrImkmFAE0Xmetz1dbl6hCEqKk9yC6iHZbXrQN1EaIpVRdGAwFSikHpS1rGhlHiZZSLCFeEmkNLyF+SWXOkKgLDxFHgQLwg8kO3KfxCzvD6cR91h9sZMhMVzZ8AIcWjyklugPwT4glDlAgsQI9StLTK8HZKotBMoD7B4HV9f9zwjslCysYJHBaImi9rKmImiTjCWLqgZg2Hiom9+O0BejTHMugHIO3dpvCaqoGqB2uq27D8LdyVINYEh/mnqZczAt6i9HJ6AxIricaAUGDOgjEkiMB35IhjLw2kAg6raAG0Tf5m2KiP6parRGtaozxiEsU3GsRtQTQXNiayjosXX+KB5HLStHZUIbr1OHwgWc1FvjZwkCdE6fU3qNg9t31QvN3SQ9aSBepZD20TaqEN3UwjEAnGjfQJwQn3t5iGKXNvGNYBOTZaJovXql8KOWBcVESkhctrpNjek4aWGUM54Rrhgqd0MExMfvge5SAYleSKppMTQb0C3rdC29gaGESUbDud4wCskI8qOeqdQBabk0tlPJ5No6JJR3z+xJgjvUVR6yLAq5cWKATPuFQsCTkIgIMFyVu9sz6dsI2uFsuKm5muov7ES/OXaiKZ5miIkOkQSOFTK8OpvaHMc10/iFe50mDbk8HQaiWBRJa+064J7LVLogCQ+v7yO99C0ksv4TImu9HbVgJdLLjU1/HBDQc6ampXHv6i4StayADA2oKysAEGBSmRedHAvaNPVcWCRlzqFA+RCKxiGoPuAkIIvtrqfOBMeyej6iDIDRxC+IIh2LBJilCxLADy01aj+I4NAhLp4lBvt2t89yF7uk7yesbNwxeOSDsId1wpUodSTu8QTUMQOU3+gFZx30VNw6QRvg9rZyABk6CRIsyNUq4HqkseUFP/e2i3p1y3x5QHrgzZ7pIS3uAuFttScmcY17rak98hmdeEyTgeuBk205fDNru7zTdp4TPQn+bSQqbAlRS1xqV0GgY72wW6fdsjarY/o5pEAK5FG1F1YDiT24yprAsivTUpIachAe21GoZoSjnYt7FDjs/xQk2PLTKMS4SajZrACmOMld4JmkV0EEbR5AXGDIVt+e4FKFZcfke9o/SlBgslsDbGeOi7mCTivrcPJ9RrC9ipViuaANFCnZpTiIMZQypLN9rbnEeQLikDXXWTf7g8IiI8L2gqCVUiiwCoiSI8FrTHJ3rhf7bMhj5JRKXu90s/a4a8CZvkID4CTHq4vtXlP8Dh9SWSEO5YMiwmqU2QYa3IQBMTy1wXLaztX2+QSKVLy5SOFTMMVPZEDLMWNFVyt3AOOmqvqgRujJsOtEfo0kI46AUQj6wOt6JYoyP6ar47E6mT5kVtt6oLCyfj8HNRmgUy0YV8oHe193AFFn1wxs8QU7jbImfrEunlHvqKAEjVBwVM4alL3TcFqyQ2h3FH3FO3IWpZEiCN3BQYcgZduD3xoa7vZqI34Np94H7gut+TPCMAZCzOkmkAfhBKX/WyExvuy0NrjtqIGaGA4tcYigZcHRerjRUFfS1mDDqga9LiGJVjea2jXu+VfLqys9gsqiEoB2bQlEeXXNt8FtRjh7hQTQBhVdWAYsAWFUJjahV5YfApJLWJEBHeAxvnTPpr7sbFWNrQftT2piZz2xl3Afw0PWJBhnbBohw+0UwTcTrX7qdLTtGW8nVAMgdmieqcZUKjUZNQ2m5Q7mKHhD0oFFt93aAIhQmAIY64PN2gFRyLawEFyY6A3/0dP40VY+pul1IgzUAddvWEDKWQ5AuwAXhdvS07FXU7pkA5p6ygetFTC/2LyAHwSZpahXWG0VdxIjSyvODXnpGLV5A+1j6o48s3BKz+QVm6KysByxF70r15h/JJeQu5cMK8QiUQGuCZzjhVuqKW5g4Zqhjrh6h+hsxMUGFaGrVM/b7qAxwH0CKcTKMTDQOcibLXNcLWBjuRQfz+DpyAMGhGZvRxZfJLkM1HSjKRENwAF3ekWe2cll4lbB1AFsh9kYzMhQbnqFPNBk/c0J1sooeVZNggwqf0ONzTWSX08fAY4LpcxpXPvySOpIWjqdu6WdcmRAh7OVFdYR8SN1NFpEZDVDuqFk8hvTdKWrO5B07AEGQvbIx6DnB0OQF0N9Nh0SVNipi181Cy34iNraFQKzqEvHPGHTickC8dTq2pTza4N2P2VyX2qRDYyQ03JgS16w1D5QhAD0Q6IT80UgV4a99GUIQC0nop9xiYC4rh41DnZ694m3pB8SnAJPh4npqcVzYjI8qPeJndSq7a5v7YzN0LtqIW1SeSp7unBHKsdPgw/a2IKtf7UUOofD+EfMpHzJPv8VtntbzZa3MG8Hkkh1FjfynO+7QENoRkb1BYxPFdTZVcCAr+VyZeGoOffqOB1e7lqQ2tLiBS7gWSuGCu15PBA5E31qCzMa4Txy6NitVDgm11IO3kglJlGu1Rh12k3Bn0kpFuo4ovzSOoAn0//Gp+cM5YtQPmtY4a3vMbNobx9CA3vSf7X6UQiwDeB3fI6aPIoCckj2r+R4MWxAdZDm3yV4kheVzg64BfHEz9ycNvBuCR5xGCsN//yZt3S3Sc3qHL2MSO0RkLg+Slm9eVwiCyTmgjAOtKKV5TtIEaNrQEtiH0vV3zr66yY4Uaq6qjjW9QznwDngv0CVGpA+NS8r2kWiXd0RG8grtRd44YXcbiwJcbeunwszuOABxEYe2vWpEFRAJP7hegwhCSaBKPLImoA+uaiFrzfUW2nBDA18pGFovhlilmr/Xaljuaap3a0KPC6hSngW3faeCVs1DZK6e0WgAbtlBsQ9zlq51k6DiEQNLICvFfyD0N/KisWSXnU6Y3LIcBwsDihJA1D3ZIjF8G+Ed8YMI3SoH9N072QtzROQagHg4Jf65I13AOWd1xb6H2Kw5O8ubZCqG71ttEhsdvjqyjZM55eWUV78YiqkSeKAZlrMA9Cy5JF7TqkBeztq3TfqnbFSTZ4s+LlauyJhK7kZxswSiYvtTeo2WyN8yQH0zSJWiKkDSdtPJn2Y/imQS9Dudm3ht8QgyiN2j2u9YlZOOWP6nVf32j4Aqpe2iZU35nlwzqQijlrTIbQaagh6JMo9clNFW0FXHijiPux6yAhICL/m3bPmiqfiArU/Ou68VLY1WsfenmJM+6yG/wFBWpaQa39JJ3rMMTkESYDg8fzYS/h1lwa7KnahmeFWCbAdqq96aVs7maxSE/CDAlIHGiQSdN97VnHjHXbecybBI4WbJs8n8cMmRcJqumSZtaedwwzIo7Uv3jDWcMROvKzYA40RQR8o3HJzvG2l55dB8m8anyh1YAxglsloaUOStSevbxJ4Y0ARRK2PHfIE7BMUpia8D0ET3MLaKsjc6XtWYl0fepW72KjBzdwusKDEQpVxnJJ3alSE5oEOR60TRvBM5ZYvbr59l8w2xHcm6hpfGAaXeNXBaHFrbA6WQ001Wzi2jRcWeVKkRfIobLRMODJNsQQvAHv7605KViQ649cteb8DcGl8ey3DLyAQBmaDQk+1SAE2KlvCrXCnlp0vGpXqrFmID/WaXPnp2Wn6TVNzyyLmswCREkrqg/0rlNVj7Nd2p/QT0j69n7SPfeDqg7hMQOK2kWZ+HCPNOpVGyMsvMsa2j5ZcbYmYVQCADXVCtEG7MDphjyw4rAr5piqu9FpDJLMzdrKR8tJi1pFvGu8MADmEsWLD8YNtfv2kvrdb+CxNdO0hYb9yHcpNvwkhok1k/cVdnVAi9sLGk5GCDdtmyEANO67piayhgYsALGjXW2+BU7dGy090Jy2PnFGb3fpBmCqq1u4/m4c4vV5gtq1RROHVFqZGhpUPmAINcDZ4c8Kaqi50Ujgpc1z1V3TxJdX9ZFkHqu7q5fI0vh/f7sQoRftzlNVrzW31JulIvVqTbcVk8FAue0r7YOO9RrUChpiIg73wG7E7WynWTwucVTWBO9CwvAMNcg166VbUMc86a0IHhINfY+J8RqqOhof0zgZsio4rko7p9S10ldzY11HZ5Bl/alytetKYGEAPXUQlSXVv0k74FlDY0A/GekQQ2ixNrI6mdiUinPXITQNe4t3CD5vQdpRQftt8lHvWWPf4bGPRBQSfTiNAF31s9WQO2+TcstgThzV4Y6zspRQyzDeVDVIA/VrYBtonerwaSb8ZjeeHW86rIH517ZXSqTouYvUxMNxt3wO0rdNTT5tGFND4HBJmU16BVhbiCE3lwZ2p1i4Q6qX1WAl2/5MV1ZBrKoW1Yk8III5ody7vI16zUgbhM9S188Q+lV+ULqJEEcNFG3pBRQ8RvFKDb7xtKI+aULg8UGaC+kNDYpiDwBWMbV9gP0Khny6LUezRhrOJJTKHEozazguajKCeIpLKQBku5yoN3nRlcNwNa+pwXVQgos9mmcAdK41jWmRCgvGIDZkahXUs8DEIGvY+Rjg6G/WqC2LbchLQAM6g6BYgN2QsqGBQlxilkYDJJsEGnn9+u1UoSYRS2XBWwYd1KsEsykpcivAdjVRABAiSQ8M8rY4IAmdxrUawC5/qyaA1xTm1S5XUrMFR85rnM8ztqjC89AMNQvYAxeERd6cywnxNviG1KS4u6RVIHHJWS1d7twZMS3JcSHW/UfSs2g//PfRCFPXKANLFbWHg+bUETeI6LPJgiP9yME3N+y0rb+jcsRGhYDbViS4NbQGH8r1+arZJZuTFLmqe9xQQKptHU0rOCEor2fHh/JCUkqINj/n5bQ/qVQRji3WAuYkyzvKXVtsKHUMcOUfMgu1rIHOOc7ejBDh1wS1qdePi4yJKkAoN0xFRhOo2SNjQubxcSx3hNU/kyPB6yxIus5DX9CiQLxR2lJ3rLCmO60c9SPJbWnkIp+lHWwWe5N6R2eIkCoEBe5HjKIrqhpcNZEj8hgNt2VLI368ZqFB81EjhKsLrO8WqaHUsDCvm4t6eRqjOJ3nfDPtQQ0keH+Jda7mrjU2gOy7NcKfb1+XUg5DIUYLSopXWHGVz+Ec7VFWSXJ7KENMNPa6gSKwI+kcwnjz0U0jrUhRqV2B22xoG/xsTynDSEg/9IuUtmEgJG8M2JVhgCWsc5kaLC0SuE3sQ+wAO3xEyVfLHhBd2nauzWHSq8zI1Y65JgDe7m/ZAZUYtUFzNR31bKXHCV3NKZc3saGDRJS+fyJkOASRJL9sMNKQC4ESNB1ewH++boynWjLltWTU85zccdfGKwYWgZcpF4S/d2oDWkYR7oo9riBgELTafvPIrPiPbaehUfrnkKaudOF8ytKpg67NPYe8GapHHYMJsH6YSBNJ+nV1fgklwYI1HSMabbeM2NI8C2u+cCRcG1SE7cuskUaP9WyPJmRVliaK1JtEsb+ZJxidMgMt4LSmo2JcxmvDJs3KPNYi9Y4jhuuqBYJCw4OiLRMFTFQ68Ox5P+2NcQlBlSAJj+ATjqslhOHRCIzyNzltn7691J2wn9B/0bTvsLe1QzWm/gAua2TlC+sCj4Ka0R6jE9qVrLqqYSUxT9cm7djqVF3NtGq2V3PEpJaMB1B0SdvJ7WnS6qJGlwaLDitC9Qan8dVF3Wq3uYFptfTPJE0FnqjaCVEPrJLwb21ZWK+s7FsyQEZF2oCrRNZQELBq1XBBog5xDP6hiXpon4H1iPFami3EYy91UXQMSjwmJvazgRjdtTfChaTE8Wh8byo1LoVQCjFKOg4sv7xyfUdHyEmvEw0yKYF8ijo0B8hst472lwDlKtejYV21QzPJBKtAYgjCpIZRRrIh2TNIEbeGcXkJSwr2wD+4facpw8+Z6KLYyqHLNgHMXFFC/bDAMr1I1FpES16nQm7W4H5cSSdjcIftukDxj6wjYCzLkOUqBq2hZHkeyechW0zb23sL+JwPHGtw2XRmTI3djAieTk0obU41rw2Oo45ZUPJoSFJHAYAQHEcHTQtC6Or4ZsCOI16nf3tt9W1mY/yoF8nDihxB9RfUHBQUC1IBJabTVDoubRC1pmbQZqTjAQLA1EiKZknEhPdwOoaPctTxwqpdBbQ73glxrE2ePKjMjGZQrxOArbD6phIp7E1qE1+8d9f9brzIAiY8azJmOGrMagKi5axTHtrUhRXfaQnNhp2iXfKMfzKEEKueuJy3AZSc9lQ3i4Rhhr922Q210HWkDjWElPIk8OtdzClHr+Gf25ps35SlCSgKQ4RPR6BZRrJX/PNpUI3PUKc6+Y1CBwo1iZ2O5pijTuNgR7fSB1DF4qvZb93p6I1a6F4B2UnNgC4fFLT3r8HZE/o7YUQleM0UNAiE0KEjtC1BDgcwOpNHiAZ5/z9A9devOmiGPYZbO/mZNDmmxlHtKEdS6J16O8VlIy+mDlmke6cCoaNg5+084NnVMWlnn7d96LUzhx3S1vGZyB1N7NSJFs7mNKE4NHaUiu9AIboG+UYOrTdIgK704J8mFn0WZWXRTyEBDsUMjGt2tcEeDrGA6JKwQo3pmMh+3TVNJ+sIiUAWANBfXSP2Tzf31+9rsihdaFuRk24208QdPzI1tYBseViZah1LV2JR5GVvHAjPESQ3fL/YAh1/dFosTA3ROUqUZNW5Bc3swGdVQzUGsiZNquoFMGHXIMxYAiu7GgLTLql+1YFGo6ZECiWCcOuA7V7Ev2pinjpAtKplQfppFI/CwvoiEavOb4mC0tRBuqG8GNoTQo0cEeL1GgWLIwaN+waNCbPsSk8E86TmwXzVS1UjJWkornK9qkoIFOUJwznug5zfXgdD1psLzdK0aLu01X4FqwYuoLBiahjgOwLKlrIu2k5TEwm9sTPcbydjXmTiuT9AK+Ofpp6HcH0bNwMVp1bVO1BrMt/vF5EgtZrOcqBgCHZ3OmkTNduOL/sMRRYsnsbHuSeNauYrFoAH5TtGn+h1bX0/cEeFq1mrqX6nmccISgEIFzkQMMDabbv6TSjq9Elpo3FQgDqFw32x7DoGooOeakBqJGLCHA5sTlFGHVbVfo+OdD5nr4M+lISwp40NtGiPIimFSL0riNcWMTSlg3fwGqJHB1H81ox41mBEvpolqFMTYGpbgr0Wm1rR+kg5gdSlxaN2cVFm+IeAqal5bnBDzR20A077yIXot1qQpbw2qMKivVMy418cz3O/PqCbf/PgmkTJUaNxqF3THpxOrWIBuZ5TPJ8SYU2WT3uzIeiYR1ZXS1MYQF00ilBNs6oDY3gx3B8Ljl+ZXNQRUb12qPFW6tSqLyseKJrS8NS1vKnO1syhvQJsgw5l6cwOSwelaStJh/d4gmymZ/2hDtzCoZR3Rca6qOl8vJjcDnBhGveg4LY8sLY3N/n9Wn6p57TeFph4Swet2wLXhrbPqXKsKB/GjftNqqELmzaE1KCuX9PlplPcqEHeVVFcBExt3qN6E8rpV8fMEZwGbzXZRx6ZPlrpRdZRx6dclIR2BFrS2Q/WFku8rjYCg+YS5W4WL9GYijmPyxiwLGt7V6xI0fDOu6LNqjbj3gSCznBrfACSZ41Vo0HjpLga9H1pWgmnEZVQPpvpDcf12aOQ4qE85Sy0MYVcazqviKtd+0n5qGEVbBPKRY2Ikp3srldfCflsMLd2jYRMO2lPUzsR6iEjP6v6kJQIphbZ4hMojJQghZ4a19E809k4XNn8nKT1k8s31YXOFmn2Fl2joQYMj0FHWYfDMyaCsG/tHvNJUb8D4VnvolMn+00aXG1eAyEQsHZHPUnkKc5kX5OQierH7cJ/+r0VqFT+ucZw4WT1DYWDTzaqoY7DIg0CakSnhxHHUaoNF0Lkd9cShHfqR79EBvxrOtWnrUNkpqYH1CGGlufWgT6sMYmMIO58mn4jSsraVtJBDzWoNIj7M7m7v2P733812XSdCdrqPkR5JlyNpsedBdlkSqNQwt2mHTWjtAZkvpa6fY79Abr4h14F2jryAc/jrtJzXQer7aAbTSM2/dFvCuCvq1/TUz8njdEODRHP6zXvhkvRobGo+1YLDT70C1NFsToDVzS6jW5Xs2Hrl480DNpj6ZGkvmVIZNg79u8C4bl6CSOkNJAS1ffExLlXVPpdIQCvzayZsuR1bhQcsP4GeTWXAVAq8ECehkRJWySNtplJKWQNieKgapZwvNY8RlC/IAKkm5Na0JlejZZrVIZ31nAzeQZv6whb0taDYJICRnM03BFOI+jQbHgz6lDus7FJXK4D/ZLXlMcBmrRrn+TaQIIOLuTn8xP27m5cdjU5bNgZK652xsnEd4Pf+vVFoGfUEKXm/vBKOuDOAiCzMWzcW9tkcWD9J77/HPXM+2YhhakENmRRrBJbx91nW6ACtazhrjQaXIW82K2qvWFqfY6m3xKDqqnaRMfOVH2MZg+19OAk/gfTB/eD/xc/pvMhwBourUBRvG5zrzvjj3134nqU+tRBq6sPI9HeTpXOZehzD/ioA4aGmcpRv+9Bvx0iRw27aUfvlbLp1h5TqwFnuB2w+q6xl/pLmUt985Ve4w9vF6gow07UZOLVb9cI4Z2mzjYQowPXws/wDzVLV+zZtReyNcyxNHeJJ4vv6GsKVP5ABPhSd8EnzDorck01T9HqHCqaBdOjvbnZ09vgQ3IV9eiX1FPRkUIA8A2MGvkkmQY6Z1nvhrlGsOtaNTajdvpnk/Kf/5YZ4Ki7/wf7A74PFnZPKQAAAYVpQ0NQSUNDIHByb2ZpbGUAAHicfZE9SMNAHMVfU6WlVEQsKOKQoTpZERVxlCoWwUJpK7TqYHLpFzRpSFJcHAXXgoMfi1UHF2ddHVwFQfADxNnBSdFFSvxfUmgR68FxP97de9y9A4R6malm1wSgapaRjEXFTHZV9L3Cjz4EMIBxiZl6PLWYRsfxdQ8PX+8iPKvzuT9Hj5IzGeARieeYbljEG8Qzm5bOeZ84xIqSQnxOPGbQBYkfuS67/Ma54LDAM0NGOjlPHCIWC20stzErGirxNHFYUTXKFzIuK5y3OKvlKmvek78wmNNWUlynOYwYlhBHAiJkVFFCGRYitGqkmEjSfrSDf8jxJ8glk6sERo4FVKBCcvzgf/C7WzM/NekmBaNA94ttf4wAvl2gUbPt72PbbpwA3mfgSmv5K3Vg9pP0WksLHwG928DFdUuT94DLHWDwSZcMyZG8NIV8Hng/o2/KAv23QGDN7a25j9MHIE1dLd8AB4fAaIGy1zu829/e279nmv39AJgQcrZV0xJsAAAPnGlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4KPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNC40LjAtRXhpdjIiPgogPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgeG1sbnM6aXB0Y0V4dD0iaHR0cDovL2lwdGMub3JnL3N0ZC9JcHRjNHhtcEV4dC8yMDA4LTAyLTI5LyIKICAgIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIgogICAgeG1sbnM6c3RFdnQ9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZUV2ZW50IyIKICAgIHhtbG5zOnBsdXM9Imh0dHA6Ly9ucy51c2VwbHVzLm9yZy9sZGYveG1wLzEuMC8iCiAgICB4bWxuczpHSU1QPSJodHRwOi8vd3d3LmdpbXAub3JnL3htcC8iCiAgICB4bWxuczpkYz0iaHR0cDovL3B1cmwub3JnL2RjL2VsZW1lbnRzLzEuMS8iCiAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyIKICAgIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIKICAgeG1wTU06RG9jdW1lbnRJRD0iZ2ltcDpkb2NpZDpnaW1wOjUzYmQyNDkzLWRkOTUtNDA4OS04ZDhlLTIxY2YyZTFjNTAwYiIKICAgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDoyOTgyZWYzOC1mZDI4LTQwZTgtYWI2MC1iNTY4N2M1YzgxM2IiCiAgIHhtcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD0ieG1wLmRpZDo1YmM0MmYyYy0zODU2LTQ0YWYtYTVhNi0yNWZmNGNiN2Q1OTUiCiAgIEdJTVA6QVBJPSIyLjAiCiAgIEdJTVA6UGxhdGZvcm09IldpbmRvd3MiCiAgIEdJTVA6VGltZVN0YW1wPSIxNzIzODkwMzcwMDMwODg0IgogICBHSU1QOlZlcnNpb249IjIuMTAuMjIiCiAgIGRjOkZvcm1hdD0iaW1hZ2UvcG5nIgogICB0aWZmOk9yaWVudGF0aW9uPSIxIgogICB4bXA6Q3JlYXRvclRvb2w9IkdJTVAgMi4xMCI+CiAgIDxpcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgPGlwdGNFeHQ6TG9jYXRpb25TaG93bj4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uU2hvd24+CiAgIDxpcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgPGlwdGNFeHQ6UmVnaXN0cnlJZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OlJlZ2lzdHJ5SWQ+CiAgIDx4bXBNTTpIaXN0b3J5PgogICAgPHJkZjpTZXE+CiAgICAgPHJkZjpsaQogICAgICBzdEV2dDphY3Rpb249InNhdmVkIgogICAgICBzdEV2dDpjaGFuZ2VkPSIvIgogICAgICBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOjM0ZmM2MGFmLWMxZDgtNGE4OS05NzA3LWQ3ZmEyNWM3ZGM3YiIKICAgICAgc3RFdnQ6c29mdHdhcmVBZ2VudD0iR2ltcCAyLjEwIChXaW5kb3dzKSIKICAgICAgc3RFdnQ6d2hlbj0iMjAyNC0wOC0xN1QxMzoyNjoxMCIvPgogICAgPC9yZGY6U2VxPgogICA8L3htcE1NOkhpc3Rvcnk+CiAgIDxwbHVzOkltYWdlU3VwcGxpZXI+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZVN1cHBsaWVyPgogICA8cGx1czpJbWFnZUNyZWF0b3I+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZUNyZWF0b3I+CiAgIDxwbHVzOkNvcHlyaWdodE93bmVyPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6Q29weXJpZ2h0T3duZXI+CiAgIDxwbHVzOkxpY2Vuc29yPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6TGljZW5zb3I+CiAgPC9yZGY6RGVzY3JpcHRpb24+CiA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgCjw/eHBhY2tldCBlbmQ9InciPz7vTM7PAAAABmJLR0QA/wDQAFmsGaCTAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH6AgRChoJKnCP3QAAIABJREFUeNrsvVmTJNdxLvi5nxNLLrUv3ehuAA2gsXEBwQ2kLnkpu7K58zamJ5nNH9B/kOkX6CfoXS8zNm9jRrM7Y2NXZtQylIb3khJIkCAIoLvRe9eeW0Scc9zn4URERlZVgxQFXXEJhxW6OrMqMzKr2r/j/rl/H6GPPvro45IQEa6cS7xzSVVVVBQFzedzcs4BIZAhYtiElBNK84Q3xiMe5DmnaSLMpgSwAFASkfbv5u9m2P4t6KOPPppQVQLAAFIRWSdgX1W3QvC5945FhFWEVdWqqiXvLBtNgtO0LE1umBIilMboIyJ6H8AnIYSZMUb6d7cHkD766ON3FzgSAGsAtr33z3nnXqqq6parqqtlVQ6dcyYEz6pqFEhUNYFIqvCpVpLNoUMJIa0qt7DWfsTMf0tEf2eM+SCInBjm0L/Tv1tB/VvQRx+/96AxEJF1EbkiIrdCCG+GEF7zzt0sy3K/qqphVVXWB48QPKkqqYBVlVWVQWAAhgDLxpjEJt4m9sRa+3Nj7N8a5u8ZY/7ZGPNEgWp3d7dvafUA0kcfffyWgob13qesOgLzFVF9SVVvee9vuVh1vBC83w8hrDnnkspVFHyAiEAhUAVUFSoKVYGoQEVJJN7HzDDGBGPN3Bh7xzL/ozHmb4y1P7BJcifPh7O9vZ2+pfU7EH0Lq48+fn/AwwIYieoeEV0X4AUJ4ZUQwmveu1veh2vOubWqLPOqqqzznkOIwCEigEr9ODWAaLw9fh4BRVQQAuAcDBGPrbWvGGOGzLydJMl2Ku7viOTnqnpKRD2I9BVIH3308RsMGgZACmAEYEdEborI50IIXxQJt7wPz7nKbZVVOaqqMvHOs/eenHMROCJaQDUCRRNd4EADKNCmGmm/lohgrHXW2GNjzc+ttd9L0/S/jkajH6dpenzlytWq/yn1ANJHH338ZoGGVSADsAHVmwA+p6qfi22q6kZZlvtVWa075zLnPHvvyHkHCdICh9bgAdVO6woANH6OJVhoCzQKjdfQggwbA2OMMPPMWnM3SZLvZ1n2/wzy7AfDwfj+cDwuRqMRmLnnRn7Lom9h9dHH7wZoMICm2tgCcB3ATai+LCKv+hBe9c694L3frqoyL4vCFEVJzju0barQqThwDhTa6oPqz3UFJC4ASKd6kYg5rKxjqN5S1REpbRiYbWuqvzdl+WGe5zMAPYD0ANJHH338DwIN8gD7oElZ+XUm7DHTc8x8k4A3VOQNVb3pvN8py3KtLMq8LAvjXAXnHLwPCBJaIJAQW1XoEuWdiiNGw4Pop3/UwEIUmxwRUIRUKFPV64bYVt5kVDIrkTPG/AJA2byufvmwB5A++ujj3yBElcj5ZDGdDWau2hDRq4boJWv4DWPMa9aYF4joaghhx3s/LqvSFouCiqKAqyqEEFaSfdOuEmm4Dmm5DdRlgaLzd5UV3uNZIIK2ZonfH0J8bCuSENEVMH1JVachhEdlWT46Ojpy29vbPbHeA0gfffTxWcfi8dwUZZE++eTxmppwJUh4ufLu1RDkFiluEtHzxpp9a8wIQCIixjlHsdrwCN7X01TaSetYVgz1FFUXAFQvVD01gKzyHbikjQVEEh3130WbNpkDiBIQ7YroG86HzyWJ/9nR4eH83t27RV+F9ADSRx99fEYxnU65KBbZUXGwW5TFzaqqbon3r/sQXvMSXgpB9kVkzXufq4glIqp3McDM9QeBsEzmqgKiFhXQ1hrPqCRoBUDOgcc5EFERKABiWk7pqAKiTTkTR4CDz7zIfuDwpoi8oczH5fr64xtEvt5X6aMHkD766OPXjY8++ogPDw+HwVUveFd+yTn/jnf+i86556uq2imrauycS5x3VFUlOeehImDDSJMUWZYjz3NkWQprLZgNInLoheqCiOJHBwhENYIA0Wplch40VKF1tSE1uLBS2/pq+BA2VPMiBBVhId1QkddE5Eulc3eoqk6//5OfzPqffA8gffTRx78iHj1+bObz+bgoileCq/4gePftEPzbIYTrPvih856dc1SUkdvw3qNpV4kEEBGstcizHIPhEMPBAFmeI0kSMDOWJciywmAigAmKWLGQKETRggrOta26VUkLLHXFQc0NXIOTRuAgAggKESEiHgB4IWj4ovrwLnt5YMqyICLf/wb0ANJHH338C+L4+JSqakHWmERBG1ma3lKR70jw/4mYv0BqdkmRsgFsEisDm1iEEBB8QOUqVGWJypVwVYWyLLFYLDCZTJAPcoyGI4zHYwwGA9gkATHXbEjM9jG5EwwRQAwlgFSgcnH6qmlNdTmPptIgqgGoBqnubfGZmu9Tw0zrRHhJoW+qyl2Apj/+8d9PvvCF/9AT6j2A9NFHH5fFkycPaDIZwdqKiEsigplMT4fB+w2C7jGbl1X1q4B+21j7BhE2iNkwG7AR2CSBStYS2yEEBBF451rwKBYLzOdzzBdzzI/mOD09w3g8xubmBtbW1zHIcxhjWxBRVRAUIIIxsVoIAEI9pbWyYNhtY9WtL26AovMRH7cueLiudaS5TUERr/ag+kXR8ElR6mHlTIF6rLeP39zoiao++vh3iNPT981sNsyqyg5UfS5SDYOEDUCvQvQmgJeY6JYCt1TlehAdi4hRqUUNdXn6X6kMoNAg8N7HllZVoSgLzGZTnJ2eYTKZwHmHwXCI7e1tbG9vYzwaI03TC+0oAiD1jogPS4BaTnJ1MwlF8GACE6+Ah9TVCzVf072dAGZWZi5V9Rci+n+J8P+pSH6kZjj5n/7w7X4Sq69A+ujj9zNEhCaTKQwzFVAW57haLLLT02oTCNeA8LxIuCYh7KvKHqKB076K7HmVHVWMoZIEUdLOlng7zbRkHWIyBkMZSJIExhgkSYJ8kCMfDJBlOay1ODw8wNHhIaaTCeazGfb397G5uYk0zVauXdFwIgxTlw2qgNJyZbxpUxERmHm1VUVNWyyS69SATqc6qRl2YuLUWLPvQ3hJoDdg9aMiqeYAei6kB5A++vj9iaPHT6jwDlluqCxPU+/dWul1y3m/7b3f8t7vqoTnVPGiQl9UxQ2VsKeiYyIkomJCCEZEWUKg8+2Cln5YUf5oKhFp729GeFVNCyZpmiJNEzx69AiHh4eYzWaYz+e4du0adnZ2kecZiHj5eDHfg5mgasCm0cFaiiUS1wBC3LkabfmOGj8utD6YqK6kACYiwzwQlesQfRU+fDAsypPv/W//x+w7/+uf9FVIDyB99PG7FycnJxSCgy8DW7KJMZS74IaqOlwsytFiXmyJ6vMi+moI8qqIvECiu6o6DiJ5kJCqaqKqRkQMVKjZCj8f3UmnrmwUoTsuK+fgpk7mREiTBGZtDWkagYSZ8fDRI9y+fQfz+QLBB+zt72EwGMQ20xKpQAAMCGADstTKnDRAQUTosPEr17ZyOd3qo0O+BxFCCJkGvQKl1xn4SWLTu6Obzy8QaZg+egDpo4/f7jibHBIhJahaH0LivU9FJFeWkYfbDAFXvfcv+BBuiOo+VHdEwk4Ifi8E2SaldWZKAWXVAKk5jWZXAmj2KPQSaUFdrTzO3x8XNpZE+MrNdZWQJmDDsTVVVzP37t3Dg/v3ESRqY125cgWj4QjM3PIU0LgYaJRAxAiqiAvpWj9ft22FtjrpXoRewptQo+wrAiWyALYIuMHM1ym1a1gbH/cA0gNIH338Vkc1P+XKnySLYp56XwwhuqHAHoj2VXVPVHYJ2FPRK9776xLkOSVsMlGuqomIWpFgVJTg0fHOkI5oIQBq+A09hwx6DkqWINK0mbpfonj2hAwzIx8MsLO725LZt+/ewd27d1uZk6tXrmA4HC4rkQZEiMGovT9YoNKpMnA5eFDTqqIL+AEodVkcZuYBoFdAel1Vtqti/vD2nZ+5my++0bexegDpo4/frlBVKp48yU9PZzvOydUqlFe8l30NeoWIroPpBoiuxpMzjURlEHzIVSQDkQXq8dcQGkXaZbupLgGWWHG+6ljuWuCSYqP7fV01kgY+9PzjdNpgRIwsy7GzswNVReUcfvGLD3Dnzp2Gk8Bzzz2HPM8BiiDTVBgEAjfPQUtRxbZldQly0bm2GhGgiEuL1Hl9xrKFYoMIz1trbuS5+WQ8mpXoyfQeQPro47cpfvree+bORx+tGeCmk/DVEPzbQfzNEGRXg66L6ppCxyAMiDgBwFClhr9oAWKJFp3ppfMggU9vW+lFMLgsRUcOpD7uX3yylcdgJgzyAXa2d+Aqh6JY4MMPP8RHH38MNgZplmJ/bx82sTUZr22VFEEEUFIIdfQZ6RmVD1GXBmlbalBFa2xb30GEobHmRpJmryRp+mEQc6b6k0D0+b4K6QGkjz5+8+Pu3bt2Pp9tLxbzz6nKt0XxLRH/OlR3FJqpqBERDiKkqnRJkRCTLHPc9qbLmlFdcUE9N1V1cerqkuroYrXSAatlLUKdyuN8O4uQ5zl2d3dRViVOTk7w4MFD3P74NgaDAbIsw/bWNtjwEqC0I33SqUJWe1NtPdKpmJoqhWvSvQY97uKoEjGnbMw1NuYVVXt1MU/v3bu3vkBvONUDSB99/CaH956ODg+TyWSyJz685Z37TyLybVF5TVXWVdVC405G10uj4S3aqqPehTCGwTDtqCud71Tp6lhsFzEit0G/pPK4pOVFv+qXx2c1hjEajbC3u4cb15/HdDLH0fExbt+5g/X1deR5lEBBzVksnyeCAHWVfesyhGpgufRyKBLxkRuRaFFFjYwKQMSW2WwYY/aJeEOV0xBMv/TcA0gfffzmRgiBZtNpJiFcZeDrKuGPRMIfhBBeFpGRiPDSznV5vj9fA0itZNskSK7VceOiXUd7qisH0qRaenaVseLwdylC0AUQoXPg86xWGBvGeDzGjeevYzKdYv7BHA8fPsTW5ibW19aQ2ARZmkWhxbpNRiAQx4oCzbQWdYCS6jZXR9G3+zIJALGJ3wutN9jjhBgTKRGDmclaEJt+EKsHkD76+A2OoiwT59zV4P0fiPj/RVXeEZFrIpJLCHETvD09ryb4bnJnIgiW5kuqApHal8OYlT2ICxWEXjLueimg6LOKiosVSVz2XrmdLoGeJE2wu7OLG9cmOD46wp1P7uCTTz7BztY2RqMx0iQFE0M6BH2zEAjmlkZviPYGSJpJru44cRRxrKl1bqo1A2MtCORV9Fi8fxAMHYK0MJn07aseQPro498//vej92j/0QkNFxYpp9jYWNeXXnrJLhaLHRH5vBf/HR/8N1T1hqqmUhskNclPVRFCgG+c/kTQGDg1Jk7LEzd1gERrrw7Tyn6cT/SXt6Xo3C260kW6vJPVqUTOPfizvsUag+FwiN3dHVy9egVHx0c4OT3Fo8dPsLO7i+FwgDzPa/BrHqxjOFULJnblTTpI2yoq0rllwmaD3RgDa6wCKKC4F0R+TkEfcuBCw6gHkB5A+ujj3yfuPXjAp8bwYVmxHhyaUeDEkBqod0GkDFWVe+ee98F/xXn/lcr5/RBCIvWeBhFBRFCWJabTKc7OojBhUZRQFRhjkGVZ9N0YDjEaDpHlGayx0YypFiHUxpipAyKXgsAzKwy9UHGsfv+n5Vn9FAiJaGSswWhtDXv7+9g7OMAndz/Bk6dPsP90D+vra0iSBNbaFsio7pVRvYzSBY8ugET6ZFmhcef+1mwqSq+oqs4F+klQ/UidPHWlKb/w4k4PID2A9NHHv1382Z/9Gb399tt45ZVXaGNjA4vFgobDIQXv+ezkJAlANnQugUpiKclBwQh0ptacTmezDeeql4N3b6nIy965gasqatz1JAQsFgscHBzg3v37uHfvHg6eHqAoSxARksRikOdYW1/H9vY29vb2sLuzg/X1daRp2goHSu07zqqxWjEM6q7ixVLnErmS5Z/n9zsuHcY693fqbKl3daq6TaxmozzPMmxtbWF3dw9PHj/B8dERHj1+jJ3dHYzXxrCJRb1aXj82tY9P7SwvLUd1mwtovr4GzmY0eFX6Xb0CpyB6ANFHIVSzRfWw9wXpAaSPPv7t4nvf+x69/PLL7Jwzk8nEHBwcsDEmCyEMSDUlkYSY04TZKEiIjBNgETjMNzZHKRTPq+obEH0JinEUM4x5S0LAbDbD/fv38dFHH+Hj27fx6NEjzOeLTuuFYayFtQmGwwE2Nzdx9coVXL9xHVevXMXG+kadeAEVhYiPlYtaGGM6ZYReqDKIdKUr9Wl9qMvUTbqE+0r76bKHI0KSJLVnyCYGwyEODw/x+PFjXLt2DXt7u20ba3mZq8Q5Go7jPAfSNZeqHRG5lnaP7T8rAKZE+hCKeyA68SLum+98va8+egDpo49/XWiHCS6KAv/4j/+ItbU1StOUzs7O6JNPPmEisqpqAbAxhkVEmVmI2RmiQMwkRB5EC+91euPa87Ix2LxRlcUXQNXbIYRrriqTRmIEBBRlgYcPH+Jn77+Pn3/wAR49foyyKMDEYBP1opwDRAqE4BEkgNlgfX0d169fw6uvvoqXX34Je7u7yLM8glLz+FiVQn9Wq0k7WiCtVez5ia0VkfXl93WT/WWyJ+0z1v8z1iDPM4zHIwyHQwQRHJ8c4/jkCNPpDMPhEEmSLK+HunIlkVDnFcn21cqpK/ve3Get1SSxVQhyGEQ+JqK7xtrTUZb1G+g9gPTRx2calGUZvvrVr+Lp06eU5zltbGzQ/fv3qaoqJaIgIsE5V21sbMzH4zGC9+TKknyagq2VlNmn1vq93f2xhHDdMH+BmV4PErarsmyrD1c5nJ6c4s7du/jww49w/959zOdzaId8UABaGy557+G8g/MeDx4+xIOHD3F0fIKiKPH6a7ewv7ePLIu+G6IK+JgfrbUwzOdA4TzB8WyFK13J0uelTHB5yfFM7p5gjUWWZhgMcrAxmE6nODo6xunpKTY2NmBtsvTzWC2XWvBg5uUV01KypLmv+3z1hFolqk+g9Iug9IlhM7t582bfvuoBpI8+PjvwUFVMJhNUVYUrV66oMQYHBwfKzLK2tkZEhKOjI7z77ruyt7en3/rWt8BMcM4hGAOxFl986SX9+S9+zvPZbN0wvSghvALVfVVJK1fF0dsQMJ1O8ejxY9y9exf379/H8ckJQpDo1ifRoU81VhTee/jgEUKAcxFEjk9OMJ/NEXyASoCqYm9vD0mSAqoINTmvqkCSRBC5AA10oc4gomck/5Wv+vSK7rI3t1nQYIZNLNIsg7UWp6enOD46wunZKcqqxGg0qjkMWW6Yc8dcqlNddNtb3WtvqhZmAkAqgoUqPSTQx6R4WhVVb2nbA0gffXy2nSzvPb773e/ie9/7Hv70T/8UX/nKV/S5557D9evXn3no/m///Z/Iu5J2B0Pa2tjAg4cPeV6cjQ6PDl5MjHmTQDecd4OiKBFCPPT6EHB6doYHDx7gwYOHODg8xGQ6bTNvaO1lFVJXIA2oiGh738OHj5YcABFEFDvb27ENpIBwgErck6AkATF9epY/19L6VIhokvb5PtIlBcnyf7EiSNIUw+EQg0GOg4OnODo+xtnZGcqyql9Pw4vTcj+Gm+mqjnxLKx1/kaExhmEMg5grqB4Y5tvGJPeBdAKs9dVHDyB99PEZlR5EF9LfX/7lXwIA/vqv/5q+/w//QIYYCTEZQwgac7FAjfNFbgwPZ/NZ7oPPiDEM4q9UwX11ofiqql4N3iVlWVKT7H3wmEwmePLkCZ4eHGAynWKxWKCxlhWpPch1+dFdv2imjFQUTw8O8bP3fwbD1FYZG+vrcRKrrkJACmaGZXuhmiA8YwN9ZQ+DPgUduqO0upLYL9Q79dJfmqYYjUYYjcdQVRwfn+D0dIKyKFamp5olwYYLWX6serVHPKPOyK5BkiSaJIkn5gMi+rFh/jEbfqBAef3aZk+e9wDSRx+fXTz96RHtvbmtP3v/fSoXC6hzvKgqC2NSy5wSwapKouCUmFMCEmt4wIY3q8rtTieTreOjo3WRsMWGric2ecUae5OItkSCCcG3ido5h/l8hslkgrIs4w6EaSapBEECfJDWFEqCtFXHilYWKUQCDp4+xe3BEGtraxjkAzAzhoMBTG3cRAwkNoGxBkx8ASz00jGsaMrU+oJ076fzY8D0qe0xOtfKsoaRpSnSJIUqMJlMMJ1NUZQlQgiXt8Ra2qYG2E7VQRyBw1oLY4wyG2cTOzOJPTBs3rPG/I1Nkh+lWfI0TZ3rf9t7AOmjj391fDz5mHCqNjxx9uH0tv3RD39oFtOplRASBvIsTdeUaIuINgi6RqRrSrTBltYt25yIhqq6HnzYrIpi7eTkeLRYzMequpml6TjL8yxJU06sJWvjNrkKEHwAQBgMBrh27Tlcu3atXaILIaCqKpRVhaIoUBQF5rM5FsUCVeUQfORCYpsrVizOeTw9OMDtO3ewubWF0WgEw4w0SdCQ9tZa2CQBW15a1X5Kq6pbeayCx7Jntfz/r9QhXH0kjm0pRfQMqaoKrqriBn6o23e1VwgpAK6HAzqju03FUW/qa2ITx8ZMiegxM3/IxO9ZY/4pzbJ/Rp7f5TSdZsb07aseQPro49eP09PHtChnyfzEbZQzt+dQ7Hj16+IwBjBmYATiERFtEtMWQJtEtEaqG0S0wcRjZk6I2aqqNdZYYtgQvJnPpqasKrZsKMvjBvloFMdWjTGQWp5kc3MTr776Gm7ceB7WGhibAAC8cyjKAov5AtNZrFJOTk5wcnyCs+kEs9kMi/kCZRVP642c+Ww+w8NHD7F/fw87W1sY5BloNAIbE+VEygppUsHUCRdopN7pkuoDn9qyav7yDDuqS25RkBKUdOl53kiQ1OAi9aRZI+OiiC06AGBlsJrlDkjcLG9ei7C1FROfEfMjNvyhMea9NEnfzdL0ZwrcF5EJgGpkTN+66gGkjz5+/Tg5OeSyqEbVQp+XMrypTr4Iwotg2oHoBhGtGWMGzJyoaqqElEAJgESBRKGJipJHINQJHApkWYb19TUiQtwiB5AkCdIsQ5KmMMZGRVhDyAdDXL36HLa3d2LLppZdDyLwzqEsCywWC8zn8wggxyc4Oj7G0dERjo7in6dnp1gsCgQKred41Jd6jL29PayNx7DWIs/ztqqpqipWIYZXhQgvKP9qLWVyWWvqWYCxbH01ysKNrLt2jKhEJE6Yia5sukuQelTZw9cjyNIVSkQk17muNkzcwSnY8Imx5oEx9hfW2Hetse/axH40HA6fDAaDMxFxWZb1wNEDSB99/PrxsKwomZ7Y+XSy6arwunPuGyHIOwp9A0S7RDRkpoyZLRvDDCIhaeVmtbHcUIUPHtqsodVZMEkSrG9sYjgcI9Rto1qDCcxxkqjZX0hSxWA4jL7loss9jxBP4M4Nou7VaITxeIy18Ro2NjextbWFjY3DuHD3OMHh0VEk351CIPDe4ejoCE+ePsXu7g7W1sZIswwkAucqVK5CLjmA5NmtpQ4kqHY3yTufNErB1AAFVpwRW+K/fhBVbRcNGxve5cJjfLgg9XvgHFxVtXsqxppooFULIhJzMMwLw3xCxtwzxv7M2uTHNk1+atl8zMyPrbXTtbU1f9lwRB89gPTRx78oHquSPzrK57PFFVdWbwXvvx0kfFNFX1WVLQAJEXFD0gbvEbBMiKvn7+4obGeBzVhkxiLPl7sI7UJgrVO1zKnaKulKCLGvT0ujpGZ0lWsZ8iRJkA9yjEYjrI1HGA5zJEkCMozDw0PMZ/P26qbTKY6PjzE5PUO5X2KsAlGC+gDvPIKPyTu2segZ2yDL13nh/vq6u6vny7aUrLao6imvJYBQfC9CgAQfvU3afQ20ey6V91EY0TAsLNgwjDGBjSmY6IiZb7O1P7XWvmesfT/N8o+SNH3iy3IWQvBXr17tgaMHkD76+Awqj0ePTXnv3lpVVS96V31VvP9DEfmaitwQkbGIcJsLu6dnvZhUl3sHbZ4HUawq+JyceDseq4CS1IkUtYdHM1VVf974jdeLcoYZsLY92BMIhg3SJEWeZ0jSpBZMjCTyIR9iNp3Be4eiKDA5O8N0NkVZVghBwGyiVLwIfA0gzOaSjW9aZTE6gNcWGh0J+fb1aUN6a2sKFauXLuke36Mgca+l2W0BAYm1MBx1u1rTLGujBliSqDF2zsxPjOG7hs3PbGLfTdLk3SRJ7hqbHo2Go/n6+novTdIDSB99fDbhvDPzs8VwNp/su7J4zVXl17333xSRL6jIvoqmokqtw19HLqqpFqitJNBOBa22ZAjMpiWluzpMjSXtEix0BTRUpP2a7n3t+Z/iMpxV22qrs2EYG1tizAxjDay14NrNbzqJXMdsNsd0NsdisUDwDkkttighIIiHBIEarb/vEuJcl94gy3aUtiDRjhQ3PEfnfr2gQELLaoaAIALnPcrKoXIx52dZhjRLI2eUJMjilrqzSTJP0vQwSdIPkzT5Z2vNu9aa99PEPhgOh0ej8XqR56MeOHoA6aOPzy5UlZxzQ7J6y1j+hmH+BgNfJOiLUN1QUSsi1Ir0dRbU4s6F1vsIugIKqtJOBqGuPpqTPLceFE2VEU/joe73Sw0YqE/Yq77n8fN236O+LCZuq5HmBG9MfE5rLBKbwrCN1+s8fOVRFiXmxSJOay0WcM4hyzMQMYLWk04hwNYTWF0L3NX2WhfwdKXt1iwxxsoJq465etEQUTvgGkJAWZaYzae19hfaKbU8zzXLcpdl+cwmyRNr7c+TJPnnJEnfS7PsF/kguZdl2TGxVsPBQPK8N4PqAaSPPj77YGPMyBj7krX2m9aabzljrsH7XFV5qVYbk1/cI4iTSYEj+yFScwat8VNM6I19rK0l1q21td8E6qqiqTBiAm7aNV2L2pb/qPc4oKtb56rLVQUmBhmKC4BWICGBNQls7VLYLCZWZYmyLLFYzBFqMrpyDi6E1hxKgiD4gBB83LEgiiBw7vmbKqOtNETazXiRjnd7XabF0dqOnPs5+9xm450NIwSPylVYLAoUZQlrE2xsburGxnoY5PnEWvvAJsndXvmBAAAgAElEQVQv0iz7aWqzd9Mk+YlNk4f5IJ8Mhnm1ubndm5j3ANJHH/+2QURimCsiLkSpCCJeRDTKhGDVX7tuU4FQL6YxrBgE7yDBwQcBEyFJ4jhummXI8hxpkkCB5f5Cp9poWlWhs0XeAEhTzbQAArQVSneCiWpwa/iVBpCaEVxVxdbmJlw9+jtfzDGZTls73BACJEQ9rGYRL4TQgkjc6pZVsFCsttzqiTLF+etfyr8r1c6BTR2i5+1xm+11bSXf45IgsLY2xv7+vmxv756Ox2vv5Xn+t3mW/UOa5T9PTfZkaIeT0drYre+v99VGDyB99PE/JISITlTCj5wr1ftqIiL/EcDrxvC6qnKb2EAIwWOxqGJSbbacARjm6LNBcYw0SVKkeY4szVqPcu/jad55j1B/3oBBlCEJsXWFc6dy7fIHS84EWNV1MnWLjChOcznvlnyJCgbDAba3tlAUBc4mExwfn+Dw8DDyHT60bTEOBIjWY8IVTGlaz5GmQlp+rF5jF0C6Ha/l0BhB6iqDuLafReSV4uugmtOJjoM2SZCmKcbjMfI8x4svvBief/7Gk6v7V360tbn5vfH62j9t7uwejNfWetmRHkD66GM1iqLgyWRiF0WRlEVhiqIAAOEQwsBaTYdDGW9thY3NTfk1Z/kZAJskK7N8eCpKZ8y2rKpSRILG1hC1st/FYo6F9yiKBSQEsDFI0xR5liPNMph6IsiYuDFujKll16VdjPP1LsdK26eefLroN74KHk0ybie4eGkExcTt/WoURg2SxMbHDoLECobDIbY2N7G/u4+DnUPMZrO2ggjNNTa+4c6hLMsIimxW2m7xeTqTU7rc6wDVwosrQ1vU+pVzfd3GNIDHHSAEiGLLLYToSri3twcRwfraOm698grdfOFmvr+/tzsaj59P0uyYmRLnFnNjrQYYmFWzXAUgADyAUH8eAIR+96MHkD5+h8M5Z2bz+Xrw/jmIXDVMoyRJ4L1fKHNZAZU4N/cnJyfT2enxo4c/ml997u1fql9UuwoyQsg0hC0BroHwUpblbxLoy0x0nZkGEjwTx8TctIIAhQs+Lgl6HwEky5ANBsiyPG5vd9zuVBWCJZ8hdauouyC3QkQ3yblrFNUqzdJKO425I13efDGWRLQxNraIBO0obJIkGA1H2NraxPbWJp4ePAUx13Ig0uFg4nOaKsqCGLYApFX/baufGkq0047iug1FzOeudbksycbANLd1AIRIa0AxsFawsb6OGzduYHd3D2tra7h69ard3tneyweDrxLzSERuhSD3jfCEggbm1smdQKRxKE5LVZ1qCGcicuZCOPNVdfbkwYOiFHF5nofdnR3tAaUHkD5+B+L27ds0GAzS4+Pj7RDCG965rwfvPx982BPxGsSfQXSuIvOgeuS8vw3I+8H72z/4wf93PJ8vyu985zsXgERECIABMJQQtiSEa6L6mqi+papvqsiLgO4w07o1JhOiunO13HlIswwjjYq13gewYSRphjRpSPKlB4XWU1It+S26Qpi3o74doGimr87brUZAMEvDpE5bbUkndHdSYjsIxkCtwgaLEDyM4fgaRiOMx1GR1zADnS33SHLHB7LewvoQ3zXttKcuTPTW2+CN9pSJbS/DpgWPpaAht5UHWuOnCB4RmLiWYTcYDAa4msZ9ltFohNFoTFmWDUF4QULYhuJzIEydo1IFUgMIYen/ISKhCs6feO8PfPCPnHMPXFE+dFV1QMynFjidz+dTEZkTUUVEvYhiDyB9/LaF956m06mpqmrsg3/Be/+29/5bwfsviw/Pi4RRCAHqpRIVJwpHIcyI6JGKvC8q/x2i/5Qmye3v//3fn2QSqi9/+z+qF2GoJt77EVT3VPXVEMLnROR1kfBKEHleRXZUdaghmBACxSqlmSBaKnAwc7N70Cq9NjIkTRqXZrKoGbNF4weuK8uB3QoEQLsY1+36xGqG2+eIvAEuOI/rObKhC0CsCnbctoqYCUmSIMvjsqFhRhCJyr5lAWbTPnqShJaM7yyetNvzxAxD9TWaWu223jvhFjyWC5MNR7O8vosCjcv7FNZapCljMBwiHwxhkwSiylVZ5QpNAWwCEAJpNJNa9TpXAEGCBO+rEMJMQpiIyGnw4VhVj21iDyvvHizm8w+Z+edpmt5TkYkCFTP3QNIDSB+/DVFzHYOyLK9UrnrTe/e14MM3fPBvSpB9FclVhJpTOwFKDCWoaASAVxR4nQhvJMw/VJGfkOFPHt++XZZlucbM1xHCyxrC6977zwWRVwFcVZX1EEIWgjcqQtpZ/mtbSNCuGGybzLVz4+rn57iLWoq8/a9TgbS+5p0luwYw4p/U0cnqtNK6XEnd1nqmcyCaSa9Qjwp7+Jpgjx7ohOB9DSBlS/o3isDdybA4mswwJvI8zYhwc3t7rcbUgIEWPPQSMcVL2ovtn+2WvwJVUSD4UL/vjZVvYBHhUE+PdR0Xqa7AiKkGFc6JaGyY95nZE5EH1IUQFs65Q1dVn/iqeo9Vf8LWvg+iu0VZHgXvy9Fo1ANJDyB9/CaGqlJRFHY2m20WxeIl59yXQ/DfCD58KUi4KSGshyA2cgatEh8IShLHQw0UFkQ5EzYAXAtBbgn0VjDmp2dlMaXJ2X6apa8z6HMQeSmEsB9CWBPVVFW54Qe6wLHKQSwTG533U+okuhY0sKxaVpPh6sa2yGpeitXFKlgsZVOw4m0BrNAeSxABOot9GncpqhJlWaAsCxSLBaaTKc7OzjCbTmNby9q49e0cnHNQrV0Jk7ggGbfaTWvE1Hy0QNOpNM5XP90qic7Jujevf3mtYWUqTevR5chD1ZwSqGOUJcvJsO7SZod3MdbAJgmsTchaa5LEwtrE2kjgK1Q3RGQ3hPB8VVWvishb5NyPiflHqvq+qt47OTk5Dt6Xoqp7e3s9T9IDSB+/CXFwcMBHR0cD7/2Vsiw/7537Rgjh6yLhdZGwJ0FyHwKL9y1526Ql6ciAx7Y5GwatAciJdJtIXySmd7z3RbFYrGsIV9mYqwSsiYgNwZOEep8iAtJSKBYNcU3LyaJOytaaC4g7fNr6bESQkIun63N+FiuVQzN9RLxCjHO7v4G2/SX18/ElxHnDgcSKIcD7epO8KlGUBebzGebzOaaTGU5OTvDk8RMcHx+jcg5JlkE0tLsgoVYCVlWwMciyDIPBoDFjaj+IuE3saFtrujoDhY5EOy4uIEbeJcD5CF5VVcG7uNzYEPrG8ApgNa0v7b6/OD9kUO/oBFu3Bs89tzEwxpI1hlQkdd4lVNDYWLtvrXmRiD+nwHsq+kMJ/qfB+4dBZPLxxx+X3nu/ubmhe3v7vzKY1AclfPDBB3jrrbd6EOoBpI9fN45PTmg+myXT6XSLgFsSwld9rDreUpXno3BhMEtpjyUR0dQILdnc/AMNARKzVArCNgjrKvKKq0qZT9W4NE2stdbE7Ituq6rZQ+iOo15sTa2emruyHtKQ363gR8fn4kIsT+nNyX2ZFHHOy3uJEKutne4JX1tDpRCiTLtzJcqyihvnRfQLmc2mODub4Pgk7n48fXqAo6MjlFWFNE1rh7/Y1uJGSgVxWGA4GGI4Gq6OCxM6E1jL2qLbSlutwGRl2z620QK8jzpXlatQNddclnU7rapJ/aiBNRwMkA8GSJMUbEwLuk31xsRRRKujVKxaS85wQAirApZEAqn5n7IoyTlnrbXrxpgREV1TpVdV5QuA/gwqHyroNjHfS9P0yXxeTB4/flwNBwNPqiF4rxs7O/os8KjbtFQUBX33u9/FlStX5Gtf+1oPJD2A9PEviYePHpn5dDoSledVwts+hG+GEL4SQnglhLClIomokoRQS4Hr0ui6c9JfbRNJ5yCqiHLrlAYNqYSFuqqkRuo8TVPYJK0VXZcpmHTV31tFIBczwQrpfVFEcGmydAEzVJcyJx2nvy6fsgpWy6kk1WeeaqM7Xz091ZDgxWKBRbFAMZ9jNp1hOp3i9OwMJye12dTxMc4mExSLAsYYOOfhfPRWDyG0UiPex3FlwwaJTVYlSDqvrbN9suLxIZ39krjVHg2gLv1oXQZ9rIJCQOWi2KN3FbIshV/fABCBImGOT0wddWMstcqaKk2x1BnDCmlf8yNCQACEFAgei8WCnHM2BD9mMnmSJvtJYj9v2Dw1xtw1NvmYDN0h1UdVUTwV5w4YOAjQ44cP75YiTlSt7u1eQZbndXlMqqqU5zlefvllvPzyyzQcDllVtZ/46gHk957D+FXm5w8OD0lEUu/crvf+VVX5hkj4tqp8TkT2QwjDEAKLhLb33VXb0/OtIO1WCBeX75qWBaCkqmDn4J1D8AFZjig1Ys2SwMbSEel8Mr8oLaLnRmbR2RPBJdcidXXgW5taY8yS9F3hXLQ11iBiAJe/vtZYqqpQViWKosBiMcdsOsd0NsVsOsV0MsHZ2RlOz85wenqGyeQM09kMi6KorWDRtqcGeQ5rTFwmLCsEEZAxmM6mWJRzDEYDWLbLKa8OYLRgVkuudCsNX/uyN382LauGd2pJeon7I9YaEKUQVZiyhGr0QVcFsqxq38Pm92NZhayKPbY+6dQl7EMNzLFV2FQkEcgj0CwWBaaTCebzOTFRMhgO7CAfjNI03U2z7IUsx1sp8wkzHwnkkQtyh4k/BOg2E54SzBmRmRVlOZs4V64lSeiACPIIKg2SUa100O+g9ADy+wkevwqI3L9/30wnkyEzvSAiX4LqH0D0HQlyK4SwHrw33nsSCZ2KY4kTF8ADl4CHnpvwOQcsTT89JjiF5ooEWe1i1wGKS8Bj9e+4FCguBTFViETjo+Z0HW1pI4+xwqF3J6loFZi6CbFp6zlX1aCxwGI+x2w2w2RyhtPTU5yenOL07AyTyQSTyRTTWeQ/qg5BnqYpkiTF5sY6trY2sLYWbW2rGmibxH6cZRiNhsjyHGvjtRr40Bk40GiTG6RtS4XgO0DRAIdckKzXWiSLicFGoWCoxqRfOdfu36DxR6nbdKFusXH7s2hafnqh1bj0MdFlk42W2/vUVJYmljNxeMDCWAPvHBbzGVVlSdbaLMsH6XgtbAK4kaapA3RCwBEMPWamxyL6kMCfgHCnKIrb6tyDe48enS4mk/L09LTdfNelphk551hENIQgpvdh7wHk9zDoGc1+HBw8oRAkdZXbkxDedFV4R1W+CeAtAFddVaXOueUElF7w8buktYMLKrQrKVz1mZcWE5eL/XgV5CpI8wzWWLS8yAogPeu5LweQJrFGkKqTaAgtKSwS2uvSjhOTAiClFbBoqpMocRK1qrx38K5RqF1gNp1iMplgOp1gOp3Gj8kUk+nyYzqNUu0hxBHYxCbI8xSDfBBBYW2MwSAHG4YPvq1qRGLFxBxJ9DzLYU2CwSAHEXfALLRtKOd8W2ms7LqIXM4GEUDguKQIACoQIUDr75HIajVTX2x4xW9FRaCt+CI6zofLn/cq4R4QsCr/0vyGGMQlyCRJsbZmkOcDuKqMjpOhnWijsijIsGERscycM/OOAV5hEa8qUwAPAbrrnPsYwAci8lOIfDQa5E9++KMfLr789pcbINHDw0OeTqdkreWtrS0qyzL0nuw9gPz+IAfRpUzxg/sPSKHJfL5YU5EXRPTrIfg/9CG8HUK4ISGMQ/DcaTOdE+NbgkGbTC/WJBcqla7Xdod6WDnJt9VIWcTeuISYHK1d2cdYbVFpZxHwsmpjaUXbtpbqkdjzciXdRbpuoUSXeDU1Sbqqq42yiPxGURRxomo6bR0F54sFXOXqpM/I0hRlksLaEraeXkoSiyxNMRjkGA6GyLMMibUoixKnctpqUzUjsSKC6XSKg6cHSGwCgLC+sYEkSdo2mquqKA7ZOAcGiXsnTS4XrLTqGuDQpqqArlR2IUitVBw5C1v7myRJEisDbhSHlz93bg4djVT+uYNEIycf24kB4gmh5m6kaT/Wk2eGCcwWxljk+aCB+wtDDrGyAkFhQDDEbJkoJaINJr5FhAJEh1D9kYh8X6E/ZMKHP/jBPx6yyOIr73xTUFUaNb8Cn5ycqIjoBx98IK+++moPIv/CE2wfvyPxi48/MIbsCIqrIvKmSvhGCPJOCP4NFdkVlawhVFdO8p2WU9cn+0LC1u5QKC74SQCrTndLYh0XOA1mA5ukyLMMWZa1nIjqqr95t62letHSVkK0f3XBte2qpeGTtiKH2vXEqDe7m+fiJgE2MuoNkVyWWBQLzOdzzGexopjNZygWC1T1tJJzDqVzqMoKRVGiKBaYzmaYTGPrynuPxFrkeYZBnmOQ58jyDNYmS6HH+v02XItD5vE9yfMceT7A2toatra2sL6xgcFg0G7id+VYuj+D7h7NkjPpwL12ljRriRdf76y4qooDAZWrJ8MUxhhkec3X1JNY0WGRl8Cn9XReOxq9XGJcLkAaGI7+8WmSwCZJFL+shxnag0Q7LbfU/Fp1XFx9dei0xbjWAAPUAzhSldtB5N0g8t9U5Ecs4eNB0JPtNKuymy/i4OSU5/M5F0Whs9lMjo+P5Y//+I97EOkrkN+vuHdwmFTzyU5w7pYG/YqKviMa3gohvKD1aG6ULZfujOfKWaLroX2+dXSh4qBV6fBP4yW6ib9NBhLgfYWyHoVNNXp4YGVR76JtXtevPPhOC8f7KKEepNtxj1NezWhuN6F2gEhq6RMfImcSk2iJxWKB6WSCyXSC2XSG+WKOoiHBG7tbEXjnMZ/PcVbzHg3nISKwtWJw0qgD134hzbhsUZRw3oMIyLMMa2trcVqtbh0REYqiwNHRIebzOfI8R5qmrU2uNbZNwlSLJXbFJLsSKMsTYxydbrbzg0SJe1dFEIYq0sQitab+2VHrdwLtqhHzMuFTLeSIpQf9Umomfr9t/NOtbdWSTcefPppm0QUOChdk9hXUaZMqog1wt0ohJmuYdwGsQXGVFC8pcEuIfjBn/fGiXNzTd38yOVERa4zWLozqfe+82wPIb2H81V/9FeV5jj/5kz95Zlb+8M4dEu+pKh0l87luT+fqb1xjP86GvphdF++/5L3/A/XyVVW9JSLbQUISZUJCa4x0KYugq8T4qtfEJcCguJjczz0y0TPbb/HEXxPSzXk4SRBlODqJo7sX0ljYdncZQm3K1PT8Ab2wStfIa9QysecqpgiqIQRUVYliEVtUi8Uc81kcw53PI3A0ulRZloGJ4ghuTZIfHh3h6OgY09kMwXsQM5Ikqb3YLbgmwKumYqkqzOcLFGUJAjAY5MjStD6JR9CJul9JazG7WMxRVRWsNUiSJPqetGBjllL2JmphEXd3L7ByYo+pV6AESCs7EhM+mDvb5/VSY1dPq5UooRWzr5UqoKMhFsEjvg/GLq+PO+Cx4p7YudQuX3Xxt1AvNFFaLk8AiSPlAwJdB3QbwIsKek3Z/L8K/r7k9qcj4oPDoyPPTPif//N/7iuPvoX12xd//ud/ThsbG8TMdHh4qH/xF3+xwlIvZjMui2I4n883i6paLxbzxFelJsaIzbIUxlxV4MshhG+KD2+qyBURGYoIt1pKLbfQEhMrk0/nR3KfXYlc/m/sMn7i0u8/x4nEv8dkm2YZkjSNya9NIEvg6PIboTZr6j5lY/u6cv10XhJ+mbDiYzq4KnpvLIoF5rMpZjUolEXZkReJnIBNouqvdw5nZxM8fvIE9+/fx8NHj3F6dhZVgplqUjhBluXI8wxJEltWQQSVWy7qWWMwGg4wHo+xtraG9fU1jEdjDEdDDPPoc9IMGnQXCLlO4obPJ2pbcxZpfdKvBRZNLbzIDLRb/ks3xljJ1dxRLU8idbUXHSCjUVdsrUVg6+qEtS2qBrzqbfRGmyu2rzpCkOfSz2WHjcZNcWXMuvNtSw1LarW/moXXbhXabskTeYDOVPUjUf07Ff2vbOkHu7vjJy+88GZfevQVyG9nfP/738fGxgaYWb33K1n45OTYTmazLV9Wr/ng3wL0lrF2WEtuCJhTEd0JIdxUCc+r6oao2CCBtAUPrIJI93R/bkFveTLXZ6HEBY7iWUDxy4CkARPVuMXdZJEkSUHMbWWwnDRy8PVo6pIU52XrpJ340U85Ji1HcquqQlksMK/HcZtKwzsHQJBmKfI8b0/81lqICBbzBSanZ3j69Cnu33+ABw8f4+T0BN77ukUTe/3EVI/9uta+tnktTIQ8yzAaDjAcDjEcDpBlKaDAoljEllxVYW28htFohCxNwPUC5CovFL1Ruu+nOecHn2Yx8UfZewPipspjMMcfYcNpMJt6+qnRxorgG90Js5qzSpEkdUuOzQW5k6YCaU23OsZVq/tF+qmLmqs/PO3OVSwBA9R5rO7hQUHgFkxqEX5rmLZA9AZCSISUVKQ8OJn94Hu3Pzr5zs2Xex/3vgL53Yi7//dfE7/0XBKybDcEfUuD/CERvknASyIy0IadVjUikgTv8xB80lQdcgl4rP4j1HOEtV5oF1wk2s81E34N8HhmSwuoT9ApbJJEldoGPOoR16ifJSsmT0v1XOrO+NejxtT245vbm92Qsowcx7zZ06gqiPdQRNI4STtJsm63VVWF09MzPKmrjk/u3cfDx49xNpkghABjTOtNEk/jjdghLdtv9TJjBI8hBoMcaZrU2/HU2u6qKPI8w9bWFvZ2d7GzvY3RKEqq00rbcVlFhFbcMFZibGJbK0lrUj7LkKZL/oHJtCKMzc+/4ZaadiCI6seI7bI0SZGm9VRWR9LEWAte2fGg85O9F3+PtLsfsvo12iHOaEl3rKStprLoggg6CgXc+sMsCbj6+hSqEwnysyDyX4Tov1CWvb+5uTXdHI8lSxJdVKTgTK9sp31bq69AfnOi8fmuvMfJyQkWszMdj8+wu/vl9hf17nt/Q6Ub51r6axrkKwL8ERT/wTDfZKIxCNyMr2rt590sjbWjq+gs5p3jPVarkbbuf3YL6lOqkV8FOOiXNLea7w0iUO/gJUAVy/HUxsq1M9VFnwJEzel6WXHEZTrnKpT1pNSiWKBYLFCWZUz+ZJANhkizpK02QAQJgqIsMDk7w9ODAzx8+KiuOh7h8PAQi2JRj6DG6Z8gAnX1xjZsXR1FEAGWYogRNOL4alwEFFTOYTKZ4mwygfMeeZpie2sLi8UC3nvs7GxjNBy1gMPGAMogCi1ALoFSwPWAQAgC7xyqskSa2KiQW79Ga2wrBR/bTtGKl8hEot5YJGmyogJsO6Q9neO1lkDQWOvqJTtC50+weklf6pzqsWJ1nLwZ4tDLf7sacNGVa0GjRkBENALTy1D6Q1KQdX4vzGb3FkQzSbNKwQVzMX/y9F45PTkMxUwkG4zlldf7Md++Avn3AQ4LYFBV1Zr3flDEZTQ3nc+c84uSg1YmZFUy9OqBkYp9EUrvAPpHSvQOEV0jINMowbD085altPb5SqNRqNVzjeN22kpXM/wFmlL10/mQf+Evmf4KVUgz1SMd1diLz9WZp2rbJLyyDNiAaWx9RaHA2KpaoCzjJBUBdfsl6nQ1hDQQwasoFjg7m+Dw6BCPnzzBo0eP8eTJExwfn2C+WMDX9rrNTo20o7XxcZM0QVYn6sb0akk4RyDJ8+hQOBgMEILg8PAQ9x88RFkWyLMM6+tr2N7axs7ONrY2N7E2HmM4HES+yCatw2AzlBBE2jHtZjR26VIYPUTYLA2njGm4k6Q2kKrbXVmOLI/Vke08DzUuhkQXksd5iZlPq1RBFwGD0Pk9pIu/O3TuF2rFx2vF6WvVLIvOZbqOoZYHcAbFJ8T0UZqm9/M8P0rTbJJYe0SMA1U9FpGJik7BNNXEzgLZxcnBaXjrzVu/92DSVyD/xuG9tyH4QVUVeyHIy875V5xzu+ViTlVVzSSEM/E48UEPCdVhVSIw0zVD8jUi/o8AvkTAPoBEzstR1K0KaasJPVdhdP5RtUDyS8BAfwkP8iuCR7elpL/C165WNroULKLLDqV8LhGttmFCPY5btTpVsdqoqhLBh5pniYt9aZq1rar654WiKHB2dobj42McHB7g4OAQJyfHmM3nIAI2Njewtj6uN9Pj2G8k9329iCeRrNZYVcEHNAZ77ciqOBATjDUYDgZ47rnnMB6PMJlMsbGxjoODAzjnkCYJRAJOT0+xWBRI01ghJdYiqfdoBsMcg3yApG79NbsgjemUTZLW5pZrEp3qCTTv6wm2ECvZljS3BhmyWJHUm+jdn0VXTuXZZloXT6gr/Ne5ilZXjwaX+CUu72sntugcKDUPQpdL22utME0AmI1lYzaZeUiEF1TCNAQ/VbVzwJwy21MinInIqYgeCHAPqnesugdXdoeHZ2dP5izenX10P1z7ytdDDyB9fKatKhEZVFV1xTn3smp403v/Be/D665y+2VZkvNuBugJszkm4qcgOiBCgOKaAp8nxqv/P3tv9iNZlt6H/b5z7hIRGZFrZXV19VYzPT1r9+yiKIqkScqCZUMEaBm0HizA8gJYhuEnP8iE/WLzH7D+A70I8KP9IMCGYAimaIkaLprpHvYs3T29VHVXVe4Z613OOZ8fznLPvXEjM6unOZxh1wWyuyorIiMy7r3nO9/v+y0Esc/gBK2uw7SDkjrdAnczMHizZmMDqfdjzTJ+ik9rbamxxYOdzUjju9TX3RCarAmlFKrS2o0EmKqqoFUNQRQW4CzLkGbOGRhAXdcoihVmszkuLy9xdnaK8/MLzOczlGWFNE1xa3/fDveZXUdToCgKVFWBqqxQ1gpa6SBatA2g1Zdw7To/t85ZXy5AygQGjMlkjBeefx4ykbh16wAffHAfjx49wsLRglfaYLlcWWsVY0CwQ/idnW3bmUwmyLI00IeHg4FjjaWhQMaxvL7w+j8TAYY1av8+jQEMg5hBQ7bsOClAjMgpmdd90K6rIPFGIeoYvXvvzcER7rwGbX6a71gM20JfVsFqJUkSkWb5IM3SXBBtG62NMUYxoISgWpBQRKJk6BkxfyiI3iXGe2T4QVmoR2z4SBzePnn08OHl3v5+kee5elpAnoFwJG4AACAASURBVB4f+zDGyLquB6vFYp+NfkkZ/bW6Ur+ktPqS1vpuXdc7VVXl1sDQKACVlKIkolIIsbKbJDNiY7a1NlsEIzlyvzURa6qBojrD7h4riXWooad0bMCrP04xaUKh+AmRUwodiECMY2N9kQmiwobmWxQFiuUSSzffMFqDCAGa8fMNWzgYStdYLQvM5zNcXFzg/PwC0+klVkvrYZVnObYnE+R5DhICSikrMARBa7sI5VkGM/I6FApwVVGVzidr0Zg6ug6lmVcB5+cXmM3mYGbc2t/HZGypvIN8gA/uf4CzszMU5dL5QtnlO8tyyK0tDAYDq0sRBKU0kgTIswzj8RhbW1tIk8TNKqiVshj0HCSaAu2KtNEGZVm4zsSKDEdbW8hcEWlNI0J3uM6oIlo/19TD16WIRbcGe3IP6hUVPcQebq1ONgrY4qaAaGVQFCXKYgWtFYhs5vt4sk08GEqAJIhSAMzG2M6UwMyspZDPJzL5MjNPtdZnWpmPQPQOJdlbBPmT5Wz28OL4+EKk6TIdDMpEyjpNU35aQJ4eVx6r5ZKU1sJoPZzPZ89obb6gVP2aUvVrqlafV0o9r5Xe00ZnWilyxcN//jkRxkTELAQ7iwpiY4QxvHZHBZy5x9qhewO3OhR0oAfm3qlCtxixw7s3YtlX7hF5A7S1viiEX3Jt0WmgiHiW41Xg2s04ytJGxxZFEbQMggipo5z6wiGclXtVVyhWK8xmM5yfX+Di4gKz2Qx1XYKIMBoNMRgMwu7dGEZZlZYRVlsluhX8pRZGGg4xGAyd+M/SfS8uL/HgwYe4/+ABiqKAAQdthJQimDWenZ3h/fffR55lkFLg1q1DvPjiC9b+ZJjjrXd+gkePHoO5Rp5bO5HJZIzdHevkm7t5yGAwwP7+Hvb39zEZjy2khQbS8wXMGyUKx2ADtS8zv2FQqsZyyXauYgxGoy3kg9wx04ANJL2+JuNjdvE9f6e+XrVdXTZ120IIB+klKAtYj7OqxKpYhhAvIMwUSWXKBmgJQUIIwcwJM28BuG2MqZn5CwL4BhFOmPRjpc0DInqf6+rtsq7fBvPDhx9+OFsul/XLr7xinhaQp0frmE5nJCUnSlWTWuk7ulavKK1eNVq/qrT+gtb6ea31tqpVqrUmYwzZHbOO/Z2IIneNrjbDW0nEWzKOoX9fPEwP06qjyuabDjhDBwEQMz7OFopusnKsDTkQ7UQ5LBYCgPGiQofVK6VQlzbEaVUUqKsK2g21iQhZlgfhn0ws3dQYg2JldR/zuYWqfD55VdrCMRgMMRwOMMgHkEkCMKNy1iZlUUDVCkIKTLYnbv4wwnhrCyPXDSRJAqMNFos5alUjyzOMJ2Ps7u1hvLWFPM9AINSqtjTi1RJ1VeP07BRvvUWo6gqf/UyBZ27fxjO3bwd7k48+eojL6RRaG6RZisl4jJ2dHfczc2RZhvF4C7s7u9je2cZwMHD27+3oWqWtu7CJOyG/ixdNxK8/6YYZdV1htVq4rgWu4xFY59fRExSGyOSxdd47I42eqsGGW91NbCfvLyXhAri4E2OcpAkGPIDRGrVStoCsVkiSKdIkgZSiZe9PDKRZ5iJNiLQ2kogkEaXOEXiXBD3PzDUzz5j5SEC8D8I7RPSjNE1/OJlsv/vo0dGplFmRpIb3dvf5aQH5FB9a1VTVq6Qsykldm2e10i8rpV81Wn9dG/N5rdSzSuuJVirXRgujYzbROrOJAeuc2hqCt3fyxG04KQBE3I7x2BTn2qsU/ymG5J/ErpJusOB4DYa3Lq9rFaJXy7JEVVovKYCRCCv4C35LDvM3zChKO0yfTadN4VguoeoaQlgYY5DnVvntNA3aGJRVhdLZmCRJgswt1qPRFibjMbbGIwwGQ0jXdSwWC8wXc5yfnWM2myPPM3zu5ZdxeOsQ+/u7GA4GIABlVWE+n4eY27OzM5ydn9kM9cUSxcsFXnjheRwe3sJ4awv7e3s4PTvDcrkCCYGt0SjAVIPhAHlmBX55lkEKWyw9zCOkRC4T5HkeSBjB98vln3vzSYrhIEFhYK2UQlmubAdF5BwDxNXDjis2ER2i1LUbkXWGYLQB6Vy3MWxFaKvYyeWx2O7PCljncxsC5mdGQiYQQoOU8/uSAqlInDEnxYJFYdgIwcIhCbRFoH0p5YtE9FXDuM/G/DlJ+ncS9KYg/b5iPnv38XnxmWf2zNMC8ik7Xn/jdcqSLPnwg4ejdJgeMsyXtNLfNlp/1RjzslH6jtJqWxudaa3Ju8J29/18xVxwXZ3L/UQXz1rhqAvZYHfe+4o3KB5/EWWEqGdxIeqHvpzDqzUsrIOV+mppGVVK2fmGp6E2MFVid6XOa2u1KjCbzzC9tNGy89kMZVU5Gu0Ao+HQOQJbmxI2jW2KqmtIKS1E5dxoR6MtjIIIMAcJQl3VuLi8wMnJCT788CNcXk6R5xnuvfgS7ty5g/39PYxGQyRSBu2HqmvMF3M8evwY7733Pt599z0cHx+jLKugDn/pxRcxGo2wv7+PNMus/YkbkueDAbI0RZqkLqccDnpS0EY7kSW1rE78V5KmdnbjEwyNZ6757BSbGx93knbGtLLiQyLr9UVXDK8dBEq9xePJsK02S5fWr5tO7IDtREVns+KKiLQ5K4abcDBvnjkqSwwGQxgpoKCAunEFTpPYV6yhbBtLaiCrL8HAsMkFiR0AhyToJWL+Kti8CeCP2fD3MqE++PDx48utwaDc3dkxTwvIX/Hj/fffpKo0Usp0DIjna11/uZ5XXzdsvsrGfM6wucOGt7TR0mg732iS47jJnOB1a/S1qQH3FJD2tLI3/KkTVB4W4n5Lks0Dyk+uQmxeCPoeswavsdW4aLeYl0URdopVXQNwGo40bam/vR7CKs0LLJcLLJwhoi08tnCMx2NnnT6wNFWXja4iQWaSJqFw2IIxRO7mHIH6y5bB5aNttTbYnkxwsL+PnZ1t7O/tY2dnB/kgC8rt+MyPJ1tI0xR1pTCbzjCfL7BcrXBycoKHj6x9+97+HtI0w/7+AZKkcbUVRGuOtTHMw6RhDIFIN864wSVXBpNDO7PRSJzduvUa0w4KamzZfVZ7WRTBmiRxRZfQpwvBGtU2zEW4EX3GUcJr3URw+0VIMAw9TzfDpnONMbgDpTadiRASg3wA3tkBASiKFdK00QF5oa5SGkBlPzMQkoTsXNDDcO7nMtlr1YBAxhAJkoLEGERbYL4D5pdBeJUIb6ZEb4hUfp+I31qcLI54parxC7+YheRpAbnmODn5KJnNLiZa1S/UpfoihPw6QXyDiL4I5lva6IHWWhpjqBlON4PutuIbHbpt7xi70310uhZnINiJbgJ36ki4ra7tNH76ytGFCa6EsIiuYHZyZNfuvJiifA6rUwASmTSmgYkMHlFKKWeRvsJiscBivkBRrKBdRGs+yDEYDtzC1BgB+jmBn/tYim9qM8sHQ5dbPrT2Jk5Yl0hP/7UmhFIIjIYjZHdsYRkOBtZ63am+U59/4cKTlKqdpXuNVVFYRbxh+1qjIW4d3sJ4PA4dw2g0aqxV/NmN9D7sO11an0t4+rdxrDH7pUN3Es8Q0jRxjC4VqMagtrW6qmuUVITFPUlFv60N+owzAeb12cUm6PQqrQmHISKtz9xcper+TIrovlImGA23kCYp6roGkfVhk4kMTsTQGpoZFRojyCSR4b6xL8OhIAYY2li3Y4ci5iTlbSnEHgivGOZvgfF9U5s/q1B+HyP93mz6+EiSWJIZqOHOhJ8WkL8Cx0ePHyXT2eKgKvnLWtOvsuG/TmxeMTC3AYwBlsYYMkGc1ER88ibYyC+SFN8GvZIr30M00lzi/h1e3ONz357syiX9pyoiXbEX91hRXPf67ThaEzyrLARoh7xEZIVzA3bdh3QYvOX2V5G31Xwxt92Aqu1APc1CjoZdvG1X0yQWWkaSTJ2Nugt9yrMcmfORsn92xSDLkCSWzVVXNdI0scPu8cR6aQlvX+6EfEmK1NmPGGY3v6lwfn6Bo+NjfPjRR7h//wGmsxl2dnfx4gvP4/nnnsPh4S3s7GxjOBwitWygVrgSU2MVwkRrn6ffwbfDlprF2hs9ejp4eBxZBTtB2E7EbYKEF0dqDVRlVIwoeIZtmntRJCP3vIlN7sy9T+5ueDodfatsbuq6Q4YNBbKfkBIZ5UjTLFy2FH/OADQbQCmIWkSGkXTNZd74fDmVvQBRLoRIBfMYoDsAvsjMP2TQ95SS39cs30kEPyrmq+VgPNRPC8gv8PHw6ChdrZa36lq9ZrT5W4bxWwB9jojGYJY6QFXxAnyFaC8I/LqtQpdm2wKg+geHfU1Lq6V+UuYUg5meGMaifmTsyoJEPZCdNwOM/+8XNfbDXYe5E5GFCtx8oyxLGzG7mGO5WFh+v1KucKRhbpEPBpAycVG3RbAgEVIEYaFPAcydrXyTuZFb1XqeI81Sx9axBUTnGqPRKJgYxv2ioEZ/YdigcIPzi4sLHB+f4OjoCEfHx3h8dITT0zOkaYpn79zB515+GXfuPGN1HKm3ERFt2DPq5MgVkKC9IQ/TWKjKe14laQPVNW7EBapKO78w3dieEEFKZytjoo7avarPT/Es7ywbgG5URBjXu6NdM6+jVjtz/WyPr9orcSgY1C4vzZ3kHAX8xiORiSUYEN1ocwQgbFaEEEJKORCEZwDaI8JzDPEKGK+B+N8Z0t/Rht8u5rNzIROVDYf8tID8gh3zxSJdzOe3JeMbyvBvsebfNNp8EUBuqbjcuJVeNRynBnftT/vj1kCCrxx881Wzb3QNEZ/wFgWusNa+SfG4KRzWCOcZDN0KibKwle1EgPVwqySRMM4Vd76YYz6fYT6bYblYWJ2F1pBSIM9yjIaWjpsPh0izFEIk7nVMsBrJkgR5nln9houRjQuHD2zKsxxZniFNk8DQ8hBHymkEv3GYO4VFuqywWMwxnc9wfn6O09NTHB+f4vTsFBcXF7i8nOL84gJFUeDw8BCTyQQHB/vY3t5GkqTo2tOsbXsjaMl3ED6TI00TZ3uShmwQX4iUKwCJW/StP5gOGSssmgF8G3INQwxorVGWpVtyBSjLHBHBi0Fpw9rOuH7fTmvtQ3Q7Rb5YDUur1yaFb3CFMre3axS/fvMM44tIoiAkuSE9reldYgGjn316d2EvBBZEJITIhZB3hBAHYP6MYf0KGM8bY/6lYX6D2BxV1arMsp/fIvK0gHSO2pikLIpbUsqvSyH+fSHEbwL4nDEmR2Rk2FbZ9i/ujfKXYZhC282WXhTa29iCOr5mN5kYdhOv2w+jq+cq/OT9yU0H4f3f4Rbc5gkGAaYycfEwsFB+Uzw8zu4XRaU0lssFHj96hJOTE6yWCxAQ7DuGoyG2RpbammWZ6xQQWFXMBmmWIRcCmQtHGuQ50ixH6micwVAwy10cbeLceaOM7s4vbQfJ3sjR2qnMF7bbOD05wenpqU0tPD/H5eUUi8XS0opnc1xeXqAsS4yGQyyXrhga4+JpxQZDyeaC80XD05ezUAAb8SRF2gaGt3qXLSjQmCJQfCUYIGe46N6DMY141efKG21sJ+L28DkJyKQd4NW6dum6DpUaB4MY9uLObGMTdBoVlm5B2dwxcPT+oh6emmudoo65m5+zlsTJFGWQ9M/6NDO0YUjJJCEzQXSLILYYfMDgA2beI4M/qery/mIxW21tTczTAvJzfjAzaWMGBLwoBH1bCPqWIHoJRCPmfnpsd4DXFUkFnFeIYGhIcWoad7bmdtK8btkRdxbct2drL+Kbmhj+JMi5TzLfiHbnfiju5xxx5xELJ/2OjhyMYi3G7aLobeuXizmW8xmYGaMtK+bzrrZeDW7t1RnahTgZtkNSn23hFeppFkFVubc8sR2HdK61jY0Kr6X5hkhW58W1XC5Dt3F6doqLy0vMXF76bLbAbDrDxeUlprOZi89dAQCWyxXOLy5xfnGB/f0DDIfDdr555xCOpiudsWKaZcjzLFi1CNl2KG6xAkFIZALK7b979+OyLIK9vHcaazoRW+A50GTt+9JKo+QyOPUSecuTbngYOvcKtS7cWL+xtiUhtK12qJ1pSD3Xp39/1CVuBDGu2wzE9i5rlDH/+HjmQWCm9vuP+yJaH/K3f2TTxXkqMAshBIktAj7DQE7gMYBtpfjfEMw7i6KYbw0G5mkB+fk+CMCAGHdsS2nuGqNHbHTrAune0HZ+wJ0LrGcqQMJ6BhkDFtRSALYnKT3Fg69r/jfYpjcTy59tMe4pHN5qXMfMqtbuuumq/M5YyqSBYlLLjBqPx9jb3w8Cw+FwiK3x2LGeEgiyUFetbQogO8gqT1JnVZ4HwWHqvue/bwtLEuYAiHekPe7C3iXAD6QX84V18T0+xunZORbLBZitGSEJgbIqcTmd4uz0FJezGaqqcvBciqqurBBxvnBU5fXiEeePWxv61MFuTTa6aC1YpjWwjvtCAlnILxIYAoyiKENQla0hlv4rpADIdyLx5eW6rqoIxTTLcohEtKCmNdNlrHcoV2zurprMX4+bRoQDRAPyeI7CrWgcDgUkju5NnFq9KU7o+MlT7zaKOvkmFL1/wwbQAARAglIhxHMAJwxsgbFNwP+Lsvzh5eXldGdnRz8tID/PBYQ5Y+ZdY/hAKz2u61oqrXo24XTF/KC9IHr/Jw/HkCCAqbXzDmWDr2BadUoFbxxirw/Xw+aIn3Q28uQMLW/6qI0B+7ArpYONRhwS5Re4+HP1xcMPtz2VlQjI8gy3bh0gkQLb4zEWiwWEoPA4ANayo7avQeQW2rhAZHYu4DO+81A4fEwrrX/2PafA71aN1iiK0vpqOZhquVgiSRPcOjhAmmWo6xrDwQCstVXP1zW0YczMDEVZgrkOu34KSXrxQt2wnbxo0jsKp44e7GEbw808jLvtqIN/GtjHFqPBYBAWO2ZYI8pYnS4dTEc2BtcXG39dM7ODCJv3m1FmB+thZ9WGeltDde4MSog6s70rJ/PtIuOKQ7w5oUiQux7h3LlrfVSCiwe2NOwkXCOe+ty897hTct0NU6uuBCIlYh1L81kxDDQzhBEgQYkQdAeMAcA7BN5hYEzA6w9Xq7Nnh8P6aQH5OTwMMxmth8xmj4B9EIbGGGG0AXoZJNQzruaWL087Ja9ZzMktFCDblbLhDYNsvnrg3TfyoI3f6MPA+ovOBqF4PKzsGiMGh2Afsaqt/5J2sbTGxa7GWHozU4p31tak0Ac8CaeINsZAComtrTFkkiAfDDG/vMRqtbRFI2R5289HJokbgOfNTt3BV4Oo6wh53iR6BtYIsKLvNgh+obZdx3K5xHQ6DYaMhg129/awvb2NLaflqMoSh4e3cHjrFu4+dxfHxyfBwmQ6m8MYg53tHTz33F3sH+wjd3Yb5BZ4GdGB85BhkgT/qsBY675v9AhO19L8yNqdDAYNU5AIpZvFaGfgLiWFItKCxbiJ4rCdSBnU5hlZO5D2gr1Zg0St+QY3JnFoPvfGTZotpOauHxPFHFgRasTm67AlYzhvrX93v5BPYUzTNLDzAl2Z291Fp4Y0S0NnXsVki0v7zm7PXpRSkFJKIcQeiF5jxg6D9wHe3lLln61WFw+Hw93iaQH5OTt0VYmqqgfKqB0DnhBRCrItJkGg5QdL691IVxzYzEfWdRmeb8+CwEbDENm5Ori3cKzPNPiq+rKpFmyECVrwF7XL4jpaQIhV80H85wSAWtmvYAfi5hbtoCteg4KkFK5w5MEMsb3bc9i/lMgHw6CmpkuB2XSKqq7d8Fm6hMFmEJ5ltgvxflexmjzGvtehEgQoyZ9nD1cVRYHZbIbL6RTL5RJaa4zHY2zv7GB3b89ldFh9QVWWNrtjbw/PPHMHs/kcs+kUs9kMC2cdP8ytm+6tW/sYDAf2GnHusYEh5ii5vpu1IUk6QDIUA/CRgzPFJ7ZvIWeClAkGg6GDmyy04zsR/1hbRGxRM4ZbGyYCYFzmRnydWN8suWbq3GVlNcUjSs+MzrvhJgtHB71QE2kQIFNuD7tbHllNnxXC2JpM9sZMMs1sxzFyTgRZlltrly6FJYbiaH0uSb2QVrSGxHEF0WzGWSAJIjEG8DIR5URiYtjsKYU/WiwW7xLRcjQa8dMC8nMyQC9XRVJX1Vat6rHWKjfGyNbOKMAC8WVhok6jY79wdccduezaNp+8juAqLvsVKBXoasCJuTF1DDYYdHMHVWoVFgq7NTYGylmOaKWgnEGfUk1WO7cKBrdkLcJBVB5S8imBvQpjd0hhaaMYj4MIkYSwWoYkCbBU5qm4g4H1j3KFQ8hmON6dM20qrobtDKdwtirT6cwGPmmFNMuxt7+Pvd097OxsB+U4OepmlqbIc2vCuLOzi7K01ieFU6F7CnIWhIo+DMoOxv3MxndJPprYWBdOUB/+HhcRihY77lHwuM86SRMMaNDayVdVaXf0rN3cREYzDV6zxLFJh3XYOBlmq+CPCt/VvAxudxNxEqfx8Kc95z5hsBuCxj1WQbSu8HCPM43Vi5DIck8DHwa/MSHkGmy95tES34AxYaWHFtylInd7MstUZBAZIqKBEPJFIUUOgzEzbzObf8VMP6rrep6mqXlaQP6Sj6quqaqrYVWV+1VZ7iijM6UUeYVuu9PwF0CbjdLsZNC727I3Q/sx5Gci7vKxN46+ehTBWIfOrioe0QDRONYMeSqnbIau3HN7XCU7MYZhuOk0QuaEKyStRQD9O18SAlIIt8DmjkF1dfGI6atZlmE8mUDKBMPRFuq6cjtlZxiYWxX6cDBEnuVWCxHsO2gjHt6cbzfPURaaWSwsi2o2n6OuamRZhu2dA+zu7mJnZwej0cg6uno1s/s5HiZL0xyDwRBVXaFyxaNyVvRgWwSlTJBmTU57A5twB5JZA3s27C6oBdV3yRoUAfVElp01HAxDt8Ww2hvPuLJdoAjFQIgurMlBr6OUQq2U9RAbWKp0bHLYhj+boDStG+KFcUQIYwy00Q7ubXfUfRsA7t4CgWxMLfqWIBGul0E+wGg4wnA0sp99Ilvw0sYiQlFxDvNGWp+tc0/hbt1wbWcJ31cag4wIzwoSAwbvGMMTEMu6rt/8yywiTwuI311qLZer5WRVLO/UZX2ojcmNMdQMNiMTw4hAtemC6obtEMXQTzxYd7BMZDNh0MGzu1uTK7qa3roTQQzkilRd1w4ysqyjGNeNKyB1qle8I9RaNbbglfV1UqqGCWry9QLoPwZv6Je4bsF3Hh622vTLNIW4KUyJTLA1tnkcvoCBYJXooeuw7KyocQLD9BIUAnUWDK2tMeNyscR0eon5fI6qqpGmKQ4ObOGYTCZhwRHO6yrAmdHvTc5HSUjL5smzDIO6Rl1XIQSLiCCT1OaYCOlyLTiKMW5TulvnhtZb1fAY7s7GupRVgCOGhfDsLNfhsTONDIwhx05qaMaO4suei+Iz1zVqbaCNYzQRQUpP4Y2gpCil0fqedSCq+NpzqYzkN2wdYWWg7UY2Lv5x3kwyxoSFEEidsWYcCmbnS/0bi+a+pw7ZIdok9ppDdlaLjosod+jJvoi4biQRQuwD9CoRpJVTmVJr/WNjzFIIwU8LyF/ScXx8LFbFcqiqctdosw2mjJ1wsL0j9fS9Tcrt7rCu3eZvcl6wbElhJy3MYDJBXEhXtAJET1BMohtKKYWqdhgwUVNEet5bbLmiNQc6rnKD66quUVeVha6Mjt53dJMxWu28FNLpFvKgu7jST8m9IaMbNpdlWVnsPpEyDMm9sWDqnHpl6qAf7lrec0/H4aw6jLX6WCwWmM9mmM/nKIoSQhC2t7dtx7G7iy0f9Soaamd7raburw9BBOGCriwVN4NSjoVl2HakrnAYrSNIpkN7xRNy5PgagkUE0Ho/rOFwGCity+USdV01RQSwcwHhAoip6eZsIRUgwaGT00qjrmpoaVrdhom6CxsYZkJH4fPlY8NOP7MK9FqX8hgbZPrHkCAnyCTHUmtDuWwavYtW2qUUVq1rwxaM5rWklEiEF2ImTd58i6pMNzofjB4/sHjgHoo/e9t4KaXYZqJXDPMMwCOt9WK1XH4wn8/L8XjMTwvIz/j4zne+Q0dHD0kISGJkIJkSCUEbMAEiwJgNW2SKFOemnzJItDl8hwRBsABYwkCvGSheNaO4voiQy8+wN0NVFA6rBqQYIUmSDep308oer2sNpZqdc8j69nGpmzozauCc1DOhXGxsmEf0zo4cjKQ16qp5TXZQVZoaEGVI/ILi7EaklI5GShtYQOvnxNpVKKyKFeazOWZO7AcwRltDbG/vYGdnF+PJxCYQxkWP+bpVu2P4Z68lISj8HKMjDzBnad9lbnT8D26+YG0uzZ332C4ig8HALvIOPtPaRvoa9xxJ0m1OGuw+zKnclyA7nypc8iNaBYTdgLxhR4UC4DsKv3gLEcSd3p3AF5CYylwrhbqqURcWHtSus6lrhar2m51G0Mqm6e7C52/YLuKeHejU+17tPxqOsLO7i/39fWxvT5ClWZuRxf1zyK6TA3dg2fim5oj1F3VhCQnaFcDnDeNXQHTGRMvFcvkIgHpaQH7Gh7WtJkpIUttAYXMEVO8iTU17y+QgEjdA9glxgqgFg8XLAUUXa4DWDN8sIbAn12e9mNjXSJIEWZaiKFYoViXAQBJcRmMFMYdAJ8+uquoaqrY55KquQ+GwCwxvNL4jgnOpTQJckLuOoSke6zebX9Rr1SQR1oFtJcCu+GitQ0ZFM5hslL7UEbK1ITUK3lVFYecc09kUy/kSSiukaYqdnW3HrLLuuBbiEB0cfp292dpRdr7nX5NNjPXzBt80wnW9w8Yi0vX73DQv6zK34BlJGYbR6xbLle2YjA47aL8Lt++76TDILcYaxp0jBzOFRXGduehFi75AWAqzp9S63BcHxfoCoJTCyl2XRVlhuVzicjbDYj5HsVrZZEmXEbNarWwEslHWqSDEBZhQKP2A3h8+x95rkvI8x+7OLu4+dxef/cxn8Oyzz2LscuhlcGJOEcZzFgAAIABJREFUwuzLEw827fTijQV1huoxbcfYCg0BSkmIO1LgmwCOATrdmUwWqlaXSZqYpwXkZ3gcHh4CTvSmjGalDTMb20K4RdRDD+2pWBuiIvKCqwaD1W4B1K5l9nYP3mGVBKHb6pCwpGHnWgTWGutQ2vVrxaaHeZFemqZYLleYL+ZBTzAcDAKNsIEWTLADsYNRp7lQ7qbzmDTFsxNqaWCElEiTxFqlO4ZUQ9O9wjPIucZWbgHwxaOZXVnIwzvJGmPtPexu0trH6Fhn0hlaMpHNx65rLBcLTKdTzGZzVFWFJEkCVGVt1UdBtMcuuGrtPff9Ll12kCu2jWV9V69wRYu5UeDRX0PY4fIt9o+z5iC6+slxEcnSDBihiSNYcSBK+N8rcSwxIUT4nbQ2kQ1I003E14b0aYlud2+zUyxdWQgZBs1+2K+UxrJYYjaf2Xjiy0tcTmeYz+ZYLBZYrgoUZWH/vFyhKisnLq1RuQ7WZ8HHMz3mtpi3z4aFyEb6JkmCra0tHLx7C2+//Q5u3TrAZDLB1tYY4/EWxuOxpW3v7mGyPbGW/EnagtiC0wGtB6rFtvvt+aS7fiBIEg9IyOfZ8F9j5nMyvNTC/KCseZ6nxE8LyM/omEwmdtihFK+qkldlCVXX1gAxulHXh+HUujkbCIbCjldICeEuTKWUZZYAMFrYnQokWAgAHfw04K6y4av3+nGt8U3QWi42LM4emlguV7i4uLBJfUJYq/IkcXCVceI81TCtnDBw3YakhVRFTDNbPGK7dF88riocftDvC4dn9Bhj2kNMvxAbAaMljDBgI2wHaNCGABkw1Axf7SmvsVotMZ9buMr6UpFdAHYdXDUeI8vzFrMKzL3muH1OAoQYdzfRgNhCJ74Ax4PYNnEhfp3u592BCnldWbrecVAv4ubnei2yKzVixjTNMBw1i25ZrMI58Z2ikBauYrKOv/Z8idA1eHuaVsFImoIh4x27u2eWy5WLJL7EdDrDdGa9xC4vL3F+cY7Li0vrNza1JpU2nKuZqXBIIaRWhkn8ZfM9qHdQ3nIidqLKWimUdY3pbIYHDx4gSzNnqTPCZDzBZDLB7u4O9vb2LNFiexvbkwl2d3aws7OD7W3fyabR62Pj/bDGwrR2SIKZtwF8HuCZZnNmanNeLosPAJRPC8jP6Lh16xZUXWM1n3OlFYkWGE8QEBGexa0bLoZM/IXgv+dFcH7nAmbUEdvEGANOGVKu78TJguMQYDBLkNE9s5TN0Pt1A1bplMd5nkNrjdl8Bimso+vWaGRvktoWDhXouXVYMEyMz0fvmbsUXTfcHrji4R1iN0FWvuuo69plVVSo6irg1FhT9rt10yAU2baArPEp42ggyQ4CKcrCLkrTS1RliTRNMdnZwd7efrjJpTNm7GM49cWBdSnQoZuLzrsXxbUFlZ2UO7Thzm7B6noq3XS0ft0jukonP5PwrL14flO5GN9QoI0FWcqy5Nl8zlprGgyGYjKZUJ7nlAWNi7MGcVbzJKxepqpqLFfWYHK1LLBYrTC7nOLs/AzHx8d4fPQYx8cnOL+4wMLZ+FdV5bqMSHO05h/WTqHc9NUtLN1rrUVXNgaVs7T3dH8PtVmYOMdwOMBoNMRkMsH+3h5uP/MM7jzzDJ65fRv7+wfY3t7GeDzGaDRs2fG0DCM7MxXPlnOiWSmEODDMX2Q2RwRzlCZ6cXl5erSzc6CeFpCfwXF6egajVabreqesqn2t9YSZE47sNpsY0f4BhLfe7mLt3vohtvtmNhb+MT57mx0LSkY2EXERiaMyzcYBcHeR2Gwo7fn+FstN0hTLswL148dgMG4dHCAfDGC0DtRc7USBJmr9N4zpA31SJknLNiTNNjOt/A7dw2SlY8N4WjBHsFhse0IihGVHangDErFbKrV29m6yEgKsmIE0sRqAybaddbTYVYiFadwssNFgu7som2h+w1o3DKMAlZg1mydaCxa73v6c18i8fTO7rlBtk+lfu4iE8xktnEJYeq8dKidYJimK1YrLqjJVXZcMLLTWs9lssTg+PjFaq63D24e7O7s7k+3t7Wxra4uklIG+q43BqlihKEss5gucXVzg5PgEx8fHOD8/x2K5QlVZmvhytcJ0OsXZhbXEX61seFiL8eegIe7ZSASDyBhOo8YqpjHwlOE67WrAqMfpN/6775rt32eOJGEdFobDEba3J9jd3cPBwT4Obx3imWeewZ07d3D79iH29vYwHo8xHAyQZamlnaN/h8IUoDciQSkR3yHmb4FwlqbJGQlRlGV9ked/sfqQT30B+fDD96ksV1tFUX5Gq/qbRuuvGmPuMPOAmSkWCvYw7WwcqnCROleobIUzZfNTVmNKx2bhFsYat7Ic2WgIYeNQuS+FbQNUfh0vRwiBfJBjazyGOD7G0fGxzYYGYW9/F0QUGE9ezNUVBnZjUcK8I7U+VLkbll8172h1HR6yKkuLsTuqblw8RERHRqSm95qXJtTJgEh2FknTahuyLMNke4Lx1hbSLMXWeIzRaAtJ4sOCOIIQqLWodjtS7nRSoetwBSRoWKLkSNo00Og4kmxuMiJV/w1cBfiaIrL2TnidIEJSQkjJRMIwqFZaL1ZFeV5U1YfKmPe00u/OFouj0/MLZFn6WcP8TWb+Igk6FIlMGcBqWWA2m+Ls/Bynp2fW+v70DKdnpzg5sV8Xl5eoayvW9Fb9UkpMxhMkMsFqtQpKft/Vxxsk0zejYm4xmgLM6joQXzzir77uJC4aMellU0xvXStU1RTT6RQfffQQeZ678LAD3D5sCsmzz97Bs3fu4ODgwEGnGaSbA3ULOzv4ljSEEGJEoHsM/BIYR8Q8E7J8i/lsTrTPTwvIX8Dx3ns/FqpebVcVf14p86ta6d9i5q+yMfvG6IQjb5qrqE8xitAxPm09UkiJhDyEyTCV0zUoFR6VJOjZ9QhHkZR2ALqhgDDfHKfwCWlZmmGytYWt4RAflSWOj48xHOZIEok8z5qIWdMz5O2IcOGos17fMXDD8sCT7wgE/c9Tjp5blSXKaMgZmyx6GDDoZfyXsxoPDKwObs3MG8+fIBEcVi292eLxYANj2v5INzm6thvGMaw8Q42v7BJuCkA96QM3P7Y//W998xMJ8GyOpNFa13qptD41jA8B8T4D71WVeq9Q9buazYNVVV1WbORWnrw2m8/T9z+4f3ByerozGAxTgDGbzXF0dISPHj7Cw4cPcXJygvPzC8zncyyXSxRl6ajajOFwiJ3tnSDa9Ay+4XCI1WrlhuXLcN0Eg0jHCusLgeo7Z0TUivXtKyL+3zZdE33fpxbz0m6WfPE7Pz/H/Q8+wHg8xsHBAe4++yxeePEFvPDCC7h79y6euX0bOzs7yAeDtQ2YD2ZzryKJaEzAKwD+BoHOSNOM9fAvdB7yqS0g9+9/IOu63DHKfMUY8+sAfl0Iek0pfUtr1cBX3TAY2rx4GObGloR7vK9gqaxIAOT2wq24AhsrjkNdu8c3UFYDiQkIwQCLXgiJbxLd2Xm/5GYho9EIk8k2BnluB5Nn5xgOhtjd2YaQspdW2hauW8FWIhOkedsivUm86/+8lFIoPT23LMPgFa5QxHCD2DAA9R+yNpY2HZtYxm6/m25sIUSoglorMJvOMPcKcWMY5Df6Dc9cawqv6ZwYwrVn68oC8TG0H1eyfLszD9/1iMDOM8YYo02ptZ4qpU6qSj2oqurtqq5/VNfqba30h6rUZ8vValoLXrGU+qUXn0+m56f373/w4P3lcnGktb4rBA0ZJFarFc7OznB0dIyzs3PM5zOsXCwxd87ParmyZAP3Gfsi4jsSv7Avl0tUVRkcmfvscPquhW6RienBMazl/+8p5LEw99p7jZpwrvj7niQyXyxwdnaOhw8f4t333sPdu8/i3ksv4d69e3jhhRdw+/ZtbG9vIx8M1goYh3mISEjQLUHiVTAf1ZqPDfN8Pp8fjcdj/bSAfELHo0ePEqXqPWZ+TWn+LWb8Gth8kY3ZN1ol2uV/kBBX5DpvuJ07roOx1TVFATVJkiLPrRSrqsugxFXKK2q5xcryFysbr/g1vbvYJ5WT+SyNyfYEu7u7WMzngZE0HAyQD/IrdlnNTi9JEudyO0CeZ86Abr3r6EJWVVWh8H5QygrUmqJAaFAqWoMSws9SCjqy4PBZGQSCkLSxiHi79LhAamg7/DcmCCs3FcGw+EQdh886CTvePndfuuGZ2rTo08cUDd6wa/FAHTMzGzbGmKqq62ld1x8qpd/SWv+gqtRbRVm+XxTFw7Isz6arYlkro/7x//iPQ7X8J//kf9PHlTl/fHz8wcnx0f3ZbPbZqqp2GRDGW8SsVo45VYSsekFt4ZwxBqvVquWtBiDY1DQdg8BiQSiKouUn13fe+/6t+5r+tTwt2RePuEtJkqTZhFxbRMLn2oKR/b+XVYnyrMTl9BJHx0d48OAB3n33Pdy79xJe/tzncO+lezg8vIWxc3kOA3dwyNURJDMSuMNMXyfCmWC6IKIFM8+IPnlq76eqgDAzzWazdLlYHGqlvqpq/beNNr/GbD5njJkopeTaUC62IQmGcwiLm4+oJKb+loM7YkRuFsM0zYJwrK6rkLBnjN/VCKxRC4UAuUWW+Rovd9C19iaWv29x5duHz2AxX2A2n2G+WGB7MgmeTN2hYYMdy5AUGFN0Y2+v+DBBEVyHzqNyGHZ3fYvnQnEBQaQaN7qOWG2NLctoZCNu0w4+vbaYOD+sFhtZKwc9WQiKA3NMtKhvDHY6FN1m1jHjavvkJ0nTu/muoO/Hcs9Mg6k/CtbNmdhyNbSua7VSWp0qpT9Qqn67rtUPaqV/UNX67bJSj5Xi5f7+rh4Oh/wbv/Eba79wmmZmNBpdqLp+v6zq94qyfHW5XN5RtUq9H9hwaIOsPFUcV0DGVVVhOp2Gc+9Zct71uEkMlFgu2xTjXgj3Bt/vPt8XF19UfGGJoa5WtnpnJnK1caef3bDTI83w8NEjvPfe+/jgg/v4/Be+gJc/+1k8//zzODw8xHiy5WjAUaSCJhCJMRG9AmBJhCMQHStTv8uaK6uV/uQO+WkpHkopWi6XeVmWz1ZF8deqqvo7dV3/plHqc1qridZatnY41OWCx/Naiha49orXZ5EebahbQQB+gYzx+gayEZ32mKPZCkXp3H37R2rjrtd0KMHkT9gdVlnZYma9pLLGeZWa2YlwHlS+cPjdYGtY3vkcPMuqLCuUZYGyLJwTrQ4fcMyM8d5D5Gy2QwFht+C4DiZQi53Bo88ECWl9UrTOVTyUjz/FLpTRNrSkyH7fmtsZpSNNjG7lZrRs+al/ykCgNWf1zbd3Nz98A5hFVwzG4+6H2vG41vaNtTFmycac1JV6ryjKN1aL5b8qlqv/S9X1/51I+tfDrezHQo5Ojo7uFf/wH/6G/mf/7J/xP/2n/7T3Nf/5P//nONjf5+VymbLWh2C8xAbPaq2HBELiKLy2gOgmM6Zzbcb3oVed+5mFLxpN8XDiQ/fYNa3SEx7xwt6FxGIDyC4ja42S/wSvFXcmSmnMFws8PjrCo4cPcX52ZrVKxEiTBFmaOcGlCOdfCkGSREZEuVsn5sR8JoHF//L7v/+JsrI+NR3IbDbLq7J8vqyqX6qr6rdqpX7FaPWS1npojKbuoI0Nw4AtlNQalne44RG9E8aqbj21tI1UrIu3iIRjLKWR8lsHW44QpkSR5bbns7MPxNHtpaSzWLUG/NxruAsiQpqm2N3dRq3uwLDBxcV50GCkWYqQpxXdtGlkwR7mHbSmumwJA20OhleURzvEDXMO757qIQNmm8uh3ELiISaZJLbYOEjNQxtd+KC1C2ySXyN2GbeKtV3UECxdfDFlr4BnHbpIb78bdvhEVzYQIeiJ6AkwyHYkKnXpdj00vDV/P2pTotkYrbVZqVqd1nX9gTb6x1qbN5U2bxW1vl8siyOj6ovhaFz89t/5u0+0AKVZZm4dHq6Wi8VxOps+ZOCyVvV2rVTiF10vavVi1Vjd3rd7r+sai8WiVfQHbjaQZVlrAzKfz6NQrPZi3Zc132Vp+ULV95zuxshfiyHh8hpYq/sz+zp8D/cuFgusViucX1zg4dEjPHz8EK9+5VV84Quv4M4zz2I8mdhiHN6zSIjokIBvg3EB0EcsxTkzq08SyvorX0Cm0ymVZTlYLpfPqbr+VaXqv620/rYx+gWt9UAbRZ5K26L3BUNE7uFRIvDYG3GPX4iMWxTENe2xfYI3/ZNJAukGuLFTKTM1IUJoh1b5TqU1pO2D0XB1iq19is3FPjg4sG63RqNYLZ163kbJ+p2RLxxeXe7NEMMN07HuMMagcsJAL/wyjtYaqKz+po/N84LWoyki9oZq6MLSeyRF0JkQXuUsWyK8Ng3brA9RuzypaKiqdA0ha2uo53K+rYqcg7CuDzSim5SDK5him+HJ62bqG0yvKEI3GcYYXdd1fVGX9btKqe8qpd6o6vrHta4/MJDHSovlrKjVspzzf/cP/sETLzxf//rXebVarR4+fPhYG/PuYrn8KEmTW1rrCUcQ0GAwaCxGIq1GK1EwKiRKKaxWq9ZjvEdZmqZri7Sn+l7lfrBpUe9eC10SR1zwfFfi30efGHFTEbmK6AEARmucnZ1hsZjj4vwSZ6dnOD8/x1e+/CW8+NI97O3utX73JElzEvQcG37VML+utP7A1HV5eXlZ7ezs8NMCcs1x/8GMTk8uhlqX9wzrXzfG/B025ltszG1d16lWigybq+5si5FTzzC95ZLK4X5tmcihTd/rHd4RhRAhIROQaWzcjWFI2Y+Je+t3uwPiFtSynhB3nRtwIxIbDobY3d3BcrnAuWnyGazNhA9pshRdDxHFUFs73tSEvJCyLK2yvCydcrkNWVmYilpDchk5uZKg8DvbVDzhdB5WsNi2wYh/VgQ7ciOpC30jY714cHeHafn2UHYe0h6arheedrXiVud61SzKw1prflZBmY5ojubOdUfHzh3FGbmMCe/P5ubitTFmYQyfaq0f1nX9dlVW39VK/6kC/6TQ+qIqVtVqPjf/5X/13/xUC83v/d7v8b/4F/9i9Qd/8AcPL87P35Ek7gshPktEW4ZZkINK/YIrpWxBWX2LebwzX61WrevbdyLeij6Gk+IisolUcdX5CQae3tPOXQNxpxtDWsEfTIgrNVBdyKsXxgPAzpCxqmo8eHAfl5eXODk9xenpKb52OcXLL7+Mw8PbGAxtLLFgA0EiA/AcwK8ppd41xsyFEMcIhvxPC0jv8eGHBZXl2UjV5T2jq9/QrP9jY8zXjDG7rExijLqRqtszaQgm5Al0d0NhF+mGssbA7aTRm1bYXhhsF+EN5YwW7gYya1tL7gzibfEhEFMUuYsb3xSbdkN5mmM8GmO1WLmgqMqm43mKbpa3dvzd0Crf1tfO5qFyXw08wY3zvQsZinMb2vRICkXWdyiJlGCkUTcmQkStt6pvClGHtYUYzuO1991+TCPy9IyXJotCut/T/oc3Bb084WycN/gHrGfbuwJBm5sUb9/hfncNsDLMy7quj6qq+kldq+9rrd8g0A/yLHtgcnG5LMvqP/m7v/2JUj7n83k9nkwu0iz7UEj5WAq5FEIwe1t4t6j7IqJb2qh1CCum2sadiP+3uIgMBoNW4SmKwmlFbn5/dGdjfcWg2yXFlirxkP2mlN9N78v/DK01Li4u8MYb38fx0QkePXyEb3/rW3j1tdfw3HN3MZ5MApsTwD4RXhVC/EQK8YCJLp4WkGtP+vGAqH5RCP03jea/zYa/CsP7rLUwnmHTl4Wwlhzmgn2ind+aNTj7nV/DemJjrES9aQPWlqk42lZImzeg3SC72R23C1l4S3CqdBJu8sqN5xP3D183pau1h4LGY9dIEonFog4L8nA4spBV4gbTvnhEnxU7n6e6tvbrhSseHiMOr9nqPmzxEI7lZDUwUYF0jsWCGrU/9Rjjiahg+NeJTfJi3UbDlFr/zK7ciTq6NRkKi4J23w9ZKHC7fvQrxK8lVvVQp6hldNIOqGzTvdtEAXtRcGmMuVTGHCml3q+q6gdlVb5RluWPirJ6ABZnf+OXf7l8/sUX/0IUy6dK4bxcFaWuzrIsPRmNRgtttClWRmqLR4ZZoA3XUr0D9b7Zgz9ffibiF/c8z8P5GQwGrecVRdG6HrvowFUMrU1ixL6CEs9GmutR3Aiu7C0isW7JvcZqtcK7772H2Xxm2ZPLBb7+ta/h3r172NndRZZlJGQyFkK8RMDnwXgdRPeVUlWS/PS2738lC8jp6UfJYrG6zUZ9Dcy/BuAbbMyeVkp4tgxz/x27KVHMLzjeWNoqlSm6cSMIybAz7EPA8jcvHdHF5S54z+mm4PHULh4RwtaaDbDb3fe5nVwlgIwZJX6Q6ZPavIqaotmH6BNoYd1Ft3CQleoGTXXV5fHCH3UMtGZyh6Z4OB8sgoCIGXOElmX4WvgSo7d43LRTMx2xonRBRgTr0xqfq+tI1k96xL8LrxWRFgOIAWhmrtmYlTbmyBjzltLqzbIof7haFW8tVsv3V+XybDmvi3/03/6jv1C/pP/6d3+X/4ff/18Va7NIZHKSJMmJFHLFQGKMIVYKCbxnVBbs+6+DlOKOQGuN5XLZEv2Fc+Q83/w1Hkfn3njx7qIOVwhU45/RZYHJTu7Oxzn/vohY0kCKsizx+PEjlGVhk0FVDaVrfOYzL2Nvbw/DkSRBYgLgJcPmZWZ+l4xZ4hNQqP/CF5A///M/JyEEqqrC1772NT45vqDZ4mJfK/Oq0ebX2PA3wHzbaJ0o3YWtnkTJy9HNa3UfHHZ57ds74NDe5hroFJHNl4g3XvS20S7WqcWuamqJD1S3KYbGa1aYbyQzCEM/t1NSLjPB0iSV7YrSFCCyg3V3w1F3WB4xluqqDhTdsqyC+WIDqVCriMRzD5CdXfi5hzdLbCAoG/VKcWQpAZHacE21HrMIYsgqPq1PCvMZY6DqGs6F0aXiWXzaRJ1Ia4faqeI36kIQnecNT4g3MU7lXDPznA1faDanSutHWul3jDGva2PeLKrqweX04vwn735U/E//8+/pn9V9+sLWmB8PRkWxKo9IiI8YfM7MA8OccV0DDKRZ2nK0rev6xt2ANzJcLpdhpuJ/lofH4iLiF/Y+dtZNOot4eL/Jrbc79PfPvU582Fu8eh7nfz9jGFVV4uTkBN97/Y2Q32O0wWdf/hxuSQkp5ACCnjfgV8F4j5mPV8tVPRwNzae2gPzhH/4hLZdLORwOMRwOzdHRCVXl5bZR9ZeM0v+eMfw3jNYvqVrl1qJCr1lnx+ZV1AqM6rBpOvbhBgbEHj6ijj6EW5AHs13kES96fZcI+4Gto4QKjoJ0+roJ975ZOCTL+ppz7BgbP8HbnaOtBlcuLMrnlRjXAaVpEuzei8IG9GRpGnx5fKtjouCnsiwcTbcKBUf4zgCR/qKrLBfU9rcSIrLSwLqhIkQo3i3tSPDMItdwmCj0i3/qGZH/HL0NC4Otf1lE2zTcZnmFgtG7Y10HpnjNNr5LGUco5KH4WpR1xcyPjDZvG2PeVlq9Vyr1QGvzgTL8oDA4PS306r/4z/5z8zO/WYXg5557rpSJPK2q8uHl5eWFYXOolcos689etzFFPIZ/rutCfGGvKptG6Km0vnj43X/mPLR8EbmqSF238bqKJdZ3ND5dVxFarpnHrj1GOOaV3Tyenp7hjTfegFI2vldr63ZBh7fTwXDwjBTiS8bwW8aYH4IwCzvVT2MB2dvbg5SSkyQhIqLlcjHSqnxFqfrXjDG/wox7xpiRNtomQJBArAiPRhw99Z5bhWXdayokFkW7y2iBCI93Ox2QdYbtdCtxQJXFTGvUdQ0hCJLFxk6F1wzb7SLMIMCQKyYcFnmOFj5v4OjhqiCG6wRXSSEhhUBdVVgtV5ilc5sDHtETjdFQSjcW7GWJqq4tawlwOg7fXTWdQjeDIU5pa7oSERWIiLqMZnYCaqz0RQe2ip15b7rT2wQZbYSz3Kw3YVdEyBZz3RNFzNHQgp5gtM4RdBp0gPYzYxJkAJRgc8mM+8x4HeA/Ncb8qKjqh6uiPNfMcyVkeZ9Z//d/73f4L+Ne/fVf/3W88847xXe/+++Oz07PPmTmc610XSsFpW26JYAgRk3TtBGZXrHAdt1xjTEoisKaekYMQf/VyniPnAO63Uwf86s75I6pvbEBap8jr9ci2Y5HrQ3FrxqoXzcr8dZI3hPr5OQUr7/+Ouqqcvn0BCES8cydZ7aSgbwL4GUivCCEONFazaT8+LOQX+gC8pWvfIVns5n58MOPxHK5GKZp+qIg/DKz+TU25gvM2GZm4XUO7RvVbLRevuE+JCyGNv0uMnATdn/cCOkM2Lm72gtNdMKgrCWGUhXqyg6cZSItZTTo2uIMCo5mI+33Q0LA5c2EIhOEcFoHAZ5ynPsu7RCm4yjr4C1jGLWqW49tpQa64qGUgmZLRRbUwHvNTYx2t9G1yhaxsy4iXUiE8Ysm9tAXG0Hd4SSHzIRPpOu4qojUDLIDELsgCIKADAmEN6wTPQVjvaKRC+oSUjCYC6PNKcAPALzDht8E4XWZ4McGeLy6LFbT6VKBwH//7/+n/Jd5r37zm9/kP/uzP6veeOON07KsHtV1fW6Mqa0djYGBgVCiRem9KYwV02qbbHubfe6LSJzvkaYpBoPB2vXfd208KbX3Zh0TwNy2bbkKzrpJEfEsQb8JPT4+tkw2AtI0xdZohNFwIAXt7gopXwbhyyC6T0QrANWndgby7runYDYpkbyr6/rbhvhXSdBXwLTHzLK5OOxi04oj7ZjdNSe/T1DWLTTNn7WydNWyqiCIkDlPKCll0/AY45LEGCQi7rfbNdSqRlWVULp2rXwSFlHjxInsX7arKwl1RUS77sboTxtt42m1bhUOz5hiJ5g0voC43GX/RSCkSYJBntmQJaLQvfg8BrtbVC09Slfx3Jp5bOhAghElOdRPNGr0ViYFNTkpQlCv6WUnruPJoQrS9UFGAAAgAElEQVRsJiLEP9sYhoK2GwkwRCgiAhaNNOslgtdtZq6cyjUwHhOgmc0UzO+BzesGeB1EPyCJ96RQx9kAM1mj/g//o7/LP0/36je/+U39u7/7u6vZbHqZJMlyMMh1gE6j2UTsPOA9pzadP7+I+wIRIgKUQlEUQVvS1W1kWRZII30phn1/73P37YO1Nj/Gn/v2YN3PaTaJDrtK9U0zFyk90cUWx9OzM3z3e69jOBxiMhkjyzPx0kv3xpPt7XtJmr4GwX8O4mPNupYk+VNZQFblIslSdUsI81UwfgOMb7HhQwAypKh5LL2JHCJABLFenHfRsT7cqCmO+d6LxQLn5+eYTadIEond3T3s7O5iMBxCOHM0r2w3bIDIHsFf7HVdQdU1BAnIVCJNs2AlTtR0E3bmQRESF1M829eAUtqmCbqCEXZc7oYxLcW7LSJsTEMUIFjtxyDHaLSFnZ0dCy24m7NYrULX4QWZIToUfXRdEb5inceaRbtXoVMnxId8VyPaqvUO6shuDvRJdx0bf4QbQWht30ICaqxViGAMWj5ZAYbk69lxET2ZQaTAvGTmhzB4g8DfEYK+KyF/YohOMTDLg92peu7uf8A/x7esnkzGpRC0EkJUVVWbolgJZhMMFf2CKgMrsW0pcpXVSOgKYc0XV6vV2kDdPzbuRPoot9fBnnH3cZMjJnX4TimG4qSU1z6fiDbMSewm2cYOpzBmCGbg7OwM3/3u95BmGUgKEkLk9+7dOxyPx6+A5T1I/ERpvQJQf+oKyHf+5I+JxHII0IsE8ZqU8ssMPKO1zozTM4RFSJACc22saVECUGqxpJhdBedrxGG378tO4NdHSmHP/JjPZzg/PcHZ2RlIUMhI3gUwGAzXOP0cOqCmSyCQnS04XNTumkR7KuOgrCYhL2xN0YTYWkW8VYErVFUdDAZj+Cm2S2l9P1JqCykxHA4xyAcYjUbI8hxlWWKxWGK2mKNYrWC8tbVXgQsBEi6mEdSi1Da+Vt0I4Cbpr0XvFRE1VzSzj3Vqb9NVciAK3Ewg9vEhzL7iYmA0oN37lIl0cGZ0zkN8YPM8WmtBIvjOvj8N8IKZHzH4LWL6nmT6Eynlm0mWPZJEi6Q0+t6Xv84/7/fswcGBXiwWM2P4sdb6xGi9z8wjZiat7RA8NkiUUrZEhZt2/n3f9/HIRVG0ilI8f/AkEd+JdBfm6+ZnfdqQbk4NNtikNJCTirgGV+tENrG+/MUjhISUjDRtOrr7Dx5AutnP1nAkBnm+dffu3bvD0egVAG+pup6dnZ1N9/f3zaeqgCxmc9qejASYUkOUC+IUgPAFwC5SYFi+8wlAx3VdoSiLW0rpQwJyIQVJB4PEOwMT3c/Cba1jpg+7Qbant9osDzsPYNMMPXf3BAaD3GV0t4dzHnYRsSivxQjjAJGAGzt5NONUZyUfRvLWfIUZmhla212dVjoMx41nabFLyYuCkII6Gw2unLhccykFqrLCdDbD2fk5ZvMZVF1DCoE8H7j0wRRIEthArPaFHTOtiAQEyahAkOVUdcWBiIoMIqYWiVYIVLAlawkEf/aHh0U1FLzFiXRsNeGyJNis57j0jUQa8gGUYZ4C/A4Dfwrg34LwhhDJ/VE+uDh86V49noz5F+WeXS6XejqdzqbT6aPFfP64rKq7xvCAGdIYHQqIV5L7OcgmW/arIKZ4RldV1Vqscnx9Z1kWXqfPcuiqNMO+QXuLun3NBsXDd7GhY5cGfNO5iC+Ssaq/rq31yfffmGBnMsHWaJRmWXZwcHjry4Ph4G0p6UhKufw4s5Bf6AIyn895nOcrSpMHEPoHSpnPMOMWgEwQJUTEzFgS4QMh6HvG4P7F5eXu0dHRV1er5bYQIh+NhhiNRhjkeci9iAFvLxBb0xh4PJUIg3yAyWSCqixweXGJ5WKBEzumtyf04ABJmvSwcrgzJ0A7c7yHDbLG7ohoZNy92MKi6iA6tJkj2t8snS+DtmOt352tVoXNsD47C8rfLM8c08MumGnnhqKgaowKQWAUUYhLDUp00ab6diNtQ/EItZY6N/LN19JPovPoG4DD2ALOzIB3ZrUMCvvZ9u2YoyJi7frZgFGAcQrgRwD9G0H0RyC8yVl2VE32ilc/+xnzi3bP5qMR7926VWnmRVmWc7FYVGwMsxOsxtCQH3h7NtamhXPdZ67dnfh5nVIqSplsrk8vkI2jlG8KS8VD/D7/LtEZnm0qRF04q8+V9+MWkSzLgmJ9vLWF7cmEJtuTiUzlF/ex/04+GPxEpslRXdd1mqb8qSkgv/3bv83/9v/715Wuq4+kFH8khCAiIWQifzWRyS0wFsaYt0iIPzCMP3p0/Cj/8MGDv356epotF8tEa4XEaR3y1Po8bW1tYTweN0E1Qjhoy/S0qPbOHwwG2N3ZdQs14/Jyivl8bgPv3cqws7ODLM8D1bCv7V0TtUWrCvW4AZOffvC6pV+7g27gKWbL+NItRT5HMFDsDWWtSaqyRKUU5vM5Li8vsVourZDOPa5yHlTrYVN2EYi7GqYGHoSImFnoCgFFsDChBoZ0VOXWZLz/hn+izPAbyvafZPjuWG8eFJFJ4ob9toiYuGj759nPiwWRZsMXhvkdgP9EkvhOksrvp5n8QAhcvvKlb9a/qPfs3/ud38Gbb77JP/zBD9SbzHq5XPJsPrdxxJ3Fb1P+eB9Vtt0JiDWIyxeRuHjEr+edpf0cpM9K5boCtrbwf4zi003cvAkE21dA4i7Oa2oup1O885OfYHt7m3Z2d7PtyfbtUT76bJ7nLyZCviuFeOJZyC/8EP2v/81f4X/5L/+fIkuzDwYZsZCUCxIJA/dAeExS/pEg+sPp7PJMK/XLe3t7nx0Nh3fLosjLsiKlapRVheVqhbPzc7tLyjIMBkP47mQ0GmE4HAZmVWApRRfxYDjEDu/ZoTwzplPbiTzWH6GsCty6dRt7+wfY2hpZ9WjAbt0NQLzurxVU5YS2Pwk1flgtXL3JISE05oQAWjGrxhU6TwOOF+QoPilc2J7RUhR2YC6EDQMCrJjNiuo0hFBNFgr5ECjjqMXGDv/bwJYbisfZFdGswxcRB1utOx5esVOkDUWi3xCsa4b1UxeSZqZmYAcj5Dpc223BxAp9Zz9ih+Qzw/wRGD8k4j+GwB/nuf7RaMucZQOunr37S+YX+X795je+YcqiWB0fHZ0naXrOlhRgbLeRIM9yDAZ5sEKXsungzDUzgT4qrS8GvoCsueN2oNo6Yin2QUjd4KgYhloLkerAV1flscf3mmeeXTUP2aQ1iY9uAamVwvHxMX704x9j/2BfPPfcc4PxePy8TOQXIOi9jGjGzFMiMp+aAgIAv/mbf4v/9//j/yy+dPvWh4LwR4CpwbgDIU6kwJuCzdkwz7+Q3jr8NgFfALDLxkhV24tquVri/OIcxycnOD89x+XlFGdn51Z0NBz8/+y96ZMkx5Un9nvuceVRR1ff3WgQ90UCPEEAw+VobXZNa5ovkq1Ma7umL5LpD9CftTKbNZlkJq2NaXeWQxIYAiSxQ84QxxDEjW50o7uOvDMO96cP7hHhERmRGdm4GkDFWA2a3VVZmXH48/d+V9GVDAZ99KLI2Jg7SldpF7he1IPe3UOWGp3FSXyCO7dv4/bhHdy5c4jLV67i0uXL2N/bK0C9giJcY+UwV0xRql5SeXCR65NFjtSs5jOlC12HQ891R1zghjXXvHZpc2KySjxPAhzC83QB5pcKbGPGKCUjN6xUyoDqNkiwxhaz9GoHNK+08Y5ehFCVvKDBlqRTh9FGfWoyENsmenbN79VKg4yU1BQPh2lmCRrMzInWfIeI3gTzbwH8PUCvex5/5IV68q2Hfpp9HZ7Vixcv6r/+67+eTiaTW4eHhzeXy+VUSqmCwEcYBgh8SxUXuT7CdAhCSugNYHpTh+J2IFmRHqlXFmY35yYfd7UZOnbpRO5G3Z5/uXhI2+/Z9HfkdFdSSnhSwrOWT9dv3MDbb79Nb775ZjAY9K8IIZ4SUr4rhLzuef5WWMjXxkzx3/4P/z1/+NJLi3mWvaPgjUjIvu/5SeD7lCn1CEn5LzXz80LKy1LKAMxUhB0lCfb393Hu7DmMxxNMZ1PMZzNMZzPMZ3OcnBzj+OgIQRig3+thMBhgMBii14ts7KvrveMXato0SXB0dITRZIIbN27i8OgIk+kU165dw9mDA4RhaBf5cn5fNhnV3Y37YJCjLq8v/uyO2exipbU2QLpSFaW5YRiwO70viopihrK7tiRNrapV2ehbUZgswprZSWnxCYcsrQudibbAOlXwHjfdaGV05di30+p8qLlj6DKeWjfe+ryKSMF2AxgV7Ys1PdQzZn2LmV8noheFoFeg8Y4XhEcy4OTRx36o8TU6/uqv/ip59dVXT27fvn1CRIvhcKB934fne5B5tIEwFv1aKSS+XzAb1y2+bTt0N+jJpQm76nG3C8lxl3VxuG0Mvroyva1jWfc58gLSNM5aN7biWhAQ2cLoSa/SiSwWC3z40XW8/sYb3v7+/sGgP3gw6vUeCYLwD0EQ3mbmtGtq4dfKjffaT36ip//xP07vxPFs8PwPfemH55Jl/F0dx/9KZPwX0PpBMAcqy8h1Z/U8Dzs7OxgOh7hw8YIJQFrGxcx/NB5hPpsXLI35fG5UrpYG2Ov3EEUmDS1LU8xmU0ynU4zHY5ycjHA8OkGaKhweHuHw8AhHR0d46KGHcPHCBQyHw8KrhxsWRW67eZvCReqLnp0Fs+NCWr3Jan+0HUeSppUMD+WIMfPsEpNN7rLdrPBLlvqOalCfk9znmhyWM7dKEXF1HuWPN4Dkrj9Uk3WI+/nazlklwXHVd+ozgdrzRc76jAmSTKAlM99k5rfA+AME/U4L/XvRp/d6wcn08Uf+8mtVOPLjlVdeYSJSFy6cT7XWWZqmnCYJNGt4UmJnOMT5c2fhBwFG40lhWx5v2P3ngsKm0Y7rxKss9bweY5vv2HMV/Da03iaNSpei0VSA6gWkzhzr+lrFmNgpIp7nIUmNUv2dd96hy5cuBefOnTu/s7v7rSiK7vN9/4P+cLhAx7yQr52d+/Av/5KZF2I8me3Hi/QZzfhXROIvAHwLQKC1Js2lZsJdYYgInjAnOQoj7AyHOHf2LGJLA0ziJeazOSbTMaaTiVVhL03+RZKawJrFAkfHR/jkk09wdHyMmY2Fnc8XOB6N8MmdO7j1ySc4PDzEo488ivvuu4ozZ84giqLVm9DGHFZnvKuLmltQqLL7sJG3gHHo1Ca/24VMcg2JVgoqyxAnCZaLBRa5FXuW2W5GQggTE+v75hyR9CpGhqVVtSy0H61VMD/ngipEASEFDK3azLy0A/K3sqzYjR3mysNT7OyAWqIG6qH1K90IdcVQtjjI2ghorecEvAfgFSHES/DkP7Km65nKTq6cuba8cvnPvpbFAwAeeeQBMANKKV4ulxiNxhidjOB5EmcPDnD1ymXcd+UKQISPrn9s8MmTk042Ifl91DSmcvEQFwdxfzYfZfm+v5bW29QR5OFRTWOulcTODf5XdWpv01hs3XhrZQzs2ax234PQxurl1q1P8O6774mzZ88NBv3BfVEQPBJ63p8i3xsDmH8jCwgATKeLnTRJn1Aq+6lmfoGAB5g50lpT2yLkspFyx1xpxzWe7yMKQ2S9CH1rC7A8s0Ri0/qSJEWWJoiTGLP5DKOTE5ycnGA2myNJUhOulKVYLGPMF0ukidnhTycTHB8f49q1azh//hwGg8FKRKwLFLumjtXsDob0pBmlWesGUSzqotCU6ILSW9prMDMylSF1/KzSNC2+zMy43J0FYQCiHjzPrziernhb1axKCmjfqYA5YF50HKIpPbCeN94yojJ2txva+y3t+2vdCN3NSMv5XgGDlzFYa62PwPoPQohfeOy9HJH30UjvLW5c/yM/99zzjK/xcebMvrHWyTJ4ns9KMfueh7MHB7jv6hVcu3oF5w7OYrFcYrlMcOPjmwj8IAeLmpMcW8ZY9S/XMmUdFpLnknSl9ea5JHWzxaYFv20kVf97txNpK16btCLFpkx7kNJEP2fCWL0fnxzj3XffpeFw2O/3osvDYf+xqB+95veiG8y87AKmf+0KyGIRB7PZyeU0zX6olHqBtX5Ys+4zMzUZ2zWPiHSp0lb2hlPGYj3fnfT7faRpgsViaYKTkhiYATzSWMYxFssl4iRBmmaI7ULsebKY704mE3z4wQeYL+Y4PDrEpUuXcOHCBRwcnMFwMCwS1co1qCp0nM/mGI/HmM9n0FojikIMhkMMBgMzTvM9a2joBOwUuIR5DWVJBGlqOqw0TQx4qHWR+W4eOlX8V0hRmAbmrf6KnXrRessiYtZVjTeJ5qQwTrZVttWWosA1NeIzVXx0LSJF3azatBMJTVBTzfpGlqkPM53cllovfvjn39P4BhyeL1lKqaT0Ein8pB/1VBSFfOnCebp48QIO9vdNLO14gsGgj/7AJGEKIaCyrCCJrC6cVRJGXbjrGoQ2ufDmP5vjBU1dyDrtRX3xbvqZripzt9htovauw2mM/MhYnHieAdOlkMgow3IZ4+atW7Szu+OfPXf27KUrlx8a7u1eC6LozagXjdDB6v1rVUBu3brpnYyOzqksfZqVepaZH9VK7aZpInJ78QrgnOdKO7tFNysjxw60zStAUdVRAN4m6jVCFJkbfDyagByzwcwGuwgSCEIL0nkeQIQ4TfHxx7dweHiE69ev48rly7h27RouXbqI/f199Hp9u0CXC2SmFBbzGY6PjnF0dIT5fA4C0OtFGOwMMRwO0e8PEPX7CHzfGDEWegyYnV+aIknjQqGbpRnKpMbS9Tdvf8vkN2lolZ4H6dlxlvV8Kjo3Z27rfrmFBE5AUt2Zt+rtw6uVPu8kaE0RyS9yDVTcbtZEq+OsbfPlYRX2dX2AEcIwE2nNrDPKMElmjG/IsTfcAZFMBMmRlPIwDPzpcDAY7u/uev1Br+jCPd9HfzDAznCIQb8P3/NWbE1Kx4bVnJ2mRbfeibg7fLcLcR2BXZHfuq6hCTSvEF864hZN2E39+egudDR3ohDGDcHzzPMr7Po0nkzwye074saNjwc3bty4PBwOH4gC/2IYyNvMnG0C0782BUSpuTg5mewsl8lTKkt/qpV+hrU+0NrkLq+OrkozkMri48RQKme3gor3jVmImbUFjn07t5fY359hd3cPvn8LmVJIs9RW/wi+78H3jDhR2zGUyhIsF3PEywVYGY2FtAI6MIyCXZcCwCSJMR6PcHJyjMV8Dq0ZnieRpQmmoxEWsyn8MES/10d/MEAQhNa+PUOWpIhttxTHsbFnt5+j7jZc/Nkr/+z7AaIoQhAG8D0fnvRMYZDCCcsqszmqhUFUo2YtWG5ohqbAuCFfjTkerlvylhOpLVsMtMT/dag7tQfcTUbM/83cehEYe8S85ysKDwZadAUuv+rH4/d/iyFkAiGOSYpbnvROfN8753mel3eh0vPRH/Sxu7uL3b1d9Ad9+IGP5XKJZmiqW/BUUyfShDFIJ6N93Rirzfak6c9dQfSm11vHCOtSVPJnUlogXUoBpQhKKYxHI3x882Pv/ffe39vb2X3gzN7eA+cvXLwBYIkNlN6vRQFZxGMaT2a9OI6vZVn6I63Us1rp+7XWkdaaWheJmp+28ZHS5ZxU2Va3xdnV7MjzQBfjp3Xm4AwuXLyI4+MTTGYzkwhGBE8amw4AyJQ2TrlpBg2NMAixt7eHg4MD7O/vYWdnB/1eD1KQxSWWgBUoJkmC2WyKrChM0mA1AJTKkNix2nw6QziZIApNemCWZYiXCyzjGGmSlNkeuZ0K5SubAESpDxEsQDKnOIaIoghhGBY22cKK46ieDChkrYhULd2lBfVMEfLKS7FJIPj5zKTctmW7MVXtdbSuqpIrho8oFOiCmfcEcB8LcRke7WQ75w+/KQXk7L7PSvQUk7cEiRmAJYhYkGApPQqCAFGvB82M+SLG/t5e0YG0Xbsu0cTuOCvf1bugt/vzORaS43yb0hHbAPJ1Wo42LKQ+AnOLXZtjb5eOpJwGmFFWZrPkJ5MJbt68SR8cHAwvX7784JXJlUcWi/hPWZbd+UYUkOVkGiyS7EoSpz9SSj3HWj8I1gNmTXXv/bZNJttEQO0AbE1V373RcgA5D0HygwB7e/u4cuUKkiSF8DwcHR0iiWMs5nMs49jiIQZbkVJgEPVxcHCAq1cv476r9+Hy5cs4d+4c+oOBCamaTBAvucz0yDLTmUgJCGnFdw5IbJXmSWzEjPFiCc+TYA1kygDjmVZFbjoxVbQjRZw7AYJN0XNFVmEYIfCDgmDgpgUKx6tK1GzbSy8rqhjlGdpvvcP4dHhHK7jVuZBsnAmsFBd2Nh7m3vAcGw6nszLW/gLEQwAXCDgLkr1lPBDflBHWQviQREyG06zJFA4EQWjusShCFEZgAHvzBXZ3d9Hv9wq6+6YFc91i3NSFNEfFVi1Vuuz4651HF7X4evyCVvCbppFbp3FWLl614+RcYKiUoe2fnIzEnTuHvdFodHk0Gn3r+Pj4/M6dOyGA6de6gBx98IFcTBdnM+bvaKV+wko/rbXeN8WDK5RYWhU+lKN1bT2iKj5RuhyXtMxWK46yQiDqRTh3/hyEENjf38NoNMLJ8THe/+BDfHL7NjQI/b5RtQ8HQ+zu7uDg4AAXL17AxQsXcHBwgMFwaAG8xNBnpcRysUS8XBYOuCw9m3uBMscjT2YDwMXOV0Nz6dJbDO9IGC07rUCQABiCjU2JlGZ2GgSBGV35XgGkF6peQfCkB8jyfNBK2qAViOWiJouj5NgMnHTFNl3H2vXeDQXh9u9dzRvfUCxWB+sr31Yqnc3mwPPyhac5v8EkWHLGzHMCFsRI00R/YzCQVEQgEHsklJQy8zxPBWHEvV6/0t0ygH6/XxBDfGuf0zQWatr11zUZTawsVwOyrojkuSTrGFldhIK0wdqkrTDUx23b6lKM9VypTJeeB2Gjs7VmLJdLjCcTcXR0vHPn9uGV/b1bV3tRtK+SZCyDIP1aFpDpeCymJ6O9NNOPK9bPEfi7AF/SWgdFwFFl8ahOKchAmXYRtkrtvHg4uMe6C+RmWOQAdBRGOHv2LIbDIRbzBW7fuY1lnIKkRBCEOH/+HM6fP4/dnV2rajfq9l6vhyiK4PuBTU0LIWUAz/MxphGyNCveeEHpLaxIioARQ0EWEn7gI/ADkJAWMEwKMZtiKuUTlQXY+Xy2+/DsLDgIAgPqg6y40CQoCSEA3xQPCekA6WXnIaWE9C27JXeoLVx168XDFRx2KCTU0kFQTZ/fNMNuLCK0+jMtD3phGR7HyJSyY8XQkh8c+iUzSBCToBTMUwbeBuFlBr+mOTkMo2n2TSkgfjpFr7+fBWE094PoJPDDaRhFyliYiOISCBB83zOhZqFRiHdduNvA83p3ki/MdYDaHcfm3XJdiNum9djUTVQ2E7X/3ea825S93lZAWotSvrGTcgWUT9MUo5MTun79enj24MzlgzP7j1+9fPndJI5HzHzYBqZ/ZQvIB7dv0+FsFiFL79esn2Wtf8TA/cwclRG0LdCHs8HMg+iV0kXxwJriQXXVMgm7UFAlnMnzJIAAzIydnV1cu/8aLl25jL29fZw/fxb7+/uIQmOF4kkPQlIldCl/82EYQGUhFpaZUn0YUI3mddS0RiE/QBhGYDDSJLWeUozEJJk4GQtULpnk0AvIgG6Bb0Fzr4wHdTPahcnoXnHUzdkf+Y4nLx4m8lVUiAkrF4kdnGpTIWnD1OuqeyLLgOL12bH5fxuKR/5HrWGzFpJCrZ+fd1P4ZUlbNudDMzBTWt8A8xsAfk0Cv2bof1ouxifLdKS/KQXkf/5f/3d+5f/86xS7wQkC+YmQ8sT3/UxKyVprMqQVFNhb6BuPrLIor1901y3CbdRe99mq4wYFDX6DGrztPTQxsbaJEnDtWNaB6V1GWnkcRU5eERYH0VpjPB7Txzc/Dq5cvnRpNp8/mWbpO3G8fC8aDk8AZF+rAiKV8tJ4eV5l6dPM/CMiepSZ97VmWXYXKLfY3DyyyPUNWiurf9Cdx+eiUHpSEY+b034L9haAXq+H+++/H72+YZXsDIfw7W6LnJ2sG+wEJyLW9z30ehGW/R7ieIEkiaFUBncow/abhRAIwxB9a80SBCG00oj9uDArZDvCqtyMTpa6eXDy7sOD53vwbfdR4D51RpUwzqkrmIel/uaAZL77KS5Ja/HApwCzN3Ur1A3vqHljufb4SimTBW9t7X3Ps8UjcKjXxahBM2HEzG8z41UAv5JC/t4LxAeKF5M7Hx1l//pf/y/fmBEWADx05Rl14h3Plzw/UVBTQaSa9EGelMU9KD3Zqq9owig7oV4Nu/t6cVqlmHcD7Nsovs2WI+uLgatrqUf5bnPrU1EUXecIU0QWyyXG47Gczmf7i+Xi2mw+vX8yGe3v7R8IZqamLuQrWUA++uA9qeezfc7UE6z1cwCeYtB5ZvYK3ALVTWz9IhWMK5WZjHDbdWyTb0yOFYIB4M1rKaUAIkjPRyR99PoD9Pp9mBlvUJ2n1nYUDBTYRv6ucz58TrUVQmA2nRpMJMsAnVWA/SCMMOgPMBzsGAM1lUFIWe7mScDzUiid1TLhdVlAiKz9Qdl5lFG7buCT/V7rg1VnXhk6pGFbedKz0bQrg6LG4uFiIbQB5qbVC9ylkmD1F9a6jryIFHkthkGXJAniOAYARGGIqNdDYPNjAJtbb7QoqQafENObILxEgl4SJP8QBdGti5cuLc9evPiNKhz5EV7ymMbIKKUYTOkq9GXuBXJwM7PgEZRqNhhswyg2ifCa2E2l9klU7vt1mMmmiUWbnQl1KBzue21y621TvTetZ/nmMO9CsowK+5RlnGA2m/uj0fjM4eHR1f0zh5eGu/tv7x2cPWl6qr5yBeSNd/8g5smsT4q+BcaPwfwjBl+DRsjWYXdlZO0CqPbPBV3X8YjauKvIq7i1b8/b6eaYdcQAACAASURBVLpRGwmC5wcII8tYkmb3JKU0a0qtFa3kkzcYKhIZPETsCASBj8FggMl4jPHoBNPpBMvFElmaVG46KaTBLsIQUvsASbvgG459miRVi2uL/7ieQDlu4bbwhcuvc0YKL6zcRZUA6WAn7uiL2lb3DoWbN5UBbi4N6y1IGoD3NXhHlqWI46RItzOMoTK/gjhfsMAAEs18mxi/J8LPAfErIby3wv7g6KmnnkrxDT6O9BQxZ8jYQfBq+faAwfIC32B5gQXXDRaxXv1dX4jr3UV+Pes7+8aRj6ju1us4yKbuZhPgX7HKWVMA6uyxrgD8atHKox5KfVa+UVoulzg6OqKbN28Ozp8/f/+58+efnC9m7wXz3gwmGvyrW0Deu/0+JfM41Fl2lcA/IOBZgB8EY6BZi1a67gqOanb++ajJFA/tYrloW2rIseuAQ/1VdiEmIgR2R9qL+vCDwGZ9ODnkrFdmsfnfuaMdN96WCLaN7xevPxgMMJ1OMJtOMJvNEC8W9vUZmR3JQQh4QpR4hOchzL2ukqTMPsgyW0itW6yoPTiOkjy3G8lzyqWQhQFiDtLlxSNn1BSRvU2VoA1vqgOALSD4uhFABShvDZ+iVWCs0oUAWivjaWb9kTzPs5qYyIxWnJcSgjSDZ8x8A8DvQPg5Qb7sifDdXn9n8uhTjyh8w4+EF1DQbAmC5ci5wKfKrBnf8xBZCrlnrd3bsI5NXYD7zLlFZZN3lfss5FTtrs677ATZ1HEUsjsN2lB0Ps2Yru3zVLRKMBql+XyOT27fphs3b/bvu++++5Ikflpl2ZtaZx985QtINkqkAM4IiKcY/GNAP8XAPoPlui1r9VwbrEIrp4A4O55NM/GybcwxD5O1kd9UfhCgF/VtJG5gInE1FzRa5tqYxgHEnRlW7SbhSjfieYRBv48oCDAYDrCY72I2m2I2nWIZx5YZJqxuRFU0F57NBMjSFKlNYEvTtCiAOmeaWBZMhZLrgokWjKtrPnIFr+8aO+YAZcvT9Znaptcai61es0VpnDOt0jQFWz+0Au9wRh/2Vyqt9ZiN0+5vCXiRQL+V8D8cpmdmDz31gMbpAUkTkNl+U32EWW8GpWcYhWFobIDyBbeLhqJpwW0CuzcBz+4Yq63zqP5e6//Mq/HS2+hC6gVnE5W4C+aT36vlxICKAKosy3B0dIzDw0N/OpudS+L04SxJH1BJ+vfMPCUi9ZUsIG+++YbQSu0I4BECfiiInmGIS5qVr9sysVsBM+V0HzW75jXFIzcLRIF7KCPw0woAw/NMFG4URfD8wNycNgkw15WUtuJcxMzCmfk23iBOJ1K+HQHPDyCsAKvfH2B3dx/LeFk49BrzOSts80qMwvM8KDfqsvDsMoVQs66cv6Lzqu9anMwOsjejZ4uHb+N/qT46aBrR3eXivulnO73uGoYX2xFnfo4AFHRm32HFOThbyoxjgN8i4GVB4kWP5D/67N0Iqb988M8e4NPSYRceP4QUKWlioRnCIZRXuvAS9M092LytNgWb8sXX0XLbxlibFuicQFHaJ2kAohj3rutYumahu8D/towucum87mjOjsZmsxlGoxFNJpPeYjG/sFgs7k/j+FK2WJyw5imJEkz/ShSQo+ObNBtPwixV97HGC8x4gcEPMjjSDu5RB0PdcL/SXbc0R+xCicvvaFHoGkTV7iTLANaQNv7WFA8zD9eV8VQZI6udv6voH4pCUZt7cksLm8+JpYTs9RCEIXpZv8A2zFdZFDwHCC9FfQq+HyBTGXSWnxdVLWR5ZK7T7q4UEvt6xj/IN/YkgirXwTVEbOs6Vui4WwHj7vcSQLzO5b29cNi/zzKFLEuR2dGkH1hMR/pF5KolBZhIWubbBLwOwosE/juA3yAtD30VJQ/+9MnT4uEcNz+OKfSlBJMHsOC2y0TOAi4kPDsq1Ws2H+sA801fLuW2bm3ibqBcDKK58FRtbOoQXD23YxOmUi8623Yh9cJF7gRBSpBSIPs5lFJYzBeYTCZiPB7vTKbTbw13hw+HSXB7p6diOPYmX4kCMp7MPJ3o81rppwE8R4IeB7CvlZallsFdEKrcXW3ZTjldN49a1Y52Yl3xcO1KDHOKC8A8Z3CEUc844IYhhJAFY6dyoR2wvMyn4EpBKJZWqhYTl6JirNZ5ZQ0kKv178pn9chkjSRNopZHagulbPn3ObNFaw1MetJ8DdNa+PX9fOcGgrlrPi0khtvILxhWJ9fNp6vr3LZYl3PZzRKsjTOdu6LJXY+ai69BKFUp8P/DhiVLfIQRBmCnFghkfA/g9Ab8Ugn4FwttZmo2UQvadP3/2tHjUjjM7A4oXscw0B8zwIZiqc9wqviWKTZxdxG130gacd93JbzNKqpNJmkZgQgisCHKxnUK97X20iSM3dS6N5ACUmhByBL35urRcLnB8fEy3Dw8Ho/H4gbPnzj2ptHgPGBx+pQrIm3fekNks2QP4CQ3+CZifEizOApDFLpzWza2sTUluVaIdZ0sHBGttJ3OhHInKTDy3exdCIAgjRL0+gjAydNkVii47hcLVXpQpr27xyN8bN2kimm70laA9k8Xh+6VKJE1MJklqQX/fD6wBZOmGq7UbOqUdsaIZwzFWf78BjUtvKzO2+oxtcrnbt3Th128qIrktSZKm5vpKgSAMLJtOFnRhuzBoDcyY+QMmvArQi4LkK5HvvxvtDWcPPfzEKd7Rchz3RpCxEEjhEZNk5+Ktms1QxfEBa1L6uo6B2nCFttdzNSHbFIEugPgmy/emQlUfYa37/a2PVG4SvfJMMOaLBQ6PDunw8DCczWZXVKYeI6LfA/SOxUL4ni8gb775BoVjv6eVul8r9WMwnmfGFa11wCujqwZBGniFIlsZWznb0kavrLzNI2NXrh1DQ21B8yAM0ev3zejKdfZ0Amvy37+accEr2pP8ZxtHLW27JKoWoOIjCInAJ9MxWe2C0saF1JyHAJ4Hi41IkACELRIVZlpLAcnz0IWQxXiMiL6Qe6ORqtuxx2gbn2kH79CWaRWGIfzAejNxOc4EQTFjAo0/MfAyE15kwt9noI9CP1w89PATp13HmuPOnGlfMVkHHLIy1pVNU8UW38YfN8lA67qILriG+/qbfLGaEjPXLdDbdkTb5IXkU5cun3Vdkc3FvlQba2lmLJcxTo5HGJ2MvOUy3mPgKoGugHkPRMcA0nu+gIhQRDpTV1nr74PxHICHiDDUWpNhNrVR9qvFQ2vXIJGdICkCk7sgsmPjUc734WQUK5VBqQwMRhCE6PX6JgFQGo+ofDTGLa1mfWzlmj3mizZaf9Z5p/VigmZbEEEET0ow6yLDXUiJXi+C1hpBoOHlKnEhDNjHAJMGcx4mJSAkl9hFLesix1TcB5s7Yg7rGFjcYexFDdjXuqLDGzqP3JbEc5TleT574e0FZFrzMYPfIIhfEskXSYg/KOZPfvz888lpedh8JNkumBMYh4zV8OLKol7ca6LVlKAt0nbTAr7Nhqdua7Kt4r1JVNhU9JqsWdZhOZs+R/31yj9X3bOFXeugNVSWYTwaYTQeY7lcekplQ4Y+q7U6Q0LeyMOm7tkC8tZbf/RExmeZ+Wlm/qmGfpo1hkSm82AqWoeVPWjBBdRczPSLbI/a7p5agoPqJok55pFlynpd+Yh6fYRRrwTNHS8sOMXL/G8qQpLysRbXVNBcmdY30w87z22tsSM5i7zWCqPRCHGSYDAcYndnB/2++QxhoI3ORBh8hJwkwlUcp97WOw+BW2Q6mxduh5NsM/Wida9p6dhKl/nyYCCwNF3XytvqXxiERLO+DeAficTfCilfFCTfWip18sLzz6enpaEjBrI7YG+kQDor0HNyKki5sUJtxlK3l6GNC2ZbUWnDQZoW7yZbkyZg+67u1Y5jrrbR2911PTaGQVh8V4gyeROA0hrHoxOMRiNMp1OaLxZhHMc7YZQOPU+GAOb3bAfy+msvkVbZDogeIcIPSdAzpMUlhpKVgCduPzk5CFyyinS3vAlqsSnRqnDjFMIzdN1ezwgFBVUZS43z1NrfO51HTt9dZWThrooH18BI6Un0ej0MhkOcnIxw584hZrMZMktNNUiwhq8U/MCC7MhVqlzp2urnPGcjVW7YluKxrih81gGDnXaIvFo8fN9HGIQWHxIFtkJEzMxLMG4w+Hck6OeekC/5fvD2kjF94dln1WlZ2GK6QGWKIFd66IYOgd3ukovY6XoBadvJr9vBN2ELmxTuXcdE9XFRFwykDs53wVi2xV9yHZtbEIu0TGf0vlgsMZvPMZ3NaDGfh3Ec72VZthcECJ3A0nvrWCzGdPvW234c831gPAvQs0R0TRAHGkyMzb5IrB3nSheL6IDG5rv23PtIO+wtZg0hCGFoEtOCIDRGipor3UXJvmoqALzSYVRou6gWmOL7clXcBhX3qq8WQwhDQd3d3UF64TyyLMNkOimZZEojRWrpvmyjdH0boJh3GmXHt/rw1jqmbeiFuMvsp0955BuDnO4syBhHupb1+ZgTDM3gBYD3wXgVhF8IgVcCye9GMpp955mnTvGOLY9sllCwTI2tcY2p1NS3MnSpm+o4wmpb7OseUtu42zY58t5N57FucW/ywer63rrSewsarx1zC/te6pq6eLnEfD4T88Wil6TJWa2zs0SqRyQFAHVPFZD/8B/+Dzo+HntC7p4nip/Wmp8H8BQzn2GtyTXVcyYQKwtqbqtefjFWItHbTmrezuV4hhMwRTC54L1+31hY2Nk4bMZGXqy02004RWKlUKBO022n6DYWjbrYsGVvn4+coijC+QvnEfUiTCbT4u+k9IpzlQvmGAzf8w1HnDYPlArw0xk93PWoyvEH6lJoaMODtbowGRFnprIi2jRXz+cz7pJmjQzgCTPeJdCviPALQfz3vhDXH37i24tosHtaPO7i6L33LsnhQArDKZeoRvdU8JB8I8S6Oj5tus5tBaOtsLQB79t0E5twiLsR/HXBaLglDmGr4uaA56VervyZ5WKJ6XgqpuNJbzGbn01303Oqr/rCVpx7qoA8++P7hVLL/SxRzzDjpyB8G8AZALIEpmnNslDNNXdddtFgV7Kq/aEiUU+zLjsZZdhIvl/iHtKTZkOuHY8roCgeJRUXTjdCxqbdze9wCoBuYl81AuarZ4A77FIIhCAIcO7sWZw7d84KooAkSbCMjbOvZkMWSJLUfGYYoaJlHjlK24adX03R31l30VAg69TCu02wrWMhJZ6VQStLw7ZdRzHbBtvURSiAR8z8TwB+wcS/0MBrJL1PBsNz8WnxuLvj5//X/0Pc73nsyQET7QvQAIBgZhfpqKKaDKfL326hbLJR38ZRd10RuRtb902dTJf31mYeueUHsRhIue6VuhXzutPZDEfHRzg6Pgomk8nOwdl4R2cqJE/cWyMsvvVrukP9aL5QV03nQc8RcBVA6GoSQPWFhCoLbb7g52woza6P1Jpz6cwC83x0lQsP2RELRpHNe6Cis9AO7bXw6KmZIcLBNepTnjxLZLUl77jr4DXutlQ9VZIkPF9CSh8AIbNCOc/3CiwgTdNih24/EFBQdHnj2GBd17CRSXWXmEhbweJaV6MyVRTKvPPI9Su19l4xYcyMtzTzixr6ZwD9Icv0nevv3U7/7b/7yWnxuMtjb38IhF7AQhwwcIXBBwTyKxiiQ+ktkje1e/+XV7c+lmpL+msrBPWCsI6xVc8G2VRImqi/mxhhdxON2+bN1e3JKb8K01P7o3EcYzqd0XQ6lcvlMsrStAdmn4gEM9M9U0Cmcd+PWZ5XqX6KNX+fQA8wUZ/zhDJnReCmfA+H9aQLV9luwHk5ujInMU8oNKC5grQhTTloXqaXmQ7EnY8xVwJmHVxGVyi79fdtLppL8e14MzB33I/nLBIJgpkYsC2cxvjQg1YaSZJAyly9zlBpZthszMZ4TdBWs9a2ld5Vuud+R64i9m6LSFthKToPrUyHUXxuM6arLCrGEHHEwB8BvAiinyuNP8Spuv0v/pu/OGVafcpDRZKEIA/MuwycBdMea53vygy9HrXuvIKvcePdsWmhbrMPadrVN2V3VEDnjqMnt/vZNE67m7FWmyfWts9moQkRAsJhjyZpimW8RBwnMk3TUGvVZ9YRAAkgvScKyN/94md0kvg7GfCoVvrHWvOjRDwESOiab1JFaERUzPjL7kN1jn4sTly+S7DFI/fL0jYYKggsaB4GkNKNldVrfXUq81sXLM8puw1MrdXi0QBKM28uHjWmQU7XM3Gy1mqF2LBhhF1AJTtpZZ5JPswMdVkzQ0tp2EktWcG8YezEzMhUrvROrDpeQ0qBKAwRhCE8JzfEXSY+FaXXcQ8AUKjmXZpuYcsCyljzMUO/DsaLEOKXni/+gTTf+Wc/+eenxeOzKCCxBvuQJEQAIGJmv2IVRewYY9nnLM/bqZufdlBxrysc69hXm15j0+vWgfpti8e6EdW21iVdClKOhbDz/GWZdetWShBRKEjsEGiHSIQAknuigAz3DvyY9QUwPQXg+wCuKKW9cvbZDqGyMwLSygLZetXlFi02F+7FzxeZTKnKYhP1IkS9njEIzLM9igQ/R9fRZMOOZgU5u11LMd6qjtoqXPjaQr12bFWrHuSYphWdVq4TEdXl2fMkhIwgbQhUHC+RJllh886sTYa7q/1wonCbgO/8+5RSWCwWmM6mWC6Ma7DWGr5vQrIGzAitol80FJG7mfEaJ2RTBAFASAnf8yrOqjaHnkFIWPMdBl5jjZ8x0UtE9KaUdPzDZ/88O136P6NDMjQAYiYCiWYxFopn0iRApkiSBJm11G8b6W6Lc3QpQG2FpP47tgXXu4yqNg13PxUGsjLGW51hZDYDJ8syYkYAiCFD7AAIAUy/9AJy85Mb4uTwaJ9T9TAJ8ZSQ8n5mHhirki4t4mpSV5VKSq2rTy6gyXUcqhAdZlYsaPUeUd9ke+T27Gy+oMvfXy0e7RGbq50IKhYhXLOurQPU3DasarB1YafDMp5XskggK23WueLNRSBIQRA+GQM7QRAiNt2CfZjBgHTia9deJ+dz5y6fs+nMGDhaS/l8Mc+yDCJNTWGvJBjeHS7Cmq3zshV/SuvZlTsF21AsEBiEmJlvMvA7gP5WQ7wkpHw76vXH3/3e9041Hp/h4e8E0CmDFQgMa39QGTgWt7TSZqy6WC6xWCwQx3En36h1o61146auxoZu8ekypqr//PZjK6wdubWp0u+2wOSvkaYZ5vM55rMZlouFSNPEU0p5doT15WMgSx0HRHRNs35GMD9BwD4VN1T3GWBd89HpijhKc50vNsrQfnPco9fvIQiC8vuMOa2jHOfaQlyK7lasSurFBNXX4JoVRxf2VeviCVTsmoUoIyxz8R9cgSCq2w8iKkY8UkrEMkYSJ0htcqH727fbvRmhome7jjAMAFAh0szZaHyXtMdy58qO+NMwyTzPt92TABMXY0sQJbZ4vArwzwSJFyHFO2GvP/vu9753aoj4WR+pB2IlQRwC3GNGiNxDBwYLLO4Fpc0cPokRJzHSLKss1JuyNbqA1/Wd+N1+T70AbXq9yuRgCwPIT2s3Vxa89UWWSEBphflsjsl0iulsysvlQmdZpplZE/DlWpl89McPRTxb7hLToyDxDIgezJQaaK2prerW2zej+SjZUtvkmudxkpUOxmY/eEGAMOohCIzDrtaOk24j5oFKR1Q1HWwqHmYxJeZaz9Cwa2DeWmyXi4NEbnIoZMV2pLprafZLJ1DRtQgyeQwiiQs7F6XM2loEbbU12/Z8CCEQRVEROJUz2kqAW4O1KorIygKwDebBGpktSlJK+J4PzzNOwbnnme1vEtZ8E8CrYP4bEuIlSeLtg53d+UPf/vYp0+rzqB8EITSHAtgDiTMA95lZVHfo5hnJlM1ksYmZd6v47lokuu7M689pk93Iyu/LN631ERfursasey+bxmJ1/KZVcAkgSRMsTQeol3Gs0jRVbE37vrQCcuejOzQejXpZmlwjoieFlA8R0RmlMs8wm+wim1dzrIZGVcZWWgMdgHNzDYWjNnfibe2C6Hk+oqiHMIoKF9Z1gDlc3lXNpoSd/A5ip3gUGA3BtQjhNeJAd0Fe9ykpLyB54pg0tu2VVj3v1hqXfccjzJoIeoFfpBkmSYIkTQzArjJ4LIuRU3OpR1Fooigyi7pDnc3jNQUAhaox5LYPez6KVMqwrUzErmMzn2e5ExjMCQMfA/gNgP9MQvydF0XvirA3f+ipU3X553V4whNaZz0isSeF3NGafaWymrs2QWkTQ5DEJeGiq71H+5yf1hacTcLE9t36Bqxl3Si2w2tV9S/tRWEb199VXVxdB8JWE2fycZIk5SRNs0xnWf5uvrQCcji945HQB9D8HYC/A9BlC8wQO4sYOwsmkTP6sSrxAjjfQsJPznjEHV+x1XtEUWRMEj2/KDLFGdd1rytX29FgkMhVvANNIVFOsVnXdVALDlIZJ7mf0RaOnCJLQIVksKr1XjOzhfHUyhdhhjlnmVJgxcVOX7S58hIVjr3FjVxn0+SW3fZirzzcbbu1vJMsHJMVQIYAkQPmZbaLFTxrLDTzdWb8lgh/Q0Qvs+T3d/YG80ceOrVi/zyP+SSWgacjL5B9IWUA0sIYTVRPu1YKy+US88UCcbyEyjK4IoWu46mmsVLXIrCt0WH92SnWGefeLWgrd7E5ykd8n2dqgus8wQxopZEpxVmWcpZmSmUqY2aFL2uE9fobrxLrZUiQVwF8F6DHmPWB1vAqmg8yi2Z9F+7qPdzRlYtIUGsLKyqqavM6GTSzSfQLQoRRhMDuuIvdOkoqroYusQt2s8zLolEvCOxgAPWFv9PIitu11pWwQCJTOKSEtGFRpmBa1bzTpVGN3cZtq3ReA4mLgC1pAXSdWEsQbVP78vFgU6FbE8hTXB9H0NR5aJVrgHLqNXMRrytroi+7/MwZ/AGYfwPQfwHkKyD6kDM+LR6f8/H//tX/Tdl87Hn9KILvB2CWVLvHc2ZglhkAdzqZYjFfIFUZiNBqutjEqFqHk3Sl2nIrixKdxkZu0bjb4vFFHE2kH22fK8PGSnWaxirNUqWt8vlLKSDnxRV/rE/OZqweBeEJEuISgIhZUzUkqZwRcm10paw9uxtN21Y43JyP3PNFO6OrgrLr+4h6dnQlROFxteqkixUcpPTEaioeq9LCtVbMnf6OVyQfFbqulDYoymI9tnho5tqLrrLUaHVgaJuvsgCRY8CWpAkos4mkYQDP+bc6sTfHndo+F7nvh7rf+Ln+B8gBc1lxGTUxqARmjhn8ETNeIUH/yZPyFSG960sl4heeO42e/dyf/fvOUJqmIXm0w+BdZg41a1HvdgGjQZjNZ5hMJ5gt5sjSrJpMiGYarXbu0U3jp7pxYVsm+qZCsY4+TA728WmKx92EWW1T5HLiT72oZkohzVIkacJJkmZZmmYWA/niO5B3XntNjNPjXUX8KBN+APC3GDwweDKj4ldSA1DZiVvNs80N9rGp+hPgeN7ndUEpE5xiZvI+gjAyJonSqxSwFb8nZkvhXXX4zfGNClDmemGhblxdo+9yk9tw7e9aE8ZEAZpL6VVyC1xhZRGoRQ0OqE46o6ubN+esPO8FbiGMv1ea6srTn9u9rIZlruki8g6q1vpvxDxWikfVmgTmvTKIYs36A2i8IsA/I61/IwSuR2dE/P2HnzstHl/AMdD7Yh5MdgFcZcZVrfQus5arUcmW9r1cYjqbYTFfIs2yxiTCdQvupiJQt0DpgmfUAeh6h9M2JqtT7reh/Ha1TrmreZUjiagbuWptMMVMZcjSVGdZppVSivWXBKKPewu/H0fnoPGUYH6GwZdYc8DWqn1FzULV6lhqPXQ1X3zDSRJOnjIX+R6ZsQGQAmEQoNfrwbfhUMYGpbQ3dn2tqs66VP6NUyiacA63wPBaIWCnFbc4OYXNgpQQ0itwj3wEp2sYkRNZtbLVp6byZa0k8s4PrA1NWJqxlUozKGU4+roYQ4gi4rfeynPLNao3Hh32S8b80RpmSs8UDyFrYysCM3jBzO8z42US8meSxW8oxo3s/Th+8vkXTovHF4V/6InQzH0SOMfQZzVjwGBREYzaGyBNMyzmC0ynM8yLDqS6sSy64Rrtuykzvb6wr8NDmjQbTYWDLbuwS7HpgqF0YVBtk32+VS2pPaFmCEM5nZozpXSWZpkyI6wvvoC88d7rkuNsF4xvCUGPCSmvKa2HSmnZeALczPIimzt32e2u96gHROUsHUPZtS67UYQwDA3rylWVa67akbj27NZct2xMquwrcHN3sqluNCezWncgbigiZM0gC3GfrHYeLeeKgXUiYDsO4JKwUHQxbNlZAqEfAD1zThfzOdI4hiCCJAKF4UYb6+Zs8w3FJv8ZXToYCykhPekUD0tjFsTMnCilP2LgVyTobyDEq6kXfqSiaPFn//yUbfVFHjvENAVLzRRq1hHIwGbV62rcsK2RHyaTKebzBbIsbV0w64t6U1dxNzTeTaytrt1Q02tt+/s/B9DD5LE4zuGVQgUUmJPWzEpprZRSaaaVypQGf4EjrA9v3KDZeBQho/tA/DQRPU5EBwR4IO4Q9sBWWaxruMPmC5Azg+D4ZeW55r7nIwwjBHZ0xc4MtVws9YrK3B1nMW8OhGrrMDYXD67D3NX9goN7mNGVgDRxb1VxZcMpJVDrYs3OZ9Ha7faq10pIiSCMMLCfc7FYIF4ui1cOOhSRTbsibixsedKkEX1Kh21VzprBmjlh5k8A/J4Yv2CN32rSHxLR8s++f1o8vuhjyUqwoIAIAZHwYETD7soKZkaapiYRbzbDfD5DHMdGJ4T1NN11GMW2RaSpK1np5juOvdpec93/7jKe68o+bSPquCzX+r9rRyytmVlrrRVrpbXWmjWTIBZf2I0zm8ksy/Y19GNM/H0mfkRpvaN01bKE6yAvl1RbZReyYkHr1H2UIFYOAittzAGFEAb3sC67sKOrdVoPJ07xSQAAIABJREFUtlL0ikEiray8qKYZrM9erkDsNV0Jrxnm1G1KynjKKl232E2gSyyUM46rnO/2ai2lQBhG6Pf7CMIQDGMDvYxjJElSdAld0ge56VQ2FI/cnkRQWTwECMQ5EE/MjCWz/ohZ/4qA/w+M36hFev3k+o3l89///mnx+IKPN/79vxdxpiINOiAhL0oh9gUJv9xI5al4Gss4xmw2w2w+xzKOjQW/WnXXXodfrLN0bwtjqsfbNhqkdhwXNeIgW8gNmkZdXYO0OmEftWeOa6Nkzte7Mk5Ys9aaWWul1BfHwnrzrSUlyw8jAi4LSU8IIR4lIc5pzT4zV2g5VX2Aq9VQ4Bw452r6XdvW1RQOUVB2c8CVtQaB4PuBpeyGNv+6QYtRZ1phNdimsvRynRbL7cWjXvk3Zng7gydbPGRO2bX/hWVc5VhRm2qEaBUwy89bca7ycaErPGwA4M28lBCGoaVDkxEbxnHlIepig+2iO01sYjN+zOzvNJ9f1pTwRMQkKGbgOjO9TIT/TIJeIU0fLsfp4r/7H/+n0+LxJRzj/TNEUkZC0IEUdEEIucdgH6q8p8h2zovFAuPxBNPp1HQfShUd56Zd+TqMoa1j2GYBbqPxrlN0199LE0vsbj24uhS1pnOzUpAsgYct0QguJs3MbABhxUqrLE2/uAIym3zkBTI+KwU/ISCeJCEugiis0HbbdsR28cppmpY9tjnfnIQjGKRKzC2zcZ2NoghBEBSjD7b/xg4lF86orB4QRXWLkjp1twNXnNDOrOLW/1ENtym6Dzh02/y9U/cdv4vluGOrXAfTvMyXn8vzPPSiqPi7NDUOqvmN6vt+UURozXtoe5/aFo8cuJTCaF1KS3bYHgQJGLcI9F+Z6W8BekUI/wOvFy7+xQs/PS0eX9IRXDgnsyTpQfAQhB6IPWim6tNgHJTniwVG4xEmbgFp0Wo05ZvXmUuf1sKkXjy6qr/z76tvnu62eKzrVJqy1O8+ddF5SqnYCNuMPtJxgi+mgNy48Q80ncz7KuNrAD0N4seZ+QAMWY5F1l+AKvOq2g20j67I2dFYr6UsKzyWfD9AEETwPb8akGRDqNxCUQyU3JpQceF160ez3frG5L7afGd98UAxuspZV0TNoytssMJfPd+6Zk65WjxopQSUN7Pn+4icWbGxQCiLSCWDY8sHV1nyhBAET5Zju1xbYv5DiWa+RYy/F+Cfe4J+A8UfUaIX3332dGz1ZR2vvfY6pekyIEl70PqsZj0EQ9bvKwKgtcJiscR4YjqQYgx6F0yjNo+qT1M82kZom0wUP4vuZ+NaskXM7epYrhwaVz3oCDAbM22/WFlfps+9gEzGgc8qO0vMj4DwJIGuAuhpnYuHuhQPmzCoc1+pLsVD2M6juiianbLRfARBUKTRVWi6RcSsrv2bm+HBjTN65g57aub2DmDN9xaXk+zoRpY2JTk92TCuVuecGzuPCvNMF9YujcW6cddT3sC+76Nn3/t8PkeWZWXOea/X6SF274w84x52MZDSK3Qu5QhNMJgTzXyLmV8lgf8ESS/BC987c+bs/MGHHjotHl/iobUmlamQgPNMdAWMM6zho0F0m6RGQDgeTzCdzZAkaZFcyS04Q30Hno/CNiUJbpsD0qVArSscq0mF6+58dI7C3fRMdaEHu/Sahg6GCWACawjF5E8+/wLy5h//KHWW7oLxIIBvC+BBgHaYIWq67JXzxzWzRL0S1ORgJPVdTCFwQyWlkDVDSoEgDIxg0PMKVXolj9nN9NBtTroNuIEzWqMVvANw1RdttNpNnZVwcI9CaY5c5GcLCKqqfG5CE7h6/iuRwE5n1VQQq2+dHDyFCyt43/OAXq9gZimlEMdxkUPidiK0bodUZNNrA5jn7sJuipogECHVjNsAfkfA3xDpF2Wg3p3N0/kPHnr21JL9yx5feZKShYpYqwOALzCJXWL2KpoqMs9rHMeYTWeYTKeGGm6Dx1DLh3GLwybGkptN3pShvk3BaBtjbcPyKv+dVjKA1v1olzjpbcSG3LRBhTaOhLk0wbaGJIghiIUAAluLP9cCorO5xyzOEdHjBPoOCJcADphBqOwoamoALi25KwrqhoHXSvFwqzzKTIjcpt0PAkRhBD/wIaSoGDGuMK7q4DlXO5IKfsH1bPTNO//SXZMbdR8ru4wa46pwFXYYUyt7mRUbaK5kyrNTJOu5KuYarc7P2LEFrexPHEaayDuRvIgsrZJ4sQAzIwwCk0fuGCxyw8gqB/ELwNwZWznXOtWa77DWr4H5JQj9CnTynkfj2T/7yb857TzugSNeziXprMdan2HgLIiHmiDzZ4ZsPHWaJCZ0bDbHYr7AcpmUBaRlsSwwzA2K8C7dxqadet3VYVPWeffxFK8db3XOOdqiu2pjmTViSgJMgrSUQvt+wIHY/3wLyBsf/gPJKQYgcR9AjxPRAwB2GSxQo5dWXXC4cNt11ear1uO0dqdh22YbLGRew/Pt6CoMrE07VxMF6ydVs8vDrbrrlpVuxcgRjYLydjPETcWjstuSAiSsPbvIaY/VQlc5p7QO8UD5/rWufG2cNxOtNymx6v8gCIrzOV8skCSJ6SqyzJgdet7KDjKPFs5HEJ5nRIL14mHfgGKNYwa/wcAvGfwSg9/OaDx79nunxeNeOF759W8oXsaeYL0D4DyROEdEPcBMItyddRzHmEwmmEwmWCwWSLO0cFhuYjPWx0JtIHsXvcbGLKEKHtstUI06jcm2owV/ZjYmTdNyLqcK5ATTmzwgwZ702Pc8zqcHn1sBWYw4jECXpaAnpRSPEdF5Zu03qaKrCx4V4xgjGiwLCHGT9YbzOvXioUqxmRACge0+vBw4z9lFjFpQVLl+MjW569ZCpZruBd58ozRlnLQXD1EwjvIAJwKV46aGG3dd8apz3Su5KsytEEyhq0E7LuIe0p73/HcsliYLPU1TCCktGO5BSKp0Q2BjHx+GgYmhzQsNKqIxxdAjAP8E4EUB+iWRfFN5evTCc//mdGx1z+AfC7AmnxlDEnQghdgRQniF6aH9P601lsslTkZjnIxG1r4kXSke66xH1qUVbls8NrnwtnULbcB6/TXdf1s3Mvu0nUaXrst10XCWODtNECQod/eW1uFaf34F5Gg8p5sfvjMk4BEAP2Tmx8C8o5lJ63L+7maXlICp3Q0rbfUMHVo3Fzh3LDw0m5Q7oLQr8f0AQsjS36n0YF+xKkFlPFVd513rEmq60OTcAMXFoUqpbwqsbR7JicZ8j5I1ptsbDLSzwVYp0rySUbJp19TGFitmtbCWJ2EIISQ838dyuUSSJFBZZvyNKDGYVT7+EsZjKwwChEFYxUvKh1IxeAzGWwS8yIRfCIh/OiAxeui5Pz8tHvfQoVItPUF9JtonYBdAwMxUblDM86a0wnyxxGg0wmg8xnKxRObcm/Uj30zVF2f3OW64bzovvu3BTu2pftsq05t+1wq1v0Py4GdBU667bZQdndF5Gb2Zx0IGLMj/fArI6HhER4efBILoAgFPCkFPCUEXmTkoR0LktkeVBYvZLPyaSwopb/IsMZ8QEFTBI8xuWkNKzwgGw9CEIuU2H0XXoQunXxcMRr2YwA1+4tVlllfBaQAttN5mgi2tFEbHpsR5YIrFvwD5W1ytCM3dhDvP1bWALDeV0CmEVayioQukeggVFUr9fPwkpUQUhqYLSYxORGkFEmaW7dkcD8/z7X+rOg+rtNeseQrG2wR6UUj6Wxb4g2J59NDzL2SnS/Y9NL565RWCViGUOk/AAyC6wow+YN23HbJKlmaYzWY4GZ1gMh5jaUOklFNE2hhNTeOrdSB7VyfcphEWt4iDG4vChlz2RjNFOx7mDT/XhGVsXbzyWHA2DF0DRYnqGmeEuSzMl80Yos+ngIzvjIXK0rMEeoqInxaCLhOJqMAzig9YDzNqWdA0O962a+qHM5Mvw6a4oJWGUQQ/CMqQKEe8URSJAudA4cbrlonS58pdMFFNtO0y0+yAeZSYjrlgwvNMF2IXU67NYmnLCatpXmwaYxG7q1sDueoJgu1IVAvMQ/m1MCmBYRAiizKkaYosz6H3vELfkYdgUZ3SaNSbCzB/SMBvIemX1Av/4O/1j7774HdOi8c9dvjSI80cMukDBl8B4TwIvbKAlM/scrnEZDLBaDzBZDZDHCfIMhM1zeCNuEC9KLgi27ojwt16YtVB9LvpYjo+Mp/piKqt28if/XL6kGf2cCEJEFQIlg0GIiRL+pwwkFk6DwThPiL8CMDTWvMZIi1yBTga0I+K95Kbc55/qCYnQEatfbTLvC5DopgZnuchCEOj+RCykixYnEDHFsUtEhVQfDUTqkK8WnGWYV6DVLl0AWeRddvzeiwtiQIDYK7Tmmv1mFoaEaoqzXNbF2PPrjeXhQ2Z52tv+JwSBhNbK8nQkD3fKx9+lJb79XNYpBUylqz5I9b8Kgn8Ukr63XLQ++SHp8XjnjyEArFCxMAZEM4D2GO2+g/nnkrTFJPZFCfjMaaTCZaWcJFn27c5MdSxDhcDzYtI22ipy469qcvZxkyxTvFte/1NOMi6EK02z61u3Ycd43M5cXA38FIKRFGIXtTjMIzYD3yWdjMLGCfMz+z46PoHHvm8B6EfJoHvCiEeIKKe1pq09Z8iBwOor5oloMuOBblDLaLqIl5QWx3RoC66GA0hqNR8SA/WVRIa2omedUZNNfcRcnuPinEiV7xjcstjblhsK26XKwJCWhkFlZnmJkO8NEnMF9BqLG29uFZcWNDcnRTMNAuYt46k2h6qrsUjPzl5DoulDbhjQZGTA6hUlK9Y4VtKCAmRMONjZvxXgH8B6P+q1PLWnz369GnxuEePyWIitNADCLoohLgqhDhDBE9bxwe3gIxHE5ycnGBqu480y5DZzJ6mrqOeQLiCJayh8bZ5V63bCDVReNuKyLZNw7bjp0104zaiQRUwd3APl7LvjKLDIMBwOMRwOMwGg8EiivpLLwgzISR/pgVkfOsTQWm2IxkPA/wMgAeIMCCC4JpGorJRt/9P65plCbh5jg/H7DYHmC2HnO2uOrd99jzPWLW7o6vKiAzVTHM3TZBacj2q9lgVbbqrHWliRnWdYAkqAUJR5HzYz8jaET02nKCiCq3a3euiOOfGdHb26bDbqNZLbXDoqs1iuxISsYopVe6R6o0uSECQyFjzx2D9awD/hUj8WoM++pP3fny6TN+bx5/eeotkID2NbA/EF4QQB0KKKB9fFZouZsRxguPjYxwfn2A+XyCtYR9tY9U2fKGpcHQBnbsICNt+V3W/UzIWt8FbPs/8j5X34pqkVkSM5TMYBAF6UU+HQbD0PO9Iet5h2AvnwhOfrRfWyXjkaa0vEPA9YvoBoC8yjFV7cbOQ03RQdRrFNc3GJsPE6uiKyiJQAOcSQRAiCEJIz7exHlW7jnzR0g724S5qKzYeXHrGEFzWLW+xYNbBgVpPQkYgaHyuZMWCIV/wi/fVMqqqtPwuG8zJRa/vRFrHbbnPVNPS31gJqfLnJqJAnbnlGkgTl51UwaxjVsx8zOB/IKKfCcLLyOR73tKf/7uf/G+nWo979Pjk9sdCSjFkxnkQXQDRDkCycqdwjn8scHxygpOTEyzm88K3rkLh3dLTqs3C5G4YS03Yx7opL3O7E++nxTO6iBi3fS0rNbfZR+Va6PkefN9nEmKhtT7UOrsjJC1An2Ei4Yfvv0tpnPYBXBNCfIeYH9ead7XS5C64Bkx1h0MAoCssqLYdPNUuUGlhkTvtOhbmRPD8AEEYWQdYY6hYWfCp2r5VeomG4lFng5UW+W6hW2Na2BjasooomM9lcI98tJNfTO16gVHX1pYdwNzJkmduHFlx7WHgldLg+AfQupa/PaxqFUhp0PdQMb/WmvWYNf+RQC+RoN8Kj95XoPmP/ttTi5J7Gv+AkFB8RgjcT8BVGAqvdO8FzRpJkmI2m2M0GmE8nmCxWCJNM5MBskaBvkkL0iXIrKubbsVWqTbGqnYl5mv1Nav3NvNn03GsKyIbVfWN4XfVwuJJD37ga+nJWLEepVk6ViqLxWdlZfL+O38inU1DkHcfQ3xbED1KhH2tIcvWk8DElaCl/E+6GK2oxuzu9lVHgCCc3UEJnEspEQah0R4UinNdFgoXgqkycqs5H/luQtdnZ1X0nEAr+SCVK9JhFGTyS4T1uJJFETG4gF5xI12xdGmLBHbBshaxYPNtDrQH3lIjsWGdNWY7xk+rP8uF2zADPAfjXYD/TjFe9jzvvZ294fzRx75zWjzu4ePV3/yaiOClSXyBWT/MwAOsaZ+JJHLxIBFUlmG+mOPEaj/mizmSNEHmjLDqOENb7ob7HLTZ3qwDmtv+d93CpGkUtsrsWv8+m7W43QD1tqK66bO0YSLaWRvrnZaQEr7nsZQyATBnYBaGYRoEwWdTQDSdIc3eLlHyFKB/pFk/BHCvAJxdew1qqIJag5Wq2pDz+l22AZkNgsMWP1Gq2n34YQhpvZbKxZcb5plsjcMa4iErDK27m5Q0lo+GnA6C6ahcr6scy+AKqSC/OagWDLXqKMWmwSsKdCWWtu2GW/FdbHAMZa7OIFs6DWoopq2OoihFZYYyKJjAC2Z+H8y/BvB3zPqPmcL40ce+o06X6Hv7YBK0mM8DT9IBMV2CoLMAh2Am1lwEgKUqw3g8we3bt414MDZOBVmWIsuyzSFILQWENugv2nCT+uu6jEXX0bvrOKwpn73LvzV1GHWB5Dbsq3pRKl+rSqSp/7yUAtLztCe9mEhMUoWp0l5CFH56EP299z4iYB4K8EUielII8QSAC1rrQNdGLdywoy0ZV3ptbvhq8chPaO6bpIsF0vMkwiisAuctX9W2rY5NOHTf+kgI6y0O2v5uXUNFtnjkDrsi97nK1fjY5M5Yh/NN8aimCW6ZqdB2SYp4gE8PP9RdmZ2HONWsP9ZavwqmX3rk/WPPD45+/Pzzp4yrr8CxK4ZSEu0KwgUpxDkhqE+CZD4Gzte8NE1xMh7jk9u3MZlOkSQZMqWQ2vFVYwhbi4iwMj7rML7aZFRY/z1t+g/qqBTv0u00FY7VLmZ1jN913FVdn0riC7W8T9/zEYWhiqJoHgbBCTGmKsvS/N8/VQcipSeVSs5A6CdY40kCXSKiULFaXSCd5FpCzUbDFbVUtq6ru2oiMpRPuGpsUzxy0WAQGvuLcrTEtaS9tsxzZ8Gs23pU7E1qF35TK7x6JasaBwgIcsZWQhhlvRU0csOuZ6V/ye2XyekQctqyY/XuAvfsdBIl3E2N75trrQW1IRvMrRzGRh68+9AbRajZmGp9G8DvifklCfpd5Ac3d/b2ktOl+d4/3viH18VkPO57gq4Q+AEiuiCEiIwPdNl9a60RL2OMRiPcOTzCfLaAUllhnpibabq79fpXF/rupi6kK2ZQ7z42Wao3dUVt76VN49G243TlUl3eT1MnorVRf+WUf+ZVo8gwDHk4HKZ7e7vTvd3dST8MFpPxWH3qAvJPb7xOKp6FQoirGvwjZv0YM/aZWbbO4xkru4a8C9Fr3XbJ2Z2KAqgqP3A1KKqqONflQswrGYONViWoOQUX38FVTINdFSGvuYjr0POcKVKb2ZrXKsWUVAP0V3Y0RSHg0gCykoWiK4SxcmTFzmyxeafTjpRQKz7S/rPcUGuoNGkk0sx8AuA1Zv6lhn5VCnVd62x5/+M/PmVcfQUOP/hQQHhDYu9+Bj1E4HMABxWmIzPSNMF0NsWJZV8tlyV4XgfQq/kvVQGhy7JymVd360tVsA9bMJCuI6dNY7O2wtIG7LsbYZd00+0jrXrguaSlsmiryvsKAp97/V66u7Oz3NvdWeyeGaYno9v41AWk34Ngzvpay/sZ/CQzrjBzxNrNOW8ya3dPhkPZrezkqWHmXgkPKi+q0nYmKOEHAfwgtKJBrFjBcwPbIKeOlrke5btt1IHcxQ6m0hRUKLZU6jykAElTSPKAqMJavfEGrHVMVBXLGLqurhShCqBfF/x9RgdV7OOp5dmsAokEo/WwxWPMTH8C+GUQfgPgXfbV9Oln/+UpaP5VwT+ghBbekDNcAXBVa94Fyo0lEaCUwny+wMnxCY6OjzGfz5AkcYF95ISYba1G6gVk3VfrM1vOiCoLbNMIq6lYbfLdqjO42rqOZuBbI2dWlqyvbS+QE11RMMtyHLlOEBDakzIOwmDW70fLM8OBIqdg31UBGX9wh2K98BNOD5RW15j4MgE7AKTmNnvAqrstMxvBH+tueccV0SCBWUFZu3cww7PMK9/3C4CuMt/kahUvd8vsqLbLbqQVdWhgSHSGFRrmnELm3UeuqIfjFJwLKjtow51vc7UuVaoy1o6Qaj0O6ItacUomwJyA9wT4Nwy8LP3gbeF5kx/84NlT0PyrMr568WeUHsuAgD0NfQWMc0TUZ2bhbixVlmEyneL24SGODo/+f/bebEmS68oWW/u4e8wRGRE51QygAJAEB5BAN2d2s5vX1H2lVz1LZtf0oH+Qmcz0D3rR2/0CWV/TdNXqyS57IJoECQLEUEBNWVWZlZmV8xCTD2frwafjx497eCQANqssvQ3sqqyMwSPczz57rb3Wgut6CKSE7wdhASnYOBXt7tVuZFGvq9KFVrVVKpjAWjS0qghSmrc5VT+/ixaP1P9K5py49fdl2zYsy/KFEOc1xz5qNRvjVq8b9JbWk1++EInOdkNANNoMcR3gl1jKIQAntmied8RJg1LlJOYWD8r4v8eju4xwbNd2anBqNdhJ98GFkJVuXcI5Kjc1cjRGdtAFiofhnFS1OVE4skvqdESlBoFyF3xycVyoeBTibl9a8WACJHgqpdwKJP+WGb8AiY+dWuPw7be/610uy8/PcT5yLY+tLhhXAXFNCLFEFIoH1evU83ycnZ7hYG8PJ8fHCPwQQvH9kEQ38X5Cd6NmNsJBuv/VxesHF4ZIFRWQi8BKF7UvuWjRUsd3k7VYOz8hBLqdDjcaDb/m1E4ajcZes90+a3d6mSGWC3UgJ87EBrwBB/wKEb0GyT1GAfeBPCQULnABEI/vViR/4s4pVayHF5kVE+dOLcrJkBmluVosQByKTzLjuYYqYZBPcw7DL+I72Fx0lB+nwVCK1xXp0J4yt0baeyNdmJRV2WfGog07qzyHor4MGWNmUzguS3KQ1honRZ+5mikQw2XCM4A/YMa/CKb3m7Xa7je/89Ylaf48dR9//3fkCdFwA39NCvEKEV8XJNogiNSOHQgkYxqR5wcHhzg7P4cv0wISGMZ3TfxBGVxUphdZZMHVxYNqp7NI52F6v1VCrDKIQsGI8txOxvDz2NYo6/6RPpfjOOj1uuh22n69Xj9xnPpBzWmeE9WDz1VAPtrfJ282cyzfW2Ppv8YsbzO4DY78bSrEQrIpBrbkEMq4WqB8oeDwiwy5jzCmNutJksJlKYYVFTLIbO6F+t5Ue11O9QkwjOixMcc2D9tlnHYFZexKSFhIzCCTjI/08aRmF2Yl/VnqIwnSUoYLDAUtf61neZlsLWRzN2iqnJTPMynCl5XnCJj5iMCfEPAOiH9tQ2x2nNpl8XjOjnGNiMFNSXyFIV8m0DqAhnLVghlwXRenZ6c4PD7E8ekJprNZlFJZrj7XbUniRVldnHVOoogrqbLYqxoQPRWxCFLTX9uUSFglpbBs3TSd47xEQ31DWDSRmhQG20Kz2UKr3Q6cWm1iCXEqIGZAxrZ78QLSdl0hfbcV+N4aATeJaAVKwpgZAlFmqYEMdFWl84g9kTixMk8FPbZlo+bUEssSZsWRFmpUbZ64z5D6MetR4H01bwud3aLrP4ugKSjxtJbIXggUEecGe5McI8FpQgpnuJ3os2GdwfkcrXyGa0/fj6lPYe1dzwXfQtJ8BOAhgHct4F2H8ajuBaOX3/rOJWn+nB1u4Alh2R0Cbgii2wSxwmAnvNU4CXIbTybY3z/As739sPvwfAR+ANd14XmeUaxn8rTSYSBdeV62u1cX8TJltwnC0mGyIluTsvdRSuJra5/6HtRCNU/rwibnCgM/anoPtm2j0Wig1WwFtVptTMIaCRKuXkAW5kDqQtgW0ZBA1y0h1mzbahAJMoW0IssqRAu6zOSPl5EIibNM/EFpWg4SBMepwbEdWNEuPkOHs1FeFxYiSYojcJZoJ8WccV7xoBwPUcwfxKOqsd5DWCI5N1UZytmAkTydTflPV0Km4TByARFjJZaFjJQ6V/LrzT9XBNkxmCfMvAngPUD8a0B01/XlyVd+9rPL4vGcHf/7X/0VeVLUAGtNCPGKsKybtmN1iMiKx04JgAwCjEYj7O3vY29vD6PRBIGU8PwoXKxAfV6WKjiv+1g0C91UQKqYGM7LQC/jP0yaFTINA6HaqLARCov+0329TIfj1NDptHlpqTfrtNuntm0dk8MTABeHsA4PD63RZNyRzDcJdJsg1gB2oi1xflHSyXEpAY3g5bm8h5Z5HCnXAcASdkic207o2gpFBJgzOeQsG0PFKtYUxmKtE1G+nEzByVHw+W+O1MUztmi3ICJFfZ70VyAgzm3vlczxeEdhyFCZ06LrAk19t0IVugiGudDFeLdurSKS7xS+ZLkHxm8B+kci+3e2qO2/9ed/dKk0fw6PK4OBEIQhQdwmsm5bwloWgpwgkBlIKISvzrB/sI/D42PM3Bn8IO0+TFCRDg2ZApayAylmYrtsUS7iP1RRY9HzUMXY2qp2KlW6kosURXW9C+ZMl9VrNfR6XbmyPJwOB/2jmlM7nPk8EUJcHMIaj0+swA8GYLzKLL8SBHIdzDUpmYrmqTMxsxnRYLkbLCl4e9rGBYmduSCC7ThwnFqY0UvQNCXpyhuv9zLDZnPaF6mW54bVmsEFX0ze44pLNviZiFphKTbt2a4huxDnOPM8fSEjPYzMDiUwsr7HxTuyoqRBc9dRZcA3uRFI6z/C7zMA4RiCPgPzL0jQb2qt+k7TGVwWj+f0aNbrjud7Vxn8Ohg3mbkbBCziWGl3Gxr4AAAgAElEQVQA8H0f56MRDo8OcXgY5n740fSV3n3oQsGi6at4EbQsy6gBKVrg5xUPHboq2v1X4VoWIe1NVig6fFbFP6uomKjnVcbt2I6Ndqstl/pL7tJwcN7sds4Gg+UcL1m5gMxmkvb3HzsE7gO4CUE3WPJSMt9tNNyL9vsxZCUVzYem6s5BV1Hx0b1opAwAAoRtwanXYDl2NHnFeXt2Jaco3ZhzwZSVwpUob6qQ6i/ICM/1JHH3ETvtCjsqHmqLK5F3hSqoQlpTEGfNg2UOEiysOYoCvLS1IDMEpTvn5r97ZDsodRcphGTwKUv+jKV8R4B+Q6Cn3/7225fBUM/xIWRQA+EKiG5Lllch0QzXBpmM4Lueh6OjI+zs7OLo6AheFFnreV4aX1sg1CvbqKhFpgxOqgpbFXUfRTyK/ncTUX6RkWLdQLGo41mkOCVcqWKuaiog9VoNzVZT9no9d7DUnyx1ltylXi/3wVXmQLZ3JhT4ThOwVsF01SLRt4RItB9lu1JWYmZZKx7zPkCo/UJEnhNC2xLHcWDZVhbiYii27Kx1FYpJoua6m3ndpIJIACUxe0QlmD9pO2+h8B6UpijGhpLMlTgE0wUhpVRid7+gY871WfoVahqnNCUBDGDGUm6ylO+C+B3LFvfb7f74cgl+fo97v/4XC8RdAt8UQtwSljUEkSOVwREpJSaTCQ4OD7G78wwnp6fwo8XZ9bxS8lw3PdR5DksJXiuagroI96EWkIuEOC0Cl82DnEyfyUWLSKw4Z8nGJa1Rr6HVbHK71XLb7c5Zr9s7X+p2fNPSVLkDsWnq+F4wYMiXAFwFoU1xiLWGgbMBPJGxAlLxp1LXKT1PnMLdaqL8jhdZii4Yx3Fg206q3s4oyM3FI006VPEfQwATMfSMqNyXX9I9ZXqAuPtIdB8iCaQvm4JAAbcQv2hsU5K02LI8wTFHT+FzOpjMMQdWonViPJKZ2WcZ7BHwIYBfAbhj1+nojTe/cak0f06P9975f+jYc9sBxC0QXidBV4UlWpAQPgdJzn3IfZxj/+AQ+4eHmEymkIEMnXcN5LnOaxTBMTrEVcY5LLLoF4VHlVmlLFJQ5v2e2n3EhdUEzy1aPFTthzQMMREJtNoddLrdoNlqnTUbzWetVuu42Wwa4eVKBeTk5IRGZ+M6CbkmA34J4DXJ1IQ0dzAEUpxrlaTBZF4oDwvp+oH0Q0wdaTnCU23bQa1Wg+3Y2TavqMNAfqJK3UFrmVJKXSl2nM0R3pm/peFZoU07ZXZJIeGvROvm8mej/4kje7WJ3DwRJg0JisXjtFR6kWVqX56XyrZpc587dRDgQDIfQfJHBPELAft3FvhZ9/zZpdL8eT5oYMnAX2GWbwL4KpiHLNlWSWc/CHA+GuHg4AD7+wc4OztL/K58rfsoctVVuY8y76sqi3K1hdbMEVQpTJ/H1qSsC4l5nirPWxQvEcNXJgcQinjlTqfDvaUlr9Vqnzm12p5dc05EvX7xArJ5dkbNwKsTB0NAXmHmvgyoBmbikpHVWAzH8eSU5PkZ4hSNjKq2JTJdaEXcfTgOhLAU6ErD/wvwQ5XvgP52EpSLgCoyRzZlnmh55HE3ZaXFgxRIjlFs/U5qFrTuZAxllrtgbLcg96mw/WBNzgJmMFG+MMwJ/MoXEEgpeQzmhwD/EoLedUT9SUd0Jq9878eXDrvPNflhNyiQ1wn8JoDbLLkXIBBJdAAIvuvh5PgEO7u72Nvfw3Q6heRodNd14bmuUQ0dF4cyyKnK9JX+/+dGvZZYmJQ9/6JFo+i96JBdrP9YRPU+D5YLlBgN9XUb9RqWlnpYXR4Gw/7SqNlsHFu2cy4sK7hwAWHXET67DYvlkBhrRNRlhs1cDpsQNOMuw07Z9MEJUuafMjh/yH3YtRosK877kJnI1lyNKHEpSYSDzGrPVF48iuxLDE67YXYJhWrzBJaLzixRmxNyJilx3kahrYGca5RIC/MpOWqnIIJ2MTggkgi5AHYAfECgXwtLbIimfXb7za9e6j2e4+PnH3zguKPzAXHwEgGvEtEqiGosmWQ0xs3MmEynODw8xO7uLg4ODuF6HqRkeJ6H6WyWg69Mug8TGa1DXF+EgaKeQKhDZVWLx6I+V0WFTB8fvjiElXLI8fmZnL5rtRr6S0tYWVnxl5eHo26nc9So1c8cxwmI6GIkuu2dkQiCJjEGRLQshGgSEZUVg3hsNhnbVRc7LobT44U2tVKWiUe9IAHHqaHm1CAsnUfQySo2w0tRsVA+VjAxKtlA6m1hDM8kHYLyd4U4t2LuI/q3lNPJLvcK2Zyu5PpFyWlHlo2jNHMdRgFggcOIHlJDRBcuHunjKWDJRwA+JdC7BHGnEbSPbsjXLnmP5/j44De/Eo3T0xb7/jXJuM3AGhOaMekRXyKu5+H07BT7BwfY39/H+fk5Aj+ADAJ4bjp9VcRrxHyECYYqgq/KdBllnGP8ezp5Pk9XMg86KysSRSO3i3p8zTsS3iOeZIX5c6g5DrrdDg+Gfbc/GBx32p2dmtM4si3r4hBWvebbCNACo08QHYKwCTJd9bikiirTV0VQC2VWMJGIAiVLBDIIPerj0d1aBF+RAJLuI9s36NBVkv0RL8Bq96Es4Fxg4s4FhHlREYxPJ+Y+rNjziigat1WNHpVwJipQdavBNkjdjHOfp9E52KDbqGhyWJVoz+hXogcIy4JtWb6U8kiy/ERK/gXA71kQ29LjWf877Uvo6jk+zjEV5FCPAroF5tsAhgDZIf4bXnOSZaI63332DEfHJ3BnLoLAh+t5cN0ZAj/IwDk6Ua0XFX3xLZq+KuIrqnQfRYFWRUWk7DX5Anbd8dSaXsAu2n2kmSYSQRBHBZvhwHq9gU67w71Od9ppt/brzfp2rV4/hqZAr9yBPHp0RwgSLRCtMGiZgSbAIiUM5r9xU2ysqYiEi266DU+LjgSRgO3UYDuhbUlKsKdQV54HUYkN5AEZ4nTHX9AdoUBEaNa4px5bQlCSb04JcU6Z8TnSZl3VU9DhoxguDMWUnElOTN4+UMkBK56M4QJsr2yXVtk5mYgZmEkpH7PkdwH8MmA8HEtv/K2fvnVZPJ7zwya7LghrILxOhNcI3IeUlurU7Hs+Tk5OsLO9g93dXYxGI0gO3Xjd2Qwz1w2t2xnGjmLezn6eceLFF9p8B1KFqL8oVFUUdFUkYCy9B6NJ1VwHEgmxw3MzW9M7jo1Wq4lms+nV643jRrO522q1juqtumuCryp1ILZk2wtkl5nWmbEKcFMyW2rudvH+NZq6Yhm535ZVj3hBTWThKXnOgGVbqDlOmDYoKGNVwmxe0nM1hRWbErVruWCoB+vQVix+FBRBV6q5G5JRZKl8yUWfIBV1c8yJaLDK4z5Pl7HwrUIJ7wHJ0ocv95mDO0z8HgTdq9m1kx9/70eXvMdzfrz3/q9sfzoZksSrROKrILrOzC2W8cYy3EFPZzMcHkTcx+EBZjMXQLhAzyLrEj1hT4+sLRrJLUoC/CL4jyLzRJMDbplY8aKjvXqEblmXVfCkmc2ljIKjgkBCxhoQQwFpNhrodjuy2Wyc1WrO01q99rTRqp8VdR+VCgiPhcU295jkKjNWAGpASpr/RXACs8QXSH5VirLOkU5exaaJ8UnGX4Rt26jV6rCECCNoFc8rXbSR9ZbiTDkLnUsoMVtUK7ZZyldcJMko/iNF92HlbgY1Zzk+19ykLuUvJiQ6GvMgQtF1RQss/nOfrODfSJnUiq1KpJQnLOVnDP41CJ+C5EEgp5dWJS/A4Y2mDUjcJMI3ycLrJGggJSxV/+W5Hk5OTvFsbw97+wc4Px+HcDQzfINxYlkh0Hfm8yxLqjjdmkjuuPtQ4asyo8aiGNqiwjBP1Kh3H2qxjEd45/Eq+nnH60XMffgFCYSWEGg229xfGviddvewVqs/ti17s+7Yp2XQ0VwIy7fIZqDNTMsMDJm5DoAyHzDISPjGopW5O3xS887D5TROy4o/wBC+qmVGd1mFbzjrw54vLKy4BHJp51TkkZ+DrHJq63jyKhILCt1tVyYFi5TR3PiJdRI781kyZ4WDBXkqmu7eXELY7D8W/43mTqGx+ZUEgQDJgRyB+SGIf8nMv/Z8+cQPaPKDH/zsErp6zg/+DZMd2F1ivMzAG5L5lmRuSZaCEU5eSWZMZlPs7e1he2cHR0fH8Dw/nLzyfcxcF67nGRdb3cK8aKHVi0fR7ly/l/V7Wt3tq9BVkfp8nhPvRXiXMgirCnmuZyzlC0m4doQKdGm8ty3bRqfT4ZWVFXc47O+1Gs2HgumxIPuUiOSFOxDUyGZJPcFYI4ghUxhdy5pogDRIJ4Vcoi6Ei4ZCKUOgQ9utx91HqDy3QEJzoWWZSx3Uaom26rMSRngBgkt7WtJ25qHTbmTXTkKD5GS2UOWesRjXzI3uFnQXBNPsmdkOnrQSS6huL1OEORNoxuBtlnifhPgVRHC/UW+dfPd7P7ycunrOj08++oQ+mb3bYsu/BsZrRHgJwBIk25FTabiL9zycnZ1hZ3cHu7vPcD46TxZldzbDbDqF7/u566mqHXtcQNT8D1O3UqUTiX8vfn+xwFFfvE2vXwRnVelGTBCYnv2hw1dF3JCZtI+NGFVOJ8hMrGb5DwftdguD4cDrDwaHnV73qW3V92rH3VKPutIOZOb7ZAvHqdlOu1avLdXqTsu2LIEC/QepHcGcnXL2ccqHksn8CAU0lu3Atm2IaDw2M1WVPkhTiMdNB2emq5jJyJXzHDbHfK6UIbtFNEEmkv8IRHPCs3Kzu8rrqvoZqY5CV0ejqiNXXOYNUPXZAgafAnQPhN8Q6I5Tax7ajnMJXb0Ix+jEnk6nK5LlV5n4axC0RoLqcUMriMCSMZ5McHBwgN3dPRweHcF13QQeciPjRFlgnKgXAH0SyxQcVUWBPq8L4AhaK5u+Mi3YVe1Sig0dOYM8mASMVc/VqD6XIe/h+wF8P9CcL9L3Vq+F/lfNZnPSbLUO293eYbu/NKZrVLrxK+1APrtzR3RbzaZti54Qok0EW0qeGzhX5PJYunONCGhGOu7LQKo8t52wQ2HFFFGBskxTRcYioezeuaB4UI5VKVp8Oc07p5g8T/M+Yi6rOPddzfTTBIUqkRZNomEBq0Ra4Lez89gXIyGJEAdEbTHjI8sSHwoH2ytrV2a3br1yCV29AIdrBfXA52sS+DqA18E8BGCpC53rTnF8fIyd3WfY29/DeDwOoewggOe6cA3CQRXnNznqqryhZVm5zqMKfFQ2vVREnhcVEFO3UWVxLy9klHsvavEocyQ2d1kR0xtPlfnhf6bNbBhf2+RWq+XWa7X9er2+02q3jpf6S3NthkrflV23G17gD30/WJdSLgUBJw6bSHwUs6628WIpFaHb3NUrvlAQ54YEADMECFYEX1mWpRDJqs8WCtx1OTvbyjp+X9Z5FLvsZsZsWeU+lMIhsqJBNop2KCvaA0KFn+ImnBhQSsac8MY5hWHxfoSqdGesQg+WR0LsMvC7gINfB9J7SEKOb9165XLq6gU4Pvr4Y9sNaEmCbzHwOkDXwGixTOMcGMBkMsXe3j6ebm1hf/8ArusB0e7eVWxL1F25CcbRF+UYzlE95eYt4KY0waLDlNBXxH3MC5Sq2qkQZeEHnaOJz3eeB5bx3JSimyjrWRr0aoRGo4GlXpcH/aVxq9V82qjXn7SbzcNer+deuIAwMzk1qwniNSnllcCXfRkEtpSSEiJYB0HYQGhX9kuiJByJlYXJtixYth1dMIpZYiHYxFnxXQbCittFZTKMFU5dzQCJfk6cLUgEznMFpI766ZNXMm8pP6evgTIhBsUChlUPKgJMZHYVzU35kSeQKEOsc+68o18aQWADQrznS/7obHy83+398yXv8QIcd+78s5hOjjtSypsAfYVAN8HoEkiol4M7c3F0fIydnR1s7+zi9PQsXLykhOv5mM3cyMZEGrsPdadepDrXF9SiyaWqRLY6eVVl+qpqt1NUXMqyPYr4j4WLR1wUI8PVIAgQJPxHvvNrNpro9wdyZWVl1O12t5qNxhNLWIcA5nYgJRDWUxIyaElgBcAas+wxw+YKI7zqwllW+JPdu/74IIqste3Qst2yUjhI8a+KldaK8W+qSo8vPqMXFkHLhgfpnQKhUCeZJZ6jqNr4AjcWj3zSYvH6Hp+fVKavCnZQGZwqvsDz71Xbl1XoZAwOvoYAqkjfwmA5DXzegqAPAfrYEfbO+dievfba/3QJXb0Ax9FR4AjGKoO/RkzfBHCDiJqRCVByvZ+enmJ7ZwdPt7dxeHQEz/cBjievZnA9N0NQ67tsvYDM240vGh1b1n3ozrtFOexVeI6iQlZGqutTYvqgwKKHjIuRap5o8L4SFBaQpaWev7w8PF9a6m03m42nlmWd5RbJRQrI4eETIf1uCyzWWPAVZnQBiFKVcrR717N2y7xnhBLKJOOAJZYQJMIC4jiwVCJNFw2yWQzIBV5YnFt9GSYxBqvrZYFbCFHq3UWWlUBX4VQHGwvoPJZBtWLJtt/8+cmOhaEshZdhg09WeJN7zNgF+LfEeEdY4l6z3Tn7wZ/86WXxeAGOX7zzr0JIt8MsXyKmb4DwFSJaBmCrXm6+72P/8BBPnmxie2cXo9E4hJylhOu6iXDQtCuPd9q68lr/ezYSoXxhr8rBqh2IWkBM4r0qZHyZoLDK49Xu46LiSFVR7wep9sN0l4f8R0P2et1Zf9g/GA6Xtpf67eN2zy5Un1eCsE5PV0kytUG0JohWhSXaRCSYixRsUQlQgo7K4JoYtko+oDS0PFzPLQHbCaevwsjarGctJ5G1atuhTGIVJdGyajmlxx8h8wp6PrqJpiJQEhQlKGsCqS78sRqd4mKnzwMrpyBznUeBVTtT5IxI2dPQfmRkRuI3k5sAo/xXq16Y2QUgYOAYoVHiO2Dx21m9ufOtt992L5feF+PwvEk9kPIqiL5Ggt4QQlwlonoM6xIRgijvY3tnB5tbWzg4OEiKhed5cGezQst2oYWrFfEF85TYRQLCeRoQ1d68iDz/vN5XVSN04//iYrmIeLCoGPlBCs3l1OdCoNVuodvryG63e7a0tPS0P1x+NlheGw2H1ypxl6KI/xBkW0I4TWHZS5bldCxh22T6cFX/JKkZJmoQkr5Whc8RXUDxjj02ThQCtm3DsqPQKBVPYlZia83BULkXnENDcMnfCi+CqPsQFHteWUhns1jns2LSIHsxxL5fpGSEsDoNYvajJypoGrSuijPdWHrTx6rh5P+S7xQJT8QK15WKHxMfLybQmIAnILzH4N+5rrdzv9meXi67L8bxy1/+35Zj8ZIgvErMbwJ4lYAemEUMfwDAZDrFzs4uNjef4tnePibTaQKjuK6L6WwWju5quRYmw0TTtJNt28bR3bJ0QBMRX9Z9qAtsmb7kiwqKMnUMKomvn+9ixSN13w38fHGMD8dxsNTr8XAwnPWX+oftVmer1ezuNZu9KWBVQhDMENb2NhEHTYvQF0BPCNRJjQrXFq4wl4OinbNMbccLcofUBYmIIOOswsgzi4hgWzZsKybPKVlYEwI9w1UwjNkkrLvu6mCbuWYQV0OFQu4jnLoKxYNx1ofKx5Bi6qhhodqsUybrQ6ocUtbbJln8jfCVmbvQlfr6nFn2vUaQVebpcrswj8H7AN8RAu/BwgPfl6P//qtfvYSuXoDj3qf/KM5HaLiBvMpMXyfgDQFcYZZ1Zg7veiIEfoDzszM8efIEW1tbODs/T8w+Pc9LoCtd2a3zDLrmIV5M4524aVEvKhDq2G8V7qNIPDivaBRF6C7igxWfqwpfxedadM7zi5EEc4Ag8HOZ7uprNxoNDAZDXltbny4vD5+1W62Nmm3vWkJMqwLjxg7kdDKxgsAfsOSrYB6CuRYTZgUb9Jycfq6iIJM8iExoVJh5bmdaOKDqHBNnCwRr0BPNbT8KoJ+CC8AKR3dF1sCqeOa2xPo+E3Nreg6T4JCqTHZVaIG15y4Kqo0uesngUyn5kZT8EYDPOl3an7nHl4LBF+SYnJDlTeUyB/xVAr5Fgm5CUBuAiC9LGQQYjyfY3z/A5uYW9vb24HseBAlIZsxmM8xms8g0MQ9dqQSxCXYqsmvX0woXgYqqFA9Tx7FIHsfiCz4bnX9N48oVnjGyLQmFg0XdByEsIP1+n1dXVycrq6v7S53OVp3oiEajSvxHYQeyH0ibwQMAV4jRF4xa1ktKWysRe17JDCdhEvLFU0iJTgL5zA7bdmA7taSAsK7nKFkDM5nmGfJb+YHqVlnl+YqKh6AwLEpYkcgRaQemP56zX576IqlVu0w1H9ByCqnkAqXcJ1x+YbPO/xgeVW6R7QK0w+APJeMD9nm77jTcv/yL//ay+3gBjs9++X/QjN2GgLjBhG8D+DqBVpjZTlxzQZi6MxweHmBraws7OzsYj8cJvOp7flJA9OmmsvFYtRCYduEXjXM18QOLGCcWTXh9ESmEagKiDu0ten4xfGUaDMh0DkKg2aij1+3IwaA/Gg6W9/pLw71OszMZ7R9Uvo9zBeR//l/+imZT16nV7QER1gFaYsk2Iow+bx2LyHFXha44Hdthzq1zSQ0yuM6G1iXh+C6RlbFg1zmBLFSWN+Jgyk5tsWHzzkauYo5SQ91BWWHiIImoFdWJwvi54s9ChYj085emnPR5Y1aVIp90zFGrbNVtp2W4SzgB4x7A7wsLn0n4x//wj7+9LB4vyPHspO7UmmIIoteI8E0hxA0ATZahB54QAlJKnJ2PsLW9g41Hj7F/eBjmTADw/SD0vJrN4BWozlWoSoWu9KmrKpNX6s9LbYOUw7TAmjy2TAWuqn1JGZxlyj1n5hzfY3ouk2WJXhg9L2/LkoWv6uh2u3JpaWnc6/X2+4P+dm84PO6trXmt125fvID86U/6BGKHwSsEcR2MgWSuZYJQSUNQkl0/F1uAqMUkSo6KSdkknhVhEJNtW6H3lVCV2VBCl1Qn3tRpl5EPY2KghDQ35YkY1mw2dx8U7xQiMnEuamggLZLJECUrJDMtkkTlcrU6QSVFhi9agOKxSjCznIDxGMDvLOY7FrBHQrr/w3/4Hy8LyAtw/PU//78iYKfjg24JxhsWiVtEos3MIu4+mBmTyQQHB/vY3NzC0+1tTCaTsHgEPibTKcaTCWaum8vdNsFPptFdE/dRtKAXLazma5hL4aui8dmL5oyUFT31vZi0H6ZCZYSjYlcQLVExKY4G/qPb7WJtddVfHi4f9XtLj/u9pSetVvOk3mouBEPnCsjVP14ja49qkLTMwDqALgCLy2zZo9HThMApc5LSvqg4Mz00I4yCmKyU/5DaOGwmW30OtcBcRNhkkZxcvaiwFMaqc6LY84oLI3HnAWOqXTsqGiYWNhm8SF2oWDzS3wuIcQDCR8T4wAE97vpy/OrP/uKyeLwAx6/f/QWxlHUZyHWW8utgfB3AOjM76r3v+T6OT07w9OlTbD3dwtHxcbLT9T0fs+kU09kMfsR9mDQfmXtZKx5FnUAZjDVPc6b+jqo8N3Ufi3QYn+fQ7VOKup8qRUR1QI/V/0XdmLAsLC0t8ZUrV/yVleX9TrfzsF6rP7bJOhUl4VGVCkjtrGbZNrc44D4BPUFUA0CSY3sP0jbnYepgMjHEKhFhLh4xhhoHO8W6B1JGd0GUpcOT9kLzvDKESrGm38grAfNWKwTKz4kb/pTuVCxNdR4XgOIFPhs6pQwdSFamror8w/K55qw2NolyPs/tJBciaedPFQpSPGYMDhg4A+EhAR9AiE8BOmhYlne59L4YRzCTNglahsQbYLwN4Ctg9GUgLVZscsbjMZ4928PjJ5vY3d3FdDZDLCacRVG1queVCbrSeQUdzlKhq3lWIlWKh7po53boQGloVBXfq0U6ErUI6K67ZXCdrtLP/XusqPf9xO3YNH1Vq9XQ7XV5dXVltrw83G21Gg+FLbeE7Y/JshbyrsswNX/z7rvEUzRIihUBWraImiRIZMUbSvBRIuY2BHGwpmozGqQl32ponkgCtp1mnmcX33h3kkr6UluSsqU2Y3KV9gjZNCrkZ44NwUqx51WSda5fxPP3+/ogVcb2JQq7z80LEJlH0HSdCzLKjpRnypyjltCY/5Qyzx3ZszCBZmD5lID3wfwR/On2mbs3vf7jn1x2Hy/A8d6//IsQzD32/TdY8o+I6G0hxDUKN5DJ4bouDg8PsbW1hc2nT3F8cpoYp7qui8l0immU9zFv8krfVSccqCaiK1q4i3ylyoKXimxLTPDVF1E45kXWqsrzmP+Yp10xhtwZoDmjdYkQaLda6HY7fn/QPx0M+pvDwfBJvd44cpq1hacoM99kY2XFghAtMC+DechAE0SCyWilF0XLcga+Kd4FpIsaKep1NeNCCCvxvkLmuZHzuzKFKrHhD1kFuwG7IsOyHmsnYoUfoEBslIRFJSJIZYIss85TRORHJo56Pc3mnKsdhXIBU15lzlqpMLUScXElQzmF0gXqFYS1iz/KYJEATgh0lwm/Zovvsy3PSR5fOu2+IAfVuSaJ15n4bRL4rhDiNgnqcHQDCCEgWeLs7AzbOzt4srmJg4PD0O8KIXE+m80wnU4zokFT91GkCq+yCy9aVKvAWXH34XkegiDIdR6mRb/Izr0yslxQ4Ey27UVOwxVeBCxj5XkALyogpmLWbDaxPBzy8mA4Xer2ngwG/fsrKys7S0vDacPp8+cqIAMiIYA6M3cYaAOwwUzEnCDh2cZAjVmVWUsR07Y7s2BnoSkSgGUL2I4NyxIAscZ3FMQdEWeRKc5DPJnHsdlN14jgZBTkWpsb47hJBZlPL+g/Su3aJeRFHHQrS02MHsJVuQ9m5gnATwn4xCLxiWXXnlGz4/7k3/2Hy+7jBTg+/vhf7IB5yOCvEuFbQtDLQlCPQIIlJzEL0+kUB9HY7tb2NkajcQhpS46mrqZw3VlmcTYt0rpo0GSYWMWJtsruXO8+1N25KV/9IoVh0Q+YEV8AACAASURBVMOk/bho8chG8qbKc1kAX3Xabaytrsr19bWzbrf7oNPu3G+22wfNdtuzavbnKyDNuiSiwAGhSUQ1irbY6XAPadBUanDIVXQaUehS3oI5VHRblhV5X1GygpMpv4MyjlhKHVF/L4vt8LyVVtO26DL11PIjjKslkY/fhVIj008pu9NXeq80NIqzxotssoJkQxOV4SpUbblmsV9W1UpyCMMJM/IYvM/M9xj4BALbtmNPvvf2jy+7jxfg+NW7/0WMx35HBvI2EX8XwNcAGjDDioW9zIyZO8PR8TGebu9gc+spDg+PEEQwle/5mE6nmEym8DzfGNVaBRYqI87nwVTzrNxV7sOk+9Ddd6smAJYZxZYVMrX70An8RbqdpHjIAH7gIwii8yvQfnQ6HayurfpXr1497va692u12iNIeQLmC0UvZEh0CV9AyDozdcDUBGDNW3tI/TDVKSQyVxACpbnmQUQaU2SeaFupdYkymhuPAOuLKnN2tScYqHNNi5Lx6jB2KKbzpdR1V90ZKeetEA65xZ1MY14xcS7zwkNS3x/lXRHDpDHK1QCOOyX1AZw/l1COkvcmVjUqQhCEJZiACZg3feDDgPhTycFxEEwucz5elOOca9LCOoi+AeBtBm5KyS1CqPkIzRJ9nJ2dY3t7B48eP8HO7rMwppZCPcXUdTGeTDGbzTLQlT6OG3cbJhJc97wyJfGVcRumvyfapXgySbE11/M2TPyHafKr6uJelFqoxudW8b2qMp6sch9+4BfmJTUaDXS7Xbk8HE7W1taeDfuDjVqtvhtIOW22O/JzF5DgLLBsoE3AMoF7zGyXLbaMlNxWyXQuqMg65q52IJawIYSd+knFC7MaLKgmDWrzqgxTgBSquHwYoSaTjoWiziO0bUc2p1wtNgyURl5p3Eealqgs/lSKUmWKEquVgtVCUCRiSr2voMGSSG5wgFkGzDhi5rskxEewxONxoz79izf/+BK6ehGgqw/es93xdOB7/muS+dtMeJWIliiKbQhvBInpZIK9/T08fvwEm5tbOD09SyKYw8mrLHSl3vPqzjq+V0yTWKapK9NElL54V9mhq3nnMblfNTDq80xdFSUrxkVM9fqyo9C8i7xWdjQ5hK/0NduyLPSXljAc9r3BYGl/eTh4uLy8vNntLZ11uksX3hBmATefbZLUBrDMRD0GbFZzVrWlkMEKoc3IpMOX4VjqQs8MIUL1uWVZYZHJxH2kE0SE1PrJ5MDLfFGOYN5bDl2DLSsd3QUXtLCc4Q/MvEpkOlnouFtOpRj+MSsCWST+lgw/CAcFBMuAz70g2AiAj0DWfQvOacezLruPF+D4h3/4v+j8/LjpBe4NSfwmCN8EsEZEjpqt7HoeDo+PsbX1FI+fPMGzvT14ngsiIAhkQpzrfldqAdGzPdSds15AyqCrRSAk9TF64qCJ+1g09e8iHIgOX+lq+4tatmfOLwhy4k0AaDYbWFlZluvr66PhcLjV63XudDvtnVajMbOF4C+kgFiWJUBoANRDSKJb5lS+VPMhFZsR02RUDrvM4PkpeWbHqWREmbJASOahsiRIvHvOaEEqfOgX+R2DqRtXuYBzGSMAQ2YILv6chByIcdGxdDKeOMUTZjMA22D6gFn8zpf2TuC3Zj/6o7cuu48X4Khz05E+1iTzGwB/G8QvAwgV59HFEQQSo9EIu7vP8PjxE2xHinMAkEE4tjudThO/Kx1v180S1etct09XF9IqnEYV3YdpgdW5j7Iup6hgLHK/FkXWJutehdHdap2Hn5DnpiLa7XSwvr4mb1y/cXZl/crjXm/ps1qzeSAJXqffv/A9nUBY9zc2wknVwHeIuQHAocSjAxn7b05yuyVQMLqrUtiU6T4oJ0uI0weFZSGdcVXI5HgHE9cOBcpiPVEwR+ZnrU4qFQ/1fJJ2WiHcDBdwkWNV8nZVJT2kUVHPxsiqLCfCGcyJtcZOn5NX+Q7tXeXTosLuI7QskSzluWR+APD7EHw/wOzExeiSOH8Bjt/88h3iwF9myW8y+IcAvoEwutpSbUGm0yn29g/w+Mkmnmxu4fjkNNq9C3ieh+kk0nwYiHO1gOhQjjp4onMkiyyk8/iBsrxzE88yj0BfNDLXVDxiHqaocFY9zxj5ic8vHk0uWot7vR7WVlf9a9eunF67dnWzP1zZqDXap1PX/Vz3dFJAnPCFhQQcBhwQ7FjFkCkJxFn9Rw7CMWWAK7A+IQvbUCitF1EkbAJvkcarqC6/hrxyyi3BJXgWz+lJKJvKJ0TIf4iselLbxSulUk/446wNSzyzrRLoHE16FY0DM1HaiSVOjJTCYoZ2IifYLIWuQs1H9JiZlHKXmT8li+5zXRygyd6/+9qfX3Yfz/nx//3t34gAaAP8Koh/CIjvEfASwA3mNPDJ9wOcnJ7gyeYmNh49wt7BAYIgAJEIifPZDJNY8xE9Tl1gTWJAfTEss+7QnXlNCuwq5HK8uKrch44mFBkmmtx4L3qo6YcmfmhRnYn6fPH5mY0Tgd5SH8vLK8FgMDgdDAabw+XBo16vc9Af9L1Go/m57umk7HWbXUjfd6TkFoBmVFyoVOctObPAsz7tFH8ZCSxCyUIfe1yFeeKpr1S8FpNGblC29OYXfq4gxCgoHkWcQcx9CGFBWKn2Q0bJi5kxtDwVod0MlPGqySB5cfEwvO30MzWXRio9Sda+imiwmIp3OkKIAESnAG2QoM+IaJsDmlrnzmXxeAGOfrtdh/RvsuS3mPFtItykMOeDYq2TlBLnozF2d/fw+PFjPN1+iul4AqKwm3BdF9PJGNPpxKg4L4Kuiuza1SJSlEO+aN55meeVPnWlP3/Rgl4VujJ1LlLzplKJc5Ox5DycJNTf5bmdfBFlXLlyBdevX3eXl5e3W63Wx41m626tVjtjGXxuPjN55+PNmS19bjLQAVGLQE4xI67AULKCD01Ohh3ngkcEumVFoUzqWLC2iS9bI6subWYPsgptqMgpz2VuFaf8axlqXMZtl+dHb1EVq/UqKsaSwpFc9KHnlcvAHkCfShaf+VLs+1Pf+9Eff++ygDznx7++844jgCEkfx3Mf0zgV8NpSykky+S6mUwmePbsGTYePcLjzc1o6gpRZxJpPqbTnFW7XgDihTMuFrrmQ7cuL4uRXaR4xA7fZdBVWbrhF2GeqE+aqUUkLrIq/7FAL5Mnzsst7PnalXW8/NLN6dWrVze73c7HlkUPbYfGzVbnc9/TCYTlNdmCoLYl0BMWNcGUCIlSHyvFgiOCkBI1tQb/qLxHPBYa4evJ4kkALGHBtmxYiTAv7+bLphCSooqwUFs5v3iEF5vBuE134Sp6S/HuJRL3xLnxMMbaohBrIi4pBET5gay4rGjFzXStKrYpvmQcS+b7DHxMwtqo1xtnb7311uXk1XN+fPKrX1rjwB8EMviaZPl9At4k0HoY1ZCiop7r4fDwCBuPHuP+w4d49mwfgQyRAj8IMJtOMZlMQh1IgVminvVhgoL0BXTRoChTUVF1H14EXalxukXFY17hmPfeygSNqgNwzFGo3cfivE78X8ynFIdGWUKgXqvRcDiU62trZ1evXHmytrb2sN5o7s2msy8kPdQGgPff/ZBOp8dOs201bXJatrBrkjl04JWyYCsvFe3FvBUwdt5FRqMAUJQlLrLiOYU64AJ8iU3B5Yw5hYXnflmJmC+BrzThIPIaFJO7b6Y/UEb3UsFlCSA1b0OSa1rMrx9PvDHlPrzIKiZzAzGBxgz5mMEfSsJdSXzkMF/G1D7nxz/+089pPPPakoLbYP4hMb4PopcBaoFBjFgwKHFyeobNrafYePQIT59uYzqdwrIsBDIc2R3HVu0FVuiZFFHDTlyFb0xhUSbthKn7MBUUUuAilRco0n3MEwouAlcVjfrqyYd6XO2ifl+qbYnv+fA8vzDzvN1u48aNG9zr9c467c7DpV7v7spwsLc8HHjtpVX+wgpIpxF+rySoBhJ1ENkocHMideGpksWNbIytGmFLRLBERKCroUyaZUfenZbztuxMqbCxEEmiykUki5dGN4VStIizlrhc8lmwYdQ5fTtpWZqXIW+6oCj3b5zprtLCpz4XZzqZ6KIMiHDMzPeJ8AmDHp+NZuOf/OxHl9DVc36QK2ueQ+sW0TeI6G2AX2Ogy4BQpwMnkwm2nm7hwYMHePJkE+fn56GtEAG+50V2JZNCzUfRGK66+MfQVZlwTucn5k1aZe71JJHPS96nSuxXUZsvWiiKHqsWkBi6sm0bjuMsJBzUx5+T84st6QtcdweDAW7ffgXr62uHnU77w1ar+VG7291rdPpf2KZQAIBo2KCGbZFFjVAHohDoVH5iPE+1ppspIo3GDa3RwwICQciVDAMclMkdUTsaE9FUhgkVffkR4xzzHoKUFjuyH9HzaDlbKgs/KxmNPefDsD4P5koV+A/9p7n2nZl5KqXcBeOhYGzUiA5pOr3M+njOj3t/93e2BVqGlN+QEt8F0ddI0IAIFkMm12Y4sruPBxsP8XBjAwcHBwiCcNHzfB+T6SyBrnSnXXUUVjcJ1DuHeYl7pm6kKvfBzAgi+ErP+zBZlnyuolzRJ0stIPrQwKL3eC4Qy/NC4aDhEY7jYDgc4NbNm/61q9ee9Xq9TyzbuQ9Yx5blfGGQtB31lCDmOjF1AeqAUEtXNVLEDGzuCDBP+qxeEKy1vlowU2ZVNuTKmlrFxZiPwgsi+75Czy6V/9A5CSYTux/t9+NR47j7kJxOrakf25yFv7whocLPm0qKCCu/Ff2mT8ARAxuCcF9YvCscf/bv/5v/+rL7eJ55j7/5O+sY6MHC6yD6PghvE3CNgZq6vfJ9H0fHR9h49AgPHm5g59kzzGYzkGVBSsYsKh6zCLrSN14muxJTB6FDV1V4iKpq83h37vs+XNfNCBtjuEjnW4pIemM3odx4xf+a/Re1eMw7/3n3ukn34RdxH5aFfr+P4fJysLq6erq2tvZ4MFzeaLQ6e06z7X6R11jYgYgJgakBEgOAhyxlk1kKhnksFxkPJ8xx4KVkjDVHc0ThTJQEJimZGsQFMBll6ktqo6LP/haVjfkEvMp/kLojgiFuVgnYSoO20pYrpJFkxqEr1W6QMWRKB99SaM4E0KkdVz44Kl/xOeOsHwV0uSDeJeAOiO5K4HAW0GX38RwfTx79ZzHqOS1Zs14mwd8jge8S4WUGd5hZxNd5EAQ4Pz/H06c7uHv3Hra2noZq82jgxXU9TCYTTCbjkDg3eCyZwp+Kpq5U6KYoXXCRrkOHinRNhFo8isKs9OJhXNiVwZ+y4qES+SbivGr3oers9G4mM31leGy73cbVK+t8ZW193F/qP+wv9T/u9/tP2+32rNfp8BdeQCxrRJYtmiRoCGDIzE1mniOkKNBjFFTQpPbI+ItQszXIMAUb24WQ6t9u8H8ycR1VuhPKfUFqxxW60aa27TAUD5qD2pmfX3tnVJSfqJcVLVhK5zziwqo57id9Y1Jgcx+0ZPCImZ+A8BmDn0w97+z73/3pper8OT3e+93f0v6hVSeSV8mitywhfiwEvSEE+gBb8f3HkjEaj/F0Zwf3Hz7ExuNHODs7i+4BEUJXkzHG43ECXek4e7wwqwuwqRsp8nwqs2zXF9Ky9SguHq7rGgtIWUxsVVjK/HjK8I1qQfOVYKe4eM4b29WHCEzPWS4cJAwHfVy/dk3evHHtZNBf+qTT7ry/1Bludxq9L3xTKACg3ZqREFxD6H/VZsBBws9SQbzsfPAodeDN6j9iAj1eoEmxlk3CAqsKAwv+lReEsLLFLu08KLaSl7wQVsaKX0sywqvfCMYsj5J3ScV9Sv78lU7LJHCPuA8QT5ixDcI9ErQhbPvQQ+dy8uo5Pka87LhuY1UyfZ2B7xPRNwTRMkCOmvDpzlwc7B9gY+MRHjx4iMPDI8ggsjKJp64mkySiVt+pz4ueVcdn9eJRVji4srddOgCgQldFosH0/jbbyV+UFzHBYKbuY97YctEkV1o8PHiem4wmm5aHer2GwWCA9fU19+rVq3srK8ufdbvdeyuDleNBvf+FbwrtcPHtgySImB0QbEIYykFIp6aI0kqbYvtmTiKdDKJk+kpvScNcjdgepHAVRhFORoYehEoWYTWpgwt2FNkLT0kdVKN1kS12pL+DGILjcNA5VtyzoSDGdvWUO6e0oKgZ8HqpZGTjgTMJikBmbDp9v/EEFoEE+cw4JOLPAPqQhLVlN5rTP//upWHi83r886/ftTCdDVjSVxj4PoC3AKwzUAuv4bDDdj0PB0dHePRkEw8ePMT2zg48z4MlLEgZGSVOJphOJhkbkPj+0Ed2TTbtepdSxfl20UPKrFW7qj0xdz2pLq2ss1hgq5g8p4k4V2G+MgK/rGCm8Fw4thsEfuRDqHEfwsLycIjVlZVgdWX1ZHV19fHK6urGYLm/1xy2ZkTEX0oB8f1rkHwuGFIAwkKRxRMZiHM9wEj9owK3CCIEyr9HgUXh+G6ClkkNHivrHKhwzqqY7aBcMckVDxF6QgnFGypTAJTgKKOyPSkiqe9VURtumowyihNN/VWOzIsyPJI0dENdyUKKDGaXGbuA+JSIPrVg7wXSvuw+ntPjH//+56I283uS/dfA/AMQvk8kXmFwi2WIAxMjyTZ//OQJ7t27hyebmxiNx2HQGxgzz8V4nEJX84qHDrkUQVdFnlcXc9uNC1XKfZQ5/MZFo8z7ah5cNa/7iMWTquNuFbv2shjeHHTleaGVksEuqVavYX19DdevX5uura1uDYfDO4PB8NFgMBx9GcUjgbDOxyMEzIJBNsIUQir/ILXFlxSMnfIovlL8EYuWhBChBoREtuGA4rpr4l2SLTtXQaRKyk/+Qk0usJg8R2oXb9x3mNjvOLQklOmHyno2KVM0EWa1aVytOctjU+lkVbYDzP0cCJhxCsYWQA8hacc7PBq//e1vXXYfz+Hx4W9+Q46FJnHwkgB/VwDfJ9BXiNAL7+nwvpPMGJ2P8HR7B/ce3MfDR49wfHySXNCu52EymWIcTV2pUInusqsXCxW2ihdPfeqo7L9Fd/7q1JU6tpsVNYpkc1VUuIqKR5WxYfXPevJhrPso4z7mGkLGBcTz4LkufKWz0fmobreLq1eu8PXr10dra2uPer2lO+1OZ6vdW5p+WdedAIBupyMsEg4BdQAOwEJflGCAq7gq16BnumZCZHT80LSCGnbgXG2hXRTLDLUfYfcBIoMHlzKBVpoxnnYhyTkbiH/jSVQpHshU5Qonp/eV5AK0D8ZjSN4kxul3//1fXhLnz+Fx5/498jy/bll0lRF8B5DfJ6KvE2GZme10gWfMZlPsPnuGB/cf4OHDDRweHiCQAUgQpB9gOplgPB5jOp1mnGOLRnb1f1fhLFUwV6T+LjIeLOMDVJ4hFgzGxcNU5OKR9yq0il485o0Q5xXiqeOuye+rknAQyBiv+kEQWrOUEOfNZhMryytYX7/ir6+tH64urz5a6i1tNBvNQwBfGqpgA4AdSCFAdSZRJ4LDIJHJ2IiKSKqm1moJkzbNoGKNlFFLczQKJ+IxWUot3Ms6hsyb+RL2yCrvIfQdVvLyhiWf8+9SgrM3gim3nUgZFGClpVnkTec/m3xraywkkggjANsSvCFZ7krm6eVS/Hwe48Mjm2WwDKJvMMsfCKI3SdA6iOoyCCi+71zXDX2uHj/G3Xv3sLvzDK7rgaLMjulshtF4YlSbmwhpdfcbjwQX5ZtX6ikqaj7KJpL0rkYIQzQDmQfn9Q5FLQ5lPlk61BQEQaZ4LAJhqc4RkhlBJBj0fB9BQWG1bRuDfh/Xrl2V6+vrZ6srK5vD5cGjpX5vr7fUmX5Z8BUA2OdHp+L06KQWQDYhqElhJ0IyWdS01SejBSnDYJQvxfCFxSK90IkHpYFPaoChPjnMFWGrwsAnbTcUFzUSivGj0olxGdQU/65ExjBR/0UyrO6LfMPm65DM/6ZNy0V2Mn4g5REzHoL4Mwu8Uzsfu5dL8fN3vPeb31ieNxtI9t8g8E8oJM5vMXOLWRIQ8o+e7+Pw6AgPNjbw2d172NrexsydJRbts5mbdB4m+3O1KOidhgpdmYqHaeHUJ6AWAq+UqSt1Ikk1aTSNC5d1AVV/VlRAdN1HFcuWeR2IDGTmPI1hUURoNupYWVnGrVu3guvXrx0srww/6/a699rt9oFda36pei6bbSariZo/o7YlrJZlWTZDEgcMKiKqtUW1aFHLRqSzMv2kGhRGCzUWGZNV3xd9cS2JUkQSqj3ZFVESppUWNbXCaqFRyvQVG24ANYAHyEo0uMoVVtqRKDxNvrhIZp4A2CbCAxA9Icc6/faf/OWl4+5zdvzyX9+xpO8OBOTXAP4xg38IoldA1JIhLJB0Bqenp3iyuYnP7t7FxqNHGI1GyXXheaFYcDQaZ+Jp501d6R2BivnrC+fn4zsUTkDzulK7nnlFqyqfsehjY+5DNUyMPa/KdB9s2BDG7yOErnzlPH0jF2vbNvqDAa5evSpv3bwxvX792tOV5ZVP+53uRsupnRDRl3pfi8ODI/J96RCoKYRoWJZlq8mAc+pk8e8QRWJARYHOEcmrjskmKvTiziP/82oGINUvgzhoyXDhZfA6Kn5SVq2Wi8VPXHIuRnhMdxiu2nKZvxMGEEDSCZgfgHEf4AOW8lJ1/pwdf/Of/1r400nPd93X2Zc/JqafCKKvEqEjGSKc8iTIQOJ8NMLW06e4/+AhHj1+jJOT42RT5Ps+ppNpoVhQ5RR0mElPCSzadZcVjoV25tFr6ymDKjcT86p5eJoqwWSLwt5q8VCJc7V4FJLnXG6Boo4nx9Oc+uuHWefruHHjRnDt2rXjtbW1x8srw4e95aW9Wq/9paMKotVqE9i2hRA2CbJIRCgcFy/BjApZGtBsTDirsxBqAaFs5nquQkOfK66eIkUVf0fHTdNBL4MinFSTemT5jTgfhZVI3gLb+1RomW+kjBO8vFhpVJ+DRCwcpBmIdgHxMVjc45l15H5mXXYfz9nR6TRbAL3Kkn/CzD8lwjeJqA8Oc83jhWgymWJ39xkePNzAwwcb2N87QBCEueaBDDCdTTGepKS5Xhx0saBuTmgySaxSPBZTmyvFQ7MrMRPnZkTkiygcpnHleLGPoatarVYKXZnfR7rOpAUkFA4W5X04joPl4RC3btyQr7z00vjatWtPl4fL97u9pafNVncM2F/6UIzd6Xbo2D8WMghsIljxuHSqM6DiboTTxdcUZ0umLXqi9KYMYVT0kZolhIuyBsUPjWUdceBVDF+Z1mp13DdxOEtgvMjblCXAae6HsTkoDno0ch0JXEBl3cv85+QwrWtERJvEdJ+EvW0t1Sff++++czm6+5wc/+k//Z90/fpKQ/rBLQ7wAwJ+KgR9i4iWJbMdj8mHE1du6LD78CHu3buPpzs7mHluKBaMHHhHkd5DtT5PdpfKoqxeh+oCqibs6ZDNorqPqsVDzzhXO494w1oEmV0UQtO1MHrx0CG8OAKiSKxc9BpJR+N58FwvFxmsnken3cb6+hpefuml4OWXXjq5duXKg8FgcKfVbj8D2bMvkzxPORCWICFtDtgBIEyYfbxIZrx4tY05FRiGJ2ttLEtgiryvtCdIDJy0aaXFGo4FCkmqGico9iVIY2sZXNpu6wb00L2vFPW6kdwmzqFlVLDrmVcdypggxbLdZeYDAp4IQbv1mj365ne+czm6+5wc//E//q/U7Vh1351dJ4jvEeEngugbJMQymB1WbNZnroeDw0M8fLSBT+/exZOtLUynEwgh0uIxGmE8GuUs2k3pfSbYKu4ATAFRpsV6Ubdd9TfjiSRPIc7VgChLyRRahG/RN79VUglNU1eAonvRUkznVKZELsCK5sP1XLiehyAwT17Vag5WVpZx4/oNvnnz1vTq1Ws7w+XlT9rd7t1avX4IjH4vgmCbALKAWkCoM7MDDpM5aN6qVK3fUzQgnHII6nivsps2XkhU3bSxrF6YuQdKiocQlBo7gsCQ1fHSCK7iXN754u9sbrBUSc9BBTCZFSr+ZSDlmDnYBtN9MPal511OXj0nxz/90/9GzNfrgmvXIPmPQPwTAG+CaJWZa+BkKwTf93B0fIxHjx/j7t37ePJkE2fn58nt5M6ySnOd94gLQdV0QRPer8NYpsW5asYHx8VDIc51fibuPOKF+/PwLfNiZeP3lfW7EnCcqPso4j7KnlPpaMLz9DN2KBneQRB63S6uXb3KL710y712/dr+8sry3W63+2m9Xt8BrClR5/eCKtij0dhi5oYgahFRDelgbW6bXTA9bV7cSSC1NE/NF0MNiOkL5gI89AucsjIBSqSQ+qm/+YJztciZJS7G0vDnPtVS04fw3AICnQDigWR8Ij0ceOfykvt4To52/ZuO53rrgcRbxPRnBP4uiG6wlE1OVmjADwIcn55ic2sL9+4/wMajRzg+OYkgGAHX8zCejDEajXJKc3VRjjH8snwPVSyop/19XshIvYd8bepKfV61SyoqHot2IWW/p3IU6gIvRGyYaFXvPrTzDGJtS1Qs1UwT9T3UHAfLy8u4ceMGv/TSrfMrV9Yf9Jb67zeanbu2XT9B6gn15ReQmTuzHEu0Qegx0GBIK7ULmbO4MRk5EoogG5FwHPl5bEE5AAjqpBFLNTp38XXV5HelvobKfVBKMhsvPj02U3188n6VLioZ+1XOL5tkS5qAnJToX16sOmhlqECmwizljCGfAXwXEPcajc7Jt//szUv46jk4fvfez53AtVYI/E1B8k9A+D6AVwB0OJJYx5nmZ2dn2Nzcwt179/HgwUPs7x+Eo6Uk4PnRuO54lCPNM/em1mmYbMVNNh1lnUYRDFRll+95HmYG6KrIoFE3djQVgXnhV/qfTSJGlTgPP4eY+8jDfkW3cQx9SxmkXZZrJs4p6vgGgwGuXb2KWzdveteuXT9YWV7+pNtpfWDb4gkIk98H95EUkLpl2xLcJYglMDdZ64CjvAAAIABJREFUwsr4BioLIRsXtfzFkYWnKKGkM5NZpPMCrHEtWvGCTorMX2cpVzJMVuoAdLJPhaC0eXcyoVecdezNZjcWcCCoFj6b/ojnFhVT8RBEgJS+ZHkSZn6IR2Th+Ns/ePPSNPE5OO7ceceenrvLgfS+xaA/BdH3ifAyM9rMTPE9JaXEeDLB050dfHbvHu7eu4dne3sIZKiK9oMg4j3OMRlPcuSsKhZUxYH64lmU71E1YbCseJi0JV7sdaUJBk0uv1Ve21QciroV059V6ErPOTdZ1s97vfhzln44deW6rtGyJH6uRr2O9bWQOL9169b56urqRqfb+aTRrG84jnVGRL/XTaGoCSkEUZOI2gBq4Y4mctmgkv0u5cAu84pGWWaYFHO/vB+tOvqn9TZzXojNroZzlmYCECnPKRY2FnuBlFkRJKT5QhzIoj3V3OpjgiMYhBkznjHzI7DcsSy65D6eg+O3v/25dXbq9mczfiOQ+FMi/FgI8TqBelHPHBHHISn+bHcX9+/fx73797G7+wyu6yadyXQyxWg0xmQyNRaPLJeAQp+rmPcoSxcsul8WgbMSvYfrhgVE8ZcqS/dbVPNRVW2uFw+VOFdhvEWKlanT8jVXYfWwLAuDfh/Xr13jl19+2b158+b2YHn4frPV+tiynT0I+/eu5xKW7bBlW74Q8AkkCUXrcIL1aPxBtYtB9ZSKsihKvZ8IFFo95vAriialSGskqGBVzRcptT9KbNvjaRNEXlZFHY42ZJ50Gmrh4C+rg8yNvs298C3LlkJYIxK0Bcn3pe9vQ/Jl9/EHfrz387+15VT24fNXAPoRgB8T0VcE0RIAC4pB4nQ6xd5eOK772d272H66jel0BoAgJWMSjetOJpMcaa7qPWzbNk4lqbykqrLWJ7V0v6wiCKgqxxAnDOr6FJPafF7Hc+E7TuuIirqPIr8vnkOcyyCErlxlPNnUfRAR2u02rly9glsvvSRv3bo1unLlykZ/afB+s9W+L2znjEj83iFpWzoNH753yhQcQWAckq3MJLVQwGSYyqSeNM7/JJMRaS5G9HPFLn2xnXfKlaiYP+fAMr1lodRiXXt/FE9uxAWNGZD5yS8uKE4EzkBYX17xKADnCmQxjHg8kH1mHBHoAYS4JyXvBZIuC8gfMufxq1/Ynuctg+lrAP8JAX9OwNeZeZC460br1WzqYm//APcfPsSdTz/DkyebGI/TTPPZbIbxOE+aq9NSKp+gFxd1A6grzXWjxCqQUVXuwzMsqCborMzZt6ggLEKY65oP3apdha7Uz2KRLHc3KpSu6+UME9UCv7a6ildefplv335lev3G9aeD5eEn3U7rs0a9cWhZzr/JPW2TbfscBCcMOiDCSAgKmFWxUAnozlreh7q4kZLvIWXmgyESEKBycjz3jwX+vFzCe7B5dc1kGFPc01DkpGu2WS+LzFXJc9PsmPFd5EQf+R0a0fw2w+SnE3ZWAhKSPd+bMPNTInHftu1Ny7ZHf/S9H16S53+gxzvv/MKaMZYk0RvE/DMwfgbQ1xncA7Olbl1mrov9g33cv/8AH3/8CR48fBgGQ1kCLBkz102EgqrHVbZDTZXmqrK7rHhUiaedxwEUaS9Ul12TUWKZsHHe9FURyV/UJenQVUycA0iKx0XMEpPnjPyufM+F57mFokFBhH5/Cbdu3sBrr73mvfLK7b0rV6582B8M3nUazS0iMft9EueZAoLzc8nAGIE8I4umREISpTPlFBG48wsqFV44MvK25+QDgWKpXGXEiM0cMs/RpRPMj6P0eUlkiX3ERDlpRpJctIPImycm8J7mX5XppSg2UFShODYW4zCIVD1TMvRcWjsvCGD2pZQnAD1i8JZdt04tR1wWjz/Q4x/+/h9sCmQv8ENzRCL6kRDiKyD0AhlYLDn5bj3Px8HBIe7eu4+PPrmDBxsbODs7h7AioeBshtEo7Dym02mu81C7D5U015XmJt6hCnQ0L1fDZJeuBkSVGSWaCkJZ8TBNhZmKRRGxr3pTSSmTzyKGrhYdVVaf03U9uImy3nxr1up1XLt6BbdvvxJ1HzeeDldWf9fpdD+0LPtQCPFvNo5vb81m3LUsV7CcEixfCJJhB5JjJJJugyhF47mMxVC/YCFAyRdXoLegfIFQV9/cMJaG5FQtItn3qHhymQGqyhzPgi+OYingIruZ/GsQAZYQzMyelHwIxiYgdyczOZEuXdqW/AEe//hf/tomIZZI4Ksc8E8B/CmANwD0mdkKEcnUPffo6BgbGxu4c+dTPHj4ECenJxGHR4m77ng8wnQ6iRbifPFQC4JePPTFtShZsGwnP++eUQ/dZVe1B1ELmK5yr9p1XIT7MBUP1baliMifc+KRVXva0XieD98PIKVubR+ee3+whNuvvILXXnvNvX7jxt7y8vBup9O+Y1nWjhDC/bfqPgDAPjs9k41Ox3NsmjHDU5AYMhHYGSJX6SL0fTApX0QYXxuKkkThhWdYCI2QEWldCZcu12yiQGJRfCIgjAAsleNJhPMlRSQTUgJFxsKFXYdqssVUpaiYZskYpsTGfLNFMwB7BDyxmPYaU0ytywLyB3dsb38g9rbPOtNZ8CpD/gkE/itB9HUBGjBLRypz9Z7n4/j4GA8fbODjT+7g/sOHODkJI2lJEFw3VZlPplP4gdR0s3koKIauVCimyKakLI5W5w0W4QOklEnx0AWDeq663nXMg6bKClzZY1XoKu6GHMdBrVYrtWqf63cV8SjxkIAXue3qjxWC0G63cHX9Cl5//XX5+muvnV27evVer9f9bbNRv0dEo9/32G6ugNxaWWaA3CDEyqeBlEEshNPWu+wmPfZviezYqRCdT/8ct9+ktjI870svYR8UT6siEUiWJ4kgn3haJMklAaBbH6pWtlzUSbDGfygGimQCnAqrYukPuTQw3ezXJQMppeRzMG8x8yYRHXUdz3v5pz+8LCB/QMedT38jdncmPd/DbTD9gMB/BqJvEVGfJVsyuq6ICL7n4+TkGI8eP8LHdz7BZ3fv4eTkNIFfXc/DeDzG+fkI4/EYvu/lEzOVBTneYeuQkz6uq2scyvLMTeRz2Q5f5T1c181wNSboTDd8LOqYTHDVIoc6caXmfDiOU2rVPrd4xMVS43lMm9Sa42BtbQ2vvnobr7zySnD9+vWD5eXhx512533bqm0S/u3H8e1+f0mORqczljj7/9l7r+VIsitLdO3jHgJaywQSCZk6S5BsNtm32dMz0/3QD2P3l/p5HtpszPonrtnYtXm4RqPqpqhiKbKqqKpSAIlMaA0EEMrV2ffBRRw/cTwigKwqZlXBacmsBBABjwj3s87ea6+1JMuyDNhVV8FGdUTg5ILRF7yMKaymZS7Z+itJheZdd1vSha/q+2G4+JqSAZWI2IbdIky+VY2I31bWK6T35Zpz4juuQPT3s/EFhVtiyeww8zEzttjng4oTVEs+X/Mfr1Pb6p3fWqXT6iCYV8D8AzD/AxE9IqIBjmzZOdo++FHl8fLlBj5/8gSrz5/jrHQWXQICvu8m4FGrhUJB0vJr9MoDWpcAQFOedyvwaNfObbeYmsAjJqlNanMT79GKKG/Fv7QCmKzWlQoeOnHedrJMqT4SfUv0etnodyUwMNCPudlZ3F5ZkTMzM6WB4aG1nr6+vxS7e17CEhdE4q++GRSVSplrNcdhoMzgMqSsh57kGcuXoiInaq01bFQtuniQMhfGJhDpdCyWsj+4zDJW03+0b6AZzOAkJ+QXm0acWXkpRvk4NRNLlzlSgneKLOlJElEZhB0AWz5k6ax67v3Dv/zX6+rjNTk+/cMfrYLlD0MGD1nK/wbmfxIkvkMkxliyzSzB0ebN932clUJzxMdPn+LZ6hqOjk+SwtvzPVSrtRR4mAAiK1VQV55nTVxdxl2307ZVSCS7Kb2H6XxN7aYsoWK7iqPVRJgKIKpdiQqmeuuq45FdzRTSa6H56OoqYmJyAotLC1heXvampqa3+voGfl8sdj+2LPtYkHgtfOzE0NAIO44XMHNdgGoAXGLI9Ma84bGfngCKUaI1iqQuOnXRbL/+Z4oNiQwPps7AQ62CqGXVQ0029c29PG6NoEq10DQUTJTdd6MOkMMc8g4i8gk4J8I2kdiCEBeOdK+NE1+T4+mPf2zL8tkomN8E8z8J4J8sEm8LISYAzsUTfQQgkAHOL8rY3NrCk6fP8Gx1FYeHRwj8QAGPKsrlMmq1mjE7W51iUhd5lVNoN657WauQjhZUKRPw0H2usgwaVSGhqaroRHneCgTV1ENT6yoWW17utYbefkEQJNYsJhfkpC1k2xgbHcPCrXksLS7LmzdvlkdHR5/1dHV/nMvlnwNceV2uZRsAhgYH2HWcgKV0AfJBJBvzro0QpYajbsxjcIOg1lZ00i6U+M2KS3Kj4l2jN1gJbTJvvVW/LDZOZqXaUsQqrIUXgp53oPA7UEf8mjpGbBy7oyYgygCLzGGrdJgVcZYzMjUVOsowgA/gjIEdAPv5XKHa1ztwXX28BseT//0r2+3iUSb5HQL+O0B/R0RLIOqXLC2VkwiCABcXZWxtbeHJ47DyODg8gueHewHf81CpVDLBo1XloQJDfH+qinR1AddHZ6/icaVzHzFproKHztFkpRtmgYI+FnzV4ChVbW5ZVhNp3tnzstJEUXI+3DDnw88wSxRCoK+3F3M3b+LOnTu8tLRUmZyYfDkwMPCnYlfXUyHECZHwXysAqVTOYdv5gIlcAG4UxM7UcBdsvoAUnUiTVxU1en5qqSqSD5kTvUVmOF/TXHY7zoBTtIhpekqbAYhsTBBpJggIgrQQUDFXVAlw1bJEmkp26oDTicFRcz3NgsnUc5Jm7JjufjGzdBh8QoQdS1hHAxh1vvfPf3vNf/yVjz//7v1cueqNSQoeSsn/CNCPhKAlEPUypJCRuFSQgO/7KJXOsbm1hc8/f4wnz0JzRM/zAWZ4vo9atYZKpZKAx2XaVuq0lcldV5126qTqUFtXrUZp1faQLhbUOY+saNysCuIyPlumVpg6SqyrzS8zspu6NxMVu5/SuCSiTXVVI0KxUMDU5CRWVpZx+/Zt7+bN2f3BoaGPC4Xix3Yut09E3ut0TQsA6O0jFoLcaCysSkReerZY2wGQQoSjHRmS3rWbWi9EjXzwxKuKm1v8rUkPgSxzRmP7K7SqVX8j2psv6jcMXt26xMDzdLpv4lSBE064MeBK4ISBLZK04/r+uV/wr61L/orH//k//w+tfvbrfOA6U9LityXRf2WIHzJonkG9AISUjfsi5DzO8XJzE599/gRPnj3DwcEhXNcHM+D5PqrVKi7KF6k4WvUeNWknVGBRF3MAxsrjKuDRyeLq+z4cx0nxHp2467ZqRV320F+TCh5x6yoGj1Yju51WNCbwSG82w8prYKAfi4vzWFlZDubmbpZGR8eedff0fmjlcp/XarWLv/bYrrECAQ+xEF4d7J+CcSqI6hKyP10FUAteIN6xI6V/iMLVYQkLbEnFjBBGbl59PEPJVWckCYHpdlozY6F7YVFTXkloCJnARrwzM72IpO5Jfy2ZvDJOW3GjKoNyoilvkw48e7SdiZHGUV+5EBDCksxcJqYtZn7OTLsMdk69s+v21V/pqJQrtL7+vFCuVKZ9uG8z4UdE4vsELDJzP7MU6rUc+AFK5+fYeLmJz588wdOnq9g/OIDn+wAjEglWUWnBeegcgvr1rFwPUzCUqXpotdNvt8CqE1eu66ZyzdUQq6y21ZWDqbTz1qsIPd88CIJELJjP542g1jF4KK2reMpM5T4aav8w43xqagp37tzhhcXF8sTk5LO+/v4Pi8XiH6xcbs/Ty8zXBUCkz0yw6kBwRsSnJKguJEkJstSIjNSFQo0FPiVt0zhmEqHPlMVWNM/eSCps9IUIHC/cpPb/1ZaN2taKWmcqb4EmCiTdVaMGjR2aCmsXREuX0PhHCKrzrpr/0fg5gy6GotdH3MzxtKg6KAM8GAxiSlpZII5MIYVk5irAhyxpF4Sz/oEB/97Dh9cA8lc4nv3vx/Tkk8ddQc69yTL4Ppj+AYTvEuEmM3oBWGq71vd9nF9c4MWLDXz++DGePVuNOA8vAY9qtYZypRk81MVRbbeolYHOeXRSeegLtwlQOp240sd1TeFQsSV6O52JyYLkVYEtBg89afEq1QcjynEPAriel7xm03tFUetqcnICd+/c5tsry97MjemtgcHBD4tdXb/N5XLPQVTv7e3l1xJAhE0Aw2HGBUAXROQwUWrjTaSCR5w2qCnTU29g43sNbybtw+Rs/YXuf9U8KaEs7ECTnQlnbOfjykOQ0rpSOI0EaPTRvgi0pESKYFcNFOMvk4FIMxkjUkbQCZvaXKRHdCl+ZfH/MwdgLoNxSIR9CbooFIvX01d/heM/fvEz67i41weIBZb4gWD8FyJ6k0BTYO5iZgE0+AI/8FEqlfDi5Qb+8tnnWF17jqPj4wQ8YoV5bMuu6iXUe6SdOaIKHupoaicjsVcBj/g8UsprQ7Kgzrt0mjHyqoeq99CNEk3vTUcZ7kBoIKvoPTzXhZSB2SxRCAwPD2NxYQEPHzyQc3O39oaHRz/u6ep5P5fLPQZR6XVrXaUAJJcHmOEHEjUw1YgoIKKm3FaVQCdFC2K2PAn/5mhBNtqhK2FT2RG0nTY1dcBJL/TGsoIyqhWkCXTzRaL0fDmOrc0a273kS8kCEhOwxEAdtiR8KbkkWe4yy32y8mXH9a/J86/4+OPv/mDX3PIgUbBCjB8y6B8g6A0CxgAUmEGNhV3A89xIJLiJv3z2GE+ePsPp6Sl8P0jAo1JtGCOadrJZhLm6IKsTWKZQqHZAkNUaukzlEY+vtoql/SqAwwQesXXLVXkPVu5LdcrMdcOpKynN4DE4OICZmRtYXl6WS0tL5fGJ8T/39ff/tlAs/sm27KPXjThvrkBEHswyAHl1BtcAuABkDBTJbjfaoSciPD3cqMllJGy1xGRzgzswrJjJ49saoRt/X6rn1XZ4i5oceFv2r1i3ZVHyQpgb9YAy6qy31DpkO8zfybyIFRtsMBCwwyzPpORDgEq1arf3ne/dvW5ffUXHR5/8nqge2L5XH7II9xj4EUB/T0T3AYwCsJmZ1IXX8zycnEYK88eP8fTpM5ycnCAIJCQzPNcNR3Ur5hzzeBFSF2MVPNRwJ9WiRBfFtcrWyBILdsQBZFQeWQDSKmHwsgDX6ud03qNTq5LWe9hwHUhAM85y9z2j5oOI0N3VhRvT01hZXublpaXq1NT0i8HBoQ97ugsf53PYIoHa63zN2wBQLBbZcV2PgQtmlKQMajLxxFKIaJWfgFJ+GJwUVcdc0nGaZeJflQYhSj4EYkqUuCYMMZHbzeDDqb8bPljKrgwdjAor5xW/Llb+wco4FGnnnDi262POrAs1sy9K0y5Hv9mZ2QfzOYB9sugYgmpd+ep19fEVHZ999ik5NT/vUzDmy+ARmP8LgL8nQSsABpjZShvliQg8TrG+/iLkPFZXcXx8ChmNhzuOg0qlkozqygzLC5NFiW7LrnMeJvBoNW1lEuplZXqoO/wYPFoFQ72qWPFVp6Ni+xbbtlOaj0u57MZbyyhh0NMEkqZzzuVyGBsbx+LCIt+5c9u5devW9vDI8LvdXT3v5WE9t0rlCo318GsPIACwsbHhDg8MnIH5IGA+YaBORF0giAaxoLRMSNvJs7bYEye79VCvJ8AslTkpTvX0waoWMHKqTVpElNniYlUHklQXKkehg0mK0DHoRVqDCCktL8khJ9IEbU2hUM21CIGjUBC9JaW32dKtNDJciJYQzIAbyOAMzPsEHDPseql0cV19fAXHr9/5iSifnRTB1jQzvQ3gvxPhB0Q0x+AeZggoXAQzw3VdHB+fYHVtDZ99/jnW11/irHSWLPb1ej0RCapJgibwsC0rjCSIeu+xpQ0M4GGatjJNJWXt2NXvtwIavfJQJ65i8GindO9kAb/KZFSStx6dlwoepum1Tp4zaYlJCc8PK4/YGDKL9xgaGsStuZtYWV7yFubnjyYnJv7Q0939H7mC/Se7r+eUxOBrz18mALK8tCSPjo7rjOAEwAExLpioT4DyjX4/pXgQIQhBylVXAYe4dQXV3EypWEz+7y2KCU6JHhq7/8aC3ih71JHcBHiUIa/YDZj0JpnSRqMm40TuvAOllRxNVQgboIDbNLxM6YTpoTWfQGUJnAkhyvlCwZua6r0GkC/5+M0vfiUEcy8zzQngeyD8I0B/IwgzIOriZCyvAR71eh0HB4dYXVvD48dP8HJjE+fn55CBRMAStZqDSqWcCoMykdxqjnksag3lTdG0lQIeMd+hhyCZAqRM7SOdU1EXTj2gKd3/d5smrrKy1DsZ2b2MWLCdRbsaEBVXHqpVyWWcfOPhhMbrdoz55iF4ELq7uzA9NYWlpcVgfmHhZGp6+o/DI6Pv9vX3/6Wnp+fUErmvxfCLnX5zpSvBRwTeINCBIBoFIQ+Z1mCoGeIxmc5NGop0rgZHqYTxZEgTfYHmBFrKWG8V/GiiUJpHd1V+nZVzpsulImo7mFT+eQbPYuy7AS2Sr7L+mQEuMRASMTPXGDgAY1sGdCIlnIf37l0DyJd4/OXnP7WcAg34JJYB/C0IPxJEbwOYBpBjMLEMr/U4b7xarWL/4BBra2t4/OQJNja3UC6Xw0UtCFCr1yPwqLatPIyEeRSOpqrCdcK8lTliK77AVKFkta1iwtwEHh1li3xBrSr93lVHdrPAw2SLcpmqJqy6skZ2gXw+j/Gxcdy8eZPnF+bLM7Mzq2Pj4x/0DvR/VOju2bXsgvt1uQds7d8umI7BvM7gXSJaEEQ9Uqh2tY3RXKFme0CX7kEhmhvfl8wIWGZEXCaN/3QbqEnIl1W1mFXuST56KkRKbQ/pjaz0gh0PEXDE3TTAo0GgZ4NIC98vysaP9BWqsUiR7iMeR46u4SqYdxm8KVmeSMf1rpf4L+/46Cc/zbu53IgE3wfoR0T0d0R0TwgaZWZbtaogIsggQLlcwe7uLp6treHp02fY2t5GtVpLdsS1Wg0XlQpq1Qpc18t0atXzMbIIczUQqlUoVKsFuhPCXOVZVJV5q3HdTiessrRQWW0kvXLSf0bXe+TzeRQKhRS4qq+pHWBCI+N1Z+H0a6FkZHdu7iYvLy3WZ2dmNkdHRn7f3z/wYXdX91ohXyi/riO7bQGkXq/7tm2fCYEtItoHUA/piMi3NvpMRLybQBTKRDIae23OA2QwhCBYZKVWdJWviKM4KQEAavAgqfZO8wfSaC7pflXpxhOh8bxJmR8v/0p7S1eyJ6mErCRwcPNZNICBza0n3deLuLM8KZNqP9Z+UBxSIwNmLhNwYgkqCbIcCOu6+vgSjk//8Al5tVqRAjntM7/NxP9IhO8T0TwR9UvJlpSNND0QICXj4uICW1vbiaPu7t4e6nUnsTOv1kJfK5M1Sfx3O28rdSFXva3itlUnmR5ZVUcnC3gMHrriOksZ32ryK7UpzRDftWtX6W01lTTXFfi65UtnL7ohFkyqrhaCQRDCkd0bN7C0sOAtLiwc3Jia/nhoYPDdYq7wmUXW2V8z3/yVAWR2djbY29+rCIFdltgD+IKZfIDyIAFAhguXIJBs30NNed9G6u8EWFJlBBltRGBYrJu+oQsMlUU2qhvST9MgQRpPk+JXzO2ipEXGjeEANp1qRqeJyeTUxakHsm4hTC2u3JgkBSRLrjBjH+B9Yi53sef3Wfb1av8FH3/+9Hei7lT6JPMcgO8R4R8J9F1BNEOEbsmSwll/Tlq7XmRNsrm5iSdPnuLZ2nPs7++j7jgIAgnXcZoEgq8CHp22rVpNPF0VPFzD5FEWYd5JOFUTrajsJ9tNgOmvJa6OOo2mNb5+rfUhtcrDcZwo48McYNXVHY7sLi0t+otLC6czszOfj4+PfTA8MPinbhQP82XxtesaNK0y5ULFGwi6z0hiD4xjlvIGCZETgkhKSmzDRZwlHvtKmUBE/6DVHXwkxhOqkSFxB5GvaM44R0P5TqmKhFK6DLyiFiluXSVGiu1Zj9R3OUtcaOJG2pyroqMPGFQB+IQZp1L6tXr5LLj3z//3dQXyBR6rf/jYrtTrA5BymRjfB/AjIvG2IJoiQr6h72jshl3Xw1mphJcbG3jy9BlW19ZwcHAUTufIAI7rolqpoFqtNQkEs8Aj5hlUDylVdR4v2qrO4yptq04PXSioaz1a5Zln7fhflevQqxMTad4qXbCT0kMFJdd14Dr1liO7lmVhfGwMc3Nzcmlx8WL+1vza1PT0B8Ojo7/vGRzcKRSLjrBt/toDiKRAkrDrJORemKWNOSLqEkS5JjtoQakdPbVZQhu9WYmUUpug6ACjhZbTLSAGAzK9o1d36sSGTpHKrShPaN6xoKE/QXamQVNuOsNQV3BTg4syO7zNWQkd3CLKOVNAoApCB94SC3Jqfd41eHxBx+8++n+pv3cwX7moj/oyuC8l/5BAPyCi+yCMM3EuDAySScXNzHBcFycnJwl4PH++jqPjEziuiyAIWz3VahXVSjWqRgJj3rdqMqjbk+hhUCp4mAKZWsW/ZlUe7Qjzdv5WrYKhWq0TzRVBhqdoG8Gjah2v+lzp71GHyBRtfNXWlQvXCTM+Ui672nmMjoxgYX6eFxcWajdv3tycmp76eHx8/IPBoaG1fLFQsSz7a6nZagKQ1V+t4sGbD7yuYn6fSLwgEstCiCEisoWUobojskJv7GyUSV5VWGgYO40/VJZKCyoZt6VEvZ6EOsXVRCQspKh1RPq2XRfwUXr0lli3pm5exButpuYRW45Fhw0FYRPBx20LHWr7NcoyT9RLM0oy6j2WdMrgHUAcWHax1ts1eg0gX8Dx3rv/KZip+/ycbkgZvAnJ/xeA74FoEUSDYLbjdgoRQQAIpES1Vsfh4SHWX77As9U1vHy5gdPTM7humH9Rd+qo1qqoVqtwHTcRsqmLp757jxdsFVjpVU9oAAAgAElEQVTURT8rDCpLZZ7VsmmXY656apksSmLOoxOdR9a/O9k4tata1MpDB49Wrau27wF0hb0H1/NC54CMiblcPoebYba5u7y0uDNz48bHIyMj7/b19v0lny+WbCv3tfWrawKQf/kf/8JPnjx183lr37bEcxK0b5GYA1F3RH4kpoiNElqASCbz6DoRHesgSBAQNPKBGY0UD1JbUcTNfEjiOqJ6vmdYnrSwJ1Ft3NUKRxXqsWnnEbsodrRZaVeJIfNGyLxqDem30by/D6KSlNiHoJPu7j737t3vXwPIKx4fvlyzsb/bD4lbLOV3Afn3RPQ2IGaIqIcBKyZ443shCAJclCvY3dvD8+fPsbr2HNvbOzi/uIDjhjvVWq2Gaq3aMn5WHXfVq1ITVxGDR7yrNqm7W6X6teI8VNBQf29M/qttq3jBNOWZt2o3qc/P/OqXrk6aq0MFrwIeKWDyvI7U5sWuAm5MTWN+fi6Yn587uXlz9rOpqcn3RoaHPy12dR8Q0dc6q8fItOZyth8EOLJtbAE4hiCHKLwwZNBwlo15EEECMiLZTWiNyMadBEFw3G9k3SNemWKiZNfNOjDoVYERRNI7dlYfr5LoZM7raLX8h+DXiXLkcvoStT1GHYCIIhiTTHABrsrArds5ce2++wrHy5e/pnKtkK+fnoz4TLfB8m+I8LcAPQJokoiKzBCpaFggsWLf3tnB6uoanq2uYW9/H5VKFa7roh6T5YqnlWn3bFp89RhadZHUM8xbeVuZWliXXbD1aat4d6/zNa1SBS9feVzu0CeuAHQEHp0Ck+pzFVdeJlJfWALDg8NYXl7C0tJieXZm5unExNhvR0eGPunv793O53OO9TXkPdoCyK1b81ytHtbqdT6VzCdSyqoQkEQQ8aJLIg4xEmG2RjSVlYzzxml9zIDkqP3T2IHHdlhJdcENkpnjizvmSbhZps7UMC8zt4PYGDDVSFNskGEp066snVgMhgYLdnNOVKoBl1KaN+xNTD3eZiad1IkxJUMlejIGREAQvvCDQGzvXlcfVzyerX4samW3x6t5N1jSG5D8AwDfJdASgCEAOdUMUUT3guuFZPnW1haePlvFs7U17O8foO6EQrrYlqSVsjwGD5PGIwYP1ShR13ioPEmnC3MnSYI6Ia2Dh26OmBX92onPVfvdf+sIbABJlnkMIMycgEdsVZJFmrfLc9crr1ZWJZYlMDg4iNnZmah1tbw5MzP73vDI2Dt9A/3P8sV8xbLzX/t71QggQhCXy/uSmM4J2JaSd5nlGJj7hSDBkqIPU4CEhbgKS2nz1GVOs5UOF24Z/REJ8RzzKI11XBVoNI9npSe/2NTMahj0ks5/xMFPuio+WrSZDVCgtsGSYd4GqBkeQYqJYxO8KMDY0lhRd4lBwxMYDEmAb4E8S9iBVcxfA8gVjp//7J3c0YEzlLN5CRI/ZOYfEeMegcYZ3M1gi1N7kPBzqtcdHB8f4+XLDTxdXcX6ixc4Pj6B4zpwHBe1Wh3VahW1ahVu1LLSrTKyJq0ai1GzaFAHjk5NCfXn6bQC0dME1coj/t364qxXIKYWXGekutJLMGTrqK9JJc1j4FX1HpcBj/jDjl001HyPrICo+Pl7e3qxcGse9+7ddebn519OTU+/Nzo6+m5Pd+8qrK4Ly+75RhidZooFisWK9P2+CymxDfAmEWZB1CNYCAmAIBNBIUV/IEnZNbPSUAJEtMMXKS1IOvAm8cqCQTho8ipBWqWeGhhuqiaoEd9O6QXbDBadzBM3E+665WE82WUSA0JNSTTeMOoDms8skNIDZAnMBwx5KgnuWaF4DSCXOP70l49E+bxaRMCTFgcPpI8fEuHvANwVggbAsJiZ4kEPEnFIUoBKpYq9vX08X1/H6tpzbG5u4bRUShbZaiXSd9Tr8A1ppCZ7D53byLJjb6Uu159f5y8uY8euVx46eOiVh/o722WbX0b/wYaEOFL0XKoXlRpLG1ceqgdYR5WHejMq/l6O48BR4nj1syIidBWLuDEzg+WVZf/2ysrRrbmbn4yPjf/nYP/wH2zPPu3v6/vGtJkzAcSyZlmK8wuw3BagTUuIUyIxGSDIseLKG94Aoa2JJJGoyVnzxGIg4kyU7xhcPSlx+W22RTeXGMoXGWmUIWPHyXyVtrEryL7CLkFwUGdMifl09JFfMMCOlHzGkg8BlAKC+50337gGkA6OX7/7PvXmgrxXcQdtsm6y4EfE/H2C+C4RLTC4D4CIosPC91yISBzo4fz8HNs7u1hbXcPq2nPs7u7holxOXFir1RpqtZoxw0ONn82atFJBoV3l0UocqC6SJkv2TvmEGBTbTVtlLdKd6k+a1wLzPdEOPNSJqzjX/KptKxmR5jGXZRp+iE/SEhYmJyexsrwULC0unt68efPzycmp98fGxz6dnLmx/zqHQ32hAEKU462d7WpXzt6hnLUhhHUkhHCZUSCSgihdfgtSerQUpMNDYudcZeIpdgpt8B0NSxOw4u0eVw7c3NGS3M6GvREyRZmK9oytjg5UsYgwXlCa2mqm+iMbh8hgDklodcPoz0wASBKkx2BXMgf8RYywfAuOjz75lFC/6ILkKQY9AONvwPwWQCsgTALogmQhlUCXmNqruw5OT8+wsbmJ1dVVPF9bx8HRESrVGlzHQa1WR60eTlmpflb64mUCD3VDZdJ46K0YvV3Uil/Q22KdVB9ZIkH9/NXK46rgYfq6SdOVquGVfPdYKOj7fpK1cVnSXM9ZZ61158QTV4Fs0ooREXK2jcHBAdyam8Pd27frC/MLa5OTU+8MDg+/3zfQv0VE7jftXmrpd+F6vteXL5TAtB8EwZGUssbMvY1YWwESUtsJxXkeceXRiH/Vd0FB7MyrpufGoMFqBjhD5aEbvejmEUfWrr5GGFZkQMikgImurmBj0CGzsXtmdEmkjJ3JVeJ6201AAtJiyJxkmQ8CabmuS9fw0PrY/uQT+9Sv9dcJtwKm74LxdwDeImAGQC+ztKVqGBDzHcyoVCrYP9jH+osNrD1/jo3NTZycnKLu1FGvO+GIbqWCmqHqUK/9uAWlVh1ZLSu1j5+l8cjiO9rttFs1aZk5ZcnuKfzNZTI9vuhJq7hNpDoOx5qM2OPqSjYlMNjUS4kg8OH6LhzXgeu4TeARf1ZCCAwNDmJpcRG3V1bq83O3XszcuPHB+Pj4e0NDQ2t9fYOVb+L91BJAFubmuFou1/0g2AukXGeWu0ToB1GXEIIgJTgSFApLQAQEKSnxylLV28kEk3JDspSpvTeBFEKdogsWSda4VkYgrSrnzCmNBmENxXqLNFBoMKRNnIhq3a7easovbBk/y80+WGgxP9a2E0aNYowBwYAIc7av8SPreP7ZqvCDUs9RrXbD94O7DH6bQd8horsEjIOoyMyCFfQWRGAp4XteOKK7vY215+tYX3+B7d09lM7P4TgO6vV6CB5VswV7K3FgFt+hJwi2m7TqZFSXTYFlBv2TbsnuKfxNp+DRqhox/XerkKos8FCFgmrlUSgUUhNXVzmS1p3nwXFcOPXImp6bP1vLEhgY6MfM7Azu3r3r37lz++DG7PQH4+PDvx4dGfx8eHTs7OvksPuFAQgA+FLWGbzLwOcAlgBMCEF5JmEzc9i6siyIwIKwbAjZuCGSC5YbvEhSESjrMmkXVPK3CMd9TfWCKXWciJW1npKqQl+Am5UjnN3OaspDb+5LXW6H9QUt8mF3LoBkj6X0mDgodF8T6PqxvvpcuCWncF46H5CWvyAlfxfA3xCJ+0Q0C6CfADu5DJUR3Tg58OTkFC83NrC69hwvNjZweHCI83IZtXod9VoN1VoNTr2e8AOmtlKDLLcV8Ag3UDrfodqBmDiPrBZR1nXYkjRXxL+6Jbs6adSu8mhs+Mzg8YVUIbFMQBMKxuDxRWk9UuO6dQdOzYHne5nJgn29fbgxfQOLi4vB4tLi2fytW59NTU29Ozw68oe+wZ4DS1jf2GiFtgDS1dXllWsXRyTwVIA+B2MFwAARWSRCAwfBFoSwICgIRYVoFhXqwkFCI2SKDTcdKzkijVlcZX1PiHpTVaI687ZMcUqAiU0/Q5Thy5uxo0I7bp2+IOyIBISAw8wXvudfuL7vgNxrAImO3d/8is67uu2L89M+3/dvMOQdlvI7zPw2Ed0RQoyCUGTJlFQMyjXo+z6q1RqOj47wcnMTq2treLmxiePjY5Qr1YQgr8ZEuWEqR11Q1eqhYX+CJJumlZuubkao8wqtwKMT3oOjSktKmbSsVG+r+LxN4KEvpq08tzoBlMwAJ2VTp47qqpG0qsfV5Q0SG7va2OMq0bv42Urz7u5uTExOYGlpIbhze+V8fv7W4/HJiV+PDI9+MtA3vFcsDrjf5PusLYDkcjkOSqWaA+z64GcMXidgHEDesqxcWIVQWIVYIrT2E6SM9DbKZ05xFZGKQsqkFUQUPpaDGDwibyyFx1CzzwEBUJSzzjAxGGmdB2XtwHSYMdkxc9rUlzqxR/wywCO6WcNGW50ln3mue1opl2vHJ8fyGjqAnY9/Z517TrHmOaMSYpmB7zDwHWbcAzBNgvoA2Cy50ZKgRiPV8zyUzkvY2d3Di/UXWH/xEru7ezg9O0OlWkW11piwcpWWlWlB1fUdsZkoJSPt7W1JOrUkuVTlEbeNlHZQMqaqVR6NMWMLliVach1fdOWhP14FD8/3gUsIBVvxHyGoy2jiKrSdcZw6XM/NBI9CoYCxsVHMz9+SKyvL1aXlpRezszO/HR0Z/nVff98627kaEfG3GkAAQPT3ByiXSwj8NQB/IsINIaw+AJaUUrAMNSGWEJCWgAxCmxNWPNfjiYbkhlBuHMkMK74YORZqSMWdV92FpPu2ULkHfQywlbthPC4ckfipL7O5IknabskvJuM2hjKxQ8tAMXI1psdyeqiACCSEhJQOiM4ZXAp8r16vVr7VAPKXj35FCAr5Y88fClgsBggeMuSbRPSIiBbANMjMeSmZ1Ao57qvLQKJWq+H45AQvNzfw/Pk6NjY2cXh4hItyOXTPjcBDF5K1mrJSDQgbvzMEDz1RMN5J67Yk6sKnciVZXIKJAzEunMqCHHMeukAwbcneOd/RSbuoFRjq4sfUtFUQAJEaPybNdfDIynA3j+xHWg8/fB/qTj2cogvMDru2bWNkeAhzN2f59sqKs7S0tDk7M/vh+Nj4u0MDQ08HR8Yuvqm8x6UBhIhY1uu1GvOWL+WfmbFCoBsgdBOREJYFwQwhbYgggBABhCXBEJHNtRrCFE2WkAA4dC8NggAivllEOCUliCATTUkMCFHVEcJRqqcV76agZLcnMMOqLp7SC3iSLcI6v5CGAm612lN6gszA0ugDvqrOkfQvKK04mJ82xFUSHhHVSFg1yuW9kcmZb2UL6+f/+WMa7euyXZ96A+lPgug+Ef2ASLxNAnMAjTJzNxEs1spREb2vrufh4qKM/f19rL94kRghnp6dJUmBcdXhRa0dU064amNuGsU1BUABZrJcb1np1Yg+/nsVXyt90kq1lTeN6qoC3KyW1VWri6wjHtVVOQ8ww7Ys5JTKo1Othz4yLxNwamg9smJp489qcKAfMzduYHlxyVtZWjqcn7v16fTU1DvDwyN/6u4bOCOib4UnXcexdVQoBAiCM2JeZ+Znvu8vCyGGBAmLiSmxU7AskGWBpASRTFbPtHiQkzWc4xuRG8rSkJOIvbUY+kpMsYI7ZQWiOwFrOetJ5JQ5o7wpB0QRszclDaaEjdSm2XQ1ViT9tM1CSzAxETyyrJrI2bVcX8HvH+j9VgHHb375S2LPtYp2oct3rXEQlkB4AMLbAN4kIWaJ0CWZLdXDSn0vJTMcx8HJySm2t3ex/mIda+svsL2zi/NSKdJ1pKsOFQj0MXKTqlwlxfVq5DJ8R9YE01VMEeNJq1aOunFF1AwS1LhX6cub/FOBUa0+4lAoO5dD/gqch+4dwRxpPZwo28P14PtBJmne09uLqelpLC0t+SsrKyfzt+b/dGN66t3x0ZFPe/t79+1Cwf+23IOdAwgRn5ycuAD2CXhsCTFPRMMkxKxkmYt9sYSwFINFEX1aUkknZKgZCjLxxEqr5ho56WHNIUlfuaOaJuWoS4n3Fid2B9olo6QepvgKygiTogwYSFpgKhlpulgJTVZYDX2aehlnC6zMCwAD8MFctWyrWsgVvImbU9+aCuSDH78v7DwXOW8PC+J5AI8YeIsZDwCeY2BYssxBhunzTe0eZviej0q1goPDQ7zc2MRa1LI6ODzERbmMmqImVzO+40VN5yZMqnLTZFLMgRCJzAwPE99hUpZfperQY1j1/HLdUTf7fK5eVZhaTFltp7j6iI0SY2DL5/OwL6n1SO3OIi2a7wdJ5REaJJozzYkI3V1dmJmexsrycnD37p3zldvLT2/Ozb4zMjLyQXdPz4adL9a/6bzHlQAEAF6+fOmPj42dFovFzywhJgGaIqIRIUQ/M8iyLLC0YVlR9rAQCFjJ9uBGLKzai0x9LQIBjvmQlINtSJrHhDwRaVnlCgAZMsup8cMNIlyLvCUms9cut17YDXZX2fVHIpA3OW9l6thTYCOlZCmlG/hBnb2gLn0ZXGyUv/EX7K9/8R+iK58rCIEBJswwcD8AvicIbxDoFgjDYBQZLBrZ1OGGQsQbE8moOy7OTs+wvbODtefP8fzFC+zs7OD0rIRKpdJoV2m+T6ZFRV9w40Va7++r0QO2HbeG7CYrkHbgoVYRnSzSatWjusmqVuTqmK5uzqjvwF+FLE8ZKRoqeL29Z0oUVP2tTM6/bd+TqAMsWTZSBRUwDQJpPKdcLoep6SncXlmRD+/fq9y5vfJ87ubseyOjw+/2DQ4+twtdZRLWt4qHvBSAvPXWW1w6O6sT0TaAPwUsZ+HzNMAFIUQBAEkZRDdFuFsgKRvpgrG6VlNixES6QEIQg6IbkFPqcqSI9BBk4vYUgfUwWVJ3NAqIRPPkwmTUpvkwmlpVOnBk1wpsbLxSmvjQzkGxlm+sAgqQRguU9GXgB67nulXP8RynWvX/5r/98zd25/Obn/3SGugt5F1BfczBjERwG6BHFOZ0rIAwQaBuAlkyqnjVTUkMHr7vo1yu4ODgEBubm1h/8QIvNzawt7+Ps7OzJJ887oFnWa+rfIcpu0Nf+LOiXlv5WekA1OmO3vT1GNTiKSuVLNdfiwk8TF+7bPuqXfys/lpVzkMFj0KhcPk4Wu2+lIm7rgen7qCegIeZurAtC5MTE1hZWuJ79+46t+/c3r41f+v3k1OTv+kb6H9i5+zzr2ss7VcGIAAwMDgYuOfn576Uzzwp32dgTBD1C4FJCLIty0JgWRCWBSuqQmQok26IlZhBUsISBJBAPE4Z9zaTXUgq7lYd3429iTiJoE2JFJlTIIJUNUJNyztFlUjaoqBhyZVdCXTSbeUOfiZ1Nu1LbzAkMwdB4MkgcCF9P/cN9cFaff6c6qWLvFtz+n2SN0BYAcR9At8nYIUgboAQjuUyE1hCz5kPW6WMWr2Os9NT7Ozs4cXGBtZfvMD29jaOjo9xcXERCQIbZnlZbQwTeKjq8SyiXOc7dOB4lcW5FajEbroq36GS5arQ0eSxlWXLflXwyPq+XinFlUfctopV5rGzblbl0fZWkIzAb4wtx5Vm1riubdsYGBjA8tISHjx84N69d2d37tbcpxOTk+8ODo/+KZ8vngphfSuD3OwrPahe91iIfRbiE59oEERTDBSFEIOWZdm2bSMIfEjLgogmKFLZ4ZLBJCFBsEgkAfXhrLyVUqbH5HhickJa2mBMnKuJgsakQmju8M0Rf6SN7yZPmTL4pQZUkdKLzmh1JSJFje/QoSJN+EMZFkgDRwSg4RkJSLLIFzkhc5z7xl2cLz77OHdxdtrn+/40LHlbMt5kyY8ALIIwAUIfg/PRRIUS+KW0QhBOWFUqFRwcHmFjYwPP11/g5cYm9g/2cXZWQqVSDWf+lZZOFniYFlq1DRSDi7p4A8gkyrM4BtOOPcs51jTSG//bZIioV0itKo9ObUkuCx7NzrtpZ12VMFcrj6vE0arvkcoBOY4bVpsReJgcky0h0N/Xh/n5W7j/4H5w//6D08WlpT9PT0//emh45CPLyu8D5ONbelwJQMT4OAd7ew5b1q607d8zYzLyx7pLJAakZGFbNqQVQAYSQkSjvLKR6Bd+mHFFEgp4pORkJl9ENsoNPqRBiKdV6sqYblMHqQEuxMpEV6o+II0DaRYkhqekzNwmTrxKIE6qP5XB2SX/R0YViH5PsKnUoaQNJ0EUwBISsBnfEBus9/+/T8juDWyr4PecXdQmJNMdCX4bwNtEtAxgnJl7mJFDOsULjcyX8P2VUqJWr+Pk5BRb29tYX1/H+ouX2N7ZTaoOlefQq4UsrsNUdajchS4KVPMyTHyHXtm0Wnw7sR9XW0CqDbtKlreyJmkHHl9EdZQFHnrbStV5tLMoybKrTz6rGDwiMK3VanC0Vp5eQfb29eHW/C289dab8v79e+dzt+Yej49PvDs4OPRRV1fPphCW+20izb8QAAEAa3KSSy9f1tDdvY5c/jcARiSoXxAKtm11ycCmIAgQWCEPEtuxc2RpwtzgRCAlmEQy0pvamUXgwSI0L29s9DkxRYS6A9P4iZQOzzBKFfpnpae0CJp0RAOChv16Z7nnpuiSJtBjymJPknOKHy7Dlx4QCU+Q5bPgiEH6+h77Lz62jo+8XM2t90HQuCReANN9gB8R4R6RmCWiPgZslpLUasO0KLmeh9JZCbt7e3i5sRlWHZsb2N/fR6l0nozlxjxHyw2TRpLHi128WOmLrG5HYvKOahW2ZJpK6qRDqZ6bKg6MLT9UrYqp8jAtoJeJx80ycuQWfnE6eMTnGrezVfBoN6rbTnUf53rUXTfFc2U8AD09PVi4dQtvPHzIbzx6o7a0uLg6MT7+q76+vncKheKalLJqWfa32j7IfpUHD8zNBeWLi3MGHjPwvpRyhAR1W5Y1Y9t23vcDWCKAtEK7kgASLBsTWI3pq8YOQc1YJiEgAATMjVQ/dQQ2qTAo8dZK3QSgcETYtKIzQssV6ByJ3lJqVo7wpXmONvTHZX6ckrcuYIbPjIAlcSC/niXIBx9+IIp2UDg8dgcDiWkILIB4hYjuMrBMoFkhaJAIBSlDt1xTtEtc08UeVkfHx9jY3MTz5y+w/uIFdnZ2cXJ6gnK5nFQdrTgOveowOeWaJ6zQRJSbjAdbhT/p/MVldvT6iK7a2zdNWuk7ehO48aUNQ7NJ8suARwwcnZgjdjJAoOpeXM9DYOI8AFiCkM8XMDc3h4cPHvAbjx5VV5aX1m/cuPHu4MjIr7p7eh/bdu7ctu1vvfec/apP0NvX51cqleNABh8zcx+z6CeifiHEiJ2zKck+lxKSG4mEiZFi7H+FUFQogyCcmBEimbiKRUvMrHWqVOt1SlmGNL4cGzuq3AmbW0zcDAjm2StSAq8aM2Dqz6UE48ZWFGXDjlI5NZc/IVRKlkEQeJ7neb7nB9L1vz6Gn7/75a9ocKpLBIxCvRoMBB6mA8gVBj2EwANBNA+iMWLqI6AIgoh746Z8+hA4AtSdOkqlEnZ39xI1+ebWNg4ODlA6Pw/1HBlkqbrg6DxHK0W5ujjqU1a6qLBT4LgMeOjcgbpIxouxClqmakrVqrTb5berJNrZyes/p7etVPBQFeatRnUvDR6OYzS/jNuf+XwB8/O38MajB/zGmw+rt++uvJi9Ofvr8fGxn3f19v3FzuVL9rdsXPdLAxAAcBzHE7bYEqDfs+QRSTxCQjzM5XJ9yUUiJYSUADEkB2BQNI3F4RofKUKlDMCwQoNGEmDBII5uQMGhJpEbYECR53uaXKckxCrsdJn4icZeNm5hUdNAFDc8HamFalx/cg3ksgasSGtTpXkSheIBpUCEwiF2N/CDuucFnuf70vdf/yms33z0e2FfnOYob3WVyzwIyGkZ8DIz7jFwj4gXiWiSgF4wbAaTjKMAlPTKVChZEMBxHZRK59jfP8DG1lZkgBiqyUulEmq1WuaUjan3bao6soBDt/3IWvCyWlamnboOHq28rtQpK9WWRG/NmTQeceVOaK03yQKHTry4Omm1xX9Y8baKzSQvS5jr74saR+skQkFz20qQQLFYwPTUFN568w28/fZb1du3b6/NzMy8Ozwy8tPevv6P7Vzh5NtiU/KVAcjw8DC7zkktCMR6EOBdZvQTUb9lWStEyEkZUBAEEcchk0U/5jIkyzCcVQYIpIAlGZalEKLJOG/ja6n4SUUPYmBCjDshdayXlO0+N/pjmiSjYbOSzFy1q+q5XbuKm7gPagM00fshAfbAqJOES4GQ1mtqGl2prdLOzrF1foEc+X4feronAcxJyQsALQNYAuGWAMaJqAfgXDj1LdMTcUJEC134pSAIUK/XUTq/wP7hAba2tvFyYwMvX25ge3sHRycnqFYr8LyIOG6x4JhGWU2WI6aFstN2VSfCwCy+I2uxVCeWVD8rdaJIBQ698kgBR/T+NrWBW1RJTREMzG2rlazKgw3GiLoyv9OjIUIM4EX+Vk69DkcbJNDPq1AoYHpqGo8e3sfDhw+d5eWVjZmZ2fdGhkZ/3tPV97Fl5Y+Ivr0TV18agABAvjAs6/WzEgL6nMB9BJokUK8Q1lQ+ly+EU1ZBaF0Sf9DxyGTUypKSIKNAKo5GfxuakGgkNqo+WCGjkzFa1i5UNgfJJn5cjMhNj80EO8LpLVIrADUOMJMX+SIO/dnjGOGkReZLZk9y4MvAk3jNWljvvf8uDQ12W+vPjroDXw4JiQmwmIMQKwBuA1ggEtMkMMTM3WDkODbsZ5lKr1QXKM/1UavXcH5xgaPjY+zs7CbAsbO7i6OjY5yfn8PzXEjmth+MqeLIqjr0r+vTVXo2eKuxXHVTcxUJj8obqFNWpnPWLVb072ed31W4jk5+Tuc8YvCIOY9XAQ8o48ue50cWJXU4btzSM7/X+Xwek44mb1oAACAASURBVJMTuH17BW+9+Za3vLS0OTU1/f7wyOgv+/r6P+nq6jogS3jXkPElAQgAFIuDwUm5fGoDfxbAEBhFEP7Wsq0buXw+F5fVzBKSI6Fg9KGHJHpjWkIKK3HoFYLAHP4hijNAkAII0jkF5sgym6Pkt/QF1uh5cvaUFjWE70TtG1iN+ic9rpWZh86EjL5X5s8lukhmGchAup4nHc+F49b/uoDxwQfEvi96cjlbMud9Ibpq1WCQmGZkQIsAVghYJqKbJGgcwACAIhA6+UuWxt0vAMgg3GXX6nWcnZVwcHiAnd1dbO9sY2t7B7u7uzg4PMJ56RyO60ZRyWi7O25HkqsAowOKXnGYFOXtAKTdSG7W7lq1JFFbVrqaW1eXdxqBe5md/mWAQ+ckdPDI5/OZMbkdgWz8/FLC8304rpNktmSBR2xRMj01ibt3buONR4/cu3fv7s/OzL43PDzy0+6e3o/yXV27sIR7DRdfMoAAAPd0B1yt73MgPwBxjgBBJL5n27npXF4WGiCCSJ0e/Y8lEJHogfAjV18BEY/yqjvR2OtKcedNmVHFrQCK0/uEoS2gAQDHWezchDPNi5puJMeNFhuaSQzKqChMuhQdMFg1f1RneZkDDgLfD3xZly5f0FcPIJ9+/D4FwbFdOqjlyzvbPXaxOMjFwrCdsweFbY9LpjkiWgDhFoGmiWgkalPlGSCWaYfc1KLBgGQJz/VwUS7j5OQE+wcH2NnZw/ZuCBr7B/s4PjnFxUU5JEYN8/yd8BzxL1QXGFPVYbI4VzUdahvMfN20b1e14hTUxTeuPLwMEZwJ1HQwI2rvwNYJOLSasFJfg64wBxpJgnqex6WBLJ5CUwcJ6g6cejq3RT9yORvT01O4d/cev/XmG96DB/d3Z2dnfzs8MvLTnp6e3+Xs3E4ul3O+zVqPrxRARkjw+WnZoSK2COK9MBSEJQnxt7ZlTefzhXw4veuGI70xF8JRvzkIorLbBls2YEVkX9yjjaZKwmqEICI6hZVpp7iyScKiVOtbPYQjNcRFqn1SYyorXkzQACzmjHaT/rzpJ1PgI0tHQmlVvSqYT0gAcOjGID3fc33frbN0ql/6xfJv//Zv9JdPP6WZW7fE0uJi1/OnzwZAPCqZpwTEbIHkDVhi1LJzQ4JohEATBBoTQvTF1QZzqFphwwIbL9bxKG7pvISTkxPs7e1je2cX29vb2N3bx9HxMUrnJVQr1ZR6vJNWlWlRzWpXqYufyiPoYU86gHSymF5mB6+bCupVh9pSM7XjdJFilkiy08W6XdWiAy8bMsxj8FDV5Vng0clnG3MeYaaHg3q9daYHUfj7JycncffuXX7zrUfu/fv3dubn5383Njb+k57e3g+sXG7bC/z6NXh8hQACAP1DvczM9Zpf2+SA32dJAiBbWNb37VxukplzYZStRBBwwklIloAMk+GCIIAlZRKhmboZSB3tRZOdlC7YM2VBJcFWQmReoEQECCUlEU3S52zaomN5iPqDZPhybMrVoPCjs5BSSuk6AdfPfK4cf3nc3m9+8xtxcnKS/+Mf/tBdd93+p0+eDHm12sTszPRM/0DfnGVZCyx4loFRyxI9ds4u2HYuz+AuBvIcB5hIpd+vLLwAEAQSruegWq2iVCrh8PAI2zs72N7exs7uHvb3D3B8HPIbtVoNfsbC0Al46GO54QY2myTXW0EmrqMTq4/Lgoep6nAU0z+T9iRrIc5SuutVSSfn1U4YqD9fvClQzQpVgaCaOXJZ8IgrG92yxXHqmZkeMXiNj49heXkJjx4+8O/du7c3v7Dwu4mJqZ8N9A98UOjq2ha5XL2Yz1+Dx1cNINHFw8xcdaTzMuCAQMiREF2WZeXYtkdkPpeLc0BkpBMBAxISkiSCIBzplTK+IUI+QwWQsAppIEdTgmBKGqIAiWof31SKw2gDT+p/cBvwuBKItHs8NfV6pWQOfMmu66JU+WKs3Dc2NuhnP/sZffrpp9bLly+t6enp3C9/+cuBWq02vre3N3taKt0C89Lp6cnMyPDAWF9fz7Cw7GEAfQAKoOQIT1XKaBSXm/rVMtpAuJ6LcrmCo5MT7O3tYWd3Fzs7uxG3cYiT01OUL8pwHDcc886wG8lqVemCOZ24FoKMLRm9VaW3qS6r1DbtmjvhOlRFuQ4cejvORD7rFd5lctXbgWKrVp0eBBVE3YU4y0MVCF4FPHTLdzfiPBynNWFu2zZGR0ewtLSIRw8fePfv3dtfmF/4/eTU9C+Ghobe6+rq3szl8rXryuOvCCAxiBweHFZy+dx6tPOxSBCsnP12njDKzDnJDPb9JD+dJUNSgCDw4PsiDKhKFoNwUouVGydsX8Q3RDpAlrXUJop6pa12T+GPqELEuK0ktOoH6bjdZvYD6VEtaupypZMNlZZVE7aQCUSIWRJDEllAsfvqn9P//J//Rnt72zQ1NSl+8Ytf5E9PT/t83x8jounVtbXZ1dXVGZZy2nXdKcdxbhSL+elqfWjQ8/0cEp/LsMKQUkJyAClFY6iAEAo6OeYaJBzXRblcxtlZ2KY6ODrEzu4etra2sbu7E01TXSRhTiYRWiueo50QUF/w9OTAmCTPcs1tNcF0VZNBnSuIq474j87x6C0rE6g1gp/IWCFcdrffDjxaCQTVICi9bXUpnlV5n9TWXj3iPDzf7DIAAnJ2DpMTE1Hl8dB7+ODh/sLCwgcTExM/7uvtfy+f79mwrNw1eLwOAAIAY+NjvL25Xe0Z6F4XwgLBYksIJhJvMfMYM+djSxMZWXHHk1iB50NakasvhWR4GAUugKb5fFboDVUNzqkxXF1jnsIYVkEkXu9i0FAf11jtqWUt0ebGMDy+gy/EhRARkbBsi/K5PPVavW0v+P/1v/6dnjx5gcPDLbzx8IGYvTljbW5tF5+vrw0cHx0NPXnyeJiZh5h5olqt3qpWq3cc113yXHfUc5yuQAaWJYQ9ODRkS8kizvwK30Ol1UPR8EM0bi0lR+6nDmq1OsoXZZyenWJ//wCbW1vY3NrC/v4BTk5PcXF+gWrNzG10ynOo2od0q4qb+v1ZFiRqLnkrLYcJOLImvzpZrE26DlPVkTV+bF7UzQCSxSVcFTzU9zkGwPjcYzv2uGVljspt//6YYm7jfBPHcaK8etaK+PB32JaFqckJ3FlZ4YcPH7r379/fXVpY/GhibPTHfT3Fd/I52hLCq1vWddvqtQEQALgxe4MD9qs1130R+ME7YAgi4lzO/o6UuTEZyBwSd16plO8+fN+LxnlzCZkuJCAFg6V68TY4Cla5aG6INkIBI6d4EDAbU9GSxLSEeUjrMC5/lxlLlMv1uxpjWCSEELZl27l8QeS7GZ7hof/+7/9O+Xye8vm8uLgo53d39/MXF6eFWrVSfP+993o++oB6fRmMup4/53juUr1Wu1kuV0bL5Yv+Wq3WHwTBkBCiz7btnG1bZEULViGfQ7GYJj+FsBr9bCEQBBKe58JxXdTqdVxcNCap9vYOcHBwgMPDQxwdH+P45ATnFxdwHScS/eFSY0H6gqrnlesmgnoLRCfHs3b07ezWL9N6yeI6TFGzOsFvspRvLVb84nzSmswaDMMIatsKaFjZv6pAMP59ceWhpivq0bypTnZEmE+Mj2F5aYnv379Xv3v39s7Cwq2PpqenfzI8MPxOl53fyltdjlUoXoPH6wYgYe/K5qOzs6oA1iwiQYAFUF4I8aads0cA2MwuAtno8cc3lGV54Y0tbMgoJJ1klDioT83EbZNorDfRZ3BzeymJxjUs3mqbKqGu1d/FfDXxYNOvusRNxAw0Jmksy7asQs62ZCEnjk6Pxb/+679SuVwW29vboqenx378+HGeiApSyp4gCIbK5fLo6enp2MX5xbjveWP1em2oVqsNeUEwwczTQRCM1Ov1YrVatWq1KgWBtGzbpt6eHlhWFyhqQfR0d6OnuweFfAGCGgpxZobruHBdD7VqDWdnZzg+PcHJ8QmOTk5weHiIg8NDHB4e4fT0NMwdVwjxGLQ1vX9L0te0kKpaDh089FaYriJXuZJWBohZvf+rZJTrE1bxaK4JPHSuI6lICRnggVcCkaY2V8brjs81zi5XweNVx3T196qZMHdaKsxzuVzIeSwu8f3795w7d+5szc8vfDA1NfXz4ZHh3/Z0DWzl6nlH9Ipr8HhdAQQARgcH5enZWYWAVWIQgwSRZVs2HgI0zGCbPCRlbxI7KSxYlh/dPARmkRDeSX6IEFH1IkI1uzqSJZuza9VoXYpaMIl/ln7fEVJmWA0OQ7+5YnfFtD18ZnXRyU3O0YByskhw/Kw5GQRd9Vq1b3Njs//J2vMCiPprtVpfqVTqOjw87BVCDBLRsO/7AwDGfN+fqNdqk7Vqddzz/ZFavd5VrVQsx3EsyWwzS+H7oe1MnAttWSKchIvOxbIsdHV3o7tYhGWJZGzS9yXOzs4RSI4yOOJqYx8HB4c4OTvBxfkFKtVqKgFOt9VQ38tWU1H6blwFjlZEcRIUZKg42nEc7Sw99DZQq+k+nSQ3qcl1QGgGS/X3Xy058CpCQlOrTn0t8ecaV6Rx6yprjLjTqk3lVVzFkr2Vs3Iul8P4+DiWFhf5wYP79bt3720tLiz9dmZ69qdjw2Pv9/T1bdk527sGj68BgADA0OCgPDw8vBBETy3blpZt5xAaijwQhCEANgOQEYgEvg8hBILAhpRRJkAkDiSSEESQESeSNJ1SdbbWomLlb2Zj5dF0AwsCCYWQpKg1RukUQrNpo2rw2PhS4jvU9n5tro8YLBzH6Tk+Prn5bHX17T/+6c/Dp6WzfHd394yUcrpcrgzUarV+KeUggEHHcYqe6+V8388FgZ/zPC/n+b7teR4FgQ8ZhPkaYawwJ95RworbUuEfy7JgR0MNjufi5KyE0nk5HL09P8f5RRml83Oclko4Oyvh/Pwc5ajKUA3+sowJWy1k6gSU3gLJSpMzTSJlaTmydBzq99v15VstzurP6AuhGvZkeh+yskRUXq5dxkgnwKGP52YtyvrP6GR5vHCrVuyvQpYDaIRBeR6c2FW3DXiEOo8JLC8t8v37D2r3797bmJ9feHdycuongwODHw709+5axa5rhfnXCUAAYGxsjH3fr/i+t+r7ns3MVviZ0/0cMMTMth/vJoEwv9j1ogWtEO3CQgCQscBPUBg4BYQtrjCnSgmaaizu8cJtrDhMIBJVKHHGCIFS1iUwaRR1IOGmzmxnN1RMUke+XQxASrbK5crQ5vbWw8dPnk6tr6+XL8rlXD6fGyTL6pNBUAwCmQuNCTkXBAH5nk++0l7w3DAPgYgTqxaLLQiBiAAH7FwOhWIh1bsGAaXzczxff4nNzW04nofyRRnnF+e4KJdRrlRQrVZRq2Vnbly2faIS41kiNbWlpR+ttBztKo0vamop7t2rwKFOV5meqxUXo5LjnYY/6VYnWeR01uP099YEHipZro/pXpYTijdOUrVkdxzUI/DIUpgTQoX55MQElpcW5YP796v37t19ubCw8O701I2fDQ+OfNjT3b9ndXdfg8fXEUAAwLZt6Um/HJB8Qr6XI0mCiThn2w9Z8jAzC0QXpWQJz/cgPAuWpfRRBYEgQKGJlsJbcDLqm4gN0YjEbQrbiMdzkbao1kGkYaZIAElDIh4yrds7pMnbcicR10Cu5xYvLsoTpfPSaKVa5WqtSvW6sIRlCYpjGmPuJ8UvhH9S72G0GBGlrWMsy4KdsyHssL3nBz4q1QCOu4/dvQP4fjg6WavVkmzpQAaRuQBnjt5ehhQ3kcQqv2H6Haa2Tyvg6DSX/KqHPm4at6z0ikznXfQx5ObzpaSNe5nW06vyIHoVFQNglhX7ZSetoIAHM0Mq6Yqxq26mwhyRwnx8HHfv3OF7d+9U7ty5vb64MP/ezOzMz0cmJj7sKnbt9fb0XoPH1xlAACAnbH7hOxejOfrMZ4uJhM8yYNvmRwAPB0KIuKcal69+Ml5pgcgCURBnhId1QVJdxCFPAoK4kUyYtI+0C1ZQY+CX9UpE8+OiNgt9WxygK+EHpYWRJFnaUrIdFifKSKcQAAEC6emYeLdu23ZCXKs3d8rqWwFj12l8BvEfzwsn5PzAb6RMIt1SuYwhXnN7hpoEcCpwZE0c6WO8OoCYKpvLBD11uuCyNggSA4e6W28WNIqWHladaFAumx6YlTvSqhWng0fcLjK1rC4DHulugZZz0gF4AKGr7lRojMiPHj26WFleWp27efOdG9NT/zE+Pvrx0PDoHhFdu+p+EwAEAG7ZBWYulcosPoPn+wGzY1mWT4Q3hRDDJIQdlvk+gqj0FySQzwuQIAiEZlgymgZqdKoii4p42y4SYUc4/hu6a4Alg0VjJ8vGxYAQJ0slbaykd98COxQuhimjUukQPNT/IqKwvVQohu0lQ94DExItRlyRMXOYTx+BjDrpE9+sKhGtTr2oo5MsI82O5oZ8GXK0VbWgt6iyAp30xVQHDBPHof9u9fe1aoN1okFRF9j4/VRbVSaeozVJTm1fs+n3m9pPV2m96ZYkaiWlijtVK/ZX4TtMpHw8aVWv1+G5LoIM3zMiQlexgOnpady9c4ffePSwvLK8/Nns7Owvp6YmfzkyOvrHgf7Bw+s8j28YgIQf/gDX686F7/mPiciFsHwB8gjiTUFiXBDlXJcRBBK+50VTWTYsskNuQoQqcwEBGSXYEsL+vlSp6MRYEYrOI3ICZiXiUyfHVSV8cnMohL1pciuL/qAmbLncjRbtVLuKRfT19KCrWAAzo+44sDwvJHszetvqQqyCgrropQGjechATYNsOA237rdnEdymNpV6rq36761iWrMMBdvxG53slvXXor+/+mSVWnGYxkxb2aO00nZktdhakf1XbVvF5623rGJleafiwM6ub0YgAwR+DB711NRelkt2T3cXZmdmcfv2inz44MHF/Xv3Hk/fmPrJ+Pj4f4yOjn0+ODJ6atm5a/D4JgIIABSLBVmv18uO46wGUkoGJIF9gnjLsqzJnJ3LS+kmEZWeZYGEqjiOrChkNNYLEU3vSiRCQk6v3jGJzuo0FlEq0jbWgQiisMpJeXE1Wfdeur2l0yZthhmjHZ9AoVBAsasIO5eDH/i4uLiAEFEMsGJNbopIbbc46ouivoBddoHKqjZMzrf6c7fKsVDbVWqLysQjmM6j1W47a7duev0mfUKW1XoWz5Pl4tsO5LI4oMtUGp20rNS2FdDQd6iq/VcGj1gT4/npyqNFHHEIHt2YnZ3B3Tt35MMHD0p37975fH5u7mcjY2M/HRge/HxkdOCcKHcdQ/tNBpAQRIosmauHZ2drOSEkgz0wuyTE94Rt37Al5+IevOs64Y1HYTsmnJJqmC0m7QgIMCQaFuLhSG443oEkGl3vvyaNsKTCUBauOEYXimg6a/eqkvd6TaI7/HLWDa3/LZCzbeRzNmwrXBxdz9Vaa+21CJdZSFI96g4fm0X+6lYi6uKgVi6misFkWZ5FNl9m536V9pvOB6i+VfHXOwEO/fe3qpZaZXDoX8v6WRPA6O+Xev2o3BeAS/MdHb2vHKcIeok4sO448P1s8LAsgd7eXszOzOLunTvB/Xt3T+7cuf3Zwvz8L0bHxn4yMDT8pLd/8IIoJ6+X+m8BgACACE3MqpVK5bnnuD4z1xhwGPTDXJ5mhO/ngyAscT0vHO21KRc5qopUuEzDM0tEBYLS0KLGll+yhOAIVYiS6NykKjARmGjE5ho5D5230OsOMre3Wt6C3MiEt2wr0mfYUdvCjECdLvY64FzVZsLEL5jsvU0Vh4mryLLvMO3cTY/NWpD1194uh9zUo4/bUzpwmCb52k2WtTvXV0kO7GQjYPqMTHyHKg7shO/o1B4+kPGYrot6vZb4WmU9XgiBwYFB3Lo1h7t37/r37t49WlyY/2T2xswvxkcnfjU4MPS4f2SkIq5NEb9dABIfPT09tdPT0w3x/7f3ZduNXFeW+9wbA+aBADiCE5LJOQdJrvLq8mqv8kO/93/0b/Sn1Af0U/daXeUqW26XZdmWLGuwpFQqpUxmMpmcB4AAIuKefogIIBCMwMBM2bIVZy0mmSQIYjz7nn3O2VtqDgR3STmWQ/RTErRAjjCV45Dj2LC7Vm8CyRX08/oezBBKudIn3gtOqX6S7fuI9GVOlOt+deOE1tsz4UFPEo8Xi2xwUGwHI+pbIYdDjq5kfEkWIoImNRi6AU3TIUiMlTDikshtrFWjTvNxiTHYdxl18o3qC4T3QMZVx73tSG4YLIK9gCjg8CuQ4GZ9XJ9j1O2Ma47fBijiKpVhz2MUZeWP6Ab7HXG02ySvIfYeU8d7PP3Kw/cvj/t9KSWmpqbQWFnB9vaWtbO7fdhYXX1/YX7hX2uV2n8W88XHhWyxlYDHDxhAAMDQ9baj1B4z20IJRwgBR9FPhBCLjhApx7bJdmwI20sssk8JKKV64ou+cq8rg+KffAc7DszsjqPKUJkfKCn6b3DRG+elXrUxwehk4NJR/iNRzZCwV5XUJHTPR1rXNbdHE5HAxpGImFR+fJRNatQU1ahqJaohHr19Hf8RRwe9DicfTqjBaiOovxTn1DdKImUUZXXbqmPSQ0C4svJ3VPwR3eDHbUZ0o94ErBQc2zPKCmyXDwMPISVqtSrW7tzB1uZmZ3tr6+Xa3bUP5udn/0+1WvvPYrH8bTaXawkjoa1+8ACSzeX4+vq6Y9v2Cyb6DQmyiQmOcP4JREsAUuwoUrYFRxBI6IGpLL8SUIH+hOjRWEKwhyu+8RG7Pw5k96Cgot8fEaGN9MBM0rA2RgQY0GCPgznU6Oi9Gwe/732tSQ2plIlMJoNMJgvTNHF9fT12NRFuXA87pUdNTsU1wKOAY5jNa7jaiPIZj6OnonostxnBjaO14vobUQuAUVVH+JQ+znTVMPCYtDk+bOAhzvwpWHX4W+X+UmBYxPF1KCulFBzLRtfq9vodo4YONE1HrVrB+vpd3t3d6W5vbe03Vld/Nz8/978rpdKvc8XS83Quc60bZlJ5JADiRjqdZgDdi8vLlwC9JyAcktSUpP1XJeSabdsZdhxyNbMkpC56lI4iQDgc0MryYcA94guC50GCngJw743nfS/YICffm91f1vMseAPvjFixXeJBiutm1REDQxHLJT6dk0qlkMvlkC/kkc1k0G63ByTKR4HHKDojrskbNxoc5tbjmtpR+w5xXweTcdzS4DiN42HJLUqO3K8w/M9BmmpUUh52X25DWUVdZtJdjjjasdeD8JrkfkXl9zjGaZT3dqgib1O4l9QfB+52uj3KKsowK/ge0HUds7Oz2N3ZxoN79zob6+tP64uL79Vmav86VSv/Om9m9lO63jGMdAIeCYDcjEI+bx81rw51lu/r4DYzNx0p/llIeVc5ToGZpVIOkRPYOmYXPAS7fRGhFBQConFCDMiX9BbjAhNWCDZBhXD3TQSBpKu9xQMjvBRPZtEQvLghNH/Tlmpwc969PYZhoFAooFatYn5+HoZXhfgjpP7IZVQyGkWhBJN9mNIJj7lGTU7F9UXCy35xFFhcMo47yUcBxSiBxqhJIx8sopb/RgFHWLpjlBHVmzB2igL2UbLz4Ua5X3mEVXSDlceNvuAYgBa22lHK2+WyfVmSfr9j2JhuKpVCfWEe29vb/PDB/dbm5sY3S/XFX1er0/9WnCq9b+RS+1oqbRl6JgGPBEDio5rN2deWdSSU80elVFswzpV0/smxrHXHtmcYyDJYunNTGOiH9GTfIcBi0L5UKeXa3TIDniR8cBwY4V0If3yY6PX0rW6gC8e1QCJ7JZqmIZvNolKpYm5+DmbKRLPpChn6kyxBPju4MBikWuJOpQAGToVRyWOUPEicl3jUyTx4XXHA8To9gXClETx1R0mNBJf/4npFo4ynxtkinxxEOLp3NqSvFQUeQboK6EvcB/1RosDjFt0kOIp7k5OdrgseQT2wuMcgl8thaWkRW5ub6sH9e83tra2vl5aX/l+1Uv15IVv6IJPN7Rtp05KaTMAjAZAxKC1dtx3lHDPzR6z4xLbpW8dR70CqB8S4A+YaK5UWQgoS/Y1xf1WQAg115W1V+w1xJq8XQgrwTpNhQUXh7YEE90Fe7811o9aIBZEbT56mIZNOIZfLIpvNotPpwjBM5PP2gEFRUDLc/wjz+HGjrHESIlGUTZxL3rAR1mFN8tsCRVxSjZowCoKGDyjDqo2onsuwx2ZUlTcO3RRVqY56ucV5ooSNn/yDVNjKN0oIMUryfTgI3jTM6nS6LnhYwzWthJQoFgq402hgd2dH7e7uXG1ubDxeWl78VW269m+FQv5DQ0sf6KlUomuVAMhkIYV0mPkCgr9UCq+kVI8I+JOj7IfsqIcM3CUpK0JqhhAsbIfAsF2KylckZFfFl6FcIUXuA42CO4xFcHdJ2DeoCshqCG95UYigyF/IeoQRe1KM1cPqc2cBWXi6QXsRCIauI5PJIGWacGwb160WSLhb6plMZkCMLgwe4RHUIKCEk224KghXL3F7GnF9gXGbycP6F6Nk+ONomqD8eBhMR/VJRoHdsBHiYZvm44NgeKk06vpucqZB8AjSVcHx3CBdNcz4aWhlFPq+YoZSrvCmb2/caQ/vdxABmtRQqVSwvbmJ+w8eqO3t7fM7a41H9Xr93Wq19vN8If9HXTeOiEQiTZIAyC3P6u6Md9dx1JEQxoVl4Sls/kyBPgXox8x4APCKlKIkBOkWAY7XC1HswoT7/vAns/yBXb45meRXMn71QqKnjcXsJwFG+D09MjfENUso6ocho3ASMMwUsrkc0uk0HEfh5PTUlXbIulNZPg2RSqV6yTF8Ao+qSIITOU5AtXfUqTpOuHDUfsYwsAjTZsN4/jjACANHuNIYZ9R4VA8jqvczrCIZRjcNe0z6IEKxL6ph8uv+YxMcz/VBZFxPkaElh/88hDTBOiF5l7jbbho65ubmsLmxgR+9847a2dk5W15Z+WxmduaX5XL5P3K5wsearp8kP969TgAAIABJREFUoogJgLyZakQKBaB9fd3qGrpx0RXqJSvniYL6Gor+iYTYFULM6ppmEoNsxwYcX9pdedSWgPLlTrj/BuCAfLtr6OROc5Ggnmw6KeVVGeGlwjcOmTdOorquIZNOI5PJwDB0dLtdXF9f4/r6GqZp9j6Cy1/BxGEYxg1RxXAFEqQZhp0+w4l93GQZ1ZCP4/DjdLuCH1HAGKRrRjXEw4AQBQRRwBCVfIOTcKOAbzKqbvzGuf+YBKvJsJ3vbRV04/5ez4rakyXpUagj+h3ZbAYLCwvY2tzAO2+/7dzb2T1bWl7+tDpd+49CofCLTCb7qQceia5VAiBvuDeSzigA19eW/cLqXFww0xGIDgGcMPAOkViWmpYBkbBhQzlAcFHV1czy3ugekKC3S0J9/3TPxEpICem/KZXCm2ilTxpCSJhmCrlsFoV8HulUChcXF7AsC+12G7quw+gtG/a1i8J0hc+BxyXzqEQdlciHnVBHiTqO28OIUg6OqjT8pBmuNEadqOP6M3EAOamV7Lj9j3Efk7gqJ6ysHFQ1DvY5wgZbr9PLc8HKnbLqeXh0+pSVGrJZXiwWsLy0hK2tLX5w/769u7N9urS8/EmlUvl5Pl94N5VKfy4N/TQBjwRAvlsg0TXn3e7/uth0fvpFGvICEK8AHAL8E0F0lzStIARptk3k2BiU2faNBgdc/ATCmrm9pCEFyOnz4Ypvmh2CcLMjPlTzim+630YwBUQACcAwdORyWRSLRRQKBZycng5s9Lbb7QEZCh9UoiZt4miZuHHY4Px/nErtJDRIlOxJFK02CjSidlOG3YZxpqXGqTii1HAnmbwaF2CGgVlc9RgEjKAUSRQ9OBFtNUCRKVhWN1B5dIbLsMMdBKnValhbW8O93R3e3dnprq+vv6ov1j8qTVX+PZPN/so0zUeapl8SUbJdngDIdx8/Nf47A2gz857jOFdKqSMQHYD5pwTsSilniIQJQLBtuyO88CoN7zUacP7z3mD+mjq72+fkjvJKIdxFRX/psGdgHjKCorA9btwkDUXRyj3qKowqUkpkMlmUSiWUikWYptlbKPTDDtAJfiIJct9hMInaBB+V2KJO+MMSU7iiCY+XhquLMGjEeZkM6ysM0+AaR0NrXAvcqH7NmwCPSSuOoOFTmK6K2th/HcrKtl2bhU7XBY5OpwvHsXu2AlGvctM0MT8/h63NTTx8+JB3d3dbqyurezPT038oFIs/N9Pp94TUnlpdq2XoRgIeCYD8ZYOILGY+FkJ0mPlSKXXCSh0B/I6UYplZzwEkHLj7DgxPwbd3elVgj75yv9/vPwhybXWFcHoUh1LKqx/ohnZVZBkSU2bEtkfDEzbMkJpELpdDtVJFpVJBKpXC2elZr44JG0iF+f2wX3iUx0YYVKIol3HHgYOJLu7rMEgELzPumO2o748LGqOWF0ctBL5u3yMOhMehq+KA4030Onp/17M37lpddLt+1WHDtp2hz1Emm8XS0iJ2trfw9sO31O7u7tXyysrjWrX2m1w2/24qlfq9ZugvSIo2JaKICYD8FUFEMfMlET0Gc0sRHbO7R/ITIlrXNFkksGRPjJCV6gMI4O2K9CdfehLuwpWAF0JCSuWCDY9qhcT4EA7bChv6BiZIIZHLZlGZmsLUVBmZdNodGHMYQnAs3UDe/Q0mpKAhU5xTXlQSiqKLRjW8oxr34RHT4PejJOeHJdhxKKpR4DLMe3xShd83TVlFeZIEl2ODoHEbz45xqg5/AbM7IIQYT1n5t71QyONOo4F7u7t4+NZDZ2d752J5afmLqUr5F9lc/l1DNz6RmvaKhOgkKToBkO8DiDAzX5MQT4lxAfARs3MI4GcA7UpNq5EQuu1pag00+3ob6uE3t5dMpYRQjqfQq8IdjKFAMvBeDjohRmBOdO3ial6l02kUy0VMTU2hUCjANAxch2isUbx22Nhp1Il6FIDE/b1h/Ym4Bn0caIR/Ly7BjwMEceAxrMp4E43vqOuMowKjxCuDQOyDe9Qy4LjgMfQ5hKtYHVwMDE5aDVPR9enW6VoVGxsbeHD/Ph48uG9tbGycLCzUPy0VSz9Pp1P/rpvmIxLyPBnTTQDkewciACzl8LFS/BGzfQzgpRTiZyToHWauCyHyNpFURHBUYKxXMZg4tKglXCpL+FSWN18vEFlNcCx7xaO5q6G0FsEwXU2sarWCWq2CF/sl2MfHkVpYkya6214uyjt8HKCJ+/kklM8oIBlVefin9WEqxaMqkNue9IfJkMQtefrJOYp2HHZbJpm4YmYoDmzwd63+bke3O8K61+13LMzPY3t7G++8/Rbfu3ev22g0Xtampz/M5fP/N2Wmf6lr2lMi0Uqa5QmAfG9DSFLNZvOq2+l8baZSTSJ6pRQ/UUr9g1K8JYWcFrpIkXI0x3EpLX8vhIRwR5+8jC6IACHBUsFRDgTL/hgwbrJUN090r5FogvdJCGTSaZRLZdSqNUxNldFsNtFqtcaqLF4HWIbRScO8xYdd/ySCfcHHwP88rG8QBTRxFcm4Vcuk9NNtH/eoQYGwh8okOx3jaly51C7DcWxYtoVut191OL7YZOz7TaBcKmF5aQnb29t46+FDtbuz01peXn42Va28n81l/0MzzN9Ikt+SEN2k35EAyPc+stksA+jYtv3CsqwL27JeEPA1iH7EzPcYaAghqkSUUg5JpRxENrr9nRAhIaXmvpGIXBdE/gu9D7xdFV03UCqVMDMzi0qlguPjE3Q6nRuN1XET+rBN71F9h3HHeYf97UkdEccBg6jLjuODcpvKItxjep0I94TizLfC49jjenMMe2kFlzOD2mr+bgfHgIev6jszM431u3exu7uD+/fuOxsbG5eL9frXpXL5vXQ6/QvN0P8AEs8FJf2OBED+1u68ptmXl5fnXcv6XAhxIIT4AsBDAn5EhB2AlknQlCCZcp1uPckSIg8f3PKcpIBkAeUIsJTuG2qgkcgT0VKDPw1RXBz6qdefMQwdU1NlzM/PYaY2jRcv9nF1ddWbWgoLJ05CG01y2WG9imEVxrApo1GgEUcx3db5bxh4vInEPC5oR406h6fk4iTkRwHx8NvnUreOUt6U1U1RzlG+KNlMBov1Bezs7OCth29hZ3fbWm00zmZmZr/I54u/Mk3jF1LTPgFwSESJIGICIH+bkc/nGUDnf/7pTwf/Y2XlVBfiObP6jFndA/A2iO4LIZaJUISC6ZkR9nrrPfpESCgp+yd+IryZ+RyKNqgKYBMzQ9M01xukVsP09DTKpRIuzs/R6bgHO1/aY9xt8ElOz68LNHEAEU6Cw3oY44LFMJoqCtSilgNvCwijLhueNAu7OoY/ohRzx7mNUf0pDzZ6xmqOE9KyCm6UD3ltSCkxVS5jdXUFDx88wI/eeQebm5uder1+UJ6a+iSdyf5SN8x3haAvAJwn/Y6/7aDkIbjx5hKXlxdpx7FrgmiNiO4D9BYR7RKwJKTMA9CUYmJmbzLFPanZtgWra8Gy/fKeb2b7OK4guGzIEzxtvpeDLmFbNp4/f4EPPvwQv/3t+/j8yy9xfn5+w8c7rIQ6TNBvkkmuccyNRlUo40qej0tPjbOjMcwPZVIgGPdxiEv8YYCPoquiZOTHBbcbl6G+pTPD2yWxHVi2DavbRdcDkGF2s/7tNAwd83Nz2FjfwMO3HuCthw95fX3jemZ2Zi+fz//BNNPvSk37DRE9JqJm0u9IKpC/P0QlUnt737Z03dnTtfSpEMa3gHgE4q8F0Y9YqQ1BNEOETK+jLgQEAMEKQioIv+lIToS/LYe+pugdQx7OZvUSAvXlUzRNIp/PYWZmGvPz83h1eNhrpIeni8LJYBKfh3FO23E2s3HVxagKY1iFMg4gjKKpvqt9jmHVRlRVFq62wsudcRvkr2P2xApQyoFSTm+j3DV+6sKyugNLgVGVmJQShUIey0tL2NnZxlsPH2L33j3VWG20KtXKk0wm+56u6+9KIX8PIZ4CuE7AIwGQv9uo15cZgP3q8PGFRkYLUKcE7CngK1L8Ywb9oxDyrhCiAEAopaAIkEJCadxbSAxKw8eDSPBLGl4bhn41aKDrA0A6k8HM9AwW63XsPX+Ow6MjOI5zI2n1mqAT9D4mpWiiAGJY4o4DkDhtqVE01Lgb6aPu/zhTYXH9hjigi6s6olQC4iqO1wcPd+FUKadHV9mWha7lV9K2ByzxCrqGrqM2XcPdtTW8/dbbeOuth7yxsW7PLSycF4ulr1Jm6tdSyl8S0Z8AHADoJOCRAMgPIqZrdxiA9fLlixMh+ErXtQMifY+BQwb/NxB2BYk8kVuJMEtIyW4vhBXYZihHxQBCVFkxximYhl+LaZooT5UxNzeHublZPH/xvEdBhBfL4kBkFJ01Cd01KoEOo6PC3xtlyjRORTFOwzzKeW+SvsKwzfG4y4apqajJqtuCRqwWmVKwffl7r+roeuZPYcfKcEgpUSoWsViv+7sduH//vrOystqs1Kov05nMZ7pu/FoI8R4RfQngFICdgEcCID+4mJ2dVwDaZ2cvDnTdvFZKdJhJANCIaFOIIIgwpKZ5b1Dv40bCj6lCYkmG8UNKiWw2i9p0FYv1Bezt7aHZbPWWCn3jID85+T2Rm9x7X5V4nOQbVuQdxzhqHCCISsRxCTr8tyftYwQrnFEgM2oIIHy/Yq1bR/jFv+mKo79P0h/Ntbpej2zADz5elyedSmFhYQF31+5gZ3sHDx8+4O3t7e7s/PyrQr7wZzNl/lFK+QEJ8TFAewCaiQx7AiA/+CiV5h3b7lw4jvrCtp0UmLMMlSKSa0KKjGRJ3BPE8vsMCqwcV4Txlu/7YS2ScAXiNjMNlMtlLC4uYe/5C7w6PMLVVRNK2QNSFz6ABCuRfnLiyFWWuKQ8TvUxbrIdp4qJSvZxE1S3OaFP6o0xyc5IlD3uKLHKNxFBf3LXs8PugYdtW+7Y7pCqQwiBfL6AO40V7O7u4sG9+9ja2rRXVxtXs3Oze+ls9gNd038tpPgjQE+9qiNZDkwAJIneA6aZTteyz1ngMyhVZIUSg00SYklIkZYsicGQzNB01dviZSjwQLYPNNFvUWtQHCHmJc5cLoe5uVksLS3h6bOnODs7RbPl9JJTkFsPViJKsScM6YLguJpNUU3WcaapRlUckyTsSX7+JiOuMoqiqYKXH+bF8kaBA4AKSOH7nh2WZcO2bNiOHejbRd8/XddRq9Wwsb6Ot956gAf37/Pdu+vthfn6Ublc/jyVTv+n0OR7RPQ5QK8AtJMR3QRAkogIQ9fsZqt1TMCHRJQmEhqBdCKxCAmj5xvCeg9AVFCUkeJ8zymWvyIMZ7x6kzyeIqtpGCiXyqgvLKC+UMfx8UmgF6JF0id9C1hMtAk+yal/WKIdVokM28OYZDt8nApjkiGCuGZ+FM02CU01SbUU+zN2X3eDNr8ecAQsf0dVHdWpKayurmJ7exv379/D1taWvbS0eFqpVB/ncoUPzFTqPSnlhwD2GHyVCCEmAJLEiMhmMlan292XQvwODIPBaQLpUso5EqT76rpKKSjHbaiDVUTVMbrU4KjqJHQ1A0mICIII6Uwac3OzuHOngaOjI5yfnaPd7kAIvpHY/N5Iz10xoLk0KlHFJc2o6mScBvywiaVJaKJx1YEnAblxhgLCNFV4smpST47b9Dz8hdZeg9x24DgugPQPCvH+8H4vrb4wj82NDdy/dw/bO9vOamP1amZ65lm+UPg4lUq/r+vGH6SUX4FwAsASJJKqIwGQJMYJXdO6RPSCmX+vWJnE0AH8SEDMaJqmA0w9aoAZji+yeCtGmMb/RWYwAbqho1qtorG6ioOXBzg4eIVms9mTqw8mwaCmUtDUKbgzchttqNehocYBrUlopnES8jhVlfD/P2QRMspLZRSI3paeotDt9Z8/fyzXBwzb8UHEGaqem0qlUKtWsby8jN2dbdy/f09trm906ouLx+WpqS/Smcz7mqb/VmryMyHkAShpkicAksTEIYRgZm5ZXesboQvf08MB8A6RmBVCS2k6E7yRSfiOerhtTzFCDCs6C7qeV0Igk81gbm4OjUYDh0dHaLVaODo+7pkPhZOH5k2QSSl71IdfkQQb18NEFaOSaVjTafSpf7wpp0nAYxIByahR3oHKgfv2lFGVxqjdjTcCHgHjs7DJU3A4QvmWwMoJUFaIfO5LxaI7YXV3Dfd2d3lne9tuNBqX0zPT3xYKxY/MVOq3UtM/APA1EZ0TUTKamwBIErcNIuJOp9OUQn5FoA4rbjHzFUP9g5BySSfKgln07G4JMTIn8ewWDfnfqJBColQq4c7aHTSbLbSaLVw1m2g2m0O9J4KLbP5oZ3BSa1SyDZ+2w54g40xbMWMiWmvUpnsczUYjKonw99gHDrgWyFGTVG8SNOLvB3tDD4MmT/bAOK4KVCWqR1sN0lUC+VzeozvXsL21he3tLbW2ttaen58/KJXKn6Yzmfd1w/itEOJTIjokom7y7k8iAZA3EKZpMjN3AHxrO3YbwJkQ4lgS/YSFWAdzESAZPC36W+qvgQ2jT6iKAQGkUinMz82j0+7g/OIcRyfH+ObJN7Bsd6yXhLjZzg8pvjqBKZ6gmVEwIY/yvhi1EzFIM41HL8WZPsXJtMTtVcRJokTdhzjAmGRvYxiQDq2U/EoOAPcMnpyBxri7Pe770gQtbweXRgURMpkMZmamsbKyjK3NLdy7d4831te7C/X6WbFUfpJKp3+n6/qvNE37SAjxgogSw6ckEgD5LioRAN3r6+uXQoj3AVwycErAP+u6/kAIUSZBmstCsbvY11vUm6C/ccsTbCaTxuzcLDY21nF5cQFWCi/299HpWO5+CsWf9oOJUnqKw8HpnWF+I2/qJD6smoiqfkZtkg/bIYmzww1TVMOWH1/X0THusv4G+WCD3O7Jjvjy/mC3OlGseoCvVP85MXS3P7a8vIT19XXsbG/xxsam3WisXtVq088z2dwnumG8p2na7wF8RUSnQoik6kgiAZDvMtLptNVut48AfATgCsAViNpCiIeGbtTAMMAg36inf9r+bkDETzpCCBTyeayurIAVI51O48tHj/D8xT7Oz87Q6XRjezPh5On3SAbpEQfMqkepvAkb1ddJtHFVyyg13zCNFwcioyqjNx1KKSjm/j6Hr7BsW7BtBw4rl1Lz+l8+ZRWuOqSU3pJpHetra9jc3OCNjQ2n0bjTmpubOyyXy5+nMpkPpJAfkEtXvYArfphUHUkkAPKXiFQq5TDzGTP/mZmvwHwO4IKE+AfdMBYATjMzdS3XErQ/qEuBJcPBVZGxFLNu+OgG6SCGrrmnTtM0XffC2Vl88cUX+PLLL7H3/AU6nc5YmlVBIOklN+X0EpYPIuEqoVdJRPBUo/Y+xp0AC9NRo9R7gxVWuOKaRGfruwCNsP+5bTu9XQ7bm7ByVGBBFeQBTb/q8HttvnZVvV7HncYqNjc3eWNj3VlZWWnNzc2/mqpUnmSyuU9Nw/idkD0JkstkpyOJBED+SpQWM7cAPAHzNYguCDghKf4LDGMNQJ6EEF104Diu0RMBYKLBQasY8cTxbkQgubFPXRgol6eQyeZQKpdQKBSg6wZsW+H5i+e9qatxKCWfVvL7JJrGA/arferkpnR8kDW7jb3uOJeN8wcJy4WMQ0mNosxGTXpNTFV5j5vTkx5xXJ+Z3g5HXyXXty5T7PrSqMCwgqZpKBYKmJ+fR6Oxio2NDWysr9uN1dWrubm5V6Vy+Uk2m//YNFN/FJr4s5ByD8A5EgmSJBIA+euDCIAOM++D+T2Arwh0RlL7KZm0Q0QlAchul9zmpwcioyexhgPGqAQshUA2k4Wu6RAkoBzlWZVaOHj1ym2uBxJt+LqiTI/6SVr0KyrmG37evd/t7cT0m8K3Os0Hk37E/Q3Lh0xCRb0pSm0SmqpHCdqOt7vhyo1Y3hJgr98Ed1kUAX+XoLKylBL5fB4z09NYXV3B+vo6b6zftRuNxvXC/MJhpVL9KpfPfWSYqY+lpn0hpXxGoFMAVkJXJZEAyPcLSLrM/IqZPmTGNYAmSHWllDuGYVaISAcR+aOXf5nbBJimgVqtNjD+ycx4dXQE27JuZTJFIQSUUt6gZIJfD4BJTHIe2iSPAZCwd8h3uY9xi9fDjYomuLypHKenjGt7uxyOR0354EGEnmSy8n+uFIQQyOWymJ2dxfLSEtbuNPju+rpqNBqter1+WKtWvy4Uip+l0+k/6Yb5iZDyKYAzuD4dCXAkkQDI9xRE7G6XTwB8LASuBMQlhLwgHQ8hMMdEKRCRbVl9UTvfrDBCetelu4IZFZE7JRR7glYgEjBNE7OzswOCf3/+/HO8PDiAbVmRJ/NxlWrHaTZP4rNxG2prlOTId1FJjLqtwd6RP0zR06vyGuR2YGw6SuRQuZ1yt7Hu7RgViwUsLCxgeXkJjdVVNBoNZ2V5+bq+sHBUna49KRZLn2Qy2Q8Nw/iz0OQzgjhFInqYRAIgfxthGOQw8wWAL8DUJBLnLOgEQvwjCbkihMh1iIR7+lfxiZIiGKsoXUYaRX0xiNw9kbm5OUgpoRsaTNPAp59+hhf7++h2uyP3KCYBkWACDfYjJvHzft1KIm4ceNR1j7vRPkwTLOjH4S722b0ehx3qb/T+jre06Pey/EqEmUFCoFQqYt5TG1i/exd3Gg17YbHemp6ZOa6Uy0+KxcJHmWzuT2Yq/bmm6089qqqd9DiSSADkb68SUcx8DeJvidAhyAsS4kwQ/YSATQKKFpGwLAuOcvqVRZSd+tA/NFmSz3jCi5qmwTBMGKYJ/WMde8+f4/r6Onb7fNJkHQcuk1rETvp3J73tYamW24JWuNrwx3BtJwgafXFDhHtFocql1wMRhFKxhHq9jsbqCtbW1rB2546zvLx8PTsz86pULj/O5rIfm6b5sWman+uG+VRK7TShqpJIAORvH0SY2e4CeAFQh4iuSOBKSu7A0HdJiDKRkN1uF46yA+Q+Ykd1JzA4jKxEAFdEb2ZmBpquwzRNmIYBTdPw9NlTNJutSBCJO8FPukg3akv9u6CU4oYBbguIwadERUyi+TSVY9s9AOlXG6o/fRd4DF1vFvc5YgaEFCgXXL2qxuoq7q6v4+7aGi8vL3dmZmdelUrlx9ls7pN0KvWRYeqfkpDPhJBnQoh2IniYRAIgfzcgojEAi5kP4fqKXAohmwx0NIgHACoM1mFhsLFOQyiriW7AIH74adEwDUxPTyOVSiGdSsE0TJimiW+fPsXl5WV/dHQM1dpRCrhROlaTJOrXoa3GodgmAo/QcIAK9DZ6wBHw5XBHtwd/9wbV5f1ICELKTKFQLKJWreJOYxVbW1tYX7+rlpeWu9MzsxelcvlpOpP5QNf130ipfaxp2gspxTkRtSmRWE8iAZC/22rEYeYzIvoMQrQk0ZkQfCw17Ueapi92Op1Ut9OmYaY/rx1isBaRUqJYLOLu3btIZ9IoT5Xw8cef4stHj3B4eIhOpxNbjYz6/+vch9vug0z6N6Nu6yhvkeDexkC14dzsbYSVjRFSK/ZDSolcLodatYqlpUWs3Wngzp073FhdVQsLC9ZUpXKazeW/TmUyH5pm6veGrn+mlHrqOM6ZUqqr63rS40giAZAfBqXFLSJ6TEQtBp+BcSqE+CchxB0pRc7qdoXt2K451RvWmQr7WjDcaaxCIY+G0UAmk0GxWEalMoXPv/gCe3t7uDi/gO04vbHd2yb3URXKqOsdRkF9l3pUwa99YBgAC9uGE9AMC+7D+AVgf4y5L7ApSMBMmZiaKmN+bg6Li4tYWVlBY3WVV1aW7fn5+etKpXKYzea+NQzjz0JqH0HKP0kpvxZEZ5fNpt1utzE/P5+ARxIJgPyQQARA27bt53CXuZpEdCU17acGsCGkKEjL1izLgnLsnjDe7f7YcO6rv08hkM6ksbCwgGwmg3KpiKnyFD7//HM8+eYbHB4d9RrsbxTQAoDwOg3sN0J9eRTTjWZ4T77FVcN1AqZNvb5HoDLpPa7+RFXgunzP8UI+j6nKFGZnZrC0tIjGagN37jR4cXHRmp6eviqVSq+yudwzM5X6s9T0P0oSnxHRHhOdMlFbJs3xJBIA+YE/IZrWtW37pee30ARwIaQ804g2CaJGRGnbJqEcNZTWGqunPgRIGAzln4jNFKrVGtKpNMqlEmZmpjE7N4svHz3C3rM9nF9cwPIWD0fRR+GfjetoOKkj4utQZeEKI9gIDzbEw/2NsIyIL92P4KCA/5kAKXWYpoFisYjpWg2L9TpWV1exurqKxXqdZ2fnrEq1clUslV5lM5mvdMP4RGjyUxLiEZHYE6ATAB2RAEcSf62Db/IQfD+DmSWAHIBFZr6nlHpbOeqeo+w1MNccx8nYti0dxyblqAHQuNUTHEUrgXs6S0QEVgqdTgfn5+fY39/HN998i68eP8bjrx9jb+85Li7OYVk2AIIQEf0Rbyw1bmprGLhMCggjHRP9JnXw/17F4DfBe2ARoKOClFSw58FBMA9ed8C50PeeT5kmCoUCpqenUa8vYGlxEYuLi6jXFzA/v8Az0zPdQqFwmUpnnhum+bmua59omvaZkOIxiPYBXADoJv7jSSQAksSwJEgADAAlZq4rpTaVUrtg3nYc546j7HlmzrFizbFt8mkT1xOdeusj470Kxt+vUI6DdruN07MzvNjfx5MnT/D4q6/wzTffYH//AOfn5+haHYBDSrcjvDOGKfBOsrcRvo5w3yJYXQSrDA5UF+EpqrAwZPh3EQIP+DIrblWJXC6HcqmIaqWC6elpzM3NoV6vY3l5GYtLizwzM6sKhUI3lUqfpFOpbzRd/0oI+ZmQ4lMi+oqZD4noSghhJ3scSSQAksSk1YjBzEXHcebYcdaU4gcMdY8Zd5jVjFIqz0rpSinh+KfhwOk38mmnyZdHKJCUbdtGq9XCyckJnj9/7gLJ10/w7NkzvHr1ChcX5+h0OrBtd/1ASOlawIa80l+Xaor9GaPYV+a0AAAI9klEQVTn/DhgxnSDmnLgKO55h/el6aPVhHtA6kmM+I+1T1EJKZFKpZDL5VDI51EqFVGrVTE3N+dWG/VFzM/Pc7Va5VK51C2Wys1sNnemado+iL4k4CMhxGcg+paAIxA1mdkSQiSN8SQSAEnidqGUEsysE1AAULcdte7Y9rZSzi5Y3QXzrGLOKWYDzIKZKZgwfZqLRmucjASQYLVgWxaumk0cHh1h/8U+9vb28PTZUzx79gwvXx7g9PQUzVbLs1t1yR1B5Frpxqj+RrNsNHJ3pGcXrIKg4Vm7+gDhLegFKwvH4d5Cn7+8N8xtMVjhSCGhGzpSKROZTBaFQh6VqQpmZmYwPzeL+fk5TE9Pc61WQ6027VQrVbtULnfS6fSV1OQrKeW3UmpfkxCPAHwF4AmAQ7g9MJVIjiSRAEgSb5ra0i2LC45jzxKpuwDvsOItx3HuMKt5IUSRiEzHdqSjHAlmCjd3g/l3/EEntwHc078lF5AUK9iWhdb1Nc7PznBwcIC953t4/vwFXr58iZcHB3h18ApHx8e4urpyhRpDzn9BoAh+3V/A71dM4b2JSEqqV3G4xkqK2TVg6k1S9c2v+tfFvfvog0hfkwoQJCCEgK5rSKfSyOayKBaLmCqXUalUUK1UMFWpoFqt8uzsjLMwP69mZmedQi7vGGbq2jCMc8M0j3XDOJBS7pELFl+D6BsAfn+jnQBHEgmAJPEdVyQsAGhEyDJz1badFdu2N5nVOgFLAKaVUjWlnIoQIiOINGYmxUy+d0R/LyFwwvZEFnvJeuCFQiHQ8ROum+aVciuSTqeNq2YT52dnODw6wsv9feztvcCL/X0cHh7i5OQE52dnuLi8xFWziU63C8dxBuitoCdJsH6KqgQiwYMZ7DhQAcopWLmMVgNmEAnomoZUOoVsNot8Lo9CIY9isYhyuYRyuYxqpcrTtRqmp6e5Uq2oQr7YzeayrXwhf1EoFM6z2dyFpumXRDgCaJ9I7BHRM4BfwLaP4DgXMIwWhLAAcAIcSSQAksRfuiKRlqWyzM4Us1NTyplmxqJSfJeVsy6EWBBCTMGluNLMbBKRCNI8/eTKgVdGvGZKuGoJtluIGYoVLMvC9fU1Li+vcH5+jpOTUxwdHeLly5fY33+JlwcvcXh4iNPTU1w1m2h3Ouh2Ouh2LU8zyun5rfdl7QPqtIP5Hor7INFb1ot93NzbK4SA1CQ0qUHXNei6jlQqhVQqhUw6jVwuj2KxgHK5jKmpKVSrVdSqVS5PlZ1iodDN5/PdYqHYzhcK19lstmmaqVNN1w80XdvTNG1PCHlARKdedXHufb4A0ESrZeOTTxT9+McJaCSRAEgSf3UgEUp1Ndu2DcdByXFUHcyLIFoA1CIrXgWwAmBeCJEXJHTFSiilyDdl74n3DXnJxFNeQYorSJe5U02dTgdXV1c4Oz3FyckJTk5OcHp2hrOzU5ydnuHk5BQnp6c4vzjH5eUlzs8vcHl5iXa73QMSpQZNlBQPDOSiJyLlVTJSSggp3YrGq2qklJCaBtMwkMlkkM1mvc8Z5PM5lEolFIslLhYLKBQKXMgXOF/IcyFfUIVCwS4WS+18Pn+WSqUOdV17pWvaoaZrB5qmHwspT4SQJyB6BbeXcebRUjYAB4BKKKokEgBJ4nsd19fXstvt6rZtG0JQRkrUmEWDSGwCfJeARQLNMHMF4CKI0kQk3QIiSPNgBGgMB5P+Z9w0ULIsdLtdNJtNXJyf4/jkxAWQcxdALs4vcNW8QrvdhtW1PBVbG91uF+12G9fttrvEqBR6PRnuw5+m6Uil3WrC0HXomgZNc6sMw3SFIj0A4Wwmg3Q6jWw26xSLBadUKln5XK6TzmRaKTN1LTWtpen6pa4bF7phHJumua/r+nMivAB4n8AHRPICRF2AHA8wbABOAhZJJACSxN9kPHr0iPb2nomZmWmtVptJ5/P5LDOXiVBXiteUUptgXhOC5oUQZbgLjCkwDHbBhHxqq0cJ9f+JfindGPS6qbfliUC5Y7O2A8uyYHUtdK0uLA9Yut0uup0OOt7XlmXBsiy0O220Wk20Wi10O5Y73UXBBrzXv9B1FyByWU6bJqSQkFKyrutsGIbtfXQN0+xomtYVQnQF0bWu65eGaVzqunGmadqBpumviOiQiI5IykOhaSdSyktJ1AbQBdj7EMq/ewloJJEASBJ/d+E4DgHQbNvOKKXKzJgFeJ4IdQArRNQg0BIR1YQQOQAms9IcR7nTXAMdd+7rRfkvKR9sBmuR0CsvRHXdACR/Csofs/XGbp2+wm3XsmBZ3d6eiXcdTACDXIpISqkMw3RM03R0TdrMsBnoSKKWlLIppHYupTgWUh4RiRMwX7BS5yTpjIS8IhJNTYhLIeUlMbdA1GQhrl3QgBPwYU/AIokEQJL44cS//Mu/0M9+9jNZKBR0IYRJoJIQYlYIWvKAZJmI6gBmFXOVmQsEpIUUuk91KaWIlV+d9Bb4iAca8fEgMkiNuaDiTmKJANAQh4CK+1NXytsVZAXAZuYuwB0vwVtEdE1El0R0LogumfmCgQsS4lwQXRLonIhOQHQMonMAVwBaAK4x2LNIehdJJJEASBJxcXV8JVOZlEEapUCcZ+ZpAEtEtMxAnZlnAZSJqEhEOQBpZpVmZhMMDWAJJo0BHQS9Dw408kUYcTkFwIYgi0BuIieyAVjkgkMHgOUldhtuk7oJ4NL77IPAJZiPwHzIzCcgXJAQlwC1vN+3fLAJXF8CEkkkkQBIErcNdndFDKVURmpaXhDlmTnPzFkAeQAVADUPZCoAssScApADURFEOSLSMYkcVz8cBtrMfAngkohazNwGUYvc8dczIjpDf+mu431ue6DRDoFCG8zXADogsgDYib1rEkkkAJLEdxzHx8eUz+dJ13WC610o4doAZAAUmbnoUVspEKXAnAFRloiyAEwM+B2Oh11+RaGUagJoktuo7gDoEFFLKXXp+aX4vQgbgzQTe5/96+t9TiqLJJJIACSJv3J14r12JACNmTVymxY+wPggI73LTfI685O/w8z+CKzjfd8BoJjZ8b6fTDwlkcRfMf4/fTmCFntb5kAAAAAASUVORK5CYII=",
-}
+from pamui.windows import PamWindow
+
+# 🧩 Conversion logic, kept loaded between runs
+import pamtools
+converter = pamtools.require('converter', 7)
+families = pamtools.require('families', 2)
 
-def bitmap_from_base64(base64_string):
-    """Decode a Base64-encoded image (e.g. PNG) into a WPF BitmapImage.
-
-    Returns None if base64_string is empty, so the UI still loads (with a
-    blank image slot) even if a placeholder hasn't been filled in yet.
-    """
-    if not base64_string:
-        return None
-
-    image_bytes = Convert.FromBase64String(base64_string)
-    stream = MemoryStream(image_bytes)
-
-    bitmap = BitmapImage()
-    bitmap.BeginInit()
-    bitmap.CacheOption = BitmapCacheOption.OnLoad
-    bitmap.StreamSource = stream
-    bitmap.EndInit()
-    bitmap.Freeze()  # makes the bitmap immutable/thread-safe
-    return bitmap
-
-def set_embedded_images(window):
-    """Assign the embedded Base64 images to their Image controls in the UI."""
-    image_bindings = {
-        "logo": IMAGES_BASE64["logo"],
-        "Coupling2Image": IMAGES_BASE64["coupling_1"],
-        "Coupling3Image": IMAGES_BASE64["coupling_2"],
-    }
-    for control_name, b64_data in image_bindings.items():
-        bitmap = bitmap_from_base64(b64_data)
-        if bitmap is None:
-            continue
-        image_control = window.FindName(control_name)
-        if image_control:
-            image_control.Source = bitmap
+# ⏱️ Opt-in Revit API call profiler (Shift+Click About to toggle)
+import apiprofiler
+apiprofiler.start(globals())
+
+# Images of the Image controls in the UI, by control name
+WINDOW_IMAGES = {
+    "logo": "logo",
+    "Coupling2Image": "coupling_1",
+    "Coupling3Image": "coupling_2",
+}
 
 
 # Variables
@@ -92,39 +58,23 @@ uidoc = revit.uidoc
 
 output = script.get_output()
 
+# Report the conversion plan instead of converting (Shift+Click to toggle)
+dry_run = script.get_config().get_option('dry_run', False)
+
 # Custom class to represent an item in the ListBox
 class PipeTypeItem:
     """Class to represent a pipe type item in the ListBox."""
-    def __init__(self, element, type_name):
-        self.Element = element
+    def __init__(self, element_id, type_name):
+        self.ElementId = element_id
         self.IsChecked = False
         self.Name = type_name
 
-def get_dict_of_elements(built_in_category):
-    elements = FilteredElementCollector(doc).OfCategory(built_in_category).WhereElementIsElementType().ToElements()
-    return {Element.Name.GetValue(e): e for e in elements}
-
-# Get pipe types
-pipe_types_dict = get_dict_of_elements(BuiltInCategory.OST_PipeCurves)
-
-# Function to get family type IDs with added support for single-type families
-def get_family_type_ids(doc, family_name, type_names):
-    type_ids = {}
-    collector = FilteredElementCollector(doc).OfClass(FamilySymbol)
-    for symbol in collector:
-        if symbol.FamilyName == family_name:
-            symbol_name = symbol.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString()
-            # Add type if it matches one in type_names or if there’s only one type available
-            if not type_names or symbol_name in type_names:
-                type_ids[symbol_name] = symbol.Id
-                # Handle single type families by setting the default ID
-                if len(type_ids) == 1 and not type_names:
-                    return symbol.Id
-    return type_ids
+# Get pipe types, scanned once per document for the session
+pipe_types_dict = families.pipe_types(doc)
 
 # Convert the dictionary items into PipeTypeItem objects and sort them by Name
 family_items = sorted(
-    [PipeTypeItem(element, type_name) for type_name, element in pipe_types_dict.items()],
+    [PipeTypeItem(element_id, type_name) for type_name, element_id in pipe_types_dict.items()],
     key=lambda item: item.Name.lower()  # Sort case-insensitively by Name
 )
 
@@ -134,27 +84,13 @@ def show_window():
     script_dir = os.path.dirname(__file__)
     xaml_file_path = os.path.join(script_dir, 'UI.xaml')
 
-    # Load the WPF window from the XAML file
-    window = WPFWindow(xaml_file_path)
-
-    # Set the logo and coupling icons from the embedded Base64 image data
-    set_embedded_images(window)
-
-    interop_helper = WindowInteropHelper(window)
-    interop_helper.Owner = revit.HOST_APP.uiapp.MainWindowHandle
+    # Load the window from the cached XAML template, with the logo and coupling icons
+    window = PamWindow(xaml_file_path, WINDOW_IMAGES)
 
     selected_coupling = [None]  # To store the selected coupling type
     selected_pipe_type = []  # To store the selected pipe types
     dialog_result = [False]
 
-    def close_button_click(sender, args):
-        """Handle the close button click event."""
-        window.Close()
-
-    def minimize_button_click(sender, args):
-        """Handle the minimize button click event."""
-        window.WindowState = WindowState.Minimized
-
     def run_button_click(sender, args):
         """Handle the Place Couplings button click event."""
         list_box = window.FindName('list_pipetypes')
@@ -179,16 +115,6 @@ def show_window():
         else:
             forms.alert('Please select a coupling type and pipe types.', title='Select Coupling and Pipe Types')
 
-    def on_image_click(sender, event_args):
-        """Handle the image click event to open a URL."""
-        url = "https://www.pambuilding.co.uk/"
-        webbrowser.open(url)
-
-    def header_drag(sender, event_args):
-        """Allow dragging the window by the header."""
-        if event_args.LeftButton == MouseButtonState.Pressed:
-            window.DragMove()
-    
     def UI_text_filter_updated(sender, args):
         """Handle TextBox TextChanged event to filter ListBox items."""
         filter_text = sender.Text.lower()
@@ -199,27 +125,10 @@ def show_window():
                 list_box.Items.Add(item)
 
     # Attach event handlers
-    close_button = window.FindName('button_close')
-    if close_button and isinstance(close_button, Button):
-        close_button.Click += close_button_click
-
-    minimize_button = window.FindName('button_minimize')
-    if minimize_button and isinstance(minimize_button, Button):
-        minimize_button.Click += minimize_button_click
-
     run_button = window.FindName('button_run')
     if run_button and isinstance(run_button, Button):
         run_button.Click += run_button_click
 
-    # Attach the image click event handler
-    logo_image = window.FindName('logo')
-    if logo_image:
-        logo_image.MouseLeftButtonDown += on_image_click
-
-    # Find the TitleBar and attach the drag event handler
-    title_bar = window.FindName('TitleBar')
-    if title_bar:
-        title_bar.MouseLeftButtonDown += header_drag
     
     # Attach the TextChanged event handler to the TextBox in code
     text_box = window.FindName('textbox_filter')
@@ -232,14 +141,7 @@ def show_window():
         for family_item in family_items:
             list_box.Items.Add(family_item)
 
-    dispatcher_frame = DispatcherFrame()
-
-    def on_window_closed(sender, args):
-        dispatcher_frame.Continue = False
-
-    window.Closed += on_window_closed
-    window.Show()
-    Dispatcher.PushFrame(dispatcher_frame)  # blocks here until the window closes
+    window.show_modal()
 
     # Retrieve and return selected coupling and pipe types
     if dialog_result[0]:
@@ -269,460 +171,124 @@ class CategorySelectionFilter(ISelectionFilter):
 
 # Use the pipe type selected from the UI
 pipe_type_name = selected_pipe_type[0].Name  # Because only one pipe type is selected
-pipe_type = pipe_types_dict[pipe_type_name]
-
-# Clear unused elements
-del pipe_types_dict
-
-# Define mapping for the coupling family based on selected coupling and family type
-coupling_mapping = {
-    'DN50x50': {
-        'EC002 - Ductile Iron Coupling': ("PBUK_ES_Two-Piece Ductile Iron Coupling_EC002_Union", "DN50x50"),
-        'EC002NG - RAPID S NG Coupling': ("PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN50x50"),
-    },
-    'DN70x70': {
-        'EC002 - Ductile Iron Coupling': ("PBUK_ES_Two-Piece Ductile Iron Coupling_EC002_Union", "DN70x70"),
-        'EC002NG - RAPID S NG Coupling': ("PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN70x70"),
-    },
-    'DN100x100': {
-        'EC002 - Ductile Iron Coupling': ("PBUK_ES_Two-Piece Ductile Iron Coupling_EC002_Union", "DN100x100"),
-        'EC002NG - RAPID S NG Coupling': ("PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN100x100"),
-    },
-    'DN125x125': {
-        'EC002 - Ductile Iron Coupling': ("PBUK_ES_Two-Piece Ductile Iron Coupling_EC002_Union", "DN125x125"),
-        'EC002NG - RAPID S NG Coupling': ("PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN125x125"),
-    },
-    'DN150x150': {
-        'EC002 - Ductile Iron Coupling': ("PBUK_ES_Two-Piece Ductile Iron Coupling_EC002_Union", "DN150x150"),
-        'EC002NG - RAPID S NG Coupling': ("PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN150x150"),
-    },
-    'DN200x200': {
-        'EC002 - Ductile Iron Coupling': ("PBUK_ES_Two-Piece Ductile Iron Coupling_EC002_Union", "DN200x200"),
-        'EC002NG - RAPID S NG Coupling': ("PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN200x200"),
-    },
-    'DN250x250': {
-        'EC002 - Ductile Iron Coupling': ("PBUK_ES_Two-Piece Ductile Iron Coupling_EC002_Union", "DN250x250"),
-        'EC002NG - RAPID S NG Coupling': ("PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN250x250"),
-    },
-    'DN300x300': {
-        'EC002 - Ductile Iron Coupling': ("PBUK_ES_Two-Piece Ductile Iron Coupling_EC002_Union", "DN300x300"),
-        'EC002NG - RAPID S NG Coupling': ("PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN300x300"),
-    },
-    'DN400x400': {
-        None: ("PBUK_ES_High Performance Coupling Stainless Steel_W2_EC002HP&EC002HP-G_Union", "DN400x400_EC002HP"),
-    },
-    'DN500x500': {
-        None: ("PBUK_ES_High Performance Coupling Stainless Steel_W2_EC002HP&EC002HP-G_Union", "DN500x500_EC002HP"),
-    },
-    'DN600x600': {
-        None: ("PBUK_ES_High Performance Coupling Stainless Steel_W2_EC002HP&EC002HP-G_Union", "DN600x600_EC002HP"),
-    }
-}
-
-def get_family_and_type(type_name, selected_coupling):
-    """Retrieve family name and type based on the type name and selected coupling."""
-    family_data = coupling_mapping.get(type_name)
-    if family_data:
-        return family_data.get(selected_coupling) or family_data.get(None)
-    return None
-
-# Define mapping for the coupling family based on selected coupling and description parameter
-description_mapping = {
-    'Access Pipe Round Door': {
-        'EC002 - Ductile Iron Coupling': "PAMBUILDINGUK_ES_Access Pipe Round Door_EF014_DI",
-        'EC002NG - RAPID S NG Coupling': "PAMBUILDINGUK_ES_Access Pipe Round Door_EF014_NG",
-    },
-    'Long Radius Bend': {
-        'EC002 - Ductile Iron Coupling': "PAMBUILDINGUK_ES_Long Radius Bend_EF02L_DI",
-        'EC002NG - RAPID S NG Coupling': "PAMBUILDINGUK_ES_Long Radius Bend_EF02L_DI",
-    }
-}
+pipe_type = doc.GetElement(pipe_types_dict[pipe_type_name])
 
-def get_family(description_param, selected_coupling):
-    """Retrieve family name based on the description parameter and selected coupling."""
-    family_data = description_mapping.get(description_param)
-    if family_data:
-        return family_data.get(selected_coupling) or family_data.get(None)
-    return None
 
+# Ways of choosing the pipework to convert
+SCOPE_PICK = "Pick pipework"
+SCOPE_SYSTEMS = "Piping systems"
+SCOPE_VIEW = "Active view"
+SCOPE_LEVEL = "Level"
 
-def get_pipe_segment_id(doc, pipe_type_elem):
-    """Return the PipeSegment ElementId from the first rule in the pipe type's
-    routing preferences. All sizes share the same segment so no diameter matching needed."""
-    rpm = pipe_type_elem.RoutingPreferenceManager
-    num_rules = rpm.GetNumberOfRules(RoutingPreferenceRuleGroupType.Segments)
-    if num_rules > 0:
-        return rpm.GetRule(RoutingPreferenceRuleGroupType.Segments, 0).MEPPartId
-    return None
+scope = forms.CommandSwitchWindow.show(
+    [SCOPE_PICK, SCOPE_SYSTEMS, SCOPE_VIEW, SCOPE_LEVEL],
+    message='Convert which pipework?'
+)
+if not scope:
+    script.exit()
 
 
 # Main logic
 try:
-    # Loop until elements are selected
-    while True:
-        # Prompt user to pick elements
-        with forms.WarningBar(title="Select pipework and press Finish when complete"):
-            selected_elements = uidoc.Selection.PickObjects(
-                ObjectType.Element,
-                CategorySelectionFilter(["Pipes", "Pipe Fittings", "Pipe Accessories"]),
-                'Select Pipework'
-            )
-
-        # Check if user selected any elements
-        if selected_elements:
-            break  # Exit loop if elements are selected
-        else:
-            forms.alert('No elements have been selected', title='Select Pipework')
+    if scope == SCOPE_SYSTEMS:
+        # Every pipe, fitting and accessory of the chosen piping systems
+        piping_systems = sorted(
+            FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_PipingSystem).WhereElementIsNotElementType(),
+            key=lambda system: system.Name.lower()
+        )
+        selected_systems = forms.SelectFromList.show(
+            piping_systems, title='Select Piping Systems', multiselect=True, name_attr='Name',
+            button_name='Convert')
+        if not selected_systems:
+            script.exit()
+        elements = converter.collect_elements(doc, systems=selected_systems)
+
+    elif scope == SCOPE_VIEW:
+        # Every pipe, fitting and accessory in the active view
+        elements = converter.collect_elements(doc, view=doc.ActiveView)
+
+    elif scope == SCOPE_LEVEL:
+        # Every pipe, fitting and accessory on the chosen level
+        levels = sorted(FilteredElementCollector(doc).OfClass(Level), key=lambda level: level.Elevation)
+        selected_level = forms.SelectFromList.show(
+            levels, title='Select Level', multiselect=False, name_attr='Name', button_name='Convert')
+        if not selected_level:
+            script.exit()
+        elements = converter.collect_elements(doc, level=selected_level)
+
+    else:
+        # Loop until elements are selected
+        while True:
+            # Prompt user to pick elements
+            with forms.WarningBar(title="Select pipework and press Finish when complete"):
+                selected_elements = uidoc.Selection.PickObjects(
+                    ObjectType.Element,
+                    CategorySelectionFilter(["Pipes", "Pipe Fittings", "Pipe Accessories"]),
+                    'Select Pipework'
+                )
+
+            # Check if user selected any elements
+            if selected_elements:
+                break  # Exit loop if elements are selected
+            else:
+                forms.alert('No elements have been selected', title='Select Pipework')
+
+        elements = [doc.GetElement(reference) for reference in selected_elements]
+
+    if not elements:
+        forms.alert('No pipes, fittings or accessories found', title=scope)
+        script.exit()
+
+    # Plan the conversion without changing the model: targets, unmatched fittings and types to load
+    plan = converter.plan_conversion(doc, elements, pipe_type, selected_coupling)
+
+    if dry_run:
+        # Dry run (Shift+Click to toggle): report the plan and stop
+        converter.report(plan, output)
+        script.exit()
+
+    # Report the Pam family types the selection converts to that are not loaded, before changing anything
+    if plan.missing:
+        converter.report(plan, output)
+        convert_others = forms.alert(
+            "{} Pam family types needed by the selection are not loaded in the project. "
+            "The elements that need them will not be converted.\n\n"
+            "Do you want to convert the other elements?".format(len(plan.missing)),
+            title='Load Pam Building Content',
+            yes=True,
+            no=True
+        )
+        if not convert_others:
+            script.exit()
 
     # Start the transaction for changing pipes and fittings
     transaction = Transaction(doc, __title__)
     transaction.Start()
 
-    num_pipes_changed = 0  # Counter for pipes changed
-    num_fittings_changed = 0  # Counter for fittings and accessories changed
-
-    # Look up the pipe segment from the target pipe type once — all sizes share the same segment
-    target_segment_id = get_pipe_segment_id(doc, doc.GetElement(pipe_type.Id))
-
-    # Loop through picked elements to change pipe types
-    for element in selected_elements:
-        try:
-            element = doc.GetElement(element)
-            # Process pipes
-            if element.Category.Name == "Pipes":
-                element.ChangeTypeId(pipe_type.Id)
-
-                # ChangeTypeId does NOT update the Pipe Segment instance parameter —
-                # set it explicitly to the segment from the new pipe type.
-                if target_segment_id:
-                    seg_param = element.get_Parameter(BuiltInParameter.RBS_PIPE_SEGMENT_PARAM)
-                    if seg_param and not seg_param.IsReadOnly:
-                        seg_param.Set(target_segment_id)
-
-                num_pipes_changed += 1  # Increment the counter
-            # Process pipe fittings and pipe accessories
-            else:
-                element_type = doc.GetElement(element.GetTypeId())
-                description_param = element_type.get_Parameter(BuiltInParameter.ALL_MODEL_DESCRIPTION).AsString()  
-                type_name = element_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString()
-                # Get and convert Nominal Diameter parameter value to mm
-                instance_diameter_param = element.LookupParameter('Nominal Diameter')
-
-                # Check if instance parameter 'Nominal Diameter' exists
-                if instance_diameter_param:  # Only proceed if the parameter exists
-                    # Retrieve and convert diameter value
-                    instance_diameter_param_value = instance_diameter_param.AsDouble()
-                    converted_instance_diameter_param_value = UnitUtils.ConvertFromInternalUnits(instance_diameter_param_value, UnitTypeId.Millimeters)
-                #converted_instance_diameter_param_value = UnitUtils.ConvertFromInternalUnits(instance_diameter_param_value, UnitTypeId.Millimeters)
-
-                # Initialize family_name
-                family_name = ""
-
-                # Check if the description contains certain substrings
-                # Determine family based on description
-                # Pipe Fittings
-                if "45° Single Long Arm Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_45° Single Long Arm Branch_EF008_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_45° Single Long Arm Branch_EF008_NG"
-                elif "88° Long Radius Door Back Bend" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_88° Long Radius Door Back Bend_EF05L_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_88° Long Radius Door Back Bend_EF05L_NG"
-                elif "88° Medium Radius Door Back Bend" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_88° Medium Radius Door Back Bend_EF05M_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_88° Medium Radius Door Back Bend_EF05M_NG"
-                elif "88° Short Radius Door Back Bend" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_88° Short Radius Door Back Bend_EF005_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_88° Short Radius Door Back Bend_EF005_NG"
-                elif "Access Pipe Rectangular Door" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Access Pipe Rect Door_EF015_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Access Pipe Rect Door_EF015_NG" 
-                elif "Access Pipe Round Door" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Access Pipe Round Door_EF014_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Access Pipe Round Door_EF014_NG"
-                elif "Air~Wave Vent Cowl" in description_param:
-                        family_name = "PBUK_ES_Air Wave Vent Cowl_EF075"
-                elif "Blank End Drilled and Taped" in description_param:
-                        family_name = "PBUK_ES_Blank End Drilled And Taped_EF071T"
-                elif "Blank End Push-Fit Connection" in description_param:
-                        family_name = "PBUK_ES_Blank End Push Fit Connection_EF077"
-                elif "Blank End Push-Fit" in description_param:
-                        family_name = "PBUK_ES_Blank End Push Fit_EF071"
-                elif "Blank End" in description_param:
-                    family_name = "PBUK_ES_Blank End_EF070"
-                elif "Corner Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Corner Branch_EF035_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Corner Branch_EF035_NG"
-                elif "Corner Radius Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Corner Radius Branch_EF035R_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Corner Radius Branch_EF035R_NG"
-                elif "Short Tail Double Bend" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Short Tail Double Bend_EF054_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Short Tail Double Bend_EF054_NG"
-                elif "Double Boss with Bosses Opposed at 88°" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Double Boss_EF091_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Double Boss_EF091_NG"
-                elif "Double Boss with Bosses at 90°" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Double Boss_EF092_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Double Boss_EF092_NG"
-                elif "Double Boss with Drilled/Tapped 50mm Bosses Opposed at 88°" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Double Boss_EF091T_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Double Boss_EF091T_NG"
-                elif "Double Boss with Drilled/Tapped 50mm Bosses at 90º" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Double Boss_EF092T_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Double Boss_EF092T_NG"
-                elif "Double Branch Long Tail Radius Curve" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Double Branch Long Tail Radius Curve_EF097_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Double Branch Long Tail Radius Curve_EF097_NG"
-                elif "Double Radius Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Double Branch Radius Curve_AF010R_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Double Branch Radius Curve_AF010R_NG"
-                elif "Double Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Double Branch_AF010_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Double Branch_AF010_NG"
-                elif "Expansion Plug" in description_param:
-                    family_name = "PBUK_ES_Expansion Plug_EF074"
-                elif "Long Radius Bend" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Long Radius Bend_EF02L_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Long Radius Bend_EF02L_NG"
-                elif "Long Tail Bend" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Long Tail Bend_EF055_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Long Tail Bend_EF055_NG"
-                elif "Long Tail Corner Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Long Tail Corner Branch_EF036_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Long Tail Corner Branch_EF036_NG"
-                
-                elif "Long Tail Double Boss with Bosses Opposed at 88°" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Long Tail Double Boss_EF091LT_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Long Tail Double Boss_EF091LT_NG"
-                elif "Long Tail Double Boss with Bosses at 90°" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Long Tail Double Boss_EF092LT_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Long Tail Double Boss_EF092LT_NG"
-                
-                elif "Long Tail Single Boss at 88°" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Long Tail Single Boss_EF090LT_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Long Tail Single Boss_EF090LT_NG"
-                elif "Long Tail Single Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Long Tail Single Branch_EF056_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Long Tail Single Branch_EF056_NG"
-                elif "Corner Multi-Waste Manifold Connector" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Manifold Connector Corner_EF099_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Manifold Connector Corner_EF099_NG"
-                elif "Multi-Waste Manifold Connector" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Manifold Connector_EF095_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Manifold Connector_EF095_NG"
-                elif "Manifold Connector" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Manifold Connector_EF094_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Manifold Connector_EF094_NG"
-                elif "Push-Fit Movement Connector" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Movement Connector_EF058_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Movement Connector_EF058_NG"
-                
-                elif "90° Rodding Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Rodding Branch_EF009_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Rodding Branch_EF009_NG"              
-                elif "45° Rodding Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Rodding Branch_EF009_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Rodding Branch_EF009_NG"
-                        
-                # Determine family based on description and diameter
-                elif "Short Radius Bend" in description_param and converted_instance_diameter_param_value > 300:
-                    family_name = "PBUK_ES_Bend_EF002_HP"
-                elif "Short Radius Bend" in description_param and converted_instance_diameter_param_value <= 300:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Bend_AF002_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Bend_AF002_NG"
-                elif "Single Boss at 88°" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Single Boss_EF090_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Single Boss_EF090_NG"
-                elif "Single Boss with Drilled/Tapped 50mm Boss Connection" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Single Boss_EF090T_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Single Boss_EF090T_NG"               
-                elif "Single Branch Long Tail Radius Curve" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Single Branch Long Tail Radius Curve_EF096_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Single Branch Long Tail Radius Curve_EF096_NG"               
-                elif "Single Branch with Radius Curve" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Single Branch Radius Curve_AF06R_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Single Branch Radius Curve_AF06R_NG"
-                elif "Single Branch with Access Radius Curve" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Single Branch With Access Radius Curve_EF07R_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Single Branch With Access Radius Curve_EF07R_NG"
-                # Determine family based on description and diameter
-                elif "Single Branch" in description_param and converted_instance_diameter_param_value > 300:
-                    family_name = "PBUK_ES_Single Branch_EF006_HP"
-                elif "Single Branch" in description_param and converted_instance_diameter_param_value <= 300:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Single Branch_AF006_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Single Branch_AF006_NG"
-                elif "Stack Support Pipe" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Stack Support Pipe_EF050 & EF051_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Stack Support Pipe_EF050 & EF051_NG"
-                elif "Stench Trap" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Stench Trap_EF081_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Stench Trap_EF081_NG"
-                elif "Strap-On Boss" in description_param:
-                    family_name = "PBUK_ES_Strap-On-Boss_EF133"                
-                elif "Taper Pipe" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Taper Pipe_EF028_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Taper Pipe_EF028_NG"
-                elif "Transitional Connector" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Transitional Connector_EF059_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Transitional Connector_EF059_NG"
-                elif "Universal Connector" in description_param:
-                    family_name = "PBUK_ES_Universal Connector_EF071R"
-                elif "Entry/Terminal Venting Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Venting Branch Entry-Terminal_EF013_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Venting Branch Entry-Terminal_EF013_NG"
-                elif "Interconnecting Venting Branch" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Venting Branch Interconnecting_EF013_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Venting Branch Interconnecting_EF013_NG"                                         
-                elif "WC Bend x 45°" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_WC Connector Bend_EF121_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_WC Connector Bend_EF121_NG" 
-                elif "WC Bend x 90°" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_WC Connector Bend_EF121_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_WC Connector Bend_EF121_NG" 
-                elif "WC Pipe" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_WC Connector Pipe_EF122_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_WC Connector Pipe_EF122_NG" 
-                        
-                # Only perform mapping if description matches
-                elif "Metallic Coupling" in description_param:
-                    result = get_family_and_type(type_name, selected_coupling)
-                    if result:
-                        family_name, type_name = result
-                
-                # Pipe Accessories
-                elif "Offset" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Offset_EF024_DI"                                               
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Offset_EF024_NG"                        
-                elif "Roof Connector for Asphalts" in description_param:
-                    family_name = "PBUK_ES_Roof Connector For Asphalts_EF073"
-                elif "Roof Penetration Flange" in description_param:
-                    family_name = "PBUK_ES_Roof Penetration Flange with Gasket_EF079"
-                elif "Branch Trap" in description_param:
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Trap Branch_EF080_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Trap Branch_EF080_NG" 
-                elif description_param == "Trap Plain":
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Trap Plain Branch_EF034_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Trap Plain Branch_EF034_NG" 
-                elif description_param == "Trap Plain With Access Bottom":
-                    if selected_coupling == 'EC002 - Ductile Iron Coupling':
-                        family_name = "PBUK_ES_Trap Plain With Access Bottom_EF037_DI"
-                    elif selected_coupling == 'EC002NG - RAPID S NG Coupling':
-                        family_name = "PBUK_ES_Trap Plain With Access Bottom_EF037_NG" 
-
-                # Change the type 
-                if family_name:
-                    type_ids = get_family_type_ids(doc, family_name, [type_name])
-                    if isinstance(type_ids, ElementId):
-                        # Single type family case: Directly change to this type
-                        element.ChangeTypeId(type_ids)
-                    elif type_name in type_ids:
-                        # Multiple type family case
-                        element.ChangeTypeId(type_ids[type_name])
-
-                    num_fittings_changed += 1 # Increment the counter
-
-        except Exception as e:
-            # Handle any exceptions that occur during the loop
-            print("Error processing element: {} - {}".format(element.Id, str(e)))
-            continue  
-
-    doc.Regenerate()
+    try:
+        # Convert the pipes, fittings and accessories as planned, in one batch that can be cancelled
+        with forms.ProgressBar(title='Converting pipework ({value} of {max_value})', cancellable=True) as progress_bar:
+            def update_progress(done, total):
+                progress_bar.update_progress(done, total)
+                return not progress_bar.cancelled
+
+            num_pipes_changed, num_fittings_changed, errors = converter.execute(doc, plan, update_progress)
+
+        if not progress_bar.cancelled:
+            doc.Regenerate()
+    except Exception:
+        # Leave the model as it was when the conversion fails part way
+        transaction.RollBack()
+        raise
+
+    if progress_bar.cancelled:
+        # Nothing is converted when the user cancels part way
+        transaction.RollBack()
+        forms.alert('Conversion cancelled, no elements were converted', title=__title__)
+        script.exit()
+
+    for element, error in plan.errors + errors:
+        print("Error processing element: {} - {}".format(element.Id, str(error)))
 
     # Commit the transaction for changing pipes and fittings
     transaction.Commit()
@@ -741,4 +307,7 @@ if num_total_elements_changed > 0:
         message = "You converted {} elements!".format(num_total_elements_changed)
     forms.alert(message, title='Success')
 else:
-    forms.alert("You haven't converted any elements", title='Info')
\ No newline at end of file
+    forms.alert("You haven't converted any elements", title='Info')
+
+# ⏱️ Report the API calls of this run when profiling is on
+apiprofiler.finish()
@@ -21,6 +21,10 @@ from System.Windows.Forms import FolderBrowserDialog, DialogResult
 
 from pyrevit import revit, forms
 
+# ⏱️ Opt-in Revit API call profiler (Shift+Click About to toggle)
+import apiprofiler
+apiprofiler.start(globals())
+
 # Variables
 uidoc = revit.uidoc
 doc = revit.doc
@@ -94,3 +98,6 @@ if (dialogResult == DialogResult.OK):
         forms.alert('No Revit families found in that folder', title='No Revit Families')
 elif (dialogResult == DialogResult.Cancel):
     forms.alert('No folder selected', title='Select Folder Location')
+
+# ⏱️ Report the API calls of this run when profiling is on
+apiprofiler.finish()
@@ -4,19 +4,22 @@ __title__ = 'Batch Save Families'
 # Import required classes and add references to required libraries
 import os
 import clr
-import webbrowser
 
 clr.AddReference('PresentationFramework')
 clr.AddReference('PresentationCore')
 
-from System.Windows.Controls import Button, TextBox, Image, ListBox
-from System.Windows.Input import MouseButtonState
+from System.Windows.Controls import Button, TextBox, ListBox
 
 from pyrevit import revit, script, forms
-from pyrevit.forms import WPFWindow
 
 from Autodesk.Revit.Exceptions import OperationCanceledException
 
+from pamui.windows import PamWindow
+
+# ⏱️ Opt-in Revit API call profiler (Shift+Click About to toggle)
+import apiprofiler
+apiprofiler.start(globals())
+
 # Get document
 doc = revit.doc
 
@@ -45,15 +48,11 @@ def show_window(family_items):
     script_dir = os.path.dirname(__file__)
     xaml_file_path = os.path.join(script_dir, 'UI.xaml')
 
-    # Load the WPF window from the XAML file
-    window = WPFWindow(xaml_file_path)
+    # Load the window from the cached XAML template
+    window = PamWindow(xaml_file_path)
 
     run_button_clicked = [False]  # Use a list to hold the flag so it can be modified in the nested functions
 
-    def close_button_click(sender, args):
-        """Handle the close button click event."""
-        window.Close()
-
     def run_button_click(sender, args):
         """Handle the run button click event."""
         list_box = window.FindName('list_families')
@@ -71,16 +70,6 @@ def show_window(family_items):
         window.Family = [item.Family for item in list_box.Items if isinstance(item, FamilyItem) and item.IsChecked]
         window.Close()
 
-    def on_image_click(sender, event_args):
-        """Handle the image click event to open a URL."""
-        url = "https://www.pambuilding.co.uk"
-        webbrowser.open(url)
-
-    def header_drag(sender, event_args):
-        """Allow dragging the window by the header."""
-        if event_args.LeftButton == MouseButtonState.Pressed:
-            window.DragMove()
-
     def check_all_click(sender, args):
         """Handle the check all button click event."""
         list_box = window.FindName('list_families')
@@ -109,10 +98,6 @@ def show_window(family_items):
                 list_box.Items.Add(item)
 
     # Attach event handlers
-    close_button = window.FindName('button_close')
-    if close_button and isinstance(close_button, Button):
-        close_button.Click += close_button_click
-
     run_button = window.FindName('button_run')
     if run_button and isinstance(run_button, Button):
         run_button.Click += run_button_click
@@ -125,16 +110,6 @@ def show_window(family_items):
     if uncheck_all_button and isinstance(uncheck_all_button, Button):
         uncheck_all_button.Click += uncheck_all_click
 
-    # Attach the image click event handler
-    image = window.FindName('logo')
-    if image and isinstance(image, Image):
-        image.MouseLeftButtonDown += on_image_click
-
-    # Find the TitleBar and attach the drag event handler
-    title_bar = window.FindName('TitleBar')
-    if title_bar:
-        title_bar.MouseLeftButtonDown += header_drag
-
     # Attach the TextChanged event handler to the TextBox in code
     text_box = window.FindName('textbox_filter')
     if text_box and isinstance(text_box, TextBox):
@@ -188,3 +163,6 @@ if folder_path:
     )
 else:
     forms.alert('No folder selected', title='Select Folder')
+
+# ⏱️ Report the API calls of this run when profiling is on
+apiprofiler.finish()
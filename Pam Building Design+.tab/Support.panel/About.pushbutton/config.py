@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+__title__ = "API Profiler Settings"
+
+from pyrevit import forms, script
+
+import apiprofiler
+
+# Toggle the API call profiler of every Pam pushbutton (Shift+Click)
+config = script.get_config(apiprofiler.CONFIG_SECTION)
+profiler_on = not config.get_option(apiprofiler.CONFIG_OPTION, False)
+setattr(config, apiprofiler.CONFIG_OPTION, profiler_on)
+script.save_config()
+
+if profiler_on:
+    forms.alert(
+        'The API profiler is on.\n\n'
+        'Every Pam Building Design+ tool now reports the Revit API calls it '
+        'makes, how long they take and where they are made from, and saves '
+        'the profile of each run to a JSON file.',
+        title='API Profiler')
+else:
+    forms.alert('The API profiler is off.', title='API Profiler')
@@ -16,39 +16,13 @@ from System.Windows.Controls import CheckBox, Button, TextBox, ListBoxItem
 from System.Diagnostics.Process import Start
 from System.Windows.Window import DragMove
 from System.Windows.Input import Key, MouseButtonState
-from System import Convert, Uri
-from System.IO import MemoryStream
-from System.Windows.Media.Imaging import BitmapImage, BitmapCacheOption
+from System import Uri
 
-# Embedded Images
-#====================================================================================================
-IMAGES_BASE64 = {
-    # Company logo 
-    "logo": "iVBORw0KGgoAAAANSUhEUgAAAfQAAAEoCAYAAACuKgPeAAAAtGVYSWZJSSoACAAAAAYAEgEDAAEAAAABAAAAGgEFAAEAAABWAAAAGwEFAAEAAABeAAAAKAEDAAEAAAACAAAAEwIDAAEAAAABAAAAaYcEAAEAAABmAAAAAAAAAN+TBADoAwAA35MEAOgDAAAGAACQBwAEAAAAMDIxMAGRBwAEAAAAAQIDAACgBwAEAAAAMDEwMAGgAwABAAAA//8AAAKgBAABAAAA9AEAAAOgBAABAAAAKAEAAAAAAACKOJ9NAAAACXBIWXMAAC4jAAAuIwF4pT92AAAEFXpUWHRYTUw6Y29tLmFkb2JlLnhtcAAASIm9Vttu2zYYfhVCvdnQ0SQl6oh6RWP3EGDugsRD091RJGUTkURNUmwnr7aLPdJeYaQsy04Rx9myTYANif/3H/j9B/LN203F+I1sQSoXqhw7f/7+hwOUGDtf/BmeVRO5VJ/ua3l1/3nO7294LJy3P4I3m2RTVIVsGdgUedkkm7HDhE5lYt7tMnJAB2lvxs47KwDXswsw0bUE/iiAnFAXhPGIBDh26Q/AxSREOETEg5gkOEi8GPSPY7zVIksupx96X+Zr7CzbtkoQWq/Xo7U30vUCkTiOEXaR60KDgM1d2bINLJtXOwtT2fBaVa3SJbDfLNW37dhxdlsoqsFs2Yy67Yy4LtCGVYiMMNoBBR9w1W2dd84FRzKXhSzbxmDJgK2WutXNUh8xPYgfODCRzGZPx1IUA7pp36/ap9HN/K6S6FI2+rbm8v3KhPlqr34ps7+jbuCDcquyI7pW8mBTcqOOQK1kgFbJpJas1fVc63xXOxc7msBkYmslAt99UaXQ6+b7Ax05Nb+x42KXQkIg8ebES3z66xYy00Jldw8hrjsnOHFxQr0dytSuYC17Cid4kum6YIZ0VbCFRFW5cMCQymSic10bd8aAd7h+Pplc1DpTuRE0lx/PwPn7SUDiIIDuiHTuZ7PkvGxaVnJ5Ph07ZmWklEgojgOeBTGMiEtgxKl9801YPk692GUUU7bTn2p+a8vQ6m87UmhubOzD8BkLqGc6hGAsocepgCwVFGa+73mBsRmGg7Wfa2WGAssPrdqohLEoQo5pHGcwwFTCMKMejEVqeKcZJSKN01hyB9g6sGaMMrOdN3ZIv3htCyq/3S56uHsQsf894OspwF7+S6lMNlwH2FraJuDKjDXZeevWLtRG5tdTZXbRdAaDKAwPZV8PZBSHkZ0ae9LmctP+xO5k3fTD5Iwt+rdcHeS4w3xmhfF8dj5zvpVYM1sJOqH9+oju604T7UNAR4LcJvCTakwv3fXOruRve7fd3EgY3/LLuw4STr+sHinD5yV8q79eyvLRVtyKG521a1bLdwtTF8/pcnQ0bl2uZH0QecVqQ2BrSBg7Wa0LMPQoaDVgVZUr3lUiWpWin0IDhcf9NGz1NDsppqaXaAZD109hxMxbxFzbpIa3kGGPiexxdlwyJ0FC4sSL/jlBvR5fsnIhzemNXrAVV4o4oDyFOOUCUmomRCQYgSnLUi7DLKYRObKVB4Pyv9/K6eyfSLitif0QP+pHyFqtHvcyhAD+RX8nU/S8I+F/ThHazxj07fjpT6ctjx8sU93F40X1Z/XF6fOOE+JjQaAMWQZjRk13eiKCPguDMOIpxTLdWdMvPe8GGg4um7slc4PtmNldnc3HcPmWpWGxNlfrvwBY9cIajLeI6gAAIABJREFUeJzsfQmcI0X1f2Z3ZlERFUVExQsRFeUcmJ1ck52ku5M9WM5M+sjsLqDrhT9vf56/QfHi560g4n0g/uVQQLz1h6ggyimCwN67wHJfy7W7M5P836uju5J0kk53J5NM6vv51M5splNd9er41qt69V4kIiEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISEhISHRnRiokyQkJCQkJCS6F1ML8vn8wlQqNYgpUp+8B/gz+HyD5yQkJCQkJCQ6g6kFSMzlctmVlIeH1w6lUvlnj+Ss5xyqFvdMpaYGXXOZovlEJLlLSEhISEh0DkyzXiB+ltQKL4sq+vKYYvxPXDXOj6n6n2OqcRP83AhpK3y2Hv5/A/z+R0g/hN8/EFUKmaha3Lc676mqvCUkJCQkJCRCBGrSmPj/R7X8gVHF+FBc0a8Ewn5sLDdZHlu6qpRaurqMvyezxXIia9kJ/4+fk78vXVVOwu8x1Xwgpui/hvTmxcfoL2JZD5BFg/AuCQkJCQkJieAYYFo5QTxTWAIkfgmQ+FOpZZS8E5pZBu18hiTVmKa/67NxlSb8nabKv+P3xnK4CFgF39cfhjy/tTitH+r2XgkJCQkJCQnfIFoy0ZSBfIdjGf23qG2jhg3kW+LkjL9DKreeHJKH/EtjsECAn7tjqv696Lj5ClIEaTwnISEhISHhH1w7VtXinnFl4n8TmrUbtOky17T9k3gjctdn4ooxi9vy8Nkj8PtpEWp0J7V1CQkJCQmJVsGsziPxrP6GuKLfiFvrcdWcaQ+R1ySi+cc1cxbfCyR/WVQ9nhjPSVKXkJCQkJDwCE7maLWe0MxH8IwcSHW6A0RenWaR2PF8PaGa6+PjE4dhuSSpS0hISEhINAMjy1i6sCaZtXYnNKtMtsE7S+QVKabq00lieGc9EFcmRmkxJalLSEhISEi4gpNkLFMoJLPF2QRufRNL9bkjc5vUFWOGXIMDUk+mjRGxvBISEhISEj2PciQycEE+srDsNdWxFufkOKrkU4ms9XRcNcvdQuYVpJ4rlpNZc+tRmRMOIAWXd9UlJCQkJHoV6EntilRksB45NwN+D8kdFwLsI5LPSOr4/UED3oyacLeRubj9jlfmEpr5l1wut4dYfgkJCQkJiZ4AknC1W9RbtMjz12cGo+vSQ8UNmcGPr1eGzt6gDJ4Hn/0U0vnw/2+uVxZ+cmNm6JT1mT2W3KZEXlKRJ5DhFdyiXTUvGlu6mpDmXBN3Y1I3ppnV/aew3HLrXUJCQkKiJ1C9VX6Hsuj1QN4fALL+w7rM4H2b1aHZ+3ND5fsaJPz7VnWoDM8/skEZunqdMnTGOmVwdCp/8CLMM5GzitSa3QjbAK4kpDDzxPP0XbGMEcXyT8mtdwkJCQmJbkV5KrIAE/5eykX22KQuyq/PDP1xozK0Cwn6nuxQCUkaiL0EJD2NCf4+45bY32a3wPN3Z4fKDywdKm9S4XuZhddfozzvtGi2+J9k1ipTV63ByJa7gI2zbXt070r+hg5pHM9ywbR0yAOd3MSz5m+YuOS2u4SEhIRE94Gfb+PPO5QhAzTrW+5hJA7kXFrPyBt+n2WEXm6W2HOzG5Dk4fug6Zce1SLlby87onyktrqUVPVAWjRz4TrLgrSQYCzw+VOQHoK/7USDNvr5JD+jD0bskAe1fC/mUFZy612iDgZ6JPUieqH+vVDGboDsz2GDG6zh7xvTQ4cCaf8ZifwuDUica9weCbwJuZc3KYPlW5RnzSxXj58ZUc1SIqBWToO0WLMYfQ3yem8sa0STavFVIylr/9FU/sB41loCz34cPc+RZ7PFUhBt3dbSVeuXTHyyE0n0LHBBik6d8Gdexi/oVszXNpEkHDbKZSBztsV+R2bwv7aoQ08hmRNNnGrjgUhcTOuUReXtSqT8Y+015WEVtGZVD7b9jcFaFPOqpDox1qyeOFlF08Zx8N07xkiUNd+kTs/SVXPnqGIeQjJv41k6ntPzydYttf8KXXlAnPBdyzAnaCIXTxPF1IJ6dcPPg9hIDA+veFYqlX92tyWMkTCazz+Te2Z0lQrrc116PXMA6xCWLFggqFAxPLx2KBZbuVd47Va/rXocA6Oj+WeGJavhFSueNdcVmlNMMSLflo88c11m8Ed4Rr5Fsc+/QyNyR0NfVN6mLCifpo2Xj1QngxA62WKPK8aZwqSzwJ6EyWf0J/6fDQjyXCx2yl7wvf8XhNS5xXtCs/4H82zDgBtoUVtq9fmmYPl5nuw6pd057dsc9crEiNpb3Ti5eQO9ipmznhPN6H+H/nVXTNE3wc/N3ZOgPLCohZ83QboypuoXx5XCl+D3N48oE6OJhLl3tay6Q3OnbY7REKOKcQvUZRskv7K1vxfXqGvnMAxcHSdZ+ntAxg9COTcEaSv6ff3BmFL4iJh/74PKGndQoZ63RFVja4C25O2JY+2fqdTqZ7CX9Jfmz8n85kRk743K0J8eXEpIdzqMrfV62+2blYXlG9TnlDXtpPKoapb9bLfbmnnGOB3L34qWKBI75PUjv6TOt/rjmvE3IftQOtAUX4yw8o6mJ44EOb0dBvVZZPLNFC7Fn1CGs6IZcy2ZkJzJKITocHQRxP83ouZfFdcKJkxSn4f3XoDvjyv6L2DwfCeumO+PqhNjwt18+F77Jh1WrgG7XKq+Gsr0FS4XKNdFMJF+IZYxThzV8s9nX1pQqYU5ecTGC6+OqeYa+M6Xbdkqxs9hgvka/HzTYsV4Df+WR1Ijf08sN/dOZq27x5ZOokOiWTT87K5UJAn7MMYswMUp/o5/g3bdDn38cpDtO0bU4qvEus0pobA+OQZtkshaj48RZ09WyacM7O/hER3mG0bdeB5jOeuM8eVrcME/E7CtSlhPyOdJWCAewQTRjbsmrYG1ZUK1frIkFDmZJTbW7htesZZr6f1D6Pw62o2pyPM2q0N/Rc0cSHd3O4hc3G6/S4mUL9ZeUYaJAsi8de2ckzl0gAuw/H40B05W2PAJzfxnMmcby7W07Y5W9EC0O6LLWPz0+gONlA9XjvCeP8B374bJcgPV3PRNQEL4+3YglN9yYiRbdoRo9Osx2hxOuDjxjlUlDPcKZcA47v+EAX8KX536n5wcsktk9FxMLVwOZXuSvqvO+2HSgefWASl+ADVT/v2oon8Rvns/pPW8rlDOjfBzM/4Ewj0Qnzs4nydXGOHzT8Lnj0BaZz/Pv6PqsILXj6LlKhwEMjsPy8XKVKosE/0/LIDuRc0Gt5d53WwNSjUPh/JdBG1RL48yDaWrP40yiCvWqNB3GvU3m9Dhu3cmsiYs+tC/AvavLkokFDENR0xugPBbIPAZxlEYy60qoQxgwfoEPPdLDJjEd6Fa2SEJF/SduMiCOjyW0Mg4nPEnA/t7pTDjNNj9C/pyCggG8t8dQnvtpsqD+Tv2mp4mKi6jZKZwLHUmRhQqn+3otCcZa6p+jzPee1tOnsHIfAC9vm1Shn75AD0vbyuZY7oDCP0eIPQvaoeXD1dX+9luL7GraI8lMpMHkcr4nFh4p4LJVk2Qa3Mt31cvYUeimo61XMzTBaRjkQVEtngbEkVSs2a5loQGfUjYSa14Kz6LWlFcMf6CEyosNshdej7h1iQM9wp/T2YnyQQMn/0roRipJuVpKJMkar6gqZLbATCxw0RSsid+1/ejHKwSCTkL5BtVChmSj1Y8f8nyk/E2wAyvK6QSk9nsmDL5evbeRez5s9MrTsUFwrTwPPkOvaVgHYl5J1RzB4tb714u9n+U65Jla1AmV8EEazs2imX0d6IvARZNryQSmpts2QISCfCTrC0bkbpA6MbdiXCuZHY4MaInE61JZU8XvddFNeM4Vv+OHbE4cDR0aJvH2Vzg94aM8702EDosNs4IaKfjsiOICyzrlLDKOkegc+Fw/rnQfv/GOSYk76AlMtYU/T7hHL0/CJ1fTQMy/yJus69vs2Yuauh3KgvK79eS5SN8GMQJ2vl3sPwhdGrS4KCFXOnHuQ16tiOe4zTzfZhPg3N0RugrngWT5X+AzLHjTZP78lRTmh5DYleNaxNafjiuWtsYOfK7880mLXYHX58h0eGALGNp/YP4Ts/ngnyBky4shUn8frY4mGHe+7y9n0SnK5L3R9OFPNT12ymchBTQUlhd41QLxMXQ9JhSqCB0PFIgRK3ou5znSSoRTRkIFcj9YbKq91Iu+t3dzLvfP8iuh2J8NAUkj7se3uumz0AbT+PWYEzTvyO2ab227m1Cr0jMh4OONislOk4Kv4+qE29kbdeSnUUw9C+h06uyFvrWuHM0nX8pe13PEZatSKnmp3GshyaffiV0TuYb1UUnoaOXDSFdR/Oa8MraKVq2fJRa9EHoZFIpR5WmGrEnOFq6+T4/nYvGTCdk8bUm5XEIXdFvI/fkK1elJRYudjv83EK0IW9k4yIjolWRLXp4xxfxvc1InZc7qhbyJHQtDIyo4s8NL9GMceLJWY+gsYrLpFviE1QtoetnI9m6uQCO0a3gXVC32VZX9DEWMQ++ezWUbQf9vFWSpVufdDGgf6xBe883QrfbjWvteFaJZ7pxpfD+iH3tqBNb8H1M6Cqdb8bIfGN9K6zydhRsHlqsmcOk/1S3Q8D+2XeEzs/Nb1Ij+27VBjdt08hW+2ynyJwaxi0q57UV5aNbP0Mn2+04kJO2oU6wScQ+79LMcTrht04UxDhPM39KSlOfOJsROklkgiLb2zWOdkrV28FNBkLJXmwoxofEulaDlzmWNsdhkO0kMm48CXkpC/6fnMXWnUhbJHSWZp13Od7/BC+A9WVCnQGVaB4V8q3ccmfb7O756Nz179Oj2YkjmQCr23y+EnpFvwdSIYtGaLNfYF0b9bHw0N+EzsqMi38gL1MJq8wdBB0bmvXbdsim7wida+dblKEvkXNz6rY1IEFT96/Mg9ys7RWOfcZ+J89uBO18nbJH+Tjt+PKIarVI6HTLCY2jUqljn8eqFKzB2GQcH9ffABPTzniLE4RN6KpxiZifCzwROnl3lebunJEXHWM04kjHJt46ZKFzUp2NKhNZfL/L4GfGevn9nGh3dQfZrFtZcIudyIL+raLsdWQZhNCpPQHbBcAFCzfMY+3QTHuvIH2+CKgx8mM2A65tzqLu8UVcPxI67w+QdpNFo2bcvFg54TV1+liI6HtCJztVSTr+r8P72+y1XU9cwlb7qe2QS7zfCL3Mzrk2pxa9bqs6tGOjQ8a+iRzvqm9WnSAsd4LGvxUSav73CoFZmJe5WYfQj/NF6AlypcbYJtyTnW+EXjFwcXuZHgWYqAnfEtOMX8fpdaKr4fs7iD0BWpjXIx/HRe3NhxIHGlUy4/XPWt9KNYh2R8qi0bLEqUX9zfBOKIv+K7Suh7I80awsNROpP0InREImBLy3quo/IpbxGQOv0/0Bt+RZCN6mbciPb9DADn6/DNJnoxn9U/Dzp5D3/WP1bz5A3ni7wXyszk5RvxA6kQVd4ExibINto0r+ENaebSJ1Sei07xozxKBTMz4aVrnbDDIm8OwfbQDozl0wd99u7dlXhM61863K0FeRaNcFcByDmjiPtAZE/cj6zOCF6zKD71mfWXjs7crCzEZl4fJ1yuDb1iuD34W/33VvlhA9dSGrLCpP+NxyT2pGOanoT46PF15NKhXw6ox9dqxYGS8k6zawGKGfT4sTDqHbRJw1n4grha/Gs/ob0KDLyQ4d5YBWnTHeDsSysdHEgQZdxMBNNd8j1nnKvgdaXAyDbHfNJFdRFkJ8j8WUwmdSmvG6yrLkFya1wsugnO+CBcdWD5NYIA2d3ZP+rFq5QKHX5MYLMZgsNjBSbyhfRua/R4v+6nxSK4x9Eqrxs3rXGZ2jFmpxXGUM2U+ETuVBjCGJMea22Hj+tU3GQgBIQudlJ1dmNfOxaIoaJ3apRz8C5/aM9a2xcA3hKmXSL4Qunp1vVoa2b1H9a+dIyndTgn70jszQ6ZtTkf3Ed1S/87ZYZK8N6cG3bFKGtt2TRccyg9OnaFr5KI9e4pD06XN6+SilODOcO7V8mHry8Zh3WEZxMCF9MIhRHJDlV5qUxzOhc7IBjfjWmJo/XPx+pPL+L98ufza8/4f1Jw+6OID8/iN2dD7hAkF+j2m8LoZoBrOaN6+LjVuvrShLuTxQXZajM8e9AB274PWaBrL0aRTHF080Fn2Eef8TE6mPZowAUT+FWrTbZM+3LEEe1xyqqnvydqvO5+CD84tgwvxr0uX2g+Ml0PymS7v3HaFzmTBHSzcfnsi/sKKvhAZJ6DXjQTMvpW8udyV5VVwP1qyww1lXtGf/EDq/pqYOrUZS9evWFb9HSXnouttTi15H8sagLpHIgnIqMojvwZ0AEkcd/49hWJlQb09F9lmXGfr5o7kF5feriZlG19bw8zFIMGiJJn84PDuqWuUT1WNmvrxspHzJ0gO/j3nyXYcAIFoZTP5XNdhibTiJMWvyd2Nmnq6tNSB0Z4vcvGUkdfz+Tp41zkxIudn7mKGJ/s16EwhdJDj35Xk5F6f1F8G77mPGa6Xa75Czun9ym4V6ZRFc67JrgFYjD3ytEzqTC/y+PrZy5V70tbUaCd85SNRf4OD1txKzeF8qfsctn7hinuCmpXMvgSCbP4ntK/7eb4TO+sw0vVZq/txFLiFAEnr1uCDzlmZYYZU/ZNgOtWCOudanAy/P7dk/hM5cvG5WB392X84foQtk/hf0Lof5oWOaas285t0siht/7nEl8t3vLDu8fIiyZmZMIPQk08SRxI8iJE7ud5dNbXn5TG24/DvtxeXb1WeUHlIi5X9oz39SXV4kW01+t/Y4qcUUayWzcPfjWIYaiCnGMswroIZO36+ZT+M2OC3jlAf/8JRg0cMcTHBX1yMg5vXrHPwG90aXUK2T6hEfs7h/FO0LRHk1gr3jsfKUvYBUb2pYzxYI3dFG9P9tJGd7MlX1onu9qGEl/L7e1aagqr2OXrZ6P+iPj9QQB1tgoF1Dve/2I6GTtiJn6rjItd7dqK38QRJ6dX8mV0Sz5qaoevy+rAhdQ2KOLIr/HfKdc9f27AtC50T6QCyy1yZlcBsaqYmW5x4N4GbR2G2rOrhlXSpCNMdyi9oxNcorD5QPjiw6P3vQn8eX4mRfmHVIfJJo4nhOPqktLX9RO6L8J/VF5Q0qjc62TRkgVvK4sNiYe3Z5TW7p5SRfulhpidTt8+OEuTeQ2i3NzlzrdiA6oTyayln7s6wbOhtpROiOoYt1Fj7bSrAXYeDkKGHppeq8mUZ5XUTwxw2a9JfcBholUPhcsz7Taln4s2Sx4L4i90/ooDGL9a0nh7hiJNyuIdJ7vGSSpRpkE5sHzA/yWl/bXvzGhbHVZUHZ14RO+h6e72ath9BFLxVJWOe7ktCrE3FuRQxSza+HVYdQwMZFNGW8DtqpdlEcfuoTQmfa+UZtcGQjI/JWz8/RCA7PzbcpQybJEzRzP2W5gHW285e+8ShFm9iJ2+6QSilNJ85mvq4dUr5SfWF5E7zzHkLiC8j70WUsepnD4C748+5MZObDy8bLr1NP/TzN2XM0qAGbnOB53BoMGpwFOtH/eah6U8cy+JN0+kqf4V7B3CmuHYJ8bnBxp8gXH/enQOvkX4JJ8fcuHvL4oNuNxnhcvq2WBc/2YWJfV6+uLZ6hk8EKWn+cPd+Q0KOZiaOFCcS5psY9+6nGt2gZ6+6A8H40AGW6tXbBxwhdMbZJQncjGWpbAm3wA9J7QjPYkoRepx6wiLJmRn26fG4LnBs0F3VKDn1B6Fcw8t2iDhX9bLcjmd8FZL5JHbz+uuEIP2/0LSje2Zbn8he8fdnS8rnq62euUl9Q3gLaN9fE11eRuFge/PxeeO6r6iEzRy59UzmlTJzr3Md0YlvbBmRCLHFuOJJI5F+I164ChU/l29iq+WHMs4kW25jQhTNiJEI/MhbueX4jVVsvvp1f5v7Tsbygfdb4Uo4528k3CefLvsoCk+75LjJuldC5M40yWrGL+dd7b2NCR9/u+rlUBh4IXe0OQrcDqYSY4t7cCvsmS1iA7RpNW8QBTzikLgm9Xt+gd9Otq9GYkxVlzsjM8Txp6GO51h12+W3PviL0TZnBjzG/7S05k8EFAInElh4kcb9b3WqvBjdku2bpC47DBcb2TGR2K2jiXPvGa22NykM0dCD0n6ivxm36GRrRyPxXUtGXNxuQQGLPiCoTJ8Pz2wIONjYZmE8vZqTU5NpIQ0LnW8pAHn+lj7dusepcwdPfV+9cnGzHs8kLo6JhIJV6ZYHfL/dQr4ZlgbzOoLcAjGqCbl1DD5fQiXW6Nw3dcDmS6Tyhk0A5LtHufCcWKjXOnRd5uLvfGsngghe1dOucRm3WGiShN5I3PZbS3xdWXXyC3jnX8s+HBd16n8eZktDrgRMokOFZ99EQqa0RugIaujZU3pheqIr5+YXj4CbySsh7B56RA0l7PgKgAV4Gypep+6PlOwmcQSJ4EU2z8C8kEQz1iMEjEksnD8JY4TChHh/XjC9hmFJ6lmzNBhloQpCYi2mtmpKeJ0KHcv6ZZheARDP6O+sYhFHrbsVI4HN1CZ2dM8Pvl9Ki+C9LPFM4PQRCtzX0WKZx3Op5Sugl5hXwKij/T6CPX4gx6YMk6AMXQr5/xLC26INgbFlj73j+y411N7fjbYoqufqEJPRm/QRtFzC8rCivTsKuf9b6At0p1DtX/34i9PWZwe+3uuWOZ+14nr0hM7TrNmWIeIHiZ/J+Id5PX68MbmzVnzxq8Lgt/3t1P7z/zQYk2UKcRVJPMe0DPZshkeDdR/w/CVlKJ+EG7lK9dx7MK6rqaayLh4mgCaHrpOxQ3lu4BXrE5zZ3QjU+77LlThKZANm5eC73zj3gs/9UkxW/ew4/rxEmBJ/b//q3w9xy70tCt49j9FB8L4jAHSuMCw+LwM+BNvWQn4iDjZJgZ2KEU3ZJ6M3kTQ1rzZ+x4nSU0O24EDBOaSClKjm3N/UHoXMCBvL8gS9Cp05onl6XXnSwmJ/v8jAhXzccedYGZfCOO30S+h+1/cpxTugCMdYG6tCFmNlhnGVy7bylu7aejOKgPrv4GbcPLb1RKFjbIh+9uvEvwGT+1wbPPiY862dgLID63OByjU4SekuJ2TRoxomY79q1a4fwnUFTtVOguJJ/ObRXqEEzqHEciTn/w0bt5h2S0JvPT7Znx3xYdWq1/knNvCLsxaGX9uwLQrfDpSpD57a65c6t4ZHUN2cGo2J+fsEJfWM68iLI/95WvdbxLfdfqy8BDdls2MDVE3oYnQZ/oktW1GxIhbwRr8dra+QK2Ufw2Vauigle346MO9vbQhASugMQ18x/H0zJk07ixBVj7aQjeGV7R6tlsbf+s1ZSWHAFCZ/a34TeRg09wpwC2XnCYp14HWzs6a9FciE7T7eic5Eq2fqAJHQvMk8Qz5DWHaOj+eezYrWd2IQro6fNRb3j/ULoZecM/TMPLPVxhs6M4oB4TxXz810epuFvUgcX+3FBi4R+lxIpX6C+sjzSuj/4YIPFcfn531iHFiYAD45ldEJakPfdI+xeu8f87at4uNXWiKChw/+E5UsIFH2Ruw4+7rFONTekUsY+5C1eFy6Otf2v6hCDJPRWUnsJ3QbPF/sSyPoPGHAlhEnZ3nkCeRxA3xTkXFcSuud5Cg0SVesLYdWrCUifX5wtvBKUnfvaFHylaXv2BaFzK/fNyuBbH/Bp5Y6R07Yog2SLOeiWOy/PVnXh6X6u0eG1Nbyjfq52cPkIdbUnf/ChDBKFesCCzvrrCD2baqWzeHT9yjVj65KIMMHWy5T7IMffycoYbQdcyMMhdHOSlINdR8OJEbT2x92izNnfUQ2yCEDf7aJ710ZlwQVPcmmjaGWGJHSvqUOELuaN3gGxX4TkDITYmyQVo14I3xYgCb2VuoF8dvG6tTd4C3PUlTV/WM9+pxN17gtC5xr1Vm2hit7emEbsWSvG5zfSbfen71CHyDazX1Ln2+23aJHnb1YHN7RqEMc1dLyv/gltpHwYEPpYBwidWNJTT2u3w+T0Ylab0AmdvosTqXmBeCed36XnqVwu29HB4krhNCjbbNz9iIFHZrrbsTZ2/LGDll5Pk7b9uYOG9T1ny7RcUxaR1DDQDbsONetSFmcilYTuLXWQ0BH2AtHdn4GPscOuZGrmm8X8/UESektyp3PWFVCcti8C8WZRcm6dKPUJobNK3ZF+5ks3qkOPbPaxze34cR+8jOQpBF1pqSz2bsHQmb59yiukHMSznNeIbcEGBg0NCVrztpF0nhgG+hj4LYZPpYMRtO7b0bjFcZwjYmpBMjtxJJTvF5R03QnUPibIVm6/8Z/JrHksGtHUMxh0HOgYNycyhRWCFb5TEiA1jHIGefwaFwdABo0clkhCbyV1mNBtS+WslUxka4P2tDx+WP9zbEO8xCeoWzpJ6C3NXXQxBWPztLDqVwXS1w8GxSOpWf/q4J1z1/bsC0IXAUR65fYsuYbmKzgLxjXfpFAHM1ewaGpe3lsuRwa4lzkg5Ikt6lDJT/hWtHDfrCwsX6c+t6xo+fKoauKWcNs6CEyiu/EsESaOrTxIic9B0RKh88EIpFFi/tA3QlnOg8/+Bz3TxVTz6/FM4Vq8GiKcdbpMbPosu5t637CSfzlrjQGxTAh45neNrFJpWfCuPynLHTGl8AMsC07ScU0/Gz67Pp61phuXpWoilYTuLXWY0O3yJ8y9sX5By2/LXNU/i/lKQu9k0vnu3H0jav5VogzDgHM91Ti9A8FXmrZn3xC66C3ufh/OZYQ0e7eG296DUzxvoq1jNLWpinPlATvKGqQpdh9ynTJkblOHnt5Ets5bJ3S+3X6edmB5uEH41aCJX38jmoVq3DSayh+I5Q8w4L0SevWW+Qy1FLaIdy8cNJi4py98ttEgok5iyEB7m2v5GRmNgqYPg+EJapXubszC3YWS6HKkLLw8dlncnPXILfceJXREXDGuCnq7fc33AAAgAElEQVT9iI6jNViPL2Kecsu9s0mwyzmPSDBkv/oxNX94XLMeZzdaOm0IV9GefUPoXJPepgwdAlr6LkaQPjRkcp5OjOTWK4OXb8pGXkvyryO4qitq37hTGyrB+2f9kDkndLyy9i5tSfnIthA6Erk+ndSsEvNy9BP0qIZ1CDjYPRE6m6Bqts5tP954l57ds2+qCSv6bhqr3fwxaYuy+5m/46ZVfyups4bX3upbqHouC3zG6uM+kUpC95Y6T+iiL/7fBCUlW+YZnQRSkoTe+QR9t5SgsSKOCaueEd7PNStQTIwQU/8QOoKT6xZl6Nd4Hu7n/JqTOmr4mMcWdejJ9ZnB89dnFh57u7rHqzanIsRwCrfX70hHXrpBWZhZlxn6OmjkD+DOwEZ4p18yx+32rZkFs9eoe08vUQuoQYfWESiRG9MJ1ZxlrkrviaX1IhEcd8QRDE0dy9BIa/oO6JSPU1effkkAv4dkvoZY5Avn7w06Nwt1qOqforsS5nTc9wAl5ca7sLugPo/VnUgloXtLc0Do9jm6qgd2NMNlHlWN0zFPIeCPn5JJQvfTBvwaqmbdMjKSew4rauAAW6BQrQ7LZ0EIqb8InTuE2aQsXHmXD+tytzN10NZLJMAKPZffAeS+CdJtGzKD6+HvD6EXOHaHvcQWEL7IHBOJsqYOzH5uebx8hAZkpehMM/Q1WZbiQvQq6AglJHL4fEdcKXwpqhb3RVmxjhtGp2jq+pVtW18bVQqTQBa7E5REpluoH/Frj2EUKSnrFwwPe+/YfBKPZvSPYfmoQ5AW30+c2pgzqeU4geufAtn+gAadIc5uOLnS/HArsIbQjbPI9iwsSITnyXd8Evps3NnxKPGFjj9Ct3chMM10LB76nG656/8IvOXOjCpjmv5OzFNq6HOThGA5ZwSsK+kfR6fy+0FeW8id87kzhKtoz74idBGblaE/BdHSRW0d88CE3uSQwDHUKv4kTmNg0cD+7pvIN7DzdrziBmnTUuWEb44q5sMpGjWKam6K6N6Vh4dEwuapeotYJ40PeZSoNbl+FxDMmegYgYloIGyPXPiPB1/ut+Jz0UxhBRDj/WMkdrc5W1k3ooGTJH6OwTXIFrtmPIFXx5jxm321zUsZbULMWsuhXFuoEx0SAEdwqSu+v8LV7ixzibs7ntFJSFn4/Ceh+nLPSg29U4SOi1qo3/3USUiQs1FefiuE8ktCD0J4+DOhWk8mtPwwkWaQwEuaefYc3jmXhI7gZ+kb04PJrSoQreLP2rzONvwsI/BZpv3PhpE3y38adwI2qXu8Bcu/Uln5EtAkT4lnjEthot0uGo3ZoSGBIHnC/4t/xzvb8L3NMCn8JKpaJw0r+ecyETFSaz18aRN4InSMT55aTe97p3LW/lHV+FZCNXawshMrc+KkgydarxKLjvYoDK7v8khLfncX7AkpQQjp40haLLhNCa3YK99ftN+Psa/h+UuhXY7gecH/f8QWTLtJfUnCONx4Rq9P1xJ64SyyU6LouyqfhwULmXithhNvBaGT51nMbyevXSkaYvIbRMYeCB2e/XeSLhqn7XyonQXmv9nFYUdPE7pDSOYK2ieDRYrjP2GB8EbygkDHV5LQgyR6HZaM1d+z4rY0P9hHMZo5Dgu9ZrdZ/LWFJPTWwB3NgEb95QdyrXuO63Raxz3VqUO/ibhozizubhw9pUFj4hWqyyD9FdJNNBVuAI3xzwnF+DloaF8BjfdUmAiGXxtbuZeYD8u3Xd6UPBM6O2Mc4JMXDZphvAXS+fDcPzDkJaQtUcXYEMsY10A+58XVwqnw2Uuq6uK7M7OBS8sMi51YxjwW3n8OlO9KkOEd+H5ImyBdB/+/OKYWPpBgd/SF90dG0/mXji01D0nkrIMxylt1qo4sh057Ejn90HrPu9/HrwU+h+Fzq7+P+WL+jnOg5jKC/nUgklF1Xpi/E6ayAvOC0EEDuzA4IaFfcaLhb+HGpZFAk2zfErpzVBUWqSvU0U+r7qsPPji/KK5Z17gEXZrruvUpobNK3qRG9tyqDF2DW+/rAm69tyuhpr9VHSpvU4fuuSW1x4Gs/IRsqj2UVQO1L0z5/AV1Oyz3dBZpf8O3SugRnLxq6ze1YMWKtc+KwWIEf1b/ndYltHumbscOA+gxDt+vqsU9q/8+FY4BYa+jZwmd71jAAk0Tbij41p6qIxMG7xt9S+iz1BNkGP7R9VkaM8K6GxfcrNhN5z9hoff+kHceSrBACCMSZn8SOoJvvd+SXnTwVm3oPuaCtatIfR2NxT57pzo0sy69iFy3qBPpzXZFSgxu6k0a7O/CQqCTje2D0J1tX2HhUQPHh3rbiHRA8NNeK7OG7y8PNAzhWf10uenznu0BGuVT7wqfG5qGIXV5N/7Ta4TOjdVwpwcm2HVheP1yCL2OH4SW0WeEzm1rFOMa6EfX0d/DCwEN5PxtItWmCy3696MzhYMSqvVQSD7+SSJb94rxfajXE0Hbs28JHcG33m8fX5gGDfhJZsTWFaSOmjned0fr+XXK4NvE8nrEgEuaSwQh9Op85rJec/3+XkB7CF0pnID5Cgur4Akmcr7IxbxRY4NJ/p8hxbKmVzE185FkaF7K+ovQHacwhUtjqqWxhV0o581xZmia0PRcs7pzwgd5XxCWdm67pc1av4R+NxIPviPU34SO4CR56/jCZaCpP3GnNvdn6rioQOczSOa3ZQb/C8vHPd31MMIidInuR69p6KS8MMEuS6jGlpDIXAwyFKKHsj4kdGwPVccAK2iM9oPwCNW+m35Do+ut9p1zzTgxRF/tVPZZcxptUTCFcMQjCR1hkzq1fN9+r2MoF+ieui8yh/fiHflt6tDOOzJDq8Xy9TgkofcPul9DB3JVVXXP6DLzFQlFN6KK/juMG4ApxAkbNfRZNFjFcktC90/o0Af+D/OMjp/wCqjzPWHFGyfXOOkNmY/XqT/py4ckzL0TqnVbWISO/jLIbRbN+BKRlaovlhp6iOCkeUdmjwOAWK9C63fQkmfQWC6sq2fNtHL4OXM/uZo2uPF2ZTCB5ZkHmjmHJPT+QbiEThKZ7NbjWSr8vDZoorcTjDtgQn8aryKOsdj1YUXKIv7byYRt/ZSKJFz/4f1H6MafeP4xzXhbiN7ZSti3QI47UEumInbayjGEs84MK/iKszNg3j6cMvbB/KMZ62hJ6CGDG5yty0X2WJceOmOLMrQTtXUWmW06bGIn+TGnNHdnh8qomd+eHvzh7akIaeR5oplzSELvH7SB0I0yeg4kfgjCSlgu4mKYOicKMJFWJdAcSYSv4sNR7YTXEYmEHBCkXwmd7XIsAA39T2GRun2NTTMvY1UYEN4VSaaNkYRq7gxItk5ic11U1U/iMoP57yhJ6G0ARkWztfXxocPuyAz+GgOqILFvpE5opv2EXq02eNvAtvS3Z4dK9Nrc4PXr1IUavhevpXkNy9pDkITeP2gLoVNviKL3w2CJ9b/Qo2NR7Ry3cfV3oBzCPfPvb0J3jBeNkXjWejoskiVRFPE9mrEK8xePdUDGfwrbriKmmT+j75niNyskobcLeE9dvB62QV2YXp8eunwzaOy4JY7hUzdw7ZoS8zT7vVSTuOtX/hx8xv27b9XI3/4OqcBjpZNwq+V52QguhO74BqcDShL6PEFbCL03Eovwp1k/Qhm0cj3QG/qb0COCbwjQmj/HAklN+83fqT91AASa/+Z0Wn8Rr0tctd4S5vY+ic2uWg9xh0yS0DsI1JKnBM9p68eH3gDk+wnUpkFb341W6A8sHSrfK/hu3yykLcy3O3kOCBy1/E2E6AdvB2L/2vrxwRhfOFQvIuYhGKGvfRZMelJDn9/oT0LHcL3k3Nz886FqcU9RFuFBEjpLkcNSxz4vqZm30pgC4dxNT1GfAedg/hjXAtpye2gGeM7d9/dxOdmuZCWhdw5ItOIWeDkVGbxtfNFr0Qp9XXroq0Dyv16fGfw3/LwXNPXHQBt/HNIO+P8DSN7w848b0kPnwkLg7bdmho7gIVZJXiDweWT41giOhq7p/2ahUnfSqGL6bujQOxNZ8tmNw2slofc4+o7QY1A/EkhIM6/hhk7hnZuLkIRe9Y7jwr5KRqOnWaMwH32dRG0MaaudbOlnravE+Y3XQxL6HABJnWyJuwgJSfnuFZFn3ZCLvPA2JfKSDWpk31tSkWdftzbiGvu4XLVI6CMMjGrFAxenVx2K/sHFhJ+xrSjZCXsb/UboLOKh+YcUI/P2uf+VhG5LgskYiPD88KKe6XRbXDPvhHwfZ7crAvcPRrbTo4qREssuNfQuASd3JHI3gq/CgP0sfk8KWWJ+o48InZ69YkS+6Lj5Cqw3Oxdt0xiXhF4ti9h44dWwoHqAyiIcL3IYijmAXGvqkKJhoL9WLWNJ6F0KJOl6aa7L1nXATtwoSfQ6+ojQ+QRs4rb7RpiYV2Ld6UQtt9zbS+jCPXHFeFe4AVNCugHBjO3iWXNTVD1+3+o6SEKX6BYMNCFl2ZH6F/1G6Fi/UjJbLOE5aVQxvoYR+VAG4W+9S0J3e+fw8PAQ9LMrw7peFlYSXNcW3eQrCV2iXSAGGmhh3qFwql2FKRakA+svw58GRh8SukG0sZhqTqeWrcGJ/G88NKe8h95eQrdJMWNEQR67A5JiaMn25Z+1LhPL6Vp2SeitA4XHw3C6pbku31yhfgjM+jLBDjOq5A/hgQV4imf1N8S1icNSy/L7Ofl0BAON2rYBSQ/U2eZv05ZpX6A/CZ1Pxoq+m8VAX5fIFA5CWYQ3v0hCb/ROIMUvUgM5fa61dO5S9jE0+KVNJwldos3gHSqVs/aPq4VTYeL9cEwzTsQ7nuyBik7IBw6Q9xj1uGXshLRLSE+hi86oYpwpPt+9oI4/RrMTR8Y1/d1xrfD+JNSNx8aOyAHhB/1M6IyI9GniXlazNsbGj3s1ykMGZ/EjR2+Ezj8f1fLPT5BY9uHcTQ9SbvRJAGX5aCO5SkL3BzrBqPpiSCcls+axeH+RJwzLiMYs6PREfH7+g5IZGpRAJ3gCPSItWbZmNknOofQ7ExkaJ1jUVO2VcKawJKFhSEuzRK920BRTzBnqvcn6gvh8G0HqkDp29fPENuWJtLVq5mOqebj4PP+JDkCg7t/HsmO5IZFBAZPlFXFl8uVV35Hwhr4ndDKpq/o0khGQ7vVINKJs/EMSerP3xjJmgc1hc9Ln8L1jORJ85fpGYVlJa0pC9wHuZD87+YslK04pJ7KTM0KQhhI95yjuTKrFV7EvzPutVsc6tHAanvlhmEfqQhGdvBgzNBpQcediIG58jne8SkLHidrg1qDUhSvzYw0/O0LovFyJ5auHsS15m/L2TeQmp8ePORV+L35LKI/dyaHM/2/J8pOxHjM4AfP6E5mo5k0pvlMxLwdG29AmQscrSZhPO5IR2jWlisS8xyU1k0ZdC+wKVhK6F/nA2L0oXKv3lmTKlAJLayZTSeh+YBtN6BezldtuJ0gDibSEDf9UHxE6nXBz+RcmmGvD2o7PzgGz1pXiF10IvaLzcfeJHSd0zRwmbcnb1GnfXXRg6+fy8jjemYxl1AK1JtIW+pbfRUg9a3ykE/WYZ2gPoaPDD/S33Y7EiBH7QtgkYAfkUIw3oVyC9SVJ6F7kExvPvzahWg8HlI+v8pL5TzO+w4TRUJ6S0P3AEdovXDpYiYZQ1PtGQ3cGnLmiwTUPupWumU8klk4Sw54IMyrEX7uR0AWnEnaZyI4Bcepg2Bo6Px+Hup3NyloT3IH6lsfoS9bf2ln+eYo2RVszHoG0HdI9oSbVuDemFB5DZyLYV/h2bWhbtopOPMlB/ndBni8RZdQ6JKF7fT+M7/eHFcPcW3LaeSRn7e+lvJLQ/UASegU4oSWXThbIFRuy1ew+2HHCSGatI/H5qXlG6EniMrJetCYgdHLsYN0sGDPNw8HRFoRM6LQt2F3eBXgePazknxtWSiTMvdHL26g6EYfJ8H0wF/wjmSuSe+VhkQHvh9BP/xdl439cSEL3UATyzMEH5xeBfP4+1qHzdHsnJut9J0YSuh9IQq+APeByk6lE/cAGxKdxUrPud7SK8sB8IvS4Vvw0JfTaBQ2dSFbhYuaXvO7trMc8Q7iErlBCR+NVzLftxx9TkQXRTGEFvPuOEB2VkPEEc839Sa3wMvoiP31KEnorZWDz1ExNfdtB5tQA8ncRISJcM0hC9wNJ6NWgluFAbAmt+E8mk12MEInhEV5HW0LOkC1yFtTAKK7nCJ1/Z2R84jCow07mtpOfo3OtjIfCNDtRj3mG9hC6UjgB82ULsoFwE12skrxZ/0DtHd5/SVjGVVSDwz5VfD/m769PSUJvuRwYNa29W+88SttTo+mJI2kzeeMQSeh+IAm9FoJ3JdDCH6Z3Jk3eMWeXLF8DE49x4+K0/iL2jYqwhb1M6OL3oP7vxT4Bk0aJR1YC8iD1hz7xHbHuEp7R2xq68A4keOgXbvOGD3Kidhm4DVwtK++QhN5CUciz6EM9nrU2MbILfeud3oohcc4/3aoMJaH7gST0eqDhB7P6G0AmP4dB8xC18tW3QzrbLZjAfCF0sf6j1A/BP6H+TxJHOarxn6hq/lcjT3kSDdHzhE7A+hZ1VmL+J4S427RfasY0jjnxHS0UShK6j7LENMNqx1l6TLFtbW4ZyVnPabWMktD9IBRCp0FHSAchnWTeBCCx65FInPxCDEWIW43kLy5BVjpI6ANc3iSPOtGrAhJ6hOeJmthRycLL0DjqFSywRhsWdgOYZ2WdOucaV5RnmMm9nvOA0COOAWlctY5P5orEYj0YAVDDKfj9LWL+3iEJveUC2XOEFdrxiZOYwWbGPNaP/CSh+4FPQncmrPrGK8Kk1rLgfPoeb1BNX77qBw7O5xdhtCLxszz5bO1Qdb3aTOgDHupe8UxQQsf/53K5PcTPMU/8rMFk29BvvKvMGtWpXB6g7wp3AcEDzsyBQd+8IfSI05YLEqrx96BGcoK1+7f91UUSessFYmMPd0XQt3pYd9PtxZlm/lh8T2tFk4TeOlokdJwEK0llasFw1noxBiMZTedH0PDhqIx5QMrW5Cj8EnsvoU2EPlD93Oho/pkJkPFiLT+MMsfAL4vTp76oivQW8IWIfw29fajuD1gn7DeLx2mdjh7X3zCqnfp8l++E+l7ybnjPSNo6OJqZODqsNJo2RuLjE4e5FGE+EbqjpWvWh0IjKNX4S7W8vEESeqAyKcZHUqFo6bp9a2FEzfs+qpWE7gc+NXQ0GItl9K/D326C9CB6T2MDaBaEtgM62Xr4/KfoOzi28pS96KvId5s2LCEszTgO3nFiXDFPsJNqHU/ygwZmj3ptkIGEYmXQbznmIeaXUK2T0C975WClWlssa702oegG8WlfVQ6o40S1I4ywCX3KiZ8OE+fq58Uzxir47sUxVd9IZMyv+6gk8Mv9IPPrY5nCF7h8nMmjZUKnfuwz1hKsZ4XMIMUyxROTirUc77KKMsZ/sJ9gG1V/h8sMt+35F1KrVz8jmtZPgs8vSlTVCfsc/P8eKPefoZ+9hxsgBlgYLhAWogtiWei/qv45SH+nTlT0nfjecJIxS4nJ3OayozKvCN0+h81aSVaOQHfqqTyMLaP5/DNFeXmDJHSfxaLBW8i8a12HxydBztMdj3D6O4PITRK6H3gk9FGteCA+N6IVD4NnfoP+zYkfZupov8ysoEt8QsbBDY1aYnluQ0OqA3Pv3IO+st5qjUX3Wr7qpWO54m6864wW1thpMSWzkzPpFafgO3+Ez3noKDbRJnOTN6F1Nlpp8/zG0GJ72RrMb7OwozDAttMjY9lVH8msfFOZloV9h5VjfPnJUL/icWI5wiR0/jccZEA6H4Q2uIfIA2RKJz1H3pUyJ1uWs1G1cCkuSEgeGmiLrRC649//7+Mob6ivUP8Saffs5ANiUA3+Xfj8rena79gyA1mfSmSk6SoMrn9j/0jlVpUIGWhinSg58vfBZw9GFeNdgn1Gq8Y11KpX0ZeDLK+C9iH5kvuxLvIMmGaSNIjN1vlO6LZ/8Ix5AMj1iaAkShZzSMa5/AtFebVSFknoAcqVNRWcP4S+3HKZ6G0F68qg8pKE7gdNCJ0MChL6U39JLDNxIvz/6RQ1XJkRfDvXTmq233BjBgRJ3EaitfSYUng9vs+9sZlmjO9S9afhu7b/aJZ2UdeTxg/q51EBm9DhO9dTv+w0wAgtN+4qkM82uhE6hktlzlWeFspAy4FhUEFzF8sRGqHzfLSJw0CON5JzRZAh860/XRUwwwn+wv+uGLP4noRq7IindXVUMQ9xm6iaETrkdxW1XiY7ADPO+8mke68boUNeb2FttKtGZvB5VDX0UaVgYr7sOVZmtzoJfUizZonnPqVwYSsD0r5ihSFwFf2SJFuUoIyc/usuzwCpjwid+W1Ylt8PJ0u3ft8SidL5ZmcsV3g1zb6VrVpJ6OGUzTx3rI7bZy8ygz6wK6GaccwrSFhcSeh+0JTQcWLSH46rhY+DQJ5mK+hWG3pWCJf4YDydV/GdtQOEaejp/EuRbAWtyenApKPpLWvoeDRQe7WGO+UwXDV0eN9HUIOnZakdSIk2ELq9hZkpHItGKsx3Nsq7lUmfLISQVJKatSOmTHzWTXtqSuiq7mboVGKLIFcNHT5/a5OJ6lKQ+WN0W72FyQzbDRZj5A68alwcEW4g1IO9y6HkU/C+u/n5oLAI9TWRNk/Yr0hQn3m/5W4fweEiHPpEYEJn/dLf1TVJ6AGLR4/Nsse/OKFa20hbtrD1HuNxzrPhhIeWhO4HjQmdNRSZoJBgAwVlwIHKIjg9EUtPjON73c6u+5XQHS134phEtjiN28I+Fk8V7YZtltCKM27tNheETuVizriQmMctPn03LbP5sUZ9gH+OW+zQd59ibnx9y7K11EeEzvtK1notlGdX0EmX90tJ6F7Gd+iELhrInYxHfF7LJ9w5X3d05rgXhFEeSeh+4IHQWZqtEqa9xUvJwg63Ot1oVQfPku1IaPi7Y+PHVW2r9TOhM0cdSv4Q6HgPuYdtrcxL3DImEbDw/7ULgFK8jnY/Rxq604/sLXx6Zk6TzmPP1xu4dFsvaz0aG6c2AjXbsvy6nqovJldxCLnqdcqjlyq33oV+7H1XpOSEpNXJbhQz7Nsy3wndWYSaS3kkNt914f1AMWybHUnojUg0fEIX84G2+I3XMnJPf7FMoSDWMwgkofuBd0KvIFac7HAFRw3jJsv8TJQaTCFxFupq82T7Hc94NetXVYWhpNZ/hC76j/9Lo5Uxj2luy7pC9mhESOwbZj0NwrkhdEaAeM5cLLO7qqWoYjwOnz3JjCmJq936/QfKTYz/im7RubjFLvNgVj8ELjubr5Sj0I9ZPb1sz5PJzElFct6fyBXnvYZuX1tTrDNDuPLEbzg8Ue1W2RskoQctHwW7m64VDwMZPhFvIkc+L0OdLibfDnBuXlEKSeg+4J3Q7cZjsbDxLPJPsbT+QYwdPqoYqahayEM+n4XPb0FiQUOmupMyJ0XVwrCPrKP3J6Hb38ua7xirG7LUPvooEeMyRb8R/v/JqKqfhFeG4PeVUI8PQYe9EuWerCVid2KcE0I3SbQ2KO8N+DxM3odilK24kn85XoeMZvRPoa1FXXeifHtPNW+vHpyCM52vEENM1/C3qP2b3CsZXlk7N6EUJkdzRiqmmePxjL4ayv8dKN99JGAIHhG4eEGztRLVuAKt9sey5gnYJ5JZ81j8PakY2UjtpDGfCJ3U5VC1uGdcM26nYymUa2t3Da9Y62PSlYQetHy15TSnmgRvYZEniw9HNeN15MuS0OcQLRA6JVRyv/bqxUv0xSyHGqGkUlODUZggoaHvoXca653Lk6tK13MHKLwB+4zQqWV/bOVeUN/1yTqGKPZ1ENXcjPfzIw3qHh03xyCvG7CtGrbnHG2503oYn49U7VCIv48ki6+C/vPvOndiS7wcYznraLvv8EhxGkaKM59ymwBihJjNEsh5dzRjnCnWoboMR2cmXwCy/jxMBNNxEpynhtS5H4BHkUToV5tOZvOG0B3Xr7gQDR5Klfdx6Jc+A7RIQg9aPgH2Yg3G2Y31Fte2dq6aHxTrFwYkofuBR0K3yVQzfoCEzb5M3GdiI/IkuulEL0HQGW6od7ZGNRxC+MvweZ5vPxG6/R3FNOtttWOZ2Q2B67gzG+66tFr29qJoNP/MeJPwlp0mdN5+cdX6kVgHm4yZe16+wMMtPxjIrhMzzwu04TXVsoTnv5ly3+kg16Kg/E/G05QARf/xohxJXnbUuUIBr+LEXQz3SJsSd6XWWawci8S86vXJXid0TuZoxwDj9H7aRgF9ufP+qBlex3cVJKEHLZ9bWdE+wq2f8h0qGIPXHJjL7RF2GSSh+4EnK3c+EZuXR/h1ocade4CTMzqcgMnuLtYhKidD+yyUxhXvR0K3fSmr5kWu8qfb7LgCXo9yoXKyY167gk+2WKeYZl5Rd0HVWUKnBk+a8URiaeGgCH1h3fbjdYB6f9vtTiyXJU6M+Bxvs1TK2Ad3htwnc72EskSPe8J3Gg3qBbZPAs06pY6WQuQB79uaSJh7i/2uDnqd0Ad420TV4r64wxaCMVzV+Dbfg/nL4CxzS+gU/Dzd+n5VedkumTmLx1TkyZC22u03S0L3geaETrYVYWJ9mFueeu3YfDJMZM1J2vGqBj0jK2isdaLv934hdJt4j139PKjrXfQ7FTJCBz0laqxFIxY5uyONYZcFt59V3H520XI7SOjOotC4nH6l8eC3r52lJ3S3oB98MQjyORufyzENIaEVj0u69DX7/Zp5vij7VmQJ4+AC97qxqFJsp6lJvwyX0HlEK804EfNdu3btEE6EYaaqHQfSbuhrH49EggZkqU70PNYYod1Qhk+de0Jnd9O1wstAntvZvDZDxx8ZT2eL9QoTktD9oAmhOxOn8VV8zk/DYcQyaJB/uWg4rHHMXSluUBHpH0JHueBPcr3KZSKxB6xm/F2P3Q8AACAASURBVE2sj1fYk4dq/rBu23aK0Fk/iinmJ/G5ZoTK88PJnYXmnHXLr5rQgdg+Q43hKjR63s/geWuUVtE7WdjtmjMSCZeJxdlp8lS3XtXQ6e0BaPNYuvAR6FOPsUVMOGTu2NT8B4+LxHd6hyT0oOVrVGYYu29l8+80vXNubj06ld+vXe+WhO4HzXy5swkcrXjxuVY7taMpmp92n2jpNijXbhD9Ruhoqe5mScpXwTFmcNLqFqQ9eaSN48ZctkU7rqHTMrzZS9sJ+R3lZj1dTeg8UEyc2A1UllnQoG8SZNjyYMbvwntvrS4PloVtFV9Axdc4xC1pk1A1dAtvPbzvqPH8a2mkt4kjw0pkMoX+HFcLp+K4g3fey64VBnIy5UpO2J6a+UUv/cMdktCDlq8BSPyEmFL4fTJnsfgH+mqxTmFDErofePDljvdCYdJ4MfuGLy0xruQnXLdO7a1Qeq6J6DdCh/ef5n6Hl535+lxM8bZdrBReD/k9NZeuX22ZKcbJXuoibHMPeyF0x/+++Y/qM11hl+nHvuRYIRPjZ9X1sydWVf+zh5xCJnSnr3DHOOEmo8R9AzDfEbzuoZG53Sc1cxoXJFTcfs5jJaEHLV8D0H6bMPdGr4Cx8cKr+ZhrFySh+0FDQqf3QuGzbalU/tnsG74IHTVwdse0wlJYMIRZw7/Tb4SORkAp92AIZEEVzVh+Jznmm9l6MdThQXZGPy8J3blCBRp0zRY9uotdg3YgX8Fn/ExEQj/+arUFvX0FUzVuEGwD6o2TNhF6O5PohTD8stpXnzTzsiayawJJ6EHL1wTVUQ7b+j5J6H7gTUN/uM593aawJ8KMeazrxMyvH7VA6FHvmlZPEDpo4O+u42WLdMKoao55rG8VmIaeLbwS8nq0GzR0vnALn9CnmMcy40ZXDR2PezTzXPpsq9bT4uRi/MBNQyeGeKpxlfCVThN6swhwQVLICwSXyRbHC4wbL32jQStJQm8/BvgV03a/SBK6HzQ/Qyc/Uaj08dYa0r6vmgEt1O0Mnd1Fj+es4/l3mhN6oSVCxzJAfjd3K6HHVKvoIhvhPaanc+dqOOWxxPLMS0K3b1Soxu+ryxzSxMf9W1/tmj+14L/UQ/49qKG3L6GBFQ31a51HxROEKCShBy1fN0ESuh80s3JXWEg8rfjf+Jzfu6HQ6X7nRg78J/f4xcrykjiJ3ORO6NAoF+FzXgkdvbBBnvdUbzl3C6EncpMp4Z5+BeEyL0xejK1qIDiG+FRdo7t5Quh5e7fDPNvFqQz36LYjqeZfRd9QbtkD2WIgCpBlDVEIDlHITZCOWrn3clLokR70p3uSSd4uktC9JknoktBr0eweunM+eKuqFvdk3/IkCGe73YiiwYtLg5QY8d2Dd7H59xoSOiWFv7LCNx78NjGZh8crHSKw988tofP3kDueqvmwywREnLHgPfJRxTyECdXrpELvC2eOewHksTnp5ulpHhF6LvdOfg/9ZLfjC/ucVjGnqOyHPZ+j206SNPOT7nnrJFAR+lvwUDdJ6Lxv231CL3qQmwdIQg9avm6CJHQ/aMlTnHE6PuvBwxZvDHgmvxAG1hWu16YcYxiyVck7ezqtvyjuOiB1doXOuI+7QG1UDj5pJ1XrA3WsyOfeUxyf4DXzL/VvAUzaMopMRbycX9nevJKa9aW67TqPCJ3vduBkjt7oXCJEUS1dMx8dY4sjL0567D6UnjgSvr/DxUFPKUFDvz7uaP+dvLbWq4nFtWfX1HCeaNYWzSEJPWj5ugmS0P2ghfCpiWyxFFWoFiJ6kIo41o8DwmcEMNl914Nv77fgs3yCRYv6hKpvTGZrA5U42+7Gu/BZutVaG6KS5zVMXYG65tUNhG47UCGLDvdIa451v/FlXkbnu2Vb9twXunDMcRpzOjLn8dDbbxTnuMOFwX95XY9uOXSIYf17JGXtX9kGfAGKqaJv45XLlyc181Y316+0XqQP/4INqM4GZ+nFpFAyZ0dJgtyDQhJ60PJ1EySh+0FL8dDNEguJ+kmRAKtypNGyUsfvD9+5lJGvazxqSnrmdif2sT2pYrAStzN39j0SYONh3MoX6jBAv+/kgQEDoCNcSOvlNmnOPaHzSQi1OyjrI/ViDzuEaJwfVY/ft5HsMfRkLKN/nh2VzNYbBPON0J3vUPevdaNDEe975jpo90QdOdqfEacqmrmpcYAhsoOywku9Iv1N6CVbM1eNXzaYQ3xCEnrQ8nUTJKH7QWvx0Et2HGlFvw215ERaPzS1wtgntnLlXqll+f1wkoyphS9AAzxYL3oYnZB1OiGrxU/h+3lHF+4Tn163PIpeYsY0QOr6e5wFATeCOwVDkS6FZ//JHH7UmTC7gdAryKtBDO8Kf+T3wu+fQTemWPdUPv9sbINoRj8ioRT+G76/kQXTmWk0AOYboYvfh+/9oZ6fcXLNjPjHt3bD7xdGFX05auHocpREqcO47Iq1EvrWxYlscTpRx8WpbbSoWb8S+18T9CWh48LHvj6oGj+D9uLjLcTrT5LQg5avmyAJ3Q9aI3QiGD4hpqirxt1oQQ6fb8FJHia30hgJJ2mW6pI5M7SDZzcMp1bsw0oyQIvjNGJCNetrlxjXWjNn6eLCfAga6p/xjP5H+Pxv8PudkH9prE4sdid1B6FH7F0Na3/odHczwnTfJoc8UMY0ZCfIBzoolh+e346Gh0T2WdubV8POPz8Jne14ZK0jSZhU1s51CIb0H7roMx7FY56EamzA31HrZnYjdVyckv5XjmetxzEAjii3Jug3Qi/hAhV39pgB3OciwhGdB3m1AEnoQcvXTZCE7gee46HXxsLlpEHCR2aZf1/hc3fBkqtZ3HL+GFqE2jNw/Afy/XUjLR81dUpwJpmUeeKEJpS5joOMriF08UaAJZBo3cUMrZ8xWyF7Mnka07W2Au5uOucnoTvfjarG2x0PfK6xukt2P8EoX0RrJwFCWP+pf/xk2zUoxpu81Kemb/cBoRMZsl2MuGY8OKrkJwRZtS3UpyT0+QFJ6H7gkdBR4613Fl7l+7mRUPHvzLrV+BC+122Q8IYcVSfi0AjT8eYeqzjB0UmYTv4l2unxd3NWiJIlpO4hdFZz7o3sM4xodzerd7XfbTe5sMVT7YQwTwldlCXI5dP0aMd1oVPRF8jf6TONdoYw/jOLHKd/UuyvHjHvCZ0tkmaSOdwlmyxHM4VL0Vuh0K5tmkgloQctXzdBErofeHH9qhqPQvrNGNd2Wo+yVKLnwuYsvT5W+Ax7ed2JkDdmPGN+jJIqkltr78WyMq3rbtySriXZbiN0oRPDM5SIzEaaYoPBTokJF2IJVf8DBtiZ365fa525OJq6/gl69c8qsVsEPiYF3KInW8eMpPSPsbe0OsnPT0JnZ+TsOK3E7Gz+HWVjJMKusLYoqxYhCT1o+boJktD9gAsto19MLXmNXba2y65QIRnA5H0gENU5S5avYaET7S3tRgKe5XkxY66nR5X8W/F9XgbHVEQgN3pnlUyqTRYUJXo+qk9T6+PiY7HxggZl+Bu7drTb2U7VdzNy2uhG6PD3D9OrZPrT4g4AygjzitYh9FHFSOF9ZTrBVX0PZZzRP99ABjY5jmby74Hy7aLHDuwoo8liir8LzyxxMYKLJzSW45NtVZl2shsA51aUx/FbfhULO1rVJ0jd7nUjdCjDW2r6kSCzmFpY46X9RUIniyOh3eyy0+OYs/C5et7ZnDbRJ6Dc9zNtfdbpA40nAeFoaZb0QcW4L64UTvBShzqYD4Ruy4XNAyQqIPQl7pP9WnQWw8cUnZjb7/tbEvr8IihJ6D7AhZbMrfrF+DGnluEnIV+WiIFbcunkzliu8Gp8DibGd8NAeRQnN7INL253s4hMjCzJ4CaBV7IW+mz/3eKcfijm0crAEBr1reS9S1fT/FS98r3OBF3CrT46ceu38khlQDI3L1lxMtRvctauH/y+ZPnJWD9XDR2e+Ujm2DfDs5O7BZkQGY2vOAWNAl0JPZW1lmB0LyK/qu+lj3kT/qyrofMyCBrvUVFF/ysa+NEJ07TtFMS682MGbBOqdZsP8NjjSW3ViFAWu0zJpaum0ytJeVw1dJDL3936BNYN5Aga+qk1hA7feWu69ju2zJLZ1Wu89AF74lu+ehjbbUxsN6HsqaWrKjR0/B7+zhM6hsnlcnvQZ6z9oU98Gz3vpUi/pP3XlqfQf/lE6/Ql80mQ5zdH06teinlhnpi3+C6P/domdHjHNuqopmax0pVJPMrCxZndFlnc+dC3xhTzXFzMOnLgfhE6BcdFL+4qEtKrXVR7S/b38BgmfELH45o6C99W0i6mpPyBZT+vCKqC0DnPBGhPahujbx/N55/JXjGv5MXB7n3r70YtPZ7RfwS/n0eT8WMQwE/g9+8Ld5+Jow147lMxvLqmWmSViAMbJz5M+P8kMUzTt8cyxvmxtDnuvK71QeEQZeGVkN8XoIE2kcWC8F7HWtncBQR4HUyS7+AhX3HiRU0VJp0LQLv6cUX9MsbPIH1ZDKnpGKgVjo1njEuhHj90vgNJJTK6qDZgDdcQCq+Hv/8U8xe/B/L9EZTj51AGkz7eWGuxFwrobS+j57D88M77yWRaWfdSkt6tRi38ZkhTyezxPH59JJExD3DK4pSJ1esXcbVwalV5+B3s07GerL7nCd//KXznnIqQuuy7CaWQgXJW9SNHZlF1YsxL3cX7+bTd3GRp/Jxr/B7PsQdo+8CErxhnQD+5EfsLN6a0++/SyRINwWrsxGdw8sX4z2IeAWATOrTZ3anluPCrXKx0ZSJjusi1nCfw2ir05csTivFRjAYo9AVSx/aeldcB6wNjy9e8BhZ8j+PCtnpR3UKyvxfLUn8XYRI6tPkZbHE/47dN+CIZ2mZea+gY52PMaUuf7TlZwrEG/eI+9NPBXjGv5OUPQqfGO7swQb8xljELeB8cJu1PwET5EUhvwvvoiYS5t/DNBT7ieYuwJwjmSW5xVDFOhknlI+S9GfM9sUzxxESmcJCw/ToQ8J1zD5S3UIdUasU+sXQhiTKG9FFYuZ6OuyZR1TopPq6/gbtAjQhacz8hqho6LJhOw61/3NWhOzuFtVGl8C5cbNCnaGAWXMQRbY7eOX8n9iOSFOO0eNo4Bv8m+Hwn34E+l41m9P8S88ff8Z1AbPmIx0kCPRxCX12LfgOAHN8H339/N6YoKZtxWlSZgLGmryTaEruz71KnhXPc52i7KvnnYnvG0voHg8tWf1+1n4tgoH0PnWJB2380oRbeG6RsOP9BXieGV76uAh1zanHfMNqR+OiA8doX86LoytUtVT3ueSst5EHu9b01GkKL9avIp8F36sa89vm9usDvedVC6Tsqook1LE+9fDsss4b18VB2uthbuvqmzDG4Fb+a2BBgSi1dM6OsfDN+dgl5xtke9+QIRqxvaumq32ZIXmtmxPzxnfD71eL3Wqxnz4H3Dydug4SERC/D9ntdfZboQiqhvpdPJrVnmPN+crEJprruPb8bEQj8mppxOTnuUfWn6e0ESIq+kwZmMW7mUdkigiOjevKs9O/OXAmr+m3MjmEnzx/fhVv0MdW4WCxLM1S/s5tT5QKq68fYQJh1j7SnrgvCbJs2lK+bEHZ7SkhIdDMcK3vza27x0KstlltZ/NgGeqoZT7hY2wrx0L+Ez8lJQ0JCQkJCwic4ica14iq360D4f7Rsx+h/4vOt5W3+uH48dGKUSIwd+0BjkpCQkJCQaBeYlX3GPABIe4fLHWTyOzqGiTOXw+LNhjoQfRIc7+YsKO7EWX8kqa15mVgWCQkJCQkJCV+gNhvxrFnHjbHO4g6Y90UzE8Q/AW69owbunA1PLeCf8SuWxCJZMx9kDm5qvP8xp0kXRmiGkswlJCQkJCSCwD7rzug55nDDNcoaIXXNfAyvjU010KaR1KMZ4+2JrPV4/Qh41EtaXNNVsQwSEhISEhISwcAi9ZmXjfHYA66kbs4yP/U3gAb+ATSWi46br4grky9PaoVYTNU/iE560L0sOk+KKbXR2px46Ny6vastvyUkJCQkJHoJVONGh0fox5+7ynXRrGdZRDDiHY5q4MZOTI7L4mJZcHla+X26KMCwtQ9FUye8jr5abrdLSEhISEiEBtt1r1pYQ7Vw01XD5mfgPF66cyVNJ9EB6wfOwMWASaPHaYYlvlNCQkJCQkIiRDj30jFi3irm5755dLVm0ZzoObo5w7bz3yu+S0JCQkJCQqINEDT192JgERYVDM/U/YQrpSF5s0UMyTuD/tzFd/QwbE94EhISEhISXQtHUy8sjSv6nejRLaGZ4pZ6A43cCdGL36FhaY3NPW7RPsBdzla6ZqZX9eYkSpqEhISEhIQX2IFVUsY+UcU4E8j8ETSES+Ym+bn5rB0L3Y6JTo3exuAZRuSPwGefHdXyzxfz7CW4l7nspqHPTfhTCQkJiSYggVzCSHNdEQn/EAlqNL3qpXHFxJCKV0N6DLfRUyS2vJOIhbtqPAok/jdYALwHfr6E5gT9oNf6Qrlsx6uPrTxlL6j7CVDvs+OK8btYRv87kYNq/grq++WYMrFseMUKEi9aRlGTkJCQkOhW1ITfPSpZeFlU1dNA2kUgtncDyb0rltaLI2lzfCRl7S8+2+YIgm0CJXJ0YYsx26GeW9E6P7VsdYlfzcOEv+Nn+DvIYUNCMU4Woqr11gJGQkJi3oFMvEeAZhXVCrFRzRhZrOqL/Sb8vhB6U6KnwV27eouH3sYQmm0F31UaTedfCiT9f8R+IFss4XECtyGoSOQzfRYNCKkVv/7L4ZSxD8tMkrqEhMTcQLi29KmU4zGs5CPN8vvKcW3iMJK5nNzmEZx46NUp0oMk7sAJVhNXzTvoGKCE3cyinxI+CwmrGtcPJ49/sZinhISEREdhX1lSjM+4hbxsIZVsZyKqeTjmKc/TJboc1P1twtw7rlk30EA1+u6W+z18B40HYUFw1aGquqeYt4SEhETH4Gjo5qfD0NAhzUhCl+gN0P4Jff97RMtuncxFbX13atkaJPWvkZxl35eQkOg0pIYu0Y9wIs6ZSiJbL0Jcy/2/BHlNJzVjBPOW/V9CQqKjkIQu0ZdgfTOpmRe6x4T3o6XTmO/JrPU9+grZ/yUkJDoISegSfQhyvg3E++KEZj3MnOY09E3vLWHgGhJD/q4Ut3qXZ+kSEhKdgiR0iX6D3edzxjJyn1zVmwabaYXUyZ111RwT3yUhISHRdkhCl+g3sPvyoKGbb0VDNhaIJgQyd7bdE1lzEt8hCV1CQqJjkIQu0W/ghJ5QjI+idTu72REuoWvG2/AdktAlJCQ6BknoEv0GTujowrZdGnoya70J3yEJXUJComOQhC7Rb7A1dLWoj+XCsXCvIPTcZDmp6MvxHZLQJSQkOgZJ6BJ9B9Yvo2rxjXHV3FXZfwMlyMNEK/cdiUzhIPFdEhISEm2HJHSJPgS/SrYAyPfaZK4YhmMZWzuPa+afq94jISEh0X5IQpfoR9guj7PWW9APexiGcbZBnGoVxXdISEhIdASS0CX6FER7TqVWPwO09OuToFkHOUtHwzrMI6FZV8KoWii+Q0JCQqIjkIQu0bdg/TOWMaKJbPHxuGb66v/4HeohznpkcfrEQ8W8JSQkJDoGSegS/Qze/6PpQh4IGYm5FFX06bg3I7kS0cyzRSTzJxMZPSfmKSEhIdFRSEKX6HfYpK7oy+Oq9QA5U1cwDLAxTccDMZhj7mGhf7O/xVVzBh3TJDTz7sWZwhIxLwkJCYmOQxK6hERFONUDYAz8HLV1JPYxei6OpE1T1sLPSvg3+P/umKL/ZCRn7S/mISEhITEnkIQuIWEDxwIxZItmrKNjqv4V6M//hH59b1zRn4CfO4DAt4Mmf3U8Uzgzrk0cxr43IM/MJSQk5hyS0CUkREwtEPstjo9MZvIFyspTXkLCrSbMvcW/4+/lcllas0tISMw9JKFLSLgA+i5zEetG1gP4N9m/JSQkugqS0CUkGmKAJuzLpD9LbVxCQqI7IQldQkJCQkKiLZhagCQrJmJwgwnP6tjvSJb877j9x4i5Ze1BErqNAVGWNbJvk/x7FmxLmtd9isnEm5zkmbOERF1MVXLAVJM5SI6r7sKAQAhh59e0gfuY0G0Cj4RLxC3Jv4cQ9rkx5DfVTefQAyElid5Hp/tCmGNrgM5p8nioo7A1wApMLRhNFQ9EBxexjP6emKp/Pa4ZF8YV/cqYUrgmrhauxZ/w+d+BOH8L6Tz4/bPRTGFtPFNYsjh96ouqXsMat/7Krc8IfcBd7pEIWi/HlYnRqGroIPMPRdXCOXGtALI3/kRkzuUPsof0V6jnJdBO34lp+hT8vxgdL8aOzky+oDrfeu/rFVANIVLRjgfn84uOHtffENWM46DuH4yq+jdiqnExyOTPtG8a1+J1L/w9oep/gJ8/ATmeCX3rTYsz1pJotLhv1WvESUii8xgQdwb5zgtNUz2dIl1NalTm4icHH5xftDitHzqq5CdgvHwkBnMMjKdL4eff6NhiHAD/h88vwbEXVwrvJ06RlMmXV71goJfnnp6AvYXCMJKznhNNG8dB45wDDXgLTHxPYZAHdFyBBIvRm9C5RU1if8NnqLcqqwSN/AjkAQ2tfwIm0sVM+0QM1NMY+4TQa+ofi63cK6ZaWkwxPwsy/wvI7gH0/EVl2kT2FfJfzeRvzsLC60EgtitAhmdEVXMMA3/w9/HtsTmpvQ+wstrtN5rOv3RUNU+F+p0P9dsMdd01tnSS1N2W1VIP/TTL+qlq/hUmo0+Mpo0RoZ/WvLczwOOD1c8II0W6mkAcVGznSlQgl8vtEbQfjI7mn8kWFC4oV8xHqdSxz4PxBARu/hDGxiaYQ3fzuWWsCQfwcYX/ByUQfSVci/PPaHriyIgzjnpq7ukJ2GeMDOiUAojkq9CAdzECL2FcZhogAknRmOauJxsm+zm9hB6txkheq4BYzRJ0kuvhHacllpt74zvxvmx1w85zQq8YOMPDa4eARNJQx+/GM4W70esXDIYS8QYGv2P5K2XqUfY09KYgf7LAwgG2DlbVn0ukrYN5gar7QffBtuaOINHG1IJGd4mMHWM5MoGUqKxMX7KicjJtOWE/hb57E2oZeM+bFaLuAjRM2N7hNFhQK8Y2uqDWb/OVVOM/8HNTTDPHxby7CfV2i5CAkmr+VaPqRDyuFUyyO6gY/4M7hNA234S6fauXEvSvc6H830koxlkZZ9esWV8if0cFC/rCVZDWszZtuS+wfnQn9OkvkZzF8U5/J/9PZE44AMbEF0DG97B5u5RsdR5y5v9ZHFdJZ1zNEC0eFgqo9dvv7uq5p1cgTE4Y2QkE/Ut0G2lP/ArxFb2b/SzFvQWGcCFUveT4mTagc0yWxghJ69vjGf3DsZWn7EWL45Rn3hI6N2jDukG9QQZvReLAAYP1RLmzMu9m/rr9yr1G/pgnDKQSBu0gbayau2CSvCwJWrtTvK47YxcXewNxxTwBFj3XYh2wD/FIZLRv2f3Ubz8R+imRU4n6T9cfRu9sSa3wMlKKNk9AvL6wkD51yfKToU8UZ7C+vpJmzVJXsdbxYt5dgJrFEWqPZB5S9Q8CcV1CFyT6U6StqzS/Hk2lJcvXYB2e1I5dQ/tS8+McIh88NoMF64O4eIW5ouSnL2A/Iv0pa11E3sz6sL2ABAUrquj/C+PgcTI/ZK3QxhbNhwYX4po85HsDbsnb9ZSk7hOCRrw4W3gl+n1GH9FkglQNooXHKYn7JZGGia/icJsTOzquOnnD0nI528DziNBtmcPPRUjkUO/NWDeYuEt896Odcrflwd+FgwvfD5M+vP+yqFp8I5dPl2jrtsyi6sQbYfHxR5wIUF5iHdolJ7ufaibtp5rxSDSjfwyJB8vULnLk+cY1/RSsL9R1N+kXfhJGXSM+343j2lnmFlC1rZsaRDsbKOs3oA9upL7q6XYukhDuuNiBZ1x2oHopkQU1GX/GYynmZ9+DBTj5+6h26vNBRvcnUB44F/rrD7vJrp+qX4B5Csa3kahiZKFsW1g/52OrHXORPa74Qg3a/acw9+zLy9SebjdvgRM17UQxpfA20HAeZVvhM4w02zVB1hI7WzygJoRbMjCwzxkeXvEsLNvw2rVDtIy9T+giQeIZNgzIG8bICrhod+5OybymDcj79VnaB6yd8PtneRvM8eDi/XQgOl54P0z0T42xfjAH8ioxYp9lEc9ugTLFBBmFuqNhE7pqnjoWrO+Tfk+JUZ9zDV20Q0BtMJ7W32HvThE7BiwnnRN4v+zkfNSJfoTbzzD+n0hqXEP3RuiooUMbPijs4Pka60RpU4wLMU+bzGGRinMR9hOuRXdCHnxxRrfijTtlZMAW4Wg7xX2h4X7BIjPNdrIR6yTasMtIw141Yq9eyaKjpwmdy3x4xYpn4dkV7kokyarUnrDmepKhg0sIuwn/vyGm5g8Xy99Z0Pah54b6RbRM1pwufJw+BBpvjmxl745lCh9gBQ71Ks58I3RxQYuGVlGl8N/Q9+9MUS0cx+csP2+Nzy8Cr07dQeiqfhFrmAXw2VmEUDVzeq7mIzKm8EggW9wVUwtrsGiS1JuAr8ZG0/kRaLxNRNPozBav585OtoToOfK6aGqCbP9GFePMgJPanBG6vYBKGa+LKeZ1SEzwswuIqb6scHCN5XBwmU+MZiZWCfXo0Lk6bZtk9vgXA6H9gy0wcKuyW/op64t08QOT4A8PzOX2QPmEFQxlPhG6aP8wmjFW0WMmfqvA6Piu4FyPr24gdLzKiXmi8fOSZWv4+JrTNqCLCWuGWsUX3ovlE2+ZSAiwz6MzhWOhQzwubK3MdQevbVhCKBjruXgn7iREM4XT6cTZW4Ruk3mmsAImr4fYWdFc74R4Hviw6JtlZHKGILN2kzrJP5HIvxD66Q10Z6Y7+ylrx91swXE5P1cPwyvWPCF02/4hkSkcROwfcLHOiJwZWc11G3a8z8w1oTMjT7yG9lYyr9Kz8rmWs8t/DQAAIABJREFUCysfGgCbM9RuxDgN6y019SrYmjloWzCYpum98K7VEGnDQiejFszW39CBASNDvxNAxwmdyzyWLqxBy1J2F7+rZV6b6A0Hsh2n6N+gNWsrqdtX+GDS+x177+65l0NTOVEZqdYvhfv9gWTU64QubrHHlIk3JVTzMcf+oS+JnKc5JfQ4u8KKd8qTmvUw3hAJkFfbZARpNolzJiigWHdJ6gz2xJDRVyeyRRhI5myvDCh6f9Eq4dWqEDpIuVOEzskcyOjd9P6+0TMyryM7roWeQ2vYHlK3tTnV/Bx9Xy+QOU9A6svWlJOa+WNWnUD9q5cJneevqsU9o4r+fXTqQ+x0ulyJ6NR4mmNCJ4nl0bX2Cmzux+t598XG86+lYuiKWzdzB3vLNz1xHGrmca13yFxs2BA6XccI3SYlxXwz2TZSe5rMRfntXkK3574s1jM0cG0uayXj2Ff9+zyYu76q6sxa1/xYUBn1KqHzvI9KFl6WUI2/O1u6PT8GQhtL3UDo8R4YX+ToldhTmb+LdJdfjM7DOTM3oknN2iE4iZnzhvLZ+UL4fnsJXZD5ibCAQlnPMqcwcy2/kAYYXi8hBjUfEOsbAvhgHQC5/d8YuwEw1/X12c9Qs5iNa7oaREa9SOiiASiU+w5mTd1Duyyd6SNdQug9kbgRX0Iz3tbOvtvl4GdX+ksSqrmeGMD15gQZ2iCiP9tH6I4B3MTRQEqPJpib3C6oe9hynE1Sn+crxXqHITvI+xg8ouhluWHZsQ4w6f4Hg+qwKvoOHdwzhG73f/0I6Pt3k2uZXWp0O8dJEnqLfRe91UGdt0TV4/cV5dFPIM440EiHXlHo+4HVbkKnxlypFfvAYP1PBxdQJbqVKab2DnRytoU+nTVz+1EZ8wBa/aCypBMakNcv8Ly1PbLTydEHT/F23ndWjF3Uy5lFDQl99LWeInRWv6MyJxyQyJqbJJk3TJLQW0zcMh/q/dG29N9uhu0DWjU+MLY00FUv3x22Ks15h4i3m9BZXgnVPI/e7W/XZKZXe9Aixi2ViQXQqfS/HPoAY74Cfh0JHGubyQ4WB7BIeDxkq9tSZXCIopOIX2sn2FA8hDvuXO7U//uqclTVfyVGFWxFKj1E6PSaYY5cM7y5h49LOpV6kdDt+Aauqe1+BLD/kvltw7CSf64ok3kOOjlitDS8a972KwmKYUdei9sEY1Yk9lyp6rlOE33bCN3ealcKk22azEpcbiRimhCykJxPYlhURb+fpsIDsYy+E53C8OcYac3EQy4XN1gBwnmHKIdWYd8ICIW4hPKhvEB21E8+8YX+GKTbQQ7/hr/fDOVfh585EejMUgC/8GTCw2s2zMbg1kRaPynIzkWPELrji10zL0/J3UBPfaVHCF0MplXmgZBo+GYnOf72qY1NuxZztkMczbBC7sNdDbpazlq/auNKWQhYYdmNnMxR7RAmSYx7+wikR8kkikZCWeG5rCVqRZ0i9nYROpH34rT+IpDFVhq6MzyNmMm5RKIr0Xv4WyH/84C03xlLm+OLlcLrMRb40an8fpiGk8e/+OhM4aAk8RWvvxsI/ufw/fvpoJss2dvNoZRPL9FFm3VvdPyEVzB5+N5aBvL9ru25MLDckMAm0TXrUyivZFZfDiv7lx944Dv3YG02gE5g8DMMSAHPnw3fu58SEgnt6LVfskWAOcuu9d0F73uH42DGvxbRC4RuG4FqLNZC58i8ehewW3YCPZW92wmd9bVZGt2OOHjZRcKuqvqvoL9/F/rkN+Dv52AYWPjsl9DuN8P/d3JFg84x4e4MCsZxlxCJdEfgqPZBuMObD+iEpYFQiR9r2tA54sHrfiCXi2MZ4wPxdGEpEsxw1noxEhxPo1r+QBbn+22QfgBEs8UOe8kWB50YRPRnuIQuyPzLzPtSWHUhcqHe8ixY9RYui6uFpYeqxT1bLePRmeNegBG7QO43sm3y0GROnf8QhyrfCCrTmGZeR20PgvVb/D7ZvdCMG6H/HcqybzRhkr+hwU0U/ewTJ0AkDnqjCbNkT3r0mtqj0Lc+cchyagSHcghKmt1O6M7OlL6cxclu586brUSI27v2DmDV3ztpVNkwHnidGOHkuz6irXWA0Et8/CRo9MUrIL05Nl54NXNt7Ap0BIXP0OiR+tUkGmKWRo8Ms2xEgVDNh1uQW8+CVOwVqdQzoCFuDGNirGloHpAiS8JWXplQdCOVWv088f1egNpLEsP0KfpFUNadwk5COwdh+ITOz81z+qFxzXyChngMPshou5nM37L+52Q6PyLKGCdSngQHL0KiZEL+Lkzc+H/0FAh538V8OYexQ8K+b+5E62YfciV1IgFYVOOeoDscVDMnFuY3c4tY3A6msnIb/IKs7JshxjIoxyP1rnkyudEAF1nzaVhsfdOZYGwin++uX20jUOj7d7RhvqFzDiNAnMh5LHR2jMSOoYwnUHuMsxDAPCUrYni3V3sX3+sxkTC8oBA9Ob7sFLaz5T0eersIvWLeUfS/glwTNaWAsY3jSUyR2r40gN7dYuzaYphuZe3FhmroIfXj7oQz+K3VYZ5DksQamm2H/gsnvIqXs0Z2JkWcOMVEJznS+M5kT48Gxs1h0O7/yM5iZ9oYJCZ0Qp+yDeGK3w3L+JAZb2EIw91xpfChMieGqUBEQf1p26Fbi/viYiqsfkItUFfhyvm7LcuVPTumGK/ByTkR1OZD4cRlEeJCzcG7mKYWDA8Pk+ej4/k02qBUlIfHb8YJJVtE7eUX4g5A2MFrupnQhbJ9rR1GoFzLRgWChvQ10P7h/+A9n02ohXxcmRjFhXRi6eRB0J/fCM8ehTsF8Yz+YWwX+H07XwDg0VA77FoYqd6N1zeT5NhmYhnuonlJ+GxSmciqzo7b3GrodDdqlvjOyOgfm+ILDHveaeoZcmCK8QBfnChK/rkYojVUuxgWjRPmmq+L/XC+YgAmoKuTIW63k3w0c5YFcvmc4KeaNV5wgomQ63X6OzDWdYKtrEMefELnD4vQGZnDhAIy35HQxHcEkjUGrng8njaOwfwd7TEUDIhtFlX1T7MVdFB5l+J0K+yxxcqa14jyaSpFvsgA7V5YyfuUo16i/UffjhbXvM6tCokvApBI+fUrbrnOAkb8Jc5iNiPE+N5homsJnbUZRmyEMbsrWJvV9iW6aCqS8MIg52txG5eFUvbclmgJHcuYx8J3L4PxuduWX4gKA98Nwi3pwDJtjjYSOiFzHDvTsbRexPc4Cpo/iPMMnrOHpzzgIo9437wqFKl2I5xrasU03bIMp6G5L13I84lRJT/B3xVmxxXPGqPjhRi86+52bd/xiS0MQrfPzjXrjJCiFZXIln3WfHo0o+cwb64thg0M7ymQxafDGGxOjGXjdFE+XuWY1Iox8TzUVzm4dq4YG4IGSHHa1/j5kuUnc0OfW6Np/aQpRt74TDvjAXQtods+A6xLQt0NFHYC0d4DNd98pKKc9vGILXsWAIbPI1VtQss5PnEYau3sKCY8bV3hDk+K29EwFd/FidBrinjvn+0jdL4wYTHI2YI2hJ2mqQXlMlXeYLH/+5CMtNnOiPlAYrl/p01dDXvgZ83vhTbAFG7BXHwsOq6nMX9GMO0Q3gAnL9zChPfeyS3hQ+mwFSQRCqETGaiquie6t6QkErSs9GwoptHVfio11e4YwAO8/lCH4Nvv/OxaNW+BSc0zmYruiWvbys9gN3Fx9cjibOGV5AU+25jLZlQzRkBD34hhHA/MvZMZBQU3ePOCbiR0e0dF1dNhkgq/MYM2NaCVf/zgfH4Re6Hfo6bqXcBIXCmcgB7siDFvSOe6jsMTcyqIXL3UB/8Jm9AFy/GzMP+wY49zeYwq5iHoYyLwkRr7Lt1671wY7E7CbmiYTO8K02k/bsGMqhNk67cDBGN3psXj5jDU4xHa+KH5QQ+N0G2tUjGyJJJaYKtsNqhU64di/u0H3zpd9VIYbHcyg7QA8qZb3kmVLgC91MO2Q4CFHOQRePvW2SkwP4X5koViwK3DVCr/bPbfgc61TXcSuu3ngnj0C88Gg9glaOZdsfSJSfKWEG4JCLDzQlfY8L7fh3U9krglpc6ctuJtEva+tig9+E+4hE7LDr9vEY6o2nZ05NwECthn7KMOass1r87RbXLJmseGdXZuT4qK+T7MO+xVWyPwd0VVQ2cTUNcSOl7VCqGDCne5Ta8Wr6FBcOryjqATNA3cggYr1ufFvBuD1hXv40Iej4a1gsdQnWiXwV4yEOCoaOD/t/clYJIVVbpZUAU9OszgMi6ooKNPfS2i2HZ35c3MSirvktVNs1uVd6nqQsRWZ/Q5IDg6PqmHooMO6ucowyCMo+JzYdQRt2EUceExOu4jI9p0Awo0TTeLIHTTW2W+c2K5NzK7lsyMuJm3qs//fdFVXVUZN+JE3PjjnDhxTq7HRC6RNUJX/R2gzn2qvHXWGk7m0c+L9pksjLCGb86CkPNx5crxI+DZnzLtFArrweuw/pTminFCl9aFkjd5gSof45CWQG/iZYUkDXb3m3bMaIiOcU7w6lTb3Q/EL70XXm5i18nvPrNrIV/BevthzpADBG240uAZnSlCZy8WXr1D87KuuV2+VIVqeLHa9x5CRPoa/2Mg4l/r9CdJShL+RNmUtOW9u2rTpiGYw3ew+8z6m1KeQAY3uLZ/7Vpn6n8297U8uBTMdFkj9ETTii4zs9bIK4bhb9QzaJMybIU8b8fvYR34vInYEUncg+j/pdh004TOg9t4wQMFZ/xY/ohU73TLXA03656lS093mfFxORF6EnbRDX9mwJmMazduuLsoruP0aeHjd5PL0bNhkd+ubwpO+qZN6E27zfjevNaZL4zdgyWv1m7EKONQiOPtZT3i4I59XvD4Wif4H6q8FgG/wugF3zAY3bCuxJvfnXf8L1huzYvPZpW+m75uZgoZI3Qmn5Vs4xdu1d94+dy5yYvuR6e1LtvULdicPOEE94klL/qugTknrUL1ghMNY90prJtGCT22wnrhv6TU3iYoZvdLdZ2IpSUQ5HCJWvcyQJLUAklYN257rC2Cto/19lNQSUjJ6CIj5y6GCF2xHrxWNyuYfKlKXngN1olaak547va4iGOOieORjHUC5MTaSjWaUOXVnkyjd5g72+RjLqOKlUW8acv1b7Wc8F2Y4vbgtqnxFPpP8FkidKUt6xS/ER1/C379yKmFWG+vtazYd8OuvRDWu52cILtXGmLnuGp0qSovgzBO6Hzz7r8+pfY2IX7HMRiZoaM9+HpZL9reMyQvmX+GYirtWlvkX8O9qH2yB/TXLMlNNM7UsbBZedDU2aouoScyD67Q3mkK8jOZV1wDQt7B93Q0FmkOw+twWF87C7Uch5GxaHVB3+ox59jHgUqqkzIRy6xlA7m7/keKXnA6OkvlWkg8CZTRH3LPIqHD+H6ovF5zQY6dQMNPd9MWU2janOuagcVxE3z/026z6y0Ck4Qu13po99Qrsd5eaegYfU73eiondOb4+g9q3UsesUOTF7ytvP5srWhNSdzw8Nui+r5rKPG1Ki/8rO6urmDuDJ2h6Abf0VwE5BWrR9fatZPQyoJx8PNe8OJ+lELVfwmeY0K7PqZDHnyxZlng/lWMYtsmd/wKGs7NmCkupVjcIpQoe0/qaDYeWT9dF86kj0Cbv1uw/fdg0Bjr1FOPap2Lvdbcs0ToAochYZX0xkc4gYYPoXbMau2/4nAYbC6+r5n/QpLT/mIlWplCvwwSeuzdfh/m2lDrTw3xbZbxlTCP9+hYk2NCd/zlRejKC39VWTNmrjQZAdmdp9bdTyRm9yAydc6lSejCZ2F6BbTlrpKBzGqiT7uBZB7vd2HtcPw9Ov0pSE3FCW7pZqxLbni28dDF88wHSe4yVzpPo7pRJpW4C/pwDfRnYtgbf7I6/q33m9NCZghdOpFVx1+Ec0TvSCY+1vtAx+1IAUkAoXCD7q2aRClKxfvaGKFLawLM/V8ZbN8ikHEdJl8A79UuHYvrsiX0XOw5GNygqy2yryx8p78W68yEF7Aa59vFs92g60lQMELo3GENHdiMxB2PS5ixotMXHj0L5uK9HUZy4t7uqzYNcS09tdS/884PmcyDm+ajOOc8/P9+KJ+17OAsyzon1tz5/Fn+keISc2l4pv46w+bY7pH1NXHzIAPrTE46Fgc/0rn6Gx83peODZJDQ+cYDvv8+r7oXY0CE3jZwp6VnBhOLsNvxIpw24gxy0LZfaXrxaxN67EjjhasUzdzEWe9cuZ37WbT6Io8SRjrzdE80wUqtBGO911B7uio8TXCwX0YwgwWkLsjsroIXfDD2M8nFC4rx9yUrhJ6cNQfv1jn6Us7Ov85rzgaZJx7Ywfk6ls6YKJ3geyk00yyh8zDN17Gae6K8EaEvhtj8CwK6W8f8K4M7wCL2E7XuLCC5Mxp8U3NR0yb0+MWvho7yQvWFcDJcRGYyZsZe1amcFW3wLYrHez9lzMY4JvcqI3c8A94HGvsXV4/6L4nbbXhhzAqhK46gn9MmPN6PN3TahlQhw/xieFKtwCc8UiJ8fw/GqRC1m1pLzRO643+Bd58IPQtgA2zjADvBDnHtomtCFzu2L/Oqs7FzRijekf+cGUL3gtNNZrRbhoUtbEUnKKtyaxdK4I+PcI/5OCpZvwsLWCMIbVYQ++N5t/Z/4jStBhfHjBB6TEigWd+kYXKPncYK3uTL1HHOAHgfQSYFL7hFwxLIrVOO/1hZ5hIwt5YSocv2L09C5+e5lZM3Psty/d/rCkgQ+qewzgy9aOp1mcv0g57wha1bQo9Nj27g98hxa4kWTh75DmK6zwFO6o5/5UniemDGNlB1TuzhAbbpcILvy+BAphaYLBE65u2GerZ0HUkwTt6DmfCS2Pgm5GQCiiXw/450b4WI19+RapDH+gySDRG6bP9yJvThk8cFoWsMsIy84wR/j3VmSUBJUoXgvVkh9DwR+iLFCKGz60Rs7G3/UhGOeFZeOet/H9V55e/jEenCOwqqCV4TWSL0cnn6aKhnW7HLoz3lfFmER82O0oBIAp9EF+ldAZbhbHkKZCJ0CSL0RcAJvTwWPduEhi5iGl+JdWZJQEToS7EYIXREnBQl79SmCl74sJS7jADX/77Kd8jfL+I43JMvTxzfzfxqRTYIfUZaSo6BenZ3u87E5+egAZuQjWkoSYq0ZM2vhGEOgfA0rI8IXYIIfTGwAebpAP2HDHk9fgbrzNLLlhB67aP9PkOXL71l12ospzIR+jyFX/syQOiImNStsdrzYa5/BRdMHnbXj8+z+9/npsxhWzEPAW9+9+9SlggdjxOUI4+uCR2+/1hnz+8Nko2jH2hdXZOe/FAP1mfwLjoRumz/cib0NWPRn8Dku7dbU1g8wNzZJTNR4iSUoP7X9pvQFWvBeiUIRWa0xIwUKY96fixa3Y2cF5C9iLtQW2e5tZtgUZvlYVyjhrxDXujzzQOW2pEnvbhBNwTociT0YgatgIh4ndEldGHtzDvhFNZHhC5BhN4WcDBAQHdopfF05MsebO5zGMa5wC0RbvADI8FzTBB6pVbSjUe8jAvPIOcEj1nV6EU5LmhDcyoJ5IJjYdlBHp73MVh8d44wrX1jnb/w/n4+T3QTiHRXZICRohP8jTpvOkWWCL2MmQ9dv+sc6MmVNf+TOjJJC7HJ3Q42auUyiIO2aIXYnQtE6Or7tUwJnWssXvjDkoG44iDoRzCmOK86E8QuHHKCp0Ib79GxQhQMELokJhb7HOMRa4TAXL6FBymC77fj4qOOoymIFzgeOwzNWgSNCM3xLKANRngDchdXiGZlYpYejpWMV/7IiNN9RLRsEDofO5Qx1HNft0SiRCe7gYsjE+tLjJjQHcyLoZF0SShHaMXD+ojQJYjQ24CIXOYGX9R94ZPMX1EWMn8xyIlW8iYtHjin79nW+AbjtOmjYVI+qJvCUH3B2LWsZVBALnuFXH5peDocBCWXeTw2a8pnPBvkeS6M85eh3F+S8dl5Jqw4QEza2jtfNNlxQNcm5iwRunXqOUdBPXd2G8BKyUZ2a0rZyLSQmNzDKzVT+LI875YXjqr1GgARumz/ciV0JWTh3+mn8uT5cYte8FG17n4iCeQSXWTAq9wYoWO7kLC0jjmUwpOCTC+LMjI2faByyrnwdSMPUtQbTWyAkUTLs/Lu5NPyXnA6yPgKyw5ugbm9T2jvGH40bW95bvXywgfk/XR5M6VdZInQ2dFeHOu8u8AyYhHvPCRwD4FHewb6uDuFPhKhy/YvV0JPrloEr+PXzjRe+PgcPdyKjnbiEf3cQSfk6eklTZAvm1zYtNKnygAUTvAlE5sMEUP/M3k7/N95278E6nv3Ui4F278YyPPvoD8bhMB6vWjPSe4rV44fgWktYTF5I7TzqyDzh/GmAr/fLoPEmA1cEzuCeeEmbEO3Ocj7Hfo1TmPsBteZSK0L2mutG3mkB3GUNhoeB+18RINsmHaOkTtTWEOJ0Jc7oZtMGs8HWpjdvSBS6+9r3zzfNWBuVz6vR+hJAApMVKFvFRGOQu9S+0wwhoEWs3wM1N5hLkzDGHwD3p3d3Fs+rJu8BhcTuht8EZ/ZrRNmvwk9nvNVjNbYveKQyCPMlGOckqNhSv8O+iSsn3FODJMgQl/uhJ4Tg4wZ0gpeuF0nnnsyIfEe7eQP+n3OFWsF1eCr/M6x9p1vI4SeXF2LTtU2uctwmF50m9jRH7Zq1aohlP1SLznFaS0VwNh1mOVsABcV3rZ43Pn5cDV6Ecz9v4U5dq+4Kz1rJsxs7CD42/L4X3Qc7jQrhJ6EX9bOVc802KIX7IBN+jM7lUeKkBaIr2oRugzQlc6GhQj9ECB0BCd1L/y6iehlTEtXzIQG71G2DSW70ykG73ubMbmLiYkx9KE+rQh9sbxxE+VEgdp3wrwYaJFRt4QwIOb2QE7dGNu1d8KYPsasQvqkLuZFeGDEmeLe7t1knsuIyT0/5p+ozPWuyYQvxsGbO21HKoj7NrEaxl0j05rs2zRaZM7HOg2vnUTosv3LmdCTXMXhX4/onqPzF19cuYnuWyscO3ocOU5M3NOfUnSjX2vmQJ9jcdUl9KSNRTf8lubdeG4VYUkrwh/BxDxCrb8fmEk036xhQE1RurZaey7I7uq1Ff8E/mudOSr7HIc5fSW8Aywlsf7c8+s4viNuuA7r7i5taX8JPSfm4wmu+0Roy2b9mBcROgtuLpdPO1qtvy+QlkAv+qyJwFVs7XT9tbxqo+smEfqhQOixadqbfFkhOfvT0mblndGiF3xPyevbE29l+YLBLvdzhuOlGyN0JXrdeWasIvJsMUpjZ98BVHlkh9hVssUkIUCyMyD7B+1Tzm1YXvRe/nMjMhuQaVBLbuQdPHe6f5cst3Z2p+3MEKErPi3BNfpXZGUYWP/iTmViEqqfjvYV1MSpeAtmphOPMLlRIUKX7V/OhJ5T8xV7oW40NUVoPk+p6oTX8NobAyl7LA8oZ3WXaqQwnK+Y09DF5zBoCDpU6S76BSUQiWxbrydpcmOi9hpMhCJ/3uE5tVGo1gJsX8H2pzEqIs+RHh7AwD4gs22ry9PPEB8x0s7ET8LXyf+tLD7T6Cj1JtmPTtuRJUJHh1lTV0iBlHYPV4I13bTHAETQqvE/hjn0U11LYHyU4IVXpdQfIvSmd2r5ErripRmcb1KrjeNSu8Gn8NqP+izT7U/yEft/q5lVbcFFxJDJHZH4LhjYRMWmdy+8ZXV5/BlSLtrCbaMfUisdrkycUhqb3MfTXPr/LuWUSzZbvSL2puflR/1Kwan9kAWIqUZ1IetZxYv8Mvy7cnnGiKaXJOoIrtGdi0pq4jfyNi5NQs9JQlk//Qxoz06+IOs54HIrYPSzl8Wm954d7cXKA/TjH7Wv/LqJhzvUx65rEqG3ggi9A/CAFQVn6lgQ1AO6jlqtwhOevzcOV8afhc+Z7ypQp8CJJBc4NFMBmX8qBc1cFqOEHi+21WhiRP+OfPKijTFZ/3RV6QzmBaw4bqWARP7WaLC+WI0eY+FS41Sg0V7o1+VlscHogRleLLR8Pq+pRCuhLV9kZ9By09QsZ3luOVuo1NgZNd4S0G1EQqS+tqPpctHQETPxcVj4ybKB91S5p/8VoTCkbQVEDMRz3gneYcaiGZvbN1vWqUfJ55huN/5DhH5IELoaVW3SyI6zVYB4dQxzPQ87/oTyWDWIR+wtvACUq0ON+O/zoxMjBS/4ZUqaedPib1pDL5enV8DLdYupqHGSTOH7LWuFc02r05YBNF35ylf8v0TyZvewRR+kFjzCtcsdlu2/6QVjbzqSfVpxTjMFNT47uyPu1D5Y8MLdnMjCA/POC8dnwXmg3IfObPh5zWtznLTGXv1nsEBvE1dB9c7QWZax4NVK2zqRSWYIXbFcVJXbJ9rzXXi9fy5NKyBHsiG13Nr5PBStfghg6d1eqIaXpNh+IvR4zixM6I1ybrCtMtMTv7AuEZusw5fDQvh4M4npF5wEmK5SRGz7llWZGJ1jIgzMdy95rkkDC/fxsHBfU6xO7hcJDdLML26a0JNzxWr4eqNHHZhXG83v1ejxgu2/Z6w56hSTcYcEPyDvbc8km69cuVp7Lr7UuFkrzH33mpm3oR2zon+/KHr+WEv/tWWYnJNPrwBN+81AYPexjYQwqy82j+VxRcGLduadiarss1J3G9oS32gmt0aCd5sZU+Hl7kx1nKwja4SeyLExUHSjm41ZpmIrYHg9JmLCJ7TEC9BF01VHeKcu4Y6K6IehvSmpgzKCys6j5rMLNvcB/yFCP0Q0dERsEvOiK0c0o5jNtyhIr108y4T//8iygwvRw37Vhk1PWKx9uAPHGMd5O9wE9Xyz6Ib7hFZuKJDHIi+e7IMhQs/JTFTDw39kwrGm+aVj9cwKH4a7oLxzjTv5vPnGXZJXa8nNQWZ4HTHv+B+ANj+cEMUCC5vIWAb9Y+RUsGvXYRhV8XQjZngkGujzr3g+gWh20TbNIS/4HGquXunmAAAa5ElEQVTrmFntcss55xh1jHIKwatlrjkAz327Ep3QQEKgoD7ihC8Vg7Xk7qHP1SbMbmfKAbfgJqReRMuUXTtJHbPuib3ZspUfPfM4y/WvV471jCRWEtHv/ok9MT1yJEJX5koroTeEfLa7uSduqQy+cevo4IVb7MHz4fu3tJbb7cHz4OvfbKkMvQI/0+jNDa5uILT00drzYcCNnqW3TogCmmNFJqsC0+T8O+Dn/1bg+anfBV/fCf+/CK8YwdePwv+vgwG4BXMqywQZBVfG0O5JWss0CF1ZdKMzDMSbP6jNKB8gqXqZa6y7oP3XF5zaBaXRmgXPOqYNE+5AsRg+acT2T4TPvRHqwzF6PA512sGCbIlkJvzcM9oNm4L3xylSZ5Jc5Z1gZGxiteXUvsk3iZOiPd3JkMs+PMA3ieFDUM9VUN/6MvOCn79teO6OaYPxahnM0f/kRx6hCaLikdHcYJvjbPpTOR7tyiaLhC7bfxxaU4xvYmPL1H7YNF4hfXZyB1mm4uO9g0rsl6NYolDZsGz/PNCkH0AfFYNrTp3dtHDDXUUZD4EIfR6kS+gzgpS3OSuO3VEd+sOD64YaO8aG6jvHhhqtBX6+f+8pQ43t1cEL8TNofk+//11Cufr1Vt1Y4+1MDDwDw4FBjQZNtyzjliBsWeTPhNbTSFJY9jSXeCqEziHTvIafTUPmzIKBxO6Bpje2MZGl7T8ILwdukr5bdP1rLS+4Gv7un3jxPw4L7Vfh8z+Cv7m74EXsJRZOdzobqdjLnF8fC+6G57y2w7vEbHEqlc54JizgO8vrN4o5YSaAED8eCusjMm2q4z8IP/spz5cOckH5MFn5n0RLEZdhsKvM5BMTlDHtDRb9f+PdXpLZ1uZtFxDZeGnMHKFzmXHLlJAbzu8Px9aN9sEtZ5WNz4KxPh/G+TZu+QlnTVkUWFvx/B/egZIb/r2uTNvtExH6woS+xVvxnK3O0ENQ6lD2Qdk/R3l8e3Wogdo6fibThJ6Tu1LUOrxI+x5tu4uoNMdLsm4qMld2yjmoF28jX9jMEzqXeaEwfizIfFvRSISxufuQ5B1HE3PYQKtA6wZKLSw2vzAfJ+NgZAxmcUFDM7ewtvy4EJtKF5ercjx0taI1mZdVG3IqcSdENZ2qkTbEzlJe9Dbsa6cBVLJK6AJ8U+ZGWvHPFxo73JTxUKrh3rzj/0eRW/vWY5RAjFqXi83pqJVPr1i9fvwZVrVWyju1N1tu7WvwjjzCrEl41dFg0h0hTxGXPtrWYklIC0Tosv0LEPrtoKEDYf/hThcIm5N6Y46yHzX1zfYS0NAZZHxi2z8RBv7RAr8z2i8izUpJk9ATD2DXfxXX8npigWC+BwdtoFpKqhsp9nx/z+iG1wBxTb1FlcUik5QTul17Ibzcvy966hiZLovJKBX5yDjue8ru5PHqe9npnMokocs1xp04HgMioek5hTWGEztaAPF4D7Rhnm7YR6ffe2Du/Ry+/hjG7yeWF9wBf/soEoW0CPIrmMYsP03FEqlg5e2FHjhmEaHL9h9yhJ5Tr7GFm0w6gSzhkiqhN8ncDS/l5mh/Xwb6nWrhEQWZFvWF7udodNHI+nSPh3ouF+lrUI2+wXvbmbldlU8mCT3XdLx3HnfC9dMav7o83rOcONcEO06JC7vlEMZzUh4LFdLwIRJRNKENXxSi6EXAJSL0WP6HIKEjlBfuI+K8c9kTzEKLAv+aHqHnFOccmLDXltenusj1vWDfeLrd8Na8e8bTuAg6Ii6e9OME94nMwao3x0O9KXHkP37NT+fed1YJXR1DGL/ruOKQ+nwXNw/8epMVimnhRrIyLjznRXIZ2Kjd9Uqv9hwugp5EuCNCl+0/VAk9p3iHYjSmcrq76FRfYgNms14QupQ5jxHtRjei5pJ3lqTMF1kUeK7vkhftLIxOvKxrecrkQk40DIvU40Be9aV+PKTcBPiyOic6xVIidMvyjyl40W09iCfRx8I3DDDv91luzTMsx7bkTIR+aBN6Lg6jOTb2J7Aw3CwEsdQ09VkxgXVKrwg9rvflxfE/g4n7Y361b8nJfMEFgZk9q5OPYpx17KsJr2mMd770j4e4Ex4s+g+vqYyvFBNCK6tfxgk9sQSWz3ol9hvf1R7Eleh1qcu78nnX/0vTMmwDROiy/Yc2oTcTDCwO/5nyeZfRlwi/lrzJXTCImzXv1feM0NW6MfJV0Q2+o5ypL1GiSl4mbnIMH7NGuZaSM3ke6wQfPmnpHg/V48XS9s9R+6Ujk6wTulpf3gtOL3nhPjWM8DIojMzZO+wE70tDfm2ACF22/1AndIQctGFv/MlAMDeWEyekrBIMe4lOOvlsbOeFGKSGtbn7Ra2nhK7Wv2HDpifgPXHhx5CK121vxkMmbQl3WJVaCftmMJf1QK4hkgy5/lVLYH42F8evx5nVXN9ITO+lROgIORfW2rUaCw7jLgtSj8kcA2Rh/9TwyT0EEbpsPxE6R0zqw+N/BIL5DJ+kCyS+6F+ZVXbELGiDgbSqPSd0IfX45S/YExfz8KmYAtRfOmTFZMbHo+gFP5cxq1NKESlIPbiCk3qIcsra/GxeYJhjVniAzVfbf48p2Sw1QlfrteyJs4B09vCYDNkev/nHFTYjXijS39Y+iP3qE5nnckToSfuJ0JtwmCho3rwIyIW96FnRhvjLH4pkILV3y0bDy7VECZ0hTg5hjU6sL7rB77iDYiY3U00yk6FnWYQ5p3bNGpEoJkWT44AcFz4/J9XAIH2fn3PJh3uzR7OY10CRjfaivxQJHZGkJ4W57kUP8EQoS2kDGyejqo9Uoe2V2juwP30k81yOCD1pPxH6QYgJpmhPODDAd3BTYR8JxuFaIL8GFe2Cl+hsbN/KcZ5SEdr13iVM6EzmcqHDc3XYoFxdAhIQoVil3LOy4MWRtUQM+e1Fxw9EP+INYZqyismsMnEKvPzbeErgMCtyElH3wgNCPncWKr6L7U3D2WypETpCznUMPANa7i0yJPISMMEnR0vV6GHLrtUUefWLzHM5IvSk/UTocyJeNMvl6aNBOJcDwewTd0lne6gRiRCi4azI4/5DeQ1KTWe5DAidQc3wBRO7aNn+d0vVqQZPYSrknk7kssXl4yTjjmNRwgQstv+RtRX/6bLtud4tavEGqALPzzvBJ0osjetUr+dny1zlIYxF0BhswxXFk8MnpSGfpUzo6jPQqgNE/sk4k142rS3CSsk3aRj7vyhuKRj0E9EBEboyTkTo8wAHUw5o3o5WY7IKPOdNsqH5aSRSqcuY72jWYmePXrAj7/hvecHY2JHYFrkYKCFVLxGBR/bImOSdFHjmPtGPvZLQU8yMtBjU/MwDGJ8aib3oTR7gWdCihoyBnzK510X9+2TADBE7exeMxaeH46QYKKf+5BzmcuLOcvnRcATaeyPmZ+dXAUVoz4Qg0pCT0Mb9/QUWW5yREloKvoF355l0ZsykkJ277+g57p+jM/eFfPbivEIvdLXutKGOX8Ge2AhjtpMTpt9WrvtelDiLILcO7oU59v4NGzY8oZdyagM84Yz3midDm+/joXbhve1mPsA8YvPJDT7Pau4hoVtjtecDoT8ixr279rvB4+J9YE6KROgHo5lgvHAUXrh/BcHvYZra2GSd74x8OSEOKESz0AvJg4Q4zYlbcHcGG4Y61zr8ewu2f8nq9ZjiMscnlzLBZLtGxqbfa5/y2gZ8ZaTXRWFa58jYRswS1jcNXUWLRjew1vXXgjz+EWS0XaSm5fnHW2RvJbnC2yUxEVlLGQcRZhXrR9lwPwr/dlgo3oM561va2O98wSphDgw7QRnaei3Mq8d4gpWpOtdYuObePEfbih52UPQxuclR5yr87A9Q92fyXs2SDUvTaiH7XBqbfk3llHN15n6jDPN+9ORzcP73TENXkPiQOP4xeNyEmyJx3NQvjT0ea67AsNTHNw1XgjXYTlXRyQhiDX1k3fQDJ61/NVsfupkLOI/4fJrqnYY+k2joMO67Tlp/drwmd9z+ddP7GResmyYNfSG0TuK1sLDn3RrmNf8ZkPteLlCekpJnGgobCyUHKbB80CFL9ckJarrBs7/5mMzh68N2sLFcPu1o8biBeRZHkQoxWGO5tQstb+JNoK3/r66KU3sz5gTHq3tq3f2GaoZHrHLG/xRNowWb5ZbfjNoVT0O7kcmvRf71+eSvJB7hsa+BtNV0tlgv/P7XuNMdtv0xvP0wX5uygNb5WR6Lng19eB1qy9CPh3BhRmvPiJRTlctIXbznk5EaH1zKSOS3fxjm/r/n7eAvlKxavVrweRS20ehFsIm4wPL8ruc+fhY2QeflR8Pj1Lp7CdWprIibV7t2fZEdo2zEOOz1FBPlqEVaBmZhjtRFIKP/xrNyOZ4ZOC+fFytXjh9hORPnFjz/r7qdD+xzOJ9EtLtcD2PRYwRNGOPX41rc7VwueLU3Mi4QV2exbiL0BTDHYj6A50nwIpwL5Wogmh/DC3EPZtmSJHFQ4feVGXmj0x2U7xSc8AOWHZy1ujz+jNbn5TL6AvUSKIdWzQnP7wqj/ktgMZ4E2V1m2eH1sADdCnLdiaYzJKGRhVKDihsM8Pn7MTgPjNsN8PVD+dHaFNY73mJKH49TUmYXTE65XIucgqfiAgXk+zauvQc/s/gc3bWgjNg8ZeFK0dS6A+Rza94NrsNUnUW7tkH6D6jPNhFI59BF8/FE0Q0LllP7F9jg72a5xavMGhgfyWlmCqxLAk9S6YpjJZYb3b857/iBPObLoFZOaBNE6O1ggbPB1atPf8qaSrQSSCZftMMNQNZn4suRr0Svwu/Rez5vT6yG3/25604+sfXzjUZDOj21S+SHSSc53dLBM/sFJpv5ZI+/K1XPeOaasWglajogYwc3SgU3OsPygijvhuPs/5XaupJXs4bXhS9F7XJc3BhoxVwbiaWBBefQAAuitK72wpIXrMH5iPMSZQTawRQQyTj/f20dbG6sQtV/CW4053GAEs/pPGOaIQxkY+5j/00USZ65JmsgXlMEkv2ldEwT8fDjc26MtKgeO81Zmv0GuIVQpF4tsTvx/l0w5lfge6GQ90Dz/DfTx7Rgai70a/Min79p1aqhN4294Mhuy6ZVuaFrx3OHY/mOIOVfV498bruEvrUy+Fb8zG1juSNlPbqlMdP348n2gIOvkEwXE5ZvDlQnGUJbGEDZxbLXvQsrNml8ce/rvVrTGIj7xWTU9RwbkDKiuZo+WjeTeE3Vcsdfbrn+W/FYjvnYoHkcj0GAlNmRClpb5ill+XdcC0cCfwjquglDtuZdv2JZ5xylPD6+SUFY2miIdWyLt+I57RL6FmfwAvbZQ0ZDXxhNC99cZSZZWGlRNAuuBSwifxoHHk52pg05HcIyagszsPnD4we0YnRbVpXOeOZq+/SnzFl/Yg1skr916qlHlSoTryg4tbBgB+8seP7lQPBfA23820U3+L4soJF/BzT46wuO/88YkAqPB/OjEyOrNgRPbX3WQv4heMZ7ouUf020fUUbo+HeC6x5klSRwSPL93cm5J212B0e2eIPWVnewoFNudwaLt3uDazY7h5+5xR7adccChA6/P7C9yr7/6O3O0EvvgDboPh/7gH25vTJ0Qr/lSyAQCPNAeCdXxp8FRLUDyoPcH8N/oJOSR58P13887wTfVOudA7FFyqAvx8Bi1kWpqcOm4O0izsF9nfaRFS6jPcUeXw9cSpDm8d96R5z18Pqhxu+8of1QGibKb705NfI5C2rxxp7rDs3uXId1Dv5Xv+VLIBAI80AS+sZnFd1wr7hdUee3Atov0mxe8MJOF7z4KCUh5diS0lIaA9Li0kLgi1pd4iuCbvgPmBAKY7h32kdWWD/ZDYuT1XoJCSSh324fcRaSIJDrPtSmTZV2Cd3kM1Hrv7uK2v/gL/otXwKBQJgP/LrRadNHAylvE05qMiBMJ+UAc0pzg9/JyHq5TB1viOiNbvgFcZVtfxd9FP1ktybWY31E6AdDJfT7OaHvb5eEs1qA0Ge3cUInDZ1AIGQWyf1h178dSVlcJevmChkLkITx3VnN2bkiFm8sQMP+BSfk7vvInPGqEbsjTYR+MIjQCQQCoT+IyQ601//ggaG6iykfh1d1/VdhfdkhO5lbYerYguM/ohFnnB1FYATDkjv5PLVuQgIidAKBQOgTlCQxXygn5uiuCL3Mz9EvV+vtN+L+VafOFJEsu80IVy8yC0ZwL1o0RPUZOlbIBojQCQQCoU+IPcC96H1aGQ8dmfEt+M2qDZueIKrvO+EpG5aP6/SPJThiFojgB/3uU5ZBhE4gEAh9Qkx4Ti00kMaVJQLKkBc421BAe54JhL5dJvnpitAxrSfLHBlehXVmoG+ZBHm5EwgEQp8gg7CMrAtfWnBjMtfKxV30wutE7VnIeAiblfACLetDU98m34B1UhS6uaES+g4M8GIP7UUN11TpiNDNPXf/XXgH3h78eb/lSyAQCAuBabGYxKTohv+t4QUuNwIs3S2GYsV6+6jJsn6tKgdPhQ3GncKDXycRDJrb61DPK7BeSvQyNySh3+0dcdaj64ca93hD+6E0TJS72wwsA2SOwWCMPJM91x2afXDdUOMuCixDIBCyjuSc2b9KX5MVZ81edNPKlStlwqCen6VLDbrohO/XPUqwpH+AF95aLk+v6FeflgJk6Netbu5pt9mHb9jiHF7dYh8+plO2Vg5ft9k+3NniHDYFZL17odCvW+2hA/dy8/jVW0/CsLGHn6z7fOwDr2cw32/5EggEwoKQhF50o1cpV9e6zlsem6ed4B1Yb6/N07Gjn107CbTzfTrHCLI/mBAmax78hwooOQuBQCC0D7ZgrranngIEuE3HeazZ9B7uyzs+c5Arl2d6s7AKsl1TPuPZ0I+tmkcIonBnv4I36fJHEKEvBiThBqYcNVEEKd/ZRfrU+ljuSGPtWCrpUwkEwqGNWEv3witHQBvt9j56XIBEeWz46P687Z+Idaetqcs+WNapRxXc8GaMu67ntR/E1/GgH78kc3t/MJPjRHq7s+LYdgl9sz14IX6GNHQCgXDIISZ0JyiLACoyfnnXZIiacZGRYXjPcGV8DdYvSN20phPnPh/2xp9sudG3+Lm5r0fmirkdCP0dqpwIvQMROoFAIHQJIOBv64SBPZjUWRa3P+QrPCxsbp786N1AZmDD79dUxleCZv5fpshcHBs0im740Npq7bn8ieTd3msQoRMIBEKHUJ3jSmMmzp4VUvdCvPJVt1z/I+Xy9NH8iTwlaheJXAZaNP2BYcd/PWwcHhZn5ibInB07jHDt/KOqfAi9BRE6gUAgdA6mMSNx4Rl0yZCWzotft5zwgLgWdwf8f3psbOxI9eFNuc6R5EVR86DnWrT6YScoQ13fHRljAW1mTW1CUDsv8Dzoj1jV6EX8aaSd9wNE6AQCgdAFpBaar/onM89ucwTJSBI3CCUvqqPDWt7xf5N3wr+2RseRMNsxv7O/WXuK/3TcEMDnbwStf9bEVbuDtXN/P7+qFr1PlQuh9yBCJxAIhC4ho6AB8X5WP7773CZ4RuywYWAZ2txgDxD0jyyn9uGC558Dxc27k8cX7akX5r3pF+fdcARjzcPfXAJ/8034/O+xXYzI3WDWdPsUz/atGGlOiIU82/sEInQCgUDoGpzQrdHa80FD3clziHcdNnVB4uTX4/B8faqByU+QqEtek5c9c0xD8ma/h69oCkcSF1frjLeLbTZYZrVwHOVA2nl/QYROIBAIGojvdDvBuWlo6XOZ4pGg+XMOMvO3/N48icdkLkztlhd+AvtPMdv7DyJ0AoFA0IQkM9CgP81IDsguRVJvIvB5SqrPlccAxWr0azK1ZwdE6AQCgaAPRmYYrKXoRT83dTc9i8Vy8EghRHP/7vxozcJ+k6k9GyBCJxAIBBMQWnqxMr4SNNcdGM51GZJ63XLDA3j3Pu/Upli/icwzAyJ0AoFAMASpqeKd76I3+ciyInWmmWMAmY14pPBWtb+EbIAInUAgEAxCxkpfW6mtK1Wj3UXhad53QtYqft3ywv0iVOwM9o/IPHsgQicQCATDkKSeH/UroKX/noVZ7Z2jnNHCNyPhAYwwB8T+duyXqfjyBLMgQicQCIQUkJD6WRZmUROEuK/QAy90Y2TuBvuL1ahe9CYPWM7467E/RObZBRE6gUAgpIQ4u5k7/jzQdH+IAV/YPXGzYWLTMbGL83LQzu/NOxNVtT+EbKIhNlpbvBXPASL/PRI3fN2/xR460Fq22kN7tlfh95XBt7DPEqETCATCwpB31Mvl6RWWHXyoVJ2sYxEm+Kxp67xdXjgr7tPfkB8Nj+PtL9OCn3FIDX0baOj3VYf+8MC6ocZ9Y0P1HaCJtxb4+f49pww1tldJQycQCIT2keQ1z+Xt2gYgzjt5bPbwQFaInZ2VQ2FauRc+atm1C2ONnDTzJQGpof/u5NyTtrqDH9viDn5mizN4DZRPt5bb7MFPwdcvbbEPH8PPXDueozEmEAiENjEgCbJ82mlHF23/0qIX7uZm7WA2rXjri2rk4ggAY7KLHOlfyXvBi7GdrL2NBp2XEwgEAoFwEGT+cgASZ8GpXQOa+h40cQPB11uSqaRB8E3PYEleqixQzE2YvU20coDOy5c2GqBxt1Ua5OBIIBAIOmgizLw7cTxoxlcCwT7A051urBeVTGnCia5bcq9jEhdWDyfxBk/HijnMwz3w/69Zbs2TZnU886dEKwQCgUAgdIBW8lxb8Z9uObU3AAHfCES7e2TdFCPeUjVq8NSsQV0SMzeVz1Piv/Fn8XNF+DxuFMqxed//Zd71L15TiVYqrTmMtHICgUAgEDQwM3MQmQ6U3MnnFTz/HMsLPgHk/KuC4+9CYsarb6ygJs+0+amkiJ/h7/BvMOY6v/vu/7ZgB9eBRn5B3vZPXDk+fsQCzyYQCAQCgaCHxgBeD2u0OKIh4Rbt8M+L9oQDGvbrCrZ/Sd4OPlZ0w88XvOAGUb4N5P8ly/Y/XnSDy2AD8FegoZ+K5vzjytMrWh40wK+hkWmdQCAQCISUMXMYkq5B7ZnVJxzyyBGKQCAQCIS+QJjGJclj4efvSZHmc/XviMAJBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUDoFP8fG2heOpsr28UAAAC0ZVhJZklJKgAIAAAABgASAQMAAQAAAAEAAAAaAQUAAQAAAFYAAAAbAQUAAQAAAF4AAAAoAQMAAQAAAAIAAAATAgMAAQAAAAEAAABphwQAAQAAAGYAAAAAAAAA35MEAOgDAADfkwQA6AMAAAYAAJAHAAQAAAAwMjEwAZEHAAQAAAABAgMAAKAHAAQAAAAwMTAwAaADAAEAAAD//wAAAqAEAAEAAAD0AQAAA6AEAAEAAAAoAQAAAAAAAIo4n00AAAAASUVORK5CYII=",
-    # Email icon 
-    "email": "iVBORw0KGgoAAAANSUhEUgAAAfQAAAH0CAYAAADL1t+KAAAAtGVYSWZJSSoACAAAAAYAEgEDAAEAAAABAAAAGgEFAAEAAABWAAAAGwEFAAEAAABeAAAAKAEDAAEAAAACAAAAEwIDAAEAAAABAAAAaYcEAAEAAABmAAAAAAAAAN+TBADoAwAA35MEAOgDAAAGAACQBwAEAAAAMDIxMAGRBwAEAAAAAQIDAACgBwAEAAAAMDEwMAGgAwABAAAA//8AAAKgBAABAAAA9AEAAAOgBAABAAAA9AEAAAAAAADbivweAAAACXBIWXMAAC4jAAAuIwF4pT92AAADPnpUWHRYTUw6Y29tLmFkb2JlLnhtcAAASIm9Vt1u2zYUfhVCvemAURRFWX+oVnRy2uTCbZAG6LA7ij+2EElUScV28mq92CPtFUopkuIWsZe1wwwYEKnvnPOdn4/iq9f7lrIb0YFCrMsmc/7+8pcDSp45nxYrb9XmYlOe32vx8f79Nbu/YQl3Xv8GXu3Tfd3WoqNgX1eNSfeZQ7kqRGqf+23kgAHS3WTOm/4F+GN1CXKlBVi4IWQ48EGUuDj0Ej/4FfgejpAXIUygh1MvTEkCxp9jo2ku06vl2zGWXWXOpuvaFKHdbufuiKv0GuEkSZDnI9+HFgHNXdPRPWzMi8nDUhimy7YrVQP6NS3UbZc5zpRC3c5uG+MO6bhM1WhPW4RdD01AzmZce6urIThnSFSiFk1nLBbP2HajOmU26ojr+fU3ASyT1eo0l7qe0aY723an0eb6rhXoShh1q5k421qaLx7Nr4T8N+YWPhi3aa4F7ZS+Vqqaunw5JQTyvO9qDF5+KhuuduaXAxuxtP/M8T0/gBhDH1/jIMVRiuM/H1ArxUt59xRq4aVBOKHsoHHa0VM4zlKpdE1thcqargVqm7UD5rqnuaqUtuGsA3K4f5Hnl1rJsrIvzNW738HFWR7iJAyh7+Ih/GqVXjSmow0TF8vMsTtuWfLUX8hCijiEnMQSLqKAwiT0ClhwxmJMceIVZLJfKnbbz0xv/yAfrpj18UhjEWPC6YJCKosYShJwWMTRAvKAhhInjDN/ZvNBl1bBtDr02rPi1qMXRUmMsQexFBySMCAwJlZtYSQxpoWMiPXT63rwdF4a29e7UTcfxefxqSrBMG0pZb2KMocN3eTOuF0+UY9nRR7tdxvRHBuLB4RRsttRLd6sbYLPGTp0jLqh29PECeMi5tiHYRx7kAQBhjQiEYxjKUmSCCaJOEV8msAfJD7asQ1t1sIex+h4Kkw1W6EP+tBSTe0pLLTJHKlVDWjbViWjPRxtGz5qfB4z0CnwqI6jcbjQ5fbpKDMF8B/G+8cWPU9r/3OL0KNm0PdyGmX/UMe3faWG4/en5q+35z8q+dFe/ezRMSd+8JGdtuyXe6jFdGWwi/nSIRpbN22vFF8BC6q6Z0JJiDkAACAASURBVHic7H0HfJTVmj5Yb9nbdvfu3t27d/du+++uu1fBUJLMTAJkWgoJSQiZlgQQkKJSFLsX7Iq9YEfhKvaKgoqCFLFgRVEpUqRbQQSkJed/nvf7zjffTKZmJpnMzPvc33ODKTPzne875znve97SoweDwWAwGAwGg8FgMBgMBoPBYDAYDAaDwWAwGAwGg8FgMBgMBoPBYDAYDAaDwWAwGAwGg8FgMBgMBoPBYDAYDAaDwWAwGAwGg8FgMBgMBoPBYDAYDAaDwWAwGAwGg8FgMBgMBoPBYDAYDAaDwWAwGAwGg8FgMBgMBoPBYDAYDAaDwWAwGAwGg8FgMBgMBoPBYDAYDAaDwWAwGF2BnimSwWAwGAxGOjFt2rRjwllaWnpcLKb6nvFeP9JnEkLwRoDBYDAYeQfDGm5oaDhWCSX+HS6Uyb/0tGOs7hG/LXIE/q4jxN/iNTpyTebPbb4ufZNxTA/2ADAYDAYjOwGrFeIIq3racQUFY47H10T/urCw4adFZcP6Fts9ffC1qMzT21LWOMDq9NxncXjuD6fV7rnP6vDOLXZ4fyh2eH60OLwHkiH+Bn+L18BrRXwPvLf8DPgs+ExWp6/AYh9WaLE3/LP+seMKthoLUI2PNlYMBoPBYGQeZG2bLdMekcWtJ35WUFBwPP6jsMxnL3R6m4tdvpoih3e6FNZ3JJdJcV0iv75ncwVEOEsrWmJSimxKjPf6YZ+nrcTdLP/Ov10K/mJ8dlwDrqXI6R1SZPd4i51ev9Xd8Ftcr37dUcdFeSrAKL/HYDAYDEZaEOIq14QnsoVZVjbkb0pdjX+EK9vi9Iy0Or2XS6G+udju3SFFb5v8uqWkvOnggMrhhliWlDcbtLmbhBTJ1nBKK/pILMrXbkuF8V+//Weyuvxt5s8eYZPxpcXu2Sr/fofF7r1Fvs8lxXbPZdZB/pNK3bX/VFbW9Dfth1rzcISONbvtGQwGg9FR4CxbislJJzWcEOF8mcSl0Nnw10UDPYOsAzz9SbQd3sfk1w0WafFK4Tpc4m5qG1AxQpSWw8L1G7Q4fEdDBNPuPWqmFD6RJWwL+exhmwAp6G3qmjEGAyqGE4sdPrlBwBh5N8nX+Iv8+rTF3lgnRd/aNyjyYQI+7Ri6FxB4Lc6ABZ7BYDAYEWG4z3Wr0IDbfeaJEBKbs7FYWtwjpNV5Q7G9cZUU7rWlsE6lcJeShTpcWEmwPSR4uuV8SP734VDrlqziTItxFzDEoj8cpHb9GCvDS6GPIcaUxlaOMcYaY46xp3tgggrCU0GFXfuoMBgMBqO7QHehP36sHrAW4tLF96SQ/EFajhVSlK8vdnrfkpb3Hqu7ad+AyhGai9ndRGfJ4dZp/oh1WtgW7qXQzuebaIwx1hhzjL12D7zXWxyN5TZH4F/hHTHdS/2rFojYQ4uuZzAYDEaOoqeWzz3tuDCLjgTBYm/6Z4sz4CjGWa/ds9hi9x5GANhAKSo2VxMCwCBAZGlKgdEFiKztTItiThFjqm2QPEd0a74VY497gHsh/y3/OwDvxyfyd56SDBS5/X3Db3bYvWb3PIPBYGQ7zIVRgt9r+Ynb7f6l1eFrKLb7phU7yH2+g9y/5c1tOO/VBIYE+5DJTc7Wd9dTH/eQe6FF/pfrEfjupgPy+5/LTdiD8menD3T5/8t8bGLOke/B1juDwWBkDXpqbldhcsVKEa/y/q3F5flfadlNkXxTLv77pXgfRpCWzR1ARHZbBNc5C3j3oxaVr+6VFkTYintIbvqK4W1yc3YEKYDy5zdZXT57gb3hV+ZnAc+G6aiFwWAwGN0FKEEaKZjtpIaGE6T17SxyeO+xOL2btUW/hc5okXutp2Md1ty8HhbvLKZy1VvIivfSPS6V4g6RL3b61smfvVjs9I7r42z8g/54kJir54bL2DIYDEbmcIzJla5Z4dLqKhzU/PtCh/d0aaG9Jhf27XJBP6KljQX0fGuPsupYwHOXbVruvueIRQo93PMlOEpBFoIz8H2xvXGR3ACMxbNiquLXU9XM78FueQaDwehsUNGR48yLMP6vv6vxj1Zn4xhpcS+Ui/lBKeCtWhS6XwSjqDmALV8ZDLSj3PhWVLnDM4JnBc8Mnh08Q+ZnChHzWplattwZDAYjbTBZTkZ6Wb9S/z/ByrLYvYvkIr1Xr7jWBlc6RUfDCmcRZ4YTRyt2z1E8I3hWNMudqtrtxbOEZwrPlunx6xlWsY7BYDAYSaJnsMSqtpAWV1f/wuL0OORifIfV6f+6tHK4LuLBICkLu9KZibNNBdbhGVLla+WztbfY4XnF6vCODy1Pyy55BoPBSByUXhTqUqfuYw7vLGk9bYUrHZHMFJUejHJmEWemyjaTW75Nle2Vz9y2YqfnbmvZMHtxcfUv1GNKz2gSXfQYDAYjbxBSwlN+dZ/pPhHNTeSCutLm8u9DMxMUGNHOwlUp1YyLADMn6WmTzx5S347o5WlVWdqP5fcnlVR6/1N/bHuqHPce7I5nMBh5jp7mxbCgqupnlCtu99wtLaXdJe6WowhgUs1MLFSpLdOLPTPP2Ko8QciUoHK0Lv/eIrvnIYvDX6u74OlZhtUenjrJYDAYOQ1VlrOHyaoptvur5eL5jlYBDOfisMaN7mPsUmdmnBQtTyVpvagmSD3hpbB/WOTwXGF1j/it/ihHrInAYDAYOYXwha601Pu3UrCvQstRW3nzEc0a97SpRTPTCziTGYVtWkEi71HtrH043PFfFZd5rkMLWP3x7mkqN8vueAaDkRsIF/Iie2NZsdNzn1wYv9JKr/rbuNkJMxupWe3eI1LQIextJa6A/F7jK8Uuv62HqRMcl5plMBjZjJ7hueP9pfWCQh4owapV7fLpldtYyJnZTa10MHWHO4r0N5u7SRQ5PPP72311wVryIfUUGAwGo9uDhFzVxi6oGvOzQofPIq3yhTZXMy12RllOdqszc5Ba3IenVW8WI7/n21JoHzapuHokpb1hbrCwMxiMbgwR0uWsn9v/S4vdP6nI0bgd0cEIdDMFuWV80WUyO5sqr93m9LcOqKCWvNstds8kzI1Ic4bBYDAyDnMOOSzy4jLPZFgl1Kva5YcVflS3yDO+yDKZXU49Oh5zoZSE3bcFcwRzRZtB7IpnMBgZhhbopgW7aRa5d6Im5MNJyHUR5/NxJlOjSdg1VzzmTNBiZ2FnMBhdjbCo9ULHMAtSzwZoQt7K3c2YzOhUkfGYK5gz8r93wBWvSsuSqHMeO4PB6GSEVHZDsFux3buwxN3UqrUqhUXOQs5kJkbNFW+VFrsKnpP/PdntPvNEzC8uUMNgMDoDPc0NU1A8o8juecUmhRyRvCqqN/MLJJOZlWzVmsJIi71yBP57sVVulnvoG2fOYWcwGGlBQ8PjhpVgrfT9Ror37aXlLaLE3dxqalma6QWRycx6qtKycm612VxNKCv7srnyXCl3d2MwGB2BVm9dazxhtzf8qtjeeJXV5f+mVLfIWciZzM6hikEp1QrUQOSvtlobqFa8qZwsg8FgxIU6JydXn1xgBlud3g8GwhXo9HMeOZPZRVR1G/Qc9j3FzsbLCwrGHK/mJqLiM7tUMBiMbgvz7r/Q7vtTkd3zgV7GslVvRsGV3ZjMLiYFzjl9rVqqm/edQrnJ1qdsTw6aYzAYITBF0/ZEukxRWeN0m8t/uKS8SXB1NyazW7CNUt3cTVScRv57lrXM929h85fBYOQz4LpTVd6sDl9Dsd2zUau3zu51JrO7UcWvoB+7xek7WlzmOVO54TVRZzc8g5F3gIgXFBTQQmAd5DnZYvc8aStvOlLibtLyyal7VOYXMCaT2Z40R52+IwMqqRf7IstAz/9iLrO1zmDkF0xBb6XHFdk9Z9vcgT2ltDAgupatciYzS9hWbPcclZvwNrRrtTga76yqqvqZmts9OHedwchhmFLR+tub/kfu8pdrFar8nIbGZGYpaRMurXXUh5ACv7V/mX8ATXeqDc+56wxGrqGnuSOaxd54jtUV+EHvTX5Ykt3rTGZ2k6x1q9PfRrUiHJ6bC50Nf435ztY6g5E76KkCZUqdgf8ocnjewE7e6mSrnMnMQaIE82EqIev0fVpsH1aBuc8BcwxGlgNlW/H1pJMaTrCWec5CLqsW9Mbd0JjMXKac34cx122uJvRZuFc1fGEXPIORhVCBbwUFY35mcfieGVg1EhOdU9GYzDyhPtePwgVvdXo3q7rwBWMozY2tdQaj+4PcanReJid0hdydf22konWDRYbJZHYtpbV+BEWibC7/HrkOnKuvD9zshcHozjCfkxU7vbcgFc3K9deZzLwnjtiwFuhV5laoKnPcmpXB6H44RrnYixzD/s/i8K3SI9hxTs5n5UwmE2xDVgtqwktx31Q0yDMUa4a+drALnsHINLDDVq6z4jLvFJsrICRb2SpnMpmRqKW3BY6iBoVcJy4qLW35ibaWcFtWBiNjUBNQTshfW+2eeWjcYHX62ixywmZ60WAymd2YWpbLIZSOtTp8KwoKGn6FtUQvB80ueAajC9FTiXnRgMYyOSE/pN22llfORWKYTGYipGI0NlcAhsDe4jJvPdYULkTDYHQVqKmK1l2pv72xDi521HIusnMUO5PJTJ44nrO5/IiCP1xsb7xFT2vD4To3eWEwOguqdCsmmpyEs6hohNPbyilpTCYzNSIK3ntYr1fxqIp+585tDEYnQAW+oT6z1eF7fGAlTbzDFnaxM5nM9BBrCVWYk193Wh2e/traw8FyDEbaoFzsVqevQHJPiVs1VWExZzKZ6SU8flrZWP83xXZPNdYeeAeFEHyuzmCkAs3lJXoWlg1rtrn9X+LMnF3sTCazM0m9Hpy+I2jyYnX4rgmuRdzghcHoAKYZxWIsds8MOtty+dFUha1yJpPZFSQXPDJoLHbvjSc7Aj/X1iY+V2cwEgbcW0Ex916LXFE5sQ5xhzQmk9n1RHW5FrRjXSfXoH/EuqTnqzMYjFgw8ssH+v7F4vC9r5Vw9aFQDFvmTCYzI6RzdbkW2Vz+tX1sjX8wr1UMBiMCVCQ7JozV6V9XWt6iisVkfEIzmcz8JvLVESxndfq2Fpd5/VirVMAug8EwQe12+zilmLv868gyt1Mke8YnMpPJZIJUB97lbyUXvMN7OtYsFnUGwwQl5sX2xnHSMj9oc/q5uQqTyeyW1NemI6XS6Cgq8443rWGc1sbIb6jdLcQcE0TrX87Bb0wms1uzDWltWLOwdmEN044MOVedkZ/oqWomSwEfW0rBb9j5spgzmcxsIKXQtqK5i8XR+Fxx8chfYD0zSlQzGHkCo1uaVbfMsdu1cCQ7k8nMLmq56pUjsIYtcTgceq46izojD6B2r4WFDT8ttjdeSHWTScy5YAyTycxOFts9h0orhuPIcCnWNvNax2DkJNQDXlBQ9TOrw7+YdrXcYIXJZOYEtQI0Vpd/MdY485rHYOQYtAf7ZIfj59jF4sEv5rQ0JpOZQ5Rr2hESdbnGnczud0YuQu1SS0tLf4JzJsrhZDFnMpm5SLtRKnYJ1jzzGshgZDdMbnaL078E50zcLY3JZOYyscZhrcOap9zvPVjUGdkNXcyrIObepfSAs2XOZDLzgWSpQ9S9S7EGmtdEBiOrYESzNzT81Or0vcZudiaTmXfU3e9YA7EWmtdGBiNbQNWS0D9Yc7OzmDOZzDylcabuX3LyyQEOlGNkFSDmPbUzc9+SASzmTCYz3ynXQFoLnV4jT53P1BndHqqcq9UVOJfyzO2eQxmfTEwmk5lxBt3vRqAcN3RhdFeofubWMu94m7uJe5kzmUymmXqgnI3KxCr3O4s6o5shtGsaegX70GKQK8AxmUymicV27yF4L61O/7PmtZPB6BZoaGg4Fl/DuqaxmDOZTGYEoqe6zRXAV2q9WlBQwKLOyDxU17Qih3c8WebcNY3JZDIToO8oDCCsndpaqh1ZMhgZgbLM+zka/tXmbtpndfpQy5j7mTOZTGYcyrWyzeL0HtGOKL2nYy1VBhKD0cXQUi5szsY/WJ3+dZr7iMWcyWQyk2AbWepoVuXwDceayu53RhdDE/M+zpo/WF2+9SXuZhZzJpPJ7ACxdlqlQVTibtqINRVrq/J+MhidjZ7qYbO6/W9zFTgmk8lMjQiSk4IubC7/2sJBDb/XllouPMPoZCgxt9h9M0o415zJZDLTQmmpH4W30+oMrDmltObX+pLLos7oHKgoTGmRzxhQOZx2lZmeBEwmk5krlKJ+hKrJOfzX0aLL5WEZnQFlmducgWJpmbdZHHRmzulpTCaTmUail/qAiuFS1H3XmNdeBiMtUA9UUdmwvjaX/1uL04dzcw6CYzKZzM7hYa0Xhq/OvAYzGClCc/kUOWr/zuoKfM3paUwmk9nZ1CttOn175HrbB2swizojZUzTznCOsTp9j5eUN5E7KPMPO5PJZOY2YThpke+BzSeVNvyVviRzIxdGx2BEtDu9D8D9w2LOZDKZXUdkEaFzJQyqHhTxzkFyjA7AqNHu9A6RO8RW3c3OQXBMJpPZhYQhNbBqpLC6fDdhTebubIzkoKdKWMvq/k2r0e4X3D2NyWQyM0Ksva1Wl/+Ixd5IQXJc852RKOiMpp/b/0sp4m/rLf4435zJZDIzRDRywVos+Q0ClLWlmt3vjDgwzs1dvmf43JzJZDK7B6mHujuAyPc3iqurf6Ev2Rwkx4gGbcdX7PBOYcucyWQyuxfpPF0aWlaXfw7Wau7MxogIwzIfOOwUKeZo6cdn5kwmk9n9eBgpxFa7x4s1m8/TGZFArhur0/ce3DpsnYfSymQyM8ZMz//uRGQc2Vx+YXX6N/Uvbfwjrd5c851hAom5tMpv1Xqb56eYY+GwOTwGrZIWu0Y5JqLI4WMymV1MzD01D6363Cwx5mh+Cj5c76UVw4U0vl7D2s1V5BgE5a6xuTyVeEDyScyVgGNxkLte0V8uHKeW+UWvsoA41dEs+rqaRX9XE3GA0yscjqHC7mhgMpldRMw5zD3MwULJfnJOFjibaY72luxrl6JvN2/CM7+udB09h1FJTv77Vqzh09hKz3tobvZK32+sTt8OK5quOHK7TrvZCu9fpgu4vUlY5cSoqmgU46sHi0trHOLO8l7i0ZqTxYu1J4lFtf8lXh/8L+Ldsl+Id+y/ZDKZXUTMOcw9zMGFQ/5bPCHn5L2VveQctYuJ1VViaHmdKC0PiAJHkxR4v+hXRkKXL+JOcU4Q9WKnbyDWchb1/AWJOSx0+TDMo4cih61zTG5Y4kW6FY4FoLzSJyZVV4qZtTbxypD/Eh9X/05sdv1E7HQfL3bYe4ptZT3EVp1flPUUm+3HMpnMLibmnpqHmJOYmzvkHN3qOkF8VvEb8Xr1H8WcIX3F1CFVorpSznFngMS90O7NeWHXztMDiHpfX1jY8FPz2s7IIyhXu8Xlm4Cygrmab64scrjTe0tLvKzcJybWVIm5tX3FBzW/F1vKfyp2OnrSorFxUE+xvuw4sbbseLHOfkII1zOZzIwxfD7SHJVzdUPZMeKLQRD5HmJLxc/Ep1V/K56rPVlMrR0s3BXanIdbPpeFXTtPb0a997uxpnNp2DyDcssUOb3/bXX6D1k0103OpanBIi/UhbxCWuMz6srEG9X/Ira6fyK2SxHfpAu4WbA/tx/PZDKzhGaxx1zGpnyr/Rixrfwn4t0h/yxuqx8oGivrySPXryxnhZ3Wb0S+F5f5arC2c5BcXoEEvad8CFbYyNWeW+fmNGHtHnK7lVf4xA31ZeJ9Obl3uI4Xm+WEX2cS8c9ZxJnMHKHJmpdzHBv2Hc5jxdqq35BLvqFqGMXLIIgOm/1Mr1PpJLne5Vpe4gqs6ls25G/0hZ5d77kOtXOzOn3nlZQ355yYYwfet0w+4K4mcWmtUwr5H8R2KeQbScg1V3rmFx4mk9nZXK+75j8fdCy55FcP+UdxY/0gYXf7aLOfc9a63XMY5bpt7sD1WOO54EzOQ3O1W1ye/y1xN32nR7XnhKtdm5iaVe6pbhQvDu0ltlX8TGwa2IOEnN3pTGZ+UlntGwYdQxb7G/X/JSYMqSU3vEp5y/T6lS4isBm1RCzOgANrPbvecxn62bnN5V+sW+c5EdVukyyUE7PQ6RdXDXWLz4b8g9hqlxa53Jmvt5+Y8QWFyWRmnspi3zyoh9hc/Rtxd32JGCit9T5lvtxxwds9bVZUkXN4vyiwN/xKX/nZ9Z5rMKLanb5zSitaBIoSZPzhS4uYe+SE9Ap7RUA8VV8gdpSfKHfiPdm1zmQyI5ICYOGGdx4jXm3sJeorh4lT9YC5TK9n6SCs9FJpsFkd/jux5nNueu5Bzzlv+bUU9G3YweWCqx0TsEBOxJoqr1js6S22O46VVvlx7F5nMplxqFnrW8t6itU1/yDG1dYb5+qZXtfSQD3qvemocr1zrfccgtFJzeF9uLS8RRQ7vFmfc27Tz8tHDK4Vq2r/SXwBMS/TJmrmFwsmk5kNhCdv06AeYn3t78TUobWi16DcEHVVcMbmDqwpLS39iS4F7HrPdhhibvf5cIMtOZBzjgmHam8T6urFZ3J3vXlgD7G2GywOTCYz+0gBc3IN2ShF/dzcEnVyvdtcvglmLWBkL2hH9h9u94kl7qbVuZBzrrnZ/WJkdZ1YO+R3tLtex4FvTCYzBa4nUe8pRf3vxbkNtTnkfvehLOyPKCJGisCu9+yFYZ27fJdqUe3ZXasd0ewFg3yioapBfFz9D7qYs4udyWSmzvW6pb5BWuoT6+tI1LM9+l1LY0NHNt8KTRVY0LMU2o2zljf9P2mZ77dQznn2utqRZ47uaK5Kv1jmOVlsKeNIdiaTmV5C1FGE6tMhvxNNVXXkDcx2S12Lem8RVqd3CDSBXe9ZCZVzHpiLQgPZbJ2rUq6FzoB4dmgfsc0IgGMymcz0Ekd4Wwb1EK83nCQclQFRWJbtFeU8bVYnMpt8u/qWNvxOFwgOkMsWqB2YzRmoL60cntViDqoguGuHlYttFT+lgjGdH83evsMTk8nMPLsiLXVt2Qlim/NY8ejQ/qKvs0lY7VlupTs8RwZUDJdWeuAyaAOXhc0e0M7rpNKGv7K6/G8jsj2bA+Fwbg4xH1FTLzZU/zXVZe6sCU2VpLBoSOsfZSK32XuI7XatNSOTycwsMRcxJzfKuYk5urZTxV0rPrO16hfikvpK0Sv7z9PbUOpb8psCl/8fzFrB6MZQOy+rw3c1CvVnc59zuLmK7F4xwOUTS+r/h3qWr+uECayEHL2VsXBsc58gPq36G/Fy5b+Kx4b0ErdXF4rLXf3FNEd/MZ3JZHYpL3P2F7dUFYq5QwrEi1X/JlZV/q3Y6j6R5upmKe5rO6npEspGoxfEqrp/EUOqvKJfmTerXe8UIFfejH8/T2LBEe/dHrTjkhb5P1pdvm+sWR4Ihx1xr7ImcW29U+xwww12XNon7bqyE8QmKeQ7nceIT6SIz63pJSYPLheDKxpFobNJ9HY0i1MlezOZzIxRzcF+ck5WVHjE+KpKMau6j3i36ne0NmCzv7YTmjBho7Dd0VM8MrQ/NXOxZrmVjvN0RL3bHL4SaAUHyHVjTDOarzTdSBXhsvjsHDvhfmU+UVc5THxc+wdygadzstJZXNmxJOTv1/xeXF09QNSUN4hTnS2itz0g+tl9NHltTCaz2xBzsr/dK06Vc7S3vUnYy73ikmq7WFHzR7HDdRx52dJrrct1YuAxYmPN34jRQ+opbdbWDdbHjlJZ6Vanf4GuGmyld0coMbfa/WW5kXPukbvyJvFAXRG51tamcZIi4OULOfE3Vv5S3FPTX7jkonCKvVkuFD7TwpH5MWAyme2JuanmKY7kTpHCXur2i6trBoq1lX9NnRbXpjELBhuErWU9xEtDThIWVNvM+gA57xFKY3P4zoJmcIBct4Qgd7vNFVhQQhXhslfQMWH7SuvcU9Ug1gz+bVqtc0z07XJyrhzyRzF8cC0JeaFdc+9nuTuNycw7Yq3A3C1yaMdz6Jz2cs3/I2sdjZrSlQ2D19pa8VMxuaaKgnRt2bxW6HXepZW+ubh45C90AeEAue6CYEU4/wCbC1WBPFldrx2TpbcU2rtqLWKHI32BcDiDx3nbC9X/La1yNHcJ6EKe+WtmMpmpEXMZhkChXAMfGGoR290npE3UlZU+v+Z/RJETPTGyWNAdWhobtdF2+s4xawijG8DIO3cFns92dzvEFRazu8In3qn7V60TUhomJCzzne7jxJO1vSiwpr9ulWf6eplMZvoIY6DY7hEFzmZxd71NijoCX9MRTHsCpcxuqPyVaK4eKvqUZfdZutyQtKKNttXp+6K0tObXupSwlZ5pBK3zxgFovmLJ4pxzNSF7Sct5Wq1LbC8/MS0V4XBmjnP4Z4acTGJeZPdk+WRkMpnRqFWWbCRRv1eK+g73CWk5U6eId+exYlZtIUW8Z7Xb3aGXhJVWutUdmGzWEkZGoQXDWRy+l7LdOtfoEf1dTWJe3Snk4krV3Y6/R0rLmzV/FGUuL1nm2T4RmUxmbELUYan3dbXQRn57GgJr4SncNKineK/6H4WrwkeexOw+rvO0wUq3uQIbiour+Sw90zAVkTmrtGJ4VheRUZMQxRvqBzeKT6v/noLhUjn/Ild92bEUzd48uE4U2APsZs9z2mgBo4pZGf8szE6+1w69oZPbI94b8s9ic1nqwbVw328p/6mYUlOZEy1W1Vm61RXgiPcMg3ZS/dz+XyJaEQsVzkUy/YCkNgE1d/v0WrcW0JKimwxuth3OY8WNQ0ootYXFPL9pdXrFqdZa0ds6RPQd0KA9c3LelEDkWeBzklScSm7kzxxcKbZKIU71PJ3c7vaeYk5NH1HgaM56QYdm2Ogs3b8ZWmLWFkYXQp13FDu8U7HDynbrHETaGM64n67tJbal6G7HTnzzoJ7ircH/JAa6fZSvmt3uMWaqLCprFFddf5c456JrRZ3/DHLJ9rIMEacU1YiCknr6b1juJW6/0BY5FvlcNH7X9gAAIABJREFUINYVNFh5tuYkqgWf6rryxaAeYvmQf5fPCfXJyPj1pUplpUNLzNrC6DrQDqq0puXXuWKdG9Ht7kbxftXfi01lPVNyj8G6Ry4qqkj1Yus8rwkXOwS7ecy54vDhwwI4cOBH8emaDWLe/MVi+lW3yZ+dJ0rLA6Jvab34U+FgUWCrFf0HDqO/L2ErPqsJKxp9zUdV1YjNFT8X61Oy0rVjvM8rfy0Cg3Mh2h0MWunQFLPGMLoAagdV4mqaQjurrA+E0867MOmGD64Tm8p/ltKkI+tcbghWVv1elLF1nvfEYnWqFOjnX3yNxPzI0aMiHAcPHhKbt2wXS19fKW6960ExbvJ0UTF0DIn6yUXVZMn3kWKvXo+t+OyistLnkZWeWm0LuO23u08U59e4qQRt9rvd20e881l6l0KrCicH/6WS8uyuCqdIpV7l5LhwsD3l83NEs+509BS3DS6U1nkunHMxO/xcSeu8D1nn55FoA21tbcTW1lZx9GgrfcV/mwHR371nr/hg1afikSfni/MuuU54RkyGe1L0ttaSyBfY6siNz2767k8qVlUWEFMGl4sd5amtL3SOXtZDzBrSjxrG5Mb6Eox4P9kR+LkuNGyldzaMIjLlgUEo36dXhesGD0TqE+5UR4u4p7qf2JHq+bncQW8q/7kYUVUjCuz+HHCJZT+V2HW14Cl3+8uvLiehhnhHgibwbSTwYLjAA4cOHRKffLZevLhwmbj2xnvF6DMuEYMqW0Tf0qHi5MJqEvp+Axsycp3M2FRHeuXlHrGq6u+ow2JHj/SwNuEsft6Q/xP9HIGcKRkdrB7nnwSNYSu9S6A6qjVnfVW40AnnEX0cTeKp2l6UM9pRQV+v8s4H/54aNsjxyfi15TMh5AgcOlVas3BfFw5qJJHtiveG1dzbUismTLlUivRRQ7gTQbgVH+nv8Jo7dn4pXlv6lrj7/kfF5POvFtXDxtJ19hvQwKLezUhrjLNZPFvzvykF3ao15o3yv8+xIz3NSkf1uFO4elznI3h27rfZtAjLnLDOwWLJErkALi7/vdiSwhkX7Z7lZH2i+v9o8ubK7jnbiBQxm9tPQg639M0z55CVbK8eIfoOGCq0QM7Oe3+8PoTVWTNSrF23SbfOExPzyAIvTAJ/lBiu8a3yG3v3/iBWf7pejJs0nTwDnX2dzCSeCUphaxZXV1nFLmfPDheagaBvHNRTfFT1WzG4Sst1zw1BD1rpNmeAa7x3OlSLVJd/QW5Z517a5TrKfeJt928poK2j7jBM0l2OnmJGOZ+fZ4qICC+UIt7bMkSMHHeBWPneR4boLVvxriiraiHXNCzoTnme5MYQZ92wkue/tESzpqO42lOFIfL6OTyseeD6W2bROXtnXSMzeao6F2dXV4htrlTO0VHX/RixfvBfi/qqRmoIkyuCbkS8u/2bOOK9E6F2Suh3jrPz4iyv2W4mJgNKslZV+uh8C7vfDgs6mrC4jhMXVjvEKWWcrtal91EKKdzpOEseJEX7wUefEz8ePGhYr+r8evkb79LZM4LVkMubzs+AxaioTBPzR554QXvvFCzzZHHkyBH6OuOme8UpLOjdihD0Pna/aK6oFhucJ8r1IoX0NVSgrPiFaJGvhdfMJU+g1Bau8d7ZKC2dppV5dQbuyoUyr2amU9CRUrLVfaKYPGQwRbWyhd41hJDC6oaLfdJ5V4mNm7boYqqiyDW3tRJ1RI8P8U4QvYpryKJP9bwZf4+YCaSW4cz+safmGxZ0gsfmaYE6q7/u5vvYQu9mpMJVjoBocAwW6+wnig0pCDrWJxwNjnMMyolGLWbC84vsKWk4LtDUR7CFnmbQgNpctf9gsXu+1Re/nDk/T6egU4S73H2PqqrWI9xzZ6J1R6ozYuRp1zSOFy+9utwQ7UjpYOr7wNZtO6lqGwLXlAsexVuScV/a9JQxnNNDQBuaJoq331lFr68C2+JBbTrMKWwd3QQoQYeFzoLevaitMz4x2FUvPi3/ldgorewOrzMk6MeIsY6ynBN0C7TF7mmzuZpEibN5ILSHrfQ0Iljm1Xd1rlnnwYmWHkH/XAr6Rinop7Ggd+49c2pn5XCbFw4aJq6+4W7xzbe7QwQynogCh48cEU/PWyhqfWeIU4qHiIKSOrKwjRrrLs2ND+G26S79Er2wCz4HLHKUbsW5/J33PSK+/W6P8frxxDyW4Gvn4VrwG1z2iUbHqzP0mXc/RJ+rhIPiug211DWfcLgaxery30hB73jqWo4Lum6lN8NKf55ESI/fYqQRVpf/M8o9z6HzczXRWNCzh+qcupcUYP+oc8SKN983RFC51xOB+Vx9957v6cx7xNgLyH0OV/zJUhDhwke0uCL++xT5M5xPF5UNE43DJ4u7Zj0qtu/4MuQzJAL1OW+eOZs8BXMff16s+niN+PKrb6J6FuIF1ylBf/LZl+kaOMq9+1AJutM1TAr6r9lCj802iolx+r8aVNn8e12C2PWeKgzrvMxbr6eq5ZSYq4nGgt79qSxkiOqAiiYxa86TYt/+A4Y4J2rFhopq6Cbg0KHD4vMNX4gnnn5RXHPDPZRD3jLmPOE/7RzRPPpcMW7iNHHljDvFQ4/Oo/Qw1GSn1xGJWeXhwvvQo8/R5gBHBnCRw9uAVLczzrmMUu2WLF8ptm3flfAmQf3ektdXUiU5FvTuQxb05KiC46QReYVZixgdh7Ejsjh8b5e4c6PMa6SJxoLevVmi53Wj9eiZ51wu1q7fFCbIqUWemVO/koFKFUvcKm8TR45o59zLVrxDnga6PrlZVm58FL9BpD6E/lRrnSirGk6NXS65/Gbx1jsfGq8T7fWBXV9+IzcGp1H6HheY6R5kQU+aZKVbXf4v+5Y2/C5ckxhJYpp+blFSPvxPWpnX3AmEC59oLOjdk6pkKyzYqobTxbz5i4zAr3QIeSRBDBZvUa/fZvxMCbh2tp3c+5vzxD/46DNhHzyCgvHCK9dRURxTA5Yiu5YG95+9nGL85EuN14qHCVMuI28GW+ndgyzoyRMeYRiSNmegHlrEVnoKMNztds9dVEjG4c2pYDjzRGNB716koDe3FvTWb8BQMf2q28XOXV+HiG4yQppu4U8WKsgNQMocFbdJsGIdnk9Y8LC26/1nin379huvGQlqbB59cj6d93Oke/cgC3ryNATd1fR6pvUw20GujaqqMT+TFtI3VictCmyhs6B3Okv0+usQI5xdv7nyg6B1nETQmxI3JXydYdEnArMr/7kXXtWPDxo6ZDnjjP1Dad2r64kE9V5ff/OdqKgfTUcV7HbPPFnQO0TSHDlXDpQ6W/5bkyaOeE8ayjq3OBpPy6Uyr9EmGgt69yHywmFV3jXrEbF37z5DvFqTdG8rwUP1NBU8R9/vIlE3f4Z9+w5Qn3MIOXLWOyLm2Ahgk4NxAWJFvKv3RQQ+ovXTXRGPmTxZ0DtG1Svd5grMNGsTIynoddsdvpUlbhZ0FvQuuA9OOXnLPGLiuVeKz9Z8HiKKyVjW5jz09Ru+oEj1IZ72RWeScdsng2B1Ou0zf/jRp+K0CRdRmp12nR2zlrVWrHVixLgLjBKv8YLj0FO9zn+G6FvKjVoyTRb0jhL13QPC5m5aU1ra8hNdoDg4LlGoYLhih6+XKec8J93taqKxoGf4HkiRQ19v78izjVSwZKPOUYBF1U1H1zG0FC0tD4hT0Sd8QAOdx086T24W1m4wCZ8IqdDWESirXwuiC35/67Zd4qbbZ9O1qRSydDTRQBT8B3Hc7uafLVn+tugvr1+Nc6bvdb6SBb3jVIVm5PM7GtrEVnoSMBqxuHznwtWRy9a5mmgs6N2DEJyPP1kXV6wiiZcS5LdWfiiaRk2lwiqq6hulv0hC3GHpTrvyVvHRJ2tDRFyd0YeWYI1MIxLe9L7qpTZt3ko55K4hp5GLHJ3X0mUd43Vg6V9+zUz9uuNXowNm3jPXKDQDT0im73M+kgW94wyvHDeNK8clDHJlFNgbfiUHb7OVFqLc6XsebaKxoGeeODdHuVKUUE1U0M3n1KjWdtX1d5EFC9c0Xi9cvGx6wB3EDWfZYydOE48++YLY9MVWIwo9WeD9t+/YJeYtWCTOvfg6MbCymYQcAWz0GdL5rMrrQe463mP955vjjlNwA9Imrr91Fn0uSotjS73LyYKeDnoO25yNf9CkikU9LpR1bnM1ufTKcDkt5mqisaBnntoZcb1oGXu+OHT4sC5IiQnqvAWLRXXjONoQaK8V3SJWdeDxb7jC8TdopzpqwkXippmzxfPytVZ/sk5s2bpDfL93nzh8+Ig4ePCQOHzosPhh335q6oIz/gULl4rb7n5IjJs0TThqRlL/dXgAILi2NHRwi0Z8duTlX37tHXEFXYm6+nrrnX+howdEvqcrnY3d+AmOk4MFPRUibbpUS5+eCo0qLS09LrNqmQVQg2RzN92ci41Yok00FvTuxU/1oLhoLmVzatbk86+SwhzsmJbM+9hcevEWaa1D3FF+VbnqUV62sn6MGBo4i/K/8bVy6On0fTwzVK61sFqcKt8bXgH1Wl0zRtpzpSrHJSLqasxefnW5cFSPoM+P19A8GcmJss3UoKbvgKEs6gmQBT1F2rXgOIvTt7GgYMzxmdbKLIDmwrDYm/5ZDuDuXGuTGmuisaB3D6rULDRKAaKlZikB+2j1WrKMVXW1Dj8D+hm7qs6G78HShiWLAjCK+G983+jIRmLYedZ4NOK9sQEZOf7CkJS8eKKuxm3d55vFhdNvpI0MzuRxPGCuTqfGQ1HrOmfqMldSr3tDPKKheSK9Dp/Nx3nGHCzoKbINx784BrY5AoOgVRwcFwPKOi9xN40ckCfWuZpoLOjdgzZd0C+95vaYlmewZvnXVEIVIptuUYVAhQubRm9az8U7SogrvAkIeKPNz9FEgghDm9G8+8Fq8efLbxHu2lFUJvZkqh9fSxkHsLwVsXnoRV3mtNiDwKip4ra7HhKrVq+hWgFoXIPjEk6Ni/E8OVjQU6XKSbe6AzOgVSzoMRBMV/O+lquNWKJNNBb07kEIAoQF59mxrE71faS41XjGk7s9P92+HlE0qFEsXPR6EqLevmoeesnPf2kJxRCccfbloqHpLDFUZ33gTPIEXHrV7WLuY/PoOESlFqoN19LlK8nKz/x4dF+yoKeButtdclUPzkWPBb0Ri937nxa796DFkR/udjXRWNC7BykfXVqE9YGzxIEfD0YVdfU9dC5DilofKpySf4KOaPX+UkiRIrfu8026qCcWrY8h1IrgtLX7Psb+wI8/EvdL8Q73lJjz99XPrphxB1nxXDs+yrPtYEFPB1HfHQHbNmdzP1IuTmFrj2B0u29sPuSeh080FvTuQVVgBpbhjwfjCzrEC+7ePiX5KeggnafL60fg3hdbd+jjklwVPHW+Hq3Ajkp9Oxqhwp76/a++/lZUDxtL5W3z01sS59l2sKCngxTtLjVK/vtWaBZHu0eCvsuxuZrm5Xrt9kgTjQW9ezBooZ9puHVjC3qraB5zXkYEPTxYTAso80UVM/X76ndLTMFnqX4WJeoNTRPFxk1bjbHpaNn68EI68aBE/ul5C42qeJl+lrobWdDTRN3tbnX4P+NSsJFBg2GvHvmPVodvvz5weeFuVxONBb17EC5kiLNv5NmGlRlJT5TIHDp0SAxrntglqVNaJL3PEGKkquGzws38p8LBWgqbtZYs1Eh/j/Kz+Dl+D8Tf4XNrKW/a66ayKdFEvY76xr+pp7Ml22q2o8Dt0NgmJp93FWUelLCohz4/Dhb0dJLSRCsCxdAudruboFwWRQ7PWaXlLTnb9zzWRGNB7x7EJIUYTL1ohm75xQ6K2/P9D6K8bjQFZHWGoKt0OBDCeyoVoqkmIUcut19uPC669CaK+H7y2ZcoOG3lux9RWtja9ZsM4r9RkhY/f/jx58UNtz1Af4ejBUTpF+ivi6+qME1Har9DRLFJwNfHn34xRNQ7u3Wsuldr1m0Ug6qG66ls7Ho3niUHC3q6iAws1EkpcTddbtYwhgay0C1O36J8im43TzQW9O5BuKKROqVSsaJZl0o8NmzaYpRzTefnUK50iDgKsGCT4RoyUoybNF3cN/sJaniy68tvKCgvFeBYYeeur8Vry96iVqejz7xEDKpsptzw3tKax3UlW/gFn73IrhXKOf/P14ttO3bRe7XpDWQ6U9yVV+W+OU/QuLGVHiQLejqpF5mxe9ZzCdhQkJiPGTPmeKvTv0k7+zI6rOUFWdC7D1VQ3Iq33idhiC7o2vfffmcVubLTZQnadLd3ge5Kd9aMFBdMu0EseHkJCbgSxpDPQk1djhrNWlqj8Khq6KJ+ry08urxN4Ds4A3/0yfnizHMuF6XlTbTBwTUmU4lOO6/36xuRUeKBh54W+/bvN94nVgBcKlCvt/eHfaJ5DOemh9wTBwt6eqmJepHDw0VmFNQgFLk8lflonauJxoKeeUKEcP6Mmuzffrs7ongqKEtwzsPPkOClmiqlqqPBpQ7LFoF2Dz36nNj55df659AFS5jTtdr076QmgEGxbx89Dg8E2sAigr23XvDFlsRZe4k7QMcREPbGlkniiWdepHK55rFtNXWYwzXF6zIXbxOgNlvYlKXbc5LNZEFPL41od2fgBrOW5TWMVqkO3yw6P2dBZ0HPEFW3tetvmRUiDJFFQxOViy69kdzTHbUCVeQ5RBzn4mMnTROvLX1LHDx0KOS9NMFLLOI7FQRbs4YK5+49e6UYv0T94jVhb0jSWtc8H6jChw0Txvid9z8W+/cfSPqaEol8V/fu2pvupXuKjUWmn69MkwU9vTRaqroDr5i1LJ9B7vbi6pG/sDr9n+tnEnnlblcTjQU9w/dAig6sObiYN2zcootCnIA4KXI1jeM7nPeMDQRqsyPy/LTxF4rlb7xrCJHqjd7ZAh4PKvdbfY59+/ZTahjS03BGrQLoErlem+6Gx3idojegQcOZS6++nQL1Vn+6TmzbvouKyhxRRwM6kU3w/fc/iLXrNsrNxff0WWKNjfrZd7v3iDrfGdqRQZ4HyLGgp52UiSWf44PFAxv/nRQtn6PdVai/vXz4nyDm+dAqNdpEY0HPLGHBQWRuuv0BXchiWed6udHX3yGrM1kxV7nfvSw1lOKF82q0SFVCFG4ddweEu7v3fL9X3H3/Y2KA3ADBYo/U+z3W9VOwmt1LDWcw7vByICodfdZrvRNEy5jzDA4//TxKDayoH02ejGtuvIc+Q3gMQDjUfXr+xdc4N93Bgt4ZpNru5Sgy45sALcvraHd18RaH54J8KyYTPtFY0DNHm55qBVcwqo0pAYsnFJddM5PEKJlIarJQBw2jUrHTrrxVfGM6T+4OFnk8wGI3CzvKvZ419QoaB0S2J5vH3r7DXCNZ0zh+MJPy5eXPYNXj5/GCFhXU55x60bVa1Hsel4VlQU8/kb6GRmLSIJ2padq0vBV0o7KO1RlYlq8BcWqisaBnaOzhapdjhPSw5SvejSsSSiC279hF9cvxd4la6NT4RVqzziEjqSe4er10RXtrZ8vBALejIW7r1rSmjJkLxhw+fFg8+tR8UeoOkPimcl5tdZgr4AUZbKPqJ68ICv+gBoD6LNFgpBdu3EIZA4V5nJvOgt4Z9LShfbH897bS0oa/Cte2fAJddGnNxF/LAdltyZPe59EmGgt6BsYdz5xTC0ibM/eZuOKgCYQmYnfe97DWCCQB6xz3F+e3cE0j6G3zF9sMseloFbVg8NrRDr+G+e87KvLm5iirPl4jvCOm0Lh0pnubghfleyD6HohXN179/MFHnk0pgDHbyYLeOdSatTRhPamCpuVlcJxyt8uHzJPP1rmaaCzoXUuIAty7sJjvuPdhU2pUdGEI9kD/RlTUjyHXeTxrT/0caVuXXjOT8qOVEHYkultFu7cX1jbx7Xd7xOfSEn3z7Q/EkmVvi5dffV0sWLhULFy8gtqLrnxnFaWhoVVp+Hur7mUdcftrn0srcIN0v0nnXUXjSpZ1Z8wXFcDoDohPPltvjGeszwcgoh7Bh/l6ns6C3jkkt3vlcPk8Nk0ya1teQV10idN/Ec4gMCiZvjGZnGgs6F1Dm35mi0Ud1jUC0oI122MLmfq9mfc8RJZePOtcCQ9cxLPmPGG8R7IWdaTzdbQUXfXxZ2L23GfERZfdRC1cXbWnUZR+35KhWs32omrxf4WDqaQr/htnz/i5u3aUGDnuAjHtqlvF3MeeFx9/slb8qLeKNX/GZIVdXdf+/T+Ky669g86s09X8JZwl+vHFWedcERJQGO+zvfPex3mbm86C3jlUFrr890pd3vLX5S4t89XoLVuch+lq5onGgt55Y6vOXlXwG1zCoyZcRC5itdgn6mr/aPVaMaCiidK1YgkVfgYPQLEkUrKU4CQjksFqatp/I2UMJVovl2JZ5z/TSP8CcXaN83yIlbperataQG+64jc2GCj0giYqEHwVXQ5X+Q233S/eX/VJSA58sha7Gkv8T5Vf7SxRVzEJqmZ8vI2S+vlNM2druel5ZqWzoHcWPa1W7VnaZq30/casb3kCQRfbr9T/T3IQvtGDCvLy/FxNNBb0jtOmp0FFIn4O4YOwnGqtE8NaJonHnpov9u0/kJAIAErQDh48JMZPmq67k6OLgRJOCOW8BYs1YUyilWi4hYzc7HseeIxEl7qrWWoo3UtFiKta64kKJwl+WHQ5ou4hchD74WPPp0Yv6ngg6FVI7AJU73Jg1l+eDIp6uucNKvvJzwuPwxa9D3siuek4ckBqHMYwn3LTWdA7j5S+VtEibO5mJ7Qtr87R1cUOcA13oWONXPzy9vxcTTQW9A6OndNL9bphbSpr1UyMLdLRLph2o3hl0QrKnw4Vqfg4qv/evbM1izO2mGtf4Waf+9g8+rtk3NfBkq44q/+azveRfw2x7aPnvCtrO73j6DM2QH2k9Y7rRLnXx55aQGfP4Z8tHtQxAYBmMr11UU/3/cdn7m0dIi65/BbjfeONL4AsA2zM8ininQW986iqxsmvl5s1Li+gLrbY4bktn/PPzRONBb0D4yYXY1hZaF5y35wnSfzuvO8RIsqUzn9pifhszQaxd+8PxkKPL4mWUFVBaMBLrywXReTS9sYUAQSCQbzUmXmiYm7eYMAT8NRzL4vBw8bSpgRWaLIdz1Kh6vTWTz+eQA32+S8tFa36WCS6EVJHDOgId8WMO+J6Njr6WeFdaGyZTNXk1PvG+1wA6gicmkcBcizonUeq617egnz0580alxdQFeKsrsDLLOgs6B2eRHqkM7qDaUIT292ajKVsFtgVb30gygYPj9vznLqLSdGCUJgFLZH3Ur+H0qZjJ04jC7nfwIYuFfJ2z6VutcPbgCBC9E/fvuNL+pyJnq2bjyumXHC1FkyYxrrqalP3yuIV9D6JbDbUJm3egkV0hJEvVjoLeqeyTT9q22dzNv5BV7p8KAOrXSRq35qEPG/Pzy0OFvQOjRnanMqFfGjgTIqqhm7AElQFVFItpKIW/Q8/+ozOaPFesSw5irq21YrRZ14s9u07ECJm8QRPidBz8xdRKVVlyXYXoVFn7vAWoFTtoqVv6uKZ+IYFQF11FITpk6aWphhzbHwQ5Z/oeKuxxjWUVbVQnEN3GedOv48OFvROZhuVMHc1FZHS5UNdd+WKsDh85dSMxZGf9dvNZEFPnqrX9kXTb0x4MU8EIZb5m+8L++ARRsvQqPePgrMaqBJZ0FsQ31IMpnkdEFddfzdZwahk1l3Lk+JzwWuAhjII0jt06HDC16o2SO9/+AltWlIVUi2LwCMGVjSLdes36Z8jsfPzxUvfokyFjjbVyVayoHcuVRlYq8N/HTSuoGDM8ZlV2y6AusiS8qbrkIwvBf1wpm9EpsmCnjxVq1P0IyfB6GC1tPAFX20Mnpv/KjUKwaIfz5qEKOAcd8HLS0PEK+Z7mbqXTTn/arJ+bZ2U3pVOqrGgQjlX355UtoAal9lzn6a/T8VKt+nWudGoJcGUNdSA1+7rsKTrzmc7WdA7l0Z/dIfnDmhcXhSYMQXEzaH+53IQMn0jMk0W9I4RedcfrPo0YUGJtdirv0cUPESCmoEMaowrOprbt0b8+Ypb6e8T69UdrDiHUrCI0O+uVnnE59WpCSo2IedcdK0RBZ9oMBrGGtXkqEtbB0Ud8RP4DJ+t3RD3/qv3RWpb1dDT43pccpUs6J1Nva673fNlYWHDT3XJy+l8dLq4hobJP5UX/nW+558rsqAnOV56/nFF3Wjx3e74vbGjLfLmoi2wHuFi9592DgVuJZLTrT4HROJLKc5msY4nLhDB8ZOni5MLq9MaJNaVxCakly7qB378MaH7oIQXQgzXe3GcAj2RqIIPp1xwTdz3VD9DJbzTz7qEUtyyafOU1nnjYEHvZEoto2f5cJFj2P+R4uXyObqyzm3OxuLQQcj4jcgoWdCTo03PPUbbzkRERPsdzc1ttsbV361Zt5FS31AaFdZbogu+Osd/+IkXQsQqnrigEtvk868my7w0S8VcUTVKQWQ/ghITuR/BBjePkHcjWWtZCfrzetGeWOOu3PyPyHtEzXTyVMxBFvTOp1bXfYR8zoaPhNbldDtVdXG4WFx0PtdvN5MFPTmW6O7eG269PykhNf5bEme/y1a8I6ZeNIMsRM0q9yZcOQyigoI2I8ddaAhZzM9g+hwIgKM+6lku5sGx8NF59r0PPK6JaIL3Y/ee70VD00Q63kjUSsfvIX3QWXMaFd6JdH/D32fnrq8pOj/fguDajZ2DBb2zqfLRLY7GS6B1OZ2PbkS42z03lHL+uUEW9OQIAUFBkNeWvZ2UgCBtarkU8evlRmBY8ySyxmHp4Tw2WcuNAuGkoC99fSW9dqJBWc++8CrVUc+lM1wlkhDaV197I6HxUJbzY08uEL0tiRecScbdrt7jL488q9Vuz5ENVIfvk4MFvbNJFePcTXhO39VlL3dd7j30i7O5Au/a8rxlqpks6EmMlbSii6QAD6psFpvDh0SMAAAgAElEQVS3BPuKxxLRRUveFC1jzqN8chQhQfcxuNdVGdVkPwM1BZEbinGTp4dUoIsn5mvXb0pLylZ3JDZZSGmrahgrduz8Mq7YmmMJELeALIFEos6x8ULcwV2zYvdCN17/wAHhGTGZNm+5NubJkgW986l1XgvAUv/EZJ3nZGAcXVRpacNfFTs8G/Qc9LztsGYmC3ri1FzddaLl9PPanYVHE9JzL7lO/Nepbkwyo6FJKos7lRuV1vlio8BK/AhrVEobi8YuetvWTI9jZ5CC5Cw14sLpiRV6UeOGFrbxauQbc0VPEcRxCQl6lLFXr43CQPAcZHpsugNZ0LuGmpXeLIpdfhs0Lyfd7uqiBlY0l1C6GlvnBlnQE6c6P7/qurtiiqk5uhkWWiL55IlQiTk2FIn04VYWJGrLp5p7nQ2kCn7SGn7xlWUx74953JAqWOc7w/CaxHp9la62YdMW/fUjj70SeuS8n5JlaYGddm8cLOhdQeV2tzg9DrP25RSC5+deq+ZuZ+tckQU9cSpBf3rewhDBDIcSkjVrNwj5zKXt/ekMt3hISCe1eIKFoCw0WumXB0FZqlmKd+QUo+hMrA2PGr/b7npQCxSMU5EP1nZ53Wixd+++mK+tXvfiy25O2PrPdbKgdw1VYJz8+jA0LycLzKiLKnZ4buaAuFCyoCc1WWhh//iTdTEFVQk9qrelq8uXJiiNVOIVIp2oWM285yE9qj0/RMVI53s8fjqfsrA/+Wy90Uc+1vgjIn5Y80Q6wog3/gA8KQXUUS23N1IJPb8OFvSuoKoYJ78+Zta+nIK6KKsz8Jh+sZyyppMFPcFxos5aDWKIZ7z4Yd/+mAu6EpHLr70jbWKqhOqC6TfEFRP1s23bd4ny+tFxO7XlEjXhbaB+6vEsaTNOnzgtZjtTddwx/PTzjQ1bpNcNBsT9KOoDZyaVFpfLZEHvIiIwzkWBcatOOqnhBF0Ccy4wji5IWuYLuWVqKFnQE6Oq340iMCTaCYjEqAkX6xZamgRdWvsLF71Orx0rXU5tKO6+/9G8ss5Dxkreq2fmvRIyHpGgxPnBR57T0sviCHrzmHPl30QvYmOOnxjadBZHuOtkQe/i8Xb6jzprhudiK1XtYgZW+P7F4vCxkIffeAcLeiLUGrJUi3tUAZM4KUtwi5dVDU9Lmpgq84rz26++/jaqmJi/f0BaiJ7hU7Ta4XkmKDa9ney4SdNM4xJZ0JXbff3nmylXPJrbPREL3dwtD96BOv8ZbKGrZ9jBgt5FpOqn8EIXSc0za2COQLsYNH43udrzvuSrIgt6guPk9FK0+lsrP9SFIHZA3PIV76bNOlO55xPOviyyKkV4f+S/Q4DyXUziNdBRonxEWt2wvrXCO+3HTJ2he4ZPNs7QYalrjNz3fsTYC/gMXY2fgwW9q2ico9sbL4T25dQ5uroYS5lnZAkXlGlHFvQExoj6XzcKR/UIaXl/FdE6U1CucNQKT1cnMypoIl9rzsPP6kISP7r9kituyesIa5WRcOudf4kp6OafXXvTPVRzPdKYKS9JZf2YiDEU+DfOzdHF7o233qcWuDhDz4fsgkTIgt6V9Bym9uAu36XQvpzqjW70QHc3X4Ya7twDPZQs6PFJFrK1lqqzBRfw2IKKbmbUojMd59dOrbTp+wlamxCcId4JCeVW5yptenncptHniiNHYufsqw3SvAWLo6avYZ5oZXoDYuPmrWL37u/J+n/uhVfF7Xc/JM6+4BpR6zuDshDwvjieyadgxHhkQe86Ui56ebMcc8/jJIK51HVNCbq80OkDKuSuhQU9hCzo8amdn9eIm2fODhGAiNaeLhqwDBGYpYqRdPj+GOfno8Q33+yOKUxK6Fe++1Fei7miqpOP83E1Puqc+2ir5i43d8DbuGmr1lbV7qEjlkivh3vZ2DJZOKtHktcGzwW8J9i8UR97xEy4tLK+1g7c60jvmwtkQe9Kelqt8vmTz+C20mlGx7XcinS32D1vcw339mRBj08VYf7K4hVxBd1sLT/xzIuINiVx7eg5qjkYK1huNvJ7qs91/1+e5ApljmC0+zy91amKTo90r+DV+Hj1WlGRQJqfEm78G2MMkoAn0Mfe/NlA9bf4HjYI2qahY3X+uzNZ0LuSSF3zQ+u25FpNd7qIMWPGHC8X1u1WmiRcJc5MFvT4VJYeGpyYLeFYMKzl9z4iN2zfAR0r/2ru+R3vvZXlft6fr496FpxPVGOnSvUivmGfFO4NG78Qr7/5npjz8DPiihl3ilETLhKDG8dSf/hYxWUUkxHucOKeQLgR5Ih7hGYv+FpU5hFlg4eTSx+bkFOtdSm9T3cjC3pXUrPQ5b93ORyBn5u1MNuhN2UpPU5O1K02FvR2ZEGPTZvekAM12Q8dPhwinLFgTmH6SLf80G0tWZHFAo9F/45752qiFDVdTvuKCGxUM+N0qWBtd9/Is8XV198tJky5VNQ0jjearGBc4TJHJDoyGBIR81Q+C76igYxdCvfYidPE1TfcLe6d/bh44cXXqPrgjl1fUZ34J595SZw19QrRt6Q+Z7rjsaB3LY3e6HbPMKWBmZXiNEC5G6xlPrveYQ3papyyZiILemxSQRlpQV0pLTkAAVaJWOhKZI/obl4EtA2saE46UMqmR2vPm79IF/TobmMA7UPLqlpyRghSfr4RgzBwmDhZjiGOTZRwq853JeT69nXq+bWqA4/3ve7m+8SmL7YmVOnv+QWL6bPlwr1kQe9aaqlrwzHuHmhgTgi6uoiS8iYfwviLHR4u+RpGFvTYVBHusKbMDT9UgFUiUCKM2u6ox67GPaH7o0drL3s9sZadqz9dl/Ex624k8XZp4t3Vwkgpj/oGYvHSt7R7JZ+bYHBeK3ld1PPU1qZ/T7+fL7+ynDYk6fgc5nN7dXbfVTnyLOhdS5WLbnE0nmbWwqyG0ZSlrLGRa7hHJgt6AmNEddyHijr/meKhx+aJ3Xv26iLalrC1rkT9jnsfTjo/HJbdp2s+DxHudq+vfx/CfyoXM+k2VOlzOK/XnoPWhJ4ZiLs6Xpl25a1x29+q8/ZwwVbPD/Lh4aGAtwdR+SD+rYofdXa8BQt611Klrlns3mXQwGm5kLpmtE11eKfrLeVY0MPIgp7gOOmiDvd7Q9NEipw+dCh4ph7PWjcqkh05KkadcXHSXdjWfb4ptqDriz9qvXOEe/egir/wn3aOUV0uUg/1aB4fdU/fff9jOiog4SXx1YXbFRRtuPQhzniucP//1H+wfFaH0Pfxe+j5Pn7KpdTcBymVN93+gDjvkuuEd4RWHhgbBhw5dJYHgwW9a6kEvdjhWQ4NzAlBVxdhcwWWc5W4yGRBT2KsdEuGhF0ugAhsWrNuY0yhNUP9Dqzt0hj5zqETU3PXfr5xS1RB0Bb/oFsfizmC6TI9XvlOVa1u5j3RAxoTOUv//vsfqMsfNgdIgTxVt7QR0IevhQOHCUfNCOowN27SdHHldXeJ++Y8Qc/Chx99KjZt3kq1/SMBUf+oW3DhpTeKflLYsXHoDGudBb1rmZOCrirkyAtcVuLmLmuRyILegTHTA6qwsJaWB8STz75kiG08S12J+k23z6bFOJ4bFQFRgypbqDJZLAEwBH2hFPTCwWyhdwOqgMqXXlmm3aMImz7cT3Rm+2LLdioba77H5ns9fOz59Dx4R55NFQvRmnf23GfEy68upywKlCRWXoBY0Fz5WlEdzbMU/D7O+Cvqx4iCkvq0izoLetcyJwVdXQQuitumRiYLescJCwxBbjgjnf3Q0zEF17ygAtt3fJlQERNloSOdCWALPTsIzws2e9j0vbgwuqBfOP1GUeubQM/BzTPnRP29L6XYI4MhnmgbwXZHQyvhRTsWUmf16vlZv+ELUdVwekrFkCKOh4MFvYupdV2DsNsb/0cXxOwXdcBi93ygVYnjHPRwsqCnOH66GCOXee5jz8cUXQVlpd9yx18S7le+zlS+NBLanaHneVGZTr/vjsiBaCr9DRs9uK//4xQnub/N98iMwGnn0DOAM+xzLrzWENl4oq2i41WQXaLBmbGgat6veOs9uo5EjoSSGS8W9K4l9A5HzaXlTX2gg1ltpRvWub2pD8TcwmIekSzoqdOmL35wj7/59ge0KMbu7qUt2LC6B1Y0UZWwWFY6fv7JZ+tjvq6y6paveIdbdqaRkaPHg/e7T6kWT0Hn2ZLw1sDaRq33ptFTqQrdS68sD7nv5vt4+TUzKfocf+MfeXaMOv1txpFOoumSmrXeZgi+YbHj+1EC8RC0CVA2RpRGNR0aRwcLetcTJWCp+mEuCbqnj15UhgU9AlnQ00Ms+AhaGtY8SezR09oSCXiacsE1MSPeVR76kmVvhwh3yKLd1ioO69bV6k/WGZ3BMj0m2UJNtENrq6v7gRxwjH9vEu1qqi6HsqwQOrTT9Y2YIqZePENced2d5KFZ/sa7VPXt62++E4f1yoKRoFzcCJhDChnuF1zd38WJlYj0HAXd5qE57R2B+ruvvv5WVAwdQ42B0hH5zoKeCbKg5x1Z0NNHKtNaVE3WDRDLSlfC/My8V2LmGKtI6ede0CrFofyssrTC+3EDX371jXDUjCSXb7ZXF0sngylfoe5xCCmsYwSCwdLG/UO6FzZZFjkvBjeMFYFRU6k9Ko5IZs99Wry29C06Atn15deGRRtdICM/B0rQn33hVf3+a59vbYysCRXQdkS//1G79Oi/e/DgQbFj51fiw48+o8ZCs+Y8STnt51x0rdxIXi2efm6hUcnQDPXe06+8LW1WOgt61xMud/JOO3zl0EJTo5bsg/rwhYO8/VjQo5MFPY1jiRKfZY3UjAVRx2ahbbdo6t9HdLNdWnqFUcp7YpOAqPU7Zz2iC0HoQr9v/36xdftOajby6FMLyIVbQp2W8mvs1fgr0Q5a25po4zy7jxJtOZ5wj6PePXrNl9eOEi2nnyfOvvBaccOt94vHn36RLO31GzaL777bY5wtxxJPIxAtLAgtmuYq0Xz/w0/os6msCRyZ0H1O8Ez8R4j2ji/FB6s+owyHOXOfoWdg7MQ/C8/wyVQ3HmmWeG0qJiOvu5d+Zo9/3/PAY+2eU/WMocZ87yTrJUS9Nw4W9K6mUS3O5b8fWpjV1eLYQk+MLOjppdY7vdpYKKM3Uwmeh542/qKo594q9enP0rLaKS3Cd977WDwuhfuam+4VE8+9kvKTkdYGsYI7GAt1psegU5/XdoKtsVg+axCuApsm2qcUa9XQMK7ocV5ZP0Y0jz6X8q1vmjlbPPHMS+KtlR+Kzzd+IfZ8vzdqjXxDgNvUOXSrLtqJn2VHfD39PP2LrTuMjQfuMz4XPTcRBH3N2g0ksni2Lrt2pjj9rD+LId4JJNrYFKje7HgdHAugYIwqO4vXV+VvQXSWgxcHxwZwr6tnUvtswU6BOEZil3t2Mlj+1ZP9gm6UfbU3Xsgpa9HJgp5eGtXBRp1jVJIzByUpd7l54bzjvodpIY4W7Q4LE41dIExIJ+qll++E9YT/RnCWzRm0SDM9Bik9j0YQmi5AuCZ3sIQpznSp9ahyj1tqSbRL5N/U+s4QzWPOE+dfcr2Yec9DJI5vvPk+BR/u3vN9LA+1cT/MVnasdK9oUL9vBKFFOB4xi+cPP+yjTRnuIa7p+ltmtRN0Jf5oi/v/ermMojK4btx/zbvjDY6XXqNdexaiPw/Ko/TRJ2tDnkf1flu37aRnLh3eHhb0rmeOCfo0+vA2d9P96DrDZV8jkwW9c1hc5hGrP40emY7voZAI8n6nX3WbXswjdj56kb0x2CVMX7iztWd2eAlT1TgFwgZrs6CkTqs7rvcLR3Aafg5Le/QZF4tzL54hbrljjnhu/iJKs9q4aavYK8Ux0plwO9FujZyjnWhb3KBgtxo53MkGopl/FxUH4WHBRmXK+Ve3e2aU9+DWOx+kMRlY2ZyW+4/xx3u+/OrrIe+jPtv+/T+KoU1npaUVLwt61zPHBF1Z6N5Z3JglOlnQ00/N7V4jHn1yPi2M3+3eI9au3yheW/aWuP3uh8TFl90sRow9XzhrRmiNM7BgJnCfMn1dST1XTm97S1sXH1xzX/1cl6xN3eKEi7hs8HCK9h457gJx6dW3U93xZ55/lc6aYWnv3fuDaEsgzz+VqO82U1qX8qok8jr42Q8/7BcbNm6h+uvPvfCquO2uB8XZF14jHn5c1SgwW97av3EMgKMSWNstp5/fTljVf6NPerzqgsk+p9gw3X3/YyHvY77GkeMvSEsaJAt619MQdLvnAbMmZiXUh8fuhAU9OlnQO2FMqQd3gxjWMpFqa0OgYHliYVRdrgooX7nR+P1Mf+aOXWfkM238DLnzVHfcpgVj0fm+FHCINty4Q5smijFnXSL+fMWt4p4HHhdPPfcynWnDzUtn2nGCwswlTMMD0RIR7BBLO8JxSDTgd+AJgEfgjbfep+wDbDqQujb6jEvoTBvjour997LUiH8/xUHxDuFiqeIrVM43NjrldaPFN9/uDvld9ZkwPhjTdD0vJOjy3lx1/V0h72P+NzafiPpPdRPBgt71zEkLnQU9NlnQO2lcdVGHFar6WYe6y7PDVa4qopld48rViw2JEm2zexybF7iFcTY8btI0SpW6e9ajYv7LS8jS3r59l9iv95aPKrrC7NbGWXTyZ9qR3ePxrXWcIaMhCkR7xZvv0Vk8RPeCaTdQYF2NvC4ElRVY6+h6ce2U6iY3bLjnqsIaxmlAeYDO/X0jzzai5dXbq00LyvWqlrr42/VhVQHVmfamzds0D0ea7i3eD8/nhCmXGuOloDYb981+grwnqaausaBnhG2oryC/7iywN/xKl8aeGZTljoMFPTGyoHfi2OpC2J2FO1oJU7XhQJR0sC1njeEix/fQ4avOf4YYc+Yl4ooZd4h7Zz9Oor3qo8/ENinaB348GNdFHamEadLucb2KmnY2rr9WAuVTUQBo46YtZPlCtG+eOVtcMP1GSmGDpYyUQVSCgxX7J2xWpOjCs9Jv4FASXsMzEbbRMZdL1TY+w4SrZqT49rs9IcJpRJO/+5EW2If3k6//pvw85p+r34fnonLo6ekr9kItgRtErfcMoxtb0M2v10l4/hUW9OxlG4Ii5X0+UOQI/J0ujVku6HbvAyzo0cmCnh8MEW2Te1yVMO0rF/beei9tWNoqghopcd4RZ4ux0tK+7JqZVFjlxYVLqVgJmoXsl0KQiGgfCWkWknwJU2VpB8+1W+PWzEcjE4goesm/+toK8djTC8SNtz0gzjj7MjqrRtEYi7z+YH665mHAf8OrQqIdFoSoNjrJxDQo8V+7fpMu1G0hX9HeFI1c8Lr4HI89NV8X1dAzbXwddcbF+pl2GnLDdS8L6iaEd3pTm4l331+txXhwUFw2so3um92bQ4LOFnpMsqDnDsMtbaOEKdz/0qozW9oqZx33v6yqhSztiedeQaI9a84TYtGSN8UHUrQTacsZWno0ddFOJpgNldpQHW/tuk1i6fKVYs7Dz4gbb39ATL1ohmhsmUTtQDEGvS1BDwM2LgXkHg8ehYR4J/RxTFdjEooml++J9qSaUIda3gikQ8odNlb4jChuYxZ08+9OPO/KmJUFO0JsOFZ/ui5EyNX7wdOCPPeiKIWPEn42HSzoGWCbfs+yX9CnBXuhP8t56NHJgp5djOYex8+olWupuYSpVhGsUApXed0oCkRDkN51N98nZv3lSWoa8tnaDWK7tLTRkzsewiPHk3GPtwtE00uYxjvTVsFvCBRDGuCy198RjzzxAtVOR/R4YNQ5JDi4fiquQ+7xwTQG2MAYlrbJLW4zuce74p6pan8q0j1SsaERYy8gSxibDZzVa+La/kwbYk8u8DT1u6fCRXKs4HUxv4+6J3v37hODh40V/QamFozHgp4R5oyg04fGRVgdvgMW7aLausEAdzuyoHc/xiphWqhb2r31Up4424WQ4WdwnTaNmiomn3+1mHHTfSQgaKf60cdrqFnIj9LSjhXFHdpLOyxHOyHZjtThS3u9eMKPGvVff/Ot+ESK9sLFK8Tcx+aJa264W4yfcqnwnXa2qKgbTRsTWNa99DQ35R6H9RjqHg+E5Giny9LuKFUaI9z9mlC3LxqDvugILoRwNo0+NyisYYL+9LyFdN1pTV2Tz9FDj84LeR8z0DEu1dQ1FvSMMPcEHRdjZUGPShb0DI17lBKm+Bnc40aHL70qHFy2sDDd0tJGjW50abvulvtI+JYsWynWrNtI58WHD8euO94axa2dTBFTo8NXku5xuO53ffUNtYJduGiFmP3Q02LGzfdRShcKmLiGnEYNURAxrtL7sHGhM+1BcI+bitG4lcXdfQMOFcnlL69j4tT2qWtK3JEFANHHxsRdO0rsDuu6pn7vtWVv0/FBugRdlRbG5sn8PuZ/o/DRKSk2aWFBzwhZ0PONLOidNK6mwirtO3x59Q5fdaEdvqQVVCytTUQy+6WlPem8q8RNt88Wjzw5n86HEdz1zXe74+ZKB3O0W5PO0Q4X7ZDUsQQKq8DS3rnra2ohinP4OXOfFpdfe4c4a+oVorFlshhU1UIWNTULKRwckp+uiban3SYnW1L8otGmt8D1jpgSoWiMdi/RdQ0BibhOpMQhZY5ENUzQ0eUtnUWGKHVNPneoVhe87yLks6EYEo4M4Pno8HxwsKBngCzo+UYW9BTHzyTa6pxWpXtRh6/SYAQ1COHC37mlNYpzU5wD40wbVeWWrXiH2md+++1ucfjokcRSvo5EcI8nca5N6V5HzXna8d3j+/btF9t3fiU+Wr1WzJu/SNz/l6fElTPuFOOkKDQOn0yWNiLkzR6G3vqZNsRcjVsulLBN9BnBs4CzaFQNNAu6Euq3qWjMUBoLiH941zUjdW3PXnqd/imeaSuq3gPIk1e9B8Ir1D2L1DW20LORLOj5Rhb0JMcrLLec6o7rzULMTTPQTKVy6BhaKBHkRJb2Ey9QjjGsLLTljGdph55Dm0U7Ib0OWtntzsbjiz7qeKO1KwrBvLRwmbjzvkeoFCtSvmoaxxuWtrmgzKlkadcbrWDDjxSSTffKOcp5tias37m6D1u27hAD5DODMcIGSJUNDg9Sw5EKjlzS1gVNb9CCTRiyBczvFUxd+9jICOjw+zhY0DNAFvR8Iwt6guOkCxQKjaCcJ9zlWKBRDa2ZemlfI2be+7B4/JkXpXX1rtj8xTayxuKdaUcqYdraoXSv0Nrj8dzj+DmqtW3f8SUVNpn/0hJKV0Nd8dOlpY0zbQixuZe2OstXHb4wLuHu8Vy2tFOhOkdf+npkyxteD5QIxhk6NoUz75kbIqr0b/138aylM3WNPAjynn6w6tOQ91Tvt/mL7WSdp9J1jQU9I2RBzzeyoMcnFjOcecMKhcWN6PE33/6A3OPf7/2BemXHQquRp92+w1eiiFTCNF69c5jyEArUR3/vg9XkOkUjDpRiHTHuAsp9dgweLvqisIqphKnWlnVoSAnTfHGPdxZV8JnR7zw8mlw+CmhIQxsoW504/8/X6+LaPoAOteNjtdvtyGfDe76m8uRb2+fJVw8bl5KbnwU9I2RBzzeyoEenOjOE0LlqThP3SQv2BymQ5sUuuNiGnkWnXnf8qFHCNN4roO44rKiV731EzUIQxHTJFbdQSVZYfQMqmshlCstP5WhrleCGGgVDIpYw7Qb3IFeIccX4I51QE/Rg0RgjdU11XZPC6T/tnHZuebUJePCR59Iq6JRWJ5/xOXOfCfls5kf39LP+TKLfUa8AC3pGyIKeb2RBjzAmeqAb3Mvoa371DXdTxSy1uHbU0o5cwvRo3BKm1JZTbiQ2fbFNvP3OKvHc/FfFHffMJSvutAkXiSGeCUZwE1KaKOVLP8uHVYXOZ+FBaEYJU7a0u4SqgMvk868KEXGzUCM48hS9uQ0awKCoS4ig6wKPjId0tDRVVIKO9DTts7VPXbtg+g0pBcaxoGeELOj5RhZ001g4td7diMbuU1Inzjj7cvHuB6tDFrd44t0mIrjHdQGP+XdygUceOXppQ7QRQHfzHXOo4EjzmHNFdeM46mCGhVyVMKVANFjaUrTV54/UYCXThVWYWvlXxF0MH3s+dY4LEWpTv3Mqx2ukrm0JEVW1CUA3NnWmnY57qzYbOJs3fy7zZ4PXJxWvAAt6RsiCnm9kQdeIhUqdkzc2TxKvLF5hLGYq4CwW4v2OqneOgiFr1m6gwLmnnn1ZXH/LLHHORdeK08ZfSAVF8FngCjeXMNU6fDVQKpzadORKjna+UDVCQTR5tK5rb73zIW0mke8N79DyN97TRDXM9f7V199SVcDCNHZdw/siPuTw4bDUNf29n5u/KKVAPBb0jJAFPd+Y74KuXIgQcgjqAw8+Jfbs/SFEpJOpogbRVpb2kuVvU/rRrXc+KCadd6UIjJ5KOcRw48PSpjxtveY6/hsLfrFJtFUJ03y2tPF8mvP8s33zgnvfvt+59hUpbaruPIITIaLqmQp9xo6S+KYzdQ1FfdB9bt++AxE3G0tfX0mbDBb0rGJuCbrVPeK3Frt3Pwt6dOaroCuBwCKF/0aXMaRwqcVMy9WOL+BqwXv1tTfEmedcTsFMaIRSqltZ7UqY6vm8kUqYZrtYpfQcOrUiJ8HWrno/drR21WvXq4Yr2VDuNfI1+ihPf8Vb74c8O+aiMdVywwdPDK4V0ezhgq5+99xLrqPfSSV1TR3RDChvovEdfcbF7d7H6Is+75WU3o8FPSPMLUF31I79O6vTfwA1oC0s6BGZb4KugsOolai0ilGSdNXHa0JcjOHn5OpMPBKUW/6eBx4T/9HLSYINa0eztHwmwWbRVuNvjIvugSh2eChwr49Knyuq0SvL1YuywcOpkAo2SyjQo1mmQ1PKic4UtSYt1eLRJ14IeXbM/c5Hjr9QfzZr6ShGE37Tmbb+HCJQM96ZdrAzX6jHBz/D+OEYB++DDSe+F77RMAs6Gsucwmfo2cbcEvSTGhpOkA/uJzZXQFjsntZuMMDdjtkVmM4AACAASURBVPkk6OZzcojEgpeXGoVfjKj1KBa4+Xci/XzR0jcp6AmLZr66x0OeK2doOVybHsRFlfWkcENE/tR/MFmGqN8+qLJZtIw5T0y9eAa1CEWhm3ffX01eE5zrKtE7cuSIuPeBx+k+Zvoak3/+AlRVz+h33tre8kanPBy/QNRHwWJuC/252gQ8/NjzehvVQLvSw+pogjrz6YWBjIp+aKc7qJHmQp3vDOpm9+crbhGrPvos5H20fwc3EQjmw/PdUe8IC3pGmDOC3qO0tPQ4fJWLxf2lFS3SCvAe6QYD3O2YD4JOVonexctRM1LMnvs0FVyJJtJqYTNHF7+86HUx+syLxZZtO0IWPvU7KJGKYLZ8s8DDI+vV9WvWn14SV7e44VJHOdzm0edSGdm7739UvPjKMvHZmg1i+/YvQ3KzI90Pc+/086W1ns5qaV3BEr24zEWX3qQ9O23tU9fgZseYYfODeAvUGIj0vL3+xrvk0cDrkkWvi7ZqKwtPEQLn6v1nUuOVK2bcQdXnnl+wmDxSqGSI8r7hY2yG8Wyv+oQ2ASk9Jw4W9Aww9wS92O6dzYIenbks6Da9rzgWO1znldfdRfXJDYGI4l43NyhBq0/UL6d2pvJ1sBiaFzv1ezt2fikc1SOMQi2Zvq9dMr4uHwlHb0uw3SnGCd4JWH/IkUdVOhRCwYZo7bpN4rvd30fsuR0UkTZhLl8bnioICx144cXX6P2ySdBV17Wm0VPbPXdGv/PnXzH6neOZXb/hC2NczM/dp2s+p/7wgypbqIvd2EnTaJP0wENPi5deXU7P6Y6dX4kffzwYday15zdyhoa5djye/4IUisqALOgZYe4JOlvosZmLgh6su15PCxHcikqIleUd7Zzc3CwDPaLxetgQaEFudeQK1hbg0PPPHw8eFMOaJ5G1lI2CHslFbu7RHv7MwILEeFQNPZ3cxFddf5fRfAYFcFAuNBZC27KqIMT4UYhK0J99/tXsE3SXFuRXWT+GNjbm50e535cse5ueN7jSUTP/3Q8+NsbLDIzbF/IZ3SlFG33mY6FdBcLWYIOeSEOuvCHAQ48+R3Mo1WeaBT0j1AQdgeHuEb/VpZEFPZeZS4IOy9B8To7+0wulZajaQkbLFTe73fcf+FE8KBcx5AtDMORzY7iUcQZ516xH9QW1/euMOuMivTxm9xR0I0gqpGqc9lmpP7upa1wvnbC+w18HYg7OltbgD/tUNbPIYhKpHG4iiFxRTx/zNu2sOZU0qs56/oKBaMEMBiWGEHM6Hx8w1JS6Fmp5q6IxVnlfMPaov6+N49F24xP+3+Fjncx4q89gngtIm1P3O9WYEBb0jLANAeEIDHfUsoWeF8wVQVcLey9T3XWkAZkXqsgLWHBBfemV5cI34mwSNAicucwl1eKW30d0sXkBNv/7kstuTjmVKC331Bks6xpMA/NrPdp14VaFa/BvCA1y8FV/dmxaEDCI4jooBwpLUUWVq6piN9x2vyFI5o5xyZbETbYULmIfbrvrIfpMmfKEhIi2aXwxRoV6ml0vdQxRpB1D4HnCkUzT6HPF+MnTxee6K90c4Q7s1vudq65raLsLRNpAtoZY2omNdch4twYbBplfA256dN5T15OWXHcHC3pXs9juPVpS3oyvCzRVnHZMJjU5JbCgJ8ZsF3RzPnmxXHyuvO5OOjsMLnjx3esff7KWLD4svKDZqjK/D95jwpTLQhZg9T7AvbMfT2vTjITun8kaVGMB4YYViKhkFd0Mz0FpeUCU142mfONLr55JndcWLXlTrFm7kYrhRLMCYYkrAVWFb9au36QLzdGkhDvcioyGI0eOip27vqaz4pdfXU4bNJwR1/vPoHQ2Syc/W+GWtvn4AZH6FFOhB/zR+OreAog2MiiQJ45jCMQPvP7Ge2L1p+uo37iqxBZpfNR4euWmErEJ2BQgBsH8jCUCvFT4eMez1vEzxIE8/+Ji0TRqqjaf9HudrnWGBb1rCc2D9kEDzZqYlWBBT4zZKuhqsdXqrtdTnjIizVXkcOQFLDRSGgvsFTPupNdTUdjRFjBVHrOheaLhwg8vvjFvweJOEfRI4kITFsKNoiuq4pz8CuFGChj6mZ824UJx3c2zSFQWL31LbNq8Tez5fm/MRd0sAhBVXCICo5BShvfC+6J7G85vtXFuC/n7SB3jYgnJQTmWO3d9Jd57fzUFut1yxxxKXUMkfFnVcMpPx/XBm4DNSTotc3X8EClKn44g9Lz4k9XYIsWOos/HUWDblPOvEjfPnK2P75ti/YbNVJZVnfPHGudIY2IUjZHXr1zzKAkc9XVEW5hnI/ZYY24g1gMb3g8/+oyOo+6f8yR5YTB/EBWPa0TsiQrKS+c6w4LetTQE3e59wKyJWQlTlPssFvTozEZBV+fkWOARiAYLzlxGM541s+f7H8RfHn6G3My9LMFz8pjjpJfHrKgfI77+5ruQBdioxb3yw5SC4lQRELPAwBLF+5Ibt3iIlkuspyVBWGENTjzvShLup557mT4D+p8f+PFgzDSwoBDEdpGra7tyxl30vqXlTbToP/J4sDiKYiz88MM+sX3HLrJWUQ73trseFGdJEfGMmEJWbXBjop3dY5OGowCLQ8UwBCJ6TpIZ0+CGyCeK7I00hloxG2wYqmlTpKUeeunZQO71OXpePBqnoPAKzri1SP3Y1xvc2MQfYwUVGIdSwRgHbNjwvO0OC6CLBwTJIX8fgaAvLlxGaZqXX3sHtUAd1jJZ2AcPp+tE1gY1+inSKhnCvW7Tx6sz1hkW9K5lTlnoDQ0Nx+KrpaxxgM3NhWWiMZsE3XxO7q49jVzBKk83lpCrdRA/f01aqgiWwyJO5+QdsKY/W7vBeD3zQovc3oEVzUa70qhj3q7/uPa7quiK+fwVizrEBZ8ZldJwpvr0cwvJwtq6bVfMCOdwi7stySApc7TzxHOvNKKvMW74THAja+MQPAfeK4UbdezfkOKH/trX3nQvpT2hWxws7r7y+kLK4ZbWh/ZkDymFm+AzHOE8G38vN/Nk0asxPUW3tmH9otwpcuIDo6ZSRzt4Bh5/egFtiPD5IaLwUMSCCrLsSNBfJBhFYx5/njYXuC54W7ZsDa19oL4eOPCjJtovL6XjHog20tdqfROkaI+g3HHlYcC14/5h41RoHm/TmHVmMSQW9K6nEnQYtdDCrBb0adO0AAC5IPahSnEOFvRIzAZB1ywsn1ZV7P+39yVgclXV1umEoEwKiD7fU8TfB+oDISRN0t11q7rSXXeonoekum5N3UlAJhkFBBmMDIJo4IGIgIo+FXiC+lRUBgGBIDLLrGQiM6CCoAJKku79n33uPVW3q6uH9FTDXev7FglJV6rqDmfdvc/ea4vPepFYuDZuzvWTj9bypISXx5JyRC4nWo0j2uNFj6NI9m13FuDBgs4iwHvUHFErm9f8dK5yS1NGIIe7C62agc1R4dnnXy6HxNz26/tlH/xrr70+hkluuUhwokVphTIP6rPLa4a3H0SEx2Jz5hdWyAh2+cVXyQiQB3zwz7BQczZB7S87c9njubnsHjvcUa9Rr4VpNBety0XLU+inxIvPkZoXzv3wfEw5jX31dTfILMaDDz9B6zdspr/9/R+jHqPscekfz7EdvJ9dsGLfA3U9cRbD8axPyUiar1vv+VDvzZki7sbg7EJWtHmcrnjN4OyGpw1xhG2lqV5nIOjTS0fQl1AomnEj9OXlK+gqQq+LpOZD0IdnKQu6HNjh7pPzAs37fFzANkiIChS8Ded49fRzLwgBiI+7Cl1Vut/y09sHLcDe9+G9X1UVLm03Q86AFhY2ZzRmSkarx596Pp17wRUyy3Dvykfo+T+skdmGkcTCMV1xK5Pl3vTOt4HtGBRRjrC3LSL/V/70Kv3yjvtkNM6C7BWCkDs4JZdNUMLdI7cwssKdjf5GFxJvL7yKHtWAlgVey1geK+t2IvDPcV/30SeeR2eJh4srr/6edEN76NEn6cX1m2U//HD91t7z5t3z3xnRdo9unmiPfnzVORn8OZz/5wyBOnZztS760c/ukH+e/wD5zrZtFO87RZ4b3grxDrUpNS8ECPr0M1vlbtifYy1EhO4DlqSgm454ypShEAzpuy6iVZVeHqkNreA+sPtnvK/IUeV43dyUoPOgCu8C612MTz/7UvrkvKiMnLoSn5HC/dUrr5e97Q8+9HtpuvLWW2+PmlHIT+OORVukqAyzdzscuEWJ99yfePJ5mcpf8bXrZdTdkzmFIq198kGqZpi52/kZiNHGm6o+7cGvSWajf6/vuLIx5T1uTtVzK9eSY86iL178dbpKRtq/lkWQMtL+21gj7fGnx4cr+BtL9Ti32q1bv4kefeIZ+bBx1TXfl4V/jz/5XPazqZ9lvPbX18nsXCYfYj4+N5qbulbA+/2k0y8quX784dYZCPp00+5n7WMN9GpiWSIn6JkjQtEM9tCHYakJurO4J+SCzlW3nHpmAZQL3zAub95+cv5Z5VKmfsy758je1uOtlFZzqnkx9i7E3vfg9Oj9DzwqK7fZpGb4hT5nczo4lTvsSwa9Nl9cRkrJ88/wMeGI9d6VD9PNP7mNLllxHZ1w+oUU7z1FuuBxmtYpumtzxpS6adud2ctW52+Q65xnwpeKtOe5xVgqHc/ng/e0Y5mT6ZiTl9N5F14hp9f9/Jd308Mi0t6y9RW5Nz+y17vXNjY/PT76MXX+jfxIe/S+eMZ28TP8UPGiEG0unPu/W++ShW1nnHOptL/ttD8j7rNktj+deeAcU6b/1flR7+/8/w5adtzZco8/ddQZdOPNv5B/7v0c6nxf/NVr5b1SD0EHh9AR9NrGxALWQpW1LnsIMX+SRT0AUR/CUhJ0FgIptmLxY8HhyFEtdMNFQt7UKPdT94kojnuW1cLoXSgZx53yxXFHNPwajlh5kc4vUBpJJJSBx2DLzbGnygelyUeJBtmYZO2LG2Wb2ndv+Al9+fJvytYn3p9f6Faoq+h3rjtfXPUb5+/3D9/CV6iwz53wxcYqC53RtE563Nnb5UJB9h3vFJ/juFO/6AxncQ1suMCPRTt/WMjQ75eXHh/n8RySHh9DZwT/PXdHsCHMQ488ST/66R0yU8CFimwWw9so3OevxpE69RGd2QcWHhGrjllDS6/885FMY3h/XBkjDfd5GNxyxu+DCL3437H06Ai6uO6qWQfLOkJnZKN0w37AdczZUfyDXFosFUFXYs4L/iOPP51dfPtHWKzVn7PwX3r5t2Qb18fnWnTBl692FspCbm4XXumOndz5BVC2rokIsyN+/JApWLn3GZigzWn/qL3b/HN//vNrssKZC/RYGNmAhA1juPo/FHUePFTvdrVbKOXMaB86ZrNQv/EQC9NorvK8znVDmxv0ilcHLRB/ZnYspUXpE+We9pe+cg1d//0fSf/7Z9xhIdxON9JhGaChFqY7t59d6HjuyD4MjfSv8M+//sbf6EWu0n/k90K0b5eiy1sQnO7ngsd6t6ZD1UVwtM3bAqpuItt2OMIxVm57nz3rkuznHe37FPp//l59x5wp3z9UYnvmhdYZCPr0kgPYehHIhpsy5Z9yl3C/gPhyK+ujEPRCLAVBV4VPevtSesYtehvNSUz93YMPPSG/w4FzDKenWCyUp3zuS0MWQhWtf/3aG2QB13jNX1TB14sbNrufY7yRoUoND/96dhV75ZW/0JNPP0+33nYPXfOtm+i0z3+Zeo8+k6KdRzrV8lx0V+u0uLFwc6GYEm5vdXMh4R6aHh9sYcoixaLttYnl9+QIk9vouD6AHyS+8/0fSy+AJ596XrqNOaI9QiaBKC+lvfPCPWhPO2thOrprHddhvPraX0WkvYHuEQ9DP/zJr6Ron3b2pdR37FlOlb64H9S1dFhtboqcLPhzsxneuoFsIdpY7zl+eBXHsSt5gtxKUN/Hi37Pw2z+36lr+dHHnyn6+rEz6wwEfRqpu/vnRuIPB8diu7qKWJ4+7grqiUR8sQfqZcodgp7PUhB0FbEom8uRxmt6F3TG5s0vSc9x7iM+4bPnyz3bWOakbAFdNprpzw2cmMgcbeUY9+jjg1uJ8j/bWPuT+Y/ffOttWSzHbmk33Hwrrfjad2T0xnvKXEdQI4R1jtuXPteNCGvze7c9EbR3zztoFLaHVUY53F7m3dPmf5//jh+uuOWL+8/ZTpf7nNkm9pnnVslIeywTvnKR9mC/8LGLduFjOVp6nPvH//SnV6Vt7MoHH6Pv3/QzWZh4xjlfkVXhTd1HOW2QrsOeyjA4Dyw92fM8aMDKTor2WK55flhS++jbRzGqUVBizvUgnzntfHcYUGmn29V1CEGfPnoq3B/wamFZI2suYyS+GG6CW1whloKg86LJC+uV13wvuyCPB7zQ817ss8+vHmK/qUTggd897oxDbUoPEsGxHi+1EP/i9nvdBXZsHtssTP948y1pD8p9xuy0xlsDJ51xkRROFg2Ofue40bDa3+ZK/6Bb9Z9r6crtbyvBLrQHzn/Pws+inW0vcw1d+L04hdwjBI7rClYIwWMjmDvuWimNc17501/GMEs7V4SWE9udj7IHu6rtKDinPv913LL16muv0/N/WE2/WfmwHN3KDx6nnHmxNIthNzSOpo9wjWxUepx94Pm7Z7MYwxzXKb/vuN5AnFt+YON2SudaGlzQN6hWwPMg9OZbb9EXLvqazM6U6mS/QusMBH36KAXdqRv7rRTDShD0rP1rJB6H/WthloKgq6g3feTp2ciPRX0s+9BKVEb1sXYFnSu9eb9RCZxyKstGsKP08MoxquJ1X7/uBncRHirobHPKonj7r++XInn+xV+X+9ucYuV/Q5mgqIhb7b+q8a+qMtybyi1sYZrKGquoPW1l5nJEfbf8O7ZVZYE79fOX0CWXfVPOt+Z9dy5EY9/xf73zzqimNTtrYVr438jvgx89Pc4e8n/6i4i0/7iW7v7N72TrH9dK8ICcxLLTpC0qbzHMk8fTtY3lDEbYyWBwt8Rw/fBT6Yo2VvL55HPPBXXc0qiOVaHjx2Af9t8+9IQ08JmMGeXTvc5A0KePKkLX9MRK1sCKiNCVoNc3ZZILW5Zw+gGCnsdSEHT5OcTixNGUEkpvu5Gq9B6rwI8mULz//fNf3kNfWnGtnCzFdq1O2rk9O+rSK57ehdPJJnSICOlK+e9530uJ+1ev+HbWrUwO9sgWpsXkv+EV5XqPe1e+HedgW1hnWMjcYM7C1LFiTVGziLS5V5/319m17cabb5Wtc6vXrJdT1FgYR8JkWZgOSo+P8XyxSHF6nB3xfnPfQ9Joh0fUcqo/lj6ZzM4j5feXLXUeC1N1npT50OAthdIQ7LHQEfXF8j48a/mKbIaEj8eDv3tCnku2zz3zvK/S4vRJ7nXQXTaRuXedgaBPH3M+7vEjvVpY1lAp92AkqbvmMgOaHPpe/ANeKiwVQVdkr2+ukGY/60cee0pWk+cLtDfVuzN9xoXAEeqmLS/Rr+68j678xvelTSg7o1W7bVdyaIW7r8qCwa1f/HfsT54PJejf+u4t8rVcdT/IdlNFiNkBLOlBlrAsUBxZeyd8qXnlLYuPke1RnFLmIq5b/u92uk+INg8LeV0OCxk59T+SPezYbUyHVo+PxViFU/fcl8/e7zzhi0Wb7XtPOP0CuacdaemTETULFffBS/tW5Tve6Bz7UrEwnZJ70P0esiNBHAMef8s8Qnx/fshU1wK3A2pmouzEXK0zEPTpY27Smt3DGlgRgj7DrerjLyO+5BaneAS96F6WmqDz4ibneNc5ozJbe46V4slFWWzawW5vhfbYdya6VIJU2E97h0xFc2rzmm//r7Sb5QiY910Pd6dScfTN+94q8lVvp0T1tl+vlFEki3/WwlRO+LJldbPa0z7UFa/5C50Jbewut+y4z0vjGo7y2QCGP8cLq5155aMVg6lCtO154zTHnR4fw9xyhTfffJs2b31ZFs3d+qt75Pli0eb9ed6nt9zivrmeISlKtHO+4ztvF1tJzM8GDammL+NjAUGfXnI2emHLUgpbvQmlgcWV4smBFPTq6qNnaxD0giw1QWeqdLfq+54n94bbpBCyOclRJ5wj05Ac7XH6vJCDmFe0x2z+Moxw/eW11+mJJ5+ThjU8mYt75SNtS2QBnnq9ek/G7x55kj5V0zaoT5sjbU7ts4Vpctlp0pCELT25mOuhR56S1qB/ff0NGhilDa6QIcrOpseHFKLlFV0NB3bh27Bpq7QsvVMce26j+8KXrpQPXGxc09DiTJqTGQZ3zGt2wlfjcBO+Jq9yHCxdQtCnlQMaP/zpiXeCjamDpRJWwh76jGyEvhwR+jAsRUEf9Pk81duqX12mw+tYLLqlbWnm02fQxSuulf7enNYt5JXutVkdKWrN9+wu9HNvvf02rRJRM/866D3cn2WhP+qEc+mzn7+EvvGtG6VH+gMPPibHq/KEr23bR9/TLtyjPeLLCn6Hwenx0YeUsEUsf/7HnniGbr3tN85DzPmXy6I+3sOtt9IyczLPrQ9wzkOXzDxkI+1ogR74Mo4uwYkTgj6d5B50LphNbPLYvZZ3D7qCSjWIp5WvodJ9KEtd0Id8XhZ4NxXpzLy2s/vdTL6QOR3OfuBc0c3T2ZSrWz7GllIeyLq/jdZO5RXU0eCdnDYeC1P1PoOGjoyQZfC+hvveN3Kk/ftn6We/uJuu+fZNsshv2fFnU2fieNLbl8hsiNcFTkXahWxiIdrgaISgTyft/qB8mE5vPfro62a7UlgZgs7pdv5VfMnzFzYv4S+7rfgHvHRYboJeiN5+YhYcjiAP15w2Jo4a23uOpTPOvVQOeuF9eO6xzhfeARoYc5p+JG/5wqI9BRO+RnkdZwI2btxKjwnR/uXt99LV191I54qHHG554uMRbk7Liuk5qkc70JmtxB9kWjMGm1gQHI0Q9OmjalkLGvYtUgQrJN0uoQRdLPQXQNCHshIEPf/7eMWI/4yFS/V9s2hxFfunTzyPrrr2B9JlbuvLfxphH378xWVjjeYLpcfH8lq2DeUaAp7w9tNf3EVXf/NGORN8qRtph9xWQJ6prSxM57luaDLSNvId5EpzljZY/oSgTyftbdymrVnJ870aWBlwn064OEBDy9oQVpqgF/yOrtNavcfyVE0D41Qyz9teeuzn6eIV18mRnavXri/okpa1Mx1nIdrOWpjya/761zdo1Zr1soWPC+guu+q79PkvXk59R58lC+wamjNuTcFgC9P8CV/evnZE2uB0E4I+fVQtawE9fjZrX6VUuLtw/dw7luwfNFPwcs+jHwR9yHfOc12rUz3QbNYS6pLHJLH0NDr3givkbGsutHv7n/8cQz98Xnp8FNHmn+cCOZ7wxUV27Dv+MxFpsznMaWd/WY5pZXtW/sxsPqL81lV/eo1biCbbm4pkYQqCYyEEfdoog1YW9brm5AFeDawUyGKAQGDZXgE9sR6V7oPpR0EfcgzMXA+0Mu3gArDD3aIwFs3u1Al06lmX0Hdv+D966NEnZV/4WKN0FvhXX/2rnFPODm5smsMmNqeeeTGljjxdRtqcAudsgbKklaItHjJqGnPDQgpO+CoTRzTQ34SgT/PxFsGrKYJYRwIrS9Bzle6G/UNUuuedeAOCXoiD3d0cgVf98LwHzfvwJ55xIX39uhvlCFfeh3/ttTfohdXraOVvH6Mbf3grfeWKb9PpZ19KSRHt889zi1223SuQm5ymJnwNtTBNIdIGK4IQ9Glibmzq0wcfXCFjU/OhBF0sjrdA0AcTgj42htw0vTNH3dmHV7PC2aKTp7eZ7UudCV/hRdkhKdlhIXlzyrMpchShgT4gBH16mN0/NxI3e7WvopAbo5rqwlz0wYSgj/O45RneSC9211hl2AlfJfC5QbAYhKBPD6WgO6PCb2LNq2hBr29ZEpJfFoKeJQR9Eo8lIm0QLEgI+vRQzUHXTNvwal+lwSmMa1+2V8Cw17mT11AYZ0DQQRCcekLQp4eOoPdSwEqFWPMqVdAZTvualX48hLR7lhB0EASnmhD0qWeAC+KisiDu+YrzcM9Hdh9dty8LN/VC0I3cjQZBB0FwKglBn3qqdHvISj3uyl5ltat5wRPX+Nf66JJlPCeW58UW+wSUAiHoIAhONSHoU09VEKcZ8fNY6yo53Z79ciEzHtByFrC+t4KFoIMgONWEoE89OUjlYJWDVtY6FcRWKuReQix26m5BK/UXtyIZgm5A0EEQnFpC0KecA+yPEdDtf2mWfYhUvEqaslYAqjigSnzpR2TxgI5Kdwg6CIJTTQj6lHNAel1Y6b9w0JqneZUJNUZOiPkKOV4Oo1SnRNCPEoJ+hBD0ep725b4HCIL+ZUiwTgi6BUGfEqqCuIBh3+XKXWWLOUPtowcjdjTozMpGyt2YfEFfJgR9ri6H4FCd+PdBEPQ3A4ILhKDrEPQpodw/b14i1vPUV1njKmsG+nBw9xT0liUHOeYy8mD4WtSnQtCPbWujgJmkiBWnBssGQdDnbBSsNxPU0iQEvXkfIegzIeiTywHWtJCZDjhSV9n75woyDVEbi+0mDsDzciqNz/fRJ1XQJXelZ5rfR79v3o+eBEEQ9PCplv1ojbWbfPgf7xoDQR8q5u48iTdDZrwyR6YOB5V2D+jJW+vZYMbnk9cmX9Bny6fv9SAIggW4Vh+/mEPQh1L1n4sA9RdejfMFsvvoViohx8z53DFuKgSdXw+CIFiIE1lbIOgFBJ0L4hz30wu9GucLZCP0SKLO04vu2330qRB0EATBqSIEfaigc3AaivaaXo3zE+ReeshMPyeL43y8jw5BB0GwnAhB99Ludzu2tgRbkvt49c03UBWAQtB/4Pf56BB0EATLiRD0HJ0Jaxn+/aOuvPlLzBnhcFh63Aoxs+t9PkoVgg6CYDkRgu6lvY3928PRzClebfMb5FNMS8tx+wSt1Bt+9nWHoIMgWE6EoGcpNMse4JR7nW63sKb5cf+ckU1LiAOy0s9ROgQdTMOMcwAAIABJREFUBMFyIgQ9J+jSv91MvR7u6Ns7X9t8BTVaLmglr5Ltaz7tR4eggyBYToSgO1TtaqGo038+Ywb5U8wZqjCuvrm3wYnQ/VnpDkEHQbCcCEH3CHq0l9fw41nL/Lp/riCfZsLh2J5BM7XOr+1rEHQQBMuJEHRFW/q31zctOZS1zC/+7cMiZwNrf9t12vHdPjoEHQTBciIE3W1X42EsVuap6upqNVnNvyl3hhL0+ujSrnDzEjmCrtgnCoIOgiA4PCHorn97cx9pZvoyr5b5HE6KIhhJfixopv/mx/Y1CDoIguVECDrTidCDejzCGgZBz0GmKTQzeY8f29cg6CAIlhMh6I6Ya7q9xjdjUseKnGucfZK0gfVZ+9rUCPqutBoEQTCPkzdtrUoIeqMvBZ23hhe2LKFQU/oir4YBDmSErrcv+4+gkXzLPWi+SbtLQY8kqK01Sc9MgqCvEXxRn0VbxQ0HgiDo5QaxNqyZsKDPpo3mbDrWMnwp6JJmkurMeIC1y/fV7UOghrVYmVv9Vu3Ogl4nInSjKUkPN32ANkTGL+j8On79/R0foy+063RBa5jOb10IgqDPyWvBOW06/aTpQNos1ojVE1hj1jXOpD+2vZ8Wt8ZpQcRZw4q9jk4jpTtcwEj8o85If8BVMH9Xt+dDFRSErOSx0jXOR4LuiLpNC4w0/bzjENqij/9m49dtjsygu9v/k+aYS2mueHqea/SCIOhzciT9X+aR9IPWw2irWCMmIugcNDzW9H4ym5NUq/tL0FV1e72V/qFXu4BBcF3j9MRBmp74l2b4q9qdU1bzzD76Qed8emmCN9vayCxa3fxeSrQsknvz9eLfDoEg6GsGdZsaokl6uO3DtHECWUAZNIig4462gyhgpoq+dk67oOt2Pxdvh8xknDULgj4M1D6EeAK612/V7nzDzRNP0Be3hWmruQutjox/f2uVeO3L5ky6sK2BDtd9ur8FgmCWcn3RU3Rkazttat6d1kR2Gff6woLOQcdNXdU0VwQhvlpfsmYy6ad97ds+FqhKQSHmy/w2rEXecJEUHdveSZubdhOCPrEbjtPud7Z/nGrNjEznF/v7gSBYPPL6wmn36zvm00vG+Lf05PoiAoat1mz6UkejeEjwV8DAQSZrUzCa/gprFaLzEeFE6Fpr5iNBK/W6n0xmeA9qgZ6k7uYYPde8L70YmTWxSnfxQLCxaXc6urWNqsWTuZ9uOhAEc8y2xTbH6bnW/ejFxpkTXls2iaDjaBF8cBDio7WFtUh6t9cZdiNrFQR9dMg0Rr2VvtNv1e6ablPAytA9HQfRpsbx76OrKH2LiNJ/1n4IzTd7EaWDoE/JNTS89XZle0BG56sm1BK7qwg2ZtIzLftRW1OPeFBI+qggzjWTMRJrq6uPnj2akAEzvNXuGcsdqeqLCJ2p9tGvba+ZcFpMPUlz+v4zbS00VzxJ10PUQdBXDAkuiCSps7mHXmjdV7abTSQ6V9t5t3YdSjWW37bz7G1sJhO00pewRsFMZmxwR6r27S0O4oagU0XpC1FX++jHtbfThqY9JlS4om4+rmZ9oOP/Uch5OPLR0zQIgiy43K72467DaeskBAlq//yiTp0Oj6T9lG73HtMa1iiYyYwRWStYM/XdhXICmz+K4xyDGZsam1L0UPtHaEPjjAnbNHLF+0vWLvSdzgWoeAdBH5EzcnP0Xjqv06Kt0V0n1Dnj0DGUeaFtP+pp66H5Ef+k23nrl7eA2fiMtQl75zsB9eQTNJPVmp7odw+qf6J0PU3XdWu01Zw1KTfh6sZZtKXp3XRuVxPNiWTEjR4v+vcEQXDqyPf4HBFBf7qtg9a17Su9KSYaHDjp9ir6ZdehsntG81Fw4FS391K4KfNp1iYI+k7D7UnXEw+7e+n9xT6p00He8zpCPPmm22O0tnVvWivEeO1E99Jds5lN7XvT6V1tdBhEHQQrlnxvHy6Cgr6WDvpD8z60vnHiqXa5jjTuQpubd6czuttlTY6Psn0DbHQWtNL/YOMzR56Qbt8pqLR7OJo5kQsReLpNCZzYaaJNATNNvxJPwpsn4BqXL+qcLtvYtjed3dVMh+q90jkqVPTvCoLgZJDT3yE3zb601RHzjRPwbM9fPzaIB4PHOz5CZpO/7F5ldN7Ux2YyV7MmITofD5RrnJX6RNBMvu0eXP+k3cUT8Mmd7bSpZU9aHZk14RvSK+qbWt9Dl3WEqMbsldkA3mvzy80JgpVGvnf5HuZe87kiMj+ns4nWtu07aZG5TLfLYrhd6LLuRrkl6KPoXGaHw0294hin21iTIOjjRK6Frfd6vznHqZ70OxcdSpsm6Slbifqaxln0srg5b+0+jBa1xOhwo5dqhLCHIOwgWDZUQs6TGudEeqmpKU43dM6jLVHx4M7zHCZxzeCRzk937U+tLc6oZ7+sEyzm3CGkmanfFlsPyx5ZQTfTixyTGX/sozOzUXpXB21q3kOK8ET30r03KFe/y6lurfvS1zvqqEUsBnIik3hPTc8b6uAuHiAIFpPee9KWzpKcXm+MJumCjgg91fbv9JI+Q0bTEy2A83KVis4XNdJcn3XK8FYvd1qFrNR5rEXoPZ8YlPl9laYnHg75qDjOoU21Zpp+vngubdZnTtoTdzaNJlPws6SJzbOtH6BvdtZQuqWLNCtN84S4c5/pEXqKagRr9SQIgkXkfHEf8j3JD94LzAwtbllMl7Vr9Ej7/jLjtj4y+WsEPxhw6v7RjgN8t3euuXPPg1bqT/PDsQ/maRIwHqgoPRzts/02J50L1rjX026P0wsdH6B1DeMfeTg8OVrfVfo7s7Cva9qTVrYdQN9snUdntpu0pKWdWqzFpFs2GVYcBMGisIdSzZ10ensTXd4WoDvbDqIXWvalV8Q9y7PJV01yVK7WhtWqsr2r1fVtL/66OF1UxXBBM3WhV4uAiUE+EdW29H5IPC296qeBLY6oO33pV3SF6aVJMYcY/kmcn+7lUBexQHDqjg1p1pnvoueb3kvPNu0DgmARuSa6u3Rpe1mIOHe/cEsr+7JPvpB7Uu3ivW5eXEMLjJSfInOHalSqmQ6wBsEZbpKgnowCZuJirjb0U3Ec30TSstXK0K96qietjW00YeeFQj48CIHnyW88kAEEweKR70Ueq7xKPXxP8TrA7/lk10eprdmWfvB+EvScM1z6F1KEIOaTCsffPXrUh4Nm6i33oPsoSnfMZnpaY/TcogPkjTaVN3OhmxsEweJyOu/3tQ1VtL5tHzq+O0bz3A6YYq+D00ihLfZAyEpRwEw2sPYg3T7pICnqmpW6vT7qs7GqhtOewu5MJ3V308bWvWjtBKcmgSAIDqVjFb21eXf670URv807dyhT7SmubF9bXd26uytAKIabTKgnpKCeivC+hr+q3R3yjVUtnpZXdEdoi7jhVk9iKxsIgn7nrrSqcRc59+F7iQZZSa/5cEKj0JYdXIAdjKZP9WoPMMnIDm2xUrdx9aHfonRJcYPNNzL0zXhEPEXvBlEHQXAS6NTNcDHsr7oPlaZWdRH/iblmONF5MJpaH+7o29uVHkTnUwH1pFRvpUJ+q3ZXVEVy3J/+P3ajiNQdUUf6HQTB8dGJzFnM7+76LzKijhucn1rUFJ1WtV4KmcnTvZoDTDE0I/lHTr1rPky9s6jz3PQaIerfSUSkqK+Rov6uElgcQBAsF66RYj6LNje9m24TkbkZdSra/SjmmjSS4b3z9JZgS3IfV2oQnU8llPVe0Eie6vi7+2kK22BR50h9gZGhr8V02tK0G61rnNqWNhAEK4eqmp0L4H6QWEiBaJpqfRqZa4bHSMZK3cAag77z6YF8YjrMSO8hnqTWiYNP3GJQ7IuhWKLOe+rVeprO7bTohe4P0UYh6lPjGgWCYGXQmeXA7a8b2vYWAUGEas2MzPr5VcyzaypbvZrJaqk0EPTpQTZKj6ZP9ZsdbCFRlzOQI2nq64jRbxd9QrpJrWlgX2ek4EEQzHGN25bGg5me7j6ATuxeJNth/VjN7qWKzjUzeRNrC/bOpxeO0UxH395BM7Uh5ETpvttL97JetrQlKNKcputj9bS+/X20CdE6CIK6K+QclTdWSW/2H8dqqLPFzvaZ+1nMFYNWartmpudIhUF0Pr3I2sEaiTP8vJfuJafLOG02T8/Q8Z1ddO+ig2mruYu8iXPCDnEHQb9wjZteXyfWAF4Lnuzcn85Z1CoLahdEEv4zjSlAFZ2Hounve7UFmF7IKH1BNPUeROk5qhQ8P3kvjKbokq4I/V7cxJyG3yBu6jWNu7iFcxB2EKxUeiNyFvLnuj5EVy1uoKbmhFwbNETlirL+iqNzoSHzWFNQDFckZPfSrfRJiNIHk0Wdo/W5elrexF/taqTH2venTc2706ZIlXhinymf3J0hD8VfgEAQHD/5Hl7tijg/tG+KONMSn+r8MH1j8ULqbE2ItSBDNTqici950Jdb2X4jawnEvLiQUXog0L6X3yveC1FF67XiJuYRrHpTkj7X3Ua3dX2KVrXtJ6L2XWizEHeehc5TnOSCMGgYBKJ4ECwtOvflGvdedUR8F1oXmSlrZrYaM2l9855016JD6EtdOrW12FLIVXodUfkQDgSN5AAq20sEWY93K/VZROmFqYS9Tgg7V7TWWRmKt/bIG57F/bnW/Whz025yMdiqz5Dz0Fnk10qzmtm5hQMEwaJRZtLEPcnZtQ3iHt2iOwLO3ut/aHs/3dP5cfp6p0ZHtnXyfjAdHslF5BDyoZR7581Lsn3n2DsvDcgofU64Y28RpW903eMQpQ9Dp8/UpvmRpLjh07L/tLM5Tie2t9FV7XX0k67D6YHmD9GzLfvR2tZ9aaM5mzbrVbRZLBwgCBaLVfJeXNe6D/2x9X30YMuH6addc+i6zjo6taONFosH9LporyyIrdZT0nQKQj4S7X4no5vcVK3H3uvVEqDIyA5tMXoXS0F39ogg6iNQRe3cf7pAdwpl5hq9dISRocZoktpaEpRoXUzHmTp9tqmRzmiJgCBYJJ7eHKHjLUPekx2tNuniHuV7dZ64Zznrxg/omivi2CMfnZzJ5Yyu5nq2q3osoESgRF0I+m31Tf6blz4RKnFX5NQ877nxIlFtpMWikQFBsMjke5HvSb436/TB9ywi8Z2hPSAnqpmp9QsWpN7jSgii81LC0HnpEPTxMuihd9EAQbC49N6bxV4nypUcnS9sWUrcHcWagei8ROGN0n07Lx0EQRAsTJ3nnac51f4H9jBxpQPReYlCnpiG5uQBQSv5ql9npoP+o4rgeB91ZxhUryuB7wCCU05X0ENGsp61ApXtJY7ceFX7ErSxgZVOJ/3qOAPyPmud1UualRkTA1GnCJKLqgI+H84BVj6dNrU+qo9mfskaATEvDzhmM7r9H0ErhSgdrFhyCyL3GbMv97FtHbKF6a6Og+iBzv+k+wVXjsL7Og+k/+mupVM628Ui5xRc+X18JlixdCxezdQ7dUYPovNygjpR9VaqRzyNYS8drDiy8M7Xk9TabNMtsRra2LInvWRUScvPMbNxBm3hHuem3eieRZ+iRHucqhthDQpWHlWbWtBMX8DagEK48oOM1EWU/ojTxobBLWBlkFPj3LrUIsT8wcWfpJf1GbS6cRdaFcnZ9o6V/JpVjWwBPIOe6TmIEh02HYFIHawo2gMiMqd6K/PnUKjr3736AJQNnIr3+qg9V5zMt9yTi9Q7WPbkPfMaI03/G6ujl4SYvxCZqO++I+wcta9c9EnSo44XAfbUwUogZ2hdb5KzWROQai9TqLRKyEp/c2HLEhTIgWVPTodXR1K0tK2L1rfsJSPzyRmi48zN5gldZ3Y00dxIGql3sOwpxTzaS0Er86CjChi+Us7IFsiFopkXgpiZDpY5WWTZg/+LHboUXxbhyZrkxQNAtuhV9P2OeXSE2SszAcX+viA4IbptanWNiU7WAkTnZY5clJ46ClE6WO5kQWfP/cuNw+Xe+apJic49gh6ZQT/unEPzrT4IOljWlI5wzUsoZCavZg2AmFcQDoxG3xW00nfC5x0sZypBv8w4bMoE/RYp6IjQwTKmG5kHjcQL4XDfu4utP8AkIjuNzUxWB83U25qB3nSwPJmL0OdMmaD/CIIOljt1e5uMzq3UUbz2o02twlBdffRs/pXH5fGJRuodLEdC0EFwZKqe8/qmzI94zVcBHVBZkAVyPMw+aCQ2ygI53UaUDhZkqU6bCxtxqjYy9N9TmHJnQa+xMlQv3qvY33e4iWPFvj7AUqXTcx6y0i8HGmKfkCs/BL0yoYoiAkbK5FYG7KWD+VTe6DWRBFVHkjRPRMOlRPZe/4RxFF1qzKVXpkDQtwpB/2HnXDrEOko+OBT7++azWmeLWj5XNsxvwKF029REsHYKr/VItVc4slXv0fQKnonLey1FvwjBkiALBDuwsWi2tyRoSWsXnWQ20EnGwpLhKUaYjjF0utE8SLaYrZ5EQWfnuE2RKrqz/UA63tTpZPFexf6+Xp6sh+nY5mZa3BangJV2He2wLQA6VAYympm6w7vWA5UNmXqfH+l8X72Vfjokvd7Rm+53OoYtSepujdMPYho92/FBWt+8F202ZknhLDWu12cJAZ4cIR8s6rPpRb00v/MWfQZtbNqNVrXuS7d3f4qO7FwkJ8VB1EGNi5zNJAWt9BshM76/d60HKhzZ1Hsk2RGC2YzvyYLA0d5RXT307KIDaKtRResaZ9KaxlkyAi5FrpnEyLxQpF7s7zfs947sQmvFudncOIPWLPowndzdLUfHQtT9TWc06hIKRVN93jUe8AlU1XvQTF3HqfcAUu++pBx0oieovTlOT3V/lDYKoVBDTibHUhWcXDrnhWsHXmwQor54f1rasVhmV7Cn7k+KtVum2oNW6laxpKMAzr+gKt5nCUUzt4Wb+lAk50NyZDdPz9D1i4Jy/OiqCES8XCir8sUD2B3dh5BmpUlDlO5D2jLVHjJTf6/R4/8ll3VUtfsTqj9RPOEdETKTf3cvErSy+YQcndfoPIY0QU+1fZDWc5odUXkZcVe5LbK+5T3U17YIY199Sbu/PpoZCJjJBl7LkWr3OXKGM4mznKr3xDvFv0jB6SAv/jy57NNtnbSheU8pDsUXKXBnuFpwizmLLmhbSHP1DPbSfUROtXNmNWSlv8ZrOAxkAAn1VCee9K4Nw0XON5TpdiNDZ5gh2mLMnNQWMHC6BH1XORP+qk5NOuhB0P3BgOvVHjJT67hjyV3KUdUOMEheCAvCXR8Omqn17CKHVrbKpyPovXSGodFWIQoQ9PKjI+hVQtCDEHT/cCDI++ZW5m+1ZvpAuYQjOge8UCYEQd1OsA+wuGhQ9V7hzAl6EIJepsxF6BB0v1C2qDXxeN/UZ3nNxr45UBDqwghFU2fJAS6oeq9oQtDLnxB0f1G6wUUz7Ab3WzjBAaNBpt4PM9J7aFbywVA0DVGvYELQy58QdP9Q7puLNTkUzazjIVveNRsAhoGzF1PT2PZvISv9KhdeYD+9MglBL39C0H1DbifuD5qp/lrD7uI1Gql2YExQF4qmx7uDVoor3vs19KdXHCHo5U8Iuj/IQRV3IAWjaZvXZqTbgZ2CumA0M7WsoXWpuKhgDVtphKCXPyHolU9uI+Z986CZvIXXZETmwDgh0+8z+UKS1rDoT68oDhb0yR1FCkLQwYmTI3P2aQ9F089VV1ezCRj2zIFxo0q5D4WimV9zOxtEvXI4qA89ggi9HIk+9Eqm3R90fNr/yvbcvA4jOgcmhOyoVXFBBa3UG3yBid9jP70CmHWKs8K0xZglbUSLLVDgeAR9Bn2tA05xFchtHEQFI0nduxYDwISQ7U83EwtCVuYt92KDqJc52cudB3osaV9EL7buDS/3MuTqyGzaas6mc1ojcmoeBL0yGDAS29kLRNMTl3rXYACYFGSL5Izkl2A6UzkM6DaFmzL0QPdBchY6pq2VD+W5apxJq1r3pVhrD80XD2fBErimwAnek1wEx/PNjeSXec2FmANTgnB4uSPquv0Vrrrkp8hiX/zgxMgR3dxImr7SrdPWpnfTqsZdaC1EvSzIs+s53X5TVzXNN9JCABCdlzuzYm4mn3WK4OScDRTCAVODXPo9fbeTEkI7WzmTIzqO0oPiAe3OxYfRy0IgVkWcvdk1YEmSzw2L+abIDHqs55PU3mLLufaIzsub0tZVinlq9RGh+P7OiouhK8CUwrnAahtjHwpZqVV8AcJJrrzJQlATSVCrEIY7uw6ml6KOWKxvrKIXwZLjxkgVvWLMoIdjnyS7w6bqSFLWQxT7OgLHTxZzsZ4Sr6m8tjpLLcQcmBa4rWxmfH9xMa4RT5QQ9TInC8ICIer1VpIu6I7SHe0fpyfb/p2eaf8gWEJ8uu2DdHfHJ+iKrjA1N8VlUSPEvOw5EDSS29gJrq7RXsxra3X10bOLu8YDvkJ23Kph13CUrsEetuzppN8Tck89YGXIbE5RtDkBlhCt5iQP56DD9V6q1RMQ8/Inr5kD0rhLt4/1rq0AMK3IVb4njuELUjMT29GjXv6UrU+6LQUDLD1yzQOfI+yZlz+dVHsaYg6UCNwiuTojcXxYRupJtLNVCINgybLY1wY4cQoxf6ehdRkFzfQVvIYefHBs1+Iu5gAwg/d7pMfwDHGBHuc8baJHHQRBcHja0gUuZCbvPTgc29NdStGeBpQGYjHn6TJopi7kp86Abv+r+DcNCIJgaVGsjY6lq5m6v7Y2tpu7hELMgZKCvCANI72HeOq8L4wedRAEwcGUYr6EI/P7DjOMPZylE+1pQGlCinp1devuQTN5Lz+FYo46CIIgU0XmyXt5jeS1cjl6zYGShnuBcipJMxP3L2RRR6QOgqCPyXVFci0UkXk2zQ4xB8oDzoV62GHpPTQzdV8Yog6CoE8pLV2ttPg9p9nTSLMD5QeVSqqNxXbLpt8h6iAI+ojsoCnWPwpF028HGuL/yWsipqcBZQpH1KtbW3fn9DsK5UAQ9AtdMe8PWuntAb2nmddCGMcA5Q03UuciECf9vkSOCCz2zQaCIDhV5DQ7z7gIWZl3ahrjTbwGIjIHKgIq/S6eTt+tyZY2pN9BEKxMish8RyiapqCV2haM2FFe+zBsBagwuIVyhrEHGyqwqIsLH5E6CIIVQ17Twm41u6bHPsJrHiJzoCKx3JN+F0+vv0GfOgiClUO3z1ysbarPHGIOVDSWe/rUnUh9CWxiQRAsaxayc4WYAz6BI+qGYezBqSn2fhc3BUfqGL0KgmB5EXaugN+hIvVAYNledRH7opCVZjHv1wzMUwdBsCw4wNlF2LkCgARVhcPLZV9mQI8fJ+epm0kulIOogyBYyuQ1alujk11cCTtXAHBQpeap10USx9ezqOuJHWzKUAI3LQiCYD5lNjFkZcQ6lbgyHO7b21nKIOYAIKH6NMWNckx9cy9XivZzP2cJ3LwgCIIOOdgwE9vDYo0S69OxztolAxLMMwcAL1RVaG1jz7ygmXyBo3WIOgiCpUDOGoas9I6FsjMnfhyvVQcfHNuVtw6Lu3ICQIlCeR0fEYrvH7JSq6SowyoWBMEiMmAktvNaFLRSa4Swt3vXKgAARoDaUxc3zn9oZnI1DGhAECwe7W1hR8xX1zbGPsRrE8QcAHYKTvqd5wdreuJyTnNp6FUHQXAaKWeZy0Jd+48hM74/r0nwZQeAcWH5TLWvHjSSX17YslS2taECHgTBqaXdz2n2hS088jlxKa9BvBahxxwAJgAiqsqa0Oh2e8hKvVofzWBfHQTBKSEX4gbN1DaZFdTtr/DaAzEHgEmE2rMKGnaNuOleZlHXkIIHQXASqYrfOHAINPY0OKuPFHJUsgPAZMJNv0t3OXHz/ZA94IMmizpS8CAIToT2gNwv50DBTK6qi6Tm85qD4jcAmEq4e+rVRx89O6DHrxRP0tsEZfFK8RcFEATLjbx2BM2knJYm1pQfuStN1QzXlhoAgKlFlXpyDkQSi8TN+Hce7uKa0CAFD4LgmCjWjO310TSFopntdQ12wl1fZsLGFQCmF1kP+Orq2HuDRvJBWZFqJN7RUAUPguBIlGuEva2hVXbOPBxq7JnHa4kbKGC/HACKARWph8N97w7oiXO4MjVopnfAMhYEwULkttegmeoPRdMDQthvmB/JvM9ZQ5ZDzAGgBJDtV69rtBeLm3V9WBrR2KiCB0FQURa+8fZc0Er9s1a3T+E1g4MCtX4AAFAayM5WD0aSHwsYiQe5yEWIO0axgqDPKdYAfrDfLm2kzdSGuobkAbxWuK5viMoBoBThSZtVBQz7cyEr9UZ9U0YWvxR7UQFBcPopO2Cs1HZpSKXHr14QTb2H1wpE5QBQHpjJbW38G01PBINmYgMPVxA39w60t4Ggbyg7X6RRTDT9Rl1DTz2vCXB9A4AyhErBR6Mnvksz7G+FrMwO5ykdk9tAsJIpraHN1HZZJKsnbguH4x9VawLbSRd1YQIAYLzIDXgJ6D3Nmpn8gxzy4tjGYm8dBCuLcqhKfbSXNCv5Zp2eWLpcWbcixQ4AFYGsEU2tGdtXPL1fIecbmymY0YBghZCj8qCV6ne31+6e39z3Qb7nkWIHgAoEp9vcp/UZNZHUQiHmm8NNfe5IVuytg2A5Unax6Pa2hdzVYiRfqzPszzh3vLjX3fkPRVx2AACYQmSj9dbW1t01I35NKJrhohlE6yBYXhzg9Lq4d/tdl8if1+uJg/jedutnEJUDgB/AabisGU2D3Sie7NfVyzQ878GhxQ0ES5r88G0mtoeFkIt79wUtYi/LTWPEhDQA8CFyBXNsMBGI2CdqZnJHuKlPPvkjDQ+CJccBVfTGA1XEPXttOHz8nnwPO1E59soBwNfwFs24LnPXs6OUWDDk4qEhDQ+Cxaa8F7mQlTNpAT35eJ0Zb1X3L4aqAAAwCDFPAU2tkWgTi8hjYTnsJdmPYS8gWBw6PeXJ7XI+g5n8uxD2M5w7dvlMCDkAACOAFwnHkEam4c0aRepgAAAJaElEQVT4hWJRecOJCuA0B4LTRa5eD7j+66Fo5s26SM9FqhVtxvKsmAMAAIwM7wSmSCTzPrG4/KI+mpHpPnfeOkxpQHBqKAtTQ1ZaCHnvDvH7uwKRRB3fi95iVgAAgJ2Cd0Yy+8LX6fadIStDPIKRFx1McgPByaETkdu8T97Pbo4BPbFK01O17q1YBdtWAAAmA1Xe6tmAmWzQzMQW3tMLWSlVOAdhB8FxUvaTs8tbs+wn36Lp9im6Hnsv32+IygEAmHR4F5bDjPQegYh9qmYkN8kBEFLYuX8dETsIjpHZeybsuLxt4nuK7y2+x7jzBEIOAMDUQi4yTsQeCLTvxdFEQLdfWuhE7P1ODzuEHQSHo8pqsfUyd5GIe+iHPGfBucHcwlRC9ToAANMD15HKEfYF0dR7ND1xMkfsuVS8jVQ8COaY3Z6SletW+l9CyP+3zuj5lHNLoQ0NAIDiYpCwV7cevbtKxTuLlivsiNhBv9ItdtOyQp7axhG51mAfMvgegpADAFASoCqnIt6pwnUidvsUsYht5SlQIdNJxWtwnQP9w6y7m5NaT+2o49S6njxU3TXOHjn2yQEAKE3IaEO11wTal+1Vq/ecolLxsniOIxYY1IAVS1s6K3IfOc9FENf+n+si8Zs1KxeRo3IdAIBywqBUfG0stlvASJ4qFrwtbE5TH+3lSH2H08uOqB0sf7pp9R28zaTaz/ia52tf3RPeuQkAAADlhiqvOQ1X8tYZdmNAj/+63sqQEPcBzUxiCAxYrhxQlsj8oBqyMuL38c1C3E+tdvvIGUitAwBQSZARuzc6CRpJTSx+t2tm6i/OEJjUgJuKRzoeLHWKa9TepvbHQ9HMDo1dFM14QIj3rny9L1+OqnUAACob3v1DudAFo0vfL6L2i4SYv8FzntkzXnNNN9DPDpYQ1TW5g69R9l3Q9MTfxP9fUGul5nmvcW9WCgAAoOIRyxnUyIUvHE7sJxbH9joj8Zhmpf4pIx8rNYApb2AxKY2SPEYw9YLiAfQhzUyc1djY+yH3cpb2yCh0AwDA76jyRuzskFXXnDxAiPt1YtF8UURDJKe8GWo2tI39dnAqOeBYGNvb+Fe+9qQ1q5V8UzPi14jrz/AINwrdAAAAhoBUL7tnEExg2V5aJL5QREg3C4Hn/UpBKe47YDELTibV/HHNSHKlOsmUupnka+wu8ffH1ITjH3UvSxmNV1cfPXsGpp8BAACMipmelLyczx6Opj4sFtdjRZR+N+9hStctud+uFmJpM4vIHRwr+Vpxrx27PySvqSVcw/GOpttrgkZiRX20Z77nmkT/OAAAwASQv4g6hXRGjxaMJFYEjeQfQ9E0OeKepmyqFJE7OBz1XDrde+3wtcTXVKghHhhc2yEeJvM6NAAAAIAJwU1zelLy1a2tu2t6T23QsL8qIvdV7M61sHnJAP/KqVMnLY+COr9TFlZm0+m5a4SvGb52+Bria8l7tTnXGqJxAACAKYWK2smzhxkO971b01O1gYgQd91eUx/tfcepSu4dCLJ5je4402lOqhWp+cqm22KW2MHnnq8BeS2Ia4KvDb5G+Frha0ZdP3wt5bdUAgAAANOI4Qw86oxkfcC0Py0is7s1M/kWtxuFRWQWtFLkCLq9zfGVR3q+3Jk7j5xKFyIuzjGf6/rmPi5s+4cQ9weEuF9ZZ3I6fRCGGB4BAAAAJQEWd2nq4UVVyIzvr+mJE8Si/m1NtzcHzdTbXMUs905Vr3uu3xgRfGnTNR5yzpeMwsU55HO5UBa19bJr22bnXCdO4HM/I+9hL7+bAgAAAChhcOqUo6+8quSqWG1st7AZO1DTk6cF9PjDmpXcxJGcSssGzaQQDduJ4JGiLwWq48+1EO/wueFzpLZTZBQuziGfy4CR/FydbrdEo9F3eQV7mGsBAAAAKDdwSjUWu2VWXvTuVDG3JvYLmMkGEdFdKPhrEdX9XRVO8Sx3Ec2zqPTLPVl3XxaFdlNHdXzV8daMZD+fAzYYWii3TNJsufp3PlfynIlzx+fQe07leRXnms850ukAAACVC170Z3r8tr3p2Cq285SDY4zEijrD/kbAiL+iWal/LGxZKudbs7AIwR/ICY9M0/PeLfbid5793tQ5k48tH2M+1nzMg2aa/dL/JsT9LsFLhJgHXcvVqrxzWuWIOIraAAAA/IpsdXN+SlZGd4KaZR+iGfEjBc8T4vKUEJVnpSWta0sbblni9sEroZJ9zor9ORZdQKeZue/ubl+84xauyb9XfeBMdTz52MpjLI61PObi2Mduic062JlilkXeOYOAAwAAAHlgERciwX3IhQrs+D+y/z0SX1gX6ZkvBOp8IVa3iOjyKU3uvye28f4uF2jJwjsrlWU2GvVEpJ4Ufjnu0w/kfw/vd/R+d7bs5ePBx4aPER8rcdyeEcfvBvGzN2mNtsHR92FGeg/vsVaIueeEz80MpNEBAACAccBN0auiKhaTQYIihUfXY+/V9NhHwlb8o0KkPs9jNYXAXSxE6kUhYFsFXwo39w5kI1IhcF5qZqI/L5ofJI75DwNarlhsstk/3Ptqzhzw3GcUnzn/e6jvx9+Vv7P4rJvEr6/yQ494zbni/8+Wx0gcKz5m3mPowDm+qpCNj/2MoVsjAAAAADA5UOne0axBnb+bMZOj+jojGQuYiVSdmegUAvcdIXCPaqZ9v/h1ZdBMvaX257koL8T7yFlxHEz+Oa70nhLKHu7C7xtyPh+pfW7+zPzZnT5v+7fOd0keqel2T63gYYaxx3IhyNXV1bNnOMI8CMpDQD0sIX0OAAAAlAKqVHTJqWHFsb6Y94przcQCmcY3e+ZoRrwpaNjfCxqJ6zVH/L8jov3vimj3GhZQJ0K23xT///Yk8S1njzvxclC3v519T0H+DPxZ+DPxZ+PPyJ+VP/NYv59Kmefse3N+6QAAAABQDlDp4ioVjaqIlCNUxZ35B2tjsd3mh/s+WGekPzCZrGm0/63WPHLfnfks3u/gjbg97n1IlwMAAAD+Qb4w5oujl1PcW1010vvmcwo/BwAAAAD4AlVTSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACYZPx/UrD6IYbZe70AAAC0ZVhJZklJKgAIAAAABgASAQMAAQAAAAEAAAAaAQUAAQAAAFYAAAAbAQUAAQAAAF4AAAAoAQMAAQAAAAIAAAATAgMAAQAAAAEAAABphwQAAQAAAGYAAAAAAAAA35MEAOgDAADfkwQA6AMAAAYAAJAHAAQAAAAwMjEwAZEHAAQAAAABAgMAAKAHAAQAAAAwMTAwAaADAAEAAAD//wAAAqAEAAEAAAD0AQAAA6AEAAEAAAD0AQAAAAAAANuK/B4AAAAASUVORK5CYII=",
-}
-
-
-def bitmap_from_base64(base64_string):
-    """Decode a Base64-encoded image into a WPF BitmapImage.
-
-    Returns None if base64_string is empty, so the UI still loads (with a
-    blank image slot) even if a placeholder hasn't been filled in yet.
-    """
-    if not base64_string:
-        return None
-
-    image_bytes = Convert.FromBase64String(base64_string)
-    stream = MemoryStream(image_bytes)
-
-    bitmap = BitmapImage()
-    bitmap.BeginInit()
-    bitmap.CacheOption = BitmapCacheOption.OnLoad
-    bitmap.StreamSource = stream
-    bitmap.EndInit()
-    bitmap.Freeze()  # makes the bitmap immutable/thread-safe
-    return bitmap
+from pamui.images import bitmap
+
+# ⏱️ Opt-in Revit API call profiler (Shift+Click About to toggle)
+import apiprofiler
+apiprofiler.start(globals())
 
 # VARIABLES
 #====================================================================================================
@@ -78,13 +52,12 @@ class AboutForm(Window):
         path_xaml_file = os.path.join(PATH_SCRIPT, 'AboutUI.xaml')
         wpf.LoadComponent(self, path_xaml_file)
 
-        # Set the logo and email icon from the embedded Base64 image data
-        # (replaces the old approach of loading them from a remote URL)
-        logo_bitmap = bitmap_from_base64(IMAGES_BASE64["logo"])
+        # Set the logo and email icon
+        logo_bitmap = bitmap("logo")
         if logo_bitmap is not None:
             self.logo.Source = logo_bitmap
 
-        email_bitmap = bitmap_from_base64(IMAGES_BASE64["email"])
+        email_bitmap = bitmap("email")
         if email_bitmap is not None:
             self.Email.Source = email_bitmap
 
@@ -115,4 +88,7 @@ class AboutForm(Window):
 #====================================================================================================
 
 # Show form to the user
-UI = AboutForm()
\ No newline at end of file
+UI = AboutForm()
+
+# ⏱️ Report the API calls of this run when profiling is on
+apiprofiler.finish()
@@ -13,6 +13,10 @@ from System.Collections.Generic import List
 
 from pyrevit import revit, forms
 
+# ⏱️ Opt-in Revit API call profiler (Shift+Click About to toggle)
+import apiprofiler
+apiprofiler.start(globals())
+
 # Variables
 uidoc = revit.uidoc
 doc = revit.doc
@@ -61,3 +65,6 @@ if matching_elements:
 else:
     # Show an alert if no matching elements were found
     forms.alert("No Pam Building products in this view.", title="No Products Found", warn_icon=True)
+
+# ⏱️ Report the API calls of this run when profiling is on
+apiprofiler.finish()
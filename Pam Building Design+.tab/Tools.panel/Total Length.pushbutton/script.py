@@ -14,6 +14,10 @@ from Autodesk.Revit.DB import BuiltInParameter
 
 from pyrevit import revit, forms
 
+# ⏱️ Opt-in Revit API call profiler (Shift+Click About to toggle)
+import apiprofiler
+apiprofiler.start(globals())
+
 # Variables
 uidoc = revit.uidoc
 doc = revit.doc
@@ -76,3 +80,6 @@ try:
 except Exception as ex:
     # Handle any other exceptions by showing an error message
     forms.alert("Error: " + str(ex))
+
+# ⏱️ Report the API calls of this run when profiling is on
+apiprofiler.finish()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Microbenchmark of the Qww/Qtot flow kernel.
+
+Compares the old per-pipe loop (one math.sqrt and one unit conversion call
+per value) with en12056.kernel on synthetic inputs. The conversion
+stand-in is a plain multiplication, so inside Revit, where every
+UnitUtils call crosses into .NET, the gap is larger than shown here. Run
+with CPython or IronPython from the extension root:
+
+    python benchmarks/bench_kernel.py [pipe count]
+"""
+import math
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'lib'))
+
+from en12056 import kernel  # noqa: E402
+
+# Litres per second in cubic feet per second, Revit's internal flow unit
+LITERS_PER_SECOND = 0.0353146667
+
+K_FACTOR = 0.7
+
+
+def convert_to_internal(value):
+    """Stand-in for one UnitUtils.ConvertToInternalUnits call."""
+    return value * LITERS_PER_SECOND
+
+
+def scalar_loop(discharge_units, qc, qp):
+    """The per-pipe loop the kernel replaces."""
+    qww_out = []
+    qtot_out = []
+    for du, c, p in zip(discharge_units, qc, qp):
+        qww = K_FACTOR * math.sqrt(du)
+        qww_out.append(convert_to_internal(qww))
+        qtot_out.append(convert_to_internal(qww + c + p))
+    return qww_out, qtot_out
+
+
+def array_kernel(discharge_units, qc, qp):
+    return kernel.flow_kernel(discharge_units, K_FACTOR, qc, qp, LITERS_PER_SECOND)
+
+
+def synthetic_inputs(count, seed=12056):
+    rng = random.Random(seed)
+    discharge_units = [rng.choice((0.3, 0.5, 0.8, 1.2, 1.8, 2.5)) * rng.randint(1, 40) for _ in range(count)]
+    qc = [rng.random() if rng.random() < 0.05 else 0.0 for _ in range(count)]
+    qp = [rng.random() * 2 if rng.random() < 0.02 else 0.0 for _ in range(count)]
+    return discharge_units, qc, qp
+
+
+def best_of(function, args, repeat=5):
+    """Return the best wall time of repeat runs in seconds."""
+    return min(timeit.repeat(lambda: function(*args), number=1, repeat=repeat))
+
+
+def main(count=100000):
+    discharge_units, qc, qp = synthetic_inputs(count)
+    arrays = (kernel.as_array(discharge_units), kernel.as_array(qc), kernel.as_array(qp))
+
+    expected = scalar_loop(discharge_units, qc, qp)
+    actual = array_kernel(*arrays)
+    for expected_column, actual_column in zip(expected, actual):
+        assert max(abs(a - b) for a, b in zip(expected_column, actual_column)) < 1e-9
+
+    scalar = best_of(scalar_loop, (discharge_units, qc, qp))
+    vector = best_of(array_kernel, arrays)
+    print("{} pipes, {}".format(count, "numpy" if kernel.HAVE_NUMPY else "array('d')"))
+    print("  scalar loop  {:8.2f} ms".format(scalar * 1000))
+    print("  flow kernel  {:8.2f} ms".format(vector * 1000))
+    print("  speedup      {:8.1f}x".format(scalar / vector))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
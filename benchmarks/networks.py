@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Synthetic sanitary networks for the benchmarks.
+
+A network is described with plain data: pipes, fittings and fixtures with
+their coordinates (feet) and the links flow takes between them. The same
+description is turned into a fake Revit document by to_document().
+
+Kinds of network:
+
+- ``stacks``: stacks of 20 floors, each floor draining a branch of four
+  pipes into the stack, with every stack joining a horizontal collector
+- ``branches``: a horizontal binary tree of branches from fixtures to one
+  outlet
+- ``manifolds``: branches of four pipes joining one long header
+"""
+import random
+
+from en12056.parameters import PRIMARY_VENTILATED, SECONDARY_VENTILATED
+from fakerevit import model
+from fakerevit.db import Document
+
+KINDS = ('stacks', 'branches', 'manifolds')
+
+FLOOR_HEIGHT = 10.0
+FLOORS_PER_STACK = 20
+BRANCH_PIPES = 4
+PIPE_LENGTH = 3.0
+FALL = 1.0 / 40
+PIPE_TYPE = "Cast Iron"
+STACK_DIAMETER = 100 / 304.8
+BRANCH_DIAMETER = 50 / 304.8
+
+# Discharge units of typical appliances from BS EN 12056-2 Table 2
+APPLIANCE_DISCHARGE_UNITS = (0.3, 0.5, 0.8, 1.3, 1.8, 2.0)
+
+PIPE = 'pipe'
+FITTING = 'fitting'
+FIXTURE = 'fixture'
+
+
+class SyntheticNetwork(object):
+    """Plain description of a synthetic sanitary network.
+
+    ``elements`` holds (kind, data) tuples. Pipes have (start, end,
+    diameter), fittings (origin, inlets, diameter) and fixtures (origin,
+    diameter, DU). ``links`` holds (upstream, downstream) element indices.
+    """
+
+    def __init__(self, kind, seed=12056):
+        self.kind = kind
+        self.elements = []
+        self.links = []
+        self.random = random.Random(seed)
+
+    def __len__(self):
+        return len(self.elements)
+
+    @property
+    def segments(self):
+        return sum(1 for kind, data in self.elements if kind == PIPE)
+
+    @property
+    def name(self):
+        return "{}-{}".format(self.kind, self.segments)
+
+    def pipe(self, start, end, diameter):
+        self.elements.append((PIPE, (start, end, diameter)))
+        return len(self.elements) - 1
+
+    def fitting(self, origin, inlets, diameter):
+        self.elements.append((FITTING, (origin, inlets, diameter)))
+        return len(self.elements) - 1
+
+    def fixture(self, origin, diameter):
+        du = self.random.choice(APPLIANCE_DISCHARGE_UNITS)
+        self.elements.append((FIXTURE, (origin, diameter, du)))
+        return len(self.elements) - 1
+
+    def link(self, upstream, downstream):
+        self.links.append((upstream, downstream))
+
+    def chain(self, upstream, start, direction, count, diameter, fall=FALL):
+        """Add count pipes in a row from start, joined by couplings.
+
+        Returns the index of the last pipe and its end point.
+        """
+        x, y, z = start
+        dx, dy = direction
+        for number in range(count):
+            end = (x + dx * PIPE_LENGTH, y + dy * PIPE_LENGTH, z - fall * PIPE_LENGTH)
+            pipe = self.pipe((x, y, z), end, diameter)
+            if number:
+                coupling = self.fitting((x, y, z), 1, diameter)
+                self.link(upstream, coupling)
+                upstream = coupling
+            if upstream is not None:
+                self.link(upstream, pipe)
+            upstream = pipe
+            x, y, z = end
+        return upstream, (x, y, z)
+
+    def branch(self, origin, direction):
+        """Add a fixture and its branch, returning (last pipe, end point)."""
+        fixture = self.fixture(origin, BRANCH_DIAMETER)
+        return self.chain(fixture, origin, direction, BRANCH_PIPES, BRANCH_DIAMETER)
+
+    def discharge_units(self):
+        """Return the DU every pipe carries, as Revit sums them up."""
+        downstream = [-1] * len(self.elements)
+        pending = [0] * len(self.elements)
+        for upstream, down in self.links:
+            downstream[upstream] = down
+            pending[down] += 1
+        totals = [data[2] if kind == FIXTURE else 0.0 for kind, data in self.elements]
+        ready = [index for index, count in enumerate(pending) if count == 0]
+        while ready:
+            index = ready.pop()
+            down = downstream[index]
+            if down != -1:
+                totals[down] += totals[index]
+                pending[down] -= 1
+                if pending[down] == 0:
+                    ready.append(down)
+        return totals
+
+    def level_elevations(self, offset=1.0):
+        """Return the elevations calculation connections are placed at.
+
+        Stacks get one offset above every floor. Branches and manifolds
+        only fall gently, so they get as many planes spread evenly through
+        the fall of their pipes, each crossing pipes to connect.
+        """
+        if self.kind == 'stacks':
+            return [floor * FLOOR_HEIGHT + offset for floor in range(FLOORS_PER_STACK)]
+        heights = [point[2] for kind, data in self.elements if kind == PIPE for point in data[:2]]
+        low = min(heights)
+        step = (max(heights) - low) / (FLOORS_PER_STACK + 1)
+        return [low + step * (number + 1) for number in range(FLOORS_PER_STACK)]
+
+
+def stacks(segments, seed=12056):
+    """Return stacks of 20 floors joining a collector, with about segments pipes."""
+    network = SyntheticNetwork('stacks', seed)
+    per_stack = FLOORS_PER_STACK * (BRANCH_PIPES + 1) + 1
+    collector = None
+    for stack_number in range(max(1, segments // per_stack)):
+        x = stack_number * 2 * PIPE_LENGTH
+        stack = None
+        for floor in range(FLOORS_PER_STACK, 0, -1):
+            z = floor * FLOOR_HEIGHT
+            branch_end, point = network.branch((x + BRANCH_PIPES * PIPE_LENGTH, 0.0, z + 1.0), (-1, 0))
+            tee = network.fitting((x, 0.0, point[2]), 1 if stack is None else 2, STACK_DIAMETER)
+            if stack is not None:
+                network.link(stack, tee)
+            network.link(branch_end, tee)
+            stack = network.pipe((x, 0.0, point[2]), (x, 0.0, point[2] - FLOOR_HEIGHT), STACK_DIAMETER)
+            network.link(tee, stack)
+        # Join the stack to the collector running below the lowest floor
+        junction = network.fitting((x, 0.0, 0.0), 1 if collector is None else 2, STACK_DIAMETER)
+        if collector is not None:
+            network.link(collector, junction)
+        network.link(stack, junction)
+        collector = network.pipe((x, 0.0, 0.0), (x + 2 * PIPE_LENGTH, 0.0, -FALL), STACK_DIAMETER)
+        network.link(junction, collector)
+    return network
+
+
+def branches(segments, seed=12056):
+    """Return a binary tree of branches with about segments pipes."""
+    network = SyntheticNetwork('branches', seed)
+
+    def pipes(leaf_count):
+        return BRANCH_PIPES * leaf_count + 3 * (leaf_count - 1)
+
+    leaves = 1
+    while pipes(leaves * 2) <= segments:
+        leaves *= 2
+
+    def build(leaf_count, origin):
+        if leaf_count == 1:
+            return network.branch(origin, (1, 0))
+        half = leaf_count // 2
+        spread = PIPE_LENGTH * half
+        left, left_end = build(half, (origin[0], origin[1] - spread, origin[2]))
+        right, right_end = build(half, (origin[0], origin[1] + spread, origin[2]))
+        junction = (left_end[0], origin[1], min(left_end[2], right_end[2]))
+        tee = network.fitting(junction, 2, BRANCH_DIAMETER)
+        network.link(left, tee)
+        network.link(right, tee)
+        return network.chain(tee, junction, (1, 0), 3, BRANCH_DIAMETER)
+
+    build(leaves, (0.0, 0.0, 0.0))
+    return network
+
+
+def manifolds(segments, seed=12056):
+    """Return branches joining one header, with about segments pipes."""
+    network = SyntheticNetwork('manifolds', seed)
+    header = None
+    x = 0.0
+    z = 0.0
+    for number in range(max(1, segments // (BRANCH_PIPES + 1))):
+        branch_end, point = network.branch((x, BRANCH_PIPES * PIPE_LENGTH, z + 0.5), (0, -1))
+        tee = network.fitting((x, 0.0, z), 1 if header is None else 2, STACK_DIAMETER)
+        if header is not None:
+            network.link(header, tee)
+        network.link(branch_end, tee)
+        header = network.pipe((x, 0.0, z), (x + PIPE_LENGTH, 0.0, z - FALL * PIPE_LENGTH), STACK_DIAMETER)
+        network.link(tee, header)
+        x += PIPE_LENGTH
+        z -= FALL * PIPE_LENGTH
+    return network
+
+
+def to_document(network, shared_parameters=(), system_name="SAN 1"):
+    """Return (doc, piping system, elements) modelling network in a fake document.
+
+    Pipes get shared_parameters bound to them, as Add Shared Parameters does,
+    with the ventilated system flags as Yes/No parameters.
+    """
+    doc = Document(title=network.name)
+    pipe_type = model.add_pipe_type(doc, PIPE_TYPE)
+    discharge_units = network.discharge_units()
+    elements = []
+    for index, (kind, data) in enumerate(network.elements):
+        if kind == PIPE:
+            start, end, diameter = data
+            element = model.add_pipe(doc, start, end, diameter, discharge_units=discharge_units[index],
+                                     pipe_type=pipe_type)
+        elif kind == FITTING:
+            origin, inlets, diameter = data
+            element = model.add_fitting(doc, origin, inlets, diameter)
+        else:
+            origin, diameter, du = data
+            element = model.add_fixture(doc, origin, diameter, discharge_units=du)
+        elements.append(element)
+    for upstream, downstream in network.links:
+        model.connect(elements[upstream], elements[downstream])
+    pipes = [element for (kind, data), element in zip(network.elements, elements) if kind == PIPE]
+    model.add_shared_parameters(doc, shared_parameters, pipes,
+                                yes_no=(PRIMARY_VENTILATED, SECONDARY_VENTILATED))
+    system = model.add_piping_system(doc, system_name, elements)
+    return doc, system, elements
+
+
+GENERATORS = {
+    'stacks': stacks,
+    'branches': branches,
+    'manifolds': manifolds,
+}
+
+
+def generate(kind, segments, seed=12056):
+    """Return a synthetic network of kind with about segments pipes."""
+    return GENERATORS[kind](segments, seed)
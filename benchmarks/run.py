@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the BS EN 12056 Calculations tools on synthetic networks.
+
+Runs outside Revit, against the fake Revit API in fakerevit, and records
+wall time, peak memory and the number of Revit API calls of every tool on
+every network. Each run is appended to a JSON history and compared with
+the run before it, so regressions show up before a change reaches Revit.
+
+Usage::
+
+    python benchmarks/run.py
+    python benchmarks/run.py --sizes 1000 200000 --kinds stacks --tools "Produce Calculations"
+    python benchmarks/run.py --check --threshold 0.25
+"""
+from __future__ import print_function
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+for path in (os.path.join(ROOT, "lib"), HERE, ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import fakerevit  # noqa: E402
+
+fakerevit.install()
+
+from fakerevit.calls import calls  # noqa: E402
+
+import networks  # noqa: E402
+import tools  # noqa: E402
+from en12056 import HAVE_NUMPY  # noqa: E402
+
+try:
+    import tracemalloc
+except ImportError:  # IronPython and Python 2
+    tracemalloc = None
+
+try:
+    clock = time.perf_counter
+except AttributeError:
+    clock = time.time
+
+DEFAULT_SIZES = (1000, 10000, 50000)
+DEFAULT_HISTORY = os.path.join(HERE, "history.json")
+
+# Figures compared with the previous run
+METRICS = ('seconds', 'peak_memory', 'api_calls')
+
+
+def git_revision():
+    """Return the short hash of the checked out commit, or None."""
+    try:
+        output = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode("ascii").strip()
+
+
+def measure(tool_class, network, memory=True):
+    """Return the figures of one tool run on network.
+
+    The tool is set up again for the memory run, as tracing slows Python
+    down too much for the timings to mean anything.
+    """
+    tool = tool_class()
+    tool.setup(network)
+    gc.collect()
+    calls.reset()
+    start = clock()
+    extra = tool.run()
+    seconds = clock() - start
+    counts = calls.snapshot()
+
+    peak_memory = None
+    if memory and tracemalloc is not None:
+        tool = tool_class()
+        tool.setup(network)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            tool.run()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    figures = {
+        'tool': tool_class.name,
+        'network': network.name,
+        'kind': network.kind,
+        'segments': network.segments,
+        'seconds': round(seconds, 4),
+        'peak_memory': peak_memory,
+        'api_calls': sum(counts.values()),
+        'api_calls_by_name': counts,
+    }
+    figures.update(extra or {})
+    return figures
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as history_file:
+        return json.load(history_file)
+
+
+def save_history(path, history):
+    with open(path, "w") as history_file:
+        json.dump(history, history_file, indent=1, sort_keys=True)
+
+
+def compare(results, previous, threshold):
+    """Return (tool, network, metric, before, after) for every regression."""
+    before = dict(((result['tool'], result['network']), result) for result in previous['results'])
+    regressions = []
+    for result in results:
+        old = before.get((result['tool'], result['network']))
+        if old is None:
+            continue
+        for metric in METRICS:
+            if not old.get(metric) or result.get(metric) is None:
+                continue
+            if result[metric] > old[metric] * (1 + threshold):
+                regressions.append((result['tool'], result['network'], metric, old[metric], result[metric]))
+    return regressions
+
+
+def format_memory(value):
+    if value is None:
+        return "-"
+    return "{:.1f} MB".format(value / 1048576.0)
+
+
+def print_results(results):
+    row = "{:<36} {:<18} {:>10} {:>12} {:>12}"
+    print(row.format("Tool", "Network", "Seconds", "Peak memory", "API calls"))
+    for result in results:
+        print(row.format(result['tool'], result['network'], "{:.4f}".format(result['seconds']),
+                         format_memory(result['peak_memory']), result['api_calls']))
+
+
+def parse_arguments(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="number of pipe segments of each network (up to 200000)")
+    parser.add_argument("--kinds", nargs="+", choices=networks.KINDS, default=list(networks.KINDS),
+                        help="kinds of network to generate")
+    parser.add_argument("--tools", nargs="+", choices=[tool.name for tool in tools.TOOLS],
+                        default=[tool.name for tool in tools.TOOLS], help="tools to run")
+    parser.add_argument("--seed", type=int, default=12056, help="seed of the network generator")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON file the runs are appended to")
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory runs")
+    parser.add_argument("--check", action="store_true",
+                        help="exit with status 1 when a figure regressed since the last run")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative increase counted as a regression (default 0.2)")
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    options = parse_arguments(arguments)
+    selected = [tool for tool in tools.TOOLS if tool.name in options.tools]
+
+    results = []
+    for kind in options.kinds:
+        for size in options.sizes:
+            network = networks.generate(kind, size, options.seed)
+            for tool_class in selected:
+                results.append(measure(tool_class, network, memory=not options.no_memory))
+                print_results(results[-1:])
+
+    record = {
+        'timestamp': datetime.datetime.now().isoformat(),
+        'python': platform.python_implementation() + " " + platform.python_version(),
+        'numpy': HAVE_NUMPY,
+        'revision': git_revision(),
+        'results': results,
+    }
+
+    history = load_history(options.history)
+    regressions = compare(results, history[-1], options.threshold) if history else []
+
+    print()
+    print_results(results)
+    for tool_name, network_name, metric, before, after in regressions:
+        print("Regression: {} on {}: {} {} -> {}".format(tool_name, network_name, metric, before, after))
+
+    if not options.no_save:
+        history.append(record)
+        save_history(options.history, history)
+
+    if options.check and regressions:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Headless runs of the BS EN 12056 Calculations tools.
+
+Each tool has a setup() that models a synthetic network in a fake document
+and a run() that does what the pushbutton does once the user has made
+their selections. Only run() is measured.
+"""
+from en12056 import CONTINUOUS, PUMPED, Injection
+from en12056.builder import document_key, ignore_transaction, results, snapshots, track_document_changes
+from en12056.calculation import SystemCalculation
+from en12056.connections import element_lines, plan_splits, remove_connections, split_and_join
+from en12056.parameters import PARAMETER_NAMES, PRIMARY_VENTILATED
+from pamtools.catalogue import CONNECTOR, catalogue
+from pamtools.routing import RuleSession, RuleSpec, element_types
+
+from Autodesk.Revit.DB import Transaction
+
+from fakerevit import model
+from fakerevit.calls import calls
+
+import networks
+
+TRANSACTION_NAME = "BS EN 12056-2 Calculations"
+
+CONNECTOR_FAMILY = "PAMBUILDINGUK_ES_EN 12056 Calculation Connector"
+
+# Every this many fixtures has a continuous or pumped discharge
+DISCHARGE_EVERY = 50
+
+
+class Tool(object):
+    """One tool run against one synthetic network."""
+
+    name = None
+
+    def setup(self, network):
+        raise NotImplementedError
+
+    def run(self):
+        """Run the tool and return a dict of extra figures to record."""
+        raise NotImplementedError
+
+
+class ProduceCalculations(Tool):
+    """Produce Calculations on a system nothing has been calculated for."""
+
+    name = "Produce Calculations"
+
+    def setup(self, network):
+        self.doc, self.system, elements = networks.to_document(network, PARAMETER_NAMES)
+        track_document_changes(self.doc.Application)
+        ignore_transaction(TRANSACTION_NAME)
+        with calls.paused():
+            fixtures = [element for element in elements if element.Category.Name == "Plumbing Fixtures"]
+            self.pipes = [element for element in elements if element.Category.Name == "Pipes"]
+        self.injections = []
+        for number, fixture in enumerate(fixtures[::DISCHARGE_EVERY]):
+            kind = PUMPED if number % 2 else CONTINUOUS
+            self.injections.append(Injection(fixture.Id, kind, 0.1 * (1 + number % 5)))
+        self._forget()
+
+    def _forget(self):
+        snapshots.clear(document_key(self.doc))
+        results.clear(document_key(self.doc))
+
+    def _calculate(self, incremental=False):
+        calculation = SystemCalculation(self.doc, self.system, 0.7, PRIMARY_VENTILATED, incremental=incremental)
+        written = calculation.run(self.injections, TRANSACTION_NAME)
+        return {
+            'pipes': calculation.pipe_count,
+            'discharges': len(self.injections),
+            'parameters_written': written,
+        }
+
+    def run(self):
+        return self._calculate()
+
+
+class ProduceCalculationsRerun(ProduceCalculations):
+    """Produce Calculations again on the unchanged system."""
+
+    name = "Produce Calculations (rerun)"
+
+    def setup(self, network):
+        ProduceCalculations.setup(self, network)
+        self._calculate()
+
+
+class ProduceCalculationsIncremental(ProduceCalculations):
+    """Incremental Produce Calculations after one pipe changed."""
+
+    name = "Produce Calculations (incremental)"
+
+    def setup(self, network):
+        ProduceCalculations.setup(self, network)
+        self._calculate()
+        # Report a change to the middle pipe, as moving it in Revit would
+        with calls.paused():
+            changed = self.pipes[len(self.pipes) // 2].Id
+        results.mark_changed(document_key(self.doc), [changed])
+
+    def run(self):
+        return self._calculate(incremental=True)
+
+
+class PlaceCalculationConnections(Tool):
+    """Break every pipe at the levels and join the parts with calculation connections.
+
+    Runs what Place Calculation Connections does once the levels are
+    selected: the connector rules, from the catalogue of the document, in
+    the routing preferences of the pipe type for the run, and
+    split_and_join() in one transaction. Setting the level of the new
+    fittings is left out, as fake elements have no bounding boxes.
+    """
+
+    name = "Place Calculation Connections"
+
+    def setup(self, network):
+        self.doc, self.system, elements = networks.to_document(network)
+        with calls.paused():
+            self.pipes = [element for element in elements if element.Category.Name == "Pipes"]
+        self.elevations = network.level_elevations()
+        self.connector = model.add_family_symbol(self.doc, CONNECTOR_FAMILY, "Standard",
+                                                 description="EN 12056 Calculation Connector")
+
+    def run(self):
+        doc = self.doc
+        splits = plan_splits(element_lines(self.pipes), self.elevations)
+        rules = [RuleSpec(symbol_id, "Sizing Connection Rule", 50 / 304.8, 600 / 304.8)
+                 for symbol_id in catalogue(doc).symbol_ids(CONNECTOR)]
+        with RuleSession(doc, element_types(doc, self.pipes), rules):
+            with Transaction(doc, 'Break Curves and Create Union Fittings') as t:
+                t.Start()
+                fittings, failures = split_and_join(doc, self.pipes, splits)
+                t.Commit()
+        self.fittings = fittings
+        return {'pipes': len(self.pipes), 'connections': len(fittings), 'failures': len(failures)}
+
+
+class RemoveCalculationConnections(Tool):
+    """Remove every calculation connection and rejoin the pipes.
+
+    Runs remove_connections(), as Remove Calculation Connections does once
+    the fittings are picked, on the connections placed by
+    PlaceCalculationConnections.
+    """
+
+    name = "Remove Calculation Connections"
+
+    def setup(self, network):
+        place = PlaceCalculationConnections()
+        place.setup(network)
+        with calls.paused():
+            place.run()
+        self.doc = place.doc
+        self.fittings = place.fittings
+
+    def run(self):
+        removed, deleted = remove_connections(self.doc, self.fittings)
+        return {'connections': removed, 'pipes_deleted': deleted}
+
+
+TOOLS = (
+    ProduceCalculations,
+    ProduceCalculationsRerun,
+    ProduceCalculationsIncremental,
+    PlaceCalculationConnections,
+    RemoveCalculationConnections,
+)
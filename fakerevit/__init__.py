@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-ins for the Revit API used by the Pam Building Design+ tools.
+
+install() registers the fakes as ``Autodesk.Revit.DB`` and friends, so the
+modules in ``lib`` can be imported and run on machines without Revit.
+Documents keep their elements in compact column tables (fakerevit.tables)
+and build models of millions of elements with fakerevit.model. Every fake
+API member counts its calls in ``fakerevit.calls.calls``.
+"""
+import sys
+import types
+
+from fakerevit.calls import CallCounter, api, api_property, calls
+
+
+def _module(name, source=None, **members):
+    module = types.ModuleType(name)
+    if source is not None:
+        for key, value in vars(source).items():
+            if not key.startswith('__'):
+                setattr(module, key, value)
+    for key, value in members.items():
+        setattr(module, key, value)
+    return module
+
+
+def install():
+    """Register the fake Revit and .NET modules in sys.modules."""
+    from fakerevit import db, exceptions, mechanical, plumbing, system
+
+    plumbing_module = _module('Autodesk.Revit.DB.Plumbing', plumbing)
+    mechanical_module = _module('Autodesk.Revit.DB.Mechanical', mechanical)
+    db_module = _module('Autodesk.Revit.DB', db, Plumbing=plumbing_module, Mechanical=mechanical_module)
+    exceptions_module = _module('Autodesk.Revit.Exceptions', exceptions)
+    revit_module = _module('Autodesk.Revit', DB=db_module, Exceptions=exceptions_module)
+    generic_module = _module('System.Collections.Generic', system)
+    collections_module = _module('System.Collections', Generic=generic_module)
+
+    sys.modules.update({
+        'Autodesk': _module('Autodesk', Revit=revit_module),
+        'Autodesk.Revit': revit_module,
+        'Autodesk.Revit.DB': db_module,
+        'Autodesk.Revit.DB.Plumbing': plumbing_module,
+        'Autodesk.Revit.DB.Mechanical': mechanical_module,
+        'Autodesk.Revit.Exceptions': exceptions_module,
+        'System': _module('System', Collections=collections_module, Double=float),
+        'System.Collections': collections_module,
+        'System.Collections.Generic': generic_module,
+    })
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Counting of fake Revit API calls."""
+import functools
+
+
+class CallCounter(object):
+    """Number of calls per API member, such as 'Element.LookupParameter'."""
+
+    def __init__(self):
+        self.counts = {}
+        self.enabled = True
+
+    def count(self, name):
+        if self.enabled:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def reset(self):
+        self.counts = {}
+
+    def total(self):
+        return sum(self.counts.values())
+
+    def snapshot(self):
+        """Return a copy of the counts."""
+        return dict(self.counts)
+
+    def paused(self):
+        """Return a context manager that stops counting while it is active."""
+        return _Paused(self)
+
+
+class _Paused(object):
+
+    def __init__(self, counter):
+        self.counter = counter
+        self.previous = None
+
+    def __enter__(self):
+        self.previous = self.counter.enabled
+        self.counter.enabled = False
+        return self.counter
+
+    def __exit__(self, *exc_info):
+        self.counter.enabled = self.previous
+        return False
+
+
+# Calls made through every fake document
+calls = CallCounter()
+
+
+def api(name):
+    """Decorate a fake API method so every call is counted under name."""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            calls.count(name)
+            return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def api_property(name):
+    """Decorate a getter as a property whose reads are counted under name."""
+    def decorate(function):
+        return property(api(name)(function))
+    return decorate
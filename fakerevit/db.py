@@ -0,0 +1,1492 @@
+# -*- coding: utf-8 -*-
+"""Fake ``Autodesk.Revit.DB`` members used by the Pam Building Design+ tools.
+
+Only the behaviour the tools rely on is modelled. Elements, parameters and
+connectors are views over the column tables of their document (see
+fakerevit.tables), created on demand. Every public member counts its calls
+in fakerevit.calls, so runs against a fake document report how many Revit
+API calls they would have made.
+"""
+import functools
+import math
+
+from fakerevit.calls import api, api_property, calls
+from fakerevit.exceptions import ArgumentException, InvalidOperationException
+from fakerevit.tables import NO_ROW, ConnectorTable, ElementTable
+
+try:
+    _STRING_TYPES = (str, unicode)  # noqa: F821 (Python 2)
+except NameError:
+    _STRING_TYPES = (str,)
+
+# Id of the first element of every fake document
+FIRST_ID = 100001
+
+# Largest gap between two connectors Revit still joins
+CONNECTION_TOLERANCE = 1e-6
+
+
+class _EnumMember(object):
+    __slots__ = ('enum', 'name')
+
+    def __init__(self, enum, name):
+        self.enum = enum
+        self.name = name
+
+    def __repr__(self):
+        return "{}.{}".format(self.enum, self.name)
+
+    def ToString(self):
+        return self.name
+
+
+class _Enum(object):
+    """Enumeration whose members are created on first access."""
+
+    def __init__(self, name, *members):
+        self._name = name
+        self._members = {}
+        for member in members:
+            getattr(self, member)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        # Members become attributes, so later reads skip __getattr__
+        member = self._members[name] = _EnumMember(self._name, name)
+        setattr(self, name, member)
+        return member
+
+    def __str__(self):
+        return self._name
+
+
+BuiltInParameter = _Enum('BuiltInParameter')
+BuiltInCategory = _Enum('BuiltInCategory')
+Domain = _Enum('Domain', 'DomainUndefined', 'DomainHvac', 'DomainElectrical', 'DomainPiping')
+FlowDirectionType = _Enum('FlowDirectionType', 'Bidirectional', 'In', 'Out')
+ConnectorProfileType = _Enum('ConnectorProfileType', 'Invalid', 'Round', 'Rectangular', 'Oval')
+ConnectorType = _Enum('ConnectorType', 'End', 'Curve', 'Physical', 'Logical')
+StorageType = _Enum('StorageType', 'None', 'Integer', 'Double', 'String', 'ElementId')
+UndoOperation = _Enum('UndoOperation', 'TransactionCommitted', 'TransactionUndone', 'TransactionRedone',
+                      'TransactionRolledBack', 'TransactionGroupRolledBack')
+RoutingPreferenceRuleGroupType = _Enum('RoutingPreferenceRuleGroupType', 'Undefined', 'Segments', 'Elbows',
+                                       'Junctions', 'Crosses', 'Transitions', 'Unions',
+                                       'MechanicalJoints', 'TransitionsRectangularToRound',
+                                       'TransitionsRectangularToOval', 'TransitionsOvalToRound', 'Caps')
+TransactionStatus = _Enum('TransactionStatus', 'Uninitialized', 'Started', 'Committed', 'RolledBack')
+
+# Category names of the built-in categories the tools use
+CATEGORY_NAMES = {
+    'OST_PipeCurves': "Pipes",
+    'OST_PipeFitting': "Pipe Fittings",
+    'OST_PipeAccessory': "Pipe Accessories",
+    'OST_PlumbingFixtures': "Plumbing Fixtures",
+    'OST_PipingSystem': "Piping Systems",
+    'OST_DuctCurves': "Ducts",
+    'OST_DuctFitting': "Duct Fittings",
+    'OST_Levels': "Levels",
+}
+
+# Codes of the enumeration members kept in the connector table
+_DIRECTIONS = [FlowDirectionType.Bidirectional, FlowDirectionType.In, FlowDirectionType.Out]
+_SHAPES = [ConnectorProfileType.Round, ConnectorProfileType.Rectangular, ConnectorProfileType.Oval,
+           ConnectorProfileType.Invalid]
+_DOMAINS = [Domain.DomainPiping, Domain.DomainHvac, Domain.DomainElectrical, Domain.DomainUndefined]
+
+# (array typecode, default) of the column of every storage type
+_STORAGE = {
+    StorageType.Double: ('d', 0.0),
+    StorageType.Integer: ('l', 0),
+    StorageType.ElementId: ('l', -1),
+    StorageType.String: (None, None),
+}
+
+
+class ElementId(object):
+    __slots__ = ('IntegerValue',)
+
+    InvalidElementId = None
+
+    def __init__(self, value):
+        self.IntegerValue = int(value)
+
+    @property
+    def Value(self):
+        return self.IntegerValue
+
+    def Equals(self, other):
+        return self == other
+
+    def __eq__(self, other):
+        return isinstance(other, ElementId) and other.IntegerValue == self.IntegerValue
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.IntegerValue)
+
+    def __repr__(self):
+        return str(self.IntegerValue)
+
+    def ToString(self):
+        return str(self.IntegerValue)
+
+
+ElementId.InvalidElementId = ElementId(-1)
+
+
+class XYZ(object):
+    __slots__ = ('X', 'Y', 'Z')
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.X = float(x)
+        self.Y = float(y)
+        self.Z = float(z)
+
+    def __add__(self, other):
+        return XYZ(self.X + other.X, self.Y + other.Y, self.Z + other.Z)
+
+    def __sub__(self, other):
+        return XYZ(self.X - other.X, self.Y - other.Y, self.Z - other.Z)
+
+    def __mul__(self, value):
+        return XYZ(self.X * value, self.Y * value, self.Z * value)
+
+    __rmul__ = __mul__
+
+    def DistanceTo(self, other):
+        return math.sqrt((self.X - other.X) ** 2 + (self.Y - other.Y) ** 2 + (self.Z - other.Z) ** 2)
+
+    def DotProduct(self, other):
+        return self.X * other.X + self.Y * other.Y + self.Z * other.Z
+
+    def GetLength(self):
+        return math.sqrt(self.DotProduct(self))
+
+    def Normalize(self):
+        length = self.GetLength()
+        return XYZ(self.X / length, self.Y / length, self.Z / length)
+
+    def IsAlmostEqualTo(self, other, tolerance=1e-9):
+        return self.DistanceTo(other) <= tolerance
+
+    def _tuple(self):
+        return (self.X, self.Y, self.Z)
+
+    def __repr__(self):
+        return "({}, {}, {})".format(self.X, self.Y, self.Z)
+
+
+class Category(object):
+    __slots__ = ('Name', 'Id', 'BuiltInCategory')
+
+    _by_name = {}
+
+    def __init__(self, name, built_in_category=None):
+        self.Name = name
+        self.BuiltInCategory = built_in_category
+        self.Id = ElementId(-2000000 - len(Category._by_name))
+
+    @classmethod
+    def get(cls, name):
+        """Return the shared Category called name."""
+        category = cls._by_name.get(name)
+        if category is None:
+            built_in = None
+            for member, category_name in CATEGORY_NAMES.items():
+                if category_name == name:
+                    built_in = getattr(BuiltInCategory, member)
+            category = cls._by_name[name] = Category(name, built_in)
+        return category
+
+
+class Definition(object):
+    __slots__ = ('Name',)
+
+    def __init__(self, name):
+        self.Name = name
+
+
+class Parameter(object):
+    """Parameter of one element, a view over one cell of a parameter column."""
+
+    __slots__ = ('_document', '_column', '_row')
+
+    def __init__(self, document, column, row):
+        self._document = document
+        self._column = column
+        self._row = row
+
+    @property
+    def Element(self):
+        return self._document._view(self._row)
+
+    @property
+    def Definition(self):
+        return Definition(self._column.name)
+
+    @property
+    def StorageType(self):
+        return self._column.storage_type
+
+    @property
+    def GUID(self):
+        return self._column.guid
+
+    @property
+    def IsShared(self):
+        return self._column.guid is not None
+
+    @property
+    def IsReadOnly(self):
+        return self._column.read_only
+
+    @property
+    def HasValue(self):
+        return True
+
+    @api('Parameter.AsDouble')
+    def AsDouble(self):
+        # As in Revit, other storage types read 0, Yes/No (Integer) parameters included
+        if self._column.storage_type is StorageType.Double:
+            return float(self._column.get(self._row))
+        return 0.0
+
+    @api('Parameter.AsInteger')
+    def AsInteger(self):
+        if self._column.storage_type is StorageType.Integer:
+            return int(self._column.get(self._row))
+        return 0
+
+    @api('Parameter.AsString')
+    def AsString(self):
+        if self._column.storage_type is StorageType.String:
+            return self._column.get(self._row)
+        return None
+
+    @api('Parameter.AsValueString')
+    def AsValueString(self):
+        value = self._column.get(self._row)
+        return None if value is None else str(value)
+
+    @api('Parameter.AsElementId')
+    def AsElementId(self):
+        if self._column.storage_type is StorageType.ElementId:
+            return ElementId(self._column.get(self._row))
+        return ElementId.InvalidElementId
+
+    @api('Parameter.Set')
+    def Set(self, value):
+        if self._column.read_only:
+            return False
+        self._document._set_parameter(self._column, self._row, _stored(self._column.storage_type, value))
+        return True
+
+    def __eq__(self, other):
+        return (isinstance(other, Parameter) and other._document is self._document
+                and other._column is self._column and other._row == self._row)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self._column), self._row))
+
+
+def _storage_type(value):
+    if isinstance(value, ElementId):
+        return StorageType.ElementId
+    if isinstance(value, _STRING_TYPES):
+        return StorageType.String
+    if isinstance(value, bool) or isinstance(value, int):
+        return StorageType.Integer
+    return StorageType.Double
+
+
+def _stored(storage_type, value):
+    """Return value as kept in a column of storage_type."""
+    if storage_type is StorageType.ElementId:
+        if not isinstance(value, ElementId):
+            raise ArgumentException("The parameter holds an ElementId.")
+        return value.IntegerValue
+    if storage_type is StorageType.String:
+        if value is not None and not isinstance(value, _STRING_TYPES):
+            raise ArgumentException("The parameter holds a string.")
+        return value
+    if isinstance(value, _STRING_TYPES) or isinstance(value, ElementId):
+        raise ArgumentException("The parameter holds a number.")
+    if storage_type is StorageType.Integer:
+        return int(value)
+    return float(value)
+
+
+class _InstanceOrStatic(object):
+    """Method with an instance overload and a static overload of the same name, as .NET allows."""
+
+    def __init__(self, instance_method, static_method):
+        self._instance_method = instance_method
+        self._static_method = static_method
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self._static_method
+        return functools.partial(self._instance_method, instance)
+
+
+@api('Element.ChangeTypeId')
+def _change_type_id(element, type_id):
+    element.Document._change_types([element._row], type_id)
+    return element.Id
+
+
+@api('Element.ChangeTypeId (bulk)')
+def _change_type_ids(document, element_ids, type_id):
+    rows = []
+    for element_id in element_ids:
+        row = document._row_of(element_id)
+        if row is None:
+            raise ArgumentException("{} is not an element of the document".format(element_id))
+        rows.append(row)
+    document._change_types(rows, type_id)
+    return {}
+
+
+class Element(object):
+    """Base of every fake element, a view over one row of its document."""
+
+    __slots__ = ('Document', '_row')
+
+    def __init__(self, document, row):
+        self.Document = document
+        self._row = row
+
+    @api_property('Element.Id')
+    def Id(self):
+        return ElementId(FIRST_ID + self._row)
+
+    @api_property('Element.Category')
+    def Category(self):
+        name = self.Document._table.category_name(self._row)
+        return Category.get(name) if name else None
+
+    @api_property('Element.Name')
+    def Name(self):
+        return self.Document._table.names[self._row]
+
+    @property
+    def IsValidObject(self):
+        return self.Document._table.alive[self._row] == 1
+
+    @api_property('Element.Location')
+    def Location(self):
+        return None
+
+    def _add_parameter(self, key, name, value=0.0, storage_type=None, guid=None, read_only=False):
+        """Give the element parameter key, outside of any transaction."""
+        storage_type = storage_type or _storage_type(value)
+        typecode, default = _STORAGE[storage_type]
+        column = self.Document._table.column(key, name, storage_type, typecode, default, guid, read_only)
+        column.set(self._row, _stored(column.storage_type, value))
+        return Parameter(self.Document, column, self._row)
+
+    def _value(self, key, default=None):
+        """Return the value of parameter key without counting an API call."""
+        column = self.Document._table.columns.get(key)
+        if column is None or self._row not in column:
+            return default
+        return column.get(self._row)
+
+    @api('Element.get_Parameter')
+    def get_Parameter(self, key):
+        column = self.Document._table.columns.get(key)
+        if column is None or self._row not in column:
+            return None
+        return Parameter(self.Document, column, self._row)
+
+    @api('Element.LookupParameter')
+    def LookupParameter(self, name):
+        for column in self.Document._table.columns_by_name.get(name, ()):
+            if self._row in column:
+                return Parameter(self.Document, column, self._row)
+        return None
+
+    # element.ChangeTypeId(type_id) or Element.ChangeTypeId(document, element_ids, type_id)
+    ChangeTypeId = _InstanceOrStatic(_change_type_id, _change_type_ids)
+
+    @api('Element.GetTypeId')
+    def GetTypeId(self):
+        type_row = self.Document._table.type_rows[self._row]
+        return ElementId(FIRST_ID + type_row) if type_row != NO_ROW else ElementId.InvalidElementId
+
+    def __eq__(self, other):
+        return isinstance(other, Element) and other.Document is self.Document and other._row == self._row
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._row)
+
+    def __repr__(self):
+        return "<{} {}>".format(type(self).__name__, FIRST_ID + self._row)
+
+
+class ElementType(Element):
+    __slots__ = ()
+
+
+class Connector(object):
+    """Physical connector of a pipe, fitting or fixture."""
+
+    __slots__ = ('_document', '_row')
+
+    def __init__(self, document, row):
+        self._document = document
+        self._row = row
+
+    @api_property('Connector.Owner')
+    def Owner(self):
+        return self._document._view(self._document._connectors.owners[self._row])
+
+    @api_property('Connector.Id')
+    def Id(self):
+        return self._row - self._document._table.first_connector[self._document._connectors.owners[self._row]]
+
+    @api_property('Connector.Domain')
+    def Domain(self):
+        return _DOMAINS[self._document._connectors.domains[self._row]]
+
+    @api_property('Connector.Direction')
+    def Direction(self):
+        return _DIRECTIONS[self._document._connectors.directions[self._row]]
+
+    @api_property('Connector.Shape')
+    def Shape(self):
+        return _SHAPES[self._document._connectors.shapes[self._row]]
+
+    @api_property('Connector.Radius')
+    def Radius(self):
+        return self._document._connectors.radii[self._row]
+
+    @api_property('Connector.ConnectorType')
+    def ConnectorType(self):
+        return ConnectorType.End
+
+    @api_property('Connector.Origin')
+    def Origin(self):
+        return XYZ(*self._document._connectors.origin(self._row))
+
+    def _set_origin(self, value):
+        calls.count('Connector.Origin')
+        self._document._set_connector_origin(self._row, value._tuple())
+
+    Origin = Origin.setter(_set_origin)
+
+    @api_property('Connector.AllRefs')
+    def AllRefs(self):
+        return [Connector(self._document, row) for row in self._document._connectors.refs(self._row)]
+
+    @api_property('Connector.IsConnected')
+    def IsConnected(self):
+        return self._document._connectors.partners[self._row] != NO_ROW
+
+    @api('Connector.ConnectTo')
+    def ConnectTo(self, other):
+        """Join the connectors, replacing any connection either end already has."""
+        document = self._document
+        if other._row == self._row or document._connectors.partners[self._row] == other._row:
+            raise InvalidOperationException("The connectors are already connected.")
+        for row in (self._row, other._row):
+            for partner in document._connectors.refs(row):
+                document._unlink(row, partner)
+        document._link(self._row, other._row)
+
+    @api('Connector.DisconnectFrom')
+    def DisconnectFrom(self, other):
+        if self._document._connectors.partners[self._row] != other._row:
+            raise InvalidOperationException("The connectors are not connected.")
+        self._document._unlink(self._row, other._row)
+
+    def __eq__(self, other):
+        return isinstance(other, Connector) and other._document is self._document and other._row == self._row
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._row)
+
+
+class ConnectorSet(object):
+    __slots__ = ('_document', '_rows')
+
+    def __init__(self, document, rows):
+        self._document = document
+        self._rows = rows
+
+    @property
+    def Size(self):
+        return len(self._rows)
+
+    @property
+    def IsEmpty(self):
+        return not self._rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        document = self._document
+        return iter([Connector(document, row) for row in self._rows])
+
+
+class ConnectorManager(object):
+    __slots__ = ('Owner',)
+
+    def __init__(self, owner):
+        self.Owner = owner
+
+    @api_property('ConnectorManager.Connectors')
+    def Connectors(self):
+        return ConnectorSet(self.Owner.Document, self.Owner.Document._table.connector_rows(self.Owner._row))
+
+    def _add(self, origin, direction, radius, shape=None, domain=None):
+        """Add a connector to the owner, outside of any transaction."""
+        return self.Owner.Document._add_connector(self.Owner._row, origin, direction, radius, shape, domain)
+
+
+class MEPModel(object):
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    @api_property('MEPModel.ConnectorManager')
+    def ConnectorManager(self):
+        return ConnectorManager(self._owner)
+
+
+class Line(object):
+    __slots__ = ('_start', '_end')
+
+    def __init__(self, start, end):
+        self._start = start
+        self._end = end
+
+    @classmethod
+    def CreateBound(cls, start, end):
+        return cls(start, end)
+
+    @api('Curve.GetEndPoint')
+    def GetEndPoint(self, index):
+        return self._start if index == 0 else self._end
+
+    @property
+    def Direction(self):
+        return (self._end - self._start).Normalize()
+
+    @property
+    def Length(self):
+        return self._start.DistanceTo(self._end)
+
+    def Evaluate(self, parameter, normalized):
+        return self._start + (self._end - self._start) * parameter
+
+
+class BoundingBoxXYZ(object):
+    """Box from Min to Max. Fake elements have none, so get_BoundingBox is not faked."""
+
+    def __init__(self):
+        self.Min = XYZ(0.0, 0.0, 0.0)
+        self.Max = XYZ(0.0, 0.0, 0.0)
+
+
+class LocationCurve(object):
+    __slots__ = ('Curve',)
+
+    def __init__(self, curve):
+        self.Curve = curve
+
+
+class LocationPoint(object):
+    __slots__ = ('Point',)
+
+    def __init__(self, point):
+        self.Point = point
+
+
+class MEPCurve(Element):
+    """Straight pipe or duct with a start (inlet) and end (outlet) connector."""
+
+    __slots__ = ()
+
+    @api_property('MEPCurve.ConnectorManager')
+    def ConnectorManager(self):
+        return ConnectorManager(self)
+
+    @api_property('Element.Location')
+    def Location(self):
+        table = self.Document._table
+        return LocationCurve(Line(XYZ(*table.start(self._row)), XYZ(*table.end(self._row))))
+
+    @api_property('MEPCurve.Diameter')
+    def Diameter(self):
+        return self._value(BuiltInParameter.RBS_PIPE_DIAMETER_PARAM, 0.0)
+
+
+class Family(Element):
+    __slots__ = ()
+
+
+class FamilySymbol(ElementType):
+    __slots__ = ()
+
+    @api_property('FamilySymbol.FamilyName')
+    def FamilyName(self):
+        return self.Document._table.names[self.Document._table.extra(self._row)['family']]
+
+    @api_property('FamilySymbol.Family')
+    def Family(self):
+        return self.Document._view(self.Document._table.extra(self._row)['family'])
+
+    @property
+    def IsActive(self):
+        return True
+
+    def Activate(self):
+        pass
+
+
+class FamilyInstance(Element):
+    """Fitting, accessory or fixture placed from a FamilySymbol."""
+
+    __slots__ = ()
+
+    @api_property('FamilyInstance.MEPModel')
+    def MEPModel(self):
+        return MEPModel(self)
+
+    @api_property('Element.Location')
+    def Location(self):
+        return LocationPoint(XYZ(*self.Document._table.start(self._row)))
+
+    @api_property('FamilyInstance.Symbol')
+    def Symbol(self):
+        type_row = self.Document._table.type_rows[self._row]
+        return self.Document._view(type_row) if type_row != NO_ROW else None
+
+
+class Level(Element):
+    __slots__ = ()
+
+    @api_property('Level.Elevation')
+    def Elevation(self):
+        return self.Document._table.z[self._row]
+
+    @api_property('Level.ProjectElevation')
+    def ProjectElevation(self):
+        return self.Document._table.z[self._row]
+
+
+class SharedParameterElement(Element):
+    """Shared parameter whose GUID, as in a shared parameter file, depends only on its name."""
+
+    __slots__ = ()
+
+    @property
+    def GuidValue(self):
+        return self.Document._table.extra(self._row)['guid']
+
+    @api('SharedParameterElement.GetDefinition')
+    def GetDefinition(self):
+        return Definition(self.Document._table.names[self._row])
+
+
+class PrimarySizeCriterion(object):
+
+    def __init__(self, minimum_size, maximum_size):
+        self.MinimumSize = float(minimum_size)
+        self.MaximumSize = float(maximum_size)
+
+    def _includes(self, size):
+        return self.MinimumSize - CONNECTION_TOLERANCE <= size <= self.MaximumSize + CONNECTION_TOLERANCE
+
+
+class RoutingPreferenceRule(object):
+
+    def __init__(self, part_id, description):
+        self.MEPPartId = part_id
+        self.Description = description
+        self._criteria = []
+
+    @property
+    def NumberOfCriteria(self):
+        return len(self._criteria)
+
+    def AddCriterion(self, criterion):
+        self._criteria.append(criterion)
+
+    def GetCriterion(self, index):
+        return self._criteria[index]
+
+    def _copy(self):
+        rule = RoutingPreferenceRule(self.MEPPartId, self.Description)
+        rule._criteria = list(self._criteria)
+        return rule
+
+    def _includes(self, size):
+        return all(criterion._includes(size) for criterion in self._criteria)
+
+
+class RoutingPreferenceManager(object):
+    """Routing preference rules of a pipe type, kept with the type's row.
+
+    Rules are copied in and out, as the Revit API hands out copies.
+    """
+
+    def __init__(self, document, type_row):
+        self._document = document
+        self._type_row = type_row
+
+    def _rules(self, group_type):
+        return self._document._table.extra(self._type_row).setdefault('routing', {}).setdefault(
+            group_type.name, [])
+
+    @api('RoutingPreferenceManager.GetNumberOfRules')
+    def GetNumberOfRules(self, group_type):
+        return len(self._rules(group_type))
+
+    @api('RoutingPreferenceManager.GetRule')
+    def GetRule(self, group_type, index):
+        rules = self._rules(group_type)
+        if not 0 <= index < len(rules):
+            raise ArgumentException("There is no rule at index {}.".format(index))
+        return rules[index]._copy()
+
+    @api('RoutingPreferenceManager.AddRule')
+    def AddRule(self, group_type, rule, index=None):
+        rules = self._rules(group_type)
+        if index is None or index > len(rules):
+            index = len(rules)
+        self._document._insert_rule(self._type_row, rules, index, rule._copy())
+
+    @api('RoutingPreferenceManager.RemoveRule')
+    def RemoveRule(self, group_type, index):
+        rules = self._rules(group_type)
+        if not 0 <= index < len(rules):
+            raise ArgumentException("There is no rule at index {}.".format(index))
+        self._document._remove_rule(self._type_row, rules, index)
+
+
+class ElementMulticategoryFilter(object):
+
+    def __init__(self, categories, inverted=False):
+        self._names = set(CATEGORY_NAMES.get(category.name) for category in categories)
+        self._inverted = inverted
+
+    def PassesFilter(self, element):
+        passes = element is not None and element.Category is not None and element.Category.Name in self._names
+        return passes != self._inverted
+
+    def _passes(self, table, row):
+        return (table.category_name(row) in self._names) != self._inverted
+
+
+class ElementCategoryFilter(ElementMulticategoryFilter):
+
+    def __init__(self, category, inverted=False):
+        ElementMulticategoryFilter.__init__(self, [category], inverted)
+
+
+class ElementClassFilter(object):
+
+    def __init__(self, cls, inverted=False):
+        self._cls = cls
+        self._inverted = inverted
+
+    def PassesFilter(self, element):
+        return isinstance(element, self._cls) != self._inverted
+
+    def _passes(self, table, row):
+        return issubclass(table.cls(row), self._cls) != self._inverted
+
+
+class ElementLevelFilter(object):
+    """Passes the elements whose Level parameter is level_id (fake pipes have none)."""
+
+    def __init__(self, level_id, inverted=False):
+        self._level = level_id.IntegerValue
+        self._inverted = inverted
+
+    def PassesFilter(self, element):
+        return (element._value(BuiltInParameter.FAMILY_LEVEL_PARAM) == self._level) != self._inverted
+
+    def _passes(self, table, row):
+        column = table.columns.get(BuiltInParameter.FAMILY_LEVEL_PARAM)
+        level = column.get(row) if column is not None and row in column else None
+        return (level == self._level) != self._inverted
+
+
+class FilteredElementCollector(object):
+    """Lazy collector over the rows of a fake document.
+
+    Filters test the table columns, so views are only created for the
+    elements collected.
+    """
+
+    @api('FilteredElementCollector')
+    def __init__(self, document, scope=None):
+        self._document = document
+        self._filters = []
+        self._rows = None
+        if scope is not None and not isinstance(scope, ElementId):
+            # Collector over a collection of element ids
+            self._rows = sorted(document._row_of(element_id) for element_id in scope
+                                if document._row_of(element_id) is not None)
+
+    def _add(self, predicate):
+        self._filters.append(predicate)
+        return self
+
+    def _class_filter(self, test):
+        table = self._document._table
+        matches = {}
+
+        def predicate(row):
+            kind = table.kinds[row]
+            match = matches.get(kind)
+            if match is None:
+                match = matches[kind] = test(table.classes[kind])
+            return match
+        return self._add(predicate)
+
+    @api('FilteredElementCollector.OfClass')
+    def OfClass(self, cls):
+        return self._class_filter(lambda kind: issubclass(kind, cls))
+
+    @api('FilteredElementCollector.OfCategory')
+    def OfCategory(self, category):
+        table = self._document._table
+        name = CATEGORY_NAMES.get(category.name)
+        return self._add(lambda row: table.category_name(row) == name)
+
+    @api('FilteredElementCollector.WhereElementIsNotElementType')
+    def WhereElementIsNotElementType(self):
+        return self._class_filter(lambda kind: not issubclass(kind, ElementType))
+
+    @api('FilteredElementCollector.WhereElementIsElementType')
+    def WhereElementIsElementType(self):
+        return self._class_filter(lambda kind: issubclass(kind, ElementType))
+
+    @api('FilteredElementCollector.WherePasses')
+    def WherePasses(self, element_filter):
+        table = self._document._table
+        return self._add(lambda row: element_filter._passes(table, row))
+
+    def _matching_rows(self):
+        table = self._document._table
+        rows = self._rows if self._rows is not None else range(len(table))
+        alive = table.alive
+        filters = self._filters
+        for row in rows:
+            if alive[row] and all(predicate(row) for predicate in filters):
+                yield row
+
+    def _elements(self):
+        view = self._document._view
+        for row in self._matching_rows():
+            yield view(row)
+
+    def __iter__(self):
+        return self._elements()
+
+    @api('FilteredElementCollector.ToElements')
+    def ToElements(self):
+        return list(self._elements())
+
+    @api('FilteredElementCollector.ToElementIds')
+    def ToElementIds(self):
+        return [ElementId(FIRST_ID + row) for row in self._matching_rows()]
+
+    @api('FilteredElementCollector.FirstElement')
+    def FirstElement(self):
+        for element in self._elements():
+            return element
+        return None
+
+    @api('FilteredElementCollector.GetElementCount')
+    def GetElementCount(self):
+        return sum(1 for _ in self._matching_rows())
+
+
+class DocumentChangedEventArgs(object):
+    """Arguments of the DocumentChanged event."""
+
+    def __init__(self, document, names, operation, added, modified, deleted):
+        self._document = document
+        self._names = names
+        self.Operation = operation
+        self._added = added
+        self._modified = modified
+        self._deleted = deleted
+
+    def GetDocument(self):
+        return self._document
+
+    def GetTransactionNames(self):
+        return list(self._names)
+
+    def GetAddedElementIds(self, element_filter=None):
+        return self._filtered(self._added, element_filter)
+
+    def GetModifiedElementIds(self, element_filter=None):
+        return self._filtered(self._modified, element_filter)
+
+    def GetDeletedElementIds(self):
+        return list(self._deleted)
+
+    def _filtered(self, ids, element_filter):
+        if element_filter is None:
+            return list(ids)
+        table = self._document._table
+        return [element_id for element_id in ids
+                if element_filter._passes(table, element_id.IntegerValue - FIRST_ID)]
+
+
+class Transaction(object):
+
+    def __init__(self, document, name=None):
+        self._document = document
+        self._name = name
+        self._status = TransactionStatus.Uninitialized
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._status is TransactionStatus.Started:
+            self.RollBack()
+        return False
+
+    def GetName(self):
+        return self._name
+
+    def GetStatus(self):
+        return self._status
+
+    @api('Transaction.Start')
+    def Start(self, name=None):
+        if name is not None:
+            self._name = name
+        if self._document._transaction is not None:
+            raise InvalidOperationException("A transaction is already started.")
+        self._document._begin(self)
+        self._status = TransactionStatus.Started
+        return self._status
+
+    @api('Transaction.Commit')
+    def Commit(self):
+        self._require_started()
+        self._document._commit()
+        self._status = TransactionStatus.Committed
+        return self._status
+
+    @api('Transaction.RollBack')
+    def RollBack(self):
+        self._require_started()
+        self._document._rollback()
+        self._status = TransactionStatus.RolledBack
+        return self._status
+
+    def _require_started(self):
+        if self._status is not TransactionStatus.Started:
+            raise InvalidOperationException("The transaction has not been started.")
+
+
+class TransactionGroup(object):
+    """Group of transactions that can be rolled back as a whole."""
+
+    def __init__(self, document, name=None):
+        self._document = document
+        self._name = name
+        self._status = TransactionStatus.Uninitialized
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._status is TransactionStatus.Started:
+            self.RollBack()
+        return False
+
+    def GetStatus(self):
+        return self._status
+
+    @api('TransactionGroup.Start')
+    def Start(self, name=None):
+        if self._document._transaction is not None:
+            raise InvalidOperationException("A transaction group cannot start inside a transaction.")
+        self._document._begin_group(self)
+        self._status = TransactionStatus.Started
+        return self._status
+
+    @api('TransactionGroup.Assimilate')
+    def Assimilate(self):
+        return self.Commit()
+
+    @api('TransactionGroup.Commit')
+    def Commit(self):
+        self._require_started()
+        self._document._end_group(self, rollback=False)
+        self._status = TransactionStatus.Committed
+        return self._status
+
+    @api('TransactionGroup.RollBack')
+    def RollBack(self):
+        self._require_started()
+        self._document._end_group(self, rollback=True)
+        self._status = TransactionStatus.RolledBack
+        return self._status
+
+    def _require_started(self):
+        if self._status is not TransactionStatus.Started:
+            raise InvalidOperationException("The transaction group has not been started.")
+
+
+class UnitTypeId(object):
+    LitersPerSecond = 'LitersPerSecond'
+    CubicFeetPerSecond = 'CubicFeetPerSecond'
+    Feet = 'Feet'
+    Millimeters = 'Millimeters'
+    Meters = 'Meters'
+
+
+# Size of one unit in Revit internal units (feet, cubic feet per second)
+_UNIT_SCALES = {
+    UnitTypeId.LitersPerSecond: 0.0353146667214886,
+    UnitTypeId.CubicFeetPerSecond: 1.0,
+    UnitTypeId.Feet: 1.0,
+    UnitTypeId.Millimeters: 1.0 / 304.8,
+    UnitTypeId.Meters: 1000.0 / 304.8,
+}
+
+
+class UnitUtils(object):
+
+    @staticmethod
+    @api('UnitUtils.ConvertToInternalUnits')
+    def ConvertToInternalUnits(value, unit):
+        return value * _UNIT_SCALES[unit]
+
+    @staticmethod
+    @api('UnitUtils.ConvertFromInternalUnits')
+    def ConvertFromInternalUnits(value, unit):
+        return value / _UNIT_SCALES[unit]
+
+    @staticmethod
+    @api('UnitUtils.Convert')
+    def Convert(value, from_unit, to_unit):
+        return value * _UNIT_SCALES[from_unit] / _UNIT_SCALES[to_unit]
+
+
+class _Event(object):
+    """.NET style event supporting += and -=."""
+
+    def __init__(self):
+        self._handlers = []
+
+    def __iadd__(self, handler):
+        self._handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+        return self
+
+    def __call__(self, sender, args):
+        for handler in list(self._handlers):
+            handler(sender, args)
+
+
+class Application(object):
+
+    def __init__(self):
+        self.DocumentChanged = _Event()
+
+
+class _Changes(object):
+    """Element ids added, modified and deleted, and how to undo the changes."""
+
+    def __init__(self):
+        self.added = []
+        self.modified = []
+        self.modified_set = set()
+        self.deleted = []
+        self.undo = []
+
+    def extend(self, other):
+        self.added.extend(other.added)
+        for element_id in other.modified:
+            if element_id not in self.modified_set:
+                self.modified_set.add(element_id)
+                self.modified.append(element_id)
+        self.deleted.extend(other.deleted)
+        self.undo.extend(other.undo)
+
+
+class Document(object):
+    """Fake Revit document keeping its elements in column tables.
+
+    Changes made in a transaction are logged so rolling back the
+    transaction, or the transaction group around it, undoes them.
+    """
+
+    def __init__(self, title="Synthetic", path_name="", application=None):
+        self.Title = title
+        self.PathName = path_name
+        self.Application = application or Application()
+        self.Create = _Creation(self)
+        self._table = ElementTable()
+        self._connectors = ConnectorTable()
+        self._transaction = None
+        self._changes = None
+        self._groups = []
+
+    # Views and rows
+
+    def _view(self, row):
+        return self._table.cls(row)(self, row)
+
+    def _row_of(self, element_id):
+        """Return the row of a live element, or None."""
+        row = element_id.IntegerValue - FIRST_ID
+        if 0 <= row < len(self._table) and self._table.alive[row]:
+            return row
+        return None
+
+    def _new_element(self, cls, category_name=None, name="", type_row=NO_ROW,
+                     start=(0.0, 0.0, 0.0), end=(0.0, 0.0, 0.0)):
+        row = self._table.add(cls, category_name, name, type_row, start, end)
+        if self._changes is not None:
+            self._changes.added.append(ElementId(FIRST_ID + row))
+            self._changes.undo.append((self._set_alive, (row, 0)))
+        return cls(self, row)
+
+    def _add_connector(self, owner_row, origin, direction, radius, shape=None, domain=None):
+        connector_row = self._connectors.add(
+            owner_row, origin, _DIRECTIONS.index(direction), radius,
+            _SHAPES.index(shape or ConnectorProfileType.Round), _DOMAINS.index(domain or Domain.DomainPiping))
+        self._table.attach_connector(owner_row, connector_row)
+        return Connector(self, connector_row)
+
+    # Changes
+
+    def _require_transaction(self):
+        if self._transaction is None:
+            raise InvalidOperationException(
+                "Attempting to modify the document outside of a transaction.")
+
+    def _mark_modified(self, row):
+        changes = self._changes
+        element_id = ElementId(FIRST_ID + row)
+        if element_id not in changes.modified_set:
+            changes.modified_set.add(element_id)
+            changes.modified.append(element_id)
+
+    def _set_alive(self, row, alive):
+        self._table.alive[row] = alive
+
+    def _set_parameter(self, column, row, value):
+        self._require_transaction()
+        self._changes.undo.append((column.set, (row, column.get(row))))
+        column.set(row, value)
+        self._mark_modified(row)
+
+    def _change_types(self, rows, type_id):
+        """Give rows the type type_id, or none of them if one cannot take it."""
+        self._require_transaction()
+        table = self._table
+        type_row = self._row_of(type_id)
+        if type_row is None or not issubclass(table.cls(type_row), ElementType):
+            raise ArgumentException("{} is not an element type".format(type_id))
+        # Family instances take family symbols, pipes take pipe types
+        is_symbol = issubclass(table.cls(type_row), FamilySymbol)
+        for row in rows:
+            if issubclass(table.cls(row), FamilyInstance) != is_symbol:
+                raise ArgumentException("{} cannot take the type {}".format(ElementId(FIRST_ID + row), type_id))
+        for row in rows:
+            self._changes.undo.append((table.type_rows.__setitem__, (row, table.type_rows[row])))
+            table.type_rows[row] = type_row
+            self._mark_modified(row)
+
+    def _set_connector_origin(self, row, origin):
+        self._require_transaction()
+        self._changes.undo.append((self._connectors.set_origin, (row, self._connectors.origin(row))))
+        self._connectors.set_origin(row, origin)
+        owner = self._connectors.owners[row]
+        if issubclass(self._table.cls(owner), MEPCurve):
+            # Moving the end connector of a curve moves that end of the curve
+            table = self._table
+            if row == table.first_connector[owner]:
+                self._set_location(owner, origin, table.end(owner))
+            else:
+                self._set_location(owner, table.start(owner), origin)
+        self._mark_modified(owner)
+
+    def _set_location(self, row, start, end):
+        self._require_transaction()
+        table = self._table
+        self._changes.undo.append((table.set_location, (row, table.start(row), table.end(row))))
+        table.set_location(row, start, end)
+        self._mark_modified(row)
+
+    def _insert_rule(self, type_row, rules, index, rule):
+        self._require_transaction()
+        self._changes.undo.append((rules.pop, (index,)))
+        rules.insert(index, rule)
+        self._mark_modified(type_row)
+
+    def _remove_rule(self, type_row, rules, index):
+        self._require_transaction()
+        self._changes.undo.append((rules.insert, (index, rules[index])))
+        del rules[index]
+        self._mark_modified(type_row)
+
+    def _union_rule_symbol(self, curve_row, size):
+        """Return the row of the first union of the routing preferences of curve_row's type for size."""
+        type_row = self._table.type_rows[curve_row]
+        if type_row == NO_ROW:
+            return NO_ROW
+        for rule in self._table.extra(type_row).get('routing', {}).get('Unions', ()):
+            if rule._includes(size):
+                row = self._row_of(rule.MEPPartId)
+                if row is not None:
+                    return row
+        return NO_ROW
+
+    @property
+    def IsModifiable(self):
+        return self._transaction is not None
+
+    def _link(self, a, b):
+        self._require_transaction()
+        self._changes.undo.append((self._connectors.unlink, (a, b)))
+        self._connectors.link(a, b)
+        self._mark_modified(self._connectors.owners[a])
+        self._mark_modified(self._connectors.owners[b])
+
+    def _unlink(self, a, b):
+        self._require_transaction()
+        self._changes.undo.append((self._connectors.link, (a, b)))
+        self._connectors.unlink(a, b)
+        self._mark_modified(self._connectors.owners[a])
+        self._mark_modified(self._connectors.owners[b])
+
+    def _add_to_system(self, row, system_row):
+        """Make row part of the piping system of system_row, as Revit does for new parts."""
+        if system_row == NO_ROW:
+            return
+        network = self._table.extra(system_row)['network']
+        self._changes.undo.append((network.pop, ()))
+        network.append(row)
+        self._table.system_rows[row] = system_row
+
+    # Transactions
+
+    def _begin(self, transaction):
+        self._transaction = transaction
+        self._changes = _Changes()
+
+    def _commit(self):
+        changes = self._finish()
+        if self._groups:
+            self._groups[-1][1].extend(changes)
+        self._raise_changed([self._transaction_name], UndoOperation.TransactionCommitted, changes)
+
+    def _rollback(self):
+        changes = self._finish()
+        self._undo(changes)
+
+    def _finish(self):
+        changes = self._changes
+        self._transaction_name = self._transaction.GetName()
+        self._transaction = None
+        self._changes = None
+        return changes
+
+    def _undo(self, changes):
+        for function, args in reversed(changes.undo):
+            function(*args)
+
+    def _begin_group(self, group):
+        self._groups.append((group, _Changes()))
+
+    def _end_group(self, group, rollback):
+        if not self._groups or self._groups[-1][0] is not group:
+            raise InvalidOperationException("Transaction groups must end in the order they started.")
+        group, changes = self._groups.pop()
+        if rollback:
+            self._undo(changes)
+            # Undoing turns additions into deletions and the reverse
+            undone = _Changes()
+            undone.added = changes.deleted
+            undone.modified = changes.modified
+            undone.deleted = changes.added
+            self._raise_changed([group._name], UndoOperation.TransactionGroupRolledBack, undone)
+        elif self._groups:
+            self._groups[-1][1].extend(changes)
+
+    def _raise_changed(self, names, operation, changes):
+        alive = self._table.alive
+
+        def live(ids):
+            return [element_id for element_id in ids if alive[element_id.IntegerValue - FIRST_ID]]
+        added = live(changes.added)
+        added_set = set(added)
+        modified = [element_id for element_id in live(changes.modified) if element_id not in added_set]
+        deleted = [element_id for element_id in changes.deleted if not alive[element_id.IntegerValue - FIRST_ID]]
+        args = DocumentChangedEventArgs(self, names, operation, added, modified, deleted)
+        with calls.paused():
+            self.Application.DocumentChanged(self.Application, args)
+
+    # API
+
+    @api('Document.GetElement')
+    def GetElement(self, reference):
+        if isinstance(reference, ElementId):
+            element_id = reference
+        else:
+            element_id = getattr(reference, 'ElementId', None)
+            if element_id is None:
+                raise ArgumentException("Unsupported reference {!r}".format(reference))
+        row = self._row_of(element_id)
+        return self._view(row) if row is not None else None
+
+    @api('Document.Delete')
+    def Delete(self, element_id):
+        self._require_transaction()
+        ids = element_id if isinstance(element_id, (list, tuple, set)) else [element_id]
+        deleted = []
+        for one_id in ids:
+            row = self._row_of(one_id)
+            if row is None:
+                continue
+            for connector_row in self._table.connector_rows(row):
+                for partner in self._connectors.refs(connector_row):
+                    self._unlink(connector_row, partner)
+            self._changes.undo.append((self._set_alive, (row, 1)))
+            self._set_alive(row, 0)
+            self._changes.deleted.append(one_id)
+            deleted.append(one_id)
+        return deleted
+
+
+def _break_curve(document, curve_id, point):
+    """Break the curve of curve_id at point and return the id of the new curve.
+
+    The new curve runs from the start of the original to point, and keeps
+    the connections of the original's start; the original now starts at
+    point. This is the order Place Calculation Connections relies on when
+    it breaks the same curve at points sorted from its start.
+    """
+    document._require_transaction()
+    row = document._row_of(curve_id)
+    table = document._table
+    if row is None or not issubclass(table.cls(row), MEPCurve):
+        raise ArgumentException("The element is not a pipe or duct.")
+    start, end = table.start(row), table.end(row)
+    point = point._tuple()
+    length = math.sqrt(sum((b - a) ** 2 for a, b in zip(start, end)))
+    t = sum((p - a) * (b - a) for a, b, p in zip(start, end, point)) / (length * length)
+    on_line = [a + (b - a) * t for a, b in zip(start, end)]
+    if not 0.0 < t < 1.0 or math.sqrt(sum((p - q) ** 2 for p, q in zip(point, on_line))) > CONNECTION_TOLERANCE:
+        raise ArgumentException("The point is not on the curve.")
+
+    cls = table.cls(row)
+    new = document._new_element(cls, table.category_name(row), table.names[row], table.type_rows[row],
+                                start, point)
+    for column in table.columns.values():
+        if row in column:
+            column.set(new._row, column.get(row))
+    original_start, original_end = table.connector_rows(row)
+    connectors = document._connectors
+    new_start = document._add_connector(new._row, start, _DIRECTIONS[connectors.directions[original_start]],
+                                        connectors.radii[original_start])._row
+    document._add_connector(new._row, point, _DIRECTIONS[connectors.directions[original_end]],
+                            connectors.radii[original_end])
+
+    # The connections at the start move to the new curve
+    for partner in connectors.refs(original_start):
+        document._unlink(original_start, partner)
+        document._link(new_start, partner)
+    document._set_connector_origin(original_start, point)
+    document._add_to_system(new._row, table.system_rows[row])
+    return ElementId(FIRST_ID + new._row)
+
+
+def _new_fitting(document, category_name, origin, symbol_row=NO_ROW, classification="", system_row=NO_ROW):
+    """Add a family instance with the parameters every placed fitting has."""
+    table = document._table
+    name = table.names[symbol_row] if symbol_row != NO_ROW else ""
+    fitting = document._new_element(FamilyInstance, category_name, name, symbol_row, origin)
+    fitting._add_parameter(BuiltInParameter.RBS_SYSTEM_CLASSIFICATION_PARAM, "System Classification",
+                           classification, StorageType.String, read_only=True)
+    fitting._add_parameter(BuiltInParameter.RBS_PIPE_FIXTURE_UNITS_PARAM, "Fixture Units",
+                           0.0, StorageType.Double, read_only=True)
+    fitting._add_parameter(BuiltInParameter.FAMILY_LEVEL_PARAM, "Level",
+                           ElementId.InvalidElementId, StorageType.ElementId)
+    fitting._add_parameter("Elevation from Level", "Elevation from Level", 0.0, StorageType.Double)
+    if system_row != NO_ROW:
+        if document._changes is not None:
+            document._add_to_system(fitting._row, system_row)
+        else:
+            table.extra(system_row)['network'].append(fitting._row)
+            table.system_rows[fitting._row] = system_row
+    return fitting
+
+
+class _Creation(object):
+    """Stand-in for Document.Create."""
+
+    def __init__(self, document):
+        self._document = document
+
+    @api('Document.Create.NewUnionFitting')
+    def NewUnionFitting(self, connector, other):
+        """Join two free, coincident connectors with a union fitting.
+
+        The union takes the first symbol registered with
+        fakerevit.model.set_union_fitting, as Revit takes the union of the
+        routing preferences.
+        """
+        document = self._document
+        document._require_transaction()
+        connectors = document._connectors
+        a, b = connector._row, other._row
+        if connectors.partners[a] != NO_ROW or connectors.partners[b] != NO_ROW:
+            raise InvalidOperationException("The connectors are already connected.")
+        if math.sqrt(sum((p - q) ** 2 for p, q in zip(connectors.origin(a), connectors.origin(b)))) \
+                > CONNECTION_TOLERANCE:
+            raise InvalidOperationException("The connectors are not coincident.")
+        symbol_row = document._union_rule_symbol(connectors.owners[a], 2 * connectors.radii[a])
+        if symbol_row == NO_ROW:
+            symbol_row = getattr(document, '_union_symbol_row', NO_ROW)
+        if symbol_row == NO_ROW:
+            raise InvalidOperationException("No union fitting is defined in the routing preferences.")
+
+        # Flow enters the union from the curve whose outlet it joins
+        if connectors.directions[b] == _DIRECTIONS.index(FlowDirectionType.Out):
+            a, b = b, a
+        owner = connectors.owners[a]
+        classification = document._view(owner)._value(BuiltInParameter.RBS_SYSTEM_CLASSIFICATION_PARAM, "")
+        fitting = _new_fitting(document, "Pipe Fittings", connectors.origin(a), symbol_row, classification,
+                               document._table.system_rows[owner])
+        radius = connectors.radii[a]
+        inlet = document._add_connector(fitting._row, connectors.origin(a), FlowDirectionType.In, radius)
+        outlet = document._add_connector(fitting._row, connectors.origin(a), FlowDirectionType.Out, radius)
+        document._link(a, inlet._row)
+        document._link(b, outlet._row)
+        return fitting
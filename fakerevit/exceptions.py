@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""Fake ``Autodesk.Revit.Exceptions``."""
+
+
+class ApplicationException(Exception):
+    pass
+
+
+class ArgumentException(ApplicationException):
+    pass
+
+
+class InvalidOperationException(ApplicationException):
+    pass
+
+
+class OperationCanceledException(ApplicationException):
+    pass
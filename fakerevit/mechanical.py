@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""Fake ``Autodesk.Revit.DB.Mechanical`` members."""
+from fakerevit.calls import api
+from fakerevit.db import Element, MEPCurve, _break_curve
+
+
+class Duct(MEPCurve):
+    __slots__ = ()
+
+
+class MechanicalSystem(Element):
+    __slots__ = ()
+
+
+class MechanicalUtils(object):
+
+    @staticmethod
+    @api('MechanicalUtils.BreakCurve')
+    def BreakCurve(document, duct_id, point):
+        return _break_curve(document, duct_id, point)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Helpers that build fake models without counting API calls.
+
+These stand in for modelling done by hand in Revit, so they may be used
+outside of transactions.
+"""
+import uuid
+from array import array
+
+from fakerevit.calls import calls
+from fakerevit.db import (
+    BuiltInParameter,
+    Family,
+    FamilyInstance,
+    FamilySymbol,
+    FlowDirectionType,
+    Level,
+    NO_ROW,
+    SharedParameterElement,
+    StorageType,
+    XYZ,
+    _DIRECTIONS,
+    _new_fitting,
+)
+from fakerevit.plumbing import Pipe, PipeType, PipingSystem
+
+
+def _point(point):
+    return point._tuple() if isinstance(point, XYZ) else tuple(float(value) for value in point)
+
+
+def _add_mep_parameters(element, classification, discharge_units):
+    element._add_parameter(BuiltInParameter.RBS_SYSTEM_CLASSIFICATION_PARAM, "System Classification",
+                           classification, StorageType.String, read_only=True)
+    element._add_parameter(BuiltInParameter.RBS_PIPE_FIXTURE_UNITS_PARAM, "Fixture Units",
+                           float(discharge_units), StorageType.Double, read_only=True)
+
+
+def add_pipe(doc, start, end, diameter, classification="Sanitary", discharge_units=0.0, pipe_type=None):
+    """Add a pipe flowing from start to end."""
+    start = _point(start)
+    end = _point(end)
+    with calls.paused():
+        pipe = doc._new_element(Pipe, "Pipes", "", pipe_type._row if pipe_type else NO_ROW, start, end)
+        pipe.ConnectorManager._add(start, FlowDirectionType.In, diameter / 2.0)
+        pipe.ConnectorManager._add(end, FlowDirectionType.Out, diameter / 2.0)
+    _add_mep_parameters(pipe, classification, discharge_units)
+    pipe._add_parameter(BuiltInParameter.RBS_PIPE_DIAMETER_PARAM, "Diameter", float(diameter), read_only=True)
+    return pipe
+
+
+def add_pipe_type(doc, name):
+    """Add a pipe type with no routing preference rules."""
+    pipe_type = doc._new_element(PipeType, None, name)
+    pipe_type._add_parameter(BuiltInParameter.SYMBOL_NAME_PARAM, "Type Name", name, StorageType.String)
+    return pipe_type
+
+
+def add_family_symbol(doc, family_name, name, category_name="Pipe Fittings", description=""):
+    """Add a type of the family called family_name, adding the family if needed."""
+    families = getattr(doc, '_families', None)
+    if families is None:
+        families = doc._families = {}
+    family_row = families.get(family_name)
+    if family_row is None:
+        family_row = families[family_name] = doc._new_element(Family, None, family_name)._row
+    symbol = doc._new_element(FamilySymbol, category_name, name)
+    doc._table.extra(symbol._row)['family'] = family_row
+    symbol._add_parameter(BuiltInParameter.SYMBOL_NAME_PARAM, "Type Name", name, StorageType.String)
+    symbol._add_parameter(BuiltInParameter.SYMBOL_FAMILY_NAME_PARAM, "Family Name", family_name,
+                          StorageType.String, read_only=True)
+    symbol._add_parameter(BuiltInParameter.ALL_MODEL_DESCRIPTION, "Description", description, StorageType.String)
+    return symbol
+
+
+def set_union_fitting(doc, symbol):
+    """Make NewUnionFitting place symbol, as a union in the routing preferences would."""
+    doc._union_symbol_row = symbol._row
+
+
+def add_fitting(doc, origin, inlets, diameter, classification="Sanitary",
+                category_name="Pipe Fittings", symbol=None):
+    """Add a fitting with inlets In connectors and one Out connector."""
+    origin = _point(origin)
+    fitting = _new_fitting(doc, category_name, origin, symbol._row if symbol else NO_ROW, classification)
+    with calls.paused():
+        manager = fitting.MEPModel.ConnectorManager
+    for _ in range(inlets):
+        manager._add(origin, FlowDirectionType.In, diameter / 2.0)
+    manager._add(origin, FlowDirectionType.Out, diameter / 2.0)
+    return fitting
+
+
+def add_fixture(doc, origin, diameter, classification="Sanitary", discharge_units=0.0, symbol=None):
+    """Add a plumbing fixture with a single outlet."""
+    origin = _point(origin)
+    symbol_row = symbol._row if symbol else NO_ROW
+    name = doc._table.names[symbol_row] if symbol else ""
+    fixture = doc._new_element(FamilyInstance, "Plumbing Fixtures", name, symbol_row, origin)
+    with calls.paused():
+        fixture.MEPModel.ConnectorManager._add(origin, FlowDirectionType.Out, diameter / 2.0)
+    _add_mep_parameters(fixture, classification, discharge_units)
+    return fixture
+
+
+def connectors_of(element):
+    """Return the rows of the connectors of element."""
+    return element.Document._table.connector_rows(element._row)
+
+
+def connect(upstream, downstream):
+    """Connect the free outlet of upstream to the first free inlet of downstream."""
+    doc = upstream.Document
+    outlet = _free(upstream, FlowDirectionType.Out)
+    inlet = _free(downstream, FlowDirectionType.In)
+    doc._connectors.link(outlet, inlet)
+    return outlet, inlet
+
+
+def _free(element, direction):
+    connectors = element.Document._connectors
+    code = _DIRECTIONS.index(direction)
+    for row in connectors_of(element):
+        if connectors.directions[row] == code and connectors.partners[row] == NO_ROW:
+            return row
+    raise ValueError("{!r} has no free {} connector".format(element, direction))
+
+
+def add_piping_system(doc, name, elements, classification="Sanitary"):
+    """Add a piping system made of elements."""
+    system = doc._new_element(PipingSystem, "Piping Systems", name)
+    network = doc._table.extra(system._row)['network'] = array('l', [element._row for element in elements])
+    for row in network:
+        doc._table.system_rows[row] = system._row
+    system._add_parameter(BuiltInParameter.RBS_SYSTEM_NAME_PARAM, "System Name", name, StorageType.String)
+    system._add_parameter(BuiltInParameter.RBS_SYSTEM_CLASSIFICATION_PARAM, "System Classification",
+                          classification, StorageType.String)
+    return system
+
+
+def add_shared_parameters(doc, names, elements=(), yes_no=()):
+    """Add shared parameters called names and bind them to elements.
+
+    Parameters named in yes_no are Yes/No parameters, stored as integers
+    as Revit does; the others are numbers.
+    """
+    shared = []
+    for name in names:
+        parameter = doc._new_element(SharedParameterElement, None, name)
+        doc._table.extra(parameter._row)['guid'] = uuid.uuid5(uuid.NAMESPACE_URL, name)
+        shared.append(parameter)
+    for parameter in shared:
+        guid = parameter.GuidValue
+        with calls.paused():
+            name = parameter.Name
+        if name in yes_no:
+            default, storage_type = 0, StorageType.Integer
+        else:
+            default, storage_type = 0.0, StorageType.Double
+        for element in elements:
+            element._add_parameter(guid, name, default, storage_type, guid=guid)
+    return shared
+
+
+def add_level(doc, name, elevation):
+    """Add a level at elevation (feet)."""
+    return doc._new_element(Level, "Levels", name, NO_ROW, (0.0, 0.0, float(elevation)))
+
+
+def counted_calls():
+    """Return the counter shared by every fake document."""
+    return calls
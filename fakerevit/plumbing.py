@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Fake ``Autodesk.Revit.DB.Plumbing`` members."""
+from fakerevit.calls import api, api_property
+from fakerevit.db import Element, ElementType, MEPCurve, RoutingPreferenceManager, _break_curve
+
+
+class Pipe(MEPCurve):
+    __slots__ = ()
+
+
+class PipeType(ElementType):
+    __slots__ = ()
+
+    @api_property('PipeType.RoutingPreferenceManager')
+    def RoutingPreferenceManager(self):
+        return RoutingPreferenceManager(self.Document, self._row)
+
+
+class PipingSystem(Element):
+    """Piping system whose network is the list of element rows assigned to it."""
+
+    __slots__ = ()
+
+    @api_property('PipingSystem.PipingNetwork')
+    def PipingNetwork(self):
+        document = self.Document
+        alive = document._table.alive
+        return [document._view(row) for row in document._table.extra(self._row)['network'] if alive[row]]
+
+
+class PlumbingUtils(object):
+
+    @staticmethod
+    @api('PlumbingUtils.BreakCurve')
+    def BreakCurve(document, pipe_id, point):
+        return _break_curve(document, pipe_id, point)
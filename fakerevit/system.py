@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Fake ``System.Collections.Generic`` generic collections."""
+
+
+class _TypedList(list):
+    """List[T] instance, a plain list that remembers its item type."""
+
+    item_type = None
+
+    @property
+    def Count(self):
+        return len(self)
+
+    def Add(self, item):
+        self.append(item)
+
+
+class _Generic(object):
+    """Generic type that is specialised with the [T] syntax."""
+
+    def __init__(self, base):
+        self._base = base
+        self._types = {}
+
+    def __getitem__(self, item_type):
+        specialised = self._types.get(item_type)
+        if specialised is None:
+            specialised = type(self._base.__name__, (self._base,), {'item_type': item_type})
+            self._types[item_type] = specialised
+        return specialised
+
+    def __call__(self, *args):
+        return self._base(*args)
+
+
+List = _Generic(_TypedList)
+ICollection = List
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Compact column storage behind the fake Revit documents.
+
+Elements, parameter values and connectors are rows of typed arrays rather
+than Python objects, so documents of millions of elements fit in memory.
+The API classes in fakerevit.db are thin views over one row.
+"""
+from array import array
+
+NO_ROW = -1
+
+
+def _grow(values, length, default):
+    """Extend values with default up to length items."""
+    missing = length - len(values)
+    if missing > 0:
+        if isinstance(values, array):
+            values.extend(array(values.typecode, [default]) * missing)
+        else:
+            values.extend([default] * missing)
+
+
+class ParameterColumn(object):
+    """Values of one parameter for every element that has it.
+
+    typecode is the array type of the values, or None for strings, which
+    are kept in a list.
+    """
+
+    __slots__ = ('key', 'name', 'storage_type', 'guid', 'read_only', 'default', 'values', 'present')
+
+    def __init__(self, key, name, storage_type, typecode, default, guid=None, read_only=False):
+        self.key = key
+        self.name = name
+        self.storage_type = storage_type
+        self.guid = guid
+        self.read_only = read_only
+        self.default = default
+        self.values = array(typecode) if typecode else []
+        self.present = bytearray()
+
+    def __contains__(self, row):
+        return row < len(self.present) and self.present[row] == 1
+
+    def get(self, row):
+        return self.values[row]
+
+    def set(self, row, value):
+        length = len(self.present)
+        if row == length:
+            self.values.append(value)
+            self.present.append(1)
+            return
+        if row > length:
+            _grow(self.present, row, 0)
+            _grow(self.values, row, self.default)
+            self.values.append(value)
+            self.present.append(1)
+            return
+        self.values[row] = value
+        self.present[row] = 1
+
+
+class ElementTable(object):
+    """One row per element: class, category, name, type, location and connectors.
+
+    Curves use both points of the location, family instances only the
+    first. Rarely used attributes, such as level elevations, are kept in
+    the sparse ``extras`` dictionary.
+    """
+
+    def __init__(self):
+        self.classes = []
+        self._class_codes = {}
+        self.category_names = []
+        self._category_codes = {}
+        self.kinds = array('H')
+        self.categories = array('h')
+        self.names = []
+        self.alive = bytearray()
+        self.type_rows = array('l')
+        self.system_rows = array('l')
+        self.x = array('d')
+        self.y = array('d')
+        self.z = array('d')
+        self.end_x = array('d')
+        self.end_y = array('d')
+        self.end_z = array('d')
+        self.first_connector = array('l')
+        self.connector_counts = array('B')
+        self.columns = {}
+        self.columns_by_name = {}
+        self.extras = {}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def _code(self, codes, values, value):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def add(self, cls, category_name=None, name="", type_row=NO_ROW, start=(0.0, 0.0, 0.0), end=(0.0, 0.0, 0.0)):
+        """Add an element row and return its index."""
+        row = len(self.kinds)
+        self.kinds.append(self._code(self._class_codes, self.classes, cls))
+        self.categories.append(self._code(self._category_codes, self.category_names, category_name)
+                               if category_name else -1)
+        self.names.append(name)
+        self.alive.append(1)
+        self.type_rows.append(type_row)
+        self.system_rows.append(NO_ROW)
+        self.x.append(start[0])
+        self.y.append(start[1])
+        self.z.append(start[2])
+        self.end_x.append(end[0])
+        self.end_y.append(end[1])
+        self.end_z.append(end[2])
+        self.first_connector.append(NO_ROW)
+        self.connector_counts.append(0)
+        return row
+
+    def cls(self, row):
+        return self.classes[self.kinds[row]]
+
+    def category_name(self, row):
+        code = self.categories[row]
+        return self.category_names[code] if code >= 0 else None
+
+    def category_code(self, category_name):
+        """Return the code of category_name, or None when no element has it."""
+        return self._category_codes.get(category_name)
+
+    def start(self, row):
+        return (self.x[row], self.y[row], self.z[row])
+
+    def end(self, row):
+        return (self.end_x[row], self.end_y[row], self.end_z[row])
+
+    def set_location(self, row, start, end):
+        self.x[row], self.y[row], self.z[row] = start
+        self.end_x[row], self.end_y[row], self.end_z[row] = end
+
+    def connector_rows(self, row):
+        first = self.first_connector[row]
+        return range(first, first + self.connector_counts[row]) if first != NO_ROW else range(0)
+
+    def attach_connector(self, row, connector_row):
+        """Record that connector_row, the next connector added, belongs to row."""
+        if self.first_connector[row] == NO_ROW:
+            self.first_connector[row] = connector_row
+        elif self.first_connector[row] + self.connector_counts[row] != connector_row:
+            raise ValueError("Connectors of an element must be added together")
+        self.connector_counts[row] += 1
+
+    def column(self, key, name, storage_type, typecode, default, guid=None, read_only=False):
+        """Return the column of parameter key, adding it if needed."""
+        column = self.columns.get(key)
+        if column is None:
+            column = self.columns[key] = ParameterColumn(key, name, storage_type, typecode, default,
+                                                         guid, read_only)
+            self.columns_by_name.setdefault(name, []).append(column)
+        return column
+
+    def extra(self, row):
+        """Return the dictionary of rarely used attributes of row."""
+        extra = self.extras.get(row)
+        if extra is None:
+            extra = self.extras[row] = {}
+        return extra
+
+
+class ConnectorTable(object):
+    """One row per connector, with the row of the connector it is joined to."""
+
+    def __init__(self):
+        self.owners = array('l')
+        self.directions = array('B')
+        self.shapes = array('B')
+        self.domains = array('B')
+        self.radii = array('d')
+        self.x = array('d')
+        self.y = array('d')
+        self.z = array('d')
+        self.partners = array('l')
+
+    def __len__(self):
+        return len(self.owners)
+
+    def add(self, owner, origin, direction, radius, shape=0, domain=0):
+        """Add a connector row and return its index."""
+        row = len(self.owners)
+        self.owners.append(owner)
+        self.directions.append(direction)
+        self.shapes.append(shape)
+        self.domains.append(domain)
+        self.radii.append(radius)
+        self.x.append(origin[0])
+        self.y.append(origin[1])
+        self.z.append(origin[2])
+        self.partners.append(NO_ROW)
+        return row
+
+    def origin(self, row):
+        return (self.x[row], self.y[row], self.z[row])
+
+    def set_origin(self, row, origin):
+        self.x[row], self.y[row], self.z[row] = origin
+
+    def refs(self, row):
+        """Return the rows of the connectors joined to row."""
+        partner = self.partners[row]
+        return [partner] if partner != NO_ROW else []
+
+    def link(self, a, b):
+        self.partners[a] = b
+        self.partners[b] = a
+
+    def unlink(self, a, b):
+        if self.partners[a] == b:
+            self.partners[a] = NO_ROW
+        if self.partners[b] == a:
+            self.partners[b] = NO_ROW
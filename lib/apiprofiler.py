@@ -0,0 +1,548 @@
+# -*- coding: utf-8 -*-
+"""Opt-in profiler for the Revit API calls of a pushbutton run.
+
+Every pushbutton calls start(globals()) once its imports are done and
+finish() at the end. Both do nothing unless profiling is turned on, with
+Shift+Click on About or the PAM_API_PROFILER environment variable.
+
+When it is on:
+
+- FilteredElementCollector, Transaction, TransactionGroup, SubTransaction
+  and the static *Utils classes seen by the script and the pamtools and
+  en12056 modules are wrapped, so every call made through them is counted and
+  timed with its Python call site. finish() unwraps them again.
+- The main thread is sampled every few milliseconds. Samples show where
+  time goes in calls that cannot be wrapped, such as LookupParameter on an
+  element, by source line and by stack.
+
+finish() prints a flame-style summary to the pyRevit output window and
+writes the whole profile to a JSON file.
+"""
+import json
+import linecache
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    clock = time.perf_counter
+except AttributeError:
+    clock = time.clock if sys.platform == 'cli' else time.time
+
+# pyRevit config section and option shared by every pushbutton
+CONFIG_SECTION = "PamBuildingDesign"
+CONFIG_OPTION = "api_profiler"
+
+# Environment variables turning the profiler on and choosing where profiles go
+ENVIRONMENT_FLAG = "PAM_API_PROFILER"
+ENVIRONMENT_FOLDER = "PAM_API_PROFILER_DIR"
+
+# Classes whose instances are wrapped, so calls on the objects they return are profiled
+WRAPPED_CLASSES = ('FilteredElementCollector', 'Transaction', 'TransactionGroup', 'SubTransaction')
+
+# Classes of static methods whose calls are profiled
+WRAPPED_STATICS = ('PlumbingUtils', 'MechanicalUtils', 'UnitUtils', 'ElementTransformUtils')
+
+# Namespaces through which scripts reach the classes above, such as DB.Plumbing.PlumbingUtils
+WRAPPED_NAMESPACES = ('DB', 'Autodesk', 'Revit', 'Plumbing', 'Mechanical')
+
+# Packages of the tool logic kept loaded between runs, profiled along with the script
+LIBRARY_PACKAGES = ('pamtools', 'en12056')
+
+SAMPLE_INTERVAL = 0.005
+
+# Samples and stack levels shown in the output window
+TOP_LINES = 15
+FLAME_DEPTH = 8
+FLAME_MIN_SHARE = 0.02
+
+_THIS_FILE = os.path.splitext(os.path.abspath(__file__))[0]
+
+_API_MEMBER = re.compile(r"\.(\w+)\s*\(|\.(\w+)\s*$")
+
+# Profiler of the pushbutton run in progress
+_active = None
+
+
+def enabled():
+    """True when profiling is turned on for this Revit session."""
+    if os.environ.get(ENVIRONMENT_FLAG, "").lower() in ("1", "true", "yes", "on"):
+        return True
+    try:
+        from pyrevit import script
+    except ImportError:
+        return False
+    return bool(script.get_config(CONFIG_SECTION).get_option(CONFIG_OPTION, False))
+
+
+def _is_own_frame(frame):
+    return os.path.splitext(os.path.abspath(frame.f_code.co_filename))[0] == _THIS_FILE
+
+
+def _call_site(depth=2):
+    """Return (file name, line, function) of the first caller outside this module."""
+    try:
+        frame = sys._getframe(depth)
+    except (AttributeError, ValueError):
+        return ("unknown", 0, "unknown")
+    while frame is not None and _is_own_frame(frame):
+        frame = frame.f_back
+    if frame is None:
+        return ("unknown", 0, "unknown")
+    return (os.path.basename(frame.f_code.co_filename), frame.f_lineno, frame.f_code.co_name)
+
+
+class CallStats(object):
+    """Count and time of the calls to one API member, in total and per call site."""
+
+    __slots__ = ('count', 'seconds', 'sites')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.sites = {}
+
+    def add(self, seconds, site):
+        self.count += 1
+        self.seconds += seconds
+        stats = self.sites.get(site)
+        if stats is None:
+            stats = self.sites[site] = [0, 0.0]
+        stats[0] += 1
+        stats[1] += seconds
+
+
+class Profiler(object):
+    """Calls and stack samples of one pushbutton run."""
+
+    def __init__(self, title, interval=SAMPLE_INTERVAL):
+        self.title = title
+        self.interval = interval
+        self.calls = {}
+        self.stacks = {}
+        self.lines = {}
+        self.sample_count = 0
+        self.started = time.time()
+        self.seconds = 0.0
+        self._start = clock()
+        self._sampler = None
+        self._replaced = []
+
+    # Wrapped calls
+
+    def record(self, name, seconds, site):
+        stats = self.calls.get(name)
+        if stats is None:
+            stats = self.calls[name] = CallStats()
+        stats.add(seconds, site)
+
+    def call(self, name, function, *args, **kwargs):
+        """Call function, recording the call under name."""
+        site = _call_site(3)
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.record(name, clock() - start, site)
+
+    def instrument(self, namespace):
+        """Replace the API classes in namespace (a script's globals) with profiled ones."""
+        for name, value in list(namespace.items()):
+            wrapped = self.wrap(name, value)
+            if wrapped is not value:
+                namespace[name] = wrapped
+                self._replaced.append((namespace, name, value))
+
+    def restore(self):
+        """Put back the API classes replaced by instrument()."""
+        for namespace, name, value in reversed(self._replaced):
+            namespace[name] = value
+        del self._replaced[:]
+
+    def wrap(self, name, value):
+        """Return value wrapped for profiling, or value itself when it is not profiled."""
+        if isinstance(value, (_Traced, _TracedClass, _TracedStatics, _TracedNamespace)):
+            return value
+        if name in WRAPPED_CLASSES and callable(value):
+            return _TracedClass(self, name, value)
+        if name in WRAPPED_STATICS:
+            return _TracedStatics(self, name, value)
+        if name in WRAPPED_NAMESPACES and hasattr(value, '__name__'):
+            return _TracedNamespace(self, value)
+        return value
+
+    # Samples
+
+    def start_sampling(self, thread_id=None):
+        """Sample the stack of thread_id (the current thread) until finish()."""
+        if not hasattr(sys, '_current_frames'):
+            return False
+        if thread_id is None:
+            thread_id = _current_thread_id()
+        self._sampler = _Sampler(self, thread_id, self.interval)
+        self._sampler.start()
+        return True
+
+    def sample(self, frame):
+        """Record the stack ending in frame."""
+        stack = []
+        while frame is not None:
+            if not _is_own_frame(frame):
+                stack.append(frame)
+            frame = frame.f_back
+        if not stack:
+            return
+        stack.reverse()
+        folded = ";".join("{}:{}".format(os.path.basename(f.f_code.co_filename), f.f_code.co_name)
+                          for f in stack)
+        self.stacks[folded] = self.stacks.get(folded, 0) + 1
+        leaf = stack[-1]
+        line = (leaf.f_code.co_filename, leaf.f_lineno)
+        self.lines[line] = self.lines.get(line, 0) + 1
+        self.sample_count += 1
+
+    # Results
+
+    def stop(self):
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+        self.seconds = clock() - self._start
+
+    def to_dict(self):
+        calls = []
+        for name, stats in sorted(self.calls.items(), key=lambda item: -item[1].seconds):
+            calls.append({
+                'name': name,
+                'count': stats.count,
+                'seconds': stats.seconds,
+                'sites': [{'file': site[0], 'line': site[1], 'function': site[2],
+                           'count': count, 'seconds': seconds}
+                          for site, (count, seconds) in sorted(stats.sites.items(), key=lambda item: -item[1][1])],
+            })
+        lines = []
+        for (file_name, line), count in sorted(self.lines.items(), key=lambda item: -item[1]):
+            code = linecache.getline(file_name, line).strip()
+            lines.append({'file': os.path.basename(file_name), 'line': line, 'code': code,
+                          'api_member': api_member(code), 'samples': count})
+        return {
+            'title': self.title,
+            'started': time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            'seconds': self.seconds,
+            'calls': calls,
+            'samples': {
+                'interval': self.interval,
+                'count': self.sample_count,
+                'stacks': self.stacks,
+                'lines': lines,
+            },
+        }
+
+    def flame_lines(self, depth=FLAME_DEPTH, min_share=FLAME_MIN_SHARE):
+        """Return the sampled stacks as an indented tree with the share of samples of every level."""
+        tree = {}
+        for folded, count in self.stacks.items():
+            node = tree
+            for frame in folded.split(";")[:depth]:
+                entry = node.setdefault(frame, [0, {}])
+                entry[0] += count
+                node = entry[1]
+        total = float(self.sample_count) or 1.0
+        lines = []
+
+        def walk(node, level):
+            for frame, (count, children) in sorted(node.items(), key=lambda item: -item[1][0]):
+                share = count / total
+                if share < min_share:
+                    continue
+                bar = u"█" * max(1, int(share * 30))
+                lines.append(u"{:>5.1f}% {}{} {}".format(share * 100, "  " * level, bar, frame))
+                walk(children, level + 1)
+        walk(tree, 0)
+        return lines
+
+
+def api_member(code):
+    """Return the last member called on a source line, such as LookupParameter, or None."""
+    matches = _API_MEMBER.findall(code)
+    if not matches:
+        return None
+    call, attribute = matches[-1]
+    return call or attribute
+
+
+def _current_thread_id():
+    try:
+        return threading.get_ident()
+    except AttributeError:
+        return threading.current_thread().ident
+
+
+class _Sampler(threading.Thread):
+    """Background thread sampling the stack of another thread."""
+
+    def __init__(self, profiler, thread_id, interval):
+        threading.Thread.__init__(self, name="API profiler sampler")
+        self.daemon = True
+        self.profiler = profiler
+        self.thread_id = thread_id
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.profiler.sample(frame)
+            self._stopped.wait(self.interval)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+class _Traced(object):
+    """Proxy of an API object whose method calls are profiled."""
+
+    __slots__ = ('_profiler', '_prefix', '_target')
+
+    def __init__(self, profiler, prefix, target):
+        self._profiler = profiler
+        self._prefix = prefix
+        self._target = target
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if not callable(value):
+            return value
+        profiler = self._profiler
+        full_name = "{}.{}".format(self._prefix, name)
+        target_type = type(self._target)
+
+        def traced(*args, **kwargs):
+            result = profiler.call(full_name, value, *_unwrap_all(args), **kwargs)
+            if type(result) is target_type:
+                # Chained collector filters return the collector
+                return _Traced(profiler, self._prefix, result)
+            return result
+        return traced
+
+    def __iter__(self):
+        profiler = self._profiler
+        name = "{}.GetEnumerator".format(self._prefix)
+        iterator = profiler.call(name, iter, self._target)
+        return _TracedIterator(profiler, "{}.MoveNext".format(self._prefix), iterator)
+
+    def __enter__(self):
+        enter = getattr(self._target, '__enter__', None)
+        if enter is not None:
+            enter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        exit_ = getattr(self._target, '__exit__', None)
+        if exit_ is not None:
+            return exit_(exc_type, exc_value, traceback)
+        self._target.Dispose()
+        return False
+
+
+class _TracedIterator(object):
+    """Iterator whose steps are timed together, as one entry per collector."""
+
+    def __init__(self, profiler, name, iterator):
+        self._profiler = profiler
+        self._name = name
+        self._iterator = iterator
+        self._site = _call_site(3)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = clock()
+        try:
+            return next(self._iterator)
+        finally:
+            self._profiler.record(self._name, clock() - start, self._site)
+
+    next = __next__
+
+
+class _TracedClass(object):
+    """Stand-in for an API class whose instances are profiled."""
+
+    def __init__(self, profiler, name, cls):
+        self._profiler = profiler
+        self._name = name
+        self._cls = cls
+
+    def __call__(self, *args, **kwargs):
+        target = self._profiler.call(self._name, self._cls, *_unwrap_all(args), **kwargs)
+        return _Traced(self._profiler, self._name, target)
+
+    def __getattr__(self, name):
+        return getattr(self._cls, name)
+
+
+class _TracedStatics(object):
+    """Stand-in for a class of static methods, such as PlumbingUtils."""
+
+    def __init__(self, profiler, name, cls):
+        self._profiler = profiler
+        self._name = name
+        self._cls = cls
+
+    def __getattr__(self, name):
+        value = getattr(self._cls, name)
+        if not callable(value):
+            return value
+        profiler = self._profiler
+        full_name = "{}.{}".format(self._name, name)
+
+        def traced(*args, **kwargs):
+            return profiler.call(full_name, value, *_unwrap_all(args), **kwargs)
+        return traced
+
+
+class _TracedNamespace(object):
+    """Stand-in for a namespace such as DB, profiling the classes reached through it."""
+
+    def __init__(self, profiler, namespace):
+        self._profiler = profiler
+        self._namespace = namespace
+
+    def __getattr__(self, name):
+        return self._profiler.wrap(name, getattr(self._namespace, name))
+
+
+def _unwrap(value):
+    return value._target if isinstance(value, _Traced) else value
+
+
+def _unwrap_all(args):
+    return [_unwrap(arg) for arg in args]
+
+
+def _library_modules():
+    """Return the loaded modules of LIBRARY_PACKAGES."""
+    prefixes = tuple(package + "." for package in LIBRARY_PACKAGES)
+    return [module for name, module in list(sys.modules.items())
+            if module is not None and name.startswith(prefixes)]
+
+
+def start(namespace, title=None):
+    """Start profiling the pushbutton whose globals are namespace, if profiling is on.
+
+    Returns the Profiler, or None when profiling is off.
+    """
+    global _active
+    if _active is not None:
+        # A run that stopped before finish(); undo its wrapping of the lib modules
+        _active.stop()
+        _active.restore()
+        _active = None
+    if not enabled():
+        return None
+    if not title:
+        bundle = os.path.basename(os.path.dirname(namespace.get('__file__') or ""))
+        title = namespace.get('__title__') or os.path.splitext(bundle)[0] or "pushbutton"
+    profiler = Profiler(title)
+    profiler.instrument(namespace)
+    for module in _library_modules():
+        profiler.instrument(vars(module))
+    profiler.start_sampling()
+    _active = profiler
+    return profiler
+
+
+def finish(output=None):
+    """Stop profiling, print the summary and write the JSON profile.
+
+    Returns the path of the JSON file, or None when nothing was profiled.
+    """
+    global _active
+    profiler, _active = _active, None
+    if profiler is None:
+        return None
+    profiler.stop()
+    profiler.restore()
+    path = write_profile(profiler)
+    report(profiler, path, output)
+    return path
+
+
+def profile_path(title, started):
+    """Return the path of the JSON profile of a run of title."""
+    folder = os.environ.get(ENVIRONMENT_FOLDER)
+    file_id = "api-profile-{}-{}".format(re.sub(r"[^\w-]+", "-", title).strip("-").lower(),
+                                         time.strftime("%Y%m%d-%H%M%S", time.localtime(started)))
+    if not folder:
+        try:
+            from pyrevit import script
+            return script.get_data_file(file_id, "json")
+        except ImportError:
+            folder = tempfile.gettempdir()
+    return os.path.join(folder, file_id + ".json")
+
+
+def write_profile(profiler):
+    path = profile_path(profiler.title, profiler.started)
+    with open(path, "w") as profile_file:
+        json.dump(profiler.to_dict(), profile_file, indent=1, sort_keys=True)
+    return path
+
+
+def report(profiler, path, output=None):
+    """Print the profile of a run to the pyRevit output window (or stdout)."""
+    if output is None:
+        try:
+            from pyrevit import script
+            output = script.get_output()
+        except ImportError:
+            output = None
+    data = profiler.to_dict()
+
+    rows = []
+    for call in data['calls']:
+        site = call['sites'][0] if call['sites'] else None
+        rows.append([
+            call['name'],
+            call['count'],
+            "{:.1f}".format(call['seconds'] * 1000),
+            "{:.3f}".format(call['seconds'] * 1000 / call['count']),
+            "{}:{} {}".format(site['file'], site['line'], site['function']) if site else "",
+        ])
+    lines = []
+    for line in data['samples']['lines'][:TOP_LINES]:
+        share = 100.0 * line['samples'] / (data['samples']['count'] or 1)
+        lines.append(["{:.1f}%".format(share), line['api_member'] or "",
+                      "{}:{}".format(line['file'], line['line']), line['code']])
+    flame = profiler.flame_lines()
+
+    title = "API profile of {} ({:.2f} s)".format(profiler.title, profiler.seconds)
+    if output is None:
+        print(title)
+        for row in rows:
+            print("  ".join(str(value) for value in row))
+        for line in lines:
+            print("  ".join(line))
+        for line in flame:
+            print(line)
+        print("Profile written to {}".format(path))
+        return
+
+    output.print_md("## ⏱️ {}".format(title))
+    if rows:
+        output.print_table(table_data=rows, title="Profiled API calls",
+                           columns=["API member", "Calls", "Total (ms)", "Mean (ms)", "Slowest call site"])
+    if lines:
+        output.print_table(table_data=lines, title="Sampled lines ({} samples)".format(data['samples']['count']),
+                           columns=["Samples", "API member", "Line", "Code"])
+    if flame:
+        output.print_md("**Sampled stacks**")
+        output.print_code("\n".join(flame))
+    output.print_md("Profile written to `{}`".format(path))
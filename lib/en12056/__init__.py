@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""BS EN 12056-2 calculation engine used by the BS EN 12056 Calculations tools.
+
+Only en12056.builder, en12056.parameters, en12056.calculation and
+en12056.connections import the Revit API. Everything exported here works
+on plain data, so calculations can be run outside of a Revit session.
+"""
+from en12056.engine import (
+    CONTINUOUS,
+    PUMPED,
+    K_INTERMITTENT,
+    K_FREQUENT,
+    K_CONGESTED,
+    K_SPECIAL,
+    PipeNetwork,
+    Injection,
+    FlowResults,
+    waste_water_flow,
+    accumulate,
+    calculate,
+    node_results,
+)
+from en12056.incremental import (
+    ResultCache,
+    SystemResults,
+)
+from en12056.kernel import (
+    HAVE_NUMPY,
+    flow_kernel,
+)
+from en12056.topology import (
+    END_CLASSIFICATION,
+    END_DIRECTION,
+    END_EXTERNAL,
+    END_SYSTEM,
+    SnapshotCache,
+    Topology,
+    document_key,
+)
+from en12056.traversal import (
+    STOP_CYCLE,
+    STOP_JOINED,
+    STOP_SIZE_END,
+    STOP_TRUNCATED,
+    Walk,
+    size_end_rule,
+    walk_downstream,
+)
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""Build topology snapshots from Revit piping systems.
+
+Each element of ``PipingSystem.PipingNetwork`` is visited once and its
+connectors are read into a Topology. Snapshots are cached for the Revit
+session and dropped when DocumentChanged reports a change to any element
+they were built from. The same event marks cached calculation results
+dirty for incremental recalculation and drops the shared parameter GUIDs
+of the document when a shared parameter changes.
+"""
+from System.Collections.Generic import List
+
+from Autodesk.Revit.DB import (
+    BuiltInCategory,
+    BuiltInParameter,
+    ConnectorProfileType,
+    Domain,
+    ElementMulticategoryFilter,
+    FlowDirectionType,
+    UndoOperation,
+)
+from Autodesk.Revit.DB.Mechanical import MechanicalSystem
+from Autodesk.Revit.DB.Plumbing import PipingSystem
+
+from en12056.incremental import ResultCache
+from en12056.parameters import invalidate_guids
+from en12056.topology import (
+    FLOW_BIDIRECTIONAL,
+    FLOW_IN,
+    FLOW_OUT,
+    END_DIRECTION,
+    END_SYSTEM,
+    SnapshotCache,
+    Topology,
+    document_key,
+)
+
+# Snapshots built during this Revit session
+snapshots = SnapshotCache()
+
+# Results of the last calculation of every system during this Revit session
+results = ResultCache()
+
+# Transactions that only write calculation results and leave the topology alone
+_ignored_transactions = set()
+
+# Applications whose DocumentChanged event already invalidates snapshots
+_tracked_applications = []
+
+_RESULT_FILTER = ElementMulticategoryFilter(List[BuiltInCategory]([
+    BuiltInCategory.OST_PipeCurves,
+    BuiltInCategory.OST_PlumbingFixtures,
+]))
+
+_FLOW_DIRECTIONS = {
+    FlowDirectionType.In: FLOW_IN,
+    FlowDirectionType.Out: FLOW_OUT,
+}
+
+
+def get_connectors(element):
+    """Return (connectors, is_curve) for a pipe or a family instance."""
+    try:
+        return element.ConnectorManager.Connectors, True
+    except AttributeError:
+        return element.MEPModel.ConnectorManager.Connectors, False
+
+
+def get_size(connectors):
+    """Return the largest round connector diameter."""
+    maxsize = 0
+    for c in connectors:
+        if c.Shape == ConnectorProfileType.Round and c.Radius * 2 > maxsize:
+            maxsize = c.Radius * 2
+    return maxsize
+
+
+def _is_system(owner):
+    return isinstance(owner, (MechanicalSystem, PipingSystem))
+
+
+def _find_next(element, connectors, is_curve, classification):
+    """Return (next element id, end reason) for flow leaving element.
+
+    Follows the same rules as the downstream walk in Produce Calculations:
+    sanitary and return systems flow out of the connector that is not an
+    inlet, and a connection to the system itself is an open end.
+    """
+    if "Return" in classification or "Sanitary" in classification:
+        direction = FlowDirectionType.In
+    else:
+        direction = FlowDirectionType.Out
+
+    piping = [c for c in connectors if c.Domain == Domain.DomainPiping]
+    if is_curve or connectors.Size != 1:
+        piping = [c for c in piping if c.Direction != direction]
+    if not piping:
+        return None, END_DIRECTION
+    refs = list(piping[-1].AllRefs)
+
+    if not is_curve and len(refs) == 1 and _is_system(refs[0].Owner):
+        return None, END_SYSTEM
+    for ref in refs:
+        if ref.Owner.Id.Equals(element.Id):
+            continue
+        if _is_system(ref.Owner):
+            if is_curve:
+                return None, END_SYSTEM
+            continue
+        return ref.Owner.Id, None
+    return None, END_SYSTEM
+
+
+def _neighbours(element, connectors):
+    """Return (element id, direction) for every connected piping connector."""
+    neighbours = []
+    for c in connectors:
+        if c.Domain != Domain.DomainPiping:
+            continue
+        direction = _FLOW_DIRECTIONS.get(c.Direction, FLOW_BIDIRECTIONAL)
+        for ref in c.AllRefs:
+            owner = ref.Owner
+            if owner.Id.Equals(element.Id) or _is_system(owner):
+                continue
+            neighbours.append((owner.Id, direction))
+    return neighbours
+
+
+def build_topology(piping_system):
+    """Scan piping_system.PipingNetwork once and return its Topology."""
+    topology = Topology(piping_system.Id)
+    for element in piping_system.PipingNetwork:
+        try:
+            connectors, is_curve = get_connectors(element)
+        except AttributeError:
+            continue  # Element without connectors
+        classification_param = element.get_Parameter(BuiltInParameter.RBS_SYSTEM_CLASSIFICATION_PARAM)
+        classification = (classification_param.AsString() if classification_param else None) or ""
+        next_id, end_reason = _find_next(element, connectors, is_curve, classification)
+        is_pipe = element.Category is not None and element.Category.Name == "Pipes"
+        topology.add_element(element.Id, is_pipe, get_size(connectors), classification,
+                             next_id, end_reason, _neighbours(element, connectors))
+    return topology.finalise()
+
+
+def get_topology(doc, piping_system):
+    """Return the cached snapshot of piping_system, building it if needed."""
+    key = document_key(doc)
+    topology = snapshots.get(key, piping_system.Id)
+    if topology is None:
+        topology = snapshots.put(key, build_topology(piping_system))
+    return topology
+
+
+def ignore_transaction(name):
+    """Ignore changes committed by transactions called name."""
+    _ignored_transactions.add(name)
+
+
+def _is_ignored(args):
+    if args.Operation != UndoOperation.TransactionCommitted:
+        return False  # Undo and redo of our own writes still count
+    names = list(args.GetTransactionNames())
+    return bool(names) and all(name in _ignored_transactions for name in names)
+
+
+def _on_document_changed(sender, args):
+    """Drop snapshots and mark results that use added, modified or deleted elements."""
+    if _is_ignored(args):
+        return
+    key = document_key(args.GetDocument())
+    invalidate_guids(key, args)
+    deleted = list(args.GetDeletedElementIds())
+    changed = list(args.GetModifiedElementIds())
+    changed.extend(deleted)
+    changed.extend(args.GetAddedElementIds())
+    snapshots.invalidate(key, changed)
+    # Only pipes and plumbing fixtures change discharge units or flow paths
+    tracked = list(args.GetModifiedElementIds(_RESULT_FILTER))
+    tracked.extend(deleted)
+    results.mark_changed(key, tracked, args.GetAddedElementIds(_RESULT_FILTER))
+
+
+def track_document_changes(application):
+    """Invalidate cached snapshots on DocumentChanged (subscribes only once)."""
+    if application in _tracked_applications:
+        return
+    application.DocumentChanged += _on_document_changed
+    _tracked_applications.append(application)
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""Calculate one sanitary piping system and write the results to Revit.
+
+SystemCalculation holds everything Produce Calculations does for a system
+apart from the user interface, so the same code runs inside Revit, in
+batch mode and in the benchmarks.
+"""
+from Autodesk.Revit.DB import BuiltInParameter, Transaction, TransactionStatus, UnitTypeId, UnitUtils
+
+from en12056.builder import document_key, get_topology, results as calculation_results
+from en12056.engine import PipeNetwork, accumulate, node_results
+from en12056.incremental import SystemResults
+from en12056.parameters import (
+    CONTINUOUS_FLOW,
+    DISCHARGE_UNITS,
+    FREQUENCY_FACTOR,
+    PARAMETER_NAMES,
+    PRIMARY_VENTILATED,
+    PUMPED_FLOW,
+    SECONDARY_VENTILATED,
+    TOTAL_FLOW,
+    WASTE_WATER_FLOW,
+    ParameterTable,
+)
+from en12056.traversal import STOP_CYCLE, STOP_TRUNCATED, size_end_rule, walk_downstream
+
+# Connectors larger than this multiple of the start size end a downstream walk
+SIZE_FACTOR = 99999
+
+
+class MissingParametersError(Exception):
+    """Raised when pipes do not have the EN12056 shared parameters."""
+
+
+def read_discharge_units(pipe):
+    """Return the fixture units Revit has summed up for pipe."""
+    return pipe.get_Parameter(BuiltInParameter.RBS_PIPE_FIXTURE_UNITS_PARAM).AsDouble()
+
+
+def internal_flow_factor():
+    """Return the factor converting l/s to Revit internal flow units."""
+    return UnitUtils.ConvertToInternalUnits(1.0, UnitTypeId.LitersPerSecond)
+
+
+class SystemCalculation(object):
+    """One calculation of a piping system.
+
+    In incremental mode the results of the last run with the same options
+    are reused: only pipes downstream of changed elements are re-read and
+    only pipes whose results changed are written.
+    """
+
+    def __init__(self, doc, piping_system, k_factor, system_type,
+                 incremental=False, max_path_length=None, size_factor=SIZE_FACTOR):
+        self.doc = doc
+        self.piping_system = piping_system
+        self.k_factor = k_factor
+        self.system_type = system_type
+        self.max_path_length = max_path_length
+        self.size_factor = size_factor
+        self.system_name = piping_system.get_Parameter(BuiltInParameter.RBS_SYSTEM_NAME_PARAM).AsString()
+        self.doc_key = document_key(doc)
+        self.topology = get_topology(doc, piping_system)
+        self.cached_results = calculation_results.get(self.doc_key, piping_system.Id)
+        self.previous_results = None
+        if incremental and self.cached_results is not None and self.cached_results.matches(k_factor, system_type):
+            self.previous_results = self.cached_results
+        self.pipe_count = 0
+        self.written = 0
+        self.injections = []
+        self.incomplete_walks = []
+        self.results = None
+
+    def __contains__(self, element_id):
+        return element_id in self.topology
+
+    @property
+    def needs_discharges(self):
+        """True unless the discharges of the last run are reused."""
+        return self.previous_results is None
+
+    def cached_injections(self):
+        """Return the discharges of the last run that are still part of the system."""
+        if self.cached_results is None:
+            return []
+        return [injection for injection in self.cached_results.injections
+                if injection.element_id in self.topology]
+
+    def _discharge_units(self):
+        """Return (pipe ids, {pipe id: DU}, ParameterTable or None)."""
+        pipe_ids = []
+        discharge_units = {}
+        if self.previous_results is None:
+            # Collect the pipes of the PipingNetwork (returns an ElementSet)
+            pipes = [element for element in self.piping_system.PipingNetwork
+                     if element.Category and element.Category.Name == "Pipes"]
+            # Look up every EN12056 parameter handle once per pipe
+            table = self._parameter_table(pipes)
+            for pipe in pipes:
+                pipe_ids.append(pipe.Id)
+                discharge_units[pipe.Id] = read_discharge_units(pipe)
+            return pipe_ids, discharge_units, table
+
+        # Only re-read pipes downstream of elements changed since the last run
+        topology = self.topology
+        previous = self.previous_results
+        affected_ids = previous.affected_ids(topology)
+        for node, element_id in enumerate(topology.ids):
+            if not topology.is_pipe[node]:
+                continue
+            pipe_ids.append(element_id)
+            if element_id in affected_ids or element_id not in previous.discharge_units:
+                discharge_units[element_id] = read_discharge_units(self.doc.GetElement(element_id))
+            else:
+                discharge_units[element_id] = previous.discharge_units[element_id]
+        return pipe_ids, discharge_units, None
+
+    def _parameter_table(self, pipes):
+        table = ParameterTable(self.doc, pipes, PARAMETER_NAMES)
+        if table.missing():
+            raise MissingParametersError(self.system_name)
+        return table
+
+    def _walk_groups(self, injections):
+        """Return the discharges in the topology, in groups whose walks may share paths.
+
+        Walks from elements of the same connector size and classification
+        stop at the same size ends and classification changes, so once one
+        joins a path another walked it goes the same way. Where a walk is
+        cut off by max_path_length depends on where it started, so with a
+        maximum every discharge walks on its own.
+        """
+        topology = self.topology
+        groups = {}
+        order = []
+        for number, injection in enumerate(injections):
+            start = topology.index.get(injection.element_id)
+            if start is None:
+                continue
+            if self.max_path_length is None:
+                key = (topology.sizes[start], topology.classifications[start])
+            else:
+                key = number
+            if key not in groups:
+                groups[key] = []
+                order.append(key)
+            groups[key].append(injection)
+        return [groups[key] for key in order]
+
+    def _add_walks(self, walk_network, injections):
+        """Walk downstream from every discharge and add the paths to walk_network.
+
+        Walks read the topology snapshot and stop as soon as they join a
+        path an earlier discharge already walked, so injections must be
+        one of the groups of _walk_groups().
+        """
+        topology = self.topology
+        walked_nodes = set()
+        stop_rule = size_end_rule(topology, self.size_factor)
+        for injection in injections:
+            start = topology.index[injection.element_id]
+            walk_network.add(injection.element_id, is_pipe=bool(topology.is_pipe[start]))
+            if start in walked_nodes:
+                continue
+            walk = walk_downstream(topology, start, max_length=self.max_path_length,
+                                   stop_rule=stop_rule, stop_at=walked_nodes)
+            for upstream, downstream in zip(walk.path, walk.path[1:]):
+                walk_network.add(topology.ids[downstream], is_pipe=bool(topology.is_pipe[downstream]))
+                walk_network.connect(topology.ids[upstream], topology.ids[downstream])
+            if walk.reason == STOP_CYCLE:
+                # Close the loop so every element on it receives the discharge
+                walk_network.connect(topology.ids[walk.path[-1]], topology.ids[walk.at])
+            if walk.complete:
+                walked_nodes.update(walk.path)
+            else:
+                walked_nodes.update(walk.path[:-1])
+            if walk.reason in (STOP_CYCLE, STOP_TRUNCATED):
+                self.incomplete_walks.append(walk)
+
+    def node_flows(self, calc_network, injections):
+        """Return the (Qc, Qp) lists of the nodes of calc_network the discharges give.
+
+        Each group of discharges is walked and summed up in a network of its
+        own, so a discharge only flows as far as its own walk goes.
+        """
+        qc_nodes = [0.0] * len(calc_network)
+        qp_nodes = [0.0] * len(calc_network)
+        for group in self._walk_groups(injections):
+            walk_network = PipeNetwork()
+            self._add_walks(walk_network, group)
+            qc, qp = accumulate(walk_network, group)
+            for walk_node, element_id in enumerate(walk_network.ids):
+                node = calc_network.index.get(element_id)
+                if node is not None:
+                    qc_nodes[node] += qc[walk_node]
+                    qp_nodes[node] += qp[walk_node]
+        return qc_nodes, qp_nodes
+
+    def run(self, injections, transaction_name, flow_factor=None):
+        """Calculate the system and write every changed parameter in one transaction.
+
+        Returns the number of parameters written. If writing fails, the
+        transaction is rolled back and the error raised again; results are
+        only cached for the next run once the transaction is committed.
+        """
+        pipe_ids, discharge_units, table = self._discharge_units()
+        self.pipe_count = len(pipe_ids)
+        self.injections = list(injections)
+
+        # Build the plain network used by the calculation engine
+        calc_network = PipeNetwork()
+        for pipe_id in pipe_ids:
+            calc_network.add(pipe_id, discharge_units[pipe_id])
+        qc_nodes, qp_nodes = self.node_flows(calc_network, self.injections)
+
+        # Calculate Qww, Qc, Qp and Qtot for every pipe in one pass
+        results = self.results = node_results(calc_network, self.k_factor, qc_nodes, qp_nodes)
+
+        if table is None:
+            # Only pipes whose results changed since the last run are written
+            changed_pipes = [self.doc.GetElement(pipe_id)
+                             for pipe_id in self.previous_results.changed_values(results)]
+            table = self._parameter_table(changed_pipes)
+
+        final_values = self.final_values(table, results, flow_factor)
+
+        # Single transaction writing only the parameters whose value changed
+        self.written = 0
+        with Transaction(self.doc, transaction_name) as t:
+            try:
+                t.Start()
+                written = 0
+                for name in PARAMETER_NAMES:
+                    written += table.update(name, final_values[name])
+                committed = t.Commit() == TransactionStatus.Committed
+            except Exception:
+                t.RollBack()
+                raise
+        if not committed:
+            return self.written
+        self.written = written
+        # Keep the committed results so the next incremental run only redoes what changed
+        calculation_results.put(self.doc_key, SystemResults(
+            self.topology, self.k_factor, self.system_type, self.injections,
+            discharge_units, ((row[0], row[1:]) for row in results)))
+        return self.written
+
+    def final_values(self, table, results, flow_factor=None):
+        """Return the final value of every EN12056 parameter, in table order."""
+        if flow_factor is None:
+            flow_factor = internal_flow_factor()
+        internal = results.converted(flow_factor)
+        rows = len(table)
+        final_values = {
+            DISCHARGE_UNITS: table.column(results.ids, results.discharge_units),
+            FREQUENCY_FACTOR: [self.k_factor] * rows,
+            CONTINUOUS_FLOW: table.column(results.ids, internal.qc),
+            PUMPED_FLOW: table.column(results.ids, internal.qp),
+            WASTE_WATER_FLOW: table.column(results.ids, internal.qww),
+            TOTAL_FLOW: table.column(results.ids, internal.qtot),
+            PRIMARY_VENTILATED: [0] * rows,
+            SECONDARY_VENTILATED: [0] * rows,
+        }
+        # Mark the selected primary or secondary ventilated system
+        final_values[self.system_type] = [1] * rows
+        return final_values
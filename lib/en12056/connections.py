@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""Placing and removing calculation connections.
+
+Planning works on plain (x, y, z) tuples in Revit internal units, so plans
+can be made without the Revit API. split_and_join(), set_levels() and
+remove_connections() turn the plans into BreakCurve, NewUnionFitting and
+Delete calls; the Place and Remove Calculation Connections tools, Place
+Access Doors and the benchmarks all run them.
+"""
+import math
+
+from Autodesk.Revit.DB import (
+    BoundingBoxXYZ,
+    BuiltInParameter,
+    ConnectorType,
+    FamilyInstance,
+    Transaction,
+    TransactionGroup,
+    XYZ,
+)
+from Autodesk.Revit.DB.Mechanical import MechanicalUtils
+from Autodesk.Revit.DB.Plumbing import Pipe, PlumbingUtils
+
+from pamtools.connectors import ConnectorGrid
+
+
+def split_points(start, end, elevations):
+    """Return the points where a pipe crosses each elevation, from start to end.
+
+    Only crossings strictly inside the pipe are returned, so every point can
+    be broken at. Horizontal pipes never cross a level plane.
+    """
+    dz = end[2] - start[2]
+    if dz == 0:
+        return []
+    points = []
+    for elevation in elevations:
+        t = (elevation - start[2]) / dz
+        if 0.0 < t < 1.0:
+            points.append((t, (start[0] + (end[0] - start[0]) * t,
+                               start[1] + (end[1] - start[1]) * t,
+                               elevation)))
+    points.sort()
+    return [point for t, point in points]
+
+
+def plan_splits(lines, elevations):
+    """Return the split points of every (start, end) line, in line order."""
+    return [split_points(start, end, elevations) for start, end in lines]
+
+
+def group_pairs(pairs):
+    """Merge (a, b) pairs that share an element into groups.
+
+    Uses a union-find over the element ids, so the cost is close to linear
+    in the number of pairs. Groups are returned as sets in order of first
+    appearance.
+    """
+    parent = {}
+
+    def find(item):
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    order = []
+    for a, b in pairs:
+        for item in (a, b):
+            if item not in parent:
+                parent[item] = item
+                order.append(item)
+        root_a = find(a)
+        root_b = find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    groups = {}
+    roots = []
+    for item in order:
+        root = find(item)
+        if root not in groups:
+            groups[root] = set()
+            roots.append(root)
+        groups[root].add(item)
+    return [groups[root] for root in roots]
+
+
+def distance(a, b):
+    """Return the distance between two points."""
+    return math.sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2)
+
+
+def most_distant_pair(points):
+    """Return the indices (i, j) of the two points furthest apart, or None."""
+    best = None
+    best_distance = -1.0
+    count = len(points)
+    for i in range(count):
+        a = points[i]
+        for j in range(i + 1, count):
+            d = distance(a, points[j])
+            if d > best_distance:
+                best_distance = d
+                best = (i, j)
+    return best
+
+
+def element_lines(elements):
+    """Return the (start, end) points of the location curve of every element."""
+    lines = []
+    for element in elements:
+        line = element.Location.Curve
+        start = line.GetEndPoint(0)
+        end = line.GetEndPoint(1)
+        lines.append(((start.X, start.Y, start.Z), (end.X, end.Y, end.Z)))
+    return lines
+
+
+def _break_curve(doc, element, point):
+    if isinstance(element, Pipe):
+        return PlumbingUtils.BreakCurve(doc, element.Id, point)
+    return MechanicalUtils.BreakCurve(doc, element.Id, point)
+
+
+def split_and_join(doc, elements, points):
+    """Break every pipe or duct at its points and join the parts with unions.
+
+    Runs in the transaction open around it. points holds the plain split
+    points of each element, as plan_splits() returns them. The parts of
+    every element go into one ConnectorGrid, each element under a group of
+    its own, and the unions are placed on the pairs it finds. Returns the
+    unions placed and the (element, error) of every break or union that
+    failed, so only unions actually created are counted.
+    """
+    fittings = []
+    failures = []
+    grid = ConnectorGrid()
+    joints = []  # (group, element, breaks made), in element order
+    for group, (element, element_points) in enumerate(zip(elements, points)):
+        if not element_points:
+            continue
+        part_ids = []
+        for point in element_points:
+            try:
+                part_ids.append(_break_curve(doc, element, XYZ(*point)))
+            except Exception as error:
+                failures.append((element, error))
+        if not part_ids:
+            continue
+        part_ids.append(element.Id)
+        for part_id in part_ids:
+            for connector in doc.GetElement(part_id).ConnectorManager.Connectors:
+                grid.add(connector, part_id, group)
+        joints.append((group, element, len(part_ids) - 1))
+
+    # The connectors each break left at the same place
+    pairs = grid.pairs_by_group()
+    for group, element, breaks in joints:
+        element_pairs = pairs.get(group, [])
+        if len(element_pairs) < breaks:
+            failures.append((element, "{} of {} breaks have no connectors that meet".format(
+                breaks - len(element_pairs), breaks)))
+        for connector, other in element_pairs:
+            try:
+                fittings.append(doc.Create.NewUnionFitting(connector, other))
+            except Exception as error:
+                failures.append((element, error))
+    return fittings, failures
+
+
+def _bounding_boxes_intersect(bbox1, bbox2):
+    return (bbox1.Max.X >= bbox2.Min.X and
+            bbox1.Min.X <= bbox2.Max.X and
+            bbox1.Max.Y >= bbox2.Min.Y and
+            bbox1.Min.Y <= bbox2.Max.Y and
+            bbox1.Max.Z >= bbox2.Min.Z and
+            bbox1.Min.Z <= bbox2.Max.Z)
+
+
+def set_levels(fittings, levels, elevation, view):
+    """Give each fitting the level it sits up to elevation above, inside an open transaction.
+
+    Fittings are found on a level by their bounding box in view; those
+    on none of levels are left alone.
+    """
+    level_boxes = []
+    for level in levels:
+        level_bbox = BoundingBoxXYZ()
+        level_bbox.Min = XYZ(-10000, -10000, level.Elevation)
+        level_bbox.Max = XYZ(10000, 10000, level.Elevation + elevation)
+        level_boxes.append((level, level_bbox))
+    for fitting in fittings:
+        if not isinstance(fitting, FamilyInstance):
+            continue
+        fitting_bbox = fitting.get_BoundingBox(view)
+        if not fitting_bbox:
+            continue
+        for level, level_bbox in level_boxes:
+            if _bounding_boxes_intersect(fitting_bbox, level_bbox):
+                fitting.get_Parameter(BuiltInParameter.FAMILY_LEVEL_PARAM).Set(level.Id)
+                fitting.LookupParameter('Elevation from Level').Set(elevation)
+                break
+
+
+def element_connectors(element):
+    """Return the connectors of a family instance, pipe or duct, or none."""
+    try:
+        return list(element.MEPModel.ConnectorManager.Connectors)
+    except AttributeError:
+        try:
+            return list(element.ConnectorManager.Connectors)
+        except AttributeError:
+            return []
+
+
+def connected_connectors(connector):
+    """Return the physical connectors of other elements connector is joined to."""
+    connected = []
+    try:
+        for ref in connector.AllRefs:
+            if ref.Owner.Id != connector.Owner.Id and ref.ConnectorType != ConnectorType.Logical:
+                connected.append(ref)
+    except Exception:
+        pass  # Unconnectable connectors have no references
+    return connected
+
+
+def _is_free(element):
+    return not any(connected_connectors(connector) for connector in element_connectors(element))
+
+
+def _join(doc, group):
+    """Join a group of pipes left by removing their fittings into one pipe.
+
+    The first pipe of the two most distant connectors is stretched to the
+    other, and joined to what that one was connected to. Returns the ids
+    of the two pipes, or None.
+    """
+    connectors = []
+    for element_id in group:
+        element = doc.GetElement(element_id)
+        if element is not None:
+            connectors.extend(element_connectors(element))
+    origins = []
+    for connector in connectors:
+        origin = connector.Origin
+        origins.append((origin.X, origin.Y, origin.Z))
+    pair = most_distant_pair(origins)
+    if pair is None:
+        return None
+    connector_a, connector_b = connectors[pair[1]], connectors[pair[0]]
+    pipe_a = connector_a.Owner
+    second = [connector for connector in pipe_a.ConnectorManager.Connectors if connector.Id != connector_a.Id][0]
+    target = connected_connectors(connector_b)
+    if target:
+        second.ConnectTo(target[0])
+        second.Origin = target[0].Origin
+    else:
+        second.Origin = connector_b.Origin
+    return pipe_a.Id, connector_b.Owner.Id
+
+
+def remove_connections(doc, fittings, name="Remove Calculation Connections"):
+    """Delete fittings and join the pipes either side of each, in one transaction group.
+
+    Pipes left over once a run is joined, with nothing connected to them,
+    are deleted. Returns the number of fittings and of pipes deleted.
+    """
+    fitting_ids = [fitting.Id for fitting in fittings]
+    pairs = []
+    for fitting in fittings:
+        for connector in element_connectors(fitting):
+            for connected in connected_connectors(connector):
+                if isinstance(connected.Owner, Pipe):
+                    pairs.append((connector.Owner.Id, connected.Owner.Id))
+    groups = group_pairs(pairs)
+
+    joined = set()
+    deleted = 0
+    with TransactionGroup(doc, name) as group_transaction:
+        group_transaction.Start()
+        with Transaction(doc, "Remove Fittings") as t:
+            t.Start()
+            for fitting_id in fitting_ids:
+                try:
+                    doc.Delete(fitting_id)
+                except Exception:
+                    pass  # Already deleted with an element it belonged to
+            t.Commit()
+
+        with Transaction(doc, "Join Pipes") as t:
+            t.Start()
+            for group in groups:
+                if len(group) >= 2:
+                    pipe_ids = _join(doc, group)
+                    if pipe_ids is not None:
+                        joined.update(pipe_ids)
+            t.Commit()
+
+        # Pipes of a group that were not joined, and joined pipes left with a free end
+        redundant = [element_id for group in groups for element_id in group
+                     if element_id not in joined and element_id not in fitting_ids]
+        for pipe_id in joined:
+            pipe = doc.GetElement(pipe_id)
+            if pipe is not None and any(not connected_connectors(connector)
+                                        for connector in element_connectors(pipe)):
+                redundant.append(pipe_id)
+
+        if redundant:
+            with Transaction(doc, "Delete Redundant Pipes") as t:
+                t.Start()
+                for pipe_id in redundant:
+                    pipe = doc.GetElement(pipe_id)
+                    # Pipes still connected to something are kept
+                    if pipe is not None and _is_free(pipe):
+                        doc.Delete(pipe_id)
+                        deleted += 1
+                t.Commit()
+        group_transaction.Assimilate()
+    return len(fitting_ids), deleted
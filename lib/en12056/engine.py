@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""BS EN 12056-2 flow calculations on a plain pipe network.
+
+The engine only works with plain Python data (ids, discharge units and
+downstream links) so it can run and be benchmarked outside of Revit.
+All flow rates are in l/s.
+"""
+import math
+
+from en12056 import kernel
+
+# Frequency factors (K) from BS EN 12056-2 Table 3
+K_INTERMITTENT = 0.5
+K_FREQUENT = 0.7
+K_CONGESTED = 1.0
+K_SPECIAL = 1.2
+
+# Kinds of additional discharge that can enter the system
+CONTINUOUS = "continuous"
+PUMPED = "pumped"
+
+
+class PipeNetwork(object):
+    """Plain graph of the elements that make up one sanitary network.
+
+    Every element (pipe, fitting, accessory or fixture) is a node. Each node
+    has at most one downstream node, which is how flow leaves it. Only pipes
+    carry discharge units and receive results.
+    """
+
+    def __init__(self):
+        self.ids = []
+        self.index = {}
+        self.downstream = []
+        self.discharge_units = []
+        self.is_pipe = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, element_id):
+        return element_id in self.index
+
+    def add(self, element_id, discharge_units=None, is_pipe=True):
+        """Add an element to the network and return its node index."""
+        node = self.index.get(element_id)
+        if node is not None:
+            if discharge_units is not None:
+                self.discharge_units[node] = discharge_units
+            return node
+        node = len(self.ids)
+        self.index[element_id] = node
+        self.ids.append(element_id)
+        self.downstream.append(-1)
+        self.discharge_units.append(discharge_units or 0.0)
+        self.is_pipe.append(bool(is_pipe))
+        return node
+
+    def connect(self, upstream_id, downstream_id):
+        """Record that flow leaves upstream_id into downstream_id."""
+        self.downstream[self.index[upstream_id]] = self.index[downstream_id]
+
+    def pipe_nodes(self):
+        """Return the node indices of all pipes, in insertion order."""
+        return [node for node, is_pipe in enumerate(self.is_pipe) if is_pipe]
+
+    def path_from(self, element_id):
+        """Return the node indices from element_id down to the outlet."""
+        path = []
+        seen = set()
+        node = self.index[element_id]
+        while node != -1 and node not in seen:
+            seen.add(node)
+            path.append(node)
+            node = self.downstream[node]
+        return path
+
+
+class Injection(object):
+    """Continuous (Qc) or pumped (Qp) discharge entering at an element."""
+
+    def __init__(self, element_id, kind, flow):
+        if kind not in (CONTINUOUS, PUMPED):
+            raise ValueError("Unknown discharge kind: {}".format(kind))
+        self.element_id = element_id
+        self.kind = kind
+        self.flow = float(flow)
+
+
+class FlowResults(object):
+    """Per-pipe flow rates in l/s, aligned with ``ids``."""
+
+    def __init__(self, ids, discharge_units, qww, qc, qp, qtot):
+        self.ids = ids
+        self.discharge_units = discharge_units
+        self.qww = qww
+        self.qc = qc
+        self.qp = qp
+        self.qtot = qtot
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        """Yield (id, DU, Qww, Qc, Qp, Qtot) for every pipe."""
+        return iter(zip(self.ids, self.discharge_units,
+                        self.qww, self.qc, self.qp, self.qtot))
+
+    def converted(self, factor):
+        """Return the results with every flow rate multiplied by factor.
+
+        Used to convert all flow rates to another unit with one precomputed
+        factor instead of one conversion per value.
+        """
+        return FlowResults(self.ids, self.discharge_units,
+                           kernel.scale(self.qww, factor), kernel.scale(self.qc, factor),
+                           kernel.scale(self.qp, factor), kernel.scale(self.qtot, factor))
+
+
+def waste_water_flow(k_factor, discharge_units):
+    """Return Qww = K * sqrt(DU) in l/s."""
+    return k_factor * math.sqrt(discharge_units)
+
+
+def accumulate(network, injections):
+    """Return per-node (Qc, Qp) lists using one topological sweep.
+
+    Injections are summed at their own element and pushed downstream once
+    in topological order, so the cost is linear in the network size no
+    matter how many injections there are. Elements that sit on a loop all
+    receive the total flow entering that loop.
+    """
+    node_count = len(network)
+    qc = [0.0] * node_count
+    qp = [0.0] * node_count
+    for injection in injections:
+        target = qc if injection.kind == CONTINUOUS else qp
+        target[network.index[injection.element_id]] += injection.flow
+
+    downstream = network.downstream
+    indegree = [0] * node_count
+    for node in downstream:
+        if node != -1:
+            indegree[node] += 1
+
+    # Kahn's algorithm: the list grows while it is being iterated
+    order = [node for node in range(node_count) if indegree[node] == 0]
+    for node in order:
+        target = downstream[node]
+        if target == -1:
+            continue
+        qc[target] += qc[node]
+        qp[target] += qp[node]
+        indegree[target] -= 1
+        if indegree[target] == 0:
+            order.append(target)
+
+    # Whatever was not reached is on a loop (every element has one downstream)
+    if len(order) < node_count:
+        done = set(order)
+        for start in range(node_count):
+            if start in done:
+                continue
+            loop = []
+            node = start
+            while node not in done:
+                done.add(node)
+                loop.append(node)
+                node = downstream[node]
+            loop_qc = sum(qc[node] for node in loop)
+            loop_qp = sum(qp[node] for node in loop)
+            for node in loop:
+                qc[node] = loop_qc
+                qp[node] = loop_qp
+    return qc, qp
+
+
+def calculate(network, k_factor, injections=(), sweep=True):
+    """Calculate Qww, Qc, Qp and Qtot for every pipe in the network.
+
+    Each injection is added to its own element and every element downstream
+    of it. With sweep=False every injection walks its own path instead of
+    using the single topological sweep.
+    """
+    if sweep:
+        qc_nodes, qp_nodes = accumulate(network, injections)
+    else:
+        node_count = len(network)
+        qc_nodes = [0.0] * node_count
+        qp_nodes = [0.0] * node_count
+        for injection in injections:
+            target = qc_nodes if injection.kind == CONTINUOUS else qp_nodes
+            for node in network.path_from(injection.element_id):
+                target[node] += injection.flow
+    return node_results(network, k_factor, qc_nodes, qp_nodes)
+
+
+def node_results(network, k_factor, qc_nodes, qp_nodes):
+    """Return the FlowResults of the pipes of network from the Qc and Qp of every node."""
+    pipes = network.pipe_nodes()
+    du = kernel.as_array([network.discharge_units[node] for node in pipes])
+    qc = kernel.as_array([qc_nodes[node] for node in pipes])
+    qp = kernel.as_array([qp_nodes[node] for node in pipes])
+    qww, qtot = kernel.flow_kernel(du, k_factor, qc, qp)
+    ids = [network.ids[node] for node in pipes]
+    return FlowResults(ids, du, qww, qc, qp, qtot)
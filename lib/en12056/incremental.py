@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Results of earlier calculations kept for incremental recalculation.
+
+The last calculation of every system is kept for the session together with
+the topology it used, its discharges and the discharge units of each pipe.
+Element changes mark the system dirty, and the next run only re-reads the
+pipes on the downstream paths of the changed elements and only writes the
+pipes whose results differ from the last run.
+"""
+from en12056.traversal import walk_downstream
+
+
+class SystemResults(object):
+    """Inputs and results of the last calculation of one system.
+
+    ``discharge_units`` maps pipe ids to DU and ``values`` maps pipe ids to
+    the (DU, Qww, Qc, Qp, Qtot) tuple that was written to the model.
+    """
+
+    def __init__(self, topology, k_factor, system_type, injections,
+                 discharge_units, values):
+        self.topology = topology
+        self.k_factor = k_factor
+        self.system_type = system_type
+        self.injections = list(injections)
+        self.discharge_units = dict(discharge_units)
+        self.values = dict(values)
+        self.element_ids = topology.element_ids()
+        self.dirty = set()
+
+    @property
+    def system_id(self):
+        return self.topology.system_id
+
+    def matches(self, k_factor, system_type):
+        """Return True if the results were calculated with these options."""
+        return self.k_factor == k_factor and self.system_type == system_type
+
+    def mark_changed(self, changed_ids, added_ids=()):
+        """Record changed element ids that belong to this system, and added element ids.
+
+        Added elements are not in the topology of the last run, so they
+        are all kept; those that joined the system are found by the walk
+        in affected_ids().
+        """
+        self.dirty.update(self.element_ids.intersection(changed_ids))
+        self.dirty.update(added_ids)
+
+    def affected_ids(self, topology):
+        """Return the ids of every element downstream of a dirty element.
+
+        Paths are followed in the previous topology and in the current one,
+        so both the old and the new downstream route of a moved element are
+        included. Elements of the current topology that the previous one
+        does not have, e.g. a WC or branch added since, are dirty too.
+        """
+        sources = set(self.dirty)
+        sources.update(element_id for element_id in topology.ids if element_id not in self.element_ids)
+        affected = set(sources)
+        for snapshot in (self.topology, topology):
+            walked = set()
+            for element_id in sources:
+                start = snapshot.index.get(element_id)
+                if start is None or start in walked:
+                    continue
+                walk = walk_downstream(snapshot, start, stop_at=walked)
+                walked.update(walk.path)
+            affected.update(snapshot.ids[node] for node in walked)
+        return affected
+
+    def changed_values(self, results):
+        """Return the pipe ids whose results differ from the last run."""
+        changed = set()
+        for row in results:
+            if self.values.get(row[0]) != row[1:]:
+                changed.add(row[0])
+        return changed
+
+
+class ResultCache(object):
+    """Last SystemResults of every system, keyed by document and system."""
+
+    def __init__(self):
+        self._results = {}
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, document_key, system_id):
+        """Return the cached SystemResults or None."""
+        return self._results.get((document_key, system_id))
+
+    def put(self, document_key, system_results):
+        """Store system_results for its system."""
+        self._results[(document_key, system_results.system_id)] = system_results
+        return system_results
+
+    def mark_changed(self, document_key, changed_ids, added_ids=()):
+        """Mark every cached system of the document that uses changed_ids.
+
+        added_ids, elements new to the document, may have joined any
+        system of it, so every system keeps them.
+        """
+        changed_ids = set(changed_ids)
+        added_ids = set(added_ids)
+        if not changed_ids and not added_ids:
+            return
+        for key, system_results in self._results.items():
+            if key[0] == document_key:
+                system_results.mark_changed(changed_ids, added_ids)
+
+    def clear(self, document_key=None):
+        """Drop every result, or only those of one document."""
+        if document_key is None:
+            self._results.clear()
+            return
+        for key in list(self._results):
+            if key[0] == document_key:
+                del self._results[key]
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Array kernels for the per-pipe flow formulas.
+
+Qww = K * sqrt(DU) and Qtot = Qww + Qc + Qp are evaluated over whole
+columns at once. NumPy is used when it can be imported (CPython), otherwise
+the kernels run a tight loop into ``array('d')`` (IronPython). Unit
+conversion is folded into a single factor instead of one conversion call
+per value.
+"""
+import math
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+HAVE_NUMPY = numpy is not None
+
+
+def as_array(values):
+    """Return values as a contiguous float array."""
+    if HAVE_NUMPY:
+        return numpy.asarray(values, dtype=numpy.float64)
+    if isinstance(values, array) and values.typecode == 'd':
+        return values
+    return array('d', values)
+
+
+def _is_scalar(value):
+    return isinstance(value, (int, float)) or (HAVE_NUMPY and numpy.ndim(value) == 0)
+
+
+def waste_water_flows(discharge_units, k_factor, factor=1.0):
+    """Return factor * K * sqrt(DU) for every pipe.
+
+    k_factor is a scalar or one value per pipe.
+    """
+    if HAVE_NUMPY:
+        return numpy.sqrt(as_array(discharge_units)) * (as_array(k_factor) * factor)
+    sqrt = math.sqrt
+    if _is_scalar(k_factor):
+        scale = k_factor * factor
+        return array('d', [scale * sqrt(du) for du in discharge_units])
+    return array('d', [k * factor * sqrt(du) for du, k in zip(discharge_units, k_factor)])
+
+
+def scale(values, factor):
+    """Return every value multiplied by factor."""
+    if HAVE_NUMPY:
+        return as_array(values) * factor
+    if factor == 1.0:
+        return as_array(values)
+    return array('d', [value * factor for value in values])
+
+
+def total_flows(qww, qc, qp):
+    """Return Qtot = Qww + Qc + Qp for every pipe."""
+    if HAVE_NUMPY:
+        return as_array(qww) + as_array(qc) + as_array(qp)
+    return array('d', [a + b + c for a, b, c in zip(qww, qc, qp)])
+
+
+def flow_kernel(discharge_units, k_factor, qc, qp, factor=1.0):
+    """Return (Qww, Qtot) arrays for flows in l/s, multiplied by factor."""
+    if HAVE_NUMPY or not _is_scalar(k_factor):
+        qww = waste_water_flows(discharge_units, k_factor)
+        qtot = total_flows(qww, qc, qp)
+        return scale(qww, factor), scale(qtot, factor)
+    # Fused loops without intermediate arrays for the pure Python path
+    sqrt = math.sqrt
+    k_scaled = k_factor * factor
+    qww = array('d', [k_scaled * sqrt(du) for du in discharge_units])
+    qtot = array('d', [w + (c + p) * factor for w, c, p in zip(qww, qc, qp)])
+    return qww, qtot
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Cached access to the EN12056 shared parameters.
+
+Shared parameter GUIDs are resolved once per document, until a shared
+parameter is added, changed or deleted, and the Parameter
+handle of every element is looked up once per run. Whole columns of values
+can then be read and written without repeating LookupParameter name
+searches, and columns of final values are only written where they differ
+from what the model already holds.
+"""
+from Autodesk.Revit.DB import ElementClassFilter, FilteredElementCollector, SharedParameterElement, StorageType
+
+from en12056.topology import document_key
+
+# EN12056 shared parameters added to pipes by Add Shared Parameters
+DISCHARGE_UNITS = "EN12056_Discharge Units"
+FREQUENCY_FACTOR = "EN12056_Frequency Factor"
+CONTINUOUS_FLOW = "EN12056_Continuous Flow Rate"
+PUMPED_FLOW = "EN12056_Pumped Flow Rate"
+WASTE_WATER_FLOW = "EN12056_Waste Water Flow Rate"
+TOTAL_FLOW = "EN12056_Total Flow Rate"
+PRIMARY_VENTILATED = "EN12056_Primary Ventilated System"
+SECONDARY_VENTILATED = "EN12056_Secondary Ventilated System"
+
+PARAMETER_NAMES = [
+    DISCHARGE_UNITS,
+    FREQUENCY_FACTOR,
+    CONTINUOUS_FLOW,
+    PUMPED_FLOW,
+    WASTE_WATER_FLOW,
+    TOTAL_FLOW,
+    PRIMARY_VENTILATED,
+    SECONDARY_VENTILATED,
+]
+
+# Values closer than this are treated as unchanged
+TOLERANCE = 1e-9
+
+# Shared parameter GUIDs by document key, as ({name: Guid or None}, set of SharedParameterElement ids)
+_guids = {}
+
+_SHARED_PARAMETER_FILTER = ElementClassFilter(SharedParameterElement)
+
+
+def resolve_guids(doc, names=PARAMETER_NAMES):
+    """Return {name: Guid} for names, or None for non-shared parameters.
+
+    SharedParameterElements are only scanned the first time a name is asked
+    for in a document; names the scan did not find are remembered as None.
+    """
+    guids, element_ids = _guids.setdefault(document_key(doc), ({}, set()))
+    if any(name not in guids for name in names):
+        for shared_param in FilteredElementCollector(doc).OfClass(SharedParameterElement):
+            guids[shared_param.GetDefinition().Name] = shared_param.GuidValue
+            element_ids.add(shared_param.Id)
+        for name in names:
+            guids.setdefault(name, None)
+    return dict((name, guids[name]) for name in names)
+
+
+def invalidate_guids(key, args):
+    """Forget the GUIDs of document key if args adds, changes or deletes a shared parameter."""
+    cached = _guids.get(key)
+    if cached is None:
+        return
+    if (args.GetAddedElementIds(_SHARED_PARAMETER_FILTER)
+            or args.GetModifiedElementIds(_SHARED_PARAMETER_FILTER)
+            or not cached[1].isdisjoint(args.GetDeletedElementIds())):
+        del _guids[key]
+
+
+class ParameterTable(object):
+    """Parameter handles of a list of elements, one column per parameter."""
+
+    def __init__(self, doc, elements, names=PARAMETER_NAMES):
+        self.names = list(names)
+        self.elements = list(elements)
+        self.index = dict((element.Id, row) for row, element in enumerate(self.elements))
+        self.columns = {}
+        guids = resolve_guids(doc, self.names)
+        for name in self.names:
+            guid = guids[name]
+            if guid is not None:
+                self.columns[name] = [element.get_Parameter(guid) for element in self.elements]
+            else:
+                self.columns[name] = [element.LookupParameter(name) for element in self.elements]
+
+    def __len__(self):
+        return len(self.elements)
+
+    def missing(self):
+        """Return the parameter names the first element does not have."""
+        if not self.elements:
+            return []
+        return [name for name in self.names if self.columns[name][0] is None]
+
+    def is_integer(self, name):
+        """True when name is stored as an integer, as Yes/No parameters are.
+
+        Every element shares the definition, so the first handle tells.
+        """
+        column = self.columns[name]
+        return bool(column) and column[0].StorageType == StorageType.Integer
+
+    def read(self, name):
+        """Return the values of a column, in element order."""
+        if self.is_integer(name):
+            return [param.AsInteger() for param in self.columns[name]]
+        return [param.AsDouble() for param in self.columns[name]]
+
+    def write(self, name, element_ids, values):
+        """Set name to each value on the matching element id.
+
+        Ids of elements that are not in the table are skipped.
+        """
+        column = self.columns[name]
+        index = self.index
+        for element_id, value in zip(element_ids, values):
+            row = index.get(element_id)
+            if row is not None:
+                column[row].Set(value)
+
+    def fill(self, name, value):
+        """Set name to the same value on every element."""
+        for param in self.columns[name]:
+            param.Set(value)
+
+    def column(self, element_ids, values, default=0.0):
+        """Return values rearranged into element order.
+
+        Elements without a value get default, ids of elements that are not
+        in the table are skipped.
+        """
+        column = [default] * len(self.elements)
+        index = self.index
+        for element_id, value in zip(element_ids, values):
+            row = index.get(element_id)
+            if row is not None:
+                column[row] = value
+        return column
+
+    def update(self, name, values, tolerance=TOLERANCE):
+        """Set name from a full column of values, skipping unchanged ones.
+
+        Integer parameters, e.g. the Yes/No ventilated system flags, are
+        compared and set as integers; AsDouble() reads 0 for them.
+        Returns the number of parameters that were written.
+        """
+        written = 0
+        if self.is_integer(name):
+            for param, value in zip(self.columns[name], values):
+                value = int(value)
+                if param.AsInteger() == value:
+                    continue
+                param.Set(value)
+                written += 1
+            return written
+        for param, value in zip(self.columns[name], values):
+            current = param.AsDouble()
+            if abs(current - value) <= tolerance * max(1.0, abs(value)):
+                continue
+            param.Set(value)
+            written += 1
+        return written
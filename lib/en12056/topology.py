@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Connector topology snapshots of sanitary piping networks.
+
+A snapshot records, for every element of a piping network, its connected
+neighbours, the element flow leaves into, its largest round connector size
+and its system classification. Once built, walking the network only reads
+these arrays and never goes back to the Revit API.
+"""
+from array import array
+
+# Connector flow directions as stored in the snapshot
+FLOW_BIDIRECTIONAL = 0
+FLOW_IN = 1
+FLOW_OUT = 2
+
+# Reasons why an element has no downstream element
+END_SYSTEM = "open end"
+END_CLASSIFICATION = "different system classification"
+END_DIRECTION = "probably a direction error"
+END_EXTERNAL = "outside the piping network"
+
+
+def document_key(doc):
+    """Return a key identifying doc for the rest of the session."""
+    return (doc.Title, doc.PathName)
+
+
+class Topology(object):
+    """Adjacency snapshot of one piping network.
+
+    Elements are added with add_element() while the network is scanned and
+    resolved into index based arrays by finalise(). After that ``downstream``
+    holds the node flow leaves into (or -1) and ``edge_offsets``,
+    ``edge_targets`` and ``edge_directions`` hold every connection in
+    compressed sparse row form.
+    """
+
+    def __init__(self, system_id=None):
+        self.system_id = system_id
+        self.ids = []
+        self.index = {}
+        self.is_pipe = bytearray()
+        self.sizes = array('d')
+        self.classifications = []
+        self.downstream = array('l')
+        self.end_reasons = []
+        self.edge_offsets = array('l', [0])
+        self.edge_targets = array('l')
+        self.edge_directions = bytearray()
+        self._next_ids = []
+        self._neighbour_ids = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, element_id):
+        return element_id in self.index
+
+    def add_element(self, element_id, is_pipe, size, classification,
+                    next_id=None, end_reason=None, neighbours=()):
+        """Record one element of the network.
+
+        next_id is the element flow leaves into, or None with end_reason
+        saying why there is none. neighbours is a sequence of
+        (element_id, direction) pairs, one per connected connector.
+        """
+        self.index[element_id] = len(self.ids)
+        self.ids.append(element_id)
+        self.is_pipe.append(1 if is_pipe else 0)
+        self.sizes.append(size)
+        self.classifications.append(classification or "")
+        self._next_ids.append(next_id)
+        self.end_reasons.append(end_reason)
+        self._neighbour_ids.append(list(neighbours))
+
+    def finalise(self):
+        """Resolve element ids recorded by add_element() into node indices."""
+        index = self.index
+        for node, next_id in enumerate(self._next_ids):
+            target = index.get(next_id, -1) if next_id is not None else -1
+            if next_id is not None and target == -1:
+                self.end_reasons[node] = END_EXTERNAL
+            self.downstream.append(target)
+        for neighbours in self._neighbour_ids:
+            for neighbour_id, direction in neighbours:
+                self.edge_targets.append(index.get(neighbour_id, -1))
+                self.edge_directions.append(direction)
+            self.edge_offsets.append(len(self.edge_targets))
+        self._next_ids = None
+        self._neighbour_ids = None
+        return self
+
+    def element_ids(self):
+        """Return every element id the snapshot depends on."""
+        ids = set(self.ids)
+        if self.system_id is not None:
+            ids.add(self.system_id)
+        return ids
+
+    def neighbours(self, node):
+        """Return (node, direction) pairs of the elements connected to node."""
+        start = self.edge_offsets[node]
+        end = self.edge_offsets[node + 1]
+        return list(zip(self.edge_targets[start:end], self.edge_directions[start:end]))
+
+    def matches_classification(self, node, classification):
+        """Return True if node shares a system classification with classification."""
+        wanted = classification.split(",")
+        for name in self.classifications[node].split(","):
+            if name in wanted:
+                return True
+        return False
+
+    def next_node(self, node, classification):
+        """Return (next node, end reason) for flow leaving node.
+
+        The next node is -1 when the walk has to stop, in which case the end
+        reason says why.
+        """
+        if not self.matches_classification(node, classification):
+            return -1, END_CLASSIFICATION
+        target = self.downstream[node]
+        if target == -1:
+            return -1, self.end_reasons[node] or END_SYSTEM
+        return target, None
+
+    def is_size_end(self, start, node, factor):
+        """Return True if node is more than factor times larger than start."""
+        return self.sizes[node] > self.sizes[start] * factor
+
+    def find_loops(self):
+        """Return the node lists of every loop in the downstream links."""
+        state = bytearray(len(self.ids))  # 0 new, 1 on current path, 2 done
+        loops = []
+        for start in range(len(self.ids)):
+            path = []
+            node = start
+            while node != -1 and state[node] == 0:
+                state[node] = 1
+                path.append(node)
+                node = self.downstream[node]
+            if node != -1 and state[node] == 1:
+                loops.append(path[path.index(node):])
+            for visited in path:
+                state[visited] = 2
+        return loops
+
+
+class SnapshotCache(object):
+    """Topology snapshots kept for the session, keyed by document and system.
+
+    Snapshots are dropped as soon as any element they were built from is
+    reported as changed.
+    """
+
+    def __init__(self):
+        self._snapshots = {}
+
+    def __len__(self):
+        return len(self._snapshots)
+
+    def get(self, document_key, system_id):
+        """Return the cached snapshot or None."""
+        entry = self._snapshots.get((document_key, system_id))
+        return entry[0] if entry else None
+
+    def put(self, document_key, topology):
+        """Store topology for its system."""
+        self._snapshots[(document_key, topology.system_id)] = (topology, topology.element_ids())
+        return topology
+
+    def invalidate(self, document_key, changed_ids):
+        """Drop every snapshot of the document that uses one of changed_ids."""
+        changed_ids = set(changed_ids)
+        if not changed_ids:
+            return
+        for key, (topology, element_ids) in list(self._snapshots.items()):
+            if key[0] == document_key and not element_ids.isdisjoint(changed_ids):
+                del self._snapshots[key]
+
+    def clear(self, document_key=None):
+        """Drop every snapshot, or only those of one document."""
+        if document_key is None:
+            self._snapshots.clear()
+            return
+        for key in list(self._snapshots):
+            if key[0] == document_key:
+                del self._snapshots[key]
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Downstream walks over topology snapshots.
+
+A walk follows the downstream links of a Topology from a start node. Visited
+nodes are kept in a set, so a walk is linear in its length, and it always
+reports why and where it stopped instead of silently giving up.
+"""
+
+# Why a walk stopped, in addition to the Topology end reasons
+STOP_CYCLE = "double element"
+STOP_TRUNCATED = "maximum path length reached"
+STOP_SIZE_END = "size end"
+STOP_JOINED = "joined a walked path"
+
+
+class Walk(object):
+    """Result of one downstream walk.
+
+    ``path`` lists the visited nodes starting with the start node, ``reason``
+    says why the walk stopped and ``at`` is the node it stopped at. For
+    cycles ``at`` is the node that would have been visited twice, for stop
+    rules it is the node that was rejected.
+    """
+
+    def __init__(self, path, reason, at):
+        self.path = path
+        self.reason = reason
+        self.at = at
+
+    def __len__(self):
+        return len(self.path)
+
+    @property
+    def complete(self):
+        """True unless the walk was cut short by a limit or a stop rule."""
+        return self.reason not in (STOP_TRUNCATED, STOP_SIZE_END)
+
+    def describe(self, topology):
+        """Return a message such as '12345: double element'."""
+        return "{}: {}".format(topology.ids[self.at], self.reason)
+
+
+def size_end_rule(topology, factor):
+    """Return a stop rule that ends a walk at much larger connectors.
+
+    A node is rejected when its largest round connector is more than factor
+    times the largest connector of the start node.
+    """
+    def rule(start, node):
+        if topology.is_size_end(start, node, factor):
+            return STOP_SIZE_END
+        return None
+    return rule
+
+
+def walk_downstream(topology, start, classification=None, max_length=None,
+                    stop_rule=None, stop_at=None):
+    """Walk downstream from the start node and return a Walk.
+
+    classification defaults to the classification of the start node.
+    max_length caps the number of nodes in the path (None for no limit).
+    stop_rule(start, node) may return a reason to reject node. stop_at is
+    an optional set of nodes; the walk stops after reaching one of them.
+    """
+    if classification is None:
+        classification = topology.classifications[start]
+    path = [start]
+    visited = set(path)
+    node = start
+    while True:
+        if max_length is not None and len(path) >= max_length:
+            return Walk(path, STOP_TRUNCATED, node)
+        next_node, end_reason = topology.next_node(node, classification)
+        if next_node == -1:
+            return Walk(path, end_reason, node)
+        if next_node in visited:
+            return Walk(path, STOP_CYCLE, next_node)
+        if stop_rule is not None:
+            reason = stop_rule(start, next_node)
+            if reason:
+                return Walk(path, reason, next_node)
+        path.append(next_node)
+        visited.add(next_node)
+        if stop_at is not None and next_node in stop_at:
+            return Walk(path, STOP_JOINED, next_node)
+        node = next_node
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Logic of the larger Pam tools, kept loaded for the Revit session.
+
+The extension is rocket-mode compatible, so pyRevit keeps modules under
+``lib`` in memory between runs of a tool and only the short pushbutton
+scripts are read and compiled on every click. Scripts load these modules
+with require(), naming the VERSION they were written against:
+
+    converter = pamtools.require('converter', 1)
+
+When the loaded copy has a different VERSION, e.g. after the extension was
+updated without restarting Revit, every loaded pamtools module is reloaded
+from source, dependencies first, so no module keeps using objects of the
+copy it imported before. Bump VERSION whenever a module changes what its
+callers rely on.
+"""
+import importlib
+import sys
+
+try:
+    reload
+except NameError:  # Python 3
+    from importlib import reload
+
+# Every module in dependency order: each one only imports modules before it
+MODULES = ('session', 'matching', 'connectors', 'routing', 'families', 'catalogue', 'converter', 'couplings')
+
+
+def require(name, version):
+    """Return the pamtools module called name, reloading it unless it is version."""
+    module_name = "{}.{}".format(__name__, name)
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    if getattr(module, 'VERSION', None) != version:
+        reload_modules()
+        module = sys.modules[module_name]
+        if getattr(module, 'VERSION', None) != version:
+            raise ImportError("{} is version {}, not {}".format(
+                module_name, getattr(module, 'VERSION', None), version))
+    return module
+
+
+def reload_modules():
+    """Reload every loaded pamtools module in dependency order.
+
+    Modules are given the chance to undo what they registered with Revit,
+    through their unload() function, before any of them is reloaded.
+    """
+    loaded = [sys.modules.get("{}.{}".format(__name__, name)) for name in MODULES]
+    loaded = [module for module in loaded if module is not None]
+    for module in reversed(loaded):
+        unload = getattr(module, 'unload', None)
+        if unload is not None:
+            unload()
+    for module in loaded:
+        reload(module)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Pam coupling and connector families of a document, by product code and DN.
+
+Add Couplings, Content Converter and Place Calculation Connections all
+look for the same families by description keyword, and Add Couplings
+read the DN out of every type name on each run. A Catalogue sorts the
+pipe fitting symbols into product lines in one pass over the family
+symbol scan, reading each DN once, and is kept until a family is
+loaded, edited or deleted.
+"""
+import re
+
+from Autodesk.Revit.DB import FamilySymbol
+
+from pamtools.families import family_symbols
+from pamtools.session import DocumentMemo
+
+VERSION = 1
+
+# Product code of the EN 12056 calculation connector, which fits every DN
+CONNECTOR = 'EN 12056 Connector'
+
+# Allowed DNs and description keywords of each product line, then those of its slim variants;
+# no DNs means the family fits every size and is kept whatever its type name
+PRODUCT_LINES = {
+    'EC002': ([50, 70, 100, 125, 150, 200, 250, 300], ['Ductile Iron Coupling'], [], []),
+    'EC002NG': ([50, 70, 100, 125, 150, 200, 250, 300], ['NG Coupling'], [], []),
+    'EC002HP': ([50, 70, 250, 300, 400, 500, 600], ['Flex Coupling'], [100, 150, 200], ['Flex Slim Coupling']),
+    'EC002HP-G': ([50, 70, 300, 400, 500, 600], ['Grip Coupling'], [100, 125, 150, 200, 250],
+                  ['Grip Slim Coupling']),
+    CONNECTOR: (None, ['EN 12056 Calculation Connector'], [], []),
+}
+
+
+def product_code(coupling):
+    """Return the product code of a coupling system, e.g. EC002NG for RAPID S NG."""
+    return coupling.split(" - ")[0]
+
+
+# Function to extract DN size from family type name and validate
+def extract_and_validate_dn_size(type_name):
+    match = re.search(r'DN(\d+)[xX](\d+)', type_name)
+    if match:
+        dn1 = int(match.group(1))
+        dn2 = int(match.group(2))
+        # Ensure both DN numbers are the same to avoid variants like DN100x110
+        if dn1 == dn2:
+            return dn1
+    return None
+
+
+def _line_diameters(code, description):
+    """Return the DNs of the product line code the symbol belongs to, or None."""
+    diameters, keywords, diameters_extra, keywords_extra = PRODUCT_LINES[code]
+    # Check extra keywords/diameters (Slim variants) FIRST
+    if keywords_extra and any(keyword in description for keyword in keywords_extra):
+        return diameters_extra
+    if any(keyword in description for keyword in keywords):
+        return diameters or []
+    return None
+
+
+class Catalogue(object):
+    """Ids of the Pam families of a document by (product code, DN).
+
+    Connector families fit every size and are kept under their DN, which
+    is None when the type name gives none.
+    """
+
+    def __init__(self, symbols):
+        self._ids = {}  # (product code, DN) -> [symbol ids]
+        self._lines = {}  # product code -> [symbol ids], in scan order
+        for symbol in symbols:
+            if not symbol.description:
+                continue
+            lines = []
+            for code in PRODUCT_LINES:
+                diameters = _line_diameters(code, symbol.description)
+                if diameters is not None:
+                    lines.append((code, diameters))
+            if not lines:
+                continue
+            # The DN is read once, whatever the number of product lines the symbol is in
+            dn_size = extract_and_validate_dn_size(symbol.type_name)
+            for code, diameters in lines:
+                if PRODUCT_LINES[code][0] is None or (dn_size and dn_size in diameters):
+                    self._ids.setdefault((code, dn_size), []).append(symbol.id)
+                    self._lines.setdefault(code, []).append(symbol.id)
+
+    def __len__(self):
+        return sum(len(ids) for ids in self._lines.values())
+
+    def get(self, code, dn_size=None):
+        """Return the ids of the families of product code of DN dn_size, in scan order."""
+        return list(self._ids.get((code, dn_size), ()))
+
+    def symbol_ids(self, code):
+        """Return the ids of every family of product code, whatever its DN, in scan order."""
+        return list(self._lines.get(code, ()))
+
+    def families(self, code):
+        """Return the (DN, symbol id) of the families of product code, smallest DN first."""
+        matches = [(dn_size, symbol_id) for (line, dn_size), ids in self._ids.items()
+                   if line == code and dn_size is not None for symbol_id in ids]
+        matches.sort(key=lambda match: match[0])
+        return matches
+
+    def missing_diameters(self, code):
+        """Return the DNs product code comes in that no loaded family has, smallest first."""
+        diameters, keywords, diameters_extra, keywords_extra = PRODUCT_LINES[code]
+        return sorted(dn_size for dn_size in (diameters or []) + diameters_extra
+                      if (code, dn_size) not in self._ids)
+
+    def values(self):
+        """Return the id of every family in the catalogue."""
+        return [symbol_id for ids in self._lines.values() for symbol_id in ids]
+
+
+_catalogue = DocumentMemo(lambda doc: Catalogue(family_symbols(doc, "Pipe Fittings")), FamilySymbol,
+                          lambda catalogue: catalogue.values())
+
+
+def catalogue(doc):
+    """Return the Catalogue of doc, built on first use from the family symbol scan."""
+    return _catalogue.get(doc)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Pairing connectors by position, in constant time per connector.
+
+A ConnectorGrid hashes connector origins into cubic cells as wide as the
+matching tolerance, so the connectors near a point are found by looking
+in the cell of the point and its 26 neighbours, however many connectors
+the grid holds. Only Origin and Owner are read from each connector once,
+when it is added.
+
+When the parts of several broken pipes go into one grid, each pipe's
+parts are added under a group of their own, so pairs() joins parts of the
+same pipe only and one grid serves the whole batch.
+"""
+import math
+
+VERSION = 2
+
+# Connectors closer than this (feet) are at the same place
+TOLERANCE = 0.01
+
+
+class ConnectorGrid(object):
+    """Connectors by the cell of the tolerance grid their origin falls in."""
+
+    def __init__(self, connectors=(), tolerance=TOLERANCE):
+        self.tolerance = tolerance
+        self._cells = {}  # cell -> [(origin, owner id, connector, number in order added, group)]
+        self._count = 0
+        for connector in connectors:
+            self.add(connector)
+
+    def __len__(self):
+        return self._count
+
+    def _cell(self, point):
+        size = self.tolerance
+        return (int(math.floor(point[0] / size)), int(math.floor(point[1] / size)),
+                int(math.floor(point[2] / size)))
+
+    def add(self, connector, owner_id=None, group=None):
+        """Add connector; owner_id, the id of its element, saves reading Owner when known.
+
+        pairs() only pairs connectors added under the same group.
+        """
+        origin = connector.Origin
+        point = (origin.X, origin.Y, origin.Z)
+        if owner_id is None:
+            owner_id = connector.Owner.Id
+        self._cells.setdefault(self._cell(point), []).append((point, owner_id, connector, self._count, group))
+        self._count += 1
+
+    def _entries_near(self, point):
+        x, y, z = self._cell(point)
+        limit = self.tolerance * self.tolerance
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for entry in self._cells.get((x + dx, y + dy, z + dz), ()):
+                        other = entry[0]
+                        if ((other[0] - point[0]) ** 2 + (other[1] - point[1]) ** 2 +
+                                (other[2] - point[2]) ** 2) < limit:
+                            yield entry
+
+    def near(self, point):
+        """Return the connectors within tolerance of the (x, y, z) point."""
+        return [entry[2] for entry in self._entries_near(point)]
+
+    def match(self, connector):
+        """Return a connector of another element at the origin of connector, or None."""
+        origin = connector.Origin
+        owner_id = connector.Owner.Id
+        for entry in self._entries_near((origin.X, origin.Y, origin.Z)):
+            if entry[1] != owner_id:
+                return entry[2]
+        return None
+
+    def _pairs(self):
+        pairs = []
+        for cell_entries in self._cells.values():
+            for point, owner_id, connector, number, group in cell_entries:
+                for other_point, other_owner_id, other, other_number, other_group in self._entries_near(point):
+                    if other_owner_id != owner_id and number < other_number and other_group == group:
+                        pairs.append((number, group, connector, other))
+        pairs.sort(key=lambda pair: pair[0])
+        return pairs
+
+    def pairs(self):
+        """Return every (connector, connector) of two elements of a group at the same place, each pair once.
+
+        Pairs come in the order their first connector was added.
+        """
+        return [(connector, other) for number, group, connector, other in self._pairs()]
+
+    def pairs_by_group(self):
+        """Return the pairs() of each group, by group."""
+        groups = {}
+        for number, group, connector, other in self._pairs():
+            groups.setdefault(group, []).append((connector, other))
+        return groups
+
+    def unmatched(self):
+        """Return the connectors no connector of another element is at."""
+        unmatched = []
+        for cell_entries in self._cells.values():
+            for point, owner_id, connector, number, group in cell_entries:
+                if not any(entry[1] != owner_id for entry in self._entries_near(point)):
+                    unmatched.append(connector)
+        return unmatched
+
+
+def connector_pair(element, other, tolerance=TOLERANCE):
+    """Return the (connector of element, connector of other) at the same place.
+
+    When no connectors are within tolerance, the closest two are returned,
+    as the tools did before the grid; None only when either has no connectors.
+    """
+    grid = ConnectorGrid(tolerance=tolerance)
+    element_id = element.Id
+    element_connectors = list(element.ConnectorManager.Connectors)
+    for connector in element_connectors:
+        grid.add(connector, element_id)
+    other_connectors = list(other.ConnectorManager.Connectors)
+    for connector in other_connectors:
+        origin = connector.Origin
+        near = grid.near((origin.X, origin.Y, origin.Z))
+        if near:
+            return near[0], connector
+    closest = None
+    closest_distance = None
+    for connector in element_connectors:
+        for other_connector in other_connectors:
+            distance = connector.Origin.DistanceTo(other_connector.Origin)
+            if closest_distance is None or distance < closest_distance:
+                closest = (connector, other_connector)
+                closest_distance = distance
+    return closest
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+"""Conversion of generic pipework to Pam Building pipes, fittings and accessories.
+
+Used by the Content Converter tool. Pipes change to the chosen pipe type
+and take its pipe segment; fittings and accessories change to the Pam
+family their type description names, in the chosen coupling system.
+
+Which family replaces which fitting is data, in data/fitting_families.json.
+Each rule has a keyword and a family, and may add conditions:
+
+- "match": "exact" when the description must equal the keyword
+- "coupling": product code of the coupling system, e.g. "EC002NG"
+- "diameter": [above, up to] nominal diameter in mm, null for no limit
+- "type": name the current type must have
+- "target_type": type to change to, instead of one of the same name
+
+New Pam product lines are added as rules, without changing this module.
+"""
+import io
+import json
+import os
+
+from System.Collections.Generic import List
+
+from Autodesk.Revit.DB import (
+    BuiltInCategory,
+    BuiltInParameter,
+    Element,
+    ElementId,
+    ElementLevelFilter,
+    ElementMulticategoryFilter,
+    FilteredElementCollector,
+    RoutingPreferenceRuleGroupType,
+    UnitTypeId,
+    UnitUtils,
+)
+
+from pamtools.catalogue import catalogue, product_code
+from pamtools.families import symbol_index
+from pamtools.matching import KeywordMatcher
+
+VERSION = 7
+
+DUCTILE_IRON = 'EC002 - Ductile Iron Coupling'
+RAPID_S_NG = 'EC002NG - RAPID S NG Coupling'
+
+# Categories of the elements Content Converter changes
+CONVERTED_CATEGORIES = [
+    BuiltInCategory.OST_PipeCurves,
+    BuiltInCategory.OST_PipeFitting,
+    BuiltInCategory.OST_PipeAccessory,
+]
+
+# Most elements changed in one Element.ChangeTypeId call, so progress can be reported between calls
+BATCH_SIZE = 500
+
+# Table of the Pam family replacing each kind of fitting and accessory
+FITTING_FAMILIES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'fitting_families.json')
+
+# Family mappings read from their table, keyed by path, with the modification time they were read at
+_mappings = {}
+
+
+class FittingRule(object):
+    """One row of the fitting family table.
+
+    A rule applies to a fitting whose type description contains keyword
+    (or equals it, when exact), in the coupling system with product code
+    coupling, whose nominal diameter d is above < d <= up_to and whose
+    type is called type_name. Conditions left as None always hold.
+    """
+
+    __slots__ = ('keyword', 'exact', 'coupling', 'above', 'up_to', 'type_name', 'family', 'target_type')
+
+    def __init__(self, keyword, family, exact=False, coupling=None, above=None, up_to=None,
+                 type_name=None, target_type=None):
+        self.keyword = keyword
+        self.exact = exact
+        self.coupling = coupling
+        self.above = above
+        self.up_to = up_to
+        self.type_name = type_name
+        self.family = family
+        self.target_type = target_type
+
+    @classmethod
+    def from_row(cls, row):
+        above, up_to = row.get('diameter') or (None, None)
+        return cls(row['keyword'], row['family'], row.get('match') == 'exact', row.get('coupling'),
+                   above, up_to, row.get('type'), row.get('target_type'))
+
+    def applies(self, type_name, diameter, coupling):
+        if self.coupling is not None and self.coupling != coupling:
+            return False
+        if self.type_name is not None and self.type_name != type_name:
+            return False
+        if self.above is not None or self.up_to is not None:
+            if diameter is None:
+                return False
+            if self.above is not None and diameter <= self.above:
+                return False
+            if self.up_to is not None and diameter > self.up_to:
+                return False
+        return True
+
+
+class FamilyMapping(object):
+    """Fitting rules compiled for matching many fittings.
+
+    The keywords of every rule go into one KeywordMatcher, so a description
+    is read once whatever the number of rules. Of the rules that apply, the
+    one with the longest keyword wins, so "Blank End Push-Fit" beats "Blank
+    End" wherever it sits in the table; an exact match beats them all and
+    ties go to the rule listed first.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self._exact = {}
+        contains = {}
+        for rule in self.rules:
+            if rule.exact:
+                self._exact.setdefault(rule.keyword, []).append(rule)
+            else:
+                contains.setdefault(rule.keyword, []).append(rule)
+        self._matcher = KeywordMatcher(contains)
+        self._rules_of = [contains[keyword] for keyword in self._matcher.keywords]
+        self._order = dict((id(rule), index) for index, rule in enumerate(self.rules))
+        self._targets = {}
+
+    def rule_for(self, description, type_name, diameter, coupling):
+        """Return the rule replacing a fitting, or None."""
+        candidates = list(self._exact.get(description, ()))
+        for index in self._matcher.find(description):
+            candidates.extend(self._rules_of[index])
+
+        best = None
+        best_key = None
+        for rule in candidates:
+            if not rule.applies(type_name, diameter, coupling):
+                continue
+            length = len(description) + 1 if rule.exact else len(rule.keyword)
+            key = (-length, self._order[id(rule)])
+            if best_key is None or key < best_key:
+                best, best_key = rule, key
+        return best
+
+    def target(self, description, type_name, diameter, coupling):
+        """Return the (family name, type name) replacing a fitting, or None.
+
+        Results are cached, as a model has few distinct fitting types.
+        """
+        key = (description, type_name, diameter, coupling)
+        if key in self._targets:
+            return self._targets[key]
+        rule = self.rule_for(description, type_name, diameter, coupling)
+        target = None
+        if rule is not None:
+            target = (rule.family, rule.target_type or type_name)
+        self._targets[key] = target
+        return target
+
+
+def load_rules(path):
+    """Return the FittingRules of the table at path."""
+    with io.open(path, encoding='utf-8') as table:
+        rows = json.load(table)['rules']
+    return [FittingRule.from_row(row) for row in rows]
+
+
+def family_mapping(path=FITTING_FAMILIES):
+    """Return the FamilyMapping of the table at path, reading it only once per session.
+
+    The table is read again if it has changed since it was cached.
+    """
+    modified = os.path.getmtime(path)
+    cached = _mappings.get(path)
+    if cached is not None and cached[0] == modified:
+        return cached[1]
+    mapping = FamilyMapping(load_rules(path))
+    _mappings[path] = (modified, mapping)
+    return mapping
+
+
+def get_target(description, type_name, diameter, coupling):
+    """Return the (family name, type name) replacing a fitting or accessory.
+
+    description and type_name are those of its current type and diameter
+    its nominal diameter in millimetres, or None. The family name is empty
+    when no Pam family matches.
+    """
+    target = family_mapping().target(description, type_name, diameter, product_code(coupling))
+    return target or ("", type_name)
+
+
+def get_pipe_segment_id(pipe_type):
+    """Return the PipeSegment ElementId from the first rule in the pipe type's
+    routing preferences. All sizes share the same segment so no diameter matching needed."""
+    rpm = pipe_type.RoutingPreferenceManager
+    num_rules = rpm.GetNumberOfRules(RoutingPreferenceRuleGroupType.Segments)
+    if num_rules > 0:
+        return rpm.GetRule(RoutingPreferenceRuleGroupType.Segments, 0).MEPPartId
+    return None
+
+
+def nominal_diameter(element):
+    """Return the Nominal Diameter of element in millimetres, or None."""
+    parameter = element.LookupParameter('Nominal Diameter')
+    if parameter is None:
+        return None
+    return UnitUtils.ConvertFromInternalUnits(parameter.AsDouble(), UnitTypeId.Millimeters)
+
+
+def set_pipe_segment(pipe, segment_id):
+    """Give pipe the pipe segment segment_id.
+
+    ChangeTypeId does NOT update the Pipe Segment instance parameter, so it
+    is set explicitly to the segment from the new pipe type.
+    """
+    if segment_id:
+        seg_param = pipe.get_Parameter(BuiltInParameter.RBS_PIPE_SEGMENT_PARAM)
+        if seg_param and not seg_param.IsReadOnly:
+            seg_param.Set(segment_id)
+
+
+def change_types(doc, elements, type_id):
+    """Change elements to the type type_id and return the (element, error) of those that failed.
+
+    All of them change in one Element.ChangeTypeId call, so Revit
+    regenerates once. If that call fails, each element is changed on its
+    own, so one element that cannot take the type does not stop the rest.
+    """
+    try:
+        Element.ChangeTypeId(doc, List[ElementId]([element.Id for element in elements]), type_id)
+        return []
+    except Exception:
+        pass
+
+    errors = []
+    for element in elements:
+        try:
+            element.ChangeTypeId(type_id)
+        except Exception as e:
+            errors.append((element, e))
+    return errors
+
+
+class ConversionPlan(object):
+    """What converting a selection will do, worked out without changing the model.
+
+    groups holds the elements to change by the id of the type they change
+    to. The counts behind the report are kept alongside: elements per
+    target, fittings no Pam family matches, by description, and target
+    types the project has not loaded, with the DNs of the chosen coupling
+    system no coupling family is loaded for.
+    """
+
+    def __init__(self, pipe_type_id, pipe_type_name, segment_id, segment_name):
+        self.pipe_type_id = pipe_type_id
+        self.pipe_type_name = pipe_type_name
+        self.segment_id = segment_id
+        self.segment_name = segment_name
+        self.groups = {}  # target type id -> elements
+        self.targets = {}  # (family name, type name) -> number of elements
+        self.unresolved = {}  # description -> number of fittings
+        self.missing = {}  # (family name, type name) -> number of fittings
+        self.coupling = None  # Product code of the coupling system
+        self.couplings_missing = []  # DNs of the coupling system with no coupling family loaded
+        self.errors = []  # (element, error)
+
+    def add(self, element, type_id, target):
+        self.groups.setdefault(type_id, []).append(element)
+        self.targets[target] = self.targets.get(target, 0) + 1
+
+    def count(self):
+        """Return the number of elements the plan converts."""
+        return sum(len(group) for group in self.groups.values())
+
+    def pipe_count(self):
+        return len(self.groups.get(self.pipe_type_id, ()))
+
+    def missing_targets(self):
+        """Return the (family name, type name, number of fittings) of the types to load."""
+        return [(family_name, type_name, count)
+                for (family_name, type_name), count in sorted(self.missing.items())]
+
+
+def collect_elements(doc, systems=None, view=None, level=None):
+    """Return the pipes, fittings and accessories of systems, or of view, or on level.
+
+    One category-filtered collector gathers them, over the network of
+    the piping systems, the elements of the view or the whole model.
+    """
+    if systems is not None:
+        network_ids = {}
+        for system in systems:
+            for element in system.PipingNetwork:
+                network_ids.setdefault(element.Id, element.Id)
+        if not network_ids:
+            return []
+        collector = FilteredElementCollector(doc, List[ElementId](network_ids.values()))
+    elif view is not None:
+        collector = FilteredElementCollector(doc, view.Id)
+    else:
+        collector = FilteredElementCollector(doc)
+
+    collector = collector.WherePasses(
+        ElementMulticategoryFilter(List[BuiltInCategory](CONVERTED_CATEGORIES))).WhereElementIsNotElementType()
+    if level is not None:
+        collector = collector.WherePasses(ElementLevelFilter(level.Id))
+    return list(collector)
+
+
+def _element_type_name(element):
+    parameter = element.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM)
+    return (parameter.AsString() if parameter else None) or ""
+
+
+def plan_conversion(doc, elements, pipe_type, coupling):
+    """Return the ConversionPlan of elements, reading the model only.
+
+    Uses the same family mapping and symbol index as the conversion, so
+    planning costs one classification per element and no transaction.
+    """
+    # Look up the pipe segment from the target pipe type once — all sizes share the same segment
+    segment_id = get_pipe_segment_id(pipe_type)
+    segment = doc.GetElement(segment_id) if segment_id else None
+    plan = ConversionPlan(pipe_type.Id, _element_type_name(pipe_type), segment_id,
+                          segment.Name if segment is not None else "")
+    index = symbol_index(doc)
+    plan.coupling = product_code(coupling)
+    plan.couplings_missing = catalogue(doc).missing_diameters(plan.coupling)
+
+    for element in elements:
+        try:
+            if element.Category.Name == "Pipes":
+                plan.add(element, plan.pipe_type_id, ("Pipes", plan.pipe_type_name))
+                continue
+
+            element_type = doc.GetElement(element.GetTypeId())
+            description = element_type.get_Parameter(BuiltInParameter.ALL_MODEL_DESCRIPTION).AsString() or ""
+            type_name = element_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString()
+            family_name, type_name = get_target(description, type_name, nominal_diameter(element), coupling)
+            if not family_name:
+                plan.unresolved[description] = plan.unresolved.get(description, 0) + 1
+                continue
+
+            type_id = index.get(family_name, type_name)
+            if type_id is None:
+                plan.missing[(family_name, type_name)] = plan.missing.get((family_name, type_name), 0) + 1
+                continue
+            plan.add(element, type_id, (family_name, type_name))
+        except Exception as e:
+            plan.errors.append((element, e))
+    return plan
+
+
+def execute(doc, plan, progress=None):
+    """Carry out plan, inside an open transaction.
+
+    Each group changes in calls of up to BATCH_SIZE elements. Returns the
+    number of pipes and of fittings and accessories converted, and the
+    (element, error) of every element that failed.
+
+    progress(done, total), when given, is called after every call with
+    the number of elements handled so far; returning False stops the
+    conversion, leaving the transaction to be rolled back.
+    """
+    errors = []
+    num_pipes_changed = 0
+    num_fittings_changed = 0
+    total = plan.count()
+    done = 0
+
+    for type_id, group in plan.groups.items():
+        for start in range(0, len(group), BATCH_SIZE):
+            batch = group[start:start + BATCH_SIZE]
+            failed = change_types(doc, batch, type_id)
+            errors.extend(failed)
+            failed_elements = set(element for element, error in failed)
+            changed = [element for element in batch if element not in failed_elements]
+            if type_id == plan.pipe_type_id:
+                for pipe in changed:
+                    try:
+                        set_pipe_segment(pipe, plan.segment_id)
+                    except Exception as e:
+                        errors.append((pipe, e))
+                num_pipes_changed += len(changed)
+            else:
+                num_fittings_changed += len(changed)
+
+            done += len(batch)
+            if progress is not None and progress(done, total) is False:
+                return num_pipes_changed, num_fittings_changed, errors
+
+    return num_pipes_changed, num_fittings_changed, errors
+
+
+def convert(doc, elements, pipe_type, coupling):
+    """Plan and convert elements, inside an open transaction.
+
+    Returns what execute() does, with the errors met while planning first.
+    """
+    plan = plan_conversion(doc, elements, pipe_type, coupling)
+    num_pipes_changed, num_fittings_changed, errors = execute(doc, plan)
+    return num_pipes_changed, num_fittings_changed, plan.errors + errors
+
+
+def report(plan, output):
+    """Print plan to the pyRevit output window output."""
+    output.print_md("### Conversion plan: {} elements to convert".format(plan.count()))
+    if plan.pipe_count():
+        output.print_md("Pipes take the pipe segment **{}**.".format(plan.segment_name or "of their new type"))
+    if plan.targets:
+        output.print_table(
+            table_data=[[family_name, type_name, count]
+                        for (family_name, type_name), count in sorted(plan.targets.items())],
+            title="Converts to",
+            columns=["Family", "Type", "Elements"],
+        )
+    if plan.missing:
+        output.print_table(
+            table_data=[list(row) for row in plan.missing_targets()],
+            title="Pam family types to load",
+            columns=["Family", "Type", "Elements"],
+        )
+    if plan.unresolved:
+        output.print_table(
+            table_data=[[description or "(no description)", count]
+                        for description, count in sorted(plan.unresolved.items())],
+            title="No matching Pam family",
+            columns=["Description", "Elements"],
+        )
+    if plan.pipe_count() and plan.couplings_missing:
+        output.print_md("No {} coupling family is loaded for DN {}; Add Couplings will leave pipes of "
+                        "these sizes uncoupled.".format(
+                            plan.coupling, ", ".join(str(dn_size) for dn_size in plan.couplings_missing)))
+    if plan.errors:
+        output.print_md("### Elements that could not be read:")
+        for element, error in plan.errors:
+            output.print_md("- {}: {}".format(output.linkify(element.Id), error))
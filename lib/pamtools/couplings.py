@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""Placement of Pam couplings along pipes, used by the Add Couplings tool.
+
+Pipes are split every 3 m, or at the spacing set with Shift+Click, and a
+union is placed at each split. The union comes from routing preference
+rules naming the coupling family of each DN, in place while the pipes
+are split (see pamtools.routing).
+"""
+from collections import namedtuple
+
+from System.Collections.Generic import List
+
+from Autodesk.Revit.DB import (
+    BuiltInCategory,
+    BuiltInParameter,
+    ElementId,
+    FilteredElementCollector,
+    UnitTypeId,
+    UnitUtils,
+)
+from Autodesk.Revit.DB.Plumbing import PlumbingUtils
+
+from pamtools.catalogue import PRODUCT_LINES, catalogue, product_code
+from pamtools.connectors import ConnectorGrid
+from pamtools.routing import RuleSpec
+
+VERSION = 8
+
+# Distance between couplings (m) unless set otherwise
+SPACING = 3.0
+
+# Pipes no longer than the spacing plus this (m) are never split
+LENGTH_MARGIN = 0.01
+
+# Pipes this long or shorter (m) are never split at the default spacing
+MINIMUM_LENGTH = SPACING + LENGTH_MARGIN
+
+# System classification of the pipes Pam couplings go on, when whole views or models are coupled
+SANITARY = "Sanitary"
+
+# Length (m) and diameter (mm) of a pipe, read once when the pipes are classified
+PipeInfo = namedtuple('PipeInfo', 'pipe length diameter')
+
+RULE_DESCRIPTION = "Coupling Rule"
+
+
+# Function to get length of pipes in meters
+def get_pipe_length(pipe):
+    length_param = pipe.get_Parameter(BuiltInParameter.CURVE_ELEM_LENGTH)
+    if length_param:
+        length_in_feet = length_param.AsDouble()
+    else:
+        length_in_feet = pipe.Location.Curve.Length
+    return UnitUtils.ConvertFromInternalUnits(length_in_feet, UnitTypeId.Meters)
+
+
+# Function to get diameter of pipes in millimeters
+def get_pipe_diameter(pipe):
+    diameter_param = pipe.get_Parameter(BuiltInParameter.RBS_PIPE_DIAMETER_PARAM)
+    if diameter_param:
+        diameter_in_feet = diameter_param.AsDouble()
+        return UnitUtils.ConvertFromInternalUnits(diameter_in_feet, UnitTypeId.Millimeters)
+    return None
+
+
+def compute_intermediate_points(start_point, end_point, interval=SPACING, adjustment_threshold=None,
+                                adjustment_distance=0.1):
+    if adjustment_threshold is None:
+        adjustment_threshold = interval + adjustment_distance
+
+    # Calculate the total length of the pipe in feet
+    total_length_feet = start_point.DistanceTo(end_point)  # Distance in feet
+
+    # Convert total length to meters
+    total_length_meters = total_length_feet * 0.3048  # Conversion factor from feet to meters
+
+    # Normalize direction vector
+    direction_vector = (end_point - start_point).Normalize()
+
+    # Generate intermediate points every `interval` meters
+    points = []
+    current_distance = interval
+
+    while current_distance < total_length_meters:
+        point = start_point + direction_vector * (current_distance / 0.3048)  # Convert distance to feet
+        points.append(point)
+        current_distance += interval
+
+    # Check the length of the last segment
+    remaining_distance = total_length_meters - (len(points) * interval)
+
+    if interval < remaining_distance < adjustment_threshold:
+        if points:
+            # Adjust the last point by moving it closer to the start point
+            points[-1] = start_point + direction_vector * ((len(points) * interval - adjustment_distance) / 0.3048)  # Convert adjustment to feet
+
+    return points
+
+
+def allowed_diameters(coupling):
+    """Return every DN the coupling system comes in."""
+    diameters, keywords, diameters_extra, keywords_extra = PRODUCT_LINES[product_code(coupling)]
+    return diameters + diameters_extra
+
+
+def matching_families(doc, coupling):
+    """Return the (DN, symbol id) of the coupling families of doc, smallest DN first.
+
+    Read from the catalogue of doc, so the family symbols are only sorted
+    by product line and DN again after a family is loaded.
+    """
+    return catalogue(doc).families(product_code(coupling))
+
+
+def is_suitable(pipe, coupling, spacing=SPACING):
+    """Return True when pipe is long enough and of a DN the coupling system comes in."""
+    if get_pipe_length(pipe) <= spacing + LENGTH_MARGIN:
+        return False
+    pipe_diameter = get_pipe_diameter(pipe)
+    return bool(pipe_diameter) and int(pipe_diameter) in allowed_diameters(coupling)
+
+
+def collect_pipes(doc, systems=None, view=None, classification=None):
+    """Return the pipes of systems, or of view, or of the whole model, from one collector.
+
+    classification, when given, keeps only the pipes whose system
+    classification contains it, e.g. SANITARY.
+    """
+    if systems is not None:
+        network_ids = {}
+        for system in systems:
+            for element in system.PipingNetwork:
+                network_ids.setdefault(element.Id, element.Id)
+        if not network_ids:
+            return []
+        collector = FilteredElementCollector(doc, List[ElementId](network_ids.values()))
+    elif view is not None:
+        collector = FilteredElementCollector(doc, view.Id)
+    else:
+        collector = FilteredElementCollector(doc)
+    pipes = list(collector.OfCategory(BuiltInCategory.OST_PipeCurves).WhereElementIsNotElementType())
+    if classification is not None:
+        pipes = [pipe for pipe in pipes if classification in _classification(pipe)]
+    return pipes
+
+
+def _classification(pipe):
+    classification_param = pipe.get_Parameter(BuiltInParameter.RBS_SYSTEM_CLASSIFICATION_PARAM)
+    return (classification_param.AsString() if classification_param else None) or ""
+
+
+def of_types(pipes, type_ids):
+    """Return the pipes of the pipe types type_ids, so pipework of other materials is left alone."""
+    type_ids = set(type_ids)
+    return [pipe for pipe in pipes if pipe.GetTypeId() in type_ids]
+
+
+def classify_pipes(pipes, coupling, families, spacing=SPACING):
+    """Sort pipes into those to couple, those of another DN and those too short to split.
+
+    Returns three lists of PipeInfo. A pipe is coupled when it is longer
+    than spacing and of a DN the coupling system comes in and one of
+    families, the (DN, symbol id) loaded, has a coupling for.
+    """
+    diameters = set(allowed_diameters(coupling)) & set(dn_size for dn_size, symbol_id in families)
+    minimum_length = spacing + LENGTH_MARGIN
+    suitable = []
+    unsuitable = []
+    short = []
+    for pipe in pipes:
+        info = PipeInfo(pipe, get_pipe_length(pipe), get_pipe_diameter(pipe))
+        if info.length <= minimum_length:
+            short.append(info)
+        elif info.diameter and int(info.diameter) in diameters:
+            suitable.append(info)
+        else:
+            unsuitable.append(info)
+    return suitable, unsuitable, short
+
+
+def families_for(families, infos):
+    """Return the (DN, symbol id) of families the DNs of the classified pipes infos need."""
+    diameters = set(int(info.diameter) for info in infos)
+    return [(dn_size, symbol_id) for dn_size, symbol_id in families if dn_size in diameters]
+
+
+def count_couplings(pipes, spacing=SPACING):
+    """Return the number of couplings placing them on pipes will take."""
+    total = 0
+    for pipe in pipes:
+        pipe_curve = pipe.Location.Curve
+        total += len(compute_intermediate_points(pipe_curve.GetEndPoint(0), pipe_curve.GetEndPoint(1),
+                                                 interval=spacing))
+    return total
+
+
+def coupling_rules(families):
+    """Return the union rule of each (DN, symbol id) of families, smallest DN first."""
+    return [RuleSpec(symbol_id, RULE_DESCRIPTION, dn_size / 304.8, dn_size / 304.8)
+            for dn_size, symbol_id in families]
+
+
+def split_pipes(doc, pipes, spacing=SPACING, progress=None):
+    """Split pipes every spacing m and join the parts with unions, inside an open transaction.
+
+    Every cut point is worked out on the original curve first, then each
+    pipe is broken at its points from the far end backwards. The part
+    holding the start of the pipe then holds every point left to break,
+    so each coupling takes a single BreakCurve. The parts of every pipe go
+    into one ConnectorGrid, each pipe under a group of its own, and a
+    union is placed on every pair of connectors it finds. Returns the
+    unions placed and the (pipe, error) of every break or union that
+    failed.
+
+    progress(done, total), when given, is called after every pipe with
+    the number of pipes split so far; returning False stops the splitting.
+    """
+    fittings = []
+    failures = []
+    grid = ConnectorGrid()
+    joints = []  # (pipe, breaks made), in pipe order
+    # Whether BreakCurve leaves the broken element at the start of its curve, seen on the first break
+    keeps_start = None
+
+    for number, pipe in enumerate(pipes):
+        pipe_curve = pipe.Location.Curve
+        start_point = pipe_curve.GetEndPoint(0)
+        intermediate_points = compute_intermediate_points(start_point, pipe_curve.GetEndPoint(1),
+                                                          interval=spacing)
+
+        head = pipe  # The part from the start of the pipe to the next point to break
+        parts = [pipe]
+        for point in reversed(intermediate_points):
+            try:
+                split = doc.GetElement(PlumbingUtils.BreakCurve(doc, head.Id, point))
+            except Exception as error:
+                # head is unchanged and still holds the points left
+                failures.append((pipe, error))
+                continue
+            parts.append(split)
+
+            if keeps_start is None:
+                keeps_start = head.Location.Curve.GetEndPoint(0).DistanceTo(start_point) < 0.01
+            if not keeps_start:
+                head = split
+
+        if len(parts) > 1:
+            pipe_id = pipe.Id
+            for part in parts:
+                part_id = part.Id
+                for connector in part.ConnectorManager.Connectors:
+                    grid.add(connector, part_id, pipe_id)
+            joints.append((pipe, len(parts) - 1))
+
+        if progress is not None and progress(number + 1, len(pipes)) is False:
+            break
+
+    # The connectors each break left at the same place
+    pairs = grid.pairs_by_group()
+    for pipe, breaks in joints:
+        pipe_pairs = pairs.get(pipe.Id, [])
+        if len(pipe_pairs) < breaks:
+            failures.append((pipe, "{} of {} breaks have no connectors that meet".format(
+                breaks - len(pipe_pairs), breaks)))
+        for connector, other in pipe_pairs:
+            try:
+                fittings.append(doc.Create.NewUnionFitting(connector, other))
+            except Exception as error:
+                failures.append((pipe, error))
+
+    return fittings, failures
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Family symbols and pipe types of a document, scanned once per session.
+
+Reading the names and descriptions of every family symbol is the slowest
+part of starting Content Converter or Add Couplings in a large project.
+The scans are memoised per document and redone only after a family or
+pipe type is loaded, edited or deleted.
+"""
+from collections import namedtuple
+
+from Autodesk.Revit.DB import (
+    BuiltInParameter,
+    FamilySymbol,
+    FilteredElementCollector,
+)
+from Autodesk.Revit.DB.Plumbing import PipeType
+
+from pamtools.session import DocumentMemo
+
+VERSION = 2
+
+# What the tools need to know about a family symbol, read once per scan
+SymbolInfo = namedtuple('SymbolInfo', 'id family_name type_name description category_name')
+
+
+def _parameter_string(element, built_in_parameter):
+    parameter = element.get_Parameter(built_in_parameter)
+    return (parameter.AsString() if parameter else None) or ""
+
+
+def _scan_family_symbols(doc):
+    symbols = []
+    for symbol in FilteredElementCollector(doc).OfClass(FamilySymbol):
+        category = symbol.Category
+        symbols.append(SymbolInfo(
+            symbol.Id,
+            symbol.FamilyName,
+            _parameter_string(symbol, BuiltInParameter.SYMBOL_NAME_PARAM),
+            _parameter_string(symbol, BuiltInParameter.ALL_MODEL_DESCRIPTION),
+            category.Name if category is not None else None,
+        ))
+    return symbols
+
+
+def _scan_pipe_types(doc):
+    return dict((_parameter_string(pipe_type, BuiltInParameter.SYMBOL_NAME_PARAM), pipe_type.Id)
+                for pipe_type in FilteredElementCollector(doc).OfClass(PipeType))
+
+
+class SymbolIndex(object):
+    """Ids of the family symbols of a document by (family name, type name)."""
+
+    def __init__(self, symbols):
+        self._ids = {}
+        for symbol in symbols:
+            self._ids.setdefault((symbol.family_name, symbol.type_name), symbol.id)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def get(self, family_name, type_name):
+        """Return the id of type_name of family_name, or None when it is not loaded."""
+        return self._ids.get((family_name, type_name))
+
+    def values(self):
+        return self._ids.values()
+
+
+def _symbol_ids(symbols):
+    return [symbol.id for symbol in symbols]
+
+
+_family_symbols = DocumentMemo(_scan_family_symbols, FamilySymbol, _symbol_ids)
+_symbol_index = DocumentMemo(lambda doc: SymbolIndex(_family_symbols.get(doc)), FamilySymbol,
+                             lambda index: index.values())
+_pipe_types = DocumentMemo(_scan_pipe_types, PipeType, lambda pipe_types: pipe_types.values())
+
+
+def family_symbols(doc, category_name=None):
+    """Return the SymbolInfo of every family symbol of doc, or of one category."""
+    symbols = _family_symbols.get(doc)
+    if category_name is None:
+        return symbols
+    return [symbol for symbol in symbols if symbol.category_name == category_name]
+
+
+def symbol_index(doc):
+    """Return the SymbolIndex of doc, built on first use from the family symbol scan."""
+    return _symbol_index.get(doc)
+
+
+def pipe_types(doc):
+    """Return the ids of the pipe types of doc, by type name."""
+    return _pipe_types.get(doc)
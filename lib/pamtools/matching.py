@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Keyword matching that reads a text once, whatever the number of keywords.
+
+KeywordMatcher is an Aho-Corasick automaton: the keywords are compiled
+into a trie whose nodes link to the longest suffix that is also in the
+trie, so scanning a text finds every keyword it contains in one pass.
+"""
+
+
+class KeywordMatcher(object):
+    """Finds which of a fixed list of keywords occur in a text."""
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self._next = [{}]  # node -> {character: node}
+        self._fail = [0]  # node -> node of the longest proper suffix
+        self._found = [[]]  # node -> indexes of the keywords ending there
+        for index, keyword in enumerate(self.keywords):
+            self._add(index, keyword)
+        self._link()
+
+    def _add(self, index, keyword):
+        node = 0
+        for character in keyword:
+            child = self._next[node].get(character)
+            if child is None:
+                child = len(self._next)
+                self._next[node][character] = child
+                self._next.append({})
+                self._fail.append(0)
+                self._found.append([])
+            node = child
+        self._found[node].append(index)
+
+    def _link(self):
+        # Breadth first, so the suffix node of every parent is linked before its children
+        queue = list(self._next[0].values())
+        position = 0
+        while position < len(queue):
+            node = queue[position]
+            position += 1
+            for character, child in self._next[node].items():
+                queue.append(child)
+                suffix = self._fail[node]
+                while suffix and character not in self._next[suffix]:
+                    suffix = self._fail[suffix]
+                target = self._next[suffix].get(character, 0)
+                self._fail[child] = target if target != child else 0
+                self._found[child].extend(self._found[self._fail[child]])
+
+    def find(self, text):
+        """Return the indexes of the keywords found in text, each once, in keyword order."""
+        found = set()
+        node = 0
+        for character in text:
+            while node and character not in self._next[node]:
+                node = self._fail[node]
+            node = self._next[node].get(character, 0)
+            if self._found[node]:
+                found.update(self._found[node])
+        return sorted(found)
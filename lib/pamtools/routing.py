@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Routing preference rules put in place for the length of a with block.
+
+Add Couplings and Place Calculation Connections make Revit place their
+own union families by putting rules first in the Unions group of the
+routing preferences of the types they work on. A RuleSession adds the
+rules once, in one transaction, and on exit puts back the exact rule
+list each type had, even when the block raises, so union rules the user
+already had are never lost or reordered.
+"""
+from collections import namedtuple
+
+import System
+
+from Autodesk.Revit.DB import (
+    PrimarySizeCriterion,
+    RoutingPreferenceRule,
+    RoutingPreferenceRuleGroupType,
+    Transaction,
+)
+
+VERSION = 2
+
+# Rule for the family symbol symbol_id on sizes from minimum to maximum (feet)
+RuleSpec = namedtuple('RuleSpec', 'symbol_id description minimum maximum')
+
+
+def element_types(doc, elements):
+    """Return the types of elements, once each, in the order first met."""
+    types = {}
+    order = []
+    for element in elements:
+        type_id = element.GetTypeId()
+        if type_id not in types:
+            types[type_id] = doc.GetElement(type_id)
+            order.append(type_id)
+    return [types[type_id] for type_id in order]
+
+
+# Sizes (feet) closer than this are the same rule criterion
+SIZE_TOLERANCE = 1e-9
+
+
+def _sizes(rule):
+    """Return the (minimum, maximum) of each size criterion of rule, None for other criteria."""
+    sizes = []
+    for index in range(rule.NumberOfCriteria):
+        criterion = rule.GetCriterion(index)
+        sizes.append((getattr(criterion, 'MinimumSize', None), getattr(criterion, 'MaximumSize', None)))
+    return sizes
+
+
+def _same_sizes(sizes, other_sizes):
+    if len(sizes) != len(other_sizes):
+        return False
+    for size, other in zip(sizes, other_sizes):
+        for value, other_value in zip(size, other):
+            if value is None or other_value is None:
+                if value is not other_value:
+                    return False
+            elif abs(value - other_value) > SIZE_TOLERANCE:
+                return False
+    return True
+
+
+def _same_rules(rules, other_rules):
+    if len(rules) != len(other_rules):
+        return False
+    return all(rule.MEPPartId == other.MEPPartId and rule.Description == other.Description and
+               _same_sizes(_sizes(rule), _sizes(other))
+               for rule, other in zip(rules, other_rules))
+
+
+def _is_spec(rule, spec):
+    """Return True when rule is the one RuleSession adds for spec."""
+    return (rule.MEPPartId == spec.symbol_id and rule.Description == spec.description and
+            _same_sizes(_sizes(rule), [(spec.minimum, spec.maximum)]))
+
+
+class RuleSession(object):
+    """Rules added first to a group of the routing preferences of types, while in use.
+
+    Used as a context manager. Rules are added on entry and the previous
+    rules restored on exit, each in a transaction of its own, or in the
+    transaction already open. The RoutingPreferenceManager of each type
+    is read once and kept for the session.
+    """
+
+    def __init__(self, doc, types, rules, name="Routing Preferences",
+                 group_type=RoutingPreferenceRuleGroupType.Unions):
+        self.doc = doc
+        self.types = list(types)
+        self.rules = list(rules)
+        self.name = name
+        self.group_type = group_type
+        self._managers = {}  # type id -> RoutingPreferenceManager
+        self._previous = {}  # type id -> rules of the group before the session
+
+    def manager(self, element_type):
+        """Return the RoutingPreferenceManager of element_type, read once per session."""
+        type_id = element_type.Id
+        manager = self._managers.get(type_id)
+        if manager is None:
+            manager = self._managers[type_id] = element_type.RoutingPreferenceManager
+        return manager
+
+    def _rules_of(self, manager):
+        return [manager.GetRule(self.group_type, index)
+                for index in range(manager.GetNumberOfRules(self.group_type))]
+
+    def _new_rule(self, spec):
+        rule = RoutingPreferenceRule(spec.symbol_id, spec.description)
+        rule.AddCriterion(PrimarySizeCriterion(System.Double(spec.minimum), System.Double(spec.maximum)))
+        return rule
+
+    def _add(self):
+        for element_type in self.types:
+            manager = self.manager(element_type)
+            self._previous[element_type.Id] = self._rules_of(manager)
+            for index, spec in enumerate(self.rules):
+                manager.AddRule(self.group_type, self._new_rule(spec), index)
+
+    def _changed(self):
+        """Return the (type id, rules before, rules now) of the types whose rules differ from before."""
+        changed = []
+        for type_id, previous in self._previous.items():
+            current = self._rules_of(self._managers[type_id])
+            # Rules already undone, e.g. by rolling back the transaction that added them, are left alone
+            if not _same_rules(current, previous):
+                changed.append((type_id, previous, current))
+        return changed
+
+    def _restore(self, changed):
+        added = len(self.rules)
+        for type_id, previous, current in changed:
+            manager = self._managers[type_id]
+            if (len(current) == added + len(previous) and _same_rules(current[added:], previous) and
+                    all(_is_spec(rule, spec) for rule, spec in zip(current, self.rules))):
+                # Only the session's rules are new, and still first: take them off the front
+                for _ in range(added):
+                    manager.RemoveRule(self.group_type, 0)
+                continue
+            # Otherwise, e.g. when the rules were changed during the session, put back the whole list as it was
+            for index in range(len(current) - 1, -1, -1):
+                manager.RemoveRule(self.group_type, index)
+            for index, rule in enumerate(previous):
+                manager.AddRule(self.group_type, rule, index)
+
+    def _changing(self, transaction_name, change):
+        if self.doc.IsModifiable:
+            change()
+            return
+        with Transaction(self.doc, transaction_name) as t:
+            t.Start()
+            try:
+                change()
+                t.Commit()
+            except Exception:
+                t.RollBack()
+                raise
+
+    def __enter__(self):
+        if self.rules:
+            self._changing("Add {}".format(self.name), self._add)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        changed = self._changed()
+        self._previous = {}
+        if changed:
+            self._changing("Restore {}".format(self.name), lambda: self._restore(changed))
+        return False
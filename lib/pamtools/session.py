@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Values worked out once per document and kept for the Revit session.
+
+A DocumentMemo builds its value the first time a tool asks for it in a
+document, e.g. a scan of every family symbol, and hands the same value to
+later runs. DocumentChanged, subscribed to on first use, drops the value
+when elements of the class it was built from are added or modified, or
+when one of its elements is deleted.
+
+The handler lives as long as the engine of the script that subscribed it,
+so every tool using a DocumentMemo runs with __persistentengine__ set.
+"""
+from Autodesk.Revit.DB import ElementClassFilter
+
+VERSION = 1
+
+# Every memo, so one DocumentChanged handler can invalidate them all
+_memos = []
+
+# Applications whose DocumentChanged event already invalidates memos
+_tracked_applications = []
+
+
+def document_key(doc):
+    """Return a key identifying doc for the rest of the session."""
+    return (doc.Title, doc.PathName)
+
+
+class DocumentMemo(object):
+    """One value per document, built by build(doc) on first use.
+
+    element_class is the class of the elements the value is read from.
+    element_ids(value), when given, returns the ids the value holds, so
+    deleting other elements keeps it; otherwise any deletion drops it.
+    """
+
+    def __init__(self, build, element_class, element_ids=None):
+        self._build = build
+        self._filter = ElementClassFilter(element_class)
+        self._element_ids = element_ids
+        self._values = {}  # document key -> (value, set of element ids or None)
+        _memos.append(self)
+
+    def get(self, doc):
+        """Return the value for doc, building it if needed."""
+        key = document_key(doc)
+        cached = self._values.get(key)
+        if cached is None:
+            track_document_changes(doc.Application)
+            value = self._build(doc)
+            ids = None
+            if self._element_ids is not None:
+                ids = set(self._element_ids(value))
+            cached = self._values[key] = (value, ids)
+        return cached[0]
+
+    def invalidate(self, key, args):
+        """Drop the value of document key if the change in args affects it."""
+        cached = self._values.get(key)
+        if cached is None:
+            return
+        stale = bool(args.GetAddedElementIds(self._filter)) or bool(args.GetModifiedElementIds(self._filter))
+        if not stale:
+            deleted = args.GetDeletedElementIds()
+            if cached[1] is None:
+                stale = bool(deleted)
+            else:
+                stale = not cached[1].isdisjoint(deleted)
+        if stale:
+            del self._values[key]
+
+    def clear(self):
+        """Forget the values of every document."""
+        self._values.clear()
+
+
+def _on_document_changed(sender, args):
+    """Drop the memoised values the change affects."""
+    key = document_key(args.GetDocument())
+    for memo in _memos:
+        memo.invalidate(key, args)
+
+
+def track_document_changes(application):
+    """Invalidate memos on DocumentChanged (subscribes only once)."""
+    if application in _tracked_applications:
+        return
+    application.DocumentChanged += _on_document_changed
+    _tracked_applications.append(application)
+
+
+def unload():
+    """Unsubscribe from DocumentChanged and forget every memo, before a reload."""
+    for application in _tracked_applications:
+        application.DocumentChanged -= _on_document_changed
+    del _tracked_applications[:]
+    for memo in _memos:
+        memo.clear()
+    del _memos[:]
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""Window helpers and image assets shared by the Pam Building Design+ tools.
+
+pamui.images loads the PNG images of the windows and pamui.windows builds
+the windows themselves from XAML templates cached for the session.
+"""
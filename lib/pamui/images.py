@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""PNG images shown in the tool windows.
+
+The images are files in the images folder of this package. Each one is
+decoded into a frozen WPF BitmapImage the first time a window asks for it
+and kept for the rest of the Revit session, so scripts no longer carry
+their images as Base64 text that IronPython has to compile on every click.
+"""
+import os
+
+from System import Uri, UriKind
+from System.Windows.Media.Imaging import BitmapCacheOption, BitmapImage
+
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+
+# Bitmaps decoded during this Revit session, keyed by image name
+_bitmaps = {}
+
+
+def image_path(name):
+    """Return the path of the image called name, such as 'logo'."""
+    return os.path.join(IMAGES_DIR, name + ".png")
+
+
+def bitmap(name):
+    """Return the BitmapImage of the image called name.
+
+    Returns None if there is no such image, so the window still loads
+    (with a blank image slot).
+    """
+    image = _bitmaps.get(name)
+    if image is not None:
+        return image
+
+    path = image_path(name)
+    if not os.path.isfile(path):
+        return None
+
+    image = BitmapImage()
+    image.BeginInit()
+    image.CacheOption = BitmapCacheOption.OnLoad  # read the file now and release it
+    image.UriSource = Uri(path, UriKind.Absolute)
+    image.EndInit()
+    image.Freeze()  # makes the bitmap immutable/thread-safe
+    _bitmaps[name] = image
+    return image
+
+
+def set_images(window, bindings):
+    """Show images in the Image controls of window.
+
+    bindings maps control names to image names, e.g. {'logo': 'logo'}.
+    """
+    for control_name, image_name in bindings.items():
+        image = bitmap(image_name)
+        if image is None:
+            continue
+        control = window.FindName(control_name)
+        if control:
+            control.Source = image
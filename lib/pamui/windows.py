@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""Tool windows built from XAML templates cached for the Revit session.
+
+Each XAML file is parsed once into a XAML node list. Every window opened
+afterwards replays that list, so opening a tool a second time skips
+reading, parsing and resolving the XAML.
+
+PamWindow also wires the parts every Pam window shares: ownership by the
+Revit main window, the logo and its link, title-bar dragging and the
+close and minimise buttons.
+"""
+import os
+import webbrowser
+
+import clr
+clr.AddReference('PresentationFramework')
+clr.AddReference('PresentationCore')
+clr.AddReference('WindowsBase')
+clr.AddReference('System.Xaml')
+
+from System.Windows import NameScope, Window, WindowState
+from System.Windows.Input import MouseButtonState
+from System.Windows.Interop import WindowInteropHelper
+from System.Windows.Markup import XamlReader
+from System.Windows.Threading import Dispatcher, DispatcherFrame
+from System.Xaml import (
+    XamlNodeList,
+    XamlObjectWriter,
+    XamlObjectWriterSettings,
+    XamlServices,
+    XamlXmlReader,
+)
+
+from pyrevit import revit
+
+from pamui.images import set_images
+
+WEBSITE = "https://www.pambuilding.co.uk/"
+
+# Images shown by a window unless it asks for others
+DEFAULT_IMAGES = {'logo': 'logo'}
+
+# Parsed XAML templates, keyed by path, with the modification time they were read at
+_templates = {}
+
+
+def xaml_template(xaml_path):
+    """Return the XamlNodeList of xaml_path, parsing the file only once per session.
+
+    The file is parsed again if it has changed since it was cached.
+    """
+    modified = os.path.getmtime(xaml_path)
+    cached = _templates.get(xaml_path)
+    if cached is not None and cached[0] == modified:
+        return cached[1]
+
+    reader = XamlXmlReader(xaml_path, XamlReader.GetWpfSchemaContext())
+    try:
+        nodes = XamlNodeList(reader.SchemaContext)
+        XamlServices.Transform(reader, nodes.Writer)
+    finally:
+        reader.Close()
+    _templates[xaml_path] = (modified, nodes)
+    return nodes
+
+
+def clear_templates():
+    """Forget every cached template."""
+    _templates.clear()
+
+
+class PamWindow(Window):
+    """Window built from a cached XAML template with the standard Pam title bar.
+
+    Named elements can be read as attributes, as with pyRevit's WPFWindow,
+    e.g. window.EC002.IsChecked.
+    """
+
+    def __init__(self, xaml_path, images=None):
+        self._load(xaml_path)
+        WindowInteropHelper(self).Owner = revit.HOST_APP.uiapp.MainWindowHandle
+        set_images(self, DEFAULT_IMAGES if images is None else images)
+        self._bind_title_bar()
+
+    def __getattr__(self, name):
+        element = self.FindName(name)
+        if element is None:
+            raise AttributeError(name)
+        return element
+
+    def _load(self, xaml_path):
+        nodes = xaml_template(xaml_path)
+        settings = XamlObjectWriterSettings()
+        settings.RootObjectInstance = self
+        writer = XamlObjectWriter(XamlReader.GetWpfSchemaContext(), settings)
+        XamlServices.Transform(nodes.GetReader(), writer)
+        if NameScope.GetNameScope(self) is None:
+            NameScope.SetNameScope(self, writer.RootNameScope)
+
+    def _bind_title_bar(self):
+        close_button = self.FindName('button_close')
+        if close_button:
+            close_button.Click += self.close_click
+
+        minimize_button = self.FindName('button_minimize')
+        if minimize_button:
+            minimize_button.Click += self.minimize_click
+
+        logo = self.FindName('logo')
+        if logo:
+            logo.MouseLeftButtonDown += self.logo_click
+
+        title_bar = self.FindName('TitleBar')
+        if title_bar:
+            title_bar.MouseLeftButtonDown += self.header_drag
+
+    def close_click(self, sender, args):
+        """Close the window."""
+        self.Close()
+
+    def minimize_click(self, sender, args):
+        """Minimise the window."""
+        self.WindowState = WindowState.Minimized
+
+    def logo_click(self, sender, args):
+        """Open the Pam website."""
+        webbrowser.open(WEBSITE)
+
+    def header_drag(self, sender, args):
+        """Drag the window by its title bar."""
+        if args.LeftButton == MouseButtonState.Pressed:
+            self.DragMove()
+
+    def show_modal(self):
+        """Show the window and block until it is closed.
+
+        The window is shown with Show() rather than ShowDialog(), so its
+        owner (Revit) can still be minimised while it is open.
+        """
+        frame = DispatcherFrame()
+
+        def on_closed(sender, args):
+            frame.Continue = False
+
+        self.Closed += on_closed
+        self.Show()
+        Dispatcher.PushFrame(frame)  # blocks here until the window closes
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""Run the tests against the fake Revit API in fakerevit.
+
+Run from the extension root with ``python -m pytest tests``.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(ROOT, "benchmarks"), os.path.join(ROOT, "lib"), ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import fakerevit  # noqa: E402
+
+fakerevit.install()
+
+import pytest  # noqa: E402
+
+from fakerevit.db import Document  # noqa: E402
+
+
+@pytest.fixture
+def doc(request):
+    """Return an empty fake document titled after the test, so caches kept per document never mix tests."""
+    return Document(title=request.node.nodeid)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Small drainage systems for the tests, modelled in fake documents."""
+from fakerevit import model
+
+from en12056.parameters import PARAMETER_NAMES, PRIMARY_VENTILATED, SECONDARY_VENTILATED
+
+
+def system(doc, pieces, links):
+    """Add pieces, {name: (kind, diameter)}, connect the (upstream, downstream) links and return the system."""
+    elements = {}
+    for number, (name, (kind, diameter)) in enumerate(sorted(pieces.items())):
+        origin = (number, 0, 0)
+        if kind == "pipe":
+            elements[name] = model.add_pipe(doc, origin, (number, 0, -1), diameter, discharge_units=1.0)
+        elif kind == "fitting":
+            elements[name] = model.add_fitting(doc, origin, 2, diameter)
+        else:
+            elements[name] = model.add_fixture(doc, origin, diameter)
+    for upstream, downstream in links:
+        model.connect(elements[upstream], elements[downstream])
+    pipes = [elements[name] for name, (kind, diameter) in pieces.items() if kind == "pipe"]
+    model.add_shared_parameters(doc, PARAMETER_NAMES, pipes, yes_no=(PRIMARY_VENTILATED, SECONDARY_VENTILATED))
+    return model.add_piping_system(doc, "SAN 1", list(elements.values())), elements
+
+
+# WC and basin branches into a stack: wc -> p_wc -> tee -> p_stack -> p_out, basin -> p_basin -> tee
+STACK = (
+    {
+        "wc": ("fixture", 0.33), "p_wc": ("pipe", 0.33),
+        "basin": ("fixture", 0.13), "p_basin": ("pipe", 0.13),
+        "tee": ("fitting", 0.33), "p_stack": ("pipe", 0.33), "p_out": ("pipe", 0.33),
+    },
+    [("wc", "p_wc"), ("p_wc", "tee"), ("basin", "p_basin"), ("p_basin", "tee"),
+     ("tee", "p_stack"), ("p_stack", "p_out")],
+)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Profiling the API calls of a pushbutton run and of the library modules it uses."""
+import json
+
+import pytest
+
+from Autodesk.Revit.DB import FilteredElementCollector, Transaction
+
+import apiprofiler
+from en12056 import parameters
+from fakerevit import model
+from pamtools import families
+
+
+@pytest.fixture
+def profiling(monkeypatch, tmpdir):
+    """Turn profiling on, writing profiles to a temporary folder."""
+    monkeypatch.setenv(apiprofiler.ENVIRONMENT_FLAG, "1")
+    monkeypatch.setenv(apiprofiler.ENVIRONMENT_FOLDER, str(tmpdir))
+    yield
+    apiprofiler.finish()
+
+
+def test_nothing_is_profiled_when_off(monkeypatch):
+    monkeypatch.delenv(apiprofiler.ENVIRONMENT_FLAG, raising=False)
+    namespace = {'Transaction': Transaction}
+    assert apiprofiler.start(namespace) is None
+    assert namespace['Transaction'] is Transaction
+    assert apiprofiler.finish() is None
+
+
+def test_script_and_library_modules_are_instrumented_until_finish(profiling, capsys):
+    namespace = {'__title__': "Test Tool", 'Transaction': Transaction}
+    profiler = apiprofiler.start(namespace)
+    assert namespace['Transaction'] is not Transaction
+    assert parameters.FilteredElementCollector is not FilteredElementCollector
+    assert families.FilteredElementCollector is not FilteredElementCollector
+    apiprofiler.finish()
+    assert namespace['Transaction'] is Transaction
+    assert parameters.FilteredElementCollector is FilteredElementCollector
+    assert families.FilteredElementCollector is FilteredElementCollector
+    assert profiler.title == "Test Tool"
+
+
+def test_engine_calls_are_counted_with_their_call_site(profiling, doc, capsys):
+    model.add_shared_parameters(doc, [parameters.DISCHARGE_UNITS])
+    apiprofiler.start({'__title__': "Test Tool"})
+    parameters.resolve_guids(doc, [parameters.DISCHARGE_UNITS])
+    path = apiprofiler.finish()
+    with open(path) as profile_file:
+        calls = dict((call['name'], call) for call in json.load(profile_file)['calls'])
+    collector = calls['FilteredElementCollector.OfClass']
+    assert collector['count'] == 1
+    assert collector['sites'][0]['function'] == 'resolve_guids'
+    assert "Test Tool" in capsys.readouterr().out
+
+
+def test_api_member_of_a_source_line():
+    assert apiprofiler.api_member("value = pipe.LookupParameter(name).AsDouble()") == "AsDouble"
+    assert apiprofiler.api_member("x = connector.Origin") == "Origin"
+    assert apiprofiler.api_member("pass") is None
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""Synthetic networks of the benchmarks and headless runs of the tools on them."""
+import pytest
+
+import networks
+import run
+import tools
+
+
+@pytest.mark.parametrize("kind", networks.KINDS)
+def test_networks_have_about_the_segments_asked_for(kind):
+    network = networks.generate(kind, 300)
+    assert 200 < network.segments <= 300
+    assert networks.generate(kind, 300).elements == network.elements
+
+
+def test_discharge_units_add_up_to_the_outlet():
+    network = networks.generate('manifolds', 50)
+    fixtures = sum(data[2] for kind, data in network.elements if kind == networks.FIXTURE)
+    totals = network.discharge_units()
+    upstream = set(link[0] for link in network.links)
+    outlets = [index for index in range(len(network)) if index not in upstream]
+    assert len(outlets) == 1
+    assert totals[outlets[0]] == pytest.approx(fixtures)
+
+
+@pytest.mark.parametrize("tool_class", tools.TOOLS, ids=[tool.name for tool in tools.TOOLS])
+@pytest.mark.parametrize("kind", networks.KINDS)
+def test_tools_run_on_every_kind_of_network(kind, tool_class):
+    figures = run.measure(tool_class, networks.generate(kind, 250), memory=False)
+    assert figures['api_calls'] > 0
+    assert figures.get('failures', 0) == 0
+
+
+def test_removing_connections_deletes_every_connection_placed():
+    network = networks.generate('stacks', 250)
+    place = tools.PlaceCalculationConnections()
+    place.setup(network)
+    placed = place.run()['connections']
+    assert placed > 0
+    remove = tools.RemoveCalculationConnections()
+    remove.setup(network)
+    assert remove.run()['connections'] == placed
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Calculating and writing one piping system of a fake document."""
+import pytest
+
+from Autodesk.Revit.DB import Transaction
+
+from en12056 import CONTINUOUS, PUMPED, Injection
+from en12056.builder import document_key, results as calculation_results
+from en12056.calculation import SystemCalculation
+from en12056.parameters import PRIMARY_VENTILATED
+
+from drainage import STACK, system
+
+
+def flows(calculation, elements):
+    """Return {name: (Qc, Qp)} of the pipes of the last run."""
+    names = dict((element.Id, name) for name, element in elements.items())
+    return dict((names[row[0]], (row[3], row[4])) for row in calculation.results)
+
+
+# A small WC branch and a larger one join at a tee, then the stack widens past twice the small size:
+# small -> p_small -> p_small2 -> tee -> p_joined -> p_wide -> p_out, large -> p_large -> tee
+JOIN_ABOVE_SIZE_JUMP = (
+    {
+        "small": ("fixture", 0.1), "p_small": ("pipe", 0.1), "p_small2": ("pipe", 0.1),
+        "large": ("fixture", 0.2), "p_large": ("pipe", 0.2),
+        "tee": ("fitting", 0.15), "p_joined": ("pipe", 0.15),
+        "p_wide": ("pipe", 0.33), "p_out": ("pipe", 0.33),
+    },
+    [("small", "p_small"), ("p_small", "p_small2"), ("p_small2", "tee"), ("large", "p_large"), ("p_large", "tee"),
+     ("tee", "p_joined"), ("p_joined", "p_wide"), ("p_wide", "p_out")],
+)
+
+
+@pytest.mark.parametrize("order", [(0, 1), (1, 0)], ids=["small first", "large first"])
+def test_joined_walks_keep_their_own_size_ends(doc, order):
+    piping_system, elements = system(doc, *JOIN_ABOVE_SIZE_JUMP)
+    discharges = [Injection(elements["small"].Id, CONTINUOUS, 0.1), Injection(elements["large"].Id, PUMPED, 0.4)]
+    calculation = SystemCalculation(doc, piping_system, 0.7, PRIMARY_VENTILATED, size_factor=2.0)
+    calculation.run([discharges[index] for index in order], "Calculate", flow_factor=1.0)
+    result = flows(calculation, elements)
+    # The small discharge stops where the stack grows past twice its size, the large one runs on
+    assert result["p_small"] == pytest.approx((0.1, 0.0))
+    assert result["p_large"] == pytest.approx((0.0, 0.4))
+    assert result["p_joined"] == pytest.approx((0.1, 0.4))
+    assert result["p_wide"] == pytest.approx((0.0, 0.4))
+    assert result["p_out"] == pytest.approx((0.0, 0.4))
+
+
+@pytest.mark.parametrize("order", [(0, 1), (1, 0)], ids=["small first", "large first"])
+def test_joined_walks_keep_their_own_maximum_length(doc, order):
+    piping_system, elements = system(doc, *JOIN_ABOVE_SIZE_JUMP)
+    discharges = [Injection(elements["small"].Id, CONTINUOUS, 0.1), Injection(elements["large"].Id, PUMPED, 0.4)]
+    calculation = SystemCalculation(doc, piping_system, 0.7, PRIMARY_VENTILATED, max_path_length=6)
+    calculation.run([discharges[index] for index in order], "Calculate", flow_factor=1.0)
+    result = flows(calculation, elements)
+    # Each walk counts its six elements from its own start: the small one ends a pipe earlier
+    assert result["p_wide"] == pytest.approx((0.1, 0.4))
+    assert result["p_out"] == pytest.approx((0.0, 0.4))
+    assert len(calculation.incomplete_walks) == 2
+
+
+def test_rerun_of_an_unchanged_system_writes_nothing(doc):
+    piping_system, elements = system(doc, *STACK)
+    discharges = [Injection(elements["wc"].Id, CONTINUOUS, 0.1)]
+    first = SystemCalculation(doc, piping_system, 0.7, PRIMARY_VENTILATED)
+    assert first.run(discharges, "Calculate", flow_factor=1.0) > 0
+    again = SystemCalculation(doc, piping_system, 0.7, PRIMARY_VENTILATED)
+    assert again.run(discharges, "Calculate", flow_factor=1.0) == 0
+    assert flows(again, elements) == flows(first, elements)
+
+
+def test_results_are_only_kept_once_committed(doc, monkeypatch):
+    piping_system, elements = system(doc, *STACK)
+    calculation = SystemCalculation(doc, piping_system, 0.7, PRIMARY_VENTILATED)
+
+    # Failure handling may roll the transaction back instead of committing it
+    monkeypatch.setattr(Transaction, "Commit", Transaction.RollBack)
+    assert calculation.run([], "Calculate", flow_factor=1.0) == 0
+    assert calculation_results.get(document_key(doc), piping_system.Id) is None
+    monkeypatch.undo()
+    assert calculation.run([], "Calculate", flow_factor=1.0) > 0
+    assert calculation_results.get(document_key(doc), piping_system.Id) is not None
+
+
+def test_results_are_not_kept_when_writing_fails(doc, monkeypatch):
+    piping_system, elements = system(doc, *STACK)
+    calculation = SystemCalculation(doc, piping_system, 0.7, PRIMARY_VENTILATED)
+
+    def fail(transaction):
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(Transaction, "Commit", fail)
+    with pytest.raises(RuntimeError):
+        calculation.run([], "Calculate", flow_factor=1.0)
+    assert calculation_results.get(document_key(doc), piping_system.Id) is None
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Pam coupling and connector families sorted by product line and DN, once per document."""
+from Autodesk.Revit.DB import Transaction
+
+from fakerevit import model
+
+from pamtools.catalogue import CONNECTOR, Catalogue, catalogue
+from pamtools.session import track_document_changes
+
+NG = "PBUK_ES_RAPID S NG Coupling"
+
+
+def test_catalogue_sorts_families_by_product_line_and_dn(doc):
+    ng_100 = model.add_family_symbol(doc, NG, "DN100x100", description="Pam NG Coupling")
+    ng_50 = model.add_family_symbol(doc, NG, "DN50x50", description="Pam NG Coupling")
+    model.add_family_symbol(doc, NG, "DN100x110", description="Pam NG Coupling")
+    slim = model.add_family_symbol(doc, "PBUK_ES_Flex Slim Coupling", "DN100x100",
+                                   description="Pam Flex Slim Coupling")
+    connector = model.add_family_symbol(doc, "PBUK_ES_Connector", "Standard",
+                                        description="EN 12056 Calculation Connector")
+    pam = catalogue(doc)
+    assert pam.families("EC002NG") == [(50, ng_50.Id), (100, ng_100.Id)]
+    assert pam.get("EC002HP", 100) == [slim.Id]
+    assert pam.symbol_ids(CONNECTOR) == [connector.Id]
+    assert 70 in pam.missing_diameters("EC002NG")
+    assert catalogue(doc) is pam
+
+
+def test_catalogue_is_rebuilt_after_a_family_is_loaded(doc):
+    track_document_changes(doc.Application)
+    model.add_family_symbol(doc, NG, "DN100x100", description="Pam NG Coupling")
+    assert [dn_size for dn_size, symbol_id in catalogue(doc).families("EC002NG")] == [100]
+    with Transaction(doc, "Load Family") as t:
+        t.Start()
+        model.add_family_symbol(doc, NG, "DN150x150", description="Pam NG Coupling")
+        t.Commit()
+    assert [dn_size for dn_size, symbol_id in catalogue(doc).families("EC002NG")] == [100, 150]
+
+
+def test_empty_catalogue():
+    assert len(Catalogue([])) == 0
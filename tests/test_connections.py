@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Planning where calculation connections go, on plain points."""
+import pytest
+
+from en12056.connections import group_pairs, most_distant_pair, plan_splits, split_points
+
+
+def test_split_points_run_from_start_to_end():
+    assert split_points((0.0, 0.0, 10.0), (2.0, 0.0, 0.0), [2.5, 7.5]) == [(0.5, 0.0, 7.5), (1.5, 0.0, 2.5)]
+
+
+def test_split_points_leave_out_the_ends_and_levels_outside():
+    assert split_points((0.0, 0.0, 0.0), (0.0, 0.0, 10.0), [0.0, 10.0, 12.0, -1.0]) == []
+
+
+def test_horizontal_pipes_are_not_split():
+    assert plan_splits([((0.0, 0.0, 3.0), (5.0, 0.0, 3.0)), ((0.0, 0.0, 0.0), (0.0, 0.0, 4.0))], [3.0]) == \
+        [[], [(0.0, 0.0, 3.0)]]
+
+
+def test_pairs_sharing_an_element_are_grouped_in_order():
+    assert group_pairs([("a", "b"), ("c", "d"), ("b", "e"), ("d", "c"), ("f", "a")]) == \
+        [{"a", "b", "e", "f"}, {"c", "d"}]
+
+
+def test_most_distant_pair():
+    points = [(0.0, 0.0, 0.0), (5.0, 0.0, 0.0), (-1.0, 0.0, 0.0), (2.0, 1.0, 0.0)]
+    assert most_distant_pair(points) == (1, 2)
+
+
+@pytest.mark.parametrize("points", [[], [(1.0, 2.0, 3.0)]])
+def test_no_pair_of_fewer_than_two_points(points):
+    assert most_distant_pair(points) is None
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Pairing connectors by position through the tolerance grid."""
+from fakerevit import model
+
+from pamtools.connectors import ConnectorGrid, connector_pair
+
+
+def connectors(element):
+    return list(element.ConnectorManager.Connectors)
+
+
+def test_grid_pairs_connectors_of_different_elements(doc):
+    a = model.add_pipe(doc, (0, 0, 0), (0, 0, 10), 0.33)
+    b = model.add_pipe(doc, (0, 0, 10), (0, 0, 20), 0.33)
+    grid = ConnectorGrid(connectors(a) + connectors(b))
+    pairs = grid.pairs()
+    assert len(pairs) == 1
+    assert [connector.Origin.Z for connector in pairs[0]] == [10, 10]
+    assert sorted(connector.Origin.Z for connector in grid.unmatched()) == [0, 20]
+    assert grid.match(connectors(a)[1]).Owner.Id == b.Id
+
+
+def test_grid_only_pairs_within_a_group(doc):
+    a = model.add_pipe(doc, (0, 0, 0), (0, 0, 10), 0.33)
+    b = model.add_pipe(doc, (0, 0, 10), (0, 0, 20), 0.33)
+    c = model.add_pipe(doc, (0, 0, 20), (0, 0, 30), 0.33)
+    grid = ConnectorGrid()
+    for group, element in [(0, a), (0, b), (1, c)]:
+        for connector in connectors(element):
+            grid.add(connector, element.Id, group)
+    assert [(first.Origin.Z, other.Origin.Z) for first, other in grid.pairs()] == [(10, 10)]
+    assert list(grid.pairs_by_group()) == [0]
+
+
+def test_connector_pair_falls_back_to_closest_connectors(doc):
+    a = model.add_pipe(doc, (0, 0, 0), (0, 0, 10), 0.33)
+    b = model.add_pipe(doc, (0, 0, 10.5), (0, 0, 20), 0.33)
+    pair = connector_pair(a, b)
+    assert (pair[0].Origin.Z, pair[1].Origin.Z) == (10, 10.5)
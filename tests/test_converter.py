@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Fitting family table, keyword matching and type changes of Content Converter."""
+import pytest
+
+from Autodesk.Revit.DB import BuiltInParameter, Transaction
+
+from fakerevit import model
+from fakerevit.calls import calls
+from pamtools import converter
+from pamtools.converter import (
+    DUCTILE_IRON,
+    RAPID_S_NG,
+    FamilyMapping,
+    FittingRule,
+    change_types,
+    collect_elements,
+    execute,
+    get_target,
+    plan_conversion,
+)
+from pamtools.matching import KeywordMatcher
+
+# Targets the hard-coded mapping of the original tool gave, now read from data/fitting_families.json
+TARGETS = [
+    ("Pam Short Radius Bend 88°", "DN100x100", 100.0, DUCTILE_IRON, ("PBUK_ES_Bend_AF002_DI", "DN100x100")),
+    ("Pam Short Radius Bend 88°", "DN100x100", 100.0, RAPID_S_NG, ("PBUK_ES_Bend_AF002_NG", "DN100x100")),
+    ("Pam Short Radius Bend 88°", "DN400x400", 400.0, DUCTILE_IRON, ("PBUK_ES_Bend_EF002_HP", "DN400x400")),
+    ("Single Branch", "DN300x300", 300.0, RAPID_S_NG, ("PBUK_ES_Single Branch_AF006_NG", "DN300x300")),
+    ("Single Branch", "DN400x400", 400.0, RAPID_S_NG, ("PBUK_ES_Single Branch_EF006_HP", "DN400x400")),
+    ("Metallic Coupling", "DN100x100", 100.0, RAPID_S_NG,
+     ("PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN100x100")),
+    ("Metallic Coupling", "DN500x500", 500.0, DUCTILE_IRON,
+     ("PBUK_ES_High Performance Coupling Stainless Steel_W2_EC002HP&EC002HP-G_Union", "DN500x500_EC002HP")),
+    ("Trap Plain", "DN100x100", 100.0, DUCTILE_IRON, ("PBUK_ES_Trap Plain Branch_EF034_DI", "DN100x100")),
+    ("Trap Plain With Access Bottom", "DN100x100", 100.0, RAPID_S_NG,
+     ("PBUK_ES_Trap Plain With Access Bottom_EF037_NG", "DN100x100")),
+    ("Blank End Push-Fit", "DN100x100", 100.0, DUCTILE_IRON, ("PBUK_ES_Blank End Push Fit_EF071", "DN100x100")),
+    ("Blank End", "DN100x100", 100.0, DUCTILE_IRON, ("PBUK_ES_Blank End_EF070", "DN100x100")),
+    ("45° Single Long Arm Branch", "DN100x100", None, RAPID_S_NG,
+     ("PBUK_ES_45° Single Long Arm Branch_EF008_NG", "DN100x100")),
+    ("Unknown Fitting", "DN100x100", 100.0, DUCTILE_IRON, ("", "DN100x100")),
+]
+
+
+@pytest.mark.parametrize("description, type_name, diameter, coupling, target", TARGETS)
+def test_fitting_family_table(description, type_name, diameter, coupling, target):
+    assert get_target(description, type_name, diameter, coupling) == target
+
+
+def test_longest_keyword_wins_wherever_it_is_listed():
+    mapping = FamilyMapping([FittingRule("Bend", "short"), FittingRule("Long Radius Bend", "long")])
+    assert mapping.target("Pam Long Radius Bend 88°", "DN100x100", 100.0, "EC002") == ("long", "DN100x100")
+    assert mapping.target("Pam Bend 88°", "DN100x100", 100.0, "EC002") == ("short", "DN100x100")
+
+
+def test_exact_rule_only_matches_whole_description():
+    mapping = FamilyMapping([FittingRule("Trap", "trap", exact=True)])
+    assert mapping.target("Trap", "DN100x100", 100.0, "EC002") == ("trap", "DN100x100")
+    assert mapping.target("Trap Plain", "DN100x100", 100.0, "EC002") is None
+
+
+def test_diameter_limits():
+    rule = FittingRule("Bend", "large", above=300, up_to=None)
+    assert not rule.applies("DN300x300", 300.0, "EC002")
+    assert rule.applies("DN400x400", 400.0, "EC002")
+    assert not rule.applies("DN400x400", None, "EC002")
+
+
+def test_keyword_matcher_finds_overlapping_keywords():
+    matcher = KeywordMatcher(["he", "she", "his", "hers"])
+    assert matcher.find("ushers") == [0, 1, 3]
+    assert matcher.find("nothing") == []
+
+
+@pytest.fixture
+def transaction(doc):
+    with Transaction(doc, "Convert") as t:
+        t.Start()
+        yield t
+        t.Commit()
+
+
+def fittings(doc, count):
+    return [model.add_fitting(doc, (number, 0, 0), 1, 0.33) for number in range(count)]
+
+
+def test_change_types_in_one_call(doc, transaction):
+    symbol = model.add_family_symbol(doc, "PBUK_ES_Bend_AF002_DI", "DN100x100")
+    elements = fittings(doc, 5)
+    calls.reset()
+    assert change_types(doc, elements, symbol.Id) == []
+    assert calls.counts['Element.ChangeTypeId (bulk)'] == 1
+    assert 'Element.ChangeTypeId' not in calls.counts
+    assert all(element.GetTypeId() == symbol.Id for element in elements)
+
+
+def test_change_types_one_by_one_when_the_bulk_call_fails(doc, transaction):
+    symbol = model.add_family_symbol(doc, "PBUK_ES_Bend_AF002_DI", "DN100x100")
+    pipe = model.add_pipe(doc, (0, 0, 0), (0, 0, -1), 0.33)
+    elements = fittings(doc, 2)
+    errors = change_types(doc, elements + [pipe], symbol.Id)
+    assert [element for element, error in errors] == [pipe]
+    assert all(element.GetTypeId() == symbol.Id for element in elements)
+
+
+BRANCH = "PBUK_ES_45° Single Long Arm Branch_EF008_NG"
+
+
+def selection(doc):
+    """Return the pipe type to convert to and a pipe and three fittings to convert."""
+    pipe_type = model.add_pipe_type(doc, "Pam Rapid S NG")
+    model.add_family_symbol(doc, BRANCH, "DN100x100")
+    elements = [model.add_pipe(doc, (0, 0, 0), (0, 0, -1), 0.33)]
+    for number, (description, type_name) in enumerate([("45° Single Long Arm Branch", "DN100x100"),
+                                                        ("45° Single Long Arm Branch", "DN150x150"),
+                                                        ("Unknown Fitting", "DN100x100")]):
+        symbol = model.add_family_symbol(doc, "Other Branch", type_name, description=description)
+        elements.append(model.add_fitting(doc, (number, 0, 0), 1, 0.33, symbol=symbol))
+    return pipe_type, elements
+
+
+def test_plan_classifies_the_selection_without_a_transaction(doc):
+    pipe_type, elements = selection(doc)
+    plan = plan_conversion(doc, elements, pipe_type, RAPID_S_NG)
+    assert plan.count() == 2
+    assert plan.pipe_count() == 1
+    assert plan.targets == {("Pipes", "Pam Rapid S NG"): 1, (BRANCH, "DN100x100"): 1}
+    assert plan.missing_targets() == [(BRANCH, "DN150x150", 1)]
+    assert plan.unresolved == {"Unknown Fitting": 1}
+    assert plan.errors == []
+    assert doc.GetElement(elements[1].GetTypeId()).FamilyName == "Other Branch"
+
+
+def test_executing_the_plan_converts_what_it_planned(doc, transaction):
+    pipe_type, elements = selection(doc)
+    plan = plan_conversion(doc, elements, pipe_type, RAPID_S_NG)
+    assert execute(doc, plan) == (1, 1, [])
+    assert elements[0].GetTypeId() == pipe_type.Id
+    assert doc.GetElement(elements[1].GetTypeId()).FamilyName == BRANCH
+
+
+def test_progress_can_stop_the_conversion(doc, transaction, monkeypatch):
+    monkeypatch.setattr(converter, "BATCH_SIZE", 1)
+    pipe_type, elements = selection(doc)
+    plan = plan_conversion(doc, elements, pipe_type, RAPID_S_NG)
+    steps = []
+
+    def progress(done, total):
+        steps.append((done, total))
+        return False
+
+    pipes, fittings, errors = execute(doc, plan, progress)
+    assert steps == [(1, 2)]
+    assert pipes + fittings == 1
+
+
+def test_collect_the_pipework_of_systems_or_of_the_model(doc):
+    fixture = model.add_fixture(doc, (0, 0, 0), 0.33)
+    pipe = model.add_pipe(doc, (0, 0, 0), (0, 0, -1), 0.33)
+    fitting = model.add_fitting(doc, (0, 0, -1), 1, 0.33)
+    other = model.add_pipe(doc, (5, 0, 0), (5, 0, -1), 0.33)
+    system = model.add_piping_system(doc, "SAN 1", [fixture, pipe, fitting])
+    assert collect_elements(doc, systems=[system]) == [pipe, fitting]
+    assert collect_elements(doc, systems=[]) == []
+    assert collect_elements(doc) == [pipe, fitting, other]
+
+
+def test_collect_the_pipework_on_a_level(doc, transaction):
+    level = model.add_level(doc, "Level 1", 0.0)
+    on_level, elsewhere = fittings(doc, 2)
+    on_level.get_Parameter(BuiltInParameter.FAMILY_LEVEL_PARAM).Set(level.Id)
+    assert collect_elements(doc, level=level) == [on_level]
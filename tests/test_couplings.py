@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Splitting pipes and placing couplings along them, as Add Couplings does."""
+import pytest
+
+from Autodesk.Revit.DB import Transaction, XYZ
+
+from fakerevit import model
+from fakerevit.calls import calls
+from pamtools import couplings
+
+METRE = 1000 / 304.8
+DN100 = 100 / 304.8
+
+
+NG = "EC002NG - RAPID S NG"
+
+
+def vertical_pipe(doc, metres, x=0.0, diameter=DN100, **options):
+    return model.add_pipe(doc, (x, 0, metres * METRE), (x, 0, 0), diameter, **options)
+
+
+@pytest.fixture
+def transaction(doc):
+    with Transaction(doc, "Split pipes") as t:
+        t.Start()
+        yield t
+        t.Commit()
+
+
+@pytest.fixture
+def union(doc):
+    """Make NewUnionFitting place a coupling, as the coupling rules do while pipes are split."""
+    symbol = model.add_family_symbol(doc, "PBUK_ES_RAPID S NG Coupling_EC002NG_Union", "DN100x100")
+    model.set_union_fitting(doc, symbol)
+    return symbol
+
+
+def heights(points):
+    return [round(point.Z / METRE, 6) for point in points]
+
+
+def test_points_every_spacing_from_the_start():
+    points = couplings.compute_intermediate_points(XYZ(0, 0, 10 * METRE), XYZ(0, 0, 0))
+    assert heights(points) == [7.0, 4.0, 1.0]
+
+
+def test_no_point_closer_than_the_spacing_to_the_end():
+    assert heights(couplings.compute_intermediate_points(XYZ(0, 0, 5 * METRE), XYZ(0, 0, 0))) == [2.0]
+    assert couplings.compute_intermediate_points(XYZ(0, 0, 2 * METRE), XYZ(0, 0, 0)) == []
+
+
+def test_points_at_another_spacing():
+    points = couplings.compute_intermediate_points(XYZ(0, 0, 0), XYZ(5 * METRE, 0, 0), interval=2.0)
+    assert [round(point.X / METRE, 6) for point in points] == [2.0, 4.0]
+
+
+def test_count_couplings(doc):
+    pipes = [vertical_pipe(doc, 10), vertical_pipe(doc, 6.5, x=1.0), vertical_pipe(doc, 2, x=2.0)]
+    assert couplings.count_couplings(pipes) == 5
+
+
+def test_every_coupling_takes_one_break(doc, transaction, union):
+    pipes = [vertical_pipe(doc, 10), vertical_pipe(doc, 6.5, x=1.0)]
+    calls.reset()
+    fittings, failures = couplings.split_pipes(doc, pipes)
+    assert len(fittings) == 5
+    assert failures == []
+    assert calls.counts['PlumbingUtils.BreakCurve'] == 5
+    assert all(fitting.GetTypeId() == union.Id for fitting in fittings)
+
+
+def test_unions_that_fail_are_returned_with_their_pipe(doc, transaction):
+    pipes = [vertical_pipe(doc, 10), vertical_pipe(doc, 2, x=1.0), vertical_pipe(doc, 6.5, x=2.0)]
+    fittings, failures = couplings.split_pipes(doc, pipes)
+    assert fittings == []
+    assert [pipe.Id for pipe, error in failures] == [pipes[0].Id] * 3 + [pipes[2].Id] * 2
+
+
+def test_collect_sanitary_pipes_of_the_model(doc):
+    sanitary = vertical_pipe(doc, 10)
+    water = vertical_pipe(doc, 10, x=1.0, classification="Domestic Cold Water")
+    model.add_fixture(doc, (2, 0, 0), DN100)
+    assert [pipe.Id for pipe in couplings.collect_pipes(doc)] == [sanitary.Id, water.Id]
+    assert [pipe.Id for pipe in couplings.collect_pipes(doc, classification=couplings.SANITARY)] == [sanitary.Id]
+
+
+def test_collect_pipes_of_systems(doc):
+    first = vertical_pipe(doc, 10)
+    vertical_pipe(doc, 10, x=1.0)
+    system = model.add_piping_system(doc, "Stack 1", [first])
+    assert [pipe.Id for pipe in couplings.collect_pipes(doc, systems=[system])] == [first.Id]
+    assert couplings.collect_pipes(doc, systems=[]) == []
+
+
+def test_pipes_of_chosen_types(doc):
+    cast_iron = model.add_pipe_type(doc, "Cast Iron")
+    plastic = model.add_pipe_type(doc, "PVC")
+    pipes = [vertical_pipe(doc, 10, pipe_type=cast_iron), vertical_pipe(doc, 10, x=1.0, pipe_type=plastic)]
+    assert couplings.of_types(pipes, [cast_iron.Id]) == pipes[:1]
+
+
+def test_classify_pipes_by_length_and_loaded_dn(doc):
+    coupled = vertical_pipe(doc, 10)
+    short = vertical_pipe(doc, couplings.SPACING, x=1.0)
+    not_loaded = vertical_pipe(doc, 10, x=2.0, diameter=150 / 304.8)
+    odd_size = vertical_pipe(doc, 10, x=3.0, diameter=90 / 304.8)
+    families = [(100, 1), (125, 2)]
+    suitable, unsuitable, too_short = couplings.classify_pipes([coupled, short, not_loaded, odd_size], NG, families)
+    assert [info.pipe for info in suitable] == [coupled]
+    assert [info.pipe for info in unsuitable] == [not_loaded, odd_size]
+    assert [info.pipe for info in too_short] == [short]
+    assert suitable[0].length == pytest.approx(10.0)
+    assert couplings.families_for(families, suitable) == [(100, 1)]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Flow results of the engine against the per-pipe formulas of the original tool."""
+import math
+
+import pytest
+
+from en12056 import CONTINUOUS, K_FREQUENT, PUMPED, Injection, PipeNetwork, calculate, node_results, waste_water_flow
+from en12056.engine import accumulate
+
+
+def baseline(discharge_units, k_factor, qc, qp):
+    """Qww = K * sqrt(DU) and Qtot = Qww + Qc + Qp, one pipe at a time, as Produce Calculations did."""
+    qww = [k_factor * math.sqrt(du) for du in discharge_units]
+    qtot = [w + c + p for w, c, p in zip(qww, qc, qp)]
+    return qww, qtot
+
+
+def assert_close(actual, expected):
+    assert len(actual) == len(expected)
+    for a, b in zip(actual, expected):
+        assert a == pytest.approx(b, abs=1e-12)
+
+
+def stack():
+    """WC and basin branches into a stack: wc -> p1 -> tee -> p3, basin -> p2 -> tee."""
+    network = PipeNetwork()
+    network.add("wc", is_pipe=False)
+    network.add("basin", is_pipe=False)
+    network.add("p1", 2.0)
+    network.add("p2", 0.5)
+    network.add("tee", is_pipe=False)
+    network.add("p3", 2.5)
+    for upstream, downstream in [("wc", "p1"), ("basin", "p2"), ("p1", "tee"), ("p2", "tee"), ("tee", "p3")]:
+        network.connect(upstream, downstream)
+    return network
+
+
+def test_waste_water_flow():
+    assert waste_water_flow(K_FREQUENT, 4.0) == pytest.approx(1.4)
+    assert waste_water_flow(K_FREQUENT, 0.0) == 0.0
+
+
+def test_only_pipes_get_results():
+    network = stack()
+    assert len(network) == 6
+    assert [network.ids[node] for node in network.pipe_nodes()] == ["p1", "p2", "p3"]
+    assert [network.ids[node] for node in network.path_from("wc")] == ["wc", "p1", "tee", "p3"]
+
+
+def test_calculate_matches_baseline():
+    results = calculate(stack(), K_FREQUENT)
+    expected_qww, expected_qtot = baseline([2.0, 0.5, 2.5], K_FREQUENT, [0.0] * 3, [0.0] * 3)
+    assert list(results.ids) == ["p1", "p2", "p3"]
+    assert_close(results.qww, expected_qww)
+    assert_close(results.qtot, expected_qtot)
+
+
+def test_calculate_adds_discharges_downstream():
+    injections = [Injection("wc", CONTINUOUS, 0.1), Injection("basin", PUMPED, 0.4)]
+    results = calculate(stack(), K_FREQUENT, injections)
+    assert_close(results.qc, [0.1, 0.0, 0.1])
+    assert_close(results.qp, [0.0, 0.4, 0.4])
+    expected_qww, expected_qtot = baseline([2.0, 0.5, 2.5], K_FREQUENT, [0.1, 0.0, 0.1], [0.0, 0.4, 0.4])
+    assert_close(results.qww, expected_qww)
+    assert_close(results.qtot, expected_qtot)
+
+
+def test_results_rows():
+    results = calculate(stack(), K_FREQUENT, [Injection("wc", CONTINUOUS, 0.1)])
+    rows = list(results)
+    assert [row[0] for row in rows] == ["p1", "p2", "p3"]
+    assert rows[0][1:] == pytest.approx((2.0, K_FREQUENT * math.sqrt(2.0), 0.1, 0.0,
+                                         K_FREQUENT * math.sqrt(2.0) + 0.1))
+
+
+def test_sweep_matches_path_walks():
+    injections = [Injection("wc", CONTINUOUS, 0.1), Injection("p2", CONTINUOUS, 0.2),
+                  Injection("basin", PUMPED, 0.4)]
+    swept = calculate(stack(), K_FREQUENT, injections)
+    walked = calculate(stack(), K_FREQUENT, injections, sweep=False)
+    for column in ("qww", "qc", "qp", "qtot"):
+        assert_close(getattr(swept, column), getattr(walked, column))
+
+
+def test_loop_elements_share_the_flow_entering_the_loop():
+    network = PipeNetwork()
+    for element_id in ("in", "a", "b", "c"):
+        network.add(element_id, 1.0)
+    for upstream, downstream in [("in", "a"), ("a", "b"), ("b", "c"), ("c", "a")]:
+        network.connect(upstream, downstream)
+    qc, qp = accumulate(network, [Injection("in", CONTINUOUS, 0.3), Injection("b", CONTINUOUS, 0.2)])
+    assert qc == pytest.approx([0.3, 0.5, 0.5, 0.5])
+    assert qp == [0.0] * 4
+
+
+def test_node_results_of_given_flows():
+    network = stack()
+    results = node_results(network, K_FREQUENT, [0.0, 0.0, 0.1, 0.0, 0.1, 0.3], [0.0, 0.0, 0.0, 0.2, 0.2, 0.2])
+    assert_close(results.qc, [0.1, 0.0, 0.3])
+    assert_close(results.qp, [0.0, 0.2, 0.2])
+
+
+def test_unknown_discharge_kind():
+    with pytest.raises(ValueError):
+        Injection("wc", "gravity", 0.1)
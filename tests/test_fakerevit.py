@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""The fake Revit API behaves as Revit does where the tools rely on it."""
+import pytest
+
+from Autodesk.Revit.DB import Transaction, TransactionGroup, UndoOperation, XYZ
+from Autodesk.Revit.DB.Plumbing import PlumbingUtils
+from Autodesk.Revit.Exceptions import InvalidOperationException
+
+from fakerevit import model
+from fakerevit.calls import calls
+
+
+@pytest.fixture
+def changes(doc):
+    """DocumentChanged arguments raised for doc, in order."""
+    raised = []
+    doc.Application.DocumentChanged += lambda sender, args: raised.append(args)
+    return raised
+
+
+def yes_no(doc):
+    pipe = model.add_pipe(doc, (0, 0, 0), (0, 0, -1), 0.33)
+    model.add_shared_parameters(doc, ["Flag"], [pipe], yes_no=["Flag"])
+    return pipe, pipe.LookupParameter("Flag")
+
+
+def test_yes_no_parameters_read_as_integers_only(doc):
+    pipe, flag = yes_no(doc)
+    with Transaction(doc, "Set") as t:
+        t.Start()
+        flag.Set(1)
+        t.Commit()
+    assert flag.AsInteger() == 1
+    assert flag.AsDouble() == 0.0
+
+
+def test_changes_need_a_transaction(doc):
+    pipe, flag = yes_no(doc)
+    with pytest.raises(InvalidOperationException):
+        flag.Set(1)
+    with pytest.raises(InvalidOperationException):
+        doc.Delete(pipe.Id)
+
+
+def test_rolling_back_undoes_the_transaction(doc, changes):
+    pipe, flag = yes_no(doc)
+    with Transaction(doc, "Change") as t:
+        t.Start()
+        flag.Set(1)
+        added = model.add_pipe(doc, (1, 0, 0), (1, 0, -1), 0.33)
+        t.RollBack()
+    assert flag.AsInteger() == 0
+    assert doc.GetElement(added.Id) is None
+    assert changes == []
+
+
+def test_document_changed_reports_committed_changes(doc, changes):
+    pipe, flag = yes_no(doc)
+    other = model.add_pipe(doc, (1, 0, 0), (1, 0, -1), 0.33)
+    with Transaction(doc, "Change") as t:
+        t.Start()
+        flag.Set(1)
+        added = model.add_pipe(doc, (2, 0, 0), (2, 0, -1), 0.33)
+        doc.Delete(other.Id)
+        t.Commit()
+    args, = changes
+    assert args.Operation == UndoOperation.TransactionCommitted
+    assert args.GetTransactionNames() == ["Change"]
+    assert args.GetAddedElementIds() == [added.Id]
+    assert args.GetModifiedElementIds() == [pipe.Id]
+    assert args.GetDeletedElementIds() == [other.Id]
+
+
+def test_rolling_back_a_group_undoes_its_committed_transactions(doc, changes):
+    pipe, flag = yes_no(doc)
+    with TransactionGroup(doc, "Group") as group:
+        group.Start()
+        with Transaction(doc, "Change") as t:
+            t.Start()
+            flag.Set(1)
+            t.Commit()
+        group.RollBack()
+    assert flag.AsInteger() == 0
+    assert [args.Operation for args in changes] == [UndoOperation.TransactionCommitted,
+                                                    UndoOperation.TransactionGroupRolledBack]
+
+
+def test_break_curve_moves_the_start_connections_to_the_new_pipe(doc):
+    fixture = model.add_fixture(doc, (0, 0, 10), 0.33)
+    pipe = model.add_pipe(doc, (0, 0, 10), (0, 0, 0), 0.33)
+    model.connect(fixture, pipe)
+    with Transaction(doc, "Break") as t:
+        t.Start()
+        new_id = PlumbingUtils.BreakCurve(doc, pipe.Id, XYZ(0, 0, 4))
+        t.Commit()
+    new = doc.GetElement(new_id)
+    start, end = [connector for connector in new.ConnectorManager.Connectors]
+    assert [ref.Owner.Id for ref in start.AllRefs] == [fixture.Id]
+    assert (end.Origin.X, end.Origin.Y, end.Origin.Z) == (0, 0, 4)
+    assert not end.IsConnected
+
+
+def test_api_calls_are_counted(doc):
+    pipe, flag = yes_no(doc)
+    calls.reset()
+    flag.AsDouble()
+    flag.AsDouble()
+    with calls.paused():
+        flag.AsDouble()
+    assert calls.counts == {'Parameter.AsDouble': 2}
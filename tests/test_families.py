@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Family symbols and pipe types scanned once per document."""
+from Autodesk.Revit.DB import Transaction
+
+from fakerevit import model
+from fakerevit.calls import calls
+from pamtools import families
+
+
+def test_symbol_index_by_family_and_type_name(doc):
+    first = model.add_family_symbol(doc, "Coupling", "DN100")
+    model.add_family_symbol(doc, "Coupling", "DN100")
+    other = model.add_family_symbol(doc, "Bend", "DN100")
+    index = families.symbol_index(doc)
+    assert len(index) == 2
+    assert index.get("Coupling", "DN100") == first.Id
+    assert index.get("Bend", "DN100") == other.Id
+    assert index.get("Bend", "DN150") is None
+    assert ("Coupling", "DN100") in index
+
+
+def test_symbols_are_scanned_once_for_every_lookup(doc):
+    for size in range(100, 600, 50):
+        model.add_family_symbol(doc, "Coupling", "DN{}".format(size))
+    calls.reset()
+    index = families.symbol_index(doc)
+    found = [families.symbol_index(doc).get("Coupling", "DN{}".format(size)) for size in range(100, 600, 50)]
+    assert all(found)
+    assert families.family_symbols(doc, "Pipe Fittings") == families.family_symbols(doc)
+    assert families.symbol_index(doc) is index
+    assert calls.counts['FilteredElementCollector.OfClass'] == 1
+
+
+def test_loading_a_symbol_rebuilds_the_index(doc):
+    model.add_family_symbol(doc, "Coupling", "DN100")
+    assert families.symbol_index(doc).get("Coupling", "DN150") is None
+    with Transaction(doc, "Load Family") as t:
+        t.Start()
+        added = model.add_family_symbol(doc, "Coupling", "DN150")
+        t.Commit()
+    assert families.symbol_index(doc).get("Coupling", "DN150") == added.Id
+
+
+def test_pipe_types_by_name(doc):
+    pipe_type = model.add_pipe_type(doc, "Cast Iron")
+    assert families.pipe_types(doc) == {"Cast Iron": pipe_type.Id}
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Images of the tool windows, loaded from PNG files instead of Base64 text in the scripts."""
+import glob
+import io
+import os
+import re
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGES_DIR = os.path.join(ROOT, "lib", "pamui", "images")
+SCRIPTS = sorted(glob.glob(os.path.join(ROOT, "Pam Building Design+.tab", "*", "**", "script.py"), recursive=True))
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Control name to image name bindings, and bitmap("name") calls
+_BINDINGS = re.compile(r"^\s*(?:WINDOW_IMAGES|\w+_image_bindings)\s*=\s*\{(.*?)\}", re.MULTILINE | re.DOTALL)
+_BINDING = re.compile(r"""["'](\w+)["']\s*:\s*["'](\w+)["']""")
+_BITMAP = re.compile(r"""\bbitmap\(\s*["'](\w+)["']\s*\)""")
+
+
+def source(path):
+    with io.open(path, encoding="utf-8") as script_file:
+        return script_file.read()
+
+
+def bindings(path):
+    """Return the (control name, image name) pairs a script binds."""
+    return [pair for block in _BINDINGS.findall(source(path)) for pair in _BINDING.findall(block)]
+
+
+def shown_images():
+    for path in SCRIPTS:
+        names = [image for control, image in bindings(path)] + _BITMAP.findall(source(path))
+        for name in names:
+            yield os.path.basename(os.path.dirname(path)), name
+
+
+@pytest.mark.parametrize("bundle,name", sorted(set(shown_images())))
+def test_every_image_shown_is_a_png(bundle, name):
+    with open(os.path.join(IMAGES_DIR, name + ".png"), "rb") as image_file:
+        assert image_file.read(len(PNG_SIGNATURE)) == PNG_SIGNATURE
+
+
+@pytest.mark.parametrize("path", [path for path in SCRIPTS if bindings(path)],
+                         ids=lambda path: os.path.basename(os.path.dirname(path)))
+def test_bound_image_controls_are_named_in_the_window(path):
+    xaml = "".join(source(xaml_path) for xaml_path in glob.glob(os.path.join(os.path.dirname(path), "*.xaml")))
+    for control, image in bindings(path):
+        assert re.search(r"""\bName=["']{}["']""".format(control), xaml), control
+
+
+@pytest.mark.parametrize("path", SCRIPTS, ids=lambda path: os.path.basename(os.path.dirname(path)))
+def test_scripts_carry_no_embedded_images(path):
+    assert os.path.getsize(path) < 64 * 1024
+    assert "base64" not in source(path).lower()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Which pipes an incremental run re-reads after elements change."""
+from en12056 import ResultCache, SystemResults, Topology
+
+
+def topology(links):
+    """Return a Topology of (element id, next id) links, in order."""
+    snapshot = Topology(system_id="system")
+    for element_id, next_id in links:
+        snapshot.add_element(element_id, not element_id.startswith("wc"), 0.33, "Sanitary", next_id=next_id)
+    return snapshot.finalise()
+
+
+# Two branches into a stack: wc1 -> b1 -> s1 -> s2, wc2 -> b2 -> s1
+LINKS = [("wc1", "b1"), ("b1", "s1"), ("wc2", "b2"), ("b2", "s1"), ("s1", "s2"), ("s2", None)]
+
+
+def results(links=LINKS):
+    snapshot = topology(links)
+    pipes = [element_id for element_id in snapshot.ids if not element_id.startswith("wc")]
+    return SystemResults(snapshot, 0.7, "Sanitary", [], dict((pipe, 1.0) for pipe in pipes),
+                         dict((pipe, (1.0, 0.7, 0.0, 0.0, 0.7)) for pipe in pipes))
+
+
+def test_nothing_changed():
+    system_results = results()
+    assert system_results.affected_ids(topology(LINKS)) == set()
+
+
+def test_changed_element_dirties_its_downstream_path():
+    system_results = results()
+    system_results.mark_changed(["b2", "not in system"])
+    assert system_results.dirty == {"b2"}
+    assert system_results.affected_ids(topology(LINKS)) == {"b2", "s1", "s2"}
+
+
+def test_moved_element_dirties_old_and_new_paths():
+    system_results = results()
+    system_results.mark_changed(["wc1"])
+    # wc1 now drains into b2 instead of b1
+    moved = [("wc1", "b2")] + LINKS[1:]
+    assert system_results.affected_ids(topology(moved)) == {"wc1", "b1", "b2", "s1", "s2"}
+
+
+def test_added_branch_dirties_its_downstream_path():
+    system_results = results()
+    system_results.mark_changed([], added_ids=["wc3", "b3"])
+    added = LINKS + [("wc3", "b3"), ("b3", "s2")]
+    assert system_results.affected_ids(topology(added)) == {"wc3", "b3", "s2"}
+
+
+def test_element_new_to_topology_is_dirty_without_being_reported():
+    system_results = results()
+    added = LINKS + [("wc3", "b3"), ("b3", "s1")]
+    assert system_results.affected_ids(topology(added)) == {"wc3", "b3", "s1", "s2"}
+
+
+def test_changed_values():
+    system_results = results()
+    rows = [("b1", 1.0, 0.7, 0.0, 0.0, 0.7), ("s1", 2.0, 0.99, 0.0, 0.0, 0.99)]
+    assert system_results.changed_values(rows) == {"s1"}
+
+
+def test_result_cache_marks_only_systems_of_the_document():
+    cache = ResultCache()
+    cache.put("model", results())
+    other = cache.put("other model", results())
+    cache.mark_changed("model", ["b1"], added_ids=["wc9"])
+    assert cache.get("model", "system").dirty == {"b1", "wc9"}
+    assert other.dirty == set()
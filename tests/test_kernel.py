@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Qww and Qtot evaluated over whole columns, with and without NumPy."""
+import pytest
+
+from en12056 import K_FREQUENT, kernel
+
+from test_engine import assert_close, baseline
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "array"])
+def numpy_kernel(request, monkeypatch):
+    if request.param and not kernel.HAVE_NUMPY:
+        pytest.skip("NumPy is not installed")
+    monkeypatch.setattr(kernel, "HAVE_NUMPY", request.param)
+    return request.param
+
+
+def test_kernel_matches_baseline(numpy_kernel):
+    discharge_units = [0.0, 0.5, 1.8, 2.5, 13.9, 120.0]
+    qc = [0.0, 0.1, 0.0, 0.0, 0.35, 1.0]
+    qp = [0.0, 0.0, 0.8, 0.0, 0.0, 2.5]
+    qww, qtot = kernel.flow_kernel(kernel.as_array(discharge_units), K_FREQUENT,
+                                   kernel.as_array(qc), kernel.as_array(qp))
+    expected_qww, expected_qtot = baseline(discharge_units, K_FREQUENT, qc, qp)
+    assert_close(qww, expected_qww)
+    assert_close(qtot, expected_qtot)
+
+
+def test_kernel_folds_unit_factor(numpy_kernel):
+    discharge_units = [1.2, 4.0, 9.5]
+    qc = [0.2, 0.0, 0.1]
+    qp = [0.0, 0.5, 0.0]
+    factor = 0.0353146667
+    qww, qtot = kernel.flow_kernel(kernel.as_array(discharge_units), K_FREQUENT,
+                                   kernel.as_array(qc), kernel.as_array(qp), factor)
+    expected_qww, expected_qtot = baseline(discharge_units, K_FREQUENT, qc, qp)
+    assert_close(qww, [value * factor for value in expected_qww])
+    assert_close(qtot, [value * factor for value in expected_qtot])
+
+
+def test_kernel_takes_a_frequency_factor_per_pipe(numpy_kernel):
+    discharge_units = [1.0, 4.0]
+    k_factors = [0.5, 0.7]
+    qww, qtot = kernel.flow_kernel(kernel.as_array(discharge_units), kernel.as_array(k_factors),
+                                   kernel.as_array([0.1, 0.0]), kernel.as_array([0.0, 0.2]))
+    assert_close(qww, [0.5, 1.4])
+    assert_close(qtot, [0.6, 1.6])
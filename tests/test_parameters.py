@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Shared parameter GUIDs resolved once per document and columns of parameter values."""
+import pytest
+
+from Autodesk.Revit.DB import Transaction
+
+from en12056.builder import track_document_changes
+from en12056.parameters import (
+    CONTINUOUS_FLOW,
+    DISCHARGE_UNITS,
+    PRIMARY_VENTILATED,
+    PUMPED_FLOW,
+    ParameterTable,
+    resolve_guids,
+)
+from fakerevit import model
+from fakerevit.calls import calls
+
+
+def scans(doc, names):
+    """Return how many times resolving names scans the shared parameters."""
+    calls.reset()
+    resolve_guids(doc, names)
+    return calls.counts.get('FilteredElementCollector.OfClass', 0)
+
+
+def test_guids_of_shared_parameters(doc):
+    shared = model.add_shared_parameters(doc, [DISCHARGE_UNITS, CONTINUOUS_FLOW])
+    assert resolve_guids(doc, [DISCHARGE_UNITS, CONTINUOUS_FLOW, PUMPED_FLOW]) == {
+        DISCHARGE_UNITS: shared[0].GuidValue, CONTINUOUS_FLOW: shared[1].GuidValue, PUMPED_FLOW: None}
+
+
+def test_missing_names_are_not_scanned_for_again(doc):
+    model.add_shared_parameters(doc, [DISCHARGE_UNITS])
+    assert scans(doc, [DISCHARGE_UNITS, PUMPED_FLOW]) == 1
+    assert scans(doc, [DISCHARGE_UNITS, PUMPED_FLOW]) == 0
+    assert scans(doc, [CONTINUOUS_FLOW]) == 1
+
+
+def test_guids_are_resolved_again_after_a_shared_parameter_is_added(doc):
+    track_document_changes(doc.Application)
+    assert resolve_guids(doc, [PUMPED_FLOW]) == {PUMPED_FLOW: None}
+    with Transaction(doc, "Add Shared Parameters") as t:
+        t.Start()
+        shared = model.add_shared_parameters(doc, [PUMPED_FLOW])
+        t.Commit()
+    assert resolve_guids(doc, [PUMPED_FLOW]) == {PUMPED_FLOW: shared[0].GuidValue}
+
+
+def test_guids_are_kept_when_other_elements_change(doc):
+    track_document_changes(doc.Application)
+    model.add_shared_parameters(doc, [DISCHARGE_UNITS])
+    resolve_guids(doc, [DISCHARGE_UNITS, PUMPED_FLOW])
+    with Transaction(doc, "Add Pipe Type") as t:
+        t.Start()
+        model.add_pipe_type(doc, "Cast Iron")
+        t.Commit()
+    assert scans(doc, [DISCHARGE_UNITS, PUMPED_FLOW]) == 0
+
+
+@pytest.fixture
+def pipe_table(doc):
+    """Two pipes and their ParameterTable, in an open transaction."""
+    pipes = [model.add_pipe(doc, (number, 0, 0), (number, 0, -1), 0.33) for number in range(2)]
+    model.add_shared_parameters(doc, [DISCHARGE_UNITS, PRIMARY_VENTILATED], pipes, yes_no=[PRIMARY_VENTILATED])
+    with Transaction(doc, "Write Results") as t:
+        t.Start()
+        yield pipes, ParameterTable(doc, pipes, [DISCHARGE_UNITS, PRIMARY_VENTILATED, PUMPED_FLOW])
+        t.RollBack()
+
+
+def test_parameters_the_elements_do_not_have(pipe_table):
+    pipes, table = pipe_table
+    assert table.missing() == [PUMPED_FLOW]
+
+
+def test_update_only_writes_values_that_changed(pipe_table):
+    pipes, table = pipe_table
+    assert table.update(DISCHARGE_UNITS, [0.0, 2.5]) == 1
+    assert table.read(DISCHARGE_UNITS) == [0.0, 2.5]
+    assert table.update(DISCHARGE_UNITS, [0.0, 2.5 + 1e-12]) == 0
+
+
+def test_yes_no_parameters_are_compared_and_written_as_integers(pipe_table):
+    pipes, table = pipe_table
+    assert table.is_integer(PRIMARY_VENTILATED)
+    assert not table.is_integer(DISCHARGE_UNITS)
+    assert table.update(PRIMARY_VENTILATED, [1, 1.0]) == 2
+    assert table.read(PRIMARY_VENTILATED) == [1, 1]
+    assert table.update(PRIMARY_VENTILATED, [1, 1]) == 0
+
+
+def test_values_are_arranged_in_element_order(doc, pipe_table):
+    pipes, table = pipe_table
+    other = model.add_pipe(doc, (5, 0, 0), (5, 0, -1), 0.33)
+    assert table.column([pipes[1].Id, other.Id], [3.0, 4.0]) == [0.0, 3.0]
+    table.write(DISCHARGE_UNITS, [other.Id, pipes[0].Id], [4.0, 1.5])
+    assert table.read(DISCHARGE_UNITS) == [1.5, 0.0]
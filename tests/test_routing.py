@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Rules added to routing preferences for the length of a RuleSession."""
+from Autodesk.Revit.DB import (
+    PrimarySizeCriterion,
+    RoutingPreferenceRule,
+    RoutingPreferenceRuleGroupType,
+    Transaction,
+)
+from fakerevit import model
+
+from pamtools import routing
+
+
+def union_rules(manager):
+    group = RoutingPreferenceRuleGroupType.Unions
+    return [(manager.GetRule(group, index).Description, routing._sizes(manager.GetRule(group, index)))
+            for index in range(manager.GetNumberOfRules(group))]
+
+
+def add_union_rule(doc, manager, symbol_id, description, size):
+    rule = RoutingPreferenceRule(symbol_id, description)
+    rule.AddCriterion(PrimarySizeCriterion(size, size))
+    with Transaction(doc, "Add Rule") as t:
+        t.Start()
+        manager.AddRule(RoutingPreferenceRuleGroupType.Unions, rule, 0)
+        t.Commit()
+
+
+def pam_type(doc):
+    """Return a pipe type with one coupling rule of its own, and the coupling symbol."""
+    pipe_type = model.add_pipe_type(doc, "Pam")
+    symbol = model.add_family_symbol(doc, "Coupling", "DN100x100")
+    add_union_rule(doc, pipe_type.RoutingPreferenceManager, symbol.Id, "Coupling Rule", 1.0)
+    return pipe_type, symbol
+
+
+def test_rule_session_restores_rules(doc):
+    pipe_type, symbol = pam_type(doc)
+    manager = pipe_type.RoutingPreferenceManager
+    before = union_rules(manager)
+
+    with routing.RuleSession(doc, [pipe_type], [routing.RuleSpec(symbol.Id, "Coupling Rule", 0.5, 0.5)]):
+        assert union_rules(manager) == [("Coupling Rule", [(0.5, 0.5)])] + before
+    assert union_rules(manager) == before
+
+
+def test_rule_session_restores_rules_swapped_while_it_was_open(doc):
+    pipe_type, symbol = pam_type(doc)
+    manager = pipe_type.RoutingPreferenceManager
+    before = union_rules(manager)
+
+    with routing.RuleSession(doc, [pipe_type], [routing.RuleSpec(symbol.Id, "Coupling Rule", 0.5, 0.5)]):
+        # The session's rule is swapped for one of the same family and description but of another size
+        with Transaction(doc, "Swap Rule") as t:
+            t.Start()
+            manager.RemoveRule(RoutingPreferenceRuleGroupType.Unions, 0)
+            t.Commit()
+        add_union_rule(doc, manager, symbol.Id, "Coupling Rule", 2.0)
+    assert union_rules(manager) == before
+
+
+def test_rule_session_leaves_rules_already_rolled_back(doc):
+    pipe_type, symbol = pam_type(doc)
+    manager = pipe_type.RoutingPreferenceManager
+    before = union_rules(manager)
+
+    with Transaction(doc, "Split pipes") as t:
+        t.Start()
+        with routing.RuleSession(doc, [pipe_type], [routing.RuleSpec(symbol.Id, "Coupling Rule", 0.5, 0.5)]):
+            assert len(union_rules(manager)) == 2
+            t.RollBack()
+    assert union_rules(manager) == before
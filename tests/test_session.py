@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Per document memos and reloading pamtools modules with require()."""
+import pytest
+
+from Autodesk.Revit.DB import FamilySymbol, FilteredElementCollector, Transaction
+
+import pamtools
+from fakerevit import model
+from pamtools import session
+
+
+def counting_memo(builds):
+    def build(doc):
+        builds.append(doc)
+        return [symbol.Id for symbol in FilteredElementCollector(doc).OfClass(FamilySymbol)]
+    return session.DocumentMemo(build, FamilySymbol, lambda ids: ids)
+
+
+@pytest.fixture
+def memos():
+    """Remove the memos a test registers."""
+    registered = list(session._memos)
+    yield
+    session._memos[:] = registered
+
+
+def commit(doc, change):
+    t = Transaction(doc, "Change")
+    t.Start()
+    change()
+    t.Commit()
+
+
+def test_memo_is_built_once_per_document(doc, memos):
+    builds = []
+    memo = counting_memo(builds)
+    model.add_family_symbol(doc, "Coupling", "DN100")
+    assert memo.get(doc) is memo.get(doc)
+    assert builds == [doc]
+
+
+def test_memo_is_dropped_when_elements_of_its_class_are_added(doc, memos):
+    builds = []
+    memo = counting_memo(builds)
+    model.add_family_symbol(doc, "Coupling", "DN100")
+    assert len(memo.get(doc)) == 1
+    commit(doc, lambda: model.add_family_symbol(doc, "Coupling", "DN150"))
+    assert len(memo.get(doc)) == 2
+    assert len(builds) == 2
+
+
+def test_memo_survives_deleting_elements_it_does_not_hold(doc, memos):
+    builds = []
+    memo = counting_memo(builds)
+    model.add_family_symbol(doc, "Coupling", "DN100")
+    pipe_type = model.add_pipe_type(doc, "Cast Iron")
+    memo.get(doc)
+    commit(doc, lambda: doc.Delete(pipe_type.Id))
+    memo.get(doc)
+    assert len(builds) == 1
+
+
+def test_require_reloads_modules_that_import_the_stale_one(doc):
+    families = pamtools.require('families', 2)
+    converter = pamtools.require('converter', 7)
+    catalogue = pamtools.require('catalogue', 1)
+    couplings = pamtools.require('couplings', 8)
+    session.track_document_changes(doc.Application)
+    memo_count = len(pamtools.session._memos)
+    old_index = families.SymbolIndex
+    families.VERSION = 0
+    assert pamtools.require('families', 2) is families
+    assert families.SymbolIndex is not old_index
+    assert converter.symbol_index is families.symbol_index
+    assert catalogue.family_symbols is families.family_symbols
+    assert couplings.catalogue is catalogue.catalogue
+    assert len(pamtools.session._memos) == memo_count
+    assert len(doc.Application.DocumentChanged._handlers) == 0
+
+
+def test_require_rejects_other_versions():
+    with pytest.raises(ImportError):
+        pamtools.require('families', 1)
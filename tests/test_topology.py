@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Connector topology snapshots of piping systems, cached until their elements change."""
+from Autodesk.Revit.DB import Transaction
+
+from en12056 import END_SYSTEM, SnapshotCache, Topology
+from en12056.builder import build_topology, document_key, get_topology, ignore_transaction, track_document_changes
+from en12056.parameters import DISCHARGE_UNITS
+
+from drainage import STACK, system
+
+
+def names(elements):
+    return dict((element.Id, name) for name, element in elements.items())
+
+
+def test_snapshot_follows_flow_downstream(doc):
+    piping_system, elements = system(doc, *STACK)
+    topology = build_topology(piping_system)
+    name_of = names(elements)
+    downstream = dict((name_of[element_id], name_of.get(topology.ids[target]) if target != -1 else None)
+                      for element_id, target in zip(topology.ids, topology.downstream))
+    assert downstream == {"wc": "p_wc", "p_wc": "tee", "basin": "p_basin", "p_basin": "tee",
+                          "tee": "p_stack", "p_stack": "p_out", "p_out": None}
+    out = topology.index[elements["p_out"].Id]
+    assert topology.end_reasons[out] == END_SYSTEM
+    assert topology.sizes[topology.index[elements["p_basin"].Id]] == 0.13
+    assert sorted(name_of[element_id] for node, element_id in enumerate(topology.ids) if topology.is_pipe[node]) == \
+        ["p_basin", "p_out", "p_stack", "p_wc"]
+    assert sorted(name_of[topology.ids[node]] for node, direction in topology.neighbours(
+        topology.index[elements["tee"].Id])) == ["p_basin", "p_stack", "p_wc"]
+
+
+def set_discharge_units(doc, pipe, value, name="Change Pipe"):
+    with Transaction(doc, name) as t:
+        t.Start()
+        pipe.LookupParameter(DISCHARGE_UNITS).Set(value)
+        t.Commit()
+
+
+def test_snapshot_is_kept_until_an_element_of_it_changes(doc):
+    piping_system, elements = system(doc, *STACK)
+    track_document_changes(doc.Application)
+    topology = get_topology(doc, piping_system)
+    assert get_topology(doc, piping_system) is topology
+
+    ignore_transaction("Write Results")
+    set_discharge_units(doc, elements["p_stack"], 2.0, "Write Results")
+    assert get_topology(doc, piping_system) is topology
+
+    set_discharge_units(doc, elements["p_stack"], 3.0)
+    assert get_topology(doc, piping_system) is not topology
+
+
+def test_snapshot_cache_is_kept_per_document():
+    cache = SnapshotCache()
+    first = cache.put("model", Topology("system").finalise())
+    cache.put("other model", Topology("system").finalise())
+    cache.invalidate("model", ["unrelated"])
+    assert cache.get("model", "system") is first
+    cache.invalidate("model", ["system"])
+    assert cache.get("model", "system") is None
+    assert cache.get("other model", "system") is not None
+    cache.clear("other model")
+    assert len(cache) == 0
+
+
+def test_document_key(doc):
+    assert document_key(doc) == (doc.Title, doc.PathName)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Downstream walks over topology snapshots: limits, loops and stop rules."""
+from en12056 import (
+    END_CLASSIFICATION,
+    END_EXTERNAL,
+    END_SYSTEM,
+    STOP_CYCLE,
+    STOP_JOINED,
+    STOP_SIZE_END,
+    STOP_TRUNCATED,
+    Topology,
+    size_end_rule,
+    walk_downstream,
+)
+
+
+def chain(links, sizes=None, classifications=None):
+    """Return a Topology of (element id, next id) links, in order."""
+    topology = Topology(system_id="system")
+    for element_id, next_id in links:
+        size = (sizes or {}).get(element_id, 0.33)
+        classification = (classifications or {}).get(element_id, "Sanitary")
+        topology.add_element(element_id, True, size, classification, next_id=next_id)
+    return topology.finalise()
+
+
+def path_ids(topology, walk):
+    return [topology.ids[node] for node in walk.path]
+
+
+def test_walk_to_open_end():
+    topology = chain([("a", "b"), ("b", "c"), ("c", None)])
+    walk = walk_downstream(topology, topology.index["a"])
+    assert path_ids(topology, walk) == ["a", "b", "c"]
+    assert walk.reason == END_SYSTEM
+    assert walk.complete
+
+
+def test_walk_truncated_at_maximum_length():
+    topology = chain([(str(number), str(number + 1)) for number in range(10)] + [("10", None)])
+    walk = walk_downstream(topology, topology.index["0"], max_length=4)
+    assert path_ids(topology, walk) == ["0", "1", "2", "3"]
+    assert walk.reason == STOP_TRUNCATED
+    assert walk.at == topology.index["3"]
+    assert not walk.complete
+
+
+def test_walk_stops_on_loop():
+    topology = chain([("a", "b"), ("b", "c"), ("c", "d"), ("d", "b")])
+    walk = walk_downstream(topology, topology.index["a"])
+    assert path_ids(topology, walk) == ["a", "b", "c", "d"]
+    assert walk.reason == STOP_CYCLE
+    assert walk.describe(topology) == "b: double element"
+    assert walk.complete
+
+
+def test_find_loops():
+    topology = chain([("a", "b"), ("b", "c"), ("c", "b"), ("x", None)])
+    loops = topology.find_loops()
+    assert [sorted(topology.ids[node] for node in loop) for loop in loops] == [["b", "c"]]
+
+
+def test_walk_stops_at_size_end():
+    topology = chain([("a", "b"), ("b", "c"), ("c", None)], sizes={"a": 0.33, "b": 0.33, "c": 1.0})
+    walk = walk_downstream(topology, topology.index["a"], stop_rule=size_end_rule(topology, 2.0))
+    assert path_ids(topology, walk) == ["a", "b"]
+    assert walk.reason == STOP_SIZE_END
+    assert walk.at == topology.index["c"]
+    assert not walk.complete
+
+
+def test_walk_stops_at_other_classification():
+    topology = chain([("a", "b"), ("b", "c"), ("c", None)], classifications={"b": "Domestic Cold Water"})
+    walk = walk_downstream(topology, topology.index["a"])
+    assert path_ids(topology, walk) == ["a", "b"]
+    assert walk.reason == END_CLASSIFICATION
+
+
+def test_walk_leaving_the_network():
+    topology = chain([("a", "b"), ("b", "elsewhere")])
+    walk = walk_downstream(topology, topology.index["a"])
+    assert path_ids(topology, walk) == ["a", "b"]
+    assert walk.reason == END_EXTERNAL
+
+
+def test_walk_joins_walked_path():
+    topology = chain([("a", "c"), ("b", "c"), ("c", "d"), ("d", None)])
+    first = walk_downstream(topology, topology.index["a"])
+    walk = walk_downstream(topology, topology.index["b"], stop_at=set(first.path))
+    assert path_ids(topology, walk) == ["b", "c"]
+    assert walk.reason == STOP_JOINED
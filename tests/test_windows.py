@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""XAML of the windows built by pamui.windows.PamWindow.
+
+PamWindow loads a cached template into itself, so the XAML root must be a
+plain Window without a code-behind class, and names must be unique in the
+one name scope the window gets.
+"""
+import glob
+import io
+import os
+import re
+from xml.etree import ElementTree
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PRESENTATION = "{http://schemas.microsoft.com/winfx/2006/xaml/presentation}"
+XAML = "{http://schemas.microsoft.com/winfx/2006/xaml}"
+
+_XAML_FILE = re.compile(r"""os\.path\.join\(\s*script_dir\s*,\s*["']([\w.]+\.xaml)["']\s*\)""")
+
+
+def pam_windows():
+    """Yield the XAML files opened as a PamWindow."""
+    for path in sorted(glob.glob(os.path.join(ROOT, "Pam Building Design+.tab", "**", "script.py"), recursive=True)):
+        with io.open(path, encoding="utf-8") as script_file:
+            source = script_file.read()
+        if "PamWindow(" not in source:
+            continue
+        for name in _XAML_FILE.findall(source):
+            yield os.path.join(os.path.dirname(path), name)
+
+
+WINDOWS = list(pam_windows())
+
+
+def test_windows_are_found():
+    assert len(WINDOWS) >= 12
+
+
+@pytest.mark.parametrize("path", WINDOWS, ids=lambda path: os.path.relpath(path, os.path.dirname(os.path.dirname(path))))
+def test_window_xaml_loads_into_a_pam_window(path):
+    root = ElementTree.parse(path).getroot()
+    assert root.tag == PRESENTATION + "Window"
+    assert XAML + "Class" not in root.attrib
+    names = [element.get(XAML + "Name") or element.get("Name") for element in root.iter()]
+    names = [name for name in names if name]
+    assert len(names) == len(set(names))